@@ -0,0 +1,394 @@
+// Filters the cards of each catalog rendered by render_catalog in
+// scripts/integrations.py. Any number of tags can be selected, matching
+// cards with any or with all of them. Next to each grid the macro emits a
+// facet index: a bitset per tag over the card indices, 32 cards a word, and
+// its count. The matching set and the count beside every button are computed
+// from bitsets alone, and a click only writes to the cards whose visibility
+// changes.
+//
+// The search box ranks cards on every keystroke from a trigram index over
+// card titles, descriptions and tags, also emitted by the macro, so it needs
+// no request. Its matches narrow the tag selection, ranked best first.
+//
+// A virtualized catalog instead ships its cards once, in a <noscript> grid
+// next to an empty one. Only a page of them is rendered, with more on "Show
+// more" or when it scrolls into view, and filtering re-renders the first page
+// of the match.
+//
+// The search box and buttons need this script, so it renders them too, from
+// the facet index; the macro emits an empty filter bar. Readers without
+// scripting, and llms-full.txt, see the cards alone.
+//
+// Loaded by a script tag in the catalog itself, which instant navigation
+// re-runs on every catalog page, so everything below is set up only once.
+(function() {
+  if (window.adkCatalogFilter) {
+    window.adkCatalogFilter.init();
+    return;
+  }
+
+  var catalogs = new WeakMap();
+
+  function popcount(word) {
+    word = word - ((word >>> 1) & 0x55555555);
+    word = (word & 0x33333333) + ((word >>> 2) & 0x33333333);
+    return (((word + (word >>> 4)) & 0x0f0f0f0f) * 0x01010101) >>> 24;
+  }
+
+  function count(bits) {
+    var total = 0;
+    for (var w = 0; w < bits.length; w++) total += popcount(bits[w]);
+    return total;
+  }
+
+  function combine(a, b, and) {
+    var bits = new Uint32Array(a.length);
+    for (var w = 0; w < a.length; w++) bits[w] = and ? a[w] & b[w] : a[w] | b[w];
+    return bits;
+  }
+
+  function lowestBit(word) {
+    return 31 - Math.clz32(word & -word);
+  }
+
+  function indices(bits) {
+    var result = [];
+    for (var w = 0; w < bits.length; w++) {
+      for (var word = bits[w]; word; word &= word - 1) {
+        result.push(w * 32 + lowestBit(word));
+      }
+    }
+    return result;
+  }
+
+  function searchWords(text) {
+    // As search_words in scripts/integrations.py.
+    return text.toLowerCase().match(/[a-z0-9]+/g) || [];
+  }
+
+  function queryGrams(query) {
+    var words = searchWords(query);
+    var grams = [];
+    words.forEach(function(word, n) {
+      // The last word may still be being typed, so it only has to start one.
+      var padded = ' ' + word + (n === words.length - 1 ? '' : ' ');
+      for (var i = 0; i + 3 <= padded.length; i++) {
+        var gram = padded.substr(i, 3);
+        if (grams.indexOf(gram) < 0) grams.push(gram);
+      }
+    });
+    return grams;
+  }
+
+  // Returns the matching cards as a bitset and in rank order, or null for a
+  // query too short to have a trigram.
+  function search(catalog, query) {
+    var grams = queryGrams(query);
+    if (!grams.length) return null;
+    var size = catalog.all.length * 32;
+    var hits = new Uint16Array(size);
+    var scores = new Uint16Array(size);
+    grams.forEach(function(gram) {
+      (catalog.index[gram] || []).forEach(function(entry) {
+        hits[entry >> 1]++;
+        // A trigram in the title counts double.
+        scores[entry >> 1] += 1 + (entry & 1);
+      });
+    });
+    // Tolerates a typo: a quarter of the trigrams may be missing.
+    var needed = grams.length - Math.floor(grams.length / 4);
+    var bits = new Uint32Array(catalog.all.length);
+    var order = [];
+    for (var i = 0; i < size; i++) {
+      if (hits[i] >= needed) {
+        bits[i >> 5] |= 1 << (i & 31);
+        order.push(i);
+      }
+    }
+    order.sort(function(a, b) { return scores[b] - scores[a] || a - b; });
+    return { bits: bits, order: order };
+  }
+
+  // As the macro once rendered them: MCP in capitals, the rest title-cased
+  // as Python's str.title() does.
+  function displayName(tag) {
+    if (tag.toLowerCase() === 'mcp') return 'MCP';
+    return tag.toLowerCase().replace(/(^|[^a-z])([a-z])/g, function(match, before, letter) {
+      return before + letter.toUpperCase();
+    });
+  }
+
+  function element(tag, className, text) {
+    var el = document.createElement(tag);
+    if (className) el.className = className;
+    if (text) el.textContent = text;
+    return el;
+  }
+
+  function filterButton(filter, label, value) {
+    var btn = element('button', 'catalog-filter-btn', label);
+    btn.setAttribute('data-filter', filter);
+    btn.setAttribute('aria-pressed', 'false');
+    btn.append(' ', element('span', 'catalog-filter-count', String(value)));
+    return btn;
+  }
+
+  function renderControls(bar, id, facets) {
+    var search = element('input', 'catalog-search');
+    search.type = 'search';
+    search.id = id + '-search';
+    search.placeholder = 'Search';
+    search.autocomplete = 'off';
+    search.setAttribute('aria-label', 'Search this catalog');
+    var mode = element('button', 'catalog-filter-mode', 'Match any');
+    mode.setAttribute('aria-pressed', 'false');
+    var all = filterButton('all', 'All', facets.size);
+    all.classList.add('active');
+    all.setAttribute('aria-pressed', 'true');
+    bar.append(search, element('span', 'catalog-filter-label', 'Filter:'), all);
+    Object.keys(facets.counts).sort().forEach(function(tag) {
+      bar.append(filterButton(tag, displayName(tag), facets.counts[tag]));
+    });
+    bar.append(mode);
+  }
+
+  function setUp(bar) {
+    var catalog = catalogs.get(bar);
+    if (catalog) return catalog;
+    var id = bar.id.replace(/-filters$/, '');
+    var grid = document.getElementById(id + '-grid');
+    var facets = JSON.parse(document.getElementById(id + '-tags').textContent);
+    // Served empty: the controls need this script.
+    if (!bar.children.length) renderControls(bar, id, facets);
+    var all = new Uint32Array(Math.ceil(facets.size / 32)).fill(0xffffffff);
+    if (facets.size % 32) all[all.length - 1] = (1 << (facets.size % 32)) - 1;
+    catalog = {
+      bar: bar,
+      grid: grid,
+      cards: grid.children,
+      all: all,
+      tags: {},
+      counts: facets.counts,
+      buttons: {},
+      mode: bar.querySelector('.catalog-filter-mode'),
+      selected: [],
+      matchAll: false,
+      search: document.getElementById(id + '-search'),
+      // The last query's matches, null while there is none.
+      found: null,
+      reordered: [],
+      // The cards shown; every card while nothing is selected.
+      visible: all
+    };
+    Object.keys(facets.tags).forEach(function(tag) {
+      catalog.tags[tag] = Uint32Array.from(facets.tags[tag]);
+    });
+    bar.querySelectorAll('.catalog-filter-btn').forEach(function(btn) {
+      catalog.buttons[btn.getAttribute('data-filter')] = btn;
+    });
+    catalog.index = JSON.parse(document.getElementById(id + '-search-index').textContent);
+    catalogs.set(bar, catalog);
+    if (grid.hasAttribute('data-page-size')) setUpVirtual(catalog, id);
+    return catalog;
+  }
+
+  function setUpVirtual(catalog, id) {
+    // Parsed inert, so no image loads until a card is rendered. The
+    // <noscript> holds the cards as text when the page was parsed with
+    // scripting on, and as elements when instant navigation parsed it
+    // without; innerHTML is their markup either way.
+    var source = document.createElement('template');
+    source.innerHTML = document.getElementById(id + '-cards').innerHTML;
+    catalog.data = Array.prototype.slice.call(source.content.querySelectorAll('.tool-card'));
+    catalog.pageSize = Number(catalog.grid.getAttribute('data-page-size'));
+    catalog.more = element('button', 'catalog-more-btn', 'Show more');
+    catalog.more.hidden = true;
+    catalog.grid.after(catalog.more);
+    catalog.more.addEventListener('click', function() { renderMore(catalog); });
+    if ('IntersectionObserver' in window) {
+      catalog.observer = new IntersectionObserver(function(entries) {
+        if (entries[0].isIntersecting) renderMore(catalog);
+      }, { rootMargin: '400px' });
+    }
+    renderFrom(catalog, null);
+  }
+
+  // Starts over with the cards at these indices, or all of them for null.
+  function renderFrom(catalog, order) {
+    catalog.order = order;
+    catalog.shown = 0;
+    catalog.grid.replaceChildren();
+    renderMore(catalog);
+  }
+
+  function renderMore(catalog) {
+    var total = catalog.order ? catalog.order.length : catalog.data.length;
+    var end = Math.min(catalog.shown + catalog.pageSize, total);
+    var page = document.createDocumentFragment();
+    for (var i = catalog.shown; i < end; i++) {
+      page.appendChild(document.importNode(catalog.data[catalog.order ? catalog.order[i] : i], true));
+    }
+    catalog.grid.appendChild(page);
+    catalog.shown = end;
+    catalog.more.hidden = end >= total;
+    if (catalog.observer) {
+      // Observed afresh, so a button still in view after this page is
+      // reported again and loads the next, until the viewport is full.
+      catalog.observer.unobserve(catalog.more);
+      if (!catalog.more.hidden) catalog.observer.observe(catalog.more);
+    }
+  }
+
+  function matching(catalog) {
+    if (!catalog.selected.length) return catalog.all;
+    return catalog.selected.reduce(function(bits, tag) {
+      return combine(bits, catalog.tags[tag], catalog.matchAll);
+    }, catalog.matchAll ? catalog.all : new Uint32Array(catalog.all.length));
+  }
+
+  function toggleCards(catalog, next) {
+    var previous = catalog.visible;
+    for (var w = 0; w < next.length; w++) {
+      for (var changed = previous[w] ^ next[w]; changed; changed &= changed - 1) {
+        var bit = lowestBit(changed);
+        // Cleared rather than set, so the stylesheet's display applies.
+        catalog.cards[w * 32 + bit].style.display = (next[w] >>> bit) & 1 ? '' : 'none';
+      }
+    }
+  }
+
+  function hasBit(bits, i) {
+    return (bits[i >> 5] >>> (i & 31)) & 1;
+  }
+
+  // Flex order puts the matches in rank order; only the cards ordered for
+  // the last query and this one are written to.
+  function reorder(catalog) {
+    catalog.reordered.forEach(function(i) { catalog.cards[i].style.order = ''; });
+    catalog.reordered = catalog.found ? catalog.found.order : [];
+    catalog.reordered.forEach(function(i, rank) { catalog.cards[i].style.order = rank; });
+  }
+
+  function setCount(btn, value) {
+    var badge = btn.querySelector('.catalog-filter-count');
+    if (badge && badge.textContent !== String(value)) badge.textContent = value;
+    btn.classList.toggle('empty', value === 0);
+  }
+
+  function apply(catalog) {
+    var found = catalog.found;
+    var next = matching(catalog);
+    if (found) next = combine(next, found.bits, true);
+    if (catalog.data) {
+      if (found) {
+        renderFrom(catalog, found.order.filter(function(i) { return hasBit(next, i); }));
+      } else {
+        renderFrom(catalog, next === catalog.all ? null : indices(next));
+      }
+    } else {
+      toggleCards(catalog, next);
+      reorder(catalog);
+    }
+    catalog.visible = next;
+
+    // With all required, a tag's count is what selecting it too would
+    // leave; with any, selecting a tag can only add its own cards, less
+    // any the search excludes.
+    var narrowing = catalog.matchAll && catalog.selected.length;
+    Object.keys(catalog.buttons).forEach(function(filter) {
+      var btn = catalog.buttons[filter];
+      var active = filter === 'all' ? !catalog.selected.length
+                                    : catalog.selected.indexOf(filter) >= 0;
+      btn.classList.toggle('active', active);
+      btn.setAttribute('aria-pressed', active);
+      if (filter === 'all') {
+        setCount(btn, count(next));
+      } else {
+        var tag = catalog.tags[filter];
+        if (narrowing) {
+          setCount(btn, count(combine(next, tag, true)));
+        } else {
+          setCount(btn, found ? count(combine(found.bits, tag, true)) : catalog.counts[filter]);
+        }
+      }
+    });
+    if (catalog.mode) {
+      catalog.mode.textContent = catalog.matchAll ? 'Match all' : 'Match any';
+      catalog.mode.setAttribute('aria-pressed', catalog.matchAll);
+    }
+  }
+
+  function select(catalog, filter) {
+    if (filter === 'all') {
+      catalog.selected = [];
+    } else if (catalog.selected.indexOf(filter) >= 0) {
+      catalog.selected = catalog.selected.filter(function(tag) { return tag !== filter; });
+    } else {
+      catalog.selected = catalog.selected.concat(filter);
+    }
+    apply(catalog);
+  }
+
+  function updateUrl(catalog) {
+    var url = new URL(window.location);
+    if (catalog.selected.length) {
+      url.searchParams.set('topic', catalog.selected.join(','));
+    } else {
+      url.searchParams.delete('topic');
+    }
+    if (catalog.matchAll) {
+      url.searchParams.set('match', 'all');
+    } else {
+      url.searchParams.delete('match');
+    }
+    window.history.pushState({}, '', url);
+  }
+
+  function init() {
+    var params = new URLSearchParams(window.location.search);
+    var topics = (params.get('topic') || '').toLowerCase().split(',');
+    var matchAll = params.get('match') === 'all';
+    document.querySelectorAll('.catalog-filter-bar').forEach(function(bar) {
+      var catalog = setUp(bar);
+      // Only topics with a button, to avoid an empty grid.
+      var selected = topics.filter(function(topic) {
+        return topic !== 'all' && catalog.buttons[topic];
+      });
+      if (selected.join() === catalog.selected.join() && matchAll === catalog.matchAll) {
+        return;
+      }
+      catalog.selected = selected;
+      catalog.matchAll = matchAll;
+      apply(catalog);
+    });
+  }
+
+  document.addEventListener('click', function(e) {
+    var btn = e.target.closest('.catalog-filter-btn, .catalog-filter-mode');
+    if (!btn) return;
+    var catalog = setUp(btn.closest('.catalog-filter-bar'));
+    if (btn === catalog.mode) {
+      catalog.matchAll = !catalog.matchAll;
+      apply(catalog);
+    } else {
+      select(catalog, btn.getAttribute('data-filter'));
+    }
+
+    // Update URL without reload
+    updateUrl(catalog);
+  });
+
+  document.addEventListener('input', function(e) {
+    if (!e.target.classList.contains('catalog-search')) return;
+    var catalog = setUp(e.target.closest('.catalog-filter-bar'));
+    catalog.found = search(catalog, e.target.value);
+    apply(catalog);
+  });
+
+  window.adkCatalogFilter = { init: init };
+  if (document.readyState === 'loading') {
+    document.addEventListener('DOMContentLoaded', init);
+  } else {
+    init();
+  }
+})();
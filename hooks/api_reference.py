@@ -0,0 +1,215 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Links the generated API reference trees into the site instead of copying them.
+
+Each directory under ``docs/api-reference/`` is a tree written by a generator,
+thousands of files MkDocs would copy into site_dir on every build. The files
+stay in the collection, so nav entries and links into them are validated as
+before, but MkDocs no longer copies them: each is hardlinked into site_dir,
+reflinked where that fails (another filesystem), and copied only when neither
+works. A manifest in .cache/ next to mkdocs.yml records a fingerprint per tree
+linked into site_dir, so a ``--dirty`` build leaves unchanged trees alone.
+``mkdocs serve`` does not watch the trees; restart it after regenerating one.
+
+A hardlinked file is the source file: anything that post-processes the site
+must replace files under api-reference/, never write them in place.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import time
+from collections import Counter, defaultdict
+from pathlib import Path
+
+from mkdocs.plugins import event_priority
+
+try:
+    import fcntl
+except ImportError:  # Not on Windows; hardlinks and copies still work.
+    fcntl = None
+
+log = logging.getLogger("mkdocs.hooks.api_reference")
+
+API_REFERENCE = "api-reference"
+
+# Kept out of site_dir, which deploy previews publish as is, like
+# precompress.py's cache. It names the site_dir it describes; another site_dir
+# ignores it.
+MANIFEST = Path(".cache") / "api-reference.json"
+
+# linux/fs.h: clone a whole file, sharing its extents until either is written.
+FICLONE = 0x40049409
+
+# (absolute source path, path relative to site_dir) of every file in each tree,
+# as collected this build.
+_trees: dict[str, list[tuple[str, str]]] = defaultdict(list)
+
+# Link methods that failed this build, so a tree on another filesystem does not
+# retry the link for every file.
+_failed_methods: set[str] = set()
+
+# (name, wall, cpu) for hooks/build_profile.py.
+profile_spans: list[tuple[str, float, float]] = []
+
+
+def _not_copied(dirty: bool = False) -> None:
+    """Replaces File.copy_file: on_post_build links the file instead."""
+
+
+def _tree(src_uri: str) -> str | None:
+    parts = src_uri.split("/")
+    if len(parts) > 2 and parts[0] == API_REFERENCE:
+        return parts[1]
+    return None
+
+
+def _fingerprint(files: list[tuple[str, str]]) -> str:
+    digest = hashlib.sha256()
+    for src, dest in files:
+        stat = os.stat(src)
+        digest.update(f"{dest}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode())
+    return digest.hexdigest()[:16]
+
+
+def _reflink(src: str, dest: str) -> None:
+    if fcntl is None:
+        raise OSError("reflinks need fcntl")
+    try:
+        with open(src, "rb") as source, open(dest, "wb") as target:
+            fcntl.ioctl(target.fileno(), FICLONE, source.fileno())
+    except OSError:
+        Path(dest).unlink(missing_ok=True)
+        raise
+
+
+def _materialize(src: str, dest: str) -> str:
+    """Puts src at dest by the cheapest method that works; returns its name."""
+    for name, method in (("linked", os.link), ("reflinked", _reflink)):
+        if name in _failed_methods:
+            continue
+        try:
+            method(src, dest)
+            return name
+        except OSError:
+            _failed_methods.add(name)
+    shutil.copyfile(src, dest)
+    return "copied"
+
+
+def _read_manifest(path: Path, site_dir: Path) -> dict[str, str]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("site_dir") != str(site_dir.resolve()):
+        return {}
+    return data.get("trees", {})
+
+
+def on_pre_build(config) -> None:
+    profile_spans.clear()
+
+
+def on_files(files, config):
+    """Takes the static files of every tree out of MkDocs's copy step."""
+    _trees.clear()
+    for file in files:
+        tree = _tree(file.src_uri)
+        # Pages, such as the Javadoc legal notices, are left to MkDocs, and
+        # files MkDocs would not copy stay uncopied.
+        if (
+            tree is None
+            or file.is_documentation_page()
+            or not file.inclusion.is_included()
+        ):
+            continue
+        file.copy_file = _not_copied
+        _trees[tree].append((file.abs_src_path, file.dest_uri))
+    return files
+
+
+def on_serve(server, config, builder):
+    """Watches everything in docs_dir but the trees.
+
+    Each top-level directory of docs_dir is watched on its own, as listed at
+    startup; restart ``mkdocs serve`` after adding one.
+    """
+    docs_dir = Path(config["docs_dir"])
+    if not _trees:
+        return server
+    server.unwatch(str(docs_dir))
+    server.watch(str(docs_dir), recursive=False)
+    for entry in sorted(docs_dir.iterdir()):
+        if entry.is_dir() and entry.name != API_REFERENCE:
+            server.watch(str(entry))
+    # api-reference/index.md is a guide, not part of a tree.
+    server.watch(str(docs_dir / API_REFERENCE), recursive=False)
+    log.info(
+        "Not watching %s/{%s}; restart `mkdocs serve` after regenerating them.",
+        API_REFERENCE,
+        ",".join(sorted(_trees)),
+    )
+    return server
+
+
+# Before pagefind.py indexes the trees and precompress.py compresses them.
+@event_priority(50)
+def on_post_build(config) -> None:
+    site_dir = Path(config["site_dir"])
+    manifest_path = Path(config.config_file_path).parent / MANIFEST
+    wall, cpu = time.perf_counter(), time.process_time()
+    previous = _read_manifest(manifest_path, site_dir)
+    manifest, methods, skipped = {}, Counter(), []
+    _failed_methods.clear()
+
+    for tree, files in sorted(_trees.items()):
+        manifest[tree] = _fingerprint(files)
+        target = site_dir / API_REFERENCE / tree
+        if previous.get(tree) == manifest[tree] and target.is_dir():
+            skipped.append(tree)
+            continue
+        # Not needed after a clean, but a --dirty build keeps deleted files.
+        shutil.rmtree(target, ignore_errors=True)
+        for src, dest in files:
+            path = site_dir / dest
+            path.parent.mkdir(parents=True, exist_ok=True)
+            methods[_materialize(src, str(path))] += 1
+    for tree in previous.keys() - manifest.keys():
+        shutil.rmtree(site_dir / API_REFERENCE / tree, ignore_errors=True)
+
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    manifest_path.write_text(
+        json.dumps({"site_dir": str(site_dir.resolve()), "trees": manifest}),
+        encoding="utf-8",
+    )
+    profile_spans.append(
+        (
+            "api-reference passthrough",
+            time.perf_counter() - wall,
+            time.process_time() - cpu,
+        )
+    )
+
+    done = ", ".join(f"{count} {name}" for name, count in sorted(methods.items()))
+    log.info(
+        "API reference trees: %s%s",
+        done or "none changed",
+        f"; unchanged: {', '.join(skipped)}" if skipped else "",
+    )
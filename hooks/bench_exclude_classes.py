@@ -0,0 +1,93 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Times the EXCLUDE_CLASSES guard: one combined pattern versus one per class.
+
+The corpus is the largest HTML files under docs/api-reference, scanned with
+a fresh ``seen`` set each time, so neither side stops early. That is the cost
+of a page that carries none of the classes, or only some.
+
+Usage:
+    python hooks/bench_exclude_classes.py [--files 20] [--runs 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import re
+import time
+from pathlib import Path
+
+# Loaded by path, as MkDocs does: `import pagefind` would find the PyPI package.
+_spec = importlib.util.spec_from_file_location(
+    "pagefind_hook", Path(__file__).with_name("pagefind.py")
+)
+hook = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(hook)
+
+API_REFERENCE = Path(__file__).parent.parent / "docs" / "api-reference"
+
+# The guard as it was: one search per class, skipping classes already seen.
+PER_CLASS_PATTERNS = {
+    name: re.compile(rf'class="[^"]*(?<![\w-]){re.escape(name)}(?![\w-])')
+    for name in hook.EXCLUDE_CLASSES
+}
+
+
+def per_class(html: str, seen: set[str]) -> None:
+    for name, pattern in PER_CLASS_PATTERNS.items():
+        if name not in seen and pattern.search(html):
+            seen.add(name)
+
+
+def combined(html: str, seen: set[str]) -> None:
+    hook._scan_exclude_classes(html, seen)
+
+
+def _best_of(runs: int, scan, pages: list[str]) -> float:
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        for html in pages:
+            scan(html, set())
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=20)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    paths = sorted(API_REFERENCE.rglob("*.html"), key=lambda p: p.stat().st_size)
+    paths = paths[-args.files :]
+    pages = [path.read_text(encoding="utf-8", errors="ignore") for path in paths]
+
+    for html in pages:
+        expected, actual = set(), set()
+        per_class(html, expected)
+        combined(html, actual)
+        assert expected == actual, (expected, actual)
+
+    size = sum(map(len, pages)) / 2**20
+    print(f"{len(pages)} pages, {size:.1f} MiB, {len(hook.EXCLUDE_CLASSES)} classes")
+    for label, scan in (("per class", per_class), ("combined", combined)):
+        seconds = _best_of(args.runs, scan, pages)
+        print(f"{label:>10}: {seconds * 1000:8.1f} ms  {size / seconds:7.1f} MiB/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Times counting marked pages in a synthetic site: scan versus manifest.
+
+Writes ``--pages`` HTML files at each ``--sizes`` (KiB per page) into a
+temporary site, one in ten of them marked like API reference pages are not,
+then times the old full scan against a ``--dirty`` rebuild that re-rendered
+one page and reconciles the rest from the manifest. The scan should grow with
+total HTML bytes; the manifest only with the page count.
+
+Usage:
+    python hooks/bench_marked_pages.py [--pages 20000] [--sizes 1 4 16]
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import tempfile
+import time
+from pathlib import Path
+
+# Loaded by path, as MkDocs does: `import pagefind` would find the PyPI package.
+_spec = importlib.util.spec_from_file_location(
+    "pagefind_hook", Path(__file__).with_name("pagefind.py")
+)
+hook = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(hook)
+
+
+def _write_site(site_dir: Path, pages: int, kib: int) -> dict[str, str]:
+    filler = "<p>" + "lorem ipsum " * (kib * 1024 // 12) + "</p>"
+    marked = {}
+    for i in range(pages):
+        rel = f"section-{i % 100}/page-{i}/index.html"
+        article = hook.ARTICLE_INDEXED if i % 10 == 0 else hook.ARTICLE
+        html = f"<html><body>{article}{i}{filler}</article></body></html>"
+        path = site_dir / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(html)
+        if i % 10 == 0:
+            marked[rel] = hook._digest(html)
+    return marked
+
+
+def _best_of(runs: int, func) -> float:
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=20_000)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'KiB/page':>8}  {'site MiB':>8}  {'scan s':>8}  {'manifest s':>10}")
+    for kib in args.sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            site_dir = Path(tmp) / "site"
+            # Normally set by on_pre_build, next to mkdocs.yml.
+            hook._state_dir = Path(tmp) / "state"
+            marked = _write_site(site_dir, args.pages, kib)
+            hook._write_manifest(site_dir, marked)
+
+            # A --dirty rebuild that re-rendered, and re-marked, one page.
+            page = min(marked)
+            hook._dirty = True
+            hook._rendered.clear()
+            hook._rendered.add(page)
+            hook._marked.clear()
+            hook._marked[page] = marked[page]
+            assert hook._marked_pages(site_dir) == hook._scan_marked(site_dir) == marked
+
+            scan = _best_of(args.runs, lambda: hook._scan_marked(site_dir))
+            manifest = _best_of(args.runs, lambda: hook._marked_pages(site_dir))
+            size = sum(p.stat().st_size for p in site_dir.rglob("*.html")) / 2**20
+            print(f"{kib:>8}  {size:>8.0f}  {scan:>8.3f}  {manifest:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
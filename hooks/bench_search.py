@@ -0,0 +1,253 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Checks the Pagefind index of a built site against size and latency budgets.
+
+Reports index bytes and fragments per top-level docs section, then serves the
+site on localhost and replays the golden queries in bench_search.json through
+the bundle's own pagefind.js under Node, recording result counts, the first
+(cold) lookup and the median of ``--repeats`` warm ones. Exits non-zero when
+a budget in bench_search.json, or one overridden on the command line, is
+exceeded, or when a golden query's expected page is not in its top results.
+
+Needs Node 18 or later on PATH. Build the site first; ``--site`` defaults to
+the ``site_dir`` of mkdocs.yml.
+
+Usage:
+    python hooks/bench_search.py [--site site] [--repeats 5] [--max-query-ms 50]
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import gzip
+import http.server
+import importlib.util
+import json
+import shutil
+import subprocess
+import sys
+import threading
+from collections import defaultdict
+from pathlib import Path
+
+from mkdocs.exceptions import PluginError
+
+# Loaded by path, as MkDocs does: `import pagefind` would find the PyPI package.
+_spec = importlib.util.spec_from_file_location(
+    "pagefind_hook", Path(__file__).with_name("pagefind.py")
+)
+hook = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(hook)
+
+GOLDEN = Path(__file__).with_suffix(".json")
+
+# Fragments are gzip with this signature ahead of the page's JSON.
+_FRAGMENT_SIGNATURE = b"pagefind_dcd"
+
+# pagefind.js derives its base path from its own URL, which is a file: URL
+# here; it is pointed at the server instead, as the browser would fetch it.
+_DRIVER = """
+const [moduleUrl, basePath, queriesJson, repeats, top] = process.argv.slice(1);
+const pagefind = await import(moduleUrl);
+await pagefind.options({ basePath });
+let start = performance.now();
+await pagefind.init();
+const report = { init_ms: performance.now() - start, queries: [] };
+for (const query of JSON.parse(queriesJson)) {
+  start = performance.now();
+  let search = await pagefind.search(query);
+  const cold = performance.now() - start;
+  const warm = [];
+  for (let i = 0; i < Number(repeats); i++) {
+    start = performance.now();
+    search = await pagefind.search(query);
+    warm.push(performance.now() - start);
+  }
+  warm.sort((a, b) => a - b);
+  const urls = [];
+  for (const result of search.results.slice(0, Number(top))) {
+    urls.push(new URL((await result.data()).url).pathname);
+  }
+  report.queries.push({
+    query,
+    results: search.results.length,
+    cold_ms: cold,
+    warm_ms: warm.length ? warm[Math.floor(warm.length / 2)] : cold,
+    top: urls,
+  });
+}
+console.log(JSON.stringify(report));
+"""
+
+
+def _section(url: str) -> str:
+    return url.strip("/").split("/")[0] or "."
+
+
+def _index_sizes(bundle_dir: Path) -> tuple[dict, dict]:
+    """Returns fragments and their bytes per section, and the shared files."""
+    sections = defaultdict(lambda: {"fragments": 0, "bytes": 0})
+    for path in (bundle_dir / "fragment").glob("*.pf_fragment"):
+        data = gzip.decompress(path.read_bytes())
+        page = json.loads(data.removeprefix(_FRAGMENT_SIGNATURE))
+        row = sections[_section(page["url"])]
+        row["fragments"] += 1
+        row["bytes"] += path.stat().st_size
+    shared = {
+        "index": sum(p.stat().st_size for p in (bundle_dir / "index").iterdir()),
+        "meta": sum(p.stat().st_size for p in bundle_dir.glob("*.pf_meta")),
+    }
+    return dict(sections), shared
+
+
+def _serve(site_dir: Path) -> http.server.ThreadingHTTPServer:
+    class Handler(http.server.SimpleHTTPRequestHandler):
+        def log_message(self, *args) -> None:
+            pass
+
+    server = http.server.ThreadingHTTPServer(
+        ("127.0.0.1", 0), functools.partial(Handler, directory=site_dir)
+    )
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _replay(site_dir: Path, bundle: str, queries, repeats: int, top: int) -> dict:
+    node = shutil.which("node")
+    if node is None:
+        sys.exit("node is not on PATH; the queries run through pagefind.js.")
+    server = _serve(site_dir)
+    try:
+        port = server.server_address[1]
+        result = subprocess.run(
+            [
+                node,
+                "--input-type=module",
+                "-e",
+                _DRIVER,
+                (site_dir / bundle / "pagefind.js").resolve().as_uri(),
+                f"http://127.0.0.1:{port}/{bundle}/",
+                json.dumps([entry["query"] for entry in queries]),
+                str(repeats),
+                str(top),
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    finally:
+        server.shutdown()
+    return json.loads(result.stdout)
+
+
+def main() -> None:
+    golden = json.loads(GOLDEN.read_text(encoding="utf-8"))
+    budgets = golden["budgets"]
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--site", type=Path)
+    parser.add_argument("--bundle", default="pagefind")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--top", type=int, default=golden["top"])
+    parser.add_argument("--json", type=Path, help="also write the report here")
+    for name, value in budgets.items():
+        parser.add_argument(f"--{name.replace('_', '-')}", type=float, default=value)
+    args = parser.parse_args()
+
+    if args.site is None:
+        from mkdocs.config import load_config
+
+        args.site = Path(
+            load_config(str(Path(__file__).parent.parent / "mkdocs.yml"))["site_dir"]
+        )
+    site_dir = args.site
+    bundle_dir = site_dir / args.bundle
+    if not (bundle_dir / "pagefind-entry.json").is_file():
+        sys.exit(f"No Pagefind bundle in {bundle_dir}; build the site first.")
+
+    failures = []
+    # The build's own checks first: a bundle that fails them has no meaningful
+    # size, and its queries would fail for reasons reported better there.
+    if args.bundle == "pagefind":
+        try:
+            hook._verify_bundle(bundle_dir, len(hook._scan_marked(site_dir)), site_dir)
+        except PluginError as error:
+            failures.append(str(error))
+
+    sections, shared = _index_sizes(bundle_dir)
+    fragments = sum(row["fragments"] for row in sections.values())
+    index_bytes = sum(row["bytes"] for row in sections.values()) + sum(shared.values())
+    print(f"{'section':<24} {'fragments':>9} {'KiB':>9}")
+    for name, row in sorted(sections.items(), key=lambda item: -item[1]["bytes"]):
+        print(f"{name:<24} {row['fragments']:>9} {row['bytes'] / 1024:>9.1f}")
+    for name, size in shared.items():
+        print(f"{'(' + name + ')':<24} {'':>9} {size / 1024:>9.1f}")
+    print(f"{'total':<24} {fragments:>9} {index_bytes / 1024:>9.1f}\n")
+
+    if index_bytes / 2**20 > args.max_index_mib:
+        failures.append(
+            f"Index is {index_bytes / 2**20:.2f} MiB, over the "
+            f"{args.max_index_mib:g} MiB budget."
+        )
+    if fragments > args.max_fragments:
+        failures.append(
+            f"Index has {fragments} fragments, over the budget of "
+            f"{args.max_fragments:g}."
+        )
+
+    replay = _replay(site_dir, args.bundle, golden["queries"], args.repeats, args.top)
+    print(f"init {replay['init_ms']:.1f} ms")
+    print(f"{'query':<32} {'results':>7} {'cold ms':>8} {'warm ms':>8}  top")
+    for entry, measured in zip(golden["queries"], replay["queries"]):
+        query = entry["query"]
+        print(
+            f"{query:<32} {measured['results']:>7} {measured['cold_ms']:>8.1f} "
+            f"{measured['warm_ms']:>8.1f}  {(measured['top'] or ['-'])[0]}"
+        )
+        if measured["warm_ms"] > args.max_query_ms:
+            failures.append(
+                f"{query!r} took {measured['warm_ms']:.1f} ms warm, over the "
+                f"{args.max_query_ms:g} ms budget."
+            )
+        if measured["cold_ms"] > args.max_cold_query_ms:
+            failures.append(
+                f"{query!r} took {measured['cold_ms']:.1f} ms cold, over the "
+                f"{args.max_cold_query_ms:g} ms budget."
+            )
+        expect = entry.get("expect")
+        if expect and expect not in measured["top"]:
+            failures.append(
+                f"{query!r} no longer ranks {expect} in its top {args.top}: "
+                f"{measured['top']}"
+            )
+
+    if args.json:
+        report = {
+            "sections": sections,
+            "shared": shared,
+            "fragments": fragments,
+            "index_bytes": index_bytes,
+            **replay,
+        }
+        args.json.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+    if failures:
+        print("\n" + "\n".join(f"FAIL: {failure}" for failure in failures))
+        sys.exit(1)
+    print("\nAll budgets met.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Profiles the docs build per plugin event and per page.
+
+``MKDOCS_PROFILE=1`` times every event handler of every plugin and hook, and
+every page from read to written, in wall and CPU seconds. The report goes to
+``build-profile.json`` in the site dir, and the slowest pages and handlers to
+the log; ``MKDOCS_PROFILE_TOP`` sets how many of each (default 10).
+
+Work an event cannot isolate, such as the Pagefind subprocess, is reported
+from ``profile_spans``: a list of ``(name, wall, cpu)`` any hook or plugin may
+expose and reset per build.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import logging
+import os
+import time
+from collections import defaultdict
+from pathlib import Path
+
+from mkdocs.plugins import event_priority
+
+log = logging.getLogger("mkdocs.hooks.build_profile")
+
+REPORT = "build-profile.json"
+
+# Calls, wall and CPU seconds per (plugin, event), and wall and CPU seconds
+# per page. A page is timed in two spans, since MkDocs reads every page before
+# it writes any: pre_page to page_content, then page_context to post_page.
+_events: dict[tuple[str, str], list] = defaultdict(lambda: [0, 0.0, 0.0])
+_pages: dict[str, list[float]] = defaultdict(lambda: [0.0, 0.0])
+_page_start: dict[str, tuple[float, float]] = {}
+_build_start: tuple[float, float] = (0.0, 0.0)
+
+
+def _enabled() -> bool:
+    return os.environ.get("MKDOCS_PROFILE") == "1"
+
+
+def _now() -> tuple[float, float]:
+    return time.perf_counter(), time.process_time()
+
+
+def _timed(method, key: tuple[str, str]):
+    @functools.wraps(method)
+    def timed(*args, **kwargs):
+        wall, cpu = _now()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            entry = _events[key]
+            entry[0] += 1
+            entry[1] += time.perf_counter() - wall
+            entry[2] += time.process_time() - cpu
+
+    timed.profiled = True
+    return timed
+
+
+def _start_page(page) -> None:
+    _page_start[page.file.src_uri] = _now()
+
+
+def _stop_page(page) -> None:
+    wall, cpu = _page_start.pop(page.file.src_uri, _now())
+    entry = _pages[page.file.src_uri]
+    entry[0] += time.perf_counter() - wall
+    entry[1] += time.process_time() - cpu
+
+
+@event_priority(100)
+def on_config(config):
+    """Wraps every other handler; first, so the rest of on_config is timed."""
+    global _build_start
+    if not _enabled():
+        return
+    _build_start = _now()
+    _events.clear()
+    _pages.clear()
+    _page_start.clear()
+
+    # Replaced in place, so the order MkDocs sorted by priority stands. The
+    # origin map is private to MkDocs, but it is the only record of which
+    # plugin registered a handler.
+    plugins = config.plugins
+    for event, methods in plugins.events.items():
+        for i, method in enumerate(methods):
+            origin = plugins._event_origins.get(method, "<unknown>")
+            if origin == __name__ or getattr(method, "profiled", False):
+                continue
+            methods[i] = _timed(method, (origin, event))
+            plugins._event_origins[methods[i]] = origin
+
+
+@event_priority(100)
+def on_pre_page(page, config, files):
+    if _enabled():
+        _start_page(page)
+
+
+@event_priority(-100)
+def on_page_content(html, page, config, files):
+    if _enabled():
+        _stop_page(page)
+
+
+@event_priority(100)
+def on_page_context(context, page, config, nav):
+    if _enabled():
+        _start_page(page)
+
+
+@event_priority(-100)
+def on_post_page(output, page, config):
+    if _enabled():
+        _stop_page(page)
+
+
+@event_priority(-100)
+def on_post_build(config) -> None:
+    """Writes the report; last, so every other post_build handler is in it."""
+    if not _enabled():
+        return
+    wall = time.perf_counter() - _build_start[0]
+    cpu = time.process_time() - _build_start[1]
+
+    events = sorted(
+        (
+            {"plugin": plugin, "event": event, "calls": calls, "wall": w, "cpu": c}
+            for (plugin, event), (calls, w, c) in _events.items()
+        ),
+        key=lambda entry: entry["wall"],
+        reverse=True,
+    )
+    pages = sorted(
+        ({"page": page, "wall": w, "cpu": c} for page, (w, c) in _pages.items()),
+        key=lambda entry: entry["wall"],
+        reverse=True,
+    )
+    spans = [
+        {"plugin": plugin, "name": name, "wall": w, "cpu": c}
+        for plugin, source in config.plugins.items()
+        for name, w, c in getattr(source, "profile_spans", ())
+    ]
+    report = {
+        "total": {"wall": wall, "cpu": cpu},
+        "events": events,
+        "pages": pages,
+        "spans": spans,
+    }
+    path = Path(config["site_dir"]) / REPORT
+    path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+    top = int(os.environ.get("MKDOCS_PROFILE_TOP", "10"))
+    lines = [f"Build took {wall:.2f}s wall, {cpu:.2f}s CPU; report in {path}"]
+    lines.append(f"Slowest {min(top, len(pages))} pages (wall, CPU):")
+    lines.extend(
+        f"  {entry['wall']:8.3f}s {entry['cpu']:8.3f}s  {entry['page']}"
+        for entry in pages[:top]
+    )
+    lines.append(f"Slowest {min(top, len(events))} handlers (wall, CPU, calls):")
+    lines.extend(
+        f"  {entry['wall']:8.3f}s {entry['cpu']:8.3f}s {entry['calls']:6d}  "
+        f"{entry['plugin']} on_{entry['event']}"
+        for entry in events[:top]
+    )
+    if spans:
+        lines.append("Reported spans (wall, CPU):")
+    lines.extend(
+        f"  {entry['wall']:8.3f}s {entry['cpu']:8.3f}s  {entry['name']}"
+        for entry in spans
+    )
+    log.info("\n".join(lines))
@@ -15,17 +15,31 @@
 """Builds the Pagefind search index, replacing Material's built-in search.
 
 ``MKDOCS_PAGEFIND_SKIP=1`` skips indexing, except under ``gh-deploy``;
-``MKDOCS_PAGEFIND_PLAYGROUND=1`` also writes the ranking playground.
+``MKDOCS_PAGEFIND_PLAYGROUND=1`` also writes the ranking playground;
+``MKDOCS_PAGEFIND_INCREMENTAL=1`` reuses the last index while no marked page
+changed and otherwise indexes marked pages only, never under ``gh-deploy``;
+``MKDOCS_PAGEFIND_BACKGROUND=1`` indexes on a worker thread under ``serve``, so
+the browser reloads without waiting and search follows when the index is ready;
+``MKDOCS_PAGEFIND_API=1`` feeds each marked page to Pagefind's Python API as it
+is rendered, instead of running the CLI over the built site afterwards.
 """
 
 from __future__ import annotations
 
+import asyncio
+import concurrent.futures
+import hashlib
+import importlib.metadata
+import json
 import logging
 import os
 import re
 import shutil
 import subprocess
 import sys
+import tempfile
+import threading
+import time
 from pathlib import Path
 
 from mkdocs.exceptions import PluginError
@@ -41,18 +55,28 @@ ARTICLE_INDEXED = '<article class="md-content__inner md-typeset" data-pagefind-b
 # `.headerlink` onto every heading, `.tabbed-labels` into "PythonJava".
 EXCLUDE_SELECTORS = ".headerlink, .tabbed-labels, .language-support-tag"
 
-# Derived from EXCLUDE_SELECTORS so the guard cannot drift from them. Hyphens
-# defeat `\b`, hence the lookarounds. Only bare `.class` selectors can be
-# matched as text, so anything else is skipped rather than left unmatchable.
+# Derived from EXCLUDE_SELECTORS so the guard cannot drift from them. Only bare
+# `.class` selectors can be matched as text, so anything else is skipped rather
+# than left unmatchable.
 _SIMPLE_CLASS = re.compile(r"\.([A-Za-z_][\w-]*)$")
-EXCLUDE_CLASS_PATTERNS = {
-    match[1]: re.compile(rf'class="[^"]*(?<![\w-]){re.escape(match[1])}(?![\w-])')
+EXCLUDE_CLASSES = frozenset(
+    match[1]
     for match in (
         _SIMPLE_CLASS.fullmatch(selector.strip())
         for selector in EXCLUDE_SELECTORS.split(",")
     )
     if match
-}
+)
+
+# One alternation, so each page is scanned once however many classes there
+# are. It matches a whole class attribute naming any of them; splitting that
+# attribute then credits every name it holds. Hyphens defeat `\b`, hence the
+# lookarounds.
+EXCLUDE_CLASS_PATTERN = re.compile(
+    r'class="([^"]*(?<![\w-])(?:'
+    + "|".join(map(re.escape, sorted(EXCLUDE_CLASSES)))
+    + r')(?![\w-])[^"]*)"'
+)
 
 # Punctuation that carries meaning here: adk.dev, run_async, a2a, C++, @tool.
 INCLUDE_CHARACTERS = ".-@#+"
@@ -61,16 +85,74 @@ INCLUDE_CHARACTERS = ".-@#+"
 # the browser, ranking silently reverts, and nothing else notices.
 RANKING_API_SYMBOLS = ("PagefindComponents", "getInstanceManager")
 
+# The generated API reference gets an index of its own, which the search modal
+# merges in only when a search is widened to it, so guide searches never fetch
+# it. Its pages carry no marker and are indexed whole, minus generator chrome.
+API_REFERENCE = "api-reference"
+API_INDEX = "pagefind-api"
+API_EXCLUDE_SELECTORS = "nav, header, footer"
+
+# Symbols the scope toggle in overrides/main.html chains through to merge the
+# API index. A rename leaves the toggle doing nothing, silently. They are not
+# public API, which is why requirements.txt pins Pagefind exactly.
+SCOPE_API_SYMBOLS = (
+    "__load__",
+    "__pagefind__",
+    "mergeIndex",
+    "searchFilters",
+    "triggerSearch",
+)
+
+# Build state is kept in .cache/pagefind next to mkdocs.yml, as precompress.py
+# keeps its cache, never in site_dir: deploy previews publish site_dir as is.
+STATE = Path(".cache") / "pagefind"
+
+# Records which built pages carry the marker, so a ``--dirty`` build can count
+# them without reading every HTML file, API reference included. It names the
+# site_dir it describes; another site_dir ignores it.
+MANIFEST = "marked.json"
+
+# The last bundle built in incremental mode. `mkdocs serve` cleans site_dir on
+# every rebuild, pagefind/ included, so reuse needs a copy outside it.
+CACHE = "bundle"
+
 _missing_anchor: list[str] = []
 
-# Which EXCLUDE_CLASS_PATTERNS keys were seen in any page rendered this build.
+# Output paths, relative to site_dir, of the pages rendered and marked this
+# build, the latter with the digest of what Pagefind reads from them. A dirty
+# build needs both: a page rendered but not marked has lost the marker, one not
+# rendered at all keeps whatever the manifest says.
+_rendered: set[str] = set()
+_marked: dict[str, str] = {}
+
+# Which EXCLUDE_CLASSES were seen in any page rendered this build.
 _seen_exclude_classes: set[str] = set()
 
+# The Pagefind process running, so a newer rebuild can stop an older background
+# run, and that run's thread and cancellation flag.
+_indexer_lock = threading.Lock()
+_indexer: subprocess.Popen | None = None
+_background_run: tuple[threading.Thread, threading.Event] | None = None
+
+# The in-process index, with the event loop thread that drives it and the adds
+# still in flight. Pages go in from on_post_page while the rest render.
+_api_loop: asyncio.AbstractEventLoop | None = None
+_api_index = None
+_api_adds: list[concurrent.futures.Future] = []
+
+# Wall and CPU seconds of each Pagefind run this build, for
+# hooks/build_profile.py: the handler timing it sees cannot tell the
+# subprocess from the checks around it.
+profile_spans: list[tuple[str, float, float]] = []
+
 # Set once per invocation by on_startup, not per build: `mkdocs serve` calls
 # on_startup once and then rebuilds on every file change.
 _command: str | None = None
 _dirty: bool = False
 
+# STATE resolved against the config file, set per build.
+_state_dir: Path | None = None
+
 
 def _skip() -> bool:
     return os.environ.get("MKDOCS_PAGEFIND_SKIP") == "1"
@@ -81,16 +163,548 @@ def _is_excluded(page) -> bool:
     return isinstance(search, dict) and search.get("exclude") is True
 
 
-def _count_marked(site_dir: Path) -> int:
-    """Counts marked pages in the built site, not ``on_post_page`` calls.
+def _scan_exclude_classes(html: str, seen: set[str]) -> None:
+    """Adds the EXCLUDE_CLASSES found in html to seen, stopping once all are."""
+    for match in EXCLUDE_CLASS_PATTERN.finditer(html):
+        seen.update(EXCLUDE_CLASSES.intersection(match[1].split()))
+        if seen == EXCLUDE_CLASSES:
+            return
+
+
+def _incremental() -> bool:
+    return (
+        os.environ.get("MKDOCS_PAGEFIND_INCREMENTAL") == "1" and _command != "gh-deploy"
+    )
+
+
+def _background() -> bool:
+    return os.environ.get("MKDOCS_PAGEFIND_BACKGROUND") == "1" and _command == "serve"
+
+
+def _api() -> bool:
+    return os.environ.get("MKDOCS_PAGEFIND_API") == "1"
+
+
+class _Superseded(Exception):
+    """A newer rebuild cancelled this background run."""
+
+
+def _digest(html: str) -> str:
+    """Hashes what Pagefind reads from a marked page: language and article.
+
+    Navigation and header are left out, so a nav edit, which re-renders every
+    page, still leaves the index current.
+    """
+    root = html.find("<html")
+    article = html.find(ARTICLE_INDEXED)
+    body = (
+        html[root : html.find(">", root) + 1]
+        + html[article : html.find("</article>", article)]
+    )
+    return hashlib.sha256(body.encode("utf-8")).hexdigest()
+
+
+def _scan_marked(site_dir: Path) -> dict[str, str]:
+    """Finds marked pages by reading every built file; the no-manifest fallback."""
+    marked = {}
+    for path in site_dir.rglob("*.html"):
+        html = path.read_text(encoding="utf-8", errors="ignore")
+        if ARTICLE_INDEXED in html:
+            marked[path.relative_to(site_dir).as_posix()] = _digest(html)
+    return marked
+
+
+def _link_or_copy(src, dest) -> None:
+    try:
+        os.link(src, dest)
+    except OSError:
+        # Another filesystem, e.g. a site_dir outside the checkout.
+        shutil.copy2(src, dest)
+
+
+def _read_manifest(site_dir: Path) -> dict | None:
+    try:
+        data = json.loads((_state_dir / MANIFEST).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or not isinstance(data.get("marked"), dict):
+        return None
+    if data.get("site_dir") != str(site_dir.resolve()):
+        return None
+    return data
+
+
+def _write_manifest(
+    site_dir: Path, marked: dict[str, str], indexed: dict[str, str] | None = None
+) -> None:
+    """Writes the marked pages and, once verified, what the cached index holds."""
+    data = {
+        "site_dir": str(site_dir.resolve()),
+        "marked": marked,
+        "indexed": indexed or {},
+        "key": _index_key() if indexed else {},
+    }
+    _state_dir.mkdir(parents=True, exist_ok=True)
+    (_state_dir / MANIFEST).write_text(
+        json.dumps(data, indent=0, sort_keys=True), encoding="utf-8"
+    )
+
+
+def _marked_pages(site_dir: Path) -> dict[str, str]:
+    """Returns the pages marked in the built site, not just in this build.
+
+    ``--dirty`` re-renders only changed pages, yet Pagefind indexes every
+    marked file on disk, so the rest are carried over from the previous
+    build's manifest while their file survives. A full build rendered every
+    page, so its own record is the whole answer.
+    """
+    if not _dirty:
+        return dict(_marked)
+    manifest = _read_manifest(site_dir)
+    if manifest is None:
+        log.info(
+            "No %s in %s for %s; scanning built pages instead.",
+            MANIFEST,
+            _state_dir,
+            site_dir,
+        )
+        return _scan_marked(site_dir)
+    carried = {
+        path: digest
+        for path, digest in manifest["marked"].items()
+        if path not in _rendered and (site_dir / path).is_file()
+    }
+    return {**carried, **_marked}
+
+
+def _stage_marked(site_dir: Path, marked: dict[str, str], stage_dir: Path) -> None:
+    """Links the marked pages into a tree of their own, at the same paths.
 
-    ``--dirty`` re-renders only changed pages, so counting calls would
-    undercount what Pagefind still indexes.
+    Pagefind derives URLs from paths, so indexing the tree gives the same
+    fragments as indexing site_dir, without parsing the API reference.
     """
-    return sum(
-        ARTICLE_INDEXED in path.read_text(encoding="utf-8", errors="ignore")
-        for path in site_dir.rglob("*.html")
+    for path in marked:
+        target = stage_dir / path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        _link_or_copy(site_dir / path, target)
+
+
+def _options() -> tuple[str, ...]:
+    """The CLI options every index is built with."""
+    options = (
+        "--exclude-selectors",
+        EXCLUDE_SELECTORS,
+        "--include-characters",
+        INCLUDE_CHARACTERS,
     )
+    if os.environ.get("MKDOCS_PAGEFIND_PLAYGROUND") == "1":
+        options += ("--write-playground",)
+    return options
+
+
+def _pagefind_versions() -> list[str]:
+    """The installed Pagefind packages, CLI binary included."""
+    versions = []
+    for name in ("pagefind", "pagefind_bin", "pagefind_bin_extended"):
+        try:
+            versions.append(f"{name} {importlib.metadata.version(name)}")
+        except importlib.metadata.PackageNotFoundError:
+            pass
+    return versions
+
+
+def _index_key(options: tuple[str, ...] = ()) -> dict:
+    """What, besides the pages, decides a bundle: Pagefind and its options."""
+    return {"pagefind": _pagefind_versions(), "options": [*_options(), *options]}
+
+
+def _children_cpu() -> float:
+    times = os.times()
+    return times.children_user + times.children_system
+
+
+def _run_pagefind(
+    source_dir: Path,
+    output_dir: Path,
+    cancelled: threading.Event | None = None,
+    *,
+    label: str = "pagefind subprocess",
+    options: tuple[str, ...] = (),
+) -> None:
+    global _indexer
+    command = [
+        sys.executable,
+        "-m",
+        "pagefind",
+        "--site",
+        str(source_dir),
+        "--output-path",
+        str(output_dir),
+        "--quiet",
+        *_options(),
+        *options,
+    ]
+
+    # Captured, not inherited: Pagefind warns on every build about API
+    # reference files with no <html>. Debug keeps new warnings reachable.
+    wall, children = time.perf_counter(), _children_cpu()
+    with _indexer_lock:
+        if cancelled is not None and cancelled.is_set():
+            raise _Superseded
+        process = subprocess.Popen(
+            command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+        )
+        _indexer = process
+    try:
+        stdout, stderr = process.communicate()
+    finally:
+        with _indexer_lock:
+            _indexer = None
+    profile_spans.append(
+        (
+            label,
+            time.perf_counter() - wall,
+            _children_cpu() - children,
+        )
+    )
+    if cancelled is not None and cancelled.is_set():
+        raise _Superseded
+    log.debug("Pagefind stdout:\n%s", stdout)
+    log.debug("Pagefind stderr:\n%s", stderr)
+
+    if process.returncode != 0:
+        # `python -m pagefind` with the package absent exits non-zero rather
+        # than raising FileNotFoundError, so the install hint belongs here.
+        if "No module named pagefind" in stderr:
+            raise PluginError(
+                "Could not run the Pagefind indexer. Install it with "
+                "'pip install -r requirements.txt'."
+            )
+        raise PluginError(
+            f"Pagefind indexing failed with exit code {process.returncode}. "
+            f"No prebuilt binary may exist for this platform; see "
+            f"https://pypi.org/project/pagefind-bin/\n"
+            f"{stdout}\n{stderr}"
+        )
+
+
+def _verify_bundle(bundle_dir: Path, marked: int, site_dir: Path) -> int:
+    """Checks a written bundle against the build; returns the fragment count."""
+    # One fragment per indexed page, so the counts describe the same set and
+    # any difference is a defect. No threshold to go stale.
+    indexed = len(list((bundle_dir / "fragment").glob("*.pf_fragment")))
+    if indexed != marked:
+        raise PluginError(
+            f"Pagefind indexed {indexed} page(s) but the build marked "
+            f"{marked}; Pagefind writes one fragment per indexed page, so the "
+            f"two must match. Far more indexed than marked means the marker "
+            f"was on no page at all and Pagefind indexed the whole site "
+            f"whole-body, so check that on_post_page still finds the ARTICLE "
+            f"anchor. Fewer means marked pages were dropped during indexing; "
+            f"drop --quiet to see which. Either way, "
+            f"`grep -rl {ARTICLE_INDEXED!r} {site_dir}` lists the marked pages."
+        )
+
+    # overrides/main.html links both from every page's <head>. Nothing above
+    # notices a rename: fragment counts stay perfect while search 404s.
+    for asset in ("pagefind-component-ui.js", "pagefind-component-ui.css"):
+        if not (bundle_dir / asset).is_file():
+            raise PluginError(
+                f"Pagefind did not emit pagefind/{asset}, which "
+                f"overrides/main.html loads on every page, so no search box "
+                f"would render at all. Check whether the Pagefind bundle "
+                f"renamed the file and update overrides/main.html to match."
+            )
+
+    # Read once for both symbols: the bundle is hundreds of kilobytes of
+    # minified JavaScript and this runs on every build.
+    component_ui = (bundle_dir / "pagefind-component-ui.js").read_text(
+        encoding="utf-8", errors="ignore"
+    )
+    for symbol in RANKING_API_SYMBOLS:
+        if symbol not in component_ui:
+            raise PluginError(
+                f"pagefind/pagefind-component-ui.js no longer contains "
+                f"{symbol!r}, which overrides/main.html chains through to set "
+                f"the search ranking. Left alone it throws a TypeError in the "
+                f"browser and ranking silently reverts to Pagefind's "
+                f"defaults. Update the script in overrides/main.html to the "
+                f"new API, and RANKING_API_SYMBOLS with it."
+            )
+    for symbol in SCOPE_API_SYMBOLS:
+        if symbol not in component_ui:
+            raise PluginError(
+                f"pagefind/pagefind-component-ui.js no longer contains "
+                f"{symbol!r}, which the API reference scope toggle in "
+                f"overrides/main.html chains through to merge the "
+                f"{API_INDEX}/ index. Left alone the toggle throws in the "
+                f"browser and searches never reach the API reference. Update "
+                f"the script to the new API, and SCOPE_API_SYMBOLS with it."
+            )
+    return indexed
+
+
+def _fingerprint(tree: Path) -> str:
+    """Hashes the paths, sizes and mtimes under tree; no file is read."""
+    digest = hashlib.sha256()
+    for path in sorted(tree.rglob("*")):
+        stat = path.stat()
+        digest.update(f"{path}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode())
+    return digest.hexdigest()[:16]
+
+
+def _api_options(trees: list[str]) -> tuple[str, ...]:
+    return (
+        "--glob",
+        f"{API_REFERENCE}/{{{','.join(trees)}}}/**/*.html",
+        "--exclude-selectors",
+        API_EXCLUDE_SELECTORS,
+        # Dokka omits <html lang>; a second language would never merge.
+        "--force-language",
+        "en",
+    )
+
+
+def _reuse_api_index(site_dir: Path, docs_dir: Path) -> tuple[list[str], Path] | None:
+    """Puts the cached API_INDEX in place, if it is current.
+
+    Returns the trees to index and the cache directory to keep the result in
+    when it is not, or None when nothing is left to do.
+    """
+    output_dir = site_dir / API_INDEX
+    shutil.rmtree(output_dir, ignore_errors=True)
+    # Each generated tree, not api-reference/ itself: its index.md is a guide.
+    root = site_dir / API_REFERENCE
+    trees = (
+        sorted(p.name for p in root.iterdir() if p.is_dir()) if root.is_dir() else []
+    )
+    if not trees:
+        log.info(
+            "No %s/ trees in %s; no API reference index built.", API_REFERENCE, site_dir
+        )
+        return None
+
+    # The API reference only changes on regeneration, yet a full build starts
+    # from a clean site_dir and `mkdocs serve` cleans it on every rebuild, so
+    # the index is kept keyed on its sources and how it is built. gh-deploy
+    # always indexes afresh.
+    digest = hashlib.sha256(_fingerprint(docs_dir / API_REFERENCE).encode())
+    digest.update(json.dumps(_index_key(_api_options(trees))).encode())
+    cache_dir = _state_dir / f"{API_INDEX}-{digest.hexdigest()[:16]}"
+    if _command == "gh-deploy" or not cache_dir.is_dir():
+        return trees, cache_dir
+    shutil.copytree(cache_dir, output_dir, copy_function=_link_or_copy)
+    log.info("API reference unchanged; reused its Pagefind index.")
+    return None
+
+
+def _build_api_index(
+    site_dir: Path,
+    trees: list[str],
+    cache_dir: Path,
+    cancelled: threading.Event | None = None,
+) -> None:
+    """Indexes the generated API reference trees into API_INDEX."""
+    # Built aside and renamed into place, so a background run never leaves a
+    # half-written index where the search modal can fetch it.
+    staging_dir = site_dir / f".{API_INDEX}-staging"
+    shutil.rmtree(staging_dir, ignore_errors=True)
+    try:
+        log.info("Building Pagefind API reference index for %s", ", ".join(trees))
+        _run_pagefind(
+            site_dir,
+            staging_dir,
+            cancelled,
+            label="pagefind subprocess (API reference)",
+            options=_api_options(trees),
+        )
+        indexed = len(list((staging_dir / "fragment").glob("*.pf_fragment")))
+        if indexed == 0 or not (staging_dir / "pagefind-entry.json").is_file():
+            raise PluginError(
+                f"Pagefind wrote no usable {API_INDEX}/ index for "
+                f"{API_REFERENCE}/{{{','.join(trees)}}}, so widening a search "
+                f"to the API reference would find nothing. Drop --quiet in "
+                f"_run_pagefind to see why."
+            )
+        _swap_in(staging_dir, site_dir / API_INDEX)
+    finally:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+    log.info("Pagefind indexed %d API reference pages.", indexed)
+
+    if _command != "gh-deploy":
+        for stale in _state_dir.glob(f"{API_INDEX}-*"):
+            shutil.rmtree(stale, ignore_errors=True)
+        shutil.copytree(site_dir / API_INDEX, cache_dir, copy_function=_link_or_copy)
+
+
+def _build_index(
+    site_dir: Path,
+    marked_pages: dict[str, str],
+    output_dir: Path,
+    cancelled: threading.Event | None = None,
+) -> int:
+    """Indexes into output_dir and verifies the bundle; returns its page count."""
+    if _incremental():
+        with tempfile.TemporaryDirectory(prefix="pagefind-") as stage_dir:
+            _stage_marked(site_dir, marked_pages, Path(stage_dir))
+            _run_pagefind(Path(stage_dir), output_dir, cancelled)
+    else:
+        _run_pagefind(site_dir, output_dir, cancelled)
+    return _verify_bundle(output_dir, len(marked_pages), site_dir)
+
+
+def _record_index(site_dir: Path, marked_pages: dict[str, str]) -> None:
+    """Keeps the verified bundle for reuse while no marked page changes."""
+    if not _incremental():
+        return
+    # Hard links where possible: pagefind/ is replaced before every run, so the
+    # next index writes new files rather than through these links.
+    cache_dir = _state_dir / CACHE
+    shutil.rmtree(cache_dir, ignore_errors=True)
+    shutil.copytree(site_dir / "pagefind", cache_dir, copy_function=_link_or_copy)
+    _write_manifest(site_dir, marked_pages, indexed=marked_pages)
+
+
+def _swap_in(staging_dir: Path, output_dir: Path) -> None:
+    """Replaces output_dir with staging_dir by renaming, never by writing.
+
+    Two renames, each atomic: a request in between gets a 404 and a retry,
+    never a bundle whose fragments disagree with its index.
+    """
+    retired = staging_dir.with_name(staging_dir.name + "-retired")
+    shutil.rmtree(retired, ignore_errors=True)
+    if output_dir.exists():
+        output_dir.rename(retired)
+    staging_dir.rename(output_dir)
+    shutil.rmtree(retired, ignore_errors=True)
+
+
+def _index_in_background(
+    site_dir: Path,
+    marked_pages: dict[str, str] | None,
+    api_job: tuple[list[str], Path] | None,
+    cancelled: threading.Event,
+) -> None:
+    """Builds whichever of the two indexes the build left to do, guides first."""
+    # Dot-prefixed, so the clean at the start of the next rebuild leaves it
+    # alone; that rebuild cancels this run first anyway.
+    staging_dir = site_dir / ".pagefind-staging"
+    shutil.rmtree(staging_dir, ignore_errors=True)
+    try:
+        if marked_pages is not None:
+            indexed = _build_index(site_dir, marked_pages, staging_dir, cancelled)
+            if cancelled.is_set():
+                return
+            _swap_in(staging_dir, site_dir / "pagefind")
+            _record_index(site_dir, marked_pages)
+            log.info(
+                "Pagefind indexed %d pages in the background, matching %d marked.",
+                indexed,
+                len(marked_pages),
+            )
+        if api_job is not None:
+            _build_api_index(site_dir, *api_job, cancelled)
+    except _Superseded:
+        log.debug("Background Pagefind run superseded by a newer rebuild.")
+    except PluginError as error:
+        # The build has finished and the browser reloaded, so there is nothing
+        # left to fail; the old bundle, if any, stays in place.
+        log.error("Background Pagefind run failed: %s", error)
+    finally:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+
+
+def _cancel_background() -> None:
+    """Stops the background run in flight, if any, and waits for it to exit."""
+    global _background_run
+    if _background_run is None:
+        return
+    thread, cancelled = _background_run
+    cancelled.set()
+    with _indexer_lock:
+        if _indexer is not None:
+            _indexer.terminate()
+    thread.join()
+    _background_run = None
+
+
+def _api_call(coroutine):
+    """Runs a coroutine on the index's event loop; returns its future."""
+    return asyncio.run_coroutine_threadsafe(coroutine, _api_loop)
+
+
+def _start_api(output_dir: Path) -> None:
+    global _api_loop, _api_index
+    # Imported here, not at the top: MkDocs puts hooks/ first on sys.path while
+    # loading this file, so `import pagefind` there would import this hook.
+    try:
+        from pagefind.index import PagefindIndex
+    except ImportError as error:
+        raise PluginError(
+            "Could not import the Pagefind Python API. Install it with "
+            "'pip install -r requirements.txt'."
+        ) from error
+
+    _api_loop = asyncio.new_event_loop()
+    threading.Thread(
+        target=_api_loop.run_forever, name="pagefind-api", daemon=True
+    ).start()
+    config = {
+        "exclude_selectors": [s.strip() for s in EXCLUDE_SELECTORS.split(",")],
+        "include_characters": INCLUDE_CHARACTERS,
+        "output_path": str(output_dir),
+        "write_playground": os.environ.get("MKDOCS_PAGEFIND_PLAYGROUND") == "1",
+    }
+    try:
+        _api_index = _api_call(PagefindIndex(config).__aenter__()).result()
+    except FileNotFoundError as error:
+        _stop_api(write=False)
+        raise PluginError(
+            "Could not start the Pagefind service: no binary found. No "
+            "prebuilt binary may exist for this platform; see "
+            "https://pypi.org/project/pagefind-bin/"
+        ) from error
+
+
+def _stop_api(*, write: bool) -> None:
+    """Writes the bundle if asked, then shuts the service and its loop down."""
+    global _api_loop, _api_index
+    if _api_loop is None:
+        return
+    try:
+        if _api_index is not None:
+            # The context manager writes on a clean exit and only closes the
+            # service when handed an exception type.
+            exc_type = None if write else _Superseded
+            _api_call(_api_index.__aexit__(exc_type, None, None)).result()
+    finally:
+        _api_loop.call_soon_threadsafe(_api_loop.stop)
+        _api_loop = None
+        _api_index = None
+        _api_adds.clear()
+
+
+def _add_to_api(html: str, path: str) -> None:
+    # source_path rather than url, so Pagefind derives URLs as the CLI does.
+    _api_adds.append(
+        _api_call(_api_index.add_html_file(content=html, source_path=path))
+    )
+
+
+def _finish_api(site_dir: Path, marked_pages: dict[str, str]) -> None:
+    """Adds what this build did not render, waits for every add, writes."""
+    # A --dirty build rendered only changed pages; the rest are still on disk.
+    for path in marked_pages.keys() - _marked.keys():
+        _add_to_api((site_dir / path).read_text(encoding="utf-8"), path)
+    try:
+        for add in _api_adds:
+            add.result()
+    except Exception as error:
+        _stop_api(write=False)
+        raise PluginError(
+            f"The Pagefind Python API failed to index a page: {error}"
+        ) from error
+    _stop_api(write=True)
 
 
 def on_startup(*, command: str, dirty: bool) -> None:
@@ -102,25 +716,43 @@ def on_startup(*, command: str, dirty: bool) -> None:
 
 def on_pre_build(config) -> None:
     """Resets per-build state so it cannot leak across ``mkdocs serve`` rebuilds."""
+    global _state_dir
+    _state_dir = Path(config.config_file_path).parent / STATE
+    # First, before MkDocs cleans site_dir under the indexer's feet.
+    _cancel_background()
     _missing_anchor.clear()
     _seen_exclude_classes.clear()
+    _rendered.clear()
+    _marked.clear()
+    profile_spans.clear()
+    _stop_api(write=False)
+    if _api() and not _skip():
+        _start_api(Path(config["site_dir"]) / "pagefind")
 
 
 def on_post_page(output: str, page, config) -> str:
     """Adds ``data-pagefind-body`` to the content article of indexable pages."""
-    if _skip() or _is_excluded(page):
+    if _skip():
+        return output
+    _rendered.add(page.file.dest_uri)
+    if _is_excluded(page):
         return output
     # Only indexed pages count: a class on an excluded page proves nothing.
-    for name, pattern in EXCLUDE_CLASS_PATTERNS.items():
-        if name not in _seen_exclude_classes and pattern.search(output):
-            _seen_exclude_classes.add(name)
+    # Once all have been seen, the rest of the build skips the scan.
+    if _seen_exclude_classes != EXCLUDE_CLASSES:
+        _scan_exclude_classes(output, _seen_exclude_classes)
     if ARTICLE not in output:
         _missing_anchor.append(page.file.src_uri)
         return output
-    return output.replace(ARTICLE, ARTICLE_INDEXED, 1)
+    output = output.replace(ARTICLE, ARTICLE_INDEXED, 1)
+    _marked[page.file.dest_uri] = _digest(output)
+    if _api_index is not None:
+        _add_to_api(output, page.file.dest_uri)
+    return output
 
 
 def on_post_build(config) -> None:
+    global _background_run
     if _skip():
         # gh-deploy runs without --strict, so the warning below would not
         # stop it shipping a site with no index.
@@ -147,7 +779,7 @@ def on_post_build(config) -> None:
     # Argues from absence, which only a full render supports: a dirty build
     # re-renders too few pages for an unseen class to mean anything.
     if not _dirty:
-        for name in EXCLUDE_CLASS_PATTERNS:
+        for name in sorted(EXCLUDE_CLASSES):
             if name not in _seen_exclude_classes:
                 raise PluginError(
                     f"No indexed page carried the class {name!r}, so the "
@@ -163,7 +795,8 @@ def on_post_build(config) -> None:
 
     # Checked before indexing: with nothing marked, Pagefind falls back to
     # indexing every file whole-body, its slowest path, for the same failure.
-    marked = _count_marked(site_dir)
+    marked_pages = _marked_pages(site_dir)
+    marked = len(marked_pages)
     if marked == 0:
         raise PluginError(
             f"No page in {site_dir} carries the Pagefind marker, so search "
@@ -172,88 +805,84 @@ def on_post_build(config) -> None:
             f"'search: exclude: true' front matter."
         )
 
+    # Written before indexing with nothing recorded as indexed, so a failed run
+    # can never be mistaken for current.
+    previous = _read_manifest(site_dir) or {}
+    _write_manifest(site_dir, marked_pages)
+
+    # Reused in place when current; otherwise built after the guide index.
+    api_job = _reuse_api_index(site_dir, Path(config["docs_dir"]))
+
+    output_dir = site_dir / "pagefind"
+    cache_dir = _state_dir / CACHE
+    index_pending = True
+    # A new Pagefind or changed options make the same pages a different bundle.
+    if (
+        _incremental()
+        and cache_dir.is_dir()
+        and previous.get("indexed") == marked_pages
+        and previous.get("key") == _index_key()
+    ):
+        _stop_api(write=False)
+        shutil.rmtree(output_dir, ignore_errors=True)
+        shutil.copytree(cache_dir, output_dir, copy_function=_link_or_copy)
+        indexed = _verify_bundle(output_dir, marked, site_dir)
+        _write_manifest(site_dir, marked_pages, indexed=marked_pages)
+        log.info("No marked page changed; reused the Pagefind index of %d.", indexed)
+        index_pending = False
+
     # Pagefind appends to its output directory and `--dirty` does not clean
     # site_dir, so fragments for deleted pages would survive in results.
-    shutil.rmtree(site_dir / "pagefind", ignore_errors=True)
+    elif _api_index is not None:
+        shutil.rmtree(output_dir, ignore_errors=True)
+        log.info("Writing Pagefind search index for %d marked pages", marked)
+        wall = time.perf_counter()
+        _finish_api(site_dir, marked_pages)
+        profile_spans.append(("pagefind API write", time.perf_counter() - wall, 0.0))
+        indexed = _verify_bundle(output_dir, marked, site_dir)
+        _record_index(site_dir, marked_pages)
+        log.info("Pagefind indexed %d pages, matching %d marked.", indexed, marked)
+        index_pending = False
+
+    if _background():
+        if not index_pending and api_job is None:
+            return
+        cancelled = threading.Event()
+        thread = threading.Thread(
+            target=_index_in_background,
+            args=(
+                site_dir,
+                marked_pages if index_pending else None,
+                api_job,
+                cancelled,
+            ),
+            name="pagefind",
+            daemon=True,
+        )
+        thread.start()
+        _background_run = (thread, cancelled)
+        log.info("Building Pagefind search index in the background")
+        return
 
-    command = [
-        sys.executable,
-        "-m",
-        "pagefind",
-        "--site",
-        str(site_dir),
-        "--exclude-selectors",
-        EXCLUDE_SELECTORS,
-        "--include-characters",
-        INCLUDE_CHARACTERS,
-        "--quiet",
-    ]
-    if os.environ.get("MKDOCS_PAGEFIND_PLAYGROUND") == "1":
-        command.append("--write-playground")
+    if index_pending:
+        shutil.rmtree(output_dir, ignore_errors=True)
+        if _incremental():
+            log.info("Building Pagefind search index for %d marked pages", marked)
+        else:
+            log.info("Building Pagefind search index in %s", site_dir)
+        indexed = _build_index(site_dir, marked_pages, output_dir)
+        _record_index(site_dir, marked_pages)
+        log.info("Pagefind indexed %d pages, matching %d marked.", indexed, marked)
 
-    log.info("Building Pagefind search index in %s", site_dir)
-    try:
-        # Captured, not inherited: Pagefind warns on every build about API
-        # reference files with no <html>. Debug keeps new warnings reachable.
-        result = subprocess.run(command, check=True, capture_output=True, text=True)
-        log.debug("Pagefind stdout:\n%s", result.stdout)
-        log.debug("Pagefind stderr:\n%s", result.stderr)
-    except subprocess.CalledProcessError as error:
-        # `python -m pagefind` with the package absent exits non-zero rather
-        # than raising FileNotFoundError, so the install hint belongs here.
-        stderr = error.stderr or ""
-        if "No module named pagefind" in stderr:
-            raise PluginError(
-                "Could not run the Pagefind indexer. Install it with "
-                "'pip install -r requirements.txt'."
-            ) from error
-        raise PluginError(
-            f"Pagefind indexing failed with exit code {error.returncode}. "
-            f"No prebuilt binary may exist for this platform; see "
-            f"https://pypi.org/project/pagefind-bin/\n"
-            f"{error.stdout}\n{stderr}"
-        ) from error
+    if api_job is not None:
+        _build_api_index(site_dir, *api_job)
 
-    # One fragment per indexed page, so the counts describe the same set and
-    # any difference is a defect. No threshold to go stale.
-    indexed = len(list((site_dir / "pagefind" / "fragment").glob("*.pf_fragment")))
-    if indexed != marked:
-        raise PluginError(
-            f"Pagefind indexed {indexed} page(s) but the build marked "
-            f"{marked}; Pagefind writes one fragment per indexed page, so the "
-            f"two must match. Far more indexed than marked means the marker "
-            f"was on no page at all and Pagefind indexed the whole site "
-            f"whole-body, so check that on_post_page still finds the ARTICLE "
-            f"anchor. Fewer means marked pages were dropped during indexing; "
-            f"drop --quiet to see which. Either way, "
-            f"`grep -rl {ARTICLE_INDEXED!r} {site_dir}` lists the marked pages."
-        )
 
-    # overrides/main.html links both from every page's <head>. Nothing above
-    # notices a rename: fragment counts stay perfect while search 404s.
-    for asset in ("pagefind-component-ui.js", "pagefind-component-ui.css"):
-        if not (site_dir / "pagefind" / asset).is_file():
-            raise PluginError(
-                f"Pagefind did not emit pagefind/{asset}, which "
-                f"overrides/main.html loads on every page, so no search box "
-                f"would render at all. Check whether the Pagefind bundle "
-                f"renamed the file and update overrides/main.html to match."
-            )
+def on_build_error(error) -> None:
+    # Leaves no service process behind when this or another plugin fails.
+    _stop_api(write=False)
 
-    # Read once for both symbols: the bundle is hundreds of kilobytes of
-    # minified JavaScript and this runs on every build.
-    component_ui = (site_dir / "pagefind" / "pagefind-component-ui.js").read_text(
-        encoding="utf-8", errors="ignore"
-    )
-    for symbol in RANKING_API_SYMBOLS:
-        if symbol not in component_ui:
-            raise PluginError(
-                f"pagefind/pagefind-component-ui.js no longer contains "
-                f"{symbol!r}, which overrides/main.html chains through to set "
-                f"the search ranking. Left alone it throws a TypeError in the "
-                f"browser and ranking silently reverts to Pagefind's "
-                f"defaults. Update the script in overrides/main.html to the "
-                f"new API, and RANKING_API_SYMBOLS with it."
-            )
 
-    log.info("Pagefind indexed %d pages, matching %d marked.", indexed, marked)
+def on_shutdown() -> None:
+    _cancel_background()
+    _stop_api(write=False)
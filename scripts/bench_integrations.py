@@ -0,0 +1,133 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Times the integration catalog over synthetic pages, cold and warm.
+
+Writes ``--pages`` pages with catalog frontmatter into a temporary docs dir,
+then builds the catalog index and renders ``--catalogs`` catalogs from it:
+cold (nothing cached), and warm from disk (the module executed afresh, as on
+every ``mkdocs serve`` rebuild, with the disk cache from the last run). The
+in-memory line renders again from an index already built, the cost of each
+further catalog in the same build.
+
+Usage:
+    python scripts/bench_integrations.py [--pages 500] [--catalogs 3] [--runs 5]
+"""
+
+import argparse
+import importlib.util
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+INTEGRATIONS = Path(__file__).with_name('integrations.py')
+TAGS = ['mcp', 'google', 'databases', 'observability', 'search', 'code']
+
+
+class _Env:
+    """The part of the macros plugin's env that define_env uses."""
+
+    def __init__(self, conf):
+        self.conf = conf
+        self.macros = {}
+
+    def macro(self, func):
+        self.macros[func.__name__] = func
+        return func
+
+
+def _load(conf):
+    # Executed afresh each time, as the macros plugin does on every build.
+    spec = importlib.util.spec_from_file_location('integrations', INTEGRATIONS)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    env = _Env(conf)
+    module.define_env(env)
+    return env.macros['render_catalog']
+
+
+def _write_pages(docs_dir, pages):
+    body = '\n'.join(f'Paragraph {i} about the integration.' for i in range(80))
+    for i in range(pages):
+        tags = ', '.join(TAGS[j % len(TAGS)] for j in range(i % 3 + 1))
+        (docs_dir / 'integrations' / f'tool-{i}.md').write_text(
+            f'---\n'
+            f'catalog_title: Tool {i}\n'
+            f'catalog_description: Connects agents to tool {i}.\n'
+            f'catalog_icon: /integrations/assets/tool-{i}.svg\n'
+            f'catalog_tags: [{tags}]\n'
+            f'---\n\n# Tool {i}\n\n{body}\n',
+            encoding='utf-8')
+
+
+def _best_of(runs, prepare, build):
+    best = float('inf')
+    output = None
+    for _ in range(runs):
+        prepare()
+        start = time.perf_counter()
+        output = build()
+        best = min(best, time.perf_counter() - start)
+    return best, output
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--pages', type=int, default=500)
+    parser.add_argument('--catalogs', type=int, default=3)
+    parser.add_argument('--runs', type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        docs_dir = root / 'docs'
+        (docs_dir / 'integrations').mkdir(parents=True)
+        _write_pages(docs_dir, args.pages)
+        script = docs_dir / 'javascript' / 'catalog-filter.js'
+        script.parent.mkdir()
+        shutil.copyfile(INTEGRATIONS.parent.parent / 'docs' / script.relative_to(docs_dir), script)
+        conf = {
+            'docs_dir': str(docs_dir),
+            'config_file_path': str(root / 'mkdocs.yml'),
+        }
+        cache_dir = root / '.cache'
+
+        def render(catalog):
+            return [catalog('integrations/*.md') for _ in range(args.catalogs)]
+
+        def build():
+            return render(_load(conf))
+
+        os.environ.pop('MKDOCS_CATALOG_CACHE', None)
+        built = _load(conf)
+
+        results = [
+            ('cold', *_best_of(args.runs,
+                               lambda: shutil.rmtree(cache_dir, ignore_errors=True),
+                               build)),
+            ('warm, disk', *_best_of(args.runs, lambda: None, build)),
+            ('warm, memory', *_best_of(args.runs, lambda: None,
+                                       lambda: render(built))),
+        ]
+        assert len({tuple(output) for _, _, output in results}) == 1
+
+        print(f'{args.pages} pages, {args.catalogs} catalogs')
+        for label, seconds, _ in results:
+            print(f'{label:>14}: {seconds * 1000:8.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -12,11 +12,263 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import yaml
+import hashlib
 import html
-from pathlib import Path
+import importlib.util
+import json
+import os
+import re
+from fnmatch import fnmatchcase
+from pathlib import Path, PurePosixPath
 from mkdocs.plugins import log
 
+# Loaded by path: MkDocs puts neither scripts/ nor hooks/ on sys.path.
+_spec = importlib.util.spec_from_file_location(
+    'page_meta', Path(__file__).with_name('page_meta.py'))
+page_meta = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(page_meta)
+
+# Card data per page, keyed on path and invalidated by mtime and size, so an
+# unchanged page is never read or parsed twice. MkDocs re-executes this module
+# on every `mkdocs serve` rebuild, so the cache is also kept on disk; set
+# MKDOCS_CATALOG_CACHE=0 to keep it in memory only.
+CACHE_FILE = Path('.cache') / 'catalog-frontmatter.json'
+# Bump when read_card changes what it derives, to drop stale cached cards.
+CACHE_VERSION = 2
+
+# The pages the catalog index covers, relative to docs_dir. render_catalog
+# can only list pages matched here; add a pattern before using a new one.
+CATALOG_PATTERNS = ('integrations/*.md',)
+# Written to the site root for client-side use.
+CATALOG_JSON = 'catalog.json'
+# The filter logic, shared by every catalog, relative to docs_dir.
+FILTER_SCRIPT = 'javascript/catalog-filter.js'
+# Cards a virtualized catalog renders at first, and per "Show more".
+CATALOG_PAGE_SIZE = 24
+# Largest serialized search index a catalog may inline, in bytes. The
+# integrations catalog needed 32 KiB at 100 cards.
+SEARCH_INDEX_BUDGET = 64 * 1024
+
+_cards = {}
+_cache_loaded = set()
+_catalog_index = {}
+
+
+def _disk_cache_enabled():
+    return os.environ.get('MKDOCS_CATALOG_CACHE') != '0'
+
+
+def _load_cache(cache_path):
+    """
+    Merges the on-disk cache into memory, once per module execution.
+    """
+    if cache_path in _cache_loaded or not _disk_cache_enabled():
+        return
+    _cache_loaded.add(cache_path)
+    try:
+        data = json.loads(cache_path.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return
+    if data.get('version') == CACHE_VERSION:
+        for key, (mtime_ns, size, card) in data['cards'].items():
+            _cards.setdefault(key, (mtime_ns, size, card))
+
+
+def _save_cache(cache_path, docs_dir):
+    if not _disk_cache_enabled():
+        return
+    # Pages that were deleted or renamed would otherwise stay in it for good.
+    cards = {key: entry for key, entry in _cards.items()
+             if (docs_dir / key).exists()}
+    data = {'version': CACHE_VERSION, 'cards': cards}
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        partial = cache_path.with_suffix('.tmp')
+        partial.write_text(json.dumps(data), encoding='utf-8')
+        os.replace(partial, cache_path)
+    except OSError as e:
+        log.warning(f"Could not write catalog cache {cache_path}: {e}")
+
+
+def read_card(file_path, docs_dir):
+    """
+    Reads the card data for one catalog page from its frontmatter.
+    """
+    # Reads on to the first H1 only if title not in frontmatter
+    frontmatter, h1 = page_meta.read_frontmatter(
+        file_path, title_keys=('catalog_title', 'title'))
+
+    # Get metadata
+    title = frontmatter.get('catalog_title', frontmatter.get('title')) or h1
+    # Fallback to filename
+    if not title:
+        title = file_path.stem.replace('-', ' ').title()
+
+    description = frontmatter.get('catalog_description',
+        frontmatter.get('description', ''))
+    icon = frontmatter.get('catalog_icon',
+        frontmatter.get('tool_icon',
+        frontmatter.get('icon', '/integrations/assets/toolbox.svg'))) # Default icon
+
+    tags = frontmatter.get('catalog_tags', [])
+    if isinstance(tags, str):
+        tags = [tags]
+
+    # Normalize tags to lowercase for consistent filtering
+    tags = [t.lower() for t in tags]
+
+    # Calculate root-relative link from file path
+    rel_path = file_path.relative_to(docs_dir).with_suffix('')
+    link = f"/{rel_path}/"
+
+    # Ensure icon path is root-relative
+    if not icon.startswith('/') and not icon.startswith('http'):
+         icon = f"/{icon}"
+
+    return {
+        'title': title,
+        'description': description,
+        'icon': icon,
+        'link': link,
+        'tags': tags
+    }
+
+
+def load_card(file_path, docs_dir):
+    """
+    Returns the card data for a page, from the cache while the file is unchanged.
+
+    Returns a tuple of the card and whether it had to be read.
+    """
+    key = file_path.relative_to(docs_dir).as_posix()
+    stat = file_path.stat()
+    cached = _cards.get(key)
+    if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        return cached[2], False
+    card = read_card(file_path, docs_dir)
+    _cards[key] = (stat.st_mtime_ns, stat.st_size, card)
+    return card, True
+
+
+def build_catalog_index(docs_dir, cache_path):
+    """
+    Reads every page in CATALOG_PATTERNS once, in path order.
+
+    Returns a dict of docs-relative path to card data, for all macros to share.
+    """
+    _load_cache(cache_path)
+    files = sorted({path for pattern in CATALOG_PATTERNS
+                    for path in docs_dir.glob(pattern)})
+
+    index = {}
+    changed = False
+    for file_path in files:
+        # Skip index.md files as they are usually container pages, not items
+        if file_path.name == 'index.md':
+            continue
+
+        try:
+            card, read = load_card(file_path, docs_dir)
+            changed = changed or read
+            index[file_path.relative_to(docs_dir).as_posix()] = card
+
+        except Exception as e:
+            log.warning(f"Error processing {file_path}: {e}")
+
+    if changed:
+        _save_cache(cache_path, docs_dir)
+    return index
+
+
+def matches_glob(path, pattern):
+    """
+    Matches a docs-relative path as Path.glob would, segment by segment.
+
+    Only '*', '?' and '[...]' are supported; '**' is not.
+    """
+    parts = PurePosixPath(path).parts
+    pattern_parts = PurePosixPath(pattern).parts
+    return len(parts) == len(pattern_parts) and all(
+        fnmatchcase(part, pattern_part)
+        for part, pattern_part in zip(parts, pattern_parts))
+
+
+def script_json(data):
+    """
+    Serializes data for a script element; escaped so nothing can close it early.
+    """
+    return json.dumps(data, separators=(',', ':')).replace('<', '\\u003c')
+
+
+def search_words(text):
+    """
+    Splits text into the words the search index holds; catalog-filter.js
+    splits queries the same way.
+    """
+    return re.findall(r'[a-z0-9]+', text.lower())
+
+
+def search_index(cards):
+    """
+    Returns the trigram index over card titles, descriptions and tags.
+
+    Each word is padded with a space on both sides before it is cut into
+    trigrams, so a query word matches at word starts. Each trigram maps to
+    the cards containing it, as index * 2 + 1 if it is in the title.
+    """
+    postings = {}
+    for i, card in enumerate(cards):
+        for field, in_title in ((card['title'], 1), (' '.join(card['tags']), 0),
+                                (card['description'], 0)):
+            for word in search_words(field):
+                padded = f' {word} '
+                for start in range(len(padded) - 2):
+                    cards_with = postings.setdefault(padded[start:start + 3], {})
+                    cards_with[i] = max(cards_with.get(i, 0), in_title)
+    return {gram: [i * 2 + in_title for i, in_title in sorted(cards_with.items())]
+            for gram, cards_with in sorted(postings.items())}
+
+
+def facet_index(cards, tags):
+    """
+    Returns the bitset of card indices carrying each tag, and its count.
+    """
+    words = (len(cards) + 31) // 32
+    bitsets = {tag: [0] * words for tag in tags}
+    for i, card in enumerate(cards):
+        for tag in card['tags']:
+            bitsets[tag][i // 32] |= 1 << (i % 32)
+    counts = {tag: sum(word.bit_count() for word in bits)
+              for tag, bits in bitsets.items()}
+    return {'size': len(cards), 'counts': counts, 'tags': bitsets}
+
+
+def card_html(card):
+    """
+    Renders one tool card.
+    """
+    tags_str = ",".join(card['tags'])
+
+    # Escape content to prevent XSS
+    safe_tags = html.escape(tags_str)
+    safe_link = html.escape(card['link'])
+    safe_icon = html.escape(card['icon'])
+    safe_title = html.escape(card['title'])
+    safe_desc = html.escape(card['description'])
+
+    return f"""
+<a href="{safe_link}" class="tool-card" data-tags="{safe_tags}">
+    <div class="tool-card-image-wrapper">
+        <img src="{safe_icon}" alt="{safe_title}" loading="lazy" decoding="async">
+    </div>
+    <div class="tool-card-content">
+        <h3>{safe_title}</h3>
+        <p>{safe_desc}</p>
+    </div>
+</a>
+"""
+
+
 def define_env(env):
     """
     This is the hook for defining variables, macros and filters.
@@ -24,204 +276,102 @@ def define_env(env):
     - variables: the dictionary that contains the environment variables
     - macro: a decorator function, to declare a macro.
     """
+    # Built once per build, before any page renders, and shared by every
+    # render_catalog call on every page.
+    docs_dir = Path(env.conf['docs_dir'])
+    cache_path = Path(env.conf['config_file_path']).parent / CACHE_FILE
+    _catalog_index.clear()
+    _catalog_index.update(build_catalog_index(docs_dir, cache_path))
+
+    # Versioned by content, so browsers can cache it until it changes.
+    script = (docs_dir / FILTER_SCRIPT).read_bytes()
+    script_url = f"/{FILTER_SCRIPT}?v={hashlib.sha256(script).hexdigest()[:12]}"
 
     @env.macro
-    def render_catalog(path_filter):
+    def render_catalog(path_filter, virtualize=False):
         """
         Renders a grid of tool cards based on markdown files matching the path_filter.
 
         Args:
             path_filter: A glob pattern relative to the docs directory, e.g., "tools/google-cloud/*.md"
+            virtualize: Emit the cards only in a <noscript> grid, which the
+                script reads and renders a page at a time.
         """
-        # docs_dir is usually where mkdocs.yml is, or explicitly set.
-        # env.conf['docs_dir'] is the absolute path to docs.
-        docs_dir = Path(env.conf['docs_dir'])
-        files = sorted(docs_dir.glob(path_filter))
-
-        # Collect all tags and cards data first
+        cards_data = [card for path, card in _catalog_index.items()
+                      if matches_glob(path, path_filter)]
+        if not cards_data:
+            log.warning(f"render_catalog('{path_filter}') matched no page in "
+                        f"the catalog index; add its pattern to "
+                        f"CATALOG_PATTERNS in scripts/integrations.py.")
+
+        # Collect all tags
         all_tags = set()
-        cards_data = []
-
-        for file_path in files:
-            # Skip index.md files as they are usually container pages, not items
-            if file_path.name == 'index.md':
-                continue
-
-            try:
-                content = file_path.read_text(encoding='utf-8')
-                # Simple frontmatter extraction
-                if content.startswith('---'):
-                    parts = content.split('---', 2)
-                    if len(parts) >= 3:
-                        frontmatter = yaml.safe_load(parts[1]) or {}
-                    else:
-                        frontmatter = {}
-                else:
-                    frontmatter = {}
-
-                # Get metadata
-                title = frontmatter.get('catalog_title', frontmatter.get('title'))
-                # If title not in frontmatter, try to find first H1
-                if not title:
-                    for line in content.splitlines():
-                        if line.startswith('# '):
-                            title = line[2:].strip()
-                            break
-                # Fallback to filename
-                if not title:
-                    title = file_path.stem.replace('-', ' ').title()
-
-                description = frontmatter.get('catalog_description',
-                    frontmatter.get('description', ''))
-                icon = frontmatter.get('catalog_icon',
-                    frontmatter.get('tool_icon',
-                    frontmatter.get('icon', '/integrations/assets/toolbox.svg'))) # Default icon
-
-                tags = frontmatter.get('catalog_tags', [])
-                if isinstance(tags, str):
-                    tags = [tags]
-
-                # Normalize tags to lowercase for consistent filtering
-                tags = [t.lower() for t in tags]
-                all_tags.update(tags)
-
-                # Calculate root-relative link from file path
-                rel_path = file_path.relative_to(docs_dir).with_suffix('')
-                link = f"/{rel_path}/"
-
-                # Ensure icon path is root-relative
-                if not icon.startswith('/') and not icon.startswith('http'):
-                     icon = f"/{icon}"
-
-                cards_data.append({
-                    'title': title,
-                    'description': description,
-                    'icon': icon,
-                    'link': link,
-                    'tags': tags
-                })
-
-            except Exception as e:
-                log.warning(f"Error processing {file_path}: {e}")
+        for card in cards_data:
+            all_tags.update(card['tags'])
 
         # Sort tags alphabetically
         sorted_tags = sorted(list(all_tags))
 
         # ID for this specific catalog instance to avoid conflicts if multiple are on page
-        catalog_id = "catalog-integrations"
+        slug = re.sub(r'[^a-z0-9]+', '-', path_filter.lower().removesuffix('.md'))
+        catalog_id = f"catalog-{slug.strip('-')}"
 
         # Generate HTML
         html_parts = []
 
         # Styles in docs/stylesheets/custom.css
 
-        # Filter Buttons
-        html_parts.append(f'<div class="catalog-filter-bar" id="{catalog_id}-filters">')
-        html_parts.append(f'<span class="catalog-filter-label">Filter:</span>')
-        html_parts.append(f'<button class="catalog-filter-btn active" data-filter="all">All</button>')
-        for tag in sorted_tags:
-            safe_tag = html.escape(tag)
-            # handle MCP button all caps display exception:
-            display_name = "MCP" if tag.lower() == "mcp" else safe_tag.title()
-            html_parts.append(f'<button class="catalog-filter-btn" data-filter="{safe_tag}">{display_name}</button>')
-        html_parts.append('</div>')
+        # Facet index: a bitset per tag over the card indices, 32 cards a
+        # word, and its count. The script intersects these for the matching
+        # cards and every button's count, without reading the cards.
+        facets = facet_index(cards_data, sorted_tags)
+
+        # Ranked on every keystroke by the script, with no request. Checked
+        # here, as it is inlined into the page.
+        search_json = script_json(search_index(cards_data))
+        if len(search_json) > SEARCH_INDEX_BUDGET:
+            log.warning(f"render_catalog('{path_filter}') search index is "
+                        f"{len(search_json)} bytes, over SEARCH_INDEX_BUDGET "
+                        f"({SEARCH_INDEX_BUDGET}) in scripts/integrations.py. "
+                        f"Shorten card descriptions or raise the budget.")
+
+        # Filter bar: the search box and buttons do nothing without the
+        # script, so it renders them from the facet index. Readers without
+        # it, and llms-full.txt, get the cards alone.
+        html_parts.append(f'<div class="catalog-filter-bar" id="{catalog_id}-filters"></div>')
 
         # Grid
-        html_parts.append('<div class="tool-card-grid">')
-        for card in cards_data:
-            tags_str = ",".join(card['tags'])
+        cards_html = [card_html(card) for card in cards_data]
+        if virtualize:
+            # Only this shell is parsed and painted; the script fills it from
+            # the <noscript> grid, the one copy of the cards on the page. With
+            # scripting on, <noscript> content stays unparsed text.
+            html_parts.append(f'<div class="tool-card-grid" id="{catalog_id}-grid" '
+                              f'data-page-size="{CATALOG_PAGE_SIZE}"></div>')
+            html_parts.append(f'<noscript id="{catalog_id}-cards"><div class="tool-card-grid">')
+            html_parts.extend(cards_html)
+            html_parts.append('</div></noscript>')
+        else:
+            html_parts.append(f'<div class="tool-card-grid" id="{catalog_id}-grid">')
+            html_parts.extend(cards_html)
+            html_parts.append('</div>')
+
+        html_parts.append(f'<script type="application/json" id="{catalog_id}-tags">'
+                          f'{script_json(facets)}</script>')
+        html_parts.append(f'<script type="application/json" id="{catalog_id}-search-index">'
+                          f'{search_json}</script>')
+
+        # JavaScript, shared by every catalog in docs/javascript
+        html_parts.append(f'<script src="{html.escape(script_url)}"></script>')
 
-            # Escape content to prevent XSS
-            safe_tags = html.escape(tags_str)
-            safe_link = html.escape(card['link'])
-            safe_icon = html.escape(card['icon'])
-            safe_title = html.escape(card['title'])
-            safe_desc = html.escape(card['description'])
+        return "\n".join(html_parts)
 
-            card_html = f"""
-<a href="{safe_link}" class="tool-card" data-tags="{safe_tags}">
-    <div class="tool-card-image-wrapper">
-        <img src="{safe_icon}" alt="{safe_title}">
-    </div>
-    <div class="tool-card-content">
-        <h3>{safe_title}</h3>
-        <p>{safe_desc}</p>
-    </div>
-</a>
-"""
-            html_parts.append(card_html)
-        html_parts.append('</div>')
-
-        # JavaScript
-        html_parts.append(f"""
-<script>
-    (function() {{
-        function initCatalog() {{
-            const filterContainer = document.getElementById('{catalog_id}-filters');
-            if (!filterContainer) return;
-
-            const buttons = filterContainer.querySelectorAll('.catalog-filter-btn');
-            const cards = document.querySelectorAll('.tool-card');
-
-            function filterCards(filterValue) {{
-                // Update buttons
-                buttons.forEach(btn => {{
-                    if (btn.getAttribute('data-filter') === filterValue) {{
-                        btn.classList.add('active');
-                    }} else {{
-                        btn.classList.remove('active');
-                    }}
-                }});
-
-                // Filter cards
-                cards.forEach(card => {{
-                    const cardTags = (card.getAttribute('data-tags') || '').split(',');
-                    if (filterValue === 'all' || cardTags.includes(filterValue)) {{
-                        card.style.display = 'flex'; // Restore flex display
-                    }} else {{
-                        card.style.display = 'none';
-                    }}
-                }});
-            }}
-
-            // Click handlers
-            buttons.forEach(btn => {{
-                btn.addEventListener('click', () => {{
-                    const filter = btn.getAttribute('data-filter');
-                    filterCards(filter);
-
-                    // Optional: Update URL without reload
-                    const url = new URL(window.location);
-                    if (filter === 'all') {{
-                        url.searchParams.delete('topic');
-                    }} else {{
-                        url.searchParams.set('topic', filter);
-                    }}
-                    window.history.pushState({{}}, '', url);
-                }});
-            }});
-
-            // Check URL param on load
-            const urlParams = new URLSearchParams(window.location.search);
-            const topic = urlParams.get('topic');
-            if (topic) {{
-                // Validate topic exists in buttons to avoid empty states if possible
-                // or just try to filter
-                const matchingBtn = Array.from(buttons).find(btn => btn.getAttribute('data-filter') === topic);
-                if (matchingBtn) {{
-                    filterCards(topic.toLowerCase());
-                }}
-            }}
-        }}
-
-        // Run immediately if DOM is ready, otherwise wait for DOMContentLoaded
-        if (document.readyState === 'loading') {{
-            document.addEventListener('DOMContentLoaded', initCatalog);
-        }} else {{
-            initCatalog();
-        }}
-    }})();
-</script>
-        """)
 
-        return "\n".join(html_parts)
+def on_post_build(env):
+    """
+    Writes the catalog index to the site, for client-side use.
+    """
+    cards = list(_catalog_index.values())
+    tags = sorted({tag for card in cards for tag in card['tags']})
+    path = Path(env.conf['site_dir']) / CATALOG_JSON
+    path.write_text(json.dumps({'tags': tags, 'cards': cards}), encoding='utf-8')
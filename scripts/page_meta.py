@@ -0,0 +1,78 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Reads page metadata from the docs sources without reading whole pages.
+
+Shared by the macros in scripts/integrations.py and any build hook that needs
+a page's frontmatter or title. Neither is on sys.path when MkDocs loads them,
+so load this module by path:
+
+    spec = importlib.util.spec_from_file_location('page_meta', path)
+"""
+
+import yaml
+
+# libyaml's loader is several times faster; PyYAML builds without it.
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+DELIMITER = '---'
+
+
+def read_frontmatter(path, title_keys=None):
+    """
+    Reads a page's YAML frontmatter, stopping at the closing delimiter.
+
+    Args:
+        path: The Markdown file.
+        title_keys: If given, the frontmatter keys that give the title, in
+            order of preference. The first one present is the title; if none
+            is, or its value is empty, reading goes on to the first H1.
+
+    Returns:
+        A tuple of the frontmatter, {} if there is none, and the text of the
+        first H1, or None if it was not read or there is none.
+    """
+    with open(path, encoding='utf-8') as f:
+        frontmatter = {}
+        line = f.readline()
+        if line.rstrip() == DELIMITER:
+            lines = []
+            line = f.readline()
+            while line and line.rstrip() != DELIMITER:
+                lines.append(line)
+                line = f.readline()
+            if line:
+                frontmatter = yaml.load(''.join(lines), Loader=SafeLoader) or {}
+                line = f.readline()
+            else:
+                # Never closed, so none of it was frontmatter.
+                f.seek(0)
+                line = f.readline()
+
+        if title_keys is None:
+            return frontmatter, None
+        # The first key present wins even if empty, as read_card's
+        # frontmatter.get(key, frontmatter.get(...)) does.
+        present = [key for key in title_keys if key in frontmatter]
+        if present and frontmatter[present[0]]:
+            return frontmatter, None
+        while line:
+            if line.startswith('# '):
+                return frontmatter, line[2:].strip()
+            line = f.readline()
+        return frontmatter, None
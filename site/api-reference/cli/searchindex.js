@@ -0,0 +1 @@
+Search.setIndex({"alltitles":{"ADK CLI documentation":[[0,null]],"add_eval_case":[[0,"adk-eval-set-add-eval-case"]],"adk":[[0,"adk"]],"agent_engine":[[0,"adk-deploy-agent-engine"]],"api_server":[[0,"adk-api-server"]],"cloud_run":[[0,"adk-deploy-cloud-run"]],"conformance":[[0,"adk-conformance"]],"create":[[0,"adk-create"],[0,"adk-eval-set-create"]],"deploy":[[0,"adk-deploy"]],"disable":[[0,"adk-telemetry-disable"]],"enable":[[0,"adk-telemetry-enable"]],"eval":[[0,"adk-eval"]],"eval_set":[[0,"adk-eval-set"]],"generate_eval_cases":[[0,"adk-eval-set-generate-eval-cases"]],"gke":[[0,"adk-deploy-gke"]],"migrate":[[0,"adk-migrate"]],"optimize":[[0,"adk-optimize"]],"record":[[0,"adk-conformance-record"]],"run":[[0,"adk-run"]],"session":[[0,"adk-migrate-session"]],"status":[[0,"adk-telemetry-status"]],"telemetry":[[0,"adk-telemetry"]],"test":[[0,"adk-conformance-test"],[0,"adk-test"]],"web":[[0,"adk-web"]]},"docnames":["index"],"envversion":{"sphinx":66,"sphinx.domains.c":3,"sphinx.domains.changeset":1,"sphinx.domains.citation":1,"sphinx.domains.cpp":9,"sphinx.domains.index":1,"sphinx.domains.javascript":3,"sphinx.domains.math":2,"sphinx.domains.python":4,"sphinx.domains.rst":2,"sphinx.domains.std":2},"filenames":["index.rst"],"indexentries":{"--a2a":[[0,"cmdoption-adk-api_server-a2a",false],[0,"cmdoption-adk-deploy-cloud_run-a2a",false],[0,"cmdoption-adk-web-a2a",false]],"--absolutize_imports":[[0,"cmdoption-adk-deploy-agent_engine-absolutize_imports",false]],"--adk_app":[[0,"cmdoption-adk-deploy-agent_engine-adk_app",false]],"--adk_app_object":[[0,"cmdoption-adk-deploy-agent_engine-adk_app_object",false]],"--adk_version":[[0,"cmdoption-adk-deploy-agent_engine-adk_version",false],[0,"cmdoption-adk-deploy-cloud_run-adk_version",false],[0,"cmdoption-adk-deploy-gke-adk_version",false]],"--agent_engine_config_file":[[0,"cmdoption-adk-deploy-agent_engine-agent_engine_config_file",false]],"--agent_engine_id":[[0,"cmdoption-adk-deploy-agent_engine-agent_engine_id",false]],"--allow-unsafe-unpickling":[[0,"cmdoption-adk-migrate-session-allow-unsafe-unpickling",false]],"--allow_origins":[[0,"cmdoption-adk-api_server-allow_origins",false],[0,"cmdoption-adk-deploy-cloud_run-allow_origins",false],[0,"cmdoption-adk-web-allow_origins",false]],"--allow_unsafe_unpickling":[[0,"cmdoption-adk-migrate-session-allow-unsafe-unpickling",false]],"--api_key":[[0,"cmdoption-adk-create-api_key",false],[0,"cmdoption-adk-deploy-agent_engine-api_key",false]],"--app_name":[[0,"cmdoption-adk-deploy-cloud_run-app_name",false],[0,"cmdoption-adk-deploy-gke-app_name",false]],"--artifact_service_uri":[[0,"cmdoption-adk-api_server-artifact_service_uri",false],[0,"cmdoption-adk-deploy-agent_engine-artifact_service_uri",false],[0,"cmdoption-adk-deploy-cloud_run-artifact_service_uri",false],[0,"cmdoption-adk-deploy-gke-artifact_service_uri",false],[0,"cmdoption-adk-run-artifact_service_uri",false],[0,"cmdoption-adk-web-artifact_service_uri",false]],"--auto_create_session":[[0,"cmdoption-adk-api_server-auto_create_session",false]],"--cluster_name":[[0,"cmdoption-adk-deploy-gke-cluster_name",false]],"--config_file_path":[[0,"cmdoption-adk-eval-config_file_path",false]],"--default_llm_model":[[0,"cmdoption-adk-run-default_llm_model",false],[0,"cmdoption-adk-web-default_llm_model",false]],"--description":[[0,"cmdoption-adk-deploy-agent_engine-description",false]],"--dest_db_url":[[0,"cmdoption-adk-migrate-session-dest_db_url",false]],"--disable_features":[[0,"cmdoption-adk-api_server-disable_features",false],[0,"cmdoption-adk-eval-disable_features",false],[0,"cmdoption-adk-run-disable_features",false],[0,"cmdoption-adk-web-disable_features",false]],"--display_name":[[0,"cmdoption-adk-deploy-agent_engine-display_name",false]],"--enable_features":[[0,"cmdoption-adk-api_server-enable_features",false],[0,"cmdoption-adk-eval-enable_features",false],[0,"cmdoption-adk-run-enable_features",false],[0,"cmdoption-adk-web-enable_features",false]],"--env_file":[[0,"cmdoption-adk-deploy-agent_engine-env_file",false]],"--eval_storage_uri":[[0,"cmdoption-adk-api_server-eval_storage_uri",false],[0,"cmdoption-adk-eval-eval_storage_uri",false],[0,"cmdoption-adk-eval_set-add_eval_case-eval_storage_uri",false],[0,"cmdoption-adk-eval_set-create-eval_storage_uri",false],[0,"cmdoption-adk-eval_set-generate_eval_cases-eval_storage_uri",false],[0,"cmdoption-adk-web-eval_storage_uri",false]],"--express_mode":[[0,"cmdoption-adk-api_server-express_mode",false]],"--extra_packages":[[0,"cmdoption-adk-deploy-agent_engine-extra_packages",false]],"--extra_plugins":[[0,"cmdoption-adk-api_server-extra_plugins",false],[0,"cmdoption-adk-web-extra_plugins",false]],"--gemini_enterprise_app_name":[[0,"cmdoption-adk-api_server-gemini_enterprise_app_name",false]],"--generate_report":[[0,"cmdoption-adk-conformance-test-generate_report",false]],"--host":[[0,"cmdoption-adk-api_server-host",false],[0,"cmdoption-adk-web-host",false]],"--in_memory":[[0,"cmdoption-adk-run-in_memory",false]],"--jsonl":[[0,"cmdoption-adk-run-jsonl",false]],"--log_level":[[0,"cmdoption-adk-api_server-log_level",false],[0,"cmdoption-adk-deploy-cloud_run-log_level",false],[0,"cmdoption-adk-deploy-gke-log_level",false],[0,"cmdoption-adk-eval-log_level",false],[0,"cmdoption-adk-eval_set-add_eval_case-log_level",false],[0,"cmdoption-adk-eval_set-create-log_level",false],[0,"cmdoption-adk-eval_set-generate_eval_cases-log_level",false],[0,"cmdoption-adk-migrate-session-log_level",false],[0,"cmdoption-adk-optimize-log_level",false],[0,"cmdoption-adk-run-log_level",false],[0,"cmdoption-adk-web-log_level",false]],"--logo-image-url":[[0,"cmdoption-adk-web-logo-image-url",false]],"--logo-text":[[0,"cmdoption-adk-web-logo-text",false]],"--memory_service_uri":[[0,"cmdoption-adk-api_server-memory_service_uri",false],[0,"cmdoption-adk-deploy-agent_engine-memory_service_uri",false],[0,"cmdoption-adk-deploy-cloud_run-memory_service_uri",false],[0,"cmdoption-adk-deploy-gke-memory_service_uri",false],[0,"cmdoption-adk-run-memory_service_uri",false],[0,"cmdoption-adk-web-memory_service_uri",false]],"--mode":[[0,"cmdoption-adk-conformance-test-mode",false]],"--model":[[0,"cmdoption-adk-create-model",false]],"--no-reload":[[0,"cmdoption-adk-api_server-reload",false],[0,"cmdoption-adk-web-reload",false]],"--no-trace_to_cloud":[[0,"cmdoption-adk-deploy-agent_engine-trace_to_cloud",false]],"--no-validate-agent-import":[[0,"cmdoption-adk-deploy-agent_engine-validate-agent-import",false]],"--no_use_local_storage":[[0,"cmdoption-adk-api_server-use_local_storage",false],[0,"cmdoption-adk-deploy-agent_engine-use_local_storage",false],[0,"cmdoption-adk-deploy-cloud_run-use_local_storage",false],[0,"cmdoption-adk-deploy-gke-use_local_storage",false],[0,"cmdoption-adk-run-use_local_storage",false],[0,"cmdoption-adk-web-use_local_storage",false]],"--optimizer_config_file_path":[[0,"cmdoption-adk-optimize-optimizer_config_file_path",false]],"--otel_to_cloud":[[0,"cmdoption-adk-api_server-otel_to_cloud",false],[0,"cmdoption-adk-deploy-agent_engine-otel_to_cloud",false],[0,"cmdoption-adk-deploy-cloud_run-otel_to_cloud",false],[0,"cmdoption-adk-deploy-gke-otel_to_cloud",false],[0,"cmdoption-adk-web-otel_to_cloud",false]],"--port":[[0,"cmdoption-adk-api_server-port",false],[0,"cmdoption-adk-deploy-cloud_run-port",false],[0,"cmdoption-adk-deploy-gke-port",false],[0,"cmdoption-adk-web-port",false]],"--print_detailed_results":[[0,"cmdoption-adk-eval-print_detailed_results",false],[0,"cmdoption-adk-optimize-print_detailed_results",false]],"--project":[[0,"cmdoption-adk-create-project",false],[0,"cmdoption-adk-deploy-agent_engine-project",false],[0,"cmdoption-adk-deploy-cloud_run-project",false],[0,"cmdoption-adk-deploy-gke-project",false]],"--rebuild":[[0,"cmdoption-adk-test-rebuild",false]],"--region":[[0,"cmdoption-adk-create-region",false],[0,"cmdoption-adk-deploy-agent_engine-region",false],[0,"cmdoption-adk-deploy-cloud_run-region",false],[0,"cmdoption-adk-deploy-gke-region",false]],"--reload":[[0,"cmdoption-adk-api_server-reload",false],[0,"cmdoption-adk-web-reload",false]],"--reload_agents":[[0,"cmdoption-adk-api_server-reload_agents",false],[0,"cmdoption-adk-web-reload_agents",false]],"--replay":[[0,"cmdoption-adk-run-replay",false]],"--report_dir":[[0,"cmdoption-adk-conformance-test-report_dir",false]],"--requirements_file":[[0,"cmdoption-adk-deploy-agent_engine-requirements_file",false]],"--resume":[[0,"cmdoption-adk-run-resume",false]],"--sampler_config_file_path":[[0,"cmdoption-adk-optimize-sampler_config_file_path",false]],"--save_session":[[0,"cmdoption-adk-run-save_session",false]],"--scenarios_file":[[0,"cmdoption-adk-eval_set-add_eval_case-scenarios_file",false]],"--service_name":[[0,"cmdoption-adk-deploy-cloud_run-service_name",false],[0,"cmdoption-adk-deploy-gke-service_name",false]],"--service_type":[[0,"cmdoption-adk-deploy-gke-service_type",false]],"--session_id":[[0,"cmdoption-adk-run-session_id",false]],"--session_input_file":[[0,"cmdoption-adk-eval_set-add_eval_case-session_input_file",false]],"--session_service_uri":[[0,"cmdoption-adk-api_server-session_service_uri",false],[0,"cmdoption-adk-deploy-agent_engine-session_service_uri",false],[0,"cmdoption-adk-deploy-cloud_run-session_service_uri",false],[0,"cmdoption-adk-deploy-gke-session_service_uri",false],[0,"cmdoption-adk-run-session_service_uri",false],[0,"cmdoption-adk-web-session_service_uri",false]],"--skip-agent-import-validation":[[0,"cmdoption-adk-deploy-agent_engine-skip-agent-import-validation",false]],"--source_db_url":[[0,"cmdoption-adk-migrate-session-source_db_url",false]],"--staging_bucket":[[0,"cmdoption-adk-deploy-agent_engine-staging_bucket",false]],"--state":[[0,"cmdoption-adk-run-state",false]],"--streaming-mode":[[0,"cmdoption-adk-conformance-test-streaming-mode",false]],"--temp_folder":[[0,"cmdoption-adk-deploy-agent_engine-temp_folder",false],[0,"cmdoption-adk-deploy-cloud_run-temp_folder",false],[0,"cmdoption-adk-deploy-gke-temp_folder",false]],"--timeout":[[0,"cmdoption-adk-run-timeout",false]],"--trace_to_cloud":[[0,"cmdoption-adk-api_server-trace_to_cloud",false],[0,"cmdoption-adk-deploy-agent_engine-trace_to_cloud",false],[0,"cmdoption-adk-deploy-cloud_run-trace_to_cloud",false],[0,"cmdoption-adk-deploy-gke-trace_to_cloud",false],[0,"cmdoption-adk-web-trace_to_cloud",false]],"--trigger_sources":[[0,"cmdoption-adk-api_server-trigger_sources",false],[0,"cmdoption-adk-deploy-agent_engine-trigger_sources",false],[0,"cmdoption-adk-deploy-cloud_run-trigger_sources",false],[0,"cmdoption-adk-deploy-gke-trigger_sources",false],[0,"cmdoption-adk-web-trigger_sources",false]],"--url_prefix":[[0,"cmdoption-adk-api_server-url_prefix",false],[0,"cmdoption-adk-web-url_prefix",false]],"--use_local_storage":[[0,"cmdoption-adk-api_server-use_local_storage",false],[0,"cmdoption-adk-deploy-agent_engine-use_local_storage",false],[0,"cmdoption-adk-deploy-cloud_run-use_local_storage",false],[0,"cmdoption-adk-deploy-gke-use_local_storage",false],[0,"cmdoption-adk-run-use_local_storage",false],[0,"cmdoption-adk-web-use_local_storage",false]],"--user_simulation_config_file":[[0,"cmdoption-adk-eval_set-generate_eval_cases-user_simulation_config_file",false]],"--validate-agent-import":[[0,"cmdoption-adk-deploy-agent_engine-validate-agent-import",false]],"--verbose":[[0,"cmdoption-adk-api_server-v",false],[0,"cmdoption-adk-run-v",false],[0,"cmdoption-adk-web-v",false]],"--version":[[0,"cmdoption-adk-version",false]],"--with_ui":[[0,"cmdoption-adk-api_server-with_ui",false],[0,"cmdoption-adk-deploy-cloud_run-with_ui",false],[0,"cmdoption-adk-deploy-gke-with_ui",false]],"-v":[[0,"cmdoption-adk-api_server-v",false],[0,"cmdoption-adk-run-v",false],[0,"cmdoption-adk-web-v",false]],"adk command line option":[[0,"cmdoption-adk-version",false]],"adk-api_server command line option":[[0,"cmdoption-adk-api_server-a2a",false],[0,"cmdoption-adk-api_server-allow_origins",false],[0,"cmdoption-adk-api_server-arg-AGENTS_DIR",false],[0,"cmdoption-adk-api_server-artifact_service_uri",false],[0,"cmdoption-adk-api_server-auto_create_session",false],[0,"cmdoption-adk-api_server-disable_features",false],[0,"cmdoption-adk-api_server-enable_features",false],[0,"cmdoption-adk-api_server-eval_storage_uri",false],[0,"cmdoption-adk-api_server-express_mode",false],[0,"cmdoption-adk-api_server-extra_plugins",false],[0,"cmdoption-adk-api_server-gemini_enterprise_app_name",false],[0,"cmdoption-adk-api_server-host",false],[0,"cmdoption-adk-api_server-log_level",false],[0,"cmdoption-adk-api_server-memory_service_uri",false],[0,"cmdoption-adk-api_server-otel_to_cloud",false],[0,"cmdoption-adk-api_server-port",false],[0,"cmdoption-adk-api_server-reload",false],[0,"cmdoption-adk-api_server-reload_agents",false],[0,"cmdoption-adk-api_server-session_service_uri",false],[0,"cmdoption-adk-api_server-trace_to_cloud",false],[0,"cmdoption-adk-api_server-trigger_sources",false],[0,"cmdoption-adk-api_server-url_prefix",false],[0,"cmdoption-adk-api_server-use_local_storage",false],[0,"cmdoption-adk-api_server-v",false],[0,"cmdoption-adk-api_server-with_ui",false]],"adk-conformance-record command line option":[[0,"cmdoption-adk-conformance-record-arg-PATHS",false],[0,"cmdoption-adk-conformance-record-arg-STREAMING_MODE",false]],"adk-conformance-test command line option":[[0,"cmdoption-adk-conformance-test-arg-PATHS",false],[0,"cmdoption-adk-conformance-test-generate_report",false],[0,"cmdoption-adk-conformance-test-mode",false],[0,"cmdoption-adk-conformance-test-report_dir",false],[0,"cmdoption-adk-conformance-test-streaming-mode",false]],"adk-create command line option":[[0,"cmdoption-adk-create-api_key",false],[0,"cmdoption-adk-create-arg-APP_NAME",false],[0,"cmdoption-adk-create-model",false],[0,"cmdoption-adk-create-project",false],[0,"cmdoption-adk-create-region",false]],"adk-deploy-agent_engine command line option":[[0,"cmdoption-adk-deploy-agent_engine-absolutize_imports",false],[0,"cmdoption-adk-deploy-agent_engine-adk_app",false],[0,"cmdoption-adk-deploy-agent_engine-adk_app_object",false],[0,"cmdoption-adk-deploy-agent_engine-adk_version",false],[0,"cmdoption-adk-deploy-agent_engine-agent_engine_config_file",false],[0,"cmdoption-adk-deploy-agent_engine-agent_engine_id",false],[0,"cmdoption-adk-deploy-agent_engine-api_key",false],[0,"cmdoption-adk-deploy-agent_engine-arg-AGENT",false],[0,"cmdoption-adk-deploy-agent_engine-artifact_service_uri",false],[0,"cmdoption-adk-deploy-agent_engine-description",false],[0,"cmdoption-adk-deploy-agent_engine-display_name",false],[0,"cmdoption-adk-deploy-agent_engine-env_file",false],[0,"cmdoption-adk-deploy-agent_engine-extra_packages",false],[0,"cmdoption-adk-deploy-agent_engine-memory_service_uri",false],[0,"cmdoption-adk-deploy-agent_engine-otel_to_cloud",false],[0,"cmdoption-adk-deploy-agent_engine-project",false],[0,"cmdoption-adk-deploy-agent_engine-region",false],[0,"cmdoption-adk-deploy-agent_engine-requirements_file",false],[0,"cmdoption-adk-deploy-agent_engine-session_service_uri",false],[0,"cmdoption-adk-deploy-agent_engine-skip-agent-import-validation",false],[0,"cmdoption-adk-deploy-agent_engine-staging_bucket",false],[0,"cmdoption-adk-deploy-agent_engine-temp_folder",false],[0,"cmdoption-adk-deploy-agent_engine-trace_to_cloud",false],[0,"cmdoption-adk-deploy-agent_engine-trigger_sources",false],[0,"cmdoption-adk-deploy-agent_engine-use_local_storage",false],[0,"cmdoption-adk-deploy-agent_engine-validate-agent-import",false]],"adk-deploy-cloud_run command line option":[[0,"cmdoption-adk-deploy-cloud_run-a2a",false],[0,"cmdoption-adk-deploy-cloud_run-adk_version",false],[0,"cmdoption-adk-deploy-cloud_run-allow_origins",false],[0,"cmdoption-adk-deploy-cloud_run-app_name",false],[0,"cmdoption-adk-deploy-cloud_run-arg-AGENT",false],[0,"cmdoption-adk-deploy-cloud_run-artifact_service_uri",false],[0,"cmdoption-adk-deploy-cloud_run-log_level",false],[0,"cmdoption-adk-deploy-cloud_run-memory_service_uri",false],[0,"cmdoption-adk-deploy-cloud_run-otel_to_cloud",false],[0,"cmdoption-adk-deploy-cloud_run-port",false],[0,"cmdoption-adk-deploy-cloud_run-project",false],[0,"cmdoption-adk-deploy-cloud_run-region",false],[0,"cmdoption-adk-deploy-cloud_run-service_name",false],[0,"cmdoption-adk-deploy-cloud_run-session_service_uri",false],[0,"cmdoption-adk-deploy-cloud_run-temp_folder",false],[0,"cmdoption-adk-deploy-cloud_run-trace_to_cloud",false],[0,"cmdoption-adk-deploy-cloud_run-trigger_sources",false],[0,"cmdoption-adk-deploy-cloud_run-use_local_storage",false],[0,"cmdoption-adk-deploy-cloud_run-with_ui",false]],"adk-deploy-gke command line option":[[0,"cmdoption-adk-deploy-gke-adk_version",false],[0,"cmdoption-adk-deploy-gke-app_name",false],[0,"cmdoption-adk-deploy-gke-arg-AGENT",false],[0,"cmdoption-adk-deploy-gke-artifact_service_uri",false],[0,"cmdoption-adk-deploy-gke-cluster_name",false],[0,"cmdoption-adk-deploy-gke-log_level",false],[0,"cmdoption-adk-deploy-gke-memory_service_uri",false],[0,"cmdoption-adk-deploy-gke-otel_to_cloud",false],[0,"cmdoption-adk-deploy-gke-port",false],[0,"cmdoption-adk-deploy-gke-project",false],[0,"cmdoption-adk-deploy-gke-region",false],[0,"cmdoption-adk-deploy-gke-service_name",false],[0,"cmdoption-adk-deploy-gke-service_type",false],[0,"cmdoption-adk-deploy-gke-session_service_uri",false],[0,"cmdoption-adk-deploy-gke-temp_folder",false],[0,"cmdoption-adk-deploy-gke-trace_to_cloud",false],[0,"cmdoption-adk-deploy-gke-trigger_sources",false],[0,"cmdoption-adk-deploy-gke-use_local_storage",false],[0,"cmdoption-adk-deploy-gke-with_ui",false]],"adk-eval command line option":[[0,"cmdoption-adk-eval-arg-AGENT_MODULE_FILE_PATH",false],[0,"cmdoption-adk-eval-arg-EVAL_SET_FILE_PATH_OR_ID",false],[0,"cmdoption-adk-eval-config_file_path",false],[0,"cmdoption-adk-eval-disable_features",false],[0,"cmdoption-adk-eval-enable_features",false],[0,"cmdoption-adk-eval-eval_storage_uri",false],[0,"cmdoption-adk-eval-log_level",false],[0,"cmdoption-adk-eval-print_detailed_results",false]],"adk-eval_set-add_eval_case command line option":[[0,"cmdoption-adk-eval_set-add_eval_case-arg-AGENT_MODULE_FILE_PATH",false],[0,"cmdoption-adk-eval_set-add_eval_case-arg-EVAL_SET_ID",false],[0,"cmdoption-adk-eval_set-add_eval_case-eval_storage_uri",false],[0,"cmdoption-adk-eval_set-add_eval_case-log_level",false],[0,"cmdoption-adk-eval_set-add_eval_case-scenarios_file",false],[0,"cmdoption-adk-eval_set-add_eval_case-session_input_file",false]],"adk-eval_set-create command line option":[[0,"cmdoption-adk-eval_set-create-arg-AGENT_MODULE_FILE_PATH",false],[0,"cmdoption-adk-eval_set-create-arg-EVAL_SET_ID",false],[0,"cmdoption-adk-eval_set-create-eval_storage_uri",false],[0,"cmdoption-adk-eval_set-create-log_level",false]],"adk-eval_set-generate_eval_cases command line option":[[0,"cmdoption-adk-eval_set-generate_eval_cases-arg-AGENT_MODULE_FILE_PATH",false],[0,"cmdoption-adk-eval_set-generate_eval_cases-arg-EVAL_SET_ID",false],[0,"cmdoption-adk-eval_set-generate_eval_cases-eval_storage_uri",false],[0,"cmdoption-adk-eval_set-generate_eval_cases-log_level",false],[0,"cmdoption-adk-eval_set-generate_eval_cases-user_simulation_config_file",false]],"adk-migrate-session command line option":[[0,"cmdoption-adk-migrate-session-allow-unsafe-unpickling",false],[0,"cmdoption-adk-migrate-session-dest_db_url",false],[0,"cmdoption-adk-migrate-session-log_level",false],[0,"cmdoption-adk-migrate-session-source_db_url",false]],"adk-optimize command line option":[[0,"cmdoption-adk-optimize-arg-AGENT_MODULE_FILE_PATH",false],[0,"cmdoption-adk-optimize-log_level",false],[0,"cmdoption-adk-optimize-optimizer_config_file_path",false],[0,"cmdoption-adk-optimize-print_detailed_results",false],[0,"cmdoption-adk-optimize-sampler_config_file_path",false]],"adk-run command line option":[[0,"cmdoption-adk-run-arg-AGENT",false],[0,"cmdoption-adk-run-arg-QUERY",false],[0,"cmdoption-adk-run-artifact_service_uri",false],[0,"cmdoption-adk-run-default_llm_model",false],[0,"cmdoption-adk-run-disable_features",false],[0,"cmdoption-adk-run-enable_features",false],[0,"cmdoption-adk-run-in_memory",false],[0,"cmdoption-adk-run-jsonl",false],[0,"cmdoption-adk-run-log_level",false],[0,"cmdoption-adk-run-memory_service_uri",false],[0,"cmdoption-adk-run-replay",false],[0,"cmdoption-adk-run-resume",false],[0,"cmdoption-adk-run-save_session",false],[0,"cmdoption-adk-run-session_id",false],[0,"cmdoption-adk-run-session_service_uri",false],[0,"cmdoption-adk-run-state",false],[0,"cmdoption-adk-run-timeout",false],[0,"cmdoption-adk-run-use_local_storage",false],[0,"cmdoption-adk-run-v",false]],"adk-test command line option":[[0,"cmdoption-adk-test-arg-FOLDER",false],[0,"cmdoption-adk-test-rebuild",false]],"adk-web command line option":[[0,"cmdoption-adk-web-a2a",false],[0,"cmdoption-adk-web-allow_origins",false],[0,"cmdoption-adk-web-arg-AGENTS_DIR",false],[0,"cmdoption-adk-web-artifact_service_uri",false],[0,"cmdoption-adk-web-default_llm_model",false],[0,"cmdoption-adk-web-disable_features",false],[0,"cmdoption-adk-web-enable_features",false],[0,"cmdoption-adk-web-eval_storage_uri",false],[0,"cmdoption-adk-web-extra_plugins",false],[0,"cmdoption-adk-web-host",false],[0,"cmdoption-adk-web-log_level",false],[0,"cmdoption-adk-web-logo-image-url",false],[0,"cmdoption-adk-web-logo-text",false],[0,"cmdoption-adk-web-memory_service_uri",false],[0,"cmdoption-adk-web-otel_to_cloud",false],[0,"cmdoption-adk-web-port",false],[0,"cmdoption-adk-web-reload",false],[0,"cmdoption-adk-web-reload_agents",false],[0,"cmdoption-adk-web-session_service_uri",false],[0,"cmdoption-adk-web-trace_to_cloud",false],[0,"cmdoption-adk-web-trigger_sources",false],[0,"cmdoption-adk-web-url_prefix",false],[0,"cmdoption-adk-web-use_local_storage",false],[0,"cmdoption-adk-web-v",false]],"agent":[[0,"cmdoption-adk-deploy-agent_engine-arg-AGENT",false],[0,"cmdoption-adk-deploy-cloud_run-arg-AGENT",false],[0,"cmdoption-adk-deploy-gke-arg-AGENT",false],[0,"cmdoption-adk-run-arg-AGENT",false]],"agent_module_file_path":[[0,"cmdoption-adk-eval-arg-AGENT_MODULE_FILE_PATH",false],[0,"cmdoption-adk-eval_set-add_eval_case-arg-AGENT_MODULE_FILE_PATH",false],[0,"cmdoption-adk-eval_set-create-arg-AGENT_MODULE_FILE_PATH",false],[0,"cmdoption-adk-eval_set-generate_eval_cases-arg-AGENT_MODULE_FILE_PATH",false],[0,"cmdoption-adk-optimize-arg-AGENT_MODULE_FILE_PATH",false]],"agents_dir":[[0,"cmdoption-adk-api_server-arg-AGENTS_DIR",false],[0,"cmdoption-adk-web-arg-AGENTS_DIR",false]],"app_name":[[0,"cmdoption-adk-create-arg-APP_NAME",false]],"eval_set_file_path_or_id":[[0,"cmdoption-adk-eval-arg-EVAL_SET_FILE_PATH_OR_ID",false]],"eval_set_id":[[0,"cmdoption-adk-eval_set-add_eval_case-arg-EVAL_SET_ID",false],[0,"cmdoption-adk-eval_set-create-arg-EVAL_SET_ID",false],[0,"cmdoption-adk-eval_set-generate_eval_cases-arg-EVAL_SET_ID",false]],"folder":[[0,"cmdoption-adk-test-arg-FOLDER",false]],"paths":[[0,"cmdoption-adk-conformance-record-arg-PATHS",false],[0,"cmdoption-adk-conformance-test-arg-PATHS",false]],"query":[[0,"cmdoption-adk-run-arg-QUERY",false]],"streaming_mode":[[0,"cmdoption-adk-conformance-record-arg-STREAMING_MODE",false]]},"objects":{"adk":[[0,0,1,"cmdoption-adk-version","--version"]],"adk-api_server":[[0,0,1,"cmdoption-adk-api_server-a2a","--a2a"],[0,0,1,"cmdoption-adk-api_server-allow_origins","--allow_origins"],[0,0,1,"cmdoption-adk-api_server-artifact_service_uri","--artifact_service_uri"],[0,0,1,"cmdoption-adk-api_server-auto_create_session","--auto_create_session"],[0,0,1,"cmdoption-adk-api_server-disable_features","--disable_features"],[0,0,1,"cmdoption-adk-api_server-enable_features","--enable_features"],[0,0,1,"cmdoption-adk-api_server-eval_storage_uri","--eval_storage_uri"],[0,0,1,"cmdoption-adk-api_server-express_mode","--express_mode"],[0,0,1,"cmdoption-adk-api_server-extra_plugins","--extra_plugins"],[0,0,1,"cmdoption-adk-api_server-gemini_enterprise_app_name","--gemini_enterprise_app_name"],[0,0,1,"cmdoption-adk-api_server-host","--host"],[0,0,1,"cmdoption-adk-api_server-log_level","--log_level"],[0,0,1,"cmdoption-adk-api_server-memory_service_uri","--memory_service_uri"],[0,0,1,"cmdoption-adk-api_server-reload","--no-reload"],[0,0,1,"cmdoption-adk-api_server-use_local_storage","--no_use_local_storage"],[0,0,1,"cmdoption-adk-api_server-otel_to_cloud","--otel_to_cloud"],[0,0,1,"cmdoption-adk-api_server-port","--port"],[0,0,1,"cmdoption-adk-api_server-reload","--reload"],[0,0,1,"cmdoption-adk-api_server-reload_agents","--reload_agents"],[0,0,1,"cmdoption-adk-api_server-session_service_uri","--session_service_uri"],[0,0,1,"cmdoption-adk-api_server-trace_to_cloud","--trace_to_cloud"],[0,0,1,"cmdoption-adk-api_server-trigger_sources","--trigger_sources"],[0,0,1,"cmdoption-adk-api_server-url_prefix","--url_prefix"],[0,0,1,"cmdoption-adk-api_server-use_local_storage","--use_local_storage"],[0,0,1,"cmdoption-adk-api_server-v","--verbose"],[0,0,1,"cmdoption-adk-api_server-with_ui","--with_ui"],[0,0,1,"cmdoption-adk-api_server-v","-v"],[0,0,1,"cmdoption-adk-api_server-arg-AGENTS_DIR","AGENTS_DIR"]],"adk-conformance-record":[[0,0,1,"cmdoption-adk-conformance-record-arg-PATHS","PATHS"],[0,0,1,"cmdoption-adk-conformance-record-arg-STREAMING_MODE","STREAMING_MODE"]],"adk-conformance-test":[[0,0,1,"cmdoption-adk-conformance-test-generate_report","--generate_report"],[0,0,1,"cmdoption-adk-conformance-test-mode","--mode"],[0,0,1,"cmdoption-adk-conformance-test-report_dir","--report_dir"],[0,0,1,"cmdoption-adk-conformance-test-streaming-mode","--streaming-mode"],[0,0,1,"cmdoption-adk-conformance-test-arg-PATHS","PATHS"]],"adk-create":[[0,0,1,"cmdoption-adk-create-api_key","--api_key"],[0,0,1,"cmdoption-adk-create-model","--model"],[0,0,1,"cmdoption-adk-create-project","--project"],[0,0,1,"cmdoption-adk-create-region","--region"],[0,0,1,"cmdoption-adk-create-arg-APP_NAME","APP_NAME"]],"adk-deploy-agent_engine":[[0,0,1,"cmdoption-adk-deploy-agent_engine-absolutize_imports","--absolutize_imports"],[0,0,1,"cmdoption-adk-deploy-agent_engine-adk_app","--adk_app"],[0,0,1,"cmdoption-adk-deploy-agent_engine-adk_app_object","--adk_app_object"],[0,0,1,"cmdoption-adk-deploy-agent_engine-adk_version","--adk_version"],[0,0,1,"cmdoption-adk-deploy-agent_engine-agent_engine_config_file","--agent_engine_config_file"],[0,0,1,"cmdoption-adk-deploy-agent_engine-agent_engine_id","--agent_engine_id"],[0,0,1,"cmdoption-adk-deploy-agent_engine-api_key","--api_key"],[0,0,1,"cmdoption-adk-deploy-agent_engine-artifact_service_uri","--artifact_service_uri"],[0,0,1,"cmdoption-adk-deploy-agent_engine-description","--description"],[0,0,1,"cmdoption-adk-deploy-agent_engine-display_name","--display_name"],[0,0,1,"cmdoption-adk-deploy-agent_engine-env_file","--env_file"],[0,0,1,"cmdoption-adk-deploy-agent_engine-extra_packages","--extra_packages"],[0,0,1,"cmdoption-adk-deploy-agent_engine-memory_service_uri","--memory_service_uri"],[0,0,1,"cmdoption-adk-deploy-agent_engine-trace_to_cloud","--no-trace_to_cloud"],[0,0,1,"cmdoption-adk-deploy-agent_engine-validate-agent-import","--no-validate-agent-import"],[0,0,1,"cmdoption-adk-deploy-agent_engine-use_local_storage","--no_use_local_storage"],[0,0,1,"cmdoption-adk-deploy-agent_engine-otel_to_cloud","--otel_to_cloud"],[0,0,1,"cmdoption-adk-deploy-agent_engine-project","--project"],[0,0,1,"cmdoption-adk-deploy-agent_engine-region","--region"],[0,0,1,"cmdoption-adk-deploy-agent_engine-requirements_file","--requirements_file"],[0,0,1,"cmdoption-adk-deploy-agent_engine-session_service_uri","--session_service_uri"],[0,0,1,"cmdoption-adk-deploy-agent_engine-skip-agent-import-validation","--skip-agent-import-validation"],[0,0,1,"cmdoption-adk-deploy-agent_engine-staging_bucket","--staging_bucket"],[0,0,1,"cmdoption-adk-deploy-agent_engine-temp_folder","--temp_folder"],[0,0,1,"cmdoption-adk-deploy-agent_engine-trace_to_cloud","--trace_to_cloud"],[0,0,1,"cmdoption-adk-deploy-agent_engine-trigger_sources","--trigger_sources"],[0,0,1,"cmdoption-adk-deploy-agent_engine-use_local_storage","--use_local_storage"],[0,0,1,"cmdoption-adk-deploy-agent_engine-validate-agent-import","--validate-agent-import"],[0,0,1,"cmdoption-adk-deploy-agent_engine-arg-AGENT","AGENT"]],"adk-deploy-cloud_run":[[0,0,1,"cmdoption-adk-deploy-cloud_run-a2a","--a2a"],[0,0,1,"cmdoption-adk-deploy-cloud_run-adk_version","--adk_version"],[0,0,1,"cmdoption-adk-deploy-cloud_run-allow_origins","--allow_origins"],[0,0,1,"cmdoption-adk-deploy-cloud_run-app_name","--app_name"],[0,0,1,"cmdoption-adk-deploy-cloud_run-artifact_service_uri","--artifact_service_uri"],[0,0,1,"cmdoption-adk-deploy-cloud_run-log_level","--log_level"],[0,0,1,"cmdoption-adk-deploy-cloud_run-memory_service_uri","--memory_service_uri"],[0,0,1,"cmdoption-adk-deploy-cloud_run-use_local_storage","--no_use_local_storage"],[0,0,1,"cmdoption-adk-deploy-cloud_run-otel_to_cloud","--otel_to_cloud"],[0,0,1,"cmdoption-adk-deploy-cloud_run-port","--port"],[0,0,1,"cmdoption-adk-deploy-cloud_run-project","--project"],[0,0,1,"cmdoption-adk-deploy-cloud_run-region","--region"],[0,0,1,"cmdoption-adk-deploy-cloud_run-service_name","--service_name"],[0,0,1,"cmdoption-adk-deploy-cloud_run-session_service_uri","--session_service_uri"],[0,0,1,"cmdoption-adk-deploy-cloud_run-temp_folder","--temp_folder"],[0,0,1,"cmdoption-adk-deploy-cloud_run-trace_to_cloud","--trace_to_cloud"],[0,0,1,"cmdoption-adk-deploy-cloud_run-trigger_sources","--trigger_sources"],[0,0,1,"cmdoption-adk-deploy-cloud_run-use_local_storage","--use_local_storage"],[0,0,1,"cmdoption-adk-deploy-cloud_run-with_ui","--with_ui"],[0,0,1,"cmdoption-adk-deploy-cloud_run-arg-AGENT","AGENT"]],"adk-deploy-gke":[[0,0,1,"cmdoption-adk-deploy-gke-adk_version","--adk_version"],[0,0,1,"cmdoption-adk-deploy-gke-app_name","--app_name"],[0,0,1,"cmdoption-adk-deploy-gke-artifact_service_uri","--artifact_service_uri"],[0,0,1,"cmdoption-adk-deploy-gke-cluster_name","--cluster_name"],[0,0,1,"cmdoption-adk-deploy-gke-log_level","--log_level"],[0,0,1,"cmdoption-adk-deploy-gke-memory_service_uri","--memory_service_uri"],[0,0,1,"cmdoption-adk-deploy-gke-use_local_storage","--no_use_local_storage"],[0,0,1,"cmdoption-adk-deploy-gke-otel_to_cloud","--otel_to_cloud"],[0,0,1,"cmdoption-adk-deploy-gke-port","--port"],[0,0,1,"cmdoption-adk-deploy-gke-project","--project"],[0,0,1,"cmdoption-adk-deploy-gke-region","--region"],[0,0,1,"cmdoption-adk-deploy-gke-service_name","--service_name"],[0,0,1,"cmdoption-adk-deploy-gke-service_type","--service_type"],[0,0,1,"cmdoption-adk-deploy-gke-session_service_uri","--session_service_uri"],[0,0,1,"cmdoption-adk-deploy-gke-temp_folder","--temp_folder"],[0,0,1,"cmdoption-adk-deploy-gke-trace_to_cloud","--trace_to_cloud"],[0,0,1,"cmdoption-adk-deploy-gke-trigger_sources","--trigger_sources"],[0,0,1,"cmdoption-adk-deploy-gke-use_local_storage","--use_local_storage"],[0,0,1,"cmdoption-adk-deploy-gke-with_ui","--with_ui"],[0,0,1,"cmdoption-adk-deploy-gke-arg-AGENT","AGENT"]],"adk-eval":[[0,0,1,"cmdoption-adk-eval-config_file_path","--config_file_path"],[0,0,1,"cmdoption-adk-eval-disable_features","--disable_features"],[0,0,1,"cmdoption-adk-eval-enable_features","--enable_features"],[0,0,1,"cmdoption-adk-eval-eval_storage_uri","--eval_storage_uri"],[0,0,1,"cmdoption-adk-eval-log_level","--log_level"],[0,0,1,"cmdoption-adk-eval-print_detailed_results","--print_detailed_results"],[0,0,1,"cmdoption-adk-eval-arg-AGENT_MODULE_FILE_PATH","AGENT_MODULE_FILE_PATH"],[0,0,1,"cmdoption-adk-eval-arg-EVAL_SET_FILE_PATH_OR_ID","EVAL_SET_FILE_PATH_OR_ID"]],"adk-eval_set-add_eval_case":[[0,0,1,"cmdoption-adk-eval_set-add_eval_case-eval_storage_uri","--eval_storage_uri"],[0,0,1,"cmdoption-adk-eval_set-add_eval_case-log_level","--log_level"],[0,0,1,"cmdoption-adk-eval_set-add_eval_case-scenarios_file","--scenarios_file"],[0,0,1,"cmdoption-adk-eval_set-add_eval_case-session_input_file","--session_input_file"],[0,0,1,"cmdoption-adk-eval_set-add_eval_case-arg-AGENT_MODULE_FILE_PATH","AGENT_MODULE_FILE_PATH"],[0,0,1,"cmdoption-adk-eval_set-add_eval_case-arg-EVAL_SET_ID","EVAL_SET_ID"]],"adk-eval_set-create":[[0,0,1,"cmdoption-adk-eval_set-create-eval_storage_uri","--eval_storage_uri"],[0,0,1,"cmdoption-adk-eval_set-create-log_level","--log_level"],[0,0,1,"cmdoption-adk-eval_set-create-arg-AGENT_MODULE_FILE_PATH","AGENT_MODULE_FILE_PATH"],[0,0,1,"cmdoption-adk-eval_set-create-arg-EVAL_SET_ID","EVAL_SET_ID"]],"adk-eval_set-generate_eval_cases":[[0,0,1,"cmdoption-adk-eval_set-generate_eval_cases-eval_storage_uri","--eval_storage_uri"],[0,0,1,"cmdoption-adk-eval_set-generate_eval_cases-log_level","--log_level"],[0,0,1,"cmdoption-adk-eval_set-generate_eval_cases-user_simulation_config_file","--user_simulation_config_file"],[0,0,1,"cmdoption-adk-eval_set-generate_eval_cases-arg-AGENT_MODULE_FILE_PATH","AGENT_MODULE_FILE_PATH"],[0,0,1,"cmdoption-adk-eval_set-generate_eval_cases-arg-EVAL_SET_ID","EVAL_SET_ID"]],"adk-migrate-session":[[0,0,1,"cmdoption-adk-migrate-session-allow-unsafe-unpickling","--allow-unsafe-unpickling"],[0,0,1,"cmdoption-adk-migrate-session-allow-unsafe-unpickling","--allow_unsafe_unpickling"],[0,0,1,"cmdoption-adk-migrate-session-dest_db_url","--dest_db_url"],[0,0,1,"cmdoption-adk-migrate-session-log_level","--log_level"],[0,0,1,"cmdoption-adk-migrate-session-source_db_url","--source_db_url"]],"adk-optimize":[[0,0,1,"cmdoption-adk-optimize-log_level","--log_level"],[0,0,1,"cmdoption-adk-optimize-optimizer_config_file_path","--optimizer_config_file_path"],[0,0,1,"cmdoption-adk-optimize-print_detailed_results","--print_detailed_results"],[0,0,1,"cmdoption-adk-optimize-sampler_config_file_path","--sampler_config_file_path"],[0,0,1,"cmdoption-adk-optimize-arg-AGENT_MODULE_FILE_PATH","AGENT_MODULE_FILE_PATH"]],"adk-run":[[0,0,1,"cmdoption-adk-run-artifact_service_uri","--artifact_service_uri"],[0,0,1,"cmdoption-adk-run-default_llm_model","--default_llm_model"],[0,0,1,"cmdoption-adk-run-disable_features","--disable_features"],[0,0,1,"cmdoption-adk-run-enable_features","--enable_features"],[0,0,1,"cmdoption-adk-run-in_memory","--in_memory"],[0,0,1,"cmdoption-adk-run-jsonl","--jsonl"],[0,0,1,"cmdoption-adk-run-log_level","--log_level"],[0,0,1,"cmdoption-adk-run-memory_service_uri","--memory_service_uri"],[0,0,1,"cmdoption-adk-run-use_local_storage","--no_use_local_storage"],[0,0,1,"cmdoption-adk-run-replay","--replay"],[0,0,1,"cmdoption-adk-run-resume","--resume"],[0,0,1,"cmdoption-adk-run-save_session","--save_session"],[0,0,1,"cmdoption-adk-run-session_id","--session_id"],[0,0,1,"cmdoption-adk-run-session_service_uri","--session_service_uri"],[0,0,1,"cmdoption-adk-run-state","--state"],[0,0,1,"cmdoption-adk-run-timeout","--timeout"],[0,0,1,"cmdoption-adk-run-use_local_storage","--use_local_storage"],[0,0,1,"cmdoption-adk-run-v","--verbose"],[0,0,1,"cmdoption-adk-run-v","-v"],[0,0,1,"cmdoption-adk-run-arg-AGENT","AGENT"],[0,0,1,"cmdoption-adk-run-arg-QUERY","QUERY"]],"adk-test":[[0,0,1,"cmdoption-adk-test-rebuild","--rebuild"],[0,0,1,"cmdoption-adk-test-arg-FOLDER","FOLDER"]],"adk-web":[[0,0,1,"cmdoption-adk-web-a2a","--a2a"],[0,0,1,"cmdoption-adk-web-allow_origins","--allow_origins"],[0,0,1,"cmdoption-adk-web-artifact_service_uri","--artifact_service_uri"],[0,0,1,"cmdoption-adk-web-default_llm_model","--default_llm_model"],[0,0,1,"cmdoption-adk-web-disable_features","--disable_features"],[0,0,1,"cmdoption-adk-web-enable_features","--enable_features"],[0,0,1,"cmdoption-adk-web-eval_storage_uri","--eval_storage_uri"],[0,0,1,"cmdoption-adk-web-extra_plugins","--extra_plugins"],[0,0,1,"cmdoption-adk-web-host","--host"],[0,0,1,"cmdoption-adk-web-log_level","--log_level"],[0,0,1,"cmdoption-adk-web-logo-image-url","--logo-image-url"],[0,0,1,"cmdoption-adk-web-logo-text","--logo-text"],[0,0,1,"cmdoption-adk-web-memory_service_uri","--memory_service_uri"],[0,0,1,"cmdoption-adk-web-reload","--no-reload"],[0,0,1,"cmdoption-adk-web-use_local_storage","--no_use_local_storage"],[0,0,1,"cmdoption-adk-web-otel_to_cloud","--otel_to_cloud"],[0,0,1,"cmdoption-adk-web-port","--port"],[0,0,1,"cmdoption-adk-web-reload","--reload"],[0,0,1,"cmdoption-adk-web-reload_agents","--reload_agents"],[0,0,1,"cmdoption-adk-web-session_service_uri","--session_service_uri"],[0,0,1,"cmdoption-adk-web-trace_to_cloud","--trace_to_cloud"],[0,0,1,"cmdoption-adk-web-trigger_sources","--trigger_sources"],[0,0,1,"cmdoption-adk-web-url_prefix","--url_prefix"],[0,0,1,"cmdoption-adk-web-use_local_storage","--use_local_storage"],[0,0,1,"cmdoption-adk-web-v","--verbose"],[0,0,1,"cmdoption-adk-web-v","-v"],[0,0,1,"cmdoption-adk-web-arg-AGENTS_DIR","AGENTS_DIR"]]},"objnames":{"0":["std","cmdoption","program option"]},"objtypes":{"0":"std:cmdoption"},"terms":{"30s":0,"5m":0,"A":0,"And":0,"Cannot":0,"Do":0,"Each":0,"For":0,"If":0,"It":0,"Not":0,"The":0,"There":0,"This":0,"When":0,"With":0,"You":0,"__init__":0,"a2a":0,"abc":0,"absent":0,"absolutize_import":0,"access":0,"add":0,"addit":0,"adk_app":0,"adk_app_object":0,"adk_disable_local_storag":0,"adk_force_local_storag":0,"adk_vers":0,"advanc":0,"agent":0,"agent_engine_config":0,"agent_engine_config_fil":0,"agent_engine_id":0,"agent_module_file_path":0,"agentengin":0,"agents_dir":0,"ai":0,"allow":0,"allow_origin":0,"allow_unsafe_unpickl":0,"alongsid":0,"alreadi":0,"altern":0,"ani":0,"api":0,"api_key":0,"app":0,"app_nam":0,"applic":0,"arg":0,"argument":0,"artifact":0,"artifact_service_uri":0,"auto":0,"auto_create_sess":0,"automat":0,"avail":0,"back":0,"backend":0,"base":0,"basenam":0,"batch":0,"behavior":0,"behind":0,"bidi":0,"bind":0,"bucket":0,"bucket_nam":0,"call":0,"can":0,"case":0,"categori":0,"central1":0,"chang":0,"choos":0,"class":0,"cloud":0,"cluster":0,"cluster_nam":0,"clusterip":0,"code":0,"collect":0,"com":0,"combin":0,"comma":0,"command":0,"common":0,"compar":0,"config":0,"config_file_path":0,"connect":0,"consist":0,"consol":0,"contain":0,"content":0,"continu":0,"convers":0,"conversationscenario":0,"cor":0,"core":0,"correct":0,"correspond":0,"critic":0,"current":0,"custom":0,"data":0,"databas":0,"db":0,"debug":0,"default":0,"default_llm_model":0,"definit":0,"demarc":0,"depend":0,"deprec":0,"descript":0,"description_001":0,"dest":0,"dest_db_url":0,"destin":0,"detail":0,"dev":0,"develop":0,"dict":0,"direct":0,"directori":0,"disable_featur":0,"display":0,"display_nam":0,"distinct":0,"doc":0,"doe":0,"doesn":0,"driven":0,"dure":0,"dynam":0,"e":0,"either":0,"empti":0,"en":0,"enable_featur":0,"endpoint":0,"engin":0,"ensur":0,"enter":0,"enterpris":0,"entri":0,"env":0,"env_fil":0,"environ":0,"error":0,"eval_1":0,"eval_2":0,"eval_3":0,"eval_4":0,"eval_5":0,"eval_set_file_path_or_id":0,"eval_set_id":0,"eval_storage_uri":0,"evalset":0,"evalu":0,"event":0,"eventarc":0,"exact":0,"exampl":0,"execut":0,"exist":0,"exit":0,"expect":0,"experiment":0,"explicit":0,"export":0,"expos":0,"express":0,"express_mod":0,"extra":0,"extra_packag":0,"extra_plugin":0,"fall":0,"fals":0,"fastapi":0,"featur":0,"file":0,"filepath":0,"first":0,"flag":0,"folder":0,"follow":0,"forc":0,"format":0,"full":0,"futur":0,"g":0,"gateway":0,"gcloud":0,"gcp":0,"gcs":0,"gemini":0,"gemini_enterprise_app_nam":0,"generat":0,"generate_report":0,"gepa":0,"geparootagentpromptoptim":0,"given":0,"googl":0,"google_api_key":0,"google_cloud_loc":0,"google_cloud_project":0,"google_genai_use_enterpris":0,"gs":0,"hello":0,"host":0,"html":0,"https":0,"human":0,"id":0,"ignor":0,"imag":0,"implement":0,"import":0,"in_memori":0,"info":0,"initi":0,"input":0,"instal":0,"instanc":0,"instead":0,"instruct":0,"interact":0,"internal":0,"invoc":0,"ip":0,"isn":0,"json":0,"json_schema_for_func_decl":0,"jsonl":0,"keep":0,"key":0,"kit":0,"kubernet":0,"later":0,"latest":0,"legaci":0,"level":0,"line":0,"list":0,"liter":0,"live":0,"llm":0,"load":0,"loadbalanc":0,"local":0,"localevalsampl":0,"locat":0,"log":0,"log_level":0,"logo":0,"logo_image_url":0,"logo_text":0,"longer":0,"make":0,"manag":0,"markdown":0,"match":0,"mean":0,"memori":0,"memory_service_uri":0,"messag":0,"method":0,"min":0,"mix":0,"mode":0,"model":0,"modul":0,"mount":0,"multipl":0,"must":0,"my_ag":0,"my_app":0,"my_plugin_inst":0,"mypluginclass":0,"name":0,"need":0,"new":0,"newli":0,"no_use_local_storag":0,"none":0,"note":0,"now":0,"number":0,"observ":0,"one":0,"onli":0,"opentelemetri":0,"optimizer_config_file_path":0,"option":0,"org":0,"origin":0,"otel":0,"otel_to_cloud":0,"output":0,"overrid":0,"overridden":0,"packag":0,"page":0,"path":0,"path_to_sqlite_fil":0,"pattern":0,"persist":0,"pick":0,"pickl":0,"place":0,"plugin":0,"point":0,"port":0,"prefix":0,"prepopul":0,"previous":0,"print":0,"print_detailed_result":0,"produc":0,"product":0,"progress":0,"progressive_sse_stream":0,"project":0,"prompt":0,"provid":0,"proxi":0,"public":0,"pubsub":0,"py":0,"pytest":0,"pythonpath":0,"qualifi":0,"queri":0,"rag":0,"rag_corpus_id":0,"re":0,"read":0,"readabl":0,"real":0,"reasoningengin":0,"rebuild":0,"redirect":0,"refer":0,"regex":0,"region":0,"regist":0,"reload":0,"reload_ag":0,"remov":0,"repeat":0,"replay":0,"report":0,"report_dir":0,"request":0,"requir":0,"requirements_fil":0,"resourc":0,"respons":0,"result":0,"resum":0,"revers":0,"root":0,"root_ag":0,"runtim":0,"s":0,"sample_eval_set_fil":0,"sample_eval_set_id":0,"sampler":0,"sampler_config_file_path":0,"save":0,"save_sess":0,"scenario":0,"scenarios_fil":0,"schema":0,"sdk":0,"search":0,"see":0,"send":0,"separ":0,"serial":0,"serv":0,"server":0,"servic":0,"service_nam":0,"service_typ":0,"session_id":0,"session_input_fil":0,"session_service_uri":0,"sessioninput":0,"set":0,"sever":0,"shadow":0,"shortcut":0,"show":0,"simul":0,"singl":0,"skip":0,"sourc":0,"source_db_url":0,"spec":0,"specif":0,"specifi":0,"sqlalchemi":0,"sqlite":0,"sse":0,"stage":0,"staging_bucket":0,"start":0,"state":0,"step":0,"storag":0,"store":0,"stream":0,"streaming_mod":0,"string":0,"structur":0,"subdirectori":0,"suffix":0,"support":0,"system":0,"t":0,"temp":0,"temp_fold":0,"templat":0,"test_nam":0,"testcas":0,"testcaseinput":0,"text":0,"timeout":0,"timestamp":0,"tool":0,"top":0,"trace":0,"trace_to_cloud":0,"train":0,"trigger":0,"trigger_sourc":0,"true":0,"trust":0,"turn":0,"type":0,"ui":0,"unauthent":0,"unless":0,"unpickl":0,"unsaf":0,"unset":0,"updat":0,"uri":0,"url":0,"url_prefix":0,"us":0,"usag":0,"use":0,"use_local_storag":0,"user":0,"user_simulation_config_fil":0,"userscenariogenerationconfig":0,"v":0,"v1":0,"valid":0,"valu":0,"variabl":0,"verbos":0,"verif":0,"verifi":0,"version":0,"vertex":0,"vertexai":0,"via":0,"want":0,"warn":0,"way":0,"whether":0,"will":0,"with_ui":0,"work":0,"writabl":0,"write":0,"yaml":0,"yet":0},"titles":["ADK CLI documentation"],"titleterms":{"add_eval_cas":0,"adk":0,"agent_engin":0,"api_serv":0,"cli":0,"cloud_run":0,"conform":0,"creat":0,"deploy":0,"disabl":0,"document":0,"enabl":0,"eval":0,"eval_set":0,"generate_eval_cas":0,"gke":0,"migrat":0,"optim":0,"record":0,"run":0,"session":0,"status":0,"telemetri":0,"test":0,"web":0}})
\ No newline at end of file
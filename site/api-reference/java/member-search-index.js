@@ -0,0 +1 @@
+memberSearchIndex = [{"p":"com.google.adk.utils","c":"AgentEnums.AgentOrigin","l":"A2A","k":"0"},{"p":"com.google.adk.a2a.converters","c":"PartConverter","l":"A2A_DATA_PART_END_TAG","k":"2"},{"p":"com.google.adk.a2a.converters","c":"PartConverter","l":"A2A_DATA_PART_START_TAG","k":"2"},{"p":"com.google.adk.a2a.converters","c":"PartConverter","l":"A2A_DATA_PART_TEXT_MIME_TYPE","k":"2"},{"p":"com.example.a2a_basic","c":"A2AAgentRun","l":"A2AAgentRun(BaseAgent)","u":"%3Cinit%3E(com.google.adk.agents.BaseAgent)","k":"3"},{"p":"com.google.adk.a2a.agent","c":"RemoteA2AAgent.Builder","l":"a2aClient(Client)","u":"a2aClient(io.a2a.client.Client)"},{"p":"com.google.adk.a2a.common","c":"A2AClientError","l":"A2AClientError(String)","u":"%3Cinit%3E(java.lang.String)","k":"3"},{"p":"com.google.adk.a2a.common","c":"A2AClientError","l":"A2AClientError(String, Throwable)","u":"%3Cinit%3E(java.lang.String,java.lang.Throwable)","k":"3"},{"p":"com.google.adk.tools.mcp","c":"AbstractMcpTool","l":"AbstractMcpTool(McpSchema.Tool, T, McpSessionManager, ObjectMapper)","u":"%3Cinit%3E(io.modelcontextprotocol.spec.McpSchema.Tool,T,com.google.adk.tools.mcp.McpSessionManager,com.fasterxml.jackson.databind.ObjectMapper)","k":"3"},{"p":"com.google.adk.skills","c":"AbstractSkillSource","l":"AbstractSkillSource()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.tools.applicationintegrationtoolset","c":"ConnectionsClient","l":"actionRequest(String)","u":"actionRequest(java.lang.String)","k":"6"},{"p":"com.google.adk.tools.applicationintegrationtoolset","c":"ConnectionsClient","l":"actionResponse(String)","u":"actionResponse(java.lang.String)","k":"6"},{"p":"com.google.adk.events","c":"Event","l":"actions()"},{"p":"com.google.adk.tools","c":"ToolContext","l":"actions()"},{"p":"com.google.adk.events","c":"Event.Builder","l":"actions(EventActions)","u":"actions(com.google.adk.events.EventActions)"},{"p":"com.google.adk.tools","c":"ToolContext.Builder","l":"actions(EventActions)","u":"actions(com.google.adk.events.EventActions)"},{"p":"com.google.adk.tools.applicationintegrationtoolset","c":"ConnectionsClient.ActionSchema","l":"ActionSchema()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.agents","c":"ActiveStreamingTool","l":"ActiveStreamingTool()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.agents","c":"ActiveStreamingTool","l":"ActiveStreamingTool(Disposable)","u":"%3Cinit%3E(io.reactivex.rxjava3.disposables.Disposable)","k":"3"},{"p":"com.google.adk.agents","c":"ActiveStreamingTool","l":"ActiveStreamingTool(Disposable, LiveRequestQueue)","u":"%3Cinit%3E(io.reactivex.rxjava3.disposables.Disposable,com.google.adk.agents.LiveRequestQueue)","k":"3"},{"p":"com.google.adk.agents","c":"ActiveStreamingTool","l":"ActiveStreamingTool(LiveRequestQueue)","u":"%3Cinit%3E(com.google.adk.agents.LiveRequestQueue)","k":"3"},{"p":"com.google.adk.agents","c":"InvocationContext","l":"activeStreamingTools()"},{"p":"com.example.github","c":"GitHubTools","l":"addCommentToIssue(String, String, int, String)","u":"addCommentToIssue(java.lang.String,java.lang.String,int,java.lang.String)","k":"6"},{"p":"com.example.adkprtriaging","c":"AdkPrTriagingAgent","l":"addCommentToPr(int, String)","u":"addCommentToPr(int,java.lang.String)","k":"6"},{"p":"com.example.github","c":"GitHubTools","l":"addCommentToPullRequest(String, String, int, String)","u":"addCommentToPullRequest(java.lang.String,java.lang.String,int,java.lang.String)","k":"6"},{"p":"com.google.adk.telemetry","c":"Instrumentation.AgentInvocation","l":"addEvent(Event)","u":"addEvent(com.google.adk.events.Event)"},{"p":"com.google.adk.tools","c":"ExampleTool.Builder","l":"addExample(Example)","u":"addExample(com.google.adk.examples.Example)"},{"p":"com.google.adk.codeexecutors","c":"CodeExecutorContext","l":"addInputFiles(List)","u":"addInputFiles(java.util.List)"},{"p":"com.google.adk.utils","c":"AdditionalAdkComponentProvider","l":"AdditionalAdkComponentProvider()","u":"%3Cinit%3E()","k":"3"},{"p":"com.example.adkstale","c":"AdkStaleAgent","l":"addLabelToIssue(int, String)","u":"addLabelToIssue(int,java.lang.String)","k":"6"},{"p":"com.example.adktriaging","c":"AdkTriagingAgent","l":"addLabelToIssue(int, String)","u":"addLabelToIssue(int,java.lang.String)","k":"6"},{"p":"com.example.github","c":"GitHubTools","l":"addLabelToIssue(String, String, int, String)","u":"addLabelToIssue(java.lang.String,java.lang.String,int,java.lang.String)","k":"6"},{"p":"com.example.adkprtriaging","c":"AdkPrTriagingAgent","l":"addLabelToPr(int, String)","u":"addLabelToPr(int,java.lang.String)","k":"6"},{"p":"com.example.github","c":"GitHubTools","l":"addLabelToPullRequest(String, String, int, String)","u":"addLabelToPullRequest(java.lang.String,java.lang.String,int,java.lang.String)","k":"6"},{"p":"com.google.adk.codeexecutors","c":"CodeExecutorContext","l":"addProcessedFileNames(List)","u":"addProcessedFileNames(java.util.List)"},{"p":"com.google.adk.skills","c":"InMemorySkillSource.Builder.SkillBuilder","l":"addResource(String, byte[])","u":"addResource(java.lang.String,byte[])"},{"p":"com.google.adk.skills","c":"InMemorySkillSource.Builder.SkillBuilder","l":"addResource(String, ByteSource)","u":"addResource(java.lang.String,com.google.common.io.ByteSource)"},{"p":"com.google.adk.skills","c":"InMemorySkillSource.Builder.SkillBuilder","l":"addResource(String, String)","u":"addResource(java.lang.String,java.lang.String)"},{"p":"com.google.adk.web","c":"AdkWebServer","l":"addResourceHandlers(ResourceHandlerRegistry)","u":"addResourceHandlers(org.springframework.web.servlet.config.annotation.ResourceHandlerRegistry)"},{"p":"com.google.adk.web.controller","c":"EvaluationController","l":"addSessionToEvalSet(String, String, AddSessionToEvalSetRequest)","u":"addSessionToEvalSet(java.lang.String,java.lang.String,com.google.adk.web.dto.AddSessionToEvalSetRequest)"},{"p":"com.google.adk.web.dto","c":"AddSessionToEvalSetRequest","l":"AddSessionToEvalSetRequest()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.memory","c":"BaseMemoryService","l":"addSessionToMemory(Session)","u":"addSessionToMemory(com.google.adk.sessions.Session)"},{"p":"com.google.adk.memory","c":"FirestoreMemoryService","l":"addSessionToMemory(Session)","u":"addSessionToMemory(com.google.adk.sessions.Session)"},{"p":"com.google.adk.memory","c":"InMemoryMemoryService","l":"addSessionToMemory(Session)","u":"addSessionToMemory(com.google.adk.sessions.Session)"},{"p":"com.example.adkstale","c":"AdkStaleAgent","l":"addStaleLabelAndComment(int)","k":"6"},{"p":"com.google.adk.web","c":"AdkWebServer","l":"addViewControllers(ViewControllerRegistry)","u":"addViewControllers(org.springframework.web.servlet.config.annotation.ViewControllerRegistry)"},{"p":"com.google.adk.a2a.converters","c":"EventConverter","l":"ADK_CONTEXT_ID_KEY","k":"2"},{"p":"com.google.adk.a2a.converters","c":"EventConverter","l":"ADK_TASK_ID_KEY","k":"2"},{"p":"com.example.adkdocs","c":"AdkDocsReleaseAnalyzerRun","l":"AdkDocsReleaseAnalyzerRun()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.tools.mcp","c":"ConversionUtils","l":"adkToMcpToolType(BaseTool)","u":"adkToMcpToolType(com.google.adk.tools.BaseTool)","k":"6"},{"p":"com.google.adk.web.config","c":"AdkWebCorsConfig","l":"AdkWebCorsConfig()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.web.config","c":"AdkWebCorsProperties","l":"AdkWebCorsProperties(String, List, List, List, boolean, long)","u":"%3Cinit%3E(java.lang.String,java.util.List,java.util.List,java.util.List,boolean,long)","k":"3"},{"p":"com.google.adk.web","c":"AdkWebServer","l":"AdkWebServer()","u":"%3Cinit%3E()","k":"3"},{"p":"com.example","c":"CoreCallbacks","l":"AFTER_AGENT_CALLBACK","k":"2"},{"p":"com.example","c":"CoreCallbacks","l":"AFTER_AGENT_CALLBACK1","k":"2"},{"p":"com.example","c":"CoreCallbacks","l":"AFTER_AGENT_CALLBACK2","k":"2"},{"p":"com.example","c":"CoreCallbacks","l":"AFTER_AGENT_CALLBACK3","k":"2"},{"p":"com.example","c":"CoreCallbacks","l":"AFTER_MODEL_CALLBACK","k":"2"},{"p":"com.example","c":"CoreCallbacks","l":"AFTER_TOOL_CALLBACK1","k":"2"},{"p":"com.example","c":"CoreCallbacks","l":"AFTER_TOOL_CALLBACK2","k":"2"},{"p":"com.example","c":"CoreCallbacks","l":"AFTER_TOOL_CALLBACK3","k":"2"},{"p":"com.google.adk.agents","c":"BaseAgent.Builder","l":"afterAgentCallback","k":"1"},{"p":"com.google.adk.agents","c":"BaseAgent","l":"afterAgentCallback()"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryAgentAnalyticsPlugin","l":"afterAgentCallback(BaseAgent, CallbackContext)","u":"afterAgentCallback(com.google.adk.agents.BaseAgent,com.google.adk.agents.CallbackContext)"},{"p":"com.google.adk.plugins","c":"LoggingPlugin","l":"afterAgentCallback(BaseAgent, CallbackContext)","u":"afterAgentCallback(com.google.adk.agents.BaseAgent,com.google.adk.agents.CallbackContext)"},{"p":"com.google.adk.plugins","c":"Plugin","l":"afterAgentCallback(BaseAgent, CallbackContext)","u":"afterAgentCallback(com.google.adk.agents.BaseAgent,com.google.adk.agents.CallbackContext)"},{"p":"com.google.adk.plugins","c":"PluginManager","l":"afterAgentCallback(BaseAgent, CallbackContext)","u":"afterAgentCallback(com.google.adk.agents.BaseAgent,com.google.adk.agents.CallbackContext)"},{"p":"com.google.adk.agents","c":"BaseAgent.Builder","l":"afterAgentCallback(Callbacks.AfterAgentCallback)","u":"afterAgentCallback(com.google.adk.agents.Callbacks.AfterAgentCallback)"},{"p":"com.google.adk.a2a.agent","c":"RemoteA2AAgent.Builder","l":"afterAgentCallback(List)","u":"afterAgentCallback(java.util.List)"},{"p":"com.google.adk.agents","c":"BaseAgent.Builder","l":"afterAgentCallback(List)","u":"afterAgentCallback(java.util.List)"},{"p":"com.google.adk.agents","c":"BaseAgentConfig","l":"afterAgentCallbacks()"},{"p":"com.google.adk.agents","c":"LlmAgent.Builder","l":"afterAgentCallbackSync(Callbacks.AfterAgentCallbackSync)","u":"afterAgentCallbackSync(com.google.adk.agents.Callbacks.AfterAgentCallbackSync)"},{"p":"com.google.adk.web.websocket","c":"LiveWebSocketHandler","l":"afterConnectionClosed(WebSocketSession, CloseStatus)","u":"afterConnectionClosed(org.springframework.web.socket.WebSocketSession,org.springframework.web.socket.CloseStatus)"},{"p":"com.google.adk.web.websocket","c":"LiveWebSocketHandler","l":"afterConnectionEstablished(WebSocketSession)","u":"afterConnectionEstablished(org.springframework.web.socket.WebSocketSession)"},{"p":"com.google.adk.a2a.executor","c":"AgentExecutorConfig","l":"afterEventCallback()"},{"p":"com.google.adk.a2a.executor","c":"AgentExecutorConfig.Builder","l":"afterEventCallback(Callbacks.AfterEventCallback)","u":"afterEventCallback(com.google.adk.a2a.executor.Callbacks.AfterEventCallback)"},{"p":"com.google.adk.a2a.executor","c":"AgentExecutorConfig","l":"afterExecuteCallback()"},{"p":"com.google.adk.a2a.executor","c":"AgentExecutorConfig.Builder","l":"afterExecuteCallback(Callbacks.AfterExecuteCallback)","u":"afterExecuteCallback(com.google.adk.a2a.executor.Callbacks.AfterExecuteCallback)"},{"p":"com.google.adk.agents","c":"LlmAgent","l":"afterModelCallback()"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryAgentAnalyticsPlugin","l":"afterModelCallback(CallbackContext, LlmResponse)","u":"afterModelCallback(com.google.adk.agents.CallbackContext,com.google.adk.models.LlmResponse)"},{"p":"com.google.adk.plugins","c":"LoggingPlugin","l":"afterModelCallback(CallbackContext, LlmResponse)","u":"afterModelCallback(com.google.adk.agents.CallbackContext,com.google.adk.models.LlmResponse)"},{"p":"com.google.adk.plugins","c":"Plugin","l":"afterModelCallback(CallbackContext, LlmResponse)","u":"afterModelCallback(com.google.adk.agents.CallbackContext,com.google.adk.models.LlmResponse)"},{"p":"com.google.adk.plugins","c":"PluginManager","l":"afterModelCallback(CallbackContext, LlmResponse)","u":"afterModelCallback(com.google.adk.agents.CallbackContext,com.google.adk.models.LlmResponse)"},{"p":"com.google.adk.agents","c":"LlmAgent.Builder","l":"afterModelCallback(Callbacks.AfterModelCallback)","u":"afterModelCallback(com.google.adk.agents.Callbacks.AfterModelCallback)"},{"p":"com.google.adk.agents","c":"LlmAgent.Builder","l":"afterModelCallback(List)","u":"afterModelCallback(java.util.List)"},{"p":"com.google.adk.agents","c":"LlmAgentConfig","l":"afterModelCallbacks()"},{"p":"com.google.adk.agents","c":"LlmAgent.Builder","l":"afterModelCallbackSync(Callbacks.AfterModelCallbackSync)","u":"afterModelCallbackSync(com.google.adk.agents.Callbacks.AfterModelCallbackSync)"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryAgentAnalyticsPlugin","l":"afterRunCallback(InvocationContext)","u":"afterRunCallback(com.google.adk.agents.InvocationContext)"},{"p":"com.google.adk.plugins","c":"LoggingPlugin","l":"afterRunCallback(InvocationContext)","u":"afterRunCallback(com.google.adk.agents.InvocationContext)"},{"p":"com.google.adk.plugins","c":"Plugin","l":"afterRunCallback(InvocationContext)","u":"afterRunCallback(com.google.adk.agents.InvocationContext)"},{"p":"com.google.adk.plugins","c":"PluginManager","l":"afterRunCallback(InvocationContext)","u":"afterRunCallback(com.google.adk.agents.InvocationContext)"},{"p":"com.google.adk.plugins","c":"ReplayPlugin","l":"afterRunCallback(InvocationContext)","u":"afterRunCallback(com.google.adk.agents.InvocationContext)"},{"p":"com.google.adk.sessions","c":"GetSessionConfig","l":"afterTimestamp()"},{"p":"com.google.adk.sessions","c":"GetSessionConfig.Builder","l":"afterTimestamp(Instant)","u":"afterTimestamp(java.time.Instant)"},{"p":"com.google.adk.agents","c":"LlmAgent","l":"afterToolCallback()"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryAgentAnalyticsPlugin","l":"afterToolCallback(BaseTool, Map, ToolContext, Map)","u":"afterToolCallback(com.google.adk.tools.BaseTool,java.util.Map,com.google.adk.tools.ToolContext,java.util.Map)"},{"p":"com.google.adk.plugins","c":"LoggingPlugin","l":"afterToolCallback(BaseTool, Map, ToolContext, Map)","u":"afterToolCallback(com.google.adk.tools.BaseTool,java.util.Map,com.google.adk.tools.ToolContext,java.util.Map)"},{"p":"com.google.adk.plugins","c":"Plugin","l":"afterToolCallback(BaseTool, Map, ToolContext, Map)","u":"afterToolCallback(com.google.adk.tools.BaseTool,java.util.Map,com.google.adk.tools.ToolContext,java.util.Map)"},{"p":"com.google.adk.plugins","c":"PluginManager","l":"afterToolCallback(BaseTool, Map, ToolContext, Map)","u":"afterToolCallback(com.google.adk.tools.BaseTool,java.util.Map,com.google.adk.tools.ToolContext,java.util.Map)"},{"p":"com.google.adk.agents","c":"LlmAgent.Builder","l":"afterToolCallback(Callbacks.AfterToolCallback)","u":"afterToolCallback(com.google.adk.agents.Callbacks.AfterToolCallback)"},{"p":"com.google.adk.agents","c":"LlmAgent.Builder","l":"afterToolCallback(List)","u":"afterToolCallback(java.util.List)"},{"p":"com.google.adk.agents","c":"LlmAgentConfig","l":"afterToolCallbacks()"},{"p":"com.google.adk.agents","c":"LlmAgent.Builder","l":"afterToolCallbackSync(Callbacks.AfterToolCallbackSync)","u":"afterToolCallbackSync(com.google.adk.agents.Callbacks.AfterToolCallbackSync)"},{"p":"com.google.adk.agents","c":"InvocationContext","l":"agent()"},{"p":"com.google.adk.runner","c":"Runner","l":"agent()"},{"p":"com.google.adk.a2a.executor","c":"AgentExecutor.Builder","l":"agent(BaseAgent)","u":"agent(com.google.adk.agents.BaseAgent)"},{"p":"com.google.adk.agents","c":"InvocationContext.Builder","l":"agent(BaseAgent)","u":"agent(com.google.adk.agents.BaseAgent)"},{"p":"com.google.adk.runner","c":"Runner.Builder","l":"agent(BaseAgent)","u":"agent(com.google.adk.agents.BaseAgent)"},{"p":"com.google.adk.samples.a2aagent","c":"AgentCardProducer","l":"agentCard()"},{"p":"com.google.adk.a2a.agent","c":"RemoteA2AAgent.Builder","l":"agentCard(AgentCard)","u":"agentCard(io.a2a.spec.AgentCard)"},{"p":"com.google.adk.samples.a2aagent","c":"AgentCardProducer","l":"AgentCardProducer()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.a2a.agent","c":"RemoteA2AAgent.AgentCardResolutionError","l":"AgentCardResolutionError(String)","u":"%3Cinit%3E(java.lang.String)","k":"3"},{"p":"com.google.adk.a2a.agent","c":"RemoteA2AAgent.AgentCardResolutionError","l":"AgentCardResolutionError(String, Throwable)","u":"%3Cinit%3E(java.lang.String,java.lang.Throwable)","k":"3"},{"p":"com.google.adk.agents","c":"BaseAgentConfig","l":"agentClass()"},{"p":"com.google.adk.web.controller","c":"AgentController","l":"AgentController(AgentLoader)","u":"%3Cinit%3E(com.google.adk.web.AgentLoader)","k":"3"},{"p":"com.google.adk.samples.a2aagent","c":"AgentExecutorProducer","l":"agentExecutor()"},{"p":"com.google.adk.a2a.executor","c":"AgentExecutorConfig","l":"AgentExecutorConfig()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.a2a.executor","c":"AgentExecutor.Builder","l":"agentExecutorConfig(AgentExecutorConfig)","u":"agentExecutorConfig(com.google.adk.a2a.executor.AgentExecutorConfig)"},{"p":"com.google.adk.samples.a2aagent","c":"AgentExecutorProducer","l":"AgentExecutorProducer()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.web","c":"AgentGraphGenerator","l":"AgentGraphGenerator()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.telemetry","c":"Instrumentation.AgentInvocation","l":"AgentInvocation(InvocationContext, BaseAgent, Context)","u":"%3Cinit%3E(com.google.adk.agents.InvocationContext,com.google.adk.agents.BaseAgent,io.opentelemetry.context.Context)","k":"3"},{"p":"com.google.adk.web.config","c":"AgentLoadingProperties","l":"AgentLoadingProperties()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.planner.goap","c":"AgentMetadata","l":"AgentMetadata(String, ImmutableList, String)","u":"%3Cinit%3E(java.lang.String,com.google.common.collect.ImmutableList,java.lang.String)","k":"3"},{"p":"com.google.adk.agents","c":"ReadonlyContext","l":"agentName()"},{"p":"com.google.adk.planner.goap","c":"AgentMetadata","l":"agentName()"},{"p":"com.google.adk.plugins.recordings","c":"Recording","l":"agentName()"},{"p":"com.google.adk.plugins.recordings","c":"Recording.Builder","l":"agentName(String)","u":"agentName(java.lang.String)"},{"p":"com.google.adk.agents","c":"BaseAgentConfig.AgentRefConfig","l":"AgentRefConfig()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.agents","c":"BaseAgentConfig.AgentRefConfig","l":"AgentRefConfig(String)","u":"%3Cinit%3E(java.lang.String)","k":"3"},{"p":"com.google.adk.web.controller","c":"ExecutionController","l":"agentRun(AgentRunRequest)","u":"agentRun(com.google.adk.web.dto.AgentRunRequest)"},{"p":"com.google.adk.web.dto","c":"AgentRunRequest","l":"AgentRunRequest()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.web.controller","c":"ExecutionController","l":"agentRunSse(AgentRunRequest)","u":"agentRunSse(com.google.adk.web.dto.AgentRunRequest)"},{"p":"com.google.adk.agents","c":"PlannerAction.RunAgents","l":"agents()"},{"p":"com.google.adk.web","c":"AgentStaticLoader","l":"AgentStaticLoader(BaseAgent...)","u":"%3Cinit%3E(com.google.adk.agents.BaseAgent...)","k":"3"},{"p":"com.google.adk.tools","c":"AgentTool","l":"AgentTool(BaseAgent, boolean)","u":"%3Cinit%3E(com.google.adk.agents.BaseAgent,boolean)","k":"3"},{"p":"com.google.adk.tools","c":"AgentTool","l":"AgentTool(BaseAgent, boolean, boolean)","u":"%3Cinit%3E(com.google.adk.agents.BaseAgent,boolean,boolean)","k":"3"},{"p":"com.google.adk.flows.llmflows","c":"AgentTransfer","l":"AgentTransfer()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.a2a.common","c":"A2AMetadata.Key","l":"AGGREGATED","k":"0"},{"p":"com.example.adkstale","c":"AdkStaleAgent","l":"alertMaintainerOfEdit(int)","k":"6"},{"p":"com.google.adk.web.config","c":"AdkWebCorsProperties","l":"allowCredentials()"},{"p":"com.example.adkprtriaging","c":"AdkPrTriagingAgent","l":"ALLOWED_LABELS","k":"2"},{"p":"com.google.adk.skills","c":"Frontmatter","l":"allowedTools()"},{"p":"com.google.adk.skills","c":"Frontmatter.Builder","l":"allowedTools(String)","u":"allowedTools(java.lang.String)"},{"p":"com.google.adk.tools.mcp","c":"AbstractMcpTool","l":"annotations()"},{"p":"com.google.adk.models","c":"Gemini.Builder","l":"apiClient(Client)","u":"apiClient(com.google.genai.Client)"},{"p":"com.google.adk.sessions","c":"HttpApiClient","l":"apiKey()"},{"p":"com.google.adk.models","c":"Gemini.Builder","l":"apiKey(String)","u":"apiKey(java.lang.String)"},{"p":"com.google.adk.sessions","c":"ApiResponse","l":"ApiResponse()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.web.service","c":"ApiServerSpanExporter","l":"ApiServerSpanExporter()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.web.config","c":"OpenTelemetryConfig","l":"apiServerSpanExporter(ApiServerSpanExporterConfig)","u":"apiServerSpanExporter(com.google.adk.web.service.ApiServerSpanExporterConfig)"},{"p":"com.google.adk.web.service","c":"ApiServerSpanExporter","l":"ApiServerSpanExporter(ApiServerSpanExporterConfig)","u":"%3Cinit%3E(com.google.adk.web.service.ApiServerSpanExporterConfig)","k":"3"},{"p":"com.google.adk.web.service","c":"ApiServerSpanExporterConfig","l":"ApiServerSpanExporterConfig()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.web.config","c":"OpenTelemetryConfig","l":"apiServerSpanExporterConfig(Optional)","u":"apiServerSpanExporterConfig(java.util.Optional)"},{"p":"com.google.adk.models","c":"ApigeeLlm.Builder","l":"apiType(ApigeeLlm.ApiType)","u":"apiType(com.google.adk.models.ApigeeLlm.ApiType)"},{"p":"com.google.adk.sessions","c":"State","l":"APP_PREFIX","k":"2"},{"p":"com.google.adk.utils","c":"Constants","l":"APP_STATE_COLLECTION","k":"2"},{"p":"com.google.adk.a2a.executor","c":"AgentExecutor.Builder","l":"app(App)","u":"app(com.google.adk.apps.App)"},{"p":"com.google.adk.runner","c":"Runner.Builder","l":"app(App)","u":"app(com.google.adk.apps.App)"},{"p":"com.google.adk.tools","c":"LoadArtifactsTool","l":"appendArtifactsToLlmRequest(LlmRequest.Builder, ToolContext)","u":"appendArtifactsToLlmRequest(com.google.adk.models.LlmRequest.Builder,com.google.adk.tools.ToolContext)"},{"p":"com.google.adk.sessions","c":"BaseSessionService","l":"appendEvent(Session, Event)","u":"appendEvent(com.google.adk.sessions.Session,com.google.adk.events.Event)"},{"p":"com.google.adk.sessions","c":"FirestoreSessionService","l":"appendEvent(Session, Event)","u":"appendEvent(com.google.adk.sessions.Session,com.google.adk.events.Event)"},{"p":"com.google.adk.sessions","c":"InMemorySessionService","l":"appendEvent(Session, Event)","u":"appendEvent(com.google.adk.sessions.Session,com.google.adk.events.Event)"},{"p":"com.google.adk.sessions","c":"VertexAiSessionService","l":"appendEvent(Session, Event)","u":"appendEvent(com.google.adk.sessions.Session,com.google.adk.events.Event)"},{"p":"com.google.adk.models","c":"LlmRequest.Builder","l":"appendInstructions(List)","u":"appendInstructions(java.util.List)"},{"p":"com.google.adk.models","c":"LlmRequest.Builder","l":"appendTools(List)","u":"appendTools(java.util.List)"},{"p":"com.google.adk.tools.applicationintegrationtoolset","c":"ApplicationIntegrationToolset","l":"ApplicationIntegrationToolset(String, String, String, List, String, Map, List, String, String, String)","u":"%3Cinit%3E(java.lang.String,java.lang.String,java.lang.String,java.util.List,java.lang.String,java.util.Map,java.util.List,java.lang.String,java.lang.String,java.lang.String)","k":"3"},{"p":"com.google.adk.telemetry","c":"Tracing.ContextTransformer","l":"apply(Completable)","u":"apply(io.reactivex.rxjava3.core.Completable)"},{"p":"com.google.adk.telemetry","c":"Tracing.TracerProvider","l":"apply(Completable)","u":"apply(io.reactivex.rxjava3.core.Completable)"},{"p":"com.google.adk.telemetry","c":"Tracing.ContextTransformer","l":"apply(Flowable)","u":"apply(io.reactivex.rxjava3.core.Flowable)"},{"p":"com.google.adk.telemetry","c":"Tracing.TracerProvider","l":"apply(Flowable)","u":"apply(io.reactivex.rxjava3.core.Flowable)"},{"p":"com.google.adk.telemetry","c":"Tracing.ContextTransformer","l":"apply(Maybe)","u":"apply(io.reactivex.rxjava3.core.Maybe)"},{"p":"com.google.adk.telemetry","c":"Tracing.TracerProvider","l":"apply(Maybe)","u":"apply(io.reactivex.rxjava3.core.Maybe)"},{"p":"com.google.adk.telemetry","c":"Tracing.ContextTransformer","l":"apply(Single)","u":"apply(io.reactivex.rxjava3.core.Single)"},{"p":"com.google.adk.telemetry","c":"Tracing.TracerProvider","l":"apply(Single)","u":"apply(io.reactivex.rxjava3.core.Single)"},{"p":"com.google.adk.web.dto","c":"AgentRunRequest","l":"appName","k":"1"},{"p":"com.google.adk.web.dto","c":"RunEvalResult","l":"appName","k":"1"},{"p":"com.google.adk.agents","c":"InvocationContext","l":"appName()"},{"p":"com.google.adk.runner","c":"Runner","l":"appName()"},{"p":"com.google.adk.sessions","c":"Session","l":"appName()"},{"p":"com.google.adk.sessions","c":"SessionKey","l":"appName()"},{"p":"com.google.adk.a2a.executor","c":"AgentExecutor.Builder","l":"appName(String)","u":"appName(java.lang.String)"},{"p":"com.google.adk.runner","c":"Runner.Builder","l":"appName(String)","u":"appName(java.lang.String)"},{"p":"com.google.adk.sessions","c":"Session.Builder","l":"appName(String)","u":"appName(java.lang.String)"},{"p":"com.google.adk.a2a.converters","c":"PartConverter","l":"ARGS_KEY","k":"2"},{"p":"com.google.adk.tools","c":"BaseTool.ToolConfig","l":"args()"},{"p":"com.google.adk.tools.mcp","c":"StdioServerParameters","l":"args()"},{"p":"com.google.adk.tools.mcp","c":"StdioServerParameters.Builder","l":"args(List)","u":"args(java.util.List)"},{"p":"com.google.adk.a2a.executor","c":"AgentExecutorConfig.OutputMode","l":"ARTIFACT_PER_EVENT","k":"0"},{"p":"com.google.adk.a2a.executor","c":"AgentExecutorConfig.OutputMode","l":"ARTIFACT_PER_RUN","k":"0"},{"p":"com.google.adk.web.controller","c":"ArtifactController","l":"ArtifactController(BaseArtifactService)","u":"%3Cinit%3E(com.google.adk.artifacts.BaseArtifactService)","k":"3"},{"p":"com.google.adk.events","c":"EventActions","l":"artifactDelta()"},{"p":"com.google.adk.events","c":"EventActions.Builder","l":"artifactDelta(Map)","u":"artifactDelta(java.util.Map)"},{"p":"com.google.adk.agents","c":"InvocationContext","l":"artifactService()"},{"p":"com.google.adk.runner","c":"Runner","l":"artifactService()"},{"p":"com.google.adk.web","c":"AdkWebServer","l":"artifactService()"},{"p":"com.google.adk.a2a.executor","c":"AgentExecutor.Builder","l":"artifactService(BaseArtifactService)","u":"artifactService(com.google.adk.artifacts.BaseArtifactService)"},{"p":"com.google.adk.agents","c":"InvocationContext.Builder","l":"artifactService(BaseArtifactService)","u":"artifactService(com.google.adk.artifacts.BaseArtifactService)"},{"p":"com.google.adk.runner","c":"Runner.Builder","l":"artifactService(BaseArtifactService)","u":"artifactService(com.google.adk.artifacts.BaseArtifactService)"},{"p":"com.google.adk.a2a.converters","c":"ResponseConverter","l":"artifactToEvent(Artifact, InvocationContext)","u":"artifactToEvent(io.a2a.spec.Artifact,com.google.adk.agents.InvocationContext)","k":"6"},{"p":"com.example.adktriaging","c":"AdkTriagingAgent","l":"assignGtechOwnerToIssue(int)","k":"6"},{"p":"com.example.github","c":"GitHubTools","l":"assignIssue(String, String, int, List)","u":"assignIssue(java.lang.String,java.lang.String,int,java.util.List)","k":"6"},{"p":"com.google.adk.planner.goap","c":"AStarSearchStrategy","l":"AStarSearchStrategy()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.plugins.agentanalytics","c":"TraceManager","l":"attachCurrentSpan(InvocationContext)","u":"attachCurrentSpan(com.google.adk.agents.InvocationContext)"},{"p":"com.google.adk.models.chat","c":"ChatCompletionsRequest","l":"audio","k":"1"},{"p":"com.google.adk.models.springai.error","c":"SpringAIErrorMapper.ErrorCategory","l":"AUTH_ERROR","k":"0"},{"p":"com.google.adk.events","c":"Event","l":"author()"},{"p":"com.google.adk.memory","c":"MemoryEntry","l":"author()"},{"p":"com.google.adk.memory","c":"MemoryEntry.Builder","l":"author(String)","u":"author(java.lang.String)"},{"p":"com.google.adk.events","c":"Event.Builder","l":"author(String)","u":"author(java.lang.String)"},{"p":"com.google.adk.agents","c":"RunConfig","l":"autoCreateSession()"},{"p":"com.google.adk.agents","c":"RunConfig.Builder","l":"autoCreateSession(boolean)"},{"p":"com.google.adk.flows.llmflows","c":"AutoFlow","l":"AutoFlow()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.flows.llmflows","c":"AutoFlow","l":"AutoFlow(Optional)","u":"%3Cinit%3E(java.util.Optional)","k":"3"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryLoggerConfig","l":"autoSchemaUpgrade()"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryLoggerConfig.Builder","l":"autoSchemaUpgrade(boolean)"},{"p":"com.google.adk.agents","c":"PlanningContext","l":"availableAgents()"},{"p":"com.google.adk.agents","c":"RunConfig","l":"avatarConfig()"},{"p":"com.google.adk.agents","c":"RunConfig.Builder","l":"avatarConfig(AvatarConfig)","u":"avatarConfig(com.google.genai.types.AvatarConfig)"},{"p":"com.google.adk.events","c":"Event","l":"avgLogprobs()"},{"p":"com.google.adk.models","c":"LlmResponse","l":"avgLogprobs()"},{"p":"com.google.adk.events","c":"Event.Builder","l":"avgLogprobs(Double)","u":"avgLogprobs(java.lang.Double)"},{"p":"com.google.adk.models","c":"LlmResponse.Builder","l":"avgLogprobs(Double)","u":"avgLogprobs(java.lang.Double)"},{"p":"com.google.adk.flows.llmflows","c":"PersistBarrier","l":"awaitPersisted(InvocationContext, List)","u":"awaitPersisted(com.google.adk.agents.InvocationContext,java.util.List)","k":"6"},{"p":"com.google.adk.utils","c":"AgentEnums.AgentOrigin","l":"BASE_AGENT","k":"0"},{"p":"com.google.adk.agents","c":"BaseAgent","l":"BaseAgent(String, String, List, List, List)","u":"%3Cinit%3E(java.lang.String,java.lang.String,java.util.List,java.util.List,java.util.List)","k":"3"},{"p":"com.google.adk.agents","c":"BaseAgentConfig","l":"BaseAgentConfig()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.agents","c":"BaseAgentConfig","l":"BaseAgentConfig(String)","u":"%3Cinit%3E(java.lang.String)","k":"3"},{"p":"com.google.adk.agents","c":"BaseAgentConfig","l":"BaseAgentConfig(String, String, String)","u":"%3Cinit%3E(java.lang.String,java.lang.String,java.lang.String)","k":"3"},{"p":"com.google.adk.codeexecutors","c":"BaseCodeExecutor","l":"BaseCodeExecutor()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.models","c":"BaseLlm","l":"BaseLlm(String)","u":"%3Cinit%3E(java.lang.String)","k":"3"},{"p":"com.google.adk.flows.llmflows","c":"BaseLlmFlow","l":"BaseLlmFlow(List, List)","u":"%3Cinit%3E(java.util.List,java.util.List)","k":"3"},{"p":"com.google.adk.flows.llmflows","c":"BaseLlmFlow","l":"BaseLlmFlow(List, List, Optional)","u":"%3Cinit%3E(java.util.List,java.util.List,java.util.Optional)","k":"3"},{"p":"com.google.adk.plugins","c":"BasePlugin","l":"BasePlugin(String)","u":"%3Cinit%3E(java.lang.String)","k":"3"},{"p":"com.google.adk.tools.retrieval","c":"BaseRetrievalTool","l":"BaseRetrievalTool(String, String)","u":"%3Cinit%3E(java.lang.String,java.lang.String)","k":"3"},{"p":"com.google.adk.tools.retrieval","c":"BaseRetrievalTool","l":"BaseRetrievalTool(String, String, boolean)","u":"%3Cinit%3E(java.lang.String,java.lang.String,boolean)","k":"3"},{"p":"com.google.adk.tools","c":"BaseTool","l":"BaseTool(String, String)","u":"%3Cinit%3E(java.lang.String,java.lang.String)","k":"3"},{"p":"com.google.adk.tools","c":"BaseTool","l":"BaseTool(String, String, boolean)","u":"%3Cinit%3E(java.lang.String,java.lang.String,boolean)","k":"3"},{"p":"com.google.adk.flows.llmflows","c":"Basic","l":"Basic()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryLoggerConfig","l":"batchFlushInterval()"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryLoggerConfig.Builder","l":"batchFlushInterval(Duration)","u":"batchFlushInterval(java.time.Duration)"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryLoggerConfig","l":"batchSize()"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryLoggerConfig.Builder","l":"batchSize(int)"},{"p":"com.example","c":"CoreCallbacks","l":"BEFORE_AGENT_CALLBACK","k":"2"},{"p":"com.example","c":"CoreCallbacks","l":"BEFORE_AGENT_CALLBACK1","k":"2"},{"p":"com.example","c":"CoreCallbacks","l":"BEFORE_AGENT_CALLBACK2","k":"2"},{"p":"com.example","c":"CoreCallbacks","l":"BEFORE_AGENT_CALLBACK3","k":"2"},{"p":"com.example","c":"CoreCallbacks","l":"BEFORE_MODEL_CALLBACK","k":"2"},{"p":"com.example","c":"CoreCallbacks","l":"BEFORE_TOOL_CALLBACK1","k":"2"},{"p":"com.example","c":"CoreCallbacks","l":"BEFORE_TOOL_CALLBACK2","k":"2"},{"p":"com.example","c":"CoreCallbacks","l":"BEFORE_TOOL_CALLBACK3","k":"2"},{"p":"com.google.adk.agents","c":"BaseAgent.Builder","l":"beforeAgentCallback","k":"1"},{"p":"com.google.adk.agents","c":"BaseAgent","l":"beforeAgentCallback()"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryAgentAnalyticsPlugin","l":"beforeAgentCallback(BaseAgent, CallbackContext)","u":"beforeAgentCallback(com.google.adk.agents.BaseAgent,com.google.adk.agents.CallbackContext)"},{"p":"com.google.adk.plugins","c":"LoggingPlugin","l":"beforeAgentCallback(BaseAgent, CallbackContext)","u":"beforeAgentCallback(com.google.adk.agents.BaseAgent,com.google.adk.agents.CallbackContext)"},{"p":"com.google.adk.plugins","c":"Plugin","l":"beforeAgentCallback(BaseAgent, CallbackContext)","u":"beforeAgentCallback(com.google.adk.agents.BaseAgent,com.google.adk.agents.CallbackContext)"},{"p":"com.google.adk.plugins","c":"PluginManager","l":"beforeAgentCallback(BaseAgent, CallbackContext)","u":"beforeAgentCallback(com.google.adk.agents.BaseAgent,com.google.adk.agents.CallbackContext)"},{"p":"com.google.adk.agents","c":"BaseAgent.Builder","l":"beforeAgentCallback(Callbacks.BeforeAgentCallback)","u":"beforeAgentCallback(com.google.adk.agents.Callbacks.BeforeAgentCallback)"},{"p":"com.google.adk.a2a.agent","c":"RemoteA2AAgent.Builder","l":"beforeAgentCallback(List)","u":"beforeAgentCallback(java.util.List)"},{"p":"com.google.adk.agents","c":"BaseAgent.Builder","l":"beforeAgentCallback(List)","u":"beforeAgentCallback(java.util.List)"},{"p":"com.google.adk.agents","c":"BaseAgentConfig","l":"beforeAgentCallbacks()"},{"p":"com.google.adk.agents","c":"LlmAgent.Builder","l":"beforeAgentCallbackSync(Callbacks.BeforeAgentCallbackSync)","u":"beforeAgentCallbackSync(com.google.adk.agents.Callbacks.BeforeAgentCallbackSync)"},{"p":"com.google.adk.a2a.executor","c":"AgentExecutorConfig","l":"beforeExecuteCallback()"},{"p":"com.google.adk.a2a.executor","c":"AgentExecutorConfig.Builder","l":"beforeExecuteCallback(Callbacks.BeforeExecuteCallback)","u":"beforeExecuteCallback(com.google.adk.a2a.executor.Callbacks.BeforeExecuteCallback)"},{"p":"com.google.adk.agents","c":"LlmAgent","l":"beforeModelCallback()"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryAgentAnalyticsPlugin","l":"beforeModelCallback(CallbackContext, LlmRequest.Builder)","u":"beforeModelCallback(com.google.adk.agents.CallbackContext,com.google.adk.models.LlmRequest.Builder)"},{"p":"com.google.adk.plugins","c":"ContextFilterPlugin","l":"beforeModelCallback(CallbackContext, LlmRequest.Builder)","u":"beforeModelCallback(com.google.adk.agents.CallbackContext,com.google.adk.models.LlmRequest.Builder)"},{"p":"com.google.adk.plugins","c":"GlobalInstructionPlugin","l":"beforeModelCallback(CallbackContext, LlmRequest.Builder)","u":"beforeModelCallback(com.google.adk.agents.CallbackContext,com.google.adk.models.LlmRequest.Builder)"},{"p":"com.google.adk.plugins","c":"LoggingPlugin","l":"beforeModelCallback(CallbackContext, LlmRequest.Builder)","u":"beforeModelCallback(com.google.adk.agents.CallbackContext,com.google.adk.models.LlmRequest.Builder)"},{"p":"com.google.adk.plugins","c":"Plugin","l":"beforeModelCallback(CallbackContext, LlmRequest.Builder)","u":"beforeModelCallback(com.google.adk.agents.CallbackContext,com.google.adk.models.LlmRequest.Builder)"},{"p":"com.google.adk.plugins","c":"PluginManager","l":"beforeModelCallback(CallbackContext, LlmRequest.Builder)","u":"beforeModelCallback(com.google.adk.agents.CallbackContext,com.google.adk.models.LlmRequest.Builder)"},{"p":"com.google.adk.plugins","c":"ReplayPlugin","l":"beforeModelCallback(CallbackContext, LlmRequest.Builder)","u":"beforeModelCallback(com.google.adk.agents.CallbackContext,com.google.adk.models.LlmRequest.Builder)"},{"p":"com.google.adk.agents","c":"LlmAgent.Builder","l":"beforeModelCallback(Callbacks.BeforeModelCallback)","u":"beforeModelCallback(com.google.adk.agents.Callbacks.BeforeModelCallback)"},{"p":"com.google.adk.agents","c":"LlmAgent.Builder","l":"beforeModelCallback(List)","u":"beforeModelCallback(java.util.List)"},{"p":"com.google.adk.agents","c":"LlmAgentConfig","l":"beforeModelCallbacks()"},{"p":"com.google.adk.agents","c":"LlmAgent.Builder","l":"beforeModelCallbackSync(Callbacks.BeforeModelCallbackSync)","u":"beforeModelCallbackSync(com.google.adk.agents.Callbacks.BeforeModelCallbackSync)"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryAgentAnalyticsPlugin","l":"beforeRunCallback(InvocationContext)","u":"beforeRunCallback(com.google.adk.agents.InvocationContext)"},{"p":"com.google.adk.plugins","c":"LoggingPlugin","l":"beforeRunCallback(InvocationContext)","u":"beforeRunCallback(com.google.adk.agents.InvocationContext)"},{"p":"com.google.adk.plugins","c":"Plugin","l":"beforeRunCallback(InvocationContext)","u":"beforeRunCallback(com.google.adk.agents.InvocationContext)"},{"p":"com.google.adk.plugins","c":"PluginManager","l":"beforeRunCallback(InvocationContext)","u":"beforeRunCallback(com.google.adk.agents.InvocationContext)"},{"p":"com.google.adk.plugins","c":"ReplayPlugin","l":"beforeRunCallback(InvocationContext)","u":"beforeRunCallback(com.google.adk.agents.InvocationContext)"},{"p":"com.google.adk.telemetry","c":"Instrumentation.ClosableTelemetryScope","l":"beforeSpanEnd()"},{"p":"com.google.adk.telemetry","c":"Instrumentation.ToolExecution","l":"beforeSpanEnd()"},{"p":"com.google.adk.agents","c":"LlmAgent","l":"beforeToolCallback()"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryAgentAnalyticsPlugin","l":"beforeToolCallback(BaseTool, Map, ToolContext)","u":"beforeToolCallback(com.google.adk.tools.BaseTool,java.util.Map,com.google.adk.tools.ToolContext)"},{"p":"com.google.adk.plugins","c":"LoggingPlugin","l":"beforeToolCallback(BaseTool, Map, ToolContext)","u":"beforeToolCallback(com.google.adk.tools.BaseTool,java.util.Map,com.google.adk.tools.ToolContext)"},{"p":"com.google.adk.plugins","c":"Plugin","l":"beforeToolCallback(BaseTool, Map, ToolContext)","u":"beforeToolCallback(com.google.adk.tools.BaseTool,java.util.Map,com.google.adk.tools.ToolContext)"},{"p":"com.google.adk.plugins","c":"PluginManager","l":"beforeToolCallback(BaseTool, Map, ToolContext)","u":"beforeToolCallback(com.google.adk.tools.BaseTool,java.util.Map,com.google.adk.tools.ToolContext)"},{"p":"com.google.adk.plugins","c":"ReplayPlugin","l":"beforeToolCallback(BaseTool, Map, ToolContext)","u":"beforeToolCallback(com.google.adk.tools.BaseTool,java.util.Map,com.google.adk.tools.ToolContext)"},{"p":"com.google.adk.agents","c":"LlmAgent.Builder","l":"beforeToolCallback(Callbacks.BeforeToolCallback)","u":"beforeToolCallback(com.google.adk.agents.Callbacks.BeforeToolCallback)"},{"p":"com.google.adk.agents","c":"LlmAgent.Builder","l":"beforeToolCallback(List)","u":"beforeToolCallback(java.util.List)"},{"p":"com.google.adk.agents","c":"LlmAgentConfig","l":"beforeToolCallbacks()"},{"p":"com.google.adk.agents","c":"LlmAgent.Builder","l":"beforeToolCallbackSync(Callbacks.BeforeToolCallbackSync)","u":"beforeToolCallbackSync(com.google.adk.agents.Callbacks.BeforeToolCallbackSync)"},{"p":"com.google.adk.agents","c":"RunConfig.StreamingMode","l":"BIDI","k":"0"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryAgentAnalyticsPlugin","l":"BigQueryAgentAnalyticsPlugin(BigQueryLoggerConfig)","u":"%3Cinit%3E(com.google.adk.plugins.agentanalytics.BigQueryLoggerConfig)","k":"3"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryAgentAnalyticsPlugin","l":"BigQueryAgentAnalyticsPlugin(BigQueryLoggerConfig, BigQuery)","u":"%3Cinit%3E(com.google.adk.plugins.agentanalytics.BigQueryLoggerConfig,com.google.cloud.bigquery.BigQuery)","k":"3"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryLoggerConfig","l":"BigQueryLoggerConfig()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.agents","c":"LiveRequest","l":"blob()"},{"p":"com.google.adk.agents","c":"LiveRequest.Builder","l":"blob(Blob)","u":"blob(com.google.genai.types.Blob)"},{"p":"com.example.adkspam","c":"Settings","l":"botAlertSignature()","k":"6"},{"p":"com.example.adkspam","c":"Settings","l":"botName()","k":"6"},{"p":"com.google.adk.agents","c":"InvocationContext","l":"branch()"},{"p":"com.google.adk.agents","c":"ReadonlyContext","l":"branch()"},{"p":"com.google.adk.events","c":"Event","l":"branch()"},{"p":"com.google.adk.agents","c":"InvocationContext","l":"branch(String)","u":"branch(java.lang.String)"},{"p":"com.google.adk.agents","c":"InvocationContext.Builder","l":"branch(String)","u":"branch(java.lang.String)"},{"p":"com.google.adk.events","c":"Event","l":"branch(String)","u":"branch(java.lang.String)"},{"p":"com.google.adk.events","c":"Event.Builder","l":"branch(String)","u":"branch(java.lang.String)"},{"p":"com.google.adk.a2a.agent","c":"RemoteA2AAgent.Builder","l":"build()"},{"p":"com.google.adk.a2a.executor","c":"AgentExecutor.Builder","l":"build()"},{"p":"com.google.adk.a2a.executor","c":"AgentExecutorConfig.Builder","l":"build()"},{"p":"com.google.adk.agents","c":"BaseAgent.Builder","l":"build()"},{"p":"com.google.adk.agents","c":"InvocationContext.Builder","l":"build()"},{"p":"com.google.adk.agents","c":"LiveRequest.Builder","l":"build()"},{"p":"com.google.adk.agents","c":"LlmAgent.Builder","l":"build()"},{"p":"com.google.adk.agents","c":"LoopAgent.Builder","l":"build()"},{"p":"com.google.adk.agents","c":"ParallelAgent.Builder","l":"build()"},{"p":"com.google.adk.agents","c":"PlannerAgent.Builder","l":"build()"},{"p":"com.google.adk.agents","c":"RunConfig.Builder","l":"build()"},{"p":"com.google.adk.agents","c":"SequentialAgent.Builder","l":"build()"},{"p":"com.google.adk.apps","c":"App.Builder","l":"build()"},{"p":"com.google.adk.apps","c":"ResumabilityConfig.Builder","l":"build()"},{"p":"com.google.adk.artifacts","c":"ListArtifactsResponse.Builder","l":"build()"},{"p":"com.google.adk.artifacts","c":"ListArtifactVersionsResponse.Builder","l":"build()"},{"p":"com.google.adk.codeexecutors","c":"CodeExecutionUtils.CodeExecutionInput.Builder","l":"build()"},{"p":"com.google.adk.codeexecutors","c":"CodeExecutionUtils.CodeExecutionResult.Builder","l":"build()"},{"p":"com.google.adk.codeexecutors","c":"CodeExecutionUtils.File.Builder","l":"build()"},{"p":"com.google.adk.events","c":"Event.Builder","l":"build()"},{"p":"com.google.adk.events","c":"EventActions.Builder","l":"build()"},{"p":"com.google.adk.events","c":"EventCompaction.Builder","l":"build()"},{"p":"com.google.adk.events","c":"ToolConfirmation.Builder","l":"build()"},{"p":"com.google.adk.examples","c":"Example.Builder","l":"build()"},{"p":"com.google.adk.memory","c":"MemoryEntry.Builder","l":"build()"},{"p":"com.google.adk.memory","c":"SearchMemoryResponse.Builder","l":"build()"},{"p":"com.google.adk.models","c":"ApigeeLlm.Builder","l":"build()"},{"p":"com.google.adk.models","c":"Gemini.Builder","l":"build()"},{"p":"com.google.adk.models.langchain4j","c":"LangChain4j.Builder","l":"build()"},{"p":"com.google.adk.models","c":"LlmRequest.Builder","l":"build()"},{"p":"com.google.adk.models","c":"LlmResponse.Builder","l":"build()"},{"p":"com.google.adk.models","c":"Model.Builder","l":"build()"},{"p":"com.google.adk.models","c":"VertexCredentials.Builder","l":"build()"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryLoggerConfig.Builder","l":"build()"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryLoggerConfig.RetryConfig.Builder","l":"build()"},{"p":"com.google.adk.plugins","c":"ContextFilterPlugin.Builder","l":"build()"},{"p":"com.google.adk.plugins.recordings","c":"LlmRecording.Builder","l":"build()"},{"p":"com.google.adk.plugins.recordings","c":"Recording.Builder","l":"build()"},{"p":"com.google.adk.plugins.recordings","c":"Recordings.Builder","l":"build()"},{"p":"com.google.adk.plugins.recordings","c":"ToolRecording.Builder","l":"build()"},{"p":"com.google.adk.runner","c":"Runner.Builder","l":"build()"},{"p":"com.google.adk.sessions","c":"GetSessionConfig.Builder","l":"build()"},{"p":"com.google.adk.sessions","c":"ListEventsResponse.Builder","l":"build()"},{"p":"com.google.adk.sessions","c":"ListSessionsResponse.Builder","l":"build()"},{"p":"com.google.adk.sessions","c":"Session.Builder","l":"build()"},{"p":"com.google.adk.skills","c":"Frontmatter.Builder","l":"build()"},{"p":"com.google.adk.skills","c":"InMemorySkillSource.Builder","l":"build()"},{"p":"com.google.adk.skills","c":"InMemorySkillSource.Builder.SkillBuilder","l":"build()"},{"p":"com.google.adk.summarizer","c":"EventsCompactionConfig.Builder","l":"build()"},{"p":"com.google.adk.tools.computeruse","c":"ComputerState.Builder","l":"build()"},{"p":"com.google.adk.tools","c":"ExampleTool.Builder","l":"build()"},{"p":"com.google.adk.tools.mcp","c":"McpAsyncToolset.Builder","l":"build()"},{"p":"com.google.adk.tools.mcp","c":"SseServerParameters.Builder","l":"build()"},{"p":"com.google.adk.tools.mcp","c":"StdioConnectionParameters.Builder","l":"build()"},{"p":"com.google.adk.tools.mcp","c":"StdioServerParameters.Builder","l":"build()"},{"p":"com.google.adk.tools.mcp","c":"StreamableHttpServerParameters.Builder","l":"build()"},{"p":"com.google.adk.tools","c":"ToolContext.Builder","l":"build()"},{"p":"com.google.adk.tools","c":"VertexAiSearchTool.Builder","l":"build()"},{"p":"com.google.adk.web.service","c":"ApiServerSpanExporterConfig.Builder","l":"build()"},{"p":"com.google.adk.tools.mcp","c":"DefaultMcpTransportBuilder","l":"build(Object)","u":"build(java.lang.Object)"},{"p":"com.google.adk.tools.mcp","c":"McpTransportBuilder","l":"build(Object)","u":"build(java.lang.Object)"},{"p":"com.google.adk.codeexecutors","c":"CodeExecutionUtils","l":"buildCodeExecutionResultPart(CodeExecutionUtils.CodeExecutionResult)","u":"buildCodeExecutionResultPart(com.google.adk.codeexecutors.CodeExecutionUtils.CodeExecutionResult)","k":"6"},{"p":"com.google.adk.a2a.agent","c":"RemoteA2AAgent","l":"builder()","k":"6"},{"p":"com.google.adk.a2a.executor","c":"AgentExecutorConfig","l":"builder()","k":"6"},{"p":"com.google.adk.agents","c":"InvocationContext","l":"builder()","k":"6"},{"p":"com.google.adk.agents","c":"LiveRequest","l":"builder()","k":"6"},{"p":"com.google.adk.agents","c":"LlmAgent","l":"builder()","k":"6"},{"p":"com.google.adk.agents","c":"LoopAgent","l":"builder()","k":"6"},{"p":"com.google.adk.agents","c":"ParallelAgent","l":"builder()","k":"6"},{"p":"com.google.adk.agents","c":"PlannerAgent","l":"builder()","k":"6"},{"p":"com.google.adk.agents","c":"RunConfig","l":"builder()","k":"6"},{"p":"com.google.adk.agents","c":"SequentialAgent","l":"builder()","k":"6"},{"p":"com.google.adk.apps","c":"App","l":"builder()","k":"6"},{"p":"com.google.adk.apps","c":"ResumabilityConfig","l":"builder()","k":"6"},{"p":"com.google.adk.artifacts","c":"ListArtifactsResponse","l":"builder()","k":"6"},{"p":"com.google.adk.artifacts","c":"ListArtifactVersionsResponse","l":"builder()","k":"6"},{"p":"com.google.adk.codeexecutors","c":"CodeExecutionUtils.CodeExecutionInput","l":"builder()","k":"6"},{"p":"com.google.adk.codeexecutors","c":"CodeExecutionUtils.CodeExecutionResult","l":"builder()","k":"6"},{"p":"com.google.adk.codeexecutors","c":"CodeExecutionUtils.File","l":"builder()","k":"6"},{"p":"com.google.adk.events","c":"Event","l":"builder()","k":"6"},{"p":"com.google.adk.events","c":"EventActions","l":"builder()","k":"6"},{"p":"com.google.adk.events","c":"EventCompaction","l":"builder()","k":"6"},{"p":"com.google.adk.events","c":"ToolConfirmation","l":"builder()","k":"6"},{"p":"com.google.adk.examples","c":"Example","l":"builder()","k":"6"},{"p":"com.google.adk.memory","c":"MemoryEntry","l":"builder()","k":"6"},{"p":"com.google.adk.memory","c":"SearchMemoryResponse","l":"builder()","k":"6"},{"p":"com.google.adk.models","c":"ApigeeLlm","l":"builder()","k":"6"},{"p":"com.google.adk.models","c":"Gemini","l":"builder()","k":"6"},{"p":"com.google.adk.models.langchain4j","c":"LangChain4j","l":"builder()","k":"6"},{"p":"com.google.adk.models","c":"LlmRequest","l":"builder()","k":"6"},{"p":"com.google.adk.models","c":"LlmResponse","l":"builder()","k":"6"},{"p":"com.google.adk.models","c":"Model","l":"builder()","k":"6"},{"p":"com.google.adk.models","c":"VertexCredentials","l":"builder()","k":"6"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryLoggerConfig","l":"builder()","k":"6"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryLoggerConfig.RetryConfig","l":"builder()","k":"6"},{"p":"com.google.adk.plugins","c":"ContextFilterPlugin","l":"builder()","k":"6"},{"p":"com.google.adk.plugins.recordings","c":"LlmRecording","l":"builder()","k":"6"},{"p":"com.google.adk.plugins.recordings","c":"Recording","l":"builder()","k":"6"},{"p":"com.google.adk.plugins.recordings","c":"Recordings","l":"builder()","k":"6"},{"p":"com.google.adk.plugins.recordings","c":"ToolRecording","l":"builder()","k":"6"},{"p":"com.google.adk.runner","c":"Runner","l":"builder()","k":"6"},{"p":"com.google.adk.sessions","c":"GetSessionConfig","l":"builder()","k":"6"},{"p":"com.google.adk.sessions","c":"ListEventsResponse","l":"builder()","k":"6"},{"p":"com.google.adk.sessions","c":"ListSessionsResponse","l":"builder()","k":"6"},{"p":"com.google.adk.skills","c":"Frontmatter","l":"builder()","k":"6"},{"p":"com.google.adk.skills","c":"InMemorySkillSource","l":"builder()","k":"6"},{"p":"com.google.adk.summarizer","c":"EventsCompactionConfig","l":"builder()","k":"6"},{"p":"com.google.adk.tools.computeruse","c":"ComputerState","l":"builder()","k":"6"},{"p":"com.google.adk.tools","c":"ExampleTool","l":"builder()","k":"6"},{"p":"com.google.adk.tools.mcp","c":"McpAsyncToolset","l":"builder()","k":"6"},{"p":"com.google.adk.tools.mcp","c":"SseServerParameters","l":"builder()","k":"6"},{"p":"com.google.adk.tools.mcp","c":"StdioConnectionParameters","l":"builder()","k":"6"},{"p":"com.google.adk.tools.mcp","c":"StdioServerParameters","l":"builder()","k":"6"},{"p":"com.google.adk.tools.mcp","c":"StreamableHttpServerParameters","l":"builder()","k":"6"},{"p":"com.google.adk.tools","c":"VertexAiSearchTool","l":"builder()","k":"6"},{"p":"com.google.adk.web.service","c":"ApiServerSpanExporterConfig","l":"builder()","k":"6"},{"p":"com.google.adk.a2a.agent","c":"RemoteA2AAgent.Builder","l":"Builder()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.a2a.executor","c":"AgentExecutor.Builder","l":"Builder()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.a2a.executor","c":"AgentExecutorConfig.Builder","l":"Builder()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.agents","c":"BaseAgent.Builder","l":"Builder()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.agents","c":"LiveRequest.Builder","l":"Builder()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.agents","c":"LlmAgent.Builder","l":"Builder()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.agents","c":"LoopAgent.Builder","l":"Builder()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.agents","c":"ParallelAgent.Builder","l":"Builder()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.agents","c":"PlannerAgent.Builder","l":"Builder()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.agents","c":"RunConfig.Builder","l":"Builder()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.agents","c":"SequentialAgent.Builder","l":"Builder()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.apps","c":"App.Builder","l":"Builder()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.apps","c":"ResumabilityConfig.Builder","l":"Builder()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.artifacts","c":"ListArtifactsResponse.Builder","l":"Builder()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.artifacts","c":"ListArtifactVersionsResponse.Builder","l":"Builder()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.codeexecutors","c":"CodeExecutionUtils.CodeExecutionInput.Builder","l":"Builder()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.codeexecutors","c":"CodeExecutionUtils.CodeExecutionResult.Builder","l":"Builder()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.codeexecutors","c":"CodeExecutionUtils.File.Builder","l":"Builder()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.events","c":"Event.Builder","l":"Builder()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.events","c":"EventActions.Builder","l":"Builder()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.events","c":"EventCompaction.Builder","l":"Builder()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.events","c":"ToolConfirmation.Builder","l":"Builder()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.examples","c":"Example.Builder","l":"Builder()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.memory","c":"MemoryEntry.Builder","l":"Builder()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.memory","c":"SearchMemoryResponse.Builder","l":"Builder()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.models","c":"ApigeeLlm.Builder","l":"Builder()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.models.langchain4j","c":"LangChain4j.Builder","l":"Builder()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.models","c":"LlmRequest.Builder","l":"Builder()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.models","c":"LlmResponse.Builder","l":"Builder()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.models","c":"Model.Builder","l":"Builder()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.models","c":"VertexCredentials.Builder","l":"Builder()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryLoggerConfig.Builder","l":"Builder()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryLoggerConfig.RetryConfig.Builder","l":"Builder()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.plugins","c":"ContextFilterPlugin.Builder","l":"Builder()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.plugins.recordings","c":"LlmRecording.Builder","l":"Builder()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.plugins.recordings","c":"Recording.Builder","l":"Builder()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.plugins.recordings","c":"Recordings.Builder","l":"Builder()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.plugins.recordings","c":"ToolRecording.Builder","l":"Builder()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.runner","c":"Runner.Builder","l":"Builder()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.sessions","c":"GetSessionConfig.Builder","l":"Builder()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.sessions","c":"ListEventsResponse.Builder","l":"Builder()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.sessions","c":"ListSessionsResponse.Builder","l":"Builder()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.skills","c":"Frontmatter.Builder","l":"Builder()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.skills","c":"InMemorySkillSource.Builder","l":"Builder()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.summarizer","c":"EventsCompactionConfig.Builder","l":"Builder()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.tools.computeruse","c":"ComputerState.Builder","l":"Builder()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.tools","c":"ExampleTool.Builder","l":"Builder()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.tools.mcp","c":"McpAsyncToolset.Builder","l":"Builder()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.tools.mcp","c":"SseServerParameters.Builder","l":"Builder()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.tools.mcp","c":"StdioConnectionParameters.Builder","l":"Builder()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.tools.mcp","c":"StdioServerParameters.Builder","l":"Builder()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.tools.mcp","c":"StreamableHttpServerParameters.Builder","l":"Builder()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.tools","c":"VertexAiSearchTool.Builder","l":"Builder()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.web.service","c":"ApiServerSpanExporterConfig.Builder","l":"Builder()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.tools","c":"ToolContext","l":"builder(InvocationContext)","u":"builder(com.google.adk.agents.InvocationContext)","k":"6"},{"p":"com.google.adk.agents","c":"RunConfig","l":"builder(RunConfig)","u":"builder(com.google.adk.agents.RunConfig)","k":"6"},{"p":"com.google.adk.sessions","c":"Session","l":"builder(SessionKey)","u":"builder(com.google.adk.sessions.SessionKey)","k":"6"},{"p":"com.google.adk.sessions","c":"Session.Builder","l":"Builder(SessionKey)","u":"%3Cinit%3E(com.google.adk.sessions.SessionKey)","k":"3"},{"p":"com.google.adk.sessions","c":"Session","l":"builder(String)","u":"builder(java.lang.String)","k":"6"},{"p":"com.google.adk.sessions","c":"Session.Builder","l":"Builder(String)","u":"%3Cinit%3E(java.lang.String)","k":"3"},{"p":"com.google.adk.examples","c":"ExampleUtils","l":"buildExampleSi(BaseExampleProvider, String)","u":"buildExampleSi(com.google.adk.examples.BaseExampleProvider,java.lang.String)","k":"6"},{"p":"com.google.adk.codeexecutors","c":"CodeExecutionUtils","l":"buildExecutableCodePart(String)","u":"buildExecutableCodePart(java.lang.String)","k":"6"},{"p":"com.google.adk.tools","c":"FunctionCallingUtils","l":"buildFunctionDeclaration(Method, List)","u":"buildFunctionDeclaration(java.lang.reflect.Method,java.util.List)","k":"6"},{"p":"com.google.adk.tools","c":"FunctionCallingUtils","l":"buildSchemaFromType(Type)","u":"buildSchemaFromType(java.lang.reflect.Type)","k":"6"},{"p":"com.google.adk.tools","c":"FunctionCallingUtils","l":"buildSchemaFromType(Type, ObjectMapper)","u":"buildSchemaFromType(java.lang.reflect.Type,com.fasterxml.jackson.databind.ObjectMapper)","k":"6"},{"p":"com.google.adk.tools","c":"BuiltInCodeExecutionTool","l":"BuiltInCodeExecutionTool()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.codeexecutors","c":"BuiltInCodeExecutor","l":"BuiltInCodeExecutor()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.models.springai","c":"EmbeddingConverter","l":"calculateSimilarities(float[], List)","u":"calculateSimilarities(float[],java.util.List)","k":"6"},{"p":"com.google.adk.agents","c":"Callbacks.AfterAgentCallback","l":"call(CallbackContext)","u":"call(com.google.adk.agents.CallbackContext)"},{"p":"com.google.adk.agents","c":"Callbacks.AfterAgentCallbackSync","l":"call(CallbackContext)","u":"call(com.google.adk.agents.CallbackContext)"},{"p":"com.google.adk.agents","c":"Callbacks.BeforeAgentCallback","l":"call(CallbackContext)","u":"call(com.google.adk.agents.CallbackContext)"},{"p":"com.google.adk.agents","c":"Callbacks.BeforeAgentCallbackSync","l":"call(CallbackContext)","u":"call(com.google.adk.agents.CallbackContext)"},{"p":"com.google.adk.agents","c":"Callbacks.OnModelErrorCallback","l":"call(CallbackContext, LlmRequest, Exception)","u":"call(com.google.adk.agents.CallbackContext,com.google.adk.models.LlmRequest,java.lang.Exception)"},{"p":"com.google.adk.agents","c":"Callbacks.OnModelErrorCallbackSync","l":"call(CallbackContext, LlmRequest, Exception)","u":"call(com.google.adk.agents.CallbackContext,com.google.adk.models.LlmRequest,java.lang.Exception)"},{"p":"com.google.adk.agents","c":"Callbacks.BeforeModelCallback","l":"call(CallbackContext, LlmRequest.Builder)","u":"call(com.google.adk.agents.CallbackContext,com.google.adk.models.LlmRequest.Builder)"},{"p":"com.google.adk.agents","c":"Callbacks.BeforeModelCallbackSync","l":"call(CallbackContext, LlmRequest.Builder)","u":"call(com.google.adk.agents.CallbackContext,com.google.adk.models.LlmRequest.Builder)"},{"p":"com.google.adk.agents","c":"Callbacks.AfterModelCallback","l":"call(CallbackContext, LlmResponse)","u":"call(com.google.adk.agents.CallbackContext,com.google.adk.models.LlmResponse)"},{"p":"com.google.adk.agents","c":"Callbacks.AfterModelCallbackSync","l":"call(CallbackContext, LlmResponse)","u":"call(com.google.adk.agents.CallbackContext,com.google.adk.models.LlmResponse)"},{"p":"com.google.adk.agents","c":"Callbacks.BeforeToolCallback","l":"call(InvocationContext, BaseTool, Map, ToolContext)","u":"call(com.google.adk.agents.InvocationContext,com.google.adk.tools.BaseTool,java.util.Map,com.google.adk.tools.ToolContext)"},{"p":"com.google.adk.agents","c":"Callbacks.BeforeToolCallbackSync","l":"call(InvocationContext, BaseTool, Map, ToolContext)","u":"call(com.google.adk.agents.InvocationContext,com.google.adk.tools.BaseTool,java.util.Map,com.google.adk.tools.ToolContext)"},{"p":"com.google.adk.agents","c":"Callbacks.OnToolErrorCallback","l":"call(InvocationContext, BaseTool, Map, ToolContext, Exception)","u":"call(com.google.adk.agents.InvocationContext,com.google.adk.tools.BaseTool,java.util.Map,com.google.adk.tools.ToolContext,java.lang.Exception)"},{"p":"com.google.adk.agents","c":"Callbacks.OnToolErrorCallbackSync","l":"call(InvocationContext, BaseTool, Map, ToolContext, Exception)","u":"call(com.google.adk.agents.InvocationContext,com.google.adk.tools.BaseTool,java.util.Map,com.google.adk.tools.ToolContext,java.lang.Exception)"},{"p":"com.google.adk.agents","c":"Callbacks.AfterToolCallback","l":"call(InvocationContext, BaseTool, Map, ToolContext, Object)","u":"call(com.google.adk.agents.InvocationContext,com.google.adk.tools.BaseTool,java.util.Map,com.google.adk.tools.ToolContext,java.lang.Object)"},{"p":"com.google.adk.agents","c":"Callbacks.AfterToolCallbackSync","l":"call(InvocationContext, BaseTool, Map, ToolContext, Object)","u":"call(com.google.adk.agents.InvocationContext,com.google.adk.tools.BaseTool,java.util.Map,com.google.adk.tools.ToolContext,java.lang.Object)"},{"p":"com.google.adk.a2a.executor","c":"Callbacks.BeforeExecuteCallback","l":"call(RequestContext)","u":"call(io.a2a.server.agentexecution.RequestContext)"},{"p":"com.google.adk.a2a.executor","c":"Callbacks.AfterEventCallback","l":"call(RequestContext, TaskArtifactUpdateEvent, Event)","u":"call(io.a2a.server.agentexecution.RequestContext,io.a2a.spec.TaskArtifactUpdateEvent,com.google.adk.events.Event)"},{"p":"com.google.adk.a2a.executor","c":"Callbacks.AfterExecuteCallback","l":"call(RequestContext, TaskStatusUpdateEvent)","u":"call(io.a2a.server.agentexecution.RequestContext,io.a2a.spec.TaskStatusUpdateEvent)"},{"p":"com.google.adk.agents","c":"CallbackContext","l":"CallbackContext(InvocationContext, EventActions)","u":"%3Cinit%3E(com.google.adk.agents.InvocationContext,com.google.adk.events.EventActions)","k":"3"},{"p":"com.google.adk.agents","c":"CallbackContext","l":"CallbackContext(InvocationContext, EventActions, String)","u":"%3Cinit%3E(com.google.adk.agents.InvocationContext,com.google.adk.events.EventActions,java.lang.String)","k":"3"},{"p":"com.google.adk.agents","c":"InvocationContext","l":"callbackContextData()"},{"p":"com.google.adk.agents","c":"InvocationContext.Builder","l":"callbackContextData(Map)","u":"callbackContextData(java.util.Map)"},{"p":"com.google.adk.agents","c":"BaseAgentConfig.CallbackRef","l":"CallbackRef()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.agents","c":"BaseAgentConfig.CallbackRef","l":"CallbackRef(String)","u":"%3Cinit%3E(java.lang.String)","k":"3"},{"p":"com.google.adk.tools","c":"FunctionTool","l":"callLive(Map, ToolContext, InvocationContext)","u":"callLive(java.util.Map,com.google.adk.tools.ToolContext,com.google.adk.agents.InvocationContext)"},{"p":"com.google.adk.a2a.executor","c":"AgentExecutor","l":"cancel(RequestContext, EventQueue)","u":"cancel(io.a2a.server.agentexecution.RequestContext,io.a2a.server.events.EventQueue)"},{"p":"com.google.adk.agents","c":"BaseAgent","l":"canonicalAfterAgentCallbacks()"},{"p":"com.google.adk.agents","c":"LlmAgent","l":"canonicalAfterModelCallbacks()"},{"p":"com.google.adk.agents","c":"LlmAgent","l":"canonicalAfterToolCallbacks()"},{"p":"com.google.adk.agents","c":"BaseAgent","l":"canonicalBeforeAgentCallbacks()"},{"p":"com.google.adk.agents","c":"LlmAgent","l":"canonicalBeforeModelCallbacks()"},{"p":"com.google.adk.agents","c":"LlmAgent","l":"canonicalBeforeToolCallbacks()"},{"p":"com.google.adk.agents","c":"LlmAgent","l":"canonicalGlobalInstruction(ReadonlyContext)","u":"canonicalGlobalInstruction(com.google.adk.agents.ReadonlyContext)"},{"p":"com.google.adk.agents","c":"LlmAgent","l":"canonicalInstruction(ReadonlyContext)","u":"canonicalInstruction(com.google.adk.agents.ReadonlyContext)"},{"p":"com.google.adk.agents","c":"LlmAgent","l":"canonicalOnModelErrorCallbacks()"},{"p":"com.google.adk.agents","c":"LlmAgent","l":"canonicalOnToolErrorCallbacks()"},{"p":"com.google.adk.agents","c":"LlmAgent","l":"canonicalTools()"},{"p":"com.google.adk.agents","c":"LlmAgent","l":"canonicalTools(ReadonlyContext)","u":"canonicalTools(com.google.adk.agents.ReadonlyContext)"},{"p":"com.google.adk.utils","c":"ModelNameUtils","l":"canUseOutputSchemaWithTools(String)","u":"canUseOutputSchemaWithTools(java.lang.String)","k":"6"},{"p":"com.google.adk.telemetry","c":"Instrumentation.ClosableTelemetryScope","l":"caughtError","k":"1"},{"p":"com.google.adk.models","c":"ApigeeLlm.ApiType","l":"CHAT_COMPLETIONS","k":"0"},{"p":"com.google.adk.models.chat","c":"ChatCompletionsHttpClient","l":"ChatCompletionsHttpClient(HttpOptions)","u":"%3Cinit%3E(com.google.genai.types.HttpOptions)","k":"3"},{"p":"com.google.adk.models.chat","c":"ChatCompletionsHttpClient","l":"ChatCompletionsHttpClient(HttpOptions, ExecutorService)","u":"%3Cinit%3E(com.google.genai.types.HttpOptions,java.util.concurrent.ExecutorService)","k":"3"},{"p":"com.google.adk.models.chat","c":"ChatCompletionsRequest","l":"ChatCompletionsRequest()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.models.langchain4j","c":"LangChain4j","l":"chatModel()"},{"p":"com.google.adk.models.langchain4j","c":"LangChain4j.Builder","l":"chatModel(ChatModel)","u":"chatModel(dev.langchain4j.model.chat.ChatModel)"},{"p":"com.example","c":"CustomDieTool","l":"CHECK_PRIME_INSTANCE","k":"2"},{"p":"com.example","c":"CustomDieTool","l":"checkPrime(List)","u":"checkPrime(java.util.List)","k":"6"},{"p":"com.example.helloworld","c":"HelloWorldAgent","l":"checkPrime(List)","u":"checkPrime(java.util.List)","k":"6"},{"p":"com.google.adk.samples.a2aagent.agent","c":"Agent","l":"checkPrime(List)","u":"checkPrime(java.util.List)","k":"6"},{"p":"com.google.adk.tutorials","c":"CityTimeWeather","l":"CityTimeWeather()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.skills","c":"ClassPathSkillSource","l":"ClassPathSkillSource(String)","u":"%3Cinit%3E(java.lang.String)","k":"3"},{"p":"com.google.adk.skills","c":"ClassPathSkillSource","l":"ClassPathSkillSource(String, ClassLoader)","u":"%3Cinit%3E(java.lang.String,java.lang.ClassLoader)","k":"3"},{"p":"com.google.adk.models","c":"Claude","l":"Claude(String, AnthropicClient)","u":"%3Cinit%3E(java.lang.String,com.anthropic.client.AnthropicClient)","k":"3"},{"p":"com.google.adk.models","c":"Claude","l":"Claude(String, AnthropicClient, int)","u":"%3Cinit%3E(java.lang.String,com.anthropic.client.AnthropicClient,int)","k":"3"},{"p":"com.google.adk.sessions","c":"State","l":"clear()"},{"p":"com.google.adk.agents","c":"LlmAgent.Builder","l":"clearBeforeModelCallbacks()"},{"p":"com.google.adk.codeexecutors","c":"CodeExecutorContext","l":"clearInputFiles()"},{"p":"com.google.adk.plugins.agentanalytics","c":"TraceManager","l":"clearStack()"},{"p":"com.google.adk.tools.computeruse","c":"BaseComputer","l":"clickAt(int, int)","u":"clickAt(int,int)"},{"p":"com.google.adk.models.springai.error","c":"SpringAIErrorMapper.ErrorCategory","l":"CLIENT_ERROR","k":"0"},{"p":"com.google.adk.a2a.converters","c":"ResponseConverter","l":"clientEventToEvent(ClientEvent, InvocationContext)","u":"clientEventToEvent(io.a2a.client.ClientEvent,com.google.adk.agents.InvocationContext)","k":"6"},{"p":"com.google.adk.agents","c":"BaseAgent","l":"close()"},{"p":"com.google.adk.agents","c":"LiveRequest","l":"close()"},{"p":"com.google.adk.agents","c":"LiveRequestQueue","l":"close()"},{"p":"com.google.adk.agents","c":"LlmAgent","l":"close()"},{"p":"com.google.adk.flows.llmflows.audio","c":"SpeechClientInterface","l":"close()"},{"p":"com.google.adk.flows.llmflows.audio","c":"VertexSpeechClient","l":"close()"},{"p":"com.google.adk.models","c":"BaseLlmConnection","l":"close()"},{"p":"com.google.adk.models","c":"GeminiLlmConnection","l":"close()"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryAgentAnalyticsPlugin","l":"close()"},{"p":"com.google.adk.plugins","c":"Plugin","l":"close()"},{"p":"com.google.adk.plugins","c":"PluginManager","l":"close()"},{"p":"com.google.adk.runner","c":"Runner","l":"close()"},{"p":"com.google.adk.sessions","c":"ApiResponse","l":"close()"},{"p":"com.google.adk.sessions","c":"HttpApiResponse","l":"close()"},{"p":"com.google.adk.telemetry","c":"Instrumentation.ClosableTelemetryScope","l":"close()"},{"p":"com.google.adk.tools.applicationintegrationtoolset","c":"ApplicationIntegrationToolset","l":"close()"},{"p":"com.google.adk.tools","c":"BaseToolset","l":"close()"},{"p":"com.google.adk.tools.computeruse","c":"BaseComputer","l":"close()"},{"p":"com.google.adk.tools.computeruse","c":"ComputerUseToolset","l":"close()"},{"p":"com.google.adk.tools.mcp","c":"McpAsyncToolset","l":"close()"},{"p":"com.google.adk.tools.mcp","c":"McpToolset","l":"close()"},{"p":"com.google.adk.tools.skills","c":"SkillToolset","l":"close()"},{"p":"com.google.adk.agents","c":"LiveRequest.Builder","l":"close(Boolean)","u":"close(java.lang.Boolean)"},{"p":"com.google.adk.models","c":"BaseLlmConnection","l":"close(Throwable)","u":"close(java.lang.Throwable)"},{"p":"com.google.adk.models","c":"GeminiLlmConnection","l":"close(Throwable)","u":"close(java.lang.Throwable)"},{"p":"com.example.adkstale","c":"AdkStaleAgent","l":"closeAsStale(int)","k":"6"},{"p":"com.google.adk.telemetry","c":"Instrumentation.ClosableTelemetryScope","l":"closed","k":"1"},{"p":"com.example.adkstale","c":"Settings","l":"closeHoursAfterStaleThreshold()","k":"6"},{"p":"com.example.github","c":"GitHubTools","l":"closeIssue(String, String, int)","u":"closeIssue(java.lang.String,java.lang.String,int)","k":"6"},{"p":"com.google.adk.sessions","c":"BaseSessionService","l":"closeSession(Session)","u":"closeSession(com.google.adk.sessions.Session)"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryLoggerConfig","l":"clusteringFields()"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryLoggerConfig.Builder","l":"clusteringFields(List)","u":"clusteringFields(java.util.List)"},{"p":"com.google.adk.a2a.converters","c":"A2ADataPartMetadataType","l":"CODE_EXECUTION_RESULT","k":"0"},{"p":"com.google.adk.a2a.converters","c":"PartConverter","l":"CODE_KEY","k":"2"},{"p":"com.google.adk.agents","c":"BaseAgentConfig.AgentRefConfig","l":"code()"},{"p":"com.google.adk.codeexecutors","c":"CodeExecutionUtils.CodeExecutionInput","l":"code()"},{"p":"com.google.adk.codeexecutors","c":"CodeExecutionUtils.CodeExecutionInput.Builder","l":"code(String)","u":"code(java.lang.String)"},{"p":"com.google.adk.codeexecutors","c":"BaseCodeExecutor","l":"codeBlockDelimiters()"},{"p":"com.google.adk.codeexecutors","c":"CodeExecutionUtils.CodeExecutionInput","l":"CodeExecutionInput()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.codeexecutors","c":"CodeExecutionUtils.CodeExecutionResult","l":"CodeExecutionResult()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.agents","c":"LlmAgent","l":"codeExecutor()"},{"p":"com.google.adk.agents","c":"LlmAgent.Builder","l":"codeExecutor(BaseCodeExecutor)","u":"codeExecutor(com.google.adk.codeexecutors.BaseCodeExecutor)"},{"p":"com.google.adk.codeexecutors","c":"CodeExecutorContext","l":"CodeExecutorContext(Map)","u":"%3Cinit%3E(java.util.Map)","k":"3"},{"p":"com.google.adk.tools.mcp","c":"StdioServerParameters","l":"command()"},{"p":"com.google.adk.tools.mcp","c":"StdioServerParameters.Builder","l":"command(String)","u":"command(java.lang.String)"},{"p":"com.google.adk.summarizer","c":"EventCompactor","l":"compact(Session, BaseSessionService)","u":"compact(com.google.adk.sessions.Session,com.google.adk.sessions.BaseSessionService)"},{"p":"com.google.adk.summarizer","c":"SlidingWindowEventCompactor","l":"compact(Session, BaseSessionService)","u":"compact(com.google.adk.sessions.Session,com.google.adk.sessions.BaseSessionService)"},{"p":"com.google.adk.summarizer","c":"TailRetentionEventCompactor","l":"compact(Session, BaseSessionService)","u":"compact(com.google.adk.sessions.Session,com.google.adk.sessions.BaseSessionService)"},{"p":"com.google.adk.events","c":"EventCompaction","l":"compactedContent()"},{"p":"com.google.adk.events","c":"EventCompaction.Builder","l":"compactedContent(Content)","u":"compactedContent(com.google.genai.types.Content)"},{"p":"com.google.adk.events","c":"EventActions","l":"compaction()"},{"p":"com.google.adk.flows.llmflows","c":"Compaction","l":"Compaction()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.events","c":"EventActions.Builder","l":"compaction(EventCompaction)","u":"compaction(com.google.adk.events.EventCompaction)"},{"p":"com.google.adk.summarizer","c":"EventsCompactionConfig","l":"compactionInterval()"},{"p":"com.google.adk.summarizer","c":"EventsCompactionConfig.Builder","l":"compactionInterval(Integer)","u":"compactionInterval(java.lang.Integer)"},{"p":"com.google.adk.skills","c":"Frontmatter","l":"compatibility()"},{"p":"com.google.adk.skills","c":"Frontmatter.Builder","l":"compatibility(String)","u":"compatibility(java.lang.String)"},{"p":"com.google.adk.web","c":"CompiledAgentLoader","l":"CompiledAgentLoader(AgentLoadingProperties)","u":"%3Cinit%3E(com.google.adk.web.config.AgentLoadingProperties)","k":"3"},{"p":"com.google.adk.models.chat","c":"ChatCompletionsClient","l":"complete(LlmRequest, boolean)","u":"complete(com.google.adk.models.LlmRequest,boolean)"},{"p":"com.google.adk.models.chat","c":"ChatCompletionsHttpClient","l":"complete(LlmRequest, boolean)","u":"complete(com.google.adk.models.LlmRequest,boolean)"},{"p":"com.example.adktriaging","c":"AdkTriagingAgent","l":"COMPONENT_LABELS","k":"2"},{"p":"com.google.adk.utils","c":"ComponentRegistry","l":"ComponentRegistry()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.tools.computeruse","c":"ComputerUseTool","l":"ComputerUseTool(Object, Method, int[], int[])","u":"%3Cinit%3E(java.lang.Object,java.lang.reflect.Method,int[],int[])","k":"3"},{"p":"com.google.adk.tools.computeruse","c":"ComputerUseToolset","l":"ComputerUseToolset(BaseComputer)","u":"%3Cinit%3E(com.google.adk.tools.computeruse.BaseComputer)","k":"3"},{"p":"com.google.adk.tools.computeruse","c":"ComputerUseToolset","l":"ComputerUseToolset(BaseComputer, int[])","u":"%3Cinit%3E(com.google.adk.tools.computeruse.BaseComputer,int[])","k":"3"},{"p":"com.google.adk.tools.mcp","c":"McpToolset","l":"CONFIG_TYPE","k":"2"},{"p":"com.google.adk.models","c":"LlmRequest.Builder","l":"config()"},{"p":"com.google.adk.models","c":"LlmRequest","l":"config()"},{"p":"com.google.adk.models","c":"LlmRequest.Builder","l":"config(GenerateContentConfig)","u":"config(com.google.genai.types.GenerateContentConfig)"},{"p":"com.google.adk.maven","c":"ConfigAgentLoader","l":"ConfigAgentLoader(String)","u":"%3Cinit%3E(java.lang.String)","k":"3"},{"p":"com.google.adk.maven","c":"ConfigAgentLoader","l":"ConfigAgentLoader(String, boolean)","u":"%3Cinit%3E(java.lang.String,boolean)","k":"3"},{"p":"com.google.adk.models.springai","c":"ConfigMapper","l":"ConfigMapper()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.agents","c":"BaseAgentConfig.AgentRefConfig","l":"configPath()"},{"p":"com.google.adk.agents","c":"ConfigAgentUtils.ConfigurationException","l":"ConfigurationException(String)","u":"%3Cinit%3E(java.lang.String)","k":"3"},{"p":"com.google.adk.agents","c":"ConfigAgentUtils.ConfigurationException","l":"ConfigurationException(String, Throwable)","u":"%3Cinit%3E(java.lang.String,java.lang.Throwable)","k":"3"},{"p":"com.google.adk.telemetry","c":"Tracing.TracerProvider","l":"configure(Consumer)","u":"configure(java.util.function.Consumer)"},{"p":"com.google.adk.events","c":"ToolConfirmation","l":"confirmed()"},{"p":"com.google.adk.events","c":"ToolConfirmation.Builder","l":"confirmed(boolean)"},{"p":"com.google.adk.models","c":"ApigeeLlm","l":"connect(LlmRequest)","u":"connect(com.google.adk.models.LlmRequest)"},{"p":"com.google.adk.models","c":"BaseLlm","l":"connect(LlmRequest)","u":"connect(com.google.adk.models.LlmRequest)"},{"p":"com.google.adk.models","c":"Claude","l":"connect(LlmRequest)","u":"connect(com.google.adk.models.LlmRequest)"},{"p":"com.google.adk.models","c":"Gemini","l":"connect(LlmRequest)","u":"connect(com.google.adk.models.LlmRequest)"},{"p":"com.google.adk.models.langchain4j","c":"LangChain4j","l":"connect(LlmRequest)","u":"connect(com.google.adk.models.LlmRequest)"},{"p":"com.google.adk.models.springai","c":"SpringAI","l":"connect(LlmRequest)","u":"connect(com.google.adk.models.LlmRequest)"},{"p":"com.google.adk.tools.applicationintegrationtoolset","c":"ConnectionsClient.ConnectionDetails","l":"ConnectionDetails()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryLoggerConfig","l":"connectionId()"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryLoggerConfig.Builder","l":"connectionId(String)","u":"connectionId(java.lang.String)"},{"p":"com.google.adk.tools.mcp","c":"McpAsyncToolset.Builder","l":"connectionParams(ServerParameters)","u":"connectionParams(io.modelcontextprotocol.client.transport.ServerParameters)"},{"p":"com.google.adk.tools.mcp","c":"McpAsyncToolset.Builder","l":"connectionParams(SseServerParameters)","u":"connectionParams(com.google.adk.tools.mcp.SseServerParameters)"},{"p":"com.google.adk.tools.applicationintegrationtoolset","c":"ConnectionsClient","l":"ConnectionsClient(String, String, String, HttpClient, ObjectMapper)","u":"%3Cinit%3E(java.lang.String,java.lang.String,java.lang.String,java.net.http.HttpClient,com.fasterxml.jackson.databind.ObjectMapper)","k":"3"},{"p":"com.google.adk.tools.applicationintegrationtoolset","c":"ConnectionsClient","l":"ConnectionsClient(String, String, String, String, HttpClient, CredentialsHelper, ObjectMapper)","u":"%3Cinit%3E(java.lang.String,java.lang.String,java.lang.String,java.lang.String,java.net.http.HttpClient,com.google.adk.tools.applicationintegrationtoolset.CredentialsHelper,com.fasterxml.jackson.databind.ObjectMapper)","k":"3"},{"p":"com.google.adk.tools.applicationintegrationtoolset","c":"ConnectionsClient","l":"connectorPayload(Map)","u":"connectorPayload(java.util.Map)"},{"p":"com.google.adk.codeexecutors","c":"ContainerCodeExecutor","l":"ContainerCodeExecutor(String, String, String)","u":"%3Cinit%3E(java.lang.String,java.lang.String,java.lang.String)","k":"3"},{"p":"com.google.adk.planner.goap","c":"GoalOrientedSearchGraph","l":"contains(String)","u":"contains(java.lang.String)"},{"p":"com.google.adk.sessions","c":"State","l":"containsKey(Object)","u":"containsKey(java.lang.Object)"},{"p":"com.google.adk.sessions","c":"State","l":"containsValue(Object)","u":"containsValue(java.lang.Object)"},{"p":"com.google.adk.agents","c":"LiveRequest","l":"content()"},{"p":"com.google.adk.codeexecutors","c":"CodeExecutionUtils.File","l":"content()"},{"p":"com.google.adk.events","c":"Event","l":"content()"},{"p":"com.google.adk.memory","c":"MemoryEntry","l":"content()"},{"p":"com.google.adk.models","c":"LlmResponse","l":"content()"},{"p":"com.google.adk.agents","c":"LiveRequest.Builder","l":"content(Content)","u":"content(com.google.genai.types.Content)"},{"p":"com.google.adk.events","c":"Event.Builder","l":"content(Content)","u":"content(com.google.genai.types.Content)"},{"p":"com.google.adk.models","c":"LlmResponse.Builder","l":"content(Content)","u":"content(com.google.genai.types.Content)"},{"p":"com.google.adk.agents","c":"LiveRequestQueue","l":"content(Content)","u":"content(com.google.genai.types.Content)"},{"p":"com.google.adk.memory","c":"MemoryEntry.Builder","l":"content(Content)","u":"content(com.google.genai.types.Content)"},{"p":"com.google.adk.codeexecutors","c":"CodeExecutionUtils.File.Builder","l":"content(String)","u":"content(java.lang.String)"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryLoggerConfig","l":"contentFormatter()"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryLoggerConfig.Builder","l":"contentFormatter(BiFunction)","u":"contentFormatter(java.util.function.BiFunction)"},{"p":"com.google.adk.models","c":"LlmRequest","l":"contents()"},{"p":"com.google.adk.flows.llmflows","c":"Contents","l":"Contents()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.models","c":"LlmRequest.Builder","l":"contents(List)","u":"contents(java.util.List)"},{"p":"com.google.adk.a2a.converters","c":"EventConverter","l":"contentToParts(Optional, boolean)","u":"contentToParts(java.util.Optional,boolean)","k":"6"},{"p":"com.google.adk.a2a.converters","c":"AdkMetadataKey","l":"CONTEXT_ID","k":"0"},{"p":"com.google.adk.telemetry","c":"Instrumentation.ClosableTelemetryScope","l":"context()"},{"p":"com.google.adk.agents","c":"InvocationContext","l":"contextCacheConfig()"},{"p":"com.google.adk.apps","c":"App","l":"contextCacheConfig()"},{"p":"com.google.adk.agents","c":"ContextCacheConfig","l":"ContextCacheConfig()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.agents","c":"InvocationContext.Builder","l":"contextCacheConfig(ContextCacheConfig)","u":"contextCacheConfig(com.google.adk.agents.ContextCacheConfig)"},{"p":"com.google.adk.apps","c":"App.Builder","l":"contextCacheConfig(ContextCacheConfig)","u":"contextCacheConfig(com.google.adk.agents.ContextCacheConfig)"},{"p":"com.google.adk.agents","c":"ContextCacheConfig","l":"ContextCacheConfig(int, Duration, int)","u":"%3Cinit%3E(int,java.time.Duration,int)","k":"3"},{"p":"com.google.adk.plugins","c":"ContextFilterPlugin","l":"ContextFilterPlugin(ContextFilterPlugin.Builder)","u":"%3Cinit%3E(com.google.adk.plugins.ContextFilterPlugin.Builder)","k":"3"},{"p":"com.google.adk.a2a.converters","c":"EventConverter","l":"contextId(Event)","u":"contextId(com.google.adk.events.Event)","k":"6"},{"p":"com.google.adk.models","c":"GeminiUtil","l":"CONTINUE_OUTPUT_MESSAGE","k":"2"},{"p":"com.example.adkprtriaging","c":"Settings","l":"contributingGuidelines()","k":"6"},{"p":"com.google.adk.codeexecutors","c":"CodeExecutionUtils","l":"convertCodeExecutionParts(Content, List, List)","u":"convertCodeExecutionParts(com.google.genai.types.Content,java.util.List,java.util.List)","k":"6"},{"p":"com.google.adk.tools.applicationintegrationtoolset","c":"ConnectionsClient","l":"convertJsonSchemaToOpenApiSchema(Map)","u":"convertJsonSchemaToOpenApiSchema(java.util.Map)"},{"p":"com.google.adk.models.springai","c":"ToolConverter","l":"convertSchemaToSpringAi(Schema)","u":"convertSchemaToSpringAi(com.google.genai.types.Schema)"},{"p":"com.google.adk.models.springai","c":"ToolConverter","l":"convertToSpringAiTools(Map)","u":"convertToSpringAiTools(java.util.Map)"},{"p":"com.google.adk.utils","c":"CoreAdkComponentProvider","l":"CoreAdkComponentProvider()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.web.config","c":"AdkWebCorsConfig","l":"corsConfigurationSource(AdkWebCorsProperties)","u":"corsConfigurationSource(com.google.adk.web.config.AdkWebCorsProperties)"},{"p":"com.google.adk.web.config","c":"AdkWebCorsConfig","l":"corsFilter(CorsConfigurationSource)","u":"corsFilter(org.springframework.web.cors.CorsConfigurationSource)"},{"p":"com.google.adk.models.springai","c":"EmbeddingConverter","l":"cosineSimilarity(float[], float[])","u":"cosineSimilarity(float[],float[])","k":"6"},{"p":"com.google.adk.tools","c":"AgentTool","l":"create(BaseAgent)","u":"create(com.google.adk.agents.BaseAgent)","k":"6"},{"p":"com.google.adk.tools","c":"AgentTool","l":"create(BaseAgent, boolean)","u":"create(com.google.adk.agents.BaseAgent,boolean)","k":"6"},{"p":"com.google.adk.tools","c":"AgentTool","l":"create(BaseAgent, boolean, boolean)","u":"create(com.google.adk.agents.BaseAgent,boolean,boolean)","k":"6"},{"p":"com.google.adk.tools","c":"GoogleSearchAgentTool","l":"create(BaseLlm)","u":"create(com.google.adk.models.BaseLlm)","k":"6"},{"p":"com.google.adk.tools","c":"VertexAiSearchAgentTool","l":"create(BaseLlm, VertexAiSearchTool)","u":"create(com.google.adk.models.BaseLlm,com.google.adk.tools.VertexAiSearchTool)","k":"6"},{"p":"com.google.adk.tools.computeruse","c":"ComputerState","l":"create(byte[])","k":"6"},{"p":"com.google.adk.tools.computeruse","c":"ComputerState","l":"create(byte[], String)","u":"create(byte[],java.lang.String)","k":"6"},{"p":"com.google.adk.tools","c":"FunctionTool","l":"create(Class, String)","u":"create(java.lang.Class,java.lang.String)","k":"6"},{"p":"com.google.adk.tools","c":"LongRunningFunctionTool","l":"create(Class, String)","u":"create(java.lang.Class,java.lang.String)","k":"6"},{"p":"com.google.adk.tools","c":"FunctionTool","l":"create(Class, String, boolean)","u":"create(java.lang.Class,java.lang.String,boolean)","k":"6"},{"p":"com.google.adk.tools","c":"LongRunningFunctionTool","l":"create(Class, String, boolean)","u":"create(java.lang.Class,java.lang.String,boolean)","k":"6"},{"p":"com.google.adk.tools","c":"FunctionTool","l":"create(Class, String, boolean, boolean)","u":"create(java.lang.Class,java.lang.String,boolean,boolean)","k":"6"},{"p":"com.google.adk.tools","c":"LongRunningFunctionTool","l":"create(FunctionTool)","u":"create(com.google.adk.tools.FunctionTool)","k":"6"},{"p":"com.google.adk.models","c":"LlmResponse","l":"create(GenerateContentResponse)","u":"create(com.google.genai.types.GenerateContentResponse)","k":"6"},{"p":"com.google.adk.models","c":"LlmResponse","l":"create(List)","u":"create(java.util.List)","k":"6"},{"p":"com.google.adk.flows.llmflows","c":"RequestProcessor.RequestProcessingResult","l":"create(LlmRequest, Iterable)","u":"create(com.google.adk.models.LlmRequest,java.lang.Iterable)","k":"6"},{"p":"com.google.adk.flows.llmflows","c":"ResponseProcessor.ResponseProcessingResult","l":"create(LlmResponse, Iterable)","u":"create(com.google.adk.models.LlmResponse,java.lang.Iterable)","k":"6"},{"p":"com.google.adk.flows.llmflows","c":"ResponseProcessor.ResponseProcessingResult","l":"create(LlmResponse, Iterable, String)","u":"create(com.google.adk.models.LlmResponse,java.lang.Iterable,java.lang.String)","k":"6"},{"p":"com.google.adk.tools","c":"FunctionTool","l":"create(Method)","u":"create(java.lang.reflect.Method)","k":"6"},{"p":"com.google.adk.tools","c":"LongRunningFunctionTool","l":"create(Method)","u":"create(java.lang.reflect.Method)","k":"6"},{"p":"com.google.adk.tools","c":"FunctionTool","l":"create(Method, boolean)","u":"create(java.lang.reflect.Method,boolean)","k":"6"},{"p":"com.google.adk.tools","c":"LongRunningFunctionTool","l":"create(Method, boolean)","u":"create(java.lang.reflect.Method,boolean)","k":"6"},{"p":"com.google.adk.tools","c":"FunctionTool","l":"create(Method, boolean, boolean)","u":"create(java.lang.reflect.Method,boolean,boolean)","k":"6"},{"p":"com.google.adk.tools","c":"LongRunningFunctionTool","l":"create(Object, Method)","u":"create(java.lang.Object,java.lang.reflect.Method)","k":"6"},{"p":"com.google.adk.tools","c":"FunctionTool","l":"create(Object, Method)","u":"create(java.lang.Object,java.lang.reflect.Method)","k":"6"},{"p":"com.google.adk.tools","c":"LongRunningFunctionTool","l":"create(Object, Method, boolean)","u":"create(java.lang.Object,java.lang.reflect.Method,boolean)","k":"6"},{"p":"com.google.adk.tools","c":"FunctionTool","l":"create(Object, Method, boolean)","u":"create(java.lang.Object,java.lang.reflect.Method,boolean)","k":"6"},{"p":"com.google.adk.tools","c":"FunctionTool","l":"create(Object, Method, boolean, boolean)","u":"create(java.lang.Object,java.lang.reflect.Method,boolean,boolean)","k":"6"},{"p":"com.google.adk.tools","c":"FunctionTool","l":"create(Object, String)","u":"create(java.lang.Object,java.lang.String)","k":"6"},{"p":"com.google.adk.tools","c":"LongRunningFunctionTool","l":"create(Object, String)","u":"create(java.lang.Object,java.lang.String)","k":"6"},{"p":"com.google.adk.tools","c":"FunctionTool","l":"create(Object, String, boolean)","u":"create(java.lang.Object,java.lang.String,boolean)","k":"6"},{"p":"com.google.adk.tools","c":"LongRunningFunctionTool","l":"create(Object, String, boolean)","u":"create(java.lang.Object,java.lang.String,boolean)","k":"6"},{"p":"com.google.adk.tools","c":"FunctionTool","l":"create(Object, String, boolean, boolean)","u":"create(java.lang.Object,java.lang.String,boolean,boolean)","k":"6"},{"p":"com.google.adk.models","c":"LlmRegistry.LlmFactory","l":"create(String)","u":"create(java.lang.String)"},{"p":"com.google.adk.tools.mcp","c":"McpSessionManager","l":"createAsyncSession()"},{"p":"com.google.adk.models.springai","c":"ConfigMapper","l":"createDefaultChatOptions()"},{"p":"com.google.adk.web.controller","c":"EvaluationController","l":"createEvalSet(String, String)","u":"createEvalSet(java.lang.String,java.lang.String)"},{"p":"com.google.adk.flows.llmflows","c":"OutputSchema","l":"createFinalModelResponseEvent(InvocationContext, String)","u":"createFinalModelResponseEvent(com.google.adk.agents.InvocationContext,java.lang.String)","k":"6"},{"p":"com.google.adk.internal.http","c":"HttpClientFactory","l":"createHttpClient(ExecutorService)","u":"createHttpClient(java.util.concurrent.ExecutorService)","k":"6"},{"p":"com.example.github","c":"GitHubTools","l":"createIssue(String, String, String, String)","u":"createIssue(java.lang.String,java.lang.String,java.lang.String,java.lang.String)","k":"6"},{"p":"com.google.adk.tools.applicationintegrationtoolset","c":"ConnectionsClient","l":"createOperation(String, String, String)","u":"createOperation(java.lang.String,java.lang.String,java.lang.String)","k":"6"},{"p":"com.google.adk.tools.applicationintegrationtoolset","c":"ConnectionsClient","l":"createOperationRequest(String)","u":"createOperationRequest(java.lang.String)","k":"6"},{"p":"com.example.github","c":"GitHubTools","l":"createPullRequest(String, String, String, List, List, String, String)","u":"createPullRequest(java.lang.String,java.lang.String,java.lang.String,java.util.List,java.util.List,java.lang.String,java.lang.String)","k":"6"},{"p":"com.google.adk.models.springai","c":"EmbeddingConverter","l":"createRequest(List)","u":"createRequest(java.util.List)","k":"6"},{"p":"com.google.adk.models.springai","c":"EmbeddingConverter","l":"createRequest(String)","u":"createRequest(java.lang.String)","k":"6"},{"p":"com.example.a2a_basic","c":"A2AAgent","l":"createRootAgent(String)","u":"createRootAgent(java.lang.String)","k":"6"},{"p":"com.google.adk.tools.mcp","c":"McpSessionManager","l":"createSession()"},{"p":"com.google.adk.sessions","c":"BaseSessionService","l":"createSession(SessionKey)","u":"createSession(com.google.adk.sessions.SessionKey)"},{"p":"com.google.adk.sessions","c":"BaseSessionService","l":"createSession(SessionKey, Map)","u":"createSession(com.google.adk.sessions.SessionKey,java.util.Map)"},{"p":"com.google.adk.sessions","c":"BaseSessionService","l":"createSession(String, String)","u":"createSession(java.lang.String,java.lang.String)"},{"p":"com.google.adk.sessions","c":"BaseSessionService","l":"createSession(String, String, ConcurrentMap, String)","u":"createSession(java.lang.String,java.lang.String,java.util.concurrent.ConcurrentMap,java.lang.String)"},{"p":"com.google.adk.sessions","c":"InMemorySessionService","l":"createSession(String, String, ConcurrentMap, String)","u":"createSession(java.lang.String,java.lang.String,java.util.concurrent.ConcurrentMap,java.lang.String)"},{"p":"com.google.adk.sessions","c":"VertexAiSessionService","l":"createSession(String, String, ConcurrentMap, String)","u":"createSession(java.lang.String,java.lang.String,java.util.concurrent.ConcurrentMap,java.lang.String)"},{"p":"com.google.adk.sessions","c":"FirestoreSessionService","l":"createSession(String, String, ConcurrentMap, String)","u":"createSession(java.lang.String,java.lang.String,java.util.concurrent.ConcurrentMap,java.lang.String)"},{"p":"com.google.adk.sessions","c":"BaseSessionService","l":"createSession(String, String, Map, String)","u":"createSession(java.lang.String,java.lang.String,java.util.Map,java.lang.String)"},{"p":"com.google.adk.sessions","c":"InMemorySessionService","l":"createSession(String, String, Map, String)","u":"createSession(java.lang.String,java.lang.String,java.util.Map,java.lang.String)"},{"p":"com.google.adk.sessions","c":"VertexAiSessionService","l":"createSession(String, String, Map, String)","u":"createSession(java.lang.String,java.lang.String,java.util.Map,java.lang.String)"},{"p":"com.google.adk.sessions","c":"FirestoreSessionService","l":"createSession(String, String, Map, String)","u":"createSession(java.lang.String,java.lang.String,java.util.Map,java.lang.String)"},{"p":"com.google.adk.web.controller","c":"SessionController","l":"createSession(String, String, SessionRequest)","u":"createSession(java.lang.String,java.lang.String,com.google.adk.web.dto.SessionRequest)"},{"p":"com.google.adk.web.controller","c":"SessionController","l":"createSessionWithId(String, String, String, SessionRequest)","u":"createSessionWithId(java.lang.String,java.lang.String,java.lang.String,com.google.adk.web.dto.SessionRequest)"},{"p":"com.google.adk.models.springai","c":"ToolConverter","l":"createToolRegistry(Map)","u":"createToolRegistry(java.util.Map)"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryLoggerConfig","l":"createViews()"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryLoggerConfig.Builder","l":"createViews(boolean)"},{"p":"com.google.adk.models","c":"VertexCredentials","l":"credentials()"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryLoggerConfig","l":"credentials()"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryLoggerConfig.Builder","l":"credentials(Credentials)","u":"credentials(com.google.auth.Credentials)"},{"p":"com.google.adk.models","c":"VertexCredentials.Builder","l":"credentials(GoogleCredentials)","u":"credentials(com.google.auth.oauth2.GoogleCredentials)"},{"p":"com.google.adk.tools.computeruse","c":"BaseComputer","l":"currentState()"},{"p":"com.google.adk.a2a.converters","c":"A2AMetadataKey","l":"CUSTOM_METADATA","k":"0"},{"p":"com.example","c":"CustomDemoRegistry","l":"CustomDemoRegistry()","u":"%3Cinit%3E()","k":"3"},{"p":"com.example","c":"CustomDieTool","l":"CustomDieTool()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.plugins","c":"ContextFilterPlugin.Builder","l":"customFilter(UnaryOperator)","u":"customFilter(java.util.function.UnaryOperator)"},{"p":"com.google.adk.models","c":"ApigeeLlm.Builder","l":"customHeaders(Map)","u":"customHeaders(java.util.Map)"},{"p":"com.google.adk.agents","c":"RunConfig","l":"customMetadata()"},{"p":"com.google.adk.events","c":"Event","l":"customMetadata()"},{"p":"com.google.adk.models","c":"LlmResponse","l":"customMetadata()"},{"p":"com.google.adk.tools","c":"BaseTool","l":"customMetadata()"},{"p":"com.google.adk.events","c":"Event.Builder","l":"customMetadata(List)","u":"customMetadata(java.util.List)"},{"p":"com.google.adk.models","c":"LlmResponse.Builder","l":"customMetadata(List)","u":"customMetadata(java.util.List)"},{"p":"com.google.adk.agents","c":"RunConfig.Builder","l":"customMetadata(Map)","u":"customMetadata(java.util.Map)"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryLoggerConfig","l":"customTags()"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryLoggerConfig.Builder","l":"customTags(Map)","u":"customTags(java.util.Map)"},{"p":"com.google.adk.internal.http","c":"HttpClientFactory","l":"daemonExecutor(String)","u":"daemonExecutor(java.lang.String)","k":"6"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryLoggerConfig","l":"datasetId()"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryLoggerConfig.Builder","l":"datasetId(String)","u":"datasetId(java.lang.String)"},{"p":"com.google.adk.tools","c":"VertexAiSearchTool","l":"dataStore()"},{"p":"com.google.adk.tools","c":"VertexAiSearchTool.Builder","l":"dataStore(String)","u":"dataStore(java.lang.String)"},{"p":"com.google.adk.tools","c":"VertexAiSearchTool","l":"dataStoreId()"},{"p":"com.google.adk.tools","c":"VertexAiSearchTool.Builder","l":"dataStoreId(String)","u":"dataStoreId(java.lang.String)"},{"p":"com.google.adk.tools","c":"VertexAiSearchTool","l":"dataStoreSpecs()"},{"p":"com.google.adk.tools","c":"VertexAiSearchTool.Builder","l":"dataStoreSpecs(List)","u":"dataStoreSpecs(java.util.List)"},{"p":"com.google.adk.web.controller","c":"DebugController","l":"DebugController(ApiServerSpanExporter)","u":"%3Cinit%3E(com.google.adk.web.service.ApiServerSpanExporter)","k":"3"},{"p":"com.google.adk.tools","c":"AgentTool","l":"declaration()"},{"p":"com.google.adk.tools.applicationintegrationtoolset","c":"IntegrationConnectorTool","l":"declaration()"},{"p":"com.google.adk.tools","c":"BaseTool","l":"declaration()"},{"p":"com.google.adk.tools","c":"FunctionTool","l":"declaration()"},{"p":"com.google.adk.tools","c":"LoadArtifactsTool","l":"declaration()"},{"p":"com.google.adk.tools.mcp","c":"AbstractMcpTool","l":"declaration()"},{"p":"com.google.adk.tools.retrieval","c":"BaseRetrievalTool","l":"declaration()"},{"p":"com.google.adk.tools","c":"SetModelResponseTool","l":"declaration()"},{"p":"com.google.adk.sessions","c":"SessionUtils","l":"decodeContent(Content)","u":"decodeContent(com.google.genai.types.Content)","k":"6"},{"p":"com.google.adk.agents","c":"LlmAgent.IncludeContents","l":"DEFAULT","k":"0"},{"p":"com.google.adk.tools.mcp","c":"DefaultMcpTransportBuilder","l":"DefaultMcpTransportBuilder()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.artifacts","c":"BaseArtifactService","l":"deleteArtifact(SessionKey, String)","u":"deleteArtifact(com.google.adk.sessions.SessionKey,java.lang.String)"},{"p":"com.google.adk.artifacts","c":"BaseArtifactService","l":"deleteArtifact(String, String, String, String)","u":"deleteArtifact(java.lang.String,java.lang.String,java.lang.String,java.lang.String)"},{"p":"com.google.adk.artifacts","c":"GcsArtifactService","l":"deleteArtifact(String, String, String, String)","u":"deleteArtifact(java.lang.String,java.lang.String,java.lang.String,java.lang.String)"},{"p":"com.google.adk.artifacts","c":"InMemoryArtifactService","l":"deleteArtifact(String, String, String, String)","u":"deleteArtifact(java.lang.String,java.lang.String,java.lang.String,java.lang.String)"},{"p":"com.google.adk.web.controller","c":"ArtifactController","l":"deleteArtifact(String, String, String, String)","u":"deleteArtifact(java.lang.String,java.lang.String,java.lang.String,java.lang.String)"},{"p":"com.google.adk.events","c":"EventActions","l":"deletedArtifactIds()"},{"p":"com.google.adk.events","c":"EventActions.Builder","l":"deletedArtifactIds(Set)","u":"deletedArtifactIds(java.util.Set)"},{"p":"com.google.adk.tools.applicationintegrationtoolset","c":"ConnectionsClient","l":"deleteOperation(String, String, String)","u":"deleteOperation(java.lang.String,java.lang.String,java.lang.String)","k":"6"},{"p":"com.google.adk.tools.applicationintegrationtoolset","c":"ConnectionsClient","l":"deleteOperationRequest()","k":"6"},{"p":"com.google.adk.sessions","c":"BaseSessionService","l":"deleteSession(SessionKey)","u":"deleteSession(com.google.adk.sessions.SessionKey)"},{"p":"com.google.adk.sessions","c":"BaseSessionService","l":"deleteSession(String, String, String)","u":"deleteSession(java.lang.String,java.lang.String,java.lang.String)"},{"p":"com.google.adk.sessions","c":"FirestoreSessionService","l":"deleteSession(String, String, String)","u":"deleteSession(java.lang.String,java.lang.String,java.lang.String)"},{"p":"com.google.adk.sessions","c":"InMemorySessionService","l":"deleteSession(String, String, String)","u":"deleteSession(java.lang.String,java.lang.String,java.lang.String)"},{"p":"com.google.adk.sessions","c":"VertexAiSessionService","l":"deleteSession(String, String, String)","u":"deleteSession(java.lang.String,java.lang.String,java.lang.String)"},{"p":"com.google.adk.web.controller","c":"SessionController","l":"deleteSession(String, String, String)","u":"deleteSession(java.lang.String,java.lang.String,java.lang.String)"},{"p":"com.google.adk.agents","c":"BaseAgent.Builder","l":"description","k":"1"},{"p":"com.google.adk.tools.applicationintegrationtoolset","c":"ConnectionsClient.ActionSchema","l":"description","k":"1"},{"p":"com.google.adk.agents","c":"BaseAgent","l":"description()"},{"p":"com.google.adk.agents","c":"BaseAgentConfig","l":"description()"},{"p":"com.google.adk.skills","c":"Frontmatter","l":"description()"},{"p":"com.google.adk.tools","c":"Annotations.Schema","l":"description()","k":"4"},{"p":"com.google.adk.tools","c":"BaseTool","l":"description()"},{"p":"com.google.adk.a2a.agent","c":"RemoteA2AAgent.Builder","l":"description(String)","u":"description(java.lang.String)"},{"p":"com.google.adk.agents","c":"BaseAgent.Builder","l":"description(String)","u":"description(java.lang.String)"},{"p":"com.google.adk.skills","c":"Frontmatter.Builder","l":"description(String)","u":"description(java.lang.String)"},{"p":"com.google.adk.tools","c":"ExampleTool.Builder","l":"description(String)","u":"description(java.lang.String)"},{"p":"com.google.adk.agents","c":"LlmAgent","l":"determineLlmFlow()"},{"p":"com.google.adk.planner.goap","c":"DfsSearchStrategy","l":"DfsSearchStrategy()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.models.springai","c":"SpringAIEmbedding","l":"dimensions()"},{"p":"com.google.adk.agents","c":"LlmAgent","l":"disallowTransferToParent()"},{"p":"com.google.adk.agents","c":"LlmAgentConfig","l":"disallowTransferToParent()"},{"p":"com.google.adk.agents","c":"LlmAgent.Builder","l":"disallowTransferToParent(boolean)"},{"p":"com.google.adk.agents","c":"LlmAgent","l":"disallowTransferToPeers()"},{"p":"com.google.adk.agents","c":"LlmAgentConfig","l":"disallowTransferToPeers()"},{"p":"com.google.adk.agents","c":"LlmAgent.Builder","l":"disallowTransferToPeers(boolean)"},{"p":"com.google.adk.tools.applicationintegrationtoolset","c":"ConnectionsClient.ActionSchema","l":"displayName","k":"1"},{"p":"com.google.adk.agents","c":"PlannerAction.Done","l":"Done()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.agents","c":"PlannerAction.DoneWithResult","l":"DoneWithResult(String)","u":"%3Cinit%3E(java.lang.String)","k":"3"},{"p":"com.google.adk.web.dto","c":"GraphResponse","l":"dotSrc","k":"1"},{"p":"com.google.adk.tools.computeruse","c":"BaseComputer","l":"dragAndDrop(int, int, int, int)","u":"dragAndDrop(int,int,int,int)"},{"p":"com.example.github","c":"GitHubTools","l":"dryRun","k":"2"},{"p":"com.google.adk.models.springai","c":"SpringAIEmbedding","l":"embed(List)","u":"embed(java.util.List)"},{"p":"com.google.adk.models.springai","c":"SpringAIEmbedding","l":"embed(String)","u":"embed(java.lang.String)"},{"p":"com.google.adk.models.springai","c":"SpringAIEmbedding","l":"embedForResponse(EmbeddingRequest)","u":"embedForResponse(org.springframework.ai.embedding.EmbeddingRequest)"},{"p":"com.google.adk.flows.llmflows","c":"PersistBarrier","l":"enable(InvocationContext)","u":"enable(com.google.adk.agents.InvocationContext)","k":"6"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryLoggerConfig","l":"enabled()"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryLoggerConfig.Builder","l":"enabled(boolean)"},{"p":"com.google.adk.sessions","c":"SessionUtils","l":"encodeContent(Content)","u":"encodeContent(com.google.genai.types.Content)","k":"6"},{"p":"com.google.adk.agents","c":"InvocationContext","l":"endInvocation()"},{"p":"com.google.adk.events","c":"EventActions","l":"endInvocation()"},{"p":"com.google.adk.agents","c":"InvocationContext.Builder","l":"endInvocation(boolean)"},{"p":"com.google.adk.events","c":"EventActions.Builder","l":"endInvocation(boolean)"},{"p":"com.google.adk.events","c":"EventActions","l":"endOfAgent()"},{"p":"com.google.adk.events","c":"EventActions.Builder","l":"endOfAgent(boolean)"},{"p":"com.google.adk.events","c":"EventCompaction","l":"endTimestamp()"},{"p":"com.google.adk.events","c":"EventCompaction.Builder","l":"endTimestamp(long)"},{"p":"com.google.adk.plugins.agentanalytics","c":"TraceManager","l":"ensureInvocationSpan(InvocationContext)","u":"ensureInvocationSpan(com.google.adk.agents.InvocationContext)"},{"p":"com.google.adk.tools.applicationintegrationtoolset","c":"ConnectionsClient.EntitySchemaAndOperations","l":"EntitySchemaAndOperations()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.sessions","c":"State","l":"entrySet()"},{"p":"com.google.adk.tools.mcp","c":"StdioServerParameters","l":"env()"},{"p":"com.google.adk.tools.mcp","c":"StdioServerParameters.Builder","l":"env(Map)","u":"env(java.util.Map)"},{"p":"com.google.adk.tools.computeruse","c":"ComputerEnvironment","l":"ENVIRONMENT_BROWSER","k":"0"},{"p":"com.google.adk.tools.computeruse","c":"ComputerEnvironment","l":"ENVIRONMENT_UNSPECIFIED","k":"0"},{"p":"com.google.adk.tools.computeruse","c":"BaseComputer","l":"environment()"},{"p":"com.google.adk.agents","c":"ContextCacheConfig","l":"equals(Object)","u":"equals(java.lang.Object)"},{"p":"com.google.adk.agents","c":"Instruction.Provider","l":"equals(Object)","u":"equals(java.lang.Object)"},{"p":"com.google.adk.agents","c":"Instruction.Static","l":"equals(Object)","u":"equals(java.lang.Object)"},{"p":"com.google.adk.agents","c":"InvocationContext","l":"equals(Object)","u":"equals(java.lang.Object)"},{"p":"com.google.adk.agents","c":"PlannerAction.Done","l":"equals(Object)","u":"equals(java.lang.Object)"},{"p":"com.google.adk.agents","c":"PlannerAction.DoneWithResult","l":"equals(Object)","u":"equals(java.lang.Object)"},{"p":"com.google.adk.agents","c":"PlannerAction.NoOp","l":"equals(Object)","u":"equals(java.lang.Object)"},{"p":"com.google.adk.agents","c":"PlannerAction.RunAgents","l":"equals(Object)","u":"equals(java.lang.Object)"},{"p":"com.google.adk.events","c":"Event","l":"equals(Object)","u":"equals(java.lang.Object)"},{"p":"com.google.adk.events","c":"EventActions","l":"equals(Object)","u":"equals(java.lang.Object)"},{"p":"com.google.adk.planner.goap","c":"AgentMetadata","l":"equals(Object)","u":"equals(java.lang.Object)"},{"p":"com.google.adk.planner.goap","c":"ReplanPolicy.FailStop","l":"equals(Object)","u":"equals(java.lang.Object)"},{"p":"com.google.adk.planner.goap","c":"ReplanPolicy.Ignore","l":"equals(Object)","u":"equals(java.lang.Object)"},{"p":"com.google.adk.planner.goap","c":"ReplanPolicy.Replan","l":"equals(Object)","u":"equals(java.lang.Object)"},{"p":"com.google.adk.sessions","c":"SessionKey","l":"equals(Object)","u":"equals(java.lang.Object)"},{"p":"com.google.adk.sessions","c":"State","l":"equals(Object)","u":"equals(java.lang.Object)"},{"p":"com.google.adk.summarizer","c":"EventsCompactionConfig","l":"equals(Object)","u":"equals(java.lang.Object)"},{"p":"com.google.adk.tools.computeruse","c":"ComputerState","l":"equals(Object)","u":"equals(java.lang.Object)"},{"p":"com.google.adk.tools","c":"LoadMemoryResponse","l":"equals(Object)","u":"equals(java.lang.Object)"},{"p":"com.google.adk.web.config","c":"AdkWebCorsProperties","l":"equals(Object)","u":"equals(java.lang.Object)"},{"p":"com.google.adk.a2a.converters","c":"A2AMetadataKey","l":"ERROR_CODE","k":"0"},{"p":"com.google.adk.events","c":"Event","l":"errorCode()"},{"p":"com.google.adk.models","c":"LlmResponse","l":"errorCode()"},{"p":"com.google.adk.events","c":"Event.Builder","l":"errorCode(FinishReason)","u":"errorCode(com.google.genai.types.FinishReason)"},{"p":"com.google.adk.models","c":"LlmResponse.Builder","l":"errorCode(FinishReason)","u":"errorCode(com.google.genai.types.FinishReason)"},{"p":"com.google.adk.events","c":"Event","l":"errorMessage()"},{"p":"com.google.adk.models","c":"LlmResponse","l":"errorMessage()"},{"p":"com.google.adk.events","c":"Event.Builder","l":"errorMessage(String)","u":"errorMessage(java.lang.String)"},{"p":"com.google.adk.models","c":"LlmResponse.Builder","l":"errorMessage(String)","u":"errorMessage(java.lang.String)"},{"p":"com.google.adk.codeexecutors","c":"BaseCodeExecutor","l":"errorRetryAttempts()"},{"p":"com.google.adk.events","c":"EventActions","l":"escalate()"},{"p":"com.google.adk.events","c":"EventActions.Builder","l":"escalate(Boolean)","u":"escalate(java.lang.Boolean)"},{"p":"com.google.adk.models.springai","c":"EmbeddingConverter","l":"euclideanDistance(float[], float[])","u":"euclideanDistance(float[],float[])","k":"6"},{"p":"com.google.adk.web.dto","c":"AddSessionToEvalSetRequest","l":"evalId","k":"1"},{"p":"com.google.adk.web.dto","c":"RunEvalResult","l":"evalId","k":"1"},{"p":"com.google.adk.web.dto","c":"RunEvalRequest","l":"evalIds","k":"1"},{"p":"com.google.adk.web.dto","c":"RunEvalResult","l":"evalMetricResults","k":"1"},{"p":"com.google.adk.web.dto","c":"RunEvalRequest","l":"evalMetrics","k":"1"},{"p":"com.google.adk.web.dto","c":"RunEvalResult","l":"evalSetId","k":"1"},{"p":"com.google.adk.web.controller","c":"EvaluationController","l":"EvaluationController()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.agents","c":"CallbackContext","l":"eventActions","k":"1"},{"p":"com.google.adk.agents","c":"CallbackContext","l":"eventActions()"},{"p":"com.google.adk.events","c":"EventActions","l":"EventActions()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryLoggerConfig","l":"eventAllowlist()"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryLoggerConfig.Builder","l":"eventAllowlist(List)","u":"eventAllowlist(java.util.List)"},{"p":"com.google.adk.events","c":"EventCompaction","l":"EventCompaction()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryLoggerConfig","l":"eventDenylist()"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryLoggerConfig.Builder","l":"eventDenylist(List)","u":"eventDenylist(java.util.List)"},{"p":"com.google.adk.agents","c":"CallbackContext","l":"eventId()"},{"p":"com.google.adk.tools","c":"ToolContext.Builder","l":"eventId(String)","u":"eventId(java.lang.String)"},{"p":"com.example.adkprtriaging","c":"Settings","l":"eventName()","k":"6"},{"p":"com.example.adkspam","c":"Settings","l":"eventName()","k":"6"},{"p":"com.example.adkstale","c":"Settings","l":"eventName()","k":"6"},{"p":"com.example.adktriaging","c":"Settings","l":"eventName()","k":"6"},{"p":"com.google.adk.summarizer","c":"EventsCompactionConfig","l":"eventRetentionSize()"},{"p":"com.google.adk.summarizer","c":"EventsCompactionConfig.Builder","l":"eventRetentionSize(Integer)","u":"eventRetentionSize(java.lang.Integer)"},{"p":"com.google.adk.utils","c":"Constants","l":"EVENTS_SUBCOLLECTION_NAME","k":"2"},{"p":"com.google.adk.agents","c":"PlanningContext","l":"events()"},{"p":"com.google.adk.agents","c":"ReadonlyContext","l":"events()"},{"p":"com.google.adk.flows.llmflows","c":"RequestProcessor.RequestProcessingResult","l":"events()"},{"p":"com.google.adk.flows.llmflows","c":"ResponseProcessor.ResponseProcessingResult","l":"events()"},{"p":"com.google.adk.sessions","c":"ListEventsResponse","l":"events()"},{"p":"com.google.adk.sessions","c":"Session","l":"events()"},{"p":"com.google.adk.sessions","c":"ListEventsResponse.Builder","l":"events(List)","u":"events(java.util.List)"},{"p":"com.google.adk.sessions","c":"Session.Builder","l":"events(List)","u":"events(java.util.List)"},{"p":"com.google.adk.agents","c":"InvocationContext","l":"eventsCompactionConfig()"},{"p":"com.google.adk.apps","c":"App","l":"eventsCompactionConfig()"},{"p":"com.google.adk.agents","c":"InvocationContext.Builder","l":"eventsCompactionConfig(EventsCompactionConfig)","u":"eventsCompactionConfig(com.google.adk.summarizer.EventsCompactionConfig)"},{"p":"com.google.adk.apps","c":"App.Builder","l":"eventsCompactionConfig(EventsCompactionConfig)","u":"eventsCompactionConfig(com.google.adk.summarizer.EventsCompactionConfig)"},{"p":"com.google.adk.summarizer","c":"EventsCompactionConfig","l":"EventsCompactionConfig(int, int)","u":"%3Cinit%3E(int,int)","k":"3"},{"p":"com.google.adk.summarizer","c":"EventsCompactionConfig","l":"EventsCompactionConfig(int, int, BaseEventSummarizer)","u":"%3Cinit%3E(int,int,com.google.adk.summarizer.BaseEventSummarizer)","k":"3"},{"p":"com.google.adk.summarizer","c":"EventsCompactionConfig","l":"EventsCompactionConfig(Integer, Integer, BaseEventSummarizer, Integer, Integer)","u":"%3Cinit%3E(java.lang.Integer,java.lang.Integer,com.google.adk.summarizer.BaseEventSummarizer,java.lang.Integer,java.lang.Integer)","k":"3"},{"p":"com.google.adk.events","c":"EventStream","l":"EventStream(Supplier)","u":"%3Cinit%3E(java.util.function.Supplier)","k":"3"},{"p":"com.example","c":"CustomDieTool","l":"EXAMPLE_TOOL_INSTANCE","k":"2"},{"p":"com.google.adk.examples","c":"Example","l":"Example()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.tools","c":"ExampleTool.Builder","l":"exampleProvider(BaseExampleProvider)","u":"exampleProvider(com.google.adk.examples.BaseExampleProvider)"},{"p":"com.google.adk.a2a.converters","c":"A2ADataPartMetadataType","l":"EXECUTABLE_CODE","k":"0"},{"p":"com.google.adk.google_adk_maven_plugin","c":"HelpMojo","l":"execute()"},{"p":"com.google.adk.maven","c":"WebMojo","l":"execute()"},{"p":"com.google.adk.a2a.executor","c":"AgentExecutor","l":"execute(RequestContext, EventQueue)","u":"execute(io.a2a.server.agentexecution.RequestContext,io.a2a.server.events.EventQueue)"},{"p":"com.google.adk.codeexecutors","c":"BaseCodeExecutor","l":"executeCode(InvocationContext, CodeExecutionUtils.CodeExecutionInput)","u":"executeCode(com.google.adk.agents.InvocationContext,com.google.adk.codeexecutors.CodeExecutionUtils.CodeExecutionInput)"},{"p":"com.google.adk.codeexecutors","c":"BuiltInCodeExecutor","l":"executeCode(InvocationContext, CodeExecutionUtils.CodeExecutionInput)","u":"executeCode(com.google.adk.agents.InvocationContext,com.google.adk.codeexecutors.CodeExecutionUtils.CodeExecutionInput)"},{"p":"com.google.adk.codeexecutors","c":"ContainerCodeExecutor","l":"executeCode(InvocationContext, CodeExecutionUtils.CodeExecutionInput)","u":"executeCode(com.google.adk.agents.InvocationContext,com.google.adk.codeexecutors.CodeExecutionUtils.CodeExecutionInput)"},{"p":"com.google.adk.codeexecutors","c":"VertexAiCodeExecutor","l":"executeCode(InvocationContext, CodeExecutionUtils.CodeExecutionInput)","u":"executeCode(com.google.adk.agents.InvocationContext,com.google.adk.codeexecutors.CodeExecutionUtils.CodeExecutionInput)"},{"p":"com.google.adk.tools.applicationintegrationtoolset","c":"ConnectionsClient","l":"executeCustomQueryRequest()","k":"6"},{"p":"com.google.adk.web.controller","c":"ExecutionController","l":"ExecutionController(RunnerService)","u":"%3Cinit%3E(com.google.adk.web.service.RunnerService)","k":"3"},{"p":"com.google.adk.codeexecutors","c":"CodeExecutionUtils.CodeExecutionInput","l":"executionId()"},{"p":"com.google.adk.codeexecutors","c":"CodeExecutionUtils.CodeExecutionInput.Builder","l":"executionId(String)","u":"executionId(java.lang.String)"},{"p":"com.google.adk.codeexecutors","c":"BaseCodeExecutor","l":"executionResultDelimiters()"},{"p":"com.google.adk.agents","c":"LlmAgent","l":"executor()"},{"p":"com.google.adk.agents","c":"LlmAgent.Builder","l":"executor(Executor)","u":"executor(java.util.concurrent.Executor)"},{"p":"com.google.adk.tools","c":"ExitLoopTool","l":"exitLoop(ToolContext)","u":"exitLoop(com.google.adk.tools.ToolContext)","k":"6"},{"p":"com.google.adk.models.springai.error","c":"SpringAIErrorMapper.RetryStrategy","l":"EXPONENTIAL_BACKOFF","k":"0"},{"p":"com.google.adk.web.service","c":"ApiServerSpanExporter","l":"export(Collection)","u":"export(java.util.Collection)"},{"p":"com.google.adk.models.chat","c":"ChatCompletionsRequest","l":"extraBody","k":"1"},{"p":"com.google.adk.codeexecutors","c":"CodeExecutionUtils","l":"extractCodeAndTruncateContent(Content.Builder, List)","u":"extractCodeAndTruncateContent(com.google.genai.types.Content.Builder,java.util.List)","k":"6"},{"p":"com.google.adk.models.springai","c":"EmbeddingConverter","l":"extractEmbeddings(EmbeddingResponse)","u":"extractEmbeddings(org.springframework.ai.embedding.EmbeddingResponse)","k":"6"},{"p":"com.google.adk.models.springai","c":"EmbeddingConverter","l":"extractFirstEmbedding(EmbeddingResponse)","u":"extractFirstEmbedding(org.springframework.ai.embedding.EmbeddingResponse)","k":"6"},{"p":"com.google.adk.planner.goap","c":"ReplanPolicy.FailStop","l":"FailStop()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.codeexecutors","c":"CodeExecutionUtils.File","l":"File()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.artifacts","c":"ListArtifactsResponse","l":"filenames()"},{"p":"com.google.adk.artifacts","c":"ListArtifactsResponse.Builder","l":"filenames(List)","u":"filenames(java.util.List)"},{"p":"com.google.adk.tools","c":"VertexAiSearchTool","l":"filter()"},{"p":"com.google.adk.tools","c":"VertexAiSearchTool.Builder","l":"filter(String)","u":"filter(java.lang.String)"},{"p":"com.google.adk.web.dto","c":"RunEvalResult","l":"finalEvalStatus","k":"1"},{"p":"com.google.adk.events","c":"Event","l":"finalResponse()"},{"p":"com.google.adk.agents","c":"BaseAgent","l":"findAgent(String)","u":"findAgent(java.lang.String)"},{"p":"com.google.adk.agents","c":"PlanningContext","l":"findAgent(String)","u":"findAgent(java.lang.String)"},{"p":"com.example.github","c":"GitHubTools","l":"findDocIssues(String, String, String)","u":"findDocIssues(java.lang.String,java.lang.String,java.lang.String)","k":"6"},{"p":"com.google.adk.flows.llmflows","c":"Functions","l":"findMatchingFunctionCallEvent(List)","u":"findMatchingFunctionCallEvent(java.util.List)","k":"6"},{"p":"com.google.adk.models.springai","c":"EmbeddingConverter","l":"findMostSimilar(float[], List)","u":"findMostSimilar(float[],java.util.List)","k":"6"},{"p":"com.example.github","c":"GitHubTools","l":"findPullRequestsForIssue(String, String, int)","u":"findPullRequestsForIssue(java.lang.String,java.lang.String,int)","k":"6"},{"p":"com.google.adk.skills","c":"AbstractSkillSource","l":"findResourcePath(String, String)","u":"findResourcePath(java.lang.String,java.lang.String)"},{"p":"com.google.adk.skills","c":"ClassPathSkillSource","l":"findResourcePath(String, String)","u":"findResourcePath(java.lang.String,java.lang.String)"},{"p":"com.google.adk.skills","c":"LocalSkillSource","l":"findResourcePath(String, String)","u":"findResourcePath(java.lang.String,java.lang.String)"},{"p":"com.google.adk.skills","c":"AbstractSkillSource","l":"findSkillMdPath(String)","u":"findSkillMdPath(java.lang.String)"},{"p":"com.google.adk.skills","c":"ClassPathSkillSource","l":"findSkillMdPath(String)","u":"findSkillMdPath(java.lang.String)"},{"p":"com.google.adk.skills","c":"LocalSkillSource","l":"findSkillMdPath(String)","u":"findSkillMdPath(java.lang.String)"},{"p":"com.google.adk.agents","c":"BaseAgent","l":"findSubAgent(String)","u":"findSubAgent(java.lang.String)"},{"p":"com.google.adk.a2a.converters","c":"EventConverter","l":"findUserFunctionCall(List)","u":"findUserFunctionCall(java.util.List)","k":"6"},{"p":"com.google.adk.events","c":"Event","l":"finishReason()"},{"p":"com.google.adk.models","c":"LlmResponse","l":"finishReason()"},{"p":"com.google.adk.events","c":"Event.Builder","l":"finishReason(FinishReason)","u":"finishReason(com.google.genai.types.FinishReason)"},{"p":"com.google.adk.models","c":"LlmResponse.Builder","l":"finishReason(FinishReason)","u":"finishReason(com.google.genai.types.FinishReason)"},{"p":"com.google.adk.runner","c":"FirestoreDatabaseRunner","l":"FirestoreDatabaseRunner(BaseAgent, Firestore)","u":"%3Cinit%3E(com.google.adk.agents.BaseAgent,com.google.cloud.firestore.Firestore)","k":"3"},{"p":"com.google.adk.runner","c":"FirestoreDatabaseRunner","l":"FirestoreDatabaseRunner(BaseAgent, String, Firestore)","u":"%3Cinit%3E(com.google.adk.agents.BaseAgent,java.lang.String,com.google.cloud.firestore.Firestore)","k":"3"},{"p":"com.google.adk.runner","c":"FirestoreDatabaseRunner","l":"FirestoreDatabaseRunner(BaseAgent, String, List, Firestore)","u":"%3Cinit%3E(com.google.adk.agents.BaseAgent,java.lang.String,java.util.List,com.google.cloud.firestore.Firestore)","k":"3"},{"p":"com.google.adk.memory","c":"FirestoreMemoryService","l":"FirestoreMemoryService(Firestore)","u":"%3Cinit%3E(com.google.cloud.firestore.Firestore)","k":"3"},{"p":"com.google.adk.sessions","c":"FirestoreSessionService","l":"FirestoreSessionService(Firestore)","u":"%3Cinit%3E(com.google.cloud.firestore.Firestore)","k":"3"},{"p":"com.google.adk.agents","c":"Planner","l":"firstAction(PlanningContext)","u":"firstAction(com.google.adk.agents.PlanningContext)"},{"p":"com.google.adk.planner.goap","c":"GoalOrientedPlanner","l":"firstAction(PlanningContext)","u":"firstAction(com.google.adk.agents.PlanningContext)"},{"p":"com.google.adk.planner","c":"LoopPlanner","l":"firstAction(PlanningContext)","u":"firstAction(com.google.adk.agents.PlanningContext)"},{"p":"com.google.adk.planner.p2p","c":"P2PPlanner","l":"firstAction(PlanningContext)","u":"firstAction(com.google.adk.agents.PlanningContext)"},{"p":"com.google.adk.planner","c":"ParallelPlanner","l":"firstAction(PlanningContext)","u":"firstAction(com.google.adk.agents.PlanningContext)"},{"p":"com.google.adk.planner","c":"SequentialPlanner","l":"firstAction(PlanningContext)","u":"firstAction(com.google.adk.agents.PlanningContext)"},{"p":"com.google.adk.planner","c":"SupervisorPlanner","l":"firstAction(PlanningContext)","u":"firstAction(com.google.adk.agents.PlanningContext)"},{"p":"com.google.adk.models.springai.error","c":"SpringAIErrorMapper.RetryStrategy","l":"FIXED_DELAY","k":"0"},{"p":"com.example.adkspam","c":"SpamDetectionAgent","l":"flagIssueAsSpam(int, String)","u":"flagIssueAsSpam(int,java.lang.String)","k":"6"},{"p":"com.google.adk.web.service","c":"ApiServerSpanExporter","l":"flush()"},{"p":"com.google.adk.models.chat","c":"ChatCompletionsRequest","l":"frequencyPenalty","k":"1"},{"p":"com.google.adk.agents","c":"BaseAgent","l":"fromConfig(BaseAgentConfig, String)","u":"fromConfig(com.google.adk.agents.BaseAgentConfig,java.lang.String)","k":"6"},{"p":"com.google.adk.tools","c":"ExampleTool","l":"fromConfig(BaseTool.ToolArgsConfig)","u":"fromConfig(com.google.adk.tools.BaseTool.ToolArgsConfig)","k":"6"},{"p":"com.google.adk.tools","c":"AgentTool","l":"fromConfig(BaseTool.ToolArgsConfig, String)","u":"fromConfig(com.google.adk.tools.BaseTool.ToolArgsConfig,java.lang.String)","k":"6"},{"p":"com.google.adk.tools","c":"ExampleTool","l":"fromConfig(BaseTool.ToolArgsConfig, String)","u":"fromConfig(com.google.adk.tools.BaseTool.ToolArgsConfig,java.lang.String)","k":"6"},{"p":"com.google.adk.tools","c":"LongRunningFunctionTool","l":"fromConfig(BaseTool.ToolArgsConfig, String)","u":"fromConfig(com.google.adk.tools.BaseTool.ToolArgsConfig,java.lang.String)","k":"6"},{"p":"com.google.adk.tools","c":"BaseTool","l":"fromConfig(BaseTool.ToolConfig, String)","u":"fromConfig(com.google.adk.tools.BaseTool.ToolConfig,java.lang.String)","k":"6"},{"p":"com.google.adk.tools.mcp","c":"McpToolset","l":"fromConfig(BaseTool.ToolConfig, String)","u":"fromConfig(com.google.adk.tools.BaseTool.ToolConfig,java.lang.String)","k":"6"},{"p":"com.google.adk.agents","c":"LlmAgent","l":"fromConfig(LlmAgentConfig, String)","u":"fromConfig(com.google.adk.agents.LlmAgentConfig,java.lang.String)","k":"6"},{"p":"com.google.adk.agents","c":"LoopAgent","l":"fromConfig(LoopAgentConfig, String)","u":"fromConfig(com.google.adk.agents.LoopAgentConfig,java.lang.String)","k":"6"},{"p":"com.google.adk.agents","c":"ParallelAgent","l":"fromConfig(ParallelAgentConfig, String)","u":"fromConfig(com.google.adk.agents.ParallelAgentConfig,java.lang.String)","k":"6"},{"p":"com.google.adk.agents","c":"SequentialAgent","l":"fromConfig(SequentialAgentConfig, String)","u":"fromConfig(com.google.adk.agents.SequentialAgentConfig,java.lang.String)","k":"6"},{"p":"com.google.adk.agents","c":"ConfigAgentUtils","l":"fromConfig(String)","u":"fromConfig(java.lang.String)","k":"6"},{"p":"com.google.adk.codeexecutors","c":"ContainerCodeExecutor","l":"fromDockerPath(String)","u":"fromDockerPath(java.lang.String)","k":"6"},{"p":"com.google.adk.codeexecutors","c":"ContainerCodeExecutor","l":"fromDockerPath(String, String)","u":"fromDockerPath(java.lang.String,java.lang.String)","k":"6"},{"p":"com.google.adk.a2a.converters","c":"PartConverter","l":"fromGenaiPart(Part, boolean)","u":"fromGenaiPart(com.google.genai.types.Part,boolean)","k":"6"},{"p":"com.google.adk.codeexecutors","c":"ContainerCodeExecutor","l":"fromImage(String)","u":"fromImage(java.lang.String)","k":"6"},{"p":"com.google.adk.codeexecutors","c":"ContainerCodeExecutor","l":"fromImage(String, String)","u":"fromImage(java.lang.String,java.lang.String)","k":"6"},{"p":"com.google.adk.events","c":"Event","l":"fromJson(String)","u":"fromJson(java.lang.String)","k":"6"},{"p":"com.google.adk.sessions","c":"Session","l":"fromJson(String)","u":"fromJson(java.lang.String)","k":"6"},{"p":"com.google.adk.sessions","c":"SessionKey","l":"fromJson(String)","u":"fromJson(java.lang.String)","k":"6"},{"p":"com.google.adk","c":"JsonBaseModel","l":"fromJsonNode(JsonNode, Class)","u":"fromJsonNode(com.fasterxml.jackson.databind.JsonNode,java.lang.Class)","k":"6"},{"p":"com.google.adk.agents","c":"LiveRequest","l":"fromJsonString(String)","u":"fromJsonString(java.lang.String)","k":"6"},{"p":"com.google.adk","c":"JsonBaseModel","l":"fromJsonString(String, Class)","u":"fromJsonString(java.lang.String,java.lang.Class)","k":"6"},{"p":"com.google.adk.models.chat","c":"ChatCompletionsRequest","l":"fromLlmRequest(LlmRequest, boolean)","u":"fromLlmRequest(com.google.adk.models.LlmRequest,boolean)","k":"6"},{"p":"com.google.adk.skills","c":"Frontmatter","l":"Frontmatter()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.skills","c":"InMemorySkillSource.Builder.SkillBuilder","l":"frontmatter(Frontmatter)","u":"frontmatter(com.google.adk.skills.Frontmatter)"},{"p":"com.google.adk.tools","c":"FunctionTool","l":"func()"},{"p":"com.google.adk.a2a.converters","c":"A2ADataPartMetadataType","l":"FUNCTION_CALL","k":"0"},{"p":"com.google.adk.a2a.converters","c":"A2ADataPartMetadataType","l":"FUNCTION_RESPONSE","k":"0"},{"p":"com.google.adk.tools","c":"ToolContext","l":"functionCallId()"},{"p":"com.google.adk.tools","c":"ToolContext.Builder","l":"functionCallId(String)","u":"functionCallId(java.lang.String)"},{"p":"com.google.adk.tools","c":"ToolContext","l":"functionCallId(String)","u":"functionCallId(java.lang.String)"},{"p":"com.google.adk.events","c":"Event","l":"functionCalls()"},{"p":"com.google.adk.telemetry","c":"Instrumentation.TelemetryContext","l":"functionResponseEvent()"},{"p":"com.google.adk.events","c":"Event","l":"functionResponses()"},{"p":"com.google.adk.tools","c":"FunctionTool","l":"FunctionTool(Object, Method, boolean)","u":"%3Cinit%3E(java.lang.Object,java.lang.reflect.Method,boolean)","k":"3"},{"p":"com.google.adk.tools","c":"FunctionTool","l":"FunctionTool(Object, Method, boolean, boolean)","u":"%3Cinit%3E(java.lang.Object,java.lang.reflect.Method,boolean,boolean)","k":"3"},{"p":"com.google.adk.tools","c":"FunctionTool","l":"FunctionTool(Object, Method, boolean, boolean, ObjectMapper)","u":"%3Cinit%3E(java.lang.Object,java.lang.reflect.Method,boolean,boolean,com.fasterxml.jackson.databind.ObjectMapper)","k":"3"},{"p":"com.google.adk.tools","c":"FunctionTool","l":"FunctionTool(Object, Method, boolean, ObjectMapper)","u":"%3Cinit%3E(java.lang.Object,java.lang.reflect.Method,boolean,com.fasterxml.jackson.databind.ObjectMapper)","k":"3"},{"p":"com.google.adk.artifacts","c":"GcsArtifactService","l":"GcsArtifactService(String, Storage)","u":"%3Cinit%3E(java.lang.String,com.google.cloud.storage.Storage)","k":"3"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryLoggerConfig","l":"gcsBucketName()"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryLoggerConfig.Builder","l":"gcsBucketName(String)","u":"gcsBucketName(java.lang.String)"},{"p":"com.google.adk.models","c":"Gemini","l":"Gemini(String, Client)","u":"%3Cinit%3E(java.lang.String,com.google.genai.Client)","k":"3"},{"p":"com.google.adk.models","c":"Gemini","l":"Gemini(String, String)","u":"%3Cinit%3E(java.lang.String,java.lang.String)","k":"3"},{"p":"com.google.adk.models","c":"Gemini","l":"Gemini(String, VertexCredentials)","u":"%3Cinit%3E(java.lang.String,com.google.adk.models.VertexCredentials)","k":"3"},{"p":"com.google.adk.models","c":"ApigeeLlm.ApiType","l":"GENAI","k":"0"},{"p":"com.google.adk.a2a.common","c":"GenAiFieldMissingException","l":"GenAiFieldMissingException(String)","u":"%3Cinit%3E(java.lang.String)","k":"3"},{"p":"com.google.adk.a2a.common","c":"GenAiFieldMissingException","l":"GenAiFieldMissingException(String, Throwable)","u":"%3Cinit%3E(java.lang.String,java.lang.Throwable)","k":"3"},{"p":"com.google.adk.flows.llmflows","c":"Functions","l":"generateClientFunctionCallId()","k":"6"},{"p":"com.google.adk.models","c":"FunctionCallIds","l":"generateClientFunctionCallId()","k":"6"},{"p":"com.google.adk.models","c":"ApigeeLlm","l":"generateContent(LlmRequest, boolean)","u":"generateContent(com.google.adk.models.LlmRequest,boolean)"},{"p":"com.google.adk.models","c":"BaseLlm","l":"generateContent(LlmRequest, boolean)","u":"generateContent(com.google.adk.models.LlmRequest,boolean)"},{"p":"com.google.adk.models","c":"Claude","l":"generateContent(LlmRequest, boolean)","u":"generateContent(com.google.adk.models.LlmRequest,boolean)"},{"p":"com.google.adk.models","c":"Gemini","l":"generateContent(LlmRequest, boolean)","u":"generateContent(com.google.adk.models.LlmRequest,boolean)"},{"p":"com.google.adk.models.langchain4j","c":"LangChain4j","l":"generateContent(LlmRequest, boolean)","u":"generateContent(com.google.adk.models.LlmRequest,boolean)"},{"p":"com.google.adk.models.springai","c":"SpringAI","l":"generateContent(LlmRequest, boolean)","u":"generateContent(com.google.adk.models.LlmRequest,boolean)"},{"p":"com.google.adk.agents","c":"LlmAgent","l":"generateContentConfig()"},{"p":"com.google.adk.agents","c":"LlmAgentConfig","l":"generateContentConfig()"},{"p":"com.google.adk.agents","c":"LlmAgent.Builder","l":"generateContentConfig(GenerateContentConfig)","u":"generateContentConfig(com.google.genai.types.GenerateContentConfig)"},{"p":"com.google.adk.events","c":"Event","l":"generateEventId()","k":"6"},{"p":"com.google.adk.flows.llmflows","c":"Functions","l":"generateRequestConfirmationEvent(InvocationContext, Event, Event)","u":"generateRequestConfirmationEvent(com.google.adk.agents.InvocationContext,com.google.adk.events.Event,com.google.adk.events.Event)","k":"6"},{"p":"com.google.adk.agents","c":"LiveRequestQueue","l":"get()"},{"p":"com.google.adk.sessions","c":"State","l":"get(Object)","u":"get(java.lang.Object)"},{"p":"com.google.adk.utils","c":"ComponentRegistry","l":"get(String)","u":"get(java.lang.String)"},{"p":"com.google.adk.utils","c":"ComponentRegistry","l":"get(String, Class)","u":"get(java.lang.String,java.lang.Class)"},{"p":"com.google.adk.models.springai","c":"StreamingResponseAggregator","l":"getAccumulatedTextLength()"},{"p":"com.google.adk.tools.applicationintegrationtoolset","c":"ConnectionsClient","l":"getActionOperation(String, String, String, String, String)","u":"getActionOperation(java.lang.String,java.lang.String,java.lang.String,java.lang.String,java.lang.String)","k":"6"},{"p":"com.google.adk.tools.applicationintegrationtoolset","c":"ConnectionsClient","l":"getActionSchema(String)","u":"getActionSchema(java.lang.String)"},{"p":"com.google.adk.tools","c":"BaseTool.ToolArgsConfig","l":"getAdditionalProperties()"},{"p":"com.google.adk.agents","c":"CallbackUtil","l":"getAfterAgentCallbacks(List)","u":"getAfterAgentCallbacks(java.util.List)","k":"6"},{"p":"com.google.adk.tools","c":"AgentTool","l":"getAgent()"},{"p":"com.google.adk.utils","c":"AdkComponentProvider","l":"getAgentClasses()"},{"p":"com.google.adk.utils","c":"CoreAdkComponentProvider","l":"getAgentClasses()"},{"p":"com.google.adk.web","c":"AgentGraphGenerator","l":"getAgentGraphDotSource(BaseAgent, List)","u":"getAgentGraphDotSource(com.google.adk.agents.BaseAgent,java.util.List)","k":"6"},{"p":"com.google.adk.web.service","c":"ApiServerSpanExporter","l":"getAllExportedSpans()"},{"p":"com.google.adk.web.dto","c":"AgentRunRequest","l":"getAppName()"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQuerySchema","l":"getArrowSchema()","k":"6"},{"p":"com.google.adk.flows.llmflows","c":"Functions","l":"getAskUserConfirmationFunctionCalls(Event)","u":"getAskUserConfirmationFunctionCalls(com.google.adk.events.Event)","k":"6"},{"p":"com.google.adk.agents","c":"CallbackUtil","l":"getBeforeAgentCallbacks(List)","u":"getBeforeAgentCallbacks(java.util.List)","k":"6"},{"p":"com.google.adk.web.config","c":"AgentLoadingProperties","l":"getBuildOutputDirs()"},{"p":"com.google.adk.models.springai.error","c":"SpringAIErrorMapper.MappedError","l":"getCategory()"},{"p":"com.example.github","c":"GitHubTools","l":"getChangedFiles(String, String, String, String, String)","u":"getChangedFiles(java.lang.String,java.lang.String,java.lang.String,java.lang.String,java.lang.String)","k":"6"},{"p":"com.google.adk.tools.applicationintegrationtoolset","c":"ConnectionsClient","l":"getConnectionDetails()"},{"p":"com.google.adk.tools.applicationintegrationtoolset","c":"ConnectionsClient","l":"getConnectorBaseSpec()","k":"6"},{"p":"com.google.adk.telemetry","c":"Instrumentation.AgentInvocation","l":"getCtx()"},{"p":"com.google.adk.plugins.agentanalytics","c":"TraceManager","l":"getCurrentSpanAndParent(InvocationContext)","u":"getCurrentSpanAndParent(com.google.adk.agents.InvocationContext)"},{"p":"com.google.adk.plugins.agentanalytics","c":"TraceManager","l":"getCurrentSpanId(InvocationContext)","u":"getCurrentSpanId(com.google.adk.agents.InvocationContext)"},{"p":"com.google.adk.tutorials","c":"CityTimeWeather","l":"getCurrentTime(String)","u":"getCurrentTime(java.lang.String)","k":"6"},{"p":"com.google.adk.models.springai","c":"ToolConverter.ToolMetadata","l":"getDeclaration()"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQuerySchema","l":"getDefaultClusteringFields()","k":"6"},{"p":"com.google.adk.planner.goap","c":"GoalOrientedSearchGraph","l":"getDependencies(String)","u":"getDependencies(java.lang.String)"},{"p":"com.google.adk.models.springai","c":"ToolConverter.ToolMetadata","l":"getDescription()"},{"p":"com.google.adk.web.dto","c":"GraphResponse","l":"getDotSrc()"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryAgentAnalyticsPlugin","l":"getDropStats()"},{"p":"com.google.adk.models.springai","c":"SpringAIEmbedding","l":"getEmbeddingModel()"},{"p":"com.google.adk.tools.applicationintegrationtoolset","c":"ConnectionsClient","l":"getEntitySchemaAndOperations(String)","u":"getEntitySchemaAndOperations(java.lang.String)"},{"p":"com.google.adk.skills","c":"SkillSourceException","l":"getErrorCode()"},{"p":"com.google.adk.codeexecutors","c":"CodeExecutorContext","l":"getErrorCount(String)","u":"getErrorCount(java.lang.String)"},{"p":"com.google.adk.web.dto","c":"AddSessionToEvalSetRequest","l":"getEvalId()"},{"p":"com.google.adk.web.dto","c":"RunEvalRequest","l":"getEvalIds()"},{"p":"com.google.adk.web.dto","c":"RunEvalRequest","l":"getEvalMetrics()"},{"p":"com.google.adk.web.controller","c":"EvaluationController","l":"getEvalResult(String, String)","u":"getEvalResult(java.lang.String,java.lang.String)"},{"p":"com.google.adk.web.controller","c":"GraphController","l":"getEventGraph(String, String, String, String)","u":"getEventGraph(java.lang.String,java.lang.String,java.lang.String,java.lang.String)"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQuerySchema","l":"getEventsSchema()","k":"6"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQuerySchema","l":"getEventsTableSchema()","k":"6"},{"p":"com.google.adk.web.service","c":"ApiServerSpanExporter","l":"getEventTraceAttributes(String)","u":"getEventTraceAttributes(java.lang.String)"},{"p":"com.google.adk.examples","c":"BaseExampleProvider","l":"getExamples(String)","u":"getExamples(java.lang.String)"},{"p":"com.google.adk.codeexecutors","c":"CodeExecutorContext","l":"getExecutionId()"},{"p":"com.example.github","c":"GitHubTools","l":"getFileContent(String, String, String)","u":"getFileContent(java.lang.String,java.lang.String,java.lang.String)","k":"6"},{"p":"com.example.github","c":"GitHubTools","l":"getFileDiff(String, String, String, String, String)","u":"getFileDiff(java.lang.String,java.lang.String,java.lang.String,java.lang.String,java.lang.String)","k":"6"},{"p":"com.google.adk.models.springai","c":"StreamingResponseAggregator","l":"getFinalResponse()"},{"p":"com.google.adk.utils","c":"FirestoreProperties","l":"getFirebaseRootCollectionName()"},{"p":"com.google.adk.models","c":"LlmRequest","l":"getFirstSystemInstruction()"},{"p":"com.google.adk.plugins.agentanalytics","c":"TraceManager","l":"getFirstTokenTime(String)","u":"getFirstTokenTime(java.lang.String)"},{"p":"com.google.adk.utils","c":"FirestoreProperties","l":"getGcsAdkBucketName()"},{"p":"com.google.adk.tools.applicationintegrationtoolset","c":"CredentialsHelper","l":"getGoogleCredentials(String)","u":"getGoogleCredentials(java.lang.String)"},{"p":"com.google.adk.tools.applicationintegrationtoolset","c":"GoogleCredentialsHelper","l":"getGoogleCredentials(String)","u":"getGoogleCredentials(java.lang.String)"},{"p":"com.google.adk.codeexecutors","c":"CodeExecutorContext","l":"getInputFiles()"},{"p":"com.google.adk.utils","c":"ComponentRegistry","l":"getInstance()","k":"6"},{"p":"com.google.adk.utils","c":"FirestoreProperties","l":"getInstance()","k":"6"},{"p":"com.google.adk.agents","c":"Instruction.Provider","l":"getInstruction()"},{"p":"com.example.github","c":"GitHubTools","l":"getIssue(String, String, int)","u":"getIssue(java.lang.String,java.lang.String,int)","k":"6"},{"p":"com.example.github","c":"GitHubTools","l":"getIssueComments(String, String, int)","u":"getIssueComments(java.lang.String,java.lang.String,int)","k":"6"},{"p":"com.example.adkstale","c":"AdkStaleAgent","l":"getIssueState(int)","k":"6"},{"p":"com.google.adk.sessions","c":"Session","l":"getLastUpdateTimeAsDouble()"},{"p":"com.google.adk.models","c":"LlmRegistry","l":"getLlm(String)","u":"getLlm(java.lang.String)","k":"6"},{"p":"com.google.adk.flows.llmflows","c":"Functions","l":"getLongRunningFunctionCalls(List, Map)","u":"getLongRunningFunctionCalls(java.util.List,java.util.Map)","k":"6"},{"p":"com.google.adk","c":"JsonBaseModel","l":"getMapper()","k":"6"},{"p":"com.google.adk.models.springai.properties","c":"SpringAIProperties","l":"getMaxTokens()"},{"p":"com.google.adk.tools.mcp","c":"AbstractMcpTool","l":"getMcpSession()"},{"p":"com.google.adk.models.springai.observability","c":"SpringAIObservabilityHandler","l":"getMeterRegistry()"},{"p":"com.google.adk.models.springai.properties","c":"SpringAIProperties","l":"getModel()"},{"p":"com.google.adk.models.springai.observability","c":"SpringAIObservabilityHandler.RequestContext","l":"getModelName()"},{"p":"com.google.adk.models.springai","c":"ToolConverter.ToolMetadata","l":"getName()"},{"p":"com.google.adk.plugins","c":"BasePlugin","l":"getName()"},{"p":"com.google.adk.plugins","c":"Plugin","l":"getName()"},{"p":"com.google.adk.web.dto","c":"AgentRunRequest","l":"getNewMessage()"},{"p":"com.google.adk.models.springai.error","c":"SpringAIErrorMapper.MappedError","l":"getNormalizedMessage()"},{"p":"com.google.adk.models.springai.properties","c":"SpringAIProperties","l":"getObservability()"},{"p":"com.google.adk.tools.applicationintegrationtoolset","c":"ConnectionsClient","l":"getOperation(String, String, String, String)","u":"getOperation(java.lang.String,java.lang.String,java.lang.String,java.lang.String)","k":"6"},{"p":"com.google.adk.tools.applicationintegrationtoolset","c":"ConnectionsClient","l":"getOperationRequest()","k":"6"},{"p":"com.google.adk.internal.http","c":"HttpClientFactory","l":"getOrCreateSharedHttpClient(String)","u":"getOrCreateSharedHttpClient(java.lang.String)","k":"6"},{"p":"com.google.adk.tools","c":"BaseTool.ToolArgsConfig","l":"getOrDefault(String, T)","u":"getOrDefault(java.lang.String,T)"},{"p":"com.google.adk.tools","c":"BaseTool.ToolArgsConfig","l":"getOrEmpty(String, TypeReference)","u":"getOrEmpty(java.lang.String,com.fasterxml.jackson.core.type.TypeReference)"},{"p":"com.google.adk.models","c":"GeminiUtil","l":"getPart0FromLlmResponse(LlmResponse)","u":"getPart0FromLlmResponse(com.google.adk.models.LlmResponse)","k":"6"},{"p":"com.google.adk.plugins","c":"PluginManager","l":"getPlugin(String)","u":"getPlugin(java.lang.String)"},{"p":"com.google.adk.plugins","c":"PluginManager","l":"getPlugins()"},{"p":"com.google.adk.codeexecutors","c":"CodeExecutorContext","l":"getProcessedFileNames()"},{"p":"com.google.adk.planner.goap","c":"GoalOrientedSearchGraph","l":"getProducerAgent(String)","u":"getProducerAgent(java.lang.String)"},{"p":"com.google.adk.utils","c":"FirestoreProperties","l":"getProperty(String)","u":"getProperty(java.lang.String)"},{"p":"com.example.github","c":"GitHubTools","l":"getPullRequest(String, String, int)","u":"getPullRequest(java.lang.String,java.lang.String,int)","k":"6"},{"p":"com.example.adkprtriaging","c":"AdkPrTriagingAgent","l":"getPullRequestDetails(int)","k":"6"},{"p":"com.google.adk.models.springai.observability","c":"SpringAIObservabilityHandler.RequestContext","l":"getRequestType()"},{"p":"com.google.adk.sessions","c":"ApiResponse","l":"getResponseBody()"},{"p":"com.google.adk.sessions","c":"HttpApiResponse","l":"getResponseBody()"},{"p":"com.google.adk.models.springai.error","c":"SpringAIErrorMapper.MappedError","l":"getRetryDelay(int)"},{"p":"com.google.adk.models.springai.error","c":"SpringAIErrorMapper","l":"getRetryDelay(SpringAIErrorMapper.RetryStrategy, int)","u":"getRetryDelay(com.google.adk.models.springai.error.SpringAIErrorMapper.RetryStrategy,int)","k":"6"},{"p":"com.google.adk.models.springai.error","c":"SpringAIErrorMapper.MappedError","l":"getRetryStrategy()"},{"p":"com.google.adk.plugins.agentanalytics","c":"TraceManager","l":"getRootAgentName()"},{"p":"com.google.adk.web.service","c":"RunnerService","l":"getRunner(String)","u":"getRunner(java.lang.String)"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQuerySchema","l":"getSerializedArrowSchema()","k":"6"},{"p":"com.google.adk.sessions","c":"BaseSessionService","l":"getSession(SessionKey, GetSessionConfig)","u":"getSession(com.google.adk.sessions.SessionKey,com.google.adk.sessions.GetSessionConfig)"},{"p":"com.google.adk.web.controller","c":"SessionController","l":"getSession(String, String, String)","u":"getSession(java.lang.String,java.lang.String,java.lang.String)"},{"p":"com.google.adk.sessions","c":"BaseSessionService","l":"getSession(String, String, String, Optional)","u":"getSession(java.lang.String,java.lang.String,java.lang.String,java.util.Optional)"},{"p":"com.google.adk.sessions","c":"FirestoreSessionService","l":"getSession(String, String, String, Optional)","u":"getSession(java.lang.String,java.lang.String,java.lang.String,java.util.Optional)"},{"p":"com.google.adk.sessions","c":"InMemorySessionService","l":"getSession(String, String, String, Optional)","u":"getSession(java.lang.String,java.lang.String,java.lang.String,java.util.Optional)"},{"p":"com.google.adk.sessions","c":"VertexAiSessionService","l":"getSession(String, String, String, Optional)","u":"getSession(java.lang.String,java.lang.String,java.lang.String,java.util.Optional)"},{"p":"com.google.adk.sessions","c":"GetSessionConfig","l":"GetSessionConfig()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.web.dto","c":"AddSessionToEvalSetRequest","l":"getSessionId()"},{"p":"com.google.adk.web.dto","c":"AgentRunRequest","l":"getSessionId()"},{"p":"com.google.adk.web.service","c":"ApiServerSpanExporter","l":"getSessionToTraceIdsMap()"},{"p":"com.google.adk.web.controller","c":"DebugController","l":"getSessionTrace(String)","u":"getSessionTrace(java.lang.String)"},{"p":"com.google.adk.web.config","c":"AgentLoadingProperties","l":"getSourceDir()"},{"p":"com.google.adk.models.springai.observability","c":"SpringAIObservabilityHandler.RequestContext","l":"getStartTime()"},{"p":"com.google.adk.plugins.agentanalytics","c":"TraceManager","l":"getStartTime(String)","u":"getStartTime(java.lang.String)"},{"p":"com.google.adk.web.dto","c":"SessionRequest","l":"getState()"},{"p":"com.google.adk.codeexecutors","c":"CodeExecutorContext","l":"getStateDelta()"},{"p":"com.google.adk.web.dto","c":"AgentRunRequest","l":"getStateDelta()"},{"p":"com.google.adk.utils","c":"FirestoreProperties","l":"getStopWords()"},{"p":"com.google.adk.web.dto","c":"AgentRunRequest","l":"getStreaming()"},{"p":"com.google.adk.flows.llmflows","c":"OutputSchema","l":"getStructuredModelResponse(Event)","u":"getStructuredModelResponse(com.google.adk.events.Event)","k":"6"},{"p":"com.google.adk.models","c":"LlmRequest","l":"getSystemInstructions()"},{"p":"com.google.adk.models.springai.properties","c":"SpringAIProperties","l":"getTemperature()"},{"p":"com.google.adk.models","c":"GeminiUtil","l":"getTextFromLlmResponse(LlmResponse)","u":"getTextFromLlmResponse(com.google.adk.models.LlmResponse)","k":"6"},{"p":"com.google.adk.models.springai.observability","c":"SpringAIObservabilityHandler.RequestContext","l":"getTimerSample()"},{"p":"com.google.adk.utils","c":"AdkComponentProvider","l":"getToolClasses()"},{"p":"com.google.adk.utils","c":"CoreAdkComponentProvider","l":"getToolClasses()"},{"p":"com.google.adk.utils","c":"AdditionalAdkComponentProvider","l":"getToolInstances()"},{"p":"com.google.adk.utils","c":"AdkComponentProvider","l":"getToolInstances()"},{"p":"com.google.adk.utils","c":"CoreAdkComponentProvider","l":"getToolInstances()"},{"p":"com.google.adk.utils","c":"ComponentRegistry","l":"getToolNamesWithPrefix(String)","u":"getToolNamesWithPrefix(java.lang.String)"},{"p":"com.google.adk.models.springai","c":"MessageConverter","l":"getToolRegistry(LlmRequest)","u":"getToolRegistry(com.google.adk.models.LlmRequest)"},{"p":"com.google.adk.tools.applicationintegrationtoolset","c":"ApplicationIntegrationToolset","l":"getTools(ReadonlyContext)","u":"getTools(com.google.adk.agents.ReadonlyContext)"},{"p":"com.google.adk.tools","c":"BaseToolset","l":"getTools(ReadonlyContext)","u":"getTools(com.google.adk.agents.ReadonlyContext)"},{"p":"com.google.adk.tools.computeruse","c":"ComputerUseToolset","l":"getTools(ReadonlyContext)","u":"getTools(com.google.adk.agents.ReadonlyContext)"},{"p":"com.google.adk.tools.mcp","c":"McpAsyncToolset","l":"getTools(ReadonlyContext)","u":"getTools(com.google.adk.agents.ReadonlyContext)"},{"p":"com.google.adk.tools.mcp","c":"McpToolset","l":"getTools(ReadonlyContext)","u":"getTools(com.google.adk.agents.ReadonlyContext)"},{"p":"com.google.adk.tools.skills","c":"SkillToolset","l":"getTools(ReadonlyContext)","u":"getTools(com.google.adk.agents.ReadonlyContext)"},{"p":"com.google.adk.utils","c":"AdditionalAdkComponentProvider","l":"getToolsetClasses()"},{"p":"com.google.adk.utils","c":"AdkComponentProvider","l":"getToolsetClasses()"},{"p":"com.google.adk.models.springai.properties","c":"SpringAIProperties","l":"getTopK()"},{"p":"com.google.adk.models.springai.properties","c":"SpringAIProperties","l":"getTopP()"},{"p":"com.google.adk.web.controller","c":"DebugController","l":"getTraceDict(String)","u":"getTraceDict(java.lang.String)"},{"p":"com.google.adk.plugins.agentanalytics","c":"TraceManager","l":"getTraceId(InvocationContext)","u":"getTraceId(com.google.adk.agents.InvocationContext)"},{"p":"com.google.adk.telemetry","c":"Tracing","l":"getTracer()","k":"6"},{"p":"com.google.adk.agents","c":"ContextCacheConfig","l":"getTtlString()"},{"p":"com.google.adk.a2a.converters","c":"A2ADataPartMetadataType","l":"getType()"},{"p":"com.google.adk.a2a.converters","c":"A2AMetadataKey","l":"getType()"},{"p":"com.google.adk.a2a.converters","c":"AdkMetadataKey","l":"getType()"},{"p":"com.google.adk.web.dto","c":"AddSessionToEvalSetRequest","l":"getUserId()"},{"p":"com.google.adk.web.dto","c":"AgentRunRequest","l":"getUserId()"},{"p":"com.google.adk.models.springai.properties","c":"SpringAIProperties","l":"getValidation()"},{"p":"com.google.adk.a2a.common","c":"A2AMetadata.Key","l":"getValue()"},{"p":"com.google.adk.tutorials","c":"CityTimeWeather","l":"getWeather(String)","u":"getWeather(java.lang.String)","k":"6"},{"p":"com.google.adk.tutorials","c":"LiveAudioSingleAgent","l":"getWeather(String)","u":"getWeather(java.lang.String)","k":"6"},{"p":"com.example.adkprtriaging","c":"Settings","l":"githubToken()","k":"6"},{"p":"com.example.adkspam","c":"Settings","l":"githubToken()","k":"6"},{"p":"com.example.adkstale","c":"Settings","l":"githubToken()","k":"6"},{"p":"com.example.adktriaging","c":"Settings","l":"githubToken()","k":"6"},{"p":"com.google.adk.agents","c":"LlmAgent","l":"globalInstruction()"},{"p":"com.google.adk.agents","c":"LlmAgent.Builder","l":"globalInstruction(Instruction)","u":"globalInstruction(com.google.adk.agents.Instruction)"},{"p":"com.google.adk.agents","c":"LlmAgent.Builder","l":"globalInstruction(String)","u":"globalInstruction(java.lang.String)"},{"p":"com.google.adk.plugins","c":"GlobalInstructionPlugin","l":"GlobalInstructionPlugin(Function)","u":"%3Cinit%3E(java.util.function.Function)","k":"3"},{"p":"com.google.adk.plugins","c":"GlobalInstructionPlugin","l":"GlobalInstructionPlugin(Function, String)","u":"%3Cinit%3E(java.util.function.Function,java.lang.String)","k":"3"},{"p":"com.google.adk.plugins","c":"GlobalInstructionPlugin","l":"GlobalInstructionPlugin(String)","u":"%3Cinit%3E(java.lang.String)","k":"3"},{"p":"com.google.adk.plugins","c":"GlobalInstructionPlugin","l":"GlobalInstructionPlugin(String, String)","u":"%3Cinit%3E(java.lang.String,java.lang.String)","k":"3"},{"p":"com.google.adk.planner.goap","c":"GoalOrientedPlanner","l":"GoalOrientedPlanner(String, List)","u":"%3Cinit%3E(java.lang.String,java.util.List)","k":"3"},{"p":"com.google.adk.planner.goap","c":"GoalOrientedPlanner","l":"GoalOrientedPlanner(String, List, boolean)","u":"%3Cinit%3E(java.lang.String,java.util.List,boolean)","k":"3"},{"p":"com.google.adk.planner.goap","c":"GoalOrientedPlanner","l":"GoalOrientedPlanner(String, List, SearchStrategy, ReplanPolicy)","u":"%3Cinit%3E(java.lang.String,java.util.List,com.google.adk.planner.goap.SearchStrategy,com.google.adk.planner.goap.ReplanPolicy)","k":"3"},{"p":"com.google.adk.planner.goap","c":"GoalOrientedSearchGraph","l":"GoalOrientedSearchGraph(List)","u":"%3Cinit%3E(java.util.List)","k":"3"},{"p":"com.google.adk.tools.computeruse","c":"BaseComputer","l":"goBack()"},{"p":"com.google.adk.tools.computeruse","c":"BaseComputer","l":"goForward()"},{"p":"com.google.adk.tools.applicationintegrationtoolset","c":"GoogleCredentialsHelper","l":"GoogleCredentialsHelper()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.tools","c":"GoogleMapsTool","l":"GoogleMapsTool()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.tools","c":"GoogleSearchAgentTool","l":"GoogleSearchAgentTool(LlmAgent)","u":"%3Cinit%3E(com.google.adk.agents.LlmAgent)","k":"3"},{"p":"com.google.adk.tools","c":"GoogleSearchTool","l":"GoogleSearchTool()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.web.controller","c":"GraphController","l":"GraphController(BaseSessionService, AgentLoader)","u":"%3Cinit%3E(com.google.adk.sessions.BaseSessionService,com.google.adk.web.AgentLoader)","k":"3"},{"p":"com.example.adkstale","c":"Settings","l":"graphqlCommentLimit()","k":"6"},{"p":"com.example.adkstale","c":"Settings","l":"graphqlEditLimit()","k":"6"},{"p":"com.example.adkstale","c":"Settings","l":"graphqlTimelineLimit()","k":"6"},{"p":"com.google.adk.web.dto","c":"GraphResponse","l":"GraphResponse()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.web.dto","c":"GraphResponse","l":"GraphResponse(String)","u":"%3Cinit%3E(java.lang.String)","k":"3"},{"p":"com.google.adk.a2a.converters","c":"A2AMetadataKey","l":"GROUNDING_METADATA","k":"0"},{"p":"com.google.adk.events","c":"Event","l":"groundingMetadata()"},{"p":"com.google.adk.models","c":"LlmResponse","l":"groundingMetadata()"},{"p":"com.google.adk.events","c":"Event.Builder","l":"groundingMetadata(GroundingMetadata)","u":"groundingMetadata(com.google.genai.types.GroundingMetadata)"},{"p":"com.google.adk.models","c":"LlmResponse.Builder","l":"groundingMetadata(GroundingMetadata)","u":"groundingMetadata(com.google.genai.types.GroundingMetadata)"},{"p":"com.google.adk.agents","c":"RunConfig","l":"groupFunctionResponsesInHistory()"},{"p":"com.google.adk.agents","c":"RunConfig.Builder","l":"groupFunctionResponsesInHistory(boolean)"},{"p":"com.google.adk.agents","c":"RunConfig","l":"groupFunctionResponsesInHistoryOverride()"},{"p":"com.google.adk.agents","c":"RunConfig.Builder","l":"groupFunctionResponsesInHistoryOverride(boolean)"},{"p":"com.google.adk.agents","c":"RunConfig.Builder","l":"groupFunctionResponsesInHistoryOverride(Optional)","u":"groupFunctionResponsesInHistoryOverride(java.util.Optional)"},{"p":"com.example.adktriaging","c":"Settings","l":"gtechAssignees()","k":"6"},{"p":"com.example.adktriaging","c":"AdkTriagingAgent","l":"gtechRotation()","k":"6"},{"p":"com.google.adk.flows.llmflows","c":"Functions","l":"handleFunctionCalls(InvocationContext, Event, Map)","u":"handleFunctionCalls(com.google.adk.agents.InvocationContext,com.google.adk.events.Event,java.util.Map)","k":"6"},{"p":"com.google.adk.flows.llmflows","c":"Functions","l":"handleFunctionCalls(InvocationContext, Event, Map, Map)","u":"handleFunctionCalls(com.google.adk.agents.InvocationContext,com.google.adk.events.Event,java.util.Map,java.util.Map)","k":"6"},{"p":"com.google.adk.flows.llmflows","c":"Functions","l":"handleFunctionCallsLive(InvocationContext, Event, Map)","u":"handleFunctionCallsLive(com.google.adk.agents.InvocationContext,com.google.adk.events.Event,java.util.Map)","k":"6"},{"p":"com.google.adk.flows.llmflows","c":"Functions","l":"handleFunctionCallsLive(InvocationContext, Event, Map, Map)","u":"handleFunctionCallsLive(com.google.adk.agents.InvocationContext,com.google.adk.events.Event,java.util.Map,java.util.Map)","k":"6"},{"p":"com.google.adk.telemetry","c":"Instrumentation.AgentInvocation","l":"handleMetricsError(RuntimeException)","u":"handleMetricsError(java.lang.RuntimeException)"},{"p":"com.google.adk.telemetry","c":"Instrumentation.ClosableTelemetryScope","l":"handleMetricsError(RuntimeException)","u":"handleMetricsError(java.lang.RuntimeException)"},{"p":"com.google.adk.telemetry","c":"Instrumentation.ToolExecution","l":"handleMetricsError(RuntimeException)","u":"handleMetricsError(java.lang.RuntimeException)"},{"p":"com.google.adk.web.websocket","c":"LiveWebSocketHandler","l":"handleTextMessage(WebSocketSession, TextMessage)","u":"handleTextMessage(org.springframework.web.socket.WebSocketSession,org.springframework.web.socket.TextMessage)"},{"p":"com.google.adk.web.websocket","c":"LiveWebSocketHandler","l":"handleTransportError(WebSocketSession, Throwable)","u":"handleTransportError(org.springframework.web.socket.WebSocketSession,java.lang.Throwable)"},{"p":"com.google.adk.sessions","c":"State","l":"hasDelta()"},{"p":"com.example.adkprtriaging","c":"Settings","l":"hasGithubToken()","k":"6"},{"p":"com.example.adkspam","c":"Settings","l":"hasGithubToken()","k":"6"},{"p":"com.example.adkstale","c":"Settings","l":"hasGithubToken()","k":"6"},{"p":"com.example.adktriaging","c":"Settings","l":"hasGithubToken()","k":"6"},{"p":"com.google.adk.agents","c":"ContextCacheConfig","l":"hashCode()"},{"p":"com.google.adk.agents","c":"Instruction.Provider","l":"hashCode()"},{"p":"com.google.adk.agents","c":"Instruction.Static","l":"hashCode()"},{"p":"com.google.adk.agents","c":"InvocationContext","l":"hashCode()"},{"p":"com.google.adk.agents","c":"PlannerAction.Done","l":"hashCode()"},{"p":"com.google.adk.agents","c":"PlannerAction.DoneWithResult","l":"hashCode()"},{"p":"com.google.adk.agents","c":"PlannerAction.NoOp","l":"hashCode()"},{"p":"com.google.adk.agents","c":"PlannerAction.RunAgents","l":"hashCode()"},{"p":"com.google.adk.events","c":"Event","l":"hashCode()"},{"p":"com.google.adk.events","c":"EventActions","l":"hashCode()"},{"p":"com.google.adk.planner.goap","c":"AgentMetadata","l":"hashCode()"},{"p":"com.google.adk.planner.goap","c":"ReplanPolicy.FailStop","l":"hashCode()"},{"p":"com.google.adk.planner.goap","c":"ReplanPolicy.Ignore","l":"hashCode()"},{"p":"com.google.adk.planner.goap","c":"ReplanPolicy.Replan","l":"hashCode()"},{"p":"com.google.adk.sessions","c":"SessionKey","l":"hashCode()"},{"p":"com.google.adk.sessions","c":"State","l":"hashCode()"},{"p":"com.google.adk.summarizer","c":"EventsCompactionConfig","l":"hashCode()"},{"p":"com.google.adk.tools.computeruse","c":"ComputerState","l":"hashCode()"},{"p":"com.google.adk.tools","c":"LoadMemoryResponse","l":"hashCode()"},{"p":"com.google.adk.web.config","c":"AdkWebCorsProperties","l":"hashCode()"},{"p":"com.google.adk.flows.llmflows","c":"Functions","l":"hasPendingLongRunningCall(Event)","u":"hasPendingLongRunningCall(com.google.adk.events.Event)","k":"6"},{"p":"com.google.adk.events","c":"Event","l":"hasPendingLongRunningToolCall()"},{"p":"com.google.adk.summarizer","c":"EventsCompactionConfig","l":"hasSlidingWindowCompactionConfig()"},{"p":"com.google.adk.events","c":"Event","l":"hasTrailingCodeExecutionResult()"},{"p":"com.google.adk.tools.mcp","c":"SseServerParameters","l":"headers()"},{"p":"com.google.adk.tools.mcp","c":"StreamableHttpServerParameters","l":"headers()"},{"p":"com.google.adk.web.config","c":"AdkWebCorsProperties","l":"headers()"},{"p":"com.google.adk.tools.mcp","c":"SseServerParameters.Builder","l":"headers(Map)","u":"headers(java.util.Map)"},{"p":"com.google.adk.tools.mcp","c":"StreamableHttpServerParameters.Builder","l":"headers(Map)","u":"headers(java.util.Map)"},{"p":"com.google.adk.google_adk_maven_plugin","c":"HelpMojo","l":"HelpMojo()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.events","c":"ToolConfirmation","l":"hint()"},{"p":"com.google.adk.events","c":"ToolConfirmation.Builder","l":"hint(String)","u":"hint(java.lang.String)"},{"p":"com.google.adk.tools.applicationintegrationtoolset","c":"ConnectionsClient.ConnectionDetails","l":"host","k":"1"},{"p":"com.google.adk.tools.computeruse","c":"BaseComputer","l":"hoverAt(int, int)","u":"hoverAt(int,int)"},{"p":"com.google.adk.sessions","c":"HttpApiResponse","l":"HttpApiResponse(Response)","u":"%3Cinit%3E(okhttp3.Response)","k":"3"},{"p":"com.google.adk.models","c":"Gemini.Builder","l":"httpExecutorService(ExecutorService)","u":"httpExecutorService(java.util.concurrent.ExecutorService)"},{"p":"com.google.adk.a2a.converters","c":"PartConverter","l":"ID_KEY","k":"2"},{"p":"com.google.adk.events","c":"Event","l":"id()"},{"p":"com.google.adk.sessions","c":"Session","l":"id()"},{"p":"com.google.adk.sessions","c":"SessionKey","l":"id()"},{"p":"com.google.adk.events","c":"Event.Builder","l":"id(String)","u":"id(java.lang.String)"},{"p":"com.google.adk.sessions","c":"Session.Builder","l":"id(String)","u":"id(java.lang.String)"},{"p":"com.google.adk.flows.llmflows","c":"Identity","l":"Identity()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.planner.goap","c":"ReplanPolicy.Ignore","l":"Ignore()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.models.springai.error","c":"SpringAIErrorMapper.RetryStrategy","l":"IMMEDIATE_RETRY","k":"0"},{"p":"com.google.adk.agents","c":"LlmAgent","l":"includeContents()"},{"p":"com.google.adk.agents","c":"LlmAgentConfig","l":"includeContents()"},{"p":"com.google.adk.agents","c":"LlmAgent.Builder","l":"includeContents(LlmAgent.IncludeContents)","u":"includeContents(com.google.adk.agents.LlmAgent.IncludeContents)"},{"p":"com.google.adk.codeexecutors","c":"CodeExecutorContext","l":"incrementErrorCount(String)","u":"incrementErrorCount(java.lang.String)"},{"p":"com.google.adk.agents","c":"InvocationContext","l":"incrementLlmCallsCount()"},{"p":"com.google.adk.agents","c":"Planner","l":"init(PlanningContext)","u":"init(com.google.adk.agents.PlanningContext)"},{"p":"com.google.adk.planner.goap","c":"GoalOrientedPlanner","l":"init(PlanningContext)","u":"init(com.google.adk.agents.PlanningContext)"},{"p":"com.google.adk.planner","c":"LoopPlanner","l":"init(PlanningContext)","u":"init(com.google.adk.agents.PlanningContext)"},{"p":"com.google.adk.planner.p2p","c":"P2PPlanner","l":"init(PlanningContext)","u":"init(com.google.adk.agents.PlanningContext)"},{"p":"com.google.adk.planner","c":"SequentialPlanner","l":"init(PlanningContext)","u":"init(com.google.adk.agents.PlanningContext)"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryLoggerConfig.RetryConfig","l":"initialDelay()"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryLoggerConfig.RetryConfig.Builder","l":"initialDelay(Duration)","u":"initialDelay(java.time.Duration)"},{"p":"com.google.adk.tools.computeruse","c":"BaseComputer","l":"initialize()"},{"p":"com.google.adk.tools.mcp","c":"McpSessionManager","l":"initializeAsyncSession(Object)","u":"initializeAsyncSession(java.lang.Object)","k":"6"},{"p":"com.google.adk.tools.mcp","c":"McpSessionManager","l":"initializeAsyncSession(Object, McpTransportBuilder)","u":"initializeAsyncSession(java.lang.Object,com.google.adk.tools.mcp.McpTransportBuilder)","k":"6"},{"p":"com.google.adk.tools.mcp","c":"McpSessionManager","l":"initializeSession(Object)","u":"initializeSession(java.lang.Object)","k":"6"},{"p":"com.google.adk.tools.mcp","c":"McpSessionManager","l":"initializeSession(Object, McpTransportBuilder)","u":"initializeSession(java.lang.Object,com.google.adk.tools.mcp.McpTransportBuilder)","k":"6"},{"p":"com.google.adk.plugins.agentanalytics","c":"TraceManager","l":"initTrace(InvocationContext)","u":"initTrace(com.google.adk.agents.InvocationContext)"},{"p":"com.google.adk.plugins.agentanalytics","c":"TraceManager","l":"initTraceIfNeeded(InvocationContext)","u":"initTraceIfNeeded(com.google.adk.agents.InvocationContext)"},{"p":"com.google.adk.utils","c":"InstructionUtils","l":"injectSessionState(InvocationContext, String)","u":"injectSessionState(com.google.adk.agents.InvocationContext,java.lang.String)","k":"6"},{"p":"com.google.adk.artifacts","c":"InMemoryArtifactService","l":"InMemoryArtifactService()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.memory","c":"InMemoryMemoryService","l":"InMemoryMemoryService()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.runner","c":"InMemoryRunner","l":"InMemoryRunner(BaseAgent)","u":"%3Cinit%3E(com.google.adk.agents.BaseAgent)","k":"3"},{"p":"com.google.adk.runner","c":"InMemoryRunner","l":"InMemoryRunner(BaseAgent, String)","u":"%3Cinit%3E(com.google.adk.agents.BaseAgent,java.lang.String)","k":"3"},{"p":"com.google.adk.runner","c":"InMemoryRunner","l":"InMemoryRunner(BaseAgent, String, List)","u":"%3Cinit%3E(com.google.adk.agents.BaseAgent,java.lang.String,java.util.List)","k":"3"},{"p":"com.google.adk.sessions","c":"InMemorySessionService","l":"InMemorySessionService()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.examples","c":"Example","l":"input()"},{"p":"com.google.adk.examples","c":"Example.Builder","l":"input(Content)","u":"input(com.google.genai.types.Content)"},{"p":"com.google.adk.agents","c":"RunConfig","l":"inputAudioTranscription()"},{"p":"com.google.adk.agents","c":"RunConfig.Builder","l":"inputAudioTranscription(AudioTranscriptionConfig)","u":"inputAudioTranscription(com.google.genai.types.AudioTranscriptionConfig)"},{"p":"com.google.adk.codeexecutors","c":"CodeExecutionUtils.CodeExecutionInput","l":"inputFiles()"},{"p":"com.google.adk.codeexecutors","c":"CodeExecutionUtils.CodeExecutionInput.Builder","l":"inputFiles(List)","u":"inputFiles(java.util.List)"},{"p":"com.google.adk.planner.goap","c":"AgentMetadata","l":"inputKeys()"},{"p":"com.google.adk.tools.applicationintegrationtoolset","c":"ConnectionsClient.ActionSchema","l":"inputSchema","k":"1"},{"p":"com.google.adk.agents","c":"LlmAgent","l":"inputSchema()"},{"p":"com.google.adk.agents","c":"LlmAgent.Builder","l":"inputSchema(Schema)","u":"inputSchema(com.google.genai.types.Schema)"},{"p":"com.google.adk.events","c":"Event","l":"inputTranscription()"},{"p":"com.google.adk.models","c":"LlmResponse","l":"inputTranscription()"},{"p":"com.google.adk.events","c":"Event.Builder","l":"inputTranscription(Transcription)","u":"inputTranscription(com.google.genai.types.Transcription)"},{"p":"com.google.adk.models","c":"LlmResponse.Builder","l":"inputTranscription(Transcription)","u":"inputTranscription(com.google.genai.types.Transcription)"},{"p":"com.example","c":"CustomDemoRegistry","l":"INSTANCE","k":"2"},{"p":"com.example","c":"LifeAgent","l":"INSTANCE","k":"2"},{"p":"com.google.adk.tools","c":"BuiltInCodeExecutionTool","l":"INSTANCE","k":"2"},{"p":"com.google.adk.tools","c":"ExitLoopTool","l":"INSTANCE","k":"2"},{"p":"com.google.adk.tools","c":"GoogleMapsTool","l":"INSTANCE","k":"2"},{"p":"com.google.adk.tools","c":"GoogleSearchTool","l":"INSTANCE","k":"2"},{"p":"com.google.adk.tools","c":"LoadArtifactsTool","l":"INSTANCE","k":"2"},{"p":"com.google.adk.tools","c":"UrlContextTool","l":"INSTANCE","k":"2"},{"p":"com.google.adk.agents","c":"Instruction.Static","l":"instruction()"},{"p":"com.google.adk.agents","c":"LlmAgent","l":"instruction()"},{"p":"com.google.adk.agents","c":"LlmAgentConfig","l":"instruction()"},{"p":"com.google.adk.agents","c":"LlmAgent.Builder","l":"instruction(Instruction)","u":"instruction(com.google.adk.agents.Instruction)"},{"p":"com.google.adk.agents","c":"LlmAgent.Builder","l":"instruction(String)","u":"instruction(java.lang.String)"},{"p":"com.google.adk.flows.llmflows","c":"Instructions","l":"Instructions()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.skills","c":"InMemorySkillSource.Builder.SkillBuilder","l":"instructions(String)","u":"instructions(java.lang.String)"},{"p":"com.google.adk.events","c":"Event","l":"interrupted()"},{"p":"com.google.adk.models","c":"LlmResponse","l":"interrupted()"},{"p":"com.google.adk.events","c":"Event.Builder","l":"interrupted(Boolean)","u":"interrupted(java.lang.Boolean)"},{"p":"com.google.adk.models","c":"LlmResponse.Builder","l":"interrupted(Boolean)","u":"interrupted(java.lang.Boolean)"},{"p":"com.google.adk.models.springai","c":"MessageConversionException","l":"invalidMessageStructure(String)","u":"invalidMessageStructure(java.lang.String)","k":"6"},{"p":"com.google.adk.agents","c":"ReadonlyContext","l":"invocationContext","k":"1"},{"p":"com.google.adk.agents","c":"PlanningContext","l":"invocationContext()"},{"p":"com.google.adk.agents","c":"ReadonlyContext","l":"invocationContext()"},{"p":"com.google.adk.agents","c":"InvocationContext","l":"InvocationContext(InvocationContext.Builder)","u":"%3Cinit%3E(com.google.adk.agents.InvocationContext.Builder)","k":"3"},{"p":"com.google.adk.agents","c":"InvocationContext","l":"invocationId()"},{"p":"com.google.adk.agents","c":"ReadonlyContext","l":"invocationId()"},{"p":"com.google.adk.events","c":"Event","l":"invocationId()"},{"p":"com.google.adk.agents","c":"InvocationContext.Builder","l":"invocationId(String)","u":"invocationId(java.lang.String)"},{"p":"com.google.adk.events","c":"Event.Builder","l":"invocationId(String)","u":"invocationId(java.lang.String)"},{"p":"com.google.adk.a2a.converters","c":"A2AMetadataKey","l":"IS_LONG_RUNNING","k":"0"},{"p":"com.google.adk.models","c":"FunctionCallIds","l":"isClientGeneratedFunctionCallId(String)","u":"isClientGeneratedFunctionCallId(java.lang.String)","k":"6"},{"p":"com.google.adk.models.springai","c":"ConfigMapper","l":"isConfigurationValid(Optional)","u":"isConfigurationValid(java.util.Optional)"},{"p":"com.google.adk.web.config","c":"AgentLoadingProperties","l":"isConfineToSourceDir()"},{"p":"com.example.adkprtriaging","c":"Settings","l":"isDryRun()","k":"6"},{"p":"com.example.adkspam","c":"Settings","l":"isDryRun()","k":"6"},{"p":"com.example.adkstale","c":"Settings","l":"isDryRun()","k":"6"},{"p":"com.example.adktriaging","c":"Settings","l":"isDryRun()","k":"6"},{"p":"com.google.adk.models.springai","c":"StreamingResponseAggregator","l":"isEmpty()"},{"p":"com.google.adk.sessions","c":"State","l":"isEmpty()"},{"p":"com.google.adk.tools","c":"BaseTool.ToolArgsConfig","l":"isEmpty()"},{"p":"com.google.adk.models.springai.properties","c":"SpringAIProperties.Observability","l":"isEnabled()"},{"p":"com.google.adk.models.springai.properties","c":"SpringAIProperties.Validation","l":"isEnabled()"},{"p":"com.google.adk.models.springai.properties","c":"SpringAIProperties.Validation","l":"isFailFast()"},{"p":"com.google.adk.utils","c":"ModelNameUtils","l":"isGemini2Model(String)","u":"isGemini2Model(java.lang.String)","k":"6"},{"p":"com.google.adk.utils","c":"ModelNameUtils","l":"isGemini2OrAbove(String)","u":"isGemini2OrAbove(java.lang.String)","k":"6"},{"p":"com.google.adk.utils","c":"ModelNameUtils","l":"isGeminiModel(String)","u":"isGeminiModel(java.lang.String)","k":"6"},{"p":"com.google.adk.models.springai.properties","c":"SpringAIProperties.Observability","l":"isIncludeContent()"},{"p":"com.example.adkspam","c":"Settings","l":"isInitialFullScan()","k":"6"},{"p":"com.google.adk.utils","c":"ModelNameUtils","l":"isInstanceOfGemini(Object)","u":"isInstanceOfGemini(java.lang.Object)","k":"6"},{"p":"com.example.adkprtriaging","c":"Settings","l":"isInteractive()","k":"6"},{"p":"com.example.adkspam","c":"Settings","l":"isInteractive()","k":"6"},{"p":"com.example.adkstale","c":"Settings","l":"isInteractive()","k":"6"},{"p":"com.example.adktriaging","c":"Settings","l":"isInteractive()","k":"6"},{"p":"com.google.adk.models.springai.properties","c":"SpringAIProperties.Observability","l":"isMetricsEnabled()"},{"p":"com.google.adk.utils","c":"CollectionUtils","l":"isNullOrEmpty(Iterable)","u":"isNullOrEmpty(java.lang.Iterable)","k":"6"},{"p":"com.google.adk.models.springai.observability","c":"SpringAIObservabilityHandler.RequestContext","l":"isObservable()"},{"p":"com.google.adk.agents","c":"InvocationContext","l":"isResumable()"},{"p":"com.google.adk.apps","c":"ResumabilityConfig","l":"isResumable()"},{"p":"com.google.adk.models.springai.error","c":"SpringAIErrorMapper.MappedError","l":"isRetryable()"},{"p":"com.google.adk.models.springai.error","c":"SpringAIErrorMapper","l":"isRetryable(SpringAIErrorMapper.ErrorCategory)","u":"isRetryable(com.google.adk.models.springai.error.SpringAIErrorMapper.ErrorCategory)","k":"6"},{"p":"com.google.adk.a2a.agent","c":"RemoteA2AAgent","l":"isStreaming()"},{"p":"com.google.adk.tools","c":"FunctionTool","l":"isStreaming()"},{"p":"com.example.adkspam","c":"Settings","l":"issueBody()","k":"6"},{"p":"com.example.adktriaging","c":"Settings","l":"issueBody()","k":"6"},{"p":"com.example.adkstale","c":"Settings","l":"issueCountToProcess()","k":"6"},{"p":"com.example.adktriaging","c":"Settings","l":"issueCountToProcess()","k":"6"},{"p":"com.example.adkspam","c":"Settings","l":"issueNumber()","k":"6"},{"p":"com.example.adkstale","c":"Settings","l":"issueNumber()","k":"6"},{"p":"com.example.adktriaging","c":"Settings","l":"issueNumber()","k":"6"},{"p":"com.example.adkspam","c":"Settings","l":"issueScanLimit()","k":"6"},{"p":"com.example.adkspam","c":"Settings","l":"issueTitle()","k":"6"},{"p":"com.example.adktriaging","c":"Settings","l":"issueTitle()","k":"6"},{"p":"com.google.adk.tools","c":"BaseToolset","l":"isToolSelected(BaseTool, Object, ReadonlyContext)","u":"isToolSelected(com.google.adk.tools.BaseTool,java.lang.Object,com.google.adk.agents.ReadonlyContext)"},{"p":"com.google.adk.events","c":"EventStream","l":"iterator()"},{"p":"com.google.adk.tools.mcp","c":"StdioConnectionParameters.Builder","l":"jacksonBuilder()","k":"6"},{"p":"com.google.adk","c":"Version","l":"JAVA_ADK_VERSION","k":"2"},{"p":"com.google.adk","c":"JsonBaseModel","l":"JsonBaseModel()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.models.springai","c":"MessageConversionException","l":"jsonParsingFailed(String, Throwable)","u":"jsonParsingFailed(java.lang.String,java.lang.Throwable)","k":"6"},{"p":"com.google.adk.utils","c":"Constants","l":"KEY_APP_NAME","k":"2"},{"p":"com.google.adk.utils","c":"Constants","l":"KEY_AUTHOR","k":"2"},{"p":"com.google.adk.utils","c":"Constants","l":"KEY_ID","k":"2"},{"p":"com.google.adk.utils","c":"Constants","l":"KEY_MODEL","k":"2"},{"p":"com.google.adk.utils","c":"Constants","l":"KEY_STATE","k":"2"},{"p":"com.google.adk.utils","c":"Constants","l":"KEY_TIMESTAMP","k":"2"},{"p":"com.google.adk.utils","c":"Constants","l":"KEY_UPDATE_TIME","k":"2"},{"p":"com.google.adk.utils","c":"Constants","l":"KEY_USER","k":"2"},{"p":"com.google.adk.utils","c":"Constants","l":"KEY_USER_ID","k":"2"},{"p":"com.google.adk.tools.computeruse","c":"BaseComputer","l":"keyCombination(List)","u":"keyCombination(java.util.List)"},{"p":"com.google.adk.sessions","c":"State","l":"keySet()"},{"p":"com.example.adkprtriaging","c":"AdkPrTriagingAgent","l":"LABEL_GUIDELINES","k":"2"},{"p":"com.example.adktriaging","c":"AdkTriagingAgent","l":"LABEL_GUIDELINES","k":"2"},{"p":"com.google.adk.models.langchain4j","c":"LangChain4j","l":"LangChain4j(ChatModel)","u":"%3Cinit%3E(dev.langchain4j.model.chat.ChatModel)","k":"3"},{"p":"com.google.adk.models.langchain4j","c":"LangChain4j","l":"LangChain4j(ChatModel, StreamingChatModel, String)","u":"%3Cinit%3E(dev.langchain4j.model.chat.ChatModel,dev.langchain4j.model.chat.StreamingChatModel,java.lang.String)","k":"3"},{"p":"com.google.adk.models.langchain4j","c":"LangChain4j","l":"LangChain4j(ChatModel, String)","u":"%3Cinit%3E(dev.langchain4j.model.chat.ChatModel,java.lang.String)","k":"3"},{"p":"com.google.adk.models.langchain4j","c":"LangChain4j","l":"LangChain4j(StreamingChatModel)","u":"%3Cinit%3E(dev.langchain4j.model.chat.StreamingChatModel)","k":"3"},{"p":"com.google.adk.models.langchain4j","c":"LangChain4j","l":"LangChain4j(StreamingChatModel, String)","u":"%3Cinit%3E(dev.langchain4j.model.chat.StreamingChatModel,java.lang.String)","k":"3"},{"p":"com.google.adk.a2a.converters","c":"PartConverter","l":"LANGUAGE_KEY","k":"2"},{"p":"com.google.adk.sessions","c":"Session","l":"lastUpdateTime()"},{"p":"com.google.adk.sessions","c":"Session.Builder","l":"lastUpdateTime(Instant)","u":"lastUpdateTime(java.time.Instant)"},{"p":"com.google.adk.sessions","c":"Session","l":"lastUpdateTime(Instant)","u":"lastUpdateTime(java.time.Instant)"},{"p":"com.google.adk.sessions","c":"Session.Builder","l":"lastUpdateTimeSeconds(double)"},{"p":"com.google.adk.skills","c":"Frontmatter","l":"license()"},{"p":"com.google.adk.skills","c":"Frontmatter.Builder","l":"license(String)","u":"license(java.lang.String)"},{"p":"com.google.adk.maven","c":"AgentLoader","l":"listAgents()"},{"p":"com.google.adk.maven","c":"ConfigAgentLoader","l":"listAgents()"},{"p":"com.google.adk.web","c":"AgentLoader","l":"listAgents()"},{"p":"com.google.adk.web","c":"AgentStaticLoader","l":"listAgents()"},{"p":"com.google.adk.web","c":"CompiledAgentLoader","l":"listAgents()"},{"p":"com.google.adk.web.controller","c":"AgentController","l":"listApps()"},{"p":"com.google.adk.artifacts","c":"BaseArtifactService","l":"listArtifactKeys(SessionKey)","u":"listArtifactKeys(com.google.adk.sessions.SessionKey)"},{"p":"com.google.adk.artifacts","c":"BaseArtifactService","l":"listArtifactKeys(String, String, String)","u":"listArtifactKeys(java.lang.String,java.lang.String,java.lang.String)"},{"p":"com.google.adk.artifacts","c":"GcsArtifactService","l":"listArtifactKeys(String, String, String)","u":"listArtifactKeys(java.lang.String,java.lang.String,java.lang.String)"},{"p":"com.google.adk.artifacts","c":"InMemoryArtifactService","l":"listArtifactKeys(String, String, String)","u":"listArtifactKeys(java.lang.String,java.lang.String,java.lang.String)"},{"p":"com.google.adk.web.controller","c":"ArtifactController","l":"listArtifactNames(String, String, String)","u":"listArtifactNames(java.lang.String,java.lang.String,java.lang.String)"},{"p":"com.google.adk.agents","c":"CallbackContext","l":"listArtifacts()"},{"p":"com.google.adk.artifacts","c":"ListArtifactsResponse","l":"ListArtifactsResponse()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.web.controller","c":"ArtifactController","l":"listArtifactVersions(String, String, String, String)","u":"listArtifactVersions(java.lang.String,java.lang.String,java.lang.String,java.lang.String)"},{"p":"com.google.adk.artifacts","c":"ListArtifactVersionsResponse","l":"ListArtifactVersionsResponse()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.web.controller","c":"EvaluationController","l":"listEvalResults(String)","u":"listEvalResults(java.lang.String)"},{"p":"com.google.adk.web.controller","c":"EvaluationController","l":"listEvalSets(String)","u":"listEvalSets(java.lang.String)"},{"p":"com.google.adk.web.controller","c":"EvaluationController","l":"listEvalsInEvalSet(String, String)","u":"listEvalsInEvalSet(java.lang.String,java.lang.String)"},{"p":"com.google.adk.sessions","c":"BaseSessionService","l":"listEvents(SessionKey)","u":"listEvents(com.google.adk.sessions.SessionKey)"},{"p":"com.google.adk.sessions","c":"BaseSessionService","l":"listEvents(String, String, String)","u":"listEvents(java.lang.String,java.lang.String,java.lang.String)"},{"p":"com.google.adk.sessions","c":"FirestoreSessionService","l":"listEvents(String, String, String)","u":"listEvents(java.lang.String,java.lang.String,java.lang.String)"},{"p":"com.google.adk.sessions","c":"InMemorySessionService","l":"listEvents(String, String, String)","u":"listEvents(java.lang.String,java.lang.String,java.lang.String)"},{"p":"com.google.adk.sessions","c":"VertexAiSessionService","l":"listEvents(String, String, String)","u":"listEvents(java.lang.String,java.lang.String,java.lang.String)"},{"p":"com.google.adk.sessions","c":"ListEventsResponse","l":"ListEventsResponse()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.skills","c":"AbstractSkillSource","l":"listFrontmatters()"},{"p":"com.google.adk.skills","c":"InMemorySkillSource","l":"listFrontmatters()"},{"p":"com.google.adk.skills","c":"SkillSource","l":"listFrontmatters()"},{"p":"com.example.github","c":"GitHubTools","l":"listOpenIssues(String, String, Integer)","u":"listOpenIssues(java.lang.String,java.lang.String,java.lang.Integer)","k":"6"},{"p":"com.example.github","c":"GitHubTools","l":"listOpenIssuesUpdatedSince(String, String, String, Integer)","u":"listOpenIssuesUpdatedSince(java.lang.String,java.lang.String,java.lang.String,java.lang.Integer)","k":"6"},{"p":"com.google.adk.tools.applicationintegrationtoolset","c":"ConnectionsClient","l":"listOperation(String, String, String, String)","u":"listOperation(java.lang.String,java.lang.String,java.lang.String,java.lang.String)","k":"6"},{"p":"com.google.adk.tools.applicationintegrationtoolset","c":"ConnectionsClient","l":"listOperationRequest()","k":"6"},{"p":"com.example.github","c":"GitHubTools","l":"listReleases(String, String)","u":"listReleases(java.lang.String,java.lang.String)","k":"6"},{"p":"com.example.github","c":"GitHubTools","l":"listRepositoryCollaborators(String, String)","u":"listRepositoryCollaborators(java.lang.String,java.lang.String)","k":"6"},{"p":"com.google.adk.skills","c":"ClassPathSkillSource","l":"listResources(String, String)","u":"listResources(java.lang.String,java.lang.String)"},{"p":"com.google.adk.skills","c":"InMemorySkillSource","l":"listResources(String, String)","u":"listResources(java.lang.String,java.lang.String)"},{"p":"com.google.adk.skills","c":"LocalSkillSource","l":"listResources(String, String)","u":"listResources(java.lang.String,java.lang.String)"},{"p":"com.google.adk.skills","c":"SkillSource","l":"listResources(String, String)","u":"listResources(java.lang.String,java.lang.String)"},{"p":"com.google.adk.sessions","c":"BaseSessionService","l":"listSessions(SessionKey)","u":"listSessions(com.google.adk.sessions.SessionKey)"},{"p":"com.google.adk.sessions","c":"BaseSessionService","l":"listSessions(String, String)","u":"listSessions(java.lang.String,java.lang.String)"},{"p":"com.google.adk.sessions","c":"FirestoreSessionService","l":"listSessions(String, String)","u":"listSessions(java.lang.String,java.lang.String)"},{"p":"com.google.adk.sessions","c":"InMemorySessionService","l":"listSessions(String, String)","u":"listSessions(java.lang.String,java.lang.String)"},{"p":"com.google.adk.sessions","c":"VertexAiSessionService","l":"listSessions(String, String)","u":"listSessions(java.lang.String,java.lang.String)"},{"p":"com.google.adk.web.controller","c":"SessionController","l":"listSessions(String, String)","u":"listSessions(java.lang.String,java.lang.String)"},{"p":"com.google.adk.sessions","c":"ListSessionsResponse","l":"ListSessionsResponse()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.skills","c":"AbstractSkillSource","l":"listSkills()"},{"p":"com.google.adk.skills","c":"ClassPathSkillSource","l":"listSkills()"},{"p":"com.google.adk.skills","c":"LocalSkillSource","l":"listSkills()"},{"p":"com.example.adktriaging","c":"AdkTriagingAgent","l":"listUntriagedIssues(int)","k":"6"},{"p":"com.google.adk.artifacts","c":"BaseArtifactService","l":"listVersions(SessionKey, String)","u":"listVersions(com.google.adk.sessions.SessionKey,java.lang.String)"},{"p":"com.google.adk.artifacts","c":"BaseArtifactService","l":"listVersions(String, String, String, String)","u":"listVersions(java.lang.String,java.lang.String,java.lang.String,java.lang.String)"},{"p":"com.google.adk.artifacts","c":"GcsArtifactService","l":"listVersions(String, String, String, String)","u":"listVersions(java.lang.String,java.lang.String,java.lang.String,java.lang.String)"},{"p":"com.google.adk.artifacts","c":"InMemoryArtifactService","l":"listVersions(String, String, String, String)","u":"listVersions(java.lang.String,java.lang.String,java.lang.String,java.lang.String)"},{"p":"com.google.adk.tutorials","c":"LiveAudioSingleAgent","l":"LiveAudioSingleAgent()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.models","c":"LlmRequest","l":"liveConnectConfig()"},{"p":"com.google.adk.models","c":"LlmRequest.Builder","l":"liveConnectConfig(LiveConnectConfig)","u":"liveConnectConfig(com.google.genai.types.LiveConnectConfig)"},{"p":"com.google.adk.agents","c":"InvocationContext","l":"liveRequestQueue()"},{"p":"com.google.adk.agents","c":"LiveRequestQueue","l":"LiveRequestQueue()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.agents","c":"InvocationContext.Builder","l":"liveRequestQueue(LiveRequestQueue)","u":"liveRequestQueue(com.google.adk.agents.LiveRequestQueue)"},{"p":"com.google.adk.web.websocket","c":"LiveWebSocketHandler","l":"LiveWebSocketHandler(ObjectMapper, BaseSessionService, RunnerService)","u":"%3Cinit%3E(com.fasterxml.jackson.databind.ObjectMapper,com.google.adk.sessions.BaseSessionService,com.google.adk.web.service.RunnerService)","k":"3"},{"p":"com.google.adk.agents","c":"LlmAgent","l":"LlmAgent(LlmAgent.Builder)","u":"%3Cinit%3E(com.google.adk.agents.LlmAgent.Builder)","k":"3"},{"p":"com.google.adk.agents","c":"LlmAgentConfig","l":"LlmAgentConfig()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.models","c":"LlmCallsLimitExceededException","l":"LlmCallsLimitExceededException(String)","u":"%3Cinit%3E(java.lang.String)","k":"3"},{"p":"com.google.adk.summarizer","c":"LlmEventSummarizer","l":"LlmEventSummarizer(BaseLlm)","u":"%3Cinit%3E(com.google.adk.models.BaseLlm)","k":"3"},{"p":"com.google.adk.summarizer","c":"LlmEventSummarizer","l":"LlmEventSummarizer(BaseLlm, String)","u":"%3Cinit%3E(com.google.adk.models.BaseLlm,java.lang.String)","k":"3"},{"p":"com.google.adk.plugins.recordings","c":"Recording","l":"llmRecording()"},{"p":"com.google.adk.plugins.recordings","c":"LlmRecording","l":"LlmRecording()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.plugins.recordings","c":"Recording.Builder","l":"llmRecording(LlmRecording)","u":"llmRecording(com.google.adk.plugins.recordings.LlmRecording)"},{"p":"com.google.adk.plugins.recordings","c":"LlmRecording","l":"llmRequest()"},{"p":"com.google.adk.models","c":"LlmRequest","l":"LlmRequest()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.plugins.recordings","c":"LlmRecording.Builder","l":"llmRequest(LlmRequest)","u":"llmRequest(com.google.adk.models.LlmRequest)"},{"p":"com.google.adk.plugins.recordings","c":"LlmRecording","l":"llmResponses()"},{"p":"com.google.adk.plugins.recordings","c":"LlmRecording.Builder","l":"llmResponses(List)","u":"llmResponses(java.util.List)"},{"p":"com.google.adk.plugins.recordings","c":"RecordingsLoader","l":"load(InputStream)","u":"load(java.io.InputStream)","k":"6"},{"p":"com.google.adk.plugins.recordings","c":"RecordingsLoader","l":"load(Path)","u":"load(java.nio.file.Path)","k":"6"},{"p":"com.google.adk.plugins.recordings","c":"RecordingsLoader","l":"load(String)","u":"load(java.lang.String)","k":"6"},{"p":"com.google.adk.maven","c":"AgentLoader","l":"loadAgent(String)","u":"loadAgent(java.lang.String)"},{"p":"com.google.adk.maven","c":"ConfigAgentLoader","l":"loadAgent(String)","u":"loadAgent(java.lang.String)"},{"p":"com.google.adk.web","c":"AgentLoader","l":"loadAgent(String)","u":"loadAgent(java.lang.String)"},{"p":"com.google.adk.web","c":"AgentStaticLoader","l":"loadAgent(String)","u":"loadAgent(java.lang.String)"},{"p":"com.google.adk.web","c":"CompiledAgentLoader","l":"loadAgent(String)","u":"loadAgent(java.lang.String)"},{"p":"com.google.adk.artifacts","c":"BaseArtifactService","l":"loadArtifact(SessionKey, String)","u":"loadArtifact(com.google.adk.sessions.SessionKey,java.lang.String)"},{"p":"com.google.adk.artifacts","c":"BaseArtifactService","l":"loadArtifact(SessionKey, String, int)","u":"loadArtifact(com.google.adk.sessions.SessionKey,java.lang.String,int)"},{"p":"com.google.adk.agents","c":"CallbackContext","l":"loadArtifact(String)","u":"loadArtifact(java.lang.String)"},{"p":"com.google.adk.agents","c":"CallbackContext","l":"loadArtifact(String, int)","u":"loadArtifact(java.lang.String,int)"},{"p":"com.google.adk.artifacts","c":"BaseArtifactService","l":"loadArtifact(String, String, String, String)","u":"loadArtifact(java.lang.String,java.lang.String,java.lang.String,java.lang.String)"},{"p":"com.google.adk.artifacts","c":"BaseArtifactService","l":"loadArtifact(String, String, String, String, int)","u":"loadArtifact(java.lang.String,java.lang.String,java.lang.String,java.lang.String,int)"},{"p":"com.google.adk.artifacts","c":"BaseArtifactService","l":"loadArtifact(String, String, String, String, Integer)","u":"loadArtifact(java.lang.String,java.lang.String,java.lang.String,java.lang.String,java.lang.Integer)"},{"p":"com.google.adk.artifacts","c":"GcsArtifactService","l":"loadArtifact(String, String, String, String, Integer)","u":"loadArtifact(java.lang.String,java.lang.String,java.lang.String,java.lang.String,java.lang.Integer)"},{"p":"com.google.adk.artifacts","c":"InMemoryArtifactService","l":"loadArtifact(String, String, String, String, Integer)","u":"loadArtifact(java.lang.String,java.lang.String,java.lang.String,java.lang.String,java.lang.Integer)"},{"p":"com.google.adk.web.controller","c":"ArtifactController","l":"loadArtifact(String, String, String, String, Integer)","u":"loadArtifact(java.lang.String,java.lang.String,java.lang.String,java.lang.String,java.lang.Integer)"},{"p":"com.google.adk.tools","c":"LoadArtifactsTool","l":"LoadArtifactsTool()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.web.controller","c":"ArtifactController","l":"loadArtifactVersion(String, String, String, String, int)","u":"loadArtifactVersion(java.lang.String,java.lang.String,java.lang.String,java.lang.String,int)"},{"p":"com.google.adk.skills","c":"AbstractSkillSource","l":"loadFrontmatter(String)","u":"loadFrontmatter(java.lang.String)"},{"p":"com.google.adk.skills","c":"InMemorySkillSource","l":"loadFrontmatter(String)","u":"loadFrontmatter(java.lang.String)"},{"p":"com.google.adk.skills","c":"SkillSource","l":"loadFrontmatter(String)","u":"loadFrontmatter(java.lang.String)"},{"p":"com.google.adk.skills","c":"AbstractSkillSource","l":"loadInstructions(String)","u":"loadInstructions(java.lang.String)"},{"p":"com.google.adk.skills","c":"InMemorySkillSource","l":"loadInstructions(String)","u":"loadInstructions(java.lang.String)"},{"p":"com.google.adk.skills","c":"SkillSource","l":"loadInstructions(String)","u":"loadInstructions(java.lang.String)"},{"p":"com.google.adk.tools","c":"LoadMemoryTool","l":"loadMemory(String, ToolContext)","u":"loadMemory(java.lang.String,com.google.adk.tools.ToolContext)","k":"6"},{"p":"com.google.adk.tools","c":"LoadMemoryResponse","l":"LoadMemoryResponse(List)","u":"%3Cinit%3E(java.util.List)","k":"3"},{"p":"com.google.adk.tools","c":"LoadMemoryTool","l":"LoadMemoryTool()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.skills","c":"AbstractSkillSource","l":"loadResource(String, String)","u":"loadResource(java.lang.String,java.lang.String)"},{"p":"com.google.adk.skills","c":"InMemorySkillSource","l":"loadResource(String, String)","u":"loadResource(java.lang.String,java.lang.String)"},{"p":"com.google.adk.skills","c":"SkillSource","l":"loadResource(String, String)","u":"loadResource(java.lang.String,java.lang.String)"},{"p":"com.google.adk.skills","c":"LocalSkillSource","l":"LocalSkillSource(Path)","u":"%3Cinit%3E(java.nio.file.Path)","k":"3"},{"p":"com.google.adk.models","c":"VertexCredentials","l":"location()"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryLoggerConfig","l":"location()"},{"p":"com.google.adk.sessions","c":"HttpApiClient","l":"location()"},{"p":"com.google.adk.tools","c":"VertexAiSearchTool","l":"location()"},{"p":"com.google.adk.models","c":"VertexCredentials.Builder","l":"location(String)","u":"location(java.lang.String)"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryLoggerConfig.Builder","l":"location(String)","u":"location(java.lang.String)"},{"p":"com.google.adk.tools","c":"VertexAiSearchTool.Builder","l":"location(String)","u":"location(java.lang.String)"},{"p":"com.google.adk.plugins","c":"LoggingPlugin","l":"LoggingPlugin()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.plugins","c":"LoggingPlugin","l":"LoggingPlugin(String)","u":"%3Cinit%3E(java.lang.String)","k":"3"},{"p":"com.google.adk.models.chat","c":"ChatCompletionsRequest","l":"logitBias","k":"1"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryLoggerConfig","l":"logMultiModalContent()"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryLoggerConfig.Builder","l":"logMultiModalContent(boolean)"},{"p":"com.google.adk.models.chat","c":"ChatCompletionsRequest","l":"logprobs","k":"1"},{"p":"com.google.adk.models.springai.observability","c":"SpringAIObservabilityHandler","l":"logRequest(String, String)","u":"logRequest(java.lang.String,java.lang.String)"},{"p":"com.google.adk.models.springai.observability","c":"SpringAIObservabilityHandler","l":"logResponse(String, String)","u":"logResponse(java.lang.String,java.lang.String)"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryLoggerConfig","l":"logSessionMetadata()"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryLoggerConfig.Builder","l":"logSessionMetadata(boolean)"},{"p":"com.google.adk.tools","c":"BaseTool","l":"longRunning()"},{"p":"com.google.adk.events","c":"Event","l":"longRunningToolIds()"},{"p":"com.google.adk.events","c":"Event.Builder","l":"longRunningToolIds(Set)","u":"longRunningToolIds(java.util.Set)"},{"p":"com.google.adk.agents","c":"LoopAgentConfig","l":"LoopAgentConfig()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.planner","c":"LoopPlanner","l":"LoopPlanner(int)","u":"%3Cinit%3E(int)","k":"3"},{"p":"com.example.a2a_basic","c":"A2AAgentRun","l":"main(String[])","u":"main(java.lang.String[])","k":"6"},{"p":"com.example.adkdocs","c":"AdkDocsReleaseAnalyzerRun","l":"main(String[])","u":"main(java.lang.String[])","k":"6"},{"p":"com.example.adkprtriaging","c":"AdkPrTriagingAgentRun","l":"main(String[])","u":"main(java.lang.String[])","k":"6"},{"p":"com.example.adkspam","c":"SpamDetectionAgentRun","l":"main(String[])","u":"main(java.lang.String[])","k":"6"},{"p":"com.example.adkstale","c":"AdkStaleAgentRun","l":"main(String[])","u":"main(java.lang.String[])","k":"6"},{"p":"com.example.adktriaging","c":"AdkTriagingAgentRun","l":"main(String[])","u":"main(java.lang.String[])","k":"6"},{"p":"com.example.helloworld","c":"HelloWorldRun","l":"main(String[])","u":"main(java.lang.String[])","k":"6"},{"p":"com.example.mcpfilesystem","c":"McpFilesystemRun","l":"main(String[])","u":"main(java.lang.String[])","k":"6"},{"p":"com.google.adk.tutorials","c":"CityTimeWeather","l":"main(String[])","u":"main(java.lang.String[])","k":"6"},{"p":"com.google.adk.tutorials","c":"LiveAudioSingleAgent","l":"main(String[])","u":"main(java.lang.String[])","k":"6"},{"p":"com.google.adk.web","c":"AdkWebServer","l":"main(String[])","u":"main(java.lang.String[])","k":"6"},{"p":"com.example.adkstale","c":"Settings","l":"maintainersOverride()","k":"6"},{"p":"com.google.adk.models.springai.error","c":"SpringAIErrorMapper","l":"mapError(Throwable)","u":"mapError(java.lang.Throwable)","k":"6"},{"p":"com.google.adk.models.springai.error","c":"SpringAIErrorMapper.MappedError","l":"MappedError(SpringAIErrorMapper.ErrorCategory, SpringAIErrorMapper.RetryStrategy, String)","u":"%3Cinit%3E(com.google.adk.models.springai.error.SpringAIErrorMapper.ErrorCategory,com.google.adk.models.springai.error.SpringAIErrorMapper.RetryStrategy,java.lang.String)","k":"3"},{"p":"com.google.adk.web.config","c":"AdkWebCorsProperties","l":"mapping()"},{"p":"com.google.adk.web","c":"AdkWebServer","l":"mappingJackson2HttpMessageConverter(ObjectMapper)","u":"mappingJackson2HttpMessageConverter(com.fasterxml.jackson.databind.ObjectMapper)"},{"p":"com.google.adk.flows.llmflows","c":"PersistBarrier","l":"markFailed(InvocationContext, String, Throwable)","u":"markFailed(com.google.adk.agents.InvocationContext,java.lang.String,java.lang.Throwable)","k":"6"},{"p":"com.google.adk.flows.llmflows","c":"PersistBarrier","l":"markPersisted(InvocationContext, String)","u":"markPersisted(com.google.adk.agents.InvocationContext,java.lang.String)","k":"6"},{"p":"com.google.adk.web.config","c":"AdkWebCorsProperties","l":"maxAge()"},{"p":"com.google.adk.planner.goap","c":"ReplanPolicy.Replan","l":"maxAttempts()"},{"p":"com.google.adk.models.chat","c":"ChatCompletionsRequest","l":"maxCompletionTokens","k":"1"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryLoggerConfig","l":"maxContentLength()"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryLoggerConfig.Builder","l":"maxContentLength(int)"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryLoggerConfig.RetryConfig","l":"maxDelay()"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryLoggerConfig.RetryConfig.Builder","l":"maxDelay(Duration)","u":"maxDelay(java.time.Duration)"},{"p":"com.google.adk.agents","c":"ContextCacheConfig","l":"maxInvocations()"},{"p":"com.google.adk.agents","c":"LoopAgent","l":"maxIterations()"},{"p":"com.google.adk.agents","c":"LoopAgentConfig","l":"maxIterations()"},{"p":"com.google.adk.agents","c":"PlannerAgent","l":"maxIterations()"},{"p":"com.google.adk.agents","c":"PlannerAgent.Builder","l":"maxIterations(int)"},{"p":"com.google.adk.agents","c":"LoopAgent.Builder","l":"maxIterations(Integer)","u":"maxIterations(java.lang.Integer)"},{"p":"com.google.adk.agents","c":"RunConfig","l":"maxLlmCalls()"},{"p":"com.google.adk.agents","c":"RunConfig.Builder","l":"maxLlmCalls(int)"},{"p":"com.google.adk.tools","c":"VertexAiSearchTool","l":"maxResults()"},{"p":"com.google.adk.tools","c":"VertexAiSearchTool.Builder","l":"maxResults(Integer)","u":"maxResults(java.lang.Integer)"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryLoggerConfig.RetryConfig","l":"maxRetries()"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryLoggerConfig.RetryConfig.Builder","l":"maxRetries(int)"},{"p":"com.google.adk.web.service","c":"ApiServerSpanExporterConfig","l":"maxSpansToKeep()"},{"p":"com.google.adk.web.service","c":"ApiServerSpanExporterConfig.Builder","l":"maxSpansToKeep(Optional)","u":"maxSpansToKeep(java.util.Optional)"},{"p":"com.google.adk.flows.llmflows","c":"BaseLlmFlow","l":"maxSteps","k":"1"},{"p":"com.google.adk.agents","c":"LlmAgent","l":"maxSteps()"},{"p":"com.google.adk.agents","c":"LlmAgent.Builder","l":"maxSteps(int)"},{"p":"com.google.adk.tools.mcp","c":"McpAsyncTool","l":"McpAsyncTool(McpSchema.Tool, McpAsyncClient, McpSessionManager)","u":"%3Cinit%3E(io.modelcontextprotocol.spec.McpSchema.Tool,io.modelcontextprotocol.client.McpAsyncClient,com.google.adk.tools.mcp.McpSessionManager)","k":"3"},{"p":"com.google.adk.tools.mcp","c":"McpAsyncTool","l":"McpAsyncTool(McpSchema.Tool, McpAsyncClient, McpSessionManager, ObjectMapper)","u":"%3Cinit%3E(io.modelcontextprotocol.spec.McpSchema.Tool,io.modelcontextprotocol.client.McpAsyncClient,com.google.adk.tools.mcp.McpSessionManager,com.fasterxml.jackson.databind.ObjectMapper)","k":"3"},{"p":"com.google.adk.tools.mcp","c":"McpToolsetException.McpInitializationException","l":"McpInitializationException(String, Throwable)","u":"%3Cinit%3E(java.lang.String,java.lang.Throwable)","k":"3"},{"p":"com.google.adk.tools.mcp","c":"AbstractMcpTool","l":"mcpSession","k":"1"},{"p":"com.google.adk.tools.mcp","c":"AbstractMcpTool","l":"mcpSessionManager","k":"1"},{"p":"com.google.adk.tools.mcp","c":"McpAsyncToolset.Builder","l":"mcpSessionManager(McpSessionManager)","u":"mcpSessionManager(com.google.adk.tools.mcp.McpSessionManager)"},{"p":"com.google.adk.tools.mcp","c":"McpSessionManager","l":"McpSessionManager(Object)","u":"%3Cinit%3E(java.lang.Object)","k":"3"},{"p":"com.google.adk.tools.mcp","c":"McpSessionManager","l":"McpSessionManager(Object, McpTransportBuilder)","u":"%3Cinit%3E(java.lang.Object,com.google.adk.tools.mcp.McpTransportBuilder)","k":"3"},{"p":"com.google.adk.tools.mcp","c":"AbstractMcpTool","l":"mcpTool","k":"1"},{"p":"com.google.adk.tools.mcp","c":"McpTool","l":"McpTool(McpSchema.Tool, McpSyncClient, McpSessionManager)","u":"%3Cinit%3E(io.modelcontextprotocol.spec.McpSchema.Tool,io.modelcontextprotocol.client.McpSyncClient,com.google.adk.tools.mcp.McpSessionManager)","k":"3"},{"p":"com.google.adk.tools.mcp","c":"McpTool","l":"McpTool(McpSchema.Tool, McpSyncClient, McpSessionManager, ObjectMapper)","u":"%3Cinit%3E(io.modelcontextprotocol.spec.McpSchema.Tool,io.modelcontextprotocol.client.McpSyncClient,com.google.adk.tools.mcp.McpSessionManager,com.fasterxml.jackson.databind.ObjectMapper)","k":"3"},{"p":"com.google.adk.tools.mcp","c":"McpToolException.McpToolDeclarationException","l":"McpToolDeclarationException(String, Throwable)","u":"%3Cinit%3E(java.lang.String,java.lang.Throwable)","k":"3"},{"p":"com.google.adk.tools.mcp","c":"McpToolException","l":"McpToolException(String, Throwable)","u":"%3Cinit%3E(java.lang.String,java.lang.Throwable)","k":"3"},{"p":"com.google.adk.tools.mcp","c":"McpToolsetException.McpToolLoadingException","l":"McpToolLoadingException(String, Throwable)","u":"%3Cinit%3E(java.lang.String,java.lang.Throwable)","k":"3"},{"p":"com.google.adk.tools.mcp","c":"McpToolset","l":"McpToolset(McpSessionManager, ObjectMapper)","u":"%3Cinit%3E(com.google.adk.tools.mcp.McpSessionManager,com.fasterxml.jackson.databind.ObjectMapper)","k":"3"},{"p":"com.google.adk.tools.mcp","c":"McpToolset","l":"McpToolset(McpSessionManager, ObjectMapper, List)","u":"%3Cinit%3E(com.google.adk.tools.mcp.McpSessionManager,com.fasterxml.jackson.databind.ObjectMapper,java.util.List)","k":"3"},{"p":"com.google.adk.tools.mcp","c":"McpToolset","l":"McpToolset(McpSessionManager, ObjectMapper, ToolPredicate)","u":"%3Cinit%3E(com.google.adk.tools.mcp.McpSessionManager,com.fasterxml.jackson.databind.ObjectMapper,com.google.adk.tools.ToolPredicate)","k":"3"},{"p":"com.google.adk.tools.mcp","c":"McpToolset","l":"McpToolset(ServerParameters)","u":"%3Cinit%3E(io.modelcontextprotocol.client.transport.ServerParameters)","k":"3"},{"p":"com.google.adk.tools.mcp","c":"McpToolset","l":"McpToolset(ServerParameters, ObjectMapper)","u":"%3Cinit%3E(io.modelcontextprotocol.client.transport.ServerParameters,com.fasterxml.jackson.databind.ObjectMapper)","k":"3"},{"p":"com.google.adk.tools.mcp","c":"McpToolset","l":"McpToolset(ServerParameters, ObjectMapper, List)","u":"%3Cinit%3E(io.modelcontextprotocol.client.transport.ServerParameters,com.fasterxml.jackson.databind.ObjectMapper,java.util.List)","k":"3"},{"p":"com.google.adk.tools.mcp","c":"McpToolset","l":"McpToolset(ServerParameters, ObjectMapper, ToolPredicate)","u":"%3Cinit%3E(io.modelcontextprotocol.client.transport.ServerParameters,com.fasterxml.jackson.databind.ObjectMapper,com.google.adk.tools.ToolPredicate)","k":"3"},{"p":"com.google.adk.tools.mcp","c":"McpToolset","l":"McpToolset(SseServerParameters)","u":"%3Cinit%3E(com.google.adk.tools.mcp.SseServerParameters)","k":"3"},{"p":"com.google.adk.tools.mcp","c":"McpToolset","l":"McpToolset(SseServerParameters, ObjectMapper)","u":"%3Cinit%3E(com.google.adk.tools.mcp.SseServerParameters,com.fasterxml.jackson.databind.ObjectMapper)","k":"3"},{"p":"com.google.adk.tools.mcp","c":"McpToolset","l":"McpToolset(SseServerParameters, ObjectMapper, List)","u":"%3Cinit%3E(com.google.adk.tools.mcp.SseServerParameters,com.fasterxml.jackson.databind.ObjectMapper,java.util.List)","k":"3"},{"p":"com.google.adk.tools.mcp","c":"McpToolset","l":"McpToolset(SseServerParameters, ObjectMapper, ToolPredicate)","u":"%3Cinit%3E(com.google.adk.tools.mcp.SseServerParameters,com.fasterxml.jackson.databind.ObjectMapper,com.google.adk.tools.ToolPredicate)","k":"3"},{"p":"com.google.adk.tools.mcp","c":"McpToolset","l":"McpToolset(StreamableHttpServerParameters)","u":"%3Cinit%3E(com.google.adk.tools.mcp.StreamableHttpServerParameters)","k":"3"},{"p":"com.google.adk.tools.mcp","c":"McpToolset","l":"McpToolset(StreamableHttpServerParameters, ObjectMapper)","u":"%3Cinit%3E(com.google.adk.tools.mcp.StreamableHttpServerParameters,com.fasterxml.jackson.databind.ObjectMapper)","k":"3"},{"p":"com.google.adk.tools.mcp","c":"McpToolset","l":"McpToolset(StreamableHttpServerParameters, ObjectMapper, List)","u":"%3Cinit%3E(com.google.adk.tools.mcp.StreamableHttpServerParameters,com.fasterxml.jackson.databind.ObjectMapper,java.util.List)","k":"3"},{"p":"com.google.adk.tools.mcp","c":"McpToolset","l":"McpToolset(StreamableHttpServerParameters, ObjectMapper, ToolPredicate)","u":"%3Cinit%3E(com.google.adk.tools.mcp.StreamableHttpServerParameters,com.fasterxml.jackson.databind.ObjectMapper,com.google.adk.tools.ToolPredicate)","k":"3"},{"p":"com.google.adk.tools.mcp","c":"McpToolset.McpToolsetConfig","l":"McpToolsetConfig()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.tools.mcp","c":"McpToolsetException","l":"McpToolsetException(String, Throwable)","u":"%3Cinit%3E(java.lang.String,java.lang.Throwable)","k":"3"},{"p":"com.google.adk.sessions","c":"HttpApiClient","l":"MEDIA_TYPE_APPLICATION_JSON","k":"2"},{"p":"com.google.adk.memory","c":"SearchMemoryResponse","l":"memories()"},{"p":"com.google.adk.tools","c":"LoadMemoryResponse","l":"memories()"},{"p":"com.google.adk.memory","c":"SearchMemoryResponse.Builder","l":"memories(ImmutableList)","u":"memories(com.google.common.collect.ImmutableList)"},{"p":"com.google.adk.memory","c":"SearchMemoryResponse.Builder","l":"memories(List)","u":"memories(java.util.List)"},{"p":"com.google.adk.memory","c":"MemoryEntry","l":"MemoryEntry()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.agents","c":"InvocationContext","l":"memoryService()"},{"p":"com.google.adk.runner","c":"Runner","l":"memoryService()"},{"p":"com.google.adk.web","c":"AdkWebServer","l":"memoryService()"},{"p":"com.google.adk.a2a.executor","c":"AgentExecutor.Builder","l":"memoryService(BaseMemoryService)","u":"memoryService(com.google.adk.memory.BaseMemoryService)"},{"p":"com.google.adk.agents","c":"InvocationContext.Builder","l":"memoryService(BaseMemoryService)","u":"memoryService(com.google.adk.memory.BaseMemoryService)"},{"p":"com.google.adk.runner","c":"Runner.Builder","l":"memoryService(BaseMemoryService)","u":"memoryService(com.google.adk.memory.BaseMemoryService)"},{"p":"com.google.adk.events","c":"EventActions.Builder","l":"merge(EventActions)","u":"merge(com.google.adk.events.EventActions)"},{"p":"com.google.adk.models.springai","c":"MessageConversionException","l":"MessageConversionException(String)","u":"%3Cinit%3E(java.lang.String)","k":"3"},{"p":"com.google.adk.models.springai","c":"MessageConversionException","l":"MessageConversionException(String, Throwable)","u":"%3Cinit%3E(java.lang.String,java.lang.Throwable)","k":"3"},{"p":"com.google.adk.models.springai","c":"MessageConversionException","l":"MessageConversionException(Throwable)","u":"%3Cinit%3E(java.lang.Throwable)","k":"3"},{"p":"com.google.adk.models.springai","c":"MessageConverter","l":"MessageConverter(ObjectMapper)","u":"%3Cinit%3E(com.fasterxml.jackson.databind.ObjectMapper)","k":"3"},{"p":"com.google.adk.a2a.converters","c":"EventConverter","l":"messagePartsFromContext(InvocationContext)","u":"messagePartsFromContext(com.google.adk.agents.InvocationContext)","k":"6"},{"p":"com.google.adk.models.chat","c":"ChatCompletionsRequest","l":"messages","k":"1"},{"p":"com.google.adk.a2a.converters","c":"PartConverter","l":"messageToContent(Message)","u":"messageToContent(io.a2a.spec.Message)","k":"6"},{"p":"com.google.adk.a2a.converters","c":"ResponseConverter","l":"messageToEvent(Message, InvocationContext)","u":"messageToEvent(io.a2a.spec.Message,com.google.adk.agents.InvocationContext)","k":"6"},{"p":"com.google.adk.a2a.converters","c":"ResponseConverter","l":"messageToEvent(Message, InvocationContext, boolean)","u":"messageToEvent(io.a2a.spec.Message,com.google.adk.agents.InvocationContext,boolean)","k":"6"},{"p":"com.google.adk.a2a.converters","c":"ResponseConverter","l":"messageToFailedEvent(Message, InvocationContext)","u":"messageToFailedEvent(io.a2a.spec.Message,com.google.adk.agents.InvocationContext)","k":"6"},{"p":"com.google.adk.tools.mcp","c":"AbstractMcpTool","l":"meta()"},{"p":"com.google.adk.models.chat","c":"ChatCompletionsRequest","l":"metadata","k":"1"},{"p":"com.google.adk.skills","c":"Frontmatter","l":"metadata()"},{"p":"com.google.adk.skills","c":"Frontmatter.Builder","l":"metadata(Map)","u":"metadata(java.util.Map)"},{"p":"com.google.adk.web.config","c":"AdkWebCorsProperties","l":"methods()"},{"p":"com.google.adk.codeexecutors","c":"CodeExecutionUtils.File","l":"mimeType()"},{"p":"com.google.adk.codeexecutors","c":"CodeExecutionUtils.File.Builder","l":"mimeType(String)","u":"mimeType(java.lang.String)"},{"p":"com.google.adk.agents","c":"ContextCacheConfig","l":"minTokens()"},{"p":"com.google.adk.models.chat","c":"ChatCompletionsRequest","l":"modalities","k":"1"},{"p":"com.google.adk.models.chat","c":"ChatCompletionsRequest","l":"model","k":"1"},{"p":"com.google.adk.models.springai.error","c":"SpringAIErrorMapper.ErrorCategory","l":"MODEL_ERROR","k":"0"},{"p":"com.example.adkprtriaging","c":"Settings","l":"model()","k":"6"},{"p":"com.example.adkspam","c":"Settings","l":"model()","k":"6"},{"p":"com.example.adkstale","c":"Settings","l":"model()","k":"6"},{"p":"com.example.adktriaging","c":"Settings","l":"model()","k":"6"},{"p":"com.google.adk.agents","c":"LlmAgent","l":"model()"},{"p":"com.google.adk.agents","c":"LlmAgentConfig","l":"model()"},{"p":"com.google.adk.models","c":"BaseLlm","l":"model()"},{"p":"com.google.adk.models.langchain4j","c":"LangChain4j","l":"model()"},{"p":"com.google.adk.models","c":"LlmRequest","l":"model()"},{"p":"com.google.adk.models","c":"Model","l":"model()"},{"p":"com.google.adk.models","c":"Model","l":"Model()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.agents","c":"LlmAgent.Builder","l":"model(BaseLlm)","u":"model(com.google.adk.models.BaseLlm)"},{"p":"com.google.adk.models","c":"Model.Builder","l":"model(BaseLlm)","u":"model(com.google.adk.models.BaseLlm)"},{"p":"com.google.adk.agents","c":"LlmAgent.Builder","l":"model(String)","u":"model(java.lang.String)"},{"p":"com.google.adk.models","c":"LlmRequest.Builder","l":"model(String)","u":"model(java.lang.String)"},{"p":"com.google.adk.models.langchain4j","c":"LangChain4j","l":"modelName()"},{"p":"com.google.adk.models","c":"Model","l":"modelName()"},{"p":"com.google.adk.models.springai","c":"SpringAIEmbedding","l":"modelName()"},{"p":"com.google.adk.models","c":"ApigeeLlm.Builder","l":"modelName(String)","u":"modelName(java.lang.String)"},{"p":"com.google.adk.models","c":"Gemini.Builder","l":"modelName(String)","u":"modelName(java.lang.String)"},{"p":"com.google.adk.models.langchain4j","c":"LangChain4j.Builder","l":"modelName(String)","u":"modelName(java.lang.String)"},{"p":"com.google.adk.models","c":"Model.Builder","l":"modelName(String)","u":"modelName(java.lang.String)"},{"p":"com.google.adk.events","c":"Event","l":"modelVersion()"},{"p":"com.google.adk.models","c":"LlmResponse","l":"modelVersion()"},{"p":"com.google.adk.events","c":"Event.Builder","l":"modelVersion(String)","u":"modelVersion(java.lang.String)"},{"p":"com.google.adk.models","c":"LlmResponse.Builder","l":"modelVersion(String)","u":"modelVersion(java.lang.String)"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryLoggerConfig.RetryConfig","l":"multiplier()"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryLoggerConfig.RetryConfig.Builder","l":"multiplier(double)"},{"p":"com.google.adk.models.chat","c":"ChatCompletionsRequest","l":"n","k":"1"},{"p":"com.google.adk.agents","c":"BaseAgent.Builder","l":"name","k":"1"},{"p":"com.google.adk.plugins","c":"BasePlugin","l":"name","k":"1"},{"p":"com.google.adk.tools.applicationintegrationtoolset","c":"ConnectionsClient.ConnectionDetails","l":"name","k":"1"},{"p":"com.google.adk.tools","c":"SetModelResponseTool","l":"NAME","k":"2"},{"p":"com.google.adk.a2a.converters","c":"PartConverter","l":"NAME_KEY","k":"2"},{"p":"com.google.adk.agents","c":"BaseAgent","l":"name()"},{"p":"com.google.adk.agents","c":"BaseAgentConfig.CallbackRef","l":"name()"},{"p":"com.google.adk.agents","c":"BaseAgentConfig","l":"name()"},{"p":"com.google.adk.apps","c":"App","l":"name()"},{"p":"com.google.adk.codeexecutors","c":"CodeExecutionUtils.File","l":"name()"},{"p":"com.google.adk.skills","c":"Frontmatter","l":"name()"},{"p":"com.google.adk.tools","c":"Annotations.Schema","l":"name()","k":"4"},{"p":"com.google.adk.tools","c":"BaseTool","l":"name()"},{"p":"com.google.adk.tools","c":"BaseTool.ToolConfig","l":"name()"},{"p":"com.google.adk.a2a.agent","c":"RemoteA2AAgent.Builder","l":"name(String)","u":"name(java.lang.String)"},{"p":"com.google.adk.agents","c":"BaseAgent.Builder","l":"name(String)","u":"name(java.lang.String)"},{"p":"com.google.adk.apps","c":"App.Builder","l":"name(String)","u":"name(java.lang.String)"},{"p":"com.google.adk.codeexecutors","c":"CodeExecutionUtils.File.Builder","l":"name(String)","u":"name(java.lang.String)"},{"p":"com.google.adk.plugins","c":"ContextFilterPlugin.Builder","l":"name(String)","u":"name(java.lang.String)"},{"p":"com.google.adk.skills","c":"Frontmatter.Builder","l":"name(String)","u":"name(java.lang.String)"},{"p":"com.google.adk.tools","c":"ExampleTool.Builder","l":"name(String)","u":"name(java.lang.String)"},{"p":"com.google.adk.tools","c":"NamedToolPredicate","l":"NamedToolPredicate(List)","u":"%3Cinit%3E(java.util.List)","k":"3"},{"p":"com.google.adk.tools","c":"NamedToolPredicate","l":"NamedToolPredicate(String...)","u":"%3Cinit%3E(java.lang.String...)","k":"3"},{"p":"com.google.adk.tools.computeruse","c":"BaseComputer","l":"navigate(String)","u":"navigate(java.lang.String)"},{"p":"com.google.adk.models.springai.error","c":"SpringAIErrorMapper.ErrorCategory","l":"NETWORK_ERROR","k":"0"},{"p":"com.google.adk.agents","c":"InvocationContext","l":"newInvocationContextId()","k":"6"},{"p":"com.google.adk.web.dto","c":"AgentRunRequest","l":"newMessage","k":"1"},{"p":"com.google.adk.agents","c":"Planner","l":"nextAction(PlanningContext)","u":"nextAction(com.google.adk.agents.PlanningContext)"},{"p":"com.google.adk.planner.goap","c":"GoalOrientedPlanner","l":"nextAction(PlanningContext)","u":"nextAction(com.google.adk.agents.PlanningContext)"},{"p":"com.google.adk.planner","c":"LoopPlanner","l":"nextAction(PlanningContext)","u":"nextAction(com.google.adk.agents.PlanningContext)"},{"p":"com.google.adk.planner.p2p","c":"P2PPlanner","l":"nextAction(PlanningContext)","u":"nextAction(com.google.adk.agents.PlanningContext)"},{"p":"com.google.adk.planner","c":"ParallelPlanner","l":"nextAction(PlanningContext)","u":"nextAction(com.google.adk.agents.PlanningContext)"},{"p":"com.google.adk.planner","c":"SequentialPlanner","l":"nextAction(PlanningContext)","u":"nextAction(com.google.adk.agents.PlanningContext)"},{"p":"com.google.adk.planner","c":"SupervisorPlanner","l":"nextAction(PlanningContext)","u":"nextAction(com.google.adk.agents.PlanningContext)"},{"p":"com.google.adk.sessions","c":"ListEventsResponse","l":"nextPageToken()"},{"p":"com.google.adk.sessions","c":"ListEventsResponse.Builder","l":"nextPageToken(String)","u":"nextPageToken(java.lang.String)"},{"p":"com.google.adk.models.springai.error","c":"SpringAIErrorMapper.RetryStrategy","l":"NO_RETRY","k":"0"},{"p":"com.google.adk.agents","c":"LlmAgent.IncludeContents","l":"NONE","k":"0"},{"p":"com.google.adk.agents","c":"RunConfig.StreamingMode","l":"NONE","k":"0"},{"p":"com.google.adk.agents","c":"RunConfig.ToolExecutionMode","l":"NONE","k":"0"},{"p":"com.google.adk.agents","c":"PlannerAction.NoOp","l":"NoOp()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.models.springai","c":"EmbeddingConverter","l":"normalize(float[])","k":"6"},{"p":"com.google.adk.plugins","c":"ContextFilterPlugin.Builder","l":"numInvocationsToKeep(int)"},{"p":"com.google.adk.sessions","c":"GetSessionConfig","l":"numRecentEvents()"},{"p":"com.google.adk.sessions","c":"GetSessionConfig.Builder","l":"numRecentEvents(int)"},{"p":"com.google.adk.tools.applicationintegrationtoolset","c":"ApplicationIntegrationToolset","l":"objectMapper","k":"2"},{"p":"com.google.adk.tools.applicationintegrationtoolset","c":"IntegrationClient","l":"objectMapper","k":"2"},{"p":"com.google.adk.tools.mcp","c":"AbstractMcpTool","l":"objectMapper","k":"1"},{"p":"com.google.adk.models.langchain4j","c":"LangChain4j","l":"objectMapper()"},{"p":"com.google.adk.web","c":"AdkWebServer","l":"objectMapper()"},{"p":"com.google.adk.models.langchain4j","c":"LangChain4j.Builder","l":"objectMapper(ObjectMapper)","u":"objectMapper(com.fasterxml.jackson.databind.ObjectMapper)"},{"p":"com.google.adk.tools.mcp","c":"McpAsyncToolset.Builder","l":"objectMapper(ObjectMapper)","u":"objectMapper(com.fasterxml.jackson.databind.ObjectMapper)"},{"p":"com.google.adk.models.springai.properties","c":"SpringAIProperties.Observability","l":"Observability()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.utils","c":"Pairs","l":"of()","k":"6"},{"p":"com.google.adk.utils","c":"Pairs","l":"of(K, V)","u":"of(K,V)","k":"6"},{"p":"com.google.adk.utils","c":"Pairs","l":"of(K, V, K, V)","u":"of(K,V,K,V)","k":"6"},{"p":"com.google.adk.utils","c":"Pairs","l":"of(K, V, K, V, K, V)","u":"of(K,V,K,V,K,V)","k":"6"},{"p":"com.google.adk.utils","c":"Pairs","l":"of(K, V, K, V, K, V, K, V)","u":"of(K,V,K,V,K,V,K,V)","k":"6"},{"p":"com.google.adk.utils","c":"Pairs","l":"of(K, V, K, V, K, V, K, V, K, V)","u":"of(K,V,K,V,K,V,K,V,K,V)","k":"6"},{"p":"com.google.adk.utils","c":"Pairs","l":"of(K, V, K, V, K, V, K, V, K, V, K, V)","u":"of(K,V,K,V,K,V,K,V,K,V,K,V)","k":"6"},{"p":"com.google.adk.utils","c":"Pairs","l":"of(K, V, K, V, K, V, K, V, K, V, K, V, K, V)","u":"of(K,V,K,V,K,V,K,V,K,V,K,V,K,V)","k":"6"},{"p":"com.google.adk.utils","c":"Pairs","l":"of(K, V, K, V, K, V, K, V, K, V, K, V, K, V, K, V)","u":"of(K,V,K,V,K,V,K,V,K,V,K,V,K,V,K,V)","k":"6"},{"p":"com.google.adk.utils","c":"Pairs","l":"of(K, V, K, V, K, V, K, V, K, V, K, V, K, V, K, V, K, V)","u":"of(K,V,K,V,K,V,K,V,K,V,K,V,K,V,K,V,K,V)","k":"6"},{"p":"com.google.adk.utils","c":"Pairs","l":"of(K, V, K, V, K, V, K, V, K, V, K, V, K, V, K, V, K, V, K, V)","u":"of(K,V,K,V,K,V,K,V,K,V,K,V,K,V,K,V,K,V,K,V)","k":"6"},{"p":"com.google.adk.plugins.recordings","c":"Recordings","l":"of(List)","u":"of(java.util.List)","k":"6"},{"p":"com.google.adk.web.service","c":"RunnerService","l":"onAgentUpdated(String)","u":"onAgentUpdated(java.lang.String)"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryAgentAnalyticsPlugin","l":"onEventCallback(InvocationContext, Event)","u":"onEventCallback(com.google.adk.agents.InvocationContext,com.google.adk.events.Event)"},{"p":"com.google.adk.plugins","c":"LoggingPlugin","l":"onEventCallback(InvocationContext, Event)","u":"onEventCallback(com.google.adk.agents.InvocationContext,com.google.adk.events.Event)"},{"p":"com.google.adk.plugins","c":"Plugin","l":"onEventCallback(InvocationContext, Event)","u":"onEventCallback(com.google.adk.agents.InvocationContext,com.google.adk.events.Event)"},{"p":"com.google.adk.plugins","c":"PluginManager","l":"onEventCallback(InvocationContext, Event)","u":"onEventCallback(com.google.adk.agents.InvocationContext,com.google.adk.events.Event)"},{"p":"com.google.adk.agents","c":"LlmAgent","l":"onModelErrorCallback()"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryAgentAnalyticsPlugin","l":"onModelErrorCallback(CallbackContext, LlmRequest.Builder, Throwable)","u":"onModelErrorCallback(com.google.adk.agents.CallbackContext,com.google.adk.models.LlmRequest.Builder,java.lang.Throwable)"},{"p":"com.google.adk.plugins","c":"LoggingPlugin","l":"onModelErrorCallback(CallbackContext, LlmRequest.Builder, Throwable)","u":"onModelErrorCallback(com.google.adk.agents.CallbackContext,com.google.adk.models.LlmRequest.Builder,java.lang.Throwable)"},{"p":"com.google.adk.plugins","c":"Plugin","l":"onModelErrorCallback(CallbackContext, LlmRequest.Builder, Throwable)","u":"onModelErrorCallback(com.google.adk.agents.CallbackContext,com.google.adk.models.LlmRequest.Builder,java.lang.Throwable)"},{"p":"com.google.adk.plugins","c":"PluginManager","l":"onModelErrorCallback(CallbackContext, LlmRequest.Builder, Throwable)","u":"onModelErrorCallback(com.google.adk.agents.CallbackContext,com.google.adk.models.LlmRequest.Builder,java.lang.Throwable)"},{"p":"com.google.adk.agents","c":"LlmAgent.Builder","l":"onModelErrorCallback(Callbacks.OnModelErrorCallback)","u":"onModelErrorCallback(com.google.adk.agents.Callbacks.OnModelErrorCallback)"},{"p":"com.google.adk.agents","c":"LlmAgent.Builder","l":"onModelErrorCallback(List)","u":"onModelErrorCallback(java.util.List)"},{"p":"com.google.adk.agents","c":"LlmAgent.Builder","l":"onModelErrorCallbackSync(Callbacks.OnModelErrorCallbackSync)","u":"onModelErrorCallbackSync(com.google.adk.agents.Callbacks.OnModelErrorCallbackSync)"},{"p":"com.google.adk.telemetry","c":"Tracing.TracerProvider","l":"onSuccess(BiConsumer)","u":"onSuccess(java.util.function.BiConsumer)"},{"p":"com.google.adk.agents","c":"LlmAgent","l":"onToolErrorCallback()"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryAgentAnalyticsPlugin","l":"onToolErrorCallback(BaseTool, Map, ToolContext, Throwable)","u":"onToolErrorCallback(com.google.adk.tools.BaseTool,java.util.Map,com.google.adk.tools.ToolContext,java.lang.Throwable)"},{"p":"com.google.adk.plugins","c":"LoggingPlugin","l":"onToolErrorCallback(BaseTool, Map, ToolContext, Throwable)","u":"onToolErrorCallback(com.google.adk.tools.BaseTool,java.util.Map,com.google.adk.tools.ToolContext,java.lang.Throwable)"},{"p":"com.google.adk.plugins","c":"Plugin","l":"onToolErrorCallback(BaseTool, Map, ToolContext, Throwable)","u":"onToolErrorCallback(com.google.adk.tools.BaseTool,java.util.Map,com.google.adk.tools.ToolContext,java.lang.Throwable)"},{"p":"com.google.adk.plugins","c":"PluginManager","l":"onToolErrorCallback(BaseTool, Map, ToolContext, Throwable)","u":"onToolErrorCallback(com.google.adk.tools.BaseTool,java.util.Map,com.google.adk.tools.ToolContext,java.lang.Throwable)"},{"p":"com.google.adk.agents","c":"LlmAgent.Builder","l":"onToolErrorCallback(Callbacks.OnToolErrorCallback)","u":"onToolErrorCallback(com.google.adk.agents.Callbacks.OnToolErrorCallback)"},{"p":"com.google.adk.agents","c":"LlmAgent.Builder","l":"onToolErrorCallback(List)","u":"onToolErrorCallback(java.util.List)"},{"p":"com.google.adk.agents","c":"LlmAgent.Builder","l":"onToolErrorCallbackSync(Callbacks.OnToolErrorCallbackSync)","u":"onToolErrorCallbackSync(com.google.adk.agents.Callbacks.OnToolErrorCallbackSync)"},{"p":"com.google.adk.plugins","c":"LoggingPlugin","l":"onUserMessageCallback(InvocationContext, Content)","u":"onUserMessageCallback(com.google.adk.agents.InvocationContext,com.google.genai.types.Content)"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryAgentAnalyticsPlugin","l":"onUserMessageCallback(InvocationContext, Content)","u":"onUserMessageCallback(com.google.adk.agents.InvocationContext,com.google.genai.types.Content)"},{"p":"com.google.adk.plugins","c":"Plugin","l":"onUserMessageCallback(InvocationContext, Content)","u":"onUserMessageCallback(com.google.adk.agents.InvocationContext,com.google.genai.types.Content)"},{"p":"com.google.adk.plugins","c":"PluginManager","l":"onUserMessageCallback(InvocationContext, Content)","u":"onUserMessageCallback(com.google.adk.agents.InvocationContext,com.google.genai.types.Content)"},{"p":"com.google.adk.skills","c":"ClassPathSkillSource","l":"openChannel(ClassPath.ResourceInfo)","u":"openChannel(com.google.common.reflect.ClassPath.ResourceInfo)"},{"p":"com.google.adk.skills","c":"LocalSkillSource","l":"openChannel(Path)","u":"openChannel(java.nio.file.Path)"},{"p":"com.google.adk.skills","c":"AbstractSkillSource","l":"openChannel(PathT)"},{"p":"com.google.adk.web.config","c":"OpenTelemetryConfig","l":"OpenTelemetryConfig()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.web.config","c":"OpenTelemetryConfig","l":"openTelemetrySdk(SdkTracerProvider)","u":"openTelemetrySdk(io.opentelemetry.sdk.trace.SdkTracerProvider)"},{"p":"com.google.adk.tools.computeruse","c":"BaseComputer","l":"openWebBrowser()"},{"p":"com.google.adk.tools.applicationintegrationtoolset","c":"ConnectionsClient.EntitySchemaAndOperations","l":"operations","k":"1"},{"p":"com.google.adk.codeexecutors","c":"BaseCodeExecutor","l":"optimizeDataFile()"},{"p":"com.google.adk.codeexecutors","c":"ContainerCodeExecutor","l":"optimizeDataFile()"},{"p":"com.google.adk.tools","c":"Annotations.Schema","l":"optional()","k":"4"},{"p":"com.google.adk.web.config","c":"AdkWebCorsProperties","l":"origins()"},{"p":"com.google.adk.telemetry","c":"Instrumentation.TelemetryContext","l":"otelContext()"},{"p":"com.google.adk.a2a.converters","c":"PartConverter","l":"OUTCOME_KEY","k":"2"},{"p":"com.google.adk.a2a.converters","c":"PartConverter","l":"OUTPUT_KEY","k":"2"},{"p":"com.google.adk.examples","c":"Example","l":"output()"},{"p":"com.google.adk.examples","c":"Example.Builder","l":"output(List)","u":"output(java.util.List)"},{"p":"com.google.adk.agents","c":"RunConfig","l":"outputAudioTranscription()"},{"p":"com.google.adk.agents","c":"RunConfig.Builder","l":"outputAudioTranscription(AudioTranscriptionConfig)","u":"outputAudioTranscription(com.google.genai.types.AudioTranscriptionConfig)"},{"p":"com.google.adk.codeexecutors","c":"CodeExecutionUtils.CodeExecutionResult","l":"outputFiles()"},{"p":"com.google.adk.codeexecutors","c":"CodeExecutionUtils.CodeExecutionResult.Builder","l":"outputFiles(List)","u":"outputFiles(java.util.List)"},{"p":"com.google.adk.agents","c":"LlmAgent","l":"outputKey()"},{"p":"com.google.adk.agents","c":"LlmAgentConfig","l":"outputKey()"},{"p":"com.google.adk.planner.goap","c":"AgentMetadata","l":"outputKey()"},{"p":"com.google.adk.agents","c":"LlmAgent.Builder","l":"outputKey(String)","u":"outputKey(java.lang.String)"},{"p":"com.google.adk.a2a.executor","c":"AgentExecutorConfig","l":"outputMode()"},{"p":"com.google.adk.a2a.executor","c":"AgentExecutorConfig.Builder","l":"outputMode(AgentExecutorConfig.OutputMode)","u":"outputMode(com.google.adk.a2a.executor.AgentExecutorConfig.OutputMode)"},{"p":"com.google.adk.tools.applicationintegrationtoolset","c":"ConnectionsClient.ActionSchema","l":"outputSchema","k":"1"},{"p":"com.google.adk.agents","c":"LlmAgent","l":"outputSchema()"},{"p":"com.google.adk.flows.llmflows","c":"OutputSchema","l":"OutputSchema()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.agents","c":"LlmAgent.Builder","l":"outputSchema(Schema)","u":"outputSchema(com.google.genai.types.Schema)"},{"p":"com.google.adk.models","c":"LlmRequest.Builder","l":"outputSchema(Schema)","u":"outputSchema(com.google.genai.types.Schema)"},{"p":"com.google.adk.events","c":"Event","l":"outputTranscription()"},{"p":"com.google.adk.models","c":"LlmResponse","l":"outputTranscription()"},{"p":"com.google.adk.events","c":"Event.Builder","l":"outputTranscription(Transcription)","u":"outputTranscription(com.google.genai.types.Transcription)"},{"p":"com.google.adk.models","c":"LlmResponse.Builder","l":"outputTranscription(Transcription)","u":"outputTranscription(com.google.genai.types.Transcription)"},{"p":"com.google.adk.summarizer","c":"EventsCompactionConfig","l":"overlapSize()"},{"p":"com.google.adk.summarizer","c":"EventsCompactionConfig.Builder","l":"overlapSize(Integer)","u":"overlapSize(java.lang.Integer)"},{"p":"com.example.adkprtriaging","c":"Settings","l":"owner()","k":"6"},{"p":"com.example.adkspam","c":"Settings","l":"owner()","k":"6"},{"p":"com.example.adkstale","c":"Settings","l":"owner()","k":"6"},{"p":"com.example.adktriaging","c":"Settings","l":"owner()","k":"6"},{"p":"com.google.adk.planner.p2p","c":"P2PPlanner","l":"P2PPlanner(List, int)","u":"%3Cinit%3E(java.util.List,int)","k":"3"},{"p":"com.google.adk.planner.p2p","c":"P2PPlanner","l":"P2PPlanner(List, int, BiPredicate)","u":"%3Cinit%3E(java.util.List,int,java.util.function.BiPredicate)","k":"3"},{"p":"com.google.adk.agents","c":"RunConfig.ToolExecutionMode","l":"PARALLEL","k":"0"},{"p":"com.google.adk.agents","c":"RunConfig.ToolExecutionMode","l":"PARALLEL_SUBSCRIBE","k":"0"},{"p":"com.google.adk.agents","c":"ParallelAgentConfig","l":"ParallelAgentConfig()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.planner","c":"ParallelPlanner","l":"ParallelPlanner()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.models.chat","c":"ChatCompletionsRequest","l":"parallelToolCalls","k":"1"},{"p":"com.google.adk.agents","c":"BaseAgent","l":"parentAgent()"},{"p":"com.google.adk.agents","c":"BaseAgent","l":"parentAgent(BaseAgent)","u":"parentAgent(com.google.adk.agents.BaseAgent)"},{"p":"com.example.adkprtriaging","c":"Settings","l":"parseNumberString(String, int)","u":"parseNumberString(java.lang.String,int)","k":"6"},{"p":"com.example.adkspam","c":"Settings","l":"parseNumberString(String, int)","u":"parseNumberString(java.lang.String,int)","k":"6"},{"p":"com.example.adkstale","c":"Settings","l":"parseNumberString(String, int)","u":"parseNumberString(java.lang.String,int)","k":"6"},{"p":"com.example.adktriaging","c":"Settings","l":"parseNumberString(String, int)","u":"parseNumberString(java.lang.String,int)","k":"6"},{"p":"com.google.adk.a2a.converters","c":"A2AMetadataKey","l":"PARTIAL","k":"0"},{"p":"com.google.adk.a2a.converters","c":"PartConverter","l":"PARTIAL_ARGS_KEY","k":"2"},{"p":"com.google.adk.events","c":"Event","l":"partial()"},{"p":"com.google.adk.models","c":"LlmResponse","l":"partial()"},{"p":"com.google.adk.events","c":"Event.Builder","l":"partial(Boolean)","u":"partial(java.lang.Boolean)"},{"p":"com.google.adk.models","c":"LlmResponse.Builder","l":"partial(Boolean)","u":"partial(java.lang.Boolean)"},{"p":"com.google.adk.a2a.converters","c":"PartConverter","l":"PARTS_KEY","k":"2"},{"p":"com.google.adk.events","c":"ToolConfirmation","l":"payload()"},{"p":"com.google.adk.events","c":"ToolConfirmation.Builder","l":"payload(Object)","u":"payload(java.lang.Object)"},{"p":"com.google.adk.agents","c":"PlannerAgent","l":"planner()"},{"p":"com.google.adk.agents","c":"PlannerAgent.Builder","l":"planner(Planner)","u":"planner(com.google.adk.agents.Planner)"},{"p":"com.google.adk.agents","c":"LlmAgent","l":"planning()"},{"p":"com.google.adk.agents","c":"LlmAgent.Builder","l":"planning(boolean)"},{"p":"com.google.adk.agents","c":"PlanningContext","l":"PlanningContext(InvocationContext, ImmutableList)","u":"%3Cinit%3E(com.google.adk.agents.InvocationContext,com.google.common.collect.ImmutableList)","k":"3"},{"p":"com.google.adk.agents","c":"InvocationContext","l":"pluginManager()"},{"p":"com.google.adk.runner","c":"Runner","l":"pluginManager()"},{"p":"com.google.adk.plugins","c":"PluginManager","l":"PluginManager()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.plugins","c":"PluginManager","l":"PluginManager(List)","u":"%3Cinit%3E(java.util.List)","k":"3"},{"p":"com.google.adk.agents","c":"InvocationContext.Builder","l":"pluginManager(Plugin)","u":"pluginManager(com.google.adk.plugins.Plugin)"},{"p":"com.google.adk.apps","c":"App","l":"plugins()"},{"p":"com.google.adk.a2a.executor","c":"AgentExecutor.Builder","l":"plugins(List)","u":"plugins(java.util.List)"},{"p":"com.google.adk.apps","c":"App.Builder","l":"plugins(List)","u":"plugins(java.util.List)"},{"p":"com.google.adk.runner","c":"Runner.Builder","l":"plugins(List)","u":"plugins(java.util.List)"},{"p":"com.google.adk.apps","c":"App.Builder","l":"plugins(Plugin...)","u":"plugins(com.google.adk.plugins.Plugin...)"},{"p":"com.google.adk.runner","c":"Runner.Builder","l":"plugins(Plugin...)","u":"plugins(com.google.adk.plugins.Plugin...)"},{"p":"com.google.adk.plugins.agentanalytics","c":"TraceManager","l":"popSpan(InvocationContext, String)","u":"popSpan(com.google.adk.agents.InvocationContext,java.lang.String)"},{"p":"com.google.adk.plugins.agentanalytics","c":"TraceManager","l":"popSpan(InvocationContext, String, String)","u":"popSpan(com.google.adk.agents.InvocationContext,java.lang.String,java.lang.String)"},{"p":"com.google.adk.flows.llmflows","c":"Functions","l":"populateClientFunctionCallId(Event)","u":"populateClientFunctionCallId(com.google.adk.events.Event)","k":"6"},{"p":"com.google.adk.tools.applicationintegrationtoolset","c":"CredentialsHelper","l":"populateHeaders(HttpRequest.Builder, Credentials)","u":"populateHeaders(java.net.http.HttpRequest.Builder,com.google.auth.Credentials)","k":"6"},{"p":"com.google.adk.flows.llmflows","c":"BaseLlmFlow","l":"postprocess(InvocationContext, Event, LlmRequest, LlmResponse, Context)","u":"postprocess(com.google.adk.agents.InvocationContext,com.google.adk.events.Event,com.google.adk.models.LlmRequest,com.google.adk.models.LlmResponse,io.opentelemetry.context.Context)"},{"p":"com.google.adk.models.chat","c":"ChatCompletionsRequest","l":"prediction","k":"1"},{"p":"com.google.adk.models","c":"GeminiUtil","l":"prepareGenenerateContentRequest(LlmRequest, boolean)","u":"prepareGenenerateContentRequest(com.google.adk.models.LlmRequest,boolean)","k":"6"},{"p":"com.google.adk.models","c":"GeminiUtil","l":"prepareGenenerateContentRequest(LlmRequest, boolean, boolean)","u":"prepareGenenerateContentRequest(com.google.adk.models.LlmRequest,boolean,boolean)","k":"6"},{"p":"com.google.adk.models.chat","c":"ChatCompletionsRequest","l":"presencePenalty","k":"1"},{"p":"com.google.adk.codeexecutors","c":"BuiltInCodeExecutor","l":"processLlmRequest(LlmRequest.Builder)","u":"processLlmRequest(com.google.adk.models.LlmRequest.Builder)"},{"p":"com.google.adk.tools","c":"BaseTool","l":"processLlmRequest(LlmRequest.Builder, ToolContext)","u":"processLlmRequest(com.google.adk.models.LlmRequest.Builder,com.google.adk.tools.ToolContext)"},{"p":"com.google.adk.tools","c":"BaseToolset","l":"processLlmRequest(LlmRequest.Builder, ToolContext)","u":"processLlmRequest(com.google.adk.models.LlmRequest.Builder,com.google.adk.tools.ToolContext)"},{"p":"com.google.adk.tools","c":"BuiltInCodeExecutionTool","l":"processLlmRequest(LlmRequest.Builder, ToolContext)","u":"processLlmRequest(com.google.adk.models.LlmRequest.Builder,com.google.adk.tools.ToolContext)"},{"p":"com.google.adk.tools.computeruse","c":"ComputerUseToolset","l":"processLlmRequest(LlmRequest.Builder, ToolContext)","u":"processLlmRequest(com.google.adk.models.LlmRequest.Builder,com.google.adk.tools.ToolContext)"},{"p":"com.google.adk.tools","c":"ExampleTool","l":"processLlmRequest(LlmRequest.Builder, ToolContext)","u":"processLlmRequest(com.google.adk.models.LlmRequest.Builder,com.google.adk.tools.ToolContext)"},{"p":"com.google.adk.tools","c":"GoogleMapsTool","l":"processLlmRequest(LlmRequest.Builder, ToolContext)","u":"processLlmRequest(com.google.adk.models.LlmRequest.Builder,com.google.adk.tools.ToolContext)"},{"p":"com.google.adk.tools","c":"GoogleSearchTool","l":"processLlmRequest(LlmRequest.Builder, ToolContext)","u":"processLlmRequest(com.google.adk.models.LlmRequest.Builder,com.google.adk.tools.ToolContext)"},{"p":"com.google.adk.tools","c":"LoadArtifactsTool","l":"processLlmRequest(LlmRequest.Builder, ToolContext)","u":"processLlmRequest(com.google.adk.models.LlmRequest.Builder,com.google.adk.tools.ToolContext)"},{"p":"com.google.adk.tools","c":"LoadMemoryTool","l":"processLlmRequest(LlmRequest.Builder, ToolContext)","u":"processLlmRequest(com.google.adk.models.LlmRequest.Builder,com.google.adk.tools.ToolContext)"},{"p":"com.google.adk.tools.retrieval","c":"VertexAiRagRetrieval","l":"processLlmRequest(LlmRequest.Builder, ToolContext)","u":"processLlmRequest(com.google.adk.models.LlmRequest.Builder,com.google.adk.tools.ToolContext)"},{"p":"com.google.adk.tools.skills","c":"SkillToolset","l":"processLlmRequest(LlmRequest.Builder, ToolContext)","u":"processLlmRequest(com.google.adk.models.LlmRequest.Builder,com.google.adk.tools.ToolContext)"},{"p":"com.google.adk.tools","c":"UrlContextTool","l":"processLlmRequest(LlmRequest.Builder, ToolContext)","u":"processLlmRequest(com.google.adk.models.LlmRequest.Builder,com.google.adk.tools.ToolContext)"},{"p":"com.google.adk.tools","c":"VertexAiSearchTool","l":"processLlmRequest(LlmRequest.Builder, ToolContext)","u":"processLlmRequest(com.google.adk.models.LlmRequest.Builder,com.google.adk.tools.ToolContext)"},{"p":"com.google.adk.flows.llmflows","c":"AgentTransfer","l":"processRequest(InvocationContext, LlmRequest)","u":"processRequest(com.google.adk.agents.InvocationContext,com.google.adk.models.LlmRequest)"},{"p":"com.google.adk.flows.llmflows","c":"Basic","l":"processRequest(InvocationContext, LlmRequest)","u":"processRequest(com.google.adk.agents.InvocationContext,com.google.adk.models.LlmRequest)"},{"p":"com.google.adk.flows.llmflows","c":"Compaction","l":"processRequest(InvocationContext, LlmRequest)","u":"processRequest(com.google.adk.agents.InvocationContext,com.google.adk.models.LlmRequest)"},{"p":"com.google.adk.flows.llmflows","c":"Contents","l":"processRequest(InvocationContext, LlmRequest)","u":"processRequest(com.google.adk.agents.InvocationContext,com.google.adk.models.LlmRequest)"},{"p":"com.google.adk.flows.llmflows","c":"Identity","l":"processRequest(InvocationContext, LlmRequest)","u":"processRequest(com.google.adk.agents.InvocationContext,com.google.adk.models.LlmRequest)"},{"p":"com.google.adk.flows.llmflows","c":"Instructions","l":"processRequest(InvocationContext, LlmRequest)","u":"processRequest(com.google.adk.agents.InvocationContext,com.google.adk.models.LlmRequest)"},{"p":"com.google.adk.flows.llmflows","c":"OutputSchema","l":"processRequest(InvocationContext, LlmRequest)","u":"processRequest(com.google.adk.agents.InvocationContext,com.google.adk.models.LlmRequest)"},{"p":"com.google.adk.flows.llmflows","c":"RequestConfirmationLlmRequestProcessor","l":"processRequest(InvocationContext, LlmRequest)","u":"processRequest(com.google.adk.agents.InvocationContext,com.google.adk.models.LlmRequest)"},{"p":"com.google.adk.flows.llmflows","c":"RequestProcessor","l":"processRequest(InvocationContext, LlmRequest)","u":"processRequest(com.google.adk.agents.InvocationContext,com.google.adk.models.LlmRequest)"},{"p":"com.google.adk.flows.llmflows","c":"ResponseProcessor","l":"processResponse(InvocationContext, LlmResponse)","u":"processResponse(com.google.adk.agents.InvocationContext,com.google.adk.models.LlmResponse)"},{"p":"com.google.adk.models.springai","c":"StreamingResponseAggregator","l":"processStreamingResponse(LlmResponse)","u":"processStreamingResponse(com.google.adk.models.LlmResponse)"},{"p":"com.google.adk.models","c":"VertexCredentials","l":"project()"},{"p":"com.google.adk.sessions","c":"HttpApiClient","l":"project()"},{"p":"com.google.adk.tools","c":"VertexAiSearchTool","l":"project()"},{"p":"com.google.adk.models","c":"VertexCredentials.Builder","l":"project(String)","u":"project(java.lang.String)"},{"p":"com.google.adk.tools","c":"VertexAiSearchTool.Builder","l":"project(String)","u":"project(java.lang.String)"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryLoggerConfig","l":"projectId()"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryLoggerConfig.Builder","l":"projectId(String)","u":"projectId(java.lang.String)"},{"p":"com.google.adk.models.chat","c":"ChatCompletionsRequest","l":"promptCacheKey","k":"1"},{"p":"com.google.adk.models.chat","c":"ChatCompletionsRequest","l":"promptCacheRetention","k":"1"},{"p":"com.google.adk.agents","c":"Instruction.Provider","l":"Provider(Function)","u":"%3Cinit%3E(java.util.function.Function)","k":"3"},{"p":"com.google.adk.models","c":"ApigeeLlm.Builder","l":"proxyUrl(String)","u":"proxyUrl(java.lang.String)"},{"p":"com.example.adkprtriaging","c":"Settings","l":"pullRequestNumber()","k":"6"},{"p":"com.google.adk.plugins.agentanalytics","c":"TraceManager","l":"pushSpan(InvocationContext, String)","u":"pushSpan(com.google.adk.agents.InvocationContext,java.lang.String)"},{"p":"com.google.adk.sessions","c":"State","l":"put(String, Object)","u":"put(java.lang.String,java.lang.Object)"},{"p":"com.google.adk.tools","c":"BaseTool.ToolArgsConfig","l":"put(String, Object)","u":"put(java.lang.String,java.lang.Object)"},{"p":"com.google.adk.sessions","c":"State","l":"putAll(Map)","u":"putAll(java.util.Map)"},{"p":"com.google.adk.sessions","c":"State","l":"putIfAbsent(String, Object)","u":"putIfAbsent(java.lang.String,java.lang.Object)"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryLoggerConfig","l":"queueMaxSize()"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryLoggerConfig.Builder","l":"queueMaxSize(int)"},{"p":"com.google.adk.models.springai.error","c":"SpringAIErrorMapper.ErrorCategory","l":"RATE_LIMITED","k":"0"},{"p":"com.google.adk.agents","c":"ReadonlyContext","l":"ReadonlyContext(InvocationContext)","u":"%3Cinit%3E(com.google.adk.agents.InvocationContext)","k":"3"},{"p":"com.google.adk.tools.mcp","c":"StreamableHttpServerParameters","l":"readTimeout()"},{"p":"com.google.adk.tools.mcp","c":"StreamableHttpServerParameters.Builder","l":"readTimeout(Duration)","u":"readTimeout(java.time.Duration)"},{"p":"com.google.adk.agents","c":"LiveRequestQueue","l":"realtime(Blob)","u":"realtime(com.google.genai.types.Blob)"},{"p":"com.google.adk.models.chat","c":"ChatCompletionsRequest","l":"reasoningEffort","k":"1"},{"p":"com.google.adk.models","c":"BaseLlmConnection","l":"receive()"},{"p":"com.google.adk.models","c":"GeminiLlmConnection","l":"receive()"},{"p":"com.google.adk.flows.llmflows.audio","c":"SpeechClientInterface","l":"recognize(RecognitionConfig, RecognitionAudio)","u":"recognize(com.google.cloud.speech.v1.RecognitionConfig,com.google.cloud.speech.v1.RecognitionAudio)"},{"p":"com.google.adk.flows.llmflows.audio","c":"VertexSpeechClient","l":"recognize(RecognitionConfig, RecognitionAudio)","u":"recognize(com.google.cloud.speech.v1.RecognitionConfig,com.google.cloud.speech.v1.RecognitionAudio)"},{"p":"com.google.adk.telemetry","c":"Instrumentation","l":"recordAgentInvocation(InvocationContext, BaseAgent)","u":"recordAgentInvocation(com.google.adk.agents.InvocationContext,com.google.adk.agents.BaseAgent)","k":"6"},{"p":"com.google.adk.telemetry","c":"Instrumentation","l":"recordAgentInvocation(InvocationContext, BaseAgent, Context)","u":"recordAgentInvocation(com.google.adk.agents.InvocationContext,com.google.adk.agents.BaseAgent,io.opentelemetry.context.Context)","k":"6"},{"p":"com.google.adk.telemetry","c":"Metrics","l":"recordAgentInvocationDuration(String, Duration, Throwable)","u":"recordAgentInvocationDuration(java.lang.String,java.time.Duration,java.lang.Throwable)","k":"6"},{"p":"com.google.adk.telemetry","c":"Metrics","l":"recordAgentRequestSize(String, Content)","u":"recordAgentRequestSize(java.lang.String,com.google.genai.types.Content)","k":"6"},{"p":"com.google.adk.telemetry","c":"Metrics","l":"recordAgentResponseSize(String, List)","u":"recordAgentResponseSize(java.lang.String,java.util.List)","k":"6"},{"p":"com.google.adk.telemetry","c":"Metrics","l":"recordAgentWorkflowSteps(String, List)","u":"recordAgentWorkflowSteps(java.lang.String,java.util.List)","k":"6"},{"p":"com.google.adk.models.springai.observability","c":"SpringAIObservabilityHandler","l":"recordError(SpringAIObservabilityHandler.RequestContext, Throwable)","u":"recordError(com.google.adk.models.springai.observability.SpringAIObservabilityHandler.RequestContext,java.lang.Throwable)"},{"p":"com.google.adk.plugins.agentanalytics","c":"TraceManager","l":"recordFirstToken(String)","u":"recordFirstToken(java.lang.String)"},{"p":"com.google.adk.plugins.recordings","c":"Recording","l":"Recording()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.plugins.recordings","c":"Recordings","l":"recordings()"},{"p":"com.google.adk.plugins.recordings","c":"Recordings","l":"Recordings()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.plugins.recordings","c":"Recordings.Builder","l":"recordings(List)","u":"recordings(java.util.List)"},{"p":"com.google.adk.telemetry","c":"Instrumentation.AgentInvocation","l":"recordMetrics(Duration, Throwable)","u":"recordMetrics(java.time.Duration,java.lang.Throwable)"},{"p":"com.google.adk.telemetry","c":"Instrumentation.ClosableTelemetryScope","l":"recordMetrics(Duration, Throwable)","u":"recordMetrics(java.time.Duration,java.lang.Throwable)"},{"p":"com.google.adk.telemetry","c":"Instrumentation.ToolExecution","l":"recordMetrics(Duration, Throwable)","u":"recordMetrics(java.time.Duration,java.lang.Throwable)"},{"p":"com.google.adk.models.springai.observability","c":"SpringAIObservabilityHandler","l":"recordSuccess(SpringAIObservabilityHandler.RequestContext, int, int, int)","u":"recordSuccess(com.google.adk.models.springai.observability.SpringAIObservabilityHandler.RequestContext,int,int,int)"},{"p":"com.google.adk.telemetry","c":"Instrumentation","l":"recordToolExecution(BaseTool, BaseAgent, Map)","u":"recordToolExecution(com.google.adk.tools.BaseTool,com.google.adk.agents.BaseAgent,java.util.Map)","k":"6"},{"p":"com.google.adk.telemetry","c":"Instrumentation","l":"recordToolExecution(BaseTool, BaseAgent, Map, Context)","u":"recordToolExecution(com.google.adk.tools.BaseTool,com.google.adk.agents.BaseAgent,java.util.Map,io.opentelemetry.context.Context)","k":"6"},{"p":"com.google.adk.telemetry","c":"Metrics","l":"recordToolExecutionDuration(String, String, Duration, Throwable)","u":"recordToolExecutionDuration(java.lang.String,java.lang.String,java.time.Duration,java.lang.Throwable)","k":"6"},{"p":"com.google.adk.telemetry","c":"Metrics","l":"recordToolRequestSize(String, String, Map)","u":"recordToolRequestSize(java.lang.String,java.lang.String,java.util.Map)","k":"6"},{"p":"com.google.adk.telemetry","c":"Metrics","l":"recordToolResponseSize(String, String, Event)","u":"recordToolResponseSize(java.lang.String,java.lang.String,com.google.adk.events.Event)","k":"6"},{"p":"com.google.adk.utils","c":"ComponentRegistry","l":"register(String, Object)","u":"register(java.lang.String,java.lang.Object)"},{"p":"com.google.adk.models","c":"LlmRegistry","l":"registerLlm(String, LlmRegistry.LlmFactory)","u":"registerLlm(java.lang.String,com.google.adk.models.LlmRegistry.LlmFactory)","k":"6"},{"p":"com.google.adk.plugins","c":"PluginManager","l":"registerPlugin(Plugin)","u":"registerPlugin(com.google.adk.plugins.Plugin)"},{"p":"com.google.adk.web.websocket","c":"WebSocketConfig","l":"registerWebSocketHandlers(WebSocketHandlerRegistry)","u":"registerWebSocketHandlers(org.springframework.web.socket.config.annotation.WebSocketHandlerRegistry)"},{"p":"com.google.adk.a2a.converters","c":"PartConverter","l":"remoteCallAsUserPart(String, Part)","u":"remoteCallAsUserPart(java.lang.String,com.google.genai.types.Part)","k":"6"},{"p":"com.google.adk.sessions","c":"State","l":"remove(Object)","u":"remove(java.lang.Object)"},{"p":"com.google.adk.sessions","c":"State","l":"remove(Object, Object)","u":"remove(java.lang.Object,java.lang.Object)"},{"p":"com.google.adk.models","c":"GeminiUtil","l":"removeClientFunctionCallId(LlmRequest)","u":"removeClientFunctionCallId(com.google.adk.models.LlmRequest)","k":"6"},{"p":"com.google.adk.sessions","c":"State","l":"REMOVED","k":"2"},{"p":"com.example.adkstale","c":"AdkStaleAgent","l":"removeLabelFromIssue(int, String)","u":"removeLabelFromIssue(int,java.lang.String)","k":"6"},{"p":"com.example.github","c":"GitHubTools","l":"removeLabelFromIssue(String, String, int, String)","u":"removeLabelFromIssue(java.lang.String,java.lang.String,int,java.lang.String)","k":"6"},{"p":"com.google.adk.events","c":"EventActions","l":"removeStateByKey(String)","u":"removeStateByKey(java.lang.String)"},{"p":"com.google.adk.sessions","c":"State","l":"replace(String, Object)","u":"replace(java.lang.String,java.lang.Object)"},{"p":"com.google.adk.sessions","c":"State","l":"replace(String, Object, Object)","u":"replace(java.lang.String,java.lang.Object,java.lang.Object)"},{"p":"com.google.adk.planner.goap","c":"ReplanPolicy.Replan","l":"Replan(int)","u":"%3Cinit%3E(int)","k":"3"},{"p":"com.google.adk.plugins","c":"ReplayConfigError","l":"ReplayConfigError(String)","u":"%3Cinit%3E(java.lang.String)","k":"3"},{"p":"com.google.adk.plugins","c":"ReplayConfigError","l":"ReplayConfigError(String, Throwable)","u":"%3Cinit%3E(java.lang.String,java.lang.Throwable)","k":"3"},{"p":"com.google.adk.plugins","c":"ReplayPlugin","l":"ReplayPlugin()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.plugins","c":"ReplayPlugin","l":"ReplayPlugin(String)","u":"%3Cinit%3E(java.lang.String)","k":"3"},{"p":"com.google.adk.plugins","c":"ReplayVerificationError","l":"ReplayVerificationError(String)","u":"%3Cinit%3E(java.lang.String)","k":"3"},{"p":"com.google.adk.plugins","c":"ReplayVerificationError","l":"ReplayVerificationError(String, Throwable)","u":"%3Cinit%3E(java.lang.String,java.lang.Throwable)","k":"3"},{"p":"com.example.adkprtriaging","c":"Settings","l":"repo()","k":"6"},{"p":"com.example.adkspam","c":"Settings","l":"repo()","k":"6"},{"p":"com.example.adkstale","c":"Settings","l":"repo()","k":"6"},{"p":"com.example.adktriaging","c":"Settings","l":"repo()","k":"6"},{"p":"com.google.adk.a2a.common","c":"A2AMetadata.Key","l":"REQUEST","k":"0"},{"p":"com.google.adk.flows.llmflows","c":"Functions","l":"REQUEST_CONFIRMATION_FUNCTION_CALL_NAME","k":"2"},{"p":"com.google.adk.flows.llmflows","c":"SingleFlow","l":"REQUEST_PROCESSORS","k":"2"},{"p":"com.google.adk.sessions","c":"HttpApiClient","l":"request(String, String, String)","u":"request(java.lang.String,java.lang.String,java.lang.String)"},{"p":"com.example.adkstale","c":"Settings","l":"requestClarificationLabel()","k":"6"},{"p":"com.google.adk.tools","c":"ToolContext","l":"requestConfirmation()"},{"p":"com.google.adk.tools","c":"ToolContext","l":"requestConfirmation(String)","u":"requestConfirmation(java.lang.String)"},{"p":"com.google.adk.tools","c":"ToolContext","l":"requestConfirmation(String, Object)","u":"requestConfirmation(java.lang.String,java.lang.Object)"},{"p":"com.google.adk.flows.llmflows","c":"RequestConfirmationLlmRequestProcessor","l":"RequestConfirmationLlmRequestProcessor()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.models.springai.observability","c":"SpringAIObservabilityHandler.RequestContext","l":"RequestContext(String, String, Instant, boolean, Timer.Sample)","u":"%3Cinit%3E(java.lang.String,java.lang.String,java.time.Instant,boolean,io.micrometer.core.instrument.Timer.Sample)","k":"3"},{"p":"com.google.adk.events","c":"EventActions","l":"requestedAuthConfigs()"},{"p":"com.google.adk.events","c":"EventActions.Builder","l":"requestedAuthConfigs(Map)","u":"requestedAuthConfigs(java.util.Map)"},{"p":"com.google.adk.events","c":"EventActions","l":"requestedToolConfirmations()"},{"p":"com.google.adk.events","c":"EventActions.Builder","l":"requestedToolConfirmations(Map)","u":"requestedToolConfirmations(java.util.Map)"},{"p":"com.google.adk.flows.llmflows","c":"RequestProcessor.RequestProcessingResult","l":"RequestProcessingResult()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.flows.llmflows","c":"CodeExecution","l":"requestProcessor","k":"2"},{"p":"com.google.adk.flows.llmflows","c":"BaseLlmFlow","l":"requestProcessors","k":"1"},{"p":"com.google.adk.models.springai","c":"StreamingResponseAggregator","l":"reset()"},{"p":"com.google.adk.codeexecutors","c":"CodeExecutorContext","l":"resetErrorCount(String)","u":"resetErrorCount(java.lang.String)"},{"p":"com.google.adk.utils","c":"FirestoreProperties","l":"resetForTest()","k":"6"},{"p":"com.google.adk.utils","c":"ComponentRegistry","l":"resolveAfterAgentCallback(String)","u":"resolveAfterAgentCallback(java.lang.String)","k":"6"},{"p":"com.google.adk.utils","c":"ComponentRegistry","l":"resolveAfterModelCallback(String)","u":"resolveAfterModelCallback(java.lang.String)","k":"6"},{"p":"com.google.adk.utils","c":"ComponentRegistry","l":"resolveAfterToolCallback(String)","u":"resolveAfterToolCallback(java.lang.String)","k":"6"},{"p":"com.google.adk.utils","c":"ComponentRegistry","l":"resolveAgentClass(String)","u":"resolveAgentClass(java.lang.String)","k":"6"},{"p":"com.google.adk.utils","c":"ComponentRegistry","l":"resolveAgentInstance(String)","u":"resolveAgentInstance(java.lang.String)","k":"6"},{"p":"com.google.adk.agents","c":"ConfigAgentUtils","l":"resolveAndSetCallback(List, Class, String, Consumer)","u":"resolveAndSetCallback(java.util.List,java.lang.Class,java.lang.String,java.util.function.Consumer)","k":"6"},{"p":"com.google.adk.agents","c":"ConfigAgentUtils","l":"resolveAndSetCommonAgentFields(BaseAgent.Builder, BaseAgentConfig, String)","u":"resolveAndSetCommonAgentFields(com.google.adk.agents.BaseAgent.Builder,com.google.adk.agents.BaseAgentConfig,java.lang.String)","k":"6"},{"p":"com.google.adk.utils","c":"ComponentRegistry","l":"resolveBeforeAgentCallback(String)","u":"resolveBeforeAgentCallback(java.lang.String)","k":"6"},{"p":"com.google.adk.utils","c":"ComponentRegistry","l":"resolveBeforeModelCallback(String)","u":"resolveBeforeModelCallback(java.lang.String)","k":"6"},{"p":"com.google.adk.utils","c":"ComponentRegistry","l":"resolveBeforeToolCallback(String)","u":"resolveBeforeToolCallback(java.lang.String)","k":"6"},{"p":"com.google.adk.agents","c":"LlmAgent","l":"resolvedModel()"},{"p":"com.google.adk.agents","c":"ConfigAgentUtils","l":"resolveSubAgents(List, String)","u":"resolveSubAgents(java.util.List,java.lang.String)","k":"6"},{"p":"com.google.adk.utils","c":"ComponentRegistry","l":"resolveToolClass(String)","u":"resolveToolClass(java.lang.String)","k":"6"},{"p":"com.google.adk.utils","c":"ComponentRegistry","l":"resolveToolInstance(String)","u":"resolveToolInstance(java.lang.String)","k":"6"},{"p":"com.google.adk.utils","c":"ComponentRegistry","l":"resolveToolsetClass(String)","u":"resolveToolsetClass(java.lang.String)","k":"6"},{"p":"com.google.adk.utils","c":"ComponentRegistry","l":"resolveToolsetInstance(String)","u":"resolveToolsetInstance(java.lang.String)","k":"6"},{"p":"com.google.adk.skills","c":"SkillSourceException","l":"RESOURCE_LOAD_ERROR","k":"2"},{"p":"com.google.adk.skills","c":"SkillSourceException","l":"RESOURCE_NOT_FOUND","k":"2"},{"p":"com.google.adk.a2a.common","c":"A2AMetadata.Key","l":"RESPONSE","k":"0"},{"p":"com.google.adk.a2a.converters","c":"PartConverter","l":"RESPONSE_KEY","k":"2"},{"p":"com.google.adk.flows.llmflows","c":"SingleFlow","l":"RESPONSE_PROCESSORS","k":"2"},{"p":"com.google.adk.models","c":"LlmResponse.Builder","l":"response(GenerateContentResponse)","u":"response(com.google.genai.types.GenerateContentResponse)"},{"p":"com.google.adk.models.chat","c":"ChatCompletionsRequest","l":"responseFormat","k":"1"},{"p":"com.google.adk.agents","c":"RunConfig","l":"responseModalities()"},{"p":"com.google.adk.agents","c":"RunConfig.Builder","l":"responseModalities(Iterable)","u":"responseModalities(java.lang.Iterable)"},{"p":"com.google.adk.flows.llmflows","c":"ResponseProcessor.ResponseProcessingResult","l":"ResponseProcessingResult()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.flows.llmflows","c":"CodeExecution","l":"responseProcessor","k":"2"},{"p":"com.google.adk.flows.llmflows","c":"BaseLlmFlow","l":"responseProcessors","k":"1"},{"p":"com.google.adk.agents","c":"PlannerAction.DoneWithResult","l":"result()"},{"p":"com.google.adk.apps","c":"App","l":"resumabilityConfig()"},{"p":"com.google.adk.apps","c":"ResumabilityConfig","l":"ResumabilityConfig()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.agents","c":"InvocationContext.Builder","l":"resumabilityConfig(ResumabilityConfig)","u":"resumabilityConfig(com.google.adk.apps.ResumabilityConfig)"},{"p":"com.google.adk.apps","c":"App.Builder","l":"resumabilityConfig(ResumabilityConfig)","u":"resumabilityConfig(com.google.adk.apps.ResumabilityConfig)"},{"p":"com.google.adk.apps","c":"ResumabilityConfig.Builder","l":"resumable(boolean)"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryLoggerConfig","l":"retryConfig()"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryLoggerConfig.RetryConfig","l":"RetryConfig()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryLoggerConfig.Builder","l":"retryConfig(BigQueryLoggerConfig.RetryConfig)","u":"retryConfig(com.google.adk.plugins.agentanalytics.BigQueryLoggerConfig.RetryConfig)"},{"p":"com.example.a2a_basic","c":"A2AAgent","l":"ROLL_AGENT","k":"2"},{"p":"com.example","c":"CustomDieTool","l":"ROLL_DIE_INSTANCE","k":"2"},{"p":"com.example.a2a_basic","c":"A2AAgent","l":"rollDie(int, ToolContext)","u":"rollDie(int,com.google.adk.tools.ToolContext)","k":"6"},{"p":"com.example","c":"CustomDieTool","l":"rollDie(int, ToolContext)","u":"rollDie(int,com.google.adk.tools.ToolContext)","k":"6"},{"p":"com.example.helloworld","c":"HelloWorldAgent","l":"rollDie(int, ToolContext)","u":"rollDie(int,com.google.adk.tools.ToolContext)","k":"6"},{"p":"com.example.adkdocs","c":"AdkDocsReleaseAnalyzerAgent","l":"ROOT_AGENT","k":"2"},{"p":"com.example.adkprtriaging","c":"AdkPrTriagingAgent","l":"ROOT_AGENT","k":"2"},{"p":"com.example.adkspam","c":"SpamDetectionAgent","l":"ROOT_AGENT","k":"2"},{"p":"com.example.adkstale","c":"AdkStaleAgent","l":"ROOT_AGENT","k":"2"},{"p":"com.example.adktriaging","c":"AdkTriagingAgent","l":"ROOT_AGENT","k":"2"},{"p":"com.example.helloworld","c":"HelloWorldAgent","l":"ROOT_AGENT","k":"2"},{"p":"com.example.mcpfilesystem","c":"McpFilesystemAgent","l":"ROOT_AGENT","k":"2"},{"p":"com.google.adk.samples.a2aagent.agent","c":"Agent","l":"ROOT_AGENT","k":"2"},{"p":"com.google.adk.tutorials","c":"CityTimeWeather","l":"ROOT_AGENT","k":"2"},{"p":"com.google.adk.utils","c":"Constants","l":"ROOT_COLLECTION_NAME","k":"2"},{"p":"com.example.adkprtriaging","c":"AdkPrTriagingAgent","l":"rootAgent()","k":"6"},{"p":"com.example.adkspam","c":"SpamDetectionAgent","l":"rootAgent()","k":"6"},{"p":"com.example.adkstale","c":"AdkStaleAgent","l":"rootAgent()","k":"6"},{"p":"com.example.adktriaging","c":"AdkTriagingAgent","l":"rootAgent()","k":"6"},{"p":"com.google.adk.agents","c":"BaseAgent","l":"rootAgent()"},{"p":"com.google.adk.apps","c":"App","l":"rootAgent()"},{"p":"com.google.adk.apps","c":"App.Builder","l":"rootAgent(BaseAgent)","u":"rootAgent(com.google.adk.agents.BaseAgent)"},{"p":"com.example.adkdocs","c":"AdkDocsReleaseAnalyzerRun","l":"run()"},{"p":"com.google.adk.flows","c":"BaseFlow","l":"run(InvocationContext)","u":"run(com.google.adk.agents.InvocationContext)"},{"p":"com.google.adk.flows.llmflows","c":"BaseLlmFlow","l":"run(InvocationContext)","u":"run(com.google.adk.agents.InvocationContext)"},{"p":"com.google.adk.agents","c":"PlannerAction.RunAgents","l":"RunAgents(BaseAgent)","u":"%3Cinit%3E(com.google.adk.agents.BaseAgent)","k":"3"},{"p":"com.google.adk.agents","c":"PlannerAction.RunAgents","l":"RunAgents(ImmutableList)","u":"%3Cinit%3E(com.google.common.collect.ImmutableList)","k":"3"},{"p":"com.google.adk.tools","c":"BaseTool","l":"runAsync(I, ToolContext, Class)","u":"runAsync(I,com.google.adk.tools.ToolContext,java.lang.Class)"},{"p":"com.google.adk.tools","c":"BaseTool","l":"runAsync(I, ToolContext, ObjectMapper, Class)","u":"runAsync(I,com.google.adk.tools.ToolContext,com.fasterxml.jackson.databind.ObjectMapper,java.lang.Class)"},{"p":"com.google.adk.tools","c":"BaseTool","l":"runAsync(I, ToolContext, ObjectMapper, TypeReference)","u":"runAsync(I,com.google.adk.tools.ToolContext,com.fasterxml.jackson.databind.ObjectMapper,com.fasterxml.jackson.core.type.TypeReference)"},{"p":"com.google.adk.tools","c":"BaseTool","l":"runAsync(I, ToolContext, TypeReference)","u":"runAsync(I,com.google.adk.tools.ToolContext,com.fasterxml.jackson.core.type.TypeReference)"},{"p":"com.google.adk.agents","c":"BaseAgent","l":"runAsync(InvocationContext)","u":"runAsync(com.google.adk.agents.InvocationContext)"},{"p":"com.google.adk.tools","c":"AgentTool","l":"runAsync(Map, ToolContext)","u":"runAsync(java.util.Map,com.google.adk.tools.ToolContext)"},{"p":"com.google.adk.tools.applicationintegrationtoolset","c":"IntegrationConnectorTool","l":"runAsync(Map, ToolContext)","u":"runAsync(java.util.Map,com.google.adk.tools.ToolContext)"},{"p":"com.google.adk.tools","c":"BaseTool","l":"runAsync(Map, ToolContext)","u":"runAsync(java.util.Map,com.google.adk.tools.ToolContext)"},{"p":"com.google.adk.tools.computeruse","c":"ComputerUseTool","l":"runAsync(Map, ToolContext)","u":"runAsync(java.util.Map,com.google.adk.tools.ToolContext)"},{"p":"com.google.adk.tools","c":"FunctionTool","l":"runAsync(Map, ToolContext)","u":"runAsync(java.util.Map,com.google.adk.tools.ToolContext)"},{"p":"com.google.adk.tools","c":"LoadArtifactsTool","l":"runAsync(Map, ToolContext)","u":"runAsync(java.util.Map,com.google.adk.tools.ToolContext)"},{"p":"com.google.adk.tools.mcp","c":"McpAsyncTool","l":"runAsync(Map, ToolContext)","u":"runAsync(java.util.Map,com.google.adk.tools.ToolContext)"},{"p":"com.google.adk.tools.mcp","c":"McpTool","l":"runAsync(Map, ToolContext)","u":"runAsync(java.util.Map,com.google.adk.tools.ToolContext)"},{"p":"com.google.adk.tools.retrieval","c":"VertexAiRagRetrieval","l":"runAsync(Map, ToolContext)","u":"runAsync(java.util.Map,com.google.adk.tools.ToolContext)"},{"p":"com.google.adk.tools","c":"SetModelResponseTool","l":"runAsync(Map, ToolContext)","u":"runAsync(java.util.Map,com.google.adk.tools.ToolContext)"},{"p":"com.google.adk.runner","c":"Runner","l":"runAsync(SessionKey, Content)","u":"runAsync(com.google.adk.sessions.SessionKey,com.google.genai.types.Content)"},{"p":"com.google.adk.runner","c":"Runner","l":"runAsync(SessionKey, Content, RunConfig)","u":"runAsync(com.google.adk.sessions.SessionKey,com.google.genai.types.Content,com.google.adk.agents.RunConfig)"},{"p":"com.google.adk.runner","c":"Runner","l":"runAsync(SessionKey, Content, RunConfig, Map)","u":"runAsync(com.google.adk.sessions.SessionKey,com.google.genai.types.Content,com.google.adk.agents.RunConfig,java.util.Map)"},{"p":"com.google.adk.runner","c":"Runner","l":"runAsync(String, String, Content)","u":"runAsync(java.lang.String,java.lang.String,com.google.genai.types.Content)"},{"p":"com.google.adk.runner","c":"Runner","l":"runAsync(String, String, Content, RunConfig)","u":"runAsync(java.lang.String,java.lang.String,com.google.genai.types.Content,com.google.adk.agents.RunConfig)"},{"p":"com.google.adk.runner","c":"Runner","l":"runAsync(String, String, Content, RunConfig, Map)","u":"runAsync(java.lang.String,java.lang.String,com.google.genai.types.Content,com.google.adk.agents.RunConfig,java.util.Map)"},{"p":"com.google.adk.tools","c":"BaseTool","l":"runAsync(T, ToolContext)","u":"runAsync(T,com.google.adk.tools.ToolContext)"},{"p":"com.google.adk.tools","c":"BaseTool","l":"runAsync(T, ToolContext, ObjectMapper)","u":"runAsync(T,com.google.adk.tools.ToolContext,com.fasterxml.jackson.databind.ObjectMapper)"},{"p":"com.google.adk.a2a.agent","c":"RemoteA2AAgent","l":"runAsyncImpl(InvocationContext)","u":"runAsyncImpl(com.google.adk.agents.InvocationContext)"},{"p":"com.google.adk.agents","c":"BaseAgent","l":"runAsyncImpl(InvocationContext)","u":"runAsyncImpl(com.google.adk.agents.InvocationContext)"},{"p":"com.google.adk.agents","c":"LlmAgent","l":"runAsyncImpl(InvocationContext)","u":"runAsyncImpl(com.google.adk.agents.InvocationContext)"},{"p":"com.google.adk.agents","c":"LoopAgent","l":"runAsyncImpl(InvocationContext)","u":"runAsyncImpl(com.google.adk.agents.InvocationContext)"},{"p":"com.google.adk.agents","c":"ParallelAgent","l":"runAsyncImpl(InvocationContext)","u":"runAsyncImpl(com.google.adk.agents.InvocationContext)"},{"p":"com.google.adk.agents","c":"PlannerAgent","l":"runAsyncImpl(InvocationContext)","u":"runAsyncImpl(com.google.adk.agents.InvocationContext)"},{"p":"com.google.adk.agents","c":"SequentialAgent","l":"runAsyncImpl(InvocationContext)","u":"runAsyncImpl(com.google.adk.agents.InvocationContext)"},{"p":"com.google.adk.runner","c":"Runner","l":"runAsyncImpl(Session, Content, RunConfig, Map)","u":"runAsyncImpl(com.google.adk.sessions.Session,com.google.genai.types.Content,com.google.adk.agents.RunConfig,java.util.Map)"},{"p":"com.google.adk.plugins","c":"PluginManager","l":"runBeforeRunCallback(InvocationContext)","u":"runBeforeRunCallback(com.google.adk.agents.InvocationContext)"},{"p":"com.google.adk.a2a.executor","c":"AgentExecutorConfig","l":"runConfig()"},{"p":"com.google.adk.agents","c":"InvocationContext","l":"runConfig()"},{"p":"com.google.adk.agents","c":"RunConfig","l":"RunConfig()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.a2a.executor","c":"AgentExecutorConfig.Builder","l":"runConfig(RunConfig)","u":"runConfig(com.google.adk.agents.RunConfig)"},{"p":"com.google.adk.agents","c":"InvocationContext.Builder","l":"runConfig(RunConfig)","u":"runConfig(com.google.adk.agents.RunConfig)"},{"p":"com.google.adk.web.controller","c":"EvaluationController","l":"runEval(String, String, RunEvalRequest)","u":"runEval(java.lang.String,java.lang.String,com.google.adk.web.dto.RunEvalRequest)"},{"p":"com.google.adk.web.dto","c":"RunEvalRequest","l":"RunEvalRequest()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.web.dto","c":"RunEvalResult","l":"RunEvalResult()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.web.dto","c":"RunEvalResult","l":"RunEvalResult(String, String, String, String, List, String)","u":"%3Cinit%3E(java.lang.String,java.lang.String,java.lang.String,java.lang.String,java.util.List,java.lang.String)","k":"3"},{"p":"com.google.adk.agents","c":"BaseAgent","l":"runLive(InvocationContext)","u":"runLive(com.google.adk.agents.InvocationContext)"},{"p":"com.google.adk.flows","c":"BaseFlow","l":"runLive(InvocationContext)","u":"runLive(com.google.adk.agents.InvocationContext)"},{"p":"com.google.adk.flows.llmflows","c":"BaseLlmFlow","l":"runLive(InvocationContext)","u":"runLive(com.google.adk.agents.InvocationContext)"},{"p":"com.google.adk.runner","c":"Runner","l":"runLive(Session, LiveRequestQueue, RunConfig)","u":"runLive(com.google.adk.sessions.Session,com.google.adk.agents.LiveRequestQueue,com.google.adk.agents.RunConfig)"},{"p":"com.google.adk.runner","c":"Runner","l":"runLive(SessionKey, LiveRequestQueue, RunConfig)","u":"runLive(com.google.adk.sessions.SessionKey,com.google.adk.agents.LiveRequestQueue,com.google.adk.agents.RunConfig)"},{"p":"com.google.adk.runner","c":"Runner","l":"runLive(String, String, LiveRequestQueue, RunConfig)","u":"runLive(java.lang.String,java.lang.String,com.google.adk.agents.LiveRequestQueue,com.google.adk.agents.RunConfig)"},{"p":"com.google.adk.a2a.agent","c":"RemoteA2AAgent","l":"runLiveImpl(InvocationContext)","u":"runLiveImpl(com.google.adk.agents.InvocationContext)"},{"p":"com.google.adk.agents","c":"BaseAgent","l":"runLiveImpl(InvocationContext)","u":"runLiveImpl(com.google.adk.agents.InvocationContext)"},{"p":"com.google.adk.agents","c":"LlmAgent","l":"runLiveImpl(InvocationContext)","u":"runLiveImpl(com.google.adk.agents.InvocationContext)"},{"p":"com.google.adk.agents","c":"LoopAgent","l":"runLiveImpl(InvocationContext)","u":"runLiveImpl(com.google.adk.agents.InvocationContext)"},{"p":"com.google.adk.agents","c":"ParallelAgent","l":"runLiveImpl(InvocationContext)","u":"runLiveImpl(com.google.adk.agents.InvocationContext)"},{"p":"com.google.adk.agents","c":"PlannerAgent","l":"runLiveImpl(InvocationContext)","u":"runLiveImpl(com.google.adk.agents.InvocationContext)"},{"p":"com.google.adk.agents","c":"SequentialAgent","l":"runLiveImpl(InvocationContext)","u":"runLiveImpl(com.google.adk.agents.InvocationContext)"},{"p":"com.google.adk.runner","c":"Runner","l":"runLiveImpl(Session, LiveRequestQueue, RunConfig)","u":"runLiveImpl(com.google.adk.sessions.Session,com.google.adk.agents.LiveRequestQueue,com.google.adk.agents.RunConfig)"},{"p":"com.google.adk.runner","c":"Runner","l":"Runner(BaseAgent, String, BaseArtifactService, BaseSessionService)","u":"%3Cinit%3E(com.google.adk.agents.BaseAgent,java.lang.String,com.google.adk.artifacts.BaseArtifactService,com.google.adk.sessions.BaseSessionService)","k":"3"},{"p":"com.google.adk.runner","c":"Runner","l":"Runner(BaseAgent, String, BaseArtifactService, BaseSessionService, BaseMemoryService)","u":"%3Cinit%3E(com.google.adk.agents.BaseAgent,java.lang.String,com.google.adk.artifacts.BaseArtifactService,com.google.adk.sessions.BaseSessionService,com.google.adk.memory.BaseMemoryService)","k":"3"},{"p":"com.google.adk.runner","c":"Runner","l":"Runner(BaseAgent, String, BaseArtifactService, BaseSessionService, BaseMemoryService, List)","u":"%3Cinit%3E(com.google.adk.agents.BaseAgent,java.lang.String,com.google.adk.artifacts.BaseArtifactService,com.google.adk.sessions.BaseSessionService,com.google.adk.memory.BaseMemoryService,java.util.List)","k":"3"},{"p":"com.google.adk.runner","c":"Runner","l":"Runner(BaseAgent, String, BaseArtifactService, BaseSessionService, BaseMemoryService, List, EventsCompactionConfig, ContextCacheConfig)","u":"%3Cinit%3E(com.google.adk.agents.BaseAgent,java.lang.String,com.google.adk.artifacts.BaseArtifactService,com.google.adk.sessions.BaseSessionService,com.google.adk.memory.BaseMemoryService,java.util.List,com.google.adk.summarizer.EventsCompactionConfig,com.google.adk.agents.ContextCacheConfig)","k":"3"},{"p":"com.google.adk.runner","c":"Runner","l":"Runner(BaseAgent, String, BaseArtifactService, BaseSessionService, BaseMemoryService, List, EventsCompactionConfig, ContextCacheConfig, ResumabilityConfig)","u":"%3Cinit%3E(com.google.adk.agents.BaseAgent,java.lang.String,com.google.adk.artifacts.BaseArtifactService,com.google.adk.sessions.BaseSessionService,com.google.adk.memory.BaseMemoryService,java.util.List,com.google.adk.summarizer.EventsCompactionConfig,com.google.adk.agents.ContextCacheConfig,com.google.adk.apps.ResumabilityConfig)","k":"3"},{"p":"com.google.adk.web.service","c":"RunnerService","l":"RunnerService(AgentLoader, BaseArtifactService, BaseSessionService, BaseMemoryService, List)","u":"%3Cinit%3E(com.google.adk.web.AgentLoader,com.google.adk.artifacts.BaseArtifactService,com.google.adk.sessions.BaseSessionService,com.google.adk.memory.BaseMemoryService,java.util.List)","k":"3"},{"p":"com.google.adk.plugins","c":"PluginManager","l":"runOnUserMessageCallback(InvocationContext, Content)","u":"runOnUserMessageCallback(com.google.adk.agents.InvocationContext,com.google.genai.types.Content)"},{"p":"com.google.adk.models.chat","c":"ChatCompletionsRequest","l":"safetyIdentifier","k":"1"},{"p":"com.google.adk.models","c":"GeminiUtil","l":"sanitizeRequestForGeminiApi(LlmRequest)","u":"sanitizeRequestForGeminiApi(com.google.adk.models.LlmRequest)","k":"6"},{"p":"com.google.adk.artifacts","c":"BaseArtifactService","l":"saveAndReloadArtifact(SessionKey, String, Part)","u":"saveAndReloadArtifact(com.google.adk.sessions.SessionKey,java.lang.String,com.google.genai.types.Part)"},{"p":"com.google.adk.artifacts","c":"BaseArtifactService","l":"saveAndReloadArtifact(String, String, String, String, Part)","u":"saveAndReloadArtifact(java.lang.String,java.lang.String,java.lang.String,java.lang.String,com.google.genai.types.Part)"},{"p":"com.google.adk.artifacts","c":"GcsArtifactService","l":"saveAndReloadArtifact(String, String, String, String, Part)","u":"saveAndReloadArtifact(java.lang.String,java.lang.String,java.lang.String,java.lang.String,com.google.genai.types.Part)"},{"p":"com.google.adk.artifacts","c":"InMemoryArtifactService","l":"saveAndReloadArtifact(String, String, String, String, Part)","u":"saveAndReloadArtifact(java.lang.String,java.lang.String,java.lang.String,java.lang.String,com.google.genai.types.Part)"},{"p":"com.google.adk.artifacts","c":"BaseArtifactService","l":"saveArtifact(SessionKey, String, Part)","u":"saveArtifact(com.google.adk.sessions.SessionKey,java.lang.String,com.google.genai.types.Part)"},{"p":"com.google.adk.agents","c":"CallbackContext","l":"saveArtifact(String, Part)","u":"saveArtifact(java.lang.String,com.google.genai.types.Part)"},{"p":"com.google.adk.artifacts","c":"BaseArtifactService","l":"saveArtifact(String, String, String, String, Part)","u":"saveArtifact(java.lang.String,java.lang.String,java.lang.String,java.lang.String,com.google.genai.types.Part)"},{"p":"com.google.adk.artifacts","c":"GcsArtifactService","l":"saveArtifact(String, String, String, String, Part)","u":"saveArtifact(java.lang.String,java.lang.String,java.lang.String,java.lang.String,com.google.genai.types.Part)"},{"p":"com.google.adk.artifacts","c":"InMemoryArtifactService","l":"saveArtifact(String, String, String, String, Part)","u":"saveArtifact(java.lang.String,java.lang.String,java.lang.String,java.lang.String,com.google.genai.types.Part)"},{"p":"com.google.adk.agents","c":"RunConfig","l":"saveInputBlobsAsArtifacts()"},{"p":"com.google.adk.agents","c":"RunConfig.Builder","l":"saveInputBlobsAsArtifacts(boolean)"},{"p":"com.google.adk.agents","c":"ParallelAgent.Builder","l":"scheduler(Scheduler)","u":"scheduler(io.reactivex.rxjava3.core.Scheduler)"},{"p":"com.google.adk.a2a.converters","c":"PartConverter","l":"SCHEDULING_KEY","k":"2"},{"p":"com.google.adk.tools.applicationintegrationtoolset","c":"ConnectionsClient.EntitySchemaAndOperations","l":"schema","k":"1"},{"p":"com.google.adk.telemetry","c":"Instrumentation.ClosableTelemetryScope","l":"scope","k":"1"},{"p":"com.google.adk.tools.computeruse","c":"ComputerState","l":"screenshot()"},{"p":"com.google.adk.tools.computeruse","c":"ComputerState.Builder","l":"screenshot(byte[])"},{"p":"com.google.adk.tools.computeruse","c":"BaseComputer","l":"screenSize()"},{"p":"com.google.adk.tools.computeruse","c":"BaseComputer","l":"scrollAt(int, int, String, int)","u":"scrollAt(int,int,java.lang.String,int)"},{"p":"com.google.adk.tools.computeruse","c":"BaseComputer","l":"scrollDocument(String)","u":"scrollDocument(java.lang.String)"},{"p":"com.google.adk.web.config","c":"OpenTelemetryConfig","l":"sdkTracerProvider(ApiServerSpanExporter)","u":"sdkTracerProvider(com.google.adk.web.service.ApiServerSpanExporter)"},{"p":"com.google.adk.tools.computeruse","c":"BaseComputer","l":"search()"},{"p":"com.google.adk.planner.goap","c":"DependencyGraphSearch","l":"search(GoalOrientedSearchGraph, Collection, String)","u":"search(com.google.adk.planner.goap.GoalOrientedSearchGraph,java.util.Collection,java.lang.String)","k":"6"},{"p":"com.example.github","c":"GitHubTools","l":"searchCode(String, String, String)","u":"searchCode(java.lang.String,java.lang.String,java.lang.String)","k":"6"},{"p":"com.google.adk.tools","c":"VertexAiSearchTool","l":"searchEngineId()"},{"p":"com.google.adk.tools","c":"VertexAiSearchTool.Builder","l":"searchEngineId(String)","u":"searchEngineId(java.lang.String)"},{"p":"com.google.adk.planner.goap","c":"AStarSearchStrategy","l":"searchGrouped(GoalOrientedSearchGraph, List, Collection, String)","u":"searchGrouped(com.google.adk.planner.goap.GoalOrientedSearchGraph,java.util.List,java.util.Collection,java.lang.String)"},{"p":"com.google.adk.planner.goap","c":"DependencyGraphSearch","l":"searchGrouped(GoalOrientedSearchGraph, List, Collection, String)","u":"searchGrouped(com.google.adk.planner.goap.GoalOrientedSearchGraph,java.util.List,java.util.Collection,java.lang.String)","k":"6"},{"p":"com.google.adk.planner.goap","c":"DfsSearchStrategy","l":"searchGrouped(GoalOrientedSearchGraph, List, Collection, String)","u":"searchGrouped(com.google.adk.planner.goap.GoalOrientedSearchGraph,java.util.List,java.util.Collection,java.lang.String)"},{"p":"com.google.adk.planner.goap","c":"SearchStrategy","l":"searchGrouped(GoalOrientedSearchGraph, List, Collection, String)","u":"searchGrouped(com.google.adk.planner.goap.GoalOrientedSearchGraph,java.util.List,java.util.Collection,java.lang.String)"},{"p":"com.google.adk.tools","c":"ToolContext","l":"searchMemory(String)","u":"searchMemory(java.lang.String)"},{"p":"com.google.adk.memory","c":"BaseMemoryService","l":"searchMemory(String, String, String)","u":"searchMemory(java.lang.String,java.lang.String,java.lang.String)"},{"p":"com.google.adk.memory","c":"FirestoreMemoryService","l":"searchMemory(String, String, String)","u":"searchMemory(java.lang.String,java.lang.String,java.lang.String)"},{"p":"com.google.adk.memory","c":"InMemoryMemoryService","l":"searchMemory(String, String, String)","u":"searchMemory(java.lang.String,java.lang.String,java.lang.String)"},{"p":"com.google.adk.memory","c":"SearchMemoryResponse","l":"SearchMemoryResponse()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.models.chat","c":"ChatCompletionsRequest","l":"seed","k":"1"},{"p":"com.google.adk.agents","c":"BaseAgent.Builder","l":"self()"},{"p":"com.google.adk.agents","c":"LiveRequestQueue","l":"send(LiveRequest)","u":"send(com.google.adk.agents.LiveRequest)"},{"p":"com.google.adk.models","c":"BaseLlmConnection","l":"sendContent(Content)","u":"sendContent(com.google.genai.types.Content)"},{"p":"com.google.adk.models","c":"GeminiLlmConnection","l":"sendContent(Content)","u":"sendContent(com.google.genai.types.Content)"},{"p":"com.google.adk.models","c":"BaseLlmConnection","l":"sendHistory(List)","u":"sendHistory(java.util.List)"},{"p":"com.google.adk.models","c":"GeminiLlmConnection","l":"sendHistory(List)","u":"sendHistory(java.util.List)"},{"p":"com.google.adk.models","c":"BaseLlmConnection","l":"sendRealtime(Blob)","u":"sendRealtime(com.google.genai.types.Blob)"},{"p":"com.google.adk.models","c":"GeminiLlmConnection","l":"sendRealtime(Blob)","u":"sendRealtime(com.google.genai.types.Blob)"},{"p":"com.google.adk.agents","c":"RunConfig.ToolExecutionMode","l":"SEQUENTIAL","k":"0"},{"p":"com.google.adk.agents","c":"SequentialAgentConfig","l":"SequentialAgentConfig()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.planner","c":"SequentialPlanner","l":"SequentialPlanner()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.models.springai.error","c":"SpringAIErrorMapper.ErrorCategory","l":"SERVER_ERROR","k":"0"},{"p":"com.google.adk.tools.mcp","c":"StdioConnectionParameters","l":"serverParams()"},{"p":"com.google.adk.tools.mcp","c":"StdioConnectionParameters.Builder","l":"serverParams(StdioServerParameters)","u":"serverParams(com.google.adk.tools.mcp.StdioServerParameters)"},{"p":"com.google.adk.tools.applicationintegrationtoolset","c":"ConnectionsClient.ConnectionDetails","l":"serviceName","k":"1"},{"p":"com.google.adk.models.chat","c":"ChatCompletionsRequest","l":"serviceTier","k":"1"},{"p":"com.google.adk.utils","c":"Constants","l":"SESSION_COLLECTION_NAME","k":"2"},{"p":"com.google.adk.agents","c":"InvocationContext","l":"session()"},{"p":"com.google.adk.agents","c":"InvocationContext.Builder","l":"session(Session)","u":"session(com.google.adk.sessions.Session)"},{"p":"com.google.adk.web.controller","c":"SessionController","l":"SessionController(BaseSessionService)","u":"%3Cinit%3E(com.google.adk.sessions.BaseSessionService)","k":"3"},{"p":"com.google.adk.sessions","c":"SessionException","l":"SessionException(String)","u":"%3Cinit%3E(java.lang.String)","k":"3"},{"p":"com.google.adk.sessions","c":"SessionException","l":"SessionException(String, Throwable)","u":"%3Cinit%3E(java.lang.String,java.lang.Throwable)","k":"3"},{"p":"com.google.adk.sessions","c":"SessionException","l":"SessionException(Throwable)","u":"%3Cinit%3E(java.lang.Throwable)","k":"3"},{"p":"com.google.adk.web.dto","c":"AddSessionToEvalSetRequest","l":"sessionId","k":"1"},{"p":"com.google.adk.web.dto","c":"AgentRunRequest","l":"sessionId","k":"1"},{"p":"com.google.adk.web.dto","c":"RunEvalResult","l":"sessionId","k":"1"},{"p":"com.google.adk.agents","c":"ReadonlyContext","l":"sessionId()"},{"p":"com.google.adk.sessions","c":"ListSessionsResponse","l":"sessionIds()"},{"p":"com.google.adk.sessions","c":"Session","l":"sessionKey()"},{"p":"com.google.adk.sessions","c":"Session.Builder","l":"sessionKey(SessionKey)","u":"sessionKey(com.google.adk.sessions.SessionKey)"},{"p":"com.google.adk.sessions","c":"SessionKey","l":"SessionKey(String, String, String)","u":"%3Cinit%3E(java.lang.String,java.lang.String,java.lang.String)","k":"3"},{"p":"com.google.adk.sessions","c":"SessionNotFoundException","l":"SessionNotFoundException(String)","u":"%3Cinit%3E(java.lang.String)","k":"3"},{"p":"com.google.adk.sessions","c":"SessionNotFoundException","l":"SessionNotFoundException(String, Throwable)","u":"%3Cinit%3E(java.lang.String,java.lang.Throwable)","k":"3"},{"p":"com.google.adk.web.dto","c":"SessionRequest","l":"SessionRequest(Map)","u":"%3Cinit%3E(java.util.Map)","k":"3"},{"p":"com.google.adk.sessions","c":"ListSessionsResponse","l":"sessions()"},{"p":"com.google.adk.sessions","c":"ListSessionsResponse.Builder","l":"sessions(List)","u":"sessions(java.util.List)"},{"p":"com.google.adk.agents","c":"InvocationContext","l":"sessionService()"},{"p":"com.google.adk.runner","c":"Runner","l":"sessionService()"},{"p":"com.google.adk.web","c":"AdkWebServer","l":"sessionService()"},{"p":"com.google.adk.a2a.executor","c":"AgentExecutor.Builder","l":"sessionService(BaseSessionService)","u":"sessionService(com.google.adk.sessions.BaseSessionService)"},{"p":"com.google.adk.agents","c":"InvocationContext.Builder","l":"sessionService(BaseSessionService)","u":"sessionService(com.google.adk.sessions.BaseSessionService)"},{"p":"com.google.adk.runner","c":"Runner.Builder","l":"sessionService(BaseSessionService)","u":"sessionService(com.google.adk.sessions.BaseSessionService)"},{"p":"com.google.adk.sessions","c":"SessionUtils","l":"SessionUtils()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.events","c":"Event","l":"setActions(EventActions)","u":"setActions(com.google.adk.events.EventActions)"},{"p":"com.google.adk.tools","c":"ToolContext","l":"setActions(EventActions)","u":"setActions(com.google.adk.events.EventActions)"},{"p":"com.google.adk.tools","c":"BaseTool.ToolArgsConfig","l":"setAdditionalProperty(String, Object)","u":"setAdditionalProperty(java.lang.String,java.lang.Object)"},{"p":"com.google.adk.agents","c":"BaseAgentConfig","l":"setAfterAgentCallbacks(List)","u":"setAfterAgentCallbacks(java.util.List)"},{"p":"com.google.adk.agents","c":"LlmAgentConfig","l":"setAfterModelCallbacks(List)","u":"setAfterModelCallbacks(java.util.List)"},{"p":"com.google.adk.agents","c":"LlmAgentConfig","l":"setAfterToolCallbacks(List)","u":"setAfterToolCallbacks(java.util.List)"},{"p":"com.google.adk.agents","c":"BaseAgentConfig","l":"setAgentClass(String)","u":"setAgentClass(java.lang.String)"},{"p":"com.google.adk.tools","c":"BaseTool.ToolConfig","l":"setArgs(BaseTool.ToolArgsConfig)","u":"setArgs(com.google.adk.tools.BaseTool.ToolArgsConfig)"},{"p":"com.google.adk.events","c":"EventActions","l":"setArtifactDelta(Map)","u":"setArtifactDelta(java.util.Map)"},{"p":"com.google.adk.events","c":"Event","l":"setAuthor(String)","u":"setAuthor(java.lang.String)"},{"p":"com.google.adk.agents","c":"RunConfig.Builder","l":"setAutoCreateSession(boolean)"},{"p":"com.google.adk.events","c":"Event","l":"setAvgLogprobs(Double)","u":"setAvgLogprobs(java.lang.Double)"},{"p":"com.google.adk.agents","c":"ConfigAgentUtils","l":"setBaseAgentCallbacks(BaseAgentConfig, Consumer, Consumer)","u":"setBaseAgentCallbacks(com.google.adk.agents.BaseAgentConfig,java.util.function.Consumer,java.util.function.Consumer)","k":"6"},{"p":"com.google.adk.agents","c":"BaseAgentConfig","l":"setBeforeAgentCallbacks(List)","u":"setBeforeAgentCallbacks(java.util.List)"},{"p":"com.google.adk.agents","c":"LlmAgentConfig","l":"setBeforeModelCallbacks(List)","u":"setBeforeModelCallbacks(java.util.List)"},{"p":"com.google.adk.agents","c":"LlmAgentConfig","l":"setBeforeToolCallbacks(List)","u":"setBeforeToolCallbacks(java.util.List)"},{"p":"com.google.adk.web.config","c":"AgentLoadingProperties","l":"setBuildOutputDirs(String[])","u":"setBuildOutputDirs(java.lang.String[])"},{"p":"com.google.adk.agents","c":"BaseAgentConfig.AgentRefConfig","l":"setCode(String)","u":"setCode(java.lang.String)"},{"p":"com.google.adk.events","c":"EventActions","l":"setCompaction(EventCompaction)","u":"setCompaction(com.google.adk.events.EventCompaction)"},{"p":"com.google.adk.agents","c":"BaseAgentConfig.AgentRefConfig","l":"setConfigPath(String)","u":"setConfigPath(java.lang.String)"},{"p":"com.google.adk.web.config","c":"AgentLoadingProperties","l":"setConfineToSourceDir(boolean)"},{"p":"com.google.adk.events","c":"Event","l":"setContent(Content)","u":"setContent(com.google.genai.types.Content)"},{"p":"com.google.adk.models","c":"VertexCredentials.Builder","l":"setCredentials(GoogleCredentials)","u":"setCredentials(com.google.auth.oauth2.GoogleCredentials)"},{"p":"com.google.adk.events","c":"Event","l":"setCustomMetadata(List)","u":"setCustomMetadata(java.util.List)"},{"p":"com.google.adk.tools","c":"BaseTool","l":"setCustomMetadata(String, Object)","u":"setCustomMetadata(java.lang.String,java.lang.Object)"},{"p":"com.google.adk.events","c":"EventActions","l":"setDeletedArtifactIds(Set)","u":"setDeletedArtifactIds(java.util.Set)"},{"p":"com.google.adk.agents","c":"BaseAgentConfig","l":"setDescription(String)","u":"setDescription(java.lang.String)"},{"p":"com.google.adk.tools","c":"ExampleTool.Builder","l":"setDescription(String)","u":"setDescription(java.lang.String)"},{"p":"com.google.adk.agents","c":"LlmAgentConfig","l":"setDisallowTransferToParent(Boolean)","u":"setDisallowTransferToParent(java.lang.Boolean)"},{"p":"com.google.adk.agents","c":"LlmAgentConfig","l":"setDisallowTransferToPeers(Boolean)","u":"setDisallowTransferToPeers(java.lang.Boolean)"},{"p":"com.google.adk.models.springai.properties","c":"SpringAIProperties.Observability","l":"setEnabled(boolean)"},{"p":"com.google.adk.models.springai.properties","c":"SpringAIProperties.Validation","l":"setEnabled(boolean)"},{"p":"com.google.adk.agents","c":"InvocationContext","l":"setEndInvocation(boolean)"},{"p":"com.google.adk.events","c":"EventActions","l":"setEndInvocation(boolean)"},{"p":"com.google.adk.events","c":"EventActions","l":"setEndOfAgent(boolean)"},{"p":"com.google.adk.telemetry","c":"Instrumentation.ClosableTelemetryScope","l":"setError(Throwable)","u":"setError(java.lang.Throwable)"},{"p":"com.google.adk.events","c":"Event","l":"setErrorCode(FinishReason)","u":"setErrorCode(com.google.genai.types.FinishReason)"},{"p":"com.google.adk.events","c":"Event","l":"setErrorMessage(String)","u":"setErrorMessage(java.lang.String)"},{"p":"com.google.adk.events","c":"EventActions","l":"setEscalate(Boolean)","u":"setEscalate(java.lang.Boolean)"},{"p":"com.google.adk.tools","c":"ExampleTool.Builder","l":"setExampleProvider(BaseExampleProvider)","u":"setExampleProvider(com.google.adk.examples.BaseExampleProvider)"},{"p":"com.google.adk.codeexecutors","c":"CodeExecutorContext","l":"setExecutionId(String)","u":"setExecutionId(java.lang.String)"},{"p":"com.google.adk.models.springai.properties","c":"SpringAIProperties.Validation","l":"setFailFast(boolean)"},{"p":"com.google.adk.events","c":"Event","l":"setFinishReason(FinishReason)","u":"setFinishReason(com.google.genai.types.FinishReason)"},{"p":"com.google.adk.events","c":"Event","l":"setFinishReason(Optional)","u":"setFinishReason(java.util.Optional)"},{"p":"com.google.adk.telemetry","c":"Instrumentation.TelemetryContext","l":"setFunctionResponseEvent(Event)","u":"setFunctionResponseEvent(com.google.adk.events.Event)"},{"p":"com.google.adk.agents","c":"LlmAgentConfig","l":"setGenerateContentConfig(GenerateContentConfig)","u":"setGenerateContentConfig(com.google.genai.types.GenerateContentConfig)"},{"p":"com.google.adk.events","c":"Event","l":"setGroundingMetadata(GroundingMetadata)","u":"setGroundingMetadata(com.google.genai.types.GroundingMetadata)"},{"p":"com.google.adk.events","c":"Event","l":"setId(String)","u":"setId(java.lang.String)"},{"p":"com.google.adk.models.springai.properties","c":"SpringAIProperties.Observability","l":"setIncludeContent(boolean)"},{"p":"com.google.adk.agents","c":"LlmAgentConfig","l":"setIncludeContents(LlmAgent.IncludeContents)","u":"setIncludeContents(com.google.adk.agents.LlmAgent.IncludeContents)"},{"p":"com.google.adk.agents","c":"RunConfig.Builder","l":"setInputAudioTranscription(AudioTranscriptionConfig)","u":"setInputAudioTranscription(com.google.genai.types.AudioTranscriptionConfig)"},{"p":"com.google.adk.events","c":"Event","l":"setInputTranscription(Transcription)","u":"setInputTranscription(com.google.genai.types.Transcription)"},{"p":"com.google.adk.utils","c":"ComponentRegistry","l":"setInstance(ComponentRegistry)","u":"setInstance(com.google.adk.utils.ComponentRegistry)","k":"6"},{"p":"com.google.adk.agents","c":"LlmAgentConfig","l":"setInstruction(String)","u":"setInstruction(java.lang.String)"},{"p":"com.google.adk.events","c":"Event","l":"setInterrupted(Boolean)","u":"setInterrupted(java.lang.Boolean)"},{"p":"com.google.adk.events","c":"Event","l":"setInvocationId(String)","u":"setInvocationId(java.lang.String)"},{"p":"com.google.adk.models","c":"VertexCredentials.Builder","l":"setLocation(String)","u":"setLocation(java.lang.String)"},{"p":"com.google.adk.events","c":"Event","l":"setLongRunningToolIds(Set)","u":"setLongRunningToolIds(java.util.Set)"},{"p":"com.google.adk.agents","c":"LoopAgentConfig","l":"setMaxIterations(Integer)","u":"setMaxIterations(java.lang.Integer)"},{"p":"com.google.adk.agents","c":"RunConfig.Builder","l":"setMaxLlmCalls(int)"},{"p":"com.google.adk.models.springai.properties","c":"SpringAIProperties","l":"setMaxTokens(Integer)","u":"setMaxTokens(java.lang.Integer)"},{"p":"com.google.adk.memory","c":"SearchMemoryResponse.Builder","l":"setMemories(ImmutableList)","u":"setMemories(com.google.common.collect.ImmutableList)"},{"p":"com.google.adk.memory","c":"SearchMemoryResponse.Builder","l":"setMemories(List)","u":"setMemories(java.util.List)"},{"p":"com.google.adk.telemetry","c":"Metrics","l":"setMeterForTesting(Meter)","u":"setMeterForTesting(io.opentelemetry.api.metrics.Meter)","k":"6"},{"p":"com.google.adk.models.springai.properties","c":"SpringAIProperties.Observability","l":"setMetricsEnabled(boolean)"},{"p":"com.google.adk.agents","c":"LlmAgentConfig","l":"setModel(String)","u":"setModel(java.lang.String)"},{"p":"com.google.adk.models.springai.properties","c":"SpringAIProperties","l":"setModel(String)","u":"setModel(java.lang.String)"},{"p":"com.google.adk.tools","c":"SetModelResponseTool","l":"SetModelResponseTool(Schema)","u":"%3Cinit%3E(com.google.genai.types.Schema)","k":"3"},{"p":"com.google.adk.events","c":"Event","l":"setModelVersion(String)","u":"setModelVersion(java.lang.String)"},{"p":"com.google.adk.agents","c":"BaseAgentConfig.CallbackRef","l":"setName(String)","u":"setName(java.lang.String)"},{"p":"com.google.adk.agents","c":"BaseAgentConfig","l":"setName(String)","u":"setName(java.lang.String)"},{"p":"com.google.adk.tools","c":"BaseTool.ToolConfig","l":"setName(String)","u":"setName(java.lang.String)"},{"p":"com.google.adk.tools","c":"ExampleTool.Builder","l":"setName(String)","u":"setName(java.lang.String)"},{"p":"com.google.adk.models.springai.properties","c":"SpringAIProperties","l":"setObservability(SpringAIProperties.Observability)","u":"setObservability(com.google.adk.models.springai.properties.SpringAIProperties.Observability)"},{"p":"com.google.adk.agents","c":"RunConfig.Builder","l":"setOutputAudioTranscription(AudioTranscriptionConfig)","u":"setOutputAudioTranscription(com.google.genai.types.AudioTranscriptionConfig)"},{"p":"com.google.adk.agents","c":"LlmAgentConfig","l":"setOutputKey(String)","u":"setOutputKey(java.lang.String)"},{"p":"com.google.adk.events","c":"Event","l":"setOutputTranscription(Transcription)","u":"setOutputTranscription(com.google.genai.types.Transcription)"},{"p":"com.google.adk.telemetry","c":"Tracing.TracerProvider","l":"setParent(Context)","u":"setParent(io.opentelemetry.context.Context)"},{"p":"com.google.adk.events","c":"Event","l":"setPartial(Boolean)","u":"setPartial(java.lang.Boolean)"},{"p":"com.google.adk.models","c":"VertexCredentials.Builder","l":"setProject(String)","u":"setProject(java.lang.String)"},{"p":"com.google.adk.events","c":"EventActions","l":"setRequestedAuthConfigs(Map)","u":"setRequestedAuthConfigs(java.util.Map)"},{"p":"com.google.adk.events","c":"EventActions","l":"setRequestedToolConfirmations(Map)","u":"setRequestedToolConfirmations(java.util.Map)"},{"p":"com.google.adk.agents","c":"RunConfig.Builder","l":"setResponseModalities(Iterable)","u":"setResponseModalities(java.lang.Iterable)"},{"p":"com.google.adk.agents","c":"RunConfig.Builder","l":"setSaveInputBlobsAsArtifacts(boolean)"},{"p":"com.google.adk.events","c":"EventActions","l":"setSkipSummarization(boolean)"},{"p":"com.google.adk.events","c":"EventActions","l":"setSkipSummarization(Boolean)","u":"setSkipSummarization(java.lang.Boolean)"},{"p":"com.google.adk.web.config","c":"AgentLoadingProperties","l":"setSourceDir(String)","u":"setSourceDir(java.lang.String)"},{"p":"com.google.adk.agents","c":"RunConfig.Builder","l":"setSpeechConfig(SpeechConfig)","u":"setSpeechConfig(com.google.genai.types.SpeechConfig)"},{"p":"com.google.adk.tools.mcp","c":"McpToolset.McpToolsetConfig","l":"setSseServerParams(SseServerParameters)","u":"setSseServerParams(com.google.adk.tools.mcp.SseServerParameters)"},{"p":"com.google.adk.events","c":"EventActions","l":"setStateDelta(ConcurrentMap)","u":"setStateDelta(java.util.concurrent.ConcurrentMap)"},{"p":"com.google.adk.tools.mcp","c":"McpToolset.McpToolsetConfig","l":"setStdioConnectionParams(StdioConnectionParameters)","u":"setStdioConnectionParams(com.google.adk.tools.mcp.StdioConnectionParameters)"},{"p":"com.google.adk.tools.mcp","c":"McpToolset.McpToolsetConfig","l":"setStdioServerParams(StdioServerParameters)","u":"setStdioServerParams(com.google.adk.tools.mcp.StdioServerParameters)"},{"p":"com.google.adk.agents","c":"RunConfig.Builder","l":"setStreamingMode(RunConfig.StreamingMode)","u":"setStreamingMode(com.google.adk.agents.RunConfig.StreamingMode)"},{"p":"com.google.adk.agents","c":"BaseAgentConfig","l":"setSubAgents(List)","u":"setSubAgents(java.util.List)"},{"p":"com.google.adk.models.springai.properties","c":"SpringAIProperties","l":"setTemperature(Double)","u":"setTemperature(java.lang.Double)"},{"p":"com.google.adk.events","c":"Event","l":"setTimestamp(long)"},{"p":"com.google.adk.agents","c":"RunConfig.Builder","l":"setToolExecutionMode(RunConfig.ToolExecutionMode)","u":"setToolExecutionMode(com.google.adk.agents.RunConfig.ToolExecutionMode)"},{"p":"com.google.adk.tools.mcp","c":"McpToolset.McpToolsetConfig","l":"setToolFilter(List)","u":"setToolFilter(java.util.List)"},{"p":"com.google.adk.agents","c":"LlmAgentConfig","l":"setTools(List)","u":"setTools(java.util.List)"},{"p":"com.google.adk.models.springai.properties","c":"SpringAIProperties","l":"setTopK(Integer)","u":"setTopK(java.lang.Integer)"},{"p":"com.google.adk.models.springai.properties","c":"SpringAIProperties","l":"setTopP(Double)","u":"setTopP(java.lang.Double)"},{"p":"com.google.adk.telemetry","c":"Tracing","l":"setTracerForTesting(Tracer)","u":"setTracerForTesting(io.opentelemetry.api.trace.Tracer)","k":"6"},{"p":"com.google.adk.events","c":"EventActions","l":"setTransferToAgent(String)","u":"setTransferToAgent(java.lang.String)"},{"p":"com.google.adk.events","c":"Event","l":"setTurnComplete(Boolean)","u":"setTurnComplete(java.lang.Boolean)"},{"p":"com.google.adk.events","c":"Event","l":"setUsageMetadata(GenerateContentResponseUsageMetadata)","u":"setUsageMetadata(com.google.genai.types.GenerateContentResponseUsageMetadata)"},{"p":"com.google.adk.models.springai.properties","c":"SpringAIProperties","l":"setValidation(SpringAIProperties.Validation)","u":"setValidation(com.google.adk.models.springai.properties.SpringAIProperties.Validation)"},{"p":"com.google.adk.agents","c":"LiveRequest","l":"shouldClose()"},{"p":"com.google.adk.models","c":"GeminiUtil","l":"shouldEmitAccumulatedText(LlmResponse)","u":"shouldEmitAccumulatedText(com.google.adk.models.LlmResponse)","k":"6"},{"p":"com.google.adk.web.service","c":"ApiServerSpanExporter","l":"shutdown()"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryLoggerConfig","l":"shutdownTimeout()"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryLoggerConfig.Builder","l":"shutdownTimeout(Duration)","u":"shutdownTimeout(java.time.Duration)"},{"p":"com.google.adk.flows.llmflows","c":"SingleFlow","l":"SingleFlow()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.flows.llmflows","c":"SingleFlow","l":"SingleFlow(List, List, Optional)","u":"%3Cinit%3E(java.util.List,java.util.List,java.util.Optional)","k":"3"},{"p":"com.google.adk.flows.llmflows","c":"SingleFlow","l":"SingleFlow(Optional)","u":"%3Cinit%3E(java.util.Optional)","k":"3"},{"p":"com.google.adk.sessions","c":"State","l":"size()"},{"p":"com.google.adk.tools","c":"BaseTool.ToolArgsConfig","l":"size()"},{"p":"com.google.adk.skills","c":"SkillSourceException","l":"SKILL_FORMAT_ERROR","k":"2"},{"p":"com.google.adk.skills","c":"SkillSourceException","l":"SKILL_LOAD_ERROR","k":"2"},{"p":"com.google.adk.skills","c":"SkillSourceException","l":"SKILL_NOT_FOUND","k":"2"},{"p":"com.google.adk.skills","c":"InMemorySkillSource.Builder","l":"skill(String)","u":"skill(java.lang.String)"},{"p":"com.google.adk.skills","c":"InMemorySkillSource.Builder.SkillBuilder","l":"skill(String)","u":"skill(java.lang.String)"},{"p":"com.google.adk.skills","c":"AbstractSkillSource.SkillMdPath","l":"SkillMdPath(String, PathT)","u":"%3Cinit%3E(java.lang.String,PathT)","k":"3"},{"p":"com.google.adk.skills","c":"SkillSourceException","l":"SkillSourceException(String, String)","u":"%3Cinit%3E(java.lang.String,java.lang.String)","k":"3"},{"p":"com.google.adk.skills","c":"SkillSourceException","l":"SkillSourceException(String, String, Throwable)","u":"%3Cinit%3E(java.lang.String,java.lang.String,java.lang.Throwable)","k":"3"},{"p":"com.google.adk.tools.skills","c":"SkillToolset","l":"SkillToolset(SkillSource)","u":"%3Cinit%3E(com.google.adk.skills.SkillSource)","k":"3"},{"p":"com.google.adk.tools.skills","c":"SkillToolset","l":"SkillToolset(SkillSource, String)","u":"%3Cinit%3E(com.google.adk.skills.SkillSource,java.lang.String)","k":"3"},{"p":"com.google.adk.events","c":"EventActions","l":"skipSummarization()"},{"p":"com.google.adk.events","c":"EventActions.Builder","l":"skipSummarization(Boolean)","u":"skipSummarization(java.lang.Boolean)"},{"p":"com.example.adkstale","c":"Settings","l":"sleepBetweenIssuesMs()","k":"6"},{"p":"com.google.adk.summarizer","c":"SlidingWindowEventCompactor","l":"SlidingWindowEventCompactor(EventsCompactionConfig)","u":"%3Cinit%3E(com.google.adk.summarizer.EventsCompactionConfig)","k":"3"},{"p":"com.example.adkspam","c":"Settings","l":"spamLabel()","k":"6"},{"p":"com.google.adk.telemetry","c":"Instrumentation.ClosableTelemetryScope","l":"span","k":"1"},{"p":"com.google.adk.agents","c":"RunConfig","l":"speechConfig()"},{"p":"com.google.adk.agents","c":"RunConfig.Builder","l":"speechConfig(SpeechConfig)","u":"speechConfig(com.google.genai.types.SpeechConfig)"},{"p":"com.google.adk.models.springai","c":"SpringAI","l":"SpringAI(ChatModel)","u":"%3Cinit%3E(org.springframework.ai.chat.model.ChatModel)","k":"3"},{"p":"com.google.adk.models.springai","c":"SpringAI","l":"SpringAI(ChatModel, StreamingChatModel, String)","u":"%3Cinit%3E(org.springframework.ai.chat.model.ChatModel,org.springframework.ai.chat.model.StreamingChatModel,java.lang.String)","k":"3"},{"p":"com.google.adk.models.springai","c":"SpringAI","l":"SpringAI(ChatModel, StreamingChatModel, String, SpringAIProperties.Observability)","u":"%3Cinit%3E(org.springframework.ai.chat.model.ChatModel,org.springframework.ai.chat.model.StreamingChatModel,java.lang.String,com.google.adk.models.springai.properties.SpringAIProperties.Observability)","k":"3"},{"p":"com.google.adk.models.springai","c":"SpringAI","l":"SpringAI(ChatModel, String)","u":"%3Cinit%3E(org.springframework.ai.chat.model.ChatModel,java.lang.String)","k":"3"},{"p":"com.google.adk.models.springai","c":"SpringAI","l":"SpringAI(ChatModel, String, SpringAIProperties.Observability)","u":"%3Cinit%3E(org.springframework.ai.chat.model.ChatModel,java.lang.String,com.google.adk.models.springai.properties.SpringAIProperties.Observability)","k":"3"},{"p":"com.google.adk.models.springai","c":"SpringAI","l":"SpringAI(StreamingChatModel)","u":"%3Cinit%3E(org.springframework.ai.chat.model.StreamingChatModel)","k":"3"},{"p":"com.google.adk.models.springai","c":"SpringAI","l":"SpringAI(StreamingChatModel, String)","u":"%3Cinit%3E(org.springframework.ai.chat.model.StreamingChatModel,java.lang.String)","k":"3"},{"p":"com.google.adk.models.springai","c":"SpringAI","l":"SpringAI(StreamingChatModel, String, SpringAIProperties.Observability)","u":"%3Cinit%3E(org.springframework.ai.chat.model.StreamingChatModel,java.lang.String,com.google.adk.models.springai.properties.SpringAIProperties.Observability)","k":"3"},{"p":"com.google.adk.models.springai.autoconfigure","c":"SpringAIAutoConfiguration","l":"SpringAIAutoConfiguration()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.models.springai","c":"SpringAIEmbedding","l":"SpringAIEmbedding(EmbeddingModel)","u":"%3Cinit%3E(org.springframework.ai.embedding.EmbeddingModel)","k":"3"},{"p":"com.google.adk.models.springai.autoconfigure","c":"SpringAIAutoConfiguration","l":"springAIEmbedding(EmbeddingModel, SpringAIProperties)","u":"springAIEmbedding(org.springframework.ai.embedding.EmbeddingModel,com.google.adk.models.springai.properties.SpringAIProperties)"},{"p":"com.google.adk.models.springai","c":"SpringAIEmbedding","l":"SpringAIEmbedding(EmbeddingModel, String)","u":"%3Cinit%3E(org.springframework.ai.embedding.EmbeddingModel,java.lang.String)","k":"3"},{"p":"com.google.adk.models.springai","c":"SpringAIEmbedding","l":"SpringAIEmbedding(EmbeddingModel, String, SpringAIProperties.Observability)","u":"%3Cinit%3E(org.springframework.ai.embedding.EmbeddingModel,java.lang.String,com.google.adk.models.springai.properties.SpringAIProperties.Observability)","k":"3"},{"p":"com.google.adk.models.springai.error","c":"SpringAIErrorMapper","l":"SpringAIErrorMapper()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.models.springai.observability","c":"SpringAIObservabilityHandler","l":"SpringAIObservabilityHandler(SpringAIProperties.Observability)","u":"%3Cinit%3E(com.google.adk.models.springai.properties.SpringAIProperties.Observability)","k":"3"},{"p":"com.google.adk.models.springai.observability","c":"SpringAIObservabilityHandler","l":"SpringAIObservabilityHandler(SpringAIProperties.Observability, MeterRegistry)","u":"%3Cinit%3E(com.google.adk.models.springai.properties.SpringAIProperties.Observability,io.micrometer.core.instrument.MeterRegistry)","k":"3"},{"p":"com.google.adk.models.springai.properties","c":"SpringAIProperties","l":"SpringAIProperties()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.models.springai.autoconfigure","c":"SpringAIAutoConfiguration","l":"springAIWithBothModels(ChatModel, StreamingChatModel, SpringAIProperties)","u":"springAIWithBothModels(org.springframework.ai.chat.model.ChatModel,org.springframework.ai.chat.model.StreamingChatModel,com.google.adk.models.springai.properties.SpringAIProperties)"},{"p":"com.google.adk.models.springai.autoconfigure","c":"SpringAIAutoConfiguration","l":"springAIWithChatModel(ChatModel, SpringAIProperties)","u":"springAIWithChatModel(org.springframework.ai.chat.model.ChatModel,com.google.adk.models.springai.properties.SpringAIProperties)"},{"p":"com.google.adk.models.springai.autoconfigure","c":"SpringAIAutoConfiguration","l":"springAIWithStreamingModel(StreamingChatModel, SpringAIProperties)","u":"springAIWithStreamingModel(org.springframework.ai.chat.model.StreamingChatModel,com.google.adk.models.springai.properties.SpringAIProperties)"},{"p":"com.google.adk.agents","c":"RunConfig.StreamingMode","l":"SSE","k":"0"},{"p":"com.google.adk.tools.mcp","c":"SseServerParameters","l":"sseEndpoint()"},{"p":"com.google.adk.tools.mcp","c":"SseServerParameters.Builder","l":"sseEndpoint(String)","u":"sseEndpoint(java.lang.String)"},{"p":"com.google.adk.tools.mcp","c":"SseServerParameters","l":"sseReadTimeout()"},{"p":"com.google.adk.tools.mcp","c":"SseServerParameters.Builder","l":"sseReadTimeout(Duration)","u":"sseReadTimeout(java.time.Duration)"},{"p":"com.google.adk.tools.mcp","c":"SseServerParameters","l":"SseServerParameters()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.tools.mcp","c":"McpToolset.McpToolsetConfig","l":"sseServerParams()"},{"p":"com.example.adkstale","c":"Settings","l":"staleHoursThreshold()","k":"6"},{"p":"com.example.adkstale","c":"Settings","l":"staleLabel()","k":"6"},{"p":"com.google.adk.web","c":"AdkWebServer","l":"start(BaseAgent...)","u":"start(com.google.adk.agents.BaseAgent...)","k":"6"},{"p":"com.google.adk.models.springai.observability","c":"SpringAIObservabilityHandler","l":"startRequest(String, String)","u":"startRequest(java.lang.String,java.lang.String)"},{"p":"com.google.adk.telemetry","c":"Instrumentation.ClosableTelemetryScope","l":"startTimeNanos","k":"1"},{"p":"com.google.adk.events","c":"EventCompaction","l":"startTimestamp()"},{"p":"com.google.adk.events","c":"EventCompaction.Builder","l":"startTimestamp(long)"},{"p":"com.google.adk.samples.a2aagent","c":"StartupConfig","l":"StartupConfig()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.agents","c":"CallbackContext","l":"state()"},{"p":"com.google.adk.agents","c":"PlanningContext","l":"state()"},{"p":"com.google.adk.agents","c":"ReadonlyContext","l":"state()"},{"p":"com.google.adk.sessions","c":"Session","l":"state()"},{"p":"com.google.adk.sessions","c":"Session.Builder","l":"state(Map)","u":"state(java.util.Map)"},{"p":"com.google.adk.sessions","c":"State","l":"State(Map)","u":"%3Cinit%3E(java.util.Map)","k":"3"},{"p":"com.google.adk.sessions","c":"State","l":"State(Map, Map)","u":"%3Cinit%3E(java.util.Map,java.util.Map)","k":"3"},{"p":"com.google.adk.sessions","c":"Session.Builder","l":"state(State)","u":"state(com.google.adk.sessions.State)"},{"p":"com.google.adk.web.dto","c":"AgentRunRequest","l":"stateDelta","k":"1"},{"p":"com.google.adk.events","c":"EventActions","l":"stateDelta()"},{"p":"com.google.adk.events","c":"EventActions.Builder","l":"stateDelta(Map)","u":"stateDelta(java.util.Map)"},{"p":"com.google.adk.codeexecutors","c":"BaseCodeExecutor","l":"stateful()"},{"p":"com.google.adk.codeexecutors","c":"ContainerCodeExecutor","l":"stateful()"},{"p":"com.google.adk.agents","c":"Instruction.Static","l":"Static(String)","u":"%3Cinit%3E(java.lang.String)","k":"3"},{"p":"com.google.adk.codeexecutors","c":"CodeExecutionUtils.CodeExecutionResult","l":"stderr()"},{"p":"com.google.adk.codeexecutors","c":"CodeExecutionUtils.CodeExecutionResult.Builder","l":"stderr(String)","u":"stderr(java.lang.String)"},{"p":"com.google.adk.tools.mcp","c":"McpToolset.McpToolsetConfig","l":"stdioConnectionParams()"},{"p":"com.google.adk.tools.mcp","c":"StdioServerParameters","l":"StdioServerParameters()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.tools.mcp","c":"McpToolset.McpToolsetConfig","l":"stdioServerParams()"},{"p":"com.google.adk.codeexecutors","c":"CodeExecutionUtils.CodeExecutionResult","l":"stdout()"},{"p":"com.google.adk.codeexecutors","c":"CodeExecutionUtils.CodeExecutionResult.Builder","l":"stdout(String)","u":"stdout(java.lang.String)"},{"p":"com.google.adk.models.chat","c":"ChatCompletionsRequest","l":"stop","k":"1"},{"p":"com.google.adk.utils","c":"Constants","l":"STOP_WORDS","k":"2"},{"p":"com.google.adk.maven","c":"ConfigAgentLoader","l":"stop()"},{"p":"com.google.adk.models.chat","c":"ChatCompletionsRequest","l":"store","k":"1"},{"p":"com.google.adk.models.chat","c":"ChatCompletionsRequest","l":"stream","k":"1"},{"p":"com.google.adk.agents","c":"ActiveStreamingTool","l":"stream()"},{"p":"com.google.adk.agents","c":"ActiveStreamingTool","l":"stream(LiveRequestQueue)","u":"stream(com.google.adk.agents.LiveRequestQueue)"},{"p":"com.google.adk.tools.mcp","c":"StreamableHttpServerParameters","l":"StreamableHttpServerParameters(String, Map, Duration, Duration, Boolean)","u":"%3Cinit%3E(java.lang.String,java.util.Map,java.time.Duration,java.time.Duration,java.lang.Boolean)","k":"3"},{"p":"com.google.adk.web.dto","c":"AgentRunRequest","l":"streaming","k":"1"},{"p":"com.google.adk.a2a.agent","c":"RemoteA2AAgent.Builder","l":"streaming(boolean)"},{"p":"com.google.adk.models.langchain4j","c":"LangChain4j","l":"streamingChatModel()"},{"p":"com.google.adk.models.langchain4j","c":"LangChain4j.Builder","l":"streamingChatModel(StreamingChatModel)","u":"streamingChatModel(dev.langchain4j.model.chat.StreamingChatModel)"},{"p":"com.google.adk.agents","c":"RunConfig","l":"streamingMode()"},{"p":"com.google.adk.agents","c":"RunConfig.Builder","l":"streamingMode(RunConfig.StreamingMode)","u":"streamingMode(com.google.adk.agents.RunConfig.StreamingMode)"},{"p":"com.google.adk.models.springai","c":"StreamingResponseAggregator","l":"StreamingResponseAggregator()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.models.chat","c":"ChatCompletionsRequest","l":"streamOptions","k":"1"},{"p":"com.google.adk.events","c":"Event","l":"stringifyContent()"},{"p":"com.google.adk.models","c":"GeminiUtil","l":"stripThoughts(List)","u":"stripThoughts(java.util.List)","k":"6"},{"p":"com.google.adk.utils","c":"AgentEnums.AgentOrigin","l":"SUB_AGENT","k":"0"},{"p":"com.google.adk.agents","c":"BaseAgent.Builder","l":"subAgents","k":"1"},{"p":"com.google.adk.agents","c":"BaseAgent","l":"subAgents()"},{"p":"com.google.adk.agents","c":"BaseAgentConfig","l":"subAgents()"},{"p":"com.google.adk.agents","c":"BaseAgent.Builder","l":"subAgents(BaseAgent...)","u":"subAgents(com.google.adk.agents.BaseAgent...)"},{"p":"com.google.adk.a2a.agent","c":"RemoteA2AAgent.Builder","l":"subAgents(List)","u":"subAgents(java.util.List)"},{"p":"com.google.adk.agents","c":"BaseAgent.Builder","l":"subAgents(List)","u":"subAgents(java.util.List)"},{"p":"com.google.adk.summarizer","c":"BaseEventSummarizer","l":"summarizeEvents(List)","u":"summarizeEvents(java.util.List)"},{"p":"com.google.adk.summarizer","c":"LlmEventSummarizer","l":"summarizeEvents(List)","u":"summarizeEvents(java.util.List)"},{"p":"com.google.adk.summarizer","c":"EventsCompactionConfig","l":"summarizer()"},{"p":"com.google.adk.summarizer","c":"EventsCompactionConfig.Builder","l":"summarizer(BaseEventSummarizer)","u":"summarizer(com.google.adk.summarizer.BaseEventSummarizer)"},{"p":"com.google.adk.planner","c":"SupervisorPlanner","l":"SupervisorPlanner(BaseLlm)","u":"%3Cinit%3E(com.google.adk.models.BaseLlm)","k":"3"},{"p":"com.google.adk.planner","c":"SupervisorPlanner","l":"SupervisorPlanner(BaseLlm, String)","u":"%3Cinit%3E(com.google.adk.models.BaseLlm,java.lang.String)","k":"3"},{"p":"com.google.adk.planner","c":"SupervisorPlanner","l":"SupervisorPlanner(BaseLlm, String, int)","u":"%3Cinit%3E(com.google.adk.models.BaseLlm,java.lang.String,int)","k":"3"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryLoggerConfig","l":"tableName()"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryLoggerConfig.Builder","l":"tableName(String)","u":"tableName(java.lang.String)"},{"p":"com.google.adk.summarizer","c":"TailRetentionEventCompactor","l":"TailRetentionEventCompactor(BaseEventSummarizer, int, int)","u":"%3Cinit%3E(com.google.adk.summarizer.BaseEventSummarizer,int,int)","k":"3"},{"p":"com.google.adk.a2a.converters","c":"AdkMetadataKey","l":"TASK_ID","k":"0"},{"p":"com.google.adk.agents","c":"ActiveStreamingTool","l":"task()"},{"p":"com.google.adk.agents","c":"ActiveStreamingTool","l":"task(Disposable)","u":"task(io.reactivex.rxjava3.disposables.Disposable)"},{"p":"com.google.adk.a2a.converters","c":"EventConverter","l":"taskId(Event)","u":"taskId(com.google.adk.events.Event)","k":"6"},{"p":"com.google.adk.a2a.converters","c":"ResponseConverter","l":"taskToEvent(Task, InvocationContext)","u":"taskToEvent(io.a2a.spec.Task,com.google.adk.agents.InvocationContext)","k":"6"},{"p":"com.google.adk.telemetry","c":"Instrumentation.ClosableTelemetryScope","l":"telemetryContext","k":"1"},{"p":"com.google.adk.telemetry","c":"Instrumentation.TelemetryContext","l":"TelemetryContext(Context)","u":"%3Cinit%3E(io.opentelemetry.context.Context)","k":"3"},{"p":"com.google.adk.sessions","c":"State","l":"TEMP_PREFIX","k":"2"},{"p":"com.google.adk.models.chat","c":"ChatCompletionsRequest","l":"temperature","k":"1"},{"p":"com.google.adk.tools.mcp","c":"StreamableHttpServerParameters","l":"terminateOnClose()"},{"p":"com.google.adk.tools.mcp","c":"StreamableHttpServerParameters.Builder","l":"terminateOnClose(boolean)"},{"p":"com.google.adk.tools","c":"NamedToolPredicate","l":"test(BaseTool, Optional)","u":"test(com.google.adk.tools.BaseTool,java.util.Optional)"},{"p":"com.google.adk.tools","c":"ToolPredicate","l":"test(BaseTool, Optional)","u":"test(com.google.adk.tools.BaseTool,java.util.Optional)"},{"p":"com.google.adk.tools","c":"ToolPredicate","l":"test(BaseTool, ReadonlyContext)","u":"test(com.google.adk.tools.BaseTool,com.google.adk.agents.ReadonlyContext)"},{"p":"com.google.adk.models.springai.error","c":"SpringAIErrorMapper.ErrorCategory","l":"TIMEOUT_ERROR","k":"0"},{"p":"com.google.adk.tools.mcp","c":"SseServerParameters","l":"timeout()"},{"p":"com.google.adk.tools.mcp","c":"StdioConnectionParameters","l":"timeout()"},{"p":"com.google.adk.tools.mcp","c":"StreamableHttpServerParameters","l":"timeout()"},{"p":"com.google.adk.tools.mcp","c":"SseServerParameters.Builder","l":"timeout(Duration)","u":"timeout(java.time.Duration)"},{"p":"com.google.adk.tools.mcp","c":"StreamableHttpServerParameters.Builder","l":"timeout(Duration)","u":"timeout(java.time.Duration)"},{"p":"com.google.adk.tools.mcp","c":"StdioConnectionParameters.Builder","l":"timeout(float)"},{"p":"com.google.adk.tools.mcp","c":"StdioConnectionParameters","l":"timeoutDuration()"},{"p":"com.google.adk.events","c":"Event","l":"timestamp()"},{"p":"com.google.adk.memory","c":"MemoryEntry","l":"timestamp()"},{"p":"com.google.adk.memory","c":"MemoryEntry.Builder","l":"timestamp(Instant)","u":"timestamp(java.time.Instant)"},{"p":"com.google.adk.events","c":"Event.Builder","l":"timestamp(long)"},{"p":"com.google.adk.memory","c":"MemoryEntry.Builder","l":"timestamp(String)","u":"timestamp(java.lang.String)"},{"p":"com.google.adk.a2a.executor","c":"AgentExecutorConfig","l":"toBuilder()"},{"p":"com.google.adk.agents","c":"InvocationContext","l":"toBuilder()"},{"p":"com.google.adk.agents","c":"LiveRequest","l":"toBuilder()"},{"p":"com.google.adk.agents","c":"RunConfig","l":"toBuilder()"},{"p":"com.google.adk.events","c":"Event","l":"toBuilder()"},{"p":"com.google.adk.events","c":"EventActions","l":"toBuilder()"},{"p":"com.google.adk.events","c":"ToolConfirmation","l":"toBuilder()"},{"p":"com.google.adk.examples","c":"Example","l":"toBuilder()"},{"p":"com.google.adk.memory","c":"MemoryEntry","l":"toBuilder()"},{"p":"com.google.adk.models","c":"LlmRequest","l":"toBuilder()"},{"p":"com.google.adk.models","c":"LlmResponse","l":"toBuilder()"},{"p":"com.google.adk.models","c":"Model","l":"toBuilder()"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryLoggerConfig","l":"toBuilder()"},{"p":"com.google.adk.summarizer","c":"EventsCompactionConfig","l":"toBuilder()"},{"p":"com.google.adk.tools","c":"ToolContext","l":"toBuilder()"},{"p":"com.google.adk.models.springai","c":"EmbeddingConverter","l":"toDoubleArray(float[])","k":"6"},{"p":"com.google.adk.models.springai","c":"EmbeddingConverter","l":"toFloatArray(double[])","k":"6"},{"p":"com.google.adk.a2a.converters","c":"PartConverter","l":"toGenaiPart(Part)","u":"toGenaiPart(io.a2a.spec.Part)","k":"6"},{"p":"com.google.adk.a2a.converters","c":"PartConverter","l":"toGenaiParts(List)","u":"toGenaiParts(java.util.List)","k":"6"},{"p":"com.google.adk.models","c":"GeminiUtil","l":"toGenerateContentResponseUsageMetadata(UsageMetadata)","u":"toGenerateContentResponseUsageMetadata(com.google.genai.types.UsageMetadata)","k":"6"},{"p":"com.google.adk","c":"JsonBaseModel","l":"toJson()"},{"p":"com.google.adk","c":"JsonBaseModel","l":"toJsonNode(Object)","u":"toJsonNode(java.lang.Object)","k":"6"},{"p":"com.google.adk","c":"JsonBaseModel","l":"toJsonString(Object)","u":"toJsonString(java.lang.Object)","k":"6"},{"p":"com.google.adk.models.langchain4j","c":"LangChain4j","l":"tokenCountEstimator()"},{"p":"com.google.adk.models.langchain4j","c":"LangChain4j.Builder","l":"tokenCountEstimator(TokenCountEstimator)","u":"tokenCountEstimator(dev.langchain4j.model.TokenCountEstimator)"},{"p":"com.google.adk.summarizer","c":"EventsCompactionConfig","l":"tokenThreshold()"},{"p":"com.google.adk.summarizer","c":"EventsCompactionConfig.Builder","l":"tokenThreshold(Integer)","u":"tokenThreshold(java.lang.Integer)"},{"p":"com.google.adk.models.springai","c":"MessageConverter","l":"toLlmPrompt(LlmRequest)","u":"toLlmPrompt(com.google.adk.models.LlmRequest)"},{"p":"com.google.adk.models.springai","c":"MessageConverter","l":"toLlmPrompt(LlmRequest, ChatOptions)","u":"toLlmPrompt(com.google.adk.models.LlmRequest,org.springframework.ai.chat.prompt.ChatOptions)"},{"p":"com.google.adk.models.springai","c":"MessageConverter","l":"toLlmResponse(ChatResponse)","u":"toLlmResponse(org.springframework.ai.chat.model.ChatResponse)"},{"p":"com.google.adk.models.springai","c":"MessageConverter","l":"toLlmResponse(ChatResponse, boolean)","u":"toLlmResponse(org.springframework.ai.chat.model.ChatResponse,boolean)"},{"p":"com.google.adk.utils","c":"ApiFutureUtils","l":"toMaybe(ApiFuture)","u":"toMaybe(com.google.api.core.ApiFuture)","k":"6"},{"p":"com.google.adk.flows.llmflows","c":"Functions","l":"TOOL_CALL_SECURITY_STATES","k":"2"},{"p":"com.google.adk.tools","c":"BaseTool.ToolArgsConfig","l":"ToolArgsConfig()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.plugins.recordings","c":"ToolRecording","l":"toolCall()"},{"p":"com.google.adk.plugins.recordings","c":"ToolRecording.Builder","l":"toolCall(FunctionCall)","u":"toolCall(com.google.genai.types.FunctionCall)"},{"p":"com.google.adk.models.chat","c":"ChatCompletionsRequest","l":"toolChoice","k":"1"},{"p":"com.google.adk.tools","c":"BaseTool.ToolConfig","l":"ToolConfig()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.tools","c":"BaseTool.ToolConfig","l":"ToolConfig(String, BaseTool.ToolArgsConfig)","u":"%3Cinit%3E(java.lang.String,com.google.adk.tools.BaseTool.ToolArgsConfig)","k":"3"},{"p":"com.google.adk.tools","c":"ToolContext","l":"toolConfirmation()"},{"p":"com.google.adk.events","c":"ToolConfirmation","l":"ToolConfirmation()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.tools","c":"ToolContext.Builder","l":"toolConfirmation(ToolConfirmation)","u":"toolConfirmation(com.google.adk.events.ToolConfirmation)"},{"p":"com.google.adk.tools","c":"ToolContext","l":"toolConfirmation(ToolConfirmation)","u":"toolConfirmation(com.google.adk.events.ToolConfirmation)"},{"p":"com.google.adk.models.springai","c":"ToolConverter","l":"ToolConverter()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.telemetry","c":"Instrumentation.ToolExecution","l":"ToolExecution(BaseTool, BaseAgent, Map, Context)","u":"%3Cinit%3E(com.google.adk.tools.BaseTool,com.google.adk.agents.BaseAgent,java.util.Map,io.opentelemetry.context.Context)","k":"3"},{"p":"com.google.adk.agents","c":"RunConfig","l":"toolExecutionMode()"},{"p":"com.google.adk.agents","c":"RunConfig.Builder","l":"toolExecutionMode(RunConfig.ToolExecutionMode)","u":"toolExecutionMode(com.google.adk.agents.RunConfig.ToolExecutionMode)"},{"p":"com.google.adk.tools.mcp","c":"McpToolset.McpToolsetConfig","l":"toolFilter()"},{"p":"com.google.adk.tools.mcp","c":"McpAsyncToolset.Builder","l":"toolFilter(List)","u":"toolFilter(java.util.List)"},{"p":"com.google.adk.tools.mcp","c":"McpAsyncToolset.Builder","l":"toolFilter(ToolPredicate)","u":"toolFilter(com.google.adk.tools.ToolPredicate)"},{"p":"com.google.adk.models.springai","c":"ToolConverter.ToolMetadata","l":"ToolMetadata(String, String, FunctionDeclaration)","u":"%3Cinit%3E(java.lang.String,java.lang.String,com.google.genai.types.FunctionDeclaration)","k":"3"},{"p":"com.google.adk.a2a.agent","c":"RemoteA2AAgent","l":"toolOrigin()"},{"p":"com.google.adk.agents","c":"BaseAgent","l":"toolOrigin()"},{"p":"com.google.adk.plugins.recordings","c":"Recording","l":"toolRecording()"},{"p":"com.google.adk.plugins.recordings","c":"ToolRecording","l":"ToolRecording()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.plugins.recordings","c":"Recording.Builder","l":"toolRecording(ToolRecording)","u":"toolRecording(com.google.adk.plugins.recordings.ToolRecording)"},{"p":"com.google.adk.plugins.recordings","c":"ToolRecording","l":"toolResponse()"},{"p":"com.google.adk.plugins.recordings","c":"ToolRecording.Builder","l":"toolResponse(FunctionResponse)","u":"toolResponse(com.google.genai.types.FunctionResponse)"},{"p":"com.google.adk.models.chat","c":"ChatCompletionsRequest","l":"tools","k":"1"},{"p":"com.google.adk.agents","c":"LlmAgent","l":"tools()"},{"p":"com.google.adk.agents","c":"LlmAgentConfig","l":"tools()"},{"p":"com.google.adk.models","c":"LlmRequest","l":"tools()"},{"p":"com.google.adk.agents","c":"LlmAgent.Builder","l":"tools(List)","u":"tools(java.util.List)"},{"p":"com.google.adk.models","c":"LlmRequest.Builder","l":"tools(Map)","u":"tools(java.util.Map)"},{"p":"com.google.adk.agents","c":"LlmAgent.Builder","l":"tools(Object...)","u":"tools(java.lang.Object...)"},{"p":"com.google.adk.agents","c":"LlmAgent","l":"toolsets()"},{"p":"com.google.adk.agents","c":"LlmAgent","l":"toolsUnion()"},{"p":"com.google.adk.models.chat","c":"ChatCompletionsRequest","l":"topLogprobs","k":"1"},{"p":"com.google.adk.models.chat","c":"ChatCompletionsRequest","l":"topP","k":"1"},{"p":"com.google.adk.tools.mcp","c":"StdioServerParameters","l":"toServerParameters()"},{"p":"com.google.adk.utils","c":"ApiFutureUtils","l":"toSingle(ApiFuture)","u":"toSingle(com.google.api.core.ApiFuture)","k":"6"},{"p":"com.google.adk.models.springai","c":"ConfigMapper","l":"toSpringAiChatOptions(Optional)","u":"toSpringAiChatOptions(java.util.Optional)"},{"p":"com.google.adk.agents","c":"ContextCacheConfig","l":"toString()"},{"p":"com.google.adk.agents","c":"Instruction.Provider","l":"toString()"},{"p":"com.google.adk.agents","c":"Instruction.Static","l":"toString()"},{"p":"com.google.adk.agents","c":"PlannerAction.Done","l":"toString()"},{"p":"com.google.adk.agents","c":"PlannerAction.DoneWithResult","l":"toString()"},{"p":"com.google.adk.agents","c":"PlannerAction.NoOp","l":"toString()"},{"p":"com.google.adk.agents","c":"PlannerAction.RunAgents","l":"toString()"},{"p":"com.google.adk.events","c":"Event","l":"toString()"},{"p":"com.google.adk.models.springai.error","c":"SpringAIErrorMapper.MappedError","l":"toString()"},{"p":"com.google.adk.planner.goap","c":"AgentMetadata","l":"toString()"},{"p":"com.google.adk.planner.goap","c":"ReplanPolicy.FailStop","l":"toString()"},{"p":"com.google.adk.planner.goap","c":"ReplanPolicy.Ignore","l":"toString()"},{"p":"com.google.adk.planner.goap","c":"ReplanPolicy.Replan","l":"toString()"},{"p":"com.google.adk.sessions","c":"Session","l":"toString()"},{"p":"com.google.adk.sessions","c":"SessionKey","l":"toString()"},{"p":"com.google.adk.summarizer","c":"EventsCompactionConfig","l":"toString()"},{"p":"com.google.adk.tools","c":"LoadMemoryResponse","l":"toString()"},{"p":"com.google.adk.tools","c":"ToolContext","l":"toString()"},{"p":"com.google.adk.web.config","c":"AdkWebCorsProperties","l":"toString()"},{"p":"com.google.adk.a2a.converters","c":"PartConverter","l":"toTextPart(Part)","u":"toTextPart(io.a2a.spec.Part)","k":"6"},{"p":"com.google.adk.skills","c":"Frontmatter","l":"toXml()"},{"p":"com.google.adk.telemetry","c":"Tracing","l":"trace(String)","u":"trace(java.lang.String)","k":"6"},{"p":"com.google.adk.telemetry","c":"Tracing","l":"traceAgent(String, String, String, InvocationContext)","u":"traceAgent(java.lang.String,java.lang.String,java.lang.String,com.google.adk.agents.InvocationContext)","k":"6"},{"p":"com.google.adk.telemetry","c":"Tracing","l":"traceAgentInvocation(Span, String, String, InvocationContext)","u":"traceAgentInvocation(io.opentelemetry.api.trace.Span,java.lang.String,java.lang.String,com.google.adk.agents.InvocationContext)","k":"6"},{"p":"com.google.adk.telemetry","c":"Tracing","l":"traceCallLlm(Span, InvocationContext, String, LlmRequest, LlmResponse, Exception)","u":"traceCallLlm(io.opentelemetry.api.trace.Span,com.google.adk.agents.InvocationContext,java.lang.String,com.google.adk.models.LlmRequest,com.google.adk.models.LlmResponse,java.lang.Exception)","k":"6"},{"p":"com.google.adk.telemetry","c":"Tracing","l":"traceFlowable(Context, Span, Supplier)","u":"traceFlowable(io.opentelemetry.context.Context,io.opentelemetry.api.trace.Span,java.util.function.Supplier)","k":"6"},{"p":"com.google.adk.telemetry","c":"Tracing","l":"traceMergedToolCalls(Span, String, Event)","u":"traceMergedToolCalls(io.opentelemetry.api.trace.Span,java.lang.String,com.google.adk.events.Event)","k":"6"},{"p":"com.google.adk.telemetry","c":"Tracing","l":"traceSendData(Span, InvocationContext, String, List)","u":"traceSendData(io.opentelemetry.api.trace.Span,com.google.adk.agents.InvocationContext,java.lang.String,java.util.List)","k":"6"},{"p":"com.google.adk.telemetry","c":"Tracing","l":"traceToolExecution(Span, String, String, String, Map, Event, Throwable)","u":"traceToolExecution(io.opentelemetry.api.trace.Span,java.lang.String,java.lang.String,java.lang.String,java.util.Map,com.google.adk.events.Event,java.lang.Throwable)","k":"6"},{"p":"com.google.adk.events","c":"EventActions","l":"transferToAgent()"},{"p":"com.google.adk.flows.llmflows","c":"ResponseProcessor.ResponseProcessingResult","l":"transferToAgent()"},{"p":"com.google.adk.events","c":"EventActions.Builder","l":"transferToAgent(String)","u":"transferToAgent(java.lang.String)"},{"p":"com.google.adk.flows.llmflows","c":"AgentTransfer","l":"transferToAgent(String, ToolContext)","u":"transferToAgent(java.lang.String,com.google.adk.tools.ToolContext)","k":"6"},{"p":"com.google.adk.agents","c":"ContextCacheConfig","l":"ttl()"},{"p":"com.google.adk.events","c":"Event","l":"turnComplete()"},{"p":"com.google.adk.models","c":"LlmResponse","l":"turnComplete()"},{"p":"com.google.adk.events","c":"Event.Builder","l":"turnComplete(Boolean)","u":"turnComplete(java.lang.Boolean)"},{"p":"com.google.adk.models","c":"LlmResponse.Builder","l":"turnComplete(Boolean)","u":"turnComplete(java.lang.Boolean)"},{"p":"com.google.adk.a2a.converters","c":"A2AMetadataKey","l":"TYPE","k":"0"},{"p":"com.google.adk.a2a.agent","c":"RemoteA2AAgent.TypeError","l":"TypeError(String)","u":"%3Cinit%3E(java.lang.String)","k":"3"},{"p":"com.google.adk.tools.computeruse","c":"BaseComputer","l":"typeTextAt(int, int, String, Boolean, Boolean)","u":"typeTextAt(int,int,java.lang.String,java.lang.Boolean,java.lang.Boolean)"},{"p":"com.google.adk.models","c":"ApigeeLlm.ApiType","l":"UNKNOWN","k":"0"},{"p":"com.google.adk.models.springai.error","c":"SpringAIErrorMapper.ErrorCategory","l":"UNKNOWN_ERROR","k":"0"},{"p":"com.google.adk.models.springai","c":"MessageConversionException","l":"unsupportedContentType(String)","u":"unsupportedContentType(java.lang.String)","k":"6"},{"p":"com.google.adk.codeexecutors","c":"CodeExecutorContext","l":"updateCodeExecutionResult(String, String, String, String)","u":"updateCodeExecutionResult(java.lang.String,java.lang.String,java.lang.String,java.lang.String)"},{"p":"com.google.adk.flows.llmflows","c":"RequestProcessor.RequestProcessingResult","l":"updatedRequest()"},{"p":"com.google.adk.flows.llmflows","c":"ResponseProcessor.ResponseProcessingResult","l":"updatedResponse()"},{"p":"com.google.adk.tools.applicationintegrationtoolset","c":"ConnectionsClient","l":"updateOperation(String, String, String)","u":"updateOperation(java.lang.String,java.lang.String,java.lang.String)","k":"6"},{"p":"com.google.adk.tools.applicationintegrationtoolset","c":"ConnectionsClient","l":"updateOperationRequest(String)","u":"updateOperationRequest(java.lang.String)","k":"6"},{"p":"com.google.adk.tools.computeruse","c":"ComputerState","l":"url()"},{"p":"com.google.adk.tools.mcp","c":"SseServerParameters","l":"url()"},{"p":"com.google.adk.tools.mcp","c":"StreamableHttpServerParameters","l":"url()"},{"p":"com.google.adk.tools.computeruse","c":"ComputerState.Builder","l":"url(String)","u":"url(java.lang.String)"},{"p":"com.google.adk.tools.mcp","c":"SseServerParameters.Builder","l":"url(String)","u":"url(java.lang.String)"},{"p":"com.google.adk.tools.mcp","c":"StreamableHttpServerParameters.Builder","l":"url(String)","u":"url(java.lang.String)"},{"p":"com.google.adk.tools","c":"UrlContextTool","l":"UrlContextTool()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.a2a.converters","c":"A2AMetadataKey","l":"USAGE_METADATA","k":"0"},{"p":"com.google.adk.events","c":"Event","l":"usageMetadata()"},{"p":"com.google.adk.models","c":"LlmResponse","l":"usageMetadata()"},{"p":"com.google.adk.events","c":"Event.Builder","l":"usageMetadata(GenerateContentResponseUsageMetadata)","u":"usageMetadata(com.google.genai.types.GenerateContentResponseUsageMetadata)"},{"p":"com.google.adk.models","c":"LlmResponse.Builder","l":"usageMetadata(GenerateContentResponseUsageMetadata)","u":"usageMetadata(com.google.genai.types.GenerateContentResponseUsageMetadata)"},{"p":"com.google.adk.models.chat","c":"ChatCompletionsRequest","l":"user","k":"1"},{"p":"com.google.adk.sessions","c":"State","l":"USER_PREFIX","k":"2"},{"p":"com.google.adk.utils","c":"Constants","l":"USER_STATE_COLLECTION","k":"2"},{"p":"com.google.adk.agents","c":"InvocationContext","l":"userContent()"},{"p":"com.google.adk.agents","c":"PlanningContext","l":"userContent()"},{"p":"com.google.adk.agents","c":"ReadonlyContext","l":"userContent()"},{"p":"com.google.adk.agents","c":"InvocationContext.Builder","l":"userContent(Content)","u":"userContent(com.google.genai.types.Content)"},{"p":"com.google.adk.web.dto","c":"AddSessionToEvalSetRequest","l":"userId","k":"1"},{"p":"com.google.adk.web.dto","c":"AgentRunRequest","l":"userId","k":"1"},{"p":"com.google.adk.agents","c":"InvocationContext","l":"userId()"},{"p":"com.google.adk.agents","c":"ReadonlyContext","l":"userId()"},{"p":"com.google.adk.sessions","c":"Session","l":"userId()"},{"p":"com.google.adk.sessions","c":"SessionKey","l":"userId()"},{"p":"com.google.adk.sessions","c":"Session.Builder","l":"userId(String)","u":"userId(java.lang.String)"},{"p":"com.google.adk.plugins.recordings","c":"Recording","l":"userMessageIndex()"},{"p":"com.google.adk.plugins.recordings","c":"Recording.Builder","l":"userMessageIndex(int)"},{"p":"com.google.adk.agents","c":"LlmAgent.Builder","l":"validate()"},{"p":"com.google.adk","c":"SchemaUtils","l":"validateMapOnSchema(Map, Schema, Boolean)","u":"validateMapOnSchema(java.util.Map,com.google.genai.types.Schema,java.lang.Boolean)","k":"6"},{"p":"com.google.adk","c":"SchemaUtils","l":"validateOutputSchema(String, Schema)","u":"validateOutputSchema(java.lang.String,com.google.genai.types.Schema)","k":"6"},{"p":"com.google.adk.models.springai.properties","c":"SpringAIProperties.Validation","l":"Validation()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.a2a.common","c":"A2AMetadata.Key","l":"valueOf(String)","u":"valueOf(java.lang.String)","k":"6"},{"p":"com.google.adk.a2a.converters","c":"A2ADataPartMetadataType","l":"valueOf(String)","u":"valueOf(java.lang.String)","k":"6"},{"p":"com.google.adk.a2a.converters","c":"A2AMetadataKey","l":"valueOf(String)","u":"valueOf(java.lang.String)","k":"6"},{"p":"com.google.adk.a2a.converters","c":"AdkMetadataKey","l":"valueOf(String)","u":"valueOf(java.lang.String)","k":"6"},{"p":"com.google.adk.a2a.executor","c":"AgentExecutorConfig.OutputMode","l":"valueOf(String)","u":"valueOf(java.lang.String)","k":"6"},{"p":"com.google.adk.agents","c":"LlmAgent.IncludeContents","l":"valueOf(String)","u":"valueOf(java.lang.String)","k":"6"},{"p":"com.google.adk.agents","c":"RunConfig.StreamingMode","l":"valueOf(String)","u":"valueOf(java.lang.String)","k":"6"},{"p":"com.google.adk.agents","c":"RunConfig.ToolExecutionMode","l":"valueOf(String)","u":"valueOf(java.lang.String)","k":"6"},{"p":"com.google.adk.models","c":"ApigeeLlm.ApiType","l":"valueOf(String)","u":"valueOf(java.lang.String)","k":"6"},{"p":"com.google.adk.models.springai.error","c":"SpringAIErrorMapper.ErrorCategory","l":"valueOf(String)","u":"valueOf(java.lang.String)","k":"6"},{"p":"com.google.adk.models.springai.error","c":"SpringAIErrorMapper.RetryStrategy","l":"valueOf(String)","u":"valueOf(java.lang.String)","k":"6"},{"p":"com.google.adk.tools.computeruse","c":"ComputerEnvironment","l":"valueOf(String)","u":"valueOf(java.lang.String)","k":"6"},{"p":"com.google.adk.utils","c":"AgentEnums.AgentOrigin","l":"valueOf(String)","u":"valueOf(java.lang.String)","k":"6"},{"p":"com.google.adk.a2a.common","c":"A2AMetadata.Key","l":"values()","k":"6"},{"p":"com.google.adk.a2a.converters","c":"A2ADataPartMetadataType","l":"values()","k":"6"},{"p":"com.google.adk.a2a.converters","c":"A2AMetadataKey","l":"values()","k":"6"},{"p":"com.google.adk.a2a.converters","c":"AdkMetadataKey","l":"values()","k":"6"},{"p":"com.google.adk.a2a.executor","c":"AgentExecutorConfig.OutputMode","l":"values()","k":"6"},{"p":"com.google.adk.agents","c":"LlmAgent.IncludeContents","l":"values()","k":"6"},{"p":"com.google.adk.agents","c":"RunConfig.StreamingMode","l":"values()","k":"6"},{"p":"com.google.adk.agents","c":"RunConfig.ToolExecutionMode","l":"values()","k":"6"},{"p":"com.google.adk.models","c":"ApigeeLlm.ApiType","l":"values()","k":"6"},{"p":"com.google.adk.models.springai.error","c":"SpringAIErrorMapper.ErrorCategory","l":"values()","k":"6"},{"p":"com.google.adk.models.springai.error","c":"SpringAIErrorMapper.RetryStrategy","l":"values()","k":"6"},{"p":"com.google.adk.sessions","c":"State","l":"values()"},{"p":"com.google.adk.tools.computeruse","c":"ComputerEnvironment","l":"values()","k":"6"},{"p":"com.google.adk.utils","c":"AgentEnums.AgentOrigin","l":"values()","k":"6"},{"p":"com.google.adk.models.chat","c":"ChatCompletionsRequest","l":"verbosity","k":"1"},{"p":"com.google.adk.artifacts","c":"ListArtifactVersionsResponse","l":"versions()"},{"p":"com.google.adk.artifacts","c":"ListArtifactVersionsResponse.Builder","l":"versions(List)","u":"versions(java.util.List)"},{"p":"com.google.adk.sessions","c":"HttpApiClient","l":"vertexAI()"},{"p":"com.google.adk.codeexecutors","c":"VertexAiCodeExecutor","l":"VertexAiCodeExecutor(String)","u":"%3Cinit%3E(java.lang.String)","k":"3"},{"p":"com.google.adk.tools.retrieval","c":"VertexAiRagRetrieval","l":"VertexAiRagRetrieval(String, String, VertexRagServiceClient, String, List, Double)","u":"%3Cinit%3E(java.lang.String,java.lang.String,com.google.cloud.aiplatform.v1.VertexRagServiceClient,java.lang.String,java.util.List,java.lang.Double)","k":"3"},{"p":"com.google.adk.tools","c":"VertexAiSearchAgentTool","l":"VertexAiSearchAgentTool(LlmAgent)","u":"%3Cinit%3E(com.google.adk.agents.LlmAgent)","k":"3"},{"p":"com.google.adk.sessions","c":"VertexAiSessionService","l":"VertexAiSessionService()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.sessions","c":"VertexAiSessionService","l":"VertexAiSessionService(String, String, GoogleCredentials, HttpOptions)","u":"%3Cinit%3E(java.lang.String,java.lang.String,com.google.auth.oauth2.GoogleCredentials,com.google.genai.types.HttpOptions)","k":"3"},{"p":"com.google.adk.sessions","c":"VertexAiSessionService","l":"VertexAiSessionService(String, String, HttpApiClient)","u":"%3Cinit%3E(java.lang.String,java.lang.String,com.google.adk.sessions.HttpApiClient)","k":"3"},{"p":"com.google.adk.models","c":"VertexCredentials","l":"VertexCredentials()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.models","c":"Gemini.Builder","l":"vertexCredentials(VertexCredentials)","u":"vertexCredentials(com.google.adk.models.VertexCredentials)"},{"p":"com.google.adk.flows.llmflows.audio","c":"VertexSpeechClient","l":"VertexSpeechClient()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryLoggerConfig","l":"viewPrefix()"},{"p":"com.google.adk.plugins.agentanalytics","c":"BigQueryLoggerConfig.Builder","l":"viewPrefix(String)","u":"viewPrefix(java.lang.String)"},{"p":"com.google.adk.tools.computeruse","c":"BaseComputer","l":"wait(Duration)","u":"wait(java.time.Duration)"},{"p":"com.google.adk.tutorials","c":"LiveAudioSingleAgent","l":"WEATHER_AGENT","k":"2"},{"p":"com.google.adk.maven","c":"WebMojo","l":"WebMojo()","u":"%3Cinit%3E()","k":"3"},{"p":"com.google.adk.models.chat","c":"ChatCompletionsRequest","l":"webSearchOptions","k":"1"},{"p":"com.google.adk.web.websocket","c":"WebSocketConfig","l":"WebSocketConfig(LiveWebSocketHandler, AdkWebCorsProperties)","u":"%3Cinit%3E(com.google.adk.web.websocket.LiveWebSocketHandler,com.google.adk.web.config.AdkWebCorsProperties)","k":"3"},{"p":"com.google.adk.a2a.converters","c":"PartConverter","l":"WILL_CONTINUE_KEY","k":"2"},{"p":"com.google.adk.telemetry","c":"Tracing","l":"withContext(Context)","u":"withContext(io.opentelemetry.context.Context)","k":"6"},{"p":"com.google.adk.utils","c":"Constants","l":"WORD_PATTERN","k":"2"},{"p":"com.google.adk.tools.mcp","c":"AbstractMcpTool","l":"wrapCallResult(ObjectMapper, String, McpSchema.CallToolResult)","u":"wrapCallResult(com.fasterxml.jackson.databind.ObjectMapper,java.lang.String,io.modelcontextprotocol.spec.McpSchema.CallToolResult)","k":"6"},{"p":"com.example.github","c":"GitHubTools","l":"writeRepoName","k":"2"},{"p":"com.example.github","c":"GitHubTools","l":"writeRepoOwner","k":"2"}];updateSearchResults();
\ No newline at end of file
@@ -0,0 +1 @@
+packageSearchIndex = [{"l":"All Packages","u":"allpackages-index.html","k":"18"},{"l":"com.example"},{"l":"com.example.adkdocs"},{"l":"com.example.adkprtriaging"},{"l":"com.example.adkspam"},{"l":"com.example.adkstale"},{"l":"com.example.adktriaging"},{"l":"com.example.github"},{"l":"com.google.adk"},{"l":"com.google.adk.a2a.agent"},{"l":"com.google.adk.a2a.common"},{"l":"com.google.adk.a2a.converters"},{"l":"com.google.adk.a2a.executor"},{"l":"com.google.adk.agents"},{"l":"com.google.adk.apps"},{"l":"com.google.adk.artifacts"},{"l":"com.google.adk.codeexecutors"},{"l":"com.google.adk.deploy"},{"l":"com.google.adk.events"},{"l":"com.google.adk.examples"},{"l":"com.google.adk.flows"},{"l":"com.google.adk.flows.llmflows"},{"l":"com.google.adk.flows.llmflows.audio"},{"l":"com.google.adk.google_adk_maven_plugin"},{"l":"com.google.adk.internal.http"},{"l":"com.google.adk.maven"},{"l":"com.google.adk.memory"},{"l":"com.google.adk.models"},{"l":"com.google.adk.models.chat"},{"l":"com.google.adk.models.langchain4j"},{"l":"com.google.adk.models.springai"},{"l":"com.google.adk.models.springai.autoconfigure"},{"l":"com.google.adk.models.springai.error"},{"l":"com.google.adk.models.springai.observability"},{"l":"com.google.adk.models.springai.properties"},{"l":"com.google.adk.planner"},{"l":"com.google.adk.planner.goap"},{"l":"com.google.adk.planner.p2p"},{"l":"com.google.adk.plugins"},{"l":"com.google.adk.plugins.agentanalytics"},{"l":"com.google.adk.plugins.recordings"},{"l":"com.google.adk.runner"},{"l":"com.google.adk.samples.a2aagent"},{"l":"com.google.adk.samples.a2aagent.agent"},{"l":"com.google.adk.sessions"},{"l":"com.google.adk.skills"},{"l":"com.google.adk.summarizer"},{"l":"com.google.adk.telemetry"},{"l":"com.google.adk.tools"},{"l":"com.google.adk.tools.applicationintegrationtoolset"},{"l":"com.google.adk.tools.computeruse"},{"l":"com.google.adk.tools.mcp"},{"l":"com.google.adk.tools.retrieval"},{"l":"com.google.adk.tools.skills"},{"l":"com.google.adk.tutorials"},{"l":"com.google.adk.utils"},{"l":"com.google.adk.web"},{"l":"com.google.adk.web.config"},{"l":"com.google.adk.web.controller"},{"l":"com.google.adk.web.dto"},{"l":"com.google.adk.web.service"},{"l":"com.google.adk.web.websocket"}];updateSearchResults();
\ No newline at end of file
@@ -0,0 +1 @@
+tagSearchIndex = [{"l":"AgentLoader Implementation","h":"class com.google.adk.maven.WebMojo","k":"16","u":"com/google/adk/maven/WebMojo.html#agentloader-implementation-heading"},{"l":"Basic Usage","h":"class com.google.adk.maven.WebMojo","k":"16","u":"com/google/adk/maven/WebMojo.html#basic-usage-heading"},{"l":"Configuration Parameters","h":"class com.google.adk.maven.WebMojo","k":"16","u":"com/google/adk/maven/WebMojo.html#configuration-parameters-heading"},{"l":"Constant Field Values","h":"","k":"18","u":"constant-values.html"},{"l":"Serialized Form","h":"","k":"18","u":"serialized-form.html"},{"l":"Web Interface","h":"class com.google.adk.maven.WebMojo","k":"16","u":"com/google/adk/maven/WebMojo.html#web-interface-heading"}];updateSearchResults();
\ No newline at end of file
@@ -0,0 +1 @@
+typeSearchIndex = [{"p":"com.example.a2a_basic","l":"A2AAgent"},{"p":"com.example.a2a_basic","l":"A2AAgentRun"},{"p":"com.google.adk.a2a.common","l":"A2AClientError","k":"13"},{"p":"com.google.adk.a2a.converters","l":"A2ADataPartMetadataType","k":"9"},{"p":"com.google.adk.a2a.common","l":"A2AMetadata"},{"p":"com.google.adk.a2a.converters","l":"A2AMetadataKey","k":"9"},{"p":"com.google.adk.tools.mcp","l":"AbstractMcpTool"},{"p":"com.google.adk.skills","l":"AbstractSkillSource"},{"p":"com.google.adk.tools.applicationintegrationtoolset","l":"ConnectionsClient.ActionSchema"},{"p":"com.google.adk.agents","l":"ActiveStreamingTool"},{"p":"com.google.adk.utils","l":"AdditionalAdkComponentProvider"},{"p":"com.google.adk.web.dto","l":"AddSessionToEvalSetRequest"},{"p":"com.google.adk.utils","l":"AdkComponentProvider","k":"10"},{"p":"com.example.adkdocs","l":"AdkDocsReleaseAnalyzerAgent"},{"p":"com.example.adkdocs","l":"AdkDocsReleaseAnalyzerRun"},{"p":"com.google.adk.a2a.converters","l":"AdkMetadataKey","k":"9"},{"p":"com.example.adkprtriaging","l":"AdkPrTriagingAgent"},{"p":"com.example.adkprtriaging","l":"AdkPrTriagingAgentRun"},{"p":"com.example.adkstale","l":"AdkStaleAgent"},{"p":"com.example.adkstale","l":"AdkStaleAgentRun"},{"p":"com.example.adktriaging","l":"AdkTriagingAgent"},{"p":"com.example.adktriaging","l":"AdkTriagingAgentRun"},{"p":"com.google.adk.web.config","l":"AdkWebCorsConfig"},{"p":"com.google.adk.web.config","l":"AdkWebCorsProperties","k":"11"},{"p":"com.google.adk.web","l":"AdkWebServer"},{"p":"com.google.adk.agents","l":"Callbacks.AfterAgentCallback","k":"10"},{"p":"com.google.adk.agents","l":"Callbacks.AfterAgentCallbackSync","k":"10"},{"p":"com.google.adk.a2a.executor","l":"Callbacks.AfterEventCallback","k":"10"},{"p":"com.google.adk.a2a.executor","l":"Callbacks.AfterExecuteCallback","k":"10"},{"p":"com.google.adk.agents","l":"Callbacks.AfterModelCallback","k":"10"},{"p":"com.google.adk.agents","l":"Callbacks.AfterModelCallbackSync","k":"10"},{"p":"com.google.adk.agents","l":"Callbacks.AfterToolCallback","k":"10"},{"p":"com.google.adk.agents","l":"Callbacks.AfterToolCallbackSync","k":"10"},{"p":"com.google.adk.samples.a2aagent.agent","l":"Agent"},{"p":"com.google.adk.samples.a2aagent","l":"AgentCardProducer"},{"p":"com.google.adk.a2a.agent","l":"RemoteA2AAgent.AgentCardResolutionError","k":"13"},{"p":"com.google.adk.web.controller","l":"AgentController"},{"p":"com.google.adk.utils","l":"AgentEnums"},{"p":"com.google.adk.a2a.executor","l":"AgentExecutor"},{"p":"com.google.adk.a2a.executor","l":"AgentExecutorConfig"},{"p":"com.google.adk.samples.a2aagent","l":"AgentExecutorProducer"},{"p":"com.google.adk.web","l":"AgentGraphGenerator"},{"p":"com.google.adk.telemetry","l":"Instrumentation.AgentInvocation"},{"p":"com.google.adk.maven","l":"AgentLoader","k":"10"},{"p":"com.google.adk.web","l":"AgentLoader","k":"10"},{"p":"com.google.adk.web.config","l":"AgentLoadingProperties"},{"p":"com.google.adk.planner.goap","l":"AgentMetadata","k":"11"},{"p":"com.google.adk.utils","l":"AgentEnums.AgentOrigin","k":"9"},{"p":"com.google.adk.agents","l":"BaseAgentConfig.AgentRefConfig"},{"p":"com.google.adk.web.dto","l":"AgentRunRequest"},{"p":"com.google.adk.web","l":"AgentStaticLoader"},{"p":"com.google.adk.tools","l":"AgentTool"},{"p":"com.google.adk.flows.llmflows","l":"AgentTransfer"},{"l":"All Classes and Interfaces","u":"allclasses-index.html","k":"18"},{"p":"com.google.adk.tools","l":"Annotations"},{"p":"com.google.adk.utils","l":"ApiFutureUtils"},{"p":"com.google.adk.models","l":"ApigeeLlm"},{"p":"com.google.adk.sessions","l":"ApiResponse"},{"p":"com.google.adk.web.service","l":"ApiServerSpanExporter"},{"p":"com.google.adk.web.service","l":"ApiServerSpanExporterConfig"},{"p":"com.google.adk.models","l":"ApigeeLlm.ApiType","k":"9"},{"p":"com.google.adk.apps","l":"App"},{"p":"com.google.adk.tools.applicationintegrationtoolset","l":"ApplicationIntegrationToolset"},{"p":"com.google.adk.web.controller","l":"ArtifactController"},{"p":"com.google.adk.planner.goap","l":"AStarSearchStrategy"},{"p":"com.google.adk.flows.llmflows","l":"AutoFlow"},{"p":"com.google.adk.agents","l":"BaseAgent"},{"p":"com.google.adk.agents","l":"BaseAgentConfig"},{"p":"com.google.adk.artifacts","l":"BaseArtifactService","k":"10"},{"p":"com.google.adk.codeexecutors","l":"BaseCodeExecutor"},{"p":"com.google.adk.tools.computeruse","l":"BaseComputer","k":"10"},{"p":"com.google.adk.summarizer","l":"BaseEventSummarizer","k":"10"},{"p":"com.google.adk.examples","l":"BaseExampleProvider","k":"10"},{"p":"com.google.adk.flows","l":"BaseFlow","k":"10"},{"p":"com.google.adk.models","l":"BaseLlm"},{"p":"com.google.adk.models","l":"BaseLlmConnection","k":"10"},{"p":"com.google.adk.flows.llmflows","l":"BaseLlmFlow"},{"p":"com.google.adk.memory","l":"BaseMemoryService","k":"10"},{"p":"com.google.adk.plugins","l":"BasePlugin"},{"p":"com.google.adk.tools.retrieval","l":"BaseRetrievalTool"},{"p":"com.google.adk.sessions","l":"BaseSessionService","k":"10"},{"p":"com.google.adk.tools","l":"BaseTool"},{"p":"com.google.adk.tools","l":"BaseToolset","k":"10"},{"p":"com.google.adk.flows.llmflows","l":"Basic"},{"p":"com.google.adk.agents","l":"Callbacks.BeforeAgentCallback","k":"10"},{"p":"com.google.adk.agents","l":"Callbacks.BeforeAgentCallbackSync","k":"10"},{"p":"com.google.adk.a2a.executor","l":"Callbacks.BeforeExecuteCallback","k":"10"},{"p":"com.google.adk.agents","l":"Callbacks.BeforeModelCallback","k":"10"},{"p":"com.google.adk.agents","l":"Callbacks.BeforeModelCallbackSync","k":"10"},{"p":"com.google.adk.agents","l":"Callbacks.BeforeToolCallback","k":"10"},{"p":"com.google.adk.agents","l":"Callbacks.BeforeToolCallbackSync","k":"10"},{"p":"com.google.adk.plugins.agentanalytics","l":"BigQueryAgentAnalyticsPlugin"},{"p":"com.google.adk.plugins.agentanalytics","l":"BigQueryLoggerConfig"},{"p":"com.google.adk.plugins.agentanalytics","l":"BigQuerySchema"},{"p":"com.google.adk.a2a.executor","l":"AgentExecutor.Builder"},{"p":"com.google.adk.a2a.executor","l":"AgentExecutorConfig.Builder"},{"p":"com.google.adk.models","l":"ApigeeLlm.Builder"},{"p":"com.google.adk.web.service","l":"ApiServerSpanExporterConfig.Builder"},{"p":"com.google.adk.apps","l":"App.Builder"},{"p":"com.google.adk.agents","l":"BaseAgent.Builder"},{"p":"com.google.adk.plugins.agentanalytics","l":"BigQueryLoggerConfig.Builder"},{"p":"com.google.adk.plugins.agentanalytics","l":"BigQueryLoggerConfig.RetryConfig.Builder"},{"p":"com.google.adk.codeexecutors","l":"CodeExecutionUtils.CodeExecutionInput.Builder"},{"p":"com.google.adk.codeexecutors","l":"CodeExecutionUtils.CodeExecutionResult.Builder"},{"p":"com.google.adk.codeexecutors","l":"CodeExecutionUtils.File.Builder"},{"p":"com.google.adk.tools.computeruse","l":"ComputerState.Builder"},{"p":"com.google.adk.plugins","l":"ContextFilterPlugin.Builder"},{"p":"com.google.adk.events","l":"Event.Builder"},{"p":"com.google.adk.events","l":"EventActions.Builder"},{"p":"com.google.adk.events","l":"EventCompaction.Builder"},{"p":"com.google.adk.summarizer","l":"EventsCompactionConfig.Builder"},{"p":"com.google.adk.examples","l":"Example.Builder"},{"p":"com.google.adk.tools","l":"ExampleTool.Builder"},{"p":"com.google.adk.skills","l":"Frontmatter.Builder"},{"p":"com.google.adk.models","l":"Gemini.Builder"},{"p":"com.google.adk.sessions","l":"GetSessionConfig.Builder"},{"p":"com.google.adk.skills","l":"InMemorySkillSource.Builder"},{"p":"com.google.adk.agents","l":"InvocationContext.Builder"},{"p":"com.google.adk.models.langchain4j","l":"LangChain4j.Builder"},{"p":"com.google.adk.artifacts","l":"ListArtifactsResponse.Builder"},{"p":"com.google.adk.artifacts","l":"ListArtifactVersionsResponse.Builder"},{"p":"com.google.adk.sessions","l":"ListEventsResponse.Builder"},{"p":"com.google.adk.sessions","l":"ListSessionsResponse.Builder"},{"p":"com.google.adk.agents","l":"LiveRequest.Builder"},{"p":"com.google.adk.agents","l":"LlmAgent.Builder"},{"p":"com.google.adk.plugins.recordings","l":"LlmRecording.Builder"},{"p":"com.google.adk.models","l":"LlmRequest.Builder"},{"p":"com.google.adk.models","l":"LlmResponse.Builder"},{"p":"com.google.adk.agents","l":"LoopAgent.Builder"},{"p":"com.google.adk.tools.mcp","l":"McpAsyncToolset.Builder"},{"p":"com.google.adk.memory","l":"MemoryEntry.Builder"},{"p":"com.google.adk.models","l":"Model.Builder"},{"p":"com.google.adk.agents","l":"ParallelAgent.Builder"},{"p":"com.google.adk.agents","l":"PlannerAgent.Builder"},{"p":"com.google.adk.plugins.recordings","l":"Recording.Builder"},{"p":"com.google.adk.plugins.recordings","l":"Recordings.Builder"},{"p":"com.google.adk.a2a.agent","l":"RemoteA2AAgent.Builder"},{"p":"com.google.adk.apps","l":"ResumabilityConfig.Builder"},{"p":"com.google.adk.agents","l":"RunConfig.Builder"},{"p":"com.google.adk.runner","l":"Runner.Builder"},{"p":"com.google.adk.memory","l":"SearchMemoryResponse.Builder"},{"p":"com.google.adk.agents","l":"SequentialAgent.Builder"},{"p":"com.google.adk.sessions","l":"Session.Builder"},{"p":"com.google.adk.tools.mcp","l":"SseServerParameters.Builder"},{"p":"com.google.adk.tools.mcp","l":"StdioConnectionParameters.Builder"},{"p":"com.google.adk.tools.mcp","l":"StdioServerParameters.Builder"},{"p":"com.google.adk.tools.mcp","l":"StreamableHttpServerParameters.Builder"},{"p":"com.google.adk.events","l":"ToolConfirmation.Builder"},{"p":"com.google.adk.tools","l":"ToolContext.Builder"},{"p":"com.google.adk.plugins.recordings","l":"ToolRecording.Builder"},{"p":"com.google.adk.tools","l":"VertexAiSearchTool.Builder"},{"p":"com.google.adk.models","l":"VertexCredentials.Builder"},{"p":"com.google.adk.tools","l":"BuiltInCodeExecutionTool"},{"p":"com.google.adk.codeexecutors","l":"BuiltInCodeExecutor"},{"p":"com.google.adk.agents","l":"CallbackContext"},{"p":"com.google.adk.agents","l":"BaseAgentConfig.CallbackRef"},{"p":"com.google.adk.a2a.executor","l":"Callbacks"},{"p":"com.google.adk.agents","l":"Callbacks"},{"p":"com.google.adk.agents","l":"CallbackUtil"},{"p":"com.google.adk.models.chat","l":"ChatCompletionsClient","k":"10"},{"p":"com.google.adk.models.chat","l":"ChatCompletionsHttpClient"},{"p":"com.google.adk.models.chat","l":"ChatCompletionsRequest"},{"p":"com.google.adk.models.chat","l":"ChatCompletionsResponse"},{"p":"com.google.adk.tutorials","l":"CityTimeWeather"},{"p":"com.google.adk.skills","l":"ClassPathSkillSource"},{"p":"com.google.adk.models","l":"Claude"},{"p":"com.google.adk.telemetry","l":"Instrumentation.ClosableTelemetryScope"},{"p":"com.google.adk.flows.llmflows","l":"CodeExecution"},{"p":"com.google.adk.codeexecutors","l":"CodeExecutionUtils.CodeExecutionInput"},{"p":"com.google.adk.codeexecutors","l":"CodeExecutionUtils.CodeExecutionResult"},{"p":"com.google.adk.codeexecutors","l":"CodeExecutionUtils"},{"p":"com.google.adk.codeexecutors","l":"CodeExecutorContext"},{"p":"com.google.adk.utils","l":"CollectionUtils"},{"p":"com.google.adk.flows.llmflows","l":"Compaction"},{"p":"com.google.adk.web","l":"CompiledAgentLoader"},{"p":"com.google.adk.utils","l":"ComponentRegistry"},{"p":"com.google.adk.tools.computeruse","l":"ComputerEnvironment","k":"9"},{"p":"com.google.adk.tools.computeruse","l":"ComputerState"},{"p":"com.google.adk.tools.computeruse","l":"ComputerUseTool"},{"p":"com.google.adk.tools.computeruse","l":"ComputerUseToolset"},{"p":"com.google.adk.maven","l":"ConfigAgentLoader"},{"p":"com.google.adk.agents","l":"ConfigAgentUtils"},{"p":"com.google.adk.models.springai","l":"ConfigMapper"},{"p":"com.google.adk.agents","l":"ConfigAgentUtils.ConfigurationException","k":"13"},{"p":"com.google.adk.tools.applicationintegrationtoolset","l":"ConnectionsClient.ConnectionDetails"},{"p":"com.google.adk.tools.applicationintegrationtoolset","l":"ConnectionsClient"},{"p":"com.google.adk.utils","l":"Constants"},{"p":"com.google.adk.codeexecutors","l":"ContainerCodeExecutor"},{"p":"com.google.adk.flows.llmflows","l":"Contents"},{"p":"com.google.adk.agents","l":"ContextCacheConfig","k":"11"},{"p":"com.google.adk.plugins","l":"ContextFilterPlugin"},{"p":"com.google.adk.telemetry","l":"Tracing.ContextTransformer"},{"p":"com.google.adk.tools.mcp","l":"ConversionUtils"},{"p":"com.google.adk.utils","l":"CoreAdkComponentProvider"},{"p":"com.example","l":"CoreCallbacks"},{"p":"com.google.adk.tools.applicationintegrationtoolset","l":"CredentialsHelper","k":"10"},{"p":"com.example","l":"CustomDemoRegistry"},{"p":"com.example","l":"CustomDieTool"},{"p":"com.google.adk.web.controller","l":"DebugController"},{"p":"com.google.adk.tools.mcp","l":"DefaultMcpTransportBuilder"},{"p":"com.google.adk.planner.goap","l":"DependencyGraphSearch"},{"p":"com.google.adk.planner.goap","l":"DfsSearchStrategy"},{"p":"com.google.adk.agents","l":"PlannerAction.Done","k":"11"},{"p":"com.google.adk.agents","l":"PlannerAction.DoneWithResult","k":"11"},{"p":"com.google.adk.models.springai","l":"EmbeddingConverter"},{"p":"com.google.adk.tools.applicationintegrationtoolset","l":"ConnectionsClient.EntitySchemaAndOperations"},{"p":"com.google.adk.models.springai.error","l":"SpringAIErrorMapper.ErrorCategory","k":"9"},{"p":"com.google.adk.web.controller","l":"EvaluationController"},{"p":"com.google.adk.events","l":"Event"},{"p":"com.google.adk.events","l":"EventActions"},{"p":"com.google.adk.events","l":"EventCompaction"},{"p":"com.google.adk.summarizer","l":"EventCompactor","k":"10"},{"p":"com.google.adk.a2a.converters","l":"EventConverter"},{"p":"com.google.adk.summarizer","l":"EventsCompactionConfig","k":"11"},{"p":"com.google.adk.events","l":"EventStream"},{"p":"com.google.adk.examples","l":"Example"},{"p":"com.google.adk.tools","l":"ExampleTool"},{"p":"com.google.adk.examples","l":"ExampleUtils"},{"p":"com.google.adk.web.controller","l":"ExecutionController"},{"p":"com.google.adk.tools","l":"ExitLoopTool"},{"p":"com.google.adk.planner.goap","l":"ReplanPolicy.FailStop","k":"11"},{"p":"com.google.adk.codeexecutors","l":"CodeExecutionUtils.File"},{"p":"com.google.adk.runner","l":"FirestoreDatabaseRunner"},{"p":"com.google.adk.memory","l":"FirestoreMemoryService"},{"p":"com.google.adk.utils","l":"FirestoreProperties"},{"p":"com.google.adk.sessions","l":"FirestoreSessionService"},{"p":"com.google.adk.skills","l":"Frontmatter"},{"p":"com.google.adk.models","l":"FunctionCallIds"},{"p":"com.google.adk.tools","l":"FunctionCallingUtils"},{"p":"com.google.adk.flows.llmflows","l":"Functions"},{"p":"com.google.adk.tools","l":"FunctionTool"},{"p":"com.google.adk.artifacts","l":"GcsArtifactService"},{"p":"com.google.adk.models","l":"Gemini"},{"p":"com.google.adk.models","l":"GeminiLlmConnection"},{"p":"com.google.adk.models","l":"GeminiUtil"},{"p":"com.google.adk.a2a.common","l":"GenAiFieldMissingException","k":"13"},{"p":"com.google.adk.sessions","l":"GetSessionConfig"},{"p":"com.example.github","l":"GitHubTools"},{"p":"com.google.adk.plugins","l":"GlobalInstructionPlugin"},{"p":"com.google.adk.planner.goap","l":"GoalOrientedPlanner"},{"p":"com.google.adk.planner.goap","l":"GoalOrientedSearchGraph"},{"p":"com.google.adk.tools.applicationintegrationtoolset","l":"GoogleCredentialsHelper"},{"p":"com.google.adk.tools","l":"GoogleMapsTool"},{"p":"com.google.adk.tools","l":"GoogleSearchAgentTool"},{"p":"com.google.adk.tools","l":"GoogleSearchTool"},{"p":"com.google.adk.web.controller","l":"GraphController"},{"p":"com.google.adk.web.dto","l":"GraphResponse"},{"p":"com.example.helloworld","l":"HelloWorldAgent"},{"p":"com.example.helloworld","l":"HelloWorldRun"},{"p":"com.google.adk.google_adk_maven_plugin","l":"HelpMojo"},{"p":"com.google.adk.sessions","l":"HttpApiClient"},{"p":"com.google.adk.sessions","l":"HttpApiResponse"},{"p":"com.google.adk.internal.http","l":"HttpClientFactory"},{"p":"com.google.adk.flows.llmflows","l":"Identity"},{"p":"com.google.adk.planner.goap","l":"ReplanPolicy.Ignore","k":"11"},{"p":"com.google.adk.agents","l":"LlmAgent.IncludeContents","k":"9"},{"p":"com.google.adk.artifacts","l":"InMemoryArtifactService"},{"p":"com.google.adk.memory","l":"InMemoryMemoryService"},{"p":"com.google.adk.runner","l":"InMemoryRunner"},{"p":"com.google.adk.sessions","l":"InMemorySessionService"},{"p":"com.google.adk.skills","l":"InMemorySkillSource"},{"p":"com.google.adk.agents","l":"Instruction","k":"10"},{"p":"com.google.adk.flows.llmflows","l":"Instructions"},{"p":"com.google.adk.utils","l":"InstructionUtils"},{"p":"com.google.adk.telemetry","l":"Instrumentation"},{"p":"com.google.adk.tools.applicationintegrationtoolset","l":"IntegrationClient"},{"p":"com.google.adk.tools.applicationintegrationtoolset","l":"IntegrationConnectorTool"},{"p":"com.google.adk.agents","l":"InvocationContext"},{"p":"com.google.adk","l":"JsonBaseModel"},{"p":"com.google.adk.a2a.common","l":"A2AMetadata.Key","k":"9"},{"p":"com.google.adk.models.langchain4j","l":"LangChain4j"},{"p":"com.example","l":"LifeAgent"},{"p":"com.google.adk.artifacts","l":"ListArtifactsResponse"},{"p":"com.google.adk.artifacts","l":"ListArtifactVersionsResponse"},{"p":"com.google.adk.sessions","l":"ListEventsResponse"},{"p":"com.google.adk.sessions","l":"ListSessionsResponse"},{"p":"com.google.adk.tutorials","l":"LiveAudioSingleAgent"},{"p":"com.google.adk.agents","l":"LiveRequest"},{"p":"com.google.adk.agents","l":"LiveRequestQueue"},{"p":"com.google.adk.web.websocket","l":"LiveWebSocketHandler"},{"p":"com.google.adk.agents","l":"LlmAgent"},{"p":"com.google.adk.agents","l":"LlmAgentConfig"},{"p":"com.google.adk.models","l":"LlmCallsLimitExceededException","k":"13"},{"p":"com.google.adk.summarizer","l":"LlmEventSummarizer"},{"p":"com.google.adk.models","l":"LlmRegistry.LlmFactory","k":"10"},{"p":"com.google.adk.plugins.recordings","l":"LlmRecording"},{"p":"com.google.adk.models","l":"LlmRegistry"},{"p":"com.google.adk.models","l":"LlmRequest"},{"p":"com.google.adk.models","l":"LlmResponse"},{"p":"com.google.adk.tools","l":"LoadArtifactsTool"},{"p":"com.google.adk.tools","l":"LoadMemoryResponse","k":"11"},{"p":"com.google.adk.tools","l":"LoadMemoryTool"},{"p":"com.google.adk.skills","l":"LocalSkillSource"},{"p":"com.google.adk.plugins","l":"LoggingPlugin"},{"p":"com.google.adk.tools","l":"LongRunningFunctionTool"},{"p":"com.google.adk.agents","l":"LoopAgent"},{"p":"com.google.adk.agents","l":"LoopAgentConfig"},{"p":"com.google.adk.planner","l":"LoopPlanner"},{"p":"com.google.adk.models.springai.error","l":"SpringAIErrorMapper.MappedError"},{"p":"com.google.adk.tools.mcp","l":"McpAsyncTool"},{"p":"com.google.adk.tools.mcp","l":"McpAsyncToolset"},{"p":"com.example.mcpfilesystem","l":"McpFilesystemAgent"},{"p":"com.example.mcpfilesystem","l":"McpFilesystemRun"},{"p":"com.google.adk.tools.mcp","l":"McpToolsetException.McpInitializationException","k":"13"},{"p":"com.google.adk.tools.mcp","l":"McpSessionManager"},{"p":"com.google.adk.tools.mcp","l":"McpTool"},{"p":"com.google.adk.tools.mcp","l":"McpToolException.McpToolDeclarationException","k":"13"},{"p":"com.google.adk.tools.mcp","l":"McpToolException","k":"13"},{"p":"com.google.adk.tools.mcp","l":"McpToolsetException.McpToolLoadingException","k":"13"},{"p":"com.google.adk.tools.mcp","l":"McpToolset"},{"p":"com.google.adk.tools.mcp","l":"McpToolset.McpToolsetConfig"},{"p":"com.google.adk.tools.mcp","l":"McpToolsetException","k":"13"},{"p":"com.google.adk.tools.mcp","l":"McpTransportBuilder","k":"10"},{"p":"com.google.adk.memory","l":"MemoryEntry"},{"p":"com.google.adk.models.springai","l":"MessageConversionException","k":"13"},{"p":"com.google.adk.models.springai","l":"MessageConverter"},{"p":"com.google.adk.telemetry","l":"Metrics"},{"p":"com.google.adk.models","l":"Model"},{"p":"com.google.adk.utils","l":"ModelNameUtils"},{"p":"com.google.adk.tools","l":"NamedToolPredicate"},{"p":"com.google.adk.agents","l":"PlannerAction.NoOp","k":"11"},{"p":"com.google.adk.models.springai.properties","l":"SpringAIProperties.Observability"},{"p":"com.google.adk.agents","l":"Callbacks.OnModelErrorCallback","k":"10"},{"p":"com.google.adk.agents","l":"Callbacks.OnModelErrorCallbackSync","k":"10"},{"p":"com.google.adk.agents","l":"Callbacks.OnToolErrorCallback","k":"10"},{"p":"com.google.adk.agents","l":"Callbacks.OnToolErrorCallbackSync","k":"10"},{"p":"com.google.adk.web.config","l":"OpenTelemetryConfig"},{"p":"com.google.adk.a2a.executor","l":"AgentExecutorConfig.OutputMode","k":"9"},{"p":"com.google.adk.flows.llmflows","l":"OutputSchema"},{"p":"com.google.adk.planner.p2p","l":"P2PPlanner"},{"p":"com.google.adk.utils","l":"Pairs"},{"p":"com.google.adk.agents","l":"ParallelAgent"},{"p":"com.google.adk.agents","l":"ParallelAgentConfig"},{"p":"com.google.adk.planner","l":"ParallelPlanner"},{"p":"com.google.adk.a2a.converters","l":"PartConverter"},{"p":"com.google.adk.flows.llmflows","l":"PersistBarrier"},{"p":"com.google.adk.agents","l":"Planner","k":"10"},{"p":"com.google.adk.agents","l":"PlannerAction","k":"10"},{"p":"com.google.adk.agents","l":"PlannerAgent"},{"p":"com.google.adk.agents","l":"PlanningContext"},{"p":"com.google.adk.plugins","l":"Plugin","k":"10"},{"p":"com.google.adk.plugins","l":"PluginManager"},{"p":"com.google.adk.agents","l":"Instruction.Provider","k":"11"},{"p":"com.google.adk.agents","l":"ReadonlyContext"},{"p":"com.google.adk.plugins.recordings","l":"Recording"},{"p":"com.google.adk.plugins.recordings","l":"Recordings"},{"p":"com.google.adk.plugins.recordings","l":"RecordingsLoader"},{"p":"com.google.adk.a2a.agent","l":"RemoteA2AAgent"},{"p":"com.google.adk.planner.goap","l":"ReplanPolicy.Replan","k":"11"},{"p":"com.google.adk.planner.goap","l":"ReplanPolicy","k":"10"},{"p":"com.google.adk.plugins","l":"ReplayConfigError","k":"13"},{"p":"com.google.adk.plugins","l":"ReplayPlugin"},{"p":"com.google.adk.plugins","l":"ReplayVerificationError","k":"13"},{"p":"com.google.adk.flows.llmflows","l":"RequestConfirmationLlmRequestProcessor"},{"p":"com.google.adk.models.springai.observability","l":"SpringAIObservabilityHandler.RequestContext"},{"p":"com.google.adk.flows.llmflows","l":"RequestProcessor.RequestProcessingResult"},{"p":"com.google.adk.flows.llmflows","l":"RequestProcessor","k":"10"},{"p":"com.google.adk.a2a.converters","l":"ResponseConverter"},{"p":"com.google.adk.flows.llmflows","l":"ResponseProcessor.ResponseProcessingResult"},{"p":"com.google.adk.flows.llmflows","l":"ResponseProcessor","k":"10"},{"p":"com.google.adk.apps","l":"ResumabilityConfig"},{"p":"com.google.adk.plugins.agentanalytics","l":"BigQueryLoggerConfig.RetryConfig"},{"p":"com.google.adk.models.springai.error","l":"SpringAIErrorMapper.RetryStrategy","k":"9"},{"p":"com.google.adk.agents","l":"PlannerAction.RunAgents","k":"11"},{"p":"com.google.adk.agents","l":"RunConfig"},{"p":"com.google.adk.web.dto","l":"RunEvalRequest"},{"p":"com.google.adk.web.dto","l":"RunEvalResult"},{"p":"com.google.adk.runner","l":"Runner"},{"p":"com.google.adk.web.service","l":"RunnerService"},{"p":"com.google.adk.tools","l":"Annotations.Schema","k":"8"},{"p":"com.google.adk","l":"SchemaUtils"},{"p":"com.google.adk.memory","l":"SearchMemoryResponse"},{"p":"com.google.adk.planner.goap","l":"SearchStrategy","k":"10"},{"p":"com.google.adk.agents","l":"SequentialAgent"},{"p":"com.google.adk.agents","l":"SequentialAgentConfig"},{"p":"com.google.adk.planner","l":"SequentialPlanner"},{"p":"com.google.adk.sessions","l":"Session"},{"p":"com.google.adk.web.controller","l":"SessionController"},{"p":"com.google.adk.sessions","l":"SessionException","k":"13"},{"p":"com.google.adk.sessions","l":"SessionKey"},{"p":"com.google.adk.sessions","l":"SessionNotFoundException","k":"13"},{"p":"com.google.adk.web.dto","l":"SessionRequest"},{"p":"com.google.adk.sessions","l":"SessionUtils"},{"p":"com.google.adk.tools","l":"SetModelResponseTool"},{"p":"com.example.adkprtriaging","l":"Settings"},{"p":"com.example.adkspam","l":"Settings"},{"p":"com.example.adkstale","l":"Settings"},{"p":"com.example.adktriaging","l":"Settings"},{"p":"com.google.adk.flows.llmflows","l":"SingleFlow"},{"p":"com.google.adk.skills","l":"InMemorySkillSource.Builder.SkillBuilder"},{"p":"com.google.adk.skills","l":"AbstractSkillSource.SkillMdPath"},{"p":"com.google.adk.skills","l":"SkillSource","k":"10"},{"p":"com.google.adk.skills","l":"SkillSourceException","k":"13"},{"p":"com.google.adk.tools.skills","l":"SkillToolset"},{"p":"com.google.adk.summarizer","l":"SlidingWindowEventCompactor"},{"p":"com.example.adkspam","l":"SpamDetectionAgent"},{"p":"com.example.adkspam","l":"SpamDetectionAgentRun"},{"p":"com.google.adk.flows.llmflows.audio","l":"SpeechClientInterface","k":"10"},{"p":"com.google.adk.models.springai","l":"SpringAI"},{"p":"com.google.adk.models.springai.autoconfigure","l":"SpringAIAutoConfiguration"},{"p":"com.google.adk.models.springai","l":"SpringAIEmbedding"},{"p":"com.google.adk.models.springai.error","l":"SpringAIErrorMapper"},{"p":"com.google.adk.models.springai.observability","l":"SpringAIObservabilityHandler"},{"p":"com.google.adk.models.springai.properties","l":"SpringAIProperties"},{"p":"com.google.adk.tools.mcp","l":"SseServerParameters"},{"p":"com.google.adk.samples.a2aagent","l":"StartupConfig"},{"p":"com.google.adk.sessions","l":"State"},{"p":"com.google.adk.agents","l":"Instruction.Static","k":"11"},{"p":"com.google.adk.tools.mcp","l":"StdioConnectionParameters"},{"p":"com.google.adk.tools.mcp","l":"StdioServerParameters"},{"p":"com.google.adk.tools.mcp","l":"StreamableHttpServerParameters"},{"p":"com.google.adk.agents","l":"RunConfig.StreamingMode","k":"9"},{"p":"com.google.adk.models.springai","l":"StreamingResponseAggregator"},{"p":"com.google.adk.planner","l":"SupervisorPlanner"},{"p":"com.google.adk.summarizer","l":"TailRetentionEventCompactor"},{"p":"com.google.adk.telemetry","l":"Instrumentation.TelemetryContext"},{"p":"com.google.adk.tools","l":"BaseTool.ToolArgsConfig"},{"p":"com.google.adk.tools","l":"BaseTool.ToolConfig"},{"p":"com.google.adk.events","l":"ToolConfirmation"},{"p":"com.google.adk.tools","l":"ToolContext"},{"p":"com.google.adk.models.springai","l":"ToolConverter"},{"p":"com.google.adk.telemetry","l":"Instrumentation.ToolExecution"},{"p":"com.google.adk.agents","l":"RunConfig.ToolExecutionMode","k":"9"},{"p":"com.google.adk.models.springai","l":"ToolConverter.ToolMetadata"},{"p":"com.google.adk.tools","l":"ToolPredicate","k":"10"},{"p":"com.google.adk.plugins.recordings","l":"ToolRecording"},{"p":"com.google.adk.plugins.agentanalytics","l":"TraceManager"},{"p":"com.google.adk.telemetry","l":"Tracing.TracerProvider"},{"p":"com.google.adk.telemetry","l":"Tracing"},{"p":"com.google.adk.a2a.agent","l":"RemoteA2AAgent.TypeError","k":"13"},{"p":"com.google.adk.tools","l":"UrlContextTool"},{"p":"com.google.adk.models.springai.properties","l":"SpringAIProperties.Validation"},{"p":"com.google.adk","l":"Version"},{"p":"com.google.adk.codeexecutors","l":"VertexAiCodeExecutor"},{"p":"com.google.adk.tools.retrieval","l":"VertexAiRagRetrieval"},{"p":"com.google.adk.tools","l":"VertexAiSearchAgentTool"},{"p":"com.google.adk.tools","l":"VertexAiSearchTool"},{"p":"com.google.adk.sessions","l":"VertexAiSessionService"},{"p":"com.google.adk.models","l":"VertexCredentials"},{"p":"com.google.adk.flows.llmflows.audio","l":"VertexSpeechClient"},{"p":"com.google.adk.maven","l":"WebMojo"},{"p":"com.google.adk.web.websocket","l":"WebSocketConfig"}];updateSearchResults();
\ No newline at end of file
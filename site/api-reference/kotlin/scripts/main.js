@@ -0,0 +1,44 @@
+(()=>{var e={8527:e=>{e.exports='<svg xmlns="http://www.w3.org/2000/svg" width="16" height="16" viewBox="0 0 16 16"><path d="M6.16 14.41L1.37 9.66l1.26-1.28 3.24 3.21L13.23.5l1.5 1-8.57 12.91z"/></svg>'},5570:e=>{e.exports='<svg xmlns="http://www.w3.org/2000/svg" width="10" height="10" viewBox="0 0 10 10"><path d="M5 7.99L1.5 4.5l1-1L5 6.01 7.5 3.5l.99 1L5 7.99z"/></svg>'},107:e=>{e.exports='<svg xmlns="http://www.w3.org/2000/svg" width="16" height="16" viewBox="0 0 16 16"><path d="M13.63 3.65l-1.28-1.27L8 6.73 3.64 2.38 2.37 3.65l4.35 4.36-4.34 4.34 1.27 1.28L8 9.28l4.35 4.36 1.28-1.28-4.36-4.35 4.36-4.36z"/></svg>'},7224:e=>{e.exports='<svg xmlns="http://www.w3.org/2000/svg" width="10" height="10" viewBox="0 0 10 10"><path d="M1 4.1h8v1.8H1z"/></svg>'},538:e=>{e.exports='<svg xmlns="http://www.w3.org/2000/svg" width="16" height="16" viewBox="0 0 16 16"><path d="M14.64 13.36l-4.51-4.51A4.94 4.94 0 0 0 11 6a5 5 0 1 0-2.17 4.12l4.51 4.51zM2.42 6A3.6 3.6 0 1 1 6 9.61 3.6 3.6 0 0 1 2.42 6z"/></svg>'},1924:(e,n,t)=>{"use strict";var r=t(210),o=t(5559),i=o(r("String.prototype.indexOf"));e.exports=function(e,n){var t=r(e,!!n);return"function"==typeof t&&i(e,".prototype.")>-1?o(t):t}},5559:(e,n,t)=>{"use strict";var r=t(8612),o=t(210),i=o("%Function.prototype.apply%"),a=o("%Function.prototype.call%"),l=o("%Reflect.apply%",!0)||r.call(a,i),c=o("%Object.getOwnPropertyDescriptor%",!0),u=o("%Object.defineProperty%",!0),s=o("%Math.max%");if(u)try{u({},"a",{value:1})}catch(e){u=null}e.exports=function(e){var n=l(r,a,arguments);if(c&&u){var t=c(n,"length");t.configurable&&u(n,"length",{value:1+s(0,e.length-(arguments.length-1))})}return n};var f=function(){return l(r,i,arguments)};u?u(e.exports,"apply",{value:f}):e.exports.apply=f},4184:(e,n)=>{var t;
+/*!
+  Copyright (c) 2018 Jed Watson.
+  Licensed under the MIT License (MIT), see
+  http://jedwatson.github.io/classnames
+*/!function(){"use strict";var r={}.hasOwnProperty;function o(){for(var e=[],n=0;n<arguments.length;n++){var t=arguments[n];if(t){var i=typeof t;if("string"===i||"number"===i)e.push(t);else if(Array.isArray(t)){if(t.length){var a=o.apply(null,t);a&&e.push(a)}}else if("object"===i)if(t.toString===Object.prototype.toString)for(var l in t)r.call(t,l)&&t[l]&&e.push(l);else e.push(t.toString())}}return e.join(" ")}e.exports?(o.default=o,e.exports=o):void 0===(t=function(){return o}.apply(n,[]))||(e.exports=t)}()},8736:(e,n,t)=>{"use strict";e.exports=function(e,n){var t=this,r=t.constructor;return t.options=Object.assign({storeInstancesGlobally:!0},n||{}),t.callbacks={},t.directMap={},t.sequenceLevels={},t.resetTimer=null,t.ignoreNextKeyup=!1,t.ignoreNextKeypress=!1,t.nextExpectedAction=!1,t.element=e,t.addEvents(),t.options.storeInstancesGlobally&&r.instances.push(t),t},e.exports.prototype.bind=t(2207),e.exports.prototype.bindMultiple=t(3396),e.exports.prototype.unbind=t(9208),e.exports.prototype.trigger=t(9855),e.exports.prototype.reset=t(6214),e.exports.prototype.stopCallback=t(3450),e.exports.prototype.handleKey=t(3067),e.exports.prototype.addEvents=t(718),e.exports.prototype.bindSingle=t(8763),e.exports.prototype.getKeyInfo=t(5825),e.exports.prototype.pickBestAction=t(8608),e.exports.prototype.getReverseMap=t(3956),e.exports.prototype.getMatches=t(3373),e.exports.prototype.resetSequences=t(3346),e.exports.prototype.fireCallback=t(2684),e.exports.prototype.bindSequence=t(7103),e.exports.prototype.resetSequenceTimer=t(7309),e.exports.prototype.detach=t(7554),e.exports.instances=[],e.exports.reset=t(1822),e.exports.REVERSE_MAP=null},718:(e,n,t)=>{"use strict";e.exports=function(){var e=this,n=t(4323),r=e.element;e.eventHandler=t(9646).bind(e),n(r,"keypress",e.eventHandler),n(r,"keydown",e.eventHandler),n(r,"keyup",e.eventHandler)}},2207:e=>{"use strict";e.exports=function(e,n,t){return e=e instanceof Array?e:[e],this.bindMultiple(e,n,t),this}},3396:e=>{"use strict";e.exports=function(e,n,t){for(var r=0;r<e.length;++r)this.bindSingle(e[r],n,t)}},7103:(e,n,t)=>{"use strict";e.exports=function(e,n,r,o){var i=this;function a(n){return function(){i.nextExpectedAction=n,++i.sequenceLevels[e],i.resetSequenceTimer()}}function l(n){var a;i.fireCallback(r,n,e),"keyup"!==o&&(a=t(6770),i.ignoreNextKeyup=a(n)),setTimeout((function(){i.resetSequences()}),10)}i.sequenceLevels[e]=0;for(var c=0;c<n.length;++c){var u=c+1===n.length?l:a(o||i.getKeyInfo(n[c+1]).action);i.bindSingle(n[c],u,o,e,c)}}},8763:e=>{"use strict";e.exports=function(e,n,t,r,o){var i=this;i.directMap[e+":"+t]=n;var a,l=(e=e.replace(/\s+/g," ")).split(" ");l.length>1?i.bindSequence(e,l,n,t):(a=i.getKeyInfo(e,t),i.callbacks[a.key]=i.callbacks[a.key]||[],i.getMatches(a.key,a.modifiers,{type:a.action},r,e,o),i.callbacks[a.key][r?"unshift":"push"]({callback:n,modifiers:a.modifiers,action:a.action,seq:r,level:o,combo:e}))}},7554:(e,n,t)=>{var r=t(4323).off;e.exports=function(){var e=this,n=e.element;r(n,"keypress",e.eventHandler),r(n,"keydown",e.eventHandler),r(n,"keyup",e.eventHandler)}},4323:e=>{function n(e,n,t,r){return!e.addEventListener&&(n="on"+n),(e.addEventListener||e.attachEvent).call(e,n,t,r),t}e.exports=n,e.exports.on=n,e.exports.off=function(e,n,t,r){return!e.removeEventListener&&(n="on"+n),(e.removeEventListener||e.detachEvent).call(e,n,t,r),t}},2684:(e,n,t)=>{"use strict";e.exports=function(e,n,r,o){this.stopCallback(n,n.target||n.srcElement,r,o)||!1===e(n,r)&&(t(1350)(n),t(6103)(n))}},5825:(e,n,t)=>{"use strict";e.exports=function(e,n){var r,o,i,a,l,c,u=[];for(r=t(4520)(e),a=t(7549),l=t(5355),c=t(8581),i=0;i<r.length;++i)a[o=r[i]]&&(o=a[o]),n&&"keypress"!==n&&l[o]&&(o=l[o],u.push("shift")),c(o)&&u.push(o);return{key:o,modifiers:u,action:n=this.pickBestAction(o,u,n)}}},3373:(e,n,t)=>{"use strict";e.exports=function(e,n,r,o,i,a){var l,c,u,s,f=this,p=[],d=r.type;"keypress"!==d||r.code&&"Arrow"===r.code.slice(0,5)||(f.callbacks["any-character"]||[]).forEach((function(e){p.push(e)}));if(!f.callbacks[e])return p;for(u=t(8581),"keyup"===d&&u(e)&&(n=[e]),l=0;l<f.callbacks[e].length;++l)if(c=f.callbacks[e][l],(o||!c.seq||f.sequenceLevels[c.seq]===c.level)&&d===c.action&&(s=t(5532),"keypress"===d&&!r.metaKey&&!r.ctrlKey||s(n,c.modifiers))){var h=!o&&c.combo===i,g=o&&c.seq===o&&c.level===a;(h||g)&&f.callbacks[e].splice(l,1),p.push(c)}return p}},3956:(e,n,t)=>{"use strict";e.exports=function(){var e,n=this.constructor;if(!n.REVERSE_MAP)for(var r in n.REVERSE_MAP={},e=t(4766))r>95&&r<112||e.hasOwnProperty(r)&&(n.REVERSE_MAP[e[r]]=r);return n.REVERSE_MAP}},3067:(e,n,t)=>{"use strict";e.exports=function(e,n,r){var o,i,a,l,c=this,u={},s=0,f=!1;for(o=c.getMatches(e,n,r),i=0;i<o.length;++i)o[i].seq&&(s=Math.max(s,o[i].level));for(i=0;i<o.length;++i)if(o[i].seq){if(o[i].level!==s)continue;f=!0,u[o[i].seq]=1,c.fireCallback(o[i].callback,r,o[i].combo,o[i].seq)}else f||c.fireCallback(o[i].callback,r,o[i].combo);l="keypress"===r.type&&c.ignoreNextKeypress,a=t(8581),r.type!==c.nextExpectedAction||a(e)||l||c.resetSequences(u),c.ignoreNextKeypress=f&&"keydown"===r.type}},9646:(e,n,t)=>{"use strict";e.exports=function(e){var n,r=this;"number"!=typeof e.which&&(e.which=e.keyCode);var o=t(6770)(e);void 0!==o&&("keyup"!==e.type||r.ignoreNextKeyup!==o?(n=t(4610),r.handleKey(o,n(e),e)):r.ignoreNextKeyup=!1)}},5532:e=>{"use strict";e.exports=function(e,n){return e.sort().join(",")===n.sort().join(",")}},8608:e=>{"use strict";e.exports=function(e,n,t){return t||(t=this.getReverseMap()[e]?"keydown":"keypress"),"keypress"===t&&n.length&&(t="keydown"),t}},6214:e=>{"use strict";e.exports=function(){return this.callbacks={},this.directMap={},this}},7309:e=>{"use strict";e.exports=function(){var e=this;clearTimeout(e.resetTimer),e.resetTimer=setTimeout((function(){e.resetSequences()}),1e3)}},3346:e=>{"use strict";e.exports=function(e){var n=this;e=e||{};var t,r=!1;for(t in n.sequenceLevels)e[t]?r=!0:n.sequenceLevels[t]=0;r||(n.nextExpectedAction=!1)}},3450:e=>{"use strict";e.exports=function(e,n){if((" "+n.className+" ").indexOf(" combokeys ")>-1)return!1;var t=n.tagName.toLowerCase();return"input"===t||"select"===t||"textarea"===t||n.isContentEditable}},9855:e=>{"use strict";e.exports=function(e,n){return this.directMap[e+":"+n]&&this.directMap[e+":"+n]({},e),this}},9208:e=>{"use strict";e.exports=function(e,n){return this.bind(e,(function(){}),n)}},1822:e=>{"use strict";e.exports=function(){this.instances.forEach((function(e){e.reset()}))}},6770:(e,n,t)=>{"use strict";e.exports=function(e){var n,r;if(n=t(4766),r=t(5295),"keypress"===e.type){var o=String.fromCharCode(e.which);return e.shiftKey||(o=o.toLowerCase()),o}return void 0!==n[e.which]?n[e.which]:void 0!==r[e.which]?r[e.which]:String.fromCharCode(e.which).toLowerCase()}},4610:e=>{"use strict";e.exports=function(e){var n=[];return e.shiftKey&&n.push("shift"),e.altKey&&n.push("alt"),e.ctrlKey&&n.push("ctrl"),e.metaKey&&n.push("meta"),n}},8581:e=>{"use strict";e.exports=function(e){return"shift"===e||"ctrl"===e||"alt"===e||"meta"===e}},4520:e=>{"use strict";e.exports=function(e){return"+"===e?["+"]:e.split("+")}},1350:e=>{"use strict";e.exports=function(e){e.preventDefault?e.preventDefault():e.returnValue=!1}},5355:e=>{"use strict";e.exports={"~":"`","!":"1","@":"2","#":"3",$:"4","%":"5","^":"6","&":"7","*":"8","(":"9",")":"0",_:"-","+":"=",":":";",'"':"'","<":",",">":".","?":"/","|":"\\"}},7549:e=>{"use strict";e.exports={option:"alt",command:"meta",return:"enter",escape:"esc",mod:/Mac|iPod|iPhone|iPad/.test(navigator.platform)?"meta":"ctrl"}},5295:e=>{"use strict";e.exports={106:"*",107:"plus",109:"minus",110:".",111:"/",186:";",187:"=",188:",",189:"-",190:".",191:"/",192:"`",219:"[",220:"\\",221:"]",222:"'"}},4766:e=>{"use strict";e.exports={8:"backspace",9:"tab",13:"enter",16:"shift",17:"ctrl",18:"alt",20:"capslock",27:"esc",32:"space",33:"pageup",34:"pagedown",35:"end",36:"home",37:"left",38:"up",39:"right",40:"down",45:"ins",46:"del",91:"meta",93:"meta",173:"minus",187:"plus",189:"minus",224:"meta"};for(var n=1;n<20;++n)e.exports[111+n]="f"+n;for(n=0;n<=9;++n)e.exports[n+96]=n},6103:e=>{"use strict";e.exports=function(e){e.stopPropagation?e.stopPropagation():e.cancelBubble=!0}},3362:()=>{var e;!function(){var e=Math.PI,n=2*e,t=e/180,r=document.createElement("div");document.head.appendChild(r);var o=self.ConicGradient=function(e){o.all.push(this),e=e||{},this.canvas=document.createElement("canvas"),this.context=this.canvas.getContext("2d"),this.repeating=!!e.repeating,this.size=e.size||Math.max(innerWidth,innerHeight),this.canvas.width=this.canvas.height=this.size;var n=e.stops;this.stops=(n||"").split(/\s*,(?![^(]*\))\s*/),this.from=0;for(var t=0;t<this.stops.length;t++)if(this.stops[t]){var r=this.stops[t]=new o.ColorStop(this,this.stops[t]);r.next&&(this.stops.splice(t+1,0,r.next),t++)}else this.stops.splice(t,1),t--;if(0==this.stops[0].color.indexOf("from")&&(this.from=360*this.stops[0].pos,this.stops.shift()),void 0===this.stops[0].pos)this.stops[0].pos=0;else if(this.stops[0].pos>0){var i=this.stops[0].clone();i.pos=0,this.stops.unshift(i)}if(void 0===this.stops[this.stops.length-1].pos)this.stops[this.stops.length-1].pos=1;else if(!this.repeating&&this.stops[this.stops.length-1].pos<1){var a=this.stops[this.stops.length-1].clone();a.pos=1,this.stops.push(a)}if(this.stops.forEach((function(e,n){if(void 0===e.pos){for(var t=n+1;this[t];t++)if(void 0!==this[t].pos){e.pos=this[n-1].pos+(this[t].pos-this[n-1].pos)/(t-n+1);break}}else n>0&&(e.pos=Math.max(e.pos,this[n-1].pos))}),this.stops),this.repeating){var l=(n=this.stops.slice())[n.length-1].pos-n[0].pos;for(t=0;this.stops[this.stops.length-1].pos<1&&t<1e4;t++)for(var c=0;c<n.length;c++){var u=n[c].clone();u.pos+=(t+1)*l,this.stops.push(u)}}this.paint()};o.all=[],o.prototype={toString:function(){return"url('"+this.dataURL+"')"},get dataURL(){return"data:image/svg+xml,"+encodeURIComponent(this.svg)},get blobURL(){return URL.createObjectURL(new Blob([this.svg],{type:"image/svg+xml"}))},get svg(){return'<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" preserveAspectRatio="none"><svg viewBox="0 0 100 100" preserveAspectRatio="xMidYMid slice"><image width="100" height="100%" xlink:href="'+this.png+'" /></svg></svg>'},get png(){return this.canvas.toDataURL()},get r(){return Math.sqrt(2)*this.size/2},paint:function(){var e,n,r,o=this.context,i=this.r,a=this.size/2,l=0,c=this.stops[l];o.translate(this.size/2,this.size/2),o.rotate(-90*t),o.rotate(this.from*t),o.translate(-this.size/2,-this.size/2);for(var u=0;u<360;){if(u/360+1e-5>=c.pos){do{e=c,l++,c=this.stops[l]}while(c&&c!=e&&c.pos===e.pos);if(!c)break;var s=e.color+""==c.color+""&&e!=c;n=e.color.map((function(e,n){return c.color[n]-e}))}r=(u/360-e.pos)/(c.pos-e.pos);var f=s?c.color:n.map((function(n,t){var o=n*r+e.color[t];return t<3?255&o:o}));if(o.fillStyle="rgba("+f.join(",")+")",o.beginPath(),o.moveTo(a,a),s)var p=360*(c.pos-e.pos);else p=.5;var d=u*t,h=(d=Math.min(360*t,d))+p*t;h=Math.min(360*t,h+.02),o.arc(a,a,i,d,h),o.closePath(),o.fill(),u+=p}}},o.ColorStop=function(e,t){if(this.gradient=e,t){var r=t.match(/^(.+?)(?:\s+([\d.]+)(%|deg|turn|grad|rad)?)?(?:\s+([\d.]+)(%|deg|turn|grad|rad)?)?\s*$/);if(this.color=o.ColorStop.colorToRGBA(r[1]),r[2]){var i=r[3];"%"==i||"0"===r[2]&&!i?this.pos=r[2]/100:"turn"==i?this.pos=+r[2]:"deg"==i?this.pos=r[2]/360:"grad"==i?this.pos=r[2]/400:"rad"==i&&(this.pos=r[2]/n)}r[4]&&(this.next=new o.ColorStop(e,r[1]+" "+r[4]+r[5]))}},o.ColorStop.prototype={clone:function(){var e=new o.ColorStop(this.gradient);return e.color=this.color,e.pos=this.pos,e},toString:function(){return"rgba("+this.color.join(", ")+") "+100*this.pos+"%"}},o.ColorStop.colorToRGBA=function(e){if(!Array.isArray(e)&&-1==e.indexOf("from")){r.style.color=e;var n=getComputedStyle(r).color.match(/rgba?\(([\d.]+), ([\d.]+), ([\d.]+)(?:, ([\d.]+))?\)/);return n&&(n.shift(),(n=n.map((function(e){return+e})))[3]=isNaN(n[3])?1:n[3]),n||[0,0,0,0]}return e}}(),self.StyleFix&&((e=document.createElement("p")).style.backgroundImage="conic-gradient(white, black)",e.style.backgroundImage=PrefixFree.prefix+"conic-gradient(white, black)",e.style.backgroundImage||StyleFix.register((function(e,n){return e.indexOf("conic-gradient")>-1&&(e=e.replace(/(?:repeating-)?conic-gradient\(\s*((?:\([^()]+\)|[^;()}])+?)\)/g,(function(e,n){return new ConicGradient({stops:n,repeating:e.indexOf("repeating-")>-1})}))),e})))},9662:(e,n,t)=>{var r=t(7854),o=t(614),i=t(6330),a=r.TypeError;e.exports=function(e){if(o(e))return e;throw a(i(e)+" is not a function")}},9483:(e,n,t)=>{var r=t(7854),o=t(4411),i=t(6330),a=r.TypeError;e.exports=function(e){if(o(e))return e;throw a(i(e)+" is not a constructor")}},6077:(e,n,t)=>{var r=t(7854),o=t(614),i=r.String,a=r.TypeError;e.exports=function(e){if("object"==typeof e||o(e))return e;throw a("Can't set "+i(e)+" as a prototype")}},1223:(e,n,t)=>{var r=t(5112),o=t(30),i=t(3070),a=r("unscopables"),l=Array.prototype;null==l[a]&&i.f(l,a,{configurable:!0,value:o(null)}),e.exports=function(e){l[a][e]=!0}},1530:(e,n,t)=>{"use strict";var r=t(8710).charAt;e.exports=function(e,n,t){return n+(t?r(e,n).length:1)}},5787:(e,n,t)=>{var r=t(7854),o=t(7976),i=r.TypeError;e.exports=function(e,n){if(o(n,e))return e;throw i("Incorrect invocation")}},9670:(e,n,t)=>{var r=t(7854),o=t(111),i=r.String,a=r.TypeError;e.exports=function(e){if(o(e))return e;throw a(i(e)+" is not an object")}},7556:(e,n,t)=>{var r=t(7293);e.exports=r((function(){if("function"==typeof ArrayBuffer){var e=new ArrayBuffer(8);Object.isExtensible(e)&&Object.defineProperty(e,"a",{value:8})}}))},8533:(e,n,t)=>{"use strict";var r=t(2092).forEach,o=t(9341)("forEach");e.exports=o?[].forEach:function(e){return r(this,e,arguments.length>1?arguments[1]:void 0)}},8457:(e,n,t)=>{"use strict";var r=t(7854),o=t(9974),i=t(6916),a=t(7908),l=t(3411),c=t(7659),u=t(4411),s=t(6244),f=t(6135),p=t(8554),d=t(1246),h=r.Array;e.exports=function(e){var n=a(e),t=u(this),r=arguments.length,g=r>1?arguments[1]:void 0,v=void 0!==g;v&&(g=o(g,r>2?arguments[2]:void 0));var A,b,m,y,E,_,C=d(n),w=0;if(!C||this==h&&c(C))for(A=s(n),b=t?new this(A):h(A);A>w;w++)_=v?g(n[w],w):n[w],f(b,w,_);else for(E=(y=p(n,C)).next,b=t?new this:[];!(m=i(E,y)).done;w++)_=v?l(y,g,[m.value,w],!0):m.value,f(b,w,_);return b.length=w,b}},1318:(e,n,t)=>{var r=t(5656),o=t(1400),i=t(6244),a=function(e){return function(n,t,a){var l,c=r(n),u=i(c),s=o(a,u);if(e&&t!=t){for(;u>s;)if((l=c[s++])!=l)return!0}else for(;u>s;s++)if((e||s in c)&&c[s]===t)return e||s||0;return!e&&-1}};e.exports={includes:a(!0),indexOf:a(!1)}},2092:(e,n,t)=>{var r=t(9974),o=t(1702),i=t(8361),a=t(7908),l=t(6244),c=t(5417),u=o([].push),s=function(e){var n=1==e,t=2==e,o=3==e,s=4==e,f=6==e,p=7==e,d=5==e||f;return function(h,g,v,A){for(var b,m,y=a(h),E=i(y),_=r(g,v),C=l(E),w=0,x=A||c,k=n?x(h,C):t||p?x(h,0):void 0;C>w;w++)if((d||w in E)&&(m=_(b=E[w],w,y),e))if(n)k[w]=m;else if(m)switch(e){case 3:return!0;case 5:return b;case 6:return w;case 2:u(k,b)}else switch(e){case 4:return!1;case 7:u(k,b)}return f?-1:o||s?s:k}};e.exports={forEach:s(0),map:s(1),filter:s(2),some:s(3),every:s(4),find:s(5),findIndex:s(6),filterReject:s(7)}},1194:(e,n,t)=>{var r=t(7293),o=t(5112),i=t(7392),a=o("species");e.exports=function(e){return i>=51||!r((function(){var n=[];return(n.constructor={})[a]=function(){return{foo:1}},1!==n[e](Boolean).foo}))}},9341:(e,n,t)=>{"use strict";var r=t(7293);e.exports=function(e,n){var t=[][e];return!!t&&r((function(){t.call(null,n||function(){throw 1},1)}))}},3671:(e,n,t)=>{var r=t(7854),o=t(9662),i=t(7908),a=t(8361),l=t(6244),c=r.TypeError,u=function(e){return function(n,t,r,u){o(t);var s=i(n),f=a(s),p=l(s),d=e?p-1:0,h=e?-1:1;if(r<2)for(;;){if(d in f){u=f[d],d+=h;break}if(d+=h,e?d<0:p<=d)throw c("Reduce of empty array with no initial value")}for(;e?d>=0:p>d;d+=h)d in f&&(u=t(u,f[d],d,s));return u}};e.exports={left:u(!1),right:u(!0)}},206:(e,n,t)=>{var r=t(1702);e.exports=r([].slice)},4362:(e,n,t)=>{var r=t(206),o=Math.floor,i=function(e,n){var t=e.length,c=o(t/2);return t<8?a(e,n):l(e,i(r(e,0,c),n),i(r(e,c),n),n)},a=function(e,n){for(var t,r,o=e.length,i=1;i<o;){for(r=i,t=e[i];r&&n(e[r-1],t)>0;)e[r]=e[--r];r!==i++&&(e[r]=t)}return e},l=function(e,n,t,r){for(var o=n.length,i=t.length,a=0,l=0;a<o||l<i;)e[a+l]=a<o&&l<i?r(n[a],t[l])<=0?n[a++]:t[l++]:a<o?n[a++]:t[l++];return e};e.exports=i},7475:(e,n,t)=>{var r=t(7854),o=t(3157),i=t(4411),a=t(111),l=t(5112)("species"),c=r.Array;e.exports=function(e){var n;return o(e)&&(n=e.constructor,(i(n)&&(n===c||o(n.prototype))||a(n)&&null===(n=n[l]))&&(n=void 0)),void 0===n?c:n}},5417:(e,n,t)=>{var r=t(7475);e.exports=function(e,n){return new(r(e))(0===n?0:n)}},3411:(e,n,t)=>{var r=t(9670),o=t(9212);e.exports=function(e,n,t,i){try{return i?n(r(t)[0],t[1]):n(t)}catch(n){o(e,"throw",n)}}},7072:(e,n,t)=>{var r=t(5112)("iterator"),o=!1;try{var i=0,a={next:function(){return{done:!!i++}},return:function(){o=!0}};a[r]=function(){return this},Array.from(a,(function(){throw 2}))}catch(e){}e.exports=function(e,n){if(!n&&!o)return!1;var t=!1;try{var i={};i[r]=function(){return{next:function(){return{done:t=!0}}}},e(i)}catch(e){}return t}},4326:(e,n,t)=>{var r=t(1702),o=r({}.toString),i=r("".slice);e.exports=function(e){return i(o(e),8,-1)}},648:(e,n,t)=>{var r=t(7854),o=t(1694),i=t(614),a=t(4326),l=t(5112)("toStringTag"),c=r.Object,u="Arguments"==a(function(){return arguments}());e.exports=o?a:function(e){var n,t,r;return void 0===e?"Undefined":null===e?"Null":"string"==typeof(t=function(e,n){try{return e[n]}catch(e){}}(n=c(e),l))?t:u?a(n):"Object"==(r=a(n))&&i(n.callee)?"Arguments":r}},5631:(e,n,t)=>{"use strict";var r=t(3070).f,o=t(30),i=t(2248),a=t(9974),l=t(5787),c=t(408),u=t(654),s=t(6340),f=t(9781),p=t(2423).fastKey,d=t(9909),h=d.set,g=d.getterFor;e.exports={getConstructor:function(e,n,t,u){var s=e((function(e,r){l(e,d),h(e,{type:n,index:o(null),first:void 0,last:void 0,size:0}),f||(e.size=0),null!=r&&c(r,e[u],{that:e,AS_ENTRIES:t})})),d=s.prototype,v=g(n),A=function(e,n,t){var r,o,i=v(e),a=b(e,n);return a?a.value=t:(i.last=a={index:o=p(n,!0),key:n,value:t,previous:r=i.last,next:void 0,removed:!1},i.first||(i.first=a),r&&(r.next=a),f?i.size++:e.size++,"F"!==o&&(i.index[o]=a)),e},b=function(e,n){var t,r=v(e),o=p(n);if("F"!==o)return r.index[o];for(t=r.first;t;t=t.next)if(t.key==n)return t};return i(d,{clear:function(){for(var e=v(this),n=e.index,t=e.first;t;)t.removed=!0,t.previous&&(t.previous=t.previous.next=void 0),delete n[t.index],t=t.next;e.first=e.last=void 0,f?e.size=0:this.size=0},delete:function(e){var n=this,t=v(n),r=b(n,e);if(r){var o=r.next,i=r.previous;delete t.index[r.index],r.removed=!0,i&&(i.next=o),o&&(o.previous=i),t.first==r&&(t.first=o),t.last==r&&(t.last=i),f?t.size--:n.size--}return!!r},forEach:function(e){for(var n,t=v(this),r=a(e,arguments.length>1?arguments[1]:void 0);n=n?n.next:t.first;)for(r(n.value,n.key,this);n&&n.removed;)n=n.previous},has:function(e){return!!b(this,e)}}),i(d,t?{get:function(e){var n=b(this,e);return n&&n.value},set:function(e,n){return A(this,0===e?0:e,n)}}:{add:function(e){return A(this,e=0===e?0:e,e)}}),f&&r(d,"size",{get:function(){return v(this).size}}),s},setStrong:function(e,n,t){var r=n+" Iterator",o=g(n),i=g(r);u(e,n,(function(e,n){h(this,{type:r,target:e,state:o(e),kind:n,last:void 0})}),(function(){for(var e=i(this),n=e.kind,t=e.last;t&&t.removed;)t=t.previous;return e.target&&(e.last=t=t?t.next:e.state.first)?"keys"==n?{value:t.key,done:!1}:"values"==n?{value:t.value,done:!1}:{value:[t.key,t.value],done:!1}:(e.target=void 0,{value:void 0,done:!0})}),t?"entries":"values",!t,!0),s(n)}}},9320:(e,n,t)=>{"use strict";var r=t(1702),o=t(2248),i=t(2423).getWeakData,a=t(9670),l=t(111),c=t(5787),u=t(408),s=t(2092),f=t(2597),p=t(9909),d=p.set,h=p.getterFor,g=s.find,v=s.findIndex,A=r([].splice),b=0,m=function(e){return e.frozen||(e.frozen=new y)},y=function(){this.entries=[]},E=function(e,n){return g(e.entries,(function(e){return e[0]===n}))};y.prototype={get:function(e){var n=E(this,e);if(n)return n[1]},has:function(e){return!!E(this,e)},set:function(e,n){var t=E(this,e);t?t[1]=n:this.entries.push([e,n])},delete:function(e){var n=v(this.entries,(function(n){return n[0]===e}));return~n&&A(this.entries,n,1),!!~n}},e.exports={getConstructor:function(e,n,t,r){var s=e((function(e,o){c(e,p),d(e,{type:n,id:b++,frozen:void 0}),null!=o&&u(o,e[r],{that:e,AS_ENTRIES:t})})),p=s.prototype,g=h(n),v=function(e,n,t){var r=g(e),o=i(a(n),!0);return!0===o?m(r).set(n,t):o[r.id]=t,e};return o(p,{delete:function(e){var n=g(this);if(!l(e))return!1;var t=i(e);return!0===t?m(n).delete(e):t&&f(t,n.id)&&delete t[n.id]},has:function(e){var n=g(this);if(!l(e))return!1;var t=i(e);return!0===t?m(n).has(e):t&&f(t,n.id)}}),o(p,t?{get:function(e){var n=g(this);if(l(e)){var t=i(e);return!0===t?m(n).get(e):t?t[n.id]:void 0}},set:function(e,n){return v(this,e,n)}}:{add:function(e){return v(this,e,!0)}}),s}}},7710:(e,n,t)=>{"use strict";var r=t(2109),o=t(7854),i=t(1702),a=t(4705),l=t(1320),c=t(2423),u=t(408),s=t(5787),f=t(614),p=t(111),d=t(7293),h=t(7072),g=t(8003),v=t(9587);e.exports=function(e,n,t){var A=-1!==e.indexOf("Map"),b=-1!==e.indexOf("Weak"),m=A?"set":"add",y=o[e],E=y&&y.prototype,_=y,C={},w=function(e){var n=i(E[e]);l(E,e,"add"==e?function(e){return n(this,0===e?0:e),this}:"delete"==e?function(e){return!(b&&!p(e))&&n(this,0===e?0:e)}:"get"==e?function(e){return b&&!p(e)?void 0:n(this,0===e?0:e)}:"has"==e?function(e){return!(b&&!p(e))&&n(this,0===e?0:e)}:function(e,t){return n(this,0===e?0:e,t),this})};if(a(e,!f(y)||!(b||E.forEach&&!d((function(){(new y).entries().next()})))))_=t.getConstructor(n,e,A,m),c.enable();else if(a(e,!0)){var x=new _,k=x[m](b?{}:-0,1)!=x,S=d((function(){x.has(1)})),O=h((function(e){new y(e)})),B=!b&&d((function(){for(var e=new y,n=5;n--;)e[m](n,n);return!e.has(-0)}));O||((_=n((function(e,n){s(e,E);var t=v(new y,e,_);return null!=n&&u(n,t[m],{that:t,AS_ENTRIES:A}),t}))).prototype=E,E.constructor=_),(S||B)&&(w("delete"),w("has"),A&&w("get")),(B||k)&&w(m),b&&E.clear&&delete E.clear}return C[e]=_,r({global:!0,forced:_!=y},C),g(_,e),b||t.setStrong(_,e,A),_}},9920:(e,n,t)=>{var r=t(2597),o=t(3887),i=t(1236),a=t(3070);e.exports=function(e,n){for(var t=o(n),l=a.f,c=i.f,u=0;u<t.length;u++){var s=t[u];r(e,s)||l(e,s,c(n,s))}}},4964:(e,n,t)=>{var r=t(5112)("match");e.exports=function(e){var n=/./;try{"/./"[e](n)}catch(t){try{return n[r]=!1,"/./"[e](n)}catch(e){}}return!1}},8544:(e,n,t)=>{var r=t(7293);e.exports=!r((function(){function e(){}return e.prototype.constructor=null,Object.getPrototypeOf(new e)!==e.prototype}))},4230:(e,n,t)=>{var r=t(1702),o=t(4488),i=t(1340),a=/"/g,l=r("".replace);e.exports=function(e,n,t,r){var c=i(o(e)),u="<"+n;return""!==t&&(u+=" "+t+'="'+l(i(r),a,"&quot;")+'"'),u+">"+c+"</"+n+">"}},4994:(e,n,t)=>{"use strict";var r=t(3383).IteratorPrototype,o=t(30),i=t(9114),a=t(8003),l=t(7497),c=function(){return this};e.exports=function(e,n,t){var u=n+" Iterator";return e.prototype=o(r,{next:i(1,t)}),a(e,u,!1,!0),l[u]=c,e}},8880:(e,n,t)=>{var r=t(9781),o=t(3070),i=t(9114);e.exports=r?function(e,n,t){return o.f(e,n,i(1,t))}:function(e,n,t){return e[n]=t,e}},9114:e=>{e.exports=function(e,n){return{enumerable:!(1&e),configurable:!(2&e),writable:!(4&e),value:n}}},6135:(e,n,t)=>{"use strict";var r=t(4948),o=t(3070),i=t(9114);e.exports=function(e,n,t){var a=r(n);a in e?o.f(e,a,i(0,t)):e[a]=t}},8709:(e,n,t)=>{"use strict";var r=t(7854),o=t(9670),i=t(2140),a=r.TypeError;e.exports=function(e){if(o(this),"string"===e||"default"===e)e="string";else if("number"!==e)throw a("Incorrect hint");return i(this,e)}},654:(e,n,t)=>{"use strict";var r=t(2109),o=t(6916),i=t(1913),a=t(6530),l=t(614),c=t(4994),u=t(9518),s=t(7674),f=t(8003),p=t(8880),d=t(1320),h=t(5112),g=t(7497),v=t(3383),A=a.PROPER,b=a.CONFIGURABLE,m=v.IteratorPrototype,y=v.BUGGY_SAFARI_ITERATORS,E=h("iterator"),_="keys",C="values",w="entries",x=function(){return this};e.exports=function(e,n,t,a,h,v,k){c(t,n,a);var S,O,B,I=function(e){if(e===h&&R)return R;if(!y&&e in j)return j[e];switch(e){case _:case C:case w:return function(){return new t(this,e)}}return function(){return new t(this)}},T=n+" Iterator",P=!1,j=e.prototype,z=j[E]||j["@@iterator"]||h&&j[h],R=!y&&z||I(h),M="Array"==n&&j.entries||z;if(M&&(S=u(M.call(new e)))!==Object.prototype&&S.next&&(i||u(S)===m||(s?s(S,m):l(S[E])||d(S,E,x)),f(S,T,!0,!0),i&&(g[T]=x)),A&&h==C&&z&&z.name!==C&&(!i&&b?p(j,"name",C):(P=!0,R=function(){return o(z,this)})),h)if(O={values:I(C),keys:v?R:I(_),entries:I(w)},k)for(B in O)(y||P||!(B in j))&&d(j,B,O[B]);else r({target:n,proto:!0,forced:y||P},O);return i&&!k||j[E]===R||d(j,E,R,{name:h}),g[n]=R,O}},7235:(e,n,t)=>{var r=t(857),o=t(2597),i=t(6061),a=t(3070).f;e.exports=function(e){var n=r.Symbol||(r.Symbol={});o(n,e)||a(n,e,{value:i.f(e)})}},9781:(e,n,t)=>{var r=t(7293);e.exports=!r((function(){return 7!=Object.defineProperty({},1,{get:function(){return 7}})[1]}))},317:(e,n,t)=>{var r=t(7854),o=t(111),i=r.document,a=o(i)&&o(i.createElement);e.exports=function(e){return a?i.createElement(e):{}}},8324:e=>{e.exports={CSSRuleList:0,CSSStyleDeclaration:0,CSSValueList:0,ClientRectList:0,DOMRectList:0,DOMStringList:0,DOMTokenList:1,DataTransferItemList:0,FileList:0,HTMLAllCollection:0,HTMLCollection:0,HTMLFormElement:0,HTMLSelectElement:0,MediaList:0,MimeTypeArray:0,NamedNodeMap:0,NodeList:1,PaintRequestList:0,Plugin:0,PluginArray:0,SVGLengthList:0,SVGNumberList:0,SVGPathSegList:0,SVGPointList:0,SVGStringList:0,SVGTransformList:0,SourceBufferList:0,StyleSheetList:0,TextTrackCueList:0,TextTrackList:0,TouchList:0}},8509:(e,n,t)=>{var r=t(317)("span").classList,o=r&&r.constructor&&r.constructor.prototype;e.exports=o===Object.prototype?void 0:o},8886:(e,n,t)=>{var r=t(8113).match(/firefox\/(\d+)/i);e.exports=!!r&&+r[1]},256:(e,n,t)=>{var r=t(8113);e.exports=/MSIE|Trident/.test(r)},5268:(e,n,t)=>{var r=t(4326),o=t(7854);e.exports="process"==r(o.process)},8113:(e,n,t)=>{var r=t(5005);e.exports=r("navigator","userAgent")||""},7392:(e,n,t)=>{var r,o,i=t(7854),a=t(8113),l=i.process,c=i.Deno,u=l&&l.versions||c&&c.version,s=u&&u.v8;s&&(o=(r=s.split("."))[0]>0&&r[0]<4?1:+(r[0]+r[1])),!o&&a&&(!(r=a.match(/Edge\/(\d+)/))||r[1]>=74)&&(r=a.match(/Chrome\/(\d+)/))&&(o=+r[1]),e.exports=o},8008:(e,n,t)=>{var r=t(8113).match(/AppleWebKit\/(\d+)\./);e.exports=!!r&&+r[1]},748:e=>{e.exports=["constructor","hasOwnProperty","isPrototypeOf","propertyIsEnumerable","toLocaleString","toString","valueOf"]},2109:(e,n,t)=>{var r=t(7854),o=t(1236).f,i=t(8880),a=t(1320),l=t(3505),c=t(9920),u=t(4705);e.exports=function(e,n){var t,s,f,p,d,h=e.target,g=e.global,v=e.stat;if(t=g?r:v?r[h]||l(h,{}):(r[h]||{}).prototype)for(s in n){if(p=n[s],f=e.noTargetGet?(d=o(t,s))&&d.value:t[s],!u(g?s:h+(v?".":"#")+s,e.forced)&&void 0!==f){if(typeof p==typeof f)continue;c(p,f)}(e.sham||f&&f.sham)&&i(p,"sham",!0),a(t,s,p,e)}}},7293:e=>{e.exports=function(e){try{return!!e()}catch(e){return!0}}},7007:(e,n,t)=>{"use strict";t(4916);var r=t(1702),o=t(1320),i=t(2261),a=t(7293),l=t(5112),c=t(8880),u=l("species"),s=RegExp.prototype;e.exports=function(e,n,t,f){var p=l(e),d=!a((function(){var n={};return n[p]=function(){return 7},7!=""[e](n)})),h=d&&!a((function(){var n=!1,t=/a/;return"split"===e&&((t={}).constructor={},t.constructor[u]=function(){return t},t.flags="",t[p]=/./[p]),t.exec=function(){return n=!0,null},t[p](""),!n}));if(!d||!h||t){var g=r(/./[p]),v=n(p,""[e],(function(e,n,t,o,a){var l=r(e),c=n.exec;return c===i||c===s.exec?d&&!a?{done:!0,value:g(n,t,o)}:{done:!0,value:l(t,n,o)}:{done:!1}}));o(String.prototype,e,v[0]),o(s,p,v[1])}f&&c(s[p],"sham",!0)}},6677:(e,n,t)=>{var r=t(7293);e.exports=!r((function(){return Object.isExtensible(Object.preventExtensions({}))}))},2104:e=>{var n=Function.prototype,t=n.apply,r=n.bind,o=n.call;e.exports="object"==typeof Reflect&&Reflect.apply||(r?o.bind(t):function(){return o.apply(t,arguments)})},9974:(e,n,t)=>{var r=t(1702),o=t(9662),i=r(r.bind);e.exports=function(e,n){return o(e),void 0===n?e:i?i(e,n):function(){return e.apply(n,arguments)}}},7065:(e,n,t)=>{"use strict";var r=t(7854),o=t(1702),i=t(9662),a=t(111),l=t(2597),c=t(206),u=r.Function,s=o([].concat),f=o([].join),p={},d=function(e,n,t){if(!l(p,n)){for(var r=[],o=0;o<n;o++)r[o]="a["+o+"]";p[n]=u("C,a","return new C("+f(r,",")+")")}return p[n](e,t)};e.exports=u.bind||function(e){var n=i(this),t=n.prototype,r=c(arguments,1),o=function(){var t=s(r,c(arguments));return this instanceof o?d(n,t.length,t):n.apply(e,t)};return a(t)&&(o.prototype=t),o}},6916:e=>{var n=Function.prototype.call;e.exports=n.bind?n.bind(n):function(){return n.apply(n,arguments)}},6530:(e,n,t)=>{var r=t(9781),o=t(2597),i=Function.prototype,a=r&&Object.getOwnPropertyDescriptor,l=o(i,"name"),c=l&&"something"===function(){}.name,u=l&&(!r||r&&a(i,"name").configurable);e.exports={EXISTS:l,PROPER:c,CONFIGURABLE:u}},1702:e=>{var n=Function.prototype,t=n.bind,r=n.call,o=t&&t.bind(r);e.exports=t?function(e){return e&&o(r,e)}:function(e){return e&&function(){return r.apply(e,arguments)}}},5005:(e,n,t)=>{var r=t(7854),o=t(614),i=function(e){return o(e)?e:void 0};e.exports=function(e,n){return arguments.length<2?i(r[e]):r[e]&&r[e][n]}},1246:(e,n,t)=>{var r=t(648),o=t(8173),i=t(7497),a=t(5112)("iterator");e.exports=function(e){if(null!=e)return o(e,a)||o(e,"@@iterator")||i[r(e)]}},8554:(e,n,t)=>{var r=t(7854),o=t(6916),i=t(9662),a=t(9670),l=t(6330),c=t(1246),u=r.TypeError;e.exports=function(e,n){var t=arguments.length<2?c(e):n;if(i(t))return a(o(t,e));throw u(l(e)+" is not iterable")}},8173:(e,n,t)=>{var r=t(9662);e.exports=function(e,n){var t=e[n];return null==t?void 0:r(t)}},647:(e,n,t)=>{var r=t(1702),o=t(7908),i=Math.floor,a=r("".charAt),l=r("".replace),c=r("".slice),u=/\$([$&'`]|\d{1,2}|<[^>]*>)/g,s=/\$([$&'`]|\d{1,2})/g;e.exports=function(e,n,t,r,f,p){var d=t+e.length,h=r.length,g=s;return void 0!==f&&(f=o(f),g=u),l(p,g,(function(o,l){var u;switch(a(l,0)){case"$":return"$";case"&":return e;case"`":return c(n,0,t);case"'":return c(n,d);case"<":u=f[c(l,1,-1)];break;default:var s=+l;if(0===s)return o;if(s>h){var p=i(s/10);return 0===p?o:p<=h?void 0===r[p-1]?a(l,1):r[p-1]+a(l,1):o}u=r[s-1]}return void 0===u?"":u}))}},7854:(e,n,t)=>{var r=function(e){return e&&e.Math==Math&&e};e.exports=r("object"==typeof globalThis&&globalThis)||r("object"==typeof window&&window)||r("object"==typeof self&&self)||r("object"==typeof t.g&&t.g)||function(){return this}()||Function("return this")()},2597:(e,n,t)=>{var r=t(1702),o=t(7908),i=r({}.hasOwnProperty);e.exports=Object.hasOwn||function(e,n){return i(o(e),n)}},3501:e=>{e.exports={}},490:(e,n,t)=>{var r=t(5005);e.exports=r("document","documentElement")},4664:(e,n,t)=>{var r=t(9781),o=t(7293),i=t(317);e.exports=!r&&!o((function(){return 7!=Object.defineProperty(i("div"),"a",{get:function(){return 7}}).a}))},8361:(e,n,t)=>{var r=t(7854),o=t(1702),i=t(7293),a=t(4326),l=r.Object,c=o("".split);e.exports=i((function(){return!l("z").propertyIsEnumerable(0)}))?function(e){return"String"==a(e)?c(e,""):l(e)}:l},9587:(e,n,t)=>{var r=t(614),o=t(111),i=t(7674);e.exports=function(e,n,t){var a,l;return i&&r(a=n.constructor)&&a!==t&&o(l=a.prototype)&&l!==t.prototype&&i(e,l),e}},2788:(e,n,t)=>{var r=t(1702),o=t(614),i=t(5465),a=r(Function.toString);o(i.inspectSource)||(i.inspectSource=function(e){return a(e)}),e.exports=i.inspectSource},2423:(e,n,t)=>{var r=t(2109),o=t(1702),i=t(3501),a=t(111),l=t(2597),c=t(3070).f,u=t(8006),s=t(1156),f=t(2050),p=t(9711),d=t(6677),h=!1,g=p("meta"),v=0,A=function(e){c(e,g,{value:{objectID:"O"+v++,weakData:{}}})},b=e.exports={enable:function(){b.enable=function(){},h=!0;var e=u.f,n=o([].splice),t={};t[g]=1,e(t).length&&(u.f=function(t){for(var r=e(t),o=0,i=r.length;o<i;o++)if(r[o]===g){n(r,o,1);break}return r},r({target:"Object",stat:!0,forced:!0},{getOwnPropertyNames:s.f}))},fastKey:function(e,n){if(!a(e))return"symbol"==typeof e?e:("string"==typeof e?"S":"P")+e;if(!l(e,g)){if(!f(e))return"F";if(!n)return"E";A(e)}return e[g].objectID},getWeakData:function(e,n){if(!l(e,g)){if(!f(e))return!0;if(!n)return!1;A(e)}return e[g].weakData},onFreeze:function(e){return d&&h&&f(e)&&!l(e,g)&&A(e),e}};i[g]=!0},9909:(e,n,t)=>{var r,o,i,a=t(8536),l=t(7854),c=t(1702),u=t(111),s=t(8880),f=t(2597),p=t(5465),d=t(6200),h=t(3501),g="Object already initialized",v=l.TypeError,A=l.WeakMap;if(a||p.state){var b=p.state||(p.state=new A),m=c(b.get),y=c(b.has),E=c(b.set);r=function(e,n){if(y(b,e))throw new v(g);return n.facade=e,E(b,e,n),n},o=function(e){return m(b,e)||{}},i=function(e){return y(b,e)}}else{var _=d("state");h[_]=!0,r=function(e,n){if(f(e,_))throw new v(g);return n.facade=e,s(e,_,n),n},o=function(e){return f(e,_)?e[_]:{}},i=function(e){return f(e,_)}}e.exports={set:r,get:o,has:i,enforce:function(e){return i(e)?o(e):r(e,{})},getterFor:function(e){return function(n){var t;if(!u(n)||(t=o(n)).type!==e)throw v("Incompatible receiver, "+e+" required");return t}}}},7659:(e,n,t)=>{var r=t(5112),o=t(7497),i=r("iterator"),a=Array.prototype;e.exports=function(e){return void 0!==e&&(o.Array===e||a[i]===e)}},3157:(e,n,t)=>{var r=t(4326);e.exports=Array.isArray||function(e){return"Array"==r(e)}},614:e=>{e.exports=function(e){return"function"==typeof e}},4411:(e,n,t)=>{var r=t(1702),o=t(7293),i=t(614),a=t(648),l=t(5005),c=t(2788),u=function(){},s=[],f=l("Reflect","construct"),p=/^\s*(?:class|function)\b/,d=r(p.exec),h=!p.exec(u),g=function(e){if(!i(e))return!1;try{return f(u,s,e),!0}catch(e){return!1}};e.exports=!f||o((function(){var e;return g(g.call)||!g(Object)||!g((function(){e=!0}))||e}))?function(e){if(!i(e))return!1;switch(a(e)){case"AsyncFunction":case"GeneratorFunction":case"AsyncGeneratorFunction":return!1}return h||!!d(p,c(e))}:g},4705:(e,n,t)=>{var r=t(7293),o=t(614),i=/#|\.prototype\./,a=function(e,n){var t=c[l(e)];return t==s||t!=u&&(o(n)?r(n):!!n)},l=a.normalize=function(e){return String(e).replace(i,".").toLowerCase()},c=a.data={},u=a.NATIVE="N",s=a.POLYFILL="P";e.exports=a},111:(e,n,t)=>{var r=t(614);e.exports=function(e){return"object"==typeof e?null!==e:r(e)}},1913:e=>{e.exports=!1},7850:(e,n,t)=>{var r=t(111),o=t(4326),i=t(5112)("match");e.exports=function(e){var n;return r(e)&&(void 0!==(n=e[i])?!!n:"RegExp"==o(e))}},2190:(e,n,t)=>{var r=t(7854),o=t(5005),i=t(614),a=t(7976),l=t(3307),c=r.Object;e.exports=l?function(e){return"symbol"==typeof e}:function(e){var n=o("Symbol");return i(n)&&a(n.prototype,c(e))}},408:(e,n,t)=>{var r=t(7854),o=t(9974),i=t(6916),a=t(9670),l=t(6330),c=t(7659),u=t(6244),s=t(7976),f=t(8554),p=t(1246),d=t(9212),h=r.TypeError,g=function(e,n){this.stopped=e,this.result=n},v=g.prototype;e.exports=function(e,n,t){var r,A,b,m,y,E,_,C=t&&t.that,w=!(!t||!t.AS_ENTRIES),x=!(!t||!t.IS_ITERATOR),k=!(!t||!t.INTERRUPTED),S=o(n,C),O=function(e){return r&&d(r,"normal",e),new g(!0,e)},B=function(e){return w?(a(e),k?S(e[0],e[1],O):S(e[0],e[1])):k?S(e,O):S(e)};if(x)r=e;else{if(!(A=p(e)))throw h(l(e)+" is not iterable");if(c(A)){for(b=0,m=u(e);m>b;b++)if((y=B(e[b]))&&s(v,y))return y;return new g(!1)}r=f(e,A)}for(E=r.next;!(_=i(E,r)).done;){try{y=B(_.value)}catch(e){d(r,"throw",e)}if("object"==typeof y&&y&&s(v,y))return y}return new g(!1)}},9212:(e,n,t)=>{var r=t(6916),o=t(9670),i=t(8173);e.exports=function(e,n,t){var a,l;o(e);try{if(!(a=i(e,"return"))){if("throw"===n)throw t;return t}a=r(a,e)}catch(e){l=!0,a=e}if("throw"===n)throw t;if(l)throw a;return o(a),t}},3383:(e,n,t)=>{"use strict";var r,o,i,a=t(7293),l=t(614),c=t(30),u=t(9518),s=t(1320),f=t(5112),p=t(1913),d=f("iterator"),h=!1;[].keys&&("next"in(i=[].keys())?(o=u(u(i)))!==Object.prototype&&(r=o):h=!0),null==r||a((function(){var e={};return r[d].call(e)!==e}))?r={}:p&&(r=c(r)),l(r[d])||s(r,d,(function(){return this})),e.exports={IteratorPrototype:r,BUGGY_SAFARI_ITERATORS:h}},7497:e=>{e.exports={}},6244:(e,n,t)=>{var r=t(7466);e.exports=function(e){return r(e.length)}},133:(e,n,t)=>{var r=t(7392),o=t(7293);e.exports=!!Object.getOwnPropertySymbols&&!o((function(){var e=Symbol();return!String(e)||!(Object(e)instanceof Symbol)||!Symbol.sham&&r&&r<41}))},8536:(e,n,t)=>{var r=t(7854),o=t(614),i=t(2788),a=r.WeakMap;e.exports=o(a)&&/native code/.test(i(a))},3929:(e,n,t)=>{var r=t(7854),o=t(7850),i=r.TypeError;e.exports=function(e){if(o(e))throw i("The method doesn't accept regular expressions");return e}},1574:(e,n,t)=>{"use strict";var r=t(9781),o=t(1702),i=t(6916),a=t(7293),l=t(1956),c=t(5181),u=t(5296),s=t(7908),f=t(8361),p=Object.assign,d=Object.defineProperty,h=o([].concat);e.exports=!p||a((function(){if(r&&1!==p({b:1},p(d({},"a",{enumerable:!0,get:function(){d(this,"b",{value:3,enumerable:!1})}}),{b:2})).b)return!0;var e={},n={},t=Symbol(),o="abcdefghijklmnopqrst";return e[t]=7,o.split("").forEach((function(e){n[e]=e})),7!=p({},e)[t]||l(p({},n)).join("")!=o}))?function(e,n){for(var t=s(e),o=arguments.length,a=1,p=c.f,d=u.f;o>a;)for(var g,v=f(arguments[a++]),A=p?h(l(v),p(v)):l(v),b=A.length,m=0;b>m;)g=A[m++],r&&!i(d,v,g)||(t[g]=v[g]);return t}:p},30:(e,n,t)=>{var r,o=t(9670),i=t(6048),a=t(748),l=t(3501),c=t(490),u=t(317),s=t(6200),f=s("IE_PROTO"),p=function(){},d=function(e){return"<script>"+e+"</"+"script>"},h=function(e){e.write(d("")),e.close();var n=e.parentWindow.Object;return e=null,n},g=function(){try{r=new ActiveXObject("htmlfile")}catch(e){}var e,n;g="undefined"!=typeof document?document.domain&&r?h(r):((n=u("iframe")).style.display="none",c.appendChild(n),n.src=String("javascript:"),(e=n.contentWindow.document).open(),e.write(d("document.F=Object")),e.close(),e.F):h(r);for(var t=a.length;t--;)delete g.prototype[a[t]];return g()};l[f]=!0,e.exports=Object.create||function(e,n){var t;return null!==e?(p.prototype=o(e),t=new p,p.prototype=null,t[f]=e):t=g(),void 0===n?t:i(t,n)}},6048:(e,n,t)=>{var r=t(9781),o=t(3070),i=t(9670),a=t(5656),l=t(1956);e.exports=r?Object.defineProperties:function(e,n){i(e);for(var t,r=a(n),c=l(n),u=c.length,s=0;u>s;)o.f(e,t=c[s++],r[t]);return e}},3070:(e,n,t)=>{var r=t(7854),o=t(9781),i=t(4664),a=t(9670),l=t(4948),c=r.TypeError,u=Object.defineProperty;n.f=o?u:function(e,n,t){if(a(e),n=l(n),a(t),i)try{return u(e,n,t)}catch(e){}if("get"in t||"set"in t)throw c("Accessors not supported");return"value"in t&&(e[n]=t.value),e}},1236:(e,n,t)=>{var r=t(9781),o=t(6916),i=t(5296),a=t(9114),l=t(5656),c=t(4948),u=t(2597),s=t(4664),f=Object.getOwnPropertyDescriptor;n.f=r?f:function(e,n){if(e=l(e),n=c(n),s)try{return f(e,n)}catch(e){}if(u(e,n))return a(!o(i.f,e,n),e[n])}},1156:(e,n,t)=>{var r=t(4326),o=t(5656),i=t(8006).f,a=t(206),l="object"==typeof window&&window&&Object.getOwnPropertyNames?Object.getOwnPropertyNames(window):[];e.exports.f=function(e){return l&&"Window"==r(e)?function(e){try{return i(e)}catch(e){return a(l)}}(e):i(o(e))}},8006:(e,n,t)=>{var r=t(6324),o=t(748).concat("length","prototype");n.f=Object.getOwnPropertyNames||function(e){return r(e,o)}},5181:(e,n)=>{n.f=Object.getOwnPropertySymbols},9518:(e,n,t)=>{var r=t(7854),o=t(2597),i=t(614),a=t(7908),l=t(6200),c=t(8544),u=l("IE_PROTO"),s=r.Object,f=s.prototype;e.exports=c?s.getPrototypeOf:function(e){var n=a(e);if(o(n,u))return n[u];var t=n.constructor;return i(t)&&n instanceof t?t.prototype:n instanceof s?f:null}},2050:(e,n,t)=>{var r=t(7293),o=t(111),i=t(4326),a=t(7556),l=Object.isExtensible,c=r((function(){l(1)}));e.exports=c||a?function(e){return!!o(e)&&((!a||"ArrayBuffer"!=i(e))&&(!l||l(e)))}:l},7976:(e,n,t)=>{var r=t(1702);e.exports=r({}.isPrototypeOf)},6324:(e,n,t)=>{var r=t(1702),o=t(2597),i=t(5656),a=t(1318).indexOf,l=t(3501),c=r([].push);e.exports=function(e,n){var t,r=i(e),u=0,s=[];for(t in r)!o(l,t)&&o(r,t)&&c(s,t);for(;n.length>u;)o(r,t=n[u++])&&(~a(s,t)||c(s,t));return s}},1956:(e,n,t)=>{var r=t(6324),o=t(748);e.exports=Object.keys||function(e){return r(e,o)}},5296:(e,n)=>{"use strict";var t={}.propertyIsEnumerable,r=Object.getOwnPropertyDescriptor,o=r&&!t.call({1:2},1);n.f=o?function(e){var n=r(this,e);return!!n&&n.enumerable}:t},7674:(e,n,t)=>{var r=t(1702),o=t(9670),i=t(6077);e.exports=Object.setPrototypeOf||("__proto__"in{}?function(){var e,n=!1,t={};try{(e=r(Object.getOwnPropertyDescriptor(Object.prototype,"__proto__").set))(t,[]),n=t instanceof Array}catch(e){}return function(t,r){return o(t),i(r),n?e(t,r):t.__proto__=r,t}}():void 0)},4699:(e,n,t)=>{var r=t(9781),o=t(1702),i=t(1956),a=t(5656),l=o(t(5296).f),c=o([].push),u=function(e){return function(n){for(var t,o=a(n),u=i(o),s=u.length,f=0,p=[];s>f;)t=u[f++],r&&!l(o,t)||c(p,e?[t,o[t]]:o[t]);return p}};e.exports={entries:u(!0),values:u(!1)}},288:(e,n,t)=>{"use strict";var r=t(1694),o=t(648);e.exports=r?{}.toString:function(){return"[object "+o(this)+"]"}},2140:(e,n,t)=>{var r=t(7854),o=t(6916),i=t(614),a=t(111),l=r.TypeError;e.exports=function(e,n){var t,r;if("string"===n&&i(t=e.toString)&&!a(r=o(t,e)))return r;if(i(t=e.valueOf)&&!a(r=o(t,e)))return r;if("string"!==n&&i(t=e.toString)&&!a(r=o(t,e)))return r;throw l("Can't convert object to primitive value")}},3887:(e,n,t)=>{var r=t(5005),o=t(1702),i=t(8006),a=t(5181),l=t(9670),c=o([].concat);e.exports=r("Reflect","ownKeys")||function(e){var n=i.f(l(e)),t=a.f;return t?c(n,t(e)):n}},857:(e,n,t)=>{var r=t(7854);e.exports=r},2248:(e,n,t)=>{var r=t(1320);e.exports=function(e,n,t){for(var o in n)r(e,o,n[o],t);return e}},1320:(e,n,t)=>{var r=t(7854),o=t(614),i=t(2597),a=t(8880),l=t(3505),c=t(2788),u=t(9909),s=t(6530).CONFIGURABLE,f=u.get,p=u.enforce,d=String(String).split("String");(e.exports=function(e,n,t,c){var u,f=!!c&&!!c.unsafe,h=!!c&&!!c.enumerable,g=!!c&&!!c.noTargetGet,v=c&&void 0!==c.name?c.name:n;o(t)&&("Symbol("===String(v).slice(0,7)&&(v="["+String(v).replace(/^Symbol\(([^)]*)\)/,"$1")+"]"),(!i(t,"name")||s&&t.name!==v)&&a(t,"name",v),(u=p(t)).source||(u.source=d.join("string"==typeof v?v:""))),e!==r?(f?!g&&e[n]&&(h=!0):delete e[n],h?e[n]=t:a(e,n,t)):h?e[n]=t:l(n,t)})(Function.prototype,"toString",(function(){return o(this)&&f(this).source||c(this)}))},7651:(e,n,t)=>{var r=t(7854),o=t(6916),i=t(9670),a=t(614),l=t(4326),c=t(2261),u=r.TypeError;e.exports=function(e,n){var t=e.exec;if(a(t)){var r=o(t,e,n);return null!==r&&i(r),r}if("RegExp"===l(e))return o(c,e,n);throw u("RegExp#exec called on incompatible receiver")}},2261:(e,n,t)=>{"use strict";var r,o,i=t(6916),a=t(1702),l=t(1340),c=t(7066),u=t(2999),s=t(2309),f=t(30),p=t(9909).get,d=t(9441),h=t(7168),g=s("native-string-replace",String.prototype.replace),v=RegExp.prototype.exec,A=v,b=a("".charAt),m=a("".indexOf),y=a("".replace),E=a("".slice),_=(o=/b*/g,i(v,r=/a/,"a"),i(v,o,"a"),0!==r.lastIndex||0!==o.lastIndex),C=u.UNSUPPORTED_Y||u.BROKEN_CARET,w=void 0!==/()??/.exec("")[1];(_||w||C||d||h)&&(A=function(e){var n,t,r,o,a,u,s,d=this,h=p(d),x=l(e),k=h.raw;if(k)return k.lastIndex=d.lastIndex,n=i(A,k,x),d.lastIndex=k.lastIndex,n;var S=h.groups,O=C&&d.sticky,B=i(c,d),I=d.source,T=0,P=x;if(O&&(B=y(B,"y",""),-1===m(B,"g")&&(B+="g"),P=E(x,d.lastIndex),d.lastIndex>0&&(!d.multiline||d.multiline&&"\n"!==b(x,d.lastIndex-1))&&(I="(?: "+I+")",P=" "+P,T++),t=new RegExp("^(?:"+I+")",B)),w&&(t=new RegExp("^"+I+"$(?!\\s)",B)),_&&(r=d.lastIndex),o=i(v,O?t:d,P),O?o?(o.input=E(o.input,T),o[0]=E(o[0],T),o.index=d.lastIndex,d.lastIndex+=o[0].length):d.lastIndex=0:_&&o&&(d.lastIndex=d.global?o.index+o[0].length:r),w&&o&&o.length>1&&i(g,o[0],t,(function(){for(a=1;a<arguments.length-2;a++)void 0===arguments[a]&&(o[a]=void 0)})),o&&S)for(o.groups=u=f(null),a=0;a<S.length;a++)u[(s=S[a])[0]]=o[s[1]];return o}),e.exports=A},7066:(e,n,t)=>{"use strict";var r=t(9670);e.exports=function(){var e=r(this),n="";return e.global&&(n+="g"),e.ignoreCase&&(n+="i"),e.multiline&&(n+="m"),e.dotAll&&(n+="s"),e.unicode&&(n+="u"),e.sticky&&(n+="y"),n}},2999:(e,n,t)=>{var r=t(7293),o=t(7854).RegExp;n.UNSUPPORTED_Y=r((function(){var e=o("a","y");return e.lastIndex=2,null!=e.exec("abcd")})),n.BROKEN_CARET=r((function(){var e=o("^r","gy");return e.lastIndex=2,null!=e.exec("str")}))},9441:(e,n,t)=>{var r=t(7293),o=t(7854).RegExp;e.exports=r((function(){var e=o(".","s");return!(e.dotAll&&e.exec("\n")&&"s"===e.flags)}))},7168:(e,n,t)=>{var r=t(7293),o=t(7854).RegExp;e.exports=r((function(){var e=o("(?<a>b)","g");return"b"!==e.exec("b").groups.a||"bc"!=="b".replace(e,"$<a>c")}))},4488:(e,n,t)=>{var r=t(7854).TypeError;e.exports=function(e){if(null==e)throw r("Can't call method on "+e);return e}},3505:(e,n,t)=>{var r=t(7854),o=Object.defineProperty;e.exports=function(e,n){try{o(r,e,{value:n,configurable:!0,writable:!0})}catch(t){r[e]=n}return n}},6340:(e,n,t)=>{"use strict";var r=t(5005),o=t(3070),i=t(5112),a=t(9781),l=i("species");e.exports=function(e){var n=r(e),t=o.f;a&&n&&!n[l]&&t(n,l,{configurable:!0,get:function(){return this}})}},8003:(e,n,t)=>{var r=t(3070).f,o=t(2597),i=t(5112)("toStringTag");e.exports=function(e,n,t){e&&!o(e=t?e:e.prototype,i)&&r(e,i,{configurable:!0,value:n})}},6200:(e,n,t)=>{var r=t(2309),o=t(9711),i=r("keys");e.exports=function(e){return i[e]||(i[e]=o(e))}},5465:(e,n,t)=>{var r=t(7854),o=t(3505),i="__core-js_shared__",a=r[i]||o(i,{});e.exports=a},2309:(e,n,t)=>{var r=t(1913),o=t(5465);(e.exports=function(e,n){return o[e]||(o[e]=void 0!==n?n:{})})("versions",[]).push({version:"3.19.1",mode:r?"pure":"global",copyright:"© 2021 Denis Pushkarev (zloirock.ru)"})},6707:(e,n,t)=>{var r=t(9670),o=t(9483),i=t(5112)("species");e.exports=function(e,n){var t,a=r(e).constructor;return void 0===a||null==(t=r(a)[i])?n:o(t)}},3429:(e,n,t)=>{var r=t(7293);e.exports=function(e){return r((function(){var n=""[e]('"');return n!==n.toLowerCase()||n.split('"').length>3}))}},8710:(e,n,t)=>{var r=t(1702),o=t(9303),i=t(1340),a=t(4488),l=r("".charAt),c=r("".charCodeAt),u=r("".slice),s=function(e){return function(n,t){var r,s,f=i(a(n)),p=o(t),d=f.length;return p<0||p>=d?e?"":void 0:(r=c(f,p))<55296||r>56319||p+1===d||(s=c(f,p+1))<56320||s>57343?e?l(f,p):r:e?u(f,p,p+2):s-56320+(r-55296<<10)+65536}};e.exports={codeAt:s(!1),charAt:s(!0)}},6091:(e,n,t)=>{var r=t(6530).PROPER,o=t(7293),i=t(1361);e.exports=function(e){return o((function(){return!!i[e]()||"​᠎"!=="​᠎"[e]()||r&&i[e].name!==e}))}},3111:(e,n,t)=>{var r=t(1702),o=t(4488),i=t(1340),a=t(1361),l=r("".replace),c="["+a+"]",u=RegExp("^"+c+c+"*"),s=RegExp(c+c+"*$"),f=function(e){return function(n){var t=i(o(n));return 1&e&&(t=l(t,u,"")),2&e&&(t=l(t,s,"")),t}};e.exports={start:f(1),end:f(2),trim:f(3)}},863:(e,n,t)=>{var r=t(1702);e.exports=r(1..valueOf)},1400:(e,n,t)=>{var r=t(9303),o=Math.max,i=Math.min;e.exports=function(e,n){var t=r(e);return t<0?o(t+n,0):i(t,n)}},5656:(e,n,t)=>{var r=t(8361),o=t(4488);e.exports=function(e){return r(o(e))}},9303:e=>{var n=Math.ceil,t=Math.floor;e.exports=function(e){var r=+e;return r!=r||0===r?0:(r>0?t:n)(r)}},7466:(e,n,t)=>{var r=t(9303),o=Math.min;e.exports=function(e){return e>0?o(r(e),9007199254740991):0}},7908:(e,n,t)=>{var r=t(7854),o=t(4488),i=r.Object;e.exports=function(e){return i(o(e))}},7593:(e,n,t)=>{var r=t(7854),o=t(6916),i=t(111),a=t(2190),l=t(8173),c=t(2140),u=t(5112),s=r.TypeError,f=u("toPrimitive");e.exports=function(e,n){if(!i(e)||a(e))return e;var t,r=l(e,f);if(r){if(void 0===n&&(n="default"),t=o(r,e,n),!i(t)||a(t))return t;throw s("Can't convert object to primitive value")}return void 0===n&&(n="number"),c(e,n)}},4948:(e,n,t)=>{var r=t(7593),o=t(2190);e.exports=function(e){var n=r(e,"string");return o(n)?n:n+""}},1694:(e,n,t)=>{var r={};r[t(5112)("toStringTag")]="z",e.exports="[object z]"===String(r)},1340:(e,n,t)=>{var r=t(7854),o=t(648),i=r.String;e.exports=function(e){if("Symbol"===o(e))throw TypeError("Cannot convert a Symbol value to a string");return i(e)}},6330:(e,n,t)=>{var r=t(7854).String;e.exports=function(e){try{return r(e)}catch(e){return"Object"}}},9711:(e,n,t)=>{var r=t(1702),o=0,i=Math.random(),a=r(1..toString);e.exports=function(e){return"Symbol("+(void 0===e?"":e)+")_"+a(++o+i,36)}},3307:(e,n,t)=>{var r=t(133);e.exports=r&&!Symbol.sham&&"symbol"==typeof Symbol.iterator},6061:(e,n,t)=>{var r=t(5112);n.f=r},5112:(e,n,t)=>{var r=t(7854),o=t(2309),i=t(2597),a=t(9711),l=t(133),c=t(3307),u=o("wks"),s=r.Symbol,f=s&&s.for,p=c?s:s&&s.withoutSetter||a;e.exports=function(e){if(!i(u,e)||!l&&"string"!=typeof u[e]){var n="Symbol."+e;l&&i(s,e)?u[e]=s[e]:u[e]=c&&f?f(n):p(n)}return u[e]}},1361:e=>{e.exports="\t\n\v\f\r                　\u2028\u2029\ufeff"},2222:(e,n,t)=>{"use strict";var r=t(2109),o=t(7854),i=t(7293),a=t(3157),l=t(111),c=t(7908),u=t(6244),s=t(6135),f=t(5417),p=t(1194),d=t(5112),h=t(7392),g=d("isConcatSpreadable"),v=9007199254740991,A="Maximum allowed index exceeded",b=o.TypeError,m=h>=51||!i((function(){var e=[];return e[g]=!1,e.concat()[0]!==e})),y=p("concat"),E=function(e){if(!l(e))return!1;var n=e[g];return void 0!==n?!!n:a(e)};r({target:"Array",proto:!0,forced:!m||!y},{concat:function(e){var n,t,r,o,i,a=c(this),l=f(a,0),p=0;for(n=-1,r=arguments.length;n<r;n++)if(E(i=-1===n?a:arguments[n])){if(p+(o=u(i))>v)throw b(A);for(t=0;t<o;t++,p++)t in i&&s(l,p,i[t])}else{if(p>=v)throw b(A);s(l,p++,i)}return l.length=p,l}})},6541:(e,n,t)=>{"use strict";var r=t(2109),o=t(2092).every;r({target:"Array",proto:!0,forced:!t(9341)("every")},{every:function(e){return o(this,e,arguments.length>1?arguments[1]:void 0)}})},7327:(e,n,t)=>{"use strict";var r=t(2109),o=t(2092).filter;r({target:"Array",proto:!0,forced:!t(1194)("filter")},{filter:function(e){return o(this,e,arguments.length>1?arguments[1]:void 0)}})},4553:(e,n,t)=>{"use strict";var r=t(2109),o=t(2092).findIndex,i=t(1223),a="findIndex",l=!0;a in[]&&Array(1).findIndex((function(){l=!1})),r({target:"Array",proto:!0,forced:l},{findIndex:function(e){return o(this,e,arguments.length>1?arguments[1]:void 0)}}),i(a)},9826:(e,n,t)=>{"use strict";var r=t(2109),o=t(2092).find,i=t(1223),a="find",l=!0;a in[]&&Array(1).find((function(){l=!1})),r({target:"Array",proto:!0,forced:l},{find:function(e){return o(this,e,arguments.length>1?arguments[1]:void 0)}}),i(a)},9554:(e,n,t)=>{"use strict";var r=t(2109),o=t(8533);r({target:"Array",proto:!0,forced:[].forEach!=o},{forEach:o})},1038:(e,n,t)=>{var r=t(2109),o=t(8457);r({target:"Array",stat:!0,forced:!t(7072)((function(e){Array.from(e)}))},{from:o})},6699:(e,n,t)=>{"use strict";var r=t(2109),o=t(1318).includes,i=t(1223);r({target:"Array",proto:!0},{includes:function(e){return o(this,e,arguments.length>1?arguments[1]:void 0)}}),i("includes")},2772:(e,n,t)=>{"use strict";var r=t(2109),o=t(1702),i=t(1318).indexOf,a=t(9341),l=o([].indexOf),c=!!l&&1/l([1],1,-0)<0,u=a("indexOf");r({target:"Array",proto:!0,forced:c||!u},{indexOf:function(e){var n=arguments.length>1?arguments[1]:void 0;return c?l(this,e,n)||0:i(this,e,n)}})},9753:(e,n,t)=>{t(2109)({target:"Array",stat:!0},{isArray:t(3157)})},6992:(e,n,t)=>{"use strict";var r=t(5656),o=t(1223),i=t(7497),a=t(9909),l=t(654),c="Array Iterator",u=a.set,s=a.getterFor(c);e.exports=l(Array,"Array",(function(e,n){u(this,{type:c,target:r(e),index:0,kind:n})}),(function(){var e=s(this),n=e.target,t=e.kind,r=e.index++;return!n||r>=n.length?(e.target=void 0,{value:void 0,done:!0}):"keys"==t?{value:r,done:!1}:"values"==t?{value:n[r],done:!1}:{value:[r,n[r]],done:!1}}),"values"),i.Arguments=i.Array,o("keys"),o("values"),o("entries")},9600:(e,n,t)=>{"use strict";var r=t(2109),o=t(1702),i=t(8361),a=t(5656),l=t(9341),c=o([].join),u=i!=Object,s=l("join",",");r({target:"Array",proto:!0,forced:u||!s},{join:function(e){return c(a(this),void 0===e?",":e)}})},1249:(e,n,t)=>{"use strict";var r=t(2109),o=t(2092).map;r({target:"Array",proto:!0,forced:!t(1194)("map")},{map:function(e){return o(this,e,arguments.length>1?arguments[1]:void 0)}})},5827:(e,n,t)=>{"use strict";var r=t(2109),o=t(3671).left,i=t(9341),a=t(7392),l=t(5268);r({target:"Array",proto:!0,forced:!i("reduce")||!l&&a>79&&a<83},{reduce:function(e){var n=arguments.length;return o(this,e,n,n>1?arguments[1]:void 0)}})},7042:(e,n,t)=>{"use strict";var r=t(2109),o=t(7854),i=t(3157),a=t(4411),l=t(111),c=t(1400),u=t(6244),s=t(5656),f=t(6135),p=t(5112),d=t(1194),h=t(206),g=d("slice"),v=p("species"),A=o.Array,b=Math.max;r({target:"Array",proto:!0,forced:!g},{slice:function(e,n){var t,r,o,p=s(this),d=u(p),g=c(e,d),m=c(void 0===n?d:n,d);if(i(p)&&(t=p.constructor,(a(t)&&(t===A||i(t.prototype))||l(t)&&null===(t=t[v]))&&(t=void 0),t===A||void 0===t))return h(p,g,m);for(r=new(void 0===t?A:t)(b(m-g,0)),o=0;g<m;g++,o++)g in p&&f(r,o,p[g]);return r.length=o,r}})},5212:(e,n,t)=>{"use strict";var r=t(2109),o=t(2092).some;r({target:"Array",proto:!0,forced:!t(9341)("some")},{some:function(e){return o(this,e,arguments.length>1?arguments[1]:void 0)}})},2707:(e,n,t)=>{"use strict";var r=t(2109),o=t(1702),i=t(9662),a=t(7908),l=t(6244),c=t(1340),u=t(7293),s=t(4362),f=t(9341),p=t(8886),d=t(256),h=t(7392),g=t(8008),v=[],A=o(v.sort),b=o(v.push),m=u((function(){v.sort(void 0)})),y=u((function(){v.sort(null)})),E=f("sort"),_=!u((function(){if(h)return h<70;if(!(p&&p>3)){if(d)return!0;if(g)return g<603;var e,n,t,r,o="";for(e=65;e<76;e++){switch(n=String.fromCharCode(e),e){case 66:case 69:case 70:case 72:t=3;break;case 68:case 71:t=4;break;default:t=2}for(r=0;r<47;r++)v.push({k:n+r,v:t})}for(v.sort((function(e,n){return n.v-e.v})),r=0;r<v.length;r++)n=v[r].k.charAt(0),o.charAt(o.length-1)!==n&&(o+=n);return"DGBEFHACIJK"!==o}}));r({target:"Array",proto:!0,forced:m||!y||!E||!_},{sort:function(e){void 0!==e&&i(e);var n=a(this);if(_)return void 0===e?A(n):A(n,e);var t,r,o=[],u=l(n);for(r=0;r<u;r++)r in n&&b(o,n[r]);for(s(o,function(e){return function(n,t){return void 0===t?-1:void 0===n?1:void 0!==e?+e(n,t)||0:c(n)>c(t)?1:-1}}(e)),t=o.length,r=0;r<t;)n[r]=o[r++];for(;r<u;)delete n[r++];return n}})},561:(e,n,t)=>{"use strict";var r=t(2109),o=t(7854),i=t(1400),a=t(9303),l=t(6244),c=t(7908),u=t(5417),s=t(6135),f=t(1194)("splice"),p=o.TypeError,d=Math.max,h=Math.min,g=9007199254740991,v="Maximum allowed length exceeded";r({target:"Array",proto:!0,forced:!f},{splice:function(e,n){var t,r,o,f,A,b,m=c(this),y=l(m),E=i(e,y),_=arguments.length;if(0===_?t=r=0:1===_?(t=0,r=y-E):(t=_-2,r=h(d(a(n),0),y-E)),y+t-r>g)throw p(v);for(o=u(m,r),f=0;f<r;f++)(A=E+f)in m&&s(o,f,m[A]);if(o.length=r,t<r){for(f=E;f<y-r;f++)b=f+t,(A=f+r)in m?m[b]=m[A]:delete m[b];for(f=y;f>y-r+t;f--)delete m[f-1]}else if(t>r)for(f=y-r;f>E;f--)b=f+t-1,(A=f+r-1)in m?m[b]=m[A]:delete m[b];for(f=0;f<t;f++)m[f+E]=arguments[f+2];return m.length=y-r+t,o}})},6078:(e,n,t)=>{var r=t(2597),o=t(1320),i=t(8709),a=t(5112)("toPrimitive"),l=Date.prototype;r(l,a)||o(l,a,i)},3710:(e,n,t)=>{var r=t(1702),o=t(1320),i=Date.prototype,a="Invalid Date",l="toString",c=r(i.toString),u=r(i.getTime);String(new Date(NaN))!=a&&o(i,l,(function(){var e=u(this);return e==e?c(this):a}))},4812:(e,n,t)=>{t(2109)({target:"Function",proto:!0},{bind:t(7065)})},8309:(e,n,t)=>{var r=t(9781),o=t(6530).EXISTS,i=t(1702),a=t(3070).f,l=Function.prototype,c=i(l.toString),u=/^\s*function ([^ (]*)/,s=i(u.exec);r&&!o&&a(l,"name",{configurable:!0,get:function(){try{return s(u,c(this))[1]}catch(e){return""}}})},1532:(e,n,t)=>{"use strict";t(7710)("Map",(function(e){return function(){return e(this,arguments.length?arguments[0]:void 0)}}),t(5631))},332:(e,n,t)=>{var r=t(2109),o=t(7293),i=Math.imul;r({target:"Math",stat:!0,forced:o((function(){return-5!=i(4294967295,5)||2!=i.length}))},{imul:function(e,n){var t=65535,r=+e,o=+n,i=t&r,a=t&o;return 0|i*a+((t&r>>>16)*a+i*(t&o>>>16)<<16>>>0)}})},9653:(e,n,t)=>{"use strict";var r=t(9781),o=t(7854),i=t(1702),a=t(4705),l=t(1320),c=t(2597),u=t(9587),s=t(7976),f=t(2190),p=t(7593),d=t(7293),h=t(8006).f,g=t(1236).f,v=t(3070).f,A=t(863),b=t(3111).trim,m="Number",y=o.Number,E=y.prototype,_=o.TypeError,C=i("".slice),w=i("".charCodeAt),x=function(e){var n=p(e,"number");return"bigint"==typeof n?n:k(n)},k=function(e){var n,t,r,o,i,a,l,c,u=p(e,"number");if(f(u))throw _("Cannot convert a Symbol value to a number");if("string"==typeof u&&u.length>2)if(u=b(u),43===(n=w(u,0))||45===n){if(88===(t=w(u,2))||120===t)return NaN}else if(48===n){switch(w(u,1)){case 66:case 98:r=2,o=49;break;case 79:case 111:r=8,o=55;break;default:return+u}for(a=(i=C(u,2)).length,l=0;l<a;l++)if((c=w(i,l))<48||c>o)return NaN;return parseInt(i,r)}return+u};if(a(m,!y(" 0o1")||!y("0b1")||y("+0x1"))){for(var S,O=function(e){var n=arguments.length<1?0:y(x(e)),t=this;return s(E,t)&&d((function(){A(t)}))?u(Object(n),t,O):n},B=r?h(y):"MAX_VALUE,MIN_VALUE,NaN,NEGATIVE_INFINITY,POSITIVE_INFINITY,EPSILON,MAX_SAFE_INTEGER,MIN_SAFE_INTEGER,isFinite,isInteger,isNaN,isSafeInteger,parseFloat,parseInt,fromString,range".split(","),I=0;B.length>I;I++)c(y,S=B[I])&&!c(O,S)&&v(O,S,g(y,S));O.prototype=E,E.constructor=O,l(o,m,O)}},9601:(e,n,t)=>{var r=t(2109),o=t(1574);r({target:"Object",stat:!0,forced:Object.assign!==o},{assign:o})},8011:(e,n,t)=>{t(2109)({target:"Object",stat:!0,sham:!t(9781)},{create:t(30)})},3321:(e,n,t)=>{var r=t(2109),o=t(9781);r({target:"Object",stat:!0,forced:!o,sham:!o},{defineProperties:t(6048)})},9070:(e,n,t)=>{var r=t(2109),o=t(9781);r({target:"Object",stat:!0,forced:!o,sham:!o},{defineProperty:t(3070).f})},9720:(e,n,t)=>{var r=t(2109),o=t(4699).entries;r({target:"Object",stat:!0},{entries:function(e){return o(e)}})},5003:(e,n,t)=>{var r=t(2109),o=t(7293),i=t(5656),a=t(1236).f,l=t(9781),c=o((function(){a(1)}));r({target:"Object",stat:!0,forced:!l||c,sham:!l},{getOwnPropertyDescriptor:function(e,n){return a(i(e),n)}})},9337:(e,n,t)=>{var r=t(2109),o=t(9781),i=t(3887),a=t(5656),l=t(1236),c=t(6135);r({target:"Object",stat:!0,sham:!o},{getOwnPropertyDescriptors:function(e){for(var n,t,r=a(e),o=l.f,u=i(r),s={},f=0;u.length>f;)void 0!==(t=o(r,n=u[f++]))&&c(s,n,t);return s}})},489:(e,n,t)=>{var r=t(2109),o=t(7293),i=t(7908),a=t(9518),l=t(8544);r({target:"Object",stat:!0,forced:o((function(){a(1)})),sham:!l},{getPrototypeOf:function(e){return a(i(e))}})},7941:(e,n,t)=>{var r=t(2109),o=t(7908),i=t(1956);r({target:"Object",stat:!0,forced:t(7293)((function(){i(1)}))},{keys:function(e){return i(o(e))}})},8304:(e,n,t)=>{t(2109)({target:"Object",stat:!0},{setPrototypeOf:t(7674)})},1539:(e,n,t)=>{var r=t(1694),o=t(1320),i=t(288);r||o(Object.prototype,"toString",i,{unsafe:!0})},6833:(e,n,t)=>{var r=t(2109),o=t(4699).values;r({target:"Object",stat:!0},{values:function(e){return o(e)}})},2419:(e,n,t)=>{var r=t(2109),o=t(5005),i=t(2104),a=t(7065),l=t(9483),c=t(9670),u=t(111),s=t(30),f=t(7293),p=o("Reflect","construct"),d=Object.prototype,h=[].push,g=f((function(){function e(){}return!(p((function(){}),[],e)instanceof e)})),v=!f((function(){p((function(){}))})),A=g||v;r({target:"Reflect",stat:!0,forced:A,sham:A},{construct:function(e,n){l(e),c(n);var t=arguments.length<3?e:l(arguments[2]);if(v&&!g)return p(e,n,t);if(e==t){switch(n.length){case 0:return new e;case 1:return new e(n[0]);case 2:return new e(n[0],n[1]);case 3:return new e(n[0],n[1],n[2]);case 4:return new e(n[0],n[1],n[2],n[3])}var r=[null];return i(h,r,n),new(i(a,e,r))}var o=t.prototype,f=s(u(o)?o:d),A=i(e,f,n);return u(A)?A:f}})},4916:(e,n,t)=>{"use strict";var r=t(2109),o=t(2261);r({target:"RegExp",proto:!0,forced:/./.exec!==o},{exec:o})},9714:(e,n,t)=>{"use strict";var r=t(1702),o=t(6530).PROPER,i=t(1320),a=t(9670),l=t(7976),c=t(1340),u=t(7293),s=t(7066),f="toString",p=RegExp.prototype,d=p.toString,h=r(s),g=u((function(){return"/a/b"!=d.call({source:"a",flags:"b"})})),v=o&&d.name!=f;(g||v)&&i(RegExp.prototype,f,(function(){var e=a(this),n=c(e.source),t=e.flags;return"/"+n+"/"+c(void 0===t&&l(p,e)&&!("flags"in p)?h(e):t)}),{unsafe:!0})},189:(e,n,t)=>{"use strict";t(7710)("Set",(function(e){return function(){return e(this,arguments.length?arguments[0]:void 0)}}),t(5631))},5218:(e,n,t)=>{"use strict";var r=t(2109),o=t(4230);r({target:"String",proto:!0,forced:t(3429)("anchor")},{anchor:function(e){return o(this,"a","name",e)}})},2023:(e,n,t)=>{"use strict";var r=t(2109),o=t(1702),i=t(3929),a=t(4488),l=t(1340),c=t(4964),u=o("".indexOf);r({target:"String",proto:!0,forced:!c("includes")},{includes:function(e){return!!~u(l(a(this)),l(i(e)),arguments.length>1?arguments[1]:void 0)}})},8783:(e,n,t)=>{"use strict";var r=t(8710).charAt,o=t(1340),i=t(9909),a=t(654),l="String Iterator",c=i.set,u=i.getterFor(l);a(String,"String",(function(e){c(this,{type:l,string:o(e),index:0})}),(function(){var e,n=u(this),t=n.string,o=n.index;return o>=t.length?{value:void 0,done:!0}:(e=r(t,o),n.index+=e.length,{value:e,done:!1})}))},9254:(e,n,t)=>{"use strict";var r=t(2109),o=t(4230);r({target:"String",proto:!0,forced:t(3429)("link")},{link:function(e){return o(this,"a","href",e)}})},4723:(e,n,t)=>{"use strict";var r=t(6916),o=t(7007),i=t(9670),a=t(7466),l=t(1340),c=t(4488),u=t(8173),s=t(1530),f=t(7651);o("match",(function(e,n,t){return[function(n){var t=c(this),o=null==n?void 0:u(n,e);return o?r(o,n,t):new RegExp(n)[e](l(t))},function(e){var r=i(this),o=l(e),c=t(n,r,o);if(c.done)return c.value;if(!r.global)return f(r,o);var u=r.unicode;r.lastIndex=0;for(var p,d=[],h=0;null!==(p=f(r,o));){var g=l(p[0]);d[h]=g,""===g&&(r.lastIndex=s(o,a(r.lastIndex),u)),h++}return 0===h?null:d}]}))},5306:(e,n,t)=>{"use strict";var r=t(2104),o=t(6916),i=t(1702),a=t(7007),l=t(7293),c=t(9670),u=t(614),s=t(9303),f=t(7466),p=t(1340),d=t(4488),h=t(1530),g=t(8173),v=t(647),A=t(7651),b=t(5112)("replace"),m=Math.max,y=Math.min,E=i([].concat),_=i([].push),C=i("".indexOf),w=i("".slice),x="$0"==="a".replace(/./,"$0"),k=!!/./[b]&&""===/./[b]("a","$0");a("replace",(function(e,n,t){var i=k?"$":"$0";return[function(e,t){var r=d(this),i=null==e?void 0:g(e,b);return i?o(i,e,r,t):o(n,p(r),e,t)},function(e,o){var a=c(this),l=p(e);if("string"==typeof o&&-1===C(o,i)&&-1===C(o,"$<")){var d=t(n,a,l,o);if(d.done)return d.value}var g=u(o);g||(o=p(o));var b=a.global;if(b){var x=a.unicode;a.lastIndex=0}for(var k=[];;){var S=A(a,l);if(null===S)break;if(_(k,S),!b)break;""===p(S[0])&&(a.lastIndex=h(l,f(a.lastIndex),x))}for(var O,B="",I=0,T=0;T<k.length;T++){for(var P=p((S=k[T])[0]),j=m(y(s(S.index),l.length),0),z=[],R=1;R<S.length;R++)_(z,void 0===(O=S[R])?O:String(O));var M=S.groups;if(g){var D=E([P],z,j,l);void 0!==M&&_(D,M);var N=p(r(o,void 0,D))}else N=v(P,l,j,z,M,o);j>=I&&(B+=w(l,I,j)+N,I=j+P.length)}return B+w(l,I)}]}),!!l((function(){var e=/./;return e.exec=function(){var e=[];return e.groups={a:"7"},e},"7"!=="".replace(e,"$<a>")}))||!x||k)},3123:(e,n,t)=>{"use strict";var r=t(2104),o=t(6916),i=t(1702),a=t(7007),l=t(7850),c=t(9670),u=t(4488),s=t(6707),f=t(1530),p=t(7466),d=t(1340),h=t(8173),g=t(206),v=t(7651),A=t(2261),b=t(2999),m=t(7293),y=b.UNSUPPORTED_Y,E=4294967295,_=Math.min,C=[].push,w=i(/./.exec),x=i(C),k=i("".slice);a("split",(function(e,n,t){var i;return i="c"=="abbc".split(/(b)*/)[1]||4!="test".split(/(?:)/,-1).length||2!="ab".split(/(?:ab)*/).length||4!=".".split(/(.?)(.?)/).length||".".split(/()()/).length>1||"".split(/.?/).length?function(e,t){var i=d(u(this)),a=void 0===t?E:t>>>0;if(0===a)return[];if(void 0===e)return[i];if(!l(e))return o(n,i,e,a);for(var c,s,f,p=[],h=(e.ignoreCase?"i":"")+(e.multiline?"m":"")+(e.unicode?"u":"")+(e.sticky?"y":""),v=0,b=new RegExp(e.source,h+"g");(c=o(A,b,i))&&!((s=b.lastIndex)>v&&(x(p,k(i,v,c.index)),c.length>1&&c.index<i.length&&r(C,p,g(c,1)),f=c[0].length,v=s,p.length>=a));)b.lastIndex===c.index&&b.lastIndex++;return v===i.length?!f&&w(b,"")||x(p,""):x(p,k(i,v)),p.length>a?g(p,0,a):p}:"0".split(void 0,0).length?function(e,t){return void 0===e&&0===t?[]:o(n,this,e,t)}:n,[function(n,t){var r=u(this),a=null==n?void 0:h(n,e);return a?o(a,n,r,t):o(i,d(r),n,t)},function(e,r){var o=c(this),a=d(e),l=t(i,o,a,r,i!==n);if(l.done)return l.value;var u=s(o,RegExp),h=o.unicode,g=(o.ignoreCase?"i":"")+(o.multiline?"m":"")+(o.unicode?"u":"")+(y?"g":"y"),A=new u(y?"^(?:"+o.source+")":o,g),b=void 0===r?E:r>>>0;if(0===b)return[];if(0===a.length)return null===v(A,a)?[a]:[];for(var m=0,C=0,w=[];C<a.length;){A.lastIndex=y?0:C;var S,O=v(A,y?k(a,C):a);if(null===O||(S=_(p(A.lastIndex+(y?C:0)),a.length))===m)C=f(a,C,h);else{if(x(w,k(a,m,C)),w.length===b)return w;for(var B=1;B<=O.length-1;B++)if(x(w,O[B]),w.length===b)return w;C=m=S}}return x(w,k(a,m)),w}]}),!!m((function(){var e=/(?:)/,n=e.exec;e.exec=function(){return n.apply(this,arguments)};var t="ab".split(e);return 2!==t.length||"a"!==t[0]||"b"!==t[1]})),y)},6755:(e,n,t)=>{"use strict";var r,o=t(2109),i=t(1702),a=t(1236).f,l=t(7466),c=t(1340),u=t(3929),s=t(4488),f=t(4964),p=t(1913),d=i("".startsWith),h=i("".slice),g=Math.min,v=f("startsWith");o({target:"String",proto:!0,forced:!!(p||v||(r=a(String.prototype,"startsWith"),!r||r.writable))&&!v},{startsWith:function(e){var n=c(s(this));u(e);var t=l(g(arguments.length>1?arguments[1]:void 0,n.length)),r=c(e);return d?d(n,r,t):h(n,t,t+r.length)===r}})},3210:(e,n,t)=>{"use strict";var r=t(2109),o=t(3111).trim;r({target:"String",proto:!0,forced:t(6091)("trim")},{trim:function(){return o(this)}})},1817:(e,n,t)=>{"use strict";var r=t(2109),o=t(9781),i=t(7854),a=t(1702),l=t(2597),c=t(614),u=t(7976),s=t(1340),f=t(3070).f,p=t(9920),d=i.Symbol,h=d&&d.prototype;if(o&&c(d)&&(!("description"in h)||void 0!==d().description)){var g={},v=function(){var e=arguments.length<1||void 0===arguments[0]?void 0:s(arguments[0]),n=u(h,this)?new d(e):void 0===e?d():d(e);return""===e&&(g[n]=!0),n};p(v,d),v.prototype=h,h.constructor=v;var A="Symbol(test)"==String(d("test")),b=a(h.toString),m=a(h.valueOf),y=/^Symbol\((.*)\)[^)]+$/,E=a("".replace),_=a("".slice);f(h,"description",{configurable:!0,get:function(){var e=m(this),n=b(e);if(l(g,e))return"";var t=A?_(n,7,-1):E(n,y,"$1");return""===t?void 0:t}}),r({global:!0,forced:!0},{Symbol:v})}},2165:(e,n,t)=>{t(7235)("iterator")},2526:(e,n,t)=>{"use strict";var r=t(2109),o=t(7854),i=t(5005),a=t(2104),l=t(6916),c=t(1702),u=t(1913),s=t(9781),f=t(133),p=t(7293),d=t(2597),h=t(3157),g=t(614),v=t(111),A=t(7976),b=t(2190),m=t(9670),y=t(7908),E=t(5656),_=t(4948),C=t(1340),w=t(9114),x=t(30),k=t(1956),S=t(8006),O=t(1156),B=t(5181),I=t(1236),T=t(3070),P=t(5296),j=t(206),z=t(1320),R=t(2309),M=t(6200),D=t(3501),N=t(9711),L=t(5112),F=t(6061),U=t(7235),W=t(8003),H=t(9909),G=t(2092).forEach,q=M("hidden"),V="Symbol",$=L("toPrimitive"),K=H.set,Y=H.getterFor(V),X=Object.prototype,Z=o.Symbol,Q=Z&&Z.prototype,J=o.TypeError,ee=o.QObject,ne=i("JSON","stringify"),te=I.f,re=T.f,oe=O.f,ie=P.f,ae=c([].push),le=R("symbols"),ce=R("op-symbols"),ue=R("string-to-symbol-registry"),se=R("symbol-to-string-registry"),fe=R("wks"),pe=!ee||!ee.prototype||!ee.prototype.findChild,de=s&&p((function(){return 7!=x(re({},"a",{get:function(){return re(this,"a",{value:7}).a}})).a}))?function(e,n,t){var r=te(X,n);r&&delete X[n],re(e,n,t),r&&e!==X&&re(X,n,r)}:re,he=function(e,n){var t=le[e]=x(Q);return K(t,{type:V,tag:e,description:n}),s||(t.description=n),t},ge=function(e,n,t){e===X&&ge(ce,n,t),m(e);var r=_(n);return m(t),d(le,r)?(t.enumerable?(d(e,q)&&e[q][r]&&(e[q][r]=!1),t=x(t,{enumerable:w(0,!1)})):(d(e,q)||re(e,q,w(1,{})),e[q][r]=!0),de(e,r,t)):re(e,r,t)},ve=function(e,n){m(e);var t=E(n),r=k(t).concat(ye(t));return G(r,(function(n){s&&!l(Ae,t,n)||ge(e,n,t[n])})),e},Ae=function(e){var n=_(e),t=l(ie,this,n);return!(this===X&&d(le,n)&&!d(ce,n))&&(!(t||!d(this,n)||!d(le,n)||d(this,q)&&this[q][n])||t)},be=function(e,n){var t=E(e),r=_(n);if(t!==X||!d(le,r)||d(ce,r)){var o=te(t,r);return!o||!d(le,r)||d(t,q)&&t[q][r]||(o.enumerable=!0),o}},me=function(e){var n=oe(E(e)),t=[];return G(n,(function(e){d(le,e)||d(D,e)||ae(t,e)})),t},ye=function(e){var n=e===X,t=oe(n?ce:E(e)),r=[];return G(t,(function(e){!d(le,e)||n&&!d(X,e)||ae(r,le[e])})),r};(f||(z(Q=(Z=function(){if(A(Q,this))throw J("Symbol is not a constructor");var e=arguments.length&&void 0!==arguments[0]?C(arguments[0]):void 0,n=N(e),t=function(e){this===X&&l(t,ce,e),d(this,q)&&d(this[q],n)&&(this[q][n]=!1),de(this,n,w(1,e))};return s&&pe&&de(X,n,{configurable:!0,set:t}),he(n,e)}).prototype,"toString",(function(){return Y(this).tag})),z(Z,"withoutSetter",(function(e){return he(N(e),e)})),P.f=Ae,T.f=ge,I.f=be,S.f=O.f=me,B.f=ye,F.f=function(e){return he(L(e),e)},s&&(re(Q,"description",{configurable:!0,get:function(){return Y(this).description}}),u||z(X,"propertyIsEnumerable",Ae,{unsafe:!0}))),r({global:!0,wrap:!0,forced:!f,sham:!f},{Symbol:Z}),G(k(fe),(function(e){U(e)})),r({target:V,stat:!0,forced:!f},{for:function(e){var n=C(e);if(d(ue,n))return ue[n];var t=Z(n);return ue[n]=t,se[t]=n,t},keyFor:function(e){if(!b(e))throw J(e+" is not a symbol");if(d(se,e))return se[e]},useSetter:function(){pe=!0},useSimple:function(){pe=!1}}),r({target:"Object",stat:!0,forced:!f,sham:!s},{create:function(e,n){return void 0===n?x(e):ve(x(e),n)},defineProperty:ge,defineProperties:ve,getOwnPropertyDescriptor:be}),r({target:"Object",stat:!0,forced:!f},{getOwnPropertyNames:me,getOwnPropertySymbols:ye}),r({target:"Object",stat:!0,forced:p((function(){B.f(1)}))},{getOwnPropertySymbols:function(e){return B.f(y(e))}}),ne)&&r({target:"JSON",stat:!0,forced:!f||p((function(){var e=Z();return"[null]"!=ne([e])||"{}"!=ne({a:e})||"{}"!=ne(Object(e))}))},{stringify:function(e,n,t){var r=j(arguments),o=n;if((v(n)||void 0!==e)&&!b(e))return h(n)||(n=function(e,n){if(g(o)&&(n=l(o,this,e,n)),!b(n))return n}),r[1]=n,a(ne,null,r)}});if(!Q[$]){var Ee=Q.valueOf;z(Q,$,(function(e){return l(Ee,this)}))}W(Z,V),D[q]=!0},6649:(e,n,t)=>{t(7235)("toPrimitive")},4129:(e,n,t)=>{"use strict";var r,o=t(7854),i=t(1702),a=t(2248),l=t(2423),c=t(7710),u=t(9320),s=t(111),f=t(2050),p=t(9909).enforce,d=t(8536),h=!o.ActiveXObject&&"ActiveXObject"in o,g=function(e){return function(){return e(this,arguments.length?arguments[0]:void 0)}},v=c("WeakMap",g,u);if(d&&h){r=u.getConstructor(g,"WeakMap",!0),l.enable();var A=v.prototype,b=i(A.delete),m=i(A.has),y=i(A.get),E=i(A.set);a(A,{delete:function(e){if(s(e)&&!f(e)){var n=p(this);return n.frozen||(n.frozen=new r),b(this,e)||n.frozen.delete(e)}return b(this,e)},has:function(e){if(s(e)&&!f(e)){var n=p(this);return n.frozen||(n.frozen=new r),m(this,e)||n.frozen.has(e)}return m(this,e)},get:function(e){if(s(e)&&!f(e)){var n=p(this);return n.frozen||(n.frozen=new r),m(this,e)?y(this,e):n.frozen.get(e)}return y(this,e)},set:function(e,n){if(s(e)&&!f(e)){var t=p(this);t.frozen||(t.frozen=new r),m(this,e)?E(this,e,n):t.frozen.set(e,n)}else E(this,e,n);return this}})}},4747:(e,n,t)=>{var r=t(7854),o=t(8324),i=t(8509),a=t(8533),l=t(8880),c=function(e){if(e&&e.forEach!==a)try{l(e,"forEach",a)}catch(n){e.forEach=a}};for(var u in o)o[u]&&c(r[u]&&r[u].prototype);c(i)},3948:(e,n,t)=>{var r=t(7854),o=t(8324),i=t(8509),a=t(6992),l=t(8880),c=t(5112),u=c("iterator"),s=c("toStringTag"),f=a.values,p=function(e,n){if(e){if(e[u]!==f)try{l(e,u,f)}catch(n){e[u]=f}if(e[s]||l(e,s,n),o[n])for(var t in a)if(e[t]!==a[t])try{l(e,t,a[t])}catch(n){e[t]=a[t]}}};for(var d in o)p(r[d]&&r[d].prototype,d);p(i,"DOMTokenList")},2564:(e,n,t)=>{var r=t(2109),o=t(7854),i=t(2104),a=t(614),l=t(8113),c=t(206),u=/MSIE .\./.test(l),s=o.Function,f=function(e){return function(n,t){var r=arguments.length>2,o=r?c(arguments,2):void 0;return e(r?function(){i(a(n)?n:s(n),this,o)}:n,t)}};r({global:!0,bind:!0,forced:u},{setTimeout:f(o.setTimeout),setInterval:f(o.setInterval)})},3579:(e,n,t)=>{"use strict";t.d(n,{Z:()=>s});var r=t(7537),o=t.n(r),i=t(3645),a=t.n(i),l=t(8004),c=t(3181),u=a()(o());u.i(c.Z),u.i(l.default,"",!0),u.push([e.id,".alert_aca6 {\n  position: relative;\n\n  display: flex;\n  align-items: baseline;\n\n  box-sizing: border-box;\n  min-height: 40px;\n  margin: 8px auto;\n  padding: 0 16px;\n\n  transition:\n    transform 300ms ease-out,\n    margin-bottom 300ms ease-out,\n    opacity 300ms ease-out;\n  white-space: nowrap;\n  pointer-events: auto;\n\n  border-radius: var(--ring-border-radius);\n  background-color: var(--ring-message-background-color);\n  box-shadow: 0 2px 16px var(--ring-popup-shadow-color);\n\n  font-size: var(--ring-font-size);\n  line-height: 40px;\n}\n\n.alertInline_dd24 {\n  margin: 8px;\n}\n\n.error_c230 {\n  word-wrap: break-word;\n\n  color: var(--ring-error-color);\n}\n\n.icon_bfce {\n  margin-right: 8px;\n}\n\n.caption_b385 {\n  overflow: hidden;\n\n  max-width: calc(100% - 40px);\n\n  margin: 12px 0;\n\n  white-space: normal;\n\n  color: var(--ring-dark-text-color);\n\n  line-height: 20px\n}\n\n.caption_b385 .ring-link,\n  \n  .caption_b385 .link_e6c9 {\n    color: var(--ring-main-color);\n  }\n\n.caption_b385.withCloseButton_a73c {\n    margin-right: 40px;\n  }\n\n.badge_d04e {\n  margin-left: 8px;\n\n  vertical-align: baseline;\n}\n\n.loader_a29a {\n  top: 2px;\n\n  margin-right: 8px;\n}\n\n@media (hover: hover), (-moz-touch-enabled: 0), (-ms-high-contrast: none), (-ms-high-contrast: active) {.close_db7d:hover {\n    color: var(--ring-link-hover-color);\n  }}\n\n.close_db7d {\n  position: absolute;\n  top: 2px;\n  right: 0;\n\n  margin: 4px;\n  padding: 8px;\n\n  cursor: pointer;\n\n  color: var(--ring-dark-secondary-color);\n  border: none;\n  background: transparent;\n\n  font-size: 0;\n  line-height: 0\n}\n\n.close_db7d:focus {\n    color: var(--ring-link-hover-color);\n  }\n\n@-webkit-keyframes show_b341 {\n  from {\n    transform: translateY(100%);\n\n    opacity: 0;\n  }\n\n  to {\n    transform: translateY(0);\n\n    opacity: 1;\n  }\n}\n\n@keyframes show_b341 {\n  from {\n    transform: translateY(100%);\n\n    opacity: 0;\n  }\n\n  to {\n    transform: translateY(0);\n\n    opacity: 1;\n  }\n}\n\n@-webkit-keyframes shaking_d7c0 {\n  10%,\n  90% {\n    transform: translateX(-1px);\n  }\n\n  20%,\n  80% {\n    transform: translateX(2px);\n  }\n\n  30%,\n  50%,\n  70% {\n    transform: translateX(-4px);\n  }\n\n  40%,\n  60% {\n    transform: translateX(4px);\n  }\n}\n\n@keyframes shaking_d7c0 {\n  10%,\n  90% {\n    transform: translateX(-1px);\n  }\n\n  20%,\n  80% {\n    transform: translateX(2px);\n  }\n\n  30%,\n  50%,\n  70% {\n    transform: translateX(-4px);\n  }\n\n  40%,\n  60% {\n    transform: translateX(4px);\n  }\n}\n\n.animationOpen_e3fd {\n  -webkit-animation-name: show_b341;\n          animation-name: show_b341;\n  -webkit-animation-duration: 300ms;\n          animation-duration: 300ms;\n}\n\n.animationClosing_c4ce {\n  z-index: var(--ring-invisible-element-z-index);\n\n  opacity: 0;\n}\n\n.animationShaking_d53d {\n  -webkit-animation-name: shaking_d7c0;\n          animation-name: shaking_d7c0;\n  -webkit-animation-duration: 500ms;\n          animation-duration: 500ms;\n}\n","",{version:3,sources:["webpack://./node_modules/@jetbrains/ring-ui/components/alert/alert.css","<no source>"],names:[],mappings:"AAMA;EACE,kBAAkB;;EAElB,aAAa;EACb,qBAAqB;;EAErB,sBAAsB;EACtB,gBAA0B;EAC1B,gBAAiB;EACjB,eAAyB;;EAEzB;;;0BAG6C;EAC7C,mBAAmB;EACnB,oBAAoB;;EAEpB,wCAAwC;EACxC,sDAAsD;EACtD,qDAAqD;;EAErD,gCAAgC;EAChC,iBAA2B;AAC7B;;AAEA;EACE,WAAY;AACd;;AAEA;EACE,qBAAqB;;EAErB,8BAA8B;AAChC;;AAEA;EACE,iBAAkB;AACpB;;AAEA;EACE,gBAAgB;;EAEhB,4BAAsC;;EAEtC,cAAc;;EAEd,mBAAmB;;EAEnB,kCAAkC;;EAElC;AAWF;;AATE;;;IAGE,6BAA6B;EAC/B;;AAEA;IACE,kBAA4B;EAC9B;;AAGF;EACE,gBAAiB;;EAEjB,wBAAwB;AAC1B;;AAEA;EACE,QAAQ;;EAER,iBAAkB;AACpB;;AChFA,wGAAA;IAAA,oCAAA;GAAA,CAAA;;ADkFA;EACE,kBAAkB;EAClB,QAAQ;EACR,QAAQ;;EAER,WAAsB;EACtB,YAAa;;EAEb,eAAe;;EAEf,uCAAuC;EACvC,YAAY;EACZ,uBAAuB;;EAEvB,YAAY;EACZ;AAMF;;AAJE;IAEE,mCAAmC;EACrC;;AAGF;EACE;IACE,2BAA2B;;IAE3B,UAAU;EACZ;;EAEA;IACE,wBAAwB;;IAExB,UAAU;EACZ;AACF;;AAZA;EACE;IACE,2BAA2B;;IAE3B,UAAU;EACZ;;EAEA;IACE,wBAAwB;;IAExB,UAAU;EACZ;AACF;;AAEA;EACE;;IAEE,2BAA2B;EAC7B;;EAEA;;IAEE,0BAA0B;EAC5B;;EAEA;;;IAGE,2BAA2B;EAC7B;;EAEA;;IAEE,0BAA0B;EAC5B;AACF;;AArBA;EACE;;IAEE,2BAA2B;EAC7B;;EAEA;;IAEE,0BAA0B;EAC5B;;EAEA;;;IAGE,2BAA2B;EAC7B;;EAEA;;IAEE,0BAA0B;EAC5B;AACF;;AAEA;EACE,iCAAoB;UAApB,yBAAoB;EACpB,iCAAsC;UAAtC,yBAAsC;AACxC;;AAEA;EACE,8CAA8C;;EAE9C,UAAU;AACZ;;AAEA;EACE,oCAAuB;UAAvB,4BAAuB;EACvB,iCAAyB;UAAzB,yBAAyB;AAC3B",sourcesContent:['@import "../global/variables.css";\n\n@value unit from "../global/global.css";\n@value animation-duration: 300ms;\n@value animation-easing: ease-out;\n\n.alert {\n  position: relative;\n\n  display: flex;\n  align-items: baseline;\n\n  box-sizing: border-box;\n  min-height: calc(unit * 5);\n  margin: unit auto;\n  padding: 0 calc(unit * 2);\n\n  transition:\n    transform animation-duration animation-easing,\n    margin-bottom animation-duration animation-easing,\n    opacity animation-duration animation-easing;\n  white-space: nowrap;\n  pointer-events: auto;\n\n  border-radius: var(--ring-border-radius);\n  background-color: var(--ring-message-background-color);\n  box-shadow: 0 2px 16px var(--ring-popup-shadow-color);\n\n  font-size: var(--ring-font-size);\n  line-height: calc(unit * 5);\n}\n\n.alertInline {\n  margin: unit;\n}\n\n.error {\n  word-wrap: break-word;\n\n  color: var(--ring-error-color);\n}\n\n.icon {\n  margin-right: unit;\n}\n\n.caption {\n  overflow: hidden;\n\n  max-width: calc(100% - calc(unit * 5));\n\n  margin: 12px 0;\n\n  white-space: normal;\n\n  color: var(--ring-dark-text-color);\n\n  line-height: 20px;\n\n  & :global(.ring-link),\n  /* This link styles are used in link.css */\n  & .link {\n    color: var(--ring-main-color);\n  }\n\n  &.withCloseButton {\n    margin-right: calc(unit * 5);\n  }\n}\n\n.badge {\n  margin-left: unit;\n\n  vertical-align: baseline;\n}\n\n.loader {\n  top: 2px;\n\n  margin-right: unit;\n}\n\n.close {\n  position: absolute;\n  top: 2px;\n  right: 0;\n\n  margin: calc(unit / 2);\n  padding: unit;\n\n  cursor: pointer;\n\n  color: var(--ring-dark-secondary-color);\n  border: none;\n  background: transparent;\n\n  font-size: 0;\n  line-height: 0;\n\n  &:hover,\n  &:focus {\n    color: var(--ring-link-hover-color);\n  }\n}\n\n@keyframes show {\n  from {\n    transform: translateY(100%);\n\n    opacity: 0;\n  }\n\n  to {\n    transform: translateY(0);\n\n    opacity: 1;\n  }\n}\n\n@keyframes shaking {\n  10%,\n  90% {\n    transform: translateX(-1px);\n  }\n\n  20%,\n  80% {\n    transform: translateX(2px);\n  }\n\n  30%,\n  50%,\n  70% {\n    transform: translateX(-4px);\n  }\n\n  40%,\n  60% {\n    transform: translateX(4px);\n  }\n}\n\n.animationOpen {\n  animation-name: show;\n  animation-duration: animation-duration;\n}\n\n.animationClosing {\n  z-index: var(--ring-invisible-element-z-index);\n\n  opacity: 0;\n}\n\n.animationShaking {\n  animation-name: shaking;\n  animation-duration: 500ms;\n}\n',null],sourceRoot:""}]),u.locals={unit:""+l.default.locals.unit,"animation-duration":"300ms","animation-easing":"ease-out",alert:"alert_aca6",alertInline:"alertInline_dd24",error:"error_c230",icon:"icon_bfce",caption:"caption_b385",link:"link_e6c9",withCloseButton:"withCloseButton_a73c",badge:"badge_d04e",loader:"loader_a29a",close:"close_db7d",animationOpen:"animationOpen_e3fd",show:"show_b341",animationClosing:"animationClosing_c4ce",animationShaking:"animationShaking_d53d",shaking:"shaking_d7c0"};const s=u},8759:(e,n,t)=>{"use strict";t.r(n),t.d(n,{default:()=>u});var r=t(7537),o=t.n(r),i=t(3645),a=t.n(i),l=t(3181),c=a()(o());c.i(l.Z),c.push([e.id,'.avatar_d716 {\n  display: inline-block;\n  -o-object-fit: cover;\n     object-fit: cover;\n  -o-object-position: center;\n     object-position: center;\n\n  /* This is a "graceful degradation" fallback, while the real value is controlled by JS */\n\n  border-radius: var(--ring-border-radius);\n}\n\n.subavatar_b10d {\n  position: absolute;\n  top: 15px;\n  left: 27px;\n\n  border: 1px var(--ring-content-background-color) solid;\n}\n\n.empty_a151 {\n  display: inline-block;\n\n  box-sizing: border-box;\n\n  border: 1px solid var(--ring-borders-color);\n}\n',"",{version:3,sources:["webpack://./node_modules/@jetbrains/ring-ui/components/avatar/avatar.css"],names:[],mappings:"AAEA;EACE,qBAAqB;EACrB,oBAAiB;KAAjB,iBAAiB;EACjB,0BAAuB;KAAvB,uBAAuB;;EAEvB,wFAAwF;;EAExF,wCAAwC;AAC1C;;AAEA;EACE,kBAAkB;EAClB,SAAS;EACT,UAAU;;EAEV,sDAAsD;AACxD;;AAEA;EACE,qBAAqB;;EAErB,sBAAsB;;EAEtB,2CAA2C;AAC7C",sourcesContent:['@import "../global/variables.css";\n\n.avatar {\n  display: inline-block;\n  object-fit: cover;\n  object-position: center;\n\n  /* This is a "graceful degradation" fallback, while the real value is controlled by JS */\n\n  border-radius: var(--ring-border-radius);\n}\n\n.subavatar {\n  position: absolute;\n  top: 15px;\n  left: 27px;\n\n  border: 1px var(--ring-content-background-color) solid;\n}\n\n.empty {\n  display: inline-block;\n\n  box-sizing: border-box;\n\n  border: 1px solid var(--ring-borders-color);\n}\n'],sourceRoot:""}]),c.locals={avatar:"avatar_d716",subavatar:"subavatar_b10d",empty:"empty_a151"};const u=c},5469:(e,n,t)=>{"use strict";t.d(n,{Z:()=>f});var r=t(7537),o=t.n(r),i=t(3645),a=t.n(i),l=t(8004),c=t(9131),u=t(3181),s=a()(o());s.i(u.Z),s.i(l.default,"",!0),s.i(c.Z,"",!0),s.push([e.id,":root {\n  --ring-button-group-default-z-index: 0;\n  --ring-button-group-disabled-z-index: -1;\n  --ring-button-group-active-z-index: 1;\n  --ring-button-group-hover-z-index: 2;\n  --ring-button-group-focus-z-index: 3;\n}\n\n.buttonGroup_fbe4 {\n\n  position: relative;\n  z-index: 0;\n\n  display: inline-block;\n\n  white-space: nowrap;\n}\n\n.buttonGroup_fbe4 button,\n.buttonGroup_fbe4 .button_ea9a {\n  margin: 0 0 0 -1px;\n\n  border-radius: 0;\n}\n\n.caption_c8e1 {\n\n  margin-right: 8px;\n\n  font-size: var(--ring-font-size)\n}\n\n.caption_c8e1:empty {\n    margin-right: 0;\n  }\n\n.buttonGroup_fbe4 > .caption_c8e1 + .button_ea9a,\n.buttonGroup_fbe4 > button:first-child,\n.buttonGroup_fbe4 > .button_ea9a:first-child,\n.buttonGroup_fbe4 > :first-child .button_ea9a {\n  margin: 0;\n\n  border-top-left-radius: var(--ring-border-radius);\n  border-bottom-left-radius: var(--ring-border-radius);\n}\n\n.buttonGroup_fbe4 > .button_ea9a:last-child,\n.buttonGroup_fbe4 > button:last-child,\n.buttonGroup_fbe4 > :last-child .button_ea9a {\n  border-top-right-radius: var(--ring-border-radius);\n  border-bottom-right-radius: var(--ring-border-radius);\n}\n\n.buttonGroup_fbe4 .button_ea9a {\n    position: relative;\n    z-index: 0;\n    z-index: var(--ring-button-group-default-z-index)\n  }\n\n.buttonGroup_fbe4 .button_ea9a[disabled] {\n      z-index: -1;\n      z-index: var(--ring-button-group-disabled-z-index);\n    }\n\n.buttonGroup_fbe4 .button_ea9a:active {\n      z-index: 1;\n      z-index: var(--ring-button-group-active-z-index);\n    }\n\n@media (hover: hover), (-moz-touch-enabled: 0), (-ms-high-contrast: none), (-ms-high-contrast: active) {.buttonGroup_fbe4 .button_ea9a:hover {\n      z-index: 2;\n      z-index: var(--ring-button-group-hover-z-index);\n    }}\n\n.buttonGroup_fbe4 .button_ea9a:focus {\n      z-index: 3;\n      z-index: var(--ring-button-group-focus-z-index);\n    }\n\n.buttonGroup_fbe4 .active_be1c {\n    z-index: 1;\n    z-index: var(--ring-button-group-active-z-index);\n  }\n","",{version:3,sources:["webpack://./node_modules/@jetbrains/ring-ui/components/button-group/button-group.css","<no source>"],names:[],mappings:"AAIA;EACE,sCAAsC;EACtC,wCAAwC;EACxC,qCAAqC;EACrC,oCAAoC;EACpC,oCAAoC;AACtC;;AAEA;;EAGE,kBAAkB;EAClB,UAAU;;EAEV,qBAAqB;;EAErB,mBAAmB;AACrB;;AAEA;;EAEE,kBAAkB;;EAElB,gBAAgB;AAClB;;AAEA;;EAGE,iBAAkB;;EAElB;AAKF;;AAHE;IACE,eAAe;EACjB;;AAGF;;;;EAIE,SAAS;;EAET,iDAAiD;EACjD,oDAAoD;AACtD;;AAEA;;;EAGE,kDAAkD;EAClD,qDAAqD;AACvD;;AAGE;IACE,kBAAkB;IAClB,UAAiD;IAAjD;EAiBF;;AAfE;MACE,WAAkD;MAAlD,kDAAkD;IACpD;;AAEA;MACE,UAAgD;MAAhD,gDAAgD;IAClD;;ACtEJ,wGAAA;MAAA,WAAA;MAAA,gDAAA;KAAA,CAAA;;AD4EI;MACE,UAA+C;MAA/C,+CAA+C;IACjD;;AAGF;IACE,UAAgD;IAAhD,gDAAgD;EAClD",sourcesContent:['@import "../global/variables.css";\n\n@value unit from "../global/global.css";\n\n:root {\n  --ring-button-group-default-z-index: 0;\n  --ring-button-group-disabled-z-index: -1;\n  --ring-button-group-active-z-index: 1;\n  --ring-button-group-hover-z-index: 2;\n  --ring-button-group-focus-z-index: 3;\n}\n\n.buttonGroup {\n  composes: buttonGroup from "../button-toolbar/button-toolbar.css";\n\n  position: relative;\n  z-index: 0;\n\n  display: inline-block;\n\n  white-space: nowrap;\n}\n\n.buttonGroup button,\n.buttonGroup .button {\n  margin: 0 0 0 -1px;\n\n  border-radius: 0;\n}\n\n.caption {\n  composes: font from "../global/global.css";\n\n  margin-right: unit;\n\n  font-size: var(--ring-font-size);\n\n  &:empty {\n    margin-right: 0;\n  }\n}\n\n.buttonGroup > .caption + .button,\n.buttonGroup > button:first-child,\n.buttonGroup > .button:first-child,\n.buttonGroup > :first-child .button {\n  margin: 0;\n\n  border-top-left-radius: var(--ring-border-radius);\n  border-bottom-left-radius: var(--ring-border-radius);\n}\n\n.buttonGroup > .button:last-child,\n.buttonGroup > button:last-child,\n.buttonGroup > :last-child .button {\n  border-top-right-radius: var(--ring-border-radius);\n  border-bottom-right-radius: var(--ring-border-radius);\n}\n\n.buttonGroup {\n  & .button {\n    position: relative;\n    z-index: var(--ring-button-group-default-z-index);\n\n    &[disabled] {\n      z-index: var(--ring-button-group-disabled-z-index);\n    }\n\n    &:active {\n      z-index: var(--ring-button-group-active-z-index);\n    }\n\n    &:hover {\n      z-index: var(--ring-button-group-hover-z-index);\n    }\n\n    &:focus {\n      z-index: var(--ring-button-group-focus-z-index);\n    }\n  }\n\n  & .active {\n    z-index: var(--ring-button-group-active-z-index);\n  }\n}\n',null],sourceRoot:""}]),s.locals={unit:""+l.default.locals.unit,buttonGroup:"buttonGroup_fbe4 "+c.Z.locals.buttonGroup,button:"button_ea9a",caption:"caption_c8e1 "+l.default.locals.font,active:"active_be1c"};const f=s},135:(e,n,t)=>{"use strict";t.d(n,{Z:()=>s});var r=t(7537),o=t.n(r),i=t(3645),a=t.n(i),l=t(8004),c=t(3181),u=a()(o());u.i(c.Z),u.i(l.default,"",!0),u.push([e.id,".buttonSet_f415 {\n  position: relative;\n\n  display: inline-block;\n\n  white-space: nowrap;\n\n  font-size: 0\n}\n\n.buttonSet_f415 .button_f403 {\n    margin: 0 8px 0 0;\n  }\n\n.buttonSet_f415 > .button_f403:last-child {\n    margin-right: 0;\n  }\n","",{version:3,sources:["webpack://./node_modules/@jetbrains/ring-ui/components/button-set/button-set.css"],names:[],mappings:"AAIA;EACE,kBAAkB;;EAElB,qBAAqB;;EAErB,mBAAmB;;EAEnB;AASF;;AAPE;IACE,iBAAkB;EACpB;;AAEA;IACE,eAAe;EACjB",sourcesContent:['@import "../global/variables.css";\n\n@value unit from "../global/global.css";\n\n.buttonSet {\n  position: relative;\n\n  display: inline-block;\n\n  white-space: nowrap;\n\n  font-size: 0;\n\n  & .button {\n    margin: 0 unit 0 0;\n  }\n\n  & > .button:last-child {\n    margin-right: 0;\n  }\n}\n'],sourceRoot:""}]),u.locals={unit:""+l.default.locals.unit,buttonSet:"buttonSet_f415",button:"button_f403"};const s=u},9131:(e,n,t)=>{"use strict";t.d(n,{Z:()=>s});var r=t(7537),o=t.n(r),i=t(3645),a=t.n(i),l=t(8004),c=t(3181),u=a()(o());u.i(c.Z),u.i(l.default,"",!0),u.push([e.id,".buttonToolbar_f09a {\n  display: inline-block;\n\n  white-space: nowrap;\n\n  font-size: 0;\n}\n\n.buttonToolbar_f09a > button,\n.buttonToolbar_f09a > .ring-button-group,\n.buttonToolbar_f09a > .button_fc1d,\n.buttonToolbar_f09a > .buttonGroup_c55b,\n.buttonToolbar_f09a > .buttonToolbar_f09a {\n  margin-right: 8px;\n}\n\n.buttonToolbar_f09a > :last-child {\n  margin-right: 0;\n}\n","",{version:3,sources:["webpack://./node_modules/@jetbrains/ring-ui/components/button-toolbar/button-toolbar.css"],names:[],mappings:"AAIA;EACE,qBAAqB;;EAErB,mBAAmB;;EAEnB,YAAY;AACd;;AAEA;;;;;EAKE,iBAAkB;AACpB;;AAEA;EACE,eAAe;AACjB",sourcesContent:['@import "../global/variables.css";\n\n@value unit from "../global/global.css";\n\n.buttonToolbar {\n  display: inline-block;\n\n  white-space: nowrap;\n\n  font-size: 0;\n}\n\n.buttonToolbar > button,\n.buttonToolbar > :global(.ring-button-group),\n.buttonToolbar > .button,\n.buttonToolbar > .buttonGroup,\n.buttonToolbar > .buttonToolbar {\n  margin-right: unit;\n}\n\n.buttonToolbar > :last-child {\n  margin-right: 0;\n}\n'],sourceRoot:""}]),u.locals={unit:""+l.default.locals.unit,buttonToolbar:"buttonToolbar_f09a",button:"button_fc1d",buttonGroup:"buttonGroup_c55b"};const s=u},8199:(e,n,t)=>{"use strict";t.r(n),t.d(n,{default:()=>d});var r=t(7537),o=t.n(r),i=t(3645),a=t.n(i),l=t(8004),c=t(5469),u=t(135),s=t(9131),f=t(3181),p=a()(o());p.i(f.Z),p.i(l.default,"",!0),p.i(c.Z,"",!0),p.i(u.Z,"",!0),p.i(s.Z,"",!0),p.push([e.id,':root {\n  /* TODO: This colors are not ready to move to variables.css */\n  /* stylelint-disable color-no-hex */\n  --ring-button-primary-background-color: #1a98ff;\n  --ring-button-primary-border-color: #0062b2;\n  --ring-button-danger-active-color: #ffe7e8;\n  --ring-button-danger-hover-color: var(--ring-icon-error-color);\n  --ring-button-loader-background: #33a3ff;\n  --ring-button-dark-icon-color: #80929d;\n  --ring-button-dark-border-disabled-color: #333;\n  --ring-button-dark-icon-disabled-color: var(--ring-dark-disabled-color);\n  --ring-button-dark-danger-active-color: #26080a;\n  --ring-button-dark-danger-hover-color: var(--ring-error-color);\n  --ring-button-dark-active-color: #062640;\n  --ring-button-dark-loader-background: #002039;\n  /* stylelint-enable color-no-hex */\n}\n\n.light_b3b0 {\n  color: var(--ring-text-color);\n  background-color: var(--ring-content-background-color);\n  box-shadow: inset 0 0 0 1px var(--ring-borders-color)\n}\n\n@media (hover: hover), (-moz-touch-enabled: 0), (-ms-high-contrast: none), (-ms-high-contrast: active) {.light_b3b0:hover {\n    box-shadow: inset 0 0 0 1px var(--ring-border-hover-color);\n  }}\n\n.light_b3b0:active,\n  .light_b3b0.active_bbe6 {\n    background-color: var(--ring-selected-background-color);\n    box-shadow: inset 0 0 0 1px var(--ring-border-hover-color);\n  }\n\n.light_b3b0.focus-visible {\n    box-shadow: inset 0 0 0 1px var(--ring-border-hover-color), 0 0 0 1px var(--ring-border-hover-color);\n  }\n\n.light_b3b0[disabled] {\n    box-shadow: inset 0 0 0 1px var(--ring-border-disabled-color);\n  }\n\n.light_b3b0[disabled],\n  .light_b3b0[disabled].withIcon_ef77 {\n    color: var(--ring-disabled-color);\n  }\n\n.light_b3b0[disabled] .icon_e878 {\n    color: var(--ring-icon-disabled-color);\n  }\n\n.light_b3b0.primary_ddae:active,\n  .light_b3b0.primary_ddae.active_bbe6 {\n    background-color: #1a98ff;\n    background-color: var(--ring-button-primary-background-color);\n    box-shadow: inset 0 0 0 1px #0062b2;\n    box-shadow: inset 0 0 0 1px var(--ring-button-primary-border-color);\n  }\n\n.light_b3b0.danger_bcea:active,\n  .light_b3b0.danger_bcea.active_bbe6 {\n    background-color: #ffe7e8;\n    background-color: var(--ring-button-danger-active-color);\n  }\n\n.light_b3b0.danger_bcea:active,\n  .light_b3b0.danger_bcea.active_bbe6,\n  .light_b3b0.danger_bcea.focus-visible {\n    box-shadow: inset 0 0 0 1px var(--ring-icon-error-color);\n    box-shadow: inset 0 0 0 1px var(--ring-button-danger-hover-color);\n  }\n\n.light_b3b0.withIcon_ef77 {\n    color: var(--ring-secondary-color);\n  }\n\n.light_b3b0 .loaderBackground_d9f5::before {\n    background-image:\n      linear-gradient(\n        to right,\n        var(--ring-content-background-color),\n        var(--ring-selected-background-color) 40%,\n        var(--ring-content-background-color) 80%\n      );\n  }\n\n@media (hover: hover), (-moz-touch-enabled: 0), (-ms-high-contrast: none), (-ms-high-contrast: active) {.light_b3b0.danger_bcea:hover {\n  box-shadow: inset 0 0 0 1px var(--ring-icon-error-color);\n  box-shadow: inset 0 0 0 1px var(--ring-button-danger-hover-color);\n}}\n\n.dark_e616 {\n  color: var(--ring-dark-secondary-color);\n  background-color: var(--ring-navigation-background-color);\n  box-shadow: inset 0 0 0 1px var(--ring-dark-borders-color)\n}\n\n@media (hover: hover), (-moz-touch-enabled: 0), (-ms-high-contrast: none), (-ms-high-contrast: active) {.dark_e616:hover {\n    box-shadow: inset 0 0 0 1px var(--ring-dark-border-hover-color);\n  }}\n\n.dark_e616:active,\n  .dark_e616.active_bbe6 {\n    color: var(--ring-dark-text-color);\n    background-color: #062640;\n    background-color: var(--ring-button-dark-active-color);\n    box-shadow: inset 0 0 0 1px var(--ring-dark-border-hover-color);\n  }\n\n.dark_e616.focus-visible {\n    box-shadow: inset 0 0 0 1px var(--ring-dark-border-hover-color), 0 0 0 1px var(--ring-dark-border-hover-color);\n  }\n\n.dark_e616[disabled] {\n    box-shadow: inset 0 0 0 1px #333;\n    box-shadow: inset 0 0 0 1px var(--ring-button-dark-border-disabled-color);\n  }\n\n.dark_e616[disabled],\n  .dark_e616[disabled].withIcon_ef77 {\n    color: var(--ring-dark-disabled-color);\n  }\n\n.dark_e616[disabled] .icon_e878 {\n    color: var(--ring-dark-disabled-color);\n    color: var(--ring-button-dark-icon-disabled-color);\n  }\n\n.dark_e616.primary_ddae:active,\n  .dark_e616.primary_ddae.active_bbe6 {\n    background-color: var(--ring-main-hover-color);\n    box-shadow: inset 0 0 0 1px var(--ring-border-hover-color);\n  }\n\n.dark_e616.danger_bcea:active,\n  .dark_e616.danger_bcea.active_bbe6 {\n    color: var(--ring-icon-error-color);\n    background-color: #26080a;\n    background-color: var(--ring-button-dark-danger-active-color);\n  }\n\n.dark_e616.danger_bcea:active,\n  .dark_e616.danger_bcea.active_bbe6,\n  .dark_e616.danger_bcea.focus-visible {\n    box-shadow: inset 0 0 0 1px var(--ring-error-color);\n    box-shadow: inset 0 0 0 1px var(--ring-button-dark-danger-hover-color);\n  }\n\n.dark_e616.withIcon_ef77 {\n    color: var(--ring-dark-secondary-color);\n  }\n\n.dark_e616 .loaderBackground_d9f5::before {\n    background-image:\n      linear-gradient(\n        to right,\n        var(--ring-navigation-background-color),\n        #002039 40%,\n        var(--ring-navigation-background-color) 80%\n      );\n    background-image:\n      linear-gradient(\n        to right,\n        var(--ring-navigation-background-color),\n        var(--ring-button-dark-loader-background) 40%,\n        var(--ring-navigation-background-color) 80%\n      );\n  }\n\n.dark_e616 .dropdownIcon_e982 {\n    color: var(--ring-dark-secondary-color);\n  }\n\n@media (hover: hover), (-moz-touch-enabled: 0), (-ms-high-contrast: none), (-ms-high-contrast: active) {.dark_e616.danger_bcea:hover {\n  box-shadow: inset 0 0 0 1px var(--ring-error-color);\n  box-shadow: inset 0 0 0 1px var(--ring-button-dark-danger-hover-color);\n}}\n\n.button_aba4 {\n\n  position: relative;\n\n  display: inline-block;\n\n  box-sizing: border-box;\n  height: 24px;\n  margin: 0;\n  padding: 0 16px;\n\n  cursor: pointer;\n  transition: color var(--ring-ease), background-color var(--ring-ease), box-shadow var(--ring-ease);\n  text-decoration: none;\n\n  border: 0;\n  border-radius: var(--ring-border-radius);\n  outline: 0;\n\n  font-family: var(--ring-font-family);\n  font-size: var(--ring-font-size-smaller);\n\n  line-height: 24px\n}\n\n@media (hover: hover), (-moz-touch-enabled: 0), (-ms-high-contrast: none), (-ms-high-contrast: active) {.button_aba4:hover {\n    transition: none;\n  }}\n\n.button_aba4.focus-visible {\n    transition: none;\n  }\n\n.button_aba4[disabled] {\n    pointer-events: none;\n  }\n\n.button_aba4::-moz-focus-inner {\n    padding: 0;\n\n    border: 0;\n    outline: 0;\n  }\n\n.active_bbe6 {\n}\n\n.primary_ddae {\n  color: var(--ring-dark-text-color);\n  background-color: var(--ring-main-color);\n  box-shadow: none\n}\n\n.primary_ddae.withIcon_ef77,\n  .primary_ddae.withIcon_ef77:active,\n  .primary_ddae.withIcon_ef77.active_bbe6 {\n    color: var(--ring-main-color);\n  }\n\n.primary_ddae.focus-visible {\n    transition: none;\n\n    background-color: var(--ring-main-hover-color);\n    box-shadow: none;\n  }\n\n.primary_ddae[disabled] {\n    background-color: var(--ring-content-background-color);\n    box-shadow: inset 0 0 0 1px var(--ring-borders-color);\n  }\n\n.primary_ddae[disabled].loader_cbfc {\n    color: var(--ring-dark-text-color);\n  }\n\n.primary_ddae .loaderBackground_d9f5 {\n    top: 0;\n    right: 0;\n    bottom: 0;\n    left: 0;\n\n    border-radius: var(--ring-border-radius)\n  }\n\n.primary_ddae .loaderBackground_d9f5::before {\n      background-image:\n        linear-gradient(\n          to right,\n          var(--ring-main-color),\n          #33a3ff 40%,\n          var(--ring-main-color) 80%\n        );\n      background-image:\n        linear-gradient(\n          to right,\n          var(--ring-main-color),\n          var(--ring-button-loader-background) 40%,\n          var(--ring-main-color) 80%\n        );\n    }\n\n@media (hover: hover), (-moz-touch-enabled: 0), (-ms-high-contrast: none), (-ms-high-contrast: active) {.primary_ddae:hover {\n  transition: none;\n\n  background-color: var(--ring-main-hover-color);\n  box-shadow: none;\n}}\n\n@media (hover: hover), (-moz-touch-enabled: 0), (-ms-high-contrast: none), (-ms-high-contrast: active) {.danger_bcea:hover {\n    transition: none;\n  }}\n\n.danger_bcea,\n  .danger_bcea.withIcon_ef77,\n  .danger_bcea.withIcon_ef77:active,\n  .danger_bcea.withIcon_ef77.active_bbe6,\n  .danger_bcea.text_fc2a,\n  .danger_bcea.text_fc2a:active,\n  .danger_bcea.text_fc2a.active_bbe6 {\n    color: var(--ring-error-color);\n  }\n\n.danger_bcea.focus-visible {\n    transition: none;\n  }\n\n.dark_e616.danger_bcea,\n  .dark_e616.danger_bcea:active,\n  .dark_e616.danger_bcea.active_bbe6 {\n    color: var(--ring-icon-error-color);\n  }\n\n.text_fc2a.text_fc2a,\n.withIcon_ef77.withIcon_ef77 {\n  background-color: transparent;\n  box-shadow: none\n}\n\n@media (hover: hover), (-moz-touch-enabled: 0), (-ms-high-contrast: none), (-ms-high-contrast: active) {:is(.text_fc2a.text_fc2a,.withIcon_ef77.withIcon_ef77):hover {\n    transition: none;\n  }}\n\n:is(.text_fc2a.text_fc2a,.withIcon_ef77.withIcon_ef77):active,\n  :is(.text_fc2a.text_fc2a,.withIcon_ef77.withIcon_ef77).active_bbe6 {\n    background-color: transparent;\n    box-shadow: none;\n  }\n\n:is(.text_fc2a.text_fc2a,.withIcon_ef77.withIcon_ef77).focus-visible {\n    box-shadow: inset 0 0 0 2px var(--ring-border-hover-color);\n  }\n\n.loader_cbfc.text_fc2a > .content_b2b8 {\n  -webkit-animation-name: text-loading_d1b4;\n          animation-name: text-loading_d1b4;\n  -webkit-animation-duration: 1200ms;\n          animation-duration: 1200ms;\n  -webkit-animation-iteration-count: infinite;\n          animation-iteration-count: infinite;\n}\n\n@media (hover: hover), (-moz-touch-enabled: 0), (-ms-high-contrast: none), (-ms-high-contrast: active) {.text_fc2a.text_fc2a:hover {\n  background-color: transparent;\n  box-shadow: none;\n}}\n\n@media (hover: hover), (-moz-touch-enabled: 0), (-ms-high-contrast: none), (-ms-high-contrast: active) {.withIcon_ef77:hover:not(.focus-visible) {\n  background-color: transparent;\n  box-shadow: none;\n}}\n\n.text_fc2a {\n  color: var(--ring-main-color);\n}\n\n.inline_b4a2 {\n  display: inline-block;\n\n  margin: 0;\n  padding: 0;\n\n  font-size: var(--ring-font-size);\n}\n\n.withIcon_ef77 {\n  padding: 0 8px;\n}\n\n.text_fc2a:active,\n  .text_fc2a.active_bbe6 {\n    color: var(--ring-link-hover-color);\n  }\n\n.withIcon_ef77:active,\n  .withIcon_ef77.active_bbe6 {\n    color: var(--ring-main-color);\n  }\n\n@media (hover: hover), (-moz-touch-enabled: 0), (-ms-high-contrast: none), (-ms-high-contrast: active) {.withIcon_ef77:hover {\n  color: var(--ring-link-hover-color);\n}}\n\n@media (hover: hover), (-moz-touch-enabled: 0), (-ms-high-contrast: none), (-ms-high-contrast: active) {.text_fc2a:hover {\n  color: var(--ring-link-hover-color);\n}}\n\n.icon_e878 {\n  color: inherit;\n\n  line-height: normal\n}\n\n.icon_e878:not(:last-child) {\n    margin-right: 4px;\n  }\n\n.withNormalIconLight_d71b .icon_e878 {\n  transition: color var(--ring-ease);\n\n  color: var(--ring-icon-color);\n}\n\n.withNormalIconDark_a9e5 .icon_e878 {\n  transition: color var(--ring-ease);\n\n  color: #80929d;\n\n  color: var(--ring-button-dark-icon-color);\n}\n\n.withNormalIconLight_d71b:active,\n.withNormalIconLight_d71b.active_bbe6,\n.withNormalIconDark_a9e5:active,\n.withNormalIconDark_a9e5.active_bbe6 {\n  color: var(--ring-main-color)\n}\n\n:is(.withNormalIconLight_d71b:active,.withNormalIconLight_d71b.active_bbe6,.withNormalIconDark_a9e5:active,.withNormalIconDark_a9e5.active_bbe6) .icon_e878 {\n    transition: none;\n\n    color: inherit;\n  }\n\n@media (hover: hover), (-moz-touch-enabled: 0), (-ms-high-contrast: none), (-ms-high-contrast: active) {.withNormalIconLight_d71b:hover .icon_e878,\n.withNormalIconDark_a9e5:hover .icon_e878,\n.withDangerIconLight_c37c:hover .icon_e878,\n.withDangerIconDark_e5a4:hover .icon_e878 {\n  transition: none;\n\n  color: inherit;\n}}\n\n.withDangerIconLight_c37c .icon_e878,\n.withDangerIconLight_c37c:active .icon_e878 {\n  color: var(--ring-icon-error-color);\n}\n\n.withDangerIconDark_e5a4 .icon_e878,\n.withDangerIconDark_e5a4:active .icon_e878 {\n  color: var(--ring-error-color);\n}\n\n.loader_cbfc {\n  position: relative;\n  z-index: 0;\n\n  pointer-events: none;\n\n  background-color: transparent;\n}\n\n.loaderBackground_d9f5 {\n  position: absolute;\n  z-index: -1;\n  top: 1px;\n  right: 1px;\n  bottom: 1px;\n  left: 1px;\n\n  overflow: hidden;\n\n  border-radius: var(--ring-border-radius-small)\n}\n\n.loaderBackground_d9f5::before {\n    display: block;\n\n    width: calc(100% + 64px);\n    height: 100%;\n\n    content: "";\n    -webkit-animation: progress_ed8f 1s linear infinite;\n            animation: progress_ed8f 1s linear infinite;\n\n    background-repeat: repeat;\n    background-size: 64px;\n  }\n\n.delayed_d562 .content_b2b8::after {\n  content: "…";\n}\n\n.short_a07a {\n  width: 32px;\n  padding: 0;\n}\n\n.dropdownIcon_e982 {\n  margin-right: -2px;\n\n  margin-left: 2px;\n\n  transition: color var(--ring-ease);\n\n  color: var(--ring-icon-secondary-color);\n\n  line-height: normal;\n}\n\n@media (hover: hover), (-moz-touch-enabled: 0), (-ms-high-contrast: none), (-ms-high-contrast: active) {.button_aba4:hover .dropdownIcon_e982 {\n  transition: none;\n\n  color: var(--ring-main-color);\n}}\n\n@-webkit-keyframes progress_ed8f {\n  from {\n    transform: translateX(-64px);\n  }\n\n  to {\n    transform: translateX(0);\n  }\n}\n\n@keyframes progress_ed8f {\n  from {\n    transform: translateX(-64px);\n  }\n\n  to {\n    transform: translateX(0);\n  }\n}\n\n@-webkit-keyframes text-loading_d1b4 {\n  50% {\n    opacity: 0.5;\n  }\n}\n\n@keyframes text-loading_d1b4 {\n  50% {\n    opacity: 0.5;\n  }\n}\n',"",{version:3,sources:["webpack://./node_modules/@jetbrains/ring-ui/components/button/button.css","<no source>"],names:[],mappings:"AAOA;EACE,6DAA6D;EAC7D,mCAAmC;EACnC,+CAA+C;EAC/C,2CAA2C;EAC3C,0CAA0C;EAC1C,8DAA8D;EAC9D,wCAAwC;EACxC,sCAAsC;EACtC,8CAA8C;EAC9C,uEAAuE;EACvE,+CAA+C;EAC/C,8DAA8D;EAC9D,wCAAwC;EACxC,6CAA6C;EAC7C,kCAAkC;AACpC;;AAEA;EACE,6BAA6B;EAC7B,sDAAsD;EACtD;AA2DF;;ACvFA,wGAAA;IAAA,2DAAA;GAAA,CAAA;;ADkCE;;IAEE,uDAAuD;IACvD,0DAAwD;EAC1D;;AAEA;IACE,oGAAkG;EACpG;;AAEA;IACE,6DAA2D;EAC7D;;AAEA;;IAEE,iCAAiC;EACnC;;AAEA;IACE,sCAAsC;EACxC;;AAEA;;IAEE,yBAA6D;IAA7D,6DAA6D;IAC7D,mCAAiE;IAAjE,mEAAiE;EACnE;;AAEA;;IAEE,yBAAwD;IAAxD,wDAAwD;EAC1D;;AAEA;;;IAGE,wDAA+D;IAA/D,iEAA+D;EACjE;;AAEA;IACE,kCAAkC;EACpC;;AAEA;IACE;;;;;;OAMG;EACL;;ACtFF,wGAAA;EAAA,yDAAA;EAAA,kEAAA;CAAA,CAAA;;AD6FA;EACE,uCAAuC;EACvC,yDAAyD;EACzD;AAiEF;;ACjKA,wGAAA;IAAA,gEAAA;GAAA,CAAA;;ADsGE;;IAEE,kCAAkC;IAClC,yBAAsD;IAAtD,sDAAsD;IACtD,+DAA6D;EAC/D;;AAEA;IACE,8GAA4G;EAC9G;;AAEA;IACE,gCAAuE;IAAvE,yEAAuE;EACzE;;AAEA;;IAEE,sCAAsC;EACxC;;AAEA;IACE,sCAAkD;IAAlD,kDAAkD;EACpD;;AAEA;;IAEE,8CAA8C;IAC9C,0DAAwD;EAC1D;;AAEA;;IAEE,mCAAmC;IACnC,yBAA6D;IAA7D,6DAA6D;EAC/D;;AAEA;;;IAGE,mDAAoE;IAApE,sEAAoE;EACtE;;AAEA;IACE,uCAAuC;EACzC;;AAEA;IACE;;;;;;OAMG;IANH;;;;;;OAMG;EACL;;AAEA;IACE,uCAAuC;EACzC;;AChKF,wGAAA;EAAA,oDAAA;EAAA,uEAAA;CAAA,CAAA;;ADuKA;;EAKE,kBAAkB;;EAElB,qBAAqB;;EAErB,sBAAsB;EACtB,YAAc;EACd,SAAS;EACT,eAAyB;;EAEzB,eAAe;EACf,kGAAkG;EAClG,qBAAqB;;EAErB,SAAS;EACT,wCAAwC;EACxC,UAAU;;EAEV,oCAAoC;EACpC,wCAAwC;;EAExC;AAoBF;;ACpNA,wGAAA;IAAA,iBAAA;GAAA,CAAA;;ADsME;IACE,gBAAgB;EAClB;;AAEA;IACE,oBAAoB;EACtB;;AAEA;IACE,UAAU;;IAEV,SAAS;IACT,UAAU;EACZ;;AAGF;AAEA;;AAEA;EACE,kCAAkC;EAClC,wCAAwC;EACxC;AA0CF;;AAxCE;;;IAGE,6BAA6B;EAC/B;;AAEA;IACE,gBAAgB;;IAEhB,8CAA8C;IAC9C,gBAAgB;EAClB;;AAEA;IACE,sDAAsD;IACtD,qDAAmD;EACrD;;AAEA;IACE,kCAAkC;EACpC;;AAEA;IACE,MAAM;IACN,QAAQ;IACR,SAAS;IACT,OAAO;;IAEP;EAWF;;AATE;MACE;;;;;;SAMG;MANH;;;;;;SAMG;IACL;;ACrQJ,wGAAA;EAAA,iBAAA;;EAAA,+CAAA;EAAA,iBAAA;CAAA,CAAA;;AAAA,wGAAA;IAAA,iBAAA;GAAA,CAAA;;ADiRE;;;;;;;IAOE,8BAA8B;EAChC;;AAEA;IAEE,gBAAgB;EAClB;;AAIA;;;IAGE,mCAAmC;EACrC;;AAGF;;EAEE,6BAA6B;EAC7B;AAeF;;AC3TA,wGAAA;IAAA,iBAAA;GAAA,CAAA;;ADkTE;;IAEE,6BAA6B;IAC7B,gBAAgB;EAClB;;AAEA;IACE,0DAA0D;EAC5D;;AAGF;EACE,yCAA4B;UAA5B,iCAA4B;EAC5B,kCAA0B;UAA1B,0BAA0B;EAC1B,2CAAmC;UAAnC,mCAAmC;AACrC;;ACjUA,wGAAA;EAAA,8BAAA;EAAA,iBAAA;CAAA,CAAA;;AAAA,wGAAA;EAAA,8BAAA;EAAA,iBAAA;CAAA,CAAA;;AD6UA;EACE,6BAA6B;AAC/B;;AAEA;EACE,qBAAqB;;EAErB,SAAS;EACT,UAAU;;EAEV,gCAAgC;AAClC;;AAEA;EACE,cAAe;AACjB;;AAGE;;IAEE,mCAAmC;EACrC;;AAIA;;IAEE,6BAA6B;EAC/B;;ACzWF,wGAAA;EAAA,oCAAA;CAAA,CAAA;;AAAA,wGAAA;EAAA,oCAAA;CAAA,CAAA;;ADoXA;EACE,cAAc;;EAEd;AAKF;;AAHE;IACE,iBAA8B;EAChC;;AAGF;EACE,kCAAkC;;EAElC,6BAA6B;AAC/B;;AAEA;EACE,kCAAkC;;EAElC,cAAyC;;EAAzC,yCAAyC;AAC3C;;AAEA;;;;EAIE;AAOF;;AALE;IACE,gBAAgB;;IAEhB,cAAc;EAChB;;ACpZF,wGAAA;;;;EAAA,iBAAA;;EAAA,eAAA;CAAA,CAAA;;ADgaA;;EAEE,mCAAmC;AACrC;;AAEA;;EAEE,8BAA8B;AAChC;;AAEA;EACE,kBAAkB;EAClB,UAAU;;EAEV,oBAAoB;;EAEpB,6BAA6B;AAC/B;;AAEA;EACE,kBAAkB;EAClB,WAAW;EACX,QAAQ;EACR,UAAU;EACV,WAAW;EACX,SAAS;;EAET,gBAAgB;;EAEhB;AAcF;;AAZE;IACE,cAAc;;IAEd,wBAA+B;IAC/B,YAAY;;IAEZ,WAAW;IACX,mDAAsC;YAAtC,2CAAsC;;IAEtC,yBAAyB;IACzB,qBAA4B;EAC9B;;AAGF;EACE,YAAY;AACd;;AAEA;EACE,WAAqB;EACrB,UAAU;AACZ;;AAEA;EACE,kBAAkB;;EAElB,gBAAgB;;EAEhB,kCAAkC;;EAElC,uCAAuC;;EAEvC,mBAAmB;AACrB;;ACheA,wGAAA;EAAA,iBAAA;;EAAA,8BAAA;CAAA,CAAA;;ADweA;EACE;IACE,4BAA4C;EAC9C;;EAEA;IACE,wBAAwB;EAC1B;AACF;;AARA;EACE;IACE,4BAA4C;EAC9C;;EAEA;IACE,wBAAwB;EAC1B;AACF;;AAEA;EACE;IACE,YAAY;EACd;AACF;;AAJA;EACE;IACE,YAAY;EACd;AACF",sourcesContent:['@import "../global/variables.css";\n\n@value unit from "../global/global.css";\n@value button-shadow: inset 0 0 0 1px;\n@value height: calc(unit * 3);\n@value loaderWidth: calc(unit * 8);\n\n:root {\n  /* TODO: This colors are not ready to move to variables.css */\n  /* stylelint-disable color-no-hex */\n  --ring-button-primary-background-color: #1a98ff;\n  --ring-button-primary-border-color: #0062b2;\n  --ring-button-danger-active-color: #ffe7e8;\n  --ring-button-danger-hover-color: var(--ring-icon-error-color);\n  --ring-button-loader-background: #33a3ff;\n  --ring-button-dark-icon-color: #80929d;\n  --ring-button-dark-border-disabled-color: #333;\n  --ring-button-dark-icon-disabled-color: var(--ring-dark-disabled-color);\n  --ring-button-dark-danger-active-color: #26080a;\n  --ring-button-dark-danger-hover-color: var(--ring-error-color);\n  --ring-button-dark-active-color: #062640;\n  --ring-button-dark-loader-background: #002039;\n  /* stylelint-enable color-no-hex */\n}\n\n.light {\n  color: var(--ring-text-color);\n  background-color: var(--ring-content-background-color);\n  box-shadow: button-shadow var(--ring-borders-color);\n\n  &:hover {\n    box-shadow: button-shadow var(--ring-border-hover-color);\n  }\n\n  &:active,\n  &.active {\n    background-color: var(--ring-selected-background-color);\n    box-shadow: button-shadow var(--ring-border-hover-color);\n  }\n\n  &:global(.focus-visible) {\n    box-shadow: button-shadow var(--ring-border-hover-color), 0 0 0 1px var(--ring-border-hover-color);\n  }\n\n  &[disabled] {\n    box-shadow: button-shadow var(--ring-border-disabled-color);\n  }\n\n  &[disabled],\n  &[disabled].withIcon {\n    color: var(--ring-disabled-color);\n  }\n\n  &[disabled] .icon {\n    color: var(--ring-icon-disabled-color);\n  }\n\n  &.primary:active,\n  &.primary.active {\n    background-color: var(--ring-button-primary-background-color);\n    box-shadow: button-shadow var(--ring-button-primary-border-color);\n  }\n\n  &.danger:active,\n  &.danger.active {\n    background-color: var(--ring-button-danger-active-color);\n  }\n\n  &.danger:active,\n  &.danger.active,\n  &.danger:global(.focus-visible) {\n    box-shadow: button-shadow var(--ring-button-danger-hover-color);\n  }\n\n  &.withIcon {\n    color: var(--ring-secondary-color);\n  }\n\n  & .loaderBackground::before {\n    background-image:\n      linear-gradient(\n        to right,\n        var(--ring-content-background-color),\n        var(--ring-selected-background-color) 40%,\n        var(--ring-content-background-color) 80%\n      );\n  }\n}\n\n.light.danger:hover {\n  box-shadow: button-shadow var(--ring-button-danger-hover-color);\n}\n\n.dark {\n  color: var(--ring-dark-secondary-color);\n  background-color: var(--ring-navigation-background-color);\n  box-shadow: button-shadow var(--ring-dark-borders-color);\n\n  &:hover {\n    box-shadow: button-shadow var(--ring-dark-border-hover-color);\n  }\n\n  &:active,\n  &.active {\n    color: var(--ring-dark-text-color);\n    background-color: var(--ring-button-dark-active-color);\n    box-shadow: button-shadow var(--ring-dark-border-hover-color);\n  }\n\n  &:global(.focus-visible) {\n    box-shadow: button-shadow var(--ring-dark-border-hover-color), 0 0 0 1px var(--ring-dark-border-hover-color);\n  }\n\n  &[disabled] {\n    box-shadow: button-shadow var(--ring-button-dark-border-disabled-color);\n  }\n\n  &[disabled],\n  &[disabled].withIcon {\n    color: var(--ring-dark-disabled-color);\n  }\n\n  &[disabled] .icon {\n    color: var(--ring-button-dark-icon-disabled-color);\n  }\n\n  &.primary:active,\n  &.primary.active {\n    background-color: var(--ring-main-hover-color);\n    box-shadow: button-shadow var(--ring-border-hover-color);\n  }\n\n  &.danger:active,\n  &.danger.active {\n    color: var(--ring-icon-error-color);\n    background-color: var(--ring-button-dark-danger-active-color);\n  }\n\n  &.danger:active,\n  &.danger.active,\n  &.danger:global(.focus-visible) {\n    box-shadow: button-shadow var(--ring-button-dark-danger-hover-color);\n  }\n\n  &.withIcon {\n    color: var(--ring-dark-secondary-color);\n  }\n\n  & .loaderBackground::before {\n    background-image:\n      linear-gradient(\n        to right,\n        var(--ring-navigation-background-color),\n        var(--ring-button-dark-loader-background) 40%,\n        var(--ring-navigation-background-color) 80%\n      );\n  }\n\n  & .dropdownIcon {\n    color: var(--ring-dark-secondary-color);\n  }\n}\n\n.dark.danger:hover {\n  box-shadow: button-shadow var(--ring-button-dark-danger-hover-color);\n}\n\n.button {\n  composes: button from "../button-group/button-group.css";\n  composes: button from "../button-set/button-set.css";\n  composes: button from "../button-toolbar/button-toolbar.css";\n\n  position: relative;\n\n  display: inline-block;\n\n  box-sizing: border-box;\n  height: height;\n  margin: 0;\n  padding: 0 calc(unit * 2);\n\n  cursor: pointer;\n  transition: color var(--ring-ease), background-color var(--ring-ease), box-shadow var(--ring-ease);\n  text-decoration: none;\n\n  border: 0;\n  border-radius: var(--ring-border-radius);\n  outline: 0;\n\n  font-family: var(--ring-font-family);\n  font-size: var(--ring-font-size-smaller);\n\n  line-height: height;\n\n  &:hover {\n    transition: none;\n  }\n\n  &:global(.focus-visible) {\n    transition: none;\n  }\n\n  &[disabled] {\n    pointer-events: none;\n  }\n\n  &::-moz-focus-inner {\n    padding: 0;\n\n    border: 0;\n    outline: 0;\n  }\n}\n\n.active {\n  composes: active from "../button-group/button-group.css";\n}\n\n.primary {\n  color: var(--ring-dark-text-color);\n  background-color: var(--ring-main-color);\n  box-shadow: none;\n\n  &.withIcon,\n  &.withIcon:active,\n  &.withIcon.active {\n    color: var(--ring-main-color);\n  }\n\n  &:global(.focus-visible) {\n    transition: none;\n\n    background-color: var(--ring-main-hover-color);\n    box-shadow: none;\n  }\n\n  &[disabled] {\n    background-color: var(--ring-content-background-color);\n    box-shadow: button-shadow var(--ring-borders-color);\n  }\n\n  &[disabled].loader {\n    color: var(--ring-dark-text-color);\n  }\n\n  & .loaderBackground {\n    top: 0;\n    right: 0;\n    bottom: 0;\n    left: 0;\n\n    border-radius: var(--ring-border-radius);\n\n    &::before {\n      background-image:\n        linear-gradient(\n          to right,\n          var(--ring-main-color),\n          var(--ring-button-loader-background) 40%,\n          var(--ring-main-color) 80%\n        );\n    }\n  }\n}\n\n.primary:hover {\n  transition: none;\n\n  background-color: var(--ring-main-hover-color);\n  box-shadow: none;\n}\n\n.danger {\n  &,\n  &.withIcon,\n  &.withIcon:active,\n  &.withIcon.active,\n  &.text,\n  &.text:active,\n  &.text.active {\n    color: var(--ring-error-color);\n  }\n\n  &:global(.focus-visible),\n  &:hover {\n    transition: none;\n  }\n}\n\n.dark.danger {\n  &,\n  &:active,\n  &.active {\n    color: var(--ring-icon-error-color);\n  }\n}\n\n.text.text,\n.withIcon.withIcon {\n  background-color: transparent;\n  box-shadow: none;\n\n  &:hover {\n    transition: none;\n  }\n\n  &:active,\n  &.active {\n    background-color: transparent;\n    box-shadow: none;\n  }\n\n  &:global(.focus-visible) {\n    box-shadow: inset 0 0 0 2px var(--ring-border-hover-color);\n  }\n}\n\n.loader.text > .content {\n  animation-name: text-loading;\n  animation-duration: 1200ms;\n  animation-iteration-count: infinite;\n}\n\n.text.text:hover {\n  background-color: transparent;\n  box-shadow: none;\n}\n\n.withIcon:hover:not(:global(.focus-visible)) {\n  background-color: transparent;\n  box-shadow: none;\n}\n\n.text {\n  color: var(--ring-main-color);\n}\n\n.inline {\n  display: inline-block;\n\n  margin: 0;\n  padding: 0;\n\n  font-size: var(--ring-font-size);\n}\n\n.withIcon {\n  padding: 0 unit;\n}\n\n.text {\n  &:active,\n  &.active {\n    color: var(--ring-link-hover-color);\n  }\n}\n\n.withIcon {\n  &:active,\n  &.active {\n    color: var(--ring-main-color);\n  }\n}\n\n.withIcon:hover {\n  color: var(--ring-link-hover-color);\n}\n\n.text:hover {\n  color: var(--ring-link-hover-color);\n}\n\n.icon {\n  color: inherit;\n\n  line-height: normal;\n\n  &:not(:last-child) {\n    margin-right: calc(unit * 0.5);\n  }\n}\n\n.withNormalIconLight .icon {\n  transition: color var(--ring-ease);\n\n  color: var(--ring-icon-color);\n}\n\n.withNormalIconDark .icon {\n  transition: color var(--ring-ease);\n\n  color: var(--ring-button-dark-icon-color);\n}\n\n.withNormalIconLight:active,\n.withNormalIconLight.active,\n.withNormalIconDark:active,\n.withNormalIconDark.active {\n  color: var(--ring-main-color);\n\n  & .icon {\n    transition: none;\n\n    color: inherit;\n  }\n}\n\n.withNormalIconLight:hover .icon,\n.withNormalIconDark:hover .icon,\n.withDangerIconLight:hover .icon,\n.withDangerIconDark:hover .icon {\n  transition: none;\n\n  color: inherit;\n}\n\n.withDangerIconLight .icon,\n.withDangerIconLight:active .icon {\n  color: var(--ring-icon-error-color);\n}\n\n.withDangerIconDark .icon,\n.withDangerIconDark:active .icon {\n  color: var(--ring-error-color);\n}\n\n.loader {\n  position: relative;\n  z-index: 0;\n\n  pointer-events: none;\n\n  background-color: transparent;\n}\n\n.loaderBackground {\n  position: absolute;\n  z-index: -1;\n  top: 1px;\n  right: 1px;\n  bottom: 1px;\n  left: 1px;\n\n  overflow: hidden;\n\n  border-radius: var(--ring-border-radius-small);\n\n  &::before {\n    display: block;\n\n    width: calc(100% + loaderWidth);\n    height: 100%;\n\n    content: "";\n    animation: progress 1s linear infinite;\n\n    background-repeat: repeat;\n    background-size: loaderWidth;\n  }\n}\n\n.delayed .content::after {\n  content: "…";\n}\n\n.short {\n  width: calc(unit * 4);\n  padding: 0;\n}\n\n.dropdownIcon {\n  margin-right: -2px;\n\n  margin-left: 2px;\n\n  transition: color var(--ring-ease);\n\n  color: var(--ring-icon-secondary-color);\n\n  line-height: normal;\n}\n\n.button:hover .dropdownIcon {\n  transition: none;\n\n  color: var(--ring-main-color);\n}\n\n@keyframes progress {\n  from {\n    transform: translateX(calc(0 - loaderWidth));\n  }\n\n  to {\n    transform: translateX(0);\n  }\n}\n\n@keyframes text-loading {\n  50% {\n    opacity: 0.5;\n  }\n}\n',null],sourceRoot:""}]),p.locals={unit:""+l.default.locals.unit,"button-shadow":"inset 0 0 0 1px",height:"24px",loaderWidth:"64px",light:"light_b3b0",active:"active_bbe6 "+c.Z.locals.active,withIcon:"withIcon_ef77",icon:"icon_e878",primary:"primary_ddae",danger:"danger_bcea",loaderBackground:"loaderBackground_d9f5",dark:"dark_e616",dropdownIcon:"dropdownIcon_e982",button:"button_aba4 "+c.Z.locals.button+" "+u.Z.locals.button+" "+s.Z.locals.button,loader:"loader_cbfc",text:"text_fc2a",content:"content_b2b8","text-loading":"text-loading_d1b4",inline:"inline_b4a2",withNormalIconLight:"withNormalIconLight_d71b",withNormalIconDark:"withNormalIconDark_a9e5",withDangerIconLight:"withDangerIconLight_c37c",withDangerIconDark:"withDangerIconDark_e5a4",progress:"progress_ed8f",delayed:"delayed_d562",short:"short_a07a"};const d=p},3109:(e,n,t)=>{"use strict";t.r(n),t.d(n,{default:()=>s});var r=t(7537),o=t.n(r),i=t(3645),a=t.n(i),l=t(8004),c=t(3181),u=a()(o());u.i(c.Z),u.i(l.default,"",!0),u.push([e.id,'.checkbox_dccf {\n  position: relative;\n\n  display: inline-block;\n\n  text-align: left;\n\n  color: var(--ring-text-color);\n  outline: none\n}\n\n@media (hover: hover), (-moz-touch-enabled: 0), (-ms-high-contrast: none), (-ms-high-contrast: active) {.checkbox_dccf:hover .cell_edda {\n    transition: background-color var(--ring-ease);\n\n    border-color: var(--ring-border-hover-color);\n  }}\n\n.cell_edda {\n  position: relative;\n  top: -2px;\n\n  display: inline-block;\n\n  box-sizing: border-box;\n  width: 14px;\n  height: 14px;\n\n  -webkit-user-select: none;\n\n     -moz-user-select: none;\n\n      -ms-user-select: none;\n\n          user-select: none;\n  transition: border-color var(--ring-ease), background-color var(--ring-ease), box-shadow var(--ring-ease);\n  vertical-align: middle;\n  pointer-events: none;\n\n  border: 1px solid var(--ring-borders-color);\n  border-radius: 3px;\n  background-color: var(--ring-content-background-color);\n}\n\n.icon_b476.icon_b476 {\n  position: absolute;\n\n  width: 16px;\n  height: 16px;\n\n  transition: opacity var(--ring-fast-ease), transform var(--ring-fast-ease);\n\n  opacity: 0\n}\n\n.icon_b476.icon_b476 svg {\n    position: absolute;\n    top: 0;\n    left: 0;\n  }\n\n.check_a219 {\n\n  top: -12px;\n  left: 1px;\n}\n\n.minus_de65 {\n\n  top: 1px;\n  left: 2px;\n\n  opacity: 0;\n}\n\n.input_a330 {\n  position: absolute;\n  top: 0;\n  left: 0;\n\n  width: 100%;\n  height: 100%;\n  margin: 0;\n\n  cursor: pointer;\n\n  opacity: 0\n\n  /* stylelint-disable-next-line selector-max-specificity */\n}\n\n.input_a330:checked + .cell_edda,\n  .input_a330:indeterminate[checked] + .cell_edda,\n  .input_a330:indeterminate[data-checked="true"] + .cell_edda {\n    border-color: var(--ring-border-hover-color);\n    background-color: var(--ring-selected-background-color);\n  }\n\n.input_a330 {\n\n  /* stylelint-disable-next-line selector-max-specificity */\n}\n\n.input_a330:checked + .cell_edda .check_a219 {\n    transform: translateY(8px);\n\n    opacity: 1;\n  }\n\n.input_a330:focus + .cell_edda,\n  .input_a330.focus_eaa3 + .cell_edda {\n    transition: background-color var(--ring-ease);\n\n    border-color: var(--ring-border-hover-color);\n    box-shadow: 0 0 0 1px var(--ring-border-hover-color);\n  }\n\n.input_a330 {\n\n  /* stylelint-disable-next-line selector-max-specificity */\n}\n\n.input_a330:indeterminate + .cell_edda .minus_de65 {\n    opacity: 1;\n  }\n\n.input_a330[disabled] {\n    pointer-events: none;\n  }\n\n.input_a330 {\n\n  /* stylelint-disable-next-line selector-max-specificity */\n}\n\n.input_a330[disabled][disabled] + .cell_edda {\n    border-color: var(--ring-line-color);\n    background-color: var(--ring-content-background-color);\n  }\n\n.input_a330 {\n\n  /* stylelint-disable-next-line selector-max-specificity */\n}\n\n.input_a330[disabled]:checked + .cell_edda .check_a219,\n  .input_a330[disabled]:indeterminate + .cell_edda .minus_de65 {\n    opacity: 0.5;\n  }\n\n.input_a330 {\n\n  /* stylelint-disable-next-line selector-max-specificity */\n}\n\n.input_a330:indeterminate:indeterminate + .cell_edda .check_a219 {\n    transition: none;\n\n    opacity: 0;\n  }\n\n.input_a330[disabled] ~ .label_dcc7 {\n    color: var(--ring-disabled-color);\n  }\n\n.label_dcc7 {\n  margin-left: 8px;\n\n  line-height: normal;\n}\n',"",{version:3,sources:["webpack://./node_modules/@jetbrains/ring-ui/components/checkbox/checkbox.css","<no source>"],names:[],mappings:"AAKA;EACE,kBAAkB;;EAElB,qBAAqB;;EAErB,gBAAgB;;EAEhB,6BAA6B;EAC7B;AAOF;;ACpBA,wGAAA;IAAA,8CAAA;;IAAA,6CAAA;GAAA,CAAA;;ADsBA;EACE,kBAAkB;EAClB,SAAS;;EAET,qBAAqB;;EAErB,sBAAsB;EACtB,WAAmB;EACnB,YAAoB;;EAEpB,yBAAiB;;KAAjB,sBAAiB;;MAAjB,qBAAiB;;UAAjB,iBAAiB;EACjB,yGAAyG;EACzG,sBAAsB;EACtB,oBAAoB;;EAEpB,2CAA2C;EAC3C,kBAAkB;EAClB,sDAAsD;AACxD;;AAEA;EACE,kBAAkB;;EAElB,WAAqB;EACrB,YAAsB;;EAEtB,0EAA0E;;EAE1E;AAOF;;AALE;IACE,kBAAkB;IAClB,MAAM;IACN,OAAO;EACT;;AAGF;;EAGE,UAAsB;EACtB,SAAS;AACX;;AAEA;;EAGE,QAAQ;EACR,SAAS;;EAET,UAAU;AACZ;;AAEA;EACE,kBAAkB;EAClB,MAAM;EACN,OAAO;;EAEP,WAAW;EACX,YAAY;EACZ,SAAS;;EAET,eAAe;;EAEf,SAAU;;EAEV,yDAAyD;AAsD3D;;AArDE;;;IAGE,4CAA4C;IAC5C,uDAAuD;EACzD;;AAnBF;;EAqBE,yDAAyD;AA8C3D;;AA7CE;IACE,0BAA2B;;IAE3B,UAAU;EACZ;;AAEA;;IAEE,6CAA6C;;IAE7C,4CAA4C;IAC5C,oDAAoD;EACtD;;AAlCF;;EAoCE,yDAAyD;AA+B3D;;AA9BE;IACE,UAAU;EACZ;;AAEA;IACE,oBAAoB;EACtB;;AA3CF;;EA6CE,yDAAyD;AAsB3D;;AArBE;IACE,oCAAoC;IACpC,sDAAsD;EACxD;;AAjDF;;EAmDE,yDAAyD;AAgB3D;;AAfE;;IAEE,YAAY;EACd;;AAvDF;;EAyDE,yDAAyD;AAU3D;;AATE;IACE,gBAAgB;;IAEhB,UAAU;EACZ;;AAEA;IACE,iCAAiC;EACnC;;AAGF;EACE,gBAAiB;;EAEjB,mBAAmB;AACrB",sourcesContent:['@import "../global/variables.css";\n\n@value unit from "../global/global.css";\n@value checkboxSize: 14px;\n\n.checkbox {\n  position: relative;\n\n  display: inline-block;\n\n  text-align: left;\n\n  color: var(--ring-text-color);\n  outline: none;\n\n  &:hover .cell {\n    transition: background-color var(--ring-ease);\n\n    border-color: var(--ring-border-hover-color);\n  }\n}\n\n.cell {\n  position: relative;\n  top: -2px;\n\n  display: inline-block;\n\n  box-sizing: border-box;\n  width: checkboxSize;\n  height: checkboxSize;\n\n  user-select: none;\n  transition: border-color var(--ring-ease), background-color var(--ring-ease), box-shadow var(--ring-ease);\n  vertical-align: middle;\n  pointer-events: none;\n\n  border: 1px solid var(--ring-borders-color);\n  border-radius: 3px;\n  background-color: var(--ring-content-background-color);\n}\n\n.icon.icon {\n  position: absolute;\n\n  width: calc(unit * 2);\n  height: calc(unit * 2);\n\n  transition: opacity var(--ring-fast-ease), transform var(--ring-fast-ease);\n\n  opacity: 0;\n\n  & svg {\n    position: absolute;\n    top: 0;\n    left: 0;\n  }\n}\n\n.check {\n  composes: icon;\n\n  top: calc(unit * -1.5);\n  left: 1px;\n}\n\n.minus {\n  composes: icon;\n\n  top: 1px;\n  left: 2px;\n\n  opacity: 0;\n}\n\n.input {\n  position: absolute;\n  top: 0;\n  left: 0;\n\n  width: 100%;\n  height: 100%;\n  margin: 0;\n\n  cursor: pointer;\n\n  opacity: 0;\n\n  /* stylelint-disable-next-line selector-max-specificity */\n  &:checked + .cell,\n  &:indeterminate[checked] + .cell,\n  &:indeterminate[data-checked="true"] + .cell {\n    border-color: var(--ring-border-hover-color);\n    background-color: var(--ring-selected-background-color);\n  }\n\n  /* stylelint-disable-next-line selector-max-specificity */\n  &:checked + .cell .check {\n    transform: translateY(unit);\n\n    opacity: 1;\n  }\n\n  &:focus + .cell,\n  &.focus + .cell {\n    transition: background-color var(--ring-ease);\n\n    border-color: var(--ring-border-hover-color);\n    box-shadow: 0 0 0 1px var(--ring-border-hover-color);\n  }\n\n  /* stylelint-disable-next-line selector-max-specificity */\n  &:indeterminate + .cell .minus {\n    opacity: 1;\n  }\n\n  &[disabled] {\n    pointer-events: none;\n  }\n\n  /* stylelint-disable-next-line selector-max-specificity */\n  &[disabled][disabled] + .cell {\n    border-color: var(--ring-line-color);\n    background-color: var(--ring-content-background-color);\n  }\n\n  /* stylelint-disable-next-line selector-max-specificity */\n  &[disabled]:checked + .cell .check,\n  &[disabled]:indeterminate + .cell .minus {\n    opacity: 0.5;\n  }\n\n  /* stylelint-disable-next-line selector-max-specificity */\n  &:indeterminate:indeterminate + .cell .check {\n    transition: none;\n\n    opacity: 0;\n  }\n\n  &[disabled] ~ .label {\n    color: var(--ring-disabled-color);\n  }\n}\n\n.label {\n  margin-left: unit;\n\n  line-height: normal;\n}\n',null],sourceRoot:""}]),u.locals={unit:""+l.default.locals.unit,checkboxSize:"14px",checkbox:"checkbox_dccf",cell:"cell_edda",icon:"icon_b476",check:"check_a219 icon_b476",minus:"minus_de65 icon_b476",input:"input_a330",focus:"focus_eaa3",label:"label_dcc7"};const s=u},2890:(e,n,t)=>{"use strict";t.r(n),t.d(n,{default:()=>u});var r=t(7537),o=t.n(r),i=t(3645),a=t.n(i),l=t(3181),c=a()(o());c.i(l.Z),c.push([e.id,".dropdown_a1de {\n  display: inline-block;\n}\n\n.anchor_fdbe.anchor_fdbe {\n  margin: 0 -3px;\n  padding: 0 3px;\n\n  font: inherit;\n}\n\n.chevron_ffc6 {\n  margin-left: 2px;\n\n  line-height: normal;\n}\n","",{version:3,sources:["webpack://./node_modules/@jetbrains/ring-ui/components/dropdown/dropdown.css"],names:[],mappings:"AAEA;EACE,qBAAqB;AACvB;;AAEA;EACE,cAAc;EACd,cAAc;;EAEd,aAAa;AACf;;AAEA;EACE,gBAAgB;;EAEhB,mBAAmB;AACrB",sourcesContent:['@import "../global/variables.css";\n\n.dropdown {\n  display: inline-block;\n}\n\n.anchor.anchor {\n  margin: 0 -3px;\n  padding: 0 3px;\n\n  font: inherit;\n}\n\n.chevron {\n  margin-left: 2px;\n\n  line-height: normal;\n}\n'],sourceRoot:""}]),c.locals={dropdown:"dropdown_a1de",anchor:"anchor_fdbe",chevron:"chevron_ffc6"};const u=c},8004:(e,n,t)=>{"use strict";t.r(n),t.d(n,{default:()=>l});var r=t(7537),o=t.n(r),i=t(3645),a=t.n(i)()(o());a.push([e.id,'/* https://readymag.com/artemtiunov/RingUILanguage/colours/ */\n\n/*\nUnit shouldn\'t be CSS custom property because it is not intended to change\nAlso it won\'t form in FF47 https://bugzilla.mozilla.org/show_bug.cgi?id=594933\n*/\n\n.clearfix_c694::after {\n    display: block;\n    clear: both;\n\n    content: "";\n  }\n\n.font_a1f6 {\n  font-family: var(--ring-font-family);\n  font-size: var(--ring-font-size);\n  line-height: var(--ring-line-height);\n}\n\n.font-lower_c3c9 {\n\n  line-height: var(--ring-line-height-lower);\n}\n\n.font-smaller_d963 {\n\n  font-size: var(--ring-font-size-smaller);\n}\n\n.font-smaller-lower_ff5f {\n\n  line-height: var(--ring-line-height-lowest);\n}\n\n.font-larger-lower_b336 {\n\n  font-size: var(--ring-font-size-larger);\n}\n\n.font-larger_f035 {\n\n  line-height: var(--ring-line-height-taller);\n}\n\n/* To be used at large sizes */\n/* As close as possible to Helvetica Neue Thin (to replace Gotham) */\n.thin-font_de5b {\n  font-family: "Segoe UI", "Helvetica Neue", Helvetica, Arial, sans-serif;\n  font-size: var(--ring-font-size);\n  font-weight: 100; /* Renders Helvetica Neue UltraLight on OS X  */\n}\n\n.monospace-font_ac33 {\n  font-family: var(--ring-font-family-monospace);\n  font-size: var(--ring-font-size-smaller);\n}\n\n.ellipsis_e43b {\n  overflow: hidden;\n\n  white-space: nowrap;\n  text-overflow: ellipsis;\n}\n\n.resetButton_ddd2 {\n  overflow: visible;\n\n  padding: 0;\n\n  text-align: left;\n\n  color: inherit;\n  border: 0;\n\n  background-color: transparent;\n\n  font: inherit\n}\n\n.resetButton_ddd2::-moz-focus-inner {\n    padding: 0;\n\n    border: 0;\n  }\n\n/* Note: footer also has top margin which isn\'t taken into account here */\n\n/* Media breakpoints (minimal values) */\n\n/* Media queries */\n',"",{version:3,sources:["webpack://./node_modules/@jetbrains/ring-ui/components/global/global.css"],names:[],mappings:"AAAA,6DAA6D;;AAE7D;;;CAGC;;AAIC;IACE,cAAc;IACd,WAAW;;IAEX,WAAW;EACb;;AAGF;EACE,oCAAoC;EACpC,gCAAgC;EAChC,oCAAoC;AACtC;;AAEA;;EAGE,0CAA0C;AAC5C;;AAEA;;EAGE,wCAAwC;AAC1C;;AAEA;;EAGE,2CAA2C;AAC7C;;AAEA;;EAGE,uCAAuC;AACzC;;AAEA;;EAGE,2CAA2C;AAC7C;;AAEA,8BAA8B;AAC9B,oEAAoE;AACpE;EACE,uEAAuE;EACvE,gCAAgC;EAChC,gBAAgB,EAAE,+CAA+C;AACnE;;AAEA;EACE,8CAA8C;EAC9C,wCAAwC;AAC1C;;AAEA;EACE,gBAAgB;;EAEhB,mBAAmB;EACnB,uBAAuB;AACzB;;AAEA;EACE,iBAAiB;;EAEjB,UAAU;;EAEV,gBAAgB;;EAEhB,cAAc;EACd,SAAS;;EAET,6BAA6B;;EAE7B;AAOF;;AALE;IACE,UAAU;;IAEV,SAAS;EACX;;AAGF,yEAAyE;;AAGzE,uCAAuC;;AAKvC,kBAAkB",sourcesContent:['/* https://readymag.com/artemtiunov/RingUILanguage/colours/ */\n\n/*\nUnit shouldn\'t be CSS custom property because it is not intended to change\nAlso it won\'t form in FF47 https://bugzilla.mozilla.org/show_bug.cgi?id=594933\n*/\n@value unit: 8px;\n\n.clearfix {\n  &::after {\n    display: block;\n    clear: both;\n\n    content: "";\n  }\n}\n\n.font {\n  font-family: var(--ring-font-family);\n  font-size: var(--ring-font-size);\n  line-height: var(--ring-line-height);\n}\n\n.font-lower {\n  composes: font;\n\n  line-height: var(--ring-line-height-lower);\n}\n\n.font-smaller {\n  composes: font-lower;\n\n  font-size: var(--ring-font-size-smaller);\n}\n\n.font-smaller-lower {\n  composes: font-smaller;\n\n  line-height: var(--ring-line-height-lowest);\n}\n\n.font-larger-lower {\n  composes: font-lower;\n\n  font-size: var(--ring-font-size-larger);\n}\n\n.font-larger {\n  composes: font-larger-lower;\n\n  line-height: var(--ring-line-height-taller);\n}\n\n/* To be used at large sizes */\n/* As close as possible to Helvetica Neue Thin (to replace Gotham) */\n.thin-font {\n  font-family: "Segoe UI", "Helvetica Neue", Helvetica, Arial, sans-serif;\n  font-size: var(--ring-font-size);\n  font-weight: 100; /* Renders Helvetica Neue UltraLight on OS X  */\n}\n\n.monospace-font {\n  font-family: var(--ring-font-family-monospace);\n  font-size: var(--ring-font-size-smaller);\n}\n\n.ellipsis {\n  overflow: hidden;\n\n  white-space: nowrap;\n  text-overflow: ellipsis;\n}\n\n.resetButton {\n  overflow: visible;\n\n  padding: 0;\n\n  text-align: left;\n\n  color: inherit;\n  border: 0;\n\n  background-color: transparent;\n\n  font: inherit;\n\n  &::-moz-focus-inner {\n    padding: 0;\n\n    border: 0;\n  }\n}\n\n/* Note: footer also has top margin which isn\'t taken into account here */\n@value footer-height: calc(unit * 8);\n\n/* Media breakpoints (minimal values) */\n@value breakpoint-small: 640px;\n@value breakpoint-middle: 960px;\n@value breakpoint-large: 1200px;\n\n/* Media queries */\n@value extra-small-screen-media: (max-width: calc(breakpoint-small - 1px));\n@value small-screen-media: (min-width: breakpoint-small) and (max-width: calc(breakpoint-middle - 1px));\n@value middle-screen-media: (min-width: breakpoint-middle) and (max-width: calc(breakpoint-large - 1px));\n@value large-screen-media: (min-width: breakpoint-large);\n'],sourceRoot:""}]),a.locals={unit:"8px","footer-height":"64px","breakpoint-small":"640px","breakpoint-middle":"960px","breakpoint-large":"1200px","extra-small-screen-media":"(max-width: 639px)","small-screen-media":"(min-width: 640px) and (max-width: 959px)","middle-screen-media":"(min-width: 960px) and (max-width: 1199px)","large-screen-media":"(min-width: 1200px)",clearfix:"clearfix_c694",font:"font_a1f6","font-lower":"font-lower_c3c9 font_a1f6","font-smaller":"font-smaller_d963 font-lower_c3c9 font_a1f6","font-smaller-lower":"font-smaller-lower_ff5f font-smaller_d963 font-lower_c3c9 font_a1f6","font-larger-lower":"font-larger-lower_b336 font-lower_c3c9 font_a1f6","font-larger":"font-larger_f035 font-larger-lower_b336 font-lower_c3c9 font_a1f6","thin-font":"thin-font_de5b","monospace-font":"monospace-font_ac33",ellipsis:"ellipsis_e43b",resetButton:"resetButton_ddd2"};const l=a},3181:(e,n,t)=>{"use strict";t.d(n,{Z:()=>l});var r=t(7537),o=t.n(r),i=t(3645),a=t.n(i)()(o());a.push([e.id,'/* stylelint-disable color-no-hex */\n\n:root {\n  --ring-unit: 8px;\n\n  /* Element */\n  --ring-line-color: #dfe5eb;\n  --ring-dark-line-color: #475159;\n  --ring-borders-color: #b8d1e5;\n  --ring-dark-borders-color: #406380;\n  --ring-icon-color: var(--ring-borders-color);\n  --ring-icon-secondary-color: #999;\n  --ring-border-disabled-color: #dbdbdb;\n  --ring-icon-disabled-color: #bbb;\n  --ring-border-hover-color: #80c6ff;\n  --ring-dark-border-hover-color: #70b1e6;\n  --ring-icon-hover-color: var(--ring-link-hover-color);\n  --ring-main-color: #008eff;\n  --ring-main-hover-color: #007ee5;\n  --ring-icon-error-color: #db5860;\n  --ring-icon-warning-color: #eda200;\n  --ring-icon-success-color: #59a869;\n  --ring-pale-control-color: #cfdbe5;\n  --ring-popup-border-components: 0, 42, 76;\n  --ring-popup-border-color: rgba(var(--ring-popup-border-components), 0.1);\n  --ring-popup-shadow-color: rgba(var(--ring-popup-border-components), 0.15);\n  --ring-message-shadow-color: rgba(var(--ring-popup-border-components), 0.3);\n  --ring-pinned-shadow-color: #737577;\n\n  /* Text */\n  --ring-search-color: #669ecc;\n  --ring-hint-color: #406380;\n  --ring-link-color: #0f5b99;\n  --ring-link-hover-color: #ff008c;\n  --ring-error-color: #c22731;\n  --ring-warning-color: #cc8b00;\n  --ring-success-color: #1b8833;\n  --ring-text-color: #1f2326;\n  --ring-dark-text-color: #fff;\n  --ring-heading-color: var(--ring-text-color);\n  --ring-secondary-color: #737577;\n  --ring-dark-secondary-color: #888;\n  --ring-disabled-color: #999;\n  --ring-dark-disabled-color: #444;\n  --ring-dark-active-color: #ccc;\n\n  /* Background */\n  --ring-content-background-color: #fff;\n  --ring-popup-background-color: #fff;\n  --ring-sidebar-background-color: #f7f9fa;\n  --ring-selected-background-color: #d4edff;\n  --ring-hover-background-color: #ebf6ff;\n  --ring-dark-selected-background-color: #002a4d;\n  --ring-message-background-color: #111314;\n  --ring-navigation-background-color: #000;\n  --ring-tag-background-color: #e6ecf2;\n  --ring-removed-background-color: #ffd5cb;\n  --ring-warning-background-color: #faeccd;\n  --ring-added-background-color: #bce8bb;\n\n  /* Code */\n  --ring-code-background-color: var(--ring-content-background-color);\n  --ring-code-color: #000;\n  --ring-code-comment-color: #707070;\n  --ring-code-meta-color: #707070;\n  --ring-code-keyword-color: #000080;\n  --ring-code-tag-background-color: #efefef;\n  --ring-code-tag-color: var(--ring-code-keyword-color);\n  --ring-code-tag-font-weight: bold;\n  --ring-code-field-color: #660e7a;\n  --ring-code-attribute-color: #00f;\n  --ring-code-number-color: var(--ring-code-attribute-color);\n  --ring-code-string-color: #007a00;\n  --ring-code-addition-color: #aadeaa;\n  --ring-code-deletion-color: #c8c8c8;\n\n  /* Metrics */\n  --ring-border-radius: 3px;\n  --ring-border-radius-small: 2px;\n  --ring-font-size-larger: 14px;\n  --ring-font-size: 13px;\n  --ring-font-size-smaller: 12px;\n  --ring-line-height-taller: 21px;\n  --ring-line-height: 20px;\n  --ring-line-height-lower: 18px;\n  --ring-line-height-lowest: 16px;\n  --ring-ease: 0.3s ease-out;\n  --ring-fast-ease: 0.15s ease-out;\n  --ring-font-family: system-ui, -apple-system, Segoe UI, Roboto, Noto Sans, Ubuntu, Cantarell, Helvetica Neue, Arial, sans-serif;\n  --ring-font-family-monospace:\n    Menlo,\n    "Bitstream Vera Sans Mono",\n    "Ubuntu Mono",\n    Consolas,\n    "Courier New",\n    Courier,\n    monospace;\n\n  /* Common z-index-values */\n\n  /* Invisible element is an absolutely positioned element which should be below */\n  /* all other elements on the page */\n  --ring-invisible-element-z-index: -1;\n\n  /* z-index for position: fixed elements */\n  --ring-fixed-z-index: 1;\n\n  /* Elements that should overlay all other elements on the page */\n  --ring-overlay-z-index: 5;\n\n  /* Alerts should de displayed above overlays */\n  --ring-alert-z-index: 6;\n}\n',"",{version:3,sources:["webpack://./node_modules/@jetbrains/ring-ui/components/global/variables.css"],names:[],mappings:"AAAA,mCAAmC;;AAEnC;EACE,gBAAgB;;EAEhB,YAAY;EACZ,0BAA0B;EAC1B,+BAA+B;EAC/B,6BAA6B;EAC7B,kCAAkC;EAClC,4CAA4C;EAC5C,iCAAiC;EACjC,qCAAqC;EACrC,gCAAgC;EAChC,kCAAkC;EAClC,uCAAuC;EACvC,qDAAqD;EACrD,0BAA0B;EAC1B,gCAAgC;EAChC,gCAAgC;EAChC,kCAAkC;EAClC,kCAAkC;EAClC,kCAAkC;EAClC,yCAAyC;EACzC,yEAAyE;EACzE,0EAA0E;EAC1E,2EAA2E;EAC3E,mCAAmC;;EAEnC,SAAS;EACT,4BAA4B;EAC5B,0BAA0B;EAC1B,0BAA0B;EAC1B,gCAAgC;EAChC,2BAA2B;EAC3B,6BAA6B;EAC7B,6BAA6B;EAC7B,0BAA0B;EAC1B,4BAA4B;EAC5B,4CAA4C;EAC5C,+BAA+B;EAC/B,iCAAiC;EACjC,2BAA2B;EAC3B,gCAAgC;EAChC,8BAA8B;;EAE9B,eAAe;EACf,qCAAqC;EACrC,mCAAmC;EACnC,wCAAwC;EACxC,yCAAyC;EACzC,sCAAsC;EACtC,8CAA8C;EAC9C,wCAAwC;EACxC,wCAAwC;EACxC,oCAAoC;EACpC,wCAAwC;EACxC,wCAAwC;EACxC,sCAAsC;;EAEtC,SAAS;EACT,kEAAkE;EAClE,uBAAuB;EACvB,kCAAkC;EAClC,+BAA+B;EAC/B,kCAAkC;EAClC,yCAAyC;EACzC,qDAAqD;EACrD,iCAAiC;EACjC,gCAAgC;EAChC,iCAAiC;EACjC,0DAA0D;EAC1D,iCAAiC;EACjC,mCAAmC;EACnC,mCAAmC;;EAEnC,YAAY;EACZ,yBAAyB;EACzB,+BAA+B;EAC/B,6BAA6B;EAC7B,sBAAsB;EACtB,8BAA8B;EAC9B,+BAA+B;EAC/B,wBAAwB;EACxB,8BAA8B;EAC9B,+BAA+B;EAC/B,0BAA0B;EAC1B,gCAAgC;EAChC,+HAAgD;EAChD;;;;;;;aAOW;;EAEX,0BAA0B;;EAE1B,gFAAgF;EAChF,mCAAmC;EACnC,oCAAoC;;EAEpC,yCAAyC;EACzC,uBAAuB;;EAEvB,gEAAgE;EAChE,yBAAyB;;EAEzB,8CAA8C;EAC9C,uBAAuB;AACzB",sourcesContent:['/* stylelint-disable color-no-hex */\n\n:root {\n  --ring-unit: 8px;\n\n  /* Element */\n  --ring-line-color: #dfe5eb;\n  --ring-dark-line-color: #475159;\n  --ring-borders-color: #b8d1e5;\n  --ring-dark-borders-color: #406380;\n  --ring-icon-color: var(--ring-borders-color);\n  --ring-icon-secondary-color: #999;\n  --ring-border-disabled-color: #dbdbdb;\n  --ring-icon-disabled-color: #bbb;\n  --ring-border-hover-color: #80c6ff;\n  --ring-dark-border-hover-color: #70b1e6;\n  --ring-icon-hover-color: var(--ring-link-hover-color);\n  --ring-main-color: #008eff;\n  --ring-main-hover-color: #007ee5;\n  --ring-icon-error-color: #db5860;\n  --ring-icon-warning-color: #eda200;\n  --ring-icon-success-color: #59a869;\n  --ring-pale-control-color: #cfdbe5;\n  --ring-popup-border-components: 0, 42, 76;\n  --ring-popup-border-color: rgba(var(--ring-popup-border-components), 0.1);\n  --ring-popup-shadow-color: rgba(var(--ring-popup-border-components), 0.15);\n  --ring-message-shadow-color: rgba(var(--ring-popup-border-components), 0.3);\n  --ring-pinned-shadow-color: #737577;\n\n  /* Text */\n  --ring-search-color: #669ecc;\n  --ring-hint-color: #406380;\n  --ring-link-color: #0f5b99;\n  --ring-link-hover-color: #ff008c;\n  --ring-error-color: #c22731;\n  --ring-warning-color: #cc8b00;\n  --ring-success-color: #1b8833;\n  --ring-text-color: #1f2326;\n  --ring-dark-text-color: #fff;\n  --ring-heading-color: var(--ring-text-color);\n  --ring-secondary-color: #737577;\n  --ring-dark-secondary-color: #888;\n  --ring-disabled-color: #999;\n  --ring-dark-disabled-color: #444;\n  --ring-dark-active-color: #ccc;\n\n  /* Background */\n  --ring-content-background-color: #fff;\n  --ring-popup-background-color: #fff;\n  --ring-sidebar-background-color: #f7f9fa;\n  --ring-selected-background-color: #d4edff;\n  --ring-hover-background-color: #ebf6ff;\n  --ring-dark-selected-background-color: #002a4d;\n  --ring-message-background-color: #111314;\n  --ring-navigation-background-color: #000;\n  --ring-tag-background-color: #e6ecf2;\n  --ring-removed-background-color: #ffd5cb;\n  --ring-warning-background-color: #faeccd;\n  --ring-added-background-color: #bce8bb;\n\n  /* Code */\n  --ring-code-background-color: var(--ring-content-background-color);\n  --ring-code-color: #000;\n  --ring-code-comment-color: #707070;\n  --ring-code-meta-color: #707070;\n  --ring-code-keyword-color: #000080;\n  --ring-code-tag-background-color: #efefef;\n  --ring-code-tag-color: var(--ring-code-keyword-color);\n  --ring-code-tag-font-weight: bold;\n  --ring-code-field-color: #660e7a;\n  --ring-code-attribute-color: #00f;\n  --ring-code-number-color: var(--ring-code-attribute-color);\n  --ring-code-string-color: #007a00;\n  --ring-code-addition-color: #aadeaa;\n  --ring-code-deletion-color: #c8c8c8;\n\n  /* Metrics */\n  --ring-border-radius: 3px;\n  --ring-border-radius-small: 2px;\n  --ring-font-size-larger: 14px;\n  --ring-font-size: 13px;\n  --ring-font-size-smaller: 12px;\n  --ring-line-height-taller: 21px;\n  --ring-line-height: 20px;\n  --ring-line-height-lower: 18px;\n  --ring-line-height-lowest: 16px;\n  --ring-ease: 0.3s ease-out;\n  --ring-fast-ease: 0.15s ease-out;\n  --ring-font-family: system-ui, Arial, sans-serif;\n  --ring-font-family-monospace:\n    Menlo,\n    "Bitstream Vera Sans Mono",\n    "Ubuntu Mono",\n    Consolas,\n    "Courier New",\n    Courier,\n    monospace;\n\n  /* Common z-index-values */\n\n  /* Invisible element is an absolutely positioned element which should be below */\n  /* all other elements on the page */\n  --ring-invisible-element-z-index: -1;\n\n  /* z-index for position: fixed elements */\n  --ring-fixed-z-index: 1;\n\n  /* Elements that should overlay all other elements on the page */\n  --ring-overlay-z-index: 5;\n\n  /* Alerts should de displayed above overlays */\n  --ring-alert-z-index: 6;\n}\n'],sourceRoot:""}]),a.locals={};const l=a},9791:(e,n,t)=>{"use strict";t.r(n),t.d(n,{default:()=>s});var r=t(7537),o=t.n(r),i=t(3645),a=t.n(i),l=t(8004),c=t(3181),u=a()(o());u.i(c.Z),u.i(l.default,"",!0),u.push([e.id,'.icon_aaa7 {\n  display: inline-block;\n\n  fill: currentColor;\n}\n\n.glyph_f986 {\n  display: inline-flex;\n\n  margin-right: -1px;\n  margin-left: -1px;\n\n  pointer-events: none\n}\n\n.glyph_f986[width="10"] {\n    vertical-align: -1px;\n  }\n\n.glyph_f986[width="14"] {\n    margin-right: -2px;\n    margin-left: 0;\n\n    vertical-align: -3px;\n  }\n\n.glyph_f986[width="16"] {\n    vertical-align: -3px;\n  }\n\n.glyph_f986[width="20"] {\n    vertical-align: -2px;\n  }\n\n.glyph_f986.compatibilityMode_d631 {\n    width: 16px;\n    height: 16px;\n    margin-right: 0;\n    margin-left: 0;\n  }\n\n/* HACK: This media query hack makes styles applied for WebKit browsers only */\n/* stylelint-disable-next-line media-feature-name-no-vendor-prefix */\n@media screen and (-webkit-min-device-pixel-ratio: 0) {\n  .glyph_f986 {\n    width: auto; /* Safari size bug workaround, see https://youtrack.jetbrains.com/issue/RG-1983 */\n  }\n}\n\n.gray_f6a8 {\n  color: var(--ring-icon-secondary-color);\n}\n\n.hover_fc27 {\n  color: var(--ring-icon-hover-color);\n}\n\n.green_bfb1 {\n  color: var(--ring-icon-success-color);\n}\n\n.magenta_b045 {\n  color: var(--ring-link-hover-color);\n}\n\n.red_a7ec {\n  color: var(--ring-icon-error-color);\n}\n\n.blue_ec1e {\n  color: var(--ring-main-color);\n}\n\n.white_c896 {\n  color: var(--ring-dark-text-color);\n}\n\n.loading_c5e2 {\n  -webkit-animation-name: icon-loading_fe22;\n          animation-name: icon-loading_fe22;\n  -webkit-animation-duration: 1200ms;\n          animation-duration: 1200ms;\n  -webkit-animation-iteration-count: infinite;\n          animation-iteration-count: infinite;\n}\n\n@-webkit-keyframes icon-loading_fe22 {\n  0% {\n    transform: scale(1);\n  }\n\n  50% {\n    transform: scale(0.9);\n\n    opacity: 0.5;\n  }\n\n  100% {\n    transform: scale(1);\n  }\n}\n\n@keyframes icon-loading_fe22 {\n  0% {\n    transform: scale(1);\n  }\n\n  50% {\n    transform: scale(0.9);\n\n    opacity: 0.5;\n  }\n\n  100% {\n    transform: scale(1);\n  }\n}\n',"",{version:3,sources:["webpack://./node_modules/@jetbrains/ring-ui/components/icon/icon.css"],names:[],mappings:"AAIA;EACE,qBAAqB;;EAErB,kBAAkB;AACpB;;AAEA;EACE,oBAAoB;;EAEpB,kBAAkB;EAClB,iBAAiB;;EAEjB;AA2BF;;AAzBE;IACE,oBAAoB;EACtB;;AAEA;IACE,kBAAkB;IAClB,cAAc;;IAEd,oBAAoB;EACtB;;AAEA;IACE,oBAAoB;EACtB;;AAEA;IACE,oBAAoB;EACtB;;AAEA;IACE,WAAqB;IACrB,YAAsB;IACtB,eAAe;IACf,cAAc;EAChB;;AAGF,8EAA8E;AAC9E,oEAAoE;AACpE;EACE;IACE,WAAW,EAAE,iFAAiF;EAChG;AACF;;AAEA;EACE,uCAAuC;AACzC;;AAEA;EACE,mCAAmC;AACrC;;AAEA;EACE,qCAAqC;AACvC;;AAEA;EACE,mCAAmC;AACrC;;AAEA;EACE,mCAAmC;AACrC;;AAEA;EACE,6BAA6B;AAC/B;;AAEA;EACE,kCAAkC;AACpC;;AAEA;EACE,yCAA4B;UAA5B,iCAA4B;EAC5B,kCAA0B;UAA1B,0BAA0B;EAC1B,2CAAmC;UAAnC,mCAAmC;AACrC;;AAEA;EACE;IACE,mBAAmB;EACrB;;EAEA;IACE,qBAAqB;;IAErB,YAAY;EACd;;EAEA;IACE,mBAAmB;EACrB;AACF;;AAdA;EACE;IACE,mBAAmB;EACrB;;EAEA;IACE,qBAAqB;;IAErB,YAAY;EACd;;EAEA;IACE,mBAAmB;EACrB;AACF",sourcesContent:['@import "../global/variables.css";\n\n@value unit from "../global/global.css";\n\n.icon {\n  display: inline-block;\n\n  fill: currentColor;\n}\n\n.glyph {\n  display: inline-flex;\n\n  margin-right: -1px;\n  margin-left: -1px;\n\n  pointer-events: none;\n\n  &[width="10"] {\n    vertical-align: -1px;\n  }\n\n  &[width="14"] {\n    margin-right: -2px;\n    margin-left: 0;\n\n    vertical-align: -3px;\n  }\n\n  &[width="16"] {\n    vertical-align: -3px;\n  }\n\n  &[width="20"] {\n    vertical-align: -2px;\n  }\n\n  &.compatibilityMode {\n    width: calc(unit * 2);\n    height: calc(unit * 2);\n    margin-right: 0;\n    margin-left: 0;\n  }\n}\n\n/* HACK: This media query hack makes styles applied for WebKit browsers only */\n/* stylelint-disable-next-line media-feature-name-no-vendor-prefix */\n@media screen and (-webkit-min-device-pixel-ratio: 0) {\n  .glyph {\n    width: auto; /* Safari size bug workaround, see https://youtrack.jetbrains.com/issue/RG-1983 */\n  }\n}\n\n.gray {\n  color: var(--ring-icon-secondary-color);\n}\n\n.hover {\n  color: var(--ring-icon-hover-color);\n}\n\n.green {\n  color: var(--ring-icon-success-color);\n}\n\n.magenta {\n  color: var(--ring-link-hover-color);\n}\n\n.red {\n  color: var(--ring-icon-error-color);\n}\n\n.blue {\n  color: var(--ring-main-color);\n}\n\n.white {\n  color: var(--ring-dark-text-color);\n}\n\n.loading {\n  animation-name: icon-loading;\n  animation-duration: 1200ms;\n  animation-iteration-count: infinite;\n}\n\n@keyframes icon-loading {\n  0% {\n    transform: scale(1);\n  }\n\n  50% {\n    transform: scale(0.9);\n\n    opacity: 0.5;\n  }\n\n  100% {\n    transform: scale(1);\n  }\n}\n'],sourceRoot:""}]),u.locals={unit:""+l.default.locals.unit,icon:"icon_aaa7",glyph:"glyph_f986",compatibilityMode:"compatibilityMode_d631",gray:"gray_f6a8",hover:"hover_fc27",green:"green_bfb1",magenta:"magenta_b045",red:"red_a7ec",blue:"blue_ec1e",white:"white_c896",loading:"loading_c5e2","icon-loading":"icon-loading_fe22"};const s=u},4434:(e,n,t)=>{"use strict";t.r(n),t.d(n,{default:()=>s});var r=t(7537),o=t.n(r),i=t(3645),a=t.n(i),l=t(8004),c=t(3181),u=a()(o());u.i(c.Z),u.i(l.default,"",!0),u.push([e.id,":root {\n  --ring-input-xs: 50px;\n  --ring-input-s: 100px;\n  --ring-input-m: 200px;\n  --ring-input-l: 400px;\n}\n\n/**\n * @name Input Sizes\n */\n\n/* XS */\n\n.ring-input-size_xs.ring-input-size_xs {\n  display: inline-block;\n\n  width: 50px;\n\n  width: var(--ring-input-xs);\n}\n\n.ring-input-size_xs.ring-input-size_xs ~ .ring-error-bubble {\n  left: 52px;\n  left: calc(var(--ring-input-xs) + 2px);\n}\n\n/* S */\n\n.ring-input-size_s.ring-input-size_s {\n  display: inline-block;\n\n  width: 100px;\n\n  width: var(--ring-input-s);\n}\n\n.ring-input-size_s.ring-input-size_s ~ .ring-error-bubble {\n  left: 102px;\n  left: calc(var(--ring-input-s) + 2px);\n}\n\n/* M */\n\n.ring-input-size_md.ring-input-size_md {\n  display: inline-block;\n\n  width: 200px;\n\n  width: var(--ring-input-m);\n}\n\n.ring-input-size_md.ring-input-size_md ~ .ring-error-bubble {\n  left: 202px;\n  left: calc(var(--ring-input-m) + 2px);\n}\n\n/* L */\n\n.ring-input-size_l.ring-input-size_l {\n  display: inline-block;\n\n  width: 400px;\n\n  width: var(--ring-input-l);\n}\n\n.ring-input-size_l.ring-input-size_l ~ .ring-error-bubble {\n  left: 402px;\n  left: calc(var(--ring-input-l) + 2px);\n}\n","",{version:3,sources:["webpack://./node_modules/@jetbrains/ring-ui/components/input-size/input-size.css"],names:[],mappings:"AAIA;EACE,qBAAqB;EACrB,qBAAqB;EACrB,qBAAqB;EACrB,qBAAqB;AACvB;;AAEA;;EAEE;;AAEF,OAAO;;AAEP;EACE,qBAAqB;;EAErB,WAA2B;;EAA3B,2BAA2B;AAC7B;;AAEA;EACE,UAAsC;EAAtC,sCAAsC;AACxC;;AAEA,MAAM;;AAEN;EACE,qBAAqB;;EAErB,YAA0B;;EAA1B,0BAA0B;AAC5B;;AAEA;EACE,WAAqC;EAArC,qCAAqC;AACvC;;AAEA,MAAM;;AAEN;EACE,qBAAqB;;EAErB,YAA0B;;EAA1B,0BAA0B;AAC5B;;AAEA;EACE,WAAqC;EAArC,qCAAqC;AACvC;;AAEA,MAAM;;AAEN;EACE,qBAAqB;;EAErB,YAA0B;;EAA1B,0BAA0B;AAC5B;;AAEA;EACE,WAAqC;EAArC,qCAAqC;AACvC",sourcesContent:['@import "../global/variables.css";\n\n@value unit from "../global/global.css";\n\n:root {\n  --ring-input-xs: 50px;\n  --ring-input-s: 100px;\n  --ring-input-m: 200px;\n  --ring-input-l: 400px;\n}\n\n/**\n * @name Input Sizes\n */\n\n/* XS */\n\n:global(.ring-input-size_xs.ring-input-size_xs) {\n  display: inline-block;\n\n  width: var(--ring-input-xs);\n}\n\n:global(.ring-input-size_xs.ring-input-size_xs ~ .ring-error-bubble) {\n  left: calc(var(--ring-input-xs) + 2px);\n}\n\n/* S */\n\n:global(.ring-input-size_s.ring-input-size_s) {\n  display: inline-block;\n\n  width: var(--ring-input-s);\n}\n\n:global(.ring-input-size_s.ring-input-size_s ~ .ring-error-bubble) {\n  left: calc(var(--ring-input-s) + 2px);\n}\n\n/* M */\n\n:global(.ring-input-size_md.ring-input-size_md) {\n  display: inline-block;\n\n  width: var(--ring-input-m);\n}\n\n:global(.ring-input-size_md.ring-input-size_md ~ .ring-error-bubble) {\n  left: calc(var(--ring-input-m) + 2px);\n}\n\n/* L */\n\n:global(.ring-input-size_l.ring-input-size_l) {\n  display: inline-block;\n\n  width: var(--ring-input-l);\n}\n\n:global(.ring-input-size_l.ring-input-size_l ~ .ring-error-bubble) {\n  left: calc(var(--ring-input-l) + 2px);\n}\n'],sourceRoot:""}]),u.locals={unit:""+l.default.locals.unit};const s=u},5968:(e,n,t)=>{"use strict";t.r(n),t.d(n,{default:()=>s});var r=t(7537),o=t.n(r),i=t(3645),a=t.n(i),l=t(8004),c=t(3181),u=a()(o());u.i(c.Z),u.i(l.default,"",!0),u.push([e.id,".container_ee33 {\n\n  position: relative;\n\n  box-sizing: border-box;\n  min-height: 64px;\n  padding-top: 16px\n}\n\n.container_ee33 * {\n    box-sizing: border-box;\n  }\n\n.compact_ac08 {\n  min-height: 32px;\n  padding: 0;\n}\n\n.input_f220 {\n  width: 100%;\n  min-height: 32px;\n  padding: 0;\n\n  border: none;\n  outline: none;\n  background: transparent;\n\n  font: inherit;\n  caret-color: var(--ring-main-color)\n}\n\n.clearable_fd1e .input_f220 {\n    padding-right: 24px\n}\n\n[dir=rtl] .clearable_fd1e .input_f220 {\n      padding-right: 0;\n      padding-left: 24px\n}\n\n.light_d369 .input_f220 {\n    color: var(--ring-text-color)\n}\n\n.dark_a1d3 .input_f220 {\n    color: var(--ring-dark-text-color)\n}\n\n.input_f220::-moz-placeholder {\n    color: transparent;\n  }\n\n.input_f220:-ms-input-placeholder {\n    color: transparent;\n  }\n\n.input_f220::placeholder {\n    color: transparent;\n  }\n\n.input_f220[disabled] {\n    color: var(--ring-disabled-color);\n\n    -webkit-text-fill-color: var(--ring-disabled-color); /* Required for Safari, see RG-2063 for details */\n  }\n\n.input_f220 {\n\n  /*\n    Kill yellow/blue webkit autocomplete\n    https://css-tricks.com/snippets/css/change-autocomplete-styles-webkit-browsers/\n  */\n}\n\n@media (hover: hover), (-moz-touch-enabled: 0), (-ms-high-contrast: none), (-ms-high-contrast: active) {.input_f220:-webkit-autofill:hover {\n      -webkit-transition: background-color 50000s ease-in-out 0s;\n      transition: background-color 50000s ease-in-out 0s;\n    }}\n\n.input_f220:-webkit-autofill,\n    .input_f220:-webkit-autofill:focus {\n      -webkit-transition: background-color 50000s ease-in-out 0s;\n      transition: background-color 50000s ease-in-out 0s;\n    }\n\n.input_f220 {\n\n  /* if you need a cross, pass onClear prop */\n}\n\n.input_f220::-ms-clear {\n    display: none;\n  }\n\n.withIcon_f066 .input_f220,\n.withIcon_f066 .label_db4f {\n  padding-left: 22px\n}\n\n[dir=rtl] :is(.withIcon_f066 .input_f220,.withIcon_f066 .label_db4f) {\n    padding-right: 22px;\n    padding-left: 0\n}\n\n.icon_e49c,\n\n.clear_ffc3.clear_ffc3 {\n  position: absolute;\n  top: 17px;\n\n  line-height: 32px\n}\n\n.compact_ac08 :is(.icon_e49c,.clear_ffc3.clear_ffc3) {\n    top: 1px\n}\n\n.icon_e49c {\n  left: 0;\n\n  color: var(--ring-icon-color)\n}\n\n[dir=rtl] .icon_e49c {\n    right: 0;\n    left: auto\n}\n\n.clear_ffc3 {\n  right: 0;\n\n  padding-right: 0\n}\n\n.empty_cc0d .clear_ffc3 {\n    display: none\n}\n\n[dir=rtl] .clear_ffc3 {\n    right: auto;\n    left: 0\n}\n\ntextarea.input_f220 {\n  overflow: hidden;\n\n  box-sizing: border-box;\n  padding-top: 8px;\n\n  resize: none;\n}\n\n.label_db4f {\n  position: absolute;\n  top: 23px;\n  left: 0;\n\n  transition: transform var(--ring-fast-ease), color var(--ring-fast-ease);\n  transform-origin: top left;\n  pointer-events: none\n}\n\n.light_d369 .label_db4f {\n    color: var(--ring-secondary-color)\n}\n\n.dark_a1d3 .label_db4f {\n    color: var(--ring-dark-secondary-color)\n}\n\n.input_f220:focus ~ .label_db4f,\n.container_ee33.active_f5cf > .label_db4f,\n.container_ee33:not(.empty_cc0d) > .label_db4f {\n  transform: translateY(-20px) scale(0.92308);\n}\n\n.noLabel_e16e ::-moz-placeholder, .input_f220:focus::-moz-placeholder {\n  -moz-transition: color var(--ring-fast-ease);\n  transition: color var(--ring-fast-ease);\n}\n\n.noLabel_e16e :-ms-input-placeholder, .input_f220:focus:-ms-input-placeholder {\n  -ms-transition: color var(--ring-fast-ease);\n  transition: color var(--ring-fast-ease);\n}\n\n.noLabel_e16e ::placeholder,\n.input_f220:focus::placeholder {\n  transition: color var(--ring-fast-ease);\n}\n\n.light_d369.noLabel_e16e ::-moz-placeholder, .light_d369 :focus::-moz-placeholder {\n  color: var(--ring-disabled-color);\n}\n\n.light_d369.noLabel_e16e :-ms-input-placeholder, .light_d369 :focus:-ms-input-placeholder {\n  color: var(--ring-disabled-color);\n}\n\n.light_d369.noLabel_e16e ::placeholder,\n.light_d369 :focus::placeholder {\n  color: var(--ring-disabled-color);\n}\n\n/* stylelint-disable-next-line selector-max-specificity */\n.dark_a1d3.noLabel_e16e ::-moz-placeholder, .dark_a1d3 :focus::-moz-placeholder {\n  color: var(--ring-secondary-color);\n}\n.dark_a1d3.noLabel_e16e :-ms-input-placeholder, .dark_a1d3 :focus:-ms-input-placeholder {\n  color: var(--ring-secondary-color);\n}\n.dark_a1d3.noLabel_e16e ::placeholder,\n\n.dark_a1d3 :focus::placeholder {\n  color: var(--ring-secondary-color);\n}\n\n.input_f220:focus ~ .label_db4f {\n  color: var(--ring-main-color);\n}\n\n.error_ff90 > :focus ~ .label_db4f {\n  color: var(--ring-error-color);\n}\n\n.underline_c438 {\n  height: 1px;\n\n  border-bottom-width: 1px;\n  border-bottom-style: solid\n}\n\n.light_d369 .underline_c438 {\n    border-color: var(--ring-borders-color)\n}\n\n.dark_a1d3 .underline_c438 {\n    border-color: var(--ring-dark-borders-color)\n}\n\n.input_f220[disabled] ~ .underline_c438 {\n  border-bottom-style: dashed;\n}\n\n.focusUnderline_fc5d,\n.errorUnderline_a0ab {\n  width: 100%;\n  height: 2px;\n\n  transform: scaleX(0);\n  transform-origin: top left;\n}\n\n.focusUnderline_fc5d {\n  margin-top: -1px;\n\n  background: var(--ring-main-color);\n}\n\n.errorUnderline_a0ab {\n  margin-top: -2px;\n\n  background: var(--ring-icon-error-color)\n}\n\n.dark_a1d3 .errorUnderline_a0ab {\n    background: var(--ring-error-color)\n}\n\n.input_f220:focus ~ .focusUnderline_fc5d,\n.container_ee33.active_f5cf > .focusUnderline_fc5d,\n.error_ff90 > .errorUnderline_a0ab {\n  transition: transform 0.15s ease-out;\n  transform: scaleX(1);\n}\n\n.errorText_e447 {\n  overflow: hidden;\n\n  box-sizing: border-box;\n  height: 0;\n  padding: 4px 0 8px;\n\n  transition: height 0.3s ease-out;\n\n  color: var(--ring-error-color);\n\n  font-size: var(--ring-font-size-smaller);\n  line-height: var(--ring-line-height-lowest);\n}\n\n.sizeS_c560 {\n  width: 96px;\n}\n\n.sizeM_aee6 {\n  width: 240px;\n}\n\n.sizeL_b0ca {\n  width: 400px;\n}\n\n.sizeFULL_f4f9 {\n  width: 100%;\n}\n","",{version:3,sources:["webpack://./node_modules/@jetbrains/ring-ui/components/input/input.css","<no source>"],names:[],mappings:"AAKA;;EAGE,kBAAkB;;EAElB,sBAAsB;EACtB,gBAA0B;EAC1B;AAKF;;AAHE;IACE,sBAAsB;EACxB;;AAGF;EACE,gBAA0B;EAC1B,UAAU;AACZ;;AAEA;EACE,WAAW;EACX,gBAA0B;EAC1B,UAAU;;EAEV,YAAY;EACZ,aAAa;EACb,uBAAuB;;EAEvB,aAAa;EACb;AA6CF;;AAvDA;IAaI;AA0CJ;;AAvDA;MAgBM,gBAAgB;MAChB;AAsCN;;AAvDA;IAsBI;AAiCJ;;AAvDA;IA0BI;AA6BJ;;AA1BE;IACE,kBAAkB;EACpB;;AAFA;IACE,kBAAkB;EACpB;;AAFA;IACE,kBAAkB;EACpB;;AAEA;IACE,iCAAiC;;IAEjC,mDAAmD,EAAE,iDAAiD;EACxG;;AArCF;;EAuCE;;;GAGC;AAaH;;AC/EA,wGAAA;MAAA,2DAAA;MAAA,mDAAA;KAAA,CAAA;;ADoEI;;MAGE,0DAAkD;MAAlD,kDAAkD;IACpD;;AAhDJ;;EAmDE,2CAA2C;AAI7C;;AAHE;IACE,aAAa;EACf;;AAGF;;EAEE;AAMF;;AARA;IAKI,mBAAyB;IACzB;AAEJ;;AAEA;;;EAGE,kBAAkB;EAClB,SAAS;;EAET;AAKF;;AAXA;IASI;AAEJ;;AAEA;EACE,OAAO;;EAEP;AAMF;;AATA;IAMI,QAAQ;IACR;AAEJ;;AAEA;EACE,QAAQ;;EAER;AAUF;;AAbA;IAMI;AAOJ;;AAbA;IAUI,WAAW;IACX;AAEJ;;AAEA;EACE,gBAAgB;;EAEhB,sBAAsB;EACtB,gBAAiB;;EAEjB,YAAY;AACd;;AAEA;EACE,kBAAkB;EAClB,SAAyB;EACzB,OAAO;;EAEP,wEAAwE;EACxE,0BAA0B;EAC1B;AASF;;AAhBA;IAUI;AAMJ;;AAhBA;IAcI;AAEJ;;AAEA;;;EAGE,2CAA6D;AAC/D;;AAEA;EAEE,4CAAuC;EAAvC,uCAAuC;AACzC;;AAHA;EAEE,2CAAuC;EAAvC,uCAAuC;AACzC;;AAHA;;EAEE,uCAAuC;AACzC;;AAEA;EAEE,iCAAiC;AACnC;;AAHA;EAEE,iCAAiC;AACnC;;AAHA;;EAEE,iCAAiC;AACnC;;AAEA,yDAAyD;AACzD;EAGE,kCAAkC;AACpC;AAJA;EAGE,kCAAkC;AACpC;AAJA;;;EAGE,kCAAkC;AACpC;;AAEA;EACE,6BAA6B;AAC/B;;AAEA;EACE,8BAA8B;AAChC;;AAEA;EACE,WAAW;;EAEX,wBAAwB;EACxB;AASF;;AAbA;IAOI;AAMJ;;AAbA;IAWI;AAEJ;;AAEA;EACE,2BAA2B;AAC7B;;AAEA;;EAEE,WAAW;EACX,WAAW;;EAEX,oBAAoB;EACpB,0BAA0B;AAC5B;;AAEA;EACE,gBAAgB;;EAEhB,kCAAkC;AACpC;;AAEA;EACE,gBAAgB;;EAEhB;AAKF;;AARA;IAMI;AAEJ;;AAEA;;;EAGE,oCAAoC;EACpC,oBAAoB;AACtB;;AAEA;EACE,gBAAgB;;EAEhB,sBAAsB;EACtB,SAAS;EACT,kBAA8B;;EAE9B,gCAAgC;;EAEhC,8BAA8B;;EAE9B,wCAAwC;EACxC,2CAA2C;AAC7C;;AAEA;EACE,WAAsB;AACxB;;AAEA;EACE,YAAsB;AACxB;;AAEA;EACE,YAAsB;AACxB;;AAEA;EACE,WAAW;AACb",sourcesContent:['@import "../global/variables.css";\n\n@value unit from "../global/global.css";\n@value iconOffset: calc(unit * 3 - 2px);\n\n.container {\n  composes: font-lower from  "../global/global.css";\n\n  position: relative;\n\n  box-sizing: border-box;\n  min-height: calc(unit * 8);\n  padding-top: calc(unit * 2);\n\n  & * {\n    box-sizing: border-box;\n  }\n}\n\n.compact {\n  min-height: calc(unit * 4);\n  padding: 0;\n}\n\n.input {\n  width: 100%;\n  min-height: calc(unit * 4);\n  padding: 0;\n\n  border: none;\n  outline: none;\n  background: transparent;\n\n  font: inherit;\n  caret-color: var(--ring-main-color);\n\n  @nest .clearable & {\n    padding-right: calc(unit * 3);\n\n    @nest [dir=rtl] & {\n      padding-right: 0;\n      padding-left: calc(unit * 3);\n    }\n  }\n\n  @nest .light & {\n    color: var(--ring-text-color);\n  }\n\n  @nest .dark & {\n    color: var(--ring-dark-text-color);\n  }\n\n  &::placeholder {\n    color: transparent;\n  }\n\n  &[disabled] {\n    color: var(--ring-disabled-color);\n\n    -webkit-text-fill-color: var(--ring-disabled-color); /* Required for Safari, see RG-2063 for details */\n  }\n\n  /*\n    Kill yellow/blue webkit autocomplete\n    https://css-tricks.com/snippets/css/change-autocomplete-styles-webkit-browsers/\n  */\n  &:-webkit-autofill {\n    &,\n    &:hover,\n    &:focus {\n      transition: background-color 50000s ease-in-out 0s;\n    }\n  }\n\n  /* if you need a cross, pass onClear prop */\n  &::-ms-clear {\n    display: none;\n  }\n}\n\n.withIcon .input,\n.withIcon .label {\n  padding-left: iconOffset;\n\n  @nest [dir=rtl] & {\n    padding-right: iconOffset;\n    padding-left: 0;\n  }\n}\n\n.icon,\n/* override Button */\n.clear.clear {\n  position: absolute;\n  top: 17px;\n\n  line-height: calc(unit * 4);\n\n  @nest .compact & {\n    top: 1px;\n  }\n}\n\n.icon {\n  left: 0;\n\n  color: var(--ring-icon-color);\n\n  @nest [dir=rtl] & {\n    right: 0;\n    left: auto;\n  }\n}\n\n.clear {\n  right: 0;\n\n  padding-right: 0;\n\n  @nest .empty & {\n    display: none;\n  }\n\n  @nest [dir=rtl] & {\n    right: auto;\n    left: 0;\n  }\n}\n\ntextarea.input {\n  overflow: hidden;\n\n  box-sizing: border-box;\n  padding-top: unit;\n\n  resize: none;\n}\n\n.label {\n  position: absolute;\n  top: calc(unit * 3 - 1px);\n  left: 0;\n\n  transition: transform var(--ring-fast-ease), color var(--ring-fast-ease);\n  transform-origin: top left;\n  pointer-events: none;\n\n  @nest .light & {\n    color: var(--ring-secondary-color);\n  }\n\n  @nest .dark & {\n    color: var(--ring-dark-secondary-color);\n  }\n}\n\n.input:focus ~ .label,\n.container.active > .label,\n.container:not(.empty) > .label {\n  transform: translateY(calc(unit * -2.5)) scale(calc(12 / 13));\n}\n\n.noLabel ::placeholder,\n.input:focus::placeholder {\n  transition: color var(--ring-fast-ease);\n}\n\n.light.noLabel ::placeholder,\n.light :focus::placeholder {\n  color: var(--ring-disabled-color);\n}\n\n/* stylelint-disable-next-line selector-max-specificity */\n.dark.noLabel ::placeholder,\n/* stylelint-disable-next-line selector-max-specificity */\n.dark :focus::placeholder {\n  color: var(--ring-secondary-color);\n}\n\n.input:focus ~ .label {\n  color: var(--ring-main-color);\n}\n\n.error > :focus ~ .label {\n  color: var(--ring-error-color);\n}\n\n.underline {\n  height: 1px;\n\n  border-bottom-width: 1px;\n  border-bottom-style: solid;\n\n  @nest .light & {\n    border-color: var(--ring-borders-color);\n  }\n\n  @nest .dark & {\n    border-color: var(--ring-dark-borders-color);\n  }\n}\n\n.input[disabled] ~ .underline {\n  border-bottom-style: dashed;\n}\n\n.focusUnderline,\n.errorUnderline {\n  width: 100%;\n  height: 2px;\n\n  transform: scaleX(0);\n  transform-origin: top left;\n}\n\n.focusUnderline {\n  margin-top: -1px;\n\n  background: var(--ring-main-color);\n}\n\n.errorUnderline {\n  margin-top: -2px;\n\n  background: var(--ring-icon-error-color);\n\n  @nest .dark & {\n    background: var(--ring-error-color);\n  }\n}\n\n.input:focus ~ .focusUnderline,\n.container.active > .focusUnderline,\n.error > .errorUnderline {\n  transition: transform 0.15s ease-out;\n  transform: scaleX(1);\n}\n\n.errorText {\n  overflow: hidden;\n\n  box-sizing: border-box;\n  height: 0;\n  padding: calc(unit / 2) 0 unit;\n\n  transition: height 0.3s ease-out;\n\n  color: var(--ring-error-color);\n\n  font-size: var(--ring-font-size-smaller);\n  line-height: var(--ring-line-height-lowest);\n}\n\n.sizeS {\n  width: calc(unit * 12);\n}\n\n.sizeM {\n  width: calc(unit * 30);\n}\n\n.sizeL {\n  width: calc(unit * 50);\n}\n\n.sizeFULL {\n  width: 100%;\n}\n',null],sourceRoot:""}]),u.locals={unit:""+l.default.locals.unit,iconOffset:"22px",container:"container_ee33 "+l.default.locals["font-lower"],compact:"compact_ac08",input:"input_f220",clearable:"clearable_fd1e",light:"light_d369",dark:"dark_a1d3",withIcon:"withIcon_f066",label:"label_db4f",icon:"icon_e49c",clear:"clear_ffc3",empty:"empty_cc0d",active:"active_f5cf",noLabel:"noLabel_e16e",error:"error_ff90",underline:"underline_c438",focusUnderline:"focusUnderline_fc5d",errorUnderline:"errorUnderline_a0ab",errorText:"errorText_e447",sizeS:"sizeS_c560",sizeM:"sizeM_aee6",sizeL:"sizeL_b0ca",sizeFULL:"sizeFULL_f4f9"};const s=u},9506:(e,n,t)=>{"use strict";t.r(n),t.d(n,{default:()=>s});var r=t(7537),o=t.n(r),i=t(3645),a=t.n(i),l=t(3579),c=t(3181),u=a()(o());u.i(c.Z),u.i(l.Z,"",!0),u.push([e.id,"@media (hover: hover), (-moz-touch-enabled: 0), (-ms-high-contrast: none), (-ms-high-contrast: active) {.link_e6e5:hover {\n    transition: none;\n\n    color: var(--ring-link-hover-color);\n  }}\n\n@media (hover: hover), (-moz-touch-enabled: 0), (-ms-high-contrast: none), (-ms-high-contrast: active) {.link_e6e5:hover {\n    text-decoration: none;\n  }}\n\n.link_e6e5 { /* To override link stiles inside alert */\n\n  cursor: pointer;\n  transition: color var(--ring-fast-ease);\n\n  color: var(--ring-link-color)\n}\n\n.link_e6e5 {\n    text-decoration: none;\n  }\n\n.link_e6e5.hover_bed7 {\n    transition: none;\n\n    color: var(--ring-link-hover-color);\n  }\n\n@media (hover: hover), (-moz-touch-enabled: 0), (-ms-high-contrast: none), (-ms-high-contrast: active) {.link_e6e5:hover .inner_e3ba {\n    border-width: 0;\n    border-bottom: 2px solid;\n    border-image-source: linear-gradient(currentcolor 50%, transparent 50%);\n    border-image-slice: 0 0 100% 0;\n  }}\n\n.link_e6e5.active_f804 {\n    color: inherit;\n  }\n\n@media (hover: hover), (-moz-touch-enabled: 0), (-ms-high-contrast: none), (-ms-high-contrast: active) {.link_e6e5.compatibilityUnderlineMode_e7a0:hover {\n    text-decoration: underline\n\n    /* stylelint-disable-next-line selector-max-specificity */\n  }\n    .link_e6e5.compatibilityUnderlineMode_e7a0:hover .inner_e3ba {\n      border: none;\n    }}\n\n@media (hover: hover), (-moz-touch-enabled: 0), (-ms-high-contrast: none), (-ms-high-contrast: active) {.link_e6e5.pseudo_d9ae:hover {\n    text-decoration: none\n\n    /* stylelint-disable-next-line selector-max-specificity */\n  }\n    .link_e6e5.pseudo_d9ae:hover .inner_e3ba {\n      border: none;\n    }}\n\n.link_e6e5 {\n\n  outline: none;\n  }\n\n.link_e6e5.focus-visible {\n    box-shadow: 0 0 0 2px var(--ring-border-hover-color);\n  }\n\n@media (-webkit-min-device-pixel-ratio: 2), (min-resolution: 2dppx) {@media (hover: hover), (-moz-touch-enabled: 0), (-ms-high-contrast: none), (-ms-high-contrast: active) {.link_e6e5:hover .inner_e3ba {\n    border-bottom-width: 1px;\n  }}\n}\n\n.text_e98a {\n  border-radius: var(--ring-border-radius);\n}\n\n@media (hover: hover), (-moz-touch-enabled: 0), (-ms-high-contrast: none), (-ms-high-contrast: active) {.inherit_d267:not(:hover) {\n  color: inherit;\n}}\n\n.pseudo_d9ae {\n  margin: 0;\n  padding: 0;\n\n  text-align: left;\n\n  border: 0;\n\n  background: transparent;\n\n  font: inherit\n}\n\n.pseudo_d9ae::-moz-focus-inner {\n    padding: 0;\n\n    border: 0;\n  }\n","",{version:3,sources:["<no source>","webpack://./node_modules/@jetbrains/ring-ui/components/link/link.css"],names:[],mappings:"AAAA,wGAAA;IAAA,iBAAA;;IAAA,oCAAA;GAAA,CAAA;;AAAA,wGAAA;IAAA,sBAAA;GAAA,CAAA;;ACEA,aAC4C,yCAAyC;;EAEnF,eAAe;EACf,uCAAuC;;EAEvC;AAgDF;;AA9CE;IAEE,qBAAqB;EACvB;;AAEA;IAEE,gBAAgB;;IAEhB,mCAAmC;EACrC;;ADpBF,wGAAA;IAAA,gBAAA;IAAA,yBAAA;IAAA,wEAAA;IAAA,+BAAA;GAAA,CAAA;;AC6BE;IACE,cAAc;EAChB;;AD/BF,wGAAA;IAAA,0BAAA;;IAAA,0DAAA;GAAA;IAAA;MAAA,aAAA;KAAA,CAAA;;AAAA,wGAAA;IAAA,qBAAA;;IAAA,0DAAA;GAAA;IAAA;MAAA,aAAA;KAAA,CAAA;;ACUE;;EAyCA,aAAa;EAtCb;;AAwCA;IACE,oDAAoD;EACtD;;AAGF,qED1DA,wGAAA;IAAA,yBAAA;GAAA,CAAA;AC8DA;;AAEA;EACE,wCAAwC;AAC1C;;ADlEA,wGAAA;EAAA,eAAA;CAAA,CAAA;;ACwEA;EACE,SAAS;EACT,UAAU;;EAEV,gBAAgB;;EAEhB,SAAS;;EAET,uBAAuB;;EAEvB;AAOF;;AALE;IACE,UAAU;;IAEV,SAAS;EACX",sourcesContent:[null,'@import "../global/variables.css";\n\n.link {\n  composes: link from "../alert/alert.css"; /* To override link stiles inside alert */\n\n  cursor: pointer;\n  transition: color var(--ring-fast-ease);\n\n  color: var(--ring-link-color);\n\n  &,\n  &:hover {\n    text-decoration: none;\n  }\n\n  &:hover,\n  &.hover {\n    transition: none;\n\n    color: var(--ring-link-hover-color);\n  }\n\n  &:hover .inner {\n    border-width: 0;\n    border-bottom: 2px solid;\n    border-image-source: linear-gradient(currentcolor 50%, transparent 50%);\n    border-image-slice: 0 0 100% 0;\n  }\n\n  &.active {\n    color: inherit;\n  }\n\n  &.compatibilityUnderlineMode:hover {\n    text-decoration: underline;\n\n    /* stylelint-disable-next-line selector-max-specificity */\n    & .inner {\n      border: none;\n    }\n  }\n\n  &.pseudo:hover {\n    text-decoration: none;\n\n    /* stylelint-disable-next-line selector-max-specificity */\n    & .inner {\n      border: none;\n    }\n  }\n\n  outline: none;\n\n  &:global(.focus-visible) {\n    box-shadow: 0 0 0 2px var(--ring-border-hover-color);\n  }\n}\n\n@media (min-resolution: 2dppx) {\n  .link:hover .inner {\n    border-bottom-width: 1px;\n  }\n}\n\n.text {\n  border-radius: var(--ring-border-radius);\n}\n\n.inherit:not(:hover) {\n  color: inherit;\n}\n\n.pseudo {\n  margin: 0;\n  padding: 0;\n\n  text-align: left;\n\n  border: 0;\n\n  background: transparent;\n\n  font: inherit;\n\n  &::-moz-focus-inner {\n    padding: 0;\n\n    border: 0;\n  }\n}\n'],sourceRoot:""}]),u.locals={link:"link_e6e5 "+l.Z.locals.link,hover:"hover_bed7",inner:"inner_e3ba",active:"active_f804",compatibilityUnderlineMode:"compatibilityUnderlineMode_e7a0",pseudo:"pseudo_d9ae",text:"text_e98a",inherit:"inherit_d267"};const s=u},5578:(e,n,t)=>{"use strict";t.r(n),t.d(n,{default:()=>s});var r=t(7537),o=t.n(r),i=t(3645),a=t.n(i),l=t(8004),c=t(3181),u=a()(o());u.i(c.Z),u.i(l.default,"",!0),u.push([e.id,".list_a01c {\n  position: relative;\n\n  z-index: 1;\n\n  border-radius: var(--ring-border-radius);\n\n  line-height: normal;\n}\n\n.simpleInner_a4f8 {\n  overflow: auto;\n}\n\n.scrolling_a910 {\n  pointer-events: none;\n}\n\n.separator_c26e {\n  display: block;\n\n  min-height: 8px;\n\n  margin-top: 8px;\n  padding: 0 16px 1px;\n\n  text-align: right;\n\n  color: var(--ring-secondary-color);\n  border-top: 1px solid var(--ring-line-color);\n\n  font-size: var(--ring-font-size-smaller);\n  line-height: var(--ring-line-height-lower);\n}\n\n.separator_first_ec9e {\n  margin-top: 0;\n  padding-top: 0;\n\n  border: none;\n}\n\n.item_eadd {\n  display: block;\n\n  box-sizing: border-box;\n\n  width: 100%;\n\n  text-align: left;\n  vertical-align: bottom;\n  white-space: nowrap;\n  text-decoration: none;\n\n  outline: none;\n\n  font-size: var(--ring-font-size);\n  line-height: 24px;\n}\n\n.item_eadd.item_eadd {\n  padding: 3px 16px 5px;\n}\n\n.itemContainer_f365 {\n  position: relative;\n}\n\n.compact_efa8 {\n  line-height: 16px;\n}\n\n@media (hover: hover), (-moz-touch-enabled: 0), (-ms-high-contrast: none), (-ms-high-contrast: active) {.error_aa15:hover {\n    color: var(--ring-error-color);\n  }}\n\n.error_aa15 {\n  cursor: default\n\n  /* Override ring-link */\n}\n\n.error_aa15,\n  .error_aa15:focus,\n  .error_aa15:visited {\n    color: var(--ring-error-color);\n  }\n\n.add_a8da {\n  padding: 8px 16px;\n\n  line-height: 32px;\n}\n\n.top_c4d5 {\n  display: flex;\n  align-items: baseline;\n  flex-direction: row;\n}\n\n.left_ea6b {\n  align-self: center;\n  flex-shrink: 0;\n}\n\n.label_dac9 {\n  overflow: hidden;\n  flex-grow: 1;\n  flex-shrink: 1;\n\n  text-align: left;\n  white-space: nowrap;\n  text-overflow: ellipsis\n}\n\n[dir=rtl] .label_dac9 {\n    text-align: right;\n    direction: ltr\n}\n\n.description_efcc {\n  overflow: hidden;\n  flex-shrink: 100;\n\n  padding-left: 8px;\n\n  text-align: right;\n  white-space: nowrap;\n  text-overflow: ellipsis;\n\n  color: var(--ring-secondary-color);\n\n  font-size: var(--ring-font-size-smaller);\n  font-weight: 400;\n  line-height: var(--ring-line-height-lowest);\n}\n\n.right_df77 {\n  display: flex;\n  align-items: center;\n  align-self: center;\n  flex-direction: row;\n  flex-shrink: 0;\n}\n\n.details_a2b7 {\n  margin-bottom: 6px;\n\n  white-space: normal;\n\n  color: var(--ring-secondary-color);\n\n  font-size: var(--ring-font-size-smaller);\n  line-height: var(--ring-line-height-lowest);\n}\n\n.padded_a74d {\n  margin-left: 20px;\n}\n\n/* Override :last-child */\n.hint_d29d.hint_d29d {\n  margin-bottom: 0;\n\n  border-top: 1px solid var(--ring-line-color);\n  background-color: var(--ring-sidebar-background-color);\n\n  font-size: var(--ring-font-size-smaller);\n}\n\n.action_d10e {\n  cursor: pointer;\n\n  color: var(--ring-text-color);\n}\n\n/* override link */\n.actionLink_a4c7.actionLink_a4c7 {\n  transition: none;\n}\n\n.hover_a4cd:not(.error_aa15) {\n  background-color: var(--ring-selected-background-color);\n}\n\n.icon_f1f3 {\n  display: inline-block;\n\n  width: 20px;\n  height: 20px;\n  margin-left: 16px;\n\n  background-repeat: no-repeat;\n  background-position: center;\n\n  background-size: contain;\n}\n\n.highlight_e4dd {\n  color: var(--ring-link-hover-color);\n}\n\n.service_a4fc {\n  color: var(--ring-secondary-color);\n}\n\n.glyph_dfd5 {\n  float: left;\n\n  width: 20px;\n  margin-right: 8px;\n\n  color: var(--ring-icon-secondary-color);\n}\n\n.avatar_f258 {\n\n  top: 0;\n}\n\n.rightGlyph_fb77 {\n\n  float: right;\n\n  margin-right: 0;\n  margin-left: 16px;\n}\n\n.checkboxContainer_c949 {\n  position: absolute;\n  top: 7px;\n  left: 19px;\n\n  width: 20px;\n  height: 20px;\n  margin-right: 8px;\n}\n\n.compact_efa8 .checkboxContainer_c949 {\n  top: 0;\n\n  width: 16px;\n  height: 16px;\n}\n\n.title_e1bf {\n  display: block;\n\n  margin-top: 10px;\n  margin-bottom: 6px;\n  padding: 8px 16px 0;\n\n  text-align: left\n}\n\n[dir=rtl] .title_e1bf {\n    text-align: right;\n    direction: ltr\n}\n\n.title_first_ac55 {\n  margin-top: 0;\n}\n\n.text_fe0e {\n  letter-spacing: 1.5px;\n  text-transform: uppercase;\n\n  color: var(--ring-secondary-color);\n\n  font-size: var(--ring-font-size-smaller);\n}\n\n.fade_d35c {\n  position: absolute;\n  bottom: 0;\n\n  width: 100%;\n  height: 24px;\n\n  pointer-events: none;\n\n  background: linear-gradient(to bottom, rgba(255, 255, 255, 0), var(--ring-content-background-color));\n}\n\n.disabled_c3d8 {\n  pointer-events: none;\n\n  color: var(--ring-disabled-color);\n}\n","",{version:3,sources:["webpack://./node_modules/@jetbrains/ring-ui/components/list/list.css","<no source>"],names:[],mappings:"AAKA;EACE,kBAAkB;;EAElB,UAAU;;EAEV,wCAAwC;;EAExC,mBAAmB;AACrB;;AAEA;EACE,cAAc;AAChB;;AAEA;EACE,oBAAoB;AACtB;;AAEA;EACE,cAAc;;EAEd,eAAuB;;EAEvB,eAAuB;EACvB,mBAA6B;;EAE7B,iBAAiB;;EAEjB,kCAAkC;EAClC,4CAA4C;;EAE5C,wCAAwC;EACxC,0CAA0C;AAC5C;;AAEA;EACE,aAAa;EACb,cAAc;;EAEd,YAAY;AACd;;AAEA;EACE,cAAc;;EAEd,sBAAsB;;EAEtB,WAAW;;EAEX,gBAAgB;EAChB,sBAAsB;EACtB,mBAAmB;EACnB,qBAAqB;;EAErB,aAAa;;EAEb,gCAAgC;EAChC,iBAA2B;AAC7B;;AAEA;EACE,qBAA+B;AACjC;;AAEA;EACE,kBAAkB;AACpB;;AAEA;EACE,iBAA2B;AAC7B;;AC3EA,wGAAA;IAAA,+BAAA;GAAA,CAAA;;AD6EA;EACE,cAAe;;EAEf,uBAAuB;AAOzB;;AANE;;;IAIE,8BAA8B;EAChC;;AAGF;EACE,iBAA4B;;EAE5B,iBAA2B;AAC7B;;AAEA;EACE,aAAa;EACb,qBAAqB;EACrB,mBAAmB;AACrB;;AAEA;EACE,kBAAkB;EAClB,cAAc;AAChB;;AAEA;EACE,gBAAgB;EAChB,YAAY;EACZ,cAAc;;EAEd,gBAAgB;EAChB,mBAAmB;EACnB;AAMF;;AAbA;IAUI,iBAAiB;IACjB;AAEJ;;AAEA;EACE,gBAAgB;EAChB,gBAAgB;;EAEhB,iBAAkB;;EAElB,iBAAiB;EACjB,mBAAmB;EACnB,uBAAuB;;EAEvB,kCAAkC;;EAElC,wCAAwC;EACxC,gBAAgB;EAChB,2CAA2C;AAC7C;;AAEA;EACE,aAAa;EACb,mBAAmB;EACnB,kBAAkB;EAClB,mBAAmB;EACnB,cAAc;AAChB;;AAEA;EACE,kBAAkB;;EAElB,mBAAmB;;EAEnB,kCAAkC;;EAElC,wCAAwC;EACxC,2CAA2C;AAC7C;;AAEA;EACE,iBAAiB;AACnB;;AAEA,yBAAyB;AACzB;EACE,gBAAgB;;EAEhB,4CAA4C;EAC5C,sDAAsD;;EAEtD,wCAAwC;AAC1C;;AAEA;EACE,eAAe;;EAEf,6BAA6B;AAC/B;;AAEA,kBAAkB;AAClB;EACE,gBAAgB;AAClB;;AAEA;EACE,uDAAuD;AACzD;;AAEA;EACE,qBAAqB;;EAErB,WAAW;EACX,YAAY;EACZ,iBAA2B;;EAE3B,4BAA4B;EAC5B,2BAA2B;;EAE3B,wBAAwB;AAC1B;;AAEA;EACE,mCAAmC;AACrC;;AAEA;EACE,kCAAkC;AACpC;;AAEA;EACE,WAAW;;EAEX,WAAW;EACX,iBAAkB;;EAElB,uCAAuC;AACzC;;AAEA;;EAGE,MAAM;AACR;;AAEA;;EAGE,YAAY;;EAEZ,eAAe;EACf,iBAA2B;AAC7B;;AAEA;EACE,kBAAkB;EAClB,QAAQ;EACR,UAAU;;EAEV,WAAW;EACX,YAAY;EACZ,iBAAkB;AACpB;;AAEA;EACE,MAAM;;EAEN,WAAqB;EACrB,YAAsB;AACxB;;AAEA;EACE,cAAc;;EAEd,gBAAgB;EAChB,kBAAkB;EAClB,mBAAqC;;EAErC;AAMF;;AAbA;IAUI,iBAAiB;IACjB;AAEJ;;AAEA;EACE,aAAa;AACf;;AAEA;EACE,qBAAqB;EACrB,yBAAyB;;EAEzB,kCAAkC;;EAElC,wCAAwC;AAC1C;;AAEA;EACE,kBAAkB;EAClB,SAAS;;EAET,WAAW;EACX,YAAsB;;EAEtB,oBAAoB;;EAEpB,oGAAoG;AACtG;;AAEA;EACE,oBAAoB;;EAEpB,iCAAiC;AACnC",sourcesContent:['@import "../global/variables.css";\n\n@value unit from "../global/global.css";\n@value listSpacing: unit;\n\n.list {\n  position: relative;\n\n  z-index: 1;\n\n  border-radius: var(--ring-border-radius);\n\n  line-height: normal;\n}\n\n.simpleInner {\n  overflow: auto;\n}\n\n.scrolling {\n  pointer-events: none;\n}\n\n.separator {\n  display: block;\n\n  min-height: listSpacing;\n\n  margin-top: listSpacing;\n  padding: 0 calc(unit * 2) 1px;\n\n  text-align: right;\n\n  color: var(--ring-secondary-color);\n  border-top: 1px solid var(--ring-line-color);\n\n  font-size: var(--ring-font-size-smaller);\n  line-height: var(--ring-line-height-lower);\n}\n\n.separator_first {\n  margin-top: 0;\n  padding-top: 0;\n\n  border: none;\n}\n\n.item {\n  display: block;\n\n  box-sizing: border-box;\n\n  width: 100%;\n\n  text-align: left;\n  vertical-align: bottom;\n  white-space: nowrap;\n  text-decoration: none;\n\n  outline: none;\n\n  font-size: var(--ring-font-size);\n  line-height: calc(unit * 3);\n}\n\n.item.item {\n  padding: 3px calc(unit * 2) 5px;\n}\n\n.itemContainer {\n  position: relative;\n}\n\n.compact {\n  line-height: calc(unit * 2);\n}\n\n.error {\n  cursor: default;\n\n  /* Override ring-link */\n  &,\n  &:hover,\n  &:focus,\n  &:visited {\n    color: var(--ring-error-color);\n  }\n}\n\n.add {\n  padding: unit calc(2 * unit);\n\n  line-height: calc(4 * unit);\n}\n\n.top {\n  display: flex;\n  align-items: baseline;\n  flex-direction: row;\n}\n\n.left {\n  align-self: center;\n  flex-shrink: 0;\n}\n\n.label {\n  overflow: hidden;\n  flex-grow: 1;\n  flex-shrink: 1;\n\n  text-align: left;\n  white-space: nowrap;\n  text-overflow: ellipsis;\n\n  @nest [dir=rtl] & {\n    text-align: right;\n    direction: ltr;\n  }\n}\n\n.description {\n  overflow: hidden;\n  flex-shrink: 100;\n\n  padding-left: unit;\n\n  text-align: right;\n  white-space: nowrap;\n  text-overflow: ellipsis;\n\n  color: var(--ring-secondary-color);\n\n  font-size: var(--ring-font-size-smaller);\n  font-weight: 400;\n  line-height: var(--ring-line-height-lowest);\n}\n\n.right {\n  display: flex;\n  align-items: center;\n  align-self: center;\n  flex-direction: row;\n  flex-shrink: 0;\n}\n\n.details {\n  margin-bottom: 6px;\n\n  white-space: normal;\n\n  color: var(--ring-secondary-color);\n\n  font-size: var(--ring-font-size-smaller);\n  line-height: var(--ring-line-height-lowest);\n}\n\n.padded {\n  margin-left: 20px;\n}\n\n/* Override :last-child */\n.hint.hint {\n  margin-bottom: 0;\n\n  border-top: 1px solid var(--ring-line-color);\n  background-color: var(--ring-sidebar-background-color);\n\n  font-size: var(--ring-font-size-smaller);\n}\n\n.action {\n  cursor: pointer;\n\n  color: var(--ring-text-color);\n}\n\n/* override link */\n.actionLink.actionLink {\n  transition: none;\n}\n\n.hover:not(.error) {\n  background-color: var(--ring-selected-background-color);\n}\n\n.icon {\n  display: inline-block;\n\n  width: 20px;\n  height: 20px;\n  margin-left: calc(unit * 2);\n\n  background-repeat: no-repeat;\n  background-position: center;\n\n  background-size: contain;\n}\n\n.highlight {\n  color: var(--ring-link-hover-color);\n}\n\n.service {\n  color: var(--ring-secondary-color);\n}\n\n.glyph {\n  float: left;\n\n  width: 20px;\n  margin-right: unit;\n\n  color: var(--ring-icon-secondary-color);\n}\n\n.avatar {\n  composes: glyph;\n\n  top: 0;\n}\n\n.rightGlyph {\n  composes: glyph;\n\n  float: right;\n\n  margin-right: 0;\n  margin-left: calc(unit * 2);\n}\n\n.checkboxContainer {\n  position: absolute;\n  top: 7px;\n  left: 19px;\n\n  width: 20px;\n  height: 20px;\n  margin-right: unit;\n}\n\n.compact .checkboxContainer {\n  top: 0;\n\n  width: calc(unit * 2);\n  height: calc(unit * 2);\n}\n\n.title {\n  display: block;\n\n  margin-top: 10px;\n  margin-bottom: 6px;\n  padding: listSpacing calc(unit * 2) 0;\n\n  text-align: left;\n\n  @nest [dir=rtl] & {\n    text-align: right;\n    direction: ltr;\n  }\n}\n\n.title_first {\n  margin-top: 0;\n}\n\n.text {\n  letter-spacing: 1.5px;\n  text-transform: uppercase;\n\n  color: var(--ring-secondary-color);\n\n  font-size: var(--ring-font-size-smaller);\n}\n\n.fade {\n  position: absolute;\n  bottom: 0;\n\n  width: 100%;\n  height: calc(unit * 3);\n\n  pointer-events: none;\n\n  background: linear-gradient(to bottom, rgba(255, 255, 255, 0), var(--ring-content-background-color));\n}\n\n.disabled {\n  pointer-events: none;\n\n  color: var(--ring-disabled-color);\n}\n',null],sourceRoot:""}]),u.locals={unit:""+l.default.locals.unit,listSpacing:"8px",list:"list_a01c",simpleInner:"simpleInner_a4f8",scrolling:"scrolling_a910",separator:"separator_c26e",separator_first:"separator_first_ec9e",item:"item_eadd",itemContainer:"itemContainer_f365",compact:"compact_efa8",error:"error_aa15",add:"add_a8da",top:"top_c4d5",left:"left_ea6b",label:"label_dac9",description:"description_efcc",right:"right_df77",details:"details_a2b7",padded:"padded_a74d",hint:"hint_d29d",action:"action_d10e",actionLink:"actionLink_a4c7",hover:"hover_a4cd",icon:"icon_f1f3",highlight:"highlight_e4dd",service:"service_a4fc",glyph:"glyph_dfd5",avatar:"avatar_f258 glyph_dfd5",rightGlyph:"rightGlyph_fb77 glyph_dfd5",checkboxContainer:"checkboxContainer_c949",title:"title_e1bf",title_first:"title_first_ac55",text:"text_fe0e",fade:"fade_d35c",disabled:"disabled_c3d8"};const s=u},8546:(e,n,t)=>{"use strict";t.r(n),t.d(n,{default:()=>s});var r=t(7537),o=t.n(r),i=t(3645),a=t.n(i),l=t(8004),c=t(3181),u=a()(o());u.i(c.Z),u.i(l.default,"",!0),u.push([e.id,'@-webkit-keyframes spin_ad60 {\n  0% {\n    transform: rotate(0);\n  }\n\n  100% {\n    transform: rotate(360deg);\n  }\n}\n\n@keyframes spin_ad60 {\n  0% {\n    transform: rotate(0);\n  }\n\n  100% {\n    transform: rotate(360deg);\n  }\n}\n\n@-webkit-keyframes pulse_c906 {\n  0% {\n    transform: scale(1);\n  }\n\n  100% {\n    transform: scale(1.41667);\n  }\n}\n\n@keyframes pulse_c906 {\n  0% {\n    transform: scale(1);\n  }\n\n  100% {\n    transform: scale(1.41667);\n  }\n}\n\n.loader_d294,\n.ring-loader-inline {\n  /* needed for better backward-compatibility */\n\n  position: relative;\n\n  display: inline-block;\n\n  overflow: hidden;\n\n  transform: rotate(0);\n  -webkit-animation: spin_ad60 1s linear infinite;\n          animation: spin_ad60 1s linear infinite;\n  vertical-align: -3px;\n\n  border-radius: 8px\n}\n\n:is(.loader_d294,.ring-loader-inline),\n  :is(.loader_d294,.ring-loader-inline)::after {\n    transform-origin: 50% 50%;\n  }\n\n:is(.loader_d294,.ring-loader-inline)::after {\n    display: block;\n\n    width: 16px;\n    height: 16px;\n\n    content: "";\n    -webkit-animation: pulse_c906 0.85s cubic-bezier(0.68, 0, 0.74, 0.74) infinite alternate;\n            animation: pulse_c906 0.85s cubic-bezier(0.68, 0, 0.74, 0.74) infinite alternate;\n  }\n\n.children_ece6 {\n  margin-left: 4px;\n}\n',"",{version:3,sources:["webpack://./node_modules/@jetbrains/ring-ui/components/loader-inline/loader-inline.css"],names:[],mappings:"AAIA;EACE;IACE,oBAAoB;EACtB;;EAEA;IACE,yBAAyB;EAC3B;AACF;;AARA;EACE;IACE,oBAAoB;EACtB;;EAEA;IACE,yBAAyB;EAC3B;AACF;;AAEA;EACE;IACE,mBAAmB;EACrB;;EAEA;IACE,yBAA+B;EACjC;AACF;;AARA;EACE;IACE,mBAAmB;EACrB;;EAEA;IACE,yBAA+B;EACjC;AACF;;AAEA;;EAEE,6CAA6C;;EAE7C,kBAAkB;;EAElB,qBAAqB;;EAErB,gBAAgB;;EAEhB,oBAAoB;EACpB,+CAAkC;UAAlC,uCAAkC;EAClC,oBAAoB;;EAEpB;AAgBF;;AAdE;;IAEE,yBAAyB;EAC3B;;AAEA;IACE,cAAc;;IAEd,WAAqB;IACrB,YAAsB;;IAEtB,WAAW;IACX,wFAA2E;YAA3E,gFAA2E;EAC7E;;AAGF;EACE,gBAA2B;AAC7B",sourcesContent:['@import "../global/variables.css";\n\n@value unit from "../global/global.css";\n\n@keyframes spin {\n  0% {\n    transform: rotate(0);\n  }\n\n  100% {\n    transform: rotate(360deg);\n  }\n}\n\n@keyframes pulse {\n  0% {\n    transform: scale(1);\n  }\n\n  100% {\n    transform: scale(calc(17 / 12));\n  }\n}\n\n.loader,\n:global(.ring-loader-inline) {\n  /* needed for better backward-compatibility */\n\n  position: relative;\n\n  display: inline-block;\n\n  overflow: hidden;\n\n  transform: rotate(0);\n  animation: spin 1s linear infinite;\n  vertical-align: -3px;\n\n  border-radius: unit;\n\n  &,\n  &::after {\n    transform-origin: 50% 50%;\n  }\n\n  &::after {\n    display: block;\n\n    width: calc(unit * 2);\n    height: calc(unit * 2);\n\n    content: "";\n    animation: pulse 0.85s cubic-bezier(0.68, 0, 0.74, 0.74) infinite alternate;\n  }\n}\n\n.children {\n  margin-left: calc(unit / 2);\n}\n'],sourceRoot:""}]),u.locals={unit:""+l.default.locals.unit,loader:"loader_d294",spin:"spin_ad60",pulse:"pulse_c906",children:"children_ece6"};const s=u},2616:(e,n,t)=>{"use strict";t.r(n),t.d(n,{default:()=>s});var r=t(7537),o=t.n(r),i=t(3645),a=t.n(i),l=t(8004),c=t(3181),u=a()(o());u.i(c.Z),u.i(l.default,"",!0),u.push([e.id,".popup_f35e {\n\n  position: fixed;\n  z-index: var(--ring-overlay-z-index);\n  top: -100vh;\n  left: -100vw;\n\n  overflow-y: auto;\n\n  box-sizing: border-box;\n\n  border: 1px solid var(--ring-popup-border-color);\n  border-radius: var(--ring-border-radius);\n\n  background-color: var(--ring-popup-background-color);\n  box-shadow: 0 2px 16px 0 var(--ring-popup-shadow-color);\n}\n\n.hidden_c587 {\n  display: none;\n}\n\n.showing_b07a {\n  opacity: 0;\n}\n\n.attached_ea95 {\n  border-top: 0;\n  border-top-left-radius: 0;\n  border-top-right-radius: 0;\n}\n","",{version:3,sources:["webpack://./node_modules/@jetbrains/ring-ui/components/popup/popup.css"],names:[],mappings:"AAEA;;EAGE,eAAe;EACf,oCAAoC;EACpC,WAAW;EACX,YAAY;;EAEZ,gBAAgB;;EAEhB,sBAAsB;;EAEtB,gDAAgD;EAChD,wCAAwC;;EAExC,oDAAoD;EACpD,uDAAuD;AACzD;;AAEA;EACE,aAAa;AACf;;AAEA;EACE,UAAU;AACZ;;AAEA;EACE,aAAa;EACb,yBAAyB;EACzB,0BAA0B;AAC5B",sourcesContent:['@import "../global/variables.css";\n\n.popup {\n  composes: font from "../global/global.css";\n\n  position: fixed;\n  z-index: var(--ring-overlay-z-index);\n  top: -100vh;\n  left: -100vw;\n\n  overflow-y: auto;\n\n  box-sizing: border-box;\n\n  border: 1px solid var(--ring-popup-border-color);\n  border-radius: var(--ring-border-radius);\n\n  background-color: var(--ring-popup-background-color);\n  box-shadow: 0 2px 16px 0 var(--ring-popup-shadow-color);\n}\n\n.hidden {\n  display: none;\n}\n\n.showing {\n  opacity: 0;\n}\n\n.attached {\n  border-top: 0;\n  border-top-left-radius: 0;\n  border-top-right-radius: 0;\n}\n'],sourceRoot:""}]),u.locals={popup:"popup_f35e "+l.default.locals.font,hidden:"hidden_c587",showing:"showing_b07a",attached:"attached_ea95"};const s=u},6751:(e,n,t)=>{"use strict";t.r(n),t.d(n,{default:()=>s});var r=t(7537),o=t.n(r),i=t(3645),a=t.n(i),l=t(8004),c=t(3181),u=a()(o());u.i(c.Z),u.i(l.default,"",!0),u.push([e.id,".filterWithTags_ff56 {\n  overflow: hidden;\n\n  margin: 16px 8px 0;\n  padding: 1px;\n\n  text-align: left;\n\n  border: 1px solid var(--ring-borders-color)\n}\n\n.filterWithTags_ff56 .filterWrapper_dd63 {\n    border-bottom: none;\n  }\n\n.filterWithTagsFocused_ffbf {\n  border: 1px solid var(--ring-border-hover-color);\n}\n\n.filter_deda {\n  width: 100%\n}\n\n.filter_deda input {\n    font-weight: 200;\n  }\n\n.filterWrapper_dd63 {\n  position: relative;\n\n  margin: 0;\n  padding-right: 8px;\n  padding-left: 44px;\n\n  border-bottom: 1px solid var(--ring-borders-color)\n}\n\n[dir=rtl] .filterWrapper_dd63 {\n    padding-right: 44px;\n    padding-left: 8px\n}\n\n.filterIcon_b648 {\n  position: absolute;\n  top: 7px;\n  left: 16px;\n\n  color: var(--ring-icon-color)\n}\n\n[dir=rtl] .filterIcon_b648 {\n    right: 16px;\n    left: auto\n}\n\n.bottomLine_c880 {\n  text-align: center;\n}\n\n.message_ccdf {\n  display: inline-block;\n\n  margin: 8px 0;\n  padding: 0 16px;\n}\n\n.selectAll_ff5e {\n  display: flex;\n  justify-content: space-between;\n\n  padding: 8px 16px 0;\n}\n","",{version:3,sources:["webpack://./node_modules/@jetbrains/ring-ui/components/select/select-popup.css"],names:[],mappings:"AAIA;EACE,gBAAgB;;EAEhB,kBAA6B;EAC7B,YAAY;;EAEZ,gBAAgB;;EAEhB;AAKF;;AAHE;IACE,mBAAmB;EACrB;;AAGF;EACE,gDAAgD;AAClD;;AAEA;EACE;AAKF;;AAHE;IACE,gBAAgB;EAClB;;AAGF;EACE,kBAAkB;;EAElB,SAAS;EACT,kBAAmB;EACnB,kBAA8B;;EAE9B;AAMF;;AAbA;IAUI,mBAA+B;IAC/B;AAEJ;;AAEA;EACE,kBAAkB;EAClB,QAAQ;EACR,UAAoB;;EAEpB;AAMF;;AAXA;IAQI,WAAqB;IACrB;AAEJ;;AAEA;EACE,kBAAkB;AACpB;;AAEA;EACE,qBAAqB;;EAErB,aAAc;EACd,eAAyB;AAC3B;;AAEA;EACE,aAAa;EACb,8BAA8B;;EAE9B,mBAAmB;AACrB",sourcesContent:['@import "../global/variables.css";\n\n@value unit from "../global/global.css";\n\n.filterWithTags {\n  overflow: hidden;\n\n  margin: calc(unit * 2) unit 0;\n  padding: 1px;\n\n  text-align: left;\n\n  border: 1px solid var(--ring-borders-color);\n\n  & .filterWrapper {\n    border-bottom: none;\n  }\n}\n\n.filterWithTagsFocused {\n  border: 1px solid var(--ring-border-hover-color);\n}\n\n.filter {\n  width: 100%;\n\n  & input {\n    font-weight: 200;\n  }\n}\n\n.filterWrapper {\n  position: relative;\n\n  margin: 0;\n  padding-right: unit;\n  padding-left: calc(unit * 5.5);\n\n  border-bottom: 1px solid var(--ring-borders-color);\n\n  @nest [dir=rtl] & {\n    padding-right: calc(unit * 5.5);\n    padding-left: unit;\n  }\n}\n\n.filterIcon {\n  position: absolute;\n  top: 7px;\n  left: calc(unit * 2);\n\n  color: var(--ring-icon-color);\n\n  @nest [dir=rtl] & {\n    right: calc(unit * 2);\n    left: auto;\n  }\n}\n\n.bottomLine {\n  text-align: center;\n}\n\n.message {\n  display: inline-block;\n\n  margin: unit 0;\n  padding: 0 calc(2 * unit);\n}\n\n.selectAll {\n  display: flex;\n  justify-content: space-between;\n\n  padding: 8px 16px 0;\n}\n'],sourceRoot:""}]),u.locals={unit:""+l.default.locals.unit,filterWithTags:"filterWithTags_ff56",filterWrapper:"filterWrapper_dd63",filterWithTagsFocused:"filterWithTagsFocused_ffbf",filter:"filter_deda",filterIcon:"filterIcon_b648",bottomLine:"bottomLine_c880",message:"message_ccdf",selectAll:"selectAll_ff5e"};const s=u},2260:(e,n,t)=>{"use strict";t.r(n),t.d(n,{default:()=>s});var r=t(7537),o=t.n(r),i=t(3645),a=t.n(i),l=t(8004),c=t(3181),u=a()(o());u.i(c.Z),u.i(l.default,"",!0),u.push([e.id,"@media (hover: hover), (-moz-touch-enabled: 0), (-ms-high-contrast: none), (-ms-high-contrast: active) {.select_e2a5:hover .value_b3a3,\n.select_e2a5:hover .icons_c4a9 {\n  transition: none;\n\n  color: var(--ring-main-color);\n}}\n\n.select_e2a5 {\n  position: relative;\n\n  display: inline-block;\n\n  white-space: nowrap;\n\n  color: var(--ring-text-color);\n}\n\n.toolbar_d3be {\n  border-top: 1px solid var(--ring-line-color);\n}\n\n.button_ef00 {\n  width: 100%;\n  padding: 0;\n\n  text-align: left\n}\n\n[dir=rtl] .button_ef00 {\n    text-align: right;\n    direction: ltr\n}\n\n.toolbar_d3be .button_ef00 {\n    height: 32px;\n    margin: 8px 0\n}\n\n.button_ef00.buttonSpaced_f316 {\n    padding: 0 16px;\n  }\n\n.icons_c4a9 {\n  position: absolute;\n  top: -2px;\n  right: 0;\n\n  transition: color var(--ring-ease);\n\n  color: var(--ring-icon-secondary-color);\n\n  line-height: 32px\n}\n\n.icons_c4a9 .ring-loader_inline {\n    top: 2px;\n\n    margin-right: 2px;\n  }\n\n.inputMode_a6f6 .icons_c4a9 {\n    top: 12px;\n\n    font-size: var(--ring-font-size)\n}\n\n.buttonMode_dd69 .icons_c4a9 {\n    top: -4px;\n    right: 8px\n}\n\n.selectedIcon_a62c {\n\n  display: inline-block;\n\n  width: 16px;\n  height: 16px;\n  margin: 0 4px;\n\n  background-repeat: no-repeat;\n  background-position: center;\n\n  background-size: contain;\n}\n\n.clearIcon_c750 {\n  padding: 0 3px;\n\n  vertical-align: -1px;\n}\n\n.clearIcon_c750.clearIcon_c750 > span > span {\n  color: var(--ring-icon-secondary-color);\n}\n\n.sizeS_e8c3 {\n  width: 96px;\n}\n\n.sizeM_ed34 {\n  width: 240px;\n}\n\n.sizeL_c053 {\n  width: 400px;\n}\n\n.sizeFULL_c585 {\n  width: 100%;\n}\n\n.sizeAUTO_a07c {\n  max-width: 100%;\n}\n\n.buttonMode_dd69,\n.materialMode_d31e {\n  position: relative;\n\n  cursor: pointer;\n}\n\n.value_b3a3 {\n\n  display: inline-block;\n\n  box-sizing: border-box;\n  width: 100%;\n  height: 33px;\n  padding: 0 0 3px;\n\n  cursor: pointer;\n  transition: color var(--ring-ease), border-color var(--ring-ease);\n  text-align: left;\n  vertical-align: top;\n\n  color: var(--ring-text-color);\n\n  border: none;\n  border-bottom: 1px solid var(--ring-borders-color);\n  outline: none;\n  background: transparent\n}\n\n.value_b3a3:focus {\n    border-color: var(--ring-main-color);\n  }\n\n.value_b3a3.open_f1b1,\n  .value_b3a3:active {\n    border-color: transparent;\n  }\n\n.value_b3a3::-moz-focus-inner {\n    padding: 0;\n\n    border: 0;\n    outline: 0;\n  }\n\n.buttonContainer_b2b9 {\n  position: relative;\n}\n\n.buttonValue_b4ad {\n\n  display: block;\n\n  width: 100%;\n\n  text-align: left;\n  vertical-align: -8px;\n}\n\n.buttonValueOpen_d9d3 {\n  border-color: var(--ring-selected-background-color);\n  background-color: var(--ring-selected-background-color);\n}\n\n.label_e56f {\n  position: relative;\n\n  color: var(--ring-secondary-color);\n}\n\n.value_b3a3:focus,\n.value_b3a3:focus + .icons_c4a9,\n.open_f1b1,\n.open_f1b1 + .icons_c4a9,\n.buttonValueOpen_d9d3 + .icons_c4a9 {\n  transition: none;\n\n  color: var(--ring-main-color);\n}\n\n.disabled_b89f {\n  pointer-events: none;\n\n  color: var(--ring-disabled-color)\n}\n\n.disabled_b89f .value_b3a3 {\n    color: var(--ring-disabled-color);\n    border-bottom-style: dashed;\n  }\n\n.selectedLabel_fea7 {\n  position: absolute;\n  top: -12px;\n  left: 0;\n\n  overflow: hidden;\n\n  max-width: 100%;\n\n  text-overflow: ellipsis;\n\n  color: var(--ring-secondary-color);\n\n  font-size: var(--ring-font-size-smaller);\n  line-height: var(--ring-line-height-lowest);\n}\n\n.avatar_f4dd {\n  margin-right: 4px;\n\n  vertical-align: -5px;\n}\n\n.popup_acec {\n  min-width: 240px;\n  max-width: 320px;\n}\n\n.chevron_d51f.chevron_d51f {\n  padding: 0;\n\n  transition: none;\n\n  color: inherit;\n}\n\n.chevronIcon_f6cf.chevronIcon_f6cf {\n  transition: none;\n\n  color: inherit;\n}\n\n.avatar_f4dd {\n  vertical-align: -6px;\n}\n","",{version:3,sources:["<no source>","webpack://./node_modules/@jetbrains/ring-ui/components/select/select.css"],names:[],mappings:"AAAA,wGAAA;;EAAA,iBAAA;;EAAA,8BAAA;CAAA,CAAA;;ACIA;EACE,kBAAkB;;EAElB,qBAAqB;;EAErB,mBAAmB;;EAEnB,6BAA6B;AAC/B;;AAEA;EACE,4CAA4C;AAC9C;;AAEA;EACE,WAAW;EACX,UAAU;;EAEV;AAeF;;AAnBA;IAOI,iBAAiB;IACjB;AAWJ;;AAnBA;IAYI,YAAsB;IACtB;AAMJ;;AAHE;IACE,eAAyB;EAC3B;;AAGF;EACE,kBAAkB;EAClB,SAAS;EACT,QAAQ;;EAER,kCAAkC;;EAElC,uCAAuC;;EAEvC;AAkBF;;AAhBE;IACE,QAAQ;;IAER,iBAAiB;EACnB;;AAfF;IAkBI,SAAS;;IAET;AAOJ;;AA3BA;IAwBI,SAAS;IACT;AAEJ;;AAEA;;EAGE,qBAAqB;;EAErB,WAAqB;EACrB,YAAsB;EACtB,aAAa;;EAEb,4BAA4B;EAC5B,2BAA2B;;EAE3B,wBAAwB;AAC1B;;AAEA;EACE,cAAc;;EAEd,oBAAoB;AACtB;;AAEA;EACE,uCAAuC;AACzC;;AAEA;EACE,WAAsB;AACxB;;AAEA;EACE,YAAsB;AACxB;;AAEA;EACE,YAAsB;AACxB;;AAEA;EACE,WAAW;AACb;;AAEA;EACE,eAAe;AACjB;;AAEA;;EAEE,kBAAkB;;EAElB,eAAe;AACjB;;AAEA;;EAIE,qBAAqB;;EAErB,sBAAsB;EACtB,WAAW;EACX,YAA4B;EAC5B,gBAAgB;;EAEhB,eAAe;EACf,iEAAiE;EACjE,gBAAgB;EAChB,mBAAmB;;EAEnB,6BAA6B;;EAE7B,YAAY;EACZ,kDAAkD;EAClD,aAAa;EACb;AAiBF;;AAfE;IACE,oCAAoC;EACtC;;AAEA;;IAEE,yBAAyB;EAC3B;;AAEA;IACE,UAAU;;IAEV,SAAS;IACT,UAAU;EACZ;;AAGF;EACE,kBAAkB;AACpB;;AAEA;;EAGE,cAAc;;EAEd,WAAW;;EAEX,gBAAgB;EAChB,oBAA8B;AAChC;;AAEA;EACE,mDAAmD;EACnD,uDAAuD;AACzD;;AAEA;EACE,kBAAkB;;EAElB,kCAAkC;AACpC;;AAEA;;;;;EAOE,gBAAgB;;EAEhB,6BAA6B;AAC/B;;AAEA;EACE,oBAAoB;;EAEpB;AAMF;;AAJE;IACE,iCAAiC;IACjC,2BAA2B;EAC7B;;AAGF;EACE,kBAAkB;EAClB,UAAsB;EACtB,OAAO;;EAEP,gBAAgB;;EAEhB,eAAe;;EAEf,uBAAuB;;EAEvB,kCAAkC;;EAElC,wCAAwC;EACxC,2CAA2C;AAC7C;;AAEA;EACE,iBAAiB;;EAEjB,oBAAoB;AACtB;;AAEA;EACE,gBAA0B;EAC1B,gBAA0B;AAC5B;;AAEA;EACE,UAAU;;EAEV,gBAAgB;;EAEhB,cAAc;AAChB;;AAEA;EACE,gBAAgB;;EAEhB,cAAc;AAChB;;AAEA;EACE,oBAAoB;AACtB",sourcesContent:[null,'@import "../global/variables.css";\n\n@value unit, resetButton from "../global/global.css";\n\n.select {\n  position: relative;\n\n  display: inline-block;\n\n  white-space: nowrap;\n\n  color: var(--ring-text-color);\n}\n\n.toolbar {\n  border-top: 1px solid var(--ring-line-color);\n}\n\n.button {\n  width: 100%;\n  padding: 0;\n\n  text-align: left;\n\n  @nest [dir=rtl] & {\n    text-align: right;\n    direction: ltr;\n  }\n\n  @nest .toolbar & {\n    height: calc(4 * unit);\n    margin: unit 0;\n  }\n\n  &.buttonSpaced {\n    padding: 0 calc(2 * unit);\n  }\n}\n\n.icons {\n  position: absolute;\n  top: -2px;\n  right: 0;\n\n  transition: color var(--ring-ease);\n\n  color: var(--ring-icon-secondary-color);\n\n  line-height: calc(unit * 4);\n\n  & :global(.ring-loader_inline) {\n    top: 2px;\n\n    margin-right: 2px;\n  }\n\n  @nest .inputMode & {\n    top: 12px;\n\n    font-size: var(--ring-font-size);\n  }\n\n  @nest .buttonMode & {\n    top: -4px;\n    right: unit;\n  }\n}\n\n.selectedIcon {\n  composes: resetButton;\n\n  display: inline-block;\n\n  width: calc(2 * unit);\n  height: calc(2 * unit);\n  margin: 0 4px;\n\n  background-repeat: no-repeat;\n  background-position: center;\n\n  background-size: contain;\n}\n\n.clearIcon {\n  padding: 0 3px;\n\n  vertical-align: -1px;\n}\n\n.clearIcon.clearIcon > span > span {\n  color: var(--ring-icon-secondary-color);\n}\n\n.sizeS {\n  width: calc(unit * 12);\n}\n\n.sizeM {\n  width: calc(unit * 30);\n}\n\n.sizeL {\n  width: calc(unit * 50);\n}\n\n.sizeFULL {\n  width: 100%;\n}\n\n.sizeAUTO {\n  max-width: 100%;\n}\n\n.buttonMode,\n.materialMode {\n  position: relative;\n\n  cursor: pointer;\n}\n\n.value {\n  composes: ellipsis from "../global/global.css";\n  composes: font from "../global/global.css";\n\n  display: inline-block;\n\n  box-sizing: border-box;\n  width: 100%;\n  height: calc(unit * 4 + 1px);\n  padding: 0 0 3px;\n\n  cursor: pointer;\n  transition: color var(--ring-ease), border-color var(--ring-ease);\n  text-align: left;\n  vertical-align: top;\n\n  color: var(--ring-text-color);\n\n  border: none;\n  border-bottom: 1px solid var(--ring-borders-color);\n  outline: none;\n  background: transparent;\n\n  &:focus {\n    border-color: var(--ring-main-color);\n  }\n\n  &.open,\n  &:active {\n    border-color: transparent;\n  }\n\n  &::-moz-focus-inner {\n    padding: 0;\n\n    border: 0;\n    outline: 0;\n  }\n}\n\n.buttonContainer {\n  position: relative;\n}\n\n.buttonValue {\n  composes: ellipsis from "../global/global.css";\n\n  display: block;\n\n  width: 100%;\n\n  text-align: left;\n  vertical-align: calc(0 - unit);\n}\n\n.buttonValueOpen {\n  border-color: var(--ring-selected-background-color);\n  background-color: var(--ring-selected-background-color);\n}\n\n.label {\n  position: relative;\n\n  color: var(--ring-secondary-color);\n}\n\n.select:hover .value,\n.select:hover .icons,\n.value:focus,\n.value:focus + .icons,\n.open,\n.open + .icons,\n.buttonValueOpen + .icons {\n  transition: none;\n\n  color: var(--ring-main-color);\n}\n\n.disabled {\n  pointer-events: none;\n\n  color: var(--ring-disabled-color);\n\n  & .value {\n    color: var(--ring-disabled-color);\n    border-bottom-style: dashed;\n  }\n}\n\n.selectedLabel {\n  position: absolute;\n  top: calc(unit * -1.5);\n  left: 0;\n\n  overflow: hidden;\n\n  max-width: 100%;\n\n  text-overflow: ellipsis;\n\n  color: var(--ring-secondary-color);\n\n  font-size: var(--ring-font-size-smaller);\n  line-height: var(--ring-line-height-lowest);\n}\n\n.avatar {\n  margin-right: 4px;\n\n  vertical-align: -5px;\n}\n\n.popup {\n  min-width: calc(unit * 30);\n  max-width: calc(unit * 40);\n}\n\n.chevron.chevron {\n  padding: 0;\n\n  transition: none;\n\n  color: inherit;\n}\n\n.chevronIcon.chevronIcon {\n  transition: none;\n\n  color: inherit;\n}\n\n.avatar {\n  vertical-align: -6px;\n}\n'],sourceRoot:""}]),u.locals={unit:""+l.default.locals.unit,resetButton:""+l.default.locals.resetButton,select:"select_e2a5",value:"value_b3a3 "+l.default.locals.ellipsis+" "+l.default.locals.font,icons:"icons_c4a9",toolbar:"toolbar_d3be",button:"button_ef00",buttonSpaced:"buttonSpaced_f316",inputMode:"inputMode_a6f6",buttonMode:"buttonMode_dd69",selectedIcon:"selectedIcon_a62c "+l.default.locals.resetButton,clearIcon:"clearIcon_c750",sizeS:"sizeS_e8c3",sizeM:"sizeM_ed34",sizeL:"sizeL_c053",sizeFULL:"sizeFULL_c585",sizeAUTO:"sizeAUTO_a07c",materialMode:"materialMode_d31e",open:"open_f1b1",buttonContainer:"buttonContainer_b2b9",buttonValue:"buttonValue_b4ad "+l.default.locals.ellipsis,buttonValueOpen:"buttonValueOpen_d9d3",label:"label_e56f",disabled:"disabled_b89f",selectedLabel:"selectedLabel_fea7",avatar:"avatar_f4dd",popup:"popup_acec",chevron:"chevron_d51f",chevronIcon:"chevronIcon_f6cf"};const s=u},5339:(e,n,t)=>{"use strict";t.r(n),t.d(n,{default:()=>u});var r=t(7537),o=t.n(r),i=t(3645),a=t.n(i),l=t(3181),c=a()(o());c.i(l.Z),c.push([e.id,".trapButton_c32e {\n  position: absolute;\n  left: -9999px;\n}\n","",{version:3,sources:["webpack://./node_modules/@jetbrains/ring-ui/components/tab-trap/tab-trap.css"],names:[],mappings:"AAEA;EACE,kBAAkB;EAClB,aAAa;AACf",sourcesContent:['@import "../global/variables.css";\n\n.trapButton {\n  position: absolute;\n  left: -9999px;\n}\n'],sourceRoot:""}]),c.locals={trapButton:"trapButton_c32e"};const u=c},4502:(e,n,t)=>{"use strict";t.r(n),t.d(n,{default:()=>s});var r=t(7537),o=t.n(r),i=t(3645),a=t.n(i),l=t(8004),c=t(3181),u=a()(o());u.i(c.Z),u.i(l.default,"",!0),u.push([e.id,'.tag_b7aa {\n\n  position: relative;\n  z-index: 1;\n\n  display: inline-flex;\n\n  box-sizing: border-box;\n  max-width: 100%;\n  height: 20px;\n\n  margin-bottom: 1px;\n  padding: 0 8px;\n\n  vertical-align: top;\n\n  color: var(--ring-text-color);\n\n  border: none;\n  border-radius: var(--ring-border-radius);\n  background-color: var(--ring-tag-background-color);\n\n  font-size: 12px;\n  line-height: var(--ring-line-height);\n}\n\n.withRemove_c0a5 {\n  padding-right: 22px;\n}\n\n.container_cb34 {\n  position: relative;\n\n  display: inline-block;\n\n  max-width: calc(100% - 4px);\n\n  margin-right: 4px;\n\n  white-space: nowrap;\n}\n\n.focused_fd92,\n.tag_b7aa:focus {\n  position: relative;\n\n  outline: none;\n  box-shadow: 0 0 0 2px var(--ring-border-hover-color);\n}\n\n.tagAngled_c869 {\n  /* it needs to fix vertical alignment broken by "overflow: hidden". Remove this class, when IE11 will be deprecated */\n\n  margin-bottom: -5px !important;\n\n  margin-left: 8px;\n  padding-left: 4px;\n\n  border-top-left-radius: 0;\n  border-bottom-left-radius: 0\n}\n\n.tagAngled_c869::before {\n    position: absolute;\n    z-index: -1;\n    top: 0;\n    left: 0;\n\n    box-sizing: border-box;\n    width: 12px;\n    height: 12px;\n\n    content: "";\n    transform: scaleY(1.177) rotate(45deg);\n    transform-origin: 0 0;\n\n    border: none;\n\n    background-color: var(--ring-tag-background-color);\n  }\n\n.tagAngled_c869.focused_fd92,\n  .tagAngled_c869:focus {\n    box-shadow: 0 0 0 1px var(--ring-border-hover-color) inset, 0 0 0 1px var(--ring-border-hover-color);\n  }\n\n.tagAngled_c869:focus::before {\n    box-shadow:\n      1px -1px var(--ring-border-hover-color) inset,\n      -0.8px 0.8px 0 0.5px var(--ring-border-hover-color);\n  }\n\n.content_a838 {\n}\n\n.disabled_b740 {\n  opacity: 0.5;\n}\n\n.remove_eff8 {\n  position: absolute;\n  z-index: 1;\n  top: -1px;\n  right: 0;\n\n  padding: 0 4px;\n}\n\n.removeIcon_accf.removeIcon_accf {\n  color: var(--ring-icon-secondary-color);\n}\n\n.icon_e877 {\n  margin-right: 6px;\n\n  color: var(--ring-icon-secondary-color)\n}\n\n.icon_e877 svg {\n    vertical-align: -3px;\n  }\n\n.avatarContainer_ee1b {\n  display: inline-block;\n  overflow: hidden;\n\n  box-sizing: border-box;\n  width: 20px;\n  height: 20px;\n  margin-right: 4px;\n  margin-left: -8px;\n\n  vertical-align: top;\n\n  border-top-left-radius: var(--ring-border-radius);\n  border-bottom-left-radius: var(--ring-border-radius);\n}\n\n.customIcon_ac93 {\n  max-width: 16px;\n  max-height: 16px;\n\n  margin-right: 4px;\n\n  vertical-align: bottom;\n}\n\n.avatarIcon_a8ff {\n  width: 20px;\n\n  margin-right: -4px;\n\n  -o-object-fit: contain;\n\n     object-fit: contain;\n  -o-object-position: center;\n     object-position: center;\n}\n',"",{version:3,sources:["webpack://./node_modules/@jetbrains/ring-ui/components/tag/tag.css"],names:[],mappings:"AAMA;;EAGE,kBAAkB;EAClB,UAAU;;EAEV,oBAAoB;;EAEpB,sBAAsB;EACtB,eAAe;EACf,YAAkB;;EAElB,kBAAkB;EAClB,cAAe;;EAEf,mBAAmB;;EAEnB,6BAA6B;;EAE7B,YAAY;EACZ,wCAAwC;EACxC,kDAAkC;;EAElC,eAAe;EACf,oCAAoC;AACtC;;AAEA;EACE,mBAAmB;AACrB;;AAEA;EACE,kBAAkB;;EAElB,qBAAqB;;EAErB,2BAAgC;;EAEhC,iBAA4B;;EAE5B,mBAAmB;AACrB;;AAEA;;EAEE,kBAAkB;;EAElB,aAAa;EACb,oDAAoD;AACtD;;AAEA;EACE,qHAAqH;;EAErH,8BAA8B;;EAE9B,gBAAiB;EACjB,iBAA4B;;EAE5B,yBAAyB;EACzB;AA+BF;;AA7BE;IACE,kBAAkB;IAClB,WAAW;IACX,MAAM;IACN,OAAO;;IAEP,sBAAsB;IACtB,WAAW;IACX,YAAY;;IAEZ,WAAW;IACX,sCAAsC;IACtC,qBAAqB;;IAErB,YAAY;;IAEZ,kDAAkC;EACpC;;AAEA;;IAEE,oGAAoG;EACtG;;AAEA;IACE;;yDAEqD;EACvD;;AAGF;AAEA;;AAEA;EACE,YAAY;AACd;;AAEA;EACE,kBAAkB;EAClB,UAAU;EACV,SAAS;EACT,QAAQ;;EAER,cAAyB;AAC3B;;AAEA;EACE,uCAAuC;AACzC;;AAEA;EACE,iBAAiB;;EAEjB;AAKF;;AAHE;IACE,oBAAoB;EACtB;;AAGF;EACE,qBAAqB;EACrB,gBAAgB;;EAEhB,sBAAsB;EACtB,WAAiB;EACjB,YAAkB;EAClB,iBAA4B;EAC5B,iBAA2B;;EAE3B,mBAAmB;;EAEnB,iDAAiD;EACjD,oDAAoD;AACtD;;AAEA;EACE,eAAyB;EACzB,gBAA0B;;EAE1B,iBAA4B;;EAE5B,sBAAsB;AACxB;;AAEA;EACE,WAAiB;;EAEjB,kBAAkB;;EAElB,sBAAmB;;KAAnB,mBAAmB;EACnB,0BAAuB;KAAvB,uBAAuB;AACzB",sourcesContent:['@import "../global/variables.css";\n\n@value unit, resetButton from "../global/global.css";\n@value background-color: var(--ring-tag-background-color);\n@value max-height: 20px;\n\n.tag {\n  composes: resetButton;\n\n  position: relative;\n  z-index: 1;\n\n  display: inline-flex;\n\n  box-sizing: border-box;\n  max-width: 100%;\n  height: max-height;\n\n  margin-bottom: 1px;\n  padding: 0 unit;\n\n  vertical-align: top;\n\n  color: var(--ring-text-color);\n\n  border: none;\n  border-radius: var(--ring-border-radius);\n  background-color: background-color;\n\n  font-size: 12px;\n  line-height: var(--ring-line-height);\n}\n\n.withRemove {\n  padding-right: 22px;\n}\n\n.container {\n  position: relative;\n\n  display: inline-block;\n\n  max-width: calc(100% - unit / 2);\n\n  margin-right: calc(unit / 2);\n\n  white-space: nowrap;\n}\n\n.focused,\n.tag:focus {\n  position: relative;\n\n  outline: none;\n  box-shadow: 0 0 0 2px var(--ring-border-hover-color);\n}\n\n.tagAngled {\n  /* it needs to fix vertical alignment broken by "overflow: hidden". Remove this class, when IE11 will be deprecated */\n\n  margin-bottom: -5px !important;\n\n  margin-left: unit;\n  padding-left: calc(unit / 2);\n\n  border-top-left-radius: 0;\n  border-bottom-left-radius: 0;\n\n  &::before {\n    position: absolute;\n    z-index: -1;\n    top: 0;\n    left: 0;\n\n    box-sizing: border-box;\n    width: 12px;\n    height: 12px;\n\n    content: "";\n    transform: scaleY(1.177) rotate(45deg);\n    transform-origin: 0 0;\n\n    border: none;\n\n    background-color: background-color;\n  }\n\n  &.focused,\n  &:focus {\n    box-shadow: 0 0 0 1px var(--ring-border-hover-color) inset, 0 0 0 1px var(--ring-border-hover-color);\n  }\n\n  &:focus::before {\n    box-shadow:\n      1px -1px var(--ring-border-hover-color) inset,\n      -0.8px 0.8px 0 0.5px var(--ring-border-hover-color);\n  }\n}\n\n.content {\n  composes: ellipsis from "../global/global.css";\n}\n\n.disabled {\n  opacity: 0.5;\n}\n\n.remove {\n  position: absolute;\n  z-index: 1;\n  top: -1px;\n  right: 0;\n\n  padding: 0 calc(unit / 2);\n}\n\n.removeIcon.removeIcon {\n  color: var(--ring-icon-secondary-color);\n}\n\n.icon {\n  margin-right: 6px;\n\n  color: var(--ring-icon-secondary-color);\n\n  & svg {\n    vertical-align: -3px;\n  }\n}\n\n.avatarContainer {\n  display: inline-block;\n  overflow: hidden;\n\n  box-sizing: border-box;\n  width: max-height;\n  height: max-height;\n  margin-right: calc(unit / 2);\n  margin-left: calc(0 - unit);\n\n  vertical-align: top;\n\n  border-top-left-radius: var(--ring-border-radius);\n  border-bottom-left-radius: var(--ring-border-radius);\n}\n\n.customIcon {\n  max-width: calc(unit * 2);\n  max-height: calc(unit * 2);\n\n  margin-right: calc(unit / 2);\n\n  vertical-align: bottom;\n}\n\n.avatarIcon {\n  width: max-height;\n\n  margin-right: -4px;\n\n  object-fit: contain;\n  object-position: center;\n}\n'],sourceRoot:""}]),u.locals={unit:""+l.default.locals.unit,resetButton:""+l.default.locals.resetButton,"background-color":"var(--ring-tag-background-color)","max-height":"20px",tag:"tag_b7aa "+l.default.locals.resetButton,withRemove:"withRemove_c0a5",container:"container_cb34",focused:"focused_fd92",tagAngled:"tagAngled_c869",content:"content_a838 "+l.default.locals.ellipsis,disabled:"disabled_b740",remove:"remove_eff8",removeIcon:"removeIcon_accf",icon:"icon_e877",avatarContainer:"avatarContainer_ee1b",customIcon:"customIcon_ac93",avatarIcon:"avatarIcon_a8ff"};const s=u},5729:(e,n,t)=>{"use strict";t.r(n),t.d(n,{default:()=>u});var r=t(7537),o=t.n(r),i=t(3645),a=t.n(i),l=t(3181),c=a()(o());c.i(l.Z),c.push([e.id,".text_f1dc {\n  color: var(--ring-text-color);\n}\n\n.info_c0a4 {\n  color: var(--ring-secondary-color);\n}\n","",{version:3,sources:["webpack://./node_modules/@jetbrains/ring-ui/components/text/text.css"],names:[],mappings:"AAEA;EACE,6BAA6B;AAC/B;;AAEA;EACE,kCAAkC;AACpC",sourcesContent:['@import "../global/variables.css";\n\n.text {\n  color: var(--ring-text-color);\n}\n\n.info {\n  color: var(--ring-secondary-color);\n}\n'],sourceRoot:""}]),c.locals={text:"text_f1dc",info:"info_c0a4"};const u=c},3099:(e,n,t)=>{"use strict";t.r(n),t.d(n,{default:()=>s});var r=t(7537),o=t.n(r),i=t(3645),a=t.n(i),l=t(8004),c=t(3181),u=a()(o());u.i(c.Z),u.i(l.default,"",!0),u.push([e.id,".tooltip_fbfb {\n  max-width: 400px;\n  padding: 8px;\n\n  text-align: left;\n}\n","",{version:3,sources:["webpack://./node_modules/@jetbrains/ring-ui/components/tooltip/tooltip.css"],names:[],mappings:"AAIA;EACE,gBAA0B;EAC1B,YAAa;;EAEb,gBAAgB;AAClB",sourcesContent:['@import "../global/variables.css";\n\n@value unit from "../global/global.css";\n\n.tooltip {\n  max-width: calc(unit * 50);\n  padding: unit;\n\n  text-align: left;\n}\n'],sourceRoot:""}]),u.locals={unit:""+l.default.locals.unit,tooltip:"tooltip_fbfb"};const s=u},3645:e=>{"use strict";e.exports=function(e){var n=[];return n.toString=function(){return this.map((function(n){var t="",r=void 0!==n[5];return n[4]&&(t+="@supports (".concat(n[4],") {")),n[2]&&(t+="@media ".concat(n[2]," {")),r&&(t+="@layer".concat(n[5].length>0?" ".concat(n[5]):""," {")),t+=e(n),r&&(t+="}"),n[2]&&(t+="}"),n[4]&&(t+="}"),t})).join("")},n.i=function(e,t,r,o,i){"string"==typeof e&&(e=[[null,e,void 0]]);var a={};if(r)for(var l=0;l<this.length;l++){var c=this[l][0];null!=c&&(a[c]=!0)}for(var u=0;u<e.length;u++){var s=[].concat(e[u]);r&&a[s[0]]||(void 0!==i&&(void 0===s[5]||(s[1]="@layer".concat(s[5].length>0?" ".concat(s[5]):""," {").concat(s[1],"}")),s[5]=i),t&&(s[2]?(s[1]="@media ".concat(s[2]," {").concat(s[1],"}"),s[2]=t):s[2]=t),o&&(s[4]?(s[1]="@supports (".concat(s[4],") {").concat(s[1],"}"),s[4]=o):s[4]="".concat(o)),n.push(s))}},n}},7537:e=>{"use strict";e.exports=function(e){var n=e[1],t=e[3];if(!t)return n;if("function"==typeof btoa){var r=btoa(unescape(encodeURIComponent(JSON.stringify(t)))),o="sourceMappingURL=data:application/json;charset=utf-8;base64,".concat(r),i="/*# ".concat(o," */"),a=t.sources.map((function(e){return"/*# sourceURL=".concat(t.sourceRoot||"").concat(e," */")}));return[n].concat(a).concat([i]).join("\n")}return[n].join("\n")}},251:(e,n,t)=>{"use strict";var r=t(2215),o=t(2584),i=t(609),a=t(8420),l=t(2847),c=t(5826),u=t(8923),s=t(3679),f=t(210),p=t(1924),d=t(3483),h=t(3216),g=t(7478),v=t(6430),A=t(3533),b=p("Date.prototype.getTime"),m=Object.getPrototypeOf,y=p("Object.prototype.toString"),E=f("%Set%",!0),_=p("Map.prototype.has",!0),C=p("Map.prototype.get",!0),w=p("Map.prototype.size",!0),x=p("Set.prototype.add",!0),k=p("Set.prototype.delete",!0),S=p("Set.prototype.has",!0),O=p("Set.prototype.size",!0);function B(e,n,t,r){for(var o,i=h(e);(o=i.next())&&!o.done;)if(z(n,o.value,t,r))return k(e,o.value),!0;return!1}function I(e){return void 0===e?null:"object"!=typeof e?"symbol"!=typeof e&&("string"!=typeof e&&"number"!=typeof e||+e==+e):void 0}function T(e,n,t,r,o,i){var a=I(t);if(null!=a)return a;var l=C(n,a),c=A({},o,{strict:!1});return!(void 0===l&&!_(n,a)||!z(r,l,c,i))&&(!_(e,a)&&z(r,l,c,i))}function P(e,n,t){var r=I(t);return null!=r?r:S(n,r)&&!S(e,r)}function j(e,n,t,r,o,i){for(var a,l,c=h(e);(a=c.next())&&!a.done;)if(z(t,l=a.value,o,i)&&z(r,C(n,l),o,i))return k(e,l),!0;return!1}function z(e,n,t,f){var p=t||{};if(p.strict?i(e,n):e===n)return!0;if(s(e)!==s(n))return!1;if(!e||!n||"object"!=typeof e&&"object"!=typeof n)return p.strict?i(e,n):e==n;var g,k=f.has(e),I=f.has(n);if(k&&I){if(f.get(e)===f.get(n))return!0}else g={};return k||f.set(e,g),I||f.set(n,g),function(e,n,t,i){var s,f;if(typeof e!=typeof n)return!1;if(null==e||null==n)return!1;if(y(e)!==y(n))return!1;if(o(e)!==o(n))return!1;var p=c(e),g=c(n);if(p!==g)return!1;var k=e instanceof Error,I=n instanceof Error;if(k!==I)return!1;if((k||I)&&(e.name!==n.name||e.message!==n.message))return!1;var M=a(e),D=a(n);if(M!==D)return!1;if((M||D)&&(e.source!==n.source||l(e)!==l(n)))return!1;var N=u(e),L=u(n);if(N!==L)return!1;if((N||L)&&b(e)!==b(n))return!1;if(t.strict&&m&&m(e)!==m(n))return!1;if(v(e)!==v(n))return!1;var F=R(e),U=R(n);if(F!==U)return!1;if(F||U){if(e.length!==n.length)return!1;for(s=0;s<e.length;s++)if(e[s]!==n[s])return!1;return!0}if(typeof e!=typeof n)return!1;var W=r(e),H=r(n);if(W.length!==H.length)return!1;for(W.sort(),H.sort(),s=W.length-1;s>=0;s--)if(W[s]!=H[s])return!1;for(s=W.length-1;s>=0;s--)if(!z(e[f=W[s]],n[f],t,i))return!1;var G=d(e),q=d(n);if(G!==q)return!1;if("Set"===G||"Set"===q)return function(e,n,t,r){if(O(e)!==O(n))return!1;var o,i,a,l=h(e),c=h(n);for(;(o=l.next())&&!o.done;)if(o.value&&"object"==typeof o.value)a||(a=new E),x(a,o.value);else if(!S(n,o.value)){if(t.strict)return!1;if(!P(e,n,o.value))return!1;a||(a=new E),x(a,o.value)}if(a){for(;(i=c.next())&&!i.done;)if(i.value&&"object"==typeof i.value){if(!B(a,i.value,t.strict,r))return!1}else if(!t.strict&&!S(e,i.value)&&!B(a,i.value,t.strict,r))return!1;return 0===O(a)}return!0}(e,n,t,i);if("Map"===G)return function(e,n,t,r){if(w(e)!==w(n))return!1;var o,i,a,l,c,u,s=h(e),f=h(n);for(;(o=s.next())&&!o.done;)if(l=o.value[0],c=o.value[1],l&&"object"==typeof l)a||(a=new E),x(a,l);else if(void 0===(u=C(n,l))&&!_(n,l)||!z(c,u,t,r)){if(t.strict)return!1;if(!T(e,n,l,c,t,r))return!1;a||(a=new E),x(a,l)}if(a){for(;(i=f.next())&&!i.done;)if(l=i.value[0],u=i.value[1],l&&"object"==typeof l){if(!j(a,e,l,u,t,r))return!1}else if(!(t.strict||e.has(l)&&z(C(e,l),u,t,r)||j(a,e,l,u,A({},t,{strict:!1}),r)))return!1;return 0===O(a)}return!0}(e,n,t,i);return!0}(e,n,p,f)}function R(e){return!(!e||"object"!=typeof e||"number"!=typeof e.length)&&("function"==typeof e.copy&&"function"==typeof e.slice&&(!(e.length>0&&"number"!=typeof e[0])&&!!(e.constructor&&e.constructor.isBuffer&&e.constructor.isBuffer(e))))}e.exports=function(e,n,t){return z(e,n,t,g())}},4289:(e,n,t)=>{"use strict";var r=t(2215),o="function"==typeof Symbol&&"symbol"==typeof Symbol("foo"),i=Object.prototype.toString,a=Array.prototype.concat,l=Object.defineProperty,c=l&&function(){var e={};try{for(var n in l(e,"x",{enumerable:!1,value:e}),e)return!1;return e.x===e}catch(e){return!1}}(),u=function(e,n,t,r){var o;(!(n in e)||"function"==typeof(o=r)&&"[object Function]"===i.call(o)&&r())&&(c?l(e,n,{configurable:!0,enumerable:!1,value:t,writable:!0}):e[n]=t)},s=function(e,n){var t=arguments.length>2?arguments[2]:{},i=r(n);o&&(i=a.call(i,Object.getOwnPropertySymbols(n)));for(var l=0;l<i.length;l+=1)u(e,i[l],n[i[l]],t[i[l]])};s.supportsDescriptors=!!c,e.exports=s},5202:function(){!function(){"use strict";function e(e){var n=!0,t=!1,r=null,o={text:!0,search:!0,url:!0,tel:!0,email:!0,password:!0,number:!0,date:!0,month:!0,week:!0,time:!0,datetime:!0,"datetime-local":!0};function i(e){return!!(e&&e!==document&&"HTML"!==e.nodeName&&"BODY"!==e.nodeName&&"classList"in e&&"contains"in e.classList)}function a(e){var n=e.type,t=e.tagName;return!("INPUT"!==t||!o[n]||e.readOnly)||"TEXTAREA"===t&&!e.readOnly||!!e.isContentEditable}function l(e){e.classList.contains("focus-visible")||(e.classList.add("focus-visible"),e.setAttribute("data-focus-visible-added",""))}function c(e){e.hasAttribute("data-focus-visible-added")&&(e.classList.remove("focus-visible"),e.removeAttribute("data-focus-visible-added"))}function u(t){t.metaKey||t.altKey||t.ctrlKey||(i(e.activeElement)&&l(e.activeElement),n=!0)}function s(e){n=!1}function f(e){i(e.target)&&(n||a(e.target))&&l(e.target)}function p(e){i(e.target)&&(e.target.classList.contains("focus-visible")||e.target.hasAttribute("data-focus-visible-added"))&&(t=!0,window.clearTimeout(r),r=window.setTimeout((function(){t=!1}),100),c(e.target))}function d(e){"hidden"===document.visibilityState&&(t&&(n=!0),h())}function h(){document.addEventListener("mousemove",v),document.addEventListener("mousedown",v),document.addEventListener("mouseup",v),document.addEventListener("pointermove",v),document.addEventListener("pointerdown",v),document.addEventListener("pointerup",v),document.addEventListener("touchmove",v),document.addEventListener("touchstart",v),document.addEventListener("touchend",v)}function g(){document.removeEventListener("mousemove",v),document.removeEventListener("mousedown",v),document.removeEventListener("mouseup",v),document.removeEventListener("pointermove",v),document.removeEventListener("pointerdown",v),document.removeEventListener("pointerup",v),document.removeEventListener("touchmove",v),document.removeEventListener("touchstart",v),document.removeEventListener("touchend",v)}function v(e){e.target.nodeName&&"html"===e.target.nodeName.toLowerCase()||(n=!1,g())}document.addEventListener("keydown",u,!0),document.addEventListener("mousedown",s,!0),document.addEventListener("pointerdown",s,!0),document.addEventListener("touchstart",s,!0),document.addEventListener("visibilitychange",d,!0),h(),e.addEventListener("focus",f,!0),e.addEventListener("blur",p,!0),e.nodeType===Node.DOCUMENT_FRAGMENT_NODE&&e.host?e.host.setAttribute("data-js-focus-visible",""):e.nodeType===Node.DOCUMENT_NODE&&(document.documentElement.classList.add("js-focus-visible"),document.documentElement.setAttribute("data-js-focus-visible",""))}if("undefined"!=typeof window&&"undefined"!=typeof document){var n;window.applyFocusVisiblePolyfill=e;try{n=new CustomEvent("focus-visible-polyfill-ready")}catch(e){(n=document.createEvent("CustomEvent")).initCustomEvent("focus-visible-polyfill-ready",!1,!1,{})}window.dispatchEvent(n)}"undefined"!=typeof document&&e(document)}()},9804:e=>{var n=Object.prototype.hasOwnProperty,t=Object.prototype.toString;e.exports=function(e,r,o){if("[object Function]"!==t.call(r))throw new TypeError("iterator must be a function");var i=e.length;if(i===+i)for(var a=0;a<i;a++)r.call(o,e[a],a,e);else for(var l in e)n.call(e,l)&&r.call(o,e[l],l,e)}},7648:e=>{"use strict";var n="Function.prototype.bind called on incompatible ",t=Array.prototype.slice,r=Object.prototype.toString,o="[object Function]";e.exports=function(e){var i=this;if("function"!=typeof i||r.call(i)!==o)throw new TypeError(n+i);for(var a,l=t.call(arguments,1),c=function(){if(this instanceof a){var n=i.apply(this,l.concat(t.call(arguments)));return Object(n)===n?n:this}return i.apply(e,l.concat(t.call(arguments)))},u=Math.max(0,i.length-l.length),s=[],f=0;f<u;f++)s.push("$"+f);if(a=Function("binder","return function ("+s.join(",")+"){ return binder.apply(this,arguments); }")(c),i.prototype){var p=function(){};p.prototype=i.prototype,a.prototype=new p,p.prototype=null}return a}},8612:(e,n,t)=>{"use strict";var r=t(7648);e.exports=Function.prototype.bind||r},210:(e,n,t)=>{"use strict";var r,o=SyntaxError,i=Function,a=TypeError,l=function(e){try{return i('"use strict"; return ('+e+").constructor;")()}catch(e){}},c=Object.getOwnPropertyDescriptor;if(c)try{c({},"")}catch(e){c=null}var u=function(){throw new a},s=c?function(){try{return u}catch(e){try{return c(arguments,"callee").get}catch(e){return u}}}():u,f=t(1405)(),p=Object.getPrototypeOf||function(e){return e.__proto__},d={},h="undefined"==typeof Uint8Array?r:p(Uint8Array),g={"%AggregateError%":"undefined"==typeof AggregateError?r:AggregateError,"%Array%":Array,"%ArrayBuffer%":"undefined"==typeof ArrayBuffer?r:ArrayBuffer,"%ArrayIteratorPrototype%":f?p([][Symbol.iterator]()):r,"%AsyncFromSyncIteratorPrototype%":r,"%AsyncFunction%":d,"%AsyncGenerator%":d,"%AsyncGeneratorFunction%":d,"%AsyncIteratorPrototype%":d,"%Atomics%":"undefined"==typeof Atomics?r:Atomics,"%BigInt%":"undefined"==typeof BigInt?r:BigInt,"%Boolean%":Boolean,"%DataView%":"undefined"==typeof DataView?r:DataView,"%Date%":Date,"%decodeURI%":decodeURI,"%decodeURIComponent%":decodeURIComponent,"%encodeURI%":encodeURI,"%encodeURIComponent%":encodeURIComponent,"%Error%":Error,"%eval%":eval,"%EvalError%":EvalError,"%Float32Array%":"undefined"==typeof Float32Array?r:Float32Array,"%Float64Array%":"undefined"==typeof Float64Array?r:Float64Array,"%FinalizationRegistry%":"undefined"==typeof FinalizationRegistry?r:FinalizationRegistry,"%Function%":i,"%GeneratorFunction%":d,"%Int8Array%":"undefined"==typeof Int8Array?r:Int8Array,"%Int16Array%":"undefined"==typeof Int16Array?r:Int16Array,"%Int32Array%":"undefined"==typeof Int32Array?r:Int32Array,"%isFinite%":isFinite,"%isNaN%":isNaN,"%IteratorPrototype%":f?p(p([][Symbol.iterator]())):r,"%JSON%":"object"==typeof JSON?JSON:r,"%Map%":"undefined"==typeof Map?r:Map,"%MapIteratorPrototype%":"undefined"!=typeof Map&&f?p((new Map)[Symbol.iterator]()):r,"%Math%":Math,"%Number%":Number,"%Object%":Object,"%parseFloat%":parseFloat,"%parseInt%":parseInt,"%Promise%":"undefined"==typeof Promise?r:Promise,"%Proxy%":"undefined"==typeof Proxy?r:Proxy,"%RangeError%":RangeError,"%ReferenceError%":ReferenceError,"%Reflect%":"undefined"==typeof Reflect?r:Reflect,"%RegExp%":RegExp,"%Set%":"undefined"==typeof Set?r:Set,"%SetIteratorPrototype%":"undefined"!=typeof Set&&f?p((new Set)[Symbol.iterator]()):r,"%SharedArrayBuffer%":"undefined"==typeof SharedArrayBuffer?r:SharedArrayBuffer,"%String%":String,"%StringIteratorPrototype%":f?p(""[Symbol.iterator]()):r,"%Symbol%":f?Symbol:r,"%SyntaxError%":o,"%ThrowTypeError%":s,"%TypedArray%":h,"%TypeError%":a,"%Uint8Array%":"undefined"==typeof Uint8Array?r:Uint8Array,"%Uint8ClampedArray%":"undefined"==typeof Uint8ClampedArray?r:Uint8ClampedArray,"%Uint16Array%":"undefined"==typeof Uint16Array?r:Uint16Array,"%Uint32Array%":"undefined"==typeof Uint32Array?r:Uint32Array,"%URIError%":URIError,"%WeakMap%":"undefined"==typeof WeakMap?r:WeakMap,"%WeakRef%":"undefined"==typeof WeakRef?r:WeakRef,"%WeakSet%":"undefined"==typeof WeakSet?r:WeakSet},v=function e(n){var t;if("%AsyncFunction%"===n)t=l("async function () {}");else if("%GeneratorFunction%"===n)t=l("function* () {}");else if("%AsyncGeneratorFunction%"===n)t=l("async function* () {}");else if("%AsyncGenerator%"===n){var r=e("%AsyncGeneratorFunction%");r&&(t=r.prototype)}else if("%AsyncIteratorPrototype%"===n){var o=e("%AsyncGenerator%");o&&(t=p(o.prototype))}return g[n]=t,t},A={"%ArrayBufferPrototype%":["ArrayBuffer","prototype"],"%ArrayPrototype%":["Array","prototype"],"%ArrayProto_entries%":["Array","prototype","entries"],"%ArrayProto_forEach%":["Array","prototype","forEach"],"%ArrayProto_keys%":["Array","prototype","keys"],"%ArrayProto_values%":["Array","prototype","values"],"%AsyncFunctionPrototype%":["AsyncFunction","prototype"],"%AsyncGenerator%":["AsyncGeneratorFunction","prototype"],"%AsyncGeneratorPrototype%":["AsyncGeneratorFunction","prototype","prototype"],"%BooleanPrototype%":["Boolean","prototype"],"%DataViewPrototype%":["DataView","prototype"],"%DatePrototype%":["Date","prototype"],"%ErrorPrototype%":["Error","prototype"],"%EvalErrorPrototype%":["EvalError","prototype"],"%Float32ArrayPrototype%":["Float32Array","prototype"],"%Float64ArrayPrototype%":["Float64Array","prototype"],"%FunctionPrototype%":["Function","prototype"],"%Generator%":["GeneratorFunction","prototype"],"%GeneratorPrototype%":["GeneratorFunction","prototype","prototype"],"%Int8ArrayPrototype%":["Int8Array","prototype"],"%Int16ArrayPrototype%":["Int16Array","prototype"],"%Int32ArrayPrototype%":["Int32Array","prototype"],"%JSONParse%":["JSON","parse"],"%JSONStringify%":["JSON","stringify"],"%MapPrototype%":["Map","prototype"],"%NumberPrototype%":["Number","prototype"],"%ObjectPrototype%":["Object","prototype"],"%ObjProto_toString%":["Object","prototype","toString"],"%ObjProto_valueOf%":["Object","prototype","valueOf"],"%PromisePrototype%":["Promise","prototype"],"%PromiseProto_then%":["Promise","prototype","then"],"%Promise_all%":["Promise","all"],"%Promise_reject%":["Promise","reject"],"%Promise_resolve%":["Promise","resolve"],"%RangeErrorPrototype%":["RangeError","prototype"],"%ReferenceErrorPrototype%":["ReferenceError","prototype"],"%RegExpPrototype%":["RegExp","prototype"],"%SetPrototype%":["Set","prototype"],"%SharedArrayBufferPrototype%":["SharedArrayBuffer","prototype"],"%StringPrototype%":["String","prototype"],"%SymbolPrototype%":["Symbol","prototype"],"%SyntaxErrorPrototype%":["SyntaxError","prototype"],"%TypedArrayPrototype%":["TypedArray","prototype"],"%TypeErrorPrototype%":["TypeError","prototype"],"%Uint8ArrayPrototype%":["Uint8Array","prototype"],"%Uint8ClampedArrayPrototype%":["Uint8ClampedArray","prototype"],"%Uint16ArrayPrototype%":["Uint16Array","prototype"],"%Uint32ArrayPrototype%":["Uint32Array","prototype"],"%URIErrorPrototype%":["URIError","prototype"],"%WeakMapPrototype%":["WeakMap","prototype"],"%WeakSetPrototype%":["WeakSet","prototype"]},b=t(8612),m=t(7642),y=b.call(Function.call,Array.prototype.concat),E=b.call(Function.apply,Array.prototype.splice),_=b.call(Function.call,String.prototype.replace),C=b.call(Function.call,String.prototype.slice),w=/[^%.[\]]+|\[(?:(-?\d+(?:\.\d+)?)|(["'])((?:(?!\2)[^\\]|\\.)*?)\2)\]|(?=(?:\.|\[\])(?:\.|\[\]|%$))/g,x=/\\(\\)?/g,k=function(e){var n=C(e,0,1),t=C(e,-1);if("%"===n&&"%"!==t)throw new o("invalid intrinsic syntax, expected closing `%`");if("%"===t&&"%"!==n)throw new o("invalid intrinsic syntax, expected opening `%`");var r=[];return _(e,w,(function(e,n,t,o){r[r.length]=t?_(o,x,"$1"):n||e})),r},S=function(e,n){var t,r=e;if(m(A,r)&&(r="%"+(t=A[r])[0]+"%"),m(g,r)){var i=g[r];if(i===d&&(i=v(r)),void 0===i&&!n)throw new a("intrinsic "+e+" exists, but is not available. Please file an issue!");return{alias:t,name:r,value:i}}throw new o("intrinsic "+e+" does not exist!")};e.exports=function(e,n){if("string"!=typeof e||0===e.length)throw new a("intrinsic name must be a non-empty string");if(arguments.length>1&&"boolean"!=typeof n)throw new a('"allowMissing" argument must be a boolean');var t=k(e),r=t.length>0?t[0]:"",i=S("%"+r+"%",n),l=i.name,u=i.value,s=!1,f=i.alias;f&&(r=f[0],E(t,y([0,1],f)));for(var p=1,d=!0;p<t.length;p+=1){var h=t[p],v=C(h,0,1),A=C(h,-1);if(('"'===v||"'"===v||"`"===v||'"'===A||"'"===A||"`"===A)&&v!==A)throw new o("property names with quotes must have matching quotes");if("constructor"!==h&&d||(s=!0),m(g,l="%"+(r+="."+h)+"%"))u=g[l];else if(null!=u){if(!(h in u)){if(!n)throw new a("base intrinsic for "+e+" exists, but the property is not available.");return}if(c&&p+1>=t.length){var b=c(u,h);u=(d=!!b)&&"get"in b&&!("originalValue"in b.get)?b.get:u[h]}else d=m(u,h),u=u[h];d&&!s&&(g[l]=u)}}return u}},932:(e,n,t)=>{"use strict";var r=t.g.BigInt;e.exports=function(){return"function"==typeof r&&"function"==typeof BigInt&&"bigint"==typeof r(42)&&"bigint"==typeof BigInt(42)}},1405:(e,n,t)=>{"use strict";var r="undefined"!=typeof Symbol&&Symbol,o=t(5419);e.exports=function(){return"function"==typeof r&&("function"==typeof Symbol&&("symbol"==typeof r("foo")&&("symbol"==typeof Symbol("bar")&&o())))}},5419:e=>{"use strict";e.exports=function(){if("function"!=typeof Symbol||"function"!=typeof Object.getOwnPropertySymbols)return!1;if("symbol"==typeof Symbol.iterator)return!0;var e={},n=Symbol("test"),t=Object(n);if("string"==typeof n)return!1;if("[object Symbol]"!==Object.prototype.toString.call(n))return!1;if("[object Symbol]"!==Object.prototype.toString.call(t))return!1;for(n in e[n]=42,e)return!1;if("function"==typeof Object.keys&&0!==Object.keys(e).length)return!1;if("function"==typeof Object.getOwnPropertyNames&&0!==Object.getOwnPropertyNames(e).length)return!1;var r=Object.getOwnPropertySymbols(e);if(1!==r.length||r[0]!==n)return!1;if(!Object.prototype.propertyIsEnumerable.call(e,n))return!1;if("function"==typeof Object.getOwnPropertyDescriptor){var o=Object.getOwnPropertyDescriptor(e,n);if(42!==o.value||!0!==o.enumerable)return!1}return!0}},6410:(e,n,t)=>{"use strict";var r=t(5419);e.exports=function(){return r()&&!!Symbol.toStringTag}},7642:(e,n,t)=>{"use strict";var r=t(8612);e.exports=r.call(Function.call,Object.prototype.hasOwnProperty)},2584:(e,n,t)=>{"use strict";var r=t(6410)(),o=t(1924)("Object.prototype.toString"),i=function(e){return!(r&&e&&"object"==typeof e&&Symbol.toStringTag in e)&&"[object Arguments]"===o(e)},a=function(e){return!!i(e)||null!==e&&"object"==typeof e&&"number"==typeof e.length&&e.length>=0&&"[object Array]"!==o(e)&&"[object Function]"===o(e.callee)},l=function(){return i(arguments)}();i.isLegacyArguments=a,e.exports=l?i:a},3376:(e,n,t)=>{"use strict";if(t(932)()){var r=BigInt.prototype.valueOf;e.exports=function(e){return null!=e&&"boolean"!=typeof e&&"string"!=typeof e&&"number"!=typeof e&&"symbol"!=typeof e&&"function"!=typeof e&&("bigint"==typeof e||function(e){try{return r.call(e),!0}catch(e){}return!1}(e))}}else e.exports=function(e){return!1}},6814:(e,n,t)=>{"use strict";var r=t(1924),o=r("Boolean.prototype.toString"),i=r("Object.prototype.toString"),a=t(6410)();e.exports=function(e){return"boolean"==typeof e||null!==e&&"object"==typeof e&&(a&&Symbol.toStringTag in e?function(e){try{return o(e),!0}catch(e){return!1}}(e):"[object Boolean]"===i(e))}},8923:(e,n,t)=>{"use strict";var r=Date.prototype.getDay,o=Object.prototype.toString,i=t(6410)();e.exports=function(e){return"object"==typeof e&&null!==e&&(i?function(e){try{return r.call(e),!0}catch(e){return!1}}(e):"[object Date]"===o.call(e))}},8379:e=>{"use strict";var n,t="function"==typeof Map&&Map.prototype?Map:null,r="function"==typeof Set&&Set.prototype?Set:null;t||(n=function(e){return!1});var o=t?Map.prototype.has:null,i=r?Set.prototype.has:null;n||o||(n=function(e){return!1}),e.exports=n||function(e){if(!e||"object"!=typeof e)return!1;try{if(o.call(e),i)try{i.call(e)}catch(e){return!0}return e instanceof t}catch(e){}return!1}},4578:(e,n,t)=>{"use strict";var r=Number.prototype.toString,o=Object.prototype.toString,i=t(6410)();e.exports=function(e){return"number"==typeof e||"object"==typeof e&&(i?function(e){try{return r.call(e),!0}catch(e){return!1}}(e):"[object Number]"===o.call(e))}},8420:(e,n,t)=>{"use strict";var r,o,i,a,l=t(1924),c=t(6410)();if(c){r=l("Object.prototype.hasOwnProperty"),o=l("RegExp.prototype.exec"),i={};var u=function(){throw i};a={toString:u,valueOf:u},"symbol"==typeof Symbol.toPrimitive&&(a[Symbol.toPrimitive]=u)}var s=l("Object.prototype.toString"),f=Object.getOwnPropertyDescriptor;e.exports=c?function(e){if(!e||"object"!=typeof e)return!1;var n=f(e,"lastIndex");if(!(n&&r(n,"value")))return!1;try{o(e,a)}catch(e){return e===i}}:function(e){return!(!e||"object"!=typeof e&&"function"!=typeof e)&&"[object RegExp]"===s(e)}},9572:e=>{"use strict";var n,t="function"==typeof Map&&Map.prototype?Map:null,r="function"==typeof Set&&Set.prototype?Set:null;r||(n=function(e){return!1});var o=t?Map.prototype.has:null,i=r?Set.prototype.has:null;n||i||(n=function(e){return!1}),e.exports=n||function(e){if(!e||"object"!=typeof e)return!1;try{if(i.call(e),o)try{o.call(e)}catch(e){return!0}return e instanceof r}catch(e){}return!1}},9981:(e,n,t)=>{"use strict";var r=String.prototype.valueOf,o=Object.prototype.toString,i=t(6410)();e.exports=function(e){return"string"==typeof e||"object"==typeof e&&(i?function(e){try{return r.call(e),!0}catch(e){return!1}}(e):"[object String]"===o.call(e))}},2636:(e,n,t)=>{"use strict";var r=Object.prototype.toString;if(t(1405)()){var o=Symbol.prototype.toString,i=/^Symbol\(.*\)$/;e.exports=function(e){if("symbol"==typeof e)return!0;if("[object Symbol]"!==r.call(e))return!1;try{return function(e){return"symbol"==typeof e.valueOf()&&i.test(o.call(e))}(e)}catch(e){return!1}}}else e.exports=function(e){return!1}},5692:(e,n,t)=>{"use strict";var r=t(9804),o=t(3083),i=t(1924),a=i("Object.prototype.toString"),l=t(6410)(),c="undefined"==typeof globalThis?t.g:globalThis,u=o(),s=i("Array.prototype.indexOf",!0)||function(e,n){for(var t=0;t<e.length;t+=1)if(e[t]===n)return t;return-1},f=i("String.prototype.slice"),p={},d=t(882),h=Object.getPrototypeOf;l&&d&&h&&r(u,(function(e){var n=new c[e];if(Symbol.toStringTag in n){var t=h(n),r=d(t,Symbol.toStringTag);if(!r){var o=h(t);r=d(o,Symbol.toStringTag)}p[e]=r.get}}));e.exports=function(e){if(!e||"object"!=typeof e)return!1;if(!l||!(Symbol.toStringTag in e)){var n=f(a(e),8,-1);return s(u,n)>-1}return!!d&&function(e){var n=!1;return r(p,(function(t,r){if(!n)try{n=t.call(e)===r}catch(e){}})),n}(e)}},1718:e=>{"use strict";var n,t="function"==typeof WeakMap&&WeakMap.prototype?WeakMap:null,r="function"==typeof WeakSet&&WeakSet.prototype?WeakSet:null;t||(n=function(e){return!1});var o=t?t.prototype.has:null,i=r?r.prototype.has:null;n||o||(n=function(e){return!1}),e.exports=n||function(e){if(!e||"object"!=typeof e)return!1;try{if(o.call(e,o),i)try{i.call(e,i)}catch(e){return!0}return e instanceof t}catch(e){}return!1}},5899:e=>{"use strict";var n,t="function"==typeof WeakMap&&WeakMap.prototype?WeakMap:null,r="function"==typeof WeakSet&&WeakSet.prototype?WeakSet:null;t||(n=function(e){return!1});var o=t?t.prototype.has:null,i=r?r.prototype.has:null;n||i||(e.exports=function(e){return!1}),e.exports=n||function(e){if(!e||"object"!=typeof e)return!1;try{if(i.call(e,i),o)try{o.call(e,o)}catch(e){return!0}return e instanceof r}catch(e){}return!1}},5826:e=>{var n={}.toString;e.exports=Array.isArray||function(e){return"[object Array]"==n.call(e)}},6486:function(e,n,t){var r;
+/**
+ * @license
+ * Lodash <https://lodash.com/>
+ * Copyright OpenJS Foundation and other contributors <https://openjsf.org/>
+ * Released under MIT license <https://lodash.com/license>
+ * Based on Underscore.js 1.8.3 <http://underscorejs.org/LICENSE>
+ * Copyright Jeremy Ashkenas, DocumentCloud and Investigative Reporters & Editors
+ */e=t.nmd(e),function(){var o,i="Expected a function",a="__lodash_hash_undefined__",l="__lodash_placeholder__",c=16,u=32,s=64,f=128,p=256,d=1/0,h=9007199254740991,g=NaN,v=4294967295,A=[["ary",f],["bind",1],["bindKey",2],["curry",8],["curryRight",c],["flip",512],["partial",u],["partialRight",s],["rearg",p]],b="[object Arguments]",m="[object Array]",y="[object Boolean]",E="[object Date]",_="[object Error]",C="[object Function]",w="[object GeneratorFunction]",x="[object Map]",k="[object Number]",S="[object Object]",O="[object Promise]",B="[object RegExp]",I="[object Set]",T="[object String]",P="[object Symbol]",j="[object WeakMap]",z="[object ArrayBuffer]",R="[object DataView]",M="[object Float32Array]",D="[object Float64Array]",N="[object Int8Array]",L="[object Int16Array]",F="[object Int32Array]",U="[object Uint8Array]",W="[object Uint8ClampedArray]",H="[object Uint16Array]",G="[object Uint32Array]",q=/\b__p \+= '';/g,V=/\b(__p \+=) '' \+/g,$=/(__e\(.*?\)|\b__t\)) \+\n'';/g,K=/&(?:amp|lt|gt|quot|#39);/g,Y=/[&<>"']/g,X=RegExp(K.source),Z=RegExp(Y.source),Q=/<%-([\s\S]+?)%>/g,J=/<%([\s\S]+?)%>/g,ee=/<%=([\s\S]+?)%>/g,ne=/\.|\[(?:[^[\]]*|(["'])(?:(?!\1)[^\\]|\\.)*?\1)\]/,te=/^\w*$/,re=/[^.[\]]+|\[(?:(-?\d+(?:\.\d+)?)|(["'])((?:(?!\2)[^\\]|\\.)*?)\2)\]|(?=(?:\.|\[\])(?:\.|\[\]|$))/g,oe=/[\\^$.*+?()[\]{}|]/g,ie=RegExp(oe.source),ae=/^\s+/,le=/\s/,ce=/\{(?:\n\/\* \[wrapped with .+\] \*\/)?\n?/,ue=/\{\n\/\* \[wrapped with (.+)\] \*/,se=/,? & /,fe=/[^\x00-\x2f\x3a-\x40\x5b-\x60\x7b-\x7f]+/g,pe=/[()=,{}\[\]\/\s]/,de=/\\(\\)?/g,he=/\$\{([^\\}]*(?:\\.[^\\}]*)*)\}/g,ge=/\w*$/,ve=/^[-+]0x[0-9a-f]+$/i,Ae=/^0b[01]+$/i,be=/^\[object .+?Constructor\]$/,me=/^0o[0-7]+$/i,ye=/^(?:0|[1-9]\d*)$/,Ee=/[\xc0-\xd6\xd8-\xf6\xf8-\xff\u0100-\u017f]/g,_e=/($^)/,Ce=/['\n\r\u2028\u2029\\]/g,we="\\u0300-\\u036f\\ufe20-\\ufe2f\\u20d0-\\u20ff",xe="\\u2700-\\u27bf",ke="a-z\\xdf-\\xf6\\xf8-\\xff",Se="A-Z\\xc0-\\xd6\\xd8-\\xde",Oe="\\ufe0e\\ufe0f",Be="\\xac\\xb1\\xd7\\xf7\\x00-\\x2f\\x3a-\\x40\\x5b-\\x60\\x7b-\\xbf\\u2000-\\u206f \\t\\x0b\\f\\xa0\\ufeff\\n\\r\\u2028\\u2029\\u1680\\u180e\\u2000\\u2001\\u2002\\u2003\\u2004\\u2005\\u2006\\u2007\\u2008\\u2009\\u200a\\u202f\\u205f\\u3000",Ie="['’]",Te="[\\ud800-\\udfff]",Pe="["+Be+"]",je="["+we+"]",ze="\\d+",Re="[\\u2700-\\u27bf]",Me="["+ke+"]",De="[^\\ud800-\\udfff"+Be+ze+xe+ke+Se+"]",Ne="\\ud83c[\\udffb-\\udfff]",Le="[^\\ud800-\\udfff]",Fe="(?:\\ud83c[\\udde6-\\uddff]){2}",Ue="[\\ud800-\\udbff][\\udc00-\\udfff]",We="["+Se+"]",He="(?:"+Me+"|"+De+")",Ge="(?:"+We+"|"+De+")",qe="(?:['’](?:d|ll|m|re|s|t|ve))?",Ve="(?:['’](?:D|LL|M|RE|S|T|VE))?",$e="(?:"+je+"|"+Ne+")"+"?",Ke="[\\ufe0e\\ufe0f]?",Ye=Ke+$e+("(?:\\u200d(?:"+[Le,Fe,Ue].join("|")+")"+Ke+$e+")*"),Xe="(?:"+[Re,Fe,Ue].join("|")+")"+Ye,Ze="(?:"+[Le+je+"?",je,Fe,Ue,Te].join("|")+")",Qe=RegExp(Ie,"g"),Je=RegExp(je,"g"),en=RegExp(Ne+"(?="+Ne+")|"+Ze+Ye,"g"),nn=RegExp([We+"?"+Me+"+"+qe+"(?="+[Pe,We,"$"].join("|")+")",Ge+"+"+Ve+"(?="+[Pe,We+He,"$"].join("|")+")",We+"?"+He+"+"+qe,We+"+"+Ve,"\\d*(?:1ST|2ND|3RD|(?![123])\\dTH)(?=\\b|[a-z_])","\\d*(?:1st|2nd|3rd|(?![123])\\dth)(?=\\b|[A-Z_])",ze,Xe].join("|"),"g"),tn=RegExp("[\\u200d\\ud800-\\udfff"+we+Oe+"]"),rn=/[a-z][A-Z]|[A-Z]{2}[a-z]|[0-9][a-zA-Z]|[a-zA-Z][0-9]|[^a-zA-Z0-9 ]/,on=["Array","Buffer","DataView","Date","Error","Float32Array","Float64Array","Function","Int8Array","Int16Array","Int32Array","Map","Math","Object","Promise","RegExp","Set","String","Symbol","TypeError","Uint8Array","Uint8ClampedArray","Uint16Array","Uint32Array","WeakMap","_","clearTimeout","isFinite","parseInt","setTimeout"],an=-1,ln={};ln[M]=ln[D]=ln[N]=ln[L]=ln[F]=ln[U]=ln[W]=ln[H]=ln[G]=!0,ln[b]=ln[m]=ln[z]=ln[y]=ln[R]=ln[E]=ln[_]=ln[C]=ln[x]=ln[k]=ln[S]=ln[B]=ln[I]=ln[T]=ln[j]=!1;var cn={};cn[b]=cn[m]=cn[z]=cn[R]=cn[y]=cn[E]=cn[M]=cn[D]=cn[N]=cn[L]=cn[F]=cn[x]=cn[k]=cn[S]=cn[B]=cn[I]=cn[T]=cn[P]=cn[U]=cn[W]=cn[H]=cn[G]=!0,cn[_]=cn[C]=cn[j]=!1;var un={"\\":"\\","'":"'","\n":"n","\r":"r","\u2028":"u2028","\u2029":"u2029"},sn=parseFloat,fn=parseInt,pn="object"==typeof t.g&&t.g&&t.g.Object===Object&&t.g,dn="object"==typeof self&&self&&self.Object===Object&&self,hn=pn||dn||Function("return this")(),gn=n&&!n.nodeType&&n,vn=gn&&e&&!e.nodeType&&e,An=vn&&vn.exports===gn,bn=An&&pn.process,mn=function(){try{var e=vn&&vn.require&&vn.require("util").types;return e||bn&&bn.binding&&bn.binding("util")}catch(e){}}(),yn=mn&&mn.isArrayBuffer,En=mn&&mn.isDate,_n=mn&&mn.isMap,Cn=mn&&mn.isRegExp,wn=mn&&mn.isSet,xn=mn&&mn.isTypedArray;function kn(e,n,t){switch(t.length){case 0:return e.call(n);case 1:return e.call(n,t[0]);case 2:return e.call(n,t[0],t[1]);case 3:return e.call(n,t[0],t[1],t[2])}return e.apply(n,t)}function Sn(e,n,t,r){for(var o=-1,i=null==e?0:e.length;++o<i;){var a=e[o];n(r,a,t(a),e)}return r}function On(e,n){for(var t=-1,r=null==e?0:e.length;++t<r&&!1!==n(e[t],t,e););return e}function Bn(e,n){for(var t=null==e?0:e.length;t--&&!1!==n(e[t],t,e););return e}function In(e,n){for(var t=-1,r=null==e?0:e.length;++t<r;)if(!n(e[t],t,e))return!1;return!0}function Tn(e,n){for(var t=-1,r=null==e?0:e.length,o=0,i=[];++t<r;){var a=e[t];n(a,t,e)&&(i[o++]=a)}return i}function Pn(e,n){return!!(null==e?0:e.length)&&Wn(e,n,0)>-1}function jn(e,n,t){for(var r=-1,o=null==e?0:e.length;++r<o;)if(t(n,e[r]))return!0;return!1}function zn(e,n){for(var t=-1,r=null==e?0:e.length,o=Array(r);++t<r;)o[t]=n(e[t],t,e);return o}function Rn(e,n){for(var t=-1,r=n.length,o=e.length;++t<r;)e[o+t]=n[t];return e}function Mn(e,n,t,r){var o=-1,i=null==e?0:e.length;for(r&&i&&(t=e[++o]);++o<i;)t=n(t,e[o],o,e);return t}function Dn(e,n,t,r){var o=null==e?0:e.length;for(r&&o&&(t=e[--o]);o--;)t=n(t,e[o],o,e);return t}function Nn(e,n){for(var t=-1,r=null==e?0:e.length;++t<r;)if(n(e[t],t,e))return!0;return!1}var Ln=Vn("length");function Fn(e,n,t){var r;return t(e,(function(e,t,o){if(n(e,t,o))return r=t,!1})),r}function Un(e,n,t,r){for(var o=e.length,i=t+(r?1:-1);r?i--:++i<o;)if(n(e[i],i,e))return i;return-1}function Wn(e,n,t){return n==n?function(e,n,t){var r=t-1,o=e.length;for(;++r<o;)if(e[r]===n)return r;return-1}(e,n,t):Un(e,Gn,t)}function Hn(e,n,t,r){for(var o=t-1,i=e.length;++o<i;)if(r(e[o],n))return o;return-1}function Gn(e){return e!=e}function qn(e,n){var t=null==e?0:e.length;return t?Yn(e,n)/t:g}function Vn(e){return function(n){return null==n?o:n[e]}}function $n(e){return function(n){return null==e?o:e[n]}}function Kn(e,n,t,r,o){return o(e,(function(e,o,i){t=r?(r=!1,e):n(t,e,o,i)})),t}function Yn(e,n){for(var t,r=-1,i=e.length;++r<i;){var a=n(e[r]);a!==o&&(t=t===o?a:t+a)}return t}function Xn(e,n){for(var t=-1,r=Array(e);++t<e;)r[t]=n(t);return r}function Zn(e){return e?e.slice(0,gt(e)+1).replace(ae,""):e}function Qn(e){return function(n){return e(n)}}function Jn(e,n){return zn(n,(function(n){return e[n]}))}function et(e,n){return e.has(n)}function nt(e,n){for(var t=-1,r=e.length;++t<r&&Wn(n,e[t],0)>-1;);return t}function tt(e,n){for(var t=e.length;t--&&Wn(n,e[t],0)>-1;);return t}function rt(e,n){for(var t=e.length,r=0;t--;)e[t]===n&&++r;return r}var ot=$n({À:"A",Á:"A",Â:"A",Ã:"A",Ä:"A",Å:"A",à:"a",á:"a",â:"a",ã:"a",ä:"a",å:"a",Ç:"C",ç:"c",Ð:"D",ð:"d",È:"E",É:"E",Ê:"E",Ë:"E",è:"e",é:"e",ê:"e",ë:"e",Ì:"I",Í:"I",Î:"I",Ï:"I",ì:"i",í:"i",î:"i",ï:"i",Ñ:"N",ñ:"n",Ò:"O",Ó:"O",Ô:"O",Õ:"O",Ö:"O",Ø:"O",ò:"o",ó:"o",ô:"o",õ:"o",ö:"o",ø:"o",Ù:"U",Ú:"U",Û:"U",Ü:"U",ù:"u",ú:"u",û:"u",ü:"u",Ý:"Y",ý:"y",ÿ:"y",Æ:"Ae",æ:"ae",Þ:"Th",þ:"th",ß:"ss",Ā:"A",Ă:"A",Ą:"A",ā:"a",ă:"a",ą:"a",Ć:"C",Ĉ:"C",Ċ:"C",Č:"C",ć:"c",ĉ:"c",ċ:"c",č:"c",Ď:"D",Đ:"D",ď:"d",đ:"d",Ē:"E",Ĕ:"E",Ė:"E",Ę:"E",Ě:"E",ē:"e",ĕ:"e",ė:"e",ę:"e",ě:"e",Ĝ:"G",Ğ:"G",Ġ:"G",Ģ:"G",ĝ:"g",ğ:"g",ġ:"g",ģ:"g",Ĥ:"H",Ħ:"H",ĥ:"h",ħ:"h",Ĩ:"I",Ī:"I",Ĭ:"I",Į:"I",İ:"I",ĩ:"i",ī:"i",ĭ:"i",į:"i",ı:"i",Ĵ:"J",ĵ:"j",Ķ:"K",ķ:"k",ĸ:"k",Ĺ:"L",Ļ:"L",Ľ:"L",Ŀ:"L",Ł:"L",ĺ:"l",ļ:"l",ľ:"l",ŀ:"l",ł:"l",Ń:"N",Ņ:"N",Ň:"N",Ŋ:"N",ń:"n",ņ:"n",ň:"n",ŋ:"n",Ō:"O",Ŏ:"O",Ő:"O",ō:"o",ŏ:"o",ő:"o",Ŕ:"R",Ŗ:"R",Ř:"R",ŕ:"r",ŗ:"r",ř:"r",Ś:"S",Ŝ:"S",Ş:"S",Š:"S",ś:"s",ŝ:"s",ş:"s",š:"s",Ţ:"T",Ť:"T",Ŧ:"T",ţ:"t",ť:"t",ŧ:"t",Ũ:"U",Ū:"U",Ŭ:"U",Ů:"U",Ű:"U",Ų:"U",ũ:"u",ū:"u",ŭ:"u",ů:"u",ű:"u",ų:"u",Ŵ:"W",ŵ:"w",Ŷ:"Y",ŷ:"y",Ÿ:"Y",Ź:"Z",Ż:"Z",Ž:"Z",ź:"z",ż:"z",ž:"z",Ĳ:"IJ",ĳ:"ij",Œ:"Oe",œ:"oe",ŉ:"'n",ſ:"s"}),it=$n({"&":"&amp;","<":"&lt;",">":"&gt;",'"':"&quot;","'":"&#39;"});function at(e){return"\\"+un[e]}function lt(e){return tn.test(e)}function ct(e){var n=-1,t=Array(e.size);return e.forEach((function(e,r){t[++n]=[r,e]})),t}function ut(e,n){return function(t){return e(n(t))}}function st(e,n){for(var t=-1,r=e.length,o=0,i=[];++t<r;){var a=e[t];a!==n&&a!==l||(e[t]=l,i[o++]=t)}return i}function ft(e){var n=-1,t=Array(e.size);return e.forEach((function(e){t[++n]=e})),t}function pt(e){var n=-1,t=Array(e.size);return e.forEach((function(e){t[++n]=[e,e]})),t}function dt(e){return lt(e)?function(e){var n=en.lastIndex=0;for(;en.test(e);)++n;return n}(e):Ln(e)}function ht(e){return lt(e)?function(e){return e.match(en)||[]}(e):function(e){return e.split("")}(e)}function gt(e){for(var n=e.length;n--&&le.test(e.charAt(n)););return n}var vt=$n({"&amp;":"&","&lt;":"<","&gt;":">","&quot;":'"',"&#39;":"'"});var At=function e(n){var t,r=(n=null==n?hn:At.defaults(hn.Object(),n,At.pick(hn,on))).Array,le=n.Date,we=n.Error,xe=n.Function,ke=n.Math,Se=n.Object,Oe=n.RegExp,Be=n.String,Ie=n.TypeError,Te=r.prototype,Pe=xe.prototype,je=Se.prototype,ze=n["__core-js_shared__"],Re=Pe.toString,Me=je.hasOwnProperty,De=0,Ne=(t=/[^.]+$/.exec(ze&&ze.keys&&ze.keys.IE_PROTO||""))?"Symbol(src)_1."+t:"",Le=je.toString,Fe=Re.call(Se),Ue=hn._,We=Oe("^"+Re.call(Me).replace(oe,"\\$&").replace(/hasOwnProperty|(function).*?(?=\\\()| for .+?(?=\\\])/g,"$1.*?")+"$"),He=An?n.Buffer:o,Ge=n.Symbol,qe=n.Uint8Array,Ve=He?He.allocUnsafe:o,$e=ut(Se.getPrototypeOf,Se),Ke=Se.create,Ye=je.propertyIsEnumerable,Xe=Te.splice,Ze=Ge?Ge.isConcatSpreadable:o,en=Ge?Ge.iterator:o,tn=Ge?Ge.toStringTag:o,un=function(){try{var e=hi(Se,"defineProperty");return e({},"",{}),e}catch(e){}}(),pn=n.clearTimeout!==hn.clearTimeout&&n.clearTimeout,dn=le&&le.now!==hn.Date.now&&le.now,gn=n.setTimeout!==hn.setTimeout&&n.setTimeout,vn=ke.ceil,bn=ke.floor,mn=Se.getOwnPropertySymbols,Ln=He?He.isBuffer:o,$n=n.isFinite,bt=Te.join,mt=ut(Se.keys,Se),yt=ke.max,Et=ke.min,_t=le.now,Ct=n.parseInt,wt=ke.random,xt=Te.reverse,kt=hi(n,"DataView"),St=hi(n,"Map"),Ot=hi(n,"Promise"),Bt=hi(n,"Set"),It=hi(n,"WeakMap"),Tt=hi(Se,"create"),Pt=It&&new It,jt={},zt=Ui(kt),Rt=Ui(St),Mt=Ui(Ot),Dt=Ui(Bt),Nt=Ui(It),Lt=Ge?Ge.prototype:o,Ft=Lt?Lt.valueOf:o,Ut=Lt?Lt.toString:o;function Wt(e){if(ol(e)&&!$a(e)&&!(e instanceof Vt)){if(e instanceof qt)return e;if(Me.call(e,"__wrapped__"))return Wi(e)}return new qt(e)}var Ht=function(){function e(){}return function(n){if(!rl(n))return{};if(Ke)return Ke(n);e.prototype=n;var t=new e;return e.prototype=o,t}}();function Gt(){}function qt(e,n){this.__wrapped__=e,this.__actions__=[],this.__chain__=!!n,this.__index__=0,this.__values__=o}function Vt(e){this.__wrapped__=e,this.__actions__=[],this.__dir__=1,this.__filtered__=!1,this.__iteratees__=[],this.__takeCount__=v,this.__views__=[]}function $t(e){var n=-1,t=null==e?0:e.length;for(this.clear();++n<t;){var r=e[n];this.set(r[0],r[1])}}function Kt(e){var n=-1,t=null==e?0:e.length;for(this.clear();++n<t;){var r=e[n];this.set(r[0],r[1])}}function Yt(e){var n=-1,t=null==e?0:e.length;for(this.clear();++n<t;){var r=e[n];this.set(r[0],r[1])}}function Xt(e){var n=-1,t=null==e?0:e.length;for(this.__data__=new Yt;++n<t;)this.add(e[n])}function Zt(e){var n=this.__data__=new Kt(e);this.size=n.size}function Qt(e,n){var t=$a(e),r=!t&&Va(e),o=!t&&!r&&Za(e),i=!t&&!r&&!o&&pl(e),a=t||r||o||i,l=a?Xn(e.length,Be):[],c=l.length;for(var u in e)!n&&!Me.call(e,u)||a&&("length"==u||o&&("offset"==u||"parent"==u)||i&&("buffer"==u||"byteLength"==u||"byteOffset"==u)||Ei(u,c))||l.push(u);return l}function Jt(e){var n=e.length;return n?e[Xr(0,n-1)]:o}function er(e,n){return Ni(Po(e),ur(n,0,e.length))}function nr(e){return Ni(Po(e))}function tr(e,n,t){(t!==o&&!Ha(e[n],t)||t===o&&!(n in e))&&lr(e,n,t)}function rr(e,n,t){var r=e[n];Me.call(e,n)&&Ha(r,t)&&(t!==o||n in e)||lr(e,n,t)}function or(e,n){for(var t=e.length;t--;)if(Ha(e[t][0],n))return t;return-1}function ir(e,n,t,r){return hr(e,(function(e,o,i){n(r,e,t(e),i)})),r}function ar(e,n){return e&&jo(n,zl(n),e)}function lr(e,n,t){"__proto__"==n&&un?un(e,n,{configurable:!0,enumerable:!0,value:t,writable:!0}):e[n]=t}function cr(e,n){for(var t=-1,i=n.length,a=r(i),l=null==e;++t<i;)a[t]=l?o:Bl(e,n[t]);return a}function ur(e,n,t){return e==e&&(t!==o&&(e=e<=t?e:t),n!==o&&(e=e>=n?e:n)),e}function sr(e,n,t,r,i,a){var l,c=1&n,u=2&n,s=4&n;if(t&&(l=i?t(e,r,i,a):t(e)),l!==o)return l;if(!rl(e))return e;var f=$a(e);if(f){if(l=function(e){var n=e.length,t=new e.constructor(n);n&&"string"==typeof e[0]&&Me.call(e,"index")&&(t.index=e.index,t.input=e.input);return t}(e),!c)return Po(e,l)}else{var p=Ai(e),d=p==C||p==w;if(Za(e))return ko(e,c);if(p==S||p==b||d&&!i){if(l=u||d?{}:mi(e),!c)return u?function(e,n){return jo(e,vi(e),n)}(e,function(e,n){return e&&jo(n,Rl(n),e)}(l,e)):function(e,n){return jo(e,gi(e),n)}(e,ar(l,e))}else{if(!cn[p])return i?e:{};l=function(e,n,t){var r=e.constructor;switch(n){case z:return So(e);case y:case E:return new r(+e);case R:return function(e,n){var t=n?So(e.buffer):e.buffer;return new e.constructor(t,e.byteOffset,e.byteLength)}(e,t);case M:case D:case N:case L:case F:case U:case W:case H:case G:return Oo(e,t);case x:return new r;case k:case T:return new r(e);case B:return function(e){var n=new e.constructor(e.source,ge.exec(e));return n.lastIndex=e.lastIndex,n}(e);case I:return new r;case P:return o=e,Ft?Se(Ft.call(o)):{}}var o}(e,p,c)}}a||(a=new Zt);var h=a.get(e);if(h)return h;a.set(e,l),ul(e)?e.forEach((function(r){l.add(sr(r,n,t,r,e,a))})):il(e)&&e.forEach((function(r,o){l.set(o,sr(r,n,t,o,e,a))}));var g=f?o:(s?u?li:ai:u?Rl:zl)(e);return On(g||e,(function(r,o){g&&(r=e[o=r]),rr(l,o,sr(r,n,t,o,e,a))})),l}function fr(e,n,t){var r=t.length;if(null==e)return!r;for(e=Se(e);r--;){var i=t[r],a=n[i],l=e[i];if(l===o&&!(i in e)||!a(l))return!1}return!0}function pr(e,n,t){if("function"!=typeof e)throw new Ie(i);return zi((function(){e.apply(o,t)}),n)}function dr(e,n,t,r){var o=-1,i=Pn,a=!0,l=e.length,c=[],u=n.length;if(!l)return c;t&&(n=zn(n,Qn(t))),r?(i=jn,a=!1):n.length>=200&&(i=et,a=!1,n=new Xt(n));e:for(;++o<l;){var s=e[o],f=null==t?s:t(s);if(s=r||0!==s?s:0,a&&f==f){for(var p=u;p--;)if(n[p]===f)continue e;c.push(s)}else i(n,f,r)||c.push(s)}return c}Wt.templateSettings={escape:Q,evaluate:J,interpolate:ee,variable:"",imports:{_:Wt}},Wt.prototype=Gt.prototype,Wt.prototype.constructor=Wt,qt.prototype=Ht(Gt.prototype),qt.prototype.constructor=qt,Vt.prototype=Ht(Gt.prototype),Vt.prototype.constructor=Vt,$t.prototype.clear=function(){this.__data__=Tt?Tt(null):{},this.size=0},$t.prototype.delete=function(e){var n=this.has(e)&&delete this.__data__[e];return this.size-=n?1:0,n},$t.prototype.get=function(e){var n=this.__data__;if(Tt){var t=n[e];return t===a?o:t}return Me.call(n,e)?n[e]:o},$t.prototype.has=function(e){var n=this.__data__;return Tt?n[e]!==o:Me.call(n,e)},$t.prototype.set=function(e,n){var t=this.__data__;return this.size+=this.has(e)?0:1,t[e]=Tt&&n===o?a:n,this},Kt.prototype.clear=function(){this.__data__=[],this.size=0},Kt.prototype.delete=function(e){var n=this.__data__,t=or(n,e);return!(t<0)&&(t==n.length-1?n.pop():Xe.call(n,t,1),--this.size,!0)},Kt.prototype.get=function(e){var n=this.__data__,t=or(n,e);return t<0?o:n[t][1]},Kt.prototype.has=function(e){return or(this.__data__,e)>-1},Kt.prototype.set=function(e,n){var t=this.__data__,r=or(t,e);return r<0?(++this.size,t.push([e,n])):t[r][1]=n,this},Yt.prototype.clear=function(){this.size=0,this.__data__={hash:new $t,map:new(St||Kt),string:new $t}},Yt.prototype.delete=function(e){var n=pi(this,e).delete(e);return this.size-=n?1:0,n},Yt.prototype.get=function(e){return pi(this,e).get(e)},Yt.prototype.has=function(e){return pi(this,e).has(e)},Yt.prototype.set=function(e,n){var t=pi(this,e),r=t.size;return t.set(e,n),this.size+=t.size==r?0:1,this},Xt.prototype.add=Xt.prototype.push=function(e){return this.__data__.set(e,a),this},Xt.prototype.has=function(e){return this.__data__.has(e)},Zt.prototype.clear=function(){this.__data__=new Kt,this.size=0},Zt.prototype.delete=function(e){var n=this.__data__,t=n.delete(e);return this.size=n.size,t},Zt.prototype.get=function(e){return this.__data__.get(e)},Zt.prototype.has=function(e){return this.__data__.has(e)},Zt.prototype.set=function(e,n){var t=this.__data__;if(t instanceof Kt){var r=t.__data__;if(!St||r.length<199)return r.push([e,n]),this.size=++t.size,this;t=this.__data__=new Yt(r)}return t.set(e,n),this.size=t.size,this};var hr=Mo(_r),gr=Mo(Cr,!0);function vr(e,n){var t=!0;return hr(e,(function(e,r,o){return t=!!n(e,r,o)})),t}function Ar(e,n,t){for(var r=-1,i=e.length;++r<i;){var a=e[r],l=n(a);if(null!=l&&(c===o?l==l&&!fl(l):t(l,c)))var c=l,u=a}return u}function br(e,n){var t=[];return hr(e,(function(e,r,o){n(e,r,o)&&t.push(e)})),t}function mr(e,n,t,r,o){var i=-1,a=e.length;for(t||(t=yi),o||(o=[]);++i<a;){var l=e[i];n>0&&t(l)?n>1?mr(l,n-1,t,r,o):Rn(o,l):r||(o[o.length]=l)}return o}var yr=Do(),Er=Do(!0);function _r(e,n){return e&&yr(e,n,zl)}function Cr(e,n){return e&&Er(e,n,zl)}function wr(e,n){return Tn(n,(function(n){return el(e[n])}))}function xr(e,n){for(var t=0,r=(n=_o(n,e)).length;null!=e&&t<r;)e=e[Fi(n[t++])];return t&&t==r?e:o}function kr(e,n,t){var r=n(e);return $a(e)?r:Rn(r,t(e))}function Sr(e){return null==e?e===o?"[object Undefined]":"[object Null]":tn&&tn in Se(e)?function(e){var n=Me.call(e,tn),t=e[tn];try{e[tn]=o;var r=!0}catch(e){}var i=Le.call(e);r&&(n?e[tn]=t:delete e[tn]);return i}(e):function(e){return Le.call(e)}(e)}function Or(e,n){return e>n}function Br(e,n){return null!=e&&Me.call(e,n)}function Ir(e,n){return null!=e&&n in Se(e)}function Tr(e,n,t){for(var i=t?jn:Pn,a=e[0].length,l=e.length,c=l,u=r(l),s=1/0,f=[];c--;){var p=e[c];c&&n&&(p=zn(p,Qn(n))),s=Et(p.length,s),u[c]=!t&&(n||a>=120&&p.length>=120)?new Xt(c&&p):o}p=e[0];var d=-1,h=u[0];e:for(;++d<a&&f.length<s;){var g=p[d],v=n?n(g):g;if(g=t||0!==g?g:0,!(h?et(h,v):i(f,v,t))){for(c=l;--c;){var A=u[c];if(!(A?et(A,v):i(e[c],v,t)))continue e}h&&h.push(v),f.push(g)}}return f}function Pr(e,n,t){var r=null==(e=Ii(e,n=_o(n,e)))?e:e[Fi(Ji(n))];return null==r?o:kn(r,e,t)}function jr(e){return ol(e)&&Sr(e)==b}function zr(e,n,t,r,i){return e===n||(null==e||null==n||!ol(e)&&!ol(n)?e!=e&&n!=n:function(e,n,t,r,i,a){var l=$a(e),c=$a(n),u=l?m:Ai(e),s=c?m:Ai(n),f=(u=u==b?S:u)==S,p=(s=s==b?S:s)==S,d=u==s;if(d&&Za(e)){if(!Za(n))return!1;l=!0,f=!1}if(d&&!f)return a||(a=new Zt),l||pl(e)?oi(e,n,t,r,i,a):function(e,n,t,r,o,i,a){switch(t){case R:if(e.byteLength!=n.byteLength||e.byteOffset!=n.byteOffset)return!1;e=e.buffer,n=n.buffer;case z:return!(e.byteLength!=n.byteLength||!i(new qe(e),new qe(n)));case y:case E:case k:return Ha(+e,+n);case _:return e.name==n.name&&e.message==n.message;case B:case T:return e==n+"";case x:var l=ct;case I:var c=1&r;if(l||(l=ft),e.size!=n.size&&!c)return!1;var u=a.get(e);if(u)return u==n;r|=2,a.set(e,n);var s=oi(l(e),l(n),r,o,i,a);return a.delete(e),s;case P:if(Ft)return Ft.call(e)==Ft.call(n)}return!1}(e,n,u,t,r,i,a);if(!(1&t)){var h=f&&Me.call(e,"__wrapped__"),g=p&&Me.call(n,"__wrapped__");if(h||g){var v=h?e.value():e,A=g?n.value():n;return a||(a=new Zt),i(v,A,t,r,a)}}if(!d)return!1;return a||(a=new Zt),function(e,n,t,r,i,a){var l=1&t,c=ai(e),u=c.length,s=ai(n).length;if(u!=s&&!l)return!1;var f=u;for(;f--;){var p=c[f];if(!(l?p in n:Me.call(n,p)))return!1}var d=a.get(e),h=a.get(n);if(d&&h)return d==n&&h==e;var g=!0;a.set(e,n),a.set(n,e);var v=l;for(;++f<u;){var A=e[p=c[f]],b=n[p];if(r)var m=l?r(b,A,p,n,e,a):r(A,b,p,e,n,a);if(!(m===o?A===b||i(A,b,t,r,a):m)){g=!1;break}v||(v="constructor"==p)}if(g&&!v){var y=e.constructor,E=n.constructor;y==E||!("constructor"in e)||!("constructor"in n)||"function"==typeof y&&y instanceof y&&"function"==typeof E&&E instanceof E||(g=!1)}return a.delete(e),a.delete(n),g}(e,n,t,r,i,a)}(e,n,t,r,zr,i))}function Rr(e,n,t,r){var i=t.length,a=i,l=!r;if(null==e)return!a;for(e=Se(e);i--;){var c=t[i];if(l&&c[2]?c[1]!==e[c[0]]:!(c[0]in e))return!1}for(;++i<a;){var u=(c=t[i])[0],s=e[u],f=c[1];if(l&&c[2]){if(s===o&&!(u in e))return!1}else{var p=new Zt;if(r)var d=r(s,f,u,e,n,p);if(!(d===o?zr(f,s,3,r,p):d))return!1}}return!0}function Mr(e){return!(!rl(e)||(n=e,Ne&&Ne in n))&&(el(e)?We:be).test(Ui(e));var n}function Dr(e){return"function"==typeof e?e:null==e?ac:"object"==typeof e?$a(e)?Hr(e[0],e[1]):Wr(e):gc(e)}function Nr(e){if(!ki(e))return mt(e);var n=[];for(var t in Se(e))Me.call(e,t)&&"constructor"!=t&&n.push(t);return n}function Lr(e){if(!rl(e))return function(e){var n=[];if(null!=e)for(var t in Se(e))n.push(t);return n}(e);var n=ki(e),t=[];for(var r in e)("constructor"!=r||!n&&Me.call(e,r))&&t.push(r);return t}function Fr(e,n){return e<n}function Ur(e,n){var t=-1,o=Ya(e)?r(e.length):[];return hr(e,(function(e,r,i){o[++t]=n(e,r,i)})),o}function Wr(e){var n=di(e);return 1==n.length&&n[0][2]?Oi(n[0][0],n[0][1]):function(t){return t===e||Rr(t,e,n)}}function Hr(e,n){return Ci(e)&&Si(n)?Oi(Fi(e),n):function(t){var r=Bl(t,e);return r===o&&r===n?Il(t,e):zr(n,r,3)}}function Gr(e,n,t,r,i){e!==n&&yr(n,(function(a,l){if(i||(i=new Zt),rl(a))!function(e,n,t,r,i,a,l){var c=Pi(e,t),u=Pi(n,t),s=l.get(u);if(s)return void tr(e,t,s);var f=a?a(c,u,t+"",e,n,l):o,p=f===o;if(p){var d=$a(u),h=!d&&Za(u),g=!d&&!h&&pl(u);f=u,d||h||g?$a(c)?f=c:Xa(c)?f=Po(c):h?(p=!1,f=ko(u,!0)):g?(p=!1,f=Oo(u,!0)):f=[]:ll(u)||Va(u)?(f=c,Va(c)?f=yl(c):rl(c)&&!el(c)||(f=mi(u))):p=!1}p&&(l.set(u,f),i(f,u,r,a,l),l.delete(u));tr(e,t,f)}(e,n,l,t,Gr,r,i);else{var c=r?r(Pi(e,l),a,l+"",e,n,i):o;c===o&&(c=a),tr(e,l,c)}}),Rl)}function qr(e,n){var t=e.length;if(t)return Ei(n+=n<0?t:0,t)?e[n]:o}function Vr(e,n,t){n=n.length?zn(n,(function(e){return $a(e)?function(n){return xr(n,1===e.length?e[0]:e)}:e})):[ac];var r=-1;n=zn(n,Qn(fi()));var o=Ur(e,(function(e,t,o){var i=zn(n,(function(n){return n(e)}));return{criteria:i,index:++r,value:e}}));return function(e,n){var t=e.length;for(e.sort(n);t--;)e[t]=e[t].value;return e}(o,(function(e,n){return function(e,n,t){var r=-1,o=e.criteria,i=n.criteria,a=o.length,l=t.length;for(;++r<a;){var c=Bo(o[r],i[r]);if(c)return r>=l?c:c*("desc"==t[r]?-1:1)}return e.index-n.index}(e,n,t)}))}function $r(e,n,t){for(var r=-1,o=n.length,i={};++r<o;){var a=n[r],l=xr(e,a);t(l,a)&&no(i,_o(a,e),l)}return i}function Kr(e,n,t,r){var o=r?Hn:Wn,i=-1,a=n.length,l=e;for(e===n&&(n=Po(n)),t&&(l=zn(e,Qn(t)));++i<a;)for(var c=0,u=n[i],s=t?t(u):u;(c=o(l,s,c,r))>-1;)l!==e&&Xe.call(l,c,1),Xe.call(e,c,1);return e}function Yr(e,n){for(var t=e?n.length:0,r=t-1;t--;){var o=n[t];if(t==r||o!==i){var i=o;Ei(o)?Xe.call(e,o,1):ho(e,o)}}return e}function Xr(e,n){return e+bn(wt()*(n-e+1))}function Zr(e,n){var t="";if(!e||n<1||n>h)return t;do{n%2&&(t+=e),(n=bn(n/2))&&(e+=e)}while(n);return t}function Qr(e,n){return Ri(Bi(e,n,ac),e+"")}function Jr(e){return Jt(Hl(e))}function eo(e,n){var t=Hl(e);return Ni(t,ur(n,0,t.length))}function no(e,n,t,r){if(!rl(e))return e;for(var i=-1,a=(n=_o(n,e)).length,l=a-1,c=e;null!=c&&++i<a;){var u=Fi(n[i]),s=t;if("__proto__"===u||"constructor"===u||"prototype"===u)return e;if(i!=l){var f=c[u];(s=r?r(f,u,c):o)===o&&(s=rl(f)?f:Ei(n[i+1])?[]:{})}rr(c,u,s),c=c[u]}return e}var to=Pt?function(e,n){return Pt.set(e,n),e}:ac,ro=un?function(e,n){return un(e,"toString",{configurable:!0,enumerable:!1,value:rc(n),writable:!0})}:ac;function oo(e){return Ni(Hl(e))}function io(e,n,t){var o=-1,i=e.length;n<0&&(n=-n>i?0:i+n),(t=t>i?i:t)<0&&(t+=i),i=n>t?0:t-n>>>0,n>>>=0;for(var a=r(i);++o<i;)a[o]=e[o+n];return a}function ao(e,n){var t;return hr(e,(function(e,r,o){return!(t=n(e,r,o))})),!!t}function lo(e,n,t){var r=0,o=null==e?r:e.length;if("number"==typeof n&&n==n&&o<=2147483647){for(;r<o;){var i=r+o>>>1,a=e[i];null!==a&&!fl(a)&&(t?a<=n:a<n)?r=i+1:o=i}return o}return co(e,n,ac,t)}function co(e,n,t,r){var i=0,a=null==e?0:e.length;if(0===a)return 0;for(var l=(n=t(n))!=n,c=null===n,u=fl(n),s=n===o;i<a;){var f=bn((i+a)/2),p=t(e[f]),d=p!==o,h=null===p,g=p==p,v=fl(p);if(l)var A=r||g;else A=s?g&&(r||d):c?g&&d&&(r||!h):u?g&&d&&!h&&(r||!v):!h&&!v&&(r?p<=n:p<n);A?i=f+1:a=f}return Et(a,4294967294)}function uo(e,n){for(var t=-1,r=e.length,o=0,i=[];++t<r;){var a=e[t],l=n?n(a):a;if(!t||!Ha(l,c)){var c=l;i[o++]=0===a?0:a}}return i}function so(e){return"number"==typeof e?e:fl(e)?g:+e}function fo(e){if("string"==typeof e)return e;if($a(e))return zn(e,fo)+"";if(fl(e))return Ut?Ut.call(e):"";var n=e+"";return"0"==n&&1/e==-1/0?"-0":n}function po(e,n,t){var r=-1,o=Pn,i=e.length,a=!0,l=[],c=l;if(t)a=!1,o=jn;else if(i>=200){var u=n?null:Qo(e);if(u)return ft(u);a=!1,o=et,c=new Xt}else c=n?[]:l;e:for(;++r<i;){var s=e[r],f=n?n(s):s;if(s=t||0!==s?s:0,a&&f==f){for(var p=c.length;p--;)if(c[p]===f)continue e;n&&c.push(f),l.push(s)}else o(c,f,t)||(c!==l&&c.push(f),l.push(s))}return l}function ho(e,n){return null==(e=Ii(e,n=_o(n,e)))||delete e[Fi(Ji(n))]}function go(e,n,t,r){return no(e,n,t(xr(e,n)),r)}function vo(e,n,t,r){for(var o=e.length,i=r?o:-1;(r?i--:++i<o)&&n(e[i],i,e););return t?io(e,r?0:i,r?i+1:o):io(e,r?i+1:0,r?o:i)}function Ao(e,n){var t=e;return t instanceof Vt&&(t=t.value()),Mn(n,(function(e,n){return n.func.apply(n.thisArg,Rn([e],n.args))}),t)}function bo(e,n,t){var o=e.length;if(o<2)return o?po(e[0]):[];for(var i=-1,a=r(o);++i<o;)for(var l=e[i],c=-1;++c<o;)c!=i&&(a[i]=dr(a[i]||l,e[c],n,t));return po(mr(a,1),n,t)}function mo(e,n,t){for(var r=-1,i=e.length,a=n.length,l={};++r<i;){var c=r<a?n[r]:o;t(l,e[r],c)}return l}function yo(e){return Xa(e)?e:[]}function Eo(e){return"function"==typeof e?e:ac}function _o(e,n){return $a(e)?e:Ci(e,n)?[e]:Li(El(e))}var Co=Qr;function wo(e,n,t){var r=e.length;return t=t===o?r:t,!n&&t>=r?e:io(e,n,t)}var xo=pn||function(e){return hn.clearTimeout(e)};function ko(e,n){if(n)return e.slice();var t=e.length,r=Ve?Ve(t):new e.constructor(t);return e.copy(r),r}function So(e){var n=new e.constructor(e.byteLength);return new qe(n).set(new qe(e)),n}function Oo(e,n){var t=n?So(e.buffer):e.buffer;return new e.constructor(t,e.byteOffset,e.length)}function Bo(e,n){if(e!==n){var t=e!==o,r=null===e,i=e==e,a=fl(e),l=n!==o,c=null===n,u=n==n,s=fl(n);if(!c&&!s&&!a&&e>n||a&&l&&u&&!c&&!s||r&&l&&u||!t&&u||!i)return 1;if(!r&&!a&&!s&&e<n||s&&t&&i&&!r&&!a||c&&t&&i||!l&&i||!u)return-1}return 0}function Io(e,n,t,o){for(var i=-1,a=e.length,l=t.length,c=-1,u=n.length,s=yt(a-l,0),f=r(u+s),p=!o;++c<u;)f[c]=n[c];for(;++i<l;)(p||i<a)&&(f[t[i]]=e[i]);for(;s--;)f[c++]=e[i++];return f}function To(e,n,t,o){for(var i=-1,a=e.length,l=-1,c=t.length,u=-1,s=n.length,f=yt(a-c,0),p=r(f+s),d=!o;++i<f;)p[i]=e[i];for(var h=i;++u<s;)p[h+u]=n[u];for(;++l<c;)(d||i<a)&&(p[h+t[l]]=e[i++]);return p}function Po(e,n){var t=-1,o=e.length;for(n||(n=r(o));++t<o;)n[t]=e[t];return n}function jo(e,n,t,r){var i=!t;t||(t={});for(var a=-1,l=n.length;++a<l;){var c=n[a],u=r?r(t[c],e[c],c,t,e):o;u===o&&(u=e[c]),i?lr(t,c,u):rr(t,c,u)}return t}function zo(e,n){return function(t,r){var o=$a(t)?Sn:ir,i=n?n():{};return o(t,e,fi(r,2),i)}}function Ro(e){return Qr((function(n,t){var r=-1,i=t.length,a=i>1?t[i-1]:o,l=i>2?t[2]:o;for(a=e.length>3&&"function"==typeof a?(i--,a):o,l&&_i(t[0],t[1],l)&&(a=i<3?o:a,i=1),n=Se(n);++r<i;){var c=t[r];c&&e(n,c,r,a)}return n}))}function Mo(e,n){return function(t,r){if(null==t)return t;if(!Ya(t))return e(t,r);for(var o=t.length,i=n?o:-1,a=Se(t);(n?i--:++i<o)&&!1!==r(a[i],i,a););return t}}function Do(e){return function(n,t,r){for(var o=-1,i=Se(n),a=r(n),l=a.length;l--;){var c=a[e?l:++o];if(!1===t(i[c],c,i))break}return n}}function No(e){return function(n){var t=lt(n=El(n))?ht(n):o,r=t?t[0]:n.charAt(0),i=t?wo(t,1).join(""):n.slice(1);return r[e]()+i}}function Lo(e){return function(n){return Mn(ec(Vl(n).replace(Qe,"")),e,"")}}function Fo(e){return function(){var n=arguments;switch(n.length){case 0:return new e;case 1:return new e(n[0]);case 2:return new e(n[0],n[1]);case 3:return new e(n[0],n[1],n[2]);case 4:return new e(n[0],n[1],n[2],n[3]);case 5:return new e(n[0],n[1],n[2],n[3],n[4]);case 6:return new e(n[0],n[1],n[2],n[3],n[4],n[5]);case 7:return new e(n[0],n[1],n[2],n[3],n[4],n[5],n[6])}var t=Ht(e.prototype),r=e.apply(t,n);return rl(r)?r:t}}function Uo(e){return function(n,t,r){var i=Se(n);if(!Ya(n)){var a=fi(t,3);n=zl(n),t=function(e){return a(i[e],e,i)}}var l=e(n,t,r);return l>-1?i[a?n[l]:l]:o}}function Wo(e){return ii((function(n){var t=n.length,r=t,a=qt.prototype.thru;for(e&&n.reverse();r--;){var l=n[r];if("function"!=typeof l)throw new Ie(i);if(a&&!c&&"wrapper"==ui(l))var c=new qt([],!0)}for(r=c?r:t;++r<t;){var u=ui(l=n[r]),s="wrapper"==u?ci(l):o;c=s&&wi(s[0])&&424==s[1]&&!s[4].length&&1==s[9]?c[ui(s[0])].apply(c,s[3]):1==l.length&&wi(l)?c[u]():c.thru(l)}return function(){var e=arguments,r=e[0];if(c&&1==e.length&&$a(r))return c.plant(r).value();for(var o=0,i=t?n[o].apply(this,e):r;++o<t;)i=n[o].call(this,i);return i}}))}function Ho(e,n,t,i,a,l,c,u,s,p){var d=n&f,h=1&n,g=2&n,v=24&n,A=512&n,b=g?o:Fo(e);return function o(){for(var f=arguments.length,m=r(f),y=f;y--;)m[y]=arguments[y];if(v)var E=si(o),_=rt(m,E);if(i&&(m=Io(m,i,a,v)),l&&(m=To(m,l,c,v)),f-=_,v&&f<p){var C=st(m,E);return Xo(e,n,Ho,o.placeholder,t,m,C,u,s,p-f)}var w=h?t:this,x=g?w[e]:e;return f=m.length,u?m=Ti(m,u):A&&f>1&&m.reverse(),d&&s<f&&(m.length=s),this&&this!==hn&&this instanceof o&&(x=b||Fo(x)),x.apply(w,m)}}function Go(e,n){return function(t,r){return function(e,n,t,r){return _r(e,(function(e,o,i){n(r,t(e),o,i)})),r}(t,e,n(r),{})}}function qo(e,n){return function(t,r){var i;if(t===o&&r===o)return n;if(t!==o&&(i=t),r!==o){if(i===o)return r;"string"==typeof t||"string"==typeof r?(t=fo(t),r=fo(r)):(t=so(t),r=so(r)),i=e(t,r)}return i}}function Vo(e){return ii((function(n){return n=zn(n,Qn(fi())),Qr((function(t){var r=this;return e(n,(function(e){return kn(e,r,t)}))}))}))}function $o(e,n){var t=(n=n===o?" ":fo(n)).length;if(t<2)return t?Zr(n,e):n;var r=Zr(n,vn(e/dt(n)));return lt(n)?wo(ht(r),0,e).join(""):r.slice(0,e)}function Ko(e){return function(n,t,i){return i&&"number"!=typeof i&&_i(n,t,i)&&(t=i=o),n=vl(n),t===o?(t=n,n=0):t=vl(t),function(e,n,t,o){for(var i=-1,a=yt(vn((n-e)/(t||1)),0),l=r(a);a--;)l[o?a:++i]=e,e+=t;return l}(n,t,i=i===o?n<t?1:-1:vl(i),e)}}function Yo(e){return function(n,t){return"string"==typeof n&&"string"==typeof t||(n=ml(n),t=ml(t)),e(n,t)}}function Xo(e,n,t,r,i,a,l,c,f,p){var d=8&n;n|=d?u:s,4&(n&=~(d?s:u))||(n&=-4);var h=[e,n,i,d?a:o,d?l:o,d?o:a,d?o:l,c,f,p],g=t.apply(o,h);return wi(e)&&ji(g,h),g.placeholder=r,Mi(g,e,n)}function Zo(e){var n=ke[e];return function(e,t){if(e=ml(e),(t=null==t?0:Et(Al(t),292))&&$n(e)){var r=(El(e)+"e").split("e");return+((r=(El(n(r[0]+"e"+(+r[1]+t)))+"e").split("e"))[0]+"e"+(+r[1]-t))}return n(e)}}var Qo=Bt&&1/ft(new Bt([,-0]))[1]==d?function(e){return new Bt(e)}:fc;function Jo(e){return function(n){var t=Ai(n);return t==x?ct(n):t==I?pt(n):function(e,n){return zn(n,(function(n){return[n,e[n]]}))}(n,e(n))}}function ei(e,n,t,a,d,h,g,v){var A=2&n;if(!A&&"function"!=typeof e)throw new Ie(i);var b=a?a.length:0;if(b||(n&=-97,a=d=o),g=g===o?g:yt(Al(g),0),v=v===o?v:Al(v),b-=d?d.length:0,n&s){var m=a,y=d;a=d=o}var E=A?o:ci(e),_=[e,n,t,a,d,m,y,h,g,v];if(E&&function(e,n){var t=e[1],r=n[1],o=t|r,i=o<131,a=r==f&&8==t||r==f&&t==p&&e[7].length<=n[8]||384==r&&n[7].length<=n[8]&&8==t;if(!i&&!a)return e;1&r&&(e[2]=n[2],o|=1&t?0:4);var c=n[3];if(c){var u=e[3];e[3]=u?Io(u,c,n[4]):c,e[4]=u?st(e[3],l):n[4]}(c=n[5])&&(u=e[5],e[5]=u?To(u,c,n[6]):c,e[6]=u?st(e[5],l):n[6]);(c=n[7])&&(e[7]=c);r&f&&(e[8]=null==e[8]?n[8]:Et(e[8],n[8]));null==e[9]&&(e[9]=n[9]);e[0]=n[0],e[1]=o}(_,E),e=_[0],n=_[1],t=_[2],a=_[3],d=_[4],!(v=_[9]=_[9]===o?A?0:e.length:yt(_[9]-b,0))&&24&n&&(n&=-25),n&&1!=n)C=8==n||n==c?function(e,n,t){var i=Fo(e);return function a(){for(var l=arguments.length,c=r(l),u=l,s=si(a);u--;)c[u]=arguments[u];var f=l<3&&c[0]!==s&&c[l-1]!==s?[]:st(c,s);return(l-=f.length)<t?Xo(e,n,Ho,a.placeholder,o,c,f,o,o,t-l):kn(this&&this!==hn&&this instanceof a?i:e,this,c)}}(e,n,v):n!=u&&33!=n||d.length?Ho.apply(o,_):function(e,n,t,o){var i=1&n,a=Fo(e);return function n(){for(var l=-1,c=arguments.length,u=-1,s=o.length,f=r(s+c),p=this&&this!==hn&&this instanceof n?a:e;++u<s;)f[u]=o[u];for(;c--;)f[u++]=arguments[++l];return kn(p,i?t:this,f)}}(e,n,t,a);else var C=function(e,n,t){var r=1&n,o=Fo(e);return function n(){return(this&&this!==hn&&this instanceof n?o:e).apply(r?t:this,arguments)}}(e,n,t);return Mi((E?to:ji)(C,_),e,n)}function ni(e,n,t,r){return e===o||Ha(e,je[t])&&!Me.call(r,t)?n:e}function ti(e,n,t,r,i,a){return rl(e)&&rl(n)&&(a.set(n,e),Gr(e,n,o,ti,a),a.delete(n)),e}function ri(e){return ll(e)?o:e}function oi(e,n,t,r,i,a){var l=1&t,c=e.length,u=n.length;if(c!=u&&!(l&&u>c))return!1;var s=a.get(e),f=a.get(n);if(s&&f)return s==n&&f==e;var p=-1,d=!0,h=2&t?new Xt:o;for(a.set(e,n),a.set(n,e);++p<c;){var g=e[p],v=n[p];if(r)var A=l?r(v,g,p,n,e,a):r(g,v,p,e,n,a);if(A!==o){if(A)continue;d=!1;break}if(h){if(!Nn(n,(function(e,n){if(!et(h,n)&&(g===e||i(g,e,t,r,a)))return h.push(n)}))){d=!1;break}}else if(g!==v&&!i(g,v,t,r,a)){d=!1;break}}return a.delete(e),a.delete(n),d}function ii(e){return Ri(Bi(e,o,Ki),e+"")}function ai(e){return kr(e,zl,gi)}function li(e){return kr(e,Rl,vi)}var ci=Pt?function(e){return Pt.get(e)}:fc;function ui(e){for(var n=e.name+"",t=jt[n],r=Me.call(jt,n)?t.length:0;r--;){var o=t[r],i=o.func;if(null==i||i==e)return o.name}return n}function si(e){return(Me.call(Wt,"placeholder")?Wt:e).placeholder}function fi(){var e=Wt.iteratee||lc;return e=e===lc?Dr:e,arguments.length?e(arguments[0],arguments[1]):e}function pi(e,n){var t,r,o=e.__data__;return("string"==(r=typeof(t=n))||"number"==r||"symbol"==r||"boolean"==r?"__proto__"!==t:null===t)?o["string"==typeof n?"string":"hash"]:o.map}function di(e){for(var n=zl(e),t=n.length;t--;){var r=n[t],o=e[r];n[t]=[r,o,Si(o)]}return n}function hi(e,n){var t=function(e,n){return null==e?o:e[n]}(e,n);return Mr(t)?t:o}var gi=mn?function(e){return null==e?[]:(e=Se(e),Tn(mn(e),(function(n){return Ye.call(e,n)})))}:bc,vi=mn?function(e){for(var n=[];e;)Rn(n,gi(e)),e=$e(e);return n}:bc,Ai=Sr;function bi(e,n,t){for(var r=-1,o=(n=_o(n,e)).length,i=!1;++r<o;){var a=Fi(n[r]);if(!(i=null!=e&&t(e,a)))break;e=e[a]}return i||++r!=o?i:!!(o=null==e?0:e.length)&&tl(o)&&Ei(a,o)&&($a(e)||Va(e))}function mi(e){return"function"!=typeof e.constructor||ki(e)?{}:Ht($e(e))}function yi(e){return $a(e)||Va(e)||!!(Ze&&e&&e[Ze])}function Ei(e,n){var t=typeof e;return!!(n=null==n?h:n)&&("number"==t||"symbol"!=t&&ye.test(e))&&e>-1&&e%1==0&&e<n}function _i(e,n,t){if(!rl(t))return!1;var r=typeof n;return!!("number"==r?Ya(t)&&Ei(n,t.length):"string"==r&&n in t)&&Ha(t[n],e)}function Ci(e,n){if($a(e))return!1;var t=typeof e;return!("number"!=t&&"symbol"!=t&&"boolean"!=t&&null!=e&&!fl(e))||(te.test(e)||!ne.test(e)||null!=n&&e in Se(n))}function wi(e){var n=ui(e),t=Wt[n];if("function"!=typeof t||!(n in Vt.prototype))return!1;if(e===t)return!0;var r=ci(t);return!!r&&e===r[0]}(kt&&Ai(new kt(new ArrayBuffer(1)))!=R||St&&Ai(new St)!=x||Ot&&Ai(Ot.resolve())!=O||Bt&&Ai(new Bt)!=I||It&&Ai(new It)!=j)&&(Ai=function(e){var n=Sr(e),t=n==S?e.constructor:o,r=t?Ui(t):"";if(r)switch(r){case zt:return R;case Rt:return x;case Mt:return O;case Dt:return I;case Nt:return j}return n});var xi=ze?el:mc;function ki(e){var n=e&&e.constructor;return e===("function"==typeof n&&n.prototype||je)}function Si(e){return e==e&&!rl(e)}function Oi(e,n){return function(t){return null!=t&&(t[e]===n&&(n!==o||e in Se(t)))}}function Bi(e,n,t){return n=yt(n===o?e.length-1:n,0),function(){for(var o=arguments,i=-1,a=yt(o.length-n,0),l=r(a);++i<a;)l[i]=o[n+i];i=-1;for(var c=r(n+1);++i<n;)c[i]=o[i];return c[n]=t(l),kn(e,this,c)}}function Ii(e,n){return n.length<2?e:xr(e,io(n,0,-1))}function Ti(e,n){for(var t=e.length,r=Et(n.length,t),i=Po(e);r--;){var a=n[r];e[r]=Ei(a,t)?i[a]:o}return e}function Pi(e,n){if(("constructor"!==n||"function"!=typeof e[n])&&"__proto__"!=n)return e[n]}var ji=Di(to),zi=gn||function(e,n){return hn.setTimeout(e,n)},Ri=Di(ro);function Mi(e,n,t){var r=n+"";return Ri(e,function(e,n){var t=n.length;if(!t)return e;var r=t-1;return n[r]=(t>1?"& ":"")+n[r],n=n.join(t>2?", ":" "),e.replace(ce,"{\n/* [wrapped with "+n+"] */\n")}(r,function(e,n){return On(A,(function(t){var r="_."+t[0];n&t[1]&&!Pn(e,r)&&e.push(r)})),e.sort()}(function(e){var n=e.match(ue);return n?n[1].split(se):[]}(r),t)))}function Di(e){var n=0,t=0;return function(){var r=_t(),i=16-(r-t);if(t=r,i>0){if(++n>=800)return arguments[0]}else n=0;return e.apply(o,arguments)}}function Ni(e,n){var t=-1,r=e.length,i=r-1;for(n=n===o?r:n;++t<n;){var a=Xr(t,i),l=e[a];e[a]=e[t],e[t]=l}return e.length=n,e}var Li=function(e){var n=Da(e,(function(e){return 500===t.size&&t.clear(),e})),t=n.cache;return n}((function(e){var n=[];return 46===e.charCodeAt(0)&&n.push(""),e.replace(re,(function(e,t,r,o){n.push(r?o.replace(de,"$1"):t||e)})),n}));function Fi(e){if("string"==typeof e||fl(e))return e;var n=e+"";return"0"==n&&1/e==-1/0?"-0":n}function Ui(e){if(null!=e){try{return Re.call(e)}catch(e){}try{return e+""}catch(e){}}return""}function Wi(e){if(e instanceof Vt)return e.clone();var n=new qt(e.__wrapped__,e.__chain__);return n.__actions__=Po(e.__actions__),n.__index__=e.__index__,n.__values__=e.__values__,n}var Hi=Qr((function(e,n){return Xa(e)?dr(e,mr(n,1,Xa,!0)):[]})),Gi=Qr((function(e,n){var t=Ji(n);return Xa(t)&&(t=o),Xa(e)?dr(e,mr(n,1,Xa,!0),fi(t,2)):[]})),qi=Qr((function(e,n){var t=Ji(n);return Xa(t)&&(t=o),Xa(e)?dr(e,mr(n,1,Xa,!0),o,t):[]}));function Vi(e,n,t){var r=null==e?0:e.length;if(!r)return-1;var o=null==t?0:Al(t);return o<0&&(o=yt(r+o,0)),Un(e,fi(n,3),o)}function $i(e,n,t){var r=null==e?0:e.length;if(!r)return-1;var i=r-1;return t!==o&&(i=Al(t),i=t<0?yt(r+i,0):Et(i,r-1)),Un(e,fi(n,3),i,!0)}function Ki(e){return(null==e?0:e.length)?mr(e,1):[]}function Yi(e){return e&&e.length?e[0]:o}var Xi=Qr((function(e){var n=zn(e,yo);return n.length&&n[0]===e[0]?Tr(n):[]})),Zi=Qr((function(e){var n=Ji(e),t=zn(e,yo);return n===Ji(t)?n=o:t.pop(),t.length&&t[0]===e[0]?Tr(t,fi(n,2)):[]})),Qi=Qr((function(e){var n=Ji(e),t=zn(e,yo);return(n="function"==typeof n?n:o)&&t.pop(),t.length&&t[0]===e[0]?Tr(t,o,n):[]}));function Ji(e){var n=null==e?0:e.length;return n?e[n-1]:o}var ea=Qr(na);function na(e,n){return e&&e.length&&n&&n.length?Kr(e,n):e}var ta=ii((function(e,n){var t=null==e?0:e.length,r=cr(e,n);return Yr(e,zn(n,(function(e){return Ei(e,t)?+e:e})).sort(Bo)),r}));function ra(e){return null==e?e:xt.call(e)}var oa=Qr((function(e){return po(mr(e,1,Xa,!0))})),ia=Qr((function(e){var n=Ji(e);return Xa(n)&&(n=o),po(mr(e,1,Xa,!0),fi(n,2))})),aa=Qr((function(e){var n=Ji(e);return n="function"==typeof n?n:o,po(mr(e,1,Xa,!0),o,n)}));function la(e){if(!e||!e.length)return[];var n=0;return e=Tn(e,(function(e){if(Xa(e))return n=yt(e.length,n),!0})),Xn(n,(function(n){return zn(e,Vn(n))}))}function ca(e,n){if(!e||!e.length)return[];var t=la(e);return null==n?t:zn(t,(function(e){return kn(n,o,e)}))}var ua=Qr((function(e,n){return Xa(e)?dr(e,n):[]})),sa=Qr((function(e){return bo(Tn(e,Xa))})),fa=Qr((function(e){var n=Ji(e);return Xa(n)&&(n=o),bo(Tn(e,Xa),fi(n,2))})),pa=Qr((function(e){var n=Ji(e);return n="function"==typeof n?n:o,bo(Tn(e,Xa),o,n)})),da=Qr(la);var ha=Qr((function(e){var n=e.length,t=n>1?e[n-1]:o;return t="function"==typeof t?(e.pop(),t):o,ca(e,t)}));function ga(e){var n=Wt(e);return n.__chain__=!0,n}function va(e,n){return n(e)}var Aa=ii((function(e){var n=e.length,t=n?e[0]:0,r=this.__wrapped__,i=function(n){return cr(n,e)};return!(n>1||this.__actions__.length)&&r instanceof Vt&&Ei(t)?((r=r.slice(t,+t+(n?1:0))).__actions__.push({func:va,args:[i],thisArg:o}),new qt(r,this.__chain__).thru((function(e){return n&&!e.length&&e.push(o),e}))):this.thru(i)}));var ba=zo((function(e,n,t){Me.call(e,t)?++e[t]:lr(e,t,1)}));var ma=Uo(Vi),ya=Uo($i);function Ea(e,n){return($a(e)?On:hr)(e,fi(n,3))}function _a(e,n){return($a(e)?Bn:gr)(e,fi(n,3))}var Ca=zo((function(e,n,t){Me.call(e,t)?e[t].push(n):lr(e,t,[n])}));var wa=Qr((function(e,n,t){var o=-1,i="function"==typeof n,a=Ya(e)?r(e.length):[];return hr(e,(function(e){a[++o]=i?kn(n,e,t):Pr(e,n,t)})),a})),xa=zo((function(e,n,t){lr(e,t,n)}));function ka(e,n){return($a(e)?zn:Ur)(e,fi(n,3))}var Sa=zo((function(e,n,t){e[t?0:1].push(n)}),(function(){return[[],[]]}));var Oa=Qr((function(e,n){if(null==e)return[];var t=n.length;return t>1&&_i(e,n[0],n[1])?n=[]:t>2&&_i(n[0],n[1],n[2])&&(n=[n[0]]),Vr(e,mr(n,1),[])})),Ba=dn||function(){return hn.Date.now()};function Ia(e,n,t){return n=t?o:n,n=e&&null==n?e.length:n,ei(e,f,o,o,o,o,n)}function Ta(e,n){var t;if("function"!=typeof n)throw new Ie(i);return e=Al(e),function(){return--e>0&&(t=n.apply(this,arguments)),e<=1&&(n=o),t}}var Pa=Qr((function(e,n,t){var r=1;if(t.length){var o=st(t,si(Pa));r|=u}return ei(e,r,n,t,o)})),ja=Qr((function(e,n,t){var r=3;if(t.length){var o=st(t,si(ja));r|=u}return ei(n,r,e,t,o)}));function za(e,n,t){var r,a,l,c,u,s,f=0,p=!1,d=!1,h=!0;if("function"!=typeof e)throw new Ie(i);function g(n){var t=r,i=a;return r=a=o,f=n,c=e.apply(i,t)}function v(e){return f=e,u=zi(b,n),p?g(e):c}function A(e){var t=e-s;return s===o||t>=n||t<0||d&&e-f>=l}function b(){var e=Ba();if(A(e))return m(e);u=zi(b,function(e){var t=n-(e-s);return d?Et(t,l-(e-f)):t}(e))}function m(e){return u=o,h&&r?g(e):(r=a=o,c)}function y(){var e=Ba(),t=A(e);if(r=arguments,a=this,s=e,t){if(u===o)return v(s);if(d)return xo(u),u=zi(b,n),g(s)}return u===o&&(u=zi(b,n)),c}return n=ml(n)||0,rl(t)&&(p=!!t.leading,l=(d="maxWait"in t)?yt(ml(t.maxWait)||0,n):l,h="trailing"in t?!!t.trailing:h),y.cancel=function(){u!==o&&xo(u),f=0,r=s=a=u=o},y.flush=function(){return u===o?c:m(Ba())},y}var Ra=Qr((function(e,n){return pr(e,1,n)})),Ma=Qr((function(e,n,t){return pr(e,ml(n)||0,t)}));function Da(e,n){if("function"!=typeof e||null!=n&&"function"!=typeof n)throw new Ie(i);var t=function(){var r=arguments,o=n?n.apply(this,r):r[0],i=t.cache;if(i.has(o))return i.get(o);var a=e.apply(this,r);return t.cache=i.set(o,a)||i,a};return t.cache=new(Da.Cache||Yt),t}function Na(e){if("function"!=typeof e)throw new Ie(i);return function(){var n=arguments;switch(n.length){case 0:return!e.call(this);case 1:return!e.call(this,n[0]);case 2:return!e.call(this,n[0],n[1]);case 3:return!e.call(this,n[0],n[1],n[2])}return!e.apply(this,n)}}Da.Cache=Yt;var La=Co((function(e,n){var t=(n=1==n.length&&$a(n[0])?zn(n[0],Qn(fi())):zn(mr(n,1),Qn(fi()))).length;return Qr((function(r){for(var o=-1,i=Et(r.length,t);++o<i;)r[o]=n[o].call(this,r[o]);return kn(e,this,r)}))})),Fa=Qr((function(e,n){var t=st(n,si(Fa));return ei(e,u,o,n,t)})),Ua=Qr((function(e,n){var t=st(n,si(Ua));return ei(e,s,o,n,t)})),Wa=ii((function(e,n){return ei(e,p,o,o,o,n)}));function Ha(e,n){return e===n||e!=e&&n!=n}var Ga=Yo(Or),qa=Yo((function(e,n){return e>=n})),Va=jr(function(){return arguments}())?jr:function(e){return ol(e)&&Me.call(e,"callee")&&!Ye.call(e,"callee")},$a=r.isArray,Ka=yn?Qn(yn):function(e){return ol(e)&&Sr(e)==z};function Ya(e){return null!=e&&tl(e.length)&&!el(e)}function Xa(e){return ol(e)&&Ya(e)}var Za=Ln||mc,Qa=En?Qn(En):function(e){return ol(e)&&Sr(e)==E};function Ja(e){if(!ol(e))return!1;var n=Sr(e);return n==_||"[object DOMException]"==n||"string"==typeof e.message&&"string"==typeof e.name&&!ll(e)}function el(e){if(!rl(e))return!1;var n=Sr(e);return n==C||n==w||"[object AsyncFunction]"==n||"[object Proxy]"==n}function nl(e){return"number"==typeof e&&e==Al(e)}function tl(e){return"number"==typeof e&&e>-1&&e%1==0&&e<=h}function rl(e){var n=typeof e;return null!=e&&("object"==n||"function"==n)}function ol(e){return null!=e&&"object"==typeof e}var il=_n?Qn(_n):function(e){return ol(e)&&Ai(e)==x};function al(e){return"number"==typeof e||ol(e)&&Sr(e)==k}function ll(e){if(!ol(e)||Sr(e)!=S)return!1;var n=$e(e);if(null===n)return!0;var t=Me.call(n,"constructor")&&n.constructor;return"function"==typeof t&&t instanceof t&&Re.call(t)==Fe}var cl=Cn?Qn(Cn):function(e){return ol(e)&&Sr(e)==B};var ul=wn?Qn(wn):function(e){return ol(e)&&Ai(e)==I};function sl(e){return"string"==typeof e||!$a(e)&&ol(e)&&Sr(e)==T}function fl(e){return"symbol"==typeof e||ol(e)&&Sr(e)==P}var pl=xn?Qn(xn):function(e){return ol(e)&&tl(e.length)&&!!ln[Sr(e)]};var dl=Yo(Fr),hl=Yo((function(e,n){return e<=n}));function gl(e){if(!e)return[];if(Ya(e))return sl(e)?ht(e):Po(e);if(en&&e[en])return function(e){for(var n,t=[];!(n=e.next()).done;)t.push(n.value);return t}(e[en]());var n=Ai(e);return(n==x?ct:n==I?ft:Hl)(e)}function vl(e){return e?(e=ml(e))===d||e===-1/0?17976931348623157e292*(e<0?-1:1):e==e?e:0:0===e?e:0}function Al(e){var n=vl(e),t=n%1;return n==n?t?n-t:n:0}function bl(e){return e?ur(Al(e),0,v):0}function ml(e){if("number"==typeof e)return e;if(fl(e))return g;if(rl(e)){var n="function"==typeof e.valueOf?e.valueOf():e;e=rl(n)?n+"":n}if("string"!=typeof e)return 0===e?e:+e;e=Zn(e);var t=Ae.test(e);return t||me.test(e)?fn(e.slice(2),t?2:8):ve.test(e)?g:+e}function yl(e){return jo(e,Rl(e))}function El(e){return null==e?"":fo(e)}var _l=Ro((function(e,n){if(ki(n)||Ya(n))jo(n,zl(n),e);else for(var t in n)Me.call(n,t)&&rr(e,t,n[t])})),Cl=Ro((function(e,n){jo(n,Rl(n),e)})),wl=Ro((function(e,n,t,r){jo(n,Rl(n),e,r)})),xl=Ro((function(e,n,t,r){jo(n,zl(n),e,r)})),kl=ii(cr);var Sl=Qr((function(e,n){e=Se(e);var t=-1,r=n.length,i=r>2?n[2]:o;for(i&&_i(n[0],n[1],i)&&(r=1);++t<r;)for(var a=n[t],l=Rl(a),c=-1,u=l.length;++c<u;){var s=l[c],f=e[s];(f===o||Ha(f,je[s])&&!Me.call(e,s))&&(e[s]=a[s])}return e})),Ol=Qr((function(e){return e.push(o,ti),kn(Dl,o,e)}));function Bl(e,n,t){var r=null==e?o:xr(e,n);return r===o?t:r}function Il(e,n){return null!=e&&bi(e,n,Ir)}var Tl=Go((function(e,n,t){null!=n&&"function"!=typeof n.toString&&(n=Le.call(n)),e[n]=t}),rc(ac)),Pl=Go((function(e,n,t){null!=n&&"function"!=typeof n.toString&&(n=Le.call(n)),Me.call(e,n)?e[n].push(t):e[n]=[t]}),fi),jl=Qr(Pr);function zl(e){return Ya(e)?Qt(e):Nr(e)}function Rl(e){return Ya(e)?Qt(e,!0):Lr(e)}var Ml=Ro((function(e,n,t){Gr(e,n,t)})),Dl=Ro((function(e,n,t,r){Gr(e,n,t,r)})),Nl=ii((function(e,n){var t={};if(null==e)return t;var r=!1;n=zn(n,(function(n){return n=_o(n,e),r||(r=n.length>1),n})),jo(e,li(e),t),r&&(t=sr(t,7,ri));for(var o=n.length;o--;)ho(t,n[o]);return t}));var Ll=ii((function(e,n){return null==e?{}:function(e,n){return $r(e,n,(function(n,t){return Il(e,t)}))}(e,n)}));function Fl(e,n){if(null==e)return{};var t=zn(li(e),(function(e){return[e]}));return n=fi(n),$r(e,t,(function(e,t){return n(e,t[0])}))}var Ul=Jo(zl),Wl=Jo(Rl);function Hl(e){return null==e?[]:Jn(e,zl(e))}var Gl=Lo((function(e,n,t){return n=n.toLowerCase(),e+(t?ql(n):n)}));function ql(e){return Jl(El(e).toLowerCase())}function Vl(e){return(e=El(e))&&e.replace(Ee,ot).replace(Je,"")}var $l=Lo((function(e,n,t){return e+(t?"-":"")+n.toLowerCase()})),Kl=Lo((function(e,n,t){return e+(t?" ":"")+n.toLowerCase()})),Yl=No("toLowerCase");var Xl=Lo((function(e,n,t){return e+(t?"_":"")+n.toLowerCase()}));var Zl=Lo((function(e,n,t){return e+(t?" ":"")+Jl(n)}));var Ql=Lo((function(e,n,t){return e+(t?" ":"")+n.toUpperCase()})),Jl=No("toUpperCase");function ec(e,n,t){return e=El(e),(n=t?o:n)===o?function(e){return rn.test(e)}(e)?function(e){return e.match(nn)||[]}(e):function(e){return e.match(fe)||[]}(e):e.match(n)||[]}var nc=Qr((function(e,n){try{return kn(e,o,n)}catch(e){return Ja(e)?e:new we(e)}})),tc=ii((function(e,n){return On(n,(function(n){n=Fi(n),lr(e,n,Pa(e[n],e))})),e}));function rc(e){return function(){return e}}var oc=Wo(),ic=Wo(!0);function ac(e){return e}function lc(e){return Dr("function"==typeof e?e:sr(e,1))}var cc=Qr((function(e,n){return function(t){return Pr(t,e,n)}})),uc=Qr((function(e,n){return function(t){return Pr(e,t,n)}}));function sc(e,n,t){var r=zl(n),o=wr(n,r);null!=t||rl(n)&&(o.length||!r.length)||(t=n,n=e,e=this,o=wr(n,zl(n)));var i=!(rl(t)&&"chain"in t&&!t.chain),a=el(e);return On(o,(function(t){var r=n[t];e[t]=r,a&&(e.prototype[t]=function(){var n=this.__chain__;if(i||n){var t=e(this.__wrapped__),o=t.__actions__=Po(this.__actions__);return o.push({func:r,args:arguments,thisArg:e}),t.__chain__=n,t}return r.apply(e,Rn([this.value()],arguments))})})),e}function fc(){}var pc=Vo(zn),dc=Vo(In),hc=Vo(Nn);function gc(e){return Ci(e)?Vn(Fi(e)):function(e){return function(n){return xr(n,e)}}(e)}var vc=Ko(),Ac=Ko(!0);function bc(){return[]}function mc(){return!1}var yc=qo((function(e,n){return e+n}),0),Ec=Zo("ceil"),_c=qo((function(e,n){return e/n}),1),Cc=Zo("floor");var wc,xc=qo((function(e,n){return e*n}),1),kc=Zo("round"),Sc=qo((function(e,n){return e-n}),0);return Wt.after=function(e,n){if("function"!=typeof n)throw new Ie(i);return e=Al(e),function(){if(--e<1)return n.apply(this,arguments)}},Wt.ary=Ia,Wt.assign=_l,Wt.assignIn=Cl,Wt.assignInWith=wl,Wt.assignWith=xl,Wt.at=kl,Wt.before=Ta,Wt.bind=Pa,Wt.bindAll=tc,Wt.bindKey=ja,Wt.castArray=function(){if(!arguments.length)return[];var e=arguments[0];return $a(e)?e:[e]},Wt.chain=ga,Wt.chunk=function(e,n,t){n=(t?_i(e,n,t):n===o)?1:yt(Al(n),0);var i=null==e?0:e.length;if(!i||n<1)return[];for(var a=0,l=0,c=r(vn(i/n));a<i;)c[l++]=io(e,a,a+=n);return c},Wt.compact=function(e){for(var n=-1,t=null==e?0:e.length,r=0,o=[];++n<t;){var i=e[n];i&&(o[r++]=i)}return o},Wt.concat=function(){var e=arguments.length;if(!e)return[];for(var n=r(e-1),t=arguments[0],o=e;o--;)n[o-1]=arguments[o];return Rn($a(t)?Po(t):[t],mr(n,1))},Wt.cond=function(e){var n=null==e?0:e.length,t=fi();return e=n?zn(e,(function(e){if("function"!=typeof e[1])throw new Ie(i);return[t(e[0]),e[1]]})):[],Qr((function(t){for(var r=-1;++r<n;){var o=e[r];if(kn(o[0],this,t))return kn(o[1],this,t)}}))},Wt.conforms=function(e){return function(e){var n=zl(e);return function(t){return fr(t,e,n)}}(sr(e,1))},Wt.constant=rc,Wt.countBy=ba,Wt.create=function(e,n){var t=Ht(e);return null==n?t:ar(t,n)},Wt.curry=function e(n,t,r){var i=ei(n,8,o,o,o,o,o,t=r?o:t);return i.placeholder=e.placeholder,i},Wt.curryRight=function e(n,t,r){var i=ei(n,c,o,o,o,o,o,t=r?o:t);return i.placeholder=e.placeholder,i},Wt.debounce=za,Wt.defaults=Sl,Wt.defaultsDeep=Ol,Wt.defer=Ra,Wt.delay=Ma,Wt.difference=Hi,Wt.differenceBy=Gi,Wt.differenceWith=qi,Wt.drop=function(e,n,t){var r=null==e?0:e.length;return r?io(e,(n=t||n===o?1:Al(n))<0?0:n,r):[]},Wt.dropRight=function(e,n,t){var r=null==e?0:e.length;return r?io(e,0,(n=r-(n=t||n===o?1:Al(n)))<0?0:n):[]},Wt.dropRightWhile=function(e,n){return e&&e.length?vo(e,fi(n,3),!0,!0):[]},Wt.dropWhile=function(e,n){return e&&e.length?vo(e,fi(n,3),!0):[]},Wt.fill=function(e,n,t,r){var i=null==e?0:e.length;return i?(t&&"number"!=typeof t&&_i(e,n,t)&&(t=0,r=i),function(e,n,t,r){var i=e.length;for((t=Al(t))<0&&(t=-t>i?0:i+t),(r=r===o||r>i?i:Al(r))<0&&(r+=i),r=t>r?0:bl(r);t<r;)e[t++]=n;return e}(e,n,t,r)):[]},Wt.filter=function(e,n){return($a(e)?Tn:br)(e,fi(n,3))},Wt.flatMap=function(e,n){return mr(ka(e,n),1)},Wt.flatMapDeep=function(e,n){return mr(ka(e,n),d)},Wt.flatMapDepth=function(e,n,t){return t=t===o?1:Al(t),mr(ka(e,n),t)},Wt.flatten=Ki,Wt.flattenDeep=function(e){return(null==e?0:e.length)?mr(e,d):[]},Wt.flattenDepth=function(e,n){return(null==e?0:e.length)?mr(e,n=n===o?1:Al(n)):[]},Wt.flip=function(e){return ei(e,512)},Wt.flow=oc,Wt.flowRight=ic,Wt.fromPairs=function(e){for(var n=-1,t=null==e?0:e.length,r={};++n<t;){var o=e[n];r[o[0]]=o[1]}return r},Wt.functions=function(e){return null==e?[]:wr(e,zl(e))},Wt.functionsIn=function(e){return null==e?[]:wr(e,Rl(e))},Wt.groupBy=Ca,Wt.initial=function(e){return(null==e?0:e.length)?io(e,0,-1):[]},Wt.intersection=Xi,Wt.intersectionBy=Zi,Wt.intersectionWith=Qi,Wt.invert=Tl,Wt.invertBy=Pl,Wt.invokeMap=wa,Wt.iteratee=lc,Wt.keyBy=xa,Wt.keys=zl,Wt.keysIn=Rl,Wt.map=ka,Wt.mapKeys=function(e,n){var t={};return n=fi(n,3),_r(e,(function(e,r,o){lr(t,n(e,r,o),e)})),t},Wt.mapValues=function(e,n){var t={};return n=fi(n,3),_r(e,(function(e,r,o){lr(t,r,n(e,r,o))})),t},Wt.matches=function(e){return Wr(sr(e,1))},Wt.matchesProperty=function(e,n){return Hr(e,sr(n,1))},Wt.memoize=Da,Wt.merge=Ml,Wt.mergeWith=Dl,Wt.method=cc,Wt.methodOf=uc,Wt.mixin=sc,Wt.negate=Na,Wt.nthArg=function(e){return e=Al(e),Qr((function(n){return qr(n,e)}))},Wt.omit=Nl,Wt.omitBy=function(e,n){return Fl(e,Na(fi(n)))},Wt.once=function(e){return Ta(2,e)},Wt.orderBy=function(e,n,t,r){return null==e?[]:($a(n)||(n=null==n?[]:[n]),$a(t=r?o:t)||(t=null==t?[]:[t]),Vr(e,n,t))},Wt.over=pc,Wt.overArgs=La,Wt.overEvery=dc,Wt.overSome=hc,Wt.partial=Fa,Wt.partialRight=Ua,Wt.partition=Sa,Wt.pick=Ll,Wt.pickBy=Fl,Wt.property=gc,Wt.propertyOf=function(e){return function(n){return null==e?o:xr(e,n)}},Wt.pull=ea,Wt.pullAll=na,Wt.pullAllBy=function(e,n,t){return e&&e.length&&n&&n.length?Kr(e,n,fi(t,2)):e},Wt.pullAllWith=function(e,n,t){return e&&e.length&&n&&n.length?Kr(e,n,o,t):e},Wt.pullAt=ta,Wt.range=vc,Wt.rangeRight=Ac,Wt.rearg=Wa,Wt.reject=function(e,n){return($a(e)?Tn:br)(e,Na(fi(n,3)))},Wt.remove=function(e,n){var t=[];if(!e||!e.length)return t;var r=-1,o=[],i=e.length;for(n=fi(n,3);++r<i;){var a=e[r];n(a,r,e)&&(t.push(a),o.push(r))}return Yr(e,o),t},Wt.rest=function(e,n){if("function"!=typeof e)throw new Ie(i);return Qr(e,n=n===o?n:Al(n))},Wt.reverse=ra,Wt.sampleSize=function(e,n,t){return n=(t?_i(e,n,t):n===o)?1:Al(n),($a(e)?er:eo)(e,n)},Wt.set=function(e,n,t){return null==e?e:no(e,n,t)},Wt.setWith=function(e,n,t,r){return r="function"==typeof r?r:o,null==e?e:no(e,n,t,r)},Wt.shuffle=function(e){return($a(e)?nr:oo)(e)},Wt.slice=function(e,n,t){var r=null==e?0:e.length;return r?(t&&"number"!=typeof t&&_i(e,n,t)?(n=0,t=r):(n=null==n?0:Al(n),t=t===o?r:Al(t)),io(e,n,t)):[]},Wt.sortBy=Oa,Wt.sortedUniq=function(e){return e&&e.length?uo(e):[]},Wt.sortedUniqBy=function(e,n){return e&&e.length?uo(e,fi(n,2)):[]},Wt.split=function(e,n,t){return t&&"number"!=typeof t&&_i(e,n,t)&&(n=t=o),(t=t===o?v:t>>>0)?(e=El(e))&&("string"==typeof n||null!=n&&!cl(n))&&!(n=fo(n))&&lt(e)?wo(ht(e),0,t):e.split(n,t):[]},Wt.spread=function(e,n){if("function"!=typeof e)throw new Ie(i);return n=null==n?0:yt(Al(n),0),Qr((function(t){var r=t[n],o=wo(t,0,n);return r&&Rn(o,r),kn(e,this,o)}))},Wt.tail=function(e){var n=null==e?0:e.length;return n?io(e,1,n):[]},Wt.take=function(e,n,t){return e&&e.length?io(e,0,(n=t||n===o?1:Al(n))<0?0:n):[]},Wt.takeRight=function(e,n,t){var r=null==e?0:e.length;return r?io(e,(n=r-(n=t||n===o?1:Al(n)))<0?0:n,r):[]},Wt.takeRightWhile=function(e,n){return e&&e.length?vo(e,fi(n,3),!1,!0):[]},Wt.takeWhile=function(e,n){return e&&e.length?vo(e,fi(n,3)):[]},Wt.tap=function(e,n){return n(e),e},Wt.throttle=function(e,n,t){var r=!0,o=!0;if("function"!=typeof e)throw new Ie(i);return rl(t)&&(r="leading"in t?!!t.leading:r,o="trailing"in t?!!t.trailing:o),za(e,n,{leading:r,maxWait:n,trailing:o})},Wt.thru=va,Wt.toArray=gl,Wt.toPairs=Ul,Wt.toPairsIn=Wl,Wt.toPath=function(e){return $a(e)?zn(e,Fi):fl(e)?[e]:Po(Li(El(e)))},Wt.toPlainObject=yl,Wt.transform=function(e,n,t){var r=$a(e),o=r||Za(e)||pl(e);if(n=fi(n,4),null==t){var i=e&&e.constructor;t=o?r?new i:[]:rl(e)&&el(i)?Ht($e(e)):{}}return(o?On:_r)(e,(function(e,r,o){return n(t,e,r,o)})),t},Wt.unary=function(e){return Ia(e,1)},Wt.union=oa,Wt.unionBy=ia,Wt.unionWith=aa,Wt.uniq=function(e){return e&&e.length?po(e):[]},Wt.uniqBy=function(e,n){return e&&e.length?po(e,fi(n,2)):[]},Wt.uniqWith=function(e,n){return n="function"==typeof n?n:o,e&&e.length?po(e,o,n):[]},Wt.unset=function(e,n){return null==e||ho(e,n)},Wt.unzip=la,Wt.unzipWith=ca,Wt.update=function(e,n,t){return null==e?e:go(e,n,Eo(t))},Wt.updateWith=function(e,n,t,r){return r="function"==typeof r?r:o,null==e?e:go(e,n,Eo(t),r)},Wt.values=Hl,Wt.valuesIn=function(e){return null==e?[]:Jn(e,Rl(e))},Wt.without=ua,Wt.words=ec,Wt.wrap=function(e,n){return Fa(Eo(n),e)},Wt.xor=sa,Wt.xorBy=fa,Wt.xorWith=pa,Wt.zip=da,Wt.zipObject=function(e,n){return mo(e||[],n||[],rr)},Wt.zipObjectDeep=function(e,n){return mo(e||[],n||[],no)},Wt.zipWith=ha,Wt.entries=Ul,Wt.entriesIn=Wl,Wt.extend=Cl,Wt.extendWith=wl,sc(Wt,Wt),Wt.add=yc,Wt.attempt=nc,Wt.camelCase=Gl,Wt.capitalize=ql,Wt.ceil=Ec,Wt.clamp=function(e,n,t){return t===o&&(t=n,n=o),t!==o&&(t=(t=ml(t))==t?t:0),n!==o&&(n=(n=ml(n))==n?n:0),ur(ml(e),n,t)},Wt.clone=function(e){return sr(e,4)},Wt.cloneDeep=function(e){return sr(e,5)},Wt.cloneDeepWith=function(e,n){return sr(e,5,n="function"==typeof n?n:o)},Wt.cloneWith=function(e,n){return sr(e,4,n="function"==typeof n?n:o)},Wt.conformsTo=function(e,n){return null==n||fr(e,n,zl(n))},Wt.deburr=Vl,Wt.defaultTo=function(e,n){return null==e||e!=e?n:e},Wt.divide=_c,Wt.endsWith=function(e,n,t){e=El(e),n=fo(n);var r=e.length,i=t=t===o?r:ur(Al(t),0,r);return(t-=n.length)>=0&&e.slice(t,i)==n},Wt.eq=Ha,Wt.escape=function(e){return(e=El(e))&&Z.test(e)?e.replace(Y,it):e},Wt.escapeRegExp=function(e){return(e=El(e))&&ie.test(e)?e.replace(oe,"\\$&"):e},Wt.every=function(e,n,t){var r=$a(e)?In:vr;return t&&_i(e,n,t)&&(n=o),r(e,fi(n,3))},Wt.find=ma,Wt.findIndex=Vi,Wt.findKey=function(e,n){return Fn(e,fi(n,3),_r)},Wt.findLast=ya,Wt.findLastIndex=$i,Wt.findLastKey=function(e,n){return Fn(e,fi(n,3),Cr)},Wt.floor=Cc,Wt.forEach=Ea,Wt.forEachRight=_a,Wt.forIn=function(e,n){return null==e?e:yr(e,fi(n,3),Rl)},Wt.forInRight=function(e,n){return null==e?e:Er(e,fi(n,3),Rl)},Wt.forOwn=function(e,n){return e&&_r(e,fi(n,3))},Wt.forOwnRight=function(e,n){return e&&Cr(e,fi(n,3))},Wt.get=Bl,Wt.gt=Ga,Wt.gte=qa,Wt.has=function(e,n){return null!=e&&bi(e,n,Br)},Wt.hasIn=Il,Wt.head=Yi,Wt.identity=ac,Wt.includes=function(e,n,t,r){e=Ya(e)?e:Hl(e),t=t&&!r?Al(t):0;var o=e.length;return t<0&&(t=yt(o+t,0)),sl(e)?t<=o&&e.indexOf(n,t)>-1:!!o&&Wn(e,n,t)>-1},Wt.indexOf=function(e,n,t){var r=null==e?0:e.length;if(!r)return-1;var o=null==t?0:Al(t);return o<0&&(o=yt(r+o,0)),Wn(e,n,o)},Wt.inRange=function(e,n,t){return n=vl(n),t===o?(t=n,n=0):t=vl(t),function(e,n,t){return e>=Et(n,t)&&e<yt(n,t)}(e=ml(e),n,t)},Wt.invoke=jl,Wt.isArguments=Va,Wt.isArray=$a,Wt.isArrayBuffer=Ka,Wt.isArrayLike=Ya,Wt.isArrayLikeObject=Xa,Wt.isBoolean=function(e){return!0===e||!1===e||ol(e)&&Sr(e)==y},Wt.isBuffer=Za,Wt.isDate=Qa,Wt.isElement=function(e){return ol(e)&&1===e.nodeType&&!ll(e)},Wt.isEmpty=function(e){if(null==e)return!0;if(Ya(e)&&($a(e)||"string"==typeof e||"function"==typeof e.splice||Za(e)||pl(e)||Va(e)))return!e.length;var n=Ai(e);if(n==x||n==I)return!e.size;if(ki(e))return!Nr(e).length;for(var t in e)if(Me.call(e,t))return!1;return!0},Wt.isEqual=function(e,n){return zr(e,n)},Wt.isEqualWith=function(e,n,t){var r=(t="function"==typeof t?t:o)?t(e,n):o;return r===o?zr(e,n,o,t):!!r},Wt.isError=Ja,Wt.isFinite=function(e){return"number"==typeof e&&$n(e)},Wt.isFunction=el,Wt.isInteger=nl,Wt.isLength=tl,Wt.isMap=il,Wt.isMatch=function(e,n){return e===n||Rr(e,n,di(n))},Wt.isMatchWith=function(e,n,t){return t="function"==typeof t?t:o,Rr(e,n,di(n),t)},Wt.isNaN=function(e){return al(e)&&e!=+e},Wt.isNative=function(e){if(xi(e))throw new we("Unsupported core-js use. Try https://npms.io/search?q=ponyfill.");return Mr(e)},Wt.isNil=function(e){return null==e},Wt.isNull=function(e){return null===e},Wt.isNumber=al,Wt.isObject=rl,Wt.isObjectLike=ol,Wt.isPlainObject=ll,Wt.isRegExp=cl,Wt.isSafeInteger=function(e){return nl(e)&&e>=-9007199254740991&&e<=h},Wt.isSet=ul,Wt.isString=sl,Wt.isSymbol=fl,Wt.isTypedArray=pl,Wt.isUndefined=function(e){return e===o},Wt.isWeakMap=function(e){return ol(e)&&Ai(e)==j},Wt.isWeakSet=function(e){return ol(e)&&"[object WeakSet]"==Sr(e)},Wt.join=function(e,n){return null==e?"":bt.call(e,n)},Wt.kebabCase=$l,Wt.last=Ji,Wt.lastIndexOf=function(e,n,t){var r=null==e?0:e.length;if(!r)return-1;var i=r;return t!==o&&(i=(i=Al(t))<0?yt(r+i,0):Et(i,r-1)),n==n?function(e,n,t){for(var r=t+1;r--;)if(e[r]===n)return r;return r}(e,n,i):Un(e,Gn,i,!0)},Wt.lowerCase=Kl,Wt.lowerFirst=Yl,Wt.lt=dl,Wt.lte=hl,Wt.max=function(e){return e&&e.length?Ar(e,ac,Or):o},Wt.maxBy=function(e,n){return e&&e.length?Ar(e,fi(n,2),Or):o},Wt.mean=function(e){return qn(e,ac)},Wt.meanBy=function(e,n){return qn(e,fi(n,2))},Wt.min=function(e){return e&&e.length?Ar(e,ac,Fr):o},Wt.minBy=function(e,n){return e&&e.length?Ar(e,fi(n,2),Fr):o},Wt.stubArray=bc,Wt.stubFalse=mc,Wt.stubObject=function(){return{}},Wt.stubString=function(){return""},Wt.stubTrue=function(){return!0},Wt.multiply=xc,Wt.nth=function(e,n){return e&&e.length?qr(e,Al(n)):o},Wt.noConflict=function(){return hn._===this&&(hn._=Ue),this},Wt.noop=fc,Wt.now=Ba,Wt.pad=function(e,n,t){e=El(e);var r=(n=Al(n))?dt(e):0;if(!n||r>=n)return e;var o=(n-r)/2;return $o(bn(o),t)+e+$o(vn(o),t)},Wt.padEnd=function(e,n,t){e=El(e);var r=(n=Al(n))?dt(e):0;return n&&r<n?e+$o(n-r,t):e},Wt.padStart=function(e,n,t){e=El(e);var r=(n=Al(n))?dt(e):0;return n&&r<n?$o(n-r,t)+e:e},Wt.parseInt=function(e,n,t){return t||null==n?n=0:n&&(n=+n),Ct(El(e).replace(ae,""),n||0)},Wt.random=function(e,n,t){if(t&&"boolean"!=typeof t&&_i(e,n,t)&&(n=t=o),t===o&&("boolean"==typeof n?(t=n,n=o):"boolean"==typeof e&&(t=e,e=o)),e===o&&n===o?(e=0,n=1):(e=vl(e),n===o?(n=e,e=0):n=vl(n)),e>n){var r=e;e=n,n=r}if(t||e%1||n%1){var i=wt();return Et(e+i*(n-e+sn("1e-"+((i+"").length-1))),n)}return Xr(e,n)},Wt.reduce=function(e,n,t){var r=$a(e)?Mn:Kn,o=arguments.length<3;return r(e,fi(n,4),t,o,hr)},Wt.reduceRight=function(e,n,t){var r=$a(e)?Dn:Kn,o=arguments.length<3;return r(e,fi(n,4),t,o,gr)},Wt.repeat=function(e,n,t){return n=(t?_i(e,n,t):n===o)?1:Al(n),Zr(El(e),n)},Wt.replace=function(){var e=arguments,n=El(e[0]);return e.length<3?n:n.replace(e[1],e[2])},Wt.result=function(e,n,t){var r=-1,i=(n=_o(n,e)).length;for(i||(i=1,e=o);++r<i;){var a=null==e?o:e[Fi(n[r])];a===o&&(r=i,a=t),e=el(a)?a.call(e):a}return e},Wt.round=kc,Wt.runInContext=e,Wt.sample=function(e){return($a(e)?Jt:Jr)(e)},Wt.size=function(e){if(null==e)return 0;if(Ya(e))return sl(e)?dt(e):e.length;var n=Ai(e);return n==x||n==I?e.size:Nr(e).length},Wt.snakeCase=Xl,Wt.some=function(e,n,t){var r=$a(e)?Nn:ao;return t&&_i(e,n,t)&&(n=o),r(e,fi(n,3))},Wt.sortedIndex=function(e,n){return lo(e,n)},Wt.sortedIndexBy=function(e,n,t){return co(e,n,fi(t,2))},Wt.sortedIndexOf=function(e,n){var t=null==e?0:e.length;if(t){var r=lo(e,n);if(r<t&&Ha(e[r],n))return r}return-1},Wt.sortedLastIndex=function(e,n){return lo(e,n,!0)},Wt.sortedLastIndexBy=function(e,n,t){return co(e,n,fi(t,2),!0)},Wt.sortedLastIndexOf=function(e,n){if(null==e?0:e.length){var t=lo(e,n,!0)-1;if(Ha(e[t],n))return t}return-1},Wt.startCase=Zl,Wt.startsWith=function(e,n,t){return e=El(e),t=null==t?0:ur(Al(t),0,e.length),n=fo(n),e.slice(t,t+n.length)==n},Wt.subtract=Sc,Wt.sum=function(e){return e&&e.length?Yn(e,ac):0},Wt.sumBy=function(e,n){return e&&e.length?Yn(e,fi(n,2)):0},Wt.template=function(e,n,t){var r=Wt.templateSettings;t&&_i(e,n,t)&&(n=o),e=El(e),n=wl({},n,r,ni);var i,a,l=wl({},n.imports,r.imports,ni),c=zl(l),u=Jn(l,c),s=0,f=n.interpolate||_e,p="__p += '",d=Oe((n.escape||_e).source+"|"+f.source+"|"+(f===ee?he:_e).source+"|"+(n.evaluate||_e).source+"|$","g"),h="//# sourceURL="+(Me.call(n,"sourceURL")?(n.sourceURL+"").replace(/\s/g," "):"lodash.templateSources["+ ++an+"]")+"\n";e.replace(d,(function(n,t,r,o,l,c){return r||(r=o),p+=e.slice(s,c).replace(Ce,at),t&&(i=!0,p+="' +\n__e("+t+") +\n'"),l&&(a=!0,p+="';\n"+l+";\n__p += '"),r&&(p+="' +\n((__t = ("+r+")) == null ? '' : __t) +\n'"),s=c+n.length,n})),p+="';\n";var g=Me.call(n,"variable")&&n.variable;if(g){if(pe.test(g))throw new we("Invalid `variable` option passed into `_.template`")}else p="with (obj) {\n"+p+"\n}\n";p=(a?p.replace(q,""):p).replace(V,"$1").replace($,"$1;"),p="function("+(g||"obj")+") {\n"+(g?"":"obj || (obj = {});\n")+"var __t, __p = ''"+(i?", __e = _.escape":"")+(a?", __j = Array.prototype.join;\nfunction print() { __p += __j.call(arguments, '') }\n":";\n")+p+"return __p\n}";var v=nc((function(){return xe(c,h+"return "+p).apply(o,u)}));if(v.source=p,Ja(v))throw v;return v},Wt.times=function(e,n){if((e=Al(e))<1||e>h)return[];var t=v,r=Et(e,v);n=fi(n),e-=v;for(var o=Xn(r,n);++t<e;)n(t);return o},Wt.toFinite=vl,Wt.toInteger=Al,Wt.toLength=bl,Wt.toLower=function(e){return El(e).toLowerCase()},Wt.toNumber=ml,Wt.toSafeInteger=function(e){return e?ur(Al(e),-9007199254740991,h):0===e?e:0},Wt.toString=El,Wt.toUpper=function(e){return El(e).toUpperCase()},Wt.trim=function(e,n,t){if((e=El(e))&&(t||n===o))return Zn(e);if(!e||!(n=fo(n)))return e;var r=ht(e),i=ht(n);return wo(r,nt(r,i),tt(r,i)+1).join("")},Wt.trimEnd=function(e,n,t){if((e=El(e))&&(t||n===o))return e.slice(0,gt(e)+1);if(!e||!(n=fo(n)))return e;var r=ht(e);return wo(r,0,tt(r,ht(n))+1).join("")},Wt.trimStart=function(e,n,t){if((e=El(e))&&(t||n===o))return e.replace(ae,"");if(!e||!(n=fo(n)))return e;var r=ht(e);return wo(r,nt(r,ht(n))).join("")},Wt.truncate=function(e,n){var t=30,r="...";if(rl(n)){var i="separator"in n?n.separator:i;t="length"in n?Al(n.length):t,r="omission"in n?fo(n.omission):r}var a=(e=El(e)).length;if(lt(e)){var l=ht(e);a=l.length}if(t>=a)return e;var c=t-dt(r);if(c<1)return r;var u=l?wo(l,0,c).join(""):e.slice(0,c);if(i===o)return u+r;if(l&&(c+=u.length-c),cl(i)){if(e.slice(c).search(i)){var s,f=u;for(i.global||(i=Oe(i.source,El(ge.exec(i))+"g")),i.lastIndex=0;s=i.exec(f);)var p=s.index;u=u.slice(0,p===o?c:p)}}else if(e.indexOf(fo(i),c)!=c){var d=u.lastIndexOf(i);d>-1&&(u=u.slice(0,d))}return u+r},Wt.unescape=function(e){return(e=El(e))&&X.test(e)?e.replace(K,vt):e},Wt.uniqueId=function(e){var n=++De;return El(e)+n},Wt.upperCase=Ql,Wt.upperFirst=Jl,Wt.each=Ea,Wt.eachRight=_a,Wt.first=Yi,sc(Wt,(wc={},_r(Wt,(function(e,n){Me.call(Wt.prototype,n)||(wc[n]=e)})),wc),{chain:!1}),Wt.VERSION="4.17.21",On(["bind","bindKey","curry","curryRight","partial","partialRight"],(function(e){Wt[e].placeholder=Wt})),On(["drop","take"],(function(e,n){Vt.prototype[e]=function(t){t=t===o?1:yt(Al(t),0);var r=this.__filtered__&&!n?new Vt(this):this.clone();return r.__filtered__?r.__takeCount__=Et(t,r.__takeCount__):r.__views__.push({size:Et(t,v),type:e+(r.__dir__<0?"Right":"")}),r},Vt.prototype[e+"Right"]=function(n){return this.reverse()[e](n).reverse()}})),On(["filter","map","takeWhile"],(function(e,n){var t=n+1,r=1==t||3==t;Vt.prototype[e]=function(e){var n=this.clone();return n.__iteratees__.push({iteratee:fi(e,3),type:t}),n.__filtered__=n.__filtered__||r,n}})),On(["head","last"],(function(e,n){var t="take"+(n?"Right":"");Vt.prototype[e]=function(){return this[t](1).value()[0]}})),On(["initial","tail"],(function(e,n){var t="drop"+(n?"":"Right");Vt.prototype[e]=function(){return this.__filtered__?new Vt(this):this[t](1)}})),Vt.prototype.compact=function(){return this.filter(ac)},Vt.prototype.find=function(e){return this.filter(e).head()},Vt.prototype.findLast=function(e){return this.reverse().find(e)},Vt.prototype.invokeMap=Qr((function(e,n){return"function"==typeof e?new Vt(this):this.map((function(t){return Pr(t,e,n)}))})),Vt.prototype.reject=function(e){return this.filter(Na(fi(e)))},Vt.prototype.slice=function(e,n){e=Al(e);var t=this;return t.__filtered__&&(e>0||n<0)?new Vt(t):(e<0?t=t.takeRight(-e):e&&(t=t.drop(e)),n!==o&&(t=(n=Al(n))<0?t.dropRight(-n):t.take(n-e)),t)},Vt.prototype.takeRightWhile=function(e){return this.reverse().takeWhile(e).reverse()},Vt.prototype.toArray=function(){return this.take(v)},_r(Vt.prototype,(function(e,n){var t=/^(?:filter|find|map|reject)|While$/.test(n),r=/^(?:head|last)$/.test(n),i=Wt[r?"take"+("last"==n?"Right":""):n],a=r||/^find/.test(n);i&&(Wt.prototype[n]=function(){var n=this.__wrapped__,l=r?[1]:arguments,c=n instanceof Vt,u=l[0],s=c||$a(n),f=function(e){var n=i.apply(Wt,Rn([e],l));return r&&p?n[0]:n};s&&t&&"function"==typeof u&&1!=u.length&&(c=s=!1);var p=this.__chain__,d=!!this.__actions__.length,h=a&&!p,g=c&&!d;if(!a&&s){n=g?n:new Vt(this);var v=e.apply(n,l);return v.__actions__.push({func:va,args:[f],thisArg:o}),new qt(v,p)}return h&&g?e.apply(this,l):(v=this.thru(f),h?r?v.value()[0]:v.value():v)})})),On(["pop","push","shift","sort","splice","unshift"],(function(e){var n=Te[e],t=/^(?:push|sort|unshift)$/.test(e)?"tap":"thru",r=/^(?:pop|shift)$/.test(e);Wt.prototype[e]=function(){var e=arguments;if(r&&!this.__chain__){var o=this.value();return n.apply($a(o)?o:[],e)}return this[t]((function(t){return n.apply($a(t)?t:[],e)}))}})),_r(Vt.prototype,(function(e,n){var t=Wt[n];if(t){var r=t.name+"";Me.call(jt,r)||(jt[r]=[]),jt[r].push({name:n,func:t})}})),jt[Ho(o,2).name]=[{name:"wrapper",func:o}],Vt.prototype.clone=function(){var e=new Vt(this.__wrapped__);return e.__actions__=Po(this.__actions__),e.__dir__=this.__dir__,e.__filtered__=this.__filtered__,e.__iteratees__=Po(this.__iteratees__),e.__takeCount__=this.__takeCount__,e.__views__=Po(this.__views__),e},Vt.prototype.reverse=function(){if(this.__filtered__){var e=new Vt(this);e.__dir__=-1,e.__filtered__=!0}else(e=this.clone()).__dir__*=-1;return e},Vt.prototype.value=function(){var e=this.__wrapped__.value(),n=this.__dir__,t=$a(e),r=n<0,o=t?e.length:0,i=function(e,n,t){var r=-1,o=t.length;for(;++r<o;){var i=t[r],a=i.size;switch(i.type){case"drop":e+=a;break;case"dropRight":n-=a;break;case"take":n=Et(n,e+a);break;case"takeRight":e=yt(e,n-a)}}return{start:e,end:n}}(0,o,this.__views__),a=i.start,l=i.end,c=l-a,u=r?l:a-1,s=this.__iteratees__,f=s.length,p=0,d=Et(c,this.__takeCount__);if(!t||!r&&o==c&&d==c)return Ao(e,this.__actions__);var h=[];e:for(;c--&&p<d;){for(var g=-1,v=e[u+=n];++g<f;){var A=s[g],b=A.iteratee,m=A.type,y=b(v);if(2==m)v=y;else if(!y){if(1==m)continue e;break e}}h[p++]=v}return h},Wt.prototype.at=Aa,Wt.prototype.chain=function(){return ga(this)},Wt.prototype.commit=function(){return new qt(this.value(),this.__chain__)},Wt.prototype.next=function(){this.__values__===o&&(this.__values__=gl(this.value()));var e=this.__index__>=this.__values__.length;return{done:e,value:e?o:this.__values__[this.__index__++]}},Wt.prototype.plant=function(e){for(var n,t=this;t instanceof Gt;){var r=Wi(t);r.__index__=0,r.__values__=o,n?i.__wrapped__=r:n=r;var i=r;t=t.__wrapped__}return i.__wrapped__=e,n},Wt.prototype.reverse=function(){var e=this.__wrapped__;if(e instanceof Vt){var n=e;return this.__actions__.length&&(n=new Vt(this)),(n=n.reverse()).__actions__.push({func:va,args:[ra],thisArg:o}),new qt(n,this.__chain__)}return this.thru(ra)},Wt.prototype.toJSON=Wt.prototype.valueOf=Wt.prototype.value=function(){return Ao(this.__wrapped__,this.__actions__)},Wt.prototype.first=Wt.prototype.head,en&&(Wt.prototype[en]=function(){return this}),Wt}();hn._=At,(r=function(){return At}.call(n,t,n,e))===o||(e.exports=r)}.call(this)},7418:e=>{"use strict";
+/*
+object-assign
+(c) Sindre Sorhus
+@license MIT
+*/var n=Object.getOwnPropertySymbols,t=Object.prototype.hasOwnProperty,r=Object.prototype.propertyIsEnumerable;function o(e){if(null==e)throw new TypeError("Object.assign cannot be called with null or undefined");return Object(e)}e.exports=function(){try{if(!Object.assign)return!1;var e=new String("abc");if(e[5]="de","5"===Object.getOwnPropertyNames(e)[0])return!1;for(var n={},t=0;t<10;t++)n["_"+String.fromCharCode(t)]=t;if("0123456789"!==Object.getOwnPropertyNames(n).map((function(e){return n[e]})).join(""))return!1;var r={};return"abcdefghijklmnopqrst".split("").forEach((function(e){r[e]=e})),"abcdefghijklmnopqrst"===Object.keys(Object.assign({},r)).join("")}catch(e){return!1}}()?Object.assign:function(e,i){for(var a,l,c=o(e),u=1;u<arguments.length;u++){for(var s in a=Object(arguments[u]))t.call(a,s)&&(c[s]=a[s]);if(n){l=n(a);for(var f=0;f<l.length;f++)r.call(a,l[f])&&(c[l[f]]=a[l[f]])}}return c}},631:(e,n,t)=>{var r="function"==typeof Map&&Map.prototype,o=Object.getOwnPropertyDescriptor&&r?Object.getOwnPropertyDescriptor(Map.prototype,"size"):null,i=r&&o&&"function"==typeof o.get?o.get:null,a=r&&Map.prototype.forEach,l="function"==typeof Set&&Set.prototype,c=Object.getOwnPropertyDescriptor&&l?Object.getOwnPropertyDescriptor(Set.prototype,"size"):null,u=l&&c&&"function"==typeof c.get?c.get:null,s=l&&Set.prototype.forEach,f="function"==typeof WeakMap&&WeakMap.prototype?WeakMap.prototype.has:null,p="function"==typeof WeakSet&&WeakSet.prototype?WeakSet.prototype.has:null,d="function"==typeof WeakRef&&WeakRef.prototype?WeakRef.prototype.deref:null,h=Boolean.prototype.valueOf,g=Object.prototype.toString,v=Function.prototype.toString,A=String.prototype.match,b="function"==typeof BigInt?BigInt.prototype.valueOf:null,m=Object.getOwnPropertySymbols,y="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?Symbol.prototype.toString:null,E="function"==typeof Symbol&&"object"==typeof Symbol.iterator,_=Object.prototype.propertyIsEnumerable,C=("function"==typeof Reflect?Reflect.getPrototypeOf:Object.getPrototypeOf)||([].__proto__===Array.prototype?function(e){return e.__proto__}:null),w=t(4654).custom,x=w&&I(w)?w:null,k="function"==typeof Symbol&&void 0!==Symbol.toStringTag?Symbol.toStringTag:null;function S(e,n,t){var r="double"===(t.quoteStyle||n)?'"':"'";return r+e+r}function O(e){return String(e).replace(/"/g,"&quot;")}function B(e){return!("[object Array]"!==j(e)||k&&"object"==typeof e&&k in e)}function I(e){if(E)return e&&"object"==typeof e&&e instanceof Symbol;if("symbol"==typeof e)return!0;if(!e||"object"!=typeof e||!y)return!1;try{return y.call(e),!0}catch(e){}return!1}e.exports=function e(n,t,r,o){var l=t||{};if(P(l,"quoteStyle")&&"single"!==l.quoteStyle&&"double"!==l.quoteStyle)throw new TypeError('option "quoteStyle" must be "single" or "double"');if(P(l,"maxStringLength")&&("number"==typeof l.maxStringLength?l.maxStringLength<0&&l.maxStringLength!==1/0:null!==l.maxStringLength))throw new TypeError('option "maxStringLength", if provided, must be a positive integer, Infinity, or `null`');var c=!P(l,"customInspect")||l.customInspect;if("boolean"!=typeof c&&"symbol"!==c)throw new TypeError("option \"customInspect\", if provided, must be `true`, `false`, or `'symbol'`");if(P(l,"indent")&&null!==l.indent&&"\t"!==l.indent&&!(parseInt(l.indent,10)===l.indent&&l.indent>0))throw new TypeError('options "indent" must be "\\t", an integer > 0, or `null`');if(void 0===n)return"undefined";if(null===n)return"null";if("boolean"==typeof n)return n?"true":"false";if("string"==typeof n)return R(n,l);if("number"==typeof n)return 0===n?1/0/n>0?"0":"-0":String(n);if("bigint"==typeof n)return String(n)+"n";var g=void 0===l.depth?5:l.depth;if(void 0===r&&(r=0),r>=g&&g>0&&"object"==typeof n)return B(n)?"[Array]":"[Object]";var m=function(e,n){var t;if("\t"===e.indent)t="\t";else{if(!("number"==typeof e.indent&&e.indent>0))return null;t=Array(e.indent+1).join(" ")}return{base:t,prev:Array(n+1).join(t)}}(l,r);if(void 0===o)o=[];else if(z(o,n)>=0)return"[Circular]";function _(n,t,i){if(t&&(o=o.slice()).push(t),i){var a={depth:l.depth};return P(l,"quoteStyle")&&(a.quoteStyle=l.quoteStyle),e(n,a,r+1,o)}return e(n,l,r+1,o)}if("function"==typeof n){var w=function(e){if(e.name)return e.name;var n=A.call(v.call(e),/^function\s*([\w$]+)/);if(n)return n[1];return null}(n),T=U(n,_);return"[Function"+(w?": "+w:" (anonymous)")+"]"+(T.length>0?" { "+T.join(", ")+" }":"")}if(I(n)){var M=E?String(n).replace(/^(Symbol\(.*\))_[^)]*$/,"$1"):y.call(n);return"object"!=typeof n||E?M:D(M)}if(function(e){if(!e||"object"!=typeof e)return!1;if("undefined"!=typeof HTMLElement&&e instanceof HTMLElement)return!0;return"string"==typeof e.nodeName&&"function"==typeof e.getAttribute}(n)){for(var W="<"+String(n.nodeName).toLowerCase(),H=n.attributes||[],G=0;G<H.length;G++)W+=" "+H[G].name+"="+S(O(H[G].value),"double",l);return W+=">",n.childNodes&&n.childNodes.length&&(W+="..."),W+="</"+String(n.nodeName).toLowerCase()+">"}if(B(n)){if(0===n.length)return"[]";var q=U(n,_);return m&&!function(e){for(var n=0;n<e.length;n++)if(z(e[n],"\n")>=0)return!1;return!0}(q)?"["+F(q,m)+"]":"[ "+q.join(", ")+" ]"}if(function(e){return!("[object Error]"!==j(e)||k&&"object"==typeof e&&k in e)}(n)){var V=U(n,_);return 0===V.length?"["+String(n)+"]":"{ ["+String(n)+"] "+V.join(", ")+" }"}if("object"==typeof n&&c){if(x&&"function"==typeof n[x])return n[x]();if("symbol"!==c&&"function"==typeof n.inspect)return n.inspect()}if(function(e){if(!i||!e||"object"!=typeof e)return!1;try{i.call(e);try{u.call(e)}catch(e){return!0}return e instanceof Map}catch(e){}return!1}(n)){var $=[];return a.call(n,(function(e,t){$.push(_(t,n,!0)+" => "+_(e,n))})),L("Map",i.call(n),$,m)}if(function(e){if(!u||!e||"object"!=typeof e)return!1;try{u.call(e);try{i.call(e)}catch(e){return!0}return e instanceof Set}catch(e){}return!1}(n)){var K=[];return s.call(n,(function(e){K.push(_(e,n))})),L("Set",u.call(n),K,m)}if(function(e){if(!f||!e||"object"!=typeof e)return!1;try{f.call(e,f);try{p.call(e,p)}catch(e){return!0}return e instanceof WeakMap}catch(e){}return!1}(n))return N("WeakMap");if(function(e){if(!p||!e||"object"!=typeof e)return!1;try{p.call(e,p);try{f.call(e,f)}catch(e){return!0}return e instanceof WeakSet}catch(e){}return!1}(n))return N("WeakSet");if(function(e){if(!d||!e||"object"!=typeof e)return!1;try{return d.call(e),!0}catch(e){}return!1}(n))return N("WeakRef");if(function(e){return!("[object Number]"!==j(e)||k&&"object"==typeof e&&k in e)}(n))return D(_(Number(n)));if(function(e){if(!e||"object"!=typeof e||!b)return!1;try{return b.call(e),!0}catch(e){}return!1}(n))return D(_(b.call(n)));if(function(e){return!("[object Boolean]"!==j(e)||k&&"object"==typeof e&&k in e)}(n))return D(h.call(n));if(function(e){return!("[object String]"!==j(e)||k&&"object"==typeof e&&k in e)}(n))return D(_(String(n)));if(!function(e){return!("[object Date]"!==j(e)||k&&"object"==typeof e&&k in e)}(n)&&!function(e){return!("[object RegExp]"!==j(e)||k&&"object"==typeof e&&k in e)}(n)){var Y=U(n,_),X=C?C(n)===Object.prototype:n instanceof Object||n.constructor===Object,Z=n instanceof Object?"":"null prototype",Q=!X&&k&&Object(n)===n&&k in n?j(n).slice(8,-1):Z?"Object":"",J=(X||"function"!=typeof n.constructor?"":n.constructor.name?n.constructor.name+" ":"")+(Q||Z?"["+[].concat(Q||[],Z||[]).join(": ")+"] ":"");return 0===Y.length?J+"{}":m?J+"{"+F(Y,m)+"}":J+"{ "+Y.join(", ")+" }"}return String(n)};var T=Object.prototype.hasOwnProperty||function(e){return e in this};function P(e,n){return T.call(e,n)}function j(e){return g.call(e)}function z(e,n){if(e.indexOf)return e.indexOf(n);for(var t=0,r=e.length;t<r;t++)if(e[t]===n)return t;return-1}function R(e,n){if(e.length>n.maxStringLength){var t=e.length-n.maxStringLength,r="... "+t+" more character"+(t>1?"s":"");return R(e.slice(0,n.maxStringLength),n)+r}return S(e.replace(/(['\\])/g,"\\$1").replace(/[\x00-\x1f]/g,M),"single",n)}function M(e){var n=e.charCodeAt(0),t={8:"b",9:"t",10:"n",12:"f",13:"r"}[n];return t?"\\"+t:"\\x"+(n<16?"0":"")+n.toString(16).toUpperCase()}function D(e){return"Object("+e+")"}function N(e){return e+" { ? }"}function L(e,n,t,r){return e+" ("+n+") {"+(r?F(t,r):t.join(", "))+"}"}function F(e,n){if(0===e.length)return"";var t="\n"+n.prev+n.base;return t+e.join(","+t)+"\n"+n.prev}function U(e,n){var t=B(e),r=[];if(t){r.length=e.length;for(var o=0;o<e.length;o++)r[o]=P(e,o)?n(e[o],e):""}var i,a="function"==typeof m?m(e):[];if(E){i={};for(var l=0;l<a.length;l++)i["$"+a[l]]=a[l]}for(var c in e)P(e,c)&&(t&&String(Number(c))===c&&c<e.length||E&&i["$"+c]instanceof Symbol||(/[^\w$]/.test(c)?r.push(n(c,e)+": "+n(e[c],e)):r.push(c+": "+n(e[c],e))));if("function"==typeof m)for(var u=0;u<a.length;u++)_.call(e,a[u])&&r.push("["+n(a[u])+"]: "+n(e[a[u]],e));return r}},4244:e=>{"use strict";var n=function(e){return e!=e};e.exports=function(e,t){return 0===e&&0===t?1/e==1/t:e===t||!(!n(e)||!n(t))}},609:(e,n,t)=>{"use strict";var r=t(4289),o=t(5559),i=t(4244),a=t(5624),l=t(2281),c=o(a(),Object);r(c,{getPolyfill:a,implementation:i,shim:l}),e.exports=c},5624:(e,n,t)=>{"use strict";var r=t(4244);e.exports=function(){return"function"==typeof Object.is?Object.is:r}},2281:(e,n,t)=>{"use strict";var r=t(5624),o=t(4289);e.exports=function(){var e=r();return o(Object,{is:e},{is:function(){return Object.is!==e}}),e}},8987:(e,n,t)=>{"use strict";var r;if(!Object.keys){var o=Object.prototype.hasOwnProperty,i=Object.prototype.toString,a=t(1414),l=Object.prototype.propertyIsEnumerable,c=!l.call({toString:null},"toString"),u=l.call((function(){}),"prototype"),s=["toString","toLocaleString","valueOf","hasOwnProperty","isPrototypeOf","propertyIsEnumerable","constructor"],f=function(e){var n=e.constructor;return n&&n.prototype===e},p={$applicationCache:!0,$console:!0,$external:!0,$frame:!0,$frameElement:!0,$frames:!0,$innerHeight:!0,$innerWidth:!0,$onmozfullscreenchange:!0,$onmozfullscreenerror:!0,$outerHeight:!0,$outerWidth:!0,$pageXOffset:!0,$pageYOffset:!0,$parent:!0,$scrollLeft:!0,$scrollTop:!0,$scrollX:!0,$scrollY:!0,$self:!0,$webkitIndexedDB:!0,$webkitStorageInfo:!0,$window:!0},d=function(){if("undefined"==typeof window)return!1;for(var e in window)try{if(!p["$"+e]&&o.call(window,e)&&null!==window[e]&&"object"==typeof window[e])try{f(window[e])}catch(e){return!0}}catch(e){return!0}return!1}();r=function(e){var n=null!==e&&"object"==typeof e,t="[object Function]"===i.call(e),r=a(e),l=n&&"[object String]"===i.call(e),p=[];if(!n&&!t&&!r)throw new TypeError("Object.keys called on a non-object");var h=u&&t;if(l&&e.length>0&&!o.call(e,0))for(var g=0;g<e.length;++g)p.push(String(g));if(r&&e.length>0)for(var v=0;v<e.length;++v)p.push(String(v));else for(var A in e)h&&"prototype"===A||!o.call(e,A)||p.push(String(A));if(c)for(var b=function(e){if("undefined"==typeof window||!d)return f(e);try{return f(e)}catch(e){return!1}}(e),m=0;m<s.length;++m)b&&"constructor"===s[m]||!o.call(e,s[m])||p.push(s[m]);return p}}e.exports=r},2215:(e,n,t)=>{"use strict";var r=Array.prototype.slice,o=t(1414),i=Object.keys,a=i?function(e){return i(e)}:t(8987),l=Object.keys;a.shim=function(){if(Object.keys){var e=function(){var e=Object.keys(arguments);return e&&e.length===arguments.length}(1,2);e||(Object.keys=function(e){return o(e)?l(r.call(e)):l(e)})}else Object.keys=a;return Object.keys||a},e.exports=a},1414:e=>{"use strict";var n=Object.prototype.toString;e.exports=function(e){var t=n.call(e),r="[object Arguments]"===t;return r||(r="[object Array]"!==t&&null!==e&&"object"==typeof e&&"number"==typeof e.length&&e.length>=0&&"[object Function]"===n.call(e.callee)),r}},2837:(e,n,t)=>{"use strict";var r=t(2215),o=function(e){return null!=e},i=t(5419)(),a=t(1924),l=Object,c=a("Array.prototype.push"),u=a("Object.prototype.propertyIsEnumerable"),s=i?Object.getOwnPropertySymbols:null;e.exports=function(e,n){if(!o(e))throw new TypeError("target must be an object");var t,a,f,p,d,h,g,v=l(e);for(t=1;t<arguments.length;++t){a=l(arguments[t]),p=r(a);var A=i&&(Object.getOwnPropertySymbols||s);if(A)for(d=A(a),f=0;f<d.length;++f)g=d[f],u(a,g)&&c(p,g);for(f=0;f<p.length;++f)h=a[g=p[f]],u(a,g)&&(v[g]=h)}return v}},3533:(e,n,t)=>{"use strict";var r=t(4289),o=t(5559),i=t(2837),a=t(8162),l=t(4489),c=o.apply(a()),u=function(e,n){return c(Object,arguments)};r(u,{getPolyfill:a,implementation:i,shim:l}),e.exports=u},8162:(e,n,t)=>{"use strict";var r=t(2837);e.exports=function(){return Object.assign?function(){if(!Object.assign)return!1;for(var e="abcdefghijklmnopqrst",n=e.split(""),t={},r=0;r<n.length;++r)t[n[r]]=n[r];var o=Object.assign({},t),i="";for(var a in o)i+=a;return e!==i}()||function(){if(!Object.assign||!Object.preventExtensions)return!1;var e=Object.preventExtensions({1:2});try{Object.assign(e,"xy")}catch(n){return"y"===e[1]}return!1}()?r:Object.assign:r}},4489:(e,n,t)=>{"use strict";var r=t(4289),o=t(8162);e.exports=function(){var e=o();return r(Object,{assign:e},{assign:function(){return Object.assign!==e}}),e}},2703:(e,n,t)=>{"use strict";var r=t(414);function o(){}function i(){}i.resetWarningCache=o,e.exports=function(){function e(e,n,t,o,i,a){if(a!==r){var l=new Error("Calling PropTypes validators directly is not supported by the `prop-types` package. Use PropTypes.checkPropTypes() to call them. Read more at http://fb.me/use-check-prop-types");throw l.name="Invariant Violation",l}}function n(){return e}e.isRequired=e;var t={array:e,bool:e,func:e,number:e,object:e,string:e,symbol:e,any:e,arrayOf:n,element:e,elementType:e,instanceOf:n,node:e,objectOf:n,oneOf:n,oneOfType:n,shape:n,exact:n,checkPropTypes:i,resetWarningCache:o};return t.PropTypes=t,t}},5697:(e,n,t)=>{e.exports=t(2703)()},414:e=>{"use strict";e.exports="SECRET_DO_NOT_PASS_THIS_OR_YOU_WILL_BE_FIRED"},4448:(e,n,t)=>{"use strict";var r=t(7294),o=t(7418),i=t(3840);
+/** @license React v17.0.2
+ * react-dom.production.min.js
+ *
+ * Copyright (c) Facebook, Inc. and its affiliates.
+ *
+ * This source code is licensed under the MIT license found in the
+ * LICENSE file in the root directory of this source tree.
+ */function a(e){for(var n="https://reactjs.org/docs/error-decoder.html?invariant="+e,t=1;t<arguments.length;t++)n+="&args[]="+encodeURIComponent(arguments[t]);return"Minified React error #"+e+"; visit "+n+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}if(!r)throw Error(a(227));var l=new Set,c={};function u(e,n){s(e,n),s(e+"Capture",n)}function s(e,n){for(c[e]=n,e=0;e<n.length;e++)l.add(n[e])}var f=!("undefined"==typeof window||void 0===window.document||void 0===window.document.createElement),p=/^[:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$/,d=Object.prototype.hasOwnProperty,h={},g={};function v(e,n,t,r,o,i,a){this.acceptsBooleans=2===n||3===n||4===n,this.attributeName=r,this.attributeNamespace=o,this.mustUseProperty=t,this.propertyName=e,this.type=n,this.sanitizeURL=i,this.removeEmptyString=a}var A={};"children dangerouslySetInnerHTML defaultValue defaultChecked innerHTML suppressContentEditableWarning suppressHydrationWarning style".split(" ").forEach((function(e){A[e]=new v(e,0,!1,e,null,!1,!1)})),[["acceptCharset","accept-charset"],["className","class"],["htmlFor","for"],["httpEquiv","http-equiv"]].forEach((function(e){var n=e[0];A[n]=new v(n,1,!1,e[1],null,!1,!1)})),["contentEditable","draggable","spellCheck","value"].forEach((function(e){A[e]=new v(e,2,!1,e.toLowerCase(),null,!1,!1)})),["autoReverse","externalResourcesRequired","focusable","preserveAlpha"].forEach((function(e){A[e]=new v(e,2,!1,e,null,!1,!1)})),"allowFullScreen async autoFocus autoPlay controls default defer disabled disablePictureInPicture disableRemotePlayback formNoValidate hidden loop noModule noValidate open playsInline readOnly required reversed scoped seamless itemScope".split(" ").forEach((function(e){A[e]=new v(e,3,!1,e.toLowerCase(),null,!1,!1)})),["checked","multiple","muted","selected"].forEach((function(e){A[e]=new v(e,3,!0,e,null,!1,!1)})),["capture","download"].forEach((function(e){A[e]=new v(e,4,!1,e,null,!1,!1)})),["cols","rows","size","span"].forEach((function(e){A[e]=new v(e,6,!1,e,null,!1,!1)})),["rowSpan","start"].forEach((function(e){A[e]=new v(e,5,!1,e.toLowerCase(),null,!1,!1)}));var b=/[\-:]([a-z])/g;function m(e){return e[1].toUpperCase()}function y(e,n,t,r){var o=A.hasOwnProperty(n)?A[n]:null;(null!==o?0===o.type:!r&&(2<n.length&&("o"===n[0]||"O"===n[0])&&("n"===n[1]||"N"===n[1])))||(function(e,n,t,r){if(null==n||function(e,n,t,r){if(null!==t&&0===t.type)return!1;switch(typeof n){case"function":case"symbol":return!0;case"boolean":return!r&&(null!==t?!t.acceptsBooleans:"data-"!==(e=e.toLowerCase().slice(0,5))&&"aria-"!==e);default:return!1}}(e,n,t,r))return!0;if(r)return!1;if(null!==t)switch(t.type){case 3:return!n;case 4:return!1===n;case 5:return isNaN(n);case 6:return isNaN(n)||1>n}return!1}(n,t,o,r)&&(t=null),r||null===o?function(e){return!!d.call(g,e)||!d.call(h,e)&&(p.test(e)?g[e]=!0:(h[e]=!0,!1))}(n)&&(null===t?e.removeAttribute(n):e.setAttribute(n,""+t)):o.mustUseProperty?e[o.propertyName]=null===t?3!==o.type&&"":t:(n=o.attributeName,r=o.attributeNamespace,null===t?e.removeAttribute(n):(t=3===(o=o.type)||4===o&&!0===t?"":""+t,r?e.setAttributeNS(r,n,t):e.setAttribute(n,t))))}"accent-height alignment-baseline arabic-form baseline-shift cap-height clip-path clip-rule color-interpolation color-interpolation-filters color-profile color-rendering dominant-baseline enable-background fill-opacity fill-rule flood-color flood-opacity font-family font-size font-size-adjust font-stretch font-style font-variant font-weight glyph-name glyph-orientation-horizontal glyph-orientation-vertical horiz-adv-x horiz-origin-x image-rendering letter-spacing lighting-color marker-end marker-mid marker-start overline-position overline-thickness paint-order panose-1 pointer-events rendering-intent shape-rendering stop-color stop-opacity strikethrough-position strikethrough-thickness stroke-dasharray stroke-dashoffset stroke-linecap stroke-linejoin stroke-miterlimit stroke-opacity stroke-width text-anchor text-decoration text-rendering underline-position underline-thickness unicode-bidi unicode-range units-per-em v-alphabetic v-hanging v-ideographic v-mathematical vector-effect vert-adv-y vert-origin-x vert-origin-y word-spacing writing-mode xmlns:xlink x-height".split(" ").forEach((function(e){var n=e.replace(b,m);A[n]=new v(n,1,!1,e,null,!1,!1)})),"xlink:actuate xlink:arcrole xlink:role xlink:show xlink:title xlink:type".split(" ").forEach((function(e){var n=e.replace(b,m);A[n]=new v(n,1,!1,e,"http://www.w3.org/1999/xlink",!1,!1)})),["xml:base","xml:lang","xml:space"].forEach((function(e){var n=e.replace(b,m);A[n]=new v(n,1,!1,e,"http://www.w3.org/XML/1998/namespace",!1,!1)})),["tabIndex","crossOrigin"].forEach((function(e){A[e]=new v(e,1,!1,e.toLowerCase(),null,!1,!1)})),A.xlinkHref=new v("xlinkHref",1,!1,"xlink:href","http://www.w3.org/1999/xlink",!0,!1),["src","href","action","formAction"].forEach((function(e){A[e]=new v(e,1,!1,e.toLowerCase(),null,!0,!0)}));var E=r.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED,_=60103,C=60106,w=60107,x=60108,k=60114,S=60109,O=60110,B=60112,I=60113,T=60120,P=60115,j=60116,z=60121,R=60128,M=60129,D=60130,N=60131;if("function"==typeof Symbol&&Symbol.for){var L=Symbol.for;_=L("react.element"),C=L("react.portal"),w=L("react.fragment"),x=L("react.strict_mode"),k=L("react.profiler"),S=L("react.provider"),O=L("react.context"),B=L("react.forward_ref"),I=L("react.suspense"),T=L("react.suspense_list"),P=L("react.memo"),j=L("react.lazy"),z=L("react.block"),L("react.scope"),R=L("react.opaque.id"),M=L("react.debug_trace_mode"),D=L("react.offscreen"),N=L("react.legacy_hidden")}var F,U="function"==typeof Symbol&&Symbol.iterator;function W(e){return null===e||"object"!=typeof e?null:"function"==typeof(e=U&&e[U]||e["@@iterator"])?e:null}function H(e){if(void 0===F)try{throw Error()}catch(e){var n=e.stack.trim().match(/\n( *(at )?)/);F=n&&n[1]||""}return"\n"+F+e}var G=!1;function q(e,n){if(!e||G)return"";G=!0;var t=Error.prepareStackTrace;Error.prepareStackTrace=void 0;try{if(n)if(n=function(){throw Error()},Object.defineProperty(n.prototype,"props",{set:function(){throw Error()}}),"object"==typeof Reflect&&Reflect.construct){try{Reflect.construct(n,[])}catch(e){var r=e}Reflect.construct(e,[],n)}else{try{n.call()}catch(e){r=e}e.call(n.prototype)}else{try{throw Error()}catch(e){r=e}e()}}catch(e){if(e&&r&&"string"==typeof e.stack){for(var o=e.stack.split("\n"),i=r.stack.split("\n"),a=o.length-1,l=i.length-1;1<=a&&0<=l&&o[a]!==i[l];)l--;for(;1<=a&&0<=l;a--,l--)if(o[a]!==i[l]){if(1!==a||1!==l)do{if(a--,0>--l||o[a]!==i[l])return"\n"+o[a].replace(" at new "," at ")}while(1<=a&&0<=l);break}}}finally{G=!1,Error.prepareStackTrace=t}return(e=e?e.displayName||e.name:"")?H(e):""}function V(e){switch(e.tag){case 5:return H(e.type);case 16:return H("Lazy");case 13:return H("Suspense");case 19:return H("SuspenseList");case 0:case 2:case 15:return e=q(e.type,!1);case 11:return e=q(e.type.render,!1);case 22:return e=q(e.type._render,!1);case 1:return e=q(e.type,!0);default:return""}}function $(e){if(null==e)return null;if("function"==typeof e)return e.displayName||e.name||null;if("string"==typeof e)return e;switch(e){case w:return"Fragment";case C:return"Portal";case k:return"Profiler";case x:return"StrictMode";case I:return"Suspense";case T:return"SuspenseList"}if("object"==typeof e)switch(e.$$typeof){case O:return(e.displayName||"Context")+".Consumer";case S:return(e._context.displayName||"Context")+".Provider";case B:var n=e.render;return n=n.displayName||n.name||"",e.displayName||(""!==n?"ForwardRef("+n+")":"ForwardRef");case P:return $(e.type);case z:return $(e._render);case j:n=e._payload,e=e._init;try{return $(e(n))}catch(e){}}return null}function K(e){switch(typeof e){case"boolean":case"number":case"object":case"string":case"undefined":return e;default:return""}}function Y(e){var n=e.type;return(e=e.nodeName)&&"input"===e.toLowerCase()&&("checkbox"===n||"radio"===n)}function X(e){e._valueTracker||(e._valueTracker=function(e){var n=Y(e)?"checked":"value",t=Object.getOwnPropertyDescriptor(e.constructor.prototype,n),r=""+e[n];if(!e.hasOwnProperty(n)&&void 0!==t&&"function"==typeof t.get&&"function"==typeof t.set){var o=t.get,i=t.set;return Object.defineProperty(e,n,{configurable:!0,get:function(){return o.call(this)},set:function(e){r=""+e,i.call(this,e)}}),Object.defineProperty(e,n,{enumerable:t.enumerable}),{getValue:function(){return r},setValue:function(e){r=""+e},stopTracking:function(){e._valueTracker=null,delete e[n]}}}}(e))}function Z(e){if(!e)return!1;var n=e._valueTracker;if(!n)return!0;var t=n.getValue(),r="";return e&&(r=Y(e)?e.checked?"true":"false":e.value),(e=r)!==t&&(n.setValue(e),!0)}function Q(e){if(void 0===(e=e||("undefined"!=typeof document?document:void 0)))return null;try{return e.activeElement||e.body}catch(n){return e.body}}function J(e,n){var t=n.checked;return o({},n,{defaultChecked:void 0,defaultValue:void 0,value:void 0,checked:null!=t?t:e._wrapperState.initialChecked})}function ee(e,n){var t=null==n.defaultValue?"":n.defaultValue,r=null!=n.checked?n.checked:n.defaultChecked;t=K(null!=n.value?n.value:t),e._wrapperState={initialChecked:r,initialValue:t,controlled:"checkbox"===n.type||"radio"===n.type?null!=n.checked:null!=n.value}}function ne(e,n){null!=(n=n.checked)&&y(e,"checked",n,!1)}function te(e,n){ne(e,n);var t=K(n.value),r=n.type;if(null!=t)"number"===r?(0===t&&""===e.value||e.value!=t)&&(e.value=""+t):e.value!==""+t&&(e.value=""+t);else if("submit"===r||"reset"===r)return void e.removeAttribute("value");n.hasOwnProperty("value")?oe(e,n.type,t):n.hasOwnProperty("defaultValue")&&oe(e,n.type,K(n.defaultValue)),null==n.checked&&null!=n.defaultChecked&&(e.defaultChecked=!!n.defaultChecked)}function re(e,n,t){if(n.hasOwnProperty("value")||n.hasOwnProperty("defaultValue")){var r=n.type;if(!("submit"!==r&&"reset"!==r||void 0!==n.value&&null!==n.value))return;n=""+e._wrapperState.initialValue,t||n===e.value||(e.value=n),e.defaultValue=n}""!==(t=e.name)&&(e.name=""),e.defaultChecked=!!e._wrapperState.initialChecked,""!==t&&(e.name=t)}function oe(e,n,t){"number"===n&&Q(e.ownerDocument)===e||(null==t?e.defaultValue=""+e._wrapperState.initialValue:e.defaultValue!==""+t&&(e.defaultValue=""+t))}function ie(e,n){return e=o({children:void 0},n),(n=function(e){var n="";return r.Children.forEach(e,(function(e){null!=e&&(n+=e)})),n}(n.children))&&(e.children=n),e}function ae(e,n,t,r){if(e=e.options,n){n={};for(var o=0;o<t.length;o++)n["$"+t[o]]=!0;for(t=0;t<e.length;t++)o=n.hasOwnProperty("$"+e[t].value),e[t].selected!==o&&(e[t].selected=o),o&&r&&(e[t].defaultSelected=!0)}else{for(t=""+K(t),n=null,o=0;o<e.length;o++){if(e[o].value===t)return e[o].selected=!0,void(r&&(e[o].defaultSelected=!0));null!==n||e[o].disabled||(n=e[o])}null!==n&&(n.selected=!0)}}function le(e,n){if(null!=n.dangerouslySetInnerHTML)throw Error(a(91));return o({},n,{value:void 0,defaultValue:void 0,children:""+e._wrapperState.initialValue})}function ce(e,n){var t=n.value;if(null==t){if(t=n.children,n=n.defaultValue,null!=t){if(null!=n)throw Error(a(92));if(Array.isArray(t)){if(!(1>=t.length))throw Error(a(93));t=t[0]}n=t}null==n&&(n=""),t=n}e._wrapperState={initialValue:K(t)}}function ue(e,n){var t=K(n.value),r=K(n.defaultValue);null!=t&&((t=""+t)!==e.value&&(e.value=t),null==n.defaultValue&&e.defaultValue!==t&&(e.defaultValue=t)),null!=r&&(e.defaultValue=""+r)}function se(e){var n=e.textContent;n===e._wrapperState.initialValue&&""!==n&&null!==n&&(e.value=n)}var fe="http://www.w3.org/1999/xhtml",pe="http://www.w3.org/2000/svg";function de(e){switch(e){case"svg":return"http://www.w3.org/2000/svg";case"math":return"http://www.w3.org/1998/Math/MathML";default:return"http://www.w3.org/1999/xhtml"}}function he(e,n){return null==e||"http://www.w3.org/1999/xhtml"===e?de(n):"http://www.w3.org/2000/svg"===e&&"foreignObject"===n?"http://www.w3.org/1999/xhtml":e}var ge,ve,Ae=(ve=function(e,n){if(e.namespaceURI!==pe||"innerHTML"in e)e.innerHTML=n;else{for((ge=ge||document.createElement("div")).innerHTML="<svg>"+n.valueOf().toString()+"</svg>",n=ge.firstChild;e.firstChild;)e.removeChild(e.firstChild);for(;n.firstChild;)e.appendChild(n.firstChild)}},"undefined"!=typeof MSApp&&MSApp.execUnsafeLocalFunction?function(e,n,t,r){MSApp.execUnsafeLocalFunction((function(){return ve(e,n)}))}:ve);function be(e,n){if(n){var t=e.firstChild;if(t&&t===e.lastChild&&3===t.nodeType)return void(t.nodeValue=n)}e.textContent=n}var me={animationIterationCount:!0,borderImageOutset:!0,borderImageSlice:!0,borderImageWidth:!0,boxFlex:!0,boxFlexGroup:!0,boxOrdinalGroup:!0,columnCount:!0,columns:!0,flex:!0,flexGrow:!0,flexPositive:!0,flexShrink:!0,flexNegative:!0,flexOrder:!0,gridArea:!0,gridRow:!0,gridRowEnd:!0,gridRowSpan:!0,gridRowStart:!0,gridColumn:!0,gridColumnEnd:!0,gridColumnSpan:!0,gridColumnStart:!0,fontWeight:!0,lineClamp:!0,lineHeight:!0,opacity:!0,order:!0,orphans:!0,tabSize:!0,widows:!0,zIndex:!0,zoom:!0,fillOpacity:!0,floodOpacity:!0,stopOpacity:!0,strokeDasharray:!0,strokeDashoffset:!0,strokeMiterlimit:!0,strokeOpacity:!0,strokeWidth:!0},ye=["Webkit","ms","Moz","O"];function Ee(e,n,t){return null==n||"boolean"==typeof n||""===n?"":t||"number"!=typeof n||0===n||me.hasOwnProperty(e)&&me[e]?(""+n).trim():n+"px"}function _e(e,n){for(var t in e=e.style,n)if(n.hasOwnProperty(t)){var r=0===t.indexOf("--"),o=Ee(t,n[t],r);"float"===t&&(t="cssFloat"),r?e.setProperty(t,o):e[t]=o}}Object.keys(me).forEach((function(e){ye.forEach((function(n){n=n+e.charAt(0).toUpperCase()+e.substring(1),me[n]=me[e]}))}));var Ce=o({menuitem:!0},{area:!0,base:!0,br:!0,col:!0,embed:!0,hr:!0,img:!0,input:!0,keygen:!0,link:!0,meta:!0,param:!0,source:!0,track:!0,wbr:!0});function we(e,n){if(n){if(Ce[e]&&(null!=n.children||null!=n.dangerouslySetInnerHTML))throw Error(a(137,e));if(null!=n.dangerouslySetInnerHTML){if(null!=n.children)throw Error(a(60));if("object"!=typeof n.dangerouslySetInnerHTML||!("__html"in n.dangerouslySetInnerHTML))throw Error(a(61))}if(null!=n.style&&"object"!=typeof n.style)throw Error(a(62))}}function xe(e,n){if(-1===e.indexOf("-"))return"string"==typeof n.is;switch(e){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}function ke(e){return(e=e.target||e.srcElement||window).correspondingUseElement&&(e=e.correspondingUseElement),3===e.nodeType?e.parentNode:e}var Se=null,Oe=null,Be=null;function Ie(e){if(e=ro(e)){if("function"!=typeof Se)throw Error(a(280));var n=e.stateNode;n&&(n=io(n),Se(e.stateNode,e.type,n))}}function Te(e){Oe?Be?Be.push(e):Be=[e]:Oe=e}function Pe(){if(Oe){var e=Oe,n=Be;if(Be=Oe=null,Ie(e),n)for(e=0;e<n.length;e++)Ie(n[e])}}function je(e,n){return e(n)}function ze(e,n,t,r,o){return e(n,t,r,o)}function Re(){}var Me=je,De=!1,Ne=!1;function Le(){null===Oe&&null===Be||(Re(),Pe())}function Fe(e,n){var t=e.stateNode;if(null===t)return null;var r=io(t);if(null===r)return null;t=r[n];e:switch(n){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(r=!r.disabled)||(r=!("button"===(e=e.type)||"input"===e||"select"===e||"textarea"===e)),e=!r;break e;default:e=!1}if(e)return null;if(t&&"function"!=typeof t)throw Error(a(231,n,typeof t));return t}var Ue=!1;if(f)try{var We={};Object.defineProperty(We,"passive",{get:function(){Ue=!0}}),window.addEventListener("test",We,We),window.removeEventListener("test",We,We)}catch(ve){Ue=!1}function He(e,n,t,r,o,i,a,l,c){var u=Array.prototype.slice.call(arguments,3);try{n.apply(t,u)}catch(e){this.onError(e)}}var Ge=!1,qe=null,Ve=!1,$e=null,Ke={onError:function(e){Ge=!0,qe=e}};function Ye(e,n,t,r,o,i,a,l,c){Ge=!1,qe=null,He.apply(Ke,arguments)}function Xe(e){var n=e,t=e;if(e.alternate)for(;n.return;)n=n.return;else{e=n;do{0!=(1026&(n=e).flags)&&(t=n.return),e=n.return}while(e)}return 3===n.tag?t:null}function Ze(e){if(13===e.tag){var n=e.memoizedState;if(null===n&&(null!==(e=e.alternate)&&(n=e.memoizedState)),null!==n)return n.dehydrated}return null}function Qe(e){if(Xe(e)!==e)throw Error(a(188))}function Je(e){if(e=function(e){var n=e.alternate;if(!n){if(null===(n=Xe(e)))throw Error(a(188));return n!==e?null:e}for(var t=e,r=n;;){var o=t.return;if(null===o)break;var i=o.alternate;if(null===i){if(null!==(r=o.return)){t=r;continue}break}if(o.child===i.child){for(i=o.child;i;){if(i===t)return Qe(o),e;if(i===r)return Qe(o),n;i=i.sibling}throw Error(a(188))}if(t.return!==r.return)t=o,r=i;else{for(var l=!1,c=o.child;c;){if(c===t){l=!0,t=o,r=i;break}if(c===r){l=!0,r=o,t=i;break}c=c.sibling}if(!l){for(c=i.child;c;){if(c===t){l=!0,t=i,r=o;break}if(c===r){l=!0,r=i,t=o;break}c=c.sibling}if(!l)throw Error(a(189))}}if(t.alternate!==r)throw Error(a(190))}if(3!==t.tag)throw Error(a(188));return t.stateNode.current===t?e:n}(e),!e)return null;for(var n=e;;){if(5===n.tag||6===n.tag)return n;if(n.child)n.child.return=n,n=n.child;else{if(n===e)break;for(;!n.sibling;){if(!n.return||n.return===e)return null;n=n.return}n.sibling.return=n.return,n=n.sibling}}return null}function en(e,n){for(var t=e.alternate;null!==n;){if(n===e||n===t)return!0;n=n.return}return!1}var nn,tn,rn,on,an=!1,ln=[],cn=null,un=null,sn=null,fn=new Map,pn=new Map,dn=[],hn="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset submit".split(" ");function gn(e,n,t,r,o){return{blockedOn:e,domEventName:n,eventSystemFlags:16|t,nativeEvent:o,targetContainers:[r]}}function vn(e,n){switch(e){case"focusin":case"focusout":cn=null;break;case"dragenter":case"dragleave":un=null;break;case"mouseover":case"mouseout":sn=null;break;case"pointerover":case"pointerout":fn.delete(n.pointerId);break;case"gotpointercapture":case"lostpointercapture":pn.delete(n.pointerId)}}function An(e,n,t,r,o,i){return null===e||e.nativeEvent!==i?(e=gn(n,t,r,o,i),null!==n&&(null!==(n=ro(n))&&tn(n)),e):(e.eventSystemFlags|=r,n=e.targetContainers,null!==o&&-1===n.indexOf(o)&&n.push(o),e)}function bn(e){var n=to(e.target);if(null!==n){var t=Xe(n);if(null!==t)if(13===(n=t.tag)){if(null!==(n=Ze(t)))return e.blockedOn=n,void on(e.lanePriority,(function(){i.unstable_runWithPriority(e.priority,(function(){rn(t)}))}))}else if(3===n&&t.stateNode.hydrate)return void(e.blockedOn=3===t.tag?t.stateNode.containerInfo:null)}e.blockedOn=null}function mn(e){if(null!==e.blockedOn)return!1;for(var n=e.targetContainers;0<n.length;){var t=et(e.domEventName,e.eventSystemFlags,n[0],e.nativeEvent);if(null!==t)return null!==(n=ro(t))&&tn(n),e.blockedOn=t,!1;n.shift()}return!0}function yn(e,n,t){mn(e)&&t.delete(n)}function En(){for(an=!1;0<ln.length;){var e=ln[0];if(null!==e.blockedOn){null!==(e=ro(e.blockedOn))&&nn(e);break}for(var n=e.targetContainers;0<n.length;){var t=et(e.domEventName,e.eventSystemFlags,n[0],e.nativeEvent);if(null!==t){e.blockedOn=t;break}n.shift()}null===e.blockedOn&&ln.shift()}null!==cn&&mn(cn)&&(cn=null),null!==un&&mn(un)&&(un=null),null!==sn&&mn(sn)&&(sn=null),fn.forEach(yn),pn.forEach(yn)}function _n(e,n){e.blockedOn===n&&(e.blockedOn=null,an||(an=!0,i.unstable_scheduleCallback(i.unstable_NormalPriority,En)))}function Cn(e){function n(n){return _n(n,e)}if(0<ln.length){_n(ln[0],e);for(var t=1;t<ln.length;t++){var r=ln[t];r.blockedOn===e&&(r.blockedOn=null)}}for(null!==cn&&_n(cn,e),null!==un&&_n(un,e),null!==sn&&_n(sn,e),fn.forEach(n),pn.forEach(n),t=0;t<dn.length;t++)(r=dn[t]).blockedOn===e&&(r.blockedOn=null);for(;0<dn.length&&null===(t=dn[0]).blockedOn;)bn(t),null===t.blockedOn&&dn.shift()}function wn(e,n){var t={};return t[e.toLowerCase()]=n.toLowerCase(),t["Webkit"+e]="webkit"+n,t["Moz"+e]="moz"+n,t}var xn={animationend:wn("Animation","AnimationEnd"),animationiteration:wn("Animation","AnimationIteration"),animationstart:wn("Animation","AnimationStart"),transitionend:wn("Transition","TransitionEnd")},kn={},Sn={};function On(e){if(kn[e])return kn[e];if(!xn[e])return e;var n,t=xn[e];for(n in t)if(t.hasOwnProperty(n)&&n in Sn)return kn[e]=t[n];return e}f&&(Sn=document.createElement("div").style,"AnimationEvent"in window||(delete xn.animationend.animation,delete xn.animationiteration.animation,delete xn.animationstart.animation),"TransitionEvent"in window||delete xn.transitionend.transition);var Bn=On("animationend"),In=On("animationiteration"),Tn=On("animationstart"),Pn=On("transitionend"),jn=new Map,zn=new Map,Rn=["abort","abort",Bn,"animationEnd",In,"animationIteration",Tn,"animationStart","canplay","canPlay","canplaythrough","canPlayThrough","durationchange","durationChange","emptied","emptied","encrypted","encrypted","ended","ended","error","error","gotpointercapture","gotPointerCapture","load","load","loadeddata","loadedData","loadedmetadata","loadedMetadata","loadstart","loadStart","lostpointercapture","lostPointerCapture","playing","playing","progress","progress","seeking","seeking","stalled","stalled","suspend","suspend","timeupdate","timeUpdate",Pn,"transitionEnd","waiting","waiting"];function Mn(e,n){for(var t=0;t<e.length;t+=2){var r=e[t],o=e[t+1];o="on"+(o[0].toUpperCase()+o.slice(1)),zn.set(r,n),jn.set(r,o),u(o,[r])}}(0,i.unstable_now)();var Dn=8;function Nn(e){if(0!=(1&e))return Dn=15,1;if(0!=(2&e))return Dn=14,2;if(0!=(4&e))return Dn=13,4;var n=24&e;return 0!==n?(Dn=12,n):0!=(32&e)?(Dn=11,32):0!==(n=192&e)?(Dn=10,n):0!=(256&e)?(Dn=9,256):0!==(n=3584&e)?(Dn=8,n):0!=(4096&e)?(Dn=7,4096):0!==(n=4186112&e)?(Dn=6,n):0!==(n=62914560&e)?(Dn=5,n):67108864&e?(Dn=4,67108864):0!=(134217728&e)?(Dn=3,134217728):0!==(n=805306368&e)?(Dn=2,n):0!=(1073741824&e)?(Dn=1,1073741824):(Dn=8,e)}function Ln(e,n){var t=e.pendingLanes;if(0===t)return Dn=0;var r=0,o=0,i=e.expiredLanes,a=e.suspendedLanes,l=e.pingedLanes;if(0!==i)r=i,o=Dn=15;else if(0!==(i=134217727&t)){var c=i&~a;0!==c?(r=Nn(c),o=Dn):0!==(l&=i)&&(r=Nn(l),o=Dn)}else 0!==(i=t&~a)?(r=Nn(i),o=Dn):0!==l&&(r=Nn(l),o=Dn);if(0===r)return 0;if(r=t&((0>(r=31-qn(r))?0:1<<r)<<1)-1,0!==n&&n!==r&&0==(n&a)){if(Nn(n),o<=Dn)return n;Dn=o}if(0!==(n=e.entangledLanes))for(e=e.entanglements,n&=r;0<n;)o=1<<(t=31-qn(n)),r|=e[t],n&=~o;return r}function Fn(e){return 0!==(e=-1073741825&e.pendingLanes)?e:1073741824&e?1073741824:0}function Un(e,n){switch(e){case 15:return 1;case 14:return 2;case 12:return 0===(e=Wn(24&~n))?Un(10,n):e;case 10:return 0===(e=Wn(192&~n))?Un(8,n):e;case 8:return 0===(e=Wn(3584&~n))&&(0===(e=Wn(4186112&~n))&&(e=512)),e;case 2:return 0===(n=Wn(805306368&~n))&&(n=268435456),n}throw Error(a(358,e))}function Wn(e){return e&-e}function Hn(e){for(var n=[],t=0;31>t;t++)n.push(e);return n}function Gn(e,n,t){e.pendingLanes|=n;var r=n-1;e.suspendedLanes&=r,e.pingedLanes&=r,(e=e.eventTimes)[n=31-qn(n)]=t}var qn=Math.clz32?Math.clz32:function(e){return 0===e?32:31-(Vn(e)/$n|0)|0},Vn=Math.log,$n=Math.LN2;var Kn=i.unstable_UserBlockingPriority,Yn=i.unstable_runWithPriority,Xn=!0;function Zn(e,n,t,r){De||Re();var o=Jn,i=De;De=!0;try{ze(o,e,n,t,r)}finally{(De=i)||Le()}}function Qn(e,n,t,r){Yn(Kn,Jn.bind(null,e,n,t,r))}function Jn(e,n,t,r){var o;if(Xn)if((o=0==(4&n))&&0<ln.length&&-1<hn.indexOf(e))e=gn(null,e,n,t,r),ln.push(e);else{var i=et(e,n,t,r);if(null===i)o&&vn(e,r);else{if(o){if(-1<hn.indexOf(e))return e=gn(i,e,n,t,r),void ln.push(e);if(function(e,n,t,r,o){switch(n){case"focusin":return cn=An(cn,e,n,t,r,o),!0;case"dragenter":return un=An(un,e,n,t,r,o),!0;case"mouseover":return sn=An(sn,e,n,t,r,o),!0;case"pointerover":var i=o.pointerId;return fn.set(i,An(fn.get(i)||null,e,n,t,r,o)),!0;case"gotpointercapture":return i=o.pointerId,pn.set(i,An(pn.get(i)||null,e,n,t,r,o)),!0}return!1}(i,e,n,t,r))return;vn(e,r)}Rr(e,n,r,null,t)}}}function et(e,n,t,r){var o=ke(r);if(null!==(o=to(o))){var i=Xe(o);if(null===i)o=null;else{var a=i.tag;if(13===a){if(null!==(o=Ze(i)))return o;o=null}else if(3===a){if(i.stateNode.hydrate)return 3===i.tag?i.stateNode.containerInfo:null;o=null}else i!==o&&(o=null)}}return Rr(e,n,r,o,t),null}var nt=null,tt=null,rt=null;function ot(){if(rt)return rt;var e,n,t=tt,r=t.length,o="value"in nt?nt.value:nt.textContent,i=o.length;for(e=0;e<r&&t[e]===o[e];e++);var a=r-e;for(n=1;n<=a&&t[r-n]===o[i-n];n++);return rt=o.slice(e,1<n?1-n:void 0)}function it(e){var n=e.keyCode;return"charCode"in e?0===(e=e.charCode)&&13===n&&(e=13):e=n,10===e&&(e=13),32<=e||13===e?e:0}function at(){return!0}function lt(){return!1}function ct(e){function n(n,t,r,o,i){for(var a in this._reactName=n,this._targetInst=r,this.type=t,this.nativeEvent=o,this.target=i,this.currentTarget=null,e)e.hasOwnProperty(a)&&(n=e[a],this[a]=n?n(o):o[a]);return this.isDefaultPrevented=(null!=o.defaultPrevented?o.defaultPrevented:!1===o.returnValue)?at:lt,this.isPropagationStopped=lt,this}return o(n.prototype,{preventDefault:function(){this.defaultPrevented=!0;var e=this.nativeEvent;e&&(e.preventDefault?e.preventDefault():"unknown"!=typeof e.returnValue&&(e.returnValue=!1),this.isDefaultPrevented=at)},stopPropagation:function(){var e=this.nativeEvent;e&&(e.stopPropagation?e.stopPropagation():"unknown"!=typeof e.cancelBubble&&(e.cancelBubble=!0),this.isPropagationStopped=at)},persist:function(){},isPersistent:at}),n}var ut,st,ft,pt={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(e){return e.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},dt=ct(pt),ht=o({},pt,{view:0,detail:0}),gt=ct(ht),vt=o({},ht,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:Ot,button:0,buttons:0,relatedTarget:function(e){return void 0===e.relatedTarget?e.fromElement===e.srcElement?e.toElement:e.fromElement:e.relatedTarget},movementX:function(e){return"movementX"in e?e.movementX:(e!==ft&&(ft&&"mousemove"===e.type?(ut=e.screenX-ft.screenX,st=e.screenY-ft.screenY):st=ut=0,ft=e),ut)},movementY:function(e){return"movementY"in e?e.movementY:st}}),At=ct(vt),bt=ct(o({},vt,{dataTransfer:0})),mt=ct(o({},ht,{relatedTarget:0})),yt=ct(o({},pt,{animationName:0,elapsedTime:0,pseudoElement:0})),Et=o({},pt,{clipboardData:function(e){return"clipboardData"in e?e.clipboardData:window.clipboardData}}),_t=ct(Et),Ct=ct(o({},pt,{data:0})),wt={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},xt={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},kt={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function St(e){var n=this.nativeEvent;return n.getModifierState?n.getModifierState(e):!!(e=kt[e])&&!!n[e]}function Ot(){return St}var Bt=o({},ht,{key:function(e){if(e.key){var n=wt[e.key]||e.key;if("Unidentified"!==n)return n}return"keypress"===e.type?13===(e=it(e))?"Enter":String.fromCharCode(e):"keydown"===e.type||"keyup"===e.type?xt[e.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:Ot,charCode:function(e){return"keypress"===e.type?it(e):0},keyCode:function(e){return"keydown"===e.type||"keyup"===e.type?e.keyCode:0},which:function(e){return"keypress"===e.type?it(e):"keydown"===e.type||"keyup"===e.type?e.keyCode:0}}),It=ct(Bt),Tt=ct(o({},vt,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0})),Pt=ct(o({},ht,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:Ot})),jt=ct(o({},pt,{propertyName:0,elapsedTime:0,pseudoElement:0})),zt=o({},vt,{deltaX:function(e){return"deltaX"in e?e.deltaX:"wheelDeltaX"in e?-e.wheelDeltaX:0},deltaY:function(e){return"deltaY"in e?e.deltaY:"wheelDeltaY"in e?-e.wheelDeltaY:"wheelDelta"in e?-e.wheelDelta:0},deltaZ:0,deltaMode:0}),Rt=ct(zt),Mt=[9,13,27,32],Dt=f&&"CompositionEvent"in window,Nt=null;f&&"documentMode"in document&&(Nt=document.documentMode);var Lt=f&&"TextEvent"in window&&!Nt,Ft=f&&(!Dt||Nt&&8<Nt&&11>=Nt),Ut=String.fromCharCode(32),Wt=!1;function Ht(e,n){switch(e){case"keyup":return-1!==Mt.indexOf(n.keyCode);case"keydown":return 229!==n.keyCode;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function Gt(e){return"object"==typeof(e=e.detail)&&"data"in e?e.data:null}var qt=!1;var Vt={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function $t(e){var n=e&&e.nodeName&&e.nodeName.toLowerCase();return"input"===n?!!Vt[e.type]:"textarea"===n}function Kt(e,n,t,r){Te(r),0<(n=Dr(n,"onChange")).length&&(t=new dt("onChange","change",null,t,r),e.push({event:t,listeners:n}))}var Yt=null,Xt=null;function Zt(e){Br(e,0)}function Qt(e){if(Z(oo(e)))return e}function Jt(e,n){if("change"===e)return n}var er=!1;if(f){var nr;if(f){var tr="oninput"in document;if(!tr){var rr=document.createElement("div");rr.setAttribute("oninput","return;"),tr="function"==typeof rr.oninput}nr=tr}else nr=!1;er=nr&&(!document.documentMode||9<document.documentMode)}function or(){Yt&&(Yt.detachEvent("onpropertychange",ir),Xt=Yt=null)}function ir(e){if("value"===e.propertyName&&Qt(Xt)){var n=[];if(Kt(n,Xt,e,ke(e)),e=Zt,De)e(n);else{De=!0;try{je(e,n)}finally{De=!1,Le()}}}}function ar(e,n,t){"focusin"===e?(or(),Xt=t,(Yt=n).attachEvent("onpropertychange",ir)):"focusout"===e&&or()}function lr(e){if("selectionchange"===e||"keyup"===e||"keydown"===e)return Qt(Xt)}function cr(e,n){if("click"===e)return Qt(n)}function ur(e,n){if("input"===e||"change"===e)return Qt(n)}var sr="function"==typeof Object.is?Object.is:function(e,n){return e===n&&(0!==e||1/e==1/n)||e!=e&&n!=n},fr=Object.prototype.hasOwnProperty;function pr(e,n){if(sr(e,n))return!0;if("object"!=typeof e||null===e||"object"!=typeof n||null===n)return!1;var t=Object.keys(e),r=Object.keys(n);if(t.length!==r.length)return!1;for(r=0;r<t.length;r++)if(!fr.call(n,t[r])||!sr(e[t[r]],n[t[r]]))return!1;return!0}function dr(e){for(;e&&e.firstChild;)e=e.firstChild;return e}function hr(e,n){var t,r=dr(e);for(e=0;r;){if(3===r.nodeType){if(t=e+r.textContent.length,e<=n&&t>=n)return{node:r,offset:n-e};e=t}e:{for(;r;){if(r.nextSibling){r=r.nextSibling;break e}r=r.parentNode}r=void 0}r=dr(r)}}function gr(e,n){return!(!e||!n)&&(e===n||(!e||3!==e.nodeType)&&(n&&3===n.nodeType?gr(e,n.parentNode):"contains"in e?e.contains(n):!!e.compareDocumentPosition&&!!(16&e.compareDocumentPosition(n))))}function vr(){for(var e=window,n=Q();n instanceof e.HTMLIFrameElement;){try{var t="string"==typeof n.contentWindow.location.href}catch(e){t=!1}if(!t)break;n=Q((e=n.contentWindow).document)}return n}function Ar(e){var n=e&&e.nodeName&&e.nodeName.toLowerCase();return n&&("input"===n&&("text"===e.type||"search"===e.type||"tel"===e.type||"url"===e.type||"password"===e.type)||"textarea"===n||"true"===e.contentEditable)}var br=f&&"documentMode"in document&&11>=document.documentMode,mr=null,yr=null,Er=null,_r=!1;function Cr(e,n,t){var r=t.window===t?t.document:9===t.nodeType?t:t.ownerDocument;_r||null==mr||mr!==Q(r)||("selectionStart"in(r=mr)&&Ar(r)?r={start:r.selectionStart,end:r.selectionEnd}:r={anchorNode:(r=(r.ownerDocument&&r.ownerDocument.defaultView||window).getSelection()).anchorNode,anchorOffset:r.anchorOffset,focusNode:r.focusNode,focusOffset:r.focusOffset},Er&&pr(Er,r)||(Er=r,0<(r=Dr(yr,"onSelect")).length&&(n=new dt("onSelect","select",null,n,t),e.push({event:n,listeners:r}),n.target=mr)))}Mn("cancel cancel click click close close contextmenu contextMenu copy copy cut cut auxclick auxClick dblclick doubleClick dragend dragEnd dragstart dragStart drop drop focusin focus focusout blur input input invalid invalid keydown keyDown keypress keyPress keyup keyUp mousedown mouseDown mouseup mouseUp paste paste pause pause play play pointercancel pointerCancel pointerdown pointerDown pointerup pointerUp ratechange rateChange reset reset seeked seeked submit submit touchcancel touchCancel touchend touchEnd touchstart touchStart volumechange volumeChange".split(" "),0),Mn("drag drag dragenter dragEnter dragexit dragExit dragleave dragLeave dragover dragOver mousemove mouseMove mouseout mouseOut mouseover mouseOver pointermove pointerMove pointerout pointerOut pointerover pointerOver scroll scroll toggle toggle touchmove touchMove wheel wheel".split(" "),1),Mn(Rn,2);for(var wr="change selectionchange textInput compositionstart compositionend compositionupdate".split(" "),xr=0;xr<wr.length;xr++)zn.set(wr[xr],0);s("onMouseEnter",["mouseout","mouseover"]),s("onMouseLeave",["mouseout","mouseover"]),s("onPointerEnter",["pointerout","pointerover"]),s("onPointerLeave",["pointerout","pointerover"]),u("onChange","change click focusin focusout input keydown keyup selectionchange".split(" ")),u("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" ")),u("onBeforeInput",["compositionend","keypress","textInput","paste"]),u("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" ")),u("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" ")),u("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var kr="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),Sr=new Set("cancel close invalid load scroll toggle".split(" ").concat(kr));function Or(e,n,t){var r=e.type||"unknown-event";e.currentTarget=t,function(e,n,t,r,o,i,l,c,u){if(Ye.apply(this,arguments),Ge){if(!Ge)throw Error(a(198));var s=qe;Ge=!1,qe=null,Ve||(Ve=!0,$e=s)}}(r,n,void 0,e),e.currentTarget=null}function Br(e,n){n=0!=(4&n);for(var t=0;t<e.length;t++){var r=e[t],o=r.event;r=r.listeners;e:{var i=void 0;if(n)for(var a=r.length-1;0<=a;a--){var l=r[a],c=l.instance,u=l.currentTarget;if(l=l.listener,c!==i&&o.isPropagationStopped())break e;Or(o,l,u),i=c}else for(a=0;a<r.length;a++){if(c=(l=r[a]).instance,u=l.currentTarget,l=l.listener,c!==i&&o.isPropagationStopped())break e;Or(o,l,u),i=c}}}if(Ve)throw e=$e,Ve=!1,$e=null,e}function Ir(e,n){var t=ao(n),r=e+"__bubble";t.has(r)||(zr(n,e,2,!1),t.add(r))}var Tr="_reactListening"+Math.random().toString(36).slice(2);function Pr(e){e[Tr]||(e[Tr]=!0,l.forEach((function(n){Sr.has(n)||jr(n,!1,e,null),jr(n,!0,e,null)})))}function jr(e,n,t,r){var o=4<arguments.length&&void 0!==arguments[4]?arguments[4]:0,i=t;if("selectionchange"===e&&9!==t.nodeType&&(i=t.ownerDocument),null!==r&&!n&&Sr.has(e)){if("scroll"!==e)return;o|=2,i=r}var a=ao(i),l=e+"__"+(n?"capture":"bubble");a.has(l)||(n&&(o|=4),zr(i,e,o,n),a.add(l))}function zr(e,n,t,r){var o=zn.get(n);switch(void 0===o?2:o){case 0:o=Zn;break;case 1:o=Qn;break;default:o=Jn}t=o.bind(null,n,t,e),o=void 0,!Ue||"touchstart"!==n&&"touchmove"!==n&&"wheel"!==n||(o=!0),r?void 0!==o?e.addEventListener(n,t,{capture:!0,passive:o}):e.addEventListener(n,t,!0):void 0!==o?e.addEventListener(n,t,{passive:o}):e.addEventListener(n,t,!1)}function Rr(e,n,t,r,o){var i=r;if(0==(1&n)&&0==(2&n)&&null!==r)e:for(;;){if(null===r)return;var a=r.tag;if(3===a||4===a){var l=r.stateNode.containerInfo;if(l===o||8===l.nodeType&&l.parentNode===o)break;if(4===a)for(a=r.return;null!==a;){var c=a.tag;if((3===c||4===c)&&((c=a.stateNode.containerInfo)===o||8===c.nodeType&&c.parentNode===o))return;a=a.return}for(;null!==l;){if(null===(a=to(l)))return;if(5===(c=a.tag)||6===c){r=i=a;continue e}l=l.parentNode}}r=r.return}!function(e,n,t){if(Ne)return e(n,t);Ne=!0;try{Me(e,n,t)}finally{Ne=!1,Le()}}((function(){var r=i,o=ke(t),a=[];e:{var l=jn.get(e);if(void 0!==l){var c=dt,u=e;switch(e){case"keypress":if(0===it(t))break e;case"keydown":case"keyup":c=It;break;case"focusin":u="focus",c=mt;break;case"focusout":u="blur",c=mt;break;case"beforeblur":case"afterblur":c=mt;break;case"click":if(2===t.button)break e;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":c=At;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":c=bt;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":c=Pt;break;case Bn:case In:case Tn:c=yt;break;case Pn:c=jt;break;case"scroll":c=gt;break;case"wheel":c=Rt;break;case"copy":case"cut":case"paste":c=_t;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":c=Tt}var s=0!=(4&n),f=!s&&"scroll"===e,p=s?null!==l?l+"Capture":null:l;s=[];for(var d,h=r;null!==h;){var g=(d=h).stateNode;if(5===d.tag&&null!==g&&(d=g,null!==p&&(null!=(g=Fe(h,p))&&s.push(Mr(h,g,d)))),f)break;h=h.return}0<s.length&&(l=new c(l,u,null,t,o),a.push({event:l,listeners:s}))}}if(0==(7&n)){if(c="mouseout"===e||"pointerout"===e,(!(l="mouseover"===e||"pointerover"===e)||0!=(16&n)||!(u=t.relatedTarget||t.fromElement)||!to(u)&&!u[eo])&&(c||l)&&(l=o.window===o?o:(l=o.ownerDocument)?l.defaultView||l.parentWindow:window,c?(c=r,null!==(u=(u=t.relatedTarget||t.toElement)?to(u):null)&&(u!==(f=Xe(u))||5!==u.tag&&6!==u.tag)&&(u=null)):(c=null,u=r),c!==u)){if(s=At,g="onMouseLeave",p="onMouseEnter",h="mouse","pointerout"!==e&&"pointerover"!==e||(s=Tt,g="onPointerLeave",p="onPointerEnter",h="pointer"),f=null==c?l:oo(c),d=null==u?l:oo(u),(l=new s(g,h+"leave",c,t,o)).target=f,l.relatedTarget=d,g=null,to(o)===r&&((s=new s(p,h+"enter",u,t,o)).target=d,s.relatedTarget=f,g=s),f=g,c&&u)e:{for(p=u,h=0,d=s=c;d;d=Nr(d))h++;for(d=0,g=p;g;g=Nr(g))d++;for(;0<h-d;)s=Nr(s),h--;for(;0<d-h;)p=Nr(p),d--;for(;h--;){if(s===p||null!==p&&s===p.alternate)break e;s=Nr(s),p=Nr(p)}s=null}else s=null;null!==c&&Lr(a,l,c,s,!1),null!==u&&null!==f&&Lr(a,f,u,s,!0)}if("select"===(c=(l=r?oo(r):window).nodeName&&l.nodeName.toLowerCase())||"input"===c&&"file"===l.type)var v=Jt;else if($t(l))if(er)v=ur;else{v=lr;var A=ar}else(c=l.nodeName)&&"input"===c.toLowerCase()&&("checkbox"===l.type||"radio"===l.type)&&(v=cr);switch(v&&(v=v(e,r))?Kt(a,v,t,o):(A&&A(e,l,r),"focusout"===e&&(A=l._wrapperState)&&A.controlled&&"number"===l.type&&oe(l,"number",l.value)),A=r?oo(r):window,e){case"focusin":($t(A)||"true"===A.contentEditable)&&(mr=A,yr=r,Er=null);break;case"focusout":Er=yr=mr=null;break;case"mousedown":_r=!0;break;case"contextmenu":case"mouseup":case"dragend":_r=!1,Cr(a,t,o);break;case"selectionchange":if(br)break;case"keydown":case"keyup":Cr(a,t,o)}var b;if(Dt)e:{switch(e){case"compositionstart":var m="onCompositionStart";break e;case"compositionend":m="onCompositionEnd";break e;case"compositionupdate":m="onCompositionUpdate";break e}m=void 0}else qt?Ht(e,t)&&(m="onCompositionEnd"):"keydown"===e&&229===t.keyCode&&(m="onCompositionStart");m&&(Ft&&"ko"!==t.locale&&(qt||"onCompositionStart"!==m?"onCompositionEnd"===m&&qt&&(b=ot()):(tt="value"in(nt=o)?nt.value:nt.textContent,qt=!0)),0<(A=Dr(r,m)).length&&(m=new Ct(m,e,null,t,o),a.push({event:m,listeners:A}),b?m.data=b:null!==(b=Gt(t))&&(m.data=b))),(b=Lt?function(e,n){switch(e){case"compositionend":return Gt(n);case"keypress":return 32!==n.which?null:(Wt=!0,Ut);case"textInput":return(e=n.data)===Ut&&Wt?null:e;default:return null}}(e,t):function(e,n){if(qt)return"compositionend"===e||!Dt&&Ht(e,n)?(e=ot(),rt=tt=nt=null,qt=!1,e):null;switch(e){case"paste":default:return null;case"keypress":if(!(n.ctrlKey||n.altKey||n.metaKey)||n.ctrlKey&&n.altKey){if(n.char&&1<n.char.length)return n.char;if(n.which)return String.fromCharCode(n.which)}return null;case"compositionend":return Ft&&"ko"!==n.locale?null:n.data}}(e,t))&&(0<(r=Dr(r,"onBeforeInput")).length&&(o=new Ct("onBeforeInput","beforeinput",null,t,o),a.push({event:o,listeners:r}),o.data=b))}Br(a,n)}))}function Mr(e,n,t){return{instance:e,listener:n,currentTarget:t}}function Dr(e,n){for(var t=n+"Capture",r=[];null!==e;){var o=e,i=o.stateNode;5===o.tag&&null!==i&&(o=i,null!=(i=Fe(e,t))&&r.unshift(Mr(e,i,o)),null!=(i=Fe(e,n))&&r.push(Mr(e,i,o))),e=e.return}return r}function Nr(e){if(null===e)return null;do{e=e.return}while(e&&5!==e.tag);return e||null}function Lr(e,n,t,r,o){for(var i=n._reactName,a=[];null!==t&&t!==r;){var l=t,c=l.alternate,u=l.stateNode;if(null!==c&&c===r)break;5===l.tag&&null!==u&&(l=u,o?null!=(c=Fe(t,i))&&a.unshift(Mr(t,c,l)):o||null!=(c=Fe(t,i))&&a.push(Mr(t,c,l))),t=t.return}0!==a.length&&e.push({event:n,listeners:a})}function Fr(){}var Ur=null,Wr=null;function Hr(e,n){switch(e){case"button":case"input":case"select":case"textarea":return!!n.autoFocus}return!1}function Gr(e,n){return"textarea"===e||"option"===e||"noscript"===e||"string"==typeof n.children||"number"==typeof n.children||"object"==typeof n.dangerouslySetInnerHTML&&null!==n.dangerouslySetInnerHTML&&null!=n.dangerouslySetInnerHTML.__html}var qr="function"==typeof setTimeout?setTimeout:void 0,Vr="function"==typeof clearTimeout?clearTimeout:void 0;function $r(e){1===e.nodeType?e.textContent="":9===e.nodeType&&(null!=(e=e.body)&&(e.textContent=""))}function Kr(e){for(;null!=e;e=e.nextSibling){var n=e.nodeType;if(1===n||3===n)break}return e}function Yr(e){e=e.previousSibling;for(var n=0;e;){if(8===e.nodeType){var t=e.data;if("$"===t||"$!"===t||"$?"===t){if(0===n)return e;n--}else"/$"===t&&n++}e=e.previousSibling}return null}var Xr=0;var Zr=Math.random().toString(36).slice(2),Qr="__reactFiber$"+Zr,Jr="__reactProps$"+Zr,eo="__reactContainer$"+Zr,no="__reactEvents$"+Zr;function to(e){var n=e[Qr];if(n)return n;for(var t=e.parentNode;t;){if(n=t[eo]||t[Qr]){if(t=n.alternate,null!==n.child||null!==t&&null!==t.child)for(e=Yr(e);null!==e;){if(t=e[Qr])return t;e=Yr(e)}return n}t=(e=t).parentNode}return null}function ro(e){return!(e=e[Qr]||e[eo])||5!==e.tag&&6!==e.tag&&13!==e.tag&&3!==e.tag?null:e}function oo(e){if(5===e.tag||6===e.tag)return e.stateNode;throw Error(a(33))}function io(e){return e[Jr]||null}function ao(e){var n=e[no];return void 0===n&&(n=e[no]=new Set),n}var lo=[],co=-1;function uo(e){return{current:e}}function so(e){0>co||(e.current=lo[co],lo[co]=null,co--)}function fo(e,n){co++,lo[co]=e.current,e.current=n}var po={},ho=uo(po),go=uo(!1),vo=po;function Ao(e,n){var t=e.type.contextTypes;if(!t)return po;var r=e.stateNode;if(r&&r.__reactInternalMemoizedUnmaskedChildContext===n)return r.__reactInternalMemoizedMaskedChildContext;var o,i={};for(o in t)i[o]=n[o];return r&&((e=e.stateNode).__reactInternalMemoizedUnmaskedChildContext=n,e.__reactInternalMemoizedMaskedChildContext=i),i}function bo(e){return null!=(e=e.childContextTypes)}function mo(){so(go),so(ho)}function yo(e,n,t){if(ho.current!==po)throw Error(a(168));fo(ho,n),fo(go,t)}function Eo(e,n,t){var r=e.stateNode;if(e=n.childContextTypes,"function"!=typeof r.getChildContext)return t;for(var i in r=r.getChildContext())if(!(i in e))throw Error(a(108,$(n)||"Unknown",i));return o({},t,r)}function _o(e){return e=(e=e.stateNode)&&e.__reactInternalMemoizedMergedChildContext||po,vo=ho.current,fo(ho,e),fo(go,go.current),!0}function Co(e,n,t){var r=e.stateNode;if(!r)throw Error(a(169));t?(e=Eo(e,n,vo),r.__reactInternalMemoizedMergedChildContext=e,so(go),so(ho),fo(ho,e)):so(go),fo(go,t)}var wo=null,xo=null,ko=i.unstable_runWithPriority,So=i.unstable_scheduleCallback,Oo=i.unstable_cancelCallback,Bo=i.unstable_shouldYield,Io=i.unstable_requestPaint,To=i.unstable_now,Po=i.unstable_getCurrentPriorityLevel,jo=i.unstable_ImmediatePriority,zo=i.unstable_UserBlockingPriority,Ro=i.unstable_NormalPriority,Mo=i.unstable_LowPriority,Do=i.unstable_IdlePriority,No={},Lo=void 0!==Io?Io:function(){},Fo=null,Uo=null,Wo=!1,Ho=To(),Go=1e4>Ho?To:function(){return To()-Ho};function qo(){switch(Po()){case jo:return 99;case zo:return 98;case Ro:return 97;case Mo:return 96;case Do:return 95;default:throw Error(a(332))}}function Vo(e){switch(e){case 99:return jo;case 98:return zo;case 97:return Ro;case 96:return Mo;case 95:return Do;default:throw Error(a(332))}}function $o(e,n){return e=Vo(e),ko(e,n)}function Ko(e,n,t){return e=Vo(e),So(e,n,t)}function Yo(){if(null!==Uo){var e=Uo;Uo=null,Oo(e)}Xo()}function Xo(){if(!Wo&&null!==Fo){Wo=!0;var e=0;try{var n=Fo;$o(99,(function(){for(;e<n.length;e++){var t=n[e];do{t=t(!0)}while(null!==t)}})),Fo=null}catch(n){throw null!==Fo&&(Fo=Fo.slice(e+1)),So(jo,Yo),n}finally{Wo=!1}}}var Zo=E.ReactCurrentBatchConfig;function Qo(e,n){if(e&&e.defaultProps){for(var t in n=o({},n),e=e.defaultProps)void 0===n[t]&&(n[t]=e[t]);return n}return n}var Jo=uo(null),ei=null,ni=null,ti=null;function ri(){ti=ni=ei=null}function oi(e){var n=Jo.current;so(Jo),e.type._context._currentValue=n}function ii(e,n){for(;null!==e;){var t=e.alternate;if((e.childLanes&n)===n){if(null===t||(t.childLanes&n)===n)break;t.childLanes|=n}else e.childLanes|=n,null!==t&&(t.childLanes|=n);e=e.return}}function ai(e,n){ei=e,ti=ni=null,null!==(e=e.dependencies)&&null!==e.firstContext&&(0!=(e.lanes&n)&&(Da=!0),e.firstContext=null)}function li(e,n){if(ti!==e&&!1!==n&&0!==n)if("number"==typeof n&&1073741823!==n||(ti=e,n=1073741823),n={context:e,observedBits:n,next:null},null===ni){if(null===ei)throw Error(a(308));ni=n,ei.dependencies={lanes:0,firstContext:n,responders:null}}else ni=ni.next=n;return e._currentValue}var ci=!1;function ui(e){e.updateQueue={baseState:e.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null},effects:null}}function si(e,n){e=e.updateQueue,n.updateQueue===e&&(n.updateQueue={baseState:e.baseState,firstBaseUpdate:e.firstBaseUpdate,lastBaseUpdate:e.lastBaseUpdate,shared:e.shared,effects:e.effects})}function fi(e,n){return{eventTime:e,lane:n,tag:0,payload:null,callback:null,next:null}}function pi(e,n){if(null!==(e=e.updateQueue)){var t=(e=e.shared).pending;null===t?n.next=n:(n.next=t.next,t.next=n),e.pending=n}}function di(e,n){var t=e.updateQueue,r=e.alternate;if(null!==r&&t===(r=r.updateQueue)){var o=null,i=null;if(null!==(t=t.firstBaseUpdate)){do{var a={eventTime:t.eventTime,lane:t.lane,tag:t.tag,payload:t.payload,callback:t.callback,next:null};null===i?o=i=a:i=i.next=a,t=t.next}while(null!==t);null===i?o=i=n:i=i.next=n}else o=i=n;return t={baseState:r.baseState,firstBaseUpdate:o,lastBaseUpdate:i,shared:r.shared,effects:r.effects},void(e.updateQueue=t)}null===(e=t.lastBaseUpdate)?t.firstBaseUpdate=n:e.next=n,t.lastBaseUpdate=n}function hi(e,n,t,r){var i=e.updateQueue;ci=!1;var a=i.firstBaseUpdate,l=i.lastBaseUpdate,c=i.shared.pending;if(null!==c){i.shared.pending=null;var u=c,s=u.next;u.next=null,null===l?a=s:l.next=s,l=u;var f=e.alternate;if(null!==f){var p=(f=f.updateQueue).lastBaseUpdate;p!==l&&(null===p?f.firstBaseUpdate=s:p.next=s,f.lastBaseUpdate=u)}}if(null!==a){for(p=i.baseState,l=0,f=s=u=null;;){c=a.lane;var d=a.eventTime;if((r&c)===c){null!==f&&(f=f.next={eventTime:d,lane:0,tag:a.tag,payload:a.payload,callback:a.callback,next:null});e:{var h=e,g=a;switch(c=n,d=t,g.tag){case 1:if("function"==typeof(h=g.payload)){p=h.call(d,p,c);break e}p=h;break e;case 3:h.flags=-4097&h.flags|64;case 0:if(null==(c="function"==typeof(h=g.payload)?h.call(d,p,c):h))break e;p=o({},p,c);break e;case 2:ci=!0}}null!==a.callback&&(e.flags|=32,null===(c=i.effects)?i.effects=[a]:c.push(a))}else d={eventTime:d,lane:c,tag:a.tag,payload:a.payload,callback:a.callback,next:null},null===f?(s=f=d,u=p):f=f.next=d,l|=c;if(null===(a=a.next)){if(null===(c=i.shared.pending))break;a=c.next,c.next=null,i.lastBaseUpdate=c,i.shared.pending=null}}null===f&&(u=p),i.baseState=u,i.firstBaseUpdate=s,i.lastBaseUpdate=f,Ul|=l,e.lanes=l,e.memoizedState=p}}function gi(e,n,t){if(e=n.effects,n.effects=null,null!==e)for(n=0;n<e.length;n++){var r=e[n],o=r.callback;if(null!==o){if(r.callback=null,r=t,"function"!=typeof o)throw Error(a(191,o));o.call(r)}}}var vi=(new r.Component).refs;function Ai(e,n,t,r){t=null==(t=t(r,n=e.memoizedState))?n:o({},n,t),e.memoizedState=t,0===e.lanes&&(e.updateQueue.baseState=t)}var bi={isMounted:function(e){return!!(e=e._reactInternals)&&Xe(e)===e},enqueueSetState:function(e,n,t){e=e._reactInternals;var r=pc(),o=dc(e),i=fi(r,o);i.payload=n,null!=t&&(i.callback=t),pi(e,i),hc(e,o,r)},enqueueReplaceState:function(e,n,t){e=e._reactInternals;var r=pc(),o=dc(e),i=fi(r,o);i.tag=1,i.payload=n,null!=t&&(i.callback=t),pi(e,i),hc(e,o,r)},enqueueForceUpdate:function(e,n){e=e._reactInternals;var t=pc(),r=dc(e),o=fi(t,r);o.tag=2,null!=n&&(o.callback=n),pi(e,o),hc(e,r,t)}};function mi(e,n,t,r,o,i,a){return"function"==typeof(e=e.stateNode).shouldComponentUpdate?e.shouldComponentUpdate(r,i,a):!n.prototype||!n.prototype.isPureReactComponent||(!pr(t,r)||!pr(o,i))}function yi(e,n,t){var r=!1,o=po,i=n.contextType;return"object"==typeof i&&null!==i?i=li(i):(o=bo(n)?vo:ho.current,i=(r=null!=(r=n.contextTypes))?Ao(e,o):po),n=new n(t,i),e.memoizedState=null!==n.state&&void 0!==n.state?n.state:null,n.updater=bi,e.stateNode=n,n._reactInternals=e,r&&((e=e.stateNode).__reactInternalMemoizedUnmaskedChildContext=o,e.__reactInternalMemoizedMaskedChildContext=i),n}function Ei(e,n,t,r){e=n.state,"function"==typeof n.componentWillReceiveProps&&n.componentWillReceiveProps(t,r),"function"==typeof n.UNSAFE_componentWillReceiveProps&&n.UNSAFE_componentWillReceiveProps(t,r),n.state!==e&&bi.enqueueReplaceState(n,n.state,null)}function _i(e,n,t,r){var o=e.stateNode;o.props=t,o.state=e.memoizedState,o.refs=vi,ui(e);var i=n.contextType;"object"==typeof i&&null!==i?o.context=li(i):(i=bo(n)?vo:ho.current,o.context=Ao(e,i)),hi(e,t,o,r),o.state=e.memoizedState,"function"==typeof(i=n.getDerivedStateFromProps)&&(Ai(e,n,i,t),o.state=e.memoizedState),"function"==typeof n.getDerivedStateFromProps||"function"==typeof o.getSnapshotBeforeUpdate||"function"!=typeof o.UNSAFE_componentWillMount&&"function"!=typeof o.componentWillMount||(n=o.state,"function"==typeof o.componentWillMount&&o.componentWillMount(),"function"==typeof o.UNSAFE_componentWillMount&&o.UNSAFE_componentWillMount(),n!==o.state&&bi.enqueueReplaceState(o,o.state,null),hi(e,t,o,r),o.state=e.memoizedState),"function"==typeof o.componentDidMount&&(e.flags|=4)}var Ci=Array.isArray;function wi(e,n,t){if(null!==(e=t.ref)&&"function"!=typeof e&&"object"!=typeof e){if(t._owner){if(t=t._owner){if(1!==t.tag)throw Error(a(309));var r=t.stateNode}if(!r)throw Error(a(147,e));var o=""+e;return null!==n&&null!==n.ref&&"function"==typeof n.ref&&n.ref._stringRef===o?n.ref:(n=function(e){var n=r.refs;n===vi&&(n=r.refs={}),null===e?delete n[o]:n[o]=e},n._stringRef=o,n)}if("string"!=typeof e)throw Error(a(284));if(!t._owner)throw Error(a(290,e))}return e}function xi(e,n){if("textarea"!==e.type)throw Error(a(31,"[object Object]"===Object.prototype.toString.call(n)?"object with keys {"+Object.keys(n).join(", ")+"}":n))}function ki(e){function n(n,t){if(e){var r=n.lastEffect;null!==r?(r.nextEffect=t,n.lastEffect=t):n.firstEffect=n.lastEffect=t,t.nextEffect=null,t.flags=8}}function t(t,r){if(!e)return null;for(;null!==r;)n(t,r),r=r.sibling;return null}function r(e,n){for(e=new Map;null!==n;)null!==n.key?e.set(n.key,n):e.set(n.index,n),n=n.sibling;return e}function o(e,n){return(e=Vc(e,n)).index=0,e.sibling=null,e}function i(n,t,r){return n.index=r,e?null!==(r=n.alternate)?(r=r.index)<t?(n.flags=2,t):r:(n.flags=2,t):t}function l(n){return e&&null===n.alternate&&(n.flags=2),n}function c(e,n,t,r){return null===n||6!==n.tag?((n=Xc(t,e.mode,r)).return=e,n):((n=o(n,t)).return=e,n)}function u(e,n,t,r){return null!==n&&n.elementType===t.type?((r=o(n,t.props)).ref=wi(e,n,t),r.return=e,r):((r=$c(t.type,t.key,t.props,null,e.mode,r)).ref=wi(e,n,t),r.return=e,r)}function s(e,n,t,r){return null===n||4!==n.tag||n.stateNode.containerInfo!==t.containerInfo||n.stateNode.implementation!==t.implementation?((n=Zc(t,e.mode,r)).return=e,n):((n=o(n,t.children||[])).return=e,n)}function f(e,n,t,r,i){return null===n||7!==n.tag?((n=Kc(t,e.mode,r,i)).return=e,n):((n=o(n,t)).return=e,n)}function p(e,n,t){if("string"==typeof n||"number"==typeof n)return(n=Xc(""+n,e.mode,t)).return=e,n;if("object"==typeof n&&null!==n){switch(n.$$typeof){case _:return(t=$c(n.type,n.key,n.props,null,e.mode,t)).ref=wi(e,null,n),t.return=e,t;case C:return(n=Zc(n,e.mode,t)).return=e,n}if(Ci(n)||W(n))return(n=Kc(n,e.mode,t,null)).return=e,n;xi(e,n)}return null}function d(e,n,t,r){var o=null!==n?n.key:null;if("string"==typeof t||"number"==typeof t)return null!==o?null:c(e,n,""+t,r);if("object"==typeof t&&null!==t){switch(t.$$typeof){case _:return t.key===o?t.type===w?f(e,n,t.props.children,r,o):u(e,n,t,r):null;case C:return t.key===o?s(e,n,t,r):null}if(Ci(t)||W(t))return null!==o?null:f(e,n,t,r,null);xi(e,t)}return null}function h(e,n,t,r,o){if("string"==typeof r||"number"==typeof r)return c(n,e=e.get(t)||null,""+r,o);if("object"==typeof r&&null!==r){switch(r.$$typeof){case _:return e=e.get(null===r.key?t:r.key)||null,r.type===w?f(n,e,r.props.children,o,r.key):u(n,e,r,o);case C:return s(n,e=e.get(null===r.key?t:r.key)||null,r,o)}if(Ci(r)||W(r))return f(n,e=e.get(t)||null,r,o,null);xi(n,r)}return null}function g(o,a,l,c){for(var u=null,s=null,f=a,g=a=0,v=null;null!==f&&g<l.length;g++){f.index>g?(v=f,f=null):v=f.sibling;var A=d(o,f,l[g],c);if(null===A){null===f&&(f=v);break}e&&f&&null===A.alternate&&n(o,f),a=i(A,a,g),null===s?u=A:s.sibling=A,s=A,f=v}if(g===l.length)return t(o,f),u;if(null===f){for(;g<l.length;g++)null!==(f=p(o,l[g],c))&&(a=i(f,a,g),null===s?u=f:s.sibling=f,s=f);return u}for(f=r(o,f);g<l.length;g++)null!==(v=h(f,o,g,l[g],c))&&(e&&null!==v.alternate&&f.delete(null===v.key?g:v.key),a=i(v,a,g),null===s?u=v:s.sibling=v,s=v);return e&&f.forEach((function(e){return n(o,e)})),u}function v(o,l,c,u){var s=W(c);if("function"!=typeof s)throw Error(a(150));if(null==(c=s.call(c)))throw Error(a(151));for(var f=s=null,g=l,v=l=0,A=null,b=c.next();null!==g&&!b.done;v++,b=c.next()){g.index>v?(A=g,g=null):A=g.sibling;var m=d(o,g,b.value,u);if(null===m){null===g&&(g=A);break}e&&g&&null===m.alternate&&n(o,g),l=i(m,l,v),null===f?s=m:f.sibling=m,f=m,g=A}if(b.done)return t(o,g),s;if(null===g){for(;!b.done;v++,b=c.next())null!==(b=p(o,b.value,u))&&(l=i(b,l,v),null===f?s=b:f.sibling=b,f=b);return s}for(g=r(o,g);!b.done;v++,b=c.next())null!==(b=h(g,o,v,b.value,u))&&(e&&null!==b.alternate&&g.delete(null===b.key?v:b.key),l=i(b,l,v),null===f?s=b:f.sibling=b,f=b);return e&&g.forEach((function(e){return n(o,e)})),s}return function(e,r,i,c){var u="object"==typeof i&&null!==i&&i.type===w&&null===i.key;u&&(i=i.props.children);var s="object"==typeof i&&null!==i;if(s)switch(i.$$typeof){case _:e:{for(s=i.key,u=r;null!==u;){if(u.key===s){if(7===u.tag){if(i.type===w){t(e,u.sibling),(r=o(u,i.props.children)).return=e,e=r;break e}}else if(u.elementType===i.type){t(e,u.sibling),(r=o(u,i.props)).ref=wi(e,u,i),r.return=e,e=r;break e}t(e,u);break}n(e,u),u=u.sibling}i.type===w?((r=Kc(i.props.children,e.mode,c,i.key)).return=e,e=r):((c=$c(i.type,i.key,i.props,null,e.mode,c)).ref=wi(e,r,i),c.return=e,e=c)}return l(e);case C:e:{for(u=i.key;null!==r;){if(r.key===u){if(4===r.tag&&r.stateNode.containerInfo===i.containerInfo&&r.stateNode.implementation===i.implementation){t(e,r.sibling),(r=o(r,i.children||[])).return=e,e=r;break e}t(e,r);break}n(e,r),r=r.sibling}(r=Zc(i,e.mode,c)).return=e,e=r}return l(e)}if("string"==typeof i||"number"==typeof i)return i=""+i,null!==r&&6===r.tag?(t(e,r.sibling),(r=o(r,i)).return=e,e=r):(t(e,r),(r=Xc(i,e.mode,c)).return=e,e=r),l(e);if(Ci(i))return g(e,r,i,c);if(W(i))return v(e,r,i,c);if(s&&xi(e,i),void 0===i&&!u)switch(e.tag){case 1:case 22:case 0:case 11:case 15:throw Error(a(152,$(e.type)||"Component"))}return t(e,r)}}var Si=ki(!0),Oi=ki(!1),Bi={},Ii=uo(Bi),Ti=uo(Bi),Pi=uo(Bi);function ji(e){if(e===Bi)throw Error(a(174));return e}function zi(e,n){switch(fo(Pi,n),fo(Ti,e),fo(Ii,Bi),e=n.nodeType){case 9:case 11:n=(n=n.documentElement)?n.namespaceURI:he(null,"");break;default:n=he(n=(e=8===e?n.parentNode:n).namespaceURI||null,e=e.tagName)}so(Ii),fo(Ii,n)}function Ri(){so(Ii),so(Ti),so(Pi)}function Mi(e){ji(Pi.current);var n=ji(Ii.current),t=he(n,e.type);n!==t&&(fo(Ti,e),fo(Ii,t))}function Di(e){Ti.current===e&&(so(Ii),so(Ti))}var Ni=uo(0);function Li(e){for(var n=e;null!==n;){if(13===n.tag){var t=n.memoizedState;if(null!==t&&(null===(t=t.dehydrated)||"$?"===t.data||"$!"===t.data))return n}else if(19===n.tag&&void 0!==n.memoizedProps.revealOrder){if(0!=(64&n.flags))return n}else if(null!==n.child){n.child.return=n,n=n.child;continue}if(n===e)break;for(;null===n.sibling;){if(null===n.return||n.return===e)return null;n=n.return}n.sibling.return=n.return,n=n.sibling}return null}var Fi=null,Ui=null,Wi=!1;function Hi(e,n){var t=Gc(5,null,null,0);t.elementType="DELETED",t.type="DELETED",t.stateNode=n,t.return=e,t.flags=8,null!==e.lastEffect?(e.lastEffect.nextEffect=t,e.lastEffect=t):e.firstEffect=e.lastEffect=t}function Gi(e,n){switch(e.tag){case 5:var t=e.type;return null!==(n=1!==n.nodeType||t.toLowerCase()!==n.nodeName.toLowerCase()?null:n)&&(e.stateNode=n,!0);case 6:return null!==(n=""===e.pendingProps||3!==n.nodeType?null:n)&&(e.stateNode=n,!0);default:return!1}}function qi(e){if(Wi){var n=Ui;if(n){var t=n;if(!Gi(e,n)){if(!(n=Kr(t.nextSibling))||!Gi(e,n))return e.flags=-1025&e.flags|2,Wi=!1,void(Fi=e);Hi(Fi,t)}Fi=e,Ui=Kr(n.firstChild)}else e.flags=-1025&e.flags|2,Wi=!1,Fi=e}}function Vi(e){for(e=e.return;null!==e&&5!==e.tag&&3!==e.tag&&13!==e.tag;)e=e.return;Fi=e}function $i(e){if(e!==Fi)return!1;if(!Wi)return Vi(e),Wi=!0,!1;var n=e.type;if(5!==e.tag||"head"!==n&&"body"!==n&&!Gr(n,e.memoizedProps))for(n=Ui;n;)Hi(e,n),n=Kr(n.nextSibling);if(Vi(e),13===e.tag){if(!(e=null!==(e=e.memoizedState)?e.dehydrated:null))throw Error(a(317));e:{for(e=e.nextSibling,n=0;e;){if(8===e.nodeType){var t=e.data;if("/$"===t){if(0===n){Ui=Kr(e.nextSibling);break e}n--}else"$"!==t&&"$!"!==t&&"$?"!==t||n++}e=e.nextSibling}Ui=null}}else Ui=Fi?Kr(e.stateNode.nextSibling):null;return!0}function Ki(){Ui=Fi=null,Wi=!1}var Yi=[];function Xi(){for(var e=0;e<Yi.length;e++)Yi[e]._workInProgressVersionPrimary=null;Yi.length=0}var Zi=E.ReactCurrentDispatcher,Qi=E.ReactCurrentBatchConfig,Ji=0,ea=null,na=null,ta=null,ra=!1,oa=!1;function ia(){throw Error(a(321))}function aa(e,n){if(null===n)return!1;for(var t=0;t<n.length&&t<e.length;t++)if(!sr(e[t],n[t]))return!1;return!0}function la(e,n,t,r,o,i){if(Ji=i,ea=n,n.memoizedState=null,n.updateQueue=null,n.lanes=0,Zi.current=null===e||null===e.memoizedState?ja:za,e=t(r,o),oa){i=0;do{if(oa=!1,!(25>i))throw Error(a(301));i+=1,ta=na=null,n.updateQueue=null,Zi.current=Ra,e=t(r,o)}while(oa)}if(Zi.current=Pa,n=null!==na&&null!==na.next,Ji=0,ta=na=ea=null,ra=!1,n)throw Error(a(300));return e}function ca(){var e={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return null===ta?ea.memoizedState=ta=e:ta=ta.next=e,ta}function ua(){if(null===na){var e=ea.alternate;e=null!==e?e.memoizedState:null}else e=na.next;var n=null===ta?ea.memoizedState:ta.next;if(null!==n)ta=n,na=e;else{if(null===e)throw Error(a(310));e={memoizedState:(na=e).memoizedState,baseState:na.baseState,baseQueue:na.baseQueue,queue:na.queue,next:null},null===ta?ea.memoizedState=ta=e:ta=ta.next=e}return ta}function sa(e,n){return"function"==typeof n?n(e):n}function fa(e){var n=ua(),t=n.queue;if(null===t)throw Error(a(311));t.lastRenderedReducer=e;var r=na,o=r.baseQueue,i=t.pending;if(null!==i){if(null!==o){var l=o.next;o.next=i.next,i.next=l}r.baseQueue=o=i,t.pending=null}if(null!==o){o=o.next,r=r.baseState;var c=l=i=null,u=o;do{var s=u.lane;if((Ji&s)===s)null!==c&&(c=c.next={lane:0,action:u.action,eagerReducer:u.eagerReducer,eagerState:u.eagerState,next:null}),r=u.eagerReducer===e?u.eagerState:e(r,u.action);else{var f={lane:s,action:u.action,eagerReducer:u.eagerReducer,eagerState:u.eagerState,next:null};null===c?(l=c=f,i=r):c=c.next=f,ea.lanes|=s,Ul|=s}u=u.next}while(null!==u&&u!==o);null===c?i=r:c.next=l,sr(r,n.memoizedState)||(Da=!0),n.memoizedState=r,n.baseState=i,n.baseQueue=c,t.lastRenderedState=r}return[n.memoizedState,t.dispatch]}function pa(e){var n=ua(),t=n.queue;if(null===t)throw Error(a(311));t.lastRenderedReducer=e;var r=t.dispatch,o=t.pending,i=n.memoizedState;if(null!==o){t.pending=null;var l=o=o.next;do{i=e(i,l.action),l=l.next}while(l!==o);sr(i,n.memoizedState)||(Da=!0),n.memoizedState=i,null===n.baseQueue&&(n.baseState=i),t.lastRenderedState=i}return[i,r]}function da(e,n,t){var r=n._getVersion;r=r(n._source);var o=n._workInProgressVersionPrimary;if(null!==o?e=o===r:(e=e.mutableReadLanes,(e=(Ji&e)===e)&&(n._workInProgressVersionPrimary=r,Yi.push(n))),e)return t(n._source);throw Yi.push(n),Error(a(350))}function ha(e,n,t,r){var o=jl;if(null===o)throw Error(a(349));var i=n._getVersion,l=i(n._source),c=Zi.current,u=c.useState((function(){return da(o,n,t)})),s=u[1],f=u[0];u=ta;var p=e.memoizedState,d=p.refs,h=d.getSnapshot,g=p.source;p=p.subscribe;var v=ea;return e.memoizedState={refs:d,source:n,subscribe:r},c.useEffect((function(){d.getSnapshot=t,d.setSnapshot=s;var e=i(n._source);if(!sr(l,e)){e=t(n._source),sr(f,e)||(s(e),e=dc(v),o.mutableReadLanes|=e&o.pendingLanes),e=o.mutableReadLanes,o.entangledLanes|=e;for(var r=o.entanglements,a=e;0<a;){var c=31-qn(a),u=1<<c;r[c]|=e,a&=~u}}}),[t,n,r]),c.useEffect((function(){return r(n._source,(function(){var e=d.getSnapshot,t=d.setSnapshot;try{t(e(n._source));var r=dc(v);o.mutableReadLanes|=r&o.pendingLanes}catch(e){t((function(){throw e}))}}))}),[n,r]),sr(h,t)&&sr(g,n)&&sr(p,r)||((e={pending:null,dispatch:null,lastRenderedReducer:sa,lastRenderedState:f}).dispatch=s=Ta.bind(null,ea,e),u.queue=e,u.baseQueue=null,f=da(o,n,t),u.memoizedState=u.baseState=f),f}function ga(e,n,t){return ha(ua(),e,n,t)}function va(e){var n=ca();return"function"==typeof e&&(e=e()),n.memoizedState=n.baseState=e,e=(e=n.queue={pending:null,dispatch:null,lastRenderedReducer:sa,lastRenderedState:e}).dispatch=Ta.bind(null,ea,e),[n.memoizedState,e]}function Aa(e,n,t,r){return e={tag:e,create:n,destroy:t,deps:r,next:null},null===(n=ea.updateQueue)?(n={lastEffect:null},ea.updateQueue=n,n.lastEffect=e.next=e):null===(t=n.lastEffect)?n.lastEffect=e.next=e:(r=t.next,t.next=e,e.next=r,n.lastEffect=e),e}function ba(e){return e={current:e},ca().memoizedState=e}function ma(){return ua().memoizedState}function ya(e,n,t,r){var o=ca();ea.flags|=e,o.memoizedState=Aa(1|n,t,void 0,void 0===r?null:r)}function Ea(e,n,t,r){var o=ua();r=void 0===r?null:r;var i=void 0;if(null!==na){var a=na.memoizedState;if(i=a.destroy,null!==r&&aa(r,a.deps))return void Aa(n,t,i,r)}ea.flags|=e,o.memoizedState=Aa(1|n,t,i,r)}function _a(e,n){return ya(516,4,e,n)}function Ca(e,n){return Ea(516,4,e,n)}function wa(e,n){return Ea(4,2,e,n)}function xa(e,n){return"function"==typeof n?(e=e(),n(e),function(){n(null)}):null!=n?(e=e(),n.current=e,function(){n.current=null}):void 0}function ka(e,n,t){return t=null!=t?t.concat([e]):null,Ea(4,2,xa.bind(null,n,e),t)}function Sa(){}function Oa(e,n){var t=ua();n=void 0===n?null:n;var r=t.memoizedState;return null!==r&&null!==n&&aa(n,r[1])?r[0]:(t.memoizedState=[e,n],e)}function Ba(e,n){var t=ua();n=void 0===n?null:n;var r=t.memoizedState;return null!==r&&null!==n&&aa(n,r[1])?r[0]:(e=e(),t.memoizedState=[e,n],e)}function Ia(e,n){var t=qo();$o(98>t?98:t,(function(){e(!0)})),$o(97<t?97:t,(function(){var t=Qi.transition;Qi.transition=1;try{e(!1),n()}finally{Qi.transition=t}}))}function Ta(e,n,t){var r=pc(),o=dc(e),i={lane:o,action:t,eagerReducer:null,eagerState:null,next:null},a=n.pending;if(null===a?i.next=i:(i.next=a.next,a.next=i),n.pending=i,a=e.alternate,e===ea||null!==a&&a===ea)oa=ra=!0;else{if(0===e.lanes&&(null===a||0===a.lanes)&&null!==(a=n.lastRenderedReducer))try{var l=n.lastRenderedState,c=a(l,t);if(i.eagerReducer=a,i.eagerState=c,sr(c,l))return}catch(e){}hc(e,o,r)}}var Pa={readContext:li,useCallback:ia,useContext:ia,useEffect:ia,useImperativeHandle:ia,useLayoutEffect:ia,useMemo:ia,useReducer:ia,useRef:ia,useState:ia,useDebugValue:ia,useDeferredValue:ia,useTransition:ia,useMutableSource:ia,useOpaqueIdentifier:ia,unstable_isNewReconciler:!1},ja={readContext:li,useCallback:function(e,n){return ca().memoizedState=[e,void 0===n?null:n],e},useContext:li,useEffect:_a,useImperativeHandle:function(e,n,t){return t=null!=t?t.concat([e]):null,ya(4,2,xa.bind(null,n,e),t)},useLayoutEffect:function(e,n){return ya(4,2,e,n)},useMemo:function(e,n){var t=ca();return n=void 0===n?null:n,e=e(),t.memoizedState=[e,n],e},useReducer:function(e,n,t){var r=ca();return n=void 0!==t?t(n):n,r.memoizedState=r.baseState=n,e=(e=r.queue={pending:null,dispatch:null,lastRenderedReducer:e,lastRenderedState:n}).dispatch=Ta.bind(null,ea,e),[r.memoizedState,e]},useRef:ba,useState:va,useDebugValue:Sa,useDeferredValue:function(e){var n=va(e),t=n[0],r=n[1];return _a((function(){var n=Qi.transition;Qi.transition=1;try{r(e)}finally{Qi.transition=n}}),[e]),t},useTransition:function(){var e=va(!1),n=e[0];return ba(e=Ia.bind(null,e[1])),[e,n]},useMutableSource:function(e,n,t){var r=ca();return r.memoizedState={refs:{getSnapshot:n,setSnapshot:null},source:e,subscribe:t},ha(r,e,n,t)},useOpaqueIdentifier:function(){if(Wi){var e=!1,n=function(e){return{$$typeof:R,toString:e,valueOf:e}}((function(){throw e||(e=!0,t("r:"+(Xr++).toString(36))),Error(a(355))})),t=va(n)[1];return 0==(2&ea.mode)&&(ea.flags|=516,Aa(5,(function(){t("r:"+(Xr++).toString(36))}),void 0,null)),n}return va(n="r:"+(Xr++).toString(36)),n},unstable_isNewReconciler:!1},za={readContext:li,useCallback:Oa,useContext:li,useEffect:Ca,useImperativeHandle:ka,useLayoutEffect:wa,useMemo:Ba,useReducer:fa,useRef:ma,useState:function(){return fa(sa)},useDebugValue:Sa,useDeferredValue:function(e){var n=fa(sa),t=n[0],r=n[1];return Ca((function(){var n=Qi.transition;Qi.transition=1;try{r(e)}finally{Qi.transition=n}}),[e]),t},useTransition:function(){var e=fa(sa)[0];return[ma().current,e]},useMutableSource:ga,useOpaqueIdentifier:function(){return fa(sa)[0]},unstable_isNewReconciler:!1},Ra={readContext:li,useCallback:Oa,useContext:li,useEffect:Ca,useImperativeHandle:ka,useLayoutEffect:wa,useMemo:Ba,useReducer:pa,useRef:ma,useState:function(){return pa(sa)},useDebugValue:Sa,useDeferredValue:function(e){var n=pa(sa),t=n[0],r=n[1];return Ca((function(){var n=Qi.transition;Qi.transition=1;try{r(e)}finally{Qi.transition=n}}),[e]),t},useTransition:function(){var e=pa(sa)[0];return[ma().current,e]},useMutableSource:ga,useOpaqueIdentifier:function(){return pa(sa)[0]},unstable_isNewReconciler:!1},Ma=E.ReactCurrentOwner,Da=!1;function Na(e,n,t,r){n.child=null===e?Oi(n,null,t,r):Si(n,e.child,t,r)}function La(e,n,t,r,o){t=t.render;var i=n.ref;return ai(n,o),r=la(e,n,t,r,i,o),null===e||Da?(n.flags|=1,Na(e,n,r,o),n.child):(n.updateQueue=e.updateQueue,n.flags&=-517,e.lanes&=~o,il(e,n,o))}function Fa(e,n,t,r,o,i){if(null===e){var a=t.type;return"function"!=typeof a||qc(a)||void 0!==a.defaultProps||null!==t.compare||void 0!==t.defaultProps?((e=$c(t.type,null,r,n,n.mode,i)).ref=n.ref,e.return=n,n.child=e):(n.tag=15,n.type=a,Ua(e,n,a,r,o,i))}return a=e.child,0==(o&i)&&(o=a.memoizedProps,(t=null!==(t=t.compare)?t:pr)(o,r)&&e.ref===n.ref)?il(e,n,i):(n.flags|=1,(e=Vc(a,r)).ref=n.ref,e.return=n,n.child=e)}function Ua(e,n,t,r,o,i){if(null!==e&&pr(e.memoizedProps,r)&&e.ref===n.ref){if(Da=!1,0==(i&o))return n.lanes=e.lanes,il(e,n,i);0!=(16384&e.flags)&&(Da=!0)}return Ga(e,n,t,r,i)}function Wa(e,n,t){var r=n.pendingProps,o=r.children,i=null!==e?e.memoizedState:null;if("hidden"===r.mode||"unstable-defer-without-hiding"===r.mode)if(0==(4&n.mode))n.memoizedState={baseLanes:0},_c(n,t);else{if(0==(1073741824&t))return e=null!==i?i.baseLanes|t:t,n.lanes=n.childLanes=1073741824,n.memoizedState={baseLanes:e},_c(n,e),null;n.memoizedState={baseLanes:0},_c(n,null!==i?i.baseLanes:t)}else null!==i?(r=i.baseLanes|t,n.memoizedState=null):r=t,_c(n,r);return Na(e,n,o,t),n.child}function Ha(e,n){var t=n.ref;(null===e&&null!==t||null!==e&&e.ref!==t)&&(n.flags|=128)}function Ga(e,n,t,r,o){var i=bo(t)?vo:ho.current;return i=Ao(n,i),ai(n,o),t=la(e,n,t,r,i,o),null===e||Da?(n.flags|=1,Na(e,n,t,o),n.child):(n.updateQueue=e.updateQueue,n.flags&=-517,e.lanes&=~o,il(e,n,o))}function qa(e,n,t,r,o){if(bo(t)){var i=!0;_o(n)}else i=!1;if(ai(n,o),null===n.stateNode)null!==e&&(e.alternate=null,n.alternate=null,n.flags|=2),yi(n,t,r),_i(n,t,r,o),r=!0;else if(null===e){var a=n.stateNode,l=n.memoizedProps;a.props=l;var c=a.context,u=t.contextType;"object"==typeof u&&null!==u?u=li(u):u=Ao(n,u=bo(t)?vo:ho.current);var s=t.getDerivedStateFromProps,f="function"==typeof s||"function"==typeof a.getSnapshotBeforeUpdate;f||"function"!=typeof a.UNSAFE_componentWillReceiveProps&&"function"!=typeof a.componentWillReceiveProps||(l!==r||c!==u)&&Ei(n,a,r,u),ci=!1;var p=n.memoizedState;a.state=p,hi(n,r,a,o),c=n.memoizedState,l!==r||p!==c||go.current||ci?("function"==typeof s&&(Ai(n,t,s,r),c=n.memoizedState),(l=ci||mi(n,t,l,r,p,c,u))?(f||"function"!=typeof a.UNSAFE_componentWillMount&&"function"!=typeof a.componentWillMount||("function"==typeof a.componentWillMount&&a.componentWillMount(),"function"==typeof a.UNSAFE_componentWillMount&&a.UNSAFE_componentWillMount()),"function"==typeof a.componentDidMount&&(n.flags|=4)):("function"==typeof a.componentDidMount&&(n.flags|=4),n.memoizedProps=r,n.memoizedState=c),a.props=r,a.state=c,a.context=u,r=l):("function"==typeof a.componentDidMount&&(n.flags|=4),r=!1)}else{a=n.stateNode,si(e,n),l=n.memoizedProps,u=n.type===n.elementType?l:Qo(n.type,l),a.props=u,f=n.pendingProps,p=a.context,"object"==typeof(c=t.contextType)&&null!==c?c=li(c):c=Ao(n,c=bo(t)?vo:ho.current);var d=t.getDerivedStateFromProps;(s="function"==typeof d||"function"==typeof a.getSnapshotBeforeUpdate)||"function"!=typeof a.UNSAFE_componentWillReceiveProps&&"function"!=typeof a.componentWillReceiveProps||(l!==f||p!==c)&&Ei(n,a,r,c),ci=!1,p=n.memoizedState,a.state=p,hi(n,r,a,o);var h=n.memoizedState;l!==f||p!==h||go.current||ci?("function"==typeof d&&(Ai(n,t,d,r),h=n.memoizedState),(u=ci||mi(n,t,u,r,p,h,c))?(s||"function"!=typeof a.UNSAFE_componentWillUpdate&&"function"!=typeof a.componentWillUpdate||("function"==typeof a.componentWillUpdate&&a.componentWillUpdate(r,h,c),"function"==typeof a.UNSAFE_componentWillUpdate&&a.UNSAFE_componentWillUpdate(r,h,c)),"function"==typeof a.componentDidUpdate&&(n.flags|=4),"function"==typeof a.getSnapshotBeforeUpdate&&(n.flags|=256)):("function"!=typeof a.componentDidUpdate||l===e.memoizedProps&&p===e.memoizedState||(n.flags|=4),"function"!=typeof a.getSnapshotBeforeUpdate||l===e.memoizedProps&&p===e.memoizedState||(n.flags|=256),n.memoizedProps=r,n.memoizedState=h),a.props=r,a.state=h,a.context=c,r=u):("function"!=typeof a.componentDidUpdate||l===e.memoizedProps&&p===e.memoizedState||(n.flags|=4),"function"!=typeof a.getSnapshotBeforeUpdate||l===e.memoizedProps&&p===e.memoizedState||(n.flags|=256),r=!1)}return Va(e,n,t,r,i,o)}function Va(e,n,t,r,o,i){Ha(e,n);var a=0!=(64&n.flags);if(!r&&!a)return o&&Co(n,t,!1),il(e,n,i);r=n.stateNode,Ma.current=n;var l=a&&"function"!=typeof t.getDerivedStateFromError?null:r.render();return n.flags|=1,null!==e&&a?(n.child=Si(n,e.child,null,i),n.child=Si(n,null,l,i)):Na(e,n,l,i),n.memoizedState=r.state,o&&Co(n,t,!0),n.child}function $a(e){var n=e.stateNode;n.pendingContext?yo(0,n.pendingContext,n.pendingContext!==n.context):n.context&&yo(0,n.context,!1),zi(e,n.containerInfo)}var Ka,Ya,Xa,Za={dehydrated:null,retryLane:0};function Qa(e,n,t){var r,o=n.pendingProps,i=Ni.current,a=!1;return(r=0!=(64&n.flags))||(r=(null===e||null!==e.memoizedState)&&0!=(2&i)),r?(a=!0,n.flags&=-65):null!==e&&null===e.memoizedState||void 0===o.fallback||!0===o.unstable_avoidThisFallback||(i|=1),fo(Ni,1&i),null===e?(void 0!==o.fallback&&qi(n),e=o.children,i=o.fallback,a?(e=Ja(n,e,i,t),n.child.memoizedState={baseLanes:t},n.memoizedState=Za,e):"number"==typeof o.unstable_expectedLoadTime?(e=Ja(n,e,i,t),n.child.memoizedState={baseLanes:t},n.memoizedState=Za,n.lanes=33554432,e):((t=Yc({mode:"visible",children:e},n.mode,t,null)).return=n,n.child=t)):(e.memoizedState,a?(o=nl(e,n,o.children,o.fallback,t),a=n.child,i=e.child.memoizedState,a.memoizedState=null===i?{baseLanes:t}:{baseLanes:i.baseLanes|t},a.childLanes=e.childLanes&~t,n.memoizedState=Za,o):(t=el(e,n,o.children,t),n.memoizedState=null,t))}function Ja(e,n,t,r){var o=e.mode,i=e.child;return n={mode:"hidden",children:n},0==(2&o)&&null!==i?(i.childLanes=0,i.pendingProps=n):i=Yc(n,o,0,null),t=Kc(t,o,r,null),i.return=e,t.return=e,i.sibling=t,e.child=i,t}function el(e,n,t,r){var o=e.child;return e=o.sibling,t=Vc(o,{mode:"visible",children:t}),0==(2&n.mode)&&(t.lanes=r),t.return=n,t.sibling=null,null!==e&&(e.nextEffect=null,e.flags=8,n.firstEffect=n.lastEffect=e),n.child=t}function nl(e,n,t,r,o){var i=n.mode,a=e.child;e=a.sibling;var l={mode:"hidden",children:t};return 0==(2&i)&&n.child!==a?((t=n.child).childLanes=0,t.pendingProps=l,null!==(a=t.lastEffect)?(n.firstEffect=t.firstEffect,n.lastEffect=a,a.nextEffect=null):n.firstEffect=n.lastEffect=null):t=Vc(a,l),null!==e?r=Vc(e,r):(r=Kc(r,i,o,null)).flags|=2,r.return=n,t.return=n,t.sibling=r,n.child=t,r}function tl(e,n){e.lanes|=n;var t=e.alternate;null!==t&&(t.lanes|=n),ii(e.return,n)}function rl(e,n,t,r,o,i){var a=e.memoizedState;null===a?e.memoizedState={isBackwards:n,rendering:null,renderingStartTime:0,last:r,tail:t,tailMode:o,lastEffect:i}:(a.isBackwards=n,a.rendering=null,a.renderingStartTime=0,a.last=r,a.tail=t,a.tailMode=o,a.lastEffect=i)}function ol(e,n,t){var r=n.pendingProps,o=r.revealOrder,i=r.tail;if(Na(e,n,r.children,t),0!=(2&(r=Ni.current)))r=1&r|2,n.flags|=64;else{if(null!==e&&0!=(64&e.flags))e:for(e=n.child;null!==e;){if(13===e.tag)null!==e.memoizedState&&tl(e,t);else if(19===e.tag)tl(e,t);else if(null!==e.child){e.child.return=e,e=e.child;continue}if(e===n)break e;for(;null===e.sibling;){if(null===e.return||e.return===n)break e;e=e.return}e.sibling.return=e.return,e=e.sibling}r&=1}if(fo(Ni,r),0==(2&n.mode))n.memoizedState=null;else switch(o){case"forwards":for(t=n.child,o=null;null!==t;)null!==(e=t.alternate)&&null===Li(e)&&(o=t),t=t.sibling;null===(t=o)?(o=n.child,n.child=null):(o=t.sibling,t.sibling=null),rl(n,!1,o,t,i,n.lastEffect);break;case"backwards":for(t=null,o=n.child,n.child=null;null!==o;){if(null!==(e=o.alternate)&&null===Li(e)){n.child=o;break}e=o.sibling,o.sibling=t,t=o,o=e}rl(n,!0,t,null,i,n.lastEffect);break;case"together":rl(n,!1,null,null,void 0,n.lastEffect);break;default:n.memoizedState=null}return n.child}function il(e,n,t){if(null!==e&&(n.dependencies=e.dependencies),Ul|=n.lanes,0!=(t&n.childLanes)){if(null!==e&&n.child!==e.child)throw Error(a(153));if(null!==n.child){for(t=Vc(e=n.child,e.pendingProps),n.child=t,t.return=n;null!==e.sibling;)e=e.sibling,(t=t.sibling=Vc(e,e.pendingProps)).return=n;t.sibling=null}return n.child}return null}function al(e,n){if(!Wi)switch(e.tailMode){case"hidden":n=e.tail;for(var t=null;null!==n;)null!==n.alternate&&(t=n),n=n.sibling;null===t?e.tail=null:t.sibling=null;break;case"collapsed":t=e.tail;for(var r=null;null!==t;)null!==t.alternate&&(r=t),t=t.sibling;null===r?n||null===e.tail?e.tail=null:e.tail.sibling=null:r.sibling=null}}function ll(e,n,t){var r=n.pendingProps;switch(n.tag){case 2:case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return null;case 1:case 17:return bo(n.type)&&mo(),null;case 3:return Ri(),so(go),so(ho),Xi(),(r=n.stateNode).pendingContext&&(r.context=r.pendingContext,r.pendingContext=null),null!==e&&null!==e.child||($i(n)?n.flags|=4:r.hydrate||(n.flags|=256)),null;case 5:Di(n);var i=ji(Pi.current);if(t=n.type,null!==e&&null!=n.stateNode)Ya(e,n,t,r),e.ref!==n.ref&&(n.flags|=128);else{if(!r){if(null===n.stateNode)throw Error(a(166));return null}if(e=ji(Ii.current),$i(n)){r=n.stateNode,t=n.type;var l=n.memoizedProps;switch(r[Qr]=n,r[Jr]=l,t){case"dialog":Ir("cancel",r),Ir("close",r);break;case"iframe":case"object":case"embed":Ir("load",r);break;case"video":case"audio":for(e=0;e<kr.length;e++)Ir(kr[e],r);break;case"source":Ir("error",r);break;case"img":case"image":case"link":Ir("error",r),Ir("load",r);break;case"details":Ir("toggle",r);break;case"input":ee(r,l),Ir("invalid",r);break;case"select":r._wrapperState={wasMultiple:!!l.multiple},Ir("invalid",r);break;case"textarea":ce(r,l),Ir("invalid",r)}for(var u in we(t,l),e=null,l)l.hasOwnProperty(u)&&(i=l[u],"children"===u?"string"==typeof i?r.textContent!==i&&(e=["children",i]):"number"==typeof i&&r.textContent!==""+i&&(e=["children",""+i]):c.hasOwnProperty(u)&&null!=i&&"onScroll"===u&&Ir("scroll",r));switch(t){case"input":X(r),re(r,l,!0);break;case"textarea":X(r),se(r);break;case"select":case"option":break;default:"function"==typeof l.onClick&&(r.onclick=Fr)}r=e,n.updateQueue=r,null!==r&&(n.flags|=4)}else{switch(u=9===i.nodeType?i:i.ownerDocument,e===fe&&(e=de(t)),e===fe?"script"===t?((e=u.createElement("div")).innerHTML="<script><\/script>",e=e.removeChild(e.firstChild)):"string"==typeof r.is?e=u.createElement(t,{is:r.is}):(e=u.createElement(t),"select"===t&&(u=e,r.multiple?u.multiple=!0:r.size&&(u.size=r.size))):e=u.createElementNS(e,t),e[Qr]=n,e[Jr]=r,Ka(e,n),n.stateNode=e,u=xe(t,r),t){case"dialog":Ir("cancel",e),Ir("close",e),i=r;break;case"iframe":case"object":case"embed":Ir("load",e),i=r;break;case"video":case"audio":for(i=0;i<kr.length;i++)Ir(kr[i],e);i=r;break;case"source":Ir("error",e),i=r;break;case"img":case"image":case"link":Ir("error",e),Ir("load",e),i=r;break;case"details":Ir("toggle",e),i=r;break;case"input":ee(e,r),i=J(e,r),Ir("invalid",e);break;case"option":i=ie(e,r);break;case"select":e._wrapperState={wasMultiple:!!r.multiple},i=o({},r,{value:void 0}),Ir("invalid",e);break;case"textarea":ce(e,r),i=le(e,r),Ir("invalid",e);break;default:i=r}we(t,i);var s=i;for(l in s)if(s.hasOwnProperty(l)){var f=s[l];"style"===l?_e(e,f):"dangerouslySetInnerHTML"===l?null!=(f=f?f.__html:void 0)&&Ae(e,f):"children"===l?"string"==typeof f?("textarea"!==t||""!==f)&&be(e,f):"number"==typeof f&&be(e,""+f):"suppressContentEditableWarning"!==l&&"suppressHydrationWarning"!==l&&"autoFocus"!==l&&(c.hasOwnProperty(l)?null!=f&&"onScroll"===l&&Ir("scroll",e):null!=f&&y(e,l,f,u))}switch(t){case"input":X(e),re(e,r,!1);break;case"textarea":X(e),se(e);break;case"option":null!=r.value&&e.setAttribute("value",""+K(r.value));break;case"select":e.multiple=!!r.multiple,null!=(l=r.value)?ae(e,!!r.multiple,l,!1):null!=r.defaultValue&&ae(e,!!r.multiple,r.defaultValue,!0);break;default:"function"==typeof i.onClick&&(e.onclick=Fr)}Hr(t,r)&&(n.flags|=4)}null!==n.ref&&(n.flags|=128)}return null;case 6:if(e&&null!=n.stateNode)Xa(0,n,e.memoizedProps,r);else{if("string"!=typeof r&&null===n.stateNode)throw Error(a(166));t=ji(Pi.current),ji(Ii.current),$i(n)?(r=n.stateNode,t=n.memoizedProps,r[Qr]=n,r.nodeValue!==t&&(n.flags|=4)):((r=(9===t.nodeType?t:t.ownerDocument).createTextNode(r))[Qr]=n,n.stateNode=r)}return null;case 13:return so(Ni),r=n.memoizedState,0!=(64&n.flags)?(n.lanes=t,n):(r=null!==r,t=!1,null===e?void 0!==n.memoizedProps.fallback&&$i(n):t=null!==e.memoizedState,r&&!t&&0!=(2&n.mode)&&(null===e&&!0!==n.memoizedProps.unstable_avoidThisFallback||0!=(1&Ni.current)?0===Nl&&(Nl=3):(0!==Nl&&3!==Nl||(Nl=4),null===jl||0==(134217727&Ul)&&0==(134217727&Wl)||bc(jl,Rl))),(r||t)&&(n.flags|=4),null);case 4:return Ri(),null===e&&Pr(n.stateNode.containerInfo),null;case 10:return oi(n),null;case 19:if(so(Ni),null===(r=n.memoizedState))return null;if(l=0!=(64&n.flags),null===(u=r.rendering))if(l)al(r,!1);else{if(0!==Nl||null!==e&&0!=(64&e.flags))for(e=n.child;null!==e;){if(null!==(u=Li(e))){for(n.flags|=64,al(r,!1),null!==(l=u.updateQueue)&&(n.updateQueue=l,n.flags|=4),null===r.lastEffect&&(n.firstEffect=null),n.lastEffect=r.lastEffect,r=t,t=n.child;null!==t;)e=r,(l=t).flags&=2,l.nextEffect=null,l.firstEffect=null,l.lastEffect=null,null===(u=l.alternate)?(l.childLanes=0,l.lanes=e,l.child=null,l.memoizedProps=null,l.memoizedState=null,l.updateQueue=null,l.dependencies=null,l.stateNode=null):(l.childLanes=u.childLanes,l.lanes=u.lanes,l.child=u.child,l.memoizedProps=u.memoizedProps,l.memoizedState=u.memoizedState,l.updateQueue=u.updateQueue,l.type=u.type,e=u.dependencies,l.dependencies=null===e?null:{lanes:e.lanes,firstContext:e.firstContext}),t=t.sibling;return fo(Ni,1&Ni.current|2),n.child}e=e.sibling}null!==r.tail&&Go()>Vl&&(n.flags|=64,l=!0,al(r,!1),n.lanes=33554432)}else{if(!l)if(null!==(e=Li(u))){if(n.flags|=64,l=!0,null!==(t=e.updateQueue)&&(n.updateQueue=t,n.flags|=4),al(r,!0),null===r.tail&&"hidden"===r.tailMode&&!u.alternate&&!Wi)return null!==(n=n.lastEffect=r.lastEffect)&&(n.nextEffect=null),null}else 2*Go()-r.renderingStartTime>Vl&&1073741824!==t&&(n.flags|=64,l=!0,al(r,!1),n.lanes=33554432);r.isBackwards?(u.sibling=n.child,n.child=u):(null!==(t=r.last)?t.sibling=u:n.child=u,r.last=u)}return null!==r.tail?(t=r.tail,r.rendering=t,r.tail=t.sibling,r.lastEffect=n.lastEffect,r.renderingStartTime=Go(),t.sibling=null,n=Ni.current,fo(Ni,l?1&n|2:1&n),t):null;case 23:case 24:return Cc(),null!==e&&null!==e.memoizedState!=(null!==n.memoizedState)&&"unstable-defer-without-hiding"!==r.mode&&(n.flags|=4),null}throw Error(a(156,n.tag))}function cl(e){switch(e.tag){case 1:bo(e.type)&&mo();var n=e.flags;return 4096&n?(e.flags=-4097&n|64,e):null;case 3:if(Ri(),so(go),so(ho),Xi(),0!=(64&(n=e.flags)))throw Error(a(285));return e.flags=-4097&n|64,e;case 5:return Di(e),null;case 13:return so(Ni),4096&(n=e.flags)?(e.flags=-4097&n|64,e):null;case 19:return so(Ni),null;case 4:return Ri(),null;case 10:return oi(e),null;case 23:case 24:return Cc(),null;default:return null}}function ul(e,n){try{var t="",r=n;do{t+=V(r),r=r.return}while(r);var o=t}catch(e){o="\nError generating stack: "+e.message+"\n"+e.stack}return{value:e,source:n,stack:o}}function sl(e,n){try{console.error(n.value)}catch(e){setTimeout((function(){throw e}))}}Ka=function(e,n){for(var t=n.child;null!==t;){if(5===t.tag||6===t.tag)e.appendChild(t.stateNode);else if(4!==t.tag&&null!==t.child){t.child.return=t,t=t.child;continue}if(t===n)break;for(;null===t.sibling;){if(null===t.return||t.return===n)return;t=t.return}t.sibling.return=t.return,t=t.sibling}},Ya=function(e,n,t,r){var i=e.memoizedProps;if(i!==r){e=n.stateNode,ji(Ii.current);var a,l=null;switch(t){case"input":i=J(e,i),r=J(e,r),l=[];break;case"option":i=ie(e,i),r=ie(e,r),l=[];break;case"select":i=o({},i,{value:void 0}),r=o({},r,{value:void 0}),l=[];break;case"textarea":i=le(e,i),r=le(e,r),l=[];break;default:"function"!=typeof i.onClick&&"function"==typeof r.onClick&&(e.onclick=Fr)}for(f in we(t,r),t=null,i)if(!r.hasOwnProperty(f)&&i.hasOwnProperty(f)&&null!=i[f])if("style"===f){var u=i[f];for(a in u)u.hasOwnProperty(a)&&(t||(t={}),t[a]="")}else"dangerouslySetInnerHTML"!==f&&"children"!==f&&"suppressContentEditableWarning"!==f&&"suppressHydrationWarning"!==f&&"autoFocus"!==f&&(c.hasOwnProperty(f)?l||(l=[]):(l=l||[]).push(f,null));for(f in r){var s=r[f];if(u=null!=i?i[f]:void 0,r.hasOwnProperty(f)&&s!==u&&(null!=s||null!=u))if("style"===f)if(u){for(a in u)!u.hasOwnProperty(a)||s&&s.hasOwnProperty(a)||(t||(t={}),t[a]="");for(a in s)s.hasOwnProperty(a)&&u[a]!==s[a]&&(t||(t={}),t[a]=s[a])}else t||(l||(l=[]),l.push(f,t)),t=s;else"dangerouslySetInnerHTML"===f?(s=s?s.__html:void 0,u=u?u.__html:void 0,null!=s&&u!==s&&(l=l||[]).push(f,s)):"children"===f?"string"!=typeof s&&"number"!=typeof s||(l=l||[]).push(f,""+s):"suppressContentEditableWarning"!==f&&"suppressHydrationWarning"!==f&&(c.hasOwnProperty(f)?(null!=s&&"onScroll"===f&&Ir("scroll",e),l||u===s||(l=[])):"object"==typeof s&&null!==s&&s.$$typeof===R?s.toString():(l=l||[]).push(f,s))}t&&(l=l||[]).push("style",t);var f=l;(n.updateQueue=f)&&(n.flags|=4)}},Xa=function(e,n,t,r){t!==r&&(n.flags|=4)};var fl="function"==typeof WeakMap?WeakMap:Map;function pl(e,n,t){(t=fi(-1,t)).tag=3,t.payload={element:null};var r=n.value;return t.callback=function(){Xl||(Xl=!0,Zl=r),sl(0,n)},t}function dl(e,n,t){(t=fi(-1,t)).tag=3;var r=e.type.getDerivedStateFromError;if("function"==typeof r){var o=n.value;t.payload=function(){return sl(0,n),r(o)}}var i=e.stateNode;return null!==i&&"function"==typeof i.componentDidCatch&&(t.callback=function(){"function"!=typeof r&&(null===Ql?Ql=new Set([this]):Ql.add(this),sl(0,n));var e=n.stack;this.componentDidCatch(n.value,{componentStack:null!==e?e:""})}),t}var hl="function"==typeof WeakSet?WeakSet:Set;function gl(e){var n=e.ref;if(null!==n)if("function"==typeof n)try{n(null)}catch(n){Fc(e,n)}else n.current=null}function vl(e,n){switch(n.tag){case 0:case 11:case 15:case 22:case 5:case 6:case 4:case 17:return;case 1:if(256&n.flags&&null!==e){var t=e.memoizedProps,r=e.memoizedState;n=(e=n.stateNode).getSnapshotBeforeUpdate(n.elementType===n.type?t:Qo(n.type,t),r),e.__reactInternalSnapshotBeforeUpdate=n}return;case 3:return void(256&n.flags&&$r(n.stateNode.containerInfo))}throw Error(a(163))}function Al(e,n,t){switch(t.tag){case 0:case 11:case 15:case 22:if(null!==(n=null!==(n=t.updateQueue)?n.lastEffect:null)){e=n=n.next;do{if(3==(3&e.tag)){var r=e.create;e.destroy=r()}e=e.next}while(e!==n)}if(null!==(n=null!==(n=t.updateQueue)?n.lastEffect:null)){e=n=n.next;do{var o=e;r=o.next,0!=(4&(o=o.tag))&&0!=(1&o)&&(Dc(t,e),Mc(t,e)),e=r}while(e!==n)}return;case 1:return e=t.stateNode,4&t.flags&&(null===n?e.componentDidMount():(r=t.elementType===t.type?n.memoizedProps:Qo(t.type,n.memoizedProps),e.componentDidUpdate(r,n.memoizedState,e.__reactInternalSnapshotBeforeUpdate))),void(null!==(n=t.updateQueue)&&gi(t,n,e));case 3:if(null!==(n=t.updateQueue)){if(e=null,null!==t.child)switch(t.child.tag){case 5:case 1:e=t.child.stateNode}gi(t,n,e)}return;case 5:return e=t.stateNode,void(null===n&&4&t.flags&&Hr(t.type,t.memoizedProps)&&e.focus());case 6:case 4:case 12:case 19:case 17:case 20:case 21:case 23:case 24:return;case 13:return void(null===t.memoizedState&&(t=t.alternate,null!==t&&(t=t.memoizedState,null!==t&&(t=t.dehydrated,null!==t&&Cn(t)))))}throw Error(a(163))}function bl(e,n){for(var t=e;;){if(5===t.tag){var r=t.stateNode;if(n)"function"==typeof(r=r.style).setProperty?r.setProperty("display","none","important"):r.display="none";else{r=t.stateNode;var o=t.memoizedProps.style;o=null!=o&&o.hasOwnProperty("display")?o.display:null,r.style.display=Ee("display",o)}}else if(6===t.tag)t.stateNode.nodeValue=n?"":t.memoizedProps;else if((23!==t.tag&&24!==t.tag||null===t.memoizedState||t===e)&&null!==t.child){t.child.return=t,t=t.child;continue}if(t===e)break;for(;null===t.sibling;){if(null===t.return||t.return===e)return;t=t.return}t.sibling.return=t.return,t=t.sibling}}function ml(e,n){if(xo&&"function"==typeof xo.onCommitFiberUnmount)try{xo.onCommitFiberUnmount(wo,n)}catch(e){}switch(n.tag){case 0:case 11:case 14:case 15:case 22:if(null!==(e=n.updateQueue)&&null!==(e=e.lastEffect)){var t=e=e.next;do{var r=t,o=r.destroy;if(r=r.tag,void 0!==o)if(0!=(4&r))Dc(n,t);else{r=n;try{o()}catch(e){Fc(r,e)}}t=t.next}while(t!==e)}break;case 1:if(gl(n),"function"==typeof(e=n.stateNode).componentWillUnmount)try{e.props=n.memoizedProps,e.state=n.memoizedState,e.componentWillUnmount()}catch(e){Fc(n,e)}break;case 5:gl(n);break;case 4:xl(e,n)}}function yl(e){e.alternate=null,e.child=null,e.dependencies=null,e.firstEffect=null,e.lastEffect=null,e.memoizedProps=null,e.memoizedState=null,e.pendingProps=null,e.return=null,e.updateQueue=null}function El(e){return 5===e.tag||3===e.tag||4===e.tag}function _l(e){e:{for(var n=e.return;null!==n;){if(El(n))break e;n=n.return}throw Error(a(160))}var t=n;switch(n=t.stateNode,t.tag){case 5:var r=!1;break;case 3:case 4:n=n.containerInfo,r=!0;break;default:throw Error(a(161))}16&t.flags&&(be(n,""),t.flags&=-17);e:n:for(t=e;;){for(;null===t.sibling;){if(null===t.return||El(t.return)){t=null;break e}t=t.return}for(t.sibling.return=t.return,t=t.sibling;5!==t.tag&&6!==t.tag&&18!==t.tag;){if(2&t.flags)continue n;if(null===t.child||4===t.tag)continue n;t.child.return=t,t=t.child}if(!(2&t.flags)){t=t.stateNode;break e}}r?Cl(e,t,n):wl(e,t,n)}function Cl(e,n,t){var r=e.tag,o=5===r||6===r;if(o)e=o?e.stateNode:e.stateNode.instance,n?8===t.nodeType?t.parentNode.insertBefore(e,n):t.insertBefore(e,n):(8===t.nodeType?(n=t.parentNode).insertBefore(e,t):(n=t).appendChild(e),null!=(t=t._reactRootContainer)||null!==n.onclick||(n.onclick=Fr));else if(4!==r&&null!==(e=e.child))for(Cl(e,n,t),e=e.sibling;null!==e;)Cl(e,n,t),e=e.sibling}function wl(e,n,t){var r=e.tag,o=5===r||6===r;if(o)e=o?e.stateNode:e.stateNode.instance,n?t.insertBefore(e,n):t.appendChild(e);else if(4!==r&&null!==(e=e.child))for(wl(e,n,t),e=e.sibling;null!==e;)wl(e,n,t),e=e.sibling}function xl(e,n){for(var t,r,o=n,i=!1;;){if(!i){i=o.return;e:for(;;){if(null===i)throw Error(a(160));switch(t=i.stateNode,i.tag){case 5:r=!1;break e;case 3:case 4:t=t.containerInfo,r=!0;break e}i=i.return}i=!0}if(5===o.tag||6===o.tag){e:for(var l=e,c=o,u=c;;)if(ml(l,u),null!==u.child&&4!==u.tag)u.child.return=u,u=u.child;else{if(u===c)break e;for(;null===u.sibling;){if(null===u.return||u.return===c)break e;u=u.return}u.sibling.return=u.return,u=u.sibling}r?(l=t,c=o.stateNode,8===l.nodeType?l.parentNode.removeChild(c):l.removeChild(c)):t.removeChild(o.stateNode)}else if(4===o.tag){if(null!==o.child){t=o.stateNode.containerInfo,r=!0,o.child.return=o,o=o.child;continue}}else if(ml(e,o),null!==o.child){o.child.return=o,o=o.child;continue}if(o===n)break;for(;null===o.sibling;){if(null===o.return||o.return===n)return;4===(o=o.return).tag&&(i=!1)}o.sibling.return=o.return,o=o.sibling}}function kl(e,n){switch(n.tag){case 0:case 11:case 14:case 15:case 22:var t=n.updateQueue;if(null!==(t=null!==t?t.lastEffect:null)){var r=t=t.next;do{3==(3&r.tag)&&(e=r.destroy,r.destroy=void 0,void 0!==e&&e()),r=r.next}while(r!==t)}return;case 1:case 12:case 17:return;case 5:if(null!=(t=n.stateNode)){r=n.memoizedProps;var o=null!==e?e.memoizedProps:r;e=n.type;var i=n.updateQueue;if(n.updateQueue=null,null!==i){for(t[Jr]=r,"input"===e&&"radio"===r.type&&null!=r.name&&ne(t,r),xe(e,o),n=xe(e,r),o=0;o<i.length;o+=2){var l=i[o],c=i[o+1];"style"===l?_e(t,c):"dangerouslySetInnerHTML"===l?Ae(t,c):"children"===l?be(t,c):y(t,l,c,n)}switch(e){case"input":te(t,r);break;case"textarea":ue(t,r);break;case"select":e=t._wrapperState.wasMultiple,t._wrapperState.wasMultiple=!!r.multiple,null!=(i=r.value)?ae(t,!!r.multiple,i,!1):e!==!!r.multiple&&(null!=r.defaultValue?ae(t,!!r.multiple,r.defaultValue,!0):ae(t,!!r.multiple,r.multiple?[]:"",!1))}}}return;case 6:if(null===n.stateNode)throw Error(a(162));return void(n.stateNode.nodeValue=n.memoizedProps);case 3:return void((t=n.stateNode).hydrate&&(t.hydrate=!1,Cn(t.containerInfo)));case 13:return null!==n.memoizedState&&(ql=Go(),bl(n.child,!0)),void Sl(n);case 19:return void Sl(n);case 23:case 24:return void bl(n,null!==n.memoizedState)}throw Error(a(163))}function Sl(e){var n=e.updateQueue;if(null!==n){e.updateQueue=null;var t=e.stateNode;null===t&&(t=e.stateNode=new hl),n.forEach((function(n){var r=Wc.bind(null,e,n);t.has(n)||(t.add(n),n.then(r,r))}))}}function Ol(e,n){return null!==e&&(null===(e=e.memoizedState)||null!==e.dehydrated)&&(null!==(n=n.memoizedState)&&null===n.dehydrated)}var Bl=Math.ceil,Il=E.ReactCurrentDispatcher,Tl=E.ReactCurrentOwner,Pl=0,jl=null,zl=null,Rl=0,Ml=0,Dl=uo(0),Nl=0,Ll=null,Fl=0,Ul=0,Wl=0,Hl=0,Gl=null,ql=0,Vl=1/0;function $l(){Vl=Go()+500}var Kl,Yl=null,Xl=!1,Zl=null,Ql=null,Jl=!1,ec=null,nc=90,tc=[],rc=[],oc=null,ic=0,ac=null,lc=-1,cc=0,uc=0,sc=null,fc=!1;function pc(){return 0!=(48&Pl)?Go():-1!==lc?lc:lc=Go()}function dc(e){if(0==(2&(e=e.mode)))return 1;if(0==(4&e))return 99===qo()?1:2;if(0===cc&&(cc=Fl),0!==Zo.transition){0!==uc&&(uc=null!==Gl?Gl.pendingLanes:0),e=cc;var n=4186112&~uc;return 0===(n&=-n)&&(0===(n=(e=4186112&~e)&-e)&&(n=8192)),n}return e=qo(),0!=(4&Pl)&&98===e?e=Un(12,cc):e=Un(e=function(e){switch(e){case 99:return 15;case 98:return 10;case 97:case 96:return 8;case 95:return 2;default:return 0}}(e),cc),e}function hc(e,n,t){if(50<ic)throw ic=0,ac=null,Error(a(185));if(null===(e=gc(e,n)))return null;Gn(e,n,t),e===jl&&(Wl|=n,4===Nl&&bc(e,Rl));var r=qo();1===n?0!=(8&Pl)&&0==(48&Pl)?mc(e):(vc(e,t),0===Pl&&($l(),Yo())):(0==(4&Pl)||98!==r&&99!==r||(null===oc?oc=new Set([e]):oc.add(e)),vc(e,t)),Gl=e}function gc(e,n){e.lanes|=n;var t=e.alternate;for(null!==t&&(t.lanes|=n),t=e,e=e.return;null!==e;)e.childLanes|=n,null!==(t=e.alternate)&&(t.childLanes|=n),t=e,e=e.return;return 3===t.tag?t.stateNode:null}function vc(e,n){for(var t=e.callbackNode,r=e.suspendedLanes,o=e.pingedLanes,i=e.expirationTimes,l=e.pendingLanes;0<l;){var c=31-qn(l),u=1<<c,s=i[c];if(-1===s){if(0==(u&r)||0!=(u&o)){s=n,Nn(u);var f=Dn;i[c]=10<=f?s+250:6<=f?s+5e3:-1}}else s<=n&&(e.expiredLanes|=u);l&=~u}if(r=Ln(e,e===jl?Rl:0),n=Dn,0===r)null!==t&&(t!==No&&Oo(t),e.callbackNode=null,e.callbackPriority=0);else{if(null!==t){if(e.callbackPriority===n)return;t!==No&&Oo(t)}15===n?(t=mc.bind(null,e),null===Fo?(Fo=[t],Uo=So(jo,Xo)):Fo.push(t),t=No):14===n?t=Ko(99,mc.bind(null,e)):(t=function(e){switch(e){case 15:case 14:return 99;case 13:case 12:case 11:case 10:return 98;case 9:case 8:case 7:case 6:case 4:case 5:return 97;case 3:case 2:case 1:return 95;case 0:return 90;default:throw Error(a(358,e))}}(n),t=Ko(t,Ac.bind(null,e))),e.callbackPriority=n,e.callbackNode=t}}function Ac(e){if(lc=-1,uc=cc=0,0!=(48&Pl))throw Error(a(327));var n=e.callbackNode;if(Rc()&&e.callbackNode!==n)return null;var t=Ln(e,e===jl?Rl:0);if(0===t)return null;var r=t,o=Pl;Pl|=16;var i=kc();for(jl===e&&Rl===r||($l(),wc(e,r));;)try{Bc();break}catch(n){xc(e,n)}if(ri(),Il.current=i,Pl=o,null!==zl?r=0:(jl=null,Rl=0,r=Nl),0!=(Fl&Wl))wc(e,0);else if(0!==r){if(2===r&&(Pl|=64,e.hydrate&&(e.hydrate=!1,$r(e.containerInfo)),0!==(t=Fn(e))&&(r=Sc(e,t))),1===r)throw n=Ll,wc(e,0),bc(e,t),vc(e,Go()),n;switch(e.finishedWork=e.current.alternate,e.finishedLanes=t,r){case 0:case 1:throw Error(a(345));case 2:case 5:Pc(e);break;case 3:if(bc(e,t),(62914560&t)===t&&10<(r=ql+500-Go())){if(0!==Ln(e,0))break;if(((o=e.suspendedLanes)&t)!==t){pc(),e.pingedLanes|=e.suspendedLanes&o;break}e.timeoutHandle=qr(Pc.bind(null,e),r);break}Pc(e);break;case 4:if(bc(e,t),(4186112&t)===t)break;for(r=e.eventTimes,o=-1;0<t;){var l=31-qn(t);i=1<<l,(l=r[l])>o&&(o=l),t&=~i}if(t=o,10<(t=(120>(t=Go()-t)?120:480>t?480:1080>t?1080:1920>t?1920:3e3>t?3e3:4320>t?4320:1960*Bl(t/1960))-t)){e.timeoutHandle=qr(Pc.bind(null,e),t);break}Pc(e);break;default:throw Error(a(329))}}return vc(e,Go()),e.callbackNode===n?Ac.bind(null,e):null}function bc(e,n){for(n&=~Hl,n&=~Wl,e.suspendedLanes|=n,e.pingedLanes&=~n,e=e.expirationTimes;0<n;){var t=31-qn(n),r=1<<t;e[t]=-1,n&=~r}}function mc(e){if(0!=(48&Pl))throw Error(a(327));if(Rc(),e===jl&&0!=(e.expiredLanes&Rl)){var n=Rl,t=Sc(e,n);0!=(Fl&Wl)&&(t=Sc(e,n=Ln(e,n)))}else t=Sc(e,n=Ln(e,0));if(0!==e.tag&&2===t&&(Pl|=64,e.hydrate&&(e.hydrate=!1,$r(e.containerInfo)),0!==(n=Fn(e))&&(t=Sc(e,n))),1===t)throw t=Ll,wc(e,0),bc(e,n),vc(e,Go()),t;return e.finishedWork=e.current.alternate,e.finishedLanes=n,Pc(e),vc(e,Go()),null}function yc(e,n){var t=Pl;Pl|=1;try{return e(n)}finally{0===(Pl=t)&&($l(),Yo())}}function Ec(e,n){var t=Pl;Pl&=-2,Pl|=8;try{return e(n)}finally{0===(Pl=t)&&($l(),Yo())}}function _c(e,n){fo(Dl,Ml),Ml|=n,Fl|=n}function Cc(){Ml=Dl.current,so(Dl)}function wc(e,n){e.finishedWork=null,e.finishedLanes=0;var t=e.timeoutHandle;if(-1!==t&&(e.timeoutHandle=-1,Vr(t)),null!==zl)for(t=zl.return;null!==t;){var r=t;switch(r.tag){case 1:null!=(r=r.type.childContextTypes)&&mo();break;case 3:Ri(),so(go),so(ho),Xi();break;case 5:Di(r);break;case 4:Ri();break;case 13:case 19:so(Ni);break;case 10:oi(r);break;case 23:case 24:Cc()}t=t.return}jl=e,zl=Vc(e.current,null),Rl=Ml=Fl=n,Nl=0,Ll=null,Hl=Wl=Ul=0}function xc(e,n){for(;;){var t=zl;try{if(ri(),Zi.current=Pa,ra){for(var r=ea.memoizedState;null!==r;){var o=r.queue;null!==o&&(o.pending=null),r=r.next}ra=!1}if(Ji=0,ta=na=ea=null,oa=!1,Tl.current=null,null===t||null===t.return){Nl=1,Ll=n,zl=null;break}e:{var i=e,a=t.return,l=t,c=n;if(n=Rl,l.flags|=2048,l.firstEffect=l.lastEffect=null,null!==c&&"object"==typeof c&&"function"==typeof c.then){var u=c;if(0==(2&l.mode)){var s=l.alternate;s?(l.updateQueue=s.updateQueue,l.memoizedState=s.memoizedState,l.lanes=s.lanes):(l.updateQueue=null,l.memoizedState=null)}var f=0!=(1&Ni.current),p=a;do{var d;if(d=13===p.tag){var h=p.memoizedState;if(null!==h)d=null!==h.dehydrated;else{var g=p.memoizedProps;d=void 0!==g.fallback&&(!0!==g.unstable_avoidThisFallback||!f)}}if(d){var v=p.updateQueue;if(null===v){var A=new Set;A.add(u),p.updateQueue=A}else v.add(u);if(0==(2&p.mode)){if(p.flags|=64,l.flags|=16384,l.flags&=-2981,1===l.tag)if(null===l.alternate)l.tag=17;else{var b=fi(-1,1);b.tag=2,pi(l,b)}l.lanes|=1;break e}c=void 0,l=n;var m=i.pingCache;if(null===m?(m=i.pingCache=new fl,c=new Set,m.set(u,c)):void 0===(c=m.get(u))&&(c=new Set,m.set(u,c)),!c.has(l)){c.add(l);var y=Uc.bind(null,i,u,l);u.then(y,y)}p.flags|=4096,p.lanes=n;break e}p=p.return}while(null!==p);c=Error(($(l.type)||"A React component")+" suspended while rendering, but no fallback UI was specified.\n\nAdd a <Suspense fallback=...> component higher in the tree to provide a loading indicator or placeholder to display.")}5!==Nl&&(Nl=2),c=ul(c,l),p=a;do{switch(p.tag){case 3:i=c,p.flags|=4096,n&=-n,p.lanes|=n,di(p,pl(0,i,n));break e;case 1:i=c;var E=p.type,_=p.stateNode;if(0==(64&p.flags)&&("function"==typeof E.getDerivedStateFromError||null!==_&&"function"==typeof _.componentDidCatch&&(null===Ql||!Ql.has(_)))){p.flags|=4096,n&=-n,p.lanes|=n,di(p,dl(p,i,n));break e}}p=p.return}while(null!==p)}Tc(t)}catch(e){n=e,zl===t&&null!==t&&(zl=t=t.return);continue}break}}function kc(){var e=Il.current;return Il.current=Pa,null===e?Pa:e}function Sc(e,n){var t=Pl;Pl|=16;var r=kc();for(jl===e&&Rl===n||wc(e,n);;)try{Oc();break}catch(n){xc(e,n)}if(ri(),Pl=t,Il.current=r,null!==zl)throw Error(a(261));return jl=null,Rl=0,Nl}function Oc(){for(;null!==zl;)Ic(zl)}function Bc(){for(;null!==zl&&!Bo();)Ic(zl)}function Ic(e){var n=Kl(e.alternate,e,Ml);e.memoizedProps=e.pendingProps,null===n?Tc(e):zl=n,Tl.current=null}function Tc(e){var n=e;do{var t=n.alternate;if(e=n.return,0==(2048&n.flags)){if(null!==(t=ll(t,n,Ml)))return void(zl=t);if(24!==(t=n).tag&&23!==t.tag||null===t.memoizedState||0!=(1073741824&Ml)||0==(4&t.mode)){for(var r=0,o=t.child;null!==o;)r|=o.lanes|o.childLanes,o=o.sibling;t.childLanes=r}null!==e&&0==(2048&e.flags)&&(null===e.firstEffect&&(e.firstEffect=n.firstEffect),null!==n.lastEffect&&(null!==e.lastEffect&&(e.lastEffect.nextEffect=n.firstEffect),e.lastEffect=n.lastEffect),1<n.flags&&(null!==e.lastEffect?e.lastEffect.nextEffect=n:e.firstEffect=n,e.lastEffect=n))}else{if(null!==(t=cl(n)))return t.flags&=2047,void(zl=t);null!==e&&(e.firstEffect=e.lastEffect=null,e.flags|=2048)}if(null!==(n=n.sibling))return void(zl=n);zl=n=e}while(null!==n);0===Nl&&(Nl=5)}function Pc(e){var n=qo();return $o(99,jc.bind(null,e,n)),null}function jc(e,n){do{Rc()}while(null!==ec);if(0!=(48&Pl))throw Error(a(327));var t=e.finishedWork;if(null===t)return null;if(e.finishedWork=null,e.finishedLanes=0,t===e.current)throw Error(a(177));e.callbackNode=null;var r=t.lanes|t.childLanes,o=r,i=e.pendingLanes&~o;e.pendingLanes=o,e.suspendedLanes=0,e.pingedLanes=0,e.expiredLanes&=o,e.mutableReadLanes&=o,e.entangledLanes&=o,o=e.entanglements;for(var l=e.eventTimes,c=e.expirationTimes;0<i;){var u=31-qn(i),s=1<<u;o[u]=0,l[u]=-1,c[u]=-1,i&=~s}if(null!==oc&&0==(24&r)&&oc.has(e)&&oc.delete(e),e===jl&&(zl=jl=null,Rl=0),1<t.flags?null!==t.lastEffect?(t.lastEffect.nextEffect=t,r=t.firstEffect):r=t:r=t.firstEffect,null!==r){if(o=Pl,Pl|=32,Tl.current=null,Ur=Xn,Ar(l=vr())){if("selectionStart"in l)c={start:l.selectionStart,end:l.selectionEnd};else e:if(c=(c=l.ownerDocument)&&c.defaultView||window,(s=c.getSelection&&c.getSelection())&&0!==s.rangeCount){c=s.anchorNode,i=s.anchorOffset,u=s.focusNode,s=s.focusOffset;try{c.nodeType,u.nodeType}catch(e){c=null;break e}var f=0,p=-1,d=-1,h=0,g=0,v=l,A=null;n:for(;;){for(var b;v!==c||0!==i&&3!==v.nodeType||(p=f+i),v!==u||0!==s&&3!==v.nodeType||(d=f+s),3===v.nodeType&&(f+=v.nodeValue.length),null!==(b=v.firstChild);)A=v,v=b;for(;;){if(v===l)break n;if(A===c&&++h===i&&(p=f),A===u&&++g===s&&(d=f),null!==(b=v.nextSibling))break;A=(v=A).parentNode}v=b}c=-1===p||-1===d?null:{start:p,end:d}}else c=null;c=c||{start:0,end:0}}else c=null;Wr={focusedElem:l,selectionRange:c},Xn=!1,sc=null,fc=!1,Yl=r;do{try{zc()}catch(e){if(null===Yl)throw Error(a(330));Fc(Yl,e),Yl=Yl.nextEffect}}while(null!==Yl);sc=null,Yl=r;do{try{for(l=e;null!==Yl;){var m=Yl.flags;if(16&m&&be(Yl.stateNode,""),128&m){var y=Yl.alternate;if(null!==y){var E=y.ref;null!==E&&("function"==typeof E?E(null):E.current=null)}}switch(1038&m){case 2:_l(Yl),Yl.flags&=-3;break;case 6:_l(Yl),Yl.flags&=-3,kl(Yl.alternate,Yl);break;case 1024:Yl.flags&=-1025;break;case 1028:Yl.flags&=-1025,kl(Yl.alternate,Yl);break;case 4:kl(Yl.alternate,Yl);break;case 8:xl(l,c=Yl);var _=c.alternate;yl(c),null!==_&&yl(_)}Yl=Yl.nextEffect}}catch(e){if(null===Yl)throw Error(a(330));Fc(Yl,e),Yl=Yl.nextEffect}}while(null!==Yl);if(E=Wr,y=vr(),m=E.focusedElem,l=E.selectionRange,y!==m&&m&&m.ownerDocument&&gr(m.ownerDocument.documentElement,m)){null!==l&&Ar(m)&&(y=l.start,void 0===(E=l.end)&&(E=y),"selectionStart"in m?(m.selectionStart=y,m.selectionEnd=Math.min(E,m.value.length)):(E=(y=m.ownerDocument||document)&&y.defaultView||window).getSelection&&(E=E.getSelection(),c=m.textContent.length,_=Math.min(l.start,c),l=void 0===l.end?_:Math.min(l.end,c),!E.extend&&_>l&&(c=l,l=_,_=c),c=hr(m,_),i=hr(m,l),c&&i&&(1!==E.rangeCount||E.anchorNode!==c.node||E.anchorOffset!==c.offset||E.focusNode!==i.node||E.focusOffset!==i.offset)&&((y=y.createRange()).setStart(c.node,c.offset),E.removeAllRanges(),_>l?(E.addRange(y),E.extend(i.node,i.offset)):(y.setEnd(i.node,i.offset),E.addRange(y))))),y=[];for(E=m;E=E.parentNode;)1===E.nodeType&&y.push({element:E,left:E.scrollLeft,top:E.scrollTop});for("function"==typeof m.focus&&m.focus(),m=0;m<y.length;m++)(E=y[m]).element.scrollLeft=E.left,E.element.scrollTop=E.top}Xn=!!Ur,Wr=Ur=null,e.current=t,Yl=r;do{try{for(m=e;null!==Yl;){var C=Yl.flags;if(36&C&&Al(m,Yl.alternate,Yl),128&C){y=void 0;var w=Yl.ref;if(null!==w){var x=Yl.stateNode;Yl.tag,y=x,"function"==typeof w?w(y):w.current=y}}Yl=Yl.nextEffect}}catch(e){if(null===Yl)throw Error(a(330));Fc(Yl,e),Yl=Yl.nextEffect}}while(null!==Yl);Yl=null,Lo(),Pl=o}else e.current=t;if(Jl)Jl=!1,ec=e,nc=n;else for(Yl=r;null!==Yl;)n=Yl.nextEffect,Yl.nextEffect=null,8&Yl.flags&&((C=Yl).sibling=null,C.stateNode=null),Yl=n;if(0===(r=e.pendingLanes)&&(Ql=null),1===r?e===ac?ic++:(ic=0,ac=e):ic=0,t=t.stateNode,xo&&"function"==typeof xo.onCommitFiberRoot)try{xo.onCommitFiberRoot(wo,t,void 0,64==(64&t.current.flags))}catch(e){}if(vc(e,Go()),Xl)throw Xl=!1,e=Zl,Zl=null,e;return 0!=(8&Pl)||Yo(),null}function zc(){for(;null!==Yl;){var e=Yl.alternate;fc||null===sc||(0!=(8&Yl.flags)?en(Yl,sc)&&(fc=!0):13===Yl.tag&&Ol(e,Yl)&&en(Yl,sc)&&(fc=!0));var n=Yl.flags;0!=(256&n)&&vl(e,Yl),0==(512&n)||Jl||(Jl=!0,Ko(97,(function(){return Rc(),null}))),Yl=Yl.nextEffect}}function Rc(){if(90!==nc){var e=97<nc?97:nc;return nc=90,$o(e,Nc)}return!1}function Mc(e,n){tc.push(n,e),Jl||(Jl=!0,Ko(97,(function(){return Rc(),null})))}function Dc(e,n){rc.push(n,e),Jl||(Jl=!0,Ko(97,(function(){return Rc(),null})))}function Nc(){if(null===ec)return!1;var e=ec;if(ec=null,0!=(48&Pl))throw Error(a(331));var n=Pl;Pl|=32;var t=rc;rc=[];for(var r=0;r<t.length;r+=2){var o=t[r],i=t[r+1],l=o.destroy;if(o.destroy=void 0,"function"==typeof l)try{l()}catch(e){if(null===i)throw Error(a(330));Fc(i,e)}}for(t=tc,tc=[],r=0;r<t.length;r+=2){o=t[r],i=t[r+1];try{var c=o.create;o.destroy=c()}catch(e){if(null===i)throw Error(a(330));Fc(i,e)}}for(c=e.current.firstEffect;null!==c;)e=c.nextEffect,c.nextEffect=null,8&c.flags&&(c.sibling=null,c.stateNode=null),c=e;return Pl=n,Yo(),!0}function Lc(e,n,t){pi(e,n=pl(0,n=ul(t,n),1)),n=pc(),null!==(e=gc(e,1))&&(Gn(e,1,n),vc(e,n))}function Fc(e,n){if(3===e.tag)Lc(e,e,n);else for(var t=e.return;null!==t;){if(3===t.tag){Lc(t,e,n);break}if(1===t.tag){var r=t.stateNode;if("function"==typeof t.type.getDerivedStateFromError||"function"==typeof r.componentDidCatch&&(null===Ql||!Ql.has(r))){var o=dl(t,e=ul(n,e),1);if(pi(t,o),o=pc(),null!==(t=gc(t,1)))Gn(t,1,o),vc(t,o);else if("function"==typeof r.componentDidCatch&&(null===Ql||!Ql.has(r)))try{r.componentDidCatch(n,e)}catch(e){}break}}t=t.return}}function Uc(e,n,t){var r=e.pingCache;null!==r&&r.delete(n),n=pc(),e.pingedLanes|=e.suspendedLanes&t,jl===e&&(Rl&t)===t&&(4===Nl||3===Nl&&(62914560&Rl)===Rl&&500>Go()-ql?wc(e,0):Hl|=t),vc(e,n)}function Wc(e,n){var t=e.stateNode;null!==t&&t.delete(n),0===(n=0)&&(0==(2&(n=e.mode))?n=1:0==(4&n)?n=99===qo()?1:2:(0===cc&&(cc=Fl),0===(n=Wn(62914560&~cc))&&(n=4194304))),t=pc(),null!==(e=gc(e,n))&&(Gn(e,n,t),vc(e,t))}function Hc(e,n,t,r){this.tag=e,this.key=t,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.ref=null,this.pendingProps=n,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=r,this.flags=0,this.lastEffect=this.firstEffect=this.nextEffect=null,this.childLanes=this.lanes=0,this.alternate=null}function Gc(e,n,t,r){return new Hc(e,n,t,r)}function qc(e){return!(!(e=e.prototype)||!e.isReactComponent)}function Vc(e,n){var t=e.alternate;return null===t?((t=Gc(e.tag,n,e.key,e.mode)).elementType=e.elementType,t.type=e.type,t.stateNode=e.stateNode,t.alternate=e,e.alternate=t):(t.pendingProps=n,t.type=e.type,t.flags=0,t.nextEffect=null,t.firstEffect=null,t.lastEffect=null),t.childLanes=e.childLanes,t.lanes=e.lanes,t.child=e.child,t.memoizedProps=e.memoizedProps,t.memoizedState=e.memoizedState,t.updateQueue=e.updateQueue,n=e.dependencies,t.dependencies=null===n?null:{lanes:n.lanes,firstContext:n.firstContext},t.sibling=e.sibling,t.index=e.index,t.ref=e.ref,t}function $c(e,n,t,r,o,i){var l=2;if(r=e,"function"==typeof e)qc(e)&&(l=1);else if("string"==typeof e)l=5;else e:switch(e){case w:return Kc(t.children,o,i,n);case M:l=8,o|=16;break;case x:l=8,o|=1;break;case k:return(e=Gc(12,t,n,8|o)).elementType=k,e.type=k,e.lanes=i,e;case I:return(e=Gc(13,t,n,o)).type=I,e.elementType=I,e.lanes=i,e;case T:return(e=Gc(19,t,n,o)).elementType=T,e.lanes=i,e;case D:return Yc(t,o,i,n);case N:return(e=Gc(24,t,n,o)).elementType=N,e.lanes=i,e;default:if("object"==typeof e&&null!==e)switch(e.$$typeof){case S:l=10;break e;case O:l=9;break e;case B:l=11;break e;case P:l=14;break e;case j:l=16,r=null;break e;case z:l=22;break e}throw Error(a(130,null==e?e:typeof e,""))}return(n=Gc(l,t,n,o)).elementType=e,n.type=r,n.lanes=i,n}function Kc(e,n,t,r){return(e=Gc(7,e,r,n)).lanes=t,e}function Yc(e,n,t,r){return(e=Gc(23,e,r,n)).elementType=D,e.lanes=t,e}function Xc(e,n,t){return(e=Gc(6,e,null,n)).lanes=t,e}function Zc(e,n,t){return(n=Gc(4,null!==e.children?e.children:[],e.key,n)).lanes=t,n.stateNode={containerInfo:e.containerInfo,pendingChildren:null,implementation:e.implementation},n}function Qc(e,n,t){this.tag=n,this.containerInfo=e,this.finishedWork=this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.pendingContext=this.context=null,this.hydrate=t,this.callbackNode=null,this.callbackPriority=0,this.eventTimes=Hn(0),this.expirationTimes=Hn(-1),this.entangledLanes=this.finishedLanes=this.mutableReadLanes=this.expiredLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=Hn(0),this.mutableSourceEagerHydrationData=null}function Jc(e,n,t){var r=3<arguments.length&&void 0!==arguments[3]?arguments[3]:null;return{$$typeof:C,key:null==r?null:""+r,children:e,containerInfo:n,implementation:t}}function eu(e,n,t,r){var o=n.current,i=pc(),l=dc(o);e:if(t){n:{if(Xe(t=t._reactInternals)!==t||1!==t.tag)throw Error(a(170));var c=t;do{switch(c.tag){case 3:c=c.stateNode.context;break n;case 1:if(bo(c.type)){c=c.stateNode.__reactInternalMemoizedMergedChildContext;break n}}c=c.return}while(null!==c);throw Error(a(171))}if(1===t.tag){var u=t.type;if(bo(u)){t=Eo(t,u,c);break e}}t=c}else t=po;return null===n.context?n.context=t:n.pendingContext=t,(n=fi(i,l)).payload={element:e},null!==(r=void 0===r?null:r)&&(n.callback=r),pi(o,n),hc(o,l,i),l}function nu(e){return(e=e.current).child?(e.child.tag,e.child.stateNode):null}function tu(e,n){if(null!==(e=e.memoizedState)&&null!==e.dehydrated){var t=e.retryLane;e.retryLane=0!==t&&t<n?t:n}}function ru(e,n){tu(e,n),(e=e.alternate)&&tu(e,n)}function ou(e,n,t){var r=null!=t&&null!=t.hydrationOptions&&t.hydrationOptions.mutableSources||null;if(t=new Qc(e,n,null!=t&&!0===t.hydrate),n=Gc(3,null,null,2===n?7:1===n?3:0),t.current=n,n.stateNode=t,ui(n),e[eo]=t.current,Pr(8===e.nodeType?e.parentNode:e),r)for(e=0;e<r.length;e++){var o=(n=r[e])._getVersion;o=o(n._source),null==t.mutableSourceEagerHydrationData?t.mutableSourceEagerHydrationData=[n,o]:t.mutableSourceEagerHydrationData.push(n,o)}this._internalRoot=t}function iu(e){return!(!e||1!==e.nodeType&&9!==e.nodeType&&11!==e.nodeType&&(8!==e.nodeType||" react-mount-point-unstable "!==e.nodeValue))}function au(e,n,t,r,o){var i=t._reactRootContainer;if(i){var a=i._internalRoot;if("function"==typeof o){var l=o;o=function(){var e=nu(a);l.call(e)}}eu(n,a,e,o)}else{if(i=t._reactRootContainer=function(e,n){if(n||(n=!(!(n=e?9===e.nodeType?e.documentElement:e.firstChild:null)||1!==n.nodeType||!n.hasAttribute("data-reactroot"))),!n)for(var t;t=e.lastChild;)e.removeChild(t);return new ou(e,0,n?{hydrate:!0}:void 0)}(t,r),a=i._internalRoot,"function"==typeof o){var c=o;o=function(){var e=nu(a);c.call(e)}}Ec((function(){eu(n,a,e,o)}))}return nu(a)}function lu(e,n){var t=2<arguments.length&&void 0!==arguments[2]?arguments[2]:null;if(!iu(n))throw Error(a(200));return Jc(e,n,null,t)}Kl=function(e,n,t){var r=n.lanes;if(null!==e)if(e.memoizedProps!==n.pendingProps||go.current)Da=!0;else{if(0==(t&r)){switch(Da=!1,n.tag){case 3:$a(n),Ki();break;case 5:Mi(n);break;case 1:bo(n.type)&&_o(n);break;case 4:zi(n,n.stateNode.containerInfo);break;case 10:r=n.memoizedProps.value;var o=n.type._context;fo(Jo,o._currentValue),o._currentValue=r;break;case 13:if(null!==n.memoizedState)return 0!=(t&n.child.childLanes)?Qa(e,n,t):(fo(Ni,1&Ni.current),null!==(n=il(e,n,t))?n.sibling:null);fo(Ni,1&Ni.current);break;case 19:if(r=0!=(t&n.childLanes),0!=(64&e.flags)){if(r)return ol(e,n,t);n.flags|=64}if(null!==(o=n.memoizedState)&&(o.rendering=null,o.tail=null,o.lastEffect=null),fo(Ni,Ni.current),r)break;return null;case 23:case 24:return n.lanes=0,Wa(e,n,t)}return il(e,n,t)}Da=0!=(16384&e.flags)}else Da=!1;switch(n.lanes=0,n.tag){case 2:if(r=n.type,null!==e&&(e.alternate=null,n.alternate=null,n.flags|=2),e=n.pendingProps,o=Ao(n,ho.current),ai(n,t),o=la(null,n,r,e,o,t),n.flags|=1,"object"==typeof o&&null!==o&&"function"==typeof o.render&&void 0===o.$$typeof){if(n.tag=1,n.memoizedState=null,n.updateQueue=null,bo(r)){var i=!0;_o(n)}else i=!1;n.memoizedState=null!==o.state&&void 0!==o.state?o.state:null,ui(n);var l=r.getDerivedStateFromProps;"function"==typeof l&&Ai(n,r,l,e),o.updater=bi,n.stateNode=o,o._reactInternals=n,_i(n,r,e,t),n=Va(null,n,r,!0,i,t)}else n.tag=0,Na(null,n,o,t),n=n.child;return n;case 16:o=n.elementType;e:{switch(null!==e&&(e.alternate=null,n.alternate=null,n.flags|=2),e=n.pendingProps,o=(i=o._init)(o._payload),n.type=o,i=n.tag=function(e){if("function"==typeof e)return qc(e)?1:0;if(null!=e){if((e=e.$$typeof)===B)return 11;if(e===P)return 14}return 2}(o),e=Qo(o,e),i){case 0:n=Ga(null,n,o,e,t);break e;case 1:n=qa(null,n,o,e,t);break e;case 11:n=La(null,n,o,e,t);break e;case 14:n=Fa(null,n,o,Qo(o.type,e),r,t);break e}throw Error(a(306,o,""))}return n;case 0:return r=n.type,o=n.pendingProps,Ga(e,n,r,o=n.elementType===r?o:Qo(r,o),t);case 1:return r=n.type,o=n.pendingProps,qa(e,n,r,o=n.elementType===r?o:Qo(r,o),t);case 3:if($a(n),r=n.updateQueue,null===e||null===r)throw Error(a(282));if(r=n.pendingProps,o=null!==(o=n.memoizedState)?o.element:null,si(e,n),hi(n,r,null,t),(r=n.memoizedState.element)===o)Ki(),n=il(e,n,t);else{if((i=(o=n.stateNode).hydrate)&&(Ui=Kr(n.stateNode.containerInfo.firstChild),Fi=n,i=Wi=!0),i){if(null!=(e=o.mutableSourceEagerHydrationData))for(o=0;o<e.length;o+=2)(i=e[o])._workInProgressVersionPrimary=e[o+1],Yi.push(i);for(t=Oi(n,null,r,t),n.child=t;t;)t.flags=-3&t.flags|1024,t=t.sibling}else Na(e,n,r,t),Ki();n=n.child}return n;case 5:return Mi(n),null===e&&qi(n),r=n.type,o=n.pendingProps,i=null!==e?e.memoizedProps:null,l=o.children,Gr(r,o)?l=null:null!==i&&Gr(r,i)&&(n.flags|=16),Ha(e,n),Na(e,n,l,t),n.child;case 6:return null===e&&qi(n),null;case 13:return Qa(e,n,t);case 4:return zi(n,n.stateNode.containerInfo),r=n.pendingProps,null===e?n.child=Si(n,null,r,t):Na(e,n,r,t),n.child;case 11:return r=n.type,o=n.pendingProps,La(e,n,r,o=n.elementType===r?o:Qo(r,o),t);case 7:return Na(e,n,n.pendingProps,t),n.child;case 8:case 12:return Na(e,n,n.pendingProps.children,t),n.child;case 10:e:{r=n.type._context,o=n.pendingProps,l=n.memoizedProps,i=o.value;var c=n.type._context;if(fo(Jo,c._currentValue),c._currentValue=i,null!==l)if(c=l.value,0===(i=sr(c,i)?0:0|("function"==typeof r._calculateChangedBits?r._calculateChangedBits(c,i):1073741823))){if(l.children===o.children&&!go.current){n=il(e,n,t);break e}}else for(null!==(c=n.child)&&(c.return=n);null!==c;){var u=c.dependencies;if(null!==u){l=c.child;for(var s=u.firstContext;null!==s;){if(s.context===r&&0!=(s.observedBits&i)){1===c.tag&&((s=fi(-1,t&-t)).tag=2,pi(c,s)),c.lanes|=t,null!==(s=c.alternate)&&(s.lanes|=t),ii(c.return,t),u.lanes|=t;break}s=s.next}}else l=10===c.tag&&c.type===n.type?null:c.child;if(null!==l)l.return=c;else for(l=c;null!==l;){if(l===n){l=null;break}if(null!==(c=l.sibling)){c.return=l.return,l=c;break}l=l.return}c=l}Na(e,n,o.children,t),n=n.child}return n;case 9:return o=n.type,r=(i=n.pendingProps).children,ai(n,t),r=r(o=li(o,i.unstable_observedBits)),n.flags|=1,Na(e,n,r,t),n.child;case 14:return i=Qo(o=n.type,n.pendingProps),Fa(e,n,o,i=Qo(o.type,i),r,t);case 15:return Ua(e,n,n.type,n.pendingProps,r,t);case 17:return r=n.type,o=n.pendingProps,o=n.elementType===r?o:Qo(r,o),null!==e&&(e.alternate=null,n.alternate=null,n.flags|=2),n.tag=1,bo(r)?(e=!0,_o(n)):e=!1,ai(n,t),yi(n,r,o),_i(n,r,o,t),Va(null,n,r,!0,e,t);case 19:return ol(e,n,t);case 23:case 24:return Wa(e,n,t)}throw Error(a(156,n.tag))},ou.prototype.render=function(e){eu(e,this._internalRoot,null,null)},ou.prototype.unmount=function(){var e=this._internalRoot,n=e.containerInfo;eu(null,e,null,(function(){n[eo]=null}))},nn=function(e){13===e.tag&&(hc(e,4,pc()),ru(e,4))},tn=function(e){13===e.tag&&(hc(e,67108864,pc()),ru(e,67108864))},rn=function(e){if(13===e.tag){var n=pc(),t=dc(e);hc(e,t,n),ru(e,t)}},on=function(e,n){return n()},Se=function(e,n,t){switch(n){case"input":if(te(e,t),n=t.name,"radio"===t.type&&null!=n){for(t=e;t.parentNode;)t=t.parentNode;for(t=t.querySelectorAll("input[name="+JSON.stringify(""+n)+'][type="radio"]'),n=0;n<t.length;n++){var r=t[n];if(r!==e&&r.form===e.form){var o=io(r);if(!o)throw Error(a(90));Z(r),te(r,o)}}}break;case"textarea":ue(e,t);break;case"select":null!=(n=t.value)&&ae(e,!!t.multiple,n,!1)}},je=yc,ze=function(e,n,t,r,o){var i=Pl;Pl|=4;try{return $o(98,e.bind(null,n,t,r,o))}finally{0===(Pl=i)&&($l(),Yo())}},Re=function(){0==(49&Pl)&&(function(){if(null!==oc){var e=oc;oc=null,e.forEach((function(e){e.expiredLanes|=24&e.pendingLanes,vc(e,Go())}))}Yo()}(),Rc())},Me=function(e,n){var t=Pl;Pl|=2;try{return e(n)}finally{0===(Pl=t)&&($l(),Yo())}};var cu={Events:[ro,oo,io,Te,Pe,Rc,{current:!1}]},uu={findFiberByHostInstance:to,bundleType:0,version:"17.0.2",rendererPackageName:"react-dom"},su={bundleType:uu.bundleType,version:uu.version,rendererPackageName:uu.rendererPackageName,rendererConfig:uu.rendererConfig,overrideHookState:null,overrideHookStateDeletePath:null,overrideHookStateRenamePath:null,overrideProps:null,overridePropsDeletePath:null,overridePropsRenamePath:null,setSuspenseHandler:null,scheduleUpdate:null,currentDispatcherRef:E.ReactCurrentDispatcher,findHostInstanceByFiber:function(e){return null===(e=Je(e))?null:e.stateNode},findFiberByHostInstance:uu.findFiberByHostInstance||function(){return null},findHostInstancesForRefresh:null,scheduleRefresh:null,scheduleRoot:null,setRefreshHandler:null,getCurrentFiber:null};if("undefined"!=typeof __REACT_DEVTOOLS_GLOBAL_HOOK__){var fu=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!fu.isDisabled&&fu.supportsFiber)try{wo=fu.inject(su),xo=fu}catch(ve){}}n.createPortal=lu,n.findDOMNode=function(e){if(null==e)return null;if(1===e.nodeType)return e;var n=e._reactInternals;if(void 0===n){if("function"==typeof e.render)throw Error(a(188));throw Error(a(268,Object.keys(e)))}return e=null===(e=Je(n))?null:e.stateNode},n.render=function(e,n,t){if(!iu(n))throw Error(a(200));return au(null,e,n,!1,t)}},3935:(e,n,t)=>{"use strict";!function e(){if("undefined"!=typeof __REACT_DEVTOOLS_GLOBAL_HOOK__&&"function"==typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE)try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(e)}catch(e){console.error(e)}}(),e.exports=t(4448)},2408:(e,n,t)=>{"use strict";
+/** @license React v17.0.2
+ * react.production.min.js
+ *
+ * Copyright (c) Facebook, Inc. and its affiliates.
+ *
+ * This source code is licensed under the MIT license found in the
+ * LICENSE file in the root directory of this source tree.
+ */var r=t(7418),o=60103,i=60106;n.Fragment=60107,n.StrictMode=60108,n.Profiler=60114;var a=60109,l=60110,c=60112;n.Suspense=60113;var u=60115,s=60116;if("function"==typeof Symbol&&Symbol.for){var f=Symbol.for;o=f("react.element"),i=f("react.portal"),n.Fragment=f("react.fragment"),n.StrictMode=f("react.strict_mode"),n.Profiler=f("react.profiler"),a=f("react.provider"),l=f("react.context"),c=f("react.forward_ref"),n.Suspense=f("react.suspense"),u=f("react.memo"),s=f("react.lazy")}var p="function"==typeof Symbol&&Symbol.iterator;function d(e){for(var n="https://reactjs.org/docs/error-decoder.html?invariant="+e,t=1;t<arguments.length;t++)n+="&args[]="+encodeURIComponent(arguments[t]);return"Minified React error #"+e+"; visit "+n+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}var h={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},g={};function v(e,n,t){this.props=e,this.context=n,this.refs=g,this.updater=t||h}function A(){}function b(e,n,t){this.props=e,this.context=n,this.refs=g,this.updater=t||h}v.prototype.isReactComponent={},v.prototype.setState=function(e,n){if("object"!=typeof e&&"function"!=typeof e&&null!=e)throw Error(d(85));this.updater.enqueueSetState(this,e,n,"setState")},v.prototype.forceUpdate=function(e){this.updater.enqueueForceUpdate(this,e,"forceUpdate")},A.prototype=v.prototype;var m=b.prototype=new A;m.constructor=b,r(m,v.prototype),m.isPureReactComponent=!0;var y={current:null},E=Object.prototype.hasOwnProperty,_={key:!0,ref:!0,__self:!0,__source:!0};function C(e,n,t){var r,i={},a=null,l=null;if(null!=n)for(r in void 0!==n.ref&&(l=n.ref),void 0!==n.key&&(a=""+n.key),n)E.call(n,r)&&!_.hasOwnProperty(r)&&(i[r]=n[r]);var c=arguments.length-2;if(1===c)i.children=t;else if(1<c){for(var u=Array(c),s=0;s<c;s++)u[s]=arguments[s+2];i.children=u}if(e&&e.defaultProps)for(r in c=e.defaultProps)void 0===i[r]&&(i[r]=c[r]);return{$$typeof:o,type:e,key:a,ref:l,props:i,_owner:y.current}}function w(e){return"object"==typeof e&&null!==e&&e.$$typeof===o}var x=/\/+/g;function k(e,n){return"object"==typeof e&&null!==e&&null!=e.key?function(e){var n={"=":"=0",":":"=2"};return"$"+e.replace(/[=:]/g,(function(e){return n[e]}))}(""+e.key):n.toString(36)}function S(e,n,t,r,a){var l=typeof e;"undefined"!==l&&"boolean"!==l||(e=null);var c=!1;if(null===e)c=!0;else switch(l){case"string":case"number":c=!0;break;case"object":switch(e.$$typeof){case o:case i:c=!0}}if(c)return a=a(c=e),e=""===r?"."+k(c,0):r,Array.isArray(a)?(t="",null!=e&&(t=e.replace(x,"$&/")+"/"),S(a,n,t,"",(function(e){return e}))):null!=a&&(w(a)&&(a=function(e,n){return{$$typeof:o,type:e.type,key:n,ref:e.ref,props:e.props,_owner:e._owner}}(a,t+(!a.key||c&&c.key===a.key?"":(""+a.key).replace(x,"$&/")+"/")+e)),n.push(a)),1;if(c=0,r=""===r?".":r+":",Array.isArray(e))for(var u=0;u<e.length;u++){var s=r+k(l=e[u],u);c+=S(l,n,t,s,a)}else if(s=function(e){return null===e||"object"!=typeof e?null:"function"==typeof(e=p&&e[p]||e["@@iterator"])?e:null}(e),"function"==typeof s)for(e=s.call(e),u=0;!(l=e.next()).done;)c+=S(l=l.value,n,t,s=r+k(l,u++),a);else if("object"===l)throw n=""+e,Error(d(31,"[object Object]"===n?"object with keys {"+Object.keys(e).join(", ")+"}":n));return c}function O(e,n,t){if(null==e)return e;var r=[],o=0;return S(e,r,"","",(function(e){return n.call(t,e,o++)})),r}function B(e){if(-1===e._status){var n=e._result;n=n(),e._status=0,e._result=n,n.then((function(n){0===e._status&&(n=n.default,e._status=1,e._result=n)}),(function(n){0===e._status&&(e._status=2,e._result=n)}))}if(1===e._status)return e._result;throw e._result}var I={current:null};function T(){var e=I.current;if(null===e)throw Error(d(321));return e}var P={ReactCurrentDispatcher:I,ReactCurrentBatchConfig:{transition:0},ReactCurrentOwner:y,IsSomeRendererActing:{current:!1},assign:r};n.Children={map:O,forEach:function(e,n,t){O(e,(function(){n.apply(this,arguments)}),t)},count:function(e){var n=0;return O(e,(function(){n++})),n},toArray:function(e){return O(e,(function(e){return e}))||[]},only:function(e){if(!w(e))throw Error(d(143));return e}},n.Component=v,n.PureComponent=b,n.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=P,n.cloneElement=function(e,n,t){if(null==e)throw Error(d(267,e));var i=r({},e.props),a=e.key,l=e.ref,c=e._owner;if(null!=n){if(void 0!==n.ref&&(l=n.ref,c=y.current),void 0!==n.key&&(a=""+n.key),e.type&&e.type.defaultProps)var u=e.type.defaultProps;for(s in n)E.call(n,s)&&!_.hasOwnProperty(s)&&(i[s]=void 0===n[s]&&void 0!==u?u[s]:n[s])}var s=arguments.length-2;if(1===s)i.children=t;else if(1<s){u=Array(s);for(var f=0;f<s;f++)u[f]=arguments[f+2];i.children=u}return{$$typeof:o,type:e.type,key:a,ref:l,props:i,_owner:c}},n.createContext=function(e,n){return void 0===n&&(n=null),(e={$$typeof:l,_calculateChangedBits:n,_currentValue:e,_currentValue2:e,_threadCount:0,Provider:null,Consumer:null}).Provider={$$typeof:a,_context:e},e.Consumer=e},n.createElement=C,n.createFactory=function(e){var n=C.bind(null,e);return n.type=e,n},n.createRef=function(){return{current:null}},n.forwardRef=function(e){return{$$typeof:c,render:e}},n.isValidElement=w,n.lazy=function(e){return{$$typeof:s,_payload:{_status:-1,_result:e},_init:B}},n.memo=function(e,n){return{$$typeof:u,type:e,compare:void 0===n?null:n}},n.useCallback=function(e,n){return T().useCallback(e,n)},n.useContext=function(e,n){return T().useContext(e,n)},n.useDebugValue=function(){},n.useEffect=function(e,n){return T().useEffect(e,n)},n.useImperativeHandle=function(e,n,t){return T().useImperativeHandle(e,n,t)},n.useLayoutEffect=function(e,n){return T().useLayoutEffect(e,n)},n.useMemo=function(e,n){return T().useMemo(e,n)},n.useReducer=function(e,n,t){return T().useReducer(e,n,t)},n.useRef=function(e){return T().useRef(e)},n.useState=function(e){return T().useState(e)},n.version="17.0.2"},7294:(e,n,t)=>{"use strict";e.exports=t(2408)},3697:e=>{"use strict";var n=Object,t=TypeError;e.exports=function(){if(null!=this&&this!==n(this))throw new t("RegExp.prototype.flags getter called on non-object");var e="";return this.global&&(e+="g"),this.ignoreCase&&(e+="i"),this.multiline&&(e+="m"),this.dotAll&&(e+="s"),this.unicode&&(e+="u"),this.sticky&&(e+="y"),e}},2847:(e,n,t)=>{"use strict";var r=t(4289),o=t(5559),i=t(3697),a=t(1721),l=t(2753),c=o(i);r(c,{getPolyfill:a,implementation:i,shim:l}),e.exports=c},1721:(e,n,t)=>{"use strict";var r=t(3697),o=t(4289).supportsDescriptors,i=Object.getOwnPropertyDescriptor,a=TypeError;e.exports=function(){if(!o)throw new a("RegExp.prototype.flags requires a true ES5 environment that supports property descriptors");if("gim"===/a/gim.flags){var e=i(RegExp.prototype,"flags");if(e&&"function"==typeof e.get&&"boolean"==typeof/a/.dotAll)return e.get}return r}},2753:(e,n,t)=>{"use strict";var r=t(4289).supportsDescriptors,o=t(1721),i=Object.getOwnPropertyDescriptor,a=Object.defineProperty,l=TypeError,c=Object.getPrototypeOf,u=/a/;e.exports=function(){if(!r||!c)throw new l("RegExp.prototype.flags requires a true ES5 environment that supports property descriptors");var e=o(),n=c(u),t=i(n,"flags");return t&&t.get===e||a(n,"flags",{configurable:!0,enumerable:!1,get:e}),e}},53:(e,n)=>{"use strict";
+/** @license React v0.20.2
+ * scheduler.production.min.js
+ *
+ * Copyright (c) Facebook, Inc. and its affiliates.
+ *
+ * This source code is licensed under the MIT license found in the
+ * LICENSE file in the root directory of this source tree.
+ */var t,r,o,i;if("object"==typeof performance&&"function"==typeof performance.now){var a=performance;n.unstable_now=function(){return a.now()}}else{var l=Date,c=l.now();n.unstable_now=function(){return l.now()-c}}if("undefined"==typeof window||"function"!=typeof MessageChannel){var u=null,s=null,f=function(){if(null!==u)try{var e=n.unstable_now();u(!0,e),u=null}catch(e){throw setTimeout(f,0),e}};t=function(e){null!==u?setTimeout(t,0,e):(u=e,setTimeout(f,0))},r=function(e,n){s=setTimeout(e,n)},o=function(){clearTimeout(s)},n.unstable_shouldYield=function(){return!1},i=n.unstable_forceFrameRate=function(){}}else{var p=window.setTimeout,d=window.clearTimeout;if("undefined"!=typeof console){var h=window.cancelAnimationFrame;"function"!=typeof window.requestAnimationFrame&&console.error("This browser doesn't support requestAnimationFrame. Make sure that you load a polyfill in older browsers. https://reactjs.org/link/react-polyfills"),"function"!=typeof h&&console.error("This browser doesn't support cancelAnimationFrame. Make sure that you load a polyfill in older browsers. https://reactjs.org/link/react-polyfills")}var g=!1,v=null,A=-1,b=5,m=0;n.unstable_shouldYield=function(){return n.unstable_now()>=m},i=function(){},n.unstable_forceFrameRate=function(e){0>e||125<e?console.error("forceFrameRate takes a positive int between 0 and 125, forcing frame rates higher than 125 fps is not supported"):b=0<e?Math.floor(1e3/e):5};var y=new MessageChannel,E=y.port2;y.port1.onmessage=function(){if(null!==v){var e=n.unstable_now();m=e+b;try{v(!0,e)?E.postMessage(null):(g=!1,v=null)}catch(e){throw E.postMessage(null),e}}else g=!1},t=function(e){v=e,g||(g=!0,E.postMessage(null))},r=function(e,t){A=p((function(){e(n.unstable_now())}),t)},o=function(){d(A),A=-1}}function _(e,n){var t=e.length;e.push(n);e:for(;;){var r=t-1>>>1,o=e[r];if(!(void 0!==o&&0<x(o,n)))break e;e[r]=n,e[t]=o,t=r}}function C(e){return void 0===(e=e[0])?null:e}function w(e){var n=e[0];if(void 0!==n){var t=e.pop();if(t!==n){e[0]=t;e:for(var r=0,o=e.length;r<o;){var i=2*(r+1)-1,a=e[i],l=i+1,c=e[l];if(void 0!==a&&0>x(a,t))void 0!==c&&0>x(c,a)?(e[r]=c,e[l]=t,r=l):(e[r]=a,e[i]=t,r=i);else{if(!(void 0!==c&&0>x(c,t)))break e;e[r]=c,e[l]=t,r=l}}}return n}return null}function x(e,n){var t=e.sortIndex-n.sortIndex;return 0!==t?t:e.id-n.id}var k=[],S=[],O=1,B=null,I=3,T=!1,P=!1,j=!1;function z(e){for(var n=C(S);null!==n;){if(null===n.callback)w(S);else{if(!(n.startTime<=e))break;w(S),n.sortIndex=n.expirationTime,_(k,n)}n=C(S)}}function R(e){if(j=!1,z(e),!P)if(null!==C(k))P=!0,t(M);else{var n=C(S);null!==n&&r(R,n.startTime-e)}}function M(e,t){P=!1,j&&(j=!1,o()),T=!0;var i=I;try{for(z(t),B=C(k);null!==B&&(!(B.expirationTime>t)||e&&!n.unstable_shouldYield());){var a=B.callback;if("function"==typeof a){B.callback=null,I=B.priorityLevel;var l=a(B.expirationTime<=t);t=n.unstable_now(),"function"==typeof l?B.callback=l:B===C(k)&&w(k),z(t)}else w(k);B=C(k)}if(null!==B)var c=!0;else{var u=C(S);null!==u&&r(R,u.startTime-t),c=!1}return c}finally{B=null,I=i,T=!1}}var D=i;n.unstable_IdlePriority=5,n.unstable_ImmediatePriority=1,n.unstable_LowPriority=4,n.unstable_NormalPriority=3,n.unstable_Profiling=null,n.unstable_UserBlockingPriority=2,n.unstable_cancelCallback=function(e){e.callback=null},n.unstable_continueExecution=function(){P||T||(P=!0,t(M))},n.unstable_getCurrentPriorityLevel=function(){return I},n.unstable_getFirstCallbackNode=function(){return C(k)},n.unstable_next=function(e){switch(I){case 1:case 2:case 3:var n=3;break;default:n=I}var t=I;I=n;try{return e()}finally{I=t}},n.unstable_pauseExecution=function(){},n.unstable_requestPaint=D,n.unstable_runWithPriority=function(e,n){switch(e){case 1:case 2:case 3:case 4:case 5:break;default:e=3}var t=I;I=e;try{return n()}finally{I=t}},n.unstable_scheduleCallback=function(e,i,a){var l=n.unstable_now();switch("object"==typeof a&&null!==a?a="number"==typeof(a=a.delay)&&0<a?l+a:l:a=l,e){case 1:var c=-1;break;case 2:c=250;break;case 5:c=1073741823;break;case 4:c=1e4;break;default:c=5e3}return e={id:O++,callback:i,priorityLevel:e,startTime:a,expirationTime:c=a+c,sortIndex:-1},a>l?(e.sortIndex=a,_(S,e),null===C(k)&&e===C(S)&&(j?o():j=!0,r(R,a-l))):(e.sortIndex=c,_(k,e),P||T||(P=!0,t(M))),e},n.unstable_wrapCallback=function(e){var n=I;return function(){var t=I;I=n;try{return e.apply(this,arguments)}finally{I=t}}}},3840:(e,n,t)=>{"use strict";e.exports=t(53)},7478:(e,n,t)=>{"use strict";var r=t(210),o=t(1924),i=t(631),a=r("%TypeError%"),l=r("%WeakMap%",!0),c=r("%Map%",!0),u=o("WeakMap.prototype.get",!0),s=o("WeakMap.prototype.set",!0),f=o("WeakMap.prototype.has",!0),p=o("Map.prototype.get",!0),d=o("Map.prototype.set",!0),h=o("Map.prototype.has",!0),g=function(e,n){for(var t,r=e;null!==(t=r.next);r=t)if(t.key===n)return r.next=t.next,t.next=e.next,e.next=t,t};e.exports=function(){var e,n,t,r={assert:function(e){if(!r.has(e))throw new a("Side channel does not contain "+i(e))},get:function(r){if(l&&r&&("object"==typeof r||"function"==typeof r)){if(e)return u(e,r)}else if(c){if(n)return p(n,r)}else if(t)return function(e,n){var t=g(e,n);return t&&t.value}(t,r)},has:function(r){if(l&&r&&("object"==typeof r||"function"==typeof r)){if(e)return f(e,r)}else if(c){if(n)return h(n,r)}else if(t)return function(e,n){return!!g(e,n)}(t,r);return!1},set:function(r,o){l&&r&&("object"==typeof r||"function"==typeof r)?(e||(e=new l),s(e,r,o)):c?(n||(n=new c),d(n,r,o)):(t||(t={key:{},next:null}),function(e,n,t){var r=g(e,n);r?r.value=t:e.next={key:n,next:e.next,value:t}}(t,r,o))}};return r}},3854:function(e){!function(n){var t={browser:[[/msie ([\.\_\d]+)/,"ie"],[/trident\/.*?rv:([\.\_\d]+)/,"ie"],[/firefox\/([\.\_\d]+)/,"firefox"],[/chrome\/([\.\_\d]+)/,"chrome"],[/version\/([\.\_\d]+).*?safari/,"safari"],[/mobile safari ([\.\_\d]+)/,"safari"],[/android.*?version\/([\.\_\d]+).*?safari/,"com.android.browser"],[/crios\/([\.\_\d]+).*?safari/,"chrome"],[/opera/,"opera"],[/opera\/([\.\_\d]+)/,"opera"],[/opera ([\.\_\d]+)/,"opera"],[/opera mini.*?version\/([\.\_\d]+)/,"opera.mini"],[/opios\/([a-z\.\_\d]+)/,"opera"],[/blackberry/,"blackberry"],[/blackberry.*?version\/([\.\_\d]+)/,"blackberry"],[/bb\d+.*?version\/([\.\_\d]+)/,"blackberry"],[/rim.*?version\/([\.\_\d]+)/,"blackberry"],[/iceweasel\/([\.\_\d]+)/,"iceweasel"],[/edge\/([\.\d]+)/,"edge"]],os:[[/linux ()([a-z\.\_\d]+)/,"linux"],[/mac os x/,"macos"],[/mac os x.*?([\.\_\d]+)/,"macos"],[/os ([\.\_\d]+) like mac os/,"ios"],[/openbsd ()([a-z\.\_\d]+)/,"openbsd"],[/android/,"android"],[/android ([a-z\.\_\d]+);/,"android"],[/mozilla\/[a-z\.\_\d]+ \((?:mobile)|(?:tablet)/,"firefoxos"],[/windows\s*(?:nt)?\s*([\.\_\d]+)/,"windows"],[/windows phone.*?([\.\_\d]+)/,"windows.phone"],[/windows mobile/,"windows.mobile"],[/blackberry/,"blackberryos"],[/bb\d+/,"blackberryos"],[/rim.*?os\s*([\.\_\d]+)/,"blackberryos"]],device:[[/ipad/,"ipad"],[/iphone/,"iphone"],[/lumia/,"lumia"],[/htc/,"htc"],[/nexus/,"nexus"],[/galaxy nexus/,"galaxy.nexus"],[/nokia/,"nokia"],[/ gt\-/,"galaxy"],[/ sm\-/,"galaxy"],[/xbox/,"xbox"],[/(?:bb\d+)|(?:blackberry)|(?: rim )/,"blackberry"]]},r="Unknown",o=Object.keys(t);function i(){var e=this;o.forEach((function(n){e[n]={name:r,version:[],versionString:r}}))}function a(e,n,o){t[n].forEach((function(t){var i=t[0],a=t[1],l=o.match(i);l&&(e[n].name=a,l[2]?(e[n].versionString=l[2],e[n].version=[]):l[1]?(e[n].versionString=l[1].replace(/_/g,"."),e[n].version=l[1].split(/[\._]/).map((function(e){return parseInt(e)}))):(e[n].versionString=r,e[n].version=[]))}))}i.prototype.sniff=function(e){var n=this,t="undefined"!=typeof window?navigator.userAgent:"",r=(e||t).toLowerCase();return o.forEach((function(e){a(n,e,r)})),this},e.exports?e.exports=i:(n.Sniffr=new i,n.Sniffr.sniff(navigator.userAgent))}(this)},8442:(e,n,t)=>{var r=t(3379),o=t(7795),i=t(569),a=t(3565),l=t(9216),c=t(4589),u=t(8759);u=u.__esModule?u.default:u;var s={};s.styleTagTransform=c,s.setAttributes=a,s.insert=i.bind(null,"head"),s.domAPI=o,s.insertStyleElement=l;r(u,s);e.exports=u&&u.locals||{}},5526:(e,n,t)=>{var r=t(3379),o=t(7795),i=t(569),a=t(3565),l=t(9216),c=t(4589),u=t(8199);u=u.__esModule?u.default:u;var s={};s.styleTagTransform=c,s.setAttributes=a,s.insert=i.bind(null,"head"),s.domAPI=o,s.insertStyleElement=l;r(u,s);e.exports=u&&u.locals||{}},4369:(e,n,t)=>{var r=t(3379),o=t(7795),i=t(569),a=t(3565),l=t(9216),c=t(4589),u=t(3109);u=u.__esModule?u.default:u;var s={};s.styleTagTransform=c,s.setAttributes=a,s.insert=i.bind(null,"head"),s.domAPI=o,s.insertStyleElement=l;r(u,s);e.exports=u&&u.locals||{}},2242:(e,n,t)=>{var r=t(3379),o=t(7795),i=t(569),a=t(3565),l=t(9216),c=t(4589),u=t(2890);u=u.__esModule?u.default:u;var s={};s.styleTagTransform=c,s.setAttributes=a,s.insert=i.bind(null,"head"),s.domAPI=o,s.insertStyleElement=l;r(u,s);e.exports=u&&u.locals||{}},3138:(e,n,t)=>{var r=t(3379),o=t(7795),i=t(569),a=t(3565),l=t(9216),c=t(4589),u=t(8004);u=u.__esModule?u.default:u;var s={};s.styleTagTransform=c,s.setAttributes=a,s.insert=i.bind(null,"head"),s.domAPI=o,s.insertStyleElement=l;r(u,s);e.exports=u&&u.locals||{}},2224:(e,n,t)=>{var r=t(3379),o=t(7795),i=t(569),a=t(3565),l=t(9216),c=t(4589),u=t(9791);u=u.__esModule?u.default:u;var s={};s.styleTagTransform=c,s.setAttributes=a,s.insert=i.bind(null,"head"),s.domAPI=o,s.insertStyleElement=l;r(u,s);e.exports=u&&u.locals||{}},108:(e,n,t)=>{var r=t(3379),o=t(7795),i=t(569),a=t(3565),l=t(9216),c=t(4589),u=t(4434);u=u.__esModule?u.default:u;var s={};s.styleTagTransform=c,s.setAttributes=a,s.insert=i.bind(null,"head"),s.domAPI=o,s.insertStyleElement=l;r(u,s);e.exports=u&&u.locals||{}},3068:(e,n,t)=>{var r=t(3379),o=t(7795),i=t(569),a=t(3565),l=t(9216),c=t(4589),u=t(5968);u=u.__esModule?u.default:u;var s={};s.styleTagTransform=c,s.setAttributes=a,s.insert=i.bind(null,"head"),s.domAPI=o,s.insertStyleElement=l;r(u,s);e.exports=u&&u.locals||{}},1050:(e,n,t)=>{var r=t(3379),o=t(7795),i=t(569),a=t(3565),l=t(9216),c=t(4589),u=t(9506);u=u.__esModule?u.default:u;var s={};s.styleTagTransform=c,s.setAttributes=a,s.insert=i.bind(null,"head"),s.domAPI=o,s.insertStyleElement=l;r(u,s);e.exports=u&&u.locals||{}},7869:(e,n,t)=>{var r=t(3379),o=t(7795),i=t(569),a=t(3565),l=t(9216),c=t(4589),u=t(5578);u=u.__esModule?u.default:u;var s={};s.styleTagTransform=c,s.setAttributes=a,s.insert=i.bind(null,"head"),s.domAPI=o,s.insertStyleElement=l;r(u,s);e.exports=u&&u.locals||{}},8095:(e,n,t)=>{var r=t(3379),o=t(7795),i=t(569),a=t(3565),l=t(9216),c=t(4589),u=t(8546);u=u.__esModule?u.default:u;var s={};s.styleTagTransform=c,s.setAttributes=a,s.insert=i.bind(null,"head"),s.domAPI=o,s.insertStyleElement=l;r(u,s);e.exports=u&&u.locals||{}},125:(e,n,t)=>{var r=t(3379),o=t(7795),i=t(569),a=t(3565),l=t(9216),c=t(4589),u=t(2616);u=u.__esModule?u.default:u;var s={};s.styleTagTransform=c,s.setAttributes=a,s.insert=i.bind(null,"head"),s.domAPI=o,s.insertStyleElement=l;r(u,s);e.exports=u&&u.locals||{}},6017:(e,n,t)=>{var r=t(3379),o=t(7795),i=t(569),a=t(3565),l=t(9216),c=t(4589),u=t(6751);u=u.__esModule?u.default:u;var s={};s.styleTagTransform=c,s.setAttributes=a,s.insert=i.bind(null,"head"),s.domAPI=o,s.insertStyleElement=l;r(u,s);e.exports=u&&u.locals||{}},1442:(e,n,t)=>{var r=t(3379),o=t(7795),i=t(569),a=t(3565),l=t(9216),c=t(4589),u=t(2260);u=u.__esModule?u.default:u;var s={};s.styleTagTransform=c,s.setAttributes=a,s.insert=i.bind(null,"head"),s.domAPI=o,s.insertStyleElement=l;r(u,s);e.exports=u&&u.locals||{}},335:(e,n,t)=>{var r=t(3379),o=t(7795),i=t(569),a=t(3565),l=t(9216),c=t(4589),u=t(5339);u=u.__esModule?u.default:u;var s={};s.styleTagTransform=c,s.setAttributes=a,s.insert=i.bind(null,"head"),s.domAPI=o,s.insertStyleElement=l;r(u,s);e.exports=u&&u.locals||{}},2593:(e,n,t)=>{var r=t(3379),o=t(7795),i=t(569),a=t(3565),l=t(9216),c=t(4589),u=t(4502);u=u.__esModule?u.default:u;var s={};s.styleTagTransform=c,s.setAttributes=a,s.insert=i.bind(null,"head"),s.domAPI=o,s.insertStyleElement=l;r(u,s);e.exports=u&&u.locals||{}},3833:(e,n,t)=>{var r=t(3379),o=t(7795),i=t(569),a=t(3565),l=t(9216),c=t(4589),u=t(5729);u=u.__esModule?u.default:u;var s={};s.styleTagTransform=c,s.setAttributes=a,s.insert=i.bind(null,"head"),s.domAPI=o,s.insertStyleElement=l;r(u,s);e.exports=u&&u.locals||{}},2481:(e,n,t)=>{var r=t(3379),o=t(7795),i=t(569),a=t(3565),l=t(9216),c=t(4589),u=t(3099);u=u.__esModule?u.default:u;var s={};s.styleTagTransform=c,s.setAttributes=a,s.insert=i.bind(null,"head"),s.domAPI=o,s.insertStyleElement=l;r(u,s);e.exports=u&&u.locals||{}},3379:e=>{"use strict";var n=[];function t(e){for(var t=-1,r=0;r<n.length;r++)if(n[r].identifier===e){t=r;break}return t}function r(e,r){for(var i={},a=[],l=0;l<e.length;l++){var c=e[l],u=r.base?c[0]+r.base:c[0],s=i[u]||0,f="".concat(u," ").concat(s);i[u]=s+1;var p=t(f),d={css:c[1],media:c[2],sourceMap:c[3],supports:c[4],layer:c[5]};if(-1!==p)n[p].references++,n[p].updater(d);else{var h=o(d,r);r.byIndex=l,n.splice(l,0,{identifier:f,updater:h,references:1})}a.push(f)}return a}function o(e,n){var t=n.domAPI(n);t.update(e);return function(n){if(n){if(n.css===e.css&&n.media===e.media&&n.sourceMap===e.sourceMap&&n.supports===e.supports&&n.layer===e.layer)return;t.update(e=n)}else t.remove()}}e.exports=function(e,o){var i=r(e=e||[],o=o||{});return function(e){e=e||[];for(var a=0;a<i.length;a++){var l=t(i[a]);n[l].references--}for(var c=r(e,o),u=0;u<i.length;u++){var s=t(i[u]);0===n[s].references&&(n[s].updater(),n.splice(s,1))}i=c}}},569:e=>{"use strict";var n={};e.exports=function(e,t){var r=function(e){if(void 0===n[e]){var t=document.querySelector(e);if(window.HTMLIFrameElement&&t instanceof window.HTMLIFrameElement)try{t=t.contentDocument.head}catch(e){t=null}n[e]=t}return n[e]}(e);if(!r)throw new Error("Couldn't find a style target. This probably means that the value for the 'insert' parameter is invalid.");r.appendChild(t)}},9216:e=>{"use strict";e.exports=function(e){var n=document.createElement("style");return e.setAttributes(n,e.attributes),e.insert(n,e.options),n}},3565:(e,n,t)=>{"use strict";e.exports=function(e){var n=t.nc;n&&e.setAttribute("nonce",n)}},7795:e=>{"use strict";e.exports=function(e){var n=e.insertStyleElement(e);return{update:function(t){!function(e,n,t){var r="";t.supports&&(r+="@supports (".concat(t.supports,") {")),t.media&&(r+="@media ".concat(t.media," {"));var o=void 0!==t.layer;o&&(r+="@layer".concat(t.layer.length>0?" ".concat(t.layer):""," {")),r+=t.css,o&&(r+="}"),t.media&&(r+="}"),t.supports&&(r+="}");var i=t.sourceMap;i&&"undefined"!=typeof btoa&&(r+="\n/*# sourceMappingURL=data:application/json;base64,".concat(btoa(unescape(encodeURIComponent(JSON.stringify(i))))," */")),n.styleTagTransform(r,e,n.options)}(n,e,t)},remove:function(){!function(e){if(null===e.parentNode)return!1;e.parentNode.removeChild(e)}(n)}}}},4589:e=>{"use strict";e.exports=function(e,n){if(n.styleSheet)n.styleSheet.cssText=e;else{for(;n.firstChild;)n.removeChild(n.firstChild);n.appendChild(document.createTextNode(e))}}},4927:(e,n,t)=>{function r(e){try{if(!t.g.localStorage)return!1}catch(e){return!1}var n=t.g.localStorage[e];return null!=n&&"true"===String(n).toLowerCase()}e.exports=function(e,n){if(r("noDeprecation"))return e;var t=!1;return function(){if(!t){if(r("throwDeprecation"))throw new Error(n);r("traceDeprecation")?console.trace(n):console.warn(n),t=!0}return e.apply(this,arguments)}}},3679:(e,n,t)=>{"use strict";var r=t(9981),o=t(4578),i=t(6814),a=t(2636),l=t(3376);e.exports=function(e){return null==e||"object"!=typeof e&&"function"!=typeof e?null:r(e)?"String":o(e)?"Number":i(e)?"Boolean":a(e)?"Symbol":l(e)?"BigInt":void 0}},6430:(e,n,t)=>{"use strict";var r=t(9804),o=t(3083),i=t(1924),a=i("Object.prototype.toString"),l=t(6410)(),c="undefined"==typeof globalThis?t.g:globalThis,u=o(),s=i("String.prototype.slice"),f={},p=t(882),d=Object.getPrototypeOf;l&&p&&d&&r(u,(function(e){if("function"==typeof c[e]){var n=new c[e];if(Symbol.toStringTag in n){var t=d(n),r=p(t,Symbol.toStringTag);if(!r){var o=d(t);r=p(o,Symbol.toStringTag)}f[e]=r.get}}}));var h=t(5692);e.exports=function(e){return!!h(e)&&(l&&Symbol.toStringTag in e?function(e){var n=!1;return r(f,(function(t,r){if(!n)try{var o=t.call(e);o===r&&(n=o)}catch(e){}})),n}(e):s(a(e),8,-1))}},4654:()=>{},3083:(e,n,t)=>{"use strict";var r=["BigInt64Array","BigUint64Array","Float32Array","Float64Array","Int16Array","Int32Array","Int8Array","Uint16Array","Uint32Array","Uint8Array","Uint8ClampedArray"],o="undefined"==typeof globalThis?t.g:globalThis;e.exports=function(){for(var e=[],n=0;n<r.length;n++)"function"==typeof o[r[n]]&&(e[e.length]=r[n]);return e}},882:(e,n,t)=>{"use strict";var r=t(210)("%Object.getOwnPropertyDescriptor%",!0);if(r)try{r([],"length")}catch(e){r=null}e.exports=r},3216:(e,n,t)=>{"use strict";var r=t(2584);if(t(1405)()||t(5419)()){var o=Symbol.iterator;e.exports=function(e){return null!=e&&void 0!==e[o]?e[o]():r(e)?Array.prototype[o].call(e):void 0}}else{var i=t(5826),a=t(9981),l=t(210),c=l("%Map%",!0),u=l("%Set%",!0),s=t(1924),f=s("Array.prototype.push"),p=s("String.prototype.charCodeAt"),d=s("String.prototype.slice"),h=function(e){var n=0;return{next:function(){var t,r=n>=e.length;return r||(t=e[n],n+=1),{done:r,value:t}}}},g=function(e,n){if(i(e)||r(e))return h(e);if(a(e)){var t=0;return{next:function(){var n=function(e,n){if(n+1>=e.length)return n+1;var t=p(e,n);if(t<55296||t>56319)return n+1;var r=p(e,n+1);return r<56320||r>57343?n+1:n+2}(e,t),r=d(e,t,n);return t=n,{done:n>e.length,value:r}}}}return n&&void 0!==e["_es6-shim iterator_"]?e["_es6-shim iterator_"]():void 0};if(c||u){var v=t(8379),A=t(9572),b=s("Map.prototype.forEach",!0),m=s("Set.prototype.forEach",!0);if("undefined"==typeof process||!process.versions||!process.versions.node)var y=s("Map.prototype.iterator",!0),E=s("Set.prototype.iterator",!0),_=function(e){var n=!1;return{next:function(){try{return{done:n,value:n?void 0:e.next()}}catch(e){return n=!0,{done:!0,value:void 0}}}}};var C=s("Map.prototype.@@iterator",!0)||s("Map.prototype._es6-shim iterator_",!0),w=s("Set.prototype.@@iterator",!0)||s("Set.prototype._es6-shim iterator_",!0);e.exports=function(e){return function(e){if(v(e)){if(y)return _(y(e));if(C)return C(e);if(b){var n=[];return b(e,(function(e,t){f(n,[t,e])})),h(n)}}if(A(e)){if(E)return _(E(e));if(w)return w(e);if(m){var t=[];return m(e,(function(e){f(t,e)})),h(t)}}}(e)||g(e)}}else e.exports=function(e){if(null!=e)return g(e,!0)}}},3483:(e,n,t)=>{"use strict";var r=t(8379),o=t(9572),i=t(1718),a=t(5899);e.exports=function(e){if(e&&"object"==typeof e){if(r(e))return"Map";if(o(e))return"Set";if(i(e))return"WeakMap";if(a(e))return"WeakSet"}return!1}}},n={};function t(r){var o=n[r];if(void 0!==o)return o.exports;var i=n[r]={id:r,loaded:!1,exports:{}};return e[r].call(i.exports,i,i.exports,t),i.loaded=!0,i.exports}t.n=e=>{var n=e&&e.__esModule?()=>e.default:()=>e;return t.d(n,{a:n}),n},t.d=(e,n)=>{for(var r in n)t.o(n,r)&&!t.o(e,r)&&Object.defineProperty(e,r,{enumerable:!0,get:n[r]})},t.g=function(){if("object"==typeof globalThis)return globalThis;try{return this||new Function("return this")()}catch(e){if("object"==typeof window)return window}}(),t.o=(e,n)=>Object.prototype.hasOwnProperty.call(e,n),t.r=e=>{"undefined"!=typeof Symbol&&Symbol.toStringTag&&Object.defineProperty(e,Symbol.toStringTag,{value:"Module"}),Object.defineProperty(e,"__esModule",{value:!0})},t.nmd=e=>(e.paths=[],e.children||(e.children=[]),e),t.nc=void 0,(()=>{"use strict";var e=t(7294),n=t(3935),r=(t(9070),t(8304),t(489),t(2419),t(8011),t(2772),t(7327),t(5003),t(9554),t(4747),t(9337),t(3321),t(2165),t(6992),t(8783),t(3948),t(6699),t(2023),t(2222),t(2526),t(1817),t(5212),t(1539),t(9601),t(7941),t(9826),t(4553),t(5697)),o=t.n(r),i=t(4184),a=t.n(i);function l(){return l=Object.assign||function(e){for(var n=1;n<arguments.length;n++){var t=arguments[n];for(var r in t)Object.prototype.hasOwnProperty.call(t,r)&&(e[r]=t[r])}return e},l.apply(this,arguments)}function c(e,n){if(!(e instanceof n))throw new TypeError("Cannot call a class as a function")}function u(e,n){for(var t=0;t<n.length;t++){var r=n[t];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}function s(e,n,t){return n&&u(e.prototype,n),t&&u(e,t),e}function f(e){return f="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},f(e)}function p(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}function d(e,n){if(n&&("object"===f(n)||"function"==typeof n))return n;if(void 0!==n)throw new TypeError("Derived constructors may only return object or undefined");return p(e)}function h(e){return h=Object.setPrototypeOf?Object.getPrototypeOf:function(e){return e.__proto__||Object.getPrototypeOf(e)},h(e)}function g(e,n){return g=Object.setPrototypeOf||function(e,n){return e.__proto__=n,e},g(e,n)}function v(e,n){if("function"!=typeof n&&null!==n)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(n&&n.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),n&&g(e,n)}function A(e,n,t){return n in e?Object.defineProperty(e,n,{value:t,enumerable:!0,configurable:!0,writable:!0}):e[n]=t,e}function b(e){var n,t,r="";if("string"==typeof e||"number"==typeof e)r+=e;else if("object"==typeof e)if(Array.isArray(e))for(n=0;n<e.length;n++)e[n]&&(t=b(e[n]))&&(r&&(r+=" "),r+=t);else for(n in e)e[n]&&(r&&(r+=" "),r+=n);return r}function m(){for(var e,n,t=0,r="";t<arguments.length;)(e=arguments[t++])&&(n=b(e))&&(r&&(r+=" "),r+=n);return r}function y(e){var n=e.cellCount,t=e.cellSize,r=e.computeMetadataCallback,o=e.computeMetadataCallbackProps,i=e.nextCellsCount,a=e.nextCellSize,l=e.nextScrollToIndex,c=e.scrollToIndex,u=e.updateScrollOffsetForScrollToIndex;n===i&&("number"!=typeof t&&"number"!=typeof a||t===a)||(r(o),c>=0&&c===l&&u())}function E(e,n){if(null==e)return{};var t,r,o=function(e,n){if(null==e)return{};var t,r,o={},i=Object.keys(e);for(r=0;r<i.length;r++)t=i[r],n.indexOf(t)>=0||(o[t]=e[t]);return o}(e,n);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)t=i[r],n.indexOf(t)>=0||Object.prototype.propertyIsEnumerable.call(e,t)&&(o[t]=e[t])}return o}var _=function(){function e(n){var t=n.cellCount,r=n.cellSizeGetter,o=n.estimatedCellSize;c(this,e),A(this,"_cellSizeAndPositionData",{}),A(this,"_lastMeasuredIndex",-1),A(this,"_lastBatchedIndex",-1),A(this,"_cellCount",void 0),A(this,"_cellSizeGetter",void 0),A(this,"_estimatedCellSize",void 0),this._cellSizeGetter=r,this._cellCount=t,this._estimatedCellSize=o}return s(e,[{key:"areOffsetsAdjusted",value:function(){return!1}},{key:"configure",value:function(e){var n=e.cellCount,t=e.estimatedCellSize,r=e.cellSizeGetter;this._cellCount=n,this._estimatedCellSize=t,this._cellSizeGetter=r}},{key:"getCellCount",value:function(){return this._cellCount}},{key:"getEstimatedCellSize",value:function(){return this._estimatedCellSize}},{key:"getLastMeasuredIndex",value:function(){return this._lastMeasuredIndex}},{key:"getOffsetAdjustment",value:function(){return 0}},{key:"getSizeAndPositionOfCell",value:function(e){if(e<0||e>=this._cellCount)throw Error("Requested index ".concat(e," is outside of range 0..").concat(this._cellCount));if(e>this._lastMeasuredIndex)for(var n=this.getSizeAndPositionOfLastMeasuredCell(),t=n.offset+n.size,r=this._lastMeasuredIndex+1;r<=e;r++){var o=this._cellSizeGetter({index:r});if(void 0===o||isNaN(o))throw Error("Invalid size returned for cell ".concat(r," of value ").concat(o));null===o?(this._cellSizeAndPositionData[r]={offset:t,size:0},this._lastBatchedIndex=e):(this._cellSizeAndPositionData[r]={offset:t,size:o},t+=o,this._lastMeasuredIndex=e)}return this._cellSizeAndPositionData[e]}},{key:"getSizeAndPositionOfLastMeasuredCell",value:function(){return this._lastMeasuredIndex>=0?this._cellSizeAndPositionData[this._lastMeasuredIndex]:{offset:0,size:0}}},{key:"getTotalSize",value:function(){var e=this.getSizeAndPositionOfLastMeasuredCell();return e.offset+e.size+(this._cellCount-this._lastMeasuredIndex-1)*this._estimatedCellSize}},{key:"getUpdatedOffsetForIndex",value:function(e){var n=e.align,t=void 0===n?"auto":n,r=e.containerSize,o=e.currentOffset,i=e.targetIndex;if(r<=0)return 0;var a,l=this.getSizeAndPositionOfCell(i),c=l.offset,u=c-r+l.size;switch(t){case"start":a=c;break;case"end":a=u;break;case"center":a=c-(r-l.size)/2;break;default:a=Math.max(u,Math.min(c,o))}var s=this.getTotalSize();return Math.max(0,Math.min(s-r,a))}},{key:"getVisibleCellRange",value:function(e){var n=e.containerSize,t=e.offset;if(0===this.getTotalSize())return{};var r=t+n,o=this._findNearestCell(t),i=this.getSizeAndPositionOfCell(o);t=i.offset+i.size;for(var a=o;t<r&&a<this._cellCount-1;)a++,t+=this.getSizeAndPositionOfCell(a).size;return{start:o,stop:a}}},{key:"resetCell",value:function(e){this._lastMeasuredIndex=Math.min(this._lastMeasuredIndex,e-1)}},{key:"_binarySearch",value:function(e,n,t){for(;n<=e;){var r=n+Math.floor((e-n)/2),o=this.getSizeAndPositionOfCell(r).offset;if(o===t)return r;o<t?n=r+1:o>t&&(e=r-1)}return n>0?n-1:0}},{key:"_exponentialSearch",value:function(e,n){for(var t=1;e<this._cellCount&&this.getSizeAndPositionOfCell(e).offset<n;)e+=t,t*=2;return this._binarySearch(Math.min(e,this._cellCount-1),Math.floor(e/2),n)}},{key:"_findNearestCell",value:function(e){if(isNaN(e))throw Error("Invalid offset ".concat(e," specified"));e=Math.max(0,e);var n=this.getSizeAndPositionOfLastMeasuredCell(),t=Math.max(0,this._lastMeasuredIndex);return n.offset>=e?this._binarySearch(t,0,e):this._exponentialSearch(t,e)}}]),e}(),C=function(){return"undefined"!=typeof window&&window.chrome?16777100:15e5},w=function(){function e(n){var t=n.maxScrollSize,r=void 0===t?C():t,o=E(n,["maxScrollSize"]);c(this,e),A(this,"_cellSizeAndPositionManager",void 0),A(this,"_maxScrollSize",void 0),this._cellSizeAndPositionManager=new _(o),this._maxScrollSize=r}return s(e,[{key:"areOffsetsAdjusted",value:function(){return this._cellSizeAndPositionManager.getTotalSize()>this._maxScrollSize}},{key:"configure",value:function(e){this._cellSizeAndPositionManager.configure(e)}},{key:"getCellCount",value:function(){return this._cellSizeAndPositionManager.getCellCount()}},{key:"getEstimatedCellSize",value:function(){return this._cellSizeAndPositionManager.getEstimatedCellSize()}},{key:"getLastMeasuredIndex",value:function(){return this._cellSizeAndPositionManager.getLastMeasuredIndex()}},{key:"getOffsetAdjustment",value:function(e){var n=e.containerSize,t=e.offset,r=this._cellSizeAndPositionManager.getTotalSize(),o=this.getTotalSize(),i=this._getOffsetPercentage({containerSize:n,offset:t,totalSize:o});return Math.round(i*(o-r))}},{key:"getSizeAndPositionOfCell",value:function(e){return this._cellSizeAndPositionManager.getSizeAndPositionOfCell(e)}},{key:"getSizeAndPositionOfLastMeasuredCell",value:function(){return this._cellSizeAndPositionManager.getSizeAndPositionOfLastMeasuredCell()}},{key:"getTotalSize",value:function(){return Math.min(this._maxScrollSize,this._cellSizeAndPositionManager.getTotalSize())}},{key:"getUpdatedOffsetForIndex",value:function(e){var n=e.align,t=void 0===n?"auto":n,r=e.containerSize,o=e.currentOffset,i=e.targetIndex;o=this._safeOffsetToOffset({containerSize:r,offset:o});var a=this._cellSizeAndPositionManager.getUpdatedOffsetForIndex({align:t,containerSize:r,currentOffset:o,targetIndex:i});return this._offsetToSafeOffset({containerSize:r,offset:a})}},{key:"getVisibleCellRange",value:function(e){var n=e.containerSize,t=e.offset;return t=this._safeOffsetToOffset({containerSize:n,offset:t}),this._cellSizeAndPositionManager.getVisibleCellRange({containerSize:n,offset:t})}},{key:"resetCell",value:function(e){this._cellSizeAndPositionManager.resetCell(e)}},{key:"_getOffsetPercentage",value:function(e){var n=e.containerSize,t=e.offset,r=e.totalSize;return r<=n?0:t/(r-n)}},{key:"_offsetToSafeOffset",value:function(e){var n=e.containerSize,t=e.offset,r=this._cellSizeAndPositionManager.getTotalSize(),o=this.getTotalSize();if(r===o)return t;var i=this._getOffsetPercentage({containerSize:n,offset:t,totalSize:r});return Math.round(i*(o-n))}},{key:"_safeOffsetToOffset",value:function(e){var n=e.containerSize,t=e.offset,r=this._cellSizeAndPositionManager.getTotalSize(),o=this.getTotalSize();if(r===o)return t;var i=this._getOffsetPercentage({containerSize:n,offset:t,totalSize:o});return Math.round(i*(r-n))}}]),e}();function x(){var e=!(arguments.length>0&&void 0!==arguments[0])||arguments[0],n={};return function(t){var r=t.callback,o=t.indices,i=Object.keys(o),a=!e||i.every((function(e){var n=o[e];return Array.isArray(n)?n.length>0:n>=0})),l=i.length!==Object.keys(n).length||i.some((function(e){var t=n[e],r=o[e];return Array.isArray(r)?t.join(",")!==r.join(","):t!==r}));n=o,a&&l&&r(o)}}function k(e){var n=e.cellSize,t=e.cellSizeAndPositionManager,r=e.previousCellsCount,o=e.previousCellSize,i=e.previousScrollToAlignment,a=e.previousScrollToIndex,l=e.previousSize,c=e.scrollOffset,u=e.scrollToAlignment,s=e.scrollToIndex,f=e.size,p=e.sizeJustIncreasedFromZero,d=e.updateScrollIndexCallback,h=t.getCellCount(),g=s>=0&&s<h;g&&(f!==l||p||!o||"number"==typeof n&&n!==o||u!==i||s!==a)?d(s):!g&&h>0&&(f<l||h<r)&&c>t.getTotalSize()-f&&d(h-1)}const S=!("undefined"==typeof window||!window.document||!window.document.createElement);var O,B;function I(){var e=this.constructor.getDerivedStateFromProps(this.props,this.state);null!=e&&this.setState(e)}function T(e){this.setState(function(n){var t=this.constructor.getDerivedStateFromProps(e,n);return null!=t?t:null}.bind(this))}function P(e,n){try{var t=this.props,r=this.state;this.props=e,this.state=n,this.__reactInternalSnapshotFlag=!0,this.__reactInternalSnapshot=this.getSnapshotBeforeUpdate(t,r)}finally{this.props=t,this.state=r}}I.__suppressDeprecationWarning=!0,T.__suppressDeprecationWarning=!0,P.__suppressDeprecationWarning=!0;var j,z,R=(B="undefined"!=typeof window?window:"undefined"!=typeof self?self:{}).requestAnimationFrame||B.webkitRequestAnimationFrame||B.mozRequestAnimationFrame||B.oRequestAnimationFrame||B.msRequestAnimationFrame||function(e){return B.setTimeout(e,1e3/60)},M=B.cancelAnimationFrame||B.webkitCancelAnimationFrame||B.mozCancelAnimationFrame||B.oCancelAnimationFrame||B.msCancelAnimationFrame||function(e){B.clearTimeout(e)},D=R,N=M,L=function(e){return N(e.id)},F=function(e,n){var t;Promise.resolve().then((function(){t=Date.now()}));var r={id:D((function o(){Date.now()-t>=n?e.call():r.id=D(o)}))};return r};function U(e,n){var t=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);n&&(r=r.filter((function(n){return Object.getOwnPropertyDescriptor(e,n).enumerable}))),t.push.apply(t,r)}return t}function W(e){for(var n=1;n<arguments.length;n++){var t=null!=arguments[n]?arguments[n]:{};n%2?U(t,!0).forEach((function(n){A(e,n,t[n])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(t)):U(t).forEach((function(n){Object.defineProperty(e,n,Object.getOwnPropertyDescriptor(t,n))}))}return e}var H="observed",G="requested",q=(z=j=function(n){function t(e){var n;c(this,t),A(p(n=d(this,h(t).call(this,e))),"_onGridRenderedMemoizer",x()),A(p(n),"_onScrollMemoizer",x(!1)),A(p(n),"_deferredInvalidateColumnIndex",null),A(p(n),"_deferredInvalidateRowIndex",null),A(p(n),"_recomputeScrollLeftFlag",!1),A(p(n),"_recomputeScrollTopFlag",!1),A(p(n),"_horizontalScrollBarSize",0),A(p(n),"_verticalScrollBarSize",0),A(p(n),"_scrollbarPresenceChanged",!1),A(p(n),"_scrollingContainer",void 0),A(p(n),"_childrenToDisplay",void 0),A(p(n),"_columnStartIndex",void 0),A(p(n),"_columnStopIndex",void 0),A(p(n),"_rowStartIndex",void 0),A(p(n),"_rowStopIndex",void 0),A(p(n),"_renderedColumnStartIndex",0),A(p(n),"_renderedColumnStopIndex",0),A(p(n),"_renderedRowStartIndex",0),A(p(n),"_renderedRowStopIndex",0),A(p(n),"_initialScrollTop",void 0),A(p(n),"_initialScrollLeft",void 0),A(p(n),"_disablePointerEventsTimeoutId",void 0),A(p(n),"_styleCache",{}),A(p(n),"_cellCache",{}),A(p(n),"_debounceScrollEndedCallback",(function(){n._disablePointerEventsTimeoutId=null,n.setState({isScrolling:!1,needToResetStyleCache:!1})})),A(p(n),"_invokeOnGridRenderedHelper",(function(){var e=n.props.onSectionRendered;n._onGridRenderedMemoizer({callback:e,indices:{columnOverscanStartIndex:n._columnStartIndex,columnOverscanStopIndex:n._columnStopIndex,columnStartIndex:n._renderedColumnStartIndex,columnStopIndex:n._renderedColumnStopIndex,rowOverscanStartIndex:n._rowStartIndex,rowOverscanStopIndex:n._rowStopIndex,rowStartIndex:n._renderedRowStartIndex,rowStopIndex:n._renderedRowStopIndex}})})),A(p(n),"_setScrollingContainerRef",(function(e){n._scrollingContainer=e})),A(p(n),"_onScroll",(function(e){e.target===n._scrollingContainer&&n.handleScrollEvent(e.target)}));var r=new w({cellCount:e.columnCount,cellSizeGetter:function(n){return t._wrapSizeGetter(e.columnWidth)(n)},estimatedCellSize:t._getEstimatedColumnSize(e)}),o=new w({cellCount:e.rowCount,cellSizeGetter:function(n){return t._wrapSizeGetter(e.rowHeight)(n)},estimatedCellSize:t._getEstimatedRowSize(e)});return n.state={instanceProps:{columnSizeAndPositionManager:r,rowSizeAndPositionManager:o,prevColumnWidth:e.columnWidth,prevRowHeight:e.rowHeight,prevColumnCount:e.columnCount,prevRowCount:e.rowCount,prevIsScrolling:!0===e.isScrolling,prevScrollToColumn:e.scrollToColumn,prevScrollToRow:e.scrollToRow,scrollbarSize:0,scrollbarSizeMeasured:!1},isScrolling:!1,scrollDirectionHorizontal:1,scrollDirectionVertical:1,scrollLeft:0,scrollTop:0,scrollPositionChangeReason:null,needToResetStyleCache:!1},e.scrollToRow>0&&(n._initialScrollTop=n._getCalculatedScrollTop(e,n.state)),e.scrollToColumn>0&&(n._initialScrollLeft=n._getCalculatedScrollLeft(e,n.state)),n}return v(t,n),s(t,[{key:"getOffsetForCell",value:function(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{},n=e.alignment,t=void 0===n?this.props.scrollToAlignment:n,r=e.columnIndex,o=void 0===r?this.props.scrollToColumn:r,i=e.rowIndex,a=void 0===i?this.props.scrollToRow:i,l=W({},this.props,{scrollToAlignment:t,scrollToColumn:o,scrollToRow:a});return{scrollLeft:this._getCalculatedScrollLeft(l),scrollTop:this._getCalculatedScrollTop(l)}}},{key:"getTotalRowsHeight",value:function(){return this.state.instanceProps.rowSizeAndPositionManager.getTotalSize()}},{key:"getTotalColumnsWidth",value:function(){return this.state.instanceProps.columnSizeAndPositionManager.getTotalSize()}},{key:"handleScrollEvent",value:function(e){var n=e.scrollLeft,t=void 0===n?0:n,r=e.scrollTop,o=void 0===r?0:r;if(!(o<0)){this._debounceScrollEnded();var i=this.props,a=i.autoHeight,l=i.autoWidth,c=i.height,u=i.width,s=this.state.instanceProps,f=s.scrollbarSize,p=s.rowSizeAndPositionManager.getTotalSize(),d=s.columnSizeAndPositionManager.getTotalSize(),h=Math.min(Math.max(0,d-u+f),t),g=Math.min(Math.max(0,p-c+f),o);if(this.state.scrollLeft!==h||this.state.scrollTop!==g){var v={isScrolling:!0,scrollDirectionHorizontal:h!==this.state.scrollLeft?h>this.state.scrollLeft?1:-1:this.state.scrollDirectionHorizontal,scrollDirectionVertical:g!==this.state.scrollTop?g>this.state.scrollTop?1:-1:this.state.scrollDirectionVertical,scrollPositionChangeReason:H};a||(v.scrollTop=g),l||(v.scrollLeft=h),v.needToResetStyleCache=!1,this.setState(v)}this._invokeOnScrollMemoizer({scrollLeft:h,scrollTop:g,totalColumnsWidth:d,totalRowsHeight:p})}}},{key:"invalidateCellSizeAfterRender",value:function(e){var n=e.columnIndex,t=e.rowIndex;this._deferredInvalidateColumnIndex="number"==typeof this._deferredInvalidateColumnIndex?Math.min(this._deferredInvalidateColumnIndex,n):n,this._deferredInvalidateRowIndex="number"==typeof this._deferredInvalidateRowIndex?Math.min(this._deferredInvalidateRowIndex,t):t}},{key:"measureAllCells",value:function(){var e=this.props,n=e.columnCount,t=e.rowCount,r=this.state.instanceProps;r.columnSizeAndPositionManager.getSizeAndPositionOfCell(n-1),r.rowSizeAndPositionManager.getSizeAndPositionOfCell(t-1)}},{key:"recomputeGridSize",value:function(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{},n=e.columnIndex,t=void 0===n?0:n,r=e.rowIndex,o=void 0===r?0:r,i=this.props,a=i.scrollToColumn,l=i.scrollToRow,c=this.state.instanceProps;c.columnSizeAndPositionManager.resetCell(t),c.rowSizeAndPositionManager.resetCell(o),this._recomputeScrollLeftFlag=a>=0&&(1===this.state.scrollDirectionHorizontal?t<=a:t>=a),this._recomputeScrollTopFlag=l>=0&&(1===this.state.scrollDirectionVertical?o<=l:o>=l),this._styleCache={},this._cellCache={},this.forceUpdate()}},{key:"scrollToCell",value:function(e){var n=e.columnIndex,t=e.rowIndex,r=this.props.columnCount,o=this.props;r>1&&void 0!==n&&this._updateScrollLeftForScrollToColumn(W({},o,{scrollToColumn:n})),void 0!==t&&this._updateScrollTopForScrollToRow(W({},o,{scrollToRow:t}))}},{key:"componentDidMount",value:function(){var e=this.props,n=e.getScrollbarSize,r=e.height,o=e.scrollLeft,i=e.scrollToColumn,a=e.scrollTop,l=e.scrollToRow,c=e.width,u=this.state.instanceProps;if(this._initialScrollTop=0,this._initialScrollLeft=0,this._handleInvalidatedGridSize(),u.scrollbarSizeMeasured||this.setState((function(e){var t=W({},e,{needToResetStyleCache:!1});return t.instanceProps.scrollbarSize=n(),t.instanceProps.scrollbarSizeMeasured=!0,t})),"number"==typeof o&&o>=0||"number"==typeof a&&a>=0){var s=t._getScrollToPositionStateUpdate({prevState:this.state,scrollLeft:o,scrollTop:a});s&&(s.needToResetStyleCache=!1,this.setState(s))}this._scrollingContainer&&(this._scrollingContainer.scrollLeft!==this.state.scrollLeft&&(this._scrollingContainer.scrollLeft=this.state.scrollLeft),this._scrollingContainer.scrollTop!==this.state.scrollTop&&(this._scrollingContainer.scrollTop=this.state.scrollTop));var f=r>0&&c>0;i>=0&&f&&this._updateScrollLeftForScrollToColumn(),l>=0&&f&&this._updateScrollTopForScrollToRow(),this._invokeOnGridRenderedHelper(),this._invokeOnScrollMemoizer({scrollLeft:o||0,scrollTop:a||0,totalColumnsWidth:u.columnSizeAndPositionManager.getTotalSize(),totalRowsHeight:u.rowSizeAndPositionManager.getTotalSize()}),this._maybeCallOnScrollbarPresenceChange()}},{key:"componentDidUpdate",value:function(e,n){var t=this,r=this.props,o=r.autoHeight,i=r.autoWidth,a=r.columnCount,l=r.height,c=r.rowCount,u=r.scrollToAlignment,s=r.scrollToColumn,f=r.scrollToRow,p=r.width,d=this.state,h=d.scrollLeft,g=d.scrollPositionChangeReason,v=d.scrollTop,A=d.instanceProps;this._handleInvalidatedGridSize();var b=a>0&&0===e.columnCount||c>0&&0===e.rowCount;g===G&&(!i&&h>=0&&(h!==this._scrollingContainer.scrollLeft||b)&&(this._scrollingContainer.scrollLeft=h),!o&&v>=0&&(v!==this._scrollingContainer.scrollTop||b)&&(this._scrollingContainer.scrollTop=v));var m=(0===e.width||0===e.height)&&l>0&&p>0;if(this._recomputeScrollLeftFlag?(this._recomputeScrollLeftFlag=!1,this._updateScrollLeftForScrollToColumn(this.props)):k({cellSizeAndPositionManager:A.columnSizeAndPositionManager,previousCellsCount:e.columnCount,previousCellSize:e.columnWidth,previousScrollToAlignment:e.scrollToAlignment,previousScrollToIndex:e.scrollToColumn,previousSize:e.width,scrollOffset:h,scrollToAlignment:u,scrollToIndex:s,size:p,sizeJustIncreasedFromZero:m,updateScrollIndexCallback:function(){return t._updateScrollLeftForScrollToColumn(t.props)}}),this._recomputeScrollTopFlag?(this._recomputeScrollTopFlag=!1,this._updateScrollTopForScrollToRow(this.props)):k({cellSizeAndPositionManager:A.rowSizeAndPositionManager,previousCellsCount:e.rowCount,previousCellSize:e.rowHeight,previousScrollToAlignment:e.scrollToAlignment,previousScrollToIndex:e.scrollToRow,previousSize:e.height,scrollOffset:v,scrollToAlignment:u,scrollToIndex:f,size:l,sizeJustIncreasedFromZero:m,updateScrollIndexCallback:function(){return t._updateScrollTopForScrollToRow(t.props)}}),this._invokeOnGridRenderedHelper(),h!==n.scrollLeft||v!==n.scrollTop){var y=A.rowSizeAndPositionManager.getTotalSize(),E=A.columnSizeAndPositionManager.getTotalSize();this._invokeOnScrollMemoizer({scrollLeft:h,scrollTop:v,totalColumnsWidth:E,totalRowsHeight:y})}this._maybeCallOnScrollbarPresenceChange()}},{key:"componentWillUnmount",value:function(){this._disablePointerEventsTimeoutId&&L(this._disablePointerEventsTimeoutId)}},{key:"render",value:function(){var n=this.props,t=n.autoContainerWidth,r=n.autoHeight,o=n.autoWidth,i=n.className,a=n.containerProps,c=n.containerRole,u=n.containerStyle,s=n.height,f=n.id,p=n.noContentRenderer,d=n.role,h=n.style,g=n.tabIndex,v=n.width,A=this.state,b=A.instanceProps,y=A.needToResetStyleCache,E=this._isScrolling(),_={boxSizing:"border-box",direction:"ltr",height:r?"auto":s,position:"relative",width:o?"auto":v,WebkitOverflowScrolling:"touch",willChange:"transform"};y&&(this._styleCache={}),this.state.isScrolling||this._resetStyleCache(),this._calculateChildrenToRender(this.props,this.state);var C=b.columnSizeAndPositionManager.getTotalSize(),w=b.rowSizeAndPositionManager.getTotalSize(),x=w>s?b.scrollbarSize:0,k=C>v?b.scrollbarSize:0;k===this._horizontalScrollBarSize&&x===this._verticalScrollBarSize||(this._horizontalScrollBarSize=k,this._verticalScrollBarSize=x,this._scrollbarPresenceChanged=!0),_.overflowX=C+x<=v?"hidden":"auto",_.overflowY=w+k<=s?"hidden":"auto";var S=this._childrenToDisplay,O=0===S.length&&s>0&&v>0;return e.createElement("div",l({ref:this._setScrollingContainerRef},a,{"aria-label":this.props["aria-label"],"aria-readonly":this.props["aria-readonly"],className:m("ReactVirtualized__Grid",i),id:f,onScroll:this._onScroll,role:d,style:W({},_,{},h),tabIndex:g}),S.length>0&&e.createElement("div",{className:"ReactVirtualized__Grid__innerScrollContainer",role:c,style:W({width:t?"auto":C,height:w,maxWidth:C,maxHeight:w,overflow:"hidden",pointerEvents:E?"none":"",position:"relative"},u)},S),O&&p())}},{key:"_calculateChildrenToRender",value:function(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:this.props,n=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.state,t=e.cellRenderer,r=e.cellRangeRenderer,o=e.columnCount,i=e.deferredMeasurementCache,a=e.height,l=e.overscanColumnCount,c=e.overscanIndicesGetter,u=e.overscanRowCount,s=e.rowCount,f=e.width,p=e.isScrollingOptOut,d=n.scrollDirectionHorizontal,h=n.scrollDirectionVertical,g=n.instanceProps,v=this._initialScrollTop>0?this._initialScrollTop:n.scrollTop,A=this._initialScrollLeft>0?this._initialScrollLeft:n.scrollLeft,b=this._isScrolling(e,n);if(this._childrenToDisplay=[],a>0&&f>0){var m=g.columnSizeAndPositionManager.getVisibleCellRange({containerSize:f,offset:A}),y=g.rowSizeAndPositionManager.getVisibleCellRange({containerSize:a,offset:v}),E=g.columnSizeAndPositionManager.getOffsetAdjustment({containerSize:f,offset:A}),_=g.rowSizeAndPositionManager.getOffsetAdjustment({containerSize:a,offset:v});this._renderedColumnStartIndex=m.start,this._renderedColumnStopIndex=m.stop,this._renderedRowStartIndex=y.start,this._renderedRowStopIndex=y.stop;var C=c({direction:"horizontal",cellCount:o,overscanCellsCount:l,scrollDirection:d,startIndex:"number"==typeof m.start?m.start:0,stopIndex:"number"==typeof m.stop?m.stop:-1}),w=c({direction:"vertical",cellCount:s,overscanCellsCount:u,scrollDirection:h,startIndex:"number"==typeof y.start?y.start:0,stopIndex:"number"==typeof y.stop?y.stop:-1}),x=C.overscanStartIndex,k=C.overscanStopIndex,S=w.overscanStartIndex,O=w.overscanStopIndex;if(i){if(!i.hasFixedHeight())for(var B=S;B<=O;B++)if(!i.has(B,0)){x=0,k=o-1;break}if(!i.hasFixedWidth())for(var I=x;I<=k;I++)if(!i.has(0,I)){S=0,O=s-1;break}}this._childrenToDisplay=r({cellCache:this._cellCache,cellRenderer:t,columnSizeAndPositionManager:g.columnSizeAndPositionManager,columnStartIndex:x,columnStopIndex:k,deferredMeasurementCache:i,horizontalOffsetAdjustment:E,isScrolling:b,isScrollingOptOut:p,parent:this,rowSizeAndPositionManager:g.rowSizeAndPositionManager,rowStartIndex:S,rowStopIndex:O,scrollLeft:A,scrollTop:v,styleCache:this._styleCache,verticalOffsetAdjustment:_,visibleColumnIndices:m,visibleRowIndices:y}),this._columnStartIndex=x,this._columnStopIndex=k,this._rowStartIndex=S,this._rowStopIndex=O}}},{key:"_debounceScrollEnded",value:function(){var e=this.props.scrollingResetTimeInterval;this._disablePointerEventsTimeoutId&&L(this._disablePointerEventsTimeoutId),this._disablePointerEventsTimeoutId=F(this._debounceScrollEndedCallback,e)}},{key:"_handleInvalidatedGridSize",value:function(){if("number"==typeof this._deferredInvalidateColumnIndex&&"number"==typeof this._deferredInvalidateRowIndex){var e=this._deferredInvalidateColumnIndex,n=this._deferredInvalidateRowIndex;this._deferredInvalidateColumnIndex=null,this._deferredInvalidateRowIndex=null,this.recomputeGridSize({columnIndex:e,rowIndex:n})}}},{key:"_invokeOnScrollMemoizer",value:function(e){var n=this,t=e.scrollLeft,r=e.scrollTop,o=e.totalColumnsWidth,i=e.totalRowsHeight;this._onScrollMemoizer({callback:function(e){var t=e.scrollLeft,r=e.scrollTop,a=n.props,l=a.height;(0,a.onScroll)({clientHeight:l,clientWidth:a.width,scrollHeight:i,scrollLeft:t,scrollTop:r,scrollWidth:o})},indices:{scrollLeft:t,scrollTop:r}})}},{key:"_isScrolling",value:function(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:this.props,n=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.state;return Object.hasOwnProperty.call(e,"isScrolling")?Boolean(e.isScrolling):Boolean(n.isScrolling)}},{key:"_maybeCallOnScrollbarPresenceChange",value:function(){if(this._scrollbarPresenceChanged){var e=this.props.onScrollbarPresenceChange;this._scrollbarPresenceChanged=!1,e({horizontal:this._horizontalScrollBarSize>0,size:this.state.instanceProps.scrollbarSize,vertical:this._verticalScrollBarSize>0})}}},{key:"scrollToPosition",value:function(e){var n=e.scrollLeft,r=e.scrollTop,o=t._getScrollToPositionStateUpdate({prevState:this.state,scrollLeft:n,scrollTop:r});o&&(o.needToResetStyleCache=!1,this.setState(o))}},{key:"_getCalculatedScrollLeft",value:function(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:this.props,n=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.state;return t._getCalculatedScrollLeft(e,n)}},{key:"_updateScrollLeftForScrollToColumn",value:function(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:this.props,n=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.state,r=t._getScrollLeftForScrollToColumnStateUpdate(e,n);r&&(r.needToResetStyleCache=!1,this.setState(r))}},{key:"_getCalculatedScrollTop",value:function(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:this.props,n=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.state;return t._getCalculatedScrollTop(e,n)}},{key:"_resetStyleCache",value:function(){var e=this._styleCache,n=this._cellCache,t=this.props.isScrollingOptOut;this._cellCache={},this._styleCache={};for(var r=this._rowStartIndex;r<=this._rowStopIndex;r++)for(var o=this._columnStartIndex;o<=this._columnStopIndex;o++){var i="".concat(r,"-").concat(o);this._styleCache[i]=e[i],t&&(this._cellCache[i]=n[i])}}},{key:"_updateScrollTopForScrollToRow",value:function(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:this.props,n=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.state,r=t._getScrollTopForScrollToRowStateUpdate(e,n);r&&(r.needToResetStyleCache=!1,this.setState(r))}}],[{key:"getDerivedStateFromProps",value:function(e,n){var r={};0===e.columnCount&&0!==n.scrollLeft||0===e.rowCount&&0!==n.scrollTop?(r.scrollLeft=0,r.scrollTop=0):(e.scrollLeft!==n.scrollLeft&&e.scrollToColumn<0||e.scrollTop!==n.scrollTop&&e.scrollToRow<0)&&Object.assign(r,t._getScrollToPositionStateUpdate({prevState:n,scrollLeft:e.scrollLeft,scrollTop:e.scrollTop}));var o,i,a=n.instanceProps;return r.needToResetStyleCache=!1,e.columnWidth===a.prevColumnWidth&&e.rowHeight===a.prevRowHeight||(r.needToResetStyleCache=!0),a.columnSizeAndPositionManager.configure({cellCount:e.columnCount,estimatedCellSize:t._getEstimatedColumnSize(e),cellSizeGetter:t._wrapSizeGetter(e.columnWidth)}),a.rowSizeAndPositionManager.configure({cellCount:e.rowCount,estimatedCellSize:t._getEstimatedRowSize(e),cellSizeGetter:t._wrapSizeGetter(e.rowHeight)}),0!==a.prevColumnCount&&0!==a.prevRowCount||(a.prevColumnCount=0,a.prevRowCount=0),e.autoHeight&&!1===e.isScrolling&&!0===a.prevIsScrolling&&Object.assign(r,{isScrolling:!1}),y({cellCount:a.prevColumnCount,cellSize:"number"==typeof a.prevColumnWidth?a.prevColumnWidth:null,computeMetadataCallback:function(){return a.columnSizeAndPositionManager.resetCell(0)},computeMetadataCallbackProps:e,nextCellsCount:e.columnCount,nextCellSize:"number"==typeof e.columnWidth?e.columnWidth:null,nextScrollToIndex:e.scrollToColumn,scrollToIndex:a.prevScrollToColumn,updateScrollOffsetForScrollToIndex:function(){o=t._getScrollLeftForScrollToColumnStateUpdate(e,n)}}),y({cellCount:a.prevRowCount,cellSize:"number"==typeof a.prevRowHeight?a.prevRowHeight:null,computeMetadataCallback:function(){return a.rowSizeAndPositionManager.resetCell(0)},computeMetadataCallbackProps:e,nextCellsCount:e.rowCount,nextCellSize:"number"==typeof e.rowHeight?e.rowHeight:null,nextScrollToIndex:e.scrollToRow,scrollToIndex:a.prevScrollToRow,updateScrollOffsetForScrollToIndex:function(){i=t._getScrollTopForScrollToRowStateUpdate(e,n)}}),a.prevColumnCount=e.columnCount,a.prevColumnWidth=e.columnWidth,a.prevIsScrolling=!0===e.isScrolling,a.prevRowCount=e.rowCount,a.prevRowHeight=e.rowHeight,a.prevScrollToColumn=e.scrollToColumn,a.prevScrollToRow=e.scrollToRow,a.scrollbarSize=e.getScrollbarSize(),void 0===a.scrollbarSize?(a.scrollbarSizeMeasured=!1,a.scrollbarSize=0):a.scrollbarSizeMeasured=!0,r.instanceProps=a,W({},r,{},o,{},i)}},{key:"_getEstimatedColumnSize",value:function(e){return"number"==typeof e.columnWidth?e.columnWidth:e.estimatedColumnSize}},{key:"_getEstimatedRowSize",value:function(e){return"number"==typeof e.rowHeight?e.rowHeight:e.estimatedRowSize}},{key:"_getScrollToPositionStateUpdate",value:function(e){var n=e.prevState,t=e.scrollLeft,r=e.scrollTop,o={scrollPositionChangeReason:G};return"number"==typeof t&&t>=0&&(o.scrollDirectionHorizontal=t>n.scrollLeft?1:-1,o.scrollLeft=t),"number"==typeof r&&r>=0&&(o.scrollDirectionVertical=r>n.scrollTop?1:-1,o.scrollTop=r),"number"==typeof t&&t>=0&&t!==n.scrollLeft||"number"==typeof r&&r>=0&&r!==n.scrollTop?o:{}}},{key:"_wrapSizeGetter",value:function(e){return"function"==typeof e?e:function(){return e}}},{key:"_getCalculatedScrollLeft",value:function(e,n){var t=e.columnCount,r=e.height,o=e.scrollToAlignment,i=e.scrollToColumn,a=e.width,l=n.scrollLeft,c=n.instanceProps;if(t>0){var u=t-1,s=i<0?u:Math.min(u,i),f=c.rowSizeAndPositionManager.getTotalSize(),p=c.scrollbarSizeMeasured&&f>r?c.scrollbarSize:0;return c.columnSizeAndPositionManager.getUpdatedOffsetForIndex({align:o,containerSize:a-p,currentOffset:l,targetIndex:s})}return 0}},{key:"_getScrollLeftForScrollToColumnStateUpdate",value:function(e,n){var r=n.scrollLeft,o=t._getCalculatedScrollLeft(e,n);return"number"==typeof o&&o>=0&&r!==o?t._getScrollToPositionStateUpdate({prevState:n,scrollLeft:o,scrollTop:-1}):{}}},{key:"_getCalculatedScrollTop",value:function(e,n){var t=e.height,r=e.rowCount,o=e.scrollToAlignment,i=e.scrollToRow,a=e.width,l=n.scrollTop,c=n.instanceProps;if(r>0){var u=r-1,s=i<0?u:Math.min(u,i),f=c.columnSizeAndPositionManager.getTotalSize(),p=c.scrollbarSizeMeasured&&f>a?c.scrollbarSize:0;return c.rowSizeAndPositionManager.getUpdatedOffsetForIndex({align:o,containerSize:t-p,currentOffset:l,targetIndex:s})}return 0}},{key:"_getScrollTopForScrollToRowStateUpdate",value:function(e,n){var r=n.scrollTop,o=t._getCalculatedScrollTop(e,n);return"number"==typeof o&&o>=0&&r!==o?t._getScrollToPositionStateUpdate({prevState:n,scrollLeft:-1,scrollTop:o}):{}}}]),t}(e.PureComponent),A(j,"propTypes",null),z);A(q,"defaultProps",{"aria-label":"grid","aria-readonly":!0,autoContainerWidth:!1,autoHeight:!1,autoWidth:!1,cellRangeRenderer:function(e){for(var n=e.cellCache,t=e.cellRenderer,r=e.columnSizeAndPositionManager,o=e.columnStartIndex,i=e.columnStopIndex,a=e.deferredMeasurementCache,l=e.horizontalOffsetAdjustment,c=e.isScrolling,u=e.isScrollingOptOut,s=e.parent,f=e.rowSizeAndPositionManager,p=e.rowStartIndex,d=e.rowStopIndex,h=e.styleCache,g=e.verticalOffsetAdjustment,v=e.visibleColumnIndices,A=e.visibleRowIndices,b=[],m=r.areOffsetsAdjusted()||f.areOffsetsAdjusted(),y=!c&&!m,E=p;E<=d;E++)for(var _=f.getSizeAndPositionOfCell(E),C=o;C<=i;C++){var w=r.getSizeAndPositionOfCell(C),x=C>=v.start&&C<=v.stop&&E>=A.start&&E<=A.stop,k="".concat(E,"-").concat(C),S=void 0;y&&h[k]?S=h[k]:a&&!a.has(E,C)?S={height:"auto",left:0,position:"absolute",top:0,width:"auto"}:(S={height:_.size,left:w.offset+l,position:"absolute",top:_.offset+g,width:w.size},h[k]=S);var O={columnIndex:C,isScrolling:c,isVisible:x,key:k,parent:s,rowIndex:E,style:S},B=void 0;!u&&!c||l||g?B=t(O):(n[k]||(n[k]=t(O)),B=n[k]),null!=B&&!1!==B&&b.push(B)}return b},containerRole:"rowgroup",containerStyle:{},estimatedColumnSize:100,estimatedRowSize:30,getScrollbarSize:function(e){if((!O&&0!==O||e)&&S){var n=document.createElement("div");n.style.position="absolute",n.style.top="-9999px",n.style.width="50px",n.style.height="50px",n.style.overflow="scroll",document.body.appendChild(n),O=n.offsetWidth-n.clientWidth,document.body.removeChild(n)}return O},noContentRenderer:function(){return null},onScroll:function(){},onScrollbarPresenceChange:function(){},onSectionRendered:function(){},overscanColumnCount:0,overscanIndicesGetter:function(e){var n=e.cellCount,t=e.overscanCellsCount,r=e.scrollDirection,o=e.startIndex,i=e.stopIndex;return 1===r?{overscanStartIndex:Math.max(0,o),overscanStopIndex:Math.min(n-1,i+t)}:{overscanStartIndex:Math.max(0,o-t),overscanStopIndex:Math.min(n-1,i)}},overscanRowCount:10,role:"grid",scrollingResetTimeInterval:150,scrollToAlignment:"auto",scrollToColumn:-1,scrollToRow:-1,style:{},tabIndex:0,isScrollingOptOut:!1}),function(e){var n=e.prototype;if(!n||!n.isReactComponent)throw new Error("Can only polyfill class components");if("function"!=typeof e.getDerivedStateFromProps&&"function"!=typeof n.getSnapshotBeforeUpdate)return e;var t=null,r=null,o=null;if("function"==typeof n.componentWillMount?t="componentWillMount":"function"==typeof n.UNSAFE_componentWillMount&&(t="UNSAFE_componentWillMount"),"function"==typeof n.componentWillReceiveProps?r="componentWillReceiveProps":"function"==typeof n.UNSAFE_componentWillReceiveProps&&(r="UNSAFE_componentWillReceiveProps"),"function"==typeof n.componentWillUpdate?o="componentWillUpdate":"function"==typeof n.UNSAFE_componentWillUpdate&&(o="UNSAFE_componentWillUpdate"),null!==t||null!==r||null!==o){var i=e.displayName||e.name,a="function"==typeof e.getDerivedStateFromProps?"getDerivedStateFromProps()":"getSnapshotBeforeUpdate()";throw Error("Unsafe legacy lifecycles will not be called for components using new component APIs.\n\n"+i+" uses "+a+" but also contains the following legacy lifecycles:"+(null!==t?"\n  "+t:"")+(null!==r?"\n  "+r:"")+(null!==o?"\n  "+o:"")+"\n\nThe above lifecycles should be removed. Learn more about this warning here:\nhttps://fb.me/react-async-component-lifecycle-hooks")}if("function"==typeof e.getDerivedStateFromProps&&(n.componentWillMount=I,n.componentWillReceiveProps=T),"function"==typeof n.getSnapshotBeforeUpdate){if("function"!=typeof n.componentDidUpdate)throw new Error("Cannot polyfill getSnapshotBeforeUpdate() for components that do not define componentDidUpdate() on the prototype");n.componentWillUpdate=P;var l=n.componentDidUpdate;n.componentDidUpdate=function(e,n,t){var r=this.__reactInternalSnapshotFlag?this.__reactInternalSnapshot:t;l.call(this,e,n,r)}}}(q);const V=q;var $,K,Y,X,Z=(K=$=function(n){function t(){var e,n;c(this,t);for(var r=arguments.length,o=new Array(r),i=0;i<r;i++)o[i]=arguments[i];return A(p(n=d(this,(e=h(t)).call.apply(e,[this].concat(o)))),"Grid",void 0),A(p(n),"_cellRenderer",(function(e){var t=e.parent,r=e.rowIndex,o=e.style,i=e.isScrolling,a=e.isVisible,l=e.key,c=n.props.rowRenderer,u=Object.getOwnPropertyDescriptor(o,"width");return u&&u.writable&&(o.width="100%"),c({index:r,style:o,isScrolling:i,isVisible:a,key:l,parent:t})})),A(p(n),"_setRef",(function(e){n.Grid=e})),A(p(n),"_onScroll",(function(e){var t=e.clientHeight,r=e.scrollHeight,o=e.scrollTop;(0,n.props.onScroll)({clientHeight:t,scrollHeight:r,scrollTop:o})})),A(p(n),"_onSectionRendered",(function(e){var t=e.rowOverscanStartIndex,r=e.rowOverscanStopIndex,o=e.rowStartIndex,i=e.rowStopIndex;(0,n.props.onRowsRendered)({overscanStartIndex:t,overscanStopIndex:r,startIndex:o,stopIndex:i})})),n}return v(t,n),s(t,[{key:"forceUpdateGrid",value:function(){this.Grid&&this.Grid.forceUpdate()}},{key:"getOffsetForRow",value:function(e){var n=e.alignment,t=e.index;return this.Grid?this.Grid.getOffsetForCell({alignment:n,rowIndex:t,columnIndex:0}).scrollTop:0}},{key:"invalidateCellSizeAfterRender",value:function(e){var n=e.columnIndex,t=e.rowIndex;this.Grid&&this.Grid.invalidateCellSizeAfterRender({rowIndex:t,columnIndex:n})}},{key:"measureAllRows",value:function(){this.Grid&&this.Grid.measureAllCells()}},{key:"recomputeGridSize",value:function(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{},n=e.columnIndex,t=void 0===n?0:n,r=e.rowIndex,o=void 0===r?0:r;this.Grid&&this.Grid.recomputeGridSize({rowIndex:o,columnIndex:t})}},{key:"recomputeRowHeights",value:function(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:0;this.Grid&&this.Grid.recomputeGridSize({rowIndex:e,columnIndex:0})}},{key:"scrollToPosition",value:function(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:0;this.Grid&&this.Grid.scrollToPosition({scrollTop:e})}},{key:"scrollToRow",value:function(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:0;this.Grid&&this.Grid.scrollToCell({columnIndex:0,rowIndex:e})}},{key:"render",value:function(){var n=this.props,t=n.className,r=n.noRowsRenderer,o=n.scrollToIndex,i=n.width,a=m("ReactVirtualized__List",t);return e.createElement(V,l({},this.props,{autoContainerWidth:!0,cellRenderer:this._cellRenderer,className:a,columnWidth:i,columnCount:1,noContentRenderer:r,onScroll:this._onScroll,onSectionRendered:this._onSectionRendered,ref:this._setRef,scrollToRow:o}))}}]),t}(e.PureComponent),A($,"propTypes",null),K);function Q(e,n){var r,o=void 0!==(r=void 0!==n?n:"undefined"!=typeof window?window:"undefined"!=typeof self?self:t.g).document&&r.document.attachEvent;if(!o){var i=function(){var e=r.requestAnimationFrame||r.mozRequestAnimationFrame||r.webkitRequestAnimationFrame||function(e){return r.setTimeout(e,20)};return function(n){return e(n)}}(),a=function(){var e=r.cancelAnimationFrame||r.mozCancelAnimationFrame||r.webkitCancelAnimationFrame||r.clearTimeout;return function(n){return e(n)}}(),l=function(e){var n=e.__resizeTriggers__,t=n.firstElementChild,r=n.lastElementChild,o=t.firstElementChild;r.scrollLeft=r.scrollWidth,r.scrollTop=r.scrollHeight,o.style.width=t.offsetWidth+1+"px",o.style.height=t.offsetHeight+1+"px",t.scrollLeft=t.scrollWidth,t.scrollTop=t.scrollHeight},c=function(e){if(!(e.target.className&&"function"==typeof e.target.className.indexOf&&e.target.className.indexOf("contract-trigger")<0&&e.target.className.indexOf("expand-trigger")<0)){var n=this;l(this),this.__resizeRAF__&&a(this.__resizeRAF__),this.__resizeRAF__=i((function(){(function(e){return e.offsetWidth!=e.__resizeLast__.width||e.offsetHeight!=e.__resizeLast__.height})(n)&&(n.__resizeLast__.width=n.offsetWidth,n.__resizeLast__.height=n.offsetHeight,n.__resizeListeners__.forEach((function(t){t.call(n,e)})))}))}},u=!1,s="",f="animationstart",p="Webkit Moz O ms".split(" "),d="webkitAnimationStart animationstart oAnimationStart MSAnimationStart".split(" "),h=r.document.createElement("fakeelement");if(void 0!==h.style.animationName&&(u=!0),!1===u)for(var g=0;g<p.length;g++)if(void 0!==h.style[p[g]+"AnimationName"]){s="-"+p[g].toLowerCase()+"-",f=d[g],u=!0;break}var v="resizeanim",A="@"+s+"keyframes "+v+" { from { opacity: 0; } to { opacity: 0; } } ",b=s+"animation: 1ms "+v+"; "}return{addResizeListener:function(n,t){if(o)n.attachEvent("onresize",t);else{if(!n.__resizeTriggers__){var i=n.ownerDocument,a=r.getComputedStyle(n);a&&"static"==a.position&&(n.style.position="relative"),function(n){if(!n.getElementById("detectElementResize")){var t=(A||"")+".resize-triggers { "+(b||"")+'visibility: hidden; opacity: 0; } .resize-triggers, .resize-triggers > div, .contract-trigger:before { content: " "; display: block; position: absolute; top: 0; left: 0; height: 100%; width: 100%; overflow: hidden; z-index: -1; } .resize-triggers > div { background: #eee; overflow: auto; } .contract-trigger:before { width: 200%; height: 200%; }',r=n.head||n.getElementsByTagName("head")[0],o=n.createElement("style");o.id="detectElementResize",o.type="text/css",null!=e&&o.setAttribute("nonce",e),o.styleSheet?o.styleSheet.cssText=t:o.appendChild(n.createTextNode(t)),r.appendChild(o)}}(i),n.__resizeLast__={},n.__resizeListeners__=[],(n.__resizeTriggers__=i.createElement("div")).className="resize-triggers";var u='<div class="expand-trigger"><div></div></div><div class="contract-trigger"></div>';if(window.trustedTypes){var s=trustedTypes.createPolicy("react-virtualized-auto-sizer",{createHTML:function(){return u}});n.__resizeTriggers__.innerHTML=s.createHTML("")}else n.__resizeTriggers__.innerHTML=u;n.appendChild(n.__resizeTriggers__),l(n),n.addEventListener("scroll",c,!0),f&&(n.__resizeTriggers__.__animationListener__=function(e){e.animationName==v&&l(n)},n.__resizeTriggers__.addEventListener(f,n.__resizeTriggers__.__animationListener__))}n.__resizeListeners__.push(t)}},removeResizeListener:function(e,n){if(o)e.detachEvent("onresize",n);else if(e.__resizeListeners__.splice(e.__resizeListeners__.indexOf(n),1),!e.__resizeListeners__.length){e.removeEventListener("scroll",c,!0),e.__resizeTriggers__.__animationListener__&&(e.__resizeTriggers__.removeEventListener(f,e.__resizeTriggers__.__animationListener__),e.__resizeTriggers__.__animationListener__=null);try{e.__resizeTriggers__=!e.removeChild(e.__resizeTriggers__)}catch(e){}}}}}function J(e,n){var t=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);n&&(r=r.filter((function(n){return Object.getOwnPropertyDescriptor(e,n).enumerable}))),t.push.apply(t,r)}return t}function ee(e){for(var n=1;n<arguments.length;n++){var t=null!=arguments[n]?arguments[n]:{};n%2?J(t,!0).forEach((function(n){A(e,n,t[n])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(t)):J(t).forEach((function(n){Object.defineProperty(e,n,Object.getOwnPropertyDescriptor(t,n))}))}return e}A(Z,"defaultProps",{autoHeight:!1,estimatedRowSize:30,onScroll:function(){},noRowsRenderer:function(){return null},onRowsRendered:function(){},overscanIndicesGetter:function(e){var n=e.cellCount,t=e.overscanCellsCount,r=e.scrollDirection,o=e.startIndex,i=e.stopIndex;return t=Math.max(1,t),1===r?{overscanStartIndex:Math.max(0,o-1),overscanStopIndex:Math.min(n-1,i+t)}:{overscanStartIndex:Math.max(0,o-t),overscanStopIndex:Math.min(n-1,i+1)}},overscanRowCount:10,scrollToAlignment:"auto",scrollToIndex:-1,style:{}});var ne=(X=Y=function(n){function t(){var e,n;c(this,t);for(var r=arguments.length,o=new Array(r),i=0;i<r;i++)o[i]=arguments[i];return A(p(n=d(this,(e=h(t)).call.apply(e,[this].concat(o)))),"state",{height:n.props.defaultHeight||0,width:n.props.defaultWidth||0}),A(p(n),"_parentNode",void 0),A(p(n),"_autoSizer",void 0),A(p(n),"_window",void 0),A(p(n),"_detectElementResize",void 0),A(p(n),"_onResize",(function(){var e=n.props,t=e.disableHeight,r=e.disableWidth,o=e.onResize;if(n._parentNode){var i=n._parentNode.offsetHeight||0,a=n._parentNode.offsetWidth||0,l=(n._window||window).getComputedStyle(n._parentNode)||{},c=parseInt(l.paddingLeft,10)||0,u=parseInt(l.paddingRight,10)||0,s=parseInt(l.paddingTop,10)||0,f=parseInt(l.paddingBottom,10)||0,p=i-s-f,d=a-c-u;(!t&&n.state.height!==p||!r&&n.state.width!==d)&&(n.setState({height:i-s-f,width:a-c-u}),o({height:i,width:a}))}})),A(p(n),"_setRef",(function(e){n._autoSizer=e})),n}return v(t,n),s(t,[{key:"componentDidMount",value:function(){var e=this.props.nonce;this._autoSizer&&this._autoSizer.parentNode&&this._autoSizer.parentNode.ownerDocument&&this._autoSizer.parentNode.ownerDocument.defaultView&&this._autoSizer.parentNode instanceof this._autoSizer.parentNode.ownerDocument.defaultView.HTMLElement&&(this._parentNode=this._autoSizer.parentNode,this._window=this._autoSizer.parentNode.ownerDocument.defaultView,this._detectElementResize=Q(e,this._window),this._detectElementResize.addResizeListener(this._parentNode,this._onResize),this._onResize())}},{key:"componentWillUnmount",value:function(){this._detectElementResize&&this._parentNode&&this._detectElementResize.removeResizeListener(this._parentNode,this._onResize)}},{key:"render",value:function(){var n=this.props,t=n.children,r=n.className,o=n.disableHeight,i=n.disableWidth,a=n.style,l=this.state,c=l.height,u=l.width,s={overflow:"visible"},f={};return o||(s.height=0,f.height=c),i||(s.width=0,f.width=u),e.createElement("div",{className:r,ref:this._setRef,style:ee({},s,{},a)},t(f))}}]),t}(e.Component),A(Y,"propTypes",null),X);A(ne,"defaultProps",{onResize:function(){},disableHeight:!1,disableWidth:!1,style:{}});var te=[],re=null,oe=null;function ie(){oe&&(oe=null,document.body&&null!=re&&(document.body.style.pointerEvents=re),re=null)}function ae(){ie(),te.forEach((function(e){return e.__resetIsScrolling()}))}function le(e){e.currentTarget===window&&null==re&&document.body&&(re=document.body.style.pointerEvents,document.body.style.pointerEvents="none"),function(){oe&&L(oe);var e=0;te.forEach((function(n){e=Math.max(e,n.props.scrollingResetTimeInterval)})),oe=F(ae,e)}(),te.forEach((function(n){n.props.scrollElement===e.currentTarget&&n.__handleWindowScrollEvent()}))}function ce(e,n){te.some((function(e){return e.props.scrollElement===n}))||n.addEventListener("scroll",le),te.push(e)}function ue(e,n){(te=te.filter((function(n){return n!==e}))).length||(n.removeEventListener("scroll",le),oe&&(L(oe),ie()))}var se,fe,pe=function(e){return e===window},de=function(e){return e.getBoundingClientRect()};function he(e,n){if(e){if(pe(e)){var t=window,r=t.innerHeight,o=t.innerWidth;return{height:"number"==typeof r?r:0,width:"number"==typeof o?o:0}}return de(e)}return{height:n.serverHeight,width:n.serverWidth}}function ge(e,n){if(pe(n)&&document.documentElement){var t=document.documentElement,r=de(e),o=de(t);return{top:r.top-o.top,left:r.left-o.left}}var i=ve(n),a=de(e),l=de(n);return{top:a.top+i.top-l.top,left:a.left+i.left-l.left}}function ve(e){return pe(e)&&document.documentElement?{top:"scrollY"in window?window.scrollY:document.documentElement.scrollTop,left:"scrollX"in window?window.scrollX:document.documentElement.scrollLeft}:{top:e.scrollTop,left:e.scrollLeft}}function Ae(e,n){var t=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);n&&(r=r.filter((function(n){return Object.getOwnPropertyDescriptor(e,n).enumerable}))),t.push.apply(t,r)}return t}function be(e){for(var n=1;n<arguments.length;n++){var t=null!=arguments[n]?arguments[n]:{};n%2?Ae(t,!0).forEach((function(n){A(e,n,t[n])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(t)):Ae(t).forEach((function(n){Object.defineProperty(e,n,Object.getOwnPropertyDescriptor(t,n))}))}return e}var me=function(){return"undefined"!=typeof window?window:void 0},ye=(fe=se=function(e){function t(){var e,n;c(this,t);for(var r=arguments.length,o=new Array(r),i=0;i<r;i++)o[i]=arguments[i];return A(p(n=d(this,(e=h(t)).call.apply(e,[this].concat(o)))),"_window",me()),A(p(n),"_isMounted",!1),A(p(n),"_positionFromTop",0),A(p(n),"_positionFromLeft",0),A(p(n),"_detectElementResize",void 0),A(p(n),"_child",void 0),A(p(n),"state",be({},he(n.props.scrollElement,n.props),{isScrolling:!1,scrollLeft:0,scrollTop:0})),A(p(n),"_registerChild",(function(e){!e||e instanceof Element||console.warn("WindowScroller registerChild expects to be passed Element or null"),n._child=e,n.updatePosition()})),A(p(n),"_onChildScroll",(function(e){var t=e.scrollTop;if(n.state.scrollTop!==t){var r=n.props.scrollElement;r&&("function"==typeof r.scrollTo?r.scrollTo(0,t+n._positionFromTop):r.scrollTop=t+n._positionFromTop)}})),A(p(n),"_registerResizeListener",(function(e){e===window?window.addEventListener("resize",n._onResize,!1):n._detectElementResize.addResizeListener(e,n._onResize)})),A(p(n),"_unregisterResizeListener",(function(e){e===window?window.removeEventListener("resize",n._onResize,!1):e&&n._detectElementResize.removeResizeListener(e,n._onResize)})),A(p(n),"_onResize",(function(){n.updatePosition()})),A(p(n),"__handleWindowScrollEvent",(function(){if(n._isMounted){var e=n.props.onScroll,t=n.props.scrollElement;if(t){var r=ve(t),o=Math.max(0,r.left-n._positionFromLeft),i=Math.max(0,r.top-n._positionFromTop);n.setState({isScrolling:!0,scrollLeft:o,scrollTop:i}),e({scrollLeft:o,scrollTop:i})}}})),A(p(n),"__resetIsScrolling",(function(){n.setState({isScrolling:!1})})),n}return v(t,e),s(t,[{key:"updatePosition",value:function(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:this.props.scrollElement,t=this.props.onResize,r=this.state,o=r.height,i=r.width,a=this._child||n.findDOMNode(this);if(a instanceof Element&&e){var l=ge(a,e);this._positionFromTop=l.top,this._positionFromLeft=l.left}var c=he(e,this.props);o===c.height&&i===c.width||(this.setState({height:c.height,width:c.width}),t({height:c.height,width:c.width}))}},{key:"componentDidMount",value:function(){var e=this.props.scrollElement;this._detectElementResize=Q(),this.updatePosition(e),e&&(ce(this,e),this._registerResizeListener(e)),this._isMounted=!0}},{key:"componentDidUpdate",value:function(e,n){var t=this.props.scrollElement,r=e.scrollElement;r!==t&&null!=r&&null!=t&&(this.updatePosition(t),ue(this,r),ce(this,t),this._unregisterResizeListener(r),this._registerResizeListener(t))}},{key:"componentWillUnmount",value:function(){var e=this.props.scrollElement;e&&(ue(this,e),this._unregisterResizeListener(e)),this._isMounted=!1}},{key:"render",value:function(){var e=this.props.children,n=this.state,t=n.isScrolling,r=n.scrollTop,o=n.scrollLeft,i=n.height,a=n.width;return e({onChildScroll:this._onChildScroll,registerChild:this._registerChild,height:i,isScrolling:t,scrollLeft:o,scrollTop:r,width:a})}}]),t}(e.PureComponent),A(se,"propTypes",null),fe);A(ye,"defaultProps",{onResize:function(){},onScroll:function(){},scrollingResetTimeInterval:150,scrollElement:me(),serverHeight:0,serverWidth:0});const Ee=ye;var _e,Ce,we=(Ce=_e=function(e){function t(){var e,n;c(this,t);for(var r=arguments.length,o=new Array(r),i=0;i<r;i++)o[i]=arguments[i];return A(p(n=d(this,(e=h(t)).call.apply(e,[this].concat(o)))),"_child",void 0),A(p(n),"_measure",(function(){var e=n.props,t=e.cache,r=e.columnIndex,o=void 0===r?0:r,i=e.parent,a=e.rowIndex,l=void 0===a?n.props.index||0:a,c=n._getCellMeasurements(),u=c.height,s=c.width;u===t.getHeight(l,o)&&s===t.getWidth(l,o)||(t.set(l,o,s,u),i&&"function"==typeof i.recomputeGridSize&&i.recomputeGridSize({columnIndex:o,rowIndex:l}))})),A(p(n),"_registerChild",(function(e){!e||e instanceof Element||console.warn("CellMeasurer registerChild expects to be passed Element or null"),n._child=e,e&&n._maybeMeasureCell()})),n}return v(t,e),s(t,[{key:"componentDidMount",value:function(){this._maybeMeasureCell()}},{key:"componentDidUpdate",value:function(){this._maybeMeasureCell()}},{key:"render",value:function(){var e=this.props.children;return"function"==typeof e?e({measure:this._measure,registerChild:this._registerChild}):e}},{key:"_getCellMeasurements",value:function(){var e=this.props.cache,t=this._child||(0,n.findDOMNode)(this);if(t&&t.ownerDocument&&t.ownerDocument.defaultView&&t instanceof t.ownerDocument.defaultView.HTMLElement){var r=t.style.width,o=t.style.height;e.hasFixedWidth()||(t.style.width="auto"),e.hasFixedHeight()||(t.style.height="auto");var i=Math.ceil(t.offsetHeight),a=Math.ceil(t.offsetWidth);return r&&(t.style.width=r),o&&(t.style.height=o),{height:i,width:a}}return{height:0,width:0}}},{key:"_maybeMeasureCell",value:function(){var e=this.props,n=e.cache,t=e.columnIndex,r=void 0===t?0:t,o=e.parent,i=e.rowIndex,a=void 0===i?this.props.index||0:i;if(!n.has(a,r)){var l=this._getCellMeasurements(),c=l.height,u=l.width;n.set(a,r,u,c),o&&"function"==typeof o.invalidateCellSizeAfterRender&&o.invalidateCellSizeAfterRender({columnIndex:r,rowIndex:a})}}}]),t}(e.PureComponent),A(_e,"propTypes",null),Ce);A(we,"__internalCellMeasurerFlag",!1);var xe=function(){function e(){var n=this,t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{};c(this,e),A(this,"_cellHeightCache",{}),A(this,"_cellWidthCache",{}),A(this,"_columnWidthCache",{}),A(this,"_rowHeightCache",{}),A(this,"_defaultHeight",void 0),A(this,"_defaultWidth",void 0),A(this,"_minHeight",void 0),A(this,"_minWidth",void 0),A(this,"_keyMapper",void 0),A(this,"_hasFixedHeight",void 0),A(this,"_hasFixedWidth",void 0),A(this,"_columnCount",0),A(this,"_rowCount",0),A(this,"columnWidth",(function(e){var t=e.index,r=n._keyMapper(0,t);return void 0!==n._columnWidthCache[r]?n._columnWidthCache[r]:n._defaultWidth})),A(this,"rowHeight",(function(e){var t=e.index,r=n._keyMapper(t,0);return void 0!==n._rowHeightCache[r]?n._rowHeightCache[r]:n._defaultHeight}));var r=t.defaultHeight,o=t.defaultWidth,i=t.fixedHeight,a=t.fixedWidth,l=t.keyMapper,u=t.minHeight,s=t.minWidth;this._hasFixedHeight=!0===i,this._hasFixedWidth=!0===a,this._minHeight=u||0,this._minWidth=s||0,this._keyMapper=l||ke,this._defaultHeight=Math.max(this._minHeight,"number"==typeof r?r:30),this._defaultWidth=Math.max(this._minWidth,"number"==typeof o?o:100)}return s(e,[{key:"clear",value:function(e){var n=arguments.length>1&&void 0!==arguments[1]?arguments[1]:0,t=this._keyMapper(e,n);delete this._cellHeightCache[t],delete this._cellWidthCache[t],this._updateCachedColumnAndRowSizes(e,n)}},{key:"clearAll",value:function(){this._cellHeightCache={},this._cellWidthCache={},this._columnWidthCache={},this._rowHeightCache={},this._rowCount=0,this._columnCount=0}},{key:"hasFixedHeight",value:function(){return this._hasFixedHeight}},{key:"hasFixedWidth",value:function(){return this._hasFixedWidth}},{key:"getHeight",value:function(e){var n=arguments.length>1&&void 0!==arguments[1]?arguments[1]:0;if(this._hasFixedHeight)return this._defaultHeight;var t=this._keyMapper(e,n);return void 0!==this._cellHeightCache[t]?Math.max(this._minHeight,this._cellHeightCache[t]):this._defaultHeight}},{key:"getWidth",value:function(e){var n=arguments.length>1&&void 0!==arguments[1]?arguments[1]:0;if(this._hasFixedWidth)return this._defaultWidth;var t=this._keyMapper(e,n);return void 0!==this._cellWidthCache[t]?Math.max(this._minWidth,this._cellWidthCache[t]):this._defaultWidth}},{key:"has",value:function(e){var n=arguments.length>1&&void 0!==arguments[1]?arguments[1]:0,t=this._keyMapper(e,n);return void 0!==this._cellHeightCache[t]}},{key:"set",value:function(e,n,t,r){var o=this._keyMapper(e,n);n>=this._columnCount&&(this._columnCount=n+1),e>=this._rowCount&&(this._rowCount=e+1),this._cellHeightCache[o]=r,this._cellWidthCache[o]=t,this._updateCachedColumnAndRowSizes(e,n)}},{key:"_updateCachedColumnAndRowSizes",value:function(e,n){if(!this._hasFixedWidth){for(var t=0,r=0;r<this._rowCount;r++)t=Math.max(t,this.getWidth(r,n));var o=this._keyMapper(0,n);this._columnWidthCache[o]=t}if(!this._hasFixedHeight){for(var i=0,a=0;a<this._columnCount;a++)i=Math.max(i,this.getHeight(e,a));var l=this._keyMapper(e,0);this._rowHeightCache[l]=i}}},{key:"defaultHeight",get:function(){return this._defaultHeight}},{key:"defaultWidth",get:function(){return this._defaultWidth}}]),e}();function ke(e,n){return"".concat(e,"-").concat(n)}var Se=t(4927),Oe=t.n(Se),Be=Number.isNaN||function(e){return"number"==typeof e&&e!=e};function Ie(e,n){if(e.length!==n.length)return!1;for(var t=0;t<e.length;t++)if(r=e[t],o=n[t],!(r===o||Be(r)&&Be(o)))return!1;var r,o;return!0}function Te(e,n){void 0===n&&(n=Ie);var t=null;function r(){for(var r=[],o=0;o<arguments.length;o++)r[o]=arguments[o];if(t&&t.lastThis===this&&n(r,t.lastArgs))return t.lastResult;var i=e.apply(this,r);return t={lastResult:i,lastArgs:r,lastThis:this},i}return r.clear=function(){t=null},r}t(5827),t(9720),t(9600),t(9753),t(7042),t(8309),t(1038),t(4916);function Pe(e){return Pe="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},Pe(e)}function je(e){return function(e){if(Array.isArray(e))return Me(e)}(e)||function(e){if("undefined"!=typeof Symbol&&null!=e[Symbol.iterator]||null!=e["@@iterator"])return Array.from(e)}(e)||Re(e)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function ze(e,n){return function(e){if(Array.isArray(e))return e}(e)||function(e,n){var t=null==e?null:"undefined"!=typeof Symbol&&e[Symbol.iterator]||e["@@iterator"];if(null==t)return;var r,o,i=[],a=!0,l=!1;try{for(t=t.call(e);!(a=(r=t.next()).done)&&(i.push(r.value),!n||i.length!==n);a=!0);}catch(e){l=!0,o=e}finally{try{a||null==t.return||t.return()}finally{if(l)throw o}}return i}(e,n)||Re(e,n)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function Re(e,n){if(e){if("string"==typeof e)return Me(e,n);var t=Object.prototype.toString.call(e).slice(8,-1);return"Object"===t&&e.constructor&&(t=e.constructor.name),"Map"===t||"Set"===t?Array.from(e):"Arguments"===t||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(t)?Me(e,n):void 0}}function Me(e,n){(null==n||n>e.length)&&(n=e.length);for(var t=0,r=new Array(n);t<n;t++)r[t]=e[t];return r}function De(e){return Object.entries(e).reduce((function(e,n){var t=ze(n,2),r=t[0];return t[1]?[].concat(je(e),[r]):e}),[])}function Ne(){for(var e=arguments.length,n=new Array(e),t=0;t<e;t++)n[t]=arguments[t];return n.filter((function(e){return!!e})).reduce((function(e,n){return"object"===Pe(n)?[].concat(je(e),je(De(n))):[].concat(je(e),[n])}),[]).join(" ")}var Le={};function Fe(e){if(!e)throw Error('Argument "name" is required in getUID()');return Le[e]||(Le[e]=0),e+String(Le[e]++)}function Ue(e){var n,t,r=!1;function o(){t=window.requestAnimationFrame((function(){n(),r?(r=!1,o()):(t=null,n=null)}))}return function(i){n=i,t?e&&(r=!0):o()}}t(1532),t(4129);function We(e){var n=new Map,t=new WeakMap;return function(){var r=arguments.length>0&&void 0!==arguments[0]?arguments[0]:"__singleValue__",o=r instanceof Object?t:n;if(o.has(r))return o.get(r);var i=e(r);return o.set(r,i),i}}t(4812),t(3123),t(189);function He(e,n){for(var t=0;t<n.length;t++){var r=n[t];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}var Ge=window.getComputedStyle.bind(window);function qe(e){return e===document||e instanceof Node&&document.documentElement.contains(e.parentNode)}var Ve={top:0,right:0,bottom:0,left:0,width:0,height:0};function $e(e){if(e instanceof Range||qe(e)){var n=e.getBoundingClientRect();return{top:n.top,right:n.right,bottom:n.bottom,left:n.left,width:n.width,height:n.height}}return Object.assign({},Ve)}function Ke(){return window.innerHeight}function Ye(e){var n=$e(e),t=n.top,r=n.bottom,o=n.left,i=n.right;return!(r<0||i<0||Ke()-t<0||window.innerWidth-o<0)}var Xe=function(e){return function(n){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:"";t.split(/\s+/g).filter((function(e){return!!e})).forEach((function(t){return n[e](t)}))}};Xe("add"),Xe("remove");var Ze=function(){function e(){var n,t,r;!function(e,n){if(!(e instanceof n))throw new TypeError("Cannot call a class as a function")}(this,e),n=this,t="_all",r=new Set,t in n?Object.defineProperty(n,t,{value:r,enumerable:!0,configurable:!0,writable:!0}):n[t]=r}var n,t,r;return n=e,(t=[{key:"add",value:function(e,n,t,r){e.addEventListener(n,t,r);var o=function(){return e.removeEventListener(n,t,r)};return this._all.add(o),o}},{key:"remove",value:function(e){e(),this._all.delete(e)}},{key:"removeAll",value:function(){var e=this;this._all.forEach((function(n){return e.remove(n)}))}}])&&He(n.prototype,t),r&&He(n,r),e}();t(1249),t(561),t(4723);var Qe=t(8736),Je=t.n(Qe),en=t(3854),nn=new(t.n(en)());nn.sniff();const tn=nn;function rn(e){return rn="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},rn(e)}function on(e,n){for(var t=0;t<n.length;t++){var r=n[t];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}function an(e,n,t){return n in e?Object.defineProperty(e,n,{value:t,enumerable:!0,configurable:!0,writable:!0}):e[n]=t,e}var ln=function(){function e(){var n=this;!function(e,n){if(!(e instanceof n))throw new TypeError("Cannot call a class as a function")}(this,e),an(this,"ALLOW_SHORTCUTS_SELECTOR",".ring-js-shortcuts"),an(this,"ROOT_SCOPE",{scopeId:"ROOT",options:{}}),an(this,"_scopes",{}),an(this,"combokeys",new(Je())(document.documentElement)),an(this,"trigger",(function(e){return n.combokeys.trigger(e)})),an(this,"_dispatcher",(function(e,t){for(var r,o=n._scopeChain.length-1;o>=0;o--){var i=n._scopeChain[o];if((r=n._scopes[i.scopeId])&&r[t]){var a=r[t](e,t,i.scopeId);if(!0!==a)return a}if(i.options.modal)return!0}})),an(this,"_defaultFilter",(function(e,t,r){return t!==document&&!t.matches(n.ALLOW_SHORTCUTS_SELECTOR)&&!(null!=t.dataset.enabledShortcuts?t.dataset.enabledShortcuts.split(",").includes(r):null!=t.closest(n.ALLOW_SHORTCUTS_SELECTOR))&&(t.matches("input,select,textarea")||t.contentEditable&&"true"===t.contentEditable)})),this.setFilter(),this.setScope()}var n,t,r;return n=e,t=[{key:"bind",value:function(e){if(!(e instanceof Object)||"function"!=typeof e.handler)throw new Error("Shortcut handler should exist");if(e.scope||(e.scope=this.ROOT_SCOPE.scopeId),Array.isArray(e.key))for(var n=0;n<e.key.length;n++)this.bind(Object.assign({},e,{key:e.key[n]}));else{if("string"!=typeof e.key)throw new Error("Shortcut key should exist");this._scopes[e.scope]||(this._scopes[e.scope]={}),this._scopes[e.scope][e.key]=e.handler,this.combokeys.bind(e.key,this._dispatcher,this._getKeyboardEventType(e))}}},{key:"bindMap",value:function(e,n){if(!(e instanceof Object))throw new Error("Shortcuts map shouldn't be empty");for(var t in e)e.hasOwnProperty(t)&&this.bind(Object.assign({},n||{},{key:t,handler:e[t]}))}},{key:"unbindScope",value:function(e){this._scopes[e]=null}},{key:"getScope",value:function(){return this._scopeChain.slice(1)}},{key:"hasScope",value:function(e){return-1!==this.indexOfScope(e)}},{key:"pushScope",value:function(e){var n=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{};if(e){var t=this.indexOfScope(e);-1!==t&&this._scopeChain.splice(t,1),this._scopeChain.push(this.wrapScope(e,n))}}},{key:"popScope",value:function(e){if(e){var n=this.indexOfScope(e);if(-1!==n)return this._scopeChain.splice(n,this._scopeChain.length-1)}}},{key:"spliceScope",value:function(e){if(e){var n=this.indexOfScope(e);-1!==n&&this._scopeChain.splice(n,1)}}},{key:"setScope",value:function(e){var n=this;if(e){var t;if(t="string"==typeof e||!Array.isArray(e)&&"object"===rn(e)&&null!==e?[e]:e,!Array.isArray(t))return;t=t.map((function(e){return"string"==typeof e?n.wrapScope(e):e})),this._scopeChain=[this.ROOT_SCOPE].concat(t)}else this._scopeChain=[this.ROOT_SCOPE]}},{key:"wrapScope",value:function(e){var n=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{};return{scopeId:e,options:n}}},{key:"hasKey",value:function(e,n){return!(!this._scopes[n]||!this._scopes[n][e])}},{key:"_getKeyboardEventType",value:function(e){return!e.type&&"windows"===tn.os.name&&e.key.match(/ctrl/i)&&e.key.match(/shift/i)&&e.key.match(/[0-9]/)?"keyup":e.type}},{key:"setFilter",value:function(e){this.combokeys.stopCallback="function"==typeof e?e:this._defaultFilter}},{key:"indexOfScope",value:function(e){return this._scopeChain.findIndex((function(n){return n.scopeId===e}))}},{key:"reset",value:function(){this._scopes={},this.setScope(),this.combokeys.reset()}}],t&&on(n.prototype,t),r&&on(n,r),e}();const cn=new ln;function un(e){return un="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},un(e)}function sn(e,n){if(!(e instanceof n))throw new TypeError("Cannot call a class as a function")}function fn(e,n){for(var t=0;t<n.length;t++){var r=n[t];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}function pn(e,n){return pn=Object.setPrototypeOf||function(e,n){return e.__proto__=n,e},pn(e,n)}function dn(e){var n=function(){if("undefined"==typeof Reflect||!Reflect.construct)return!1;if(Reflect.construct.sham)return!1;if("function"==typeof Proxy)return!0;try{return Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){}))),!0}catch(e){return!1}}();return function(){var t,r=gn(e);if(n){var o=gn(this).constructor;t=Reflect.construct(r,arguments,o)}else t=r.apply(this,arguments);return hn(this,t)}}function hn(e,n){if(n&&("object"===un(n)||"function"==typeof n))return n;if(void 0!==n)throw new TypeError("Derived constructors may only return object or undefined");return function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e)}function gn(e){return gn=Object.setPrototypeOf?Object.getPrototypeOf:function(e){return e.__proto__||Object.getPrototypeOf(e)},gn(e)}function vn(e,n,t){return n in e?Object.defineProperty(e,n,{value:t,enumerable:!0,configurable:!0,writable:!0}):e[n]=t,e}var An=function(e){!function(e,n){if("function"!=typeof n&&null!==n)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(n&&n.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),n&&pn(e,n)}(i,e);var n,t,r,o=dn(i);function i(){return sn(this,i),o.apply(this,arguments)}return n=i,(t=[{key:"componentDidMount",value:function(){this.props.disabled||this.turnShorcutsOn()}},{key:"componentDidUpdate",value:function(e){var n=this.props.disabled;!e.disabled&&n&&this.turnShorcutsOff(),e.disabled&&!n&&this.turnShorcutsOn()}},{key:"componentWillUnmount",value:function(){this.props.disabled||this.turnShorcutsOff()}},{key:"turnShorcutsOn",value:function(){var e=this.props,n=e.map,t=e.scope,r=e.options;cn.bindMap(n,this.props),cn.pushScope(t,r)}},{key:"turnShorcutsOff",value:function(){var e=this.props.scope;cn.unbindScope(e),cn.spliceScope(e)}},{key:"render",value:function(){return this.props.children||null}}])&&fn(n.prototype,t),r&&fn(n,r),i}(e.PureComponent);function bn(e,n){return function(e){if(Array.isArray(e))return e}(e)||function(e,n){var t=null==e?null:"undefined"!=typeof Symbol&&e[Symbol.iterator]||e["@@iterator"];if(null==t)return;var r,o,i=[],a=!0,l=!1;try{for(t=t.call(e);!(a=(r=t.next()).done)&&(i.push(r.value),!n||i.length!==n);a=!0);}catch(e){l=!0,o=e}finally{try{a||null==t.return||t.return()}finally{if(l)throw o}}return i}(e,n)||function(e,n){if(!e)return;if("string"==typeof e)return mn(e,n);var t=Object.prototype.toString.call(e).slice(8,-1);"Object"===t&&e.constructor&&(t=e.constructor.name);if("Map"===t||"Set"===t)return Array.from(e);if("Arguments"===t||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(t))return mn(e,n)}(e,n)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function mn(e,n){(null==n||n>e.length)&&(n=e.length);for(var t=0,r=new Array(n);t<n;t++)r[t]=e[t];return r}vn(An,"propTypes",{map:o().object.isRequired,scope:o().string.isRequired,options:o().object,disabled:o().bool,children:o().node}),vn(An,"defaultProps",{options:{}});t(9254),t(5202);function yn(e){return yn="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},yn(e)}var En=["onConditionalClick","onPlainLeftClick","activeClassName","href","children"];function _n(){return _n=Object.assign||function(e){for(var n=1;n<arguments.length;n++){var t=arguments[n];for(var r in t)Object.prototype.hasOwnProperty.call(t,r)&&(e[r]=t[r])}return e},_n.apply(this,arguments)}function Cn(e,n){if(null==e)return{};var t,r,o=function(e,n){if(null==e)return{};var t,r,o={},i=Object.keys(e);for(r=0;r<i.length;r++)t=i[r],n.indexOf(t)>=0||(o[t]=e[t]);return o}(e,n);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)t=i[r],n.indexOf(t)>=0||Object.prototype.propertyIsEnumerable.call(e,t)&&(o[t]=e[t])}return o}function wn(e,n){if(!(e instanceof n))throw new TypeError("Cannot call a class as a function")}function xn(e,n){for(var t=0;t<n.length;t++){var r=n[t];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}function kn(e,n){return kn=Object.setPrototypeOf||function(e,n){return e.__proto__=n,e},kn(e,n)}function Sn(e){var n=function(){if("undefined"==typeof Reflect||!Reflect.construct)return!1;if(Reflect.construct.sham)return!1;if("function"==typeof Proxy)return!0;try{return Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){}))),!0}catch(e){return!1}}();return function(){var t,r=In(e);if(n){var o=In(this).constructor;t=Reflect.construct(r,arguments,o)}else t=r.apply(this,arguments);return On(this,t)}}function On(e,n){if(n&&("object"===yn(n)||"function"==typeof n))return n;if(void 0!==n)throw new TypeError("Derived constructors may only return object or undefined");return Bn(e)}function Bn(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}function In(e){return In=Object.setPrototypeOf?Object.getPrototypeOf:function(e){return e.__proto__||Object.getPrototypeOf(e)},In(e)}function Tn(e,n,t){return n in e?Object.defineProperty(e,n,{value:t,enumerable:!0,configurable:!0,writable:!0}):e[n]=t,e}var Pn=function(e){return!(0!==e.button||e.altKey||e.ctrlKey||e.metaKey||e.shiftKey)},jn=function(n){!function(e,n){if("function"!=typeof n&&null!==n)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(n&&n.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),n&&kn(e,n)}(a,n);var t,r,o,i=Sn(a);function a(){var e;wn(this,a);for(var n=arguments.length,t=new Array(n),r=0;r<n;r++)t[r]=arguments[r];return Tn(Bn(e=i.call.apply(i,[this].concat(t))),"onClick",(function(n){var t=e.props,r=t.onClick,o=t.onConditionalClick,i=t.onPlainLeftClick,a=Pn(n);r&&r(n),o&&o(a,n),i&&a&&(n.preventDefault(),i(n))})),e}return t=a,(r=[{key:"render",value:function(){var n=this.props,t=(n.onConditionalClick,n.onPlainLeftClick,n.activeClassName,n.href),r=n.children,o=Cn(n,En);return e.createElement("a",_n({href:t},o,{onClick:this.onClick}),r)}}])&&xn(t.prototype,r),o&&xn(t,o),a}(e.PureComponent);Tn(jn,"propTypes",{onClick:o().func,onPlainLeftClick:o().func,onConditionalClick:o().func,activeClassName:o().string,href:o().string.isRequired,children:o().node.isRequired});var zn=t(1050),Rn=t.n(zn);function Mn(e){return Mn="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},Mn(e)}var Dn=["active","inherit","pseudo","hover","className","data-test","href","innerClassName","children","onPlainLeftClick","onClick"];function Nn(){return Nn=Object.assign||function(e){for(var n=1;n<arguments.length;n++){var t=arguments[n];for(var r in t)Object.prototype.hasOwnProperty.call(t,r)&&(e[r]=t[r])}return e},Nn.apply(this,arguments)}function Ln(e,n){if(null==e)return{};var t,r,o=function(e,n){if(null==e)return{};var t,r,o={},i=Object.keys(e);for(r=0;r<i.length;r++)t=i[r],n.indexOf(t)>=0||(o[t]=e[t]);return o}(e,n);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)t=i[r],n.indexOf(t)>=0||Object.prototype.propertyIsEnumerable.call(e,t)&&(o[t]=e[t])}return o}function Fn(e,n){if(!(e instanceof n))throw new TypeError("Cannot call a class as a function")}function Un(e,n){for(var t=0;t<n.length;t++){var r=n[t];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}function Wn(e,n){return Wn=Object.setPrototypeOf||function(e,n){return e.__proto__=n,e},Wn(e,n)}function Hn(e){var n=function(){if("undefined"==typeof Reflect||!Reflect.construct)return!1;if(Reflect.construct.sham)return!1;if("function"==typeof Proxy)return!0;try{return Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){}))),!0}catch(e){return!1}}();return function(){var t,r=qn(e);if(n){var o=qn(this).constructor;t=Reflect.construct(r,arguments,o)}else t=r.apply(this,arguments);return Gn(this,t)}}function Gn(e,n){if(n&&("object"===Mn(n)||"function"==typeof n))return n;if(void 0!==n)throw new TypeError("Derived constructors may only return object or undefined");return function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e)}function qn(e){return qn=Object.setPrototypeOf?Object.getPrototypeOf:function(e){return e.__proto__||Object.getPrototypeOf(e)},qn(e)}function Vn(e,n,t){return n in e?Object.defineProperty(e,n,{value:t,enumerable:!0,configurable:!0,writable:!0}):e[n]=t,e}var $n=!1;var Kn=We((function(n){var t=(0,e.memo)((function(t){var r=t.className,o=t.children,i=a()(Rn().inner,r,n);return e.createElement("span",{className:i},o)}));return t.propTypes={className:o().string,children:o().node},t}));function Yn(n){var t,r,i="string"!=typeof n&&n!==jn;return r=t=function(t){!function(e,n){if("function"!=typeof n&&null!==n)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(n&&n.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),n&&Wn(e,n)}(u,t);var r,o,l,c=Hn(u);function u(){return Fn(this,u),c.apply(this,arguments)}return r=u,(o=[{key:"getChildren",value:function(){var n=this.props,t=n.children,r=n.innerClassName,o=Kn(r);return"function"==typeof t?t(o):e.createElement(o,null,t)}},{key:"render",value:function(){var t,r=this.props,o=r.active,l=r.inherit,c=r.pseudo,u=r.hover,s=r.className,f=r["data-test"],p=r.href,d=(r.innerClassName,r.children),h=r.onPlainLeftClick,g=r.onClick,v=Ln(r,Dn),A=c||!i&&null==p,b=a()(Rn().link,s,(Vn(t={},Rn().active,o),Vn(t,Rn().inherit,l),Vn(t,Rn().hover,u),Vn(t,Rn().compatibilityUnderlineMode,$n),Vn(t,Rn().pseudo,A),Vn(t,Rn().text,"function"!=typeof d),t));return i&&!v.activeClassName&&(v.activeClassName=Rn().active),A?e.createElement("button",Nn({type:"button"},v,{className:b,onClick:g||h,"data-test":Ne("ring-link",f)}),this.getChildren()):e.createElement(n,Nn({},v,{href:p,className:b,onClick:g,onPlainLeftClick:h,"data-test":Ne("ring-link",f)}),this.getChildren())}}])&&Un(r.prototype,o),l&&Un(r,l),u}(e.Component),Vn(t,"propTypes",{className:o().string,innerClassName:o().string,active:o().bool,inherit:o().bool,pseudo:o().bool,hover:o().bool,children:o().oneOfType([o().node,o().func]),"data-test":o().string,href:o().string,onPlainLeftClick:o().func,onClick:o().func}),r}const Xn=Yn(jn);var Zn=t(7869),Qn=t.n(Zn);function Jn(e){return Jn="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},Jn(e)}var et=["scrolling","data-test","className","label","hover","description","rgItemType","url","onCheckboxChange","disabled","LinkComponent","compact","hoverClassName"];function nt(e,n){var t=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);n&&(r=r.filter((function(n){return Object.getOwnPropertyDescriptor(e,n).enumerable}))),t.push.apply(t,r)}return t}function tt(e){for(var n=1;n<arguments.length;n++){var t=null!=arguments[n]?arguments[n]:{};n%2?nt(Object(t),!0).forEach((function(n){ft(e,n,t[n])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(t)):nt(Object(t)).forEach((function(n){Object.defineProperty(e,n,Object.getOwnPropertyDescriptor(t,n))}))}return e}function rt(){return rt=Object.assign||function(e){for(var n=1;n<arguments.length;n++){var t=arguments[n];for(var r in t)Object.prototype.hasOwnProperty.call(t,r)&&(e[r]=t[r])}return e},rt.apply(this,arguments)}function ot(e,n){if(null==e)return{};var t,r,o=function(e,n){if(null==e)return{};var t,r,o={},i=Object.keys(e);for(r=0;r<i.length;r++)t=i[r],n.indexOf(t)>=0||(o[t]=e[t]);return o}(e,n);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)t=i[r],n.indexOf(t)>=0||Object.prototype.propertyIsEnumerable.call(e,t)&&(o[t]=e[t])}return o}function it(e,n){if(!(e instanceof n))throw new TypeError("Cannot call a class as a function")}function at(e,n){for(var t=0;t<n.length;t++){var r=n[t];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}function lt(e,n){return lt=Object.setPrototypeOf||function(e,n){return e.__proto__=n,e},lt(e,n)}function ct(e){var n=function(){if("undefined"==typeof Reflect||!Reflect.construct)return!1;if(Reflect.construct.sham)return!1;if("function"==typeof Proxy)return!0;try{return Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){}))),!0}catch(e){return!1}}();return function(){var t,r=st(e);if(n){var o=st(this).constructor;t=Reflect.construct(r,arguments,o)}else t=r.apply(this,arguments);return ut(this,t)}}function ut(e,n){if(n&&("object"===Jn(n)||"function"==typeof n))return n;if(void 0!==n)throw new TypeError("Derived constructors may only return object or undefined");return function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e)}function st(e){return st=Object.setPrototypeOf?Object.getPrototypeOf:function(e){return e.__proto__||Object.getPrototypeOf(e)},st(e)}function ft(e,n,t){return n in e?Object.defineProperty(e,n,{value:t,enumerable:!0,configurable:!0,writable:!0}):e[n]=t,e}var pt=function(n){!function(e,n){if("function"!=typeof n&&null!==n)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(n&&n.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),n&&lt(e,n)}(l,n);var t,r,o,i=ct(l);function l(){return it(this,l),i.apply(this,arguments)}return t=l,(r=[{key:"render",value:function(){var n,t=this.props,r=t.scrolling,o=t["data-test"],i=t.className,l=t.label,c=t.hover,u=(t.description,t.rgItemType,t.url,t.onCheckboxChange,t.disabled),s=t.LinkComponent,f=t.compact,p=(t.hoverClassName,ot(t,et)),d=a()(Qn().item,i,(ft(n={},Qn().actionLink,!u),ft(n,Qn().compact,f),ft(n,Qn().scrolling,r),n)),h=s?Yn(s):Xn;return e.createElement(h,rt({pseudo:!this.props.href},p,{hover:c&&!u,className:d,"data-test":Ne("ring-list-link",o)}),l)}}])&&at(t.prototype,r),o&&at(t,o),l}(e.PureComponent);ft(pt,"propTypes",tt(tt({},Xn.propTypes),{},{description:o().string,label:o().oneOfType([o().element,o().string,o().func]),rgItemType:o().number,scrolling:o().bool,url:o().string,LinkComponent:o().oneOfType([o().instanceOf(e.Component),o().func,o().string]),onCheckboxChange:o().func,compact:o().bool}));t(5306);function dt(e){if(null==e)return{};var n,t=/([^&;=]+)=?([^&;]*)/g,r={};function o(e){return decodeURIComponent(e.replace(/\+/g," "))}for(;null!=(n=t.exec(e));)r[o(n[1])]=o(n[2]);return r}function ht(e){return encodeURIComponent(e).replace(/%2C/g,",")}function gt(e,n){var t,r=-1===e.indexOf("?")?"?":"&",o=e,i=0;for(t in n)n.hasOwnProperty(t)&&null!=n[t]&&(o+=(0==i++?r:"&")+ht(t)+"="+ht(n[t]));return o}function vt(e){return 0===e.indexOf("data:")}var At=t(8442),bt=t.n(At);t(9653),t(332);function mt(e){return function(e){if(Array.isArray(e))return _t(e)}(e)||function(e){if("undefined"!=typeof Symbol&&null!=e[Symbol.iterator]||null!=e["@@iterator"])return Array.from(e)}(e)||Et(e)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function yt(e,n){return function(e){if(Array.isArray(e))return e}(e)||function(e,n){var t=null==e?null:"undefined"!=typeof Symbol&&e[Symbol.iterator]||e["@@iterator"];if(null==t)return;var r,o,i=[],a=!0,l=!1;try{for(t=t.call(e);!(a=(r=t.next()).done)&&(i.push(r.value),!n||i.length!==n);a=!0);}catch(e){l=!0,o=e}finally{try{a||null==t.return||t.return()}finally{if(l)throw o}}return i}(e,n)||Et(e,n)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function Et(e,n){if(e){if("string"==typeof e)return _t(e,n);var t=Object.prototype.toString.call(e).slice(8,-1);return"Object"===t&&e.constructor&&(t=e.constructor.name),"Map"===t||"Set"===t?Array.from(e):"Arguments"===t||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(t)?_t(e,n):void 0}}function _t(e,n){(null==n||n>e.length)&&(n=e.length);for(var t=0,r=new Array(n);t<n;t++)r[t]=e[t];return r}var Ct=[["#60A800","#D5CA00"],["#21D370","#03E9E1"],["#3BA1FF","#36E97D"],["#00C243","#00FFFF"],["#4BE098","#627FFF"],["#168BFA","#26F7C7"],["#9D4CFF","#39D3C3"],["#0A81F6","#0ACFF6"],["#765AF8","#5A91F8"],["#9E54FF","#0ACFF6"],["#B345F1","#669DFF"],["#765AF8","#C059EE"],["#9039D0","#C239D0"],["#9F2AFF","#FD56FD"],["#AB3AF2","#E40568"],["#9F2AFF","#E9A80B"],["#D50F6B","#E73AE8"],["#ED5502","#E73AE8"],["#ED358C","#DBED18"],["#ED358C","#F9902E"],["#FF7500","#FFCA00"]],wt={18:{radius:2,text:{x:9,y:13},fontSize:"11px",textAnchor:"middle"},24:{radius:3,text:{x:2,y:13},fontSize:"11px",underscore:{x:3,y:17}},32:{radius:3,text:{x:3,y:17},fontSize:"13px",letterSpacing:1,underscore:{x:4,y:22}},40:{radius:3,text:{x:5,y:19},fontSize:"15px",letterSpacing:1,underscore:{x:6,y:28}}},xt=Object.keys(wt).map(Number);function kt(n){var t,r=n.username,o=n.size,i=n.round,a=Math.abs(function(e){for(var n=0,t=0;t<e.length;t++)n=Math.imul(31,n)+e.charCodeAt(t)|0;return n}(r.toLowerCase())),l=yt(Ct[a%Ct.length],2),c=l[0],u=l[1],s=xt.filter((function(e){return e>=o})),f=s.length>0?Math.min.apply(Math,mt(s)):Math.max.apply(Math,mt(xt)),p=wt[f],d=i?"50%":p.radius,h=(0,e.useMemo)((function(){return Fe("gradient-")}),[]);return e.createElement("svg",{viewBox:"0 0 ".concat(f," ").concat(f),xmlns:"http://www.w3.org/2000/svg"},e.createElement("defs",null,e.createElement("linearGradient",{id:h,x1:"0",y1:"0",x2:"0",y2:"1"},e.createElement("stop",{stopColor:c,offset:"0"}),e.createElement("stop",{stopColor:u,offset:"1"}))),e.createElement("g",null,e.createElement("rect",{fill:"url(#".concat(h,")"),x:"0",y:"0",width:f,height:f,rx:d,ry:d}),e.createElement("text",{x:p.text.x,y:p.text.y,fontFamily:"Arial, Helvetica, sans-serif",fontSize:p.fontSize,letterSpacing:p.letterSpacing,fill:"#FFFFFF",textAnchor:p.textAnchor},e.createElement("tspan",null,(t=r.split(/[\s._]+/).filter(Boolean)).length>=2?t[0][0].toUpperCase()+t[1][0].toUpperCase():1===t.length?t[0].length>=2?t[0].slice(0,2).toUpperCase():"".concat(t[0][0].toUpperCase(),"X"):"XX"),p.underscore&&e.createElement("tspan",{x:p.underscore.x,y:p.underscore.y},"_"))))}function St(e){return St="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},St(e)}kt.propTypes={username:o().string.isRequired,size:o().number.isRequired,round:o().bool};var Ot=["size","url","dpr","style","round","subavatar","subavatarSize","username","skipParams"];function Bt(e,n){return function(e){if(Array.isArray(e))return e}(e)||function(e,n){var t=null==e?null:"undefined"!=typeof Symbol&&e[Symbol.iterator]||e["@@iterator"];if(null==t)return;var r,o,i=[],a=!0,l=!1;try{for(t=t.call(e);!(a=(r=t.next()).done)&&(i.push(r.value),!n||i.length!==n);a=!0);}catch(e){l=!0,o=e}finally{try{a||null==t.return||t.return()}finally{if(l)throw o}}return i}(e,n)||function(e,n){if(!e)return;if("string"==typeof e)return It(e,n);var t=Object.prototype.toString.call(e).slice(8,-1);"Object"===t&&e.constructor&&(t=e.constructor.name);if("Map"===t||"Set"===t)return Array.from(e);if("Arguments"===t||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(t))return It(e,n)}(e,n)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function It(e,n){(null==n||n>e.length)&&(n=e.length);for(var t=0,r=new Array(n);t<n;t++)r[t]=e[t];return r}function Tt(){return Tt=Object.assign||function(e){for(var n=1;n<arguments.length;n++){var t=arguments[n];for(var r in t)Object.prototype.hasOwnProperty.call(t,r)&&(e[r]=t[r])}return e},Tt.apply(this,arguments)}function Pt(e,n){var t=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);n&&(r=r.filter((function(n){return Object.getOwnPropertyDescriptor(e,n).enumerable}))),t.push.apply(t,r)}return t}function jt(e){for(var n=1;n<arguments.length;n++){var t=null!=arguments[n]?arguments[n]:{};n%2?Pt(Object(t),!0).forEach((function(n){Wt(e,n,t[n])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(t)):Pt(Object(t)).forEach((function(n){Object.defineProperty(e,n,Object.getOwnPropertyDescriptor(t,n))}))}return e}function zt(e,n){if(null==e)return{};var t,r,o=function(e,n){if(null==e)return{};var t,r,o={},i=Object.keys(e);for(r=0;r<i.length;r++)t=i[r],n.indexOf(t)>=0||(o[t]=e[t]);return o}(e,n);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)t=i[r],n.indexOf(t)>=0||Object.prototype.propertyIsEnumerable.call(e,t)&&(o[t]=e[t])}return o}function Rt(e,n){if(!(e instanceof n))throw new TypeError("Cannot call a class as a function")}function Mt(e,n){for(var t=0;t<n.length;t++){var r=n[t];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}function Dt(e,n){return Dt=Object.setPrototypeOf||function(e,n){return e.__proto__=n,e},Dt(e,n)}function Nt(e){var n=function(){if("undefined"==typeof Reflect||!Reflect.construct)return!1;if(Reflect.construct.sham)return!1;if("function"==typeof Proxy)return!0;try{return Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){}))),!0}catch(e){return!1}}();return function(){var t,r=Ut(e);if(n){var o=Ut(this).constructor;t=Reflect.construct(r,arguments,o)}else t=r.apply(this,arguments);return Lt(this,t)}}function Lt(e,n){if(n&&("object"===St(n)||"function"==typeof n))return n;if(void 0!==n)throw new TypeError("Derived constructors may only return object or undefined");return Ft(e)}function Ft(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}function Ut(e){return Ut=Object.setPrototypeOf?Object.getPrototypeOf:function(e){return e.__proto__||Object.getPrototypeOf(e)},Ut(e)}function Wt(e,n,t){return n in e?Object.defineProperty(e,n,{value:t,enumerable:!0,configurable:!0,writable:!0}):e[n]=t,e}var Ht=18,Gt=20,qt=function(n){!function(e,n){if("function"!=typeof n&&null!==n)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(n&&n.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),n&&Dt(e,n)}(l,n);var t,r,o,i=Nt(l);function l(){var e;Rt(this,l);for(var n=arguments.length,t=new Array(n),r=0;r<n;r++)t[r]=arguments[r];return Wt(Ft(e=i.call.apply(i,[this].concat(t))),"state",{errorUrl:""}),Wt(Ft(e),"handleError",(function(){e.setState({errorUrl:e.props.url})})),Wt(Ft(e),"handleSuccess",(function(){e.setState({errorUrl:""})})),e}return t=l,r=[{key:"render",value:function(){var n=this.props,t=n.size,r=n.url,o=n.dpr,i=n.style,l=n.round,c=n.subavatar,u=n.subavatarSize,s=n.username,f=n.skipParams,p=zt(n,Ot),d="".concat(t,"px"),h="".concat(u,"px"),g=jt({borderRadius:l?"50%":t<=Ht?"var(--ring-border-radius-small)":"var(--ring-border-radius)",height:d,width:d},i),v=jt({borderRadius:"2px",height:h,width:h},i);if(!r||this.state.errorUrl===r)return e.createElement("span",Tt({},p,{"data-test":"avatar",className:a()(bt().avatar,this.props.className,Wt({},bt().empty,null==s)),style:g}),null!=s&&e.createElement(kt,{size:t,round:l,username:s}));var A=r;if(!f&&!vt(r)){var b=Bt(r.split("?"),2);A=gt(b[0],jt(jt({},dt(b[1])),{},{dpr:o,size:t}))}var m=null;if(c&&!vt(c)){var y=Bt(c.split("?"),2),E=y[0],_=jt(jt({},dt(y[1])),{},{dpr:o,subavatarSizeString:h});return m=f?c:gt(E,_),e.createElement("div",null,e.createElement("img",Tt({},p,{onError:this.handleError,onLoad:this.handleSuccess,className:a()(bt().avatar,this.props.className),style:g,src:A,alt:"User avatar"})),e.createElement("img",Tt({},p,{"data-test":"avatar",onError:this.handleError,onLoad:this.handleSuccess,className:a()(bt().subavatar),style:v,src:m,alt:"Subavatar"})))}return e.createElement("img",Tt({},p,{"data-test":"avatar",onError:this.handleError,onLoad:this.handleSuccess,className:a()(bt().avatar,this.props.className),style:g,src:A,alt:"User avatar"}))}}],r&&Mt(t.prototype,r),o&&Mt(t,o),l}(e.PureComponent);Wt(qt,"propTypes",{dpr:o().number,className:o().string,size:o().number,style:o().object,url:o().string,round:o().bool,subavatar:o().string,subavatarSize:o().number,username:o().string,skipParams:o().bool}),Wt(qt,"defaultProps",{dpr:"devicePixelRatio"in window?window.devicePixelRatio:1,size:Gt,subavatarSize:Gt/2,style:{}});var Vt=t(8527),$t=t.n(Vt),Kt=t(7224),Yt=t.n(Kt),Xt={BLUE:"blue",DEFAULT:"",GRAY:"gray",GREEN:"green",MAGENTA:"magenta",RED:"red",WHITE:"white"},Zt={Size12:12,Size14:14,Size16:16,Size18:18,Size20:20,Size24:24,Size32:32,Size40:40,Size48:48,Size64:64,Size96:96,Size128:128},Qt=t(2224),Jt=t.n(Qt),er=(t(6755),["src","className"]);function nr(){return nr=Object.assign||function(e){for(var n=1;n<arguments.length;n++){var t=arguments[n];for(var r in t)Object.prototype.hasOwnProperty.call(t,r)&&(e[r]=t[r])}return e},nr.apply(this,arguments)}function tr(e,n){if(null==e)return{};var t,r,o=function(e,n){if(null==e)return{};var t,r,o={},i=Object.keys(e);for(r=0;r<i.length;r++)t=i[r],n.indexOf(t)>=0||(o[t]=e[t]);return o}(e,n);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)t=i[r],n.indexOf(t)>=0||Object.prototype.propertyIsEnumerable.call(e,t)&&(o[t]=e[t])}return o}var rr=We((function(e){var n=document.createElement("div");n.innerHTML=e;var t,r,o=n.firstElementChild;return o.remove?o.remove():n.removeChild(o),{props:(t=o,r=t.attributes,r.length>0?function(e){for(var n={},t=0;t<e.length;t++){var r=e[t].name,o=r;"class"===r?o="className":r.startsWith("data-")||(o=r.replace(/[-|:]([a-z])/g,(function(e){return e[1].toUpperCase()}))),n[o]=e[t].value}return n}(r):null),html:o.innerHTML}}));function or(n){var t,r,o,i,l,c,u=n.src,s=n.className,f=tr(n,er),p=a()(Jt().glyph,(t={},r=Jt().compatibilityMode,l=/width="[\d\.]+"/gi.test(i=u),c=/height="[\d\.]+"/gi.test(i),o=!l||!c,r in t?Object.defineProperty(t,r,{value:o,enumerable:!0,configurable:!0,writable:!0}):t[r]=o,t),s),d=rr(u),h=d.props,g=d.html;return e.createElement("svg",nr({},h,f,{className:p,dangerouslySetInnerHTML:{__html:g}}))}or.propTypes={className:o().string,src:o().string.isRequired,style:o().object};const ir=(0,e.memo)(or);function ar(e){return ar="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},ar(e)}var lr=["className","size","color","loading","glyph","width","height","suppressSizeWarning"];function cr(){return cr=Object.assign||function(e){for(var n=1;n<arguments.length;n++){var t=arguments[n];for(var r in t)Object.prototype.hasOwnProperty.call(t,r)&&(e[r]=t[r])}return e},cr.apply(this,arguments)}function ur(e,n){if(null==e)return{};var t,r,o=function(e,n){if(null==e)return{};var t,r,o={},i=Object.keys(e);for(r=0;r<i.length;r++)t=i[r],n.indexOf(t)>=0||(o[t]=e[t]);return o}(e,n);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)t=i[r],n.indexOf(t)>=0||Object.prototype.propertyIsEnumerable.call(e,t)&&(o[t]=e[t])}return o}function sr(e,n){if(!(e instanceof n))throw new TypeError("Cannot call a class as a function")}function fr(e,n){for(var t=0;t<n.length;t++){var r=n[t];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}function pr(e,n){return pr=Object.setPrototypeOf||function(e,n){return e.__proto__=n,e},pr(e,n)}function dr(e){var n=function(){if("undefined"==typeof Reflect||!Reflect.construct)return!1;if(Reflect.construct.sham)return!1;if("function"==typeof Proxy)return!0;try{return Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){}))),!0}catch(e){return!1}}();return function(){var t,r=gr(e);if(n){var o=gr(this).constructor;t=Reflect.construct(r,arguments,o)}else t=r.apply(this,arguments);return hr(this,t)}}function hr(e,n){if(n&&("object"===ar(n)||"function"==typeof n))return n;if(void 0!==n)throw new TypeError("Derived constructors may only return object or undefined");return function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e)}function gr(e){return gr=Object.setPrototypeOf?Object.getPrototypeOf:function(e){return e.__proto__||Object.getPrototypeOf(e)},gr(e)}function vr(e,n,t){return n in e?Object.defineProperty(e,n,{value:t,enumerable:!0,configurable:!0,writable:!0}):e[n]=t,e}var Ar=Oe()((function(){}),"`size`, `width` and `height` props are not recommended to use in Ring UI `Icon` component. The intrinsic sizes of SVG icon (`width` and `height` SVG attributes) are used instead.\n\nWe strongly recommend to use icons handcrafted for particular sizes. If your icon doesn't exist in the desired size, please ask your designer to draw one. \"Responsive\" checkmark should be unchecked when exporting icon.'"),br=function(n){!function(e,n){if("function"!=typeof n&&null!==n)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(n&&n.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),n&&pr(e,n)}(l,n);var t,r,o,i=dr(l);function l(){return sr(this,l),i.apply(this,arguments)}return t=l,r=[{key:"warnSize",value:function(){this.props.suppressSizeWarning||Ar()}},{key:"getStyle",value:function(){var e=this.props,n=e.size,t=e.width,r=e.height;return t||r?(this.warnSize(),{width:t,height:r}):n?(this.warnSize(),{width:n,height:n}):null}},{key:"render",value:function(){var n,t=this.props,r=t.className,o=(t.size,t.color),i=t.loading,l=t.glyph,c=(t.width,t.height,t.suppressSizeWarning,ur(t,lr));if(!l)return null;var u=a()(Jt().icon,(vr(n={},Jt()[o],!!o),vr(n,Jt().loading,i),n),r);return e.createElement("span",cr({},c,{className:u}),"string"==typeof l?e.createElement(ir,{src:l,style:this.getStyle()}):e.createElement(l,{className:Jt().glyph,style:this.getStyle()}))}}],r&&fr(t.prototype,r),o&&fr(t,o),l}(e.PureComponent);vr(br,"propTypes",{className:o().string,color:o().string,glyph:o().oneOfType([o().string,o().elementType]).isRequired,height:o().number,size:o().number,width:o().number,loading:o().bool,suppressSizeWarning:o().bool}),vr(br,"defaultProps",{className:"",color:Xt.DEFAULT,glyph:""}),vr(br,"Color",Xt),vr(br,"Size",Zt);var mr=t(4369),yr=t.n(mr);function Er(e){return Er="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},Er(e)}var _r=["children","label","className","containerClassName","containerStyle","cellClassName","labelClassName","indeterminate"];function Cr(){return Cr=Object.assign||function(e){for(var n=1;n<arguments.length;n++){var t=arguments[n];for(var r in t)Object.prototype.hasOwnProperty.call(t,r)&&(e[r]=t[r])}return e},Cr.apply(this,arguments)}function wr(e,n){if(null==e)return{};var t,r,o=function(e,n){if(null==e)return{};var t,r,o={},i=Object.keys(e);for(r=0;r<i.length;r++)t=i[r],n.indexOf(t)>=0||(o[t]=e[t]);return o}(e,n);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)t=i[r],n.indexOf(t)>=0||Object.prototype.propertyIsEnumerable.call(e,t)&&(o[t]=e[t])}return o}function xr(e,n){if(!(e instanceof n))throw new TypeError("Cannot call a class as a function")}function kr(e,n){for(var t=0;t<n.length;t++){var r=n[t];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}function Sr(e,n){return Sr=Object.setPrototypeOf||function(e,n){return e.__proto__=n,e},Sr(e,n)}function Or(e){var n=function(){if("undefined"==typeof Reflect||!Reflect.construct)return!1;if(Reflect.construct.sham)return!1;if("function"==typeof Proxy)return!0;try{return Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){}))),!0}catch(e){return!1}}();return function(){var t,r=Tr(e);if(n){var o=Tr(this).constructor;t=Reflect.construct(r,arguments,o)}else t=r.apply(this,arguments);return Br(this,t)}}function Br(e,n){if(n&&("object"===Er(n)||"function"==typeof n))return n;if(void 0!==n)throw new TypeError("Derived constructors may only return object or undefined");return Ir(e)}function Ir(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}function Tr(e){return Tr=Object.setPrototypeOf?Object.getPrototypeOf:function(e){return e.__proto__||Object.getPrototypeOf(e)},Tr(e)}function Pr(e,n,t){return n in e?Object.defineProperty(e,n,{value:t,enumerable:!0,configurable:!0,writable:!0}):e[n]=t,e}var jr=function(n){!function(e,n){if("function"!=typeof n&&null!==n)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(n&&n.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),n&&Sr(e,n)}(l,n);var t,r,o,i=Or(l);function l(){var e;xr(this,l);for(var n=arguments.length,t=new Array(n),r=0;r<n;r++)t[r]=arguments[r];return Pr(Ir(e=i.call.apply(i,[this].concat(t))),"inputRef",(function(n){null!=n&&(n.indeterminate=e.props.indeterminate),e.input=n})),e}return t=l,(r=[{key:"componentDidMount",value:function(){null!=this.input&&(this.input.indeterminate=this.props.indeterminate)}},{key:"componentDidUpdate",value:function(e){var n=this.props.indeterminate;null!=this.input&&n!==e.indeterminate&&(this.input.indeterminate=this.props.indeterminate)}},{key:"render",value:function(){var n=this.props,t=n.children,r=n.label,o=n.className,i=n.containerClassName,l=n.containerStyle,c=n.cellClassName,u=n.labelClassName,s=(n.indeterminate,wr(n,_r)),f=a()(yr().input,o),p=a()(yr().checkbox,i),d=a()(yr().cell,c),h=a()(yr().label,u);return e.createElement("label",{className:p,style:l,"data-test":"ring-checkbox"},e.createElement("input",Cr({},s,{"data-checked":s.checked,ref:this.inputRef,type:"checkbox",className:f})),e.createElement("span",{className:d},e.createElement(br,{glyph:$t(),className:yr().check}),e.createElement(br,{glyph:Yt(),className:yr().minus})),e.createElement("span",{className:h},r||t))}}])&&kr(t.prototype,r),o&&kr(t,o),l}(e.PureComponent);Pr(jr,"propTypes",{name:o().string,label:o().string,className:o().string,containerClassName:o().string,containerStyle:o().object,cellClassName:o().string,labelClassName:o().string,defaultChecked:o().bool,checked:o().bool,indeterminate:o().bool,disabled:o().bool,onChange:o().func,children:o().node});var zr=t(3138),Rr=t.n(zr);function Mr(e){return Mr="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},Mr(e)}var Dr=["scrolling","className","disabled","checkbox","avatar","subavatar","glyph","icon","rightGlyph","description","label","title","details","hover","rgItemType","level","tabIndex","compact","onClick","onCheckboxChange","onMouseOver","onMouseDown","onMouseUp","rightNodes","leftNodes","showGeneratedAvatar","username"];function Nr(e,n){if(null==e)return{};var t,r,o=function(e,n){if(null==e)return{};var t,r,o={},i=Object.keys(e);for(r=0;r<i.length;r++)t=i[r],n.indexOf(t)>=0||(o[t]=e[t]);return o}(e,n);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)t=i[r],n.indexOf(t)>=0||Object.prototype.propertyIsEnumerable.call(e,t)&&(o[t]=e[t])}return o}function Lr(e,n){if(!(e instanceof n))throw new TypeError("Cannot call a class as a function")}function Fr(e,n){for(var t=0;t<n.length;t++){var r=n[t];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}function Ur(e,n){return Ur=Object.setPrototypeOf||function(e,n){return e.__proto__=n,e},Ur(e,n)}function Wr(e){var n=function(){if("undefined"==typeof Reflect||!Reflect.construct)return!1;if(Reflect.construct.sham)return!1;if("function"==typeof Proxy)return!0;try{return Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){}))),!0}catch(e){return!1}}();return function(){var t,r=qr(e);if(n){var o=qr(this).constructor;t=Reflect.construct(r,arguments,o)}else t=r.apply(this,arguments);return Hr(this,t)}}function Hr(e,n){if(n&&("object"===Mr(n)||"function"==typeof n))return n;if(void 0!==n)throw new TypeError("Derived constructors may only return object or undefined");return Gr(e)}function Gr(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}function qr(e){return qr=Object.setPrototypeOf?Object.getPrototypeOf:function(e){return e.__proto__||Object.getPrototypeOf(e)},qr(e)}function Vr(e,n,t){return n in e?Object.defineProperty(e,n,{value:t,enumerable:!0,configurable:!0,writable:!0}):e[n]=t,e}var $r=function(n){!function(e,n){if("function"!=typeof n&&null!==n)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(n&&n.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),n&&Ur(e,n)}(l,n);var t,r,o,i=Wr(l);function l(){var e;Lr(this,l);for(var n=arguments.length,t=new Array(n),r=0;r<n;r++)t[r]=arguments[r];return Vr(Gr(e=i.call.apply(i,[this].concat(t))),"id",Fe("list-item-")),Vr(Gr(e),"stopBubbling",(function(e){return e.stopPropagation()})),Vr(Gr(e),"_isString",(function(e){return"string"==typeof e||e instanceof String})),e}return t=l,r=[{key:"render",value:function(){var n,t,r=this.props,o=r.scrolling,i=r.className,l=r.disabled,c=r.checkbox,u=r.avatar,s=r.subavatar,f=r.glyph,p=r.icon,d=r.rightGlyph,h=r.description,g=r.label,v=r.title,A=r.details,b=r.hover,m=(r.rgItemType,r.level),y=r.tabIndex,E=r.compact,_=r.onClick,C=r.onCheckboxChange,w=r.onMouseOver,x=r.onMouseDown,k=r.onMouseUp,S=r.rightNodes,O=r.leftNodes,B=r.showGeneratedAvatar,I=r.username,T=Nr(r,Dr),P=B&&null!=I,j=void 0!==c&&(c||!(O||f||u||P)||b&&!l),z=a()(Qn().item,Rr().resetButton,i,(Vr(n={},Qn().action,!l),Vr(n,Qn().hover,b&&!l),Vr(n,Qn().compact,E),Vr(n,Qn().scrolling,o),Vr(n,Qn().disabled,l),n)),R=a()((Vr(t={},Qn().details,A),Vr(t,Qn().padded,void 0!==p||void 0!==c||void 0!==f),t)),M={paddingLeft:"".concat(8*(+m||0)+16+(j?28:0),"px")},D=null;D=this._isString(v)?v:this._isString(g)?g:"";var N=Ne({"ring-list-item":-1===(T["data-test"]||"").indexOf("ring-list-item"),"ring-list-item-action":!l,"ring-list-item-selected":c},T["data-test"]);return e.createElement("div",{className:Qn().itemContainer,"data-test":N},j&&e.createElement("div",{className:Qn().checkboxContainer},e.createElement(jr,{"aria-labelledby":this.id,checked:c,disabled:l,onChange:C,onClick:this.stopBubbling})),e.createElement("button",{id:this.id,type:"button",tabIndex:y,onClick:_,onMouseOver:w,onMouseDown:x,onFocus:w,onMouseUp:k,className:z,style:M},e.createElement("div",{className:Qn().top,onMouseOut:this.stopBubbling,onBlur:this.stopBubbling},!j&&e.createElement("div",{className:Qn().left},O,f&&e.createElement(br,{className:Qn().glyph,glyph:f,size:this.props.iconSize}),(u||P)&&e.createElement(qt,{className:Qn().avatar,url:u,size:Gt,subavatar:s,username:I})),e.createElement("span",{className:Qn().label,title:D,"data-test":"ring-list-item-label"},g),h&&e.createElement("span",{className:Qn().description,"data-test":"ring-list-item-description"},h),e.createElement("div",{className:Qn().right},d&&e.createElement(br,{className:Qn().rightGlyph,glyph:d,size:this.props.iconSize}),p&&e.createElement("div",{className:Qn().icon,style:{backgroundImage:'url("'.concat(p,'")')}}),S)),A&&e.createElement("div",{className:R},A)))}}],r&&Fr(t.prototype,r),o&&Fr(t,o),l}(e.PureComponent);Vr($r,"propTypes",{scrolling:o().bool,hover:o().bool,details:o().string,disabled:o().bool,className:o().string,tabIndex:o().number,checkbox:o().bool,description:o().oneOfType([o().string,o().element,o().array]),showGeneratedAvatar:o().bool,username:o().string,avatar:o().string,subavatar:o().string,glyph:o().oneOfType([o().string,o().elementType]),icon:o().string,iconSize:o().number,rightNodes:o().oneOfType([o().string,o().element,o().array]),leftNodes:o().oneOfType([o().string,o().element,o().array]),label:o().oneOfType([o().string,o().element]),title:o().string,level:o().number,rgItemType:o().number,rightGlyph:o().oneOfType([o().string,o().elementType]),compact:o().bool,onClick:o().func,onCheckboxChange:o().func,onMouseOver:o().func,onMouseDown:o().func,onMouseUp:o().func,"data-test":o().string});var Kr={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},Yr={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"};function Xr(e){if(e.key){var n=Kr[e.key]||e.key;if("Unidentified"!==n)return n}if("keypress"===e.type){var t=function(e){var n,t=e.keyCode;return"charCode"in e?0===(n=e.charCode)&&13===t&&(n=13):n=t,n>=32||13===n?n:0}(e);return 32===t?"Enter":String.fromCharCode(t)}return"keydown"===e.type||"keyup"===e.type?Yr[e.keyCode]||"Unidentified":""}function Zr(e){return Zr="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},Zr(e)}var Qr=["scrolling","hover","className","disabled","template","rgItemType","tabIndex","onClick","onCheckboxChange","onMouseOver","onMouseUp","role","tagName"];function Jr(e,n){if(null==e)return{};var t,r,o=function(e,n){if(null==e)return{};var t,r,o={},i=Object.keys(e);for(r=0;r<i.length;r++)t=i[r],n.indexOf(t)>=0||(o[t]=e[t]);return o}(e,n);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)t=i[r],n.indexOf(t)>=0||Object.prototype.propertyIsEnumerable.call(e,t)&&(o[t]=e[t])}return o}function eo(e,n){if(!(e instanceof n))throw new TypeError("Cannot call a class as a function")}function no(e,n){for(var t=0;t<n.length;t++){var r=n[t];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}function to(e,n){return to=Object.setPrototypeOf||function(e,n){return e.__proto__=n,e},to(e,n)}function ro(e){var n=function(){if("undefined"==typeof Reflect||!Reflect.construct)return!1;if(Reflect.construct.sham)return!1;if("function"==typeof Proxy)return!0;try{return Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){}))),!0}catch(e){return!1}}();return function(){var t,r=ao(e);if(n){var o=ao(this).constructor;t=Reflect.construct(r,arguments,o)}else t=r.apply(this,arguments);return oo(this,t)}}function oo(e,n){if(n&&("object"===Zr(n)||"function"==typeof n))return n;if(void 0!==n)throw new TypeError("Derived constructors may only return object or undefined");return io(e)}function io(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}function ao(e){return ao=Object.setPrototypeOf?Object.getPrototypeOf:function(e){return e.__proto__||Object.getPrototypeOf(e)},ao(e)}function lo(e,n,t){return n in e?Object.defineProperty(e,n,{value:t,enumerable:!0,configurable:!0,writable:!0}):e[n]=t,e}var co=function(n){!function(e,n){if("function"!=typeof n&&null!==n)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(n&&n.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),n&&to(e,n)}(l,n);var t,r,o,i=ro(l);function l(){var e;eo(this,l);for(var n=arguments.length,t=new Array(n),r=0;r<n;r++)t[r]=arguments[r];return lo(io(e=i.call.apply(i,[this].concat(t))),"handleKeyPress",(function(n){var t=Xr(n);"Enter"!==t&&" "!==t||e.props.onClick(n)})),e}return t=l,(r=[{key:"render",value:function(){var n,t=this.props,r=t.scrolling,o=t.hover,i=t.className,l=t.disabled,c=t.template,u=(t.rgItemType,t.tabIndex),s=t.onClick,f=(t.onCheckboxChange,t.onMouseOver),p=t.onMouseUp,d=t.role,h=t.tagName,g=Jr(t,Qr),v=a()(Qn().item,i,(lo(n={},Qn().action,!l),lo(n,Qn().hover,o&&!l),lo(n,Qn().scrolling,r),n)),A=Ne("ring-list-item-custom",{"ring-list-item-action":!l},g["data-test"]),b="function"==typeof c?c(this.props):c,m=h||"span";return e.createElement(m,{role:d||"button",tabIndex:u,onClick:s,onKeyPress:this.handleKeyPress,onMouseOver:f,onFocus:f,onMouseUp:p,className:v,"data-test":A},b)}}])&&no(t.prototype,r),o&&no(t,o),l}(e.PureComponent);function uo(e){return uo="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},uo(e)}function so(e,n){if(!(e instanceof n))throw new TypeError("Cannot call a class as a function")}function fo(e,n){for(var t=0;t<n.length;t++){var r=n[t];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}function po(e,n){return po=Object.setPrototypeOf||function(e,n){return e.__proto__=n,e},po(e,n)}function ho(e){var n=function(){if("undefined"==typeof Reflect||!Reflect.construct)return!1;if(Reflect.construct.sham)return!1;if("function"==typeof Proxy)return!0;try{return Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){}))),!0}catch(e){return!1}}();return function(){var t,r=vo(e);if(n){var o=vo(this).constructor;t=Reflect.construct(r,arguments,o)}else t=r.apply(this,arguments);return go(this,t)}}function go(e,n){if(n&&("object"===uo(n)||"function"==typeof n))return n;if(void 0!==n)throw new TypeError("Derived constructors may only return object or undefined");return function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e)}function vo(e){return vo=Object.setPrototypeOf?Object.getPrototypeOf:function(e){return e.__proto__||Object.getPrototypeOf(e)},vo(e)}function Ao(e,n,t){return n in e?Object.defineProperty(e,n,{value:t,enumerable:!0,configurable:!0,writable:!0}):e[n]=t,e}lo(co,"propTypes",{scrolling:o().bool,hover:o().bool,className:o().string,disabled:o().bool,rgItemType:o().number,tabIndex:o().number,template:o().oneOfType([o().func,o().element,o().string]),onClick:o().func,onMouseOver:o().func,onMouseUp:o().func,onCheckboxChange:o().func,role:o().string,tagName:o().string,"data-test":o().string}),lo(co,"defaultProps",{hover:!1});var bo=function(n){!function(e,n){if("function"!=typeof n&&null!==n)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(n&&n.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),n&&po(e,n)}(l,n);var t,r,o,i=ho(l);function l(){return so(this,l),i.apply(this,arguments)}return t=l,(r=[{key:"render",value:function(){var n=this.props,t=n.className,r=n.description,o=n.label,i=n.isFirst,l=a()(Qn().title,t,Ao({},Qn().title_first,i));return e.createElement("span",{className:l,"data-test":"ring-list-title"},e.createElement("span",{className:a()(Qn().label,Qn().text),"data-test":"ring-list-title-label"},o),e.createElement("div",{className:Qn().description,"data-test":"ring-list-title-description"},r))}}])&&fo(t.prototype,r),o&&fo(t,o),l}(e.PureComponent);function mo(e){return mo="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},mo(e)}function yo(e,n){if(!(e instanceof n))throw new TypeError("Cannot call a class as a function")}function Eo(e,n){for(var t=0;t<n.length;t++){var r=n[t];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}function _o(e,n){return _o=Object.setPrototypeOf||function(e,n){return e.__proto__=n,e},_o(e,n)}function Co(e){var n=function(){if("undefined"==typeof Reflect||!Reflect.construct)return!1;if(Reflect.construct.sham)return!1;if("function"==typeof Proxy)return!0;try{return Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){}))),!0}catch(e){return!1}}();return function(){var t,r=xo(e);if(n){var o=xo(this).constructor;t=Reflect.construct(r,arguments,o)}else t=r.apply(this,arguments);return wo(this,t)}}function wo(e,n){if(n&&("object"===mo(n)||"function"==typeof n))return n;if(void 0!==n)throw new TypeError("Derived constructors may only return object or undefined");return function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e)}function xo(e){return xo=Object.setPrototypeOf?Object.getPrototypeOf:function(e){return e.__proto__||Object.getPrototypeOf(e)},xo(e)}function ko(e,n,t){return n in e?Object.defineProperty(e,n,{value:t,enumerable:!0,configurable:!0,writable:!0}):e[n]=t,e}Ao(bo,"propTypes",{className:o().string,description:o().oneOfType([o().element,o().string]),label:o().oneOfType([o().element,o().string]),isFirst:o().bool});var So=function(n){!function(e,n){if("function"!=typeof n&&null!==n)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(n&&n.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),n&&_o(e,n)}(l,n);var t,r,o,i=Co(l);function l(){return yo(this,l),i.apply(this,arguments)}return t=l,(r=[{key:"render",value:function(){var n=this.props,t=n.description,r=n.isFirst,o=n.className,i=a()(Qn().separator,o,ko({},Qn().separator_first,r));return e.createElement("span",{className:i},t)}}])&&Eo(t.prototype,r),o&&Eo(t,o),l}(e.PureComponent);function Oo(e){return Oo="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},Oo(e)}function Bo(e,n){if(!(e instanceof n))throw new TypeError("Cannot call a class as a function")}function Io(e,n){for(var t=0;t<n.length;t++){var r=n[t];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}function To(e,n){return To=Object.setPrototypeOf||function(e,n){return e.__proto__=n,e},To(e,n)}function Po(e){var n=function(){if("undefined"==typeof Reflect||!Reflect.construct)return!1;if(Reflect.construct.sham)return!1;if("function"==typeof Proxy)return!0;try{return Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){}))),!0}catch(e){return!1}}();return function(){var t,r=zo(e);if(n){var o=zo(this).constructor;t=Reflect.construct(r,arguments,o)}else t=r.apply(this,arguments);return jo(this,t)}}function jo(e,n){if(n&&("object"===Oo(n)||"function"==typeof n))return n;if(void 0!==n)throw new TypeError("Derived constructors may only return object or undefined");return function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e)}function zo(e){return zo=Object.setPrototypeOf?Object.getPrototypeOf:function(e){return e.__proto__||Object.getPrototypeOf(e)},zo(e)}ko(So,"propTypes",{className:o().string,description:o().oneOfType([o().element,o().string]),isFirst:o().bool});var Ro,Mo,Do,No=function(n){!function(e,n){if("function"!=typeof n&&null!==n)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(n&&n.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),n&&To(e,n)}(l,n);var t,r,o,i=Po(l);function l(){return Bo(this,l),i.apply(this,arguments)}return t=l,(r=[{key:"render",value:function(){return e.createElement("span",{className:a()(Qn().item,Qn().hint),"data-test":"ring-list-hint"},this.props.label)}}])&&Io(t.prototype,r),o&&Io(t,o),l}(e.PureComponent);Ro=No,Mo="propTypes",Do={label:o().node},Mo in Ro?Object.defineProperty(Ro,Mo,{value:Do,enumerable:!0,configurable:!0,writable:!0}):Ro[Mo]=Do;var Lo={SEPARATOR:0,LINK:1,ITEM:2,HINT:3,CUSTOM:4,TITLE:5,MARGIN:6},Fo={ITEM_PADDING:16,ITEM_HEIGHT:32,COMPACT_ITEM_HEIGHT:24,SEPARATOR_HEIGHT:25,SEPARATOR_FIRST_HEIGHT:16,SEPARATOR_TEXT_HEIGHT:18,TITLE_HEIGHT:42,INNER_PADDING:8,MARGIN:8},Uo=Lo.ITEM;function Wo(e){return Wo="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},Wo(e)}var Ho=["selectedLabel","originalModel"];function Go(e,n){var t=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);n&&(r=r.filter((function(n){return Object.getOwnPropertyDescriptor(e,n).enumerable}))),t.push.apply(t,r)}return t}function qo(e){for(var n=1;n<arguments.length;n++){var t=null!=arguments[n]?arguments[n]:{};n%2?Go(Object(t),!0).forEach((function(n){ei(e,n,t[n])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(t)):Go(Object(t)).forEach((function(n){Object.defineProperty(e,n,Object.getOwnPropertyDescriptor(t,n))}))}return e}function Vo(e,n){if(null==e)return{};var t,r,o=function(e,n){if(null==e)return{};var t,r,o={},i=Object.keys(e);for(r=0;r<i.length;r++)t=i[r],n.indexOf(t)>=0||(o[t]=e[t]);return o}(e,n);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)t=i[r],n.indexOf(t)>=0||Object.prototype.propertyIsEnumerable.call(e,t)&&(o[t]=e[t])}return o}function $o(e,n){if(!(e instanceof n))throw new TypeError("Cannot call a class as a function")}function Ko(e,n){for(var t=0;t<n.length;t++){var r=n[t];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}function Yo(e,n){return Yo=Object.setPrototypeOf||function(e,n){return e.__proto__=n,e},Yo(e,n)}function Xo(e){var n=function(){if("undefined"==typeof Reflect||!Reflect.construct)return!1;if(Reflect.construct.sham)return!1;if("function"==typeof Proxy)return!0;try{return Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){}))),!0}catch(e){return!1}}();return function(){var t,r=Jo(e);if(n){var o=Jo(this).constructor;t=Reflect.construct(r,arguments,o)}else t=r.apply(this,arguments);return Zo(this,t)}}function Zo(e,n){if(n&&("object"===Wo(n)||"function"==typeof n))return n;if(void 0!==n)throw new TypeError("Derived constructors may only return object or undefined");return Qo(e)}function Qo(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}function Jo(e){return Jo=Object.setPrototypeOf?Object.getPrototypeOf:function(e){return e.__proto__||Object.getPrototypeOf(e)},Jo(e)}function ei(e,n,t){return n in e?Object.defineProperty(e,n,{value:t,enumerable:!0,configurable:!0,writable:!0}):e[n]=t,e}var ni=Ue(),ti=Ue();function ri(){}var oi=Oe()((function(){}),"No key passed for list item with non-string label. It is considered as a bad practice and has been deprecated, please provide a key.");var ii=[Lo.SEPARATOR,Lo.TITLE,Lo.MARGIN];function ai(e){return null!=e&&!ii.includes(e.rgItemType)&&!e.disabled}var li=function(n){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:"",r=(0,e.createContext)(n),i=(0,e.createContext)((function(){}));function a(t){var o=t.children,a=bn((0,e.useState)(n),2),l=a[0],c=a[1];return e.createElement(r.Provider,{value:l},e.createElement(i.Provider,{value:c},o))}function l(n,t){var r=(0,e.useContext)(i);(0,e.useEffect)((function(){t||r(n)}),[r,n,t])}function c(e){return l(e.value,e.skipUpdate),null}return a.propTypes={children:o().node},a.displayName="".concat(t,"Provider"),c.displayName="".concat(t,"Updater"),{ValueContext:r,UpdateContext:i,Provider:a,useUpdate:l,Updater:(0,e.memo)(c)}}(void 0,"ActiveItem"),ci=function(n){!function(e,n){if("function"!=typeof n&&null!==n)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(n&&n.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),n&&Yo(e,n)}(l,n);var t,r,o,i=Xo(l);function l(){var n;$o(this,l);for(var t=arguments.length,r=new Array(t),o=0;o<t;o++)r[o]=arguments[o];return ei(Qo(n=i.call.apply(i,[this].concat(r))),"state",{activeIndex:null,prevActiveIndex:null,prevData:[],activeItem:null,needScrollToActive:!1,scrolling:!1,hasOverflow:!1,disabledHover:!1,scrolledToBottom:!1}),ei(Qo(n),"hoverHandler",We((function(e){return function(){return ti((function(){n.state.disabledHover||n.container&&n.setState({activeIndex:e,activeItem:n.props.data[e],needScrollToActive:!1})}))}}))),ei(Qo(n),"_activatableItems",!1),ei(Qo(n),"_bufferSize",10),ei(Qo(n),"sizeCacheKey",(function(e){if(0===e||e===n.props.data.length+1)return Lo.MARGIN;var t=n.props.data[e-1],r=1===e;switch(t.rgItemType){case Lo.SEPARATOR:case Lo.TITLE:return"".concat(t.rgItemType).concat(r?"_first":"").concat(t.description?"_desc":"");case Lo.MARGIN:return Lo.MARGIN;case Lo.CUSTOM:return"".concat(Lo.CUSTOM,"_").concat(t.key);default:return t.details?"".concat(Lo.ITEM,"_").concat(t.details):Lo.ITEM}})),ei(Qo(n),"_cache",new xe({defaultHeight:n.defaultItemHeight(),fixedWidth:!0,keyMapper:n.sizeCacheKey})),ei(Qo(n),"_hasActivatableItems",Te((function(e){return e.some(ai)}))),ei(Qo(n),"selectHandler",We((function(e){return function(t){var r=arguments.length>1&&void 0!==arguments[1]&&arguments[1],o=n.props.data[e];!n.props.useMouseUp&&o.onClick?o.onClick(o,t):n.props.useMouseUp&&o.onMouseUp&&o.onMouseUp(o,t),n.props.onSelect&&n.props.onSelect(o,t,{tryKeepOpen:r})}}))),ei(Qo(n),"checkboxHandler",We((function(e){return function(t){return n.selectHandler(e)(t,!0)}}))),ei(Qo(n),"upHandler",(function(e){var t,r=n.props,o=r.data,i=r.disableMoveOverflow,a=n.state.activeIndex;if(null===a||0===a){if(i)return;t=o.length-1}else t=a-1;n.moveHandler(t,n.upHandler,e)})),ei(Qo(n),"downHandler",(function(e){var t,r=n.props,o=r.data,i=r.disableMoveOverflow,a=r.disableMoveDownOverflow,l=n.state.activeIndex;if(null===l)t=0;else if(l+1===o.length){if(i||a)return;t=0}else t=l+1;n.moveHandler(t,n.downHandler,e)})),ei(Qo(n),"homeHandler",(function(e){n.moveHandler(0,n.downHandler,e)})),ei(Qo(n),"endHandler",(function(e){n.moveHandler(n.props.data.length-1,n.upHandler,e)})),ei(Qo(n),"onDocumentMouseMove",(function(){n.state.disabledHover&&n.setState({disabledHover:!1})})),ei(Qo(n),"onDocumentKeyDown",(function(e){n.state.disabledHover||[16,17,18,19,20,91].includes(e.keyCode)||n.setState({disabledHover:!0})})),ei(Qo(n),"mouseHandler",(function(){n.setState({scrolling:!1})})),ei(Qo(n),"scrollHandler",(function(){n.setState({scrolling:!0},n.scrollEndHandler)})),ei(Qo(n),"enterHandler",(function(e,t){if(null!==n.state.activeIndex){var r=n.props.data[n.state.activeIndex];return n.selectHandler(n.state.activeIndex)(e),r.href&&!e.defaultPrevented&&(["command+enter","ctrl+enter"].includes(t)?window.open(r.href,"_blank"):"shift+enter"===t?window.open(r.href):window.location.href=r.href),!1}return!0})),ei(Qo(n),"clearSelected",(function(){n.setState({activeIndex:null,needScrollToActive:!1})})),ei(Qo(n),"scrollEndHandler",(function(){return ni((function(){var e=n.inner;if(e){var t=e.scrollHeight,r=n.defaultItemHeight()/2,o=e.scrollTop+e.clientHeight+r,i=t>0&&o>=t;n.unmounted||n.setState({scrolledToBottom:i}),i&&n.props.onScrollToBottom()}}))})),ei(Qo(n),"checkOverflow",(function(){n.inner&&n.setState({hasOverflow:n.inner.scrollHeight-n.inner.clientHeight>1})})),ei(Qo(n),"renderItem",(function(t){var r,o,i=t.index,l=t.style,c=t.isScrolling,u=t.parent,s=t.key,f=i-1,p=n.props.data[f],d=n.getId(p);if(0===i||i===n.props.data.length+1||p.rgItemType===Lo.MARGIN)r=s||"".concat(Lo.MARGIN,"_").concat(i),o=e.createElement("div",{style:{height:Fo.MARGIN}});else{p.selectedLabel,p.originalModel;var h=Vo(p,Ho),g=Object.assign({rgItemType:Uo},h);g.url&&(g.href=g.url),g.href&&(g.rgItemType=Lo.LINK),r=s||d,g.hover=f===n.state.activeIndex,null!=g.hoverClassName&&g.hover&&(g.className=a()(g.className,g.hoverClassName)),g.onMouseOver=n.hoverHandler(f),g.tabIndex=-1,g.scrolling=c;var v,A=n.selectHandler(f);n.props.useMouseUp?g.onMouseUp=A:g.onClick=A,g.onCheckboxChange=n.checkboxHandler(f),null==g.compact&&(g.compact=n.props.compact);var b=1===i;switch(g.rgItemType){case Lo.SEPARATOR:v=So,g.isFirst=b;break;case Lo.LINK:v=pt,n.addItemDataTestToProp(g);break;case Lo.ITEM:v=$r,n.addItemDataTestToProp(g);break;case Lo.CUSTOM:v=co,n.addItemDataTestToProp(g);break;case Lo.TITLE:g.isFirst=b,v=bo;break;default:throw new Error("Unknown menu element type: ".concat(g.rgItemType))}o=e.createElement(v,g)}return u?e.createElement(we,{cache:n._cache,key:r,parent:u,rowIndex:i,columnIndex:0},(function(n){var t=n.registerChild;return e.createElement("div",{ref:t,style:l,role:"row",id:d},e.createElement("div",{role:"cell"},o))})):e.createElement("div",{role:"row",id:d,key:r},e.createElement("div",{role:"cell"},(0,e.cloneElement)(o)))})),ei(Qo(n),"addItemDataTestToProp",(function(e){return e["data-test"]=Ne("ring-list-item",e["data-test"]),e})),ei(Qo(n),"virtualizedListRef",(function(e){n.virtualizedList=e})),ei(Qo(n),"containerRef",(function(e){n.container=e})),ei(Qo(n),"id",Fe("list-")),ei(Qo(n),"shortcutsScope",n.id),ei(Qo(n),"shortcutsMap",{up:n.upHandler,down:n.downHandler,home:n.homeHandler,end:n.endHandler,enter:n.enterHandler,"meta+enter":n.enterHandler,"ctrl+enter":n.enterHandler,"command+enter":n.enterHandler,"shift+enter":n.enterHandler}),n}return t=l,r=[{key:"componentDidMount",value:function(){document.addEventListener("mousemove",this.onDocumentMouseMove),document.addEventListener("keydown",this.onDocumentKeyDown,!0)}},{key:"shouldComponentUpdate",value:function(e,n){var t=this;return e!==this.props||Object.keys(n).some((function(e){return n[e]!==t.state[e]}))}},{key:"componentDidUpdate",value:function(e){this.virtualizedList&&e.data!==this.props.data&&this.virtualizedList.recomputeRowHeights(),this.checkOverflow()}},{key:"componentWillUnmount",value:function(){this.unmounted=!0,document.removeEventListener("mousemove",this.onDocumentMouseMove),document.removeEventListener("keydown",this.onDocumentKeyDown,!0)}},{key:"hasActivatableItems",value:function(){return this._hasActivatableItems(this.props.data)}},{key:"moveHandler",value:function(e,n,t){var r;if(0!==this.props.data.length&&this.hasActivatableItems()){r=this.props.data.length<e?0:e;var o=this.props.data[r];this.setState({activeIndex:r,activeItem:o,needScrollToActive:!0},(function(){ai(o)?"Home"!==t.key&&"End"!==t.key&&function(e){e.preventDefault&&e.preventDefault()}(t):n(t)}))}}},{key:"getFirst",value:function(){return this.props.data.find((function(e){return e.rgItemType===Lo.ITEM||e.rgItemType===Lo.CUSTOM}))}},{key:"getSelected",value:function(){return this.props.data[this.state.activeIndex]}},{key:"defaultItemHeight",value:function(){return this.props.compact?Fo.COMPACT_ITEM_HEIGHT:Fo.ITEM_HEIGHT}},{key:"getVisibleListHeight",value:function(e){return e.maxHeight-this.defaultItemHeight()-Fo.INNER_PADDING}},{key:"_deprecatedGenerateKeyFromContent",value:function(e){var n=e.label||e.description;return n&&!("string"==typeof n||n instanceof String)&&(oi(),"".concat(e.rgItemType,"_").concat(JSON.stringify(n))),"".concat(e.rgItemType,"_").concat(n)}},{key:"getId",value:function(e){return null!=e?"".concat(this.id,":").concat(e.key||this._deprecatedGenerateKeyFromContent(e)):null}},{key:"inner",get:function(){return this._inner||(this._inner=this.container&&this.container.querySelector(".ring-list__i")),this._inner}},{key:"renderVirtualizedInner",value:function(n){var t=this,r=n.height,o=n.maxHeight,i=n.autoHeight,a=void 0!==i&&i,l=n.rowCount,c=n.isScrolling,u=n.onChildScroll,s=void 0===u?ri:u,f=n.scrollTop,p=n.registerChild,d={direction:"auto"};return e.createElement(ne,{disableHeight:!0,onResize:this.props.onResize},(function(n){var i=n.width;return e.createElement("div",{ref:p},e.createElement(Z,{"aria-label":t.props.ariaLabel,ref:t.virtualizedListRef,className:"ring-list__i",autoHeight:a,style:o?qo({maxHeight:o,height:"auto"},d):d,autoContainerWidth:!0,height:r,width:i,isScrolling:c,onScroll:function(e){s(e),t.scrollEndHandler(e)},scrollTop:f,rowCount:l,estimatedRowSize:t.defaultItemHeight(),rowHeight:t._cache.rowHeight,rowRenderer:t.renderItem,overscanRowCount:t._bufferSize,noop:function(){},scrollToIndex:!t.props.disableScrollToActive&&t.state.needScrollToActive&&null!=t.state.activeIndex?t.state.activeIndex+1:void 0,scrollToAlignment:"center",deferredMeasurementCache:t._cache,onRowsRendered:t.checkOverflow}))}))}},{key:"renderVirtualized",value:function(n,t){var r=this;return n?this.renderVirtualizedInner({height:n,maxHeight:n,rowCount:t}):e.createElement(Ee,null,(function(e){return r.renderVirtualizedInner(qo(qo({},e),{},{rowCount:t,autoHeight:!0}))}))}},{key:"renderSimple",value:function(n,t){for(var r=[],o=0;o<t;o++)r.push(this.renderItem({index:o,isScrolling:this.state.scrolling}));return e.createElement("div",{className:a()("ring-list__i",Qn().simpleInner),onScroll:this.scrollHandler,onMouseMove:this.mouseHandler},e.createElement("div",{"aria-label":this.props.ariaLabel,role:"grid",style:n?{maxHeight:this.getVisibleListHeight(this.props)}:null},r))}},{key:"render",value:function(){var n=this.getSelected()&&this.props.hintOnSelection||this.props.hint,t=n?{bottom:Fo.ITEM_HEIGHT}:null,r=this.props.data.length+2,o=this.props.maxHeight&&this.getVisibleListHeight(this.props),i=a()(Qn().list,this.props.className);return e.createElement(e.Fragment,null,e.createElement(li.Updater,{value:this.getId(this.state.activeItem),skipUpdate:this.props.hidden||!ai(this.state.activeItem)}),e.createElement("div",{id:this.props.id,ref:this.containerRef,className:i,onMouseOut:this.props.onMouseOut,onBlur:this.props.onMouseOut,onMouseLeave:this.clearSelected,"data-test":"ring-list"},this.props.shortcuts&&e.createElement(An,{map:this.shortcutsMap,scope:this.shortcutsScope}),this.props.renderOptimization?this.renderVirtualized(o,r):this.renderSimple(o,r),this.state.hasOverflow&&!this.state.scrolledToBottom&&e.createElement("div",{className:Qn().fade,style:t}),n&&e.createElement(No,{label:n})))}}],o=[{key:"getDerivedStateFromProps",value:function(e,n){var t,r=n.prevActiveIndex,o=n.prevData,i=n.activeItem,a=e.data,l=e.activeIndex,c=e.restoreActiveIndex,u={prevActiveIndex:l,prevData:a};if(a!==o&&Object.assign(u,{activeIndex:null,activeItem:null}),null!=l&&l!==r&&null!=a[l])Object.assign(u,{activeIndex:l,activeItem:a[l],needScrollToActive:!0});else if(a!==o&&c&&null!=i&&null!=i.key){var s=a.findIndex((function(e){return e.key===i.key}));s>=0&&Object.assign(u,{activeIndex:s,activeItem:a[s]})}if(null==l&&null==n.activeIndex&&((t=e).activateFirstItem||t.activateSingleItem&&1===t.data.length)){var f=a.findIndex(ai);f>=0&&Object.assign(u,{activeIndex:f,activeItem:a[f],needScrollToActive:!0})}return u}}],r&&Ko(t.prototype,r),o&&Ko(t,o),l}(e.Component);ei(ci,"propTypes",{id:o().string,className:o().string,hint:o().node,hintOnSelection:o().string,data:o().array,maxHeight:o().oneOfType([o().string,o().number]),activeIndex:o().number,restoreActiveIndex:o().bool,activateSingleItem:o().bool,activateFirstItem:o().bool,shortcuts:o().bool,onMouseOut:o().func,onSelect:o().func,onScrollToBottom:o().func,onResize:o().func,useMouseUp:o().bool,visible:o().bool,renderOptimization:o().bool,disableMoveOverflow:o().bool,disableMoveDownOverflow:o().bool,compact:o().bool,disableScrollToActive:o().bool,hidden:o().bool,ariaLabel:o().string}),ei(ci,"defaultProps",{data:[],restoreActiveIndex:!1,activateSingleItem:!1,activateFirstItem:!1,onMouseOut:ri,onSelect:ri,onScrollToBottom:ri,onResize:ri,shortcuts:!1,renderOptimization:!0,disableMoveDownOverflow:!1,ariaLabel:"List"}),ei(ci,"isItemType",(function(e,n){var t=n.rgItemType;return null==t&&(t=Uo),t===e})),ei(ci,"ListHint",No),ei(ci,"ListProps",{Type:Lo,Dimension:Fo});t(3210),t(6541),t(2564),t(6833),t(6649),t(6078);var ui=t(5570),si=t.n(ui),fi=t(107),pi=t.n(fi),di=t(251),hi=t.n(di),gi=(t(5218),["theme"]);function vi(){return vi=Object.assign||function(e){for(var n=1;n<arguments.length;n++){var t=arguments[n];for(var r in t)Object.prototype.hasOwnProperty.call(t,r)&&(e[r]=t[r])}return e},vi.apply(this,arguments)}function Ai(e,n){if(null==e)return{};var t,r,o=function(e,n){if(null==e)return{};var t,r,o={},i=Object.keys(e);for(r=0;r<i.length;r++)t=i[r],n.indexOf(t)>=0||(o[t]=e[t]);return o}(e,n);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)t=i[r],n.indexOf(t)>=0||Object.prototype.propertyIsEnumerable.call(e,t)&&(o[t]=e[t])}return o}var bi={LIGHT:"light",DARK:"dark"},mi=(0,e.createContext)(null),yi=function(e){var n,t;return"string"==typeof e?e:null!==(n=null!==(t=e.name)&&void 0!==t?t:e.displayName)&&void 0!==n?n:"Component"},Ei=function(){var n=arguments.length>0&&void 0!==arguments[0]?arguments[0]:bi.LIGHT;return function(t){var r=(0,e.memo)((0,e.forwardRef)((function(r,o){var i=r.theme,a=Ai(r,gi);return e.createElement(mi.Consumer,null,(function(r){var l=i||r||n;return e.createElement(mi.Provider,{value:l},e.createElement(t,vi({ref:o},a,{theme:l})))}))})));return Object.assign(r,t),r.propTypes=t.propTypes,r.displayName="withTheme(".concat(yi(t),")"),r}};const _i=bi;var Ci=t(5526),wi=t.n(Ci);function xi(e,n,t){return n in e?Object.defineProperty(e,n,{value:t,enumerable:!0,configurable:!0,writable:!0}):e[n]=t,e}function ki(e){return ki="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},ki(e)}var Si=["theme","active","danger","delayed","loader","primary","short","text","inline","dropdown","icon","iconSize","iconClassName","iconSuppressSizeWarning","className","children"];function Oi(){return Oi=Object.assign||function(e){for(var n=1;n<arguments.length;n++){var t=arguments[n];for(var r in t)Object.prototype.hasOwnProperty.call(t,r)&&(e[r]=t[r])}return e},Oi.apply(this,arguments)}function Bi(e,n){if(null==e)return{};var t,r,o=function(e,n){if(null==e)return{};var t,r,o={},i=Object.keys(e);for(r=0;r<i.length;r++)t=i[r],n.indexOf(t)>=0||(o[t]=e[t]);return o}(e,n);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)t=i[r],n.indexOf(t)>=0||Object.prototype.propertyIsEnumerable.call(e,t)&&(o[t]=e[t])}return o}function Ii(e,n){if(!(e instanceof n))throw new TypeError("Cannot call a class as a function")}function Ti(e,n){for(var t=0;t<n.length;t++){var r=n[t];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}function Pi(e,n){return Pi=Object.setPrototypeOf||function(e,n){return e.__proto__=n,e},Pi(e,n)}function ji(e){var n=function(){if("undefined"==typeof Reflect||!Reflect.construct)return!1;if(Reflect.construct.sham)return!1;if("function"==typeof Proxy)return!0;try{return Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){}))),!0}catch(e){return!1}}();return function(){var t,r=Mi(e);if(n){var o=Mi(this).constructor;t=Reflect.construct(r,arguments,o)}else t=r.apply(this,arguments);return zi(this,t)}}function zi(e,n){if(n&&("object"===ki(n)||"function"==typeof n))return n;if(void 0!==n)throw new TypeError("Derived constructors may only return object or undefined");return Ri(e)}function Ri(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}function Mi(e){return Mi=Object.setPrototypeOf?Object.getPrototypeOf:function(e){return e.__proto__||Object.getPrototypeOf(e)},Mi(e)}function Di(e,n,t){return n in e?Object.defineProperty(e,n,{value:t,enumerable:!0,configurable:!0,writable:!0}):e[n]=t,e}var Ni=function(n){!function(e,n){if("function"!=typeof n&&null!==n)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(n&&n.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),n&&Pi(e,n)}(l,n);var t,r,o,i=ji(l);function l(){var n;Ii(this,l);for(var t=arguments.length,r=new Array(t),o=0;o<t;o++)r[o]=arguments[o];return Di(Ri(n=i.call.apply(i,[this].concat(r))),"buttonRef",(0,e.createRef)()),n}return t=l,r=[{key:"render",value:function(){var n=this.props,t=n.theme,r=n.active,o=n.danger,i=n.delayed,l=n.loader,c=n.primary,u=n.short,s=n.text,f=n.inline,p=n.dropdown,d=n.icon,h=n.iconSize,g=n.iconClassName,v=n.iconSuppressSizeWarning,A=n.className,b=n.children,m=Bi(n,Si),y=function(e){var n,t=e.className,r=e.active,o=e.disabled,i=e.loader,l=e.primary,c=e.short,u=e.text,s=e.inline,f=e.danger,p=e.delayed,d=e.icon,h=e.theme,g=d&&!r&&!f&&!l&&!o;return a()(wi().button,t,wi()[h],(xi(n={},wi().active,r),xi(n,wi().danger,f),xi(n,wi().delayed,p),xi(n,wi().withIcon,d),xi(n,wi().withNormalIconLight,g&&h===_i.LIGHT),xi(n,wi().withNormalIconDark,g&&h===_i.DARK),xi(n,wi().withDangerIconLight,d&&f&&h===_i.LIGHT),xi(n,wi().withDangerIconDark,d&&f&&h===_i.DARK),xi(n,wi().loader,i&&!d),xi(n,wi().primary,l),xi(n,wi().short,c),xi(n,wi().text,u),xi(n,wi().inline,s),n))}({className:A,active:r,danger:o,delayed:i,icon:d,theme:t,loader:l,primary:c,short:u,text:s,inline:f}),E=e.createElement("span",{className:wi().content},d&&e.createElement("span",{className:a()(wi().icon,g)},e.createElement(br,{glyph:d,size:h,loading:l,suppressSizeWarning:v})),b&&e.createElement("span",null,b),p&&e.createElement(br,{glyph:si(),className:wi().dropdownIcon})),_=!!m.href,C=_?jn:"button";return e.createElement(C,Oi({ref:this.buttonRef,tabIndex:l?-1:0,type:_?null:"button"},m,{className:y}),l&&!s&&!d&&e.createElement("div",{className:wi().loaderBackground}),E)}}],r&&Ti(t.prototype,r),o&&Ti(t,o),l}(e.PureComponent);Di(Ni,"propTypes",{theme:o().oneOf(["light","dark"]),active:o().bool,danger:o().bool,delayed:o().bool,loader:o().bool,primary:o().bool,short:o().bool,text:o().bool,inline:o().bool,dropdown:o().bool,href:o().string,target:o().string,icon:o().oneOfType([o().string,o().elementType]),iconSize:o().number,iconClassName:o().string,iconSuppressSizeWarning:o().bool,className:o().string,children:o().node,onClick:o().func}),Di(Ni,"IconSize",Zt),Di(Ni,"Theme",_i);const Li=Ei()(Ni);var Fi=t(2242),Ui=t.n(Fi),Wi=["children","className"];function Hi(){return Hi=Object.assign||function(e){for(var n=1;n<arguments.length;n++){var t=arguments[n];for(var r in t)Object.prototype.hasOwnProperty.call(t,r)&&(e[r]=t[r])}return e},Hi.apply(this,arguments)}function Gi(e,n){if(null==e)return{};var t,r,o=function(e,n){if(null==e)return{};var t,r,o={},i=Object.keys(e);for(r=0;r<i.length;r++)t=i[r],n.indexOf(t)>=0||(o[t]=e[t]);return o}(e,n);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)t=i[r],n.indexOf(t)>=0||Object.prototype.propertyIsEnumerable.call(e,t)&&(o[t]=e[t])}return o}var qi=function(n){var t=n.children,r=n.className,o=Gi(n,Wi);return e.createElement(Li,Hi({text:!0,className:a()(Ui().anchor,r)},o),t,e.createElement(br,{glyph:si(),className:Ui().chevron}))};qi.propTypes={children:o().node,className:o().string};const Vi=(0,e.memo)(qi);t(3710),t(9714);var $i=t(335),Ki=t.n($i);function Yi(e){return Yi="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},Yi(e)}var Xi=["children","trapDisabled","autoFocusFirst","focusBackOnClose","focusBackOnExit"];function Zi(){return Zi=Object.assign||function(e){for(var n=1;n<arguments.length;n++){var t=arguments[n];for(var r in t)Object.prototype.hasOwnProperty.call(t,r)&&(e[r]=t[r])}return e},Zi.apply(this,arguments)}function Qi(e,n){if(null==e)return{};var t,r,o=function(e,n){if(null==e)return{};var t,r,o={},i=Object.keys(e);for(r=0;r<i.length;r++)t=i[r],n.indexOf(t)>=0||(o[t]=e[t]);return o}(e,n);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)t=i[r],n.indexOf(t)>=0||Object.prototype.propertyIsEnumerable.call(e,t)&&(o[t]=e[t])}return o}function Ji(e){return function(e){if(Array.isArray(e))return ea(e)}(e)||function(e){if("undefined"!=typeof Symbol&&null!=e[Symbol.iterator]||null!=e["@@iterator"])return Array.from(e)}(e)||function(e,n){if(!e)return;if("string"==typeof e)return ea(e,n);var t=Object.prototype.toString.call(e).slice(8,-1);"Object"===t&&e.constructor&&(t=e.constructor.name);if("Map"===t||"Set"===t)return Array.from(e);if("Arguments"===t||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(t))return ea(e,n)}(e)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function ea(e,n){(null==n||n>e.length)&&(n=e.length);for(var t=0,r=new Array(n);t<n;t++)r[t]=e[t];return r}function na(e,n){if(!(e instanceof n))throw new TypeError("Cannot call a class as a function")}function ta(e,n){for(var t=0;t<n.length;t++){var r=n[t];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}function ra(e,n){return ra=Object.setPrototypeOf||function(e,n){return e.__proto__=n,e},ra(e,n)}function oa(e){var n=function(){if("undefined"==typeof Reflect||!Reflect.construct)return!1;if(Reflect.construct.sham)return!1;if("function"==typeof Proxy)return!0;try{return Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){}))),!0}catch(e){return!1}}();return function(){var t,r=la(e);if(n){var o=la(this).constructor;t=Reflect.construct(r,arguments,o)}else t=r.apply(this,arguments);return ia(this,t)}}function ia(e,n){if(n&&("object"===Yi(n)||"function"==typeof n))return n;if(void 0!==n)throw new TypeError("Derived constructors may only return object or undefined");return aa(e)}function aa(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}function la(e){return la=Object.setPrototypeOf?Object.getPrototypeOf:function(e){return e.__proto__||Object.getPrototypeOf(e)},la(e)}function ca(e,n,t){return n in e?Object.defineProperty(e,n,{value:t,enumerable:!0,configurable:!0,writable:!0}):e[n]=t,e}var ua="input, button, select, textarea, a[href], *[tabindex]:not([data-trap-button]):not([data-scrollable-container])",sa=function(n){!function(e,n){if("function"!=typeof n&&null!==n)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(n&&n.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),n&&ra(e,n)}(a,n);var t,r,o,i=oa(a);function a(){var e;na(this,a);for(var n=arguments.length,t=new Array(n),r=0;r<n;r++)t[r]=arguments[r];return ca(aa(e=i.call.apply(i,[this].concat(t))),"restoreFocus",(function(){var n=aa(e).previousFocusedNode;n&&n.focus&&Ye(n)&&n.focus({preventScroll:!0})})),ca(aa(e),"containerRef",(function(n){n&&(e.node=n)})),ca(aa(e),"focusElement",(function(){var n=!(arguments.length>0&&void 0!==arguments[0])||arguments[0],t=aa(e),r=t.node;if(r){var o=Ji(r.querySelectorAll(ua)).filter((function(e){return e.tabIndex>=0})),i=n?o[0]:o[o.length-1];i&&i.focus()}})),ca(aa(e),"focusFirst",(function(){return e.focusElement(!0)})),ca(aa(e),"focusLast",(function(){return e.focusElement(!1)})),ca(aa(e),"focusLastIfEnabled",(function(n){if(!e.trapWithoutFocus)if(e.props.focusBackOnExit){var t=n.nativeEvent.relatedTarget;null!=t&&null!=e.node&&e.node.contains(t)&&e.restoreFocus()}else e.focusLast()})),ca(aa(e),"handleBlurIfWithoutFocus",(function(n){if(e.trapWithoutFocus){e.trapWithoutFocus=!1;var t=n.nativeEvent.relatedTarget;t&&(e.node.contains(t)||e.focusLast())}})),ca(aa(e),"trapButtonRef",(function(n){n&&(e.trapButtonNode=n)})),e}return t=a,(r=[{key:"componentDidMount",value:function(){this.previousFocusedNode=document.activeElement,this.props.autoFocusFirst?this.focusFirst():this.props.trapDisabled||this.node&&this.node.contains(this.previousFocusedNode)||(this.trapWithoutFocus=!0,this.trapButtonNode.focus())}},{key:"componentWillUnmount",value:function(){this.props.focusBackOnClose&&this.restoreFocus()}},{key:"render",value:function(){var n=this.props,t=n.children,r=n.trapDisabled,o=(n.autoFocusFirst,n.focusBackOnClose,n.focusBackOnExit),i=Qi(n,Xi);return r?e.createElement("div",Zi({ref:this.containerRef},i),t):e.createElement("div",Zi({ref:this.containerRef},i),e.createElement("div",{tabIndex:0,ref:this.trapButtonRef,className:Ki().trapButton,onFocus:this.focusLastIfEnabled,onBlur:this.handleBlurIfWithoutFocus,"data-trap-button":!0}),t,e.createElement("div",{tabIndex:0,onFocus:o?this.restoreFocus:this.focusFirst,"data-trap-button":!0}))}}])&&ta(t.prototype,r),o&&ta(t,o),a}(e.Component);ca(sa,"propTypes",{children:o().node.isRequired,trapDisabled:o().bool,autoFocusFirst:o().bool,focusBackOnClose:o().bool,focusBackOnExit:o().bool}),ca(sa,"defaultProps",{trapDisabled:!1,autoFocusFirst:!0,focusBackOnClose:!0,focusBackOnExit:!1});t(2707);var fa={BOTTOM_RIGHT:"BOTTOM_RIGHT",BOTTOM_LEFT:"BOTTOM_LEFT",BOTTOM_CENTER:"BOTTOM_CENTER",TOP_LEFT:"TOP_LEFT",TOP_RIGHT:"TOP_RIGHT",TOP_CENTER:"TOP_CENTER",RIGHT_TOP:"RIGHT_TOP",RIGHT_BOTTOM:"RIGHT_BOTTOM",RIGHT_CENTER:"RIGHT_CENTER",LEFT_TOP:"LEFT_TOP",LEFT_BOTTOM:"LEFT_BOTTOM",LEFT_CENTER:"LEFT_CENTER"},pa=[fa.BOTTOM_RIGHT,fa.BOTTOM_LEFT,fa.TOP_LEFT,fa.TOP_RIGHT,fa.RIGHT_TOP,fa.RIGHT_BOTTOM,fa.LEFT_TOP,fa.LEFT_BOTTOM],da={MARGIN:16,BORDER_WIDTH:1},ha={TARGET:-1},ga={SCREEN:-1},va=1,Aa=2;function ba(e,n,t){return n in e?Object.defineProperty(e,n,{value:t,enumerable:!0,configurable:!0,writable:!0}):e[n]=t,e}function ma(e,n,t){var r=null!==t.container?t.container.clientHeight:Ke(),o=n.top+t.sidePadding,i=n.top+r-t.sidePadding,a=Math.max(o-e.top,0),l=t.popup.clientHeight,c=e.top+l-i;return a+Math.max(c,0)}function ya(e,n,t){var r=null!==t.container?t.container.clientWidth:window.innerWidth,o=n.left+t.sidePadding,i=n.left+r-t.sidePadding,a=Math.max(o-e.left,0),l=t.popup.clientWidth,c=e.left+l-i;return a+Math.max(c,0)}var Ea=["directions","autoPositioning","autoCorrectTopOverflow","sidePadding","top","left","offset","maxHeight","minWidth"],_a={top:0,left:0};function Ca(e,n,t){var r=t||document.documentElement,o=n.getBoundingClientRect(),i=r.getBoundingClientRect(),a=Math.max(o.top-i.top,0),l=Math.max(i.height,r===document.documentElement?r.clientHeight:0),c=Math.max(l-(a+o.height),0);switch(e){case fa.TOP_LEFT:case fa.TOP_CENTER:case fa.TOP_RIGHT:return a;case fa.BOTTOM_LEFT:case fa.BOTTOM_CENTER:case fa.BOTTOM_RIGHT:return c;case fa.LEFT_BOTTOM:case fa.RIGHT_BOTTOM:return o.height+c;case fa.LEFT_TOP:case fa.RIGHT_TOP:return o.height+a;case fa.RIGHT_CENTER:case fa.LEFT_CENTER:return o.height/2+Math.min(c/2,a/2);default:return null}}function wa(e){var n=e.popup,t=e.anchor,r=e.container,o=e.directions,i=e.autoPositioning,a=e.sidePadding,l=e.top,c=e.left,u=e.offset,s=e.maxHeight,f=e.minWidth,p=e.autoCorrectTopOverflow,d=void 0===p||p,h={top:0,left:0},g=null,v=null!==r?$e(r):_a,A=null!==r?r:document.body,b=$e(qe(t)?t:A),m=function(e){return null!==e?{top:e.scrollTop,left:e.scrollLeft}:{top:document.documentElement&&document.documentElement.scrollTop||document.body.scrollTop,left:document.documentElement&&document.documentElement.scrollLeft||document.body.scrollLeft}}(r),y=b.left+m.left+c-v.left,E=b.top+m.top+l-v.top;if(n){var _=function(e,n,t,r,o){var i,a=e.clientWidth,l=e.clientHeight,c=r+n.height,u=t+n.width,s=t-a,f=r-l,p=u-a,d=t+n.width/2-a/2,h=r+n.height/2-l/2,g=c-l;return ba(i={},fa.BOTTOM_RIGHT,{left:t,top:c+o}),ba(i,fa.BOTTOM_LEFT,{left:p,top:c+o}),ba(i,fa.BOTTOM_CENTER,{left:d,top:c+o}),ba(i,fa.TOP_RIGHT,{left:t,top:f-o}),ba(i,fa.TOP_LEFT,{left:p,top:f-o}),ba(i,fa.TOP_CENTER,{left:d,top:f-o}),ba(i,fa.LEFT_BOTTOM,{left:s-o,top:r}),ba(i,fa.LEFT_TOP,{left:s-o,top:g}),ba(i,fa.LEFT_CENTER,{left:s-o,top:h}),ba(i,fa.RIGHT_BOTTOM,{left:u+o,top:r}),ba(i,fa.RIGHT_TOP,{left:u+o,top:g}),ba(i,fa.RIGHT_CENTER,{left:u+o,top:h}),i}(n,b,y,E,u);if(i&&1!==o.length){var C=o.concat(o[0]).filter((function(e){return _[e]})).map((function(e){return{styles:_[e],direction:e}})).sort((function(n,t){var r=n.styles,o=t.styles;return ma(r,m,e)+ya(r,m,e)-(ma(o,m,e)+ya(o,m,e))}));h=C[0].styles,g=C[0].direction}else h=_[o[0]],g=o[0];["left","top"].forEach((function(e){h[e]<0&&(h[e]=0)}))}return s===ga.SCREEN||"screen"===s?h.maxHeight=window.innerHeight+m.top-h.top-da.MARGIN:s&&(h.maxHeight=s),d&&(h=function(e){var n=e.sidePadding,t=e.styles,r=e.anchorRect,o=e.maxHeight,i=e.popupScrollHeight,a=e.direction,l=e.scroll,c=fa.TOP_LEFT,u=fa.TOP_RIGHT,s=fa.TOP_CENTER;if(![c,u,s,fa.RIGHT_TOP,fa.LEFT_TOP].includes(a))return t;var f=[c,s,u].includes(a)?r.top:r.bottom;return f-(o?Math.min(i,o):i)<=n&&(t.top=n+l.top,t.maxHeight=f-n+1),t}({sidePadding:a,styles:h,anchorRect:b,maxHeight:s,direction:g,popupScrollHeight:n.scrollHeight,scroll:m})),f===ha.TARGET||"target"===f?h.minWidth=b.width:f&&(h.minWidth=b.width<f?f:b.width),{styles:h,direction:g}}var xa=t(125),ka=t.n(xa),Sa=["id","children"];function Oa(){return Oa=Object.assign||function(e){for(var n=1;n<arguments.length;n++){var t=arguments[n];for(var r in t)Object.prototype.hasOwnProperty.call(t,r)&&(e[r]=t[r])}return e},Oa.apply(this,arguments)}function Ba(e,n){if(null==e)return{};var t,r,o=function(e,n){if(null==e)return{};var t,r,o={},i=Object.keys(e);for(r=0;r<i.length;r++)t=i[r],n.indexOf(t)>=0||(o[t]=e[t]);return o}(e,n);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)t=i[r],n.indexOf(t)>=0||Object.prototype.propertyIsEnumerable.call(e,t)&&(o[t]=e[t])}return o}var Ia=(0,e.createContext)(),Ta=(0,e.forwardRef)((function(n,t){var r=n.id,o=n.children,i=Ba(n,Sa),a="function"==typeof o,l=e.createElement("div",Oa({},i,{"data-portaltarget":r,ref:t}),!a&&o);return e.createElement(Ia.Provider,{value:r},a?o(l):l)}));function Pa(e){return Pa="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},Pa(e)}function ja(e,n){var t=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);n&&(r=r.filter((function(n){return Object.getOwnPropertyDescriptor(e,n).enumerable}))),t.push.apply(t,r)}return t}function za(e){for(var n=1;n<arguments.length;n++){var t=null!=arguments[n]?arguments[n]:{};n%2?ja(Object(t),!0).forEach((function(n){Wa(e,n,t[n])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(t)):ja(Object(t)).forEach((function(n){Object.defineProperty(e,n,Object.getOwnPropertyDescriptor(t,n))}))}return e}function Ra(e,n){if(!(e instanceof n))throw new TypeError("Cannot call a class as a function")}function Ma(e,n){for(var t=0;t<n.length;t++){var r=n[t];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}function Da(e,n){return Da=Object.setPrototypeOf||function(e,n){return e.__proto__=n,e},Da(e,n)}function Na(e){var n=function(){if("undefined"==typeof Reflect||!Reflect.construct)return!1;if(Reflect.construct.sham)return!1;if("function"==typeof Proxy)return!0;try{return Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){}))),!0}catch(e){return!1}}();return function(){var t,r=Ua(e);if(n){var o=Ua(this).constructor;t=Reflect.construct(r,arguments,o)}else t=r.apply(this,arguments);return La(this,t)}}function La(e,n){if(n&&("object"===Pa(n)||"function"==typeof n))return n;if(void 0!==n)throw new TypeError("Derived constructors may only return object or undefined");return Fa(e)}function Fa(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}function Ua(e){return Ua=Object.setPrototypeOf?Object.getPrototypeOf:function(e){return e.__proto__||Object.getPrototypeOf(e)},Ua(e)}function Wa(e,n,t){return n in e?Object.defineProperty(e,n,{value:t,enumerable:!0,configurable:!0,writable:!0}):e[n]=t,e}Ta.propTypes={id:o().string.isRequired,children:o().oneOfType([o().node,o().func])};var Ha=function(e){return e.stopPropagation()},Ga=function(e){return"string"==typeof e?document.querySelector("[data-portaltarget=".concat(e,"]")):e},qa=function(t){!function(e,n){if("function"!=typeof n&&null!==n)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(n&&n.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),n&&Da(e,n)}(c,t);var r,o,i,l=Na(c);function c(){var e;Ra(this,c);for(var n=arguments.length,t=new Array(n),r=0;r<n;r++)t[r]=arguments[r];return Wa(Fa(e=l.call.apply(l,[this].concat(t))),"state",{display:va}),Wa(Fa(e),"listeners",new Ze),Wa(Fa(e),"redrawScheduler",Ue(!0)),Wa(Fa(e),"uid",Fe("popup-")),Wa(Fa(e),"calculateDisplay",(function(n){return za(za({},n),{},{display:e.props.hidden?va:Aa})})),Wa(Fa(e),"portalRef",(function(n){e.node=n,e.parent=n&&n.parentElement,n&&e.getContainer()&&e._redraw()})),Wa(Fa(e),"popupRef",(function(n){e.popup=n,e._redraw()})),Wa(Fa(e),"containerRef",(function(n){e.container=n})),Wa(Fa(e),"_updateDirection",(function(n){e.state.direction!==n&&(e.setState({direction:n}),e.props.onDirectionChange&&e.props.onDirectionChange(n))})),Wa(Fa(e),"_updatePosition",(function(){if(e.popup){if(e.popup.style.position="absolute",e.isVisible()){var n=e.position(),t=n.styles,r=n.direction;Object.keys(t).forEach((function(n){var r=t[n];e.popup.style[n]="number"==typeof r?"".concat(r,"px"):r.toString()})),e._updateDirection(r)}e.setState(e.calculateDisplay)}})),Wa(Fa(e),"_redraw",(function(){e.isVisible()&&e.redrawScheduler(e._updatePosition)})),Wa(Fa(e),"_onEscPress",(function(n){e.props.onEscPress(n),e._onCloseAttempt(n,!0)})),Wa(Fa(e),"_onDocumentClick",(function(n){e.container&&e.container.contains(n.target)||!e._listenersEnabled||e.props.dontCloseOnAnchorClick&&e._getAnchor()&&e._getAnchor().contains(n.target)||(e.props.onOutsideClick(n),e._onCloseAttempt(n,!1))})),Wa(Fa(e),"shortcutsScope",e.uid),Wa(Fa(e),"shortcutsMap",{esc:e._onEscPress}),e}return r=c,o=[{key:"componentDidMount",value:function(){this.props.client||this.setState({client:!0}),this.props.hidden||this._setListenersEnabled(!0)}},{key:"componentDidUpdate",value:function(e,n){var t=this.props.hidden;this.props!==e&&(e.hidden!==t&&this._setListenersEnabled(!t),this._redraw()),!this.props.onShow||t||this.state.display!==Aa||!e.hidden&&n.display===Aa||this.props.onShow()}},{key:"componentWillUnmount",value:function(){this._setListenersEnabled(!1),this.popup=null}},{key:"shouldUseShortcuts",value:function(){var e=this.props,n=e.shortcuts,t=e.hidden;return n&&!t}},{key:"getContainer",value:function(){var e=this.props.target||this.ringPopupTarget;return e&&Ga(e)}},{key:"position",value:function(){var e=this,n=Ea.reduce((function(n,t){return n[t]=e.props[t],n}),{}),t=this.getContainer();return wa(za({popup:this.popup,container:t&&"static"!==Ge(t).position?t:null,anchor:this._getAnchor()},n))}},{key:"_getAnchor",value:function(){return this.props.anchorElement||this.parent}},{key:"_setListenersEnabled",value:function(e){var n=this;!e||this._listenersEnabled?!e&&this._listenersEnabled&&(this.listeners.removeAll(),this._listenersEnabled=!1):setTimeout((function(){n._listenersEnabled=!0,n.listeners.add(window,"resize",n._redraw),n.listeners.add(window,"scroll",n._redraw),n.listeners.add(document,"pointerdown",n._onDocumentClick,!0);for(var e=n._getAnchor();e;)n.listeners.add(e,"scroll",n._redraw),e=e.parentElement}),0)}},{key:"isVisible",value:function(){return!this.props.hidden}},{key:"_onCloseAttempt",value:function(e,n){this.props.onCloseAttempt(e,n)}},{key:"getInternalContent",value:function(){var n=this.props,t=n.trapFocus,r=n.autoFocusFirst,o=n.children;return t?e.createElement(sa,{autoFocusFirst:r,focusBackOnExit:!0},o):o}},{key:"render",value:function(){var t,r=this,o=this.props,i=o.className,l=o.style,c=o.hidden,u=o.attached,s=o.keepMounted,f=o.client,p=o.onMouseDown,d=o.onMouseUp,h=o.onMouseOver,g=o.onMouseOut,v=o.onContextMenu,A=o["data-test"],b=this.state.display===va,m=a()(i,ka().popup,(Wa(t={},ka().attached,u),Wa(t,ka().hidden,c),Wa(t,ka().showing,b),t)),y=(this.state.direction||"").toLowerCase().replace(/[_]/g,"-");return e.createElement(Ia.Consumer,null,(function(t){return r.ringPopupTarget=t,e.createElement("span",{onClick:Ha,role:"presentation",ref:r.portalRef},r.shouldUseShortcuts()&&e.createElement(An,{map:r.shortcutsMap,scope:r.shortcutsScope}),(f||r.state.client)&&(s||!c)&&(0,n.createPortal)(e.createElement(Ta,{id:r.uid,ref:r.containerRef,onMouseOver:h,onFocus:h,onMouseOut:g,onBlur:g,onContextMenu:v},e.createElement("div",{"data-test":Ne("ring-popup",A),"data-test-shown":!c&&!b,"data-test-direction":y,ref:r.popupRef,className:m,style:l,onMouseDown:p,onMouseUp:d,role:"presentation"},r.getInternalContent())),r.getContainer()||document.body))}))}}],o&&Ma(r.prototype,o),i&&Ma(r,i),c}(e.PureComponent);Wa(qa,"propTypes",{anchorElement:o().instanceOf(Node),target:o().oneOfType([o().string,o().instanceOf(Element)]),className:o().string,style:o().object,hidden:o().bool.isRequired,onOutsideClick:o().func,onEscPress:o().func,onCloseAttempt:o().func,children:o().node.isRequired,dontCloseOnAnchorClick:o().bool,shortcuts:o().bool,keepMounted:o().bool,"data-test":o().string,client:o().bool,directions:o().arrayOf(o().string),autoPositioning:o().bool,autoCorrectTopOverflow:o().bool,left:o().number,top:o().number,maxHeight:o().number,minWidth:o().number,sidePadding:o().number,attached:o().bool,onMouseDown:o().func,onMouseUp:o().func,onMouseOver:o().func,onMouseOut:o().func,onContextMenu:o().func,onDirectionChange:o().func,onShow:o().func,trapFocus:o().bool,autoFocusFirst:o().bool}),Wa(qa,"defaultProps",{shortcuts:!0,hidden:!1,onOutsideClick:function(){},onEscPress:function(){},onCloseAttempt:function(){},dontCloseOnAnchorClick:!1,keepMounted:!1,directions:pa,autoPositioning:!0,autoCorrectTopOverflow:!0,left:0,top:0,offset:0,sidePadding:8,attached:!1,trapFocus:!1,autoFocusFirst:!1,legacy:!1}),Wa(qa,"PopupProps",{Directions:fa,Dimension:da,MinWidth:ha,MaxHeight:ga});var Va=t(3068),$a=t.n(Va);function Ka(e){return Ka="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},Ka(e)}var Ya=["theme","size","active","multiline","borderless","compact","label","error","className","inputClassName","children","value","onClear","disabled","inputRef","onChange","enableShortcuts","id","placeholder","icon","renderUnderline"];function Xa(){return Xa=Object.assign||function(e){for(var n=1;n<arguments.length;n++){var t=arguments[n];for(var r in t)Object.prototype.hasOwnProperty.call(t,r)&&(e[r]=t[r])}return e},Xa.apply(this,arguments)}function Za(e,n){if(null==e)return{};var t,r,o=function(e,n){if(null==e)return{};var t,r,o={},i=Object.keys(e);for(r=0;r<i.length;r++)t=i[r],n.indexOf(t)>=0||(o[t]=e[t]);return o}(e,n);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)t=i[r],n.indexOf(t)>=0||Object.prototype.propertyIsEnumerable.call(e,t)&&(o[t]=e[t])}return o}function Qa(e,n){if(!(e instanceof n))throw new TypeError("Cannot call a class as a function")}function Ja(e,n){for(var t=0;t<n.length;t++){var r=n[t];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}function el(e,n){return el=Object.setPrototypeOf||function(e,n){return e.__proto__=n,e},el(e,n)}function nl(e){var n=function(){if("undefined"==typeof Reflect||!Reflect.construct)return!1;if(Reflect.construct.sham)return!1;if("function"==typeof Proxy)return!0;try{return Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){}))),!0}catch(e){return!1}}();return function(){var t,r=ol(e);if(n){var o=ol(this).constructor;t=Reflect.construct(r,arguments,o)}else t=r.apply(this,arguments);return tl(this,t)}}function tl(e,n){if(n&&("object"===Ka(n)||"function"==typeof n))return n;if(void 0!==n)throw new TypeError("Derived constructors may only return object or undefined");return rl(e)}function rl(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}function ol(e){return ol=Object.setPrototypeOf?Object.getPrototypeOf:function(e){return e.__proto__||Object.getPrototypeOf(e)},ol(e)}function il(e,n,t){return n in e?Object.defineProperty(e,n,{value:t,enumerable:!0,configurable:!0,writable:!0}):e[n]=t,e}function al(){}var ll={AUTO:"Auto",S:"S",M:"M",L:"L",FULL:"FULL"},cl=function(n){!function(e,n){if("function"!=typeof n&&null!==n)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(n&&n.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),n&&el(e,n)}(l,n);var t,r,o,i=nl(l);function l(){var e;Qa(this,l);for(var n=arguments.length,t=new Array(n),r=0;r<n;r++)t[r]=arguments[r];return il(rl(e=i.call.apply(i,[this].concat(t))),"state",{empty:!0}),il(rl(e),"id",Fe("ring-input-")),il(rl(e),"underlineRef",(function(n){e.underlineNode=n})),il(rl(e),"inputRef",(function(n){var t=e.props.inputRef;e.input=n,"function"==typeof t?t(n):t.current=n})),il(rl(e),"clear",(function(n){e.props.onClear&&e.props.onClear(n)})),il(rl(e),"handleChange",(function(n){e.props.onChange(n),e.checkValue(n.target)})),e}return t=l,r=[{key:"componentDidMount",value:function(){this.adapt()}},{key:"componentDidUpdate",value:function(){this.adapt()}},{key:"getId",value:function(){return this.props.id||this.id}},{key:"checkValue",value:function(){this.setState({empty:!this.input.value}),this.props.multiline&&this.input.scrollHeight>this.input.clientHeight&&this.stretch(this.input)}},{key:"stretch",value:function(e){e&&e.style&&(e.style.height="".concat(e.scrollHeight,"px"))}},{key:"adapt",value:function(){this.checkValue(),this.stretch(this.underlineNode)}},{key:"render",value:function(){var n,t=this.props,r=t.theme,o=t.size,i=t.active,l=t.multiline,c=t.borderless,u=t.compact,s=t.label,f=t.error,p=t.className,d=t.inputClassName,h=t.children,g=t.value,v=t.onClear,A=t.disabled,b=(t.inputRef,t.onChange,t.enableShortcuts),m=(t.id,t.placeholder),y=t.icon,E=t.renderUnderline,_=Za(t,Ya),C=u||c,w=this.state.empty,x=!!v,k=a()($a().container,p,$a()[r],[$a()["size".concat(o)]],(il(n={"ring-js-shortcuts":!0===b},$a().active,i),il(n,$a().error,null!=f),il(n,$a().empty,w),il(n,$a().noLabel,!this.props.label),il(n,$a().withIcon,null!=y),il(n,$a().clearable,x),il(n,$a().compact,C),n)),S=a()($a().input,d),O=l?"textarea":"input",B=null!=g?g:h;return e.createElement("div",{className:k,"data-test":"ring-input"},y&&e.createElement(br,{glyph:y,className:$a().icon}),e.createElement(O,Xa({ref:this.inputRef,onChange:this.handleChange,className:S,value:B,rows:l?1:null,disabled:A,id:this.getId(),placeholder:m,"aria-label":"string"==typeof s&&s?s:m,"data-enabled-shortcuts":Array.isArray(b)?b.join(","):null},_)),x&&!A&&e.createElement(Li,{title:"Clear input","data-test":"ring-input-clear",className:$a().clear,icon:pi(),onClick:this.clear}),!C&&e.createElement("label",{htmlFor:this.getId(),className:$a().label},s),!c&&e.createElement("div",{className:$a().underline}),!c&&e.createElement("div",{className:$a().focusUnderline}),!C&&e.createElement("div",{className:$a().errorUnderline}),!C&&E(this.underlineRef,f))}}],r&&Ja(t.prototype,r),o&&Ja(t,o),l}(e.PureComponent);il(cl,"propTypes",{value:o().string,theme:o().string,className:o().string,inputClassName:o().string,size:o().string,label:o().oneOfType([o().string,o().object]),active:o().bool,error:o().string,multiline:o().bool,borderless:o().bool,compact:o().bool,onChange:o().func,onClear:o().func,inputRef:o().oneOfType([o().func,o().shape({current:o().instanceOf(HTMLInputElement)})]),children:o().string,enableShortcuts:o().oneOfType([o().bool,o().arrayOf(o().string)]),disabled:o().bool,id:o().string,placeholder:o().string,icon:o().oneOfType([o().string,o().elementType]),renderUnderline:o().func}),il(cl,"defaultProps",{size:ll.M,onChange:al,inputRef:al,enableShortcuts:["esc"],renderUnderline:function(n,t){return e.createElement("div",{className:$a().errorText,ref:n},t)}});const ul=Ei()(cl);function sl(e){return"function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},sl(e)}function fl(e,n){if(!(e instanceof n))throw new TypeError("Cannot call a class as a function")}function pl(e,n){for(var t=0;t<n.length;t++){var r=n[t];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}function dl(e,n,t){return n&&pl(e.prototype,n),t&&pl(e,t),e}function hl(e,n){if("function"!=typeof n&&null!==n)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(n&&n.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),n&&gl(e,n)}function gl(e,n){return Object.setPrototypeOf||function(e,n){return e.__proto__=n,e},gl(e,n)}function vl(e){var n=function(){if("undefined"==typeof Reflect||!Reflect.construct)return!1;if(Reflect.construct.sham)return!1;if("function"==typeof Proxy)return!0;try{return Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){}))),!0}catch(e){return!1}}();return function(){var t,r=ml(e);if(n){var o=ml(this).constructor;Reflect.construct(r,arguments,o)}else r.apply(this,arguments);return Al(this,t)}}function Al(e,n){if(n&&("object"===sl(n)||"function"==typeof n))return n;if(void 0!==n)throw new TypeError("Derived constructors may only return object or undefined");return bl(e)}function bl(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}function ml(e){return Object.setPrototypeOf?Object.getPrototypeOf:function(e){return e.__proto__||Object.getPrototypeOf(e)},ml(e)}function yl(e,n,t){return n in e?Object.defineProperty(e,n,{value:t,enumerable:!0,configurable:!0,writable:!0}):e[n]=t,e}var El="**";function _l(e,n){var t=arguments.length>2&&void 0!==arguments[2]&&arguments[2],r=t?e:e.toLowerCase(),o=t?n:n.toLowerCase(),i=function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:n;return{matched:e,highlight:t}},a=o.length,l=r.length;if(l>a)return i(!1);if(l===a){var c=r===o;return i(c,c?"".concat(El).concat(n).concat(El):n)}var u="",s=!1,f=0;e:for(var p=0;p<l;p++){for(var d=r[p];f<a;){var h=o[f],g=h===d,v=g&&/\S/.test(h);if(v!==s&&(u+=El),u+=n[f++],s=v,g)continue e}return i(!1)}return s&&(u+=El),i(!0,u+=n.slice(f))}var Cl=t(538),wl=t.n(Cl),xl=t(8095),kl=t.n(xl);t(3362);function Sl(e,n){return function(e){if(Array.isArray(e))return e}(e)||function(e,n){var t=null==e?null:"undefined"!=typeof Symbol&&e[Symbol.iterator]||e["@@iterator"];if(null==t)return;var r,o,i=[],a=!0,l=!1;try{for(t=t.call(e);!(a=(r=t.next()).done)&&(i.push(r.value),!n||i.length!==n);a=!0);}catch(e){l=!0,o=e}finally{try{a||null==t.return||t.return()}finally{if(l)throw o}}return i}(e,n)||function(e,n){if(!e)return;if("string"==typeof e)return Ol(e,n);var t=Object.prototype.toString.call(e).slice(8,-1);"Object"===t&&e.constructor&&(t=e.constructor.name);if("Map"===t||"Set"===t)return Array.from(e);if("Arguments"===t||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(t))return Ol(e,n)}(e,n)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function Ol(e,n){(null==n||n>e.length)&&(n=e.length);for(var t=0,r=new Array(n);t<n;t++)r[t]=e[t];return r}const Bl=We((function(e){var n=Sl(e.split(": "),2),t=n[0],r=n[1],o=t.replace(/-(\w)/g,(function(e,n){return n.toUpperCase()})),i=document.createElement("div");return void 0!==i.style[o]&&(!r||(i.style[o]=r,Boolean(i.style[o])))}));function Il(e,n){var t=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);n&&(r=r.filter((function(n){return Object.getOwnPropertyDescriptor(e,n).enumerable}))),t.push.apply(t,r)}return t}function Tl(e){for(var n=1;n<arguments.length;n++){var t=null!=arguments[n]?arguments[n]:{};n%2?Il(Object(t),!0).forEach((function(n){Pl(e,n,t[n])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(t)):Il(Object(t)).forEach((function(n){Object.defineProperty(e,n,Object.getOwnPropertyDescriptor(t,n))}))}return e}function Pl(e,n,t){return n in e?Object.defineProperty(e,n,{value:t,enumerable:!0,configurable:!0,writable:!0}):e[n]=t,e}var jl=We((function(e){var n=e.stops,t=e.size;return Bl("background-image: conic-gradient(white, black)")?"conic-gradient(".concat(n,")"):new ConicGradient({stops:n,size:t})}));var zl=function(e,n,t){var r=jl({stops:n,size:t});return!e.supports&&r instanceof ConicGradient&&Object.defineProperty(r,"svg",{value:r.svg.replace("<image ","\n        ".concat(e.svgDefs,'    \n        <image mask="url(#').concat(e.maskId,')" '))}),Tl(Tl({},e.css),{},{"background-image":r.toString()})};function Rl(e,n){return function(e){if(Array.isArray(e))return e}(e)||function(e,n){var t=null==e?null:"undefined"!=typeof Symbol&&e[Symbol.iterator]||e["@@iterator"];if(null==t)return;var r,o,i=[],a=!0,l=!1;try{for(t=t.call(e);!(a=(r=t.next()).done)&&(i.push(r.value),!n||i.length!==n);a=!0);}catch(e){l=!0,o=e}finally{try{a||null==t.return||t.return()}finally{if(l)throw o}}return i}(e,n)||function(e,n){if(!e)return;if("string"==typeof e)return Ml(e,n);var t=Object.prototype.toString.call(e).slice(8,-1);"Object"===t&&e.constructor&&(t=e.constructor.name);if("Map"===t||"Set"===t)return Array.from(e);if("Arguments"===t||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(t))return Ml(e,n)}(e,n)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function Ml(e,n){(null==n||n>e.length)&&(n=e.length);for(var t=0,r=new Array(n);t<n;t++)r[t]=e[t];return r}var Dl=function(e,n){return t="\n".concat(e," {\n  ").concat(Object.entries(n).map((function(e){var n=Rl(e,2),t=n[0],r=n[1];return"".concat(t,": ").concat(r,";")})).join("\n  "),"\n}"),(r=document.createElement("style")).setAttribute("type","text/css"),r.textContent=t,document.head.appendChild(r),r;var t,r};function Nl(e,n){return function(e){if(Array.isArray(e))return e}(e)||function(e,n){var t=null==e?null:"undefined"!=typeof Symbol&&e[Symbol.iterator]||e["@@iterator"];if(null==t)return;var r,o,i=[],a=!0,l=!1;try{for(t=t.call(e);!(a=(r=t.next()).done)&&(i.push(r.value),!n||i.length!==n);a=!0);}catch(e){l=!0,o=e}finally{try{a||null==t.return||t.return()}finally{if(l)throw o}}return i}(e,n)||function(e,n){if(!e)return;if("string"==typeof e)return Ll(e,n);var t=Object.prototype.toString.call(e).slice(8,-1);"Object"===t&&e.constructor&&(t=e.constructor.name);if("Map"===t||"Set"===t)return Array.from(e);if("Arguments"===t||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(t))return Ll(e,n)}(e,n)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function Ll(e,n){(null==n||n>e.length)&&(n=e.length);for(var t=0,r=new Array(n);t<n;t++)r[t]=e[t];return r}function Fl(e,n,t){return n in e?Object.defineProperty(e,n,{value:t,enumerable:!0,configurable:!0,writable:!0}):e[n]=t,e}var Ul=function(e,n){return"radial-gradient(".concat(e,", ").concat(Object.entries(n).map((function(e){return e.join(" ")})).join(", "),")")};const Wl=We((function(){var e=function(e,n){for(var t=0,r=["","-webkit-"];t<r.length;t++){var o="".concat(r[t],"mask-image"),i="".concat(o,": radial-gradient(black, white)");if(Bl(i))return{supports:!0,css:Fl({},o,Ul(e,n))}}var a=Fe("gradient"),l=Fe("mask");return{supports:!1,css:{},maskId:l,svgDefs:'\n    <svg>\n      <defs>\n        <radialGradient id="'.concat(a,'">\n          ').concat(Object.entries(n).map((function(e){var n=Nl(e,2),t=n[0],r=n[1];return'\n            <stop offset="'.concat(r,'" stop-color="').concat(t,'"/>\n          ')})).join(""),'\n        </radialGradient>\n        <mask id="').concat(l,'">\n          <rect height="100%" width="100%" fill="url(#').concat(a,')"/>\n        </mask>\n      </defs>\n    </svg>\n  ')}}(kl().unit,{transparent:"".concat(71.875,"%"),white:"".concat(78.125,"%")});Dl(".".concat(kl().loader,"_").concat([_i.LIGHT],"::after, .ring-loader-inline::after"),zl(e,"#ff00eb,#bd3bff,#008eff, #58ba00,#f48700,#ff00eb",32)),Dl(".".concat(kl().loader,"_").concat([_i.DARK],"::after, .ring-loader-inline_dark::after"),zl(e,"#ff2eef,#d178ff,#289fff,#88d444,#ffe000,#ff2eef",32))}));function Hl(e){return Hl="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},Hl(e)}var Gl=["className","theme","data-test","children"];function ql(){return ql=Object.assign||function(e){for(var n=1;n<arguments.length;n++){var t=arguments[n];for(var r in t)Object.prototype.hasOwnProperty.call(t,r)&&(e[r]=t[r])}return e},ql.apply(this,arguments)}function Vl(e,n){if(null==e)return{};var t,r,o=function(e,n){if(null==e)return{};var t,r,o={},i=Object.keys(e);for(r=0;r<i.length;r++)t=i[r],n.indexOf(t)>=0||(o[t]=e[t]);return o}(e,n);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)t=i[r],n.indexOf(t)>=0||Object.prototype.propertyIsEnumerable.call(e,t)&&(o[t]=e[t])}return o}function $l(e,n){if(!(e instanceof n))throw new TypeError("Cannot call a class as a function")}function Kl(e,n){for(var t=0;t<n.length;t++){var r=n[t];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}function Yl(e,n){return Yl=Object.setPrototypeOf||function(e,n){return e.__proto__=n,e},Yl(e,n)}function Xl(e){var n=function(){if("undefined"==typeof Reflect||!Reflect.construct)return!1;if(Reflect.construct.sham)return!1;if("function"==typeof Proxy)return!0;try{return Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){}))),!0}catch(e){return!1}}();return function(){var t,r=Ql(e);if(n){var o=Ql(this).constructor;t=Reflect.construct(r,arguments,o)}else t=r.apply(this,arguments);return Zl(this,t)}}function Zl(e,n){if(n&&("object"===Hl(n)||"function"==typeof n))return n;if(void 0!==n)throw new TypeError("Derived constructors may only return object or undefined");return function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e)}function Ql(e){return Ql=Object.setPrototypeOf?Object.getPrototypeOf:function(e){return e.__proto__||Object.getPrototypeOf(e)},Ql(e)}function Jl(e,n,t){return n in e?Object.defineProperty(e,n,{value:t,enumerable:!0,configurable:!0,writable:!0}):e[n]=t,e}var ec=function(n){!function(e,n){if("function"!=typeof n&&null!==n)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(n&&n.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),n&&Yl(e,n)}(l,n);var t,r,o,i=Xl(l);function l(){return $l(this,l),i.apply(this,arguments)}return t=l,(r=[{key:"componentDidMount",value:function(){Wl()}},{key:"render",value:function(){var n=this.props,t=n.className,r=n.theme,o=n["data-test"],i=n.children,l=Vl(n,Gl),c=a()(kl().loader,t,"".concat(kl().loader,"_").concat(r)),u=e.createElement("div",ql({},l,{"data-test":Ne("ring-loader-inline",o),className:c}));return i?e.createElement(e.Fragment,null,u,e.createElement("span",{className:kl().children},i)):u}}])&&Kl(t.prototype,r),o&&Kl(t,o),l}(e.PureComponent);Jl(ec,"propTypes",{theme:o().oneOf(Object.values(_i)),className:o().string,"data-test":o().string,children:o().node}),Jl(ec,"Theme",_i);const nc=Ei()(ec);function tc(e){return tc="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},tc(e)}var rc=["rgShortcutsOptions","rgShortcutsMap"];function oc(e,n){if(null==e)return{};var t,r,o=function(e,n){if(null==e)return{};var t,r,o={},i=Object.keys(e);for(r=0;r<i.length;r++)t=i[r],n.indexOf(t)>=0||(o[t]=e[t]);return o}(e,n);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)t=i[r],n.indexOf(t)>=0||Object.prototype.propertyIsEnumerable.call(e,t)&&(o[t]=e[t])}return o}function ic(e,n){if(!(e instanceof n))throw new TypeError("Cannot call a class as a function")}function ac(e,n){for(var t=0;t<n.length;t++){var r=n[t];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}function lc(e,n){return lc=Object.setPrototypeOf||function(e,n){return e.__proto__=n,e},lc(e,n)}function cc(e){var n=function(){if("undefined"==typeof Reflect||!Reflect.construct)return!1;if(Reflect.construct.sham)return!1;if("function"==typeof Proxy)return!0;try{return Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){}))),!0}catch(e){return!1}}();return function(){var t,r=fc(e);if(n){var o=fc(this).constructor;t=Reflect.construct(r,arguments,o)}else t=r.apply(this,arguments);return uc(this,t)}}function uc(e,n){if(n&&("object"===tc(n)||"function"==typeof n))return n;if(void 0!==n)throw new TypeError("Derived constructors may only return object or undefined");return sc(e)}function sc(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}function fc(e){return fc=Object.setPrototypeOf?Object.getPrototypeOf:function(e){return e.__proto__||Object.getPrototypeOf(e)},fc(e)}function pc(e,n,t){return n in e?Object.defineProperty(e,n,{value:t,enumerable:!0,configurable:!0,writable:!0}):e[n]=t,e}var dc=t(2593),hc=t.n(dc);function gc(e){return gc="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},gc(e)}function vc(){return vc=Object.assign||function(e){for(var n=1;n<arguments.length;n++){var t=arguments[n];for(var r in t)Object.prototype.hasOwnProperty.call(t,r)&&(e[r]=t[r])}return e},vc.apply(this,arguments)}function Ac(e,n){if(!(e instanceof n))throw new TypeError("Cannot call a class as a function")}function bc(e,n){for(var t=0;t<n.length;t++){var r=n[t];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}function mc(e,n){return mc=Object.setPrototypeOf||function(e,n){return e.__proto__=n,e},mc(e,n)}function yc(e){var n=function(){if("undefined"==typeof Reflect||!Reflect.construct)return!1;if(Reflect.construct.sham)return!1;if("function"==typeof Proxy)return!0;try{return Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){}))),!0}catch(e){return!1}}();return function(){var t,r=Cc(e);if(n){var o=Cc(this).constructor;t=Reflect.construct(r,arguments,o)}else t=r.apply(this,arguments);return Ec(this,t)}}function Ec(e,n){if(n&&("object"===gc(n)||"function"==typeof n))return n;if(void 0!==n)throw new TypeError("Derived constructors may only return object or undefined");return _c(e)}function _c(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}function Cc(e){return Cc=Object.setPrototypeOf?Object.getPrototypeOf:function(e){return e.__proto__||Object.getPrototypeOf(e)},Cc(e)}function wc(e,n,t){return n in e?Object.defineProperty(e,n,{value:t,enumerable:!0,configurable:!0,writable:!0}):e[n]=t,e}var xc=function(n){!function(e,n){if("function"!=typeof n&&null!==n)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(n&&n.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),n&&mc(e,n)}(l,n);var t,r,o,i=yc(l);function l(){var e;Ac(this,l);for(var n=arguments.length,t=new Array(n),r=0;r<n;r++)t[r]=arguments[r];return wc(_c(e=i.call.apply(i,[this].concat(t))),"state",{focused:!1}),wc(_c(e),"onDocumentClick",(function(n){e.tagNode&&e.setState({focused:e.tagNode===n.target})})),wc(_c(e),"tagRef",(function(n){e.tagNode=n})),e}return t=l,(r=[{key:"componentDidUpdate",value:function(e){this.props.focused!==e.focused&&this.setState({focused:this.props.focused}),this.state.focused&&this.tagNode.focus(),this.setDocumentClickListener(this.state.focused)}},{key:"componentWillUnmount",value:function(){this.setDocumentClickListener(!1),this.setState({focused:!1})}},{key:"setDocumentClickListener",value:function(e){e?document.addEventListener("click",this.onDocumentClick):document.removeEventListener("click",this.onDocumentClick)}},{key:"renderCustomIcon",value:function(){return this.props.rgTagIcon?e.createElement(br,{className:hc().icon,title:this.props.rgTagTitle,glyph:this.props.rgTagIcon}):null}},{key:"_renderImageElement",value:function(n){var t,r=a()((wc(t={},hc().customIcon,this.props.icon),wc(t,hc().avatarIcon,n),t));return e.createElement("img",{alt:n?"Avatar":"Icon",className:r,src:n||this.props.icon})}},{key:"renderImage",value:function(){return this.props.icon&&!this.props.avatar?this._renderImageElement():null}},{key:"renderAvatar",value:function(){return this.props.avatar?e.createElement("span",{className:hc().avatarContainer},this._renderImageElement(this.props.avatar)):null}},{key:"renderRemoveIcon",value:function(){return this.props.readOnly?null:e.createElement(Li,{title:"Remove",icon:pi(),"data-test":"ring-tag-remove",className:hc().remove,iconClassName:hc().removeIcon,onClick:this.props.onRemove,style:{"--ring-icon-secondary-color":this.props.textColor}})}},{key:"render",value:function(){var n,t=a()("ring-js-shortcuts",hc().tag,(wc(n={},hc().focused,this.state.focused),wc(n,hc().disabled,this.props.disabled),wc(n,hc().tagAngled,this.props.angled),wc(n,hc().withRemove,!this.props.readOnly),n),this.props.className),r=this.props,o=r.backgroundColor,i=r.textColor,l=r.render;return e.createElement("span",{className:hc().container},l({"data-test":"ring-tag",className:t,ref:this.tagRef,onClick:this.props.onClick,style:{backgroundColor:o,color:i},children:e.createElement(e.Fragment,null,this.renderAvatar(),this.renderCustomIcon(),this.renderImage(),e.createElement("span",{className:hc().content},this.props.children))}),this.renderRemoveIcon())}}])&&bc(t.prototype,r),o&&bc(t,o),l}(e.PureComponent);function kc(e){return kc="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},kc(e)}wc(xc,"propTypes",{onRemove:o().func,onClick:o().func,rgTagIcon:o().oneOfType([o().string,o().elementType]),icon:o().string,avatar:o().string,rgTagTitle:o().string,readOnly:o().bool,disabled:o().bool,focused:o().bool,angled:o().bool,backgroundColor:o().string,textColor:o().string,children:o().node,className:o().string,render:o().func}),wc(xc,"defaultProps",{onRemove:function(){},onClick:function(){},readOnly:!1,disabled:!1,focused:!1,render:function(n){return e.createElement("button",vc({type:"button"},n))}});var Sc=["children","className","customTagComponent","canNotBeEmpty","handleClick","tagClassName","handleRemove","tags","activeIndex"];function Oc(e,n){if(null==e)return{};var t,r,o=function(e,n){if(null==e)return{};var t,r,o={},i=Object.keys(e);for(r=0;r<i.length;r++)t=i[r],n.indexOf(t)>=0||(o[t]=e[t]);return o}(e,n);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)t=i[r],n.indexOf(t)>=0||Object.prototype.propertyIsEnumerable.call(e,t)&&(o[t]=e[t])}return o}function Bc(){return Bc=Object.assign||function(e){for(var n=1;n<arguments.length;n++){var t=arguments[n];for(var r in t)Object.prototype.hasOwnProperty.call(t,r)&&(e[r]=t[r])}return e},Bc.apply(this,arguments)}function Ic(e,n){if(!(e instanceof n))throw new TypeError("Cannot call a class as a function")}function Tc(e,n){for(var t=0;t<n.length;t++){var r=n[t];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}function Pc(e,n){return Pc=Object.setPrototypeOf||function(e,n){return e.__proto__=n,e},Pc(e,n)}function jc(e){var n=function(){if("undefined"==typeof Reflect||!Reflect.construct)return!1;if(Reflect.construct.sham)return!1;if("function"==typeof Proxy)return!0;try{return Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){}))),!0}catch(e){return!1}}();return function(){var t,r=Rc(e);if(n){var o=Rc(this).constructor;t=Reflect.construct(r,arguments,o)}else t=r.apply(this,arguments);return zc(this,t)}}function zc(e,n){if(n&&("object"===kc(n)||"function"==typeof n))return n;if(void 0!==n)throw new TypeError("Derived constructors may only return object or undefined");return function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e)}function Rc(e){return Rc=Object.setPrototypeOf?Object.getPrototypeOf:function(e){return e.__proto__||Object.getPrototypeOf(e)},Rc(e)}function Mc(e,n,t){return n in e?Object.defineProperty(e,n,{value:t,enumerable:!0,configurable:!0,writable:!0}):e[n]=t,e}function Dc(){}var Nc=function(n){!function(e,n){if("function"!=typeof n&&null!==n)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(n&&n.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),n&&Pc(e,n)}(l,n);var t,r,o,i=jc(l);function l(){return Ic(this,l),i.apply(this,arguments)}return t=l,r=[{key:"renderTag",value:function(n,t){var r=this.props.customTagComponent||xc,o=this.props.disabled||n.readOnly||this.props.canNotBeEmpty&&1===this.props.tags.length,i=this.props.tagClassName;return e.createElement(r,Bc({},n,{readOnly:o,disabled:this.props.disabled||n.disabled,focused:t,onClick:this.props.handleClick(n),onRemove:this.props.handleRemove(n),className:i}),n.label)}},{key:"render",value:function(){var n=this,t=this.props,r=t.children,o=t.className,i=(t.customTagComponent,t.canNotBeEmpty,t.handleClick,t.tagClassName,t.handleRemove,t.tags,t.activeIndex,Oc(t,Sc)),l=a()("ring-js-shortcuts",o),c=(this.props.tags||[]).map((function(e,t){return n.renderTag(e,n.props.activeIndex===t)}));return e.createElement("div",Bc({"data-test":"ring-tags-list",className:l},i),c,r)}}],r&&Tc(t.prototype,r),o&&Tc(t,o),l}(e.Component);function Lc(e,n){for(var t=0;t<n.length;t++){var r=n[t];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}Mc(Nc,"propTypes",{children:o().node,tags:o().array,customTagComponent:function(n,t,r){return n[t]&&!n[t].prototype instanceof e.Component?new Error("Invalid prop ".concat(t," supplied to ").concat(r,". Validation failed.")):null},activeIndex:o().number,canNotBeEmpty:o().bool,disabled:o().bool,handleClick:o().func,handleRemove:o().func,className:o().string,tagClassName:o().string}),Mc(Nc,"defaultProps",{customTagComponent:null,canNotBeEmpty:!1,disabled:!1,handleClick:Dc,handleRemove:Dc});var Fc=function(){function e(n){!function(e,n){if(!(e instanceof n))throw new TypeError("Cannot call a class as a function")}(this,e),this.target=n}var n,t,r;return n=e,t=[{key:"isContentEditable",value:function(){return"true"===this.target.contentEditable}},{key:"focus",value:function(){document.activeElement&&document.activeElement===this.target||this.target.focus()}},{key:"getAbsolutePosition",value:function(e){for(var n=e,t=0;n!==this.target;){for(;n.previousSibling;)t+=n.previousSibling.textContent.length,n=n.previousSibling;n=n.parentNode}return t}},{key:"getPosition",value:function(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{};if(this.isContentEditable()){e.avoidFocus||this.focus();var n=window.getSelection();if(!n.rangeCount)return 0;var t=n.getRangeAt(0),r=t.cloneRange();r.selectNodeContents(this.target),r.setEnd(t.endContainer,t.endOffset);var o=t.startContainer;if(this.target===o)return 0===t.startOffset?0:o.textContent.length;if(!this.target.contains(o))return-1;if(!o)return this.target.selectionStart;var i=this.getAbsolutePosition(o);if(t.startContainer===t.endContainer)return t.startOffset===t.endOffset?i+t.startOffset:{startOffset:i+t.startOffset,endOffset:i+t.endOffset,position:r.toString().length};var a=i+t.startOffset,l=this.getAbsolutePosition(t.endContainer),c=l+t.endOffset;return{startOffset:a,endOffset:c,position:r.toString().length}}return this.target.selectionStart}},{key:"getRelativePosition",value:function(e,n){var t=0,r=e;if(!r)return{_curNode:this.target,_correctedPosition:n};if(0===n){for(;3!==r.nodeType;)r=r.childNodes[0];return{_curNode:r,_correctedPosition:n}}var o=-1;if(r&&void 0!==r.nodeType)for(;t<n&&3!==r.nodeType&&(o++,null!==r.childNodes[o]&&r.childNodes[o]);)(t+=r.childNodes[o].textContent.length)>=n&&(t-=(r=r.childNodes[o]).textContent.length,o=-1);return{_curNode:r,_correctedPosition:n-t}}},{key:"setPosition",value:function(e){var n,t=this.isContentEditable(),r=this.target&&this.target.childNodes[0];if(void 0!==e)if(void 0!==e.startOffset){var o=new Range,i=this.getRelativePosition(r,e.startOffset);o.setStart(i._curNode,i._correctedPosition);var a=this.getRelativePosition(r,e.endOffset);o.setEnd(a._curNode,a._correctedPosition),n=o}else if(-1===e)n=(t?this.target.textContent:this.constructor.normalizeNewlines(this.target.value)).length;else{var l=this.getRelativePosition(r,e);r=l._curNode,n=l._correctedPosition}if(t){this.focus();try{n instanceof Range?(window.getSelection().removeAllRanges(),window.getSelection().addRange(n)):window.getSelection().collapse(r||this.target,n)}catch(e){}}else this.target.setSelectionRange(n,n);return n}},{key:"getOffset",value:function(){var e,n=0;try{(e=window.getSelection().getRangeAt(0).cloneRange()).setStart(e.startContainer,e.startOffset-1)}catch(e){return n}return e&&0!==e.endOffset&&""!==e.toString()&&(n=$e(e).right-$e(this.target).left-(e.startContainer.offsetLeft||0)),n}}],r=[{key:"normalizeNewlines",value:function(e){return"string"==typeof e?e.replace(this.returnRE,""):e}}],t&&Lc(n.prototype,t),r&&Lc(n,r),e}();!function(e,n,t){n in e?Object.defineProperty(e,n,{value:t,enumerable:!0,configurable:!0,writable:!0}):e[n]=t}(Fc,"returnRE",/\r/g);var Uc=t(3833),Wc=t.n(Uc);function Hc(e){return Hc="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},Hc(e)}var Gc=["children","className","info"];function qc(){return qc=Object.assign||function(e){for(var n=1;n<arguments.length;n++){var t=arguments[n];for(var r in t)Object.prototype.hasOwnProperty.call(t,r)&&(e[r]=t[r])}return e},qc.apply(this,arguments)}function Vc(e,n){if(null==e)return{};var t,r,o=function(e,n){if(null==e)return{};var t,r,o={},i=Object.keys(e);for(r=0;r<i.length;r++)t=i[r],n.indexOf(t)>=0||(o[t]=e[t]);return o}(e,n);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)t=i[r],n.indexOf(t)>=0||Object.prototype.propertyIsEnumerable.call(e,t)&&(o[t]=e[t])}return o}function $c(e,n){if(!(e instanceof n))throw new TypeError("Cannot call a class as a function")}function Kc(e,n){for(var t=0;t<n.length;t++){var r=n[t];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}function Yc(e,n){return Yc=Object.setPrototypeOf||function(e,n){return e.__proto__=n,e},Yc(e,n)}function Xc(e){var n=function(){if("undefined"==typeof Reflect||!Reflect.construct)return!1;if(Reflect.construct.sham)return!1;if("function"==typeof Proxy)return!0;try{return Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){}))),!0}catch(e){return!1}}();return function(){var t,r=Qc(e);if(n){var o=Qc(this).constructor;t=Reflect.construct(r,arguments,o)}else t=r.apply(this,arguments);return Zc(this,t)}}function Zc(e,n){if(n&&("object"===Hc(n)||"function"==typeof n))return n;if(void 0!==n)throw new TypeError("Derived constructors may only return object or undefined");return function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e)}function Qc(e){return Qc=Object.setPrototypeOf?Object.getPrototypeOf:function(e){return e.__proto__||Object.getPrototypeOf(e)},Qc(e)}function Jc(e,n,t){return n in e?Object.defineProperty(e,n,{value:t,enumerable:!0,configurable:!0,writable:!0}):e[n]=t,e}var eu=function(n){!function(e,n){if("function"!=typeof n&&null!==n)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(n&&n.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),n&&Yc(e,n)}(l,n);var t,r,o,i=Xc(l);function l(){return $c(this,l),i.apply(this,arguments)}return t=l,(r=[{key:"render",value:function(){var n=this.props,t=n.children,r=n.className,o=n.info,i=Vc(n,Gc),l=a()(Wc().text,r,Jc({},Wc().info,o));return e.createElement("span",qc({className:l},i),t)}}])&&Kc(t.prototype,r),o&&Kc(t,o),l}(e.Component);Jc(eu,"propTypes",{children:o().node,info:o().bool,className:o().string});var nu=t(6017),tu=t.n(nu);function ru(e){return ru="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},ru(e)}var ou=["className","listId"];function iu(){return iu=Object.assign||function(e){for(var n=1;n<arguments.length;n++){var t=arguments[n];for(var r in t)Object.prototype.hasOwnProperty.call(t,r)&&(e[r]=t[r])}return e},iu.apply(this,arguments)}function au(e,n){if(null==e)return{};var t,r,o=function(e,n){if(null==e)return{};var t,r,o={},i=Object.keys(e);for(r=0;r<i.length;r++)t=i[r],n.indexOf(t)>=0||(o[t]=e[t]);return o}(e,n);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)t=i[r],n.indexOf(t)>=0||Object.prototype.propertyIsEnumerable.call(e,t)&&(o[t]=e[t])}return o}function lu(e,n){if(!(e instanceof n))throw new TypeError("Cannot call a class as a function")}function cu(e,n){for(var t=0;t<n.length;t++){var r=n[t];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}function uu(e,n){return uu=Object.setPrototypeOf||function(e,n){return e.__proto__=n,e},uu(e,n)}function su(e){var n=function(){if("undefined"==typeof Reflect||!Reflect.construct)return!1;if(Reflect.construct.sham)return!1;if("function"==typeof Proxy)return!0;try{return Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){}))),!0}catch(e){return!1}}();return function(){var t,r=du(e);if(n){var o=du(this).constructor;t=Reflect.construct(r,arguments,o)}else t=r.apply(this,arguments);return fu(this,t)}}function fu(e,n){if(n&&("object"===ru(n)||"function"==typeof n))return n;if(void 0!==n)throw new TypeError("Derived constructors may only return object or undefined");return pu(e)}function pu(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}function du(e){return du=Object.setPrototypeOf?Object.getPrototypeOf:function(e){return e.__proto__||Object.getPrototypeOf(e)},du(e)}function hu(e,n,t){return n in e?Object.defineProperty(e,n,{value:t,enumerable:!0,configurable:!0,writable:!0}):e[n]=t,e}var gu=function(n){!function(e,n){if("function"!=typeof n&&null!==n)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(n&&n.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),n&&uu(e,n)}(l,n);var t,r,o,i=su(l);function l(){var e;lu(this,l);for(var n=arguments.length,t=new Array(n),r=0;r<n;r++)t[r]=arguments[r];return hu(pu(e=i.call.apply(i,[this].concat(t))),"inputRef",(function(n){e.input=n,e.props.inputRef(n)})),e}return t=l,r=[{key:"componentWillUnmount",value:function(){this.blur()}},{key:"focus",value:function(){var e=this.input;e&&e!==document.activeElement&&("firefox"===tn.browser.name?e.select():e.focus())}},{key:"blur",value:function(){this.input&&this.input===document.activeElement&&this.input.blur()}},{key:"render",value:function(){var n=this,t=this.props,r=t.className,o=t.listId,i=au(t,ou),l=a()(tu().filter,r);return e.createElement(li.ValueContext.Consumer,null,(function(t){return e.createElement(ul,iu({},i,{"aria-owns":o,"aria-activedescendant":t,autoComplete:"off",autoFocus:!0,borderless:!0,inputRef:n.inputRef,className:l}))}))}}],r&&cu(t.prototype,r),o&&cu(t,o),l}(e.Component);function vu(e){return vu="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},vu(e)}function Au(e,n){if(!(e instanceof n))throw new TypeError("Cannot call a class as a function")}function bu(e,n){for(var t=0;t<n.length;t++){var r=n[t];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}function mu(e,n){return mu=Object.setPrototypeOf||function(e,n){return e.__proto__=n,e},mu(e,n)}function yu(e){var n=function(){if("undefined"==typeof Reflect||!Reflect.construct)return!1;if(Reflect.construct.sham)return!1;if("function"==typeof Proxy)return!0;try{return Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){}))),!0}catch(e){return!1}}();return function(){var t,r=Cu(e);if(n){var o=Cu(this).constructor;t=Reflect.construct(r,arguments,o)}else t=r.apply(this,arguments);return Eu(this,t)}}function Eu(e,n){if(n&&("object"===vu(n)||"function"==typeof n))return n;if(void 0!==n)throw new TypeError("Derived constructors may only return object or undefined");return _u(e)}function _u(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}function Cu(e){return Cu=Object.setPrototypeOf?Object.getPrototypeOf:function(e){return e.__proto__||Object.getPrototypeOf(e)},Cu(e)}function wu(e,n,t){return n in e?Object.defineProperty(e,n,{value:t,enumerable:!0,configurable:!0,writable:!0}):e[n]=t,e}hu(gu,"propTypes",{placeholder:o().string,className:o().string,inputRef:o().func,listId:o().string,activeItemId:o().string}),hu(gu,"defaultProps",{placeholder:"Filter items",inputRef:function(){}});function xu(){}var ku=function(n){var t,r;return r=t=function(t){!function(e,n){if("function"!=typeof n&&null!==n)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(n&&n.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),n&&lc(e,n)}(l,t);var r,o,i,a=cc(l);function l(){var e;ic(this,l);for(var n=arguments.length,t=new Array(n),r=0;r<n;r++)t[r]=arguments[r];return pc(sc(e=a.call.apply(a,[this].concat(t))),"_shortcutsScopeUid",Fe("rg-shortcuts-")),e}return r=l,(o=[{key:"render",value:function(){var t=this.props,r=t.rgShortcutsOptions,o=t.rgShortcutsMap,i=oc(t,rc);return e.createElement(An,{scope:this._shortcutsScopeUid,map:o,options:r,disabled:r.disabled},e.createElement(n,i))}}])&&ac(r.prototype,o),i&&ac(r,i),l}(e.Component),pc(t,"propTypes",{rgShortcutsOptions:o().object,rgShortcutsMap:o().object}),r}(gu),Su=function(n){!function(e,n){if("function"!=typeof n&&null!==n)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(n&&n.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),n&&mu(e,n)}(l,n);var t,r,o,i=yu(l);function l(){var n;Au(this,l);for(var t=arguments.length,r=new Array(t),o=0;o<t;o++)r[o]=arguments[o];return wu(_u(n=i.call.apply(i,[this].concat(r))),"state",{popupFilterShortcutsOptions:{modal:!0,disabled:!0},tagsActiveIndex:null}),wu(_u(n),"isClickingPopup",!1),wu(_u(n),"onFilterFocus",(function(){n._togglePopupFilterShortcuts(!1),n.setState({tagsActiveIndex:null})})),wu(_u(n),"popupFilterOnBlur",(function(){null===n.state.tagsActiveIndex&&n._togglePopupFilterShortcuts(!0)})),wu(_u(n),"mouseDownHandler",(function(){n.isClickingPopup=!0})),wu(_u(n),"mouseUpHandler",(function(){n.isClickingPopup=!1})),wu(_u(n),"onListSelect",(function(e,t,r){var o;n.props.onSelect(e,(document.createEvent&&(o=document.createEvent("Event")).initEvent("select",!0,!1),t&&t.persist&&t.persist(),o.originalEvent=t,o),r)})),wu(_u(n),"tabPress",(function(e){n.props.onCloseAttempt(e,!0)})),wu(_u(n),"onClickHandler",(function(){return n.filter.focus()})),wu(_u(n),"handleRemoveTag",We((function(e){return function(t){return n.removeTag(e,t)}}))),wu(_u(n),"handleTagClick",We((function(e){return function(){n.setState({tagsActiveIndex:n.props.selected.indexOf(e)})}}))),wu(_u(n),"handleListResize",(function(){n.forceUpdate()})),wu(_u(n),"handleSelectAll",(function(){return n.props.onSelectAll(n.props.data.filter((function(e){return!e.disabled})).length!==n.props.selected.length)})),wu(_u(n),"getSelectAll",(function(){var t=n.props.data.filter((function(e){return!e.disabled}));return e.createElement("div",{className:tu().selectAll},0===t.length?e.createElement("span",null):e.createElement(Li,{text:!0,inline:!0,onClick:n.handleSelectAll},t.length!==n.props.selected.length?"Select all":"Deselect all"),e.createElement(eu,{info:!0},"".concat(n.props.selected.length," selected")))})),wu(_u(n),"_adjustListMaxHeight",Te((function(e,t,r){if(e)return t;var o=n.props.directions||pa,i=n.props.anchorElement,a=Ga(r)||document.documentElement;return Math.min(o.reduce((function(e,n){return Math.max(e,Ca(n,i,"static"!==Ge(a).position?a:null))}),100),t)}))),wu(_u(n),"popupRef",(function(e){n.popup=e})),wu(_u(n),"listRef",(function(e){n.list=e})),wu(_u(n),"filterRef",(function(e){n.filter=e,n.caret=new Fc(n.filter)})),wu(_u(n),"shortcutsScope",Fe("select-popup-")),wu(_u(n),"shortcutsMap",{tab:n.tabPress}),wu(_u(n),"popupFilterShortcuts",{map:{up:function(e){return n.list&&n.list.upHandler(e)},down:function(e){return n.list&&n.list.downHandler(e)},home:function(e){return n.list&&n.list.homeHandler(e)},end:function(e){return n.list&&n.list.endHandler(e)},enter:function(e){return n.list?n.list.enterHandler(e):n.props.onEmptyPopupEnter(e)},esc:function(e){return n.props.onCloseAttempt(e,!0)},tab:function(e){return n.tabPress(e)},backspace:function(e){return n.handleBackspace(e)},del:function(){return n.removeSelectedTag()},left:function(){return n.handleNavigation(!0)},right:function(){return n.handleNavigation()}}}),n}return t=l,r=[{key:"componentDidMount",value:function(){window.document.addEventListener("mouseup",this.mouseUpHandler)}},{key:"componentWillUnmount",value:function(){window.document.removeEventListener("mouseup",this.mouseUpHandler)}},{key:"focusFilter",value:function(){var e=this;setTimeout((function(){return e.filter.focus()}))}},{key:"isEventTargetFilter",value:function(e){return e.target&&e.target.matches("input,textarea")}},{key:"handleNavigation",value:function(e){if(!(this.isEventTargetFilter(event)&&this.caret.getPosition()>0)){var n=null;e?n=null===this.state.tagsActiveIndex?this.props.selected.length-1:this.state.tagsActiveIndex-1:null!==this.state.tagsActiveIndex&&(n=this.state.tagsActiveIndex+1),null!==n&&(n>=this.props.selected.length||n<0)&&(n=null,this.focusFilter()),this.setState({tagsActiveIndex:n})}}},{key:"removeTag",value:function(e,n){var t=e||this.props.selected.slice(0)[this.props.selected.length-1];t&&(this.onListSelect(t,n,{tryKeepOpen:!0}),this.setState({tagsActiveIndex:null}),this.focusFilter())}},{key:"removeSelectedTag",value:function(){return null==this.state.tagsActiveIndex||(this.removeTag(this.props.selected[this.state.tagsActiveIndex]),!1)}},{key:"handleBackspace",value:function(e){return!(this.props.tags&&(this.isEventTargetFilter(e)?!e.target.value&&(this.removeTag(),1):(this.removeSelectedTag(),1)))}},{key:"_togglePopupFilterShortcuts",value:function(e){this.setState({popupFilterShortcutsOptions:{modal:!0,disabled:e}})}},{key:"isVisible",value:function(){return this.popup&&this.popup.isVisible()}},{key:"getFilter",value:function(){return this.props.filter||this.props.tags?e.createElement("div",{className:tu().filterWrapper,"data-test":"ring-select-popup-filter"},e.createElement(br,{glyph:wl(),className:tu().filterIcon,"data-test-custom":"ring-select-popup-filter-icon"}),e.createElement(ku,{rgShortcutsOptions:this.state.popupFilterShortcutsOptions,rgShortcutsMap:this.popupFilterShortcuts.map,value:this.props.filterValue,inputRef:this.filterRef,onBlur:this.popupFilterOnBlur,onFocus:this.onFilterFocus,className:"ring-js-shortcuts",placeholder:this.props.filter.placeholder,onChange:this.props.onFilter,onClick:this.onClickHandler,onClear:this.props.onClear,"data-test-custom":"ring-select-popup-filter-input",listId:this.props.listId,enableShortcuts:Object.keys(this.popupFilterShortcuts.map)})):null}},{key:"getTags",value:function(){return e.createElement("div",null,e.createElement(Nc,{tags:this.props.selected,activeIndex:this.state.tagsActiveIndex,handleRemove:this.handleRemoveTag,handleClick:this.handleTagClick,disabled:this.props.disabled}))}},{key:"getFilterWithTags",value:function(){if(this.props.tags){var n=a()([tu().filterWithTags,wu({},tu().filterWithTagsFocused,!this.state.popupFilterShortcutsOptions.disabled)]);return e.createElement("div",{className:n},this.getTags(),this.getFilter())}return this.getFilter()}},{key:"getBottomLine",value:function(){var n=this.props,t=n.loading,r=n.message;return(t||r)&&e.createElement("div",{className:tu().bottomLine},t&&e.createElement(nc,null),r&&e.createElement("div",{className:tu().message},r))}},{key:"getList",value:function(n){if(this.props.data.length){var t=this.props.maxHeight;return this.props.anchorElement&&(t=this._adjustListMaxHeight(this.props.hidden,t,n)),this.props.filter&&(t-=35),this.props.toolbar&&(t-=49),e.createElement(ci,{id:this.props.listId,maxHeight:t,data:this.props.data,activeIndex:this.props.activeIndex,ref:this.listRef,restoreActiveIndex:!0,activateFirstItem:!0,onSelect:this.onListSelect,onResize:this.handleListResize,onScrollToBottom:this.props.onLoadMore,hidden:this.props.hidden,shortcuts:!this.props.hidden,disableMoveOverflow:this.props.disableMoveOverflow,disableMoveDownOverflow:this.props.loading,disableScrollToActive:this.props.disableScrollToActive,compact:this.props.compact,renderOptimization:this.props.renderOptimization})}return null}},{key:"render",value:function(){var n=this,t=this.props,r=t.toolbar,o=t.className,i=t.multiple,l=t.hidden,c=t.isInputMode,u=t.anchorElement,s=t.minWidth,f=t.onCloseAttempt,p=t.directions,d=t.top,h=t.left,g=t.style,v=t.dir,A=t.filter,b=a()(tu().popup,o);return e.createElement(Ia.Consumer,null,(function(t){var o=n.getFilterWithTags(),a=i&&!i.limit&&i.selectAll&&n.getSelectAll(),m=n.getList(n.props.ringPopupTarget||t),y=n.getBottomLine(),E=o||a||m||y||r;return e.createElement(qa,{trapFocus:!1,ref:n.popupRef,hidden:l||!E,attached:c,className:b,dontCloseOnAnchorClick:!0,anchorElement:u,minWidth:s,onCloseAttempt:f,directions:p,top:d||(c?-14:null),left:h,onMouseDown:n.mouseDownHandler,target:n.props.ringPopupTarget,autoCorrectTopOverflow:!1,style:g},e.createElement("div",{dir:v},!l&&A&&e.createElement(An,{map:n.shortcutsMap,scope:n.shortcutsScope}),l?e.createElement("div",null):o,a,m,y,r))}))}}],r&&bu(t.prototype,r),o&&bu(t,o),l}(e.PureComponent);wu(Su,"propTypes",{activeIndex:o().number,anchorElement:o().instanceOf(HTMLElement),className:o().string,compact:o().bool,data:o().array,dir:o().oneOf(["ltr","rtl"]),directions:o().array,disabled:o().bool,disableMoveOverflow:o().bool,disableScrollToActive:o().bool,filter:o().oneOfType([o().bool,o().shape({value:o().string,placeholder:o().string})]),filterValue:o().string,hidden:o().bool,isInputMode:o().bool,listId:o().string,maxHeight:o().number,message:o().string,minWidth:o().number,multiple:o().oneOfType([o().bool,o().shape({label:o().string,limit:o().number,selectAll:o().bool})]),left:o().bool,loading:o().bool,onClear:o().func,onCloseAttempt:o().func,onEmptyPopupEnter:o().func,onFilter:o().func,onLoadMore:o().func,onSelect:o().func,onSelectAll:o().func,renderOptimization:o().bool,ringPopupTarget:o().string,selected:o().oneOfType([o().object,o().array]),style:o().object,tags:o().object,toolbar:o().node,top:o().number}),wu(Su,"defaultProps",{data:[],activeIndex:null,toolbar:null,filter:!1,multiple:!1,message:null,anchorElement:null,maxHeight:600,minWidth:240,loading:!1,onSelect:xu,onCloseAttempt:xu,onFilter:xu,onClear:xu,onLoadMore:xu,selected:[],tags:null,ringPopupTarget:null,onSelectAll:xu,onEmptyPopupEnter:xu});var Ou=t(1442),Bu=t.n(Ou);function Iu(e){return Iu="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},Iu(e)}function Tu(){return Tu=Object.assign||function(e){for(var n=1;n<arguments.length;n++){var t=arguments[n];for(var r in t)Object.prototype.hasOwnProperty.call(t,r)&&(e[r]=t[r])}return e},Tu.apply(this,arguments)}function Pu(e,n){if(null==e)return{};var t,r,o=function(e,n){if(null==e)return{};var t,r,o={},i=Object.keys(e);for(r=0;r<i.length;r++)t=i[r],n.indexOf(t)>=0||(o[t]=e[t]);return o}(e,n);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)t=i[r],n.indexOf(t)>=0||Object.prototype.propertyIsEnumerable.call(e,t)&&(o[t]=e[t])}return o}function ju(e){var n=function(e,n){if("object"!==Iu(e)||null===e)return e;var t=e[Symbol.toPrimitive];if(void 0!==t){var r=t.call(e,n||"default");if("object"!==Iu(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===n?String:Number)(e)}(e,"string");return"symbol"===Iu(n)?n:String(n)}function zu(e,n){if(!(e instanceof n))throw new TypeError("Cannot call a class as a function")}function Ru(e,n){for(var t=0;t<n.length;t++){var r=n[t];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}function Mu(e,n){return Mu=Object.setPrototypeOf||function(e,n){return e.__proto__=n,e},Mu(e,n)}function Du(e){var n=function(){if("undefined"==typeof Reflect||!Reflect.construct)return!1;if(Reflect.construct.sham)return!1;if("function"==typeof Proxy)return!0;try{return Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){}))),!0}catch(e){return!1}}();return function(){var t,r=Fu(e);if(n){var o=Fu(this).constructor;t=Reflect.construct(r,arguments,o)}else t=r.apply(this,arguments);return Nu(this,t)}}function Nu(e,n){if(n&&("object"===Iu(n)||"function"==typeof n))return n;if(void 0!==n)throw new TypeError("Derived constructors may only return object or undefined");return Lu(e)}function Lu(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}function Fu(e){return Fu=Object.setPrototypeOf?Object.getPrototypeOf:function(e){return e.__proto__||Object.getPrototypeOf(e)},Fu(e)}function Uu(e,n){var t=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);n&&(r=r.filter((function(n){return Object.getOwnPropertyDescriptor(e,n).enumerable}))),t.push.apply(t,r)}return t}function Wu(e){for(var n=1;n<arguments.length;n++){var t=null!=arguments[n]?arguments[n]:{};n%2?Uu(Object(t),!0).forEach((function(n){Hu(e,n,t[n])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(t)):Uu(Object(t)).forEach((function(n){Object.defineProperty(e,n,Object.getOwnPropertyDescriptor(t,n))}))}return e}function Hu(e,n,t){return n in e?Object.defineProperty(e,n,{value:t,enumerable:!0,configurable:!0,writable:!0}):e[n]=t,e}function Gu(){}var qu={BUTTON:"BUTTON",INPUT:"INPUT",CUSTOM:"CUSTOM",INLINE:"INLINE",MATERIAL:"MATERIAL",INPUT_WITHOUT_CONTROLS:"INPUT_WITHOUT_CONTROLS"},Vu=We((function(e){return{paddingRight:20*e}})),$u=function(e){return e===qu.INPUT||e===qu.INPUT_WITHOUT_CONTROLS};function Ku(e){return ci.isItemType(ci.ListProps.Type.SEPARATOR,e)||ci.isItemType(ci.ListProps.Type.HINT,e)||null==e.label?null:e.label.toLowerCase()}function Yu(e,n){var t=Ku(e);return null==t||n(t)}function Xu(e){return e.fn?e.fn:e.fuzzy?function(e,n){return Yu(e,(function(e){return _l(n,e).matched}))}:function(e,n){return Yu(e,(function(e){return e.indexOf(n)>=0}))}}var Zu=function(e){return e.reduce((function(e,n){return e[n.key]=!0,e}),{})};function Qu(e,n,t){var r=arguments.length>3&&void 0!==arguments[3]?arguments[3]:e.data,o=t.trim();$u(e.type)&&n.selected&&o===n.selected.label&&(o="");for(var i=o.toLowerCase(),a=[],l=!1,c=Xu(e.filter),u=function(t){var u=Wu({},r[t]);c(u,i,r)&&(l=u.label===o,e.multiple&&!e.multiple.removeSelectedItems&&(u.checkbox=!!n.multipleMap[u.key]),e.multiple&&e.multiple.limit&&(u.disabled=e.multiple.limit===n.selected.length&&!n.selected.find((function(e){return e.key===u.key}))),e.multiple&&e.multiple.removeSelectedItems&&n.multipleMap[u.key]||a.push(u))},s=0;s<r.length;s++)u(s);var f,p=null,d=e.add;(d&&o&&!l||d&&d.alwaysVisible)&&((d.regexp&&!d.regexp.test(o)||d.minlength&&o.length<+d.minlength)&&!d.alwaysVisible||(f=d.label?"function"==typeof d.label?d.label(o):d.label:o,p={prefix:d.prefix,label:f,delayed:!d.hasOwnProperty("delayed")||d.delayed}));return{filteredData:a,addButton:p}}function Ju(e,n,t){var r=t?e[0]:e;if(null==r)return null;for(var o=0;o<n.length;o++){var i=n[o];if(void 0!==i.key&&i.key===r.key)return o}return null}var es=function(e){var n=e.selectedLabel,t=e.label;return null!=n?n:t},ns=function(e,n,t){return e&&$u(n)?es(e):t};var ts=function(n){!function(e,n){if("function"!=typeof n&&null!==n)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(n&&n.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),n&&Mu(e,n)}(l,n);var t,r,o,i=Du(l);function l(){var e;zu(this,l);for(var n=arguments.length,t=new Array(n),r=0;r<n;r++)t[r]=arguments[r];return Hu(Lu(e=i.call.apply(i,[this].concat(t))),"state",{data:[],shownData:[],selected:e.props.multiple?[]:null,selectedIndex:null,filterValue:e.props.filter&&e.props.filter.value||"",shortcutsEnabled:!1,popupShortcuts:!1,showPopup:!1,prevData:e.props.data,prevSelected:null,prevMultiple:e.props.multiple,multipleMap:{},addButton:null}),Hu(Lu(e),"id",Fe("select-")),Hu(Lu(e),"shortcutsScope",e.id),Hu(Lu(e),"listId","".concat(e.id,":list")),Hu(Lu(e),"_focusHandler",(function(){e.props.onFocus(),e.setState({shortcutsEnabled:!0,focused:!0})})),Hu(Lu(e),"_blurHandler",(function(){e.props.onBlur(),e._popup&&e._popup.isVisible()&&!e._popup.isClickingPopup&&window.setTimeout((function(){e.setState({showPopup:!1})})),e._popup.isClickingPopup||e.setState({shortcutsEnabled:!1,focused:!1})})),Hu(Lu(e),"nodeRef",(function(n){e.node=n})),Hu(Lu(e),"_popup",null),Hu(Lu(e),"onEmptyPopupEnter",(function(){e.state.addButton&&e.addHandler()})),Hu(Lu(e),"_onEnter",(function(){if(e.state.addButton&&0===e.state.shownData.length&&e.addHandler(),e.props.onDone(),!e._popup.isVisible()&&e.props.allowAny)return!0})),Hu(Lu(e),"_onEsc",(function(n){if(!e._popup.isVisible())return!0;if(e.props.multiple||!e.props.getInitial)return!1;var t={key:Math.random(),label:e.props.getInitial()};e.setState({selected:t,filterValue:e.getValueForFilter(t)},(function(){e.props.onChange(t,n),e.props.onReset()}))})),Hu(Lu(e),"_inputShortcutHandler",(function(){e.state.focused&&e._popup&&!e._popup.isVisible()&&e._clickHandler()})),Hu(Lu(e),"addHandler",(function(){var n=e.filterValue();e._hidePopup(),e.props.onAdd(n)})),Hu(Lu(e),"getLowerCaseLabel",Ku),Hu(Lu(e),"doesLabelMatch",Yu),Hu(Lu(e),"_clickHandler",(function(){e.props.disabled||(e.state.showPopup?e._hidePopup():(e.props.onBeforeOpen(),e._showPopup()))})),Hu(Lu(e),"_filterChangeHandler",(function(n){e._setFilter(n.target.value,n)})),Hu(Lu(e),"_setFilter",(function(n){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{};if((!e.isInputMode()||e.state.focused)&&n!==e.state.filterValue){var r=n.replace(/^\s+/g,"");if(e.props.onFilter(r),e.props.allowAny){var o={key:Math.random(),label:r};e.setState({selected:""===r?null:o,selectedIndex:null},(function(){e.props.onSelect(o,t),e.props.onChange(o,t)}))}!e._popup.isVisible()&&e.props.onBeforeOpen(),e.setState({filterValue:r},(function(){e._showPopup()}))}})),Hu(Lu(e),"_redrawPopup",(function(){e.props.multiple&&setTimeout((function(){e.isInputMode()&&e.clearFilter(),e._showPopup()}),0)})),Hu(Lu(e),"_listSelectHandler",(function(n,t){var r=arguments.length>2&&void 0!==arguments[2]?arguments[2]:{},o=ci.isItemType.bind(null,ci.ListProps.Type.ITEM),i=ci.isItemType.bind(null,ci.ListProps.Type.CUSTOM),a=t&&("select"===t.type||"keydown"===t.type);if(a&&t.preventDefault(),(o(n)||i(n))&&!n.disabled&&!n.isResetItem)if(e.props.multiple){var l=r.tryKeepOpen;if(l||e._hidePopup(a),null==n.key)throw new Error('Multiple selection requires each item to have the "key" property');e.setState((function(r){var o,i=r.selected;r.multipleMap[n.key]?(o=i.filter((function(e){return e.key!==n.key})),e.props.onDeselect&&e.props.onDeselect(n)):(o=i.concat(n),e.props.onSelect&&e.props.onSelect(n,t)),e.props.onChange(o,t);var a={selected:o,selectedIndex:e._getSelectedIndex(n,e.props.data)};if(e.props.multiple.limit&&o.length===e.props.multiple.limit&&(a.shownData=r.shownData.map((function(e){return o.find((function(n){return n.key===e.key}))?e:Wu(Wu({},e),{},{disabled:!0})}))),r.multipleMap[n.key]){var l=r.multipleMap,c=n.key,u=(l[c],Pu(l,[c].map(ju)));a.multipleMap=u}else a.multipleMap=Wu(Wu({},r.multipleMap),{},Hu({},n.key,!0));return a}),(function(){l&&e._redrawPopup()}))}else e._hidePopup(a),e.setState({selected:n,selectedIndex:e._getSelectedIndex(n,e.props.data)},(function(){var r=e.isInputMode()&&!e.props.hideSelected?es(n):"";e.filterValue(r),e.props.onFilter(r),e.props.onSelect(n,t),e.props.onChange(n,t)}))})),Hu(Lu(e),"_listSelectAllHandler",(function(){var n=!(arguments.length>0&&void 0!==arguments[0])||arguments[0],t=ci.isItemType.bind(null,ci.ListProps.Type.ITEM),r=ci.isItemType.bind(null,ci.ListProps.Type.CUSTOM);e.setState((function(o){var i,a=o.selected;return n?(i=e.props.data.filter((function(e){return(t(e)||r(e))&&!e.disabled}))).filter((function(n){return!e.props.selected.find((function(e){return n.key===e.key}))})).forEach((function(n){e.props.onSelect&&e.props.onSelect(n)})):(i=[],a.forEach((function(n){e.props.onDeselect&&e.props.onDeselect(n)}))),e.props.onChange(i,event),{filterValue:"",selected:i,selectedIndex:n?e._getSelectedIndex(i,e.props.data):null,shownData:o.shownData.map((function(e){return Wu(Wu({},e),{},{checkbox:n})})),multipleMap:n?Zu(e.props.data.filter((function(e){return!e.disabled}))):{}}}),e._redrawPopup)})),Hu(Lu(e),"_onCloseAttempt",(function(n,t){e.isInputMode()&&(e.props.allowAny||(e.props.hideSelected||!e.state.selected||e.props.multiple?e.clearFilter():e.state.selected&&e.filterValue(es(e.state.selected)))),e.props.tags&&n&&n.target&&n.target.matches('[data-test="ring-tag-remove"]')||e._hidePopup(t)})),Hu(Lu(e),"clearFilter",(function(n){e._setFilter("",n)})),Hu(Lu(e),"clear",(function(n){n&&n.stopPropagation();var t=l._getEmptyValue(e.props.multiple);return e.setState({selected:t,selectedIndex:null,filterValue:""},(function(){e.props.onChange&&e.props.onChange(t,n)})),!1})),Hu(Lu(e),"popupRef",(function(n){e._popup=n})),Hu(Lu(e),"buttonRef",(function(n){e.button=n})),Hu(Lu(e),"filterRef",(function(n){e.filter=n})),e}return t=l,o=[{key:"_getEmptyValue",value:function(e){return e?[]:null}},{key:"getDerivedStateFromProps",value:function(e,n){var t=e.multiple,r=e.data,o=e.type,i=n.prevSelected,a=n.prevData,c=n.prevMultiple,u=n.filterValue,s={prevData:r,prevSelected:e.selected,prevMultiple:t};if("data"in e&&r!==a){var f=Qu(e,n,u,r),p=f.filteredData,d=f.addButton;Object.assign(s,{shownData:p,addButton:d}),n.selected&&Object.assign(s,{selectedIndex:Ju(n.selected,r,t),prevFilterValue:ns(n.selected,o,u)})}if("selected"in e&&e.selected!==i){var h=e.selected||l._getEmptyValue(t),g=Ju(h,r||a,t);Object.assign(s,{selected:h,prevFilterValue:ns(h,o,u)}),t&&function(e,n){if(!e||!n||e.length!==n.length)return!1;var t=n.reduce((function(e,n){return e[n.key]=!0,e}),{});return e.every((function(e){return t[e.key]}))}(i,h)||Object.assign(s,{selectedIndex:g})}c===t||hi()(c,t)||(s.selected=l._getEmptyValue(t));var v=Wu(Wu({},n),s).selected;if(v&&t){s.multipleMap=Zu(v);var A=Qu(e,s,u,r),b=A.filteredData,m=A.addButton;Object.assign(s,{shownData:b,addButton:m})}return s}}],(r=[{key:"componentDidUpdate",value:function(e,n){var t=this.state,r=t.showPopup,o=t.selected,i=this.props,a=i.onClose,l=i.onOpen,c=i.onChange,u=i.multiple;n.showPopup&&!r?a(o):!n.showPopup&&r&&l(),u===e.multiple||hi()(u,e.multiple)||c(o)}},{key:"getValueForFilter",value:function(e){return ns(e,this.props.type,this.state.filterValue)}},{key:"_getSelectedIndex",value:function(e,n){return Ju(e,n,this.props.multiple)}},{key:"_getResetOption",value:function(){var n=this,t=this.state.selected&&this.state.selected.length,r=this.props.tags&&this.props.tags.reset;if(!t||!r)return null;var o=this.props.tags.reset;return{isResetItem:!0,separator:o.separator,key:o.label,rgItemType:ci.ListProps.Type.CUSTOM,template:e.createElement(Li,{text:!0,className:Bu().button,"data-test":"ring-select-reset-tags-button"},o.label),glyph:o.glyph,onClick:function(e,t){n.clear(t),n.clearFilter(),n.props.onFilter(""),n.setState((function(e){return{shownData:e.shownData.slice(o.separator?2:1),multipleMap:{}}})),n._redrawPopup()}}}},{key:"_prependResetOption",value:function(e){var n=this._getResetOption(),t={rgItemType:ci.ListProps.Type.MARGIN};if(n){var r=[t,n,t];return n.separator&&r.push({rgItemType:ci.ListProps.Type.SEPARATOR}),r.concat(e)}return e}},{key:"_renderPopup",value:function(){var n=this.props.targetElement||this.node,t=this.state,r=t.showPopup,o=t.shownData,i=this._prependResetOption(o),a=null;return this.props.loading?a=this.props.loadingMessage:o.length||(a=this.props.notFoundMessage),e.createElement(Su,{data:i,message:a,toolbar:r&&this.getToolbar(),loading:this.props.loading,activeIndex:this.state.selectedIndex,hidden:!r,ref:this.popupRef,maxHeight:this.props.maxHeight,minWidth:this.props.minWidth,directions:this.props.directions,className:this.props.popupClassName,style:this.props.popupStyle,top:this.props.top,left:this.props.left,filter:!this.isInputMode()&&this.props.filter,multiple:this.props.multiple,filterValue:this.state.filterValue,anchorElement:n,onCloseAttempt:this._onCloseAttempt,onSelect:this._listSelectHandler,onSelectAll:this._listSelectAllHandler,onFilter:this._filterChangeHandler,onClear:this.clearFilter,onLoadMore:this.props.onLoadMore,isInputMode:this.isInputMode(),selected:this.state.selected,tags:this.props.tags,compact:this.props.compact,renderOptimization:this.props.renderOptimization,ringPopupTarget:this.props.ringPopupTarget,disableMoveOverflow:this.props.disableMoveOverflow,disableScrollToActive:this.props.disableScrollToActive,dir:this.props.dir,onEmptyPopupEnter:this.onEmptyPopupEnter,listId:this.listId})}},{key:"_showPopup",value:function(){if(this.node){var e=this.getListItems(this.filterValue());this.setState({showPopup:!!e.length||!this.props.allowAny,shownData:e})}}},{key:"_hidePopup",value:function(e){if(this.node&&this.state.showPopup&&(this.setState({showPopup:!1,filterValue:""}),e)){var n=this.props.targetElement||this.node.querySelector("[data-test~=ring-select__focus]");n&&n.focus()}}},{key:"getToolbar",value:function(){var n=this.props.hint,t=this.state.addButton||{},r=t.prefix,o=t.label,i=t.delayed;return this.state.addButton||n?e.createElement("div",{className:a()(Hu({},Bu().toolbar,!!this.state.addButton)),"data-test":"ring-select-toolbar"},this.state.addButton&&e.createElement(Li,{text:!0,delayed:i,className:a()(Bu().button,Bu().buttonSpaced),onClick:this.addHandler,"data-test":"ring-select-toolbar-button"},r?"".concat(r," ").concat(o):o),n&&e.createElement(ci.ListHint,{label:n,"data-test":"ring-select-toolbar-hint"})):null}},{key:"getFilterFn",value:function(){return Xu(this.props.filter)}},{key:"getListItems",value:function(e,n){var t=Qu(this.props,this.state,e,n),r=t.filteredData,o=t.addButton;return this.setState({addButton:o}),r}},{key:"filterValue",value:function(e){if("string"!=typeof e&&"number"!=typeof e)return this.state.filterValue;this.setState({filterValue:e})}},{key:"isInputMode",value:function(){return $u(this.props.type)}},{key:"_rebuildMultipleMap",value:function(e,n){e&&n&&this.setState({multipleMap:Zu(e)})}},{key:"_selectionIsEmpty",value:function(){return this.props.multiple&&!this.state.selected.length||!this.state.selected}},{key:"_getLabel",value:function(){return this.props.label||this.props.selectedLabel||"Select an option"}},{key:"_getSelectedString",value:function(){if(this.props.multiple){for(var e=[],n=0;n<this.state.selected.length;n++)e.push(es(this.state.selected[n]));return e.filter(Boolean).join(", ")}return es(this.state.selected)}},{key:"_getIcons",value:function(){var n=this.state.selected,t=this.props,r=t.disabled,o=t.clear,i=t.hideArrow,a=[];return null!=n&&n.icon&&a.push(e.createElement("button",{title:"Toggle options popup",type:"button",className:Bu().selectedIcon,key:"selected",disabled:this.props.disabled,onClick:this._clickHandler,style:{backgroundImage:"url(".concat(n.icon,")")}})),!o||r||this._selectionIsEmpty()||a.push(e.createElement(Li,{title:"Clear selection","data-test":"ring-clear-select",className:Bu().clearIcon,key:"close",disabled:this.props.disabled,onClick:this.clear,icon:pi()})),i||a.push(e.createElement(Li,{title:"Toggle options popup",className:Bu().chevron,iconClassName:Bu().chevronIcon,icon:si(),key:"hide",disabled:this.props.disabled,onClick:this._clickHandler})),a}},{key:"_getAvatar",value:function(){return this.state.selected&&(this.state.selected.avatar||this.state.selected.showGeneratedAvatar)&&e.createElement(qt,{className:Bu().avatar,url:this.state.selected.avatar,username:this.state.selected.username,size:Gt})}},{key:"getShortcutsMap",value:function(){return{enter:this._onEnter,esc:this._onEsc,up:this._inputShortcutHandler,down:this._inputShortcutHandler,right:Gu,left:Gu,"shift+up":Gu,"shift+down":Gu,space:Gu}}},{key:"renderSelect",value:function(n){var t,r,o,i,l=this.props["data-test"],c=this.state.shortcutsEnabled,u=a()(Bu().select,"ring-js-shortcuts",this.props.className,(Hu(t={},Bu()["size".concat(this.props.size)],this.props.type!==qu.INLINE),Hu(t,Bu().disabled,this.props.disabled),t)),s=this._getIcons(),f=Vu(s.length),p=e.createElement("span",{className:Bu().icons},s),d=this.state.showPopup?{"aria-owns":this.listId,"aria-activedescendant":n}:{};switch(this.props.type){case qu.INPUT_WITHOUT_CONTROLS:case qu.INPUT:return e.createElement("div",{ref:this.nodeRef,className:a()(u,Bu().inputMode),"data-test":Ne("ring-select",l)},c&&e.createElement(An,{map:this.getShortcutsMap(),scope:this.shortcutsScope}),e.createElement(ul,Tu({},d,{autoComplete:"off",id:this.props.id,onClick:this._clickHandler,inputRef:this.filterRef,disabled:this.props.disabled,value:this.state.filterValue,borderless:this.props.type===qu.INPUT_WITHOUT_CONTROLS,style:f,size:ll.FULL,onChange:this._filterChangeHandler,onFocus:this._focusHandler,onBlur:this._blurHandler,label:this.props.type===qu.INPUT?this._getLabel():null,placeholder:this.props.inputPlaceholder,onKeyDown:this.props.onKeyDown,"data-test":"ring-select__focus",enableShortcuts:c?Object.keys(Wu(Wu({},this.getShortcutsMap()),null===(r=this._popup)||void 0===r||null===(o=r.list)||void 0===o?void 0:o.shortcutsMap)):void 0})),this.props.type===qu.INPUT&&p,this._renderPopup());case qu.BUTTON:return e.createElement("div",{ref:this.nodeRef,className:a()(u,Bu().buttonMode),"data-test":Ne("ring-select",l)},c&&e.createElement(An,{map:this.getShortcutsMap(),scope:this.shortcutsScope}),e.createElement("div",{className:Bu().buttonContainer},e.createElement(Li,Tu({},d,{id:this.props.id,onClick:this._clickHandler,className:a()(this.props.buttonClassName,Bu().buttonValue,Hu({},Bu().buttonValueOpen,this.state.showPopup)),disabled:this.props.disabled,style:f,"data-test":"ring-select__button ring-select__focus"}),this._getAvatar(),this._selectionIsEmpty()?this._getLabel():this._getSelectedString()),p),this._renderPopup());case qu.MATERIAL:return e.createElement("div",{ref:this.nodeRef,className:a()(u,Bu().materialMode),"data-test":Ne("ring-select",l)},c&&e.createElement(An,{map:this.getShortcutsMap(),scope:this.shortcutsScope}),!this._selectionIsEmpty()&&this.props.selectedLabel&&e.createElement("span",{className:Bu().selectedLabel},this.props.selectedLabel),e.createElement("button",Tu({},d,{id:this.props.id,onClick:this._clickHandler,type:"button",disabled:this.props.disabled,className:a()(this.props.buttonClassName,Bu().value,(i={},Hu(i,Bu().open,this.state.showPopup),Hu(i,Bu().label,this._selectionIsEmpty()),i)),"aria-label":this._getLabel(),style:f,"data-test":"ring-select__focus",ref:this.buttonRef}),this._getAvatar(),this._selectionIsEmpty()?this._getLabel():this._getSelectedString()),p,this._renderPopup());case qu.INLINE:return e.createElement("div",{className:u,ref:this.nodeRef,"data-test":Ne("ring-select",l)},c&&e.createElement(An,{map:this.getShortcutsMap(),scope:this.shortcutsScope}),e.createElement(Vi,Tu({},d,{id:this.props.id,onClick:this._clickHandler,"data-test":"ring-select__focus",disabled:this.props.disabled,active:this.state.showPopup}),this._selectionIsEmpty()?this._getLabel():this._getSelectedString()),this._renderPopup());default:return this.props.customAnchor?e.createElement(e.Fragment,null,c&&e.createElement(An,{map:this.getShortcutsMap(),scope:this.shortcutsScope}),this.props.customAnchor({wrapperProps:{ref:this.nodeRef,"data-test":Ne("ring-select",l)},buttonProps:Wu(Wu({},d),{},{id:this.props.id,onClick:this._clickHandler,disabled:this.props.disabled,children:this._selectionIsEmpty()?this._getLabel():this._getSelectedString(),"data-test":"ring-select_focus"}),popup:this._renderPopup()})):e.createElement("span",{id:this.props.id,ref:this.nodeRef,"data-test":"ring-select"},this._renderPopup())}}},{key:"render",value:function(){var n=this;return e.createElement(li.Provider,null,e.createElement(li.ValueContext.Consumer,null,(function(e){return n.renderSelect(e)})))}}])&&Ru(t.prototype,r),o&&Ru(t,o),l}(e.Component);Hu(ts,"propTypes",{className:o().string,buttonClassName:o().string,id:o().string,multiple:o().oneOfType([o().bool,o().object]),allowAny:o().bool,filter:o().oneOfType([o().bool,o().object]),getInitial:o().func,onClose:o().func,onOpen:o().func,onDone:o().func,onFilter:o().func,onChange:o().func,onReset:o().func,onLoadMore:o().func,onAdd:o().func,onBeforeOpen:o().func,onSelect:o().func,onDeselect:o().func,onFocus:o().func,onBlur:o().func,onKeyDown:o().func,selected:o().oneOfType([o().object,o().array]),data:o().array,tags:o().object,targetElement:o().object,loading:o().bool,loadingMessage:o().string,notFoundMessage:o().string,maxHeight:o().number,minWidth:o().number,directions:o().array,popupClassName:o().string,popupStyle:o().object,top:o().number,left:o().number,renderOptimization:o().bool,ringPopupTarget:o().string,hint:ci.ListHint.propTypes.label,add:o().object,type:o().oneOf(Object.values(qu)),disabled:o().bool,hideSelected:o().bool,label:o().string,selectedLabel:o().oneOfType([o().string,o().arrayOf(o().node),o().node]),inputPlaceholder:o().string,clear:o().bool,hideArrow:o().bool,compact:o().bool,size:o().oneOf(Object.values(ll)),theme:o().string,customAnchor:o().func,disableMoveOverflow:o().bool,disableScrollToActive:o().bool,dir:o().oneOf(["ltr","rtl"]),"data-test":o().string}),Hu(ts,"defaultProps",{data:[],filter:!1,multiple:!1,clear:!1,loading:!1,disabled:!1,loadingMessage:"Loading...",notFoundMessage:"No options found",type:qu.MATERIAL,size:ll.M,targetElement:null,hideSelected:!1,allowAny:!1,hideArrow:!1,maxHeight:600,directions:[qa.PopupProps.Directions.BOTTOM_RIGHT,qa.PopupProps.Directions.BOTTOM_LEFT,qa.PopupProps.Directions.TOP_LEFT,qa.PopupProps.Directions.TOP_RIGHT],selected:null,label:"",selectedLabel:"",inputPlaceholder:"",hint:null,shortcutsEnabled:!1,onBeforeOpen:Gu,onLoadMore:Gu,onOpen:Gu,onClose:Gu,onFilter:Gu,onFocus:Gu,onBlur:Gu,onKeyDown:Gu,onSelect:Gu,onDeselect:Gu,onChange:Gu,onAdd:Gu,onDone:Gu,onReset:Gu,tags:null,onRemoveTag:Gu,ringPopupTarget:null,dir:"ltr"}),Hu(ts,"Type",qu),Hu(ts,"Size",ll),Hu(ts,"Theme",_i);(function(e){var n=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{captureNode:!1},t=n.captureNode;if(t)throw new Error('rerenderHOC: captureNode={true} is deprecated. Wrapped component must have "node" property captured itself')})(ts),t(108);var rs=t(2481),os=t.n(rs);function is(e){return is="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},is(e)}var as=["children","data-test","title","delay","selfOverflowOnly","popupProps"];function ls(){return ls=Object.assign||function(e){for(var n=1;n<arguments.length;n++){var t=arguments[n];for(var r in t)Object.prototype.hasOwnProperty.call(t,r)&&(e[r]=t[r])}return e},ls.apply(this,arguments)}function cs(e,n){if(null==e)return{};var t,r,o=function(e,n){if(null==e)return{};var t,r,o={},i=Object.keys(e);for(r=0;r<i.length;r++)t=i[r],n.indexOf(t)>=0||(o[t]=e[t]);return o}(e,n);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)t=i[r],n.indexOf(t)>=0||Object.prototype.propertyIsEnumerable.call(e,t)&&(o[t]=e[t])}return o}function us(e,n){if(!(e instanceof n))throw new TypeError("Cannot call a class as a function")}function ss(e,n){for(var t=0;t<n.length;t++){var r=n[t];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}function fs(e,n){return fs=Object.setPrototypeOf||function(e,n){return e.__proto__=n,e},fs(e,n)}function ps(e){var n=function(){if("undefined"==typeof Reflect||!Reflect.construct)return!1;if(Reflect.construct.sham)return!1;if("function"==typeof Proxy)return!0;try{return Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){}))),!0}catch(e){return!1}}();return function(){var t,r=gs(e);if(n){var o=gs(this).constructor;t=Reflect.construct(r,arguments,o)}else t=r.apply(this,arguments);return ds(this,t)}}function ds(e,n){if(n&&("object"===is(n)||"function"==typeof n))return n;if(void 0!==n)throw new TypeError("Derived constructors may only return object or undefined");return hs(e)}function hs(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}function gs(e){return gs=Object.setPrototypeOf?Object.getPrototypeOf:function(e){return e.__proto__||Object.getPrototypeOf(e)},gs(e)}function vs(e,n,t){return n in e?Object.defineProperty(e,n,{value:t,enumerable:!0,configurable:!0,writable:!0}):e[n]=t,e}var As=Ue(),bs=(0,e.createContext)(),ms=function(n){!function(e,n){if("function"!=typeof n&&null!==n)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(n&&n.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),n&&fs(e,n)}(a,n);var t,r,o,i=ps(a);function a(){var e;us(this,a);for(var n=arguments.length,t=new Array(n),r=0;r<n;r++)t[r]=arguments[r];return vs(hs(e=i.call.apply(i,[this].concat(t))),"state",{showPopup:!1,showNestedPopup:!1}),vs(hs(e),"listeners",new Ze),vs(hs(e),"containerRef",(function(n){e.containerNode=n})),vs(hs(e),"tryToShowPopup",(function(){var n=e.props,t=n.delay;n.title&&(t?e.timeout=setTimeout(e.showPopup,t):e.showPopup())})),vs(hs(e),"showPopup",(function(){var n;if(e.props.selfOverflowOnly){var t=hs(e).containerNode;if(!t)return;if(0===t.clientWidth&&0===t.clientHeight)return;if(t.scrollWidth<=t.clientWidth&&t.scrollHeight<=t.clientHeight)return}null===(n=e.context)||void 0===n||n.onNestedTooltipShow(),e.setState({showPopup:!0})})),vs(hs(e),"hidePopup",(function(){var n;clearTimeout(e.timeout),null===(n=e.context)||void 0===n||n.onNestedTooltipHide(),e.setState({showPopup:!1})})),vs(hs(e),"popupRef",(function(n){e.popup=n})),vs(hs(e),"onNestedTooltipShow",(function(){e.setState({showNestedPopup:!0})})),vs(hs(e),"onNestedTooltipHide",(function(){e.setState({showNestedPopup:!1})})),e}return t=a,(r=[{key:"componentDidMount",value:function(){this.props.title&&this.addListeners()}},{key:"componentDidUpdate",value:function(e){!e.title&&this.props.title?this.addListeners():e.title&&!this.props.title&&this.listeners.removeAll()}},{key:"componentWillUnmount",value:function(){clearTimeout(this.timeout),this.listeners.removeAll()}},{key:"addListeners",value:function(){var e=this;this.listeners.add(this.containerNode,"mouseover",this.tryToShowPopup),this.listeners.add(this.containerNode,"mouseout",this.hidePopup),this.listeners.add(document,"scroll",(function(){return As(e.hidePopup)}),{passive:!0})}},{key:"render",value:function(){var n=this.props,t=n.children,r=n["data-test"],o=n.title,i=(n.delay,n.selfOverflowOnly,n.popupProps),a=cs(n,as),l="string"==typeof o&&o?{"aria-label":o,role:"tooltip"}:{},c=this.onNestedTooltipShow,u=this.onNestedTooltipHide;return e.createElement(bs.Provider,{value:{onNestedTooltipShow:c,onNestedTooltipHide:u}},e.createElement("span",ls({},l,a,{ref:this.containerRef,"data-test":Ne("ring-tooltip",r),"data-test-title":"string"==typeof o?o:void 0}),t,e.createElement(qa,ls({trapFocus:!1,hidden:!this.state.showPopup||this.state.showNestedPopup,onCloseAttempt:this.hidePopup,maxHeight:400,className:os().tooltip,attached:!1,top:4,dontCloseOnAnchorClick:!0,ref:this.popupRef},i),o)))}}])&&ss(t.prototype,r),o&&ss(t,o),a}(e.Component);function ys(){return ys=Object.assign||function(e){for(var n=1;n<arguments.length;n++){var t=arguments[n];for(var r in t)Object.prototype.hasOwnProperty.call(t,r)&&(e[r]=t[r])}return e},ys.apply(this,arguments)}vs(ms,"propTypes",{delay:o().number,selfOverflowOnly:o().bool,popupProps:o().object,title:o().node,children:o().node,"data-test":o().string}),vs(ms,"defaultProps",{title:"",selfOverflowOnly:!1,popupProps:{}}),vs(ms,"PopupProps",qa.PopupProps),vs(ms,"contextType",bs);const Es=({styles:n={},...t})=>e.createElement("svg",ys({width:"40",height:"40",fill:"none",xmlns:"http://www.w3.org/2000/svg"},t),e.createElement("path",{fillRule:"evenodd",clipRule:"evenodd",d:"M23.847 14.861A6.99 6.99 0 0017.587 11a6.997 6.997 0 104.186 12.601l6.106 6.106 1.414-1.414-6.107-6.106a6.99 6.99 0 00.66-7.326zM22.587 18a5 5 0 11-10.001 0 5 5 0 0110 0z",fill:"#fff"}));var _s;!function(e){e[e.WINDOWS=0]="WINDOWS",e[e.MACOS=1]="MACOS",e[e.LINUX=2]="LINUX",e[e.OTHER=3]="OTHER"}(_s||(_s={}));var Cs,ws=function(){function e(){}return e.metaKey={name:"Command",keyArg:"Meta"},e.ctrlKey={name:"Ctrl",keyArg:"Control"},e.altKey={name:"Alt",keyArg:"Alt"},e.shiftKey={name:"Shift",keyArg:"Shift"},e}(),xs=[ws.altKey,ws.shiftKey,ws.ctrlKey,ws.metaKey],ks=function(){function e(){var e,n=this;this.registerHotkeyWithAccel=function(e,t){var r=n.getOsAccelKey();document.onkeydown=function(n){var o=n.getModifierState(r.keyArg),i=xs.filter((function(e){return e!==r})).map((function(e){return n.getModifierState(e.keyArg)})).some((function(e){return e}));o&&!i&&n.key===t&&(n.preventDefault(),e())}},this.osKind=(e=navigator.userAgent).includes("Mac")?_s.MACOS:e.includes("Win")?_s.WINDOWS:e.includes("Linux")?_s.LINUX:_s.OTHER}return e.prototype.getOsAccelKeyName=function(){return this.getOsAccelKey().name},e.prototype.getOsAccelKey=function(){return this.osKind===_s.MACOS?ws.metaKey:ws.ctrlKey},e}(),Ss=function(){return Ss=Object.assign||function(e){for(var n,t=1,r=arguments.length;t<r;t++)for(var o in n=arguments[t])Object.prototype.hasOwnProperty.call(n,o)&&(e[o]=n[o]);return e},Ss.apply(this,arguments)},Os=function(n){var t=n.wrapperProps,r=n.buttonProps,o=n.popup,i=new ks;return i.registerHotkeyWithAccel(r.onClick,"k"),e.createElement("span",Ss({},t),e.createElement(ms,{title:"".concat(i.getOsAccelKeyName()," + ").concat("k".toUpperCase()),delay:500,popupProps:{className:"search-hotkey-popup"}},e.createElement("button",Ss({type:"button"},r),e.createElement(Es,null))),o)},Bs=t(6486),Is=t.n(Bs),Ts=function(n){var t=n.label;return e.createElement("strong",null,t)},Ps=function(n){var t=n.searchResult,r=Is().chunk(function(e){return e.name.replace(e.searchKeys[e.rank],e.highlight)}(t).split("**"),2).flatMap((function(n){var t=n[0],r=n[1];return[t,r?e.createElement(Ts,{label:r}):null]}));return e.createElement("div",{className:"template-wrapper"},e.createElement("span",null,r),e.createElement("span",{className:"template-description"},t.description))},js=(Cs=function(e,n){return Cs=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(e,n){e.__proto__=n}||function(e,n){for(var t in n)Object.prototype.hasOwnProperty.call(n,t)&&(e[t]=n[t])},Cs(e,n)},function(e,n){if("function"!=typeof n&&null!==n)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");function t(){this.constructor=e}Cs(e,n),e.prototype=null===n?Object.create(n):(t.prototype=n.prototype,new t)}),zs=function(){return zs=Object.assign||function(e){for(var n,t=1,r=arguments.length;t<r;t++)for(var o in n=arguments[t])Object.prototype.hasOwnProperty.call(n,o)&&(e[o]=n[o]);return e},zs.apply(this,arguments)},Rs=function(n){function t(){return null!==n&&n.apply(this,arguments)||this}return js(t,n),t.prototype.componentDidUpdate=function(e,t){n.prototype.componentDidUpdate.call(this,e,t),this.props.filter&&this.state.filterValue!=this.props.filter.value&&this.setState({filterValue:this.props.filter.value})},t.prototype._showPopup=function(){if(this.props.shouldShowPopup){if(!this.node)return;var e=this.getListItems(this.filterValue());this.setState({showPopup:this.props.shouldShowPopup(this.filterValue()),shownData:e})}else n.prototype._showPopup.call(this)},t.prototype.getListItems=function(n,t){var r,o=(n||"").trim(),i=this.props.data.map((function(e){var n=e.searchKeys.map((function(n,t){return zs(zs(zs({},_l(o,n,!1)),e),{rank:t})})).filter((function(e){return e.matched})),t=Is().head(n);return t||zs({matched:!1},e)})).filter((function(e){return e.matched}));return this.props.onFilter(o),function(n){return n.map((function(n){return zs(zs({},n),{template:e.createElement(Ps,{searchResult:n})})}))}((r=o,i.sort((function(e,n){var t=e.rank-n.rank;if(0!==t)return t;var o=e.name.toLowerCase().includes(r.toLowerCase())?1:0,i=(n.name.toLowerCase().includes(r.toLowerCase())?1:0)-o;if(0!=i)return i;var a=e.highlight.indexOf("**")-n.highlight.indexOf("**");return 0==a?e.name.toLowerCase().localeCompare(n.name.toLowerCase()):a}))))},t}(ts),Ms=function(){return Ms=Object.assign||function(e){for(var n,t=1,r=arguments.length;t<r;t++)for(var o in n=arguments[t])Object.prototype.hasOwnProperty.call(n,o)&&(e[o]=n[o]);return e},Ms.apply(this,arguments)},Ds=function(n){var t=n.data,r=(0,e.useState)(t[0]),o=r[0],i=r[1],a=(0,e.useCallback)((function(e){window.location.replace("".concat(window.pathToRoot).concat(e.location,"?query=").concat(e.name)),i(e)}),[t]);return e.createElement("div",{className:"search-container"},e.createElement("div",{className:"search"},e.createElement(Rs,{id:"pages-search",selectedLabel:"Search",label:"Please type page name",filter:!0,type:ts.Type.CUSTOM,clear:!0,renderOptimization:!0,disableScrollToActive:!0,selected:o,data:t,popupClassName:"popup-wrapper",onSelect:a,customAnchor:function(n){var t=n.wrapperProps,r=n.buttonProps,o=n.popup;return e.createElement(Os,{wrapperProps:t,buttonProps:r,popup:o})}})))},Ns=function(){var n=(0,e.useState)([]),t=n[0],r=n[1];return(0,e.useEffect)((function(){var e,n,t;fetch((e="scripts/pages.json",n=window.pathToRoot,t=""==n?".":n,t.endsWith("/")?"".concat(t).concat(e):"".concat(t,"/").concat(e))).then((function(e){return e.json()})).then((function(e){r(e.map((function(e,n){return Ms(Ms({},e),{label:e.name,key:n,type:e.kind,rgItemType:ci.ListProps.Type.CUSTOM})})))}),(function(e){console.error("failed to fetch pages data",e),r([])}))}),[]),e.createElement(Ds,{data:t})};const Ls=function(){return e.createElement("div",{className:"search-content"},e.createElement(Ns,null))};var Fs=function(){(0,n.render)(e.createElement(Ls,null),document.getElementById("searchBar")),document.removeEventListener("DOMContentLoaded",Fs)};document.addEventListener("DOMContentLoaded",Fs)})()})();
+//# sourceMappingURL=main.js.map
\ No newline at end of file
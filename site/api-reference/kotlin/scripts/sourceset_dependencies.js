@@ -0,0 +1 @@
+sourceset_dependencies = '{":google-adk-kotlin-processor:dokkaHtmlPartial/main":[],":google-adk-kotlin-examples:dokkaHtmlPartial/main":[],":google-adk-kotlin-litertlm:dokkaHtmlPartial/androidMain":[":google-adk-kotlin-litertlm:dokkaHtmlPartial/commonJvmAndroidMain",":google-adk-kotlin-litertlm:dokkaHtmlPartial/commonMain"],":google-adk-kotlin-litertlm:dokkaHtmlPartial/commonJvmAndroidMain":[":google-adk-kotlin-litertlm:dokkaHtmlPartial/commonMain"],":google-adk-kotlin-litertlm:dokkaHtmlPartial/commonMain":[],":google-adk-kotlin-litertlm:dokkaHtmlPartial/jvmMain":[":google-adk-kotlin-litertlm:dokkaHtmlPartial/commonJvmAndroidMain",":google-adk-kotlin-litertlm:dokkaHtmlPartial/commonMain"],":google-adk-kotlin-a2a:dokkaHtmlPartial/commonJvmAndroidMain":[":google-adk-kotlin-a2a:dokkaHtmlPartial/commonMain"],":google-adk-kotlin-a2a:dokkaHtmlPartial/commonMain":[],":google-adk-kotlin-a2a:dokkaHtmlPartial/jvmMain":[":google-adk-kotlin-a2a:dokkaHtmlPartial/commonJvmAndroidMain",":google-adk-kotlin-a2a:dokkaHtmlPartial/commonMain"],":google-adk-kotlin-webserver:dokkaHtmlPartial/main":[],":google-adk-kotlin-core:dokkaHtmlPartial/androidMain":[":google-adk-kotlin-core:dokkaHtmlPartial/commonJvmAndroidMain",":google-adk-kotlin-core:dokkaHtmlPartial/commonMain"],":google-adk-kotlin-core:dokkaHtmlPartial/commonJvmAndroidMain":[":google-adk-kotlin-core:dokkaHtmlPartial/commonMain"],":google-adk-kotlin-core:dokkaHtmlPartial/commonMain":[],":google-adk-kotlin-core:dokkaHtmlPartial/jvmMain":[":google-adk-kotlin-core:dokkaHtmlPartial/commonJvmAndroidMain",":google-adk-kotlin-core:dokkaHtmlPartial/commonMain"]}'
\ No newline at end of file
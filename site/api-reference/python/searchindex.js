@@ -0,0 +1 @@
+Search.setIndex({"alltitles":{")":[[0,"id27"],[0,"id64"]],"Submodules":[[0,null]],"google":[[1,null]],"google.adk.a2a module":[[0,"module-google.adk.a2a"]],"google.adk.agents module":[[0,"module-google.adk.agents"]],"google.adk.apps module":[[0,"module-google.adk.apps"]],"google.adk.artifacts module":[[0,"module-google.adk.artifacts"]],"google.adk.auth module":[[0,"module-google.adk.auth"]],"google.adk.code_executors module":[[0,"google-adk-code-executors-module"]],"google.adk.environment module":[[0,"module-google.adk.environment"]],"google.adk.errors module":[[0,"module-google.adk.errors"]],"google.adk.evaluation module":[[0,"module-google.adk.evaluation"]],"google.adk.events module":[[0,"module-google.adk.events"]],"google.adk.examples module":[[0,"module-google.adk.examples"]],"google.adk.flows module":[[0,"module-google.adk.flows"]],"google.adk.integrations module":[[0,"module-google.adk.integrations"]],"google.adk.integrations.agent_identity module":[[0,"google-adk-integrations-agent-identity-module"],[0,"id79"]],"google.adk.integrations.agent_registry module":[[0,"google-adk-integrations-agent-registry-module"],[0,"id92"]],"google.adk.integrations.api_registry module":[[0,"google-adk-integrations-api-registry-module"],[0,"id105"]],"google.adk.integrations.bigquery module":[[0,"module-google.adk.integrations.bigquery"],[0,"id108"]],"google.adk.integrations.cloud_run module":[[0,"google-adk-integrations-cloud-run-module"],[0,"id109"]],"google.adk.integrations.crewai module":[[0,"module-google.adk.integrations.crewai"],[0,"id118"]],"google.adk.integrations.daytona module":[[0,"module-google.adk.integrations.daytona"],[0,"id137"]],"google.adk.integrations.e2b module":[[0,"module-google.adk.integrations.e2b"],[0,"id161"]],"google.adk.integrations.eventarc module":[[0,"module-google.adk.integrations.eventarc"],[0,"id177"]],"google.adk.integrations.firestore module":[[0,"module-google.adk.integrations.firestore"],[0,"id199"]],"google.adk.integrations.gcs module":[[0,"module-google.adk.integrations.gcs"],[0,"id200"]],"google.adk.integrations.langchain module":[[0,"module-google.adk.integrations.langchain"],[0,"id207"]],"google.adk.integrations.oci module":[[0,"module-google.adk.integrations.oci"],[0,"id214"]],"google.adk.integrations.parameter_manager module":[[0,"google-adk-integrations-parameter-manager-module"],[0,"id215"]],"google.adk.integrations.secret_manager module":[[0,"google-adk-integrations-secret-manager-module"],[0,"id222"]],"google.adk.integrations.skill_registry module":[[0,"google-adk-integrations-skill-registry-module"],[0,"id229"]],"google.adk.integrations.slack module":[[0,"module-google.adk.integrations.slack"],[0,"id233"]],"google.adk.integrations.vmaas module":[[0,"module-google.adk.integrations.vmaas"],[0,"id252"]],"google.adk.labs.antigravity module":[[0,"google-adk-labs-antigravity-module"]],"google.adk.labs.openai module":[[0,"module-google.adk.labs.openai"]],"google.adk.memory module":[[0,"module-google.adk.memory"]],"google.adk.models module":[[0,"module-google.adk.models"]],"google.adk.optimization module":[[0,"module-google.adk.optimization"]],"google.adk.planners module":[[0,"module-google.adk.planners"]],"google.adk.platform module":[[0,"module-google.adk.platform"]],"google.adk.plugins module":[[0,"module-google.adk.plugins"]],"google.adk.runners module":[[0,"module-google.adk.runners"]],"google.adk.sessions module":[[0,"module-google.adk.sessions"]],"google.adk.skills module":[[0,"module-google.adk.skills"]],"google.adk.telemetry module":[[0,"module-google.adk.telemetry"]],"google.adk.tools module":[[0,"module-google.adk.tools"]],"google.adk.tools.agent_simulator module":[[0,"google-adk-tools-agent-simulator-module"]],"google.adk.tools.agent_tool module":[[0,"google-adk-tools-agent-tool-module"]],"google.adk.tools.api_registry module":[[0,"google-adk-tools-api-registry-module"]],"google.adk.tools.apihub_tool module":[[0,"google-adk-tools-apihub-tool-module"]],"google.adk.tools.application_integration_tool module":[[0,"google-adk-tools-application-integration-tool-module"]],"google.adk.tools.authenticated_function_tool module":[[0,"google-adk-tools-authenticated-function-tool-module"]],"google.adk.tools.base_authenticated_tool module":[[0,"google-adk-tools-base-authenticated-tool-module"]],"google.adk.tools.base_tool module":[[0,"google-adk-tools-base-tool-module"]],"google.adk.tools.base_toolset module":[[0,"google-adk-tools-base-toolset-module"]],"google.adk.tools.bash_tool module":[[0,"google-adk-tools-bash-tool-module"]],"google.adk.tools.bigquery module":[[0,"module-google.adk.tools.bigquery"]],"google.adk.tools.bigtable module":[[0,"module-google.adk.tools.bigtable"]],"google.adk.tools.computer_use module":[[0,"google-adk-tools-computer-use-module"]],"google.adk.tools.crewai_tool module":[[0,"google-adk-tools-crewai-tool-module"]],"google.adk.tools.data_agent module":[[0,"google-adk-tools-data-agent-module"]],"google.adk.tools.discovery_engine_search_tool module":[[0,"google-adk-tools-discovery-engine-search-tool-module"]],"google.adk.tools.enterprise_search_tool module":[[0,"google-adk-tools-enterprise-search-tool-module"]],"google.adk.tools.environment module":[[0,"module-google.adk.tools.environment"]],"google.adk.tools.environment_simulation module":[[0,"google-adk-tools-environment-simulation-module"]],"google.adk.tools.example_tool module":[[0,"google-adk-tools-example-tool-module"]],"google.adk.tools.exit_loop_tool module":[[0,"google-adk-tools-exit-loop-tool-module"]],"google.adk.tools.function_tool module":[[0,"google-adk-tools-function-tool-module"]],"google.adk.tools.get_user_choice_tool module":[[0,"google-adk-tools-get-user-choice-tool-module"]],"google.adk.tools.google_api_tool module":[[0,"google-adk-tools-google-api-tool-module"]],"google.adk.tools.google_maps_grounding_tool module":[[0,"google-adk-tools-google-maps-grounding-tool-module"]],"google.adk.tools.google_search_agent_tool module":[[0,"google-adk-tools-google-search-agent-tool-module"]],"google.adk.tools.google_search_tool module":[[0,"google-adk-tools-google-search-tool-module"]],"google.adk.tools.google_tool module":[[0,"google-adk-tools-google-tool-module"]],"google.adk.tools.langchain_tool module":[[0,"google-adk-tools-langchain-tool-module"]],"google.adk.tools.load_artifacts_tool module":[[0,"google-adk-tools-load-artifacts-tool-module"]],"google.adk.tools.load_mcp_resource_tool module":[[0,"google-adk-tools-load-mcp-resource-tool-module"]],"google.adk.tools.load_memory_tool module":[[0,"google-adk-tools-load-memory-tool-module"]],"google.adk.tools.load_web_page module":[[0,"google-adk-tools-load-web-page-module"]],"google.adk.tools.long_running_tool module":[[0,"google-adk-tools-long-running-tool-module"]],"google.adk.tools.mcp_tool module":[[0,"google-adk-tools-mcp-tool-module"]],"google.adk.tools.openapi_tool module":[[0,"google-adk-tools-openapi-tool-module"]],"google.adk.tools.preload_memory_tool module":[[0,"google-adk-tools-preload-memory-tool-module"]],"google.adk.tools.pubsub module":[[0,"module-google.adk.tools.pubsub"]],"google.adk.tools.retrieval module":[[0,"module-google.adk.tools.retrieval"]],"google.adk.tools.set_model_response_tool module":[[0,"google-adk-tools-set-model-response-tool-module"]],"google.adk.tools.skill_toolset module":[[0,"google-adk-tools-skill-toolset-module"]],"google.adk.tools.spanner module":[[0,"module-google.adk.tools.spanner"]],"google.adk.tools.tool_configs module":[[0,"google-adk-tools-tool-configs-module"]],"google.adk.tools.tool_confirmation module":[[0,"google-adk-tools-tool-confirmation-module"]],"google.adk.tools.tool_context module":[[0,"google-adk-tools-tool-context-module"]],"google.adk.tools.toolbox_toolset module":[[0,"google-adk-tools-toolbox-toolset-module"]],"google.adk.tools.transfer_to_agent_tool module":[[0,"google-adk-tools-transfer-to-agent-tool-module"]],"google.adk.tools.url_context_tool module":[[0,"google-adk-tools-url-context-tool-module"]],"google.adk.tools.vertex_ai_load_profiles_tool module":[[0,"google-adk-tools-vertex-ai-load-profiles-tool-module"]],"google.adk.tools.vertex_ai_search_tool module":[[0,"google-adk-tools-vertex-ai-search-tool-module"]],"google.adk.utils module":[[0,"module-google.adk.utils"]],"google.adk.version module":[[0,"module-google.adk.version"]],"google.adk.workflow module":[[0,"module-google.adk.workflow"]]},"docnames":["google-adk","index"],"envversion":{"sphinx":65,"sphinx.domains.c":3,"sphinx.domains.changeset":1,"sphinx.domains.citation":1,"sphinx.domains.cpp":9,"sphinx.domains.index":1,"sphinx.domains.javascript":3,"sphinx.domains.math":2,"sphinx.domains.python":4,"sphinx.domains.rst":2,"sphinx.domains.std":2},"filenames":["google-adk.rst","index.rst"],"indexentries":{"_client (google.adk.integrations.parameter_manager.parametermanagerclient attribute)":[[0,"google.adk.integrations.parameter_manager.ParameterManagerClient._client",false],[0,"id218",false]],"_client (google.adk.integrations.secret_manager.secretmanagerclient attribute)":[[0,"google.adk.integrations.secret_manager.SecretManagerClient._client",false],[0,"id225",false]],"_credentials (google.adk.integrations.parameter_manager.parametermanagerclient attribute)":[[0,"google.adk.integrations.parameter_manager.ParameterManagerClient._credentials",false],[0,"id217",false]],"_credentials (google.adk.integrations.secret_manager.secretmanagerclient attribute)":[[0,"google.adk.integrations.secret_manager.SecretManagerClient._credentials",false],[0,"id224",false]],"actions (google.adk.agents.context property)":[[0,"google.adk.agents.Context.actions",false]],"actions (google.adk.events.event attribute)":[[0,"google.adk.events.Event.actions",false]],"active_non_blocking_tool_tasks (google.adk.agents.invocationcontext attribute)":[[0,"google.adk.agents.InvocationContext.active_non_blocking_tool_tasks",false]],"active_streaming_tools (google.adk.agents.invocationcontext attribute)":[[0,"google.adk.agents.InvocationContext.active_streaming_tools",false]],"activity_end (google.adk.agents.liverequest attribute)":[[0,"google.adk.agents.LiveRequest.activity_end",false]],"activity_start (google.adk.agents.liverequest attribute)":[[0,"google.adk.agents.LiveRequest.activity_start",false]],"add_events_to_memory() (google.adk.agents.context method)":[[0,"google.adk.agents.Context.add_events_to_memory",false]],"add_events_to_memory() (google.adk.memory.basememoryservice method)":[[0,"google.adk.memory.BaseMemoryService.add_events_to_memory",false]],"add_input_files() (google.adk.code_executors.codeexecutorcontext method)":[[0,"google.adk.code_executors.CodeExecutorContext.add_input_files",false]],"add_memory() (google.adk.agents.context method)":[[0,"google.adk.agents.Context.add_memory",false]],"add_memory() (google.adk.memory.basememoryservice method)":[[0,"google.adk.memory.BaseMemoryService.add_memory",false]],"add_processed_file_names() (google.adk.code_executors.codeexecutorcontext method)":[[0,"google.adk.code_executors.CodeExecutorContext.add_processed_file_names",false]],"add_session_to_memory() (google.adk.agents.context method)":[[0,"google.adk.agents.Context.add_session_to_memory",false]],"add_session_to_memory() (google.adk.memory.basememoryservice method)":[[0,"google.adk.memory.BaseMemoryService.add_session_to_memory",false]],"adk_to_mcp_tool_type() (in module google.adk.tools.mcp_tool)":[[0,"google.adk.tools.mcp_tool.adk_to_mcp_tool_type",false]],"after_agent_callback (google.adk.agents.baseagent attribute)":[[0,"google.adk.agents.BaseAgent.after_agent_callback",false]],"after_agent_callback() (google.adk.plugins.baseplugin method)":[[0,"google.adk.plugins.BasePlugin.after_agent_callback",false]],"after_agent_callbacks (google.adk.agents.baseagentconfig attribute)":[[0,"google.adk.agents.BaseAgentConfig.after_agent_callbacks",false]],"after_model_callback (google.adk.agents.llmagent attribute)":[[0,"google.adk.agents.LlmAgent.after_model_callback",false]],"after_model_callback() (google.adk.plugins.baseplugin method)":[[0,"google.adk.plugins.BasePlugin.after_model_callback",false]],"after_model_callbacks (google.adk.agents.llmagentconfig attribute)":[[0,"google.adk.agents.LlmAgentConfig.after_model_callbacks",false]],"after_run_callback() (google.adk.plugins.baseplugin method)":[[0,"google.adk.plugins.BasePlugin.after_run_callback",false]],"after_tool_callback (google.adk.agents.llmagent attribute)":[[0,"google.adk.agents.LlmAgent.after_tool_callback",false]],"after_tool_callback() (google.adk.plugins.baseplugin method)":[[0,"google.adk.plugins.BasePlugin.after_tool_callback",false]],"after_tool_callbacks (google.adk.agents.llmagentconfig attribute)":[[0,"google.adk.agents.LlmAgentConfig.after_tool_callbacks",false]],"agent (google.adk.agents.invocationcontext attribute)":[[0,"google.adk.agents.InvocationContext.agent",false]],"agent (google.adk.runners.inmemoryrunner attribute)":[[0,"google.adk.runners.InMemoryRunner.agent",false]],"agent (google.adk.runners.runner attribute)":[[0,"google.adk.runners.Runner.agent",false],[0,"id309",false]],"agent (google.adk.tools.agent_tool.agenttool attribute)":[[0,"google.adk.tools.agent_tool.AgentTool.agent",false]],"agent (google.adk.tools.agent_tool.agenttoolconfig attribute)":[[0,"google.adk.tools.agent_tool.AgentToolConfig.agent",false]],"agent (google.adk.tools.agenttool attribute)":[[0,"google.adk.tools.AgentTool.agent",false]],"agent (in module google.adk.agents)":[[0,"google.adk.agents.Agent",false]],"agent_class (google.adk.agents.baseagentconfig attribute)":[[0,"google.adk.agents.BaseAgentConfig.agent_class",false]],"agent_class (google.adk.agents.llmagentconfig attribute)":[[0,"google.adk.agents.LlmAgentConfig.agent_class",false]],"agent_class (google.adk.agents.loopagentconfig attribute)":[[0,"google.adk.agents.LoopAgentConfig.agent_class",false]],"agent_class (google.adk.agents.parallelagentconfig attribute)":[[0,"google.adk.agents.ParallelAgentConfig.agent_class",false]],"agent_class (google.adk.agents.sequentialagentconfig attribute)":[[0,"google.adk.agents.SequentialAgentConfig.agent_class",false]],"agent_config (google.adk.agents.managedagent attribute)":[[0,"google.adk.agents.ManagedAgent.agent_config",false]],"agent_id (google.adk.agents.managedagent attribute)":[[0,"google.adk.agents.ManagedAgent.agent_id",false]],"agent_names (google.adk.tools.transfer_to_agent_tool.transfertoagenttool attribute)":[[0,"google.adk.tools.transfer_to_agent_tool.TransferToAgentTool.agent_names",false]],"agent_names (google.adk.tools.transfertoagenttool attribute)":[[0,"google.adk.tools.TransferToAgentTool.agent_names",false]],"agent_state (google.adk.events.eventactions attribute)":[[0,"google.adk.events.EventActions.agent_state",false]],"agent_states (google.adk.agents.invocationcontext attribute)":[[0,"google.adk.agents.InvocationContext.agent_states",false]],"agentenginesandboxcomputer (class in google.adk.integrations.vmaas)":[[0,"google.adk.integrations.vmaas.AgentEngineSandboxComputer",false],[0,"id261",false]],"agentevaluator (class in google.adk.evaluation)":[[0,"google.adk.evaluation.AgentEvaluator",false]],"agentprovided (class in google.adk.integrations.eventarc)":[[0,"google.adk.integrations.eventarc.AgentProvided",false],[0,"id178",false]],"agentregistry (class in google.adk.integrations.agent_registry)":[[0,"google.adk.integrations.agent_registry.AgentRegistry",false],[0,"id93",false]],"agentsimulatorfactory (in module google.adk.tools.agent_simulator)":[[0,"google.adk.tools.agent_simulator.AgentSimulatorFactory",false]],"agenttool (class in google.adk.tools)":[[0,"google.adk.tools.AgentTool",false]],"agenttool (class in google.adk.tools.agent_tool)":[[0,"google.adk.tools.agent_tool.AgentTool",false]],"allow_egress (google.adk.integrations.cloud_run.cloudrunsandboxcodeexecutor attribute)":[[0,"google.adk.integrations.cloud_run.CloudRunSandboxCodeExecutor.allow_egress",false],[0,"id111",false]],"allowed_command_prefixes (google.adk.tools.bash_tool.bashtoolpolicy attribute)":[[0,"google.adk.tools.bash_tool.BashToolPolicy.allowed_command_prefixes",false]],"allowed_tools (google.adk.skills.frontmatter attribute)":[[0,"google.adk.skills.Frontmatter.allowed_tools",false],[0,"id318",false]],"allowed_tools (google.adk.tools.remotemcpserver attribute)":[[0,"google.adk.tools.RemoteMcpServer.allowed_tools",false]],"api_client (google.adk.agents.managedagent property)":[[0,"google.adk.agents.ManagedAgent.api_client",false]],"api_key (google.adk.labs.openai.openairesponsesllm attribute)":[[0,"google.adk.labs.openai.OpenAIResponsesLlm.api_key",false]],"apihubtoolset (class in google.adk.tools)":[[0,"google.adk.tools.APIHubToolset",false]],"apihubtoolset (class in google.adk.tools.apihub_tool)":[[0,"google.adk.tools.apihub_tool.APIHubToolset",false]],"apiregistry (class in google.adk.integrations.api_registry)":[[0,"google.adk.integrations.api_registry.ApiRegistry",false],[0,"id106",false]],"apiregistry (class in google.adk.tools)":[[0,"google.adk.tools.ApiRegistry",false]],"app_name (google.adk.agents.invocationcontext property)":[[0,"google.adk.agents.InvocationContext.app_name",false]],"app_name (google.adk.runners.inmemoryrunner attribute)":[[0,"google.adk.runners.InMemoryRunner.app_name",false]],"app_name (google.adk.runners.runner attribute)":[[0,"google.adk.runners.Runner.app_name",false],[0,"id310",false]],"app_name (google.adk.sessions.session attribute)":[[0,"google.adk.sessions.Session.app_name",false]],"app_prefix (google.adk.sessions.state attribute)":[[0,"google.adk.sessions.State.APP_PREFIX",false]],"append_event() (google.adk.sessions.basesessionservice method)":[[0,"google.adk.sessions.BaseSessionService.append_event",false]],"append_event() (google.adk.sessions.databasesessionservice method)":[[0,"google.adk.sessions.DatabaseSessionService.append_event",false]],"append_event() (google.adk.sessions.inmemorysessionservice method)":[[0,"google.adk.sessions.InMemorySessionService.append_event",false]],"append_event() (google.adk.sessions.vertexaisessionservice method)":[[0,"google.adk.sessions.VertexAiSessionService.append_event",false]],"applicationintegrationtoolset (class in google.adk.tools.application_integration_tool)":[[0,"google.adk.tools.application_integration_tool.ApplicationIntegrationToolset",false]],"apply_thinking_config() (google.adk.planners.builtinplanner method)":[[0,"google.adk.planners.BuiltInPlanner.apply_thinking_config",false]],"args (google.adk.tools.tool_configs.toolconfig attribute)":[[0,"google.adk.tools.tool_configs.ToolConfig.args",false]],"artifact_delta (google.adk.events.eventactions attribute)":[[0,"google.adk.events.EventActions.artifact_delta",false]],"artifact_service (google.adk.agents.invocationcontext attribute)":[[0,"google.adk.agents.InvocationContext.artifact_service",false]],"artifact_service (google.adk.runners.runner attribute)":[[0,"google.adk.runners.Runner.artifact_service",false],[0,"id311",false]],"assets (google.adk.skills.resources attribute)":[[0,"google.adk.skills.Resources.assets",false],[0,"id324",false]],"attempt_count (google.adk.agents.context property)":[[0,"google.adk.agents.Context.attempt_count",false]],"auth_config (google.adk.tools.authtoolarguments attribute)":[[0,"google.adk.tools.AuthToolArguments.auth_config",false]],"auth_config (google.adk.workflow.functionnode attribute)":[[0,"google.adk.workflow.FunctionNode.auth_config",false]],"auth_credential (google.adk.tools.mcp_tool.mcptoolset property)":[[0,"google.adk.tools.mcp_tool.McpToolset.auth_credential",false]],"auth_credential (google.adk.tools.mcptoolset property)":[[0,"google.adk.tools.McpToolset.auth_credential",false]],"auth_scheme (google.adk.tools.mcp_tool.mcptoolset property)":[[0,"google.adk.tools.mcp_tool.McpToolset.auth_scheme",false]],"auth_scheme (google.adk.tools.mcptoolset property)":[[0,"google.adk.tools.McpToolset.auth_scheme",false]],"authenticatedfunctiontool (class in google.adk.tools.authenticated_function_tool)":[[0,"google.adk.tools.authenticated_function_tool.AuthenticatedFunctionTool",false]],"author (google.adk.events.event attribute)":[[0,"google.adk.events.Event.author",false]],"avatar_config (google.adk.agents.runconfig attribute)":[[0,"google.adk.agents.RunConfig.avatar_config",false]],"azure_endpoint (google.adk.labs.openai.azureopenairesponsesllm attribute)":[[0,"google.adk.labs.openai.AzureOpenAIResponsesLlm.azure_endpoint",false]],"backoff_factor (google.adk.workflow.retryconfig attribute)":[[0,"google.adk.workflow.RetryConfig.backoff_factor",false]],"baseartifactservice (class in google.adk.artifacts)":[[0,"google.adk.artifacts.BaseArtifactService",false]],"baseauthenticatedtool (class in google.adk.tools.base_authenticated_tool)":[[0,"google.adk.tools.base_authenticated_tool.BaseAuthenticatedTool",false]],"baseenvironment (class in google.adk.environment)":[[0,"google.adk.environment.BaseEnvironment",false]],"baseexampleprovider (class in google.adk.examples)":[[0,"google.adk.examples.BaseExampleProvider",false]],"basememoryservice (class in google.adk.memory)":[[0,"google.adk.memory.BaseMemoryService",false]],"baseplanner (class in google.adk.planners)":[[0,"google.adk.planners.BasePlanner",false]],"baseplugin (class in google.adk.plugins)":[[0,"google.adk.plugins.BasePlugin",false]],"baseretrievaltool (class in google.adk.tools.retrieval)":[[0,"google.adk.tools.retrieval.BaseRetrievalTool",false]],"basesessionservice (class in google.adk.sessions)":[[0,"google.adk.sessions.BaseSessionService",false]],"basetool (class in google.adk.tools)":[[0,"google.adk.tools.BaseTool",false]],"basetool (class in google.adk.tools.base_tool)":[[0,"google.adk.tools.base_tool.BaseTool",false]],"basetoolset (class in google.adk.tools.base_toolset)":[[0,"google.adk.tools.base_toolset.BaseToolset",false]],"bashtoolpolicy (class in google.adk.tools.bash_tool)":[[0,"google.adk.tools.bash_tool.BashToolPolicy",false]],"before_agent_callback (google.adk.agents.baseagent attribute)":[[0,"google.adk.agents.BaseAgent.before_agent_callback",false]],"before_agent_callback() (google.adk.plugins.baseplugin method)":[[0,"google.adk.plugins.BasePlugin.before_agent_callback",false]],"before_agent_callbacks (google.adk.agents.baseagentconfig attribute)":[[0,"google.adk.agents.BaseAgentConfig.before_agent_callbacks",false]],"before_model_callback (google.adk.agents.llmagent attribute)":[[0,"google.adk.agents.LlmAgent.before_model_callback",false]],"before_model_callback() (google.adk.plugins.baseplugin method)":[[0,"google.adk.plugins.BasePlugin.before_model_callback",false]],"before_model_callbacks (google.adk.agents.llmagentconfig attribute)":[[0,"google.adk.agents.LlmAgentConfig.before_model_callbacks",false]],"before_run_callback() (google.adk.plugins.baseplugin method)":[[0,"google.adk.plugins.BasePlugin.before_run_callback",false]],"before_tool_callback (google.adk.agents.llmagent attribute)":[[0,"google.adk.agents.LlmAgent.before_tool_callback",false]],"before_tool_callback() (google.adk.plugins.baseplugin method)":[[0,"google.adk.plugins.BasePlugin.before_tool_callback",false]],"before_tool_callbacks (google.adk.agents.llmagentconfig attribute)":[[0,"google.adk.agents.LlmAgentConfig.before_tool_callbacks",false]],"bigquerytoolset (class in google.adk.tools.google_api_tool)":[[0,"google.adk.tools.google_api_tool.BigQueryToolset",false]],"bigtabletoolset (class in google.adk.tools.bigtable)":[[0,"google.adk.tools.bigtable.BigtableToolset",false]],"blob (google.adk.agents.liverequest attribute)":[[0,"google.adk.agents.LiveRequest.blob",false]],"blocked_operators (google.adk.tools.bash_tool.bashtoolpolicy attribute)":[[0,"google.adk.tools.bash_tool.BashToolPolicy.blocked_operators",false]],"branch (google.adk.agents.context property)":[[0,"google.adk.agents.Context.branch",false]],"branch (google.adk.agents.invocationcontext attribute)":[[0,"google.adk.agents.InvocationContext.branch",false]],"branch (google.adk.events.event attribute)":[[0,"google.adk.events.Event.branch",false]],"build_planning_instruction() (google.adk.planners.baseplanner method)":[[0,"google.adk.planners.BasePlanner.build_planning_instruction",false]],"build_planning_instruction() (google.adk.planners.builtinplanner method)":[[0,"google.adk.planners.BuiltInPlanner.build_planning_instruction",false]],"build_planning_instruction() (google.adk.planners.planreactplanner method)":[[0,"google.adk.planners.PlanReActPlanner.build_planning_instruction",false]],"builtinplanner (class in google.adk.planners)":[[0,"google.adk.planners.BuiltInPlanner",false]],"calendartoolset (class in google.adk.tools.google_api_tool)":[[0,"google.adk.tools.google_api_tool.CalendarToolset",false]],"call() (google.adk.tools.openapi_tool.restapitool method)":[[0,"google.adk.tools.openapi_tool.RestApiTool.call",false]],"canonical_after_agent_callbacks (google.adk.agents.baseagent property)":[[0,"google.adk.agents.BaseAgent.canonical_after_agent_callbacks",false]],"canonical_after_model_callbacks (google.adk.agents.llmagent property)":[[0,"google.adk.agents.LlmAgent.canonical_after_model_callbacks",false]],"canonical_after_tool_callbacks (google.adk.agents.llmagent property)":[[0,"google.adk.agents.LlmAgent.canonical_after_tool_callbacks",false]],"canonical_before_agent_callbacks (google.adk.agents.baseagent property)":[[0,"google.adk.agents.BaseAgent.canonical_before_agent_callbacks",false]],"canonical_before_model_callbacks (google.adk.agents.llmagent property)":[[0,"google.adk.agents.LlmAgent.canonical_before_model_callbacks",false]],"canonical_before_tool_callbacks (google.adk.agents.llmagent property)":[[0,"google.adk.agents.LlmAgent.canonical_before_tool_callbacks",false]],"canonical_global_instruction() (google.adk.agents.llmagent method)":[[0,"google.adk.agents.LlmAgent.canonical_global_instruction",false]],"canonical_instruction() (google.adk.agents.llmagent method)":[[0,"google.adk.agents.LlmAgent.canonical_instruction",false]],"canonical_instruction() (google.adk.agents.managedagent method)":[[0,"google.adk.agents.ManagedAgent.canonical_instruction",false]],"canonical_live_model (google.adk.agents.llmagent property)":[[0,"google.adk.agents.LlmAgent.canonical_live_model",false]],"canonical_model (google.adk.agents.llmagent property)":[[0,"google.adk.agents.LlmAgent.canonical_model",false]],"canonical_on_model_error_callbacks (google.adk.agents.llmagent property)":[[0,"google.adk.agents.LlmAgent.canonical_on_model_error_callbacks",false]],"canonical_on_tool_error_callbacks (google.adk.agents.llmagent property)":[[0,"google.adk.agents.LlmAgent.canonical_on_tool_error_callbacks",false]],"canonical_tools() (google.adk.agents.llmagent method)":[[0,"google.adk.agents.LlmAgent.canonical_tools",false]],"canonical_tools_cache (google.adk.agents.invocationcontext attribute)":[[0,"google.adk.agents.InvocationContext.canonical_tools_cache",false]],"capture_message_content (google.adk.telemetry.telemetryconfig attribute)":[[0,"google.adk.telemetry.TelemetryConfig.capture_message_content",false],[0,"id330",false]],"check_for_deprecated_save_live_audio() (google.adk.agents.runconfig class method)":[[0,"google.adk.agents.RunConfig.check_for_deprecated_save_live_audio",false]],"check_require_confirmation() (google.adk.tools.base_tool.basetool method)":[[0,"google.adk.tools.base_tool.BaseTool.check_require_confirmation",false]],"check_require_confirmation() (google.adk.tools.basetool method)":[[0,"google.adk.tools.BaseTool.check_require_confirmation",false]],"check_require_confirmation() (google.adk.tools.function_tool.functiontool method)":[[0,"google.adk.tools.function_tool.FunctionTool.check_require_confirmation",false]],"check_require_confirmation() (google.adk.tools.functiontool method)":[[0,"google.adk.tools.FunctionTool.check_require_confirmation",false]],"check_require_confirmation() (google.adk.tools.mcp_tool.mcptool method)":[[0,"google.adk.tools.mcp_tool.McpTool.check_require_confirmation",false]],"chunks (google.adk.tools.discovery_engine_search_tool.searchresultmode attribute)":[[0,"google.adk.tools.discovery_engine_search_tool.SearchResultMode.CHUNKS",false]],"chunks (google.adk.tools.searchresultmode attribute)":[[0,"google.adk.tools.SearchResultMode.CHUNKS",false]],"clear_input_files() (google.adk.code_executors.codeexecutorcontext method)":[[0,"google.adk.code_executors.CodeExecutorContext.clear_input_files",false]],"click_at() (google.adk.integrations.vmaas.agentenginesandboxcomputer method)":[[0,"google.adk.integrations.vmaas.AgentEngineSandboxComputer.click_at",false],[0,"id270",false]],"click_at() (google.adk.integrations.vmaas.sandboxclient method)":[[0,"google.adk.integrations.vmaas.SandboxClient.click_at",false],[0,"id290",false]],"client (google.adk.labs.openai.openairesponsesllm attribute)":[[0,"google.adk.labs.openai.OpenAIResponsesLlm.client",false]],"clone() (google.adk.agents.baseagent method)":[[0,"google.adk.agents.BaseAgent.clone",false]],"clone_with_updated_skills() (google.adk.tools.skill_toolset.skilltoolset method)":[[0,"google.adk.tools.skill_toolset.SkillToolset.clone_with_updated_skills",false]],"close (google.adk.agents.liverequest attribute)":[[0,"google.adk.agents.LiveRequest.close",false]],"close() (google.adk.agents.liverequestqueue method)":[[0,"google.adk.agents.LiveRequestQueue.close",false]],"close() (google.adk.environment.baseenvironment method)":[[0,"google.adk.environment.BaseEnvironment.close",false]],"close() (google.adk.environment.localenvironment method)":[[0,"google.adk.environment.LocalEnvironment.close",false]],"close() (google.adk.integrations.daytona.daytonaenvironment method)":[[0,"google.adk.integrations.daytona.DaytonaEnvironment.close",false],[0,"id147",false]],"close() (google.adk.integrations.e2b.e2benvironment method)":[[0,"google.adk.integrations.e2b.E2BEnvironment.close",false],[0,"id171",false]],"close() (google.adk.integrations.eventarc.eventarctoolset method)":[[0,"google.adk.integrations.eventarc.EventarcToolset.close",false],[0,"id196",false]],"close() (google.adk.integrations.vmaas.agentenginesandboxcomputer method)":[[0,"google.adk.integrations.vmaas.AgentEngineSandboxComputer.close",false],[0,"id271",false]],"close() (google.adk.plugins.baseplugin method)":[[0,"google.adk.plugins.BasePlugin.close",false]],"close() (google.adk.plugins.pluginmanager method)":[[0,"google.adk.plugins.PluginManager.close",false]],"close() (google.adk.runners.runner method)":[[0,"google.adk.runners.Runner.close",false]],"close() (google.adk.sessions.databasesessionservice method)":[[0,"google.adk.sessions.DatabaseSessionService.close",false]],"close() (google.adk.tools.apihub_tool.apihubtoolset method)":[[0,"google.adk.tools.apihub_tool.APIHubToolset.close",false]],"close() (google.adk.tools.apihubtoolset method)":[[0,"google.adk.tools.APIHubToolset.close",false]],"close() (google.adk.tools.application_integration_tool.applicationintegrationtoolset method)":[[0,"google.adk.tools.application_integration_tool.ApplicationIntegrationToolset.close",false]],"close() (google.adk.tools.base_toolset.basetoolset method)":[[0,"google.adk.tools.base_toolset.BaseToolset.close",false]],"close() (google.adk.tools.data_agent.dataagenttoolset method)":[[0,"google.adk.tools.data_agent.DataAgentToolset.close",false]],"close() (google.adk.tools.environment.environmenttoolset method)":[[0,"google.adk.tools.environment.EnvironmentToolset.close",false]],"close() (google.adk.tools.google_api_tool.googleapitoolset method)":[[0,"google.adk.tools.google_api_tool.GoogleApiToolset.close",false]],"close() (google.adk.tools.mcp_tool.mcptoolset method)":[[0,"google.adk.tools.mcp_tool.McpToolset.close",false]],"close() (google.adk.tools.mcptoolset method)":[[0,"google.adk.tools.McpToolset.close",false]],"close() (google.adk.tools.openapi_tool.openapitoolset method)":[[0,"google.adk.tools.openapi_tool.OpenAPIToolset.close",false]],"close() (google.adk.tools.pubsub.pubsubtoolset method)":[[0,"google.adk.tools.pubsub.PubSubToolset.close",false]],"close() (google.adk.tools.skill_toolset.skilltoolset method)":[[0,"google.adk.tools.skill_toolset.SkillToolset.close",false]],"close() (google.adk.tools.spanner.spanneradmintoolset method)":[[0,"google.adk.tools.spanner.SpannerAdminToolset.close",false]],"close() (google.adk.tools.spanner.spannertoolset method)":[[0,"google.adk.tools.spanner.SpannerToolset.close",false]],"close() (google.adk.tools.toolbox_toolset.toolboxtoolset method)":[[0,"google.adk.tools.toolbox_toolset.ToolboxToolset.close",false]],"cloudeventattributesbinding (class in google.adk.integrations.eventarc)":[[0,"google.adk.integrations.eventarc.CloudEventAttributesBinding",false],[0,"id181",false]],"code_block_delimiters (google.adk.code_executors.basecodeexecutor attribute)":[[0,"google.adk.code_executors.BaseCodeExecutor.code_block_delimiters",false],[0,"id67",false]],"code_block_delimiters (google.adk.integrations.cloud_run.cloudrunsandboxcodeexecutor attribute)":[[0,"google.adk.integrations.cloud_run.CloudRunSandboxCodeExecutor.code_block_delimiters",false]],"code_executor (google.adk.agents.llmagent attribute)":[[0,"google.adk.agents.LlmAgent.code_executor",false]],"codeexecutorcontext (class in google.adk.code_executors)":[[0,"google.adk.code_executors.CodeExecutorContext",false]],"compaction (google.adk.events.eventactions attribute)":[[0,"google.adk.events.EventActions.compaction",false]],"compatibility (google.adk.skills.frontmatter attribute)":[[0,"google.adk.skills.Frontmatter.compatibility",false],[0,"id319",false]],"config_type (google.adk.agents.baseagent attribute)":[[0,"google.adk.agents.BaseAgent.config_type",false]],"config_type (google.adk.agents.llmagent attribute)":[[0,"google.adk.agents.LlmAgent.config_type",false]],"config_type (google.adk.agents.loopagent attribute)":[[0,"google.adk.agents.LoopAgent.config_type",false]],"config_type (google.adk.agents.parallelagent attribute)":[[0,"google.adk.agents.ParallelAgent.config_type",false]],"config_type (google.adk.agents.sequentialagent attribute)":[[0,"google.adk.agents.SequentialAgent.config_type",false]],"configure_auth() (google.adk.tools.google_api_tool.googleapitool method)":[[0,"google.adk.tools.google_api_tool.GoogleApiTool.configure_auth",false]],"configure_auth() (google.adk.tools.google_api_tool.googleapitoolset method)":[[0,"google.adk.tools.google_api_tool.GoogleApiToolset.configure_auth",false]],"configure_auth_credential() (google.adk.tools.openapi_tool.restapitool method)":[[0,"google.adk.tools.openapi_tool.RestApiTool.configure_auth_credential",false]],"configure_auth_scheme() (google.adk.tools.openapi_tool.restapitool method)":[[0,"google.adk.tools.openapi_tool.RestApiTool.configure_auth_scheme",false]],"configure_credential_key() (google.adk.tools.openapi_tool.restapitool method)":[[0,"google.adk.tools.openapi_tool.RestApiTool.configure_credential_key",false]],"configure_sa_auth() (google.adk.tools.google_api_tool.googleapitool method)":[[0,"google.adk.tools.google_api_tool.GoogleApiTool.configure_sa_auth",false]],"configure_sa_auth() (google.adk.tools.google_api_tool.googleapitoolset method)":[[0,"google.adk.tools.google_api_tool.GoogleApiToolset.configure_sa_auth",false]],"configure_ssl_verify() (google.adk.tools.openapi_tool.restapitool method)":[[0,"google.adk.tools.openapi_tool.RestApiTool.configure_ssl_verify",false]],"configure_ssl_verify_all() (google.adk.tools.openapi_tool.openapitoolset method)":[[0,"google.adk.tools.openapi_tool.OpenAPIToolset.configure_ssl_verify_all",false]],"confirmed (google.adk.tools.tool_confirmation.toolconfirmation attribute)":[[0,"google.adk.tools.tool_confirmation.ToolConfirmation.confirmed",false]],"connect() (google.adk.models.basellm method)":[[0,"google.adk.models.BaseLlm.connect",false]],"connection_params (google.adk.tools.mcp_tool.mcptoolset property)":[[0,"google.adk.tools.mcp_tool.McpToolset.connection_params",false]],"connection_params (google.adk.tools.mcptoolset property)":[[0,"google.adk.tools.McpToolset.connection_params",false]],"content (google.adk.agents.liverequest attribute)":[[0,"google.adk.agents.LiveRequest.content",false]],"content_capturing_mode_value (google.adk.telemetry.telemetryconfig property)":[[0,"google.adk.telemetry.TelemetryConfig.content_capturing_mode_value",false]],"contentcapturingmode (class in google.adk.telemetry)":[[0,"google.adk.telemetry.ContentCapturingMode",false]],"context (class in google.adk.agents)":[[0,"google.adk.agents.Context",false]],"context_cache_config (google.adk.agents.invocationcontext attribute)":[[0,"google.adk.agents.InvocationContext.context_cache_config",false]],"context_cache_config (google.adk.runners.runner attribute)":[[0,"google.adk.runners.Runner.context_cache_config",false],[0,"id312",false]],"context_window_compression (google.adk.agents.runconfig attribute)":[[0,"google.adk.agents.RunConfig.context_window_compression",false]],"continue_uri (google.adk.integrations.agent_identity.gcpauthproviderscheme attribute)":[[0,"google.adk.integrations.agent_identity.GcpAuthProviderScheme.continue_uri",false],[0,"id75",false],[0,"id86",false],[0,"id88",false]],"create_callback() (google.adk.tools.environment_simulation.environmentsimulationfactory static method)":[[0,"google.adk.tools.environment_simulation.EnvironmentSimulationFactory.create_callback",false]],"create_google_search_agent() (in module google.adk.tools.google_search_agent_tool)":[[0,"google.adk.tools.google_search_agent_tool.create_google_search_agent",false]],"create_plugin() (google.adk.tools.environment_simulation.environmentsimulationfactory static method)":[[0,"google.adk.tools.environment_simulation.EnvironmentSimulationFactory.create_plugin",false]],"create_publish_tool() (google.adk.integrations.eventarc.eventarctoolset method)":[[0,"google.adk.integrations.eventarc.EventarcToolset.create_publish_tool",false],[0,"id197",false]],"create_session() (google.adk.sessions.basesessionservice method)":[[0,"google.adk.sessions.BaseSessionService.create_session",false]],"create_session() (google.adk.sessions.databasesessionservice method)":[[0,"google.adk.sessions.DatabaseSessionService.create_session",false]],"create_session() (google.adk.sessions.inmemorysessionservice method)":[[0,"google.adk.sessions.InMemorySessionService.create_session",false]],"create_session() (google.adk.sessions.vertexaisessionservice method)":[[0,"google.adk.sessions.VertexAiSessionService.create_session",false]],"create_session_sync() (google.adk.sessions.inmemorysessionservice method)":[[0,"google.adk.sessions.InMemorySessionService.create_session_sync",false]],"credential_by_key (google.adk.agents.invocationcontext attribute)":[[0,"google.adk.agents.InvocationContext.credential_by_key",false]],"credential_service (google.adk.agents.invocationcontext attribute)":[[0,"google.adk.agents.InvocationContext.credential_service",false]],"credential_service (google.adk.runners.runner attribute)":[[0,"google.adk.runners.Runner.credential_service",false],[0,"id313",false]],"crewaitool (class in google.adk.integrations.crewai)":[[0,"google.adk.integrations.crewai.CrewaiTool",false],[0,"id119",false]],"crewaitool (class in google.adk.tools.crewai_tool)":[[0,"google.adk.tools.crewai_tool.CrewaiTool",false]],"current_state() (google.adk.integrations.vmaas.agentenginesandboxcomputer method)":[[0,"google.adk.integrations.vmaas.AgentEngineSandboxComputer.current_state",false],[0,"id272",false]],"custom_attributes (google.adk.integrations.eventarc.cloudeventattributesbinding attribute)":[[0,"google.adk.integrations.eventarc.CloudEventAttributesBinding.custom_attributes",false],[0,"id182",false]],"custom_metadata (google.adk.agents.context property)":[[0,"google.adk.agents.Context.custom_metadata",false]],"custom_metadata (google.adk.agents.runconfig attribute)":[[0,"google.adk.agents.RunConfig.custom_metadata",false]],"custom_metadata (google.adk.tools.base_tool.basetool attribute)":[[0,"google.adk.tools.base_tool.BaseTool.custom_metadata",false]],"custom_metadata (google.adk.tools.basetool attribute)":[[0,"google.adk.tools.BaseTool.custom_metadata",false]],"data_store_id (google.adk.tools.vertex_ai_search_tool.vertexaisearchtool attribute)":[[0,"google.adk.tools.vertex_ai_search_tool.VertexAiSearchTool.data_store_id",false]],"data_store_id (google.adk.tools.vertexaisearchtool attribute)":[[0,"google.adk.tools.VertexAiSearchTool.data_store_id",false]],"dataagenttoolset (class in google.adk.tools.data_agent)":[[0,"google.adk.tools.data_agent.DataAgentToolset",false]],"databasesessionservice (class in google.adk.sessions)":[[0,"google.adk.sessions.DatabaseSessionService",false]],"datacontenttype (google.adk.integrations.eventarc.cloudeventattributesbinding attribute)":[[0,"google.adk.integrations.eventarc.CloudEventAttributesBinding.datacontenttype",false],[0,"id183",false]],"daytonaenvironment (class in google.adk.integrations.daytona)":[[0,"google.adk.integrations.daytona.DaytonaEnvironment",false],[0,"id146",false]],"default (google.adk.integrations.eventarc.agentprovided attribute)":[[0,"google.adk.integrations.eventarc.AgentProvided.default",false],[0,"id179",false]],"default_live_model (google.adk.agents.llmagent attribute)":[[0,"google.adk.agents.LlmAgent.DEFAULT_LIVE_MODEL",false]],"default_model (google.adk.agents.llmagent attribute)":[[0,"google.adk.agents.LlmAgent.DEFAULT_MODEL",false]],"delete_artifact() (google.adk.artifacts.baseartifactservice method)":[[0,"google.adk.artifacts.BaseArtifactService.delete_artifact",false]],"delete_session() (google.adk.sessions.basesessionservice method)":[[0,"google.adk.sessions.BaseSessionService.delete_session",false]],"delete_session() (google.adk.sessions.databasesessionservice method)":[[0,"google.adk.sessions.DatabaseSessionService.delete_session",false]],"delete_session() (google.adk.sessions.inmemorysessionservice method)":[[0,"google.adk.sessions.InMemorySessionService.delete_session",false]],"delete_session() (google.adk.sessions.vertexaisessionservice method)":[[0,"google.adk.sessions.VertexAiSessionService.delete_session",false]],"delete_session_sync() (google.adk.sessions.inmemorysessionservice method)":[[0,"google.adk.sessions.InMemorySessionService.delete_session_sync",false]],"description (google.adk.agents.baseagent attribute)":[[0,"google.adk.agents.BaseAgent.description",false]],"description (google.adk.agents.baseagentconfig attribute)":[[0,"google.adk.agents.BaseAgentConfig.description",false]],"description (google.adk.integrations.crewai.crewaitool attribute)":[[0,"google.adk.integrations.crewai.CrewaiTool.description",false]],"description (google.adk.integrations.crewai.crewaitoolconfig attribute)":[[0,"google.adk.integrations.crewai.CrewaiToolConfig.description",false],[0,"id126",false]],"description (google.adk.integrations.eventarc.agentprovided attribute)":[[0,"google.adk.integrations.eventarc.AgentProvided.description",false],[0,"id180",false]],"description (google.adk.integrations.langchain.langchaintoolconfig attribute)":[[0,"google.adk.integrations.langchain.LangchainToolConfig.description",false],[0,"id211",false]],"description (google.adk.skills.frontmatter attribute)":[[0,"google.adk.skills.Frontmatter.description",false],[0,"id320",false]],"description (google.adk.skills.skill property)":[[0,"google.adk.skills.Skill.description",false]],"description (google.adk.tools.base_tool.basetool attribute)":[[0,"google.adk.tools.base_tool.BaseTool.description",false]],"description (google.adk.tools.basetool attribute)":[[0,"google.adk.tools.BaseTool.description",false]],"description (google.adk.tools.crewai_tool.crewaitool attribute)":[[0,"google.adk.tools.crewai_tool.CrewaiTool.description",false]],"description (google.adk.tools.crewai_tool.crewaitoolconfig attribute)":[[0,"google.adk.tools.crewai_tool.CrewaiToolConfig.description",false]],"description (google.adk.tools.langchain_tool.langchaintoolconfig attribute)":[[0,"google.adk.tools.langchain_tool.LangchainToolConfig.description",false]],"description (google.adk.workflow.basenode attribute)":[[0,"google.adk.workflow.BaseNode.description",false]],"disallow_transfer_to_parent (google.adk.agents.llmagent attribute)":[[0,"google.adk.agents.LlmAgent.disallow_transfer_to_parent",false]],"disallow_transfer_to_parent (google.adk.agents.llmagentconfig attribute)":[[0,"google.adk.agents.LlmAgentConfig.disallow_transfer_to_parent",false]],"disallow_transfer_to_peers (google.adk.agents.llmagent attribute)":[[0,"google.adk.agents.LlmAgent.disallow_transfer_to_peers",false]],"disallow_transfer_to_peers (google.adk.agents.llmagentconfig attribute)":[[0,"google.adk.agents.LlmAgentConfig.disallow_transfer_to_peers",false]],"discovery_engine_search() (google.adk.tools.discovery_engine_search_tool.discoveryenginesearchtool method)":[[0,"google.adk.tools.discovery_engine_search_tool.DiscoveryEngineSearchTool.discovery_engine_search",false]],"discovery_engine_search() (google.adk.tools.discoveryenginesearchtool method)":[[0,"google.adk.tools.DiscoveryEngineSearchTool.discovery_engine_search",false]],"discoveryenginesearchtool (class in google.adk.tools)":[[0,"google.adk.tools.DiscoveryEngineSearchTool",false]],"discoveryenginesearchtool (class in google.adk.tools.discovery_engine_search_tool)":[[0,"google.adk.tools.discovery_engine_search_tool.DiscoveryEngineSearchTool",false]],"docstoolset (class in google.adk.tools.google_api_tool)":[[0,"google.adk.tools.google_api_tool.DocsToolset",false]],"documents (google.adk.tools.discovery_engine_search_tool.searchresultmode attribute)":[[0,"google.adk.tools.discovery_engine_search_tool.SearchResultMode.DOCUMENTS",false]],"documents (google.adk.tools.searchresultmode attribute)":[[0,"google.adk.tools.SearchResultMode.DOCUMENTS",false]],"drag_and_drop() (google.adk.integrations.vmaas.agentenginesandboxcomputer method)":[[0,"google.adk.integrations.vmaas.AgentEngineSandboxComputer.drag_and_drop",false],[0,"id273",false]],"drag_and_drop() (google.adk.integrations.vmaas.sandboxclient method)":[[0,"google.adk.integrations.vmaas.SandboxClient.drag_and_drop",false],[0,"id291",false]],"e2benvironment (class in google.adk.integrations.e2b)":[[0,"google.adk.integrations.e2b.E2BEnvironment",false],[0,"id170",false]],"edges (google.adk.workflow.workflow attribute)":[[0,"google.adk.workflow.Workflow.edges",false]],"enable_affective_dialog (google.adk.agents.runconfig attribute)":[[0,"google.adk.agents.RunConfig.enable_affective_dialog",false]],"end_invocation (google.adk.agents.invocationcontext attribute)":[[0,"google.adk.agents.InvocationContext.end_invocation",false]],"end_of_agent (google.adk.events.eventactions attribute)":[[0,"google.adk.events.EventActions.end_of_agent",false]],"end_of_agents (google.adk.agents.invocationcontext attribute)":[[0,"google.adk.agents.InvocationContext.end_of_agents",false]],"enterprisewebsearchtool (class in google.adk.tools.enterprise_search_tool)":[[0,"google.adk.tools.enterprise_search_tool.EnterpriseWebSearchTool",false]],"environment (google.adk.agents.managedagent attribute)":[[0,"google.adk.agents.ManagedAgent.environment",false]],"environment() (google.adk.integrations.vmaas.agentenginesandboxcomputer method)":[[0,"google.adk.integrations.vmaas.AgentEngineSandboxComputer.environment",false],[0,"id274",false]],"environmentsimulationfactory (class in google.adk.tools.environment_simulation)":[[0,"google.adk.tools.environment_simulation.EnvironmentSimulationFactory",false]],"environmenttoolset (class in google.adk.tools.environment)":[[0,"google.adk.tools.environment.EnvironmentToolset",false]],"errlog (google.adk.tools.mcp_tool.mcptoolset property)":[[0,"google.adk.tools.mcp_tool.McpToolset.errlog",false]],"errlog (google.adk.tools.mcptoolset property)":[[0,"google.adk.tools.McpToolset.errlog",false]],"error (google.adk.agents.context property)":[[0,"google.adk.agents.Context.error",false]],"error_node_path (google.adk.agents.context property)":[[0,"google.adk.agents.Context.error_node_path",false]],"error_retry_attempts (google.adk.code_executors.basecodeexecutor attribute)":[[0,"google.adk.code_executors.BaseCodeExecutor.error_retry_attempts",false],[0,"id68",false]],"error_retry_attempts (google.adk.integrations.cloud_run.cloudrunsandboxcodeexecutor attribute)":[[0,"google.adk.integrations.cloud_run.CloudRunSandboxCodeExecutor.error_retry_attempts",false]],"escalate (google.adk.events.eventactions attribute)":[[0,"google.adk.events.EventActions.escalate",false]],"evaluate() (google.adk.evaluation.agentevaluator static method)":[[0,"google.adk.evaluation.AgentEvaluator.evaluate",false]],"evaluate_eval_set() (google.adk.evaluation.agentevaluator static method)":[[0,"google.adk.evaluation.AgentEvaluator.evaluate_eval_set",false]],"event_author (google.adk.agents.context property)":[[0,"google.adk.agents.Context.event_author",false]],"event_only (google.adk.telemetry.contentcapturingmode attribute)":[[0,"google.adk.telemetry.ContentCapturingMode.EVENT_ONLY",false]],"eventarctoolset (class in google.adk.integrations.eventarc)":[[0,"google.adk.integrations.eventarc.EventarcToolset",false],[0,"id195",false]],"events (google.adk.sessions.session attribute)":[[0,"google.adk.sessions.Session.events",false]],"events_compaction_config (google.adk.agents.invocationcontext attribute)":[[0,"google.adk.agents.InvocationContext.events_compaction_config",false]],"examples (google.adk.tools.example_tool.exampletool attribute)":[[0,"google.adk.tools.example_tool.ExampleTool.examples",false]],"examples (google.adk.tools.example_tool.exampletoolconfig attribute)":[[0,"google.adk.tools.example_tool.ExampleToolConfig.examples",false]],"examples (google.adk.tools.exampletool attribute)":[[0,"google.adk.tools.ExampleTool.examples",false]],"exampletool (class in google.adk.tools)":[[0,"google.adk.tools.ExampleTool",false]],"exampletool (class in google.adk.tools.example_tool)":[[0,"google.adk.tools.example_tool.ExampleTool",false]],"exceptions (google.adk.workflow.retryconfig attribute)":[[0,"google.adk.workflow.RetryConfig.exceptions",false]],"exclude_fields (google.adk.tools.application_integration_tool.integrationconnectortool attribute)":[[0,"google.adk.tools.application_integration_tool.IntegrationConnectorTool.EXCLUDE_FIELDS",false]],"execute() (google.adk.environment.baseenvironment method)":[[0,"google.adk.environment.BaseEnvironment.execute",false]],"execute() (google.adk.environment.localenvironment method)":[[0,"google.adk.environment.LocalEnvironment.execute",false]],"execute() (google.adk.integrations.daytona.daytonaenvironment method)":[[0,"google.adk.integrations.daytona.DaytonaEnvironment.execute",false],[0,"id148",false]],"execute() (google.adk.integrations.e2b.e2benvironment method)":[[0,"google.adk.integrations.e2b.E2BEnvironment.execute",false],[0,"id172",false]],"execute_code() (google.adk.code_executors.basecodeexecutor method)":[[0,"google.adk.code_executors.BaseCodeExecutor.execute_code",false]],"execute_code() (google.adk.code_executors.builtincodeexecutor method)":[[0,"google.adk.code_executors.BuiltInCodeExecutor.execute_code",false]],"execute_code() (google.adk.code_executors.unsafelocalcodeexecutor method)":[[0,"google.adk.code_executors.UnsafeLocalCodeExecutor.execute_code",false]],"execute_code() (google.adk.integrations.cloud_run.cloudrunsandboxcodeexecutor method)":[[0,"google.adk.integrations.cloud_run.CloudRunSandboxCodeExecutor.execute_code",false],[0,"id115",false]],"executebashtool (class in google.adk.tools.bash_tool)":[[0,"google.adk.tools.bash_tool.ExecuteBashTool",false]],"execution_result_delimiters (google.adk.code_executors.basecodeexecutor attribute)":[[0,"google.adk.code_executors.BaseCodeExecutor.execution_result_delimiters",false],[0,"id69",false]],"execution_result_delimiters (google.adk.integrations.cloud_run.cloudrunsandboxcodeexecutor attribute)":[[0,"google.adk.integrations.cloud_run.CloudRunSandboxCodeExecutor.execution_result_delimiters",false]],"executionresult (class in google.adk.environment)":[[0,"google.adk.environment.ExecutionResult",false]],"exit_code (google.adk.environment.executionresult attribute)":[[0,"google.adk.environment.ExecutionResult.exit_code",false]],"exit_loop() (in module google.adk.tools)":[[0,"google.adk.tools.exit_loop",false]],"exit_loop() (in module google.adk.tools.exit_loop_tool)":[[0,"google.adk.tools.exit_loop_tool.exit_loop",false]],"explicit_vad_signal (google.adk.agents.runconfig attribute)":[[0,"google.adk.agents.RunConfig.explicit_vad_signal",false]],"extra_request_args (google.adk.labs.openai.openairesponsesllm attribute)":[[0,"google.adk.labs.openai.OpenAIResponsesLlm.extra_request_args",false]],"field_name (google.adk.agents.runconfig attribute)":[[0,"google.adk.agents.RunConfig.field_name",false],[0,"id66",false]],"find_agent() (google.adk.agents.baseagent method)":[[0,"google.adk.agents.BaseAgent.find_agent",false]],"find_config_for_test_file() (google.adk.evaluation.agentevaluator static method)":[[0,"google.adk.evaluation.AgentEvaluator.find_config_for_test_file",false]],"find_sub_agent() (google.adk.agents.baseagent method)":[[0,"google.adk.agents.BaseAgent.find_sub_agent",false]],"flush() (google.adk.sessions.basesessionservice method)":[[0,"google.adk.sessions.BaseSessionService.flush",false]],"from_config() (google.adk.agents.baseagent class method)":[[0,"google.adk.agents.BaseAgent.from_config",false]],"from_config() (google.adk.integrations.crewai.crewaitool class method)":[[0,"google.adk.integrations.crewai.CrewaiTool.from_config",false],[0,"id120",false]],"from_config() (google.adk.integrations.langchain.langchaintool class method)":[[0,"google.adk.integrations.langchain.LangchainTool.from_config",false],[0,"id209",false]],"from_config() (google.adk.tools.agent_tool.agenttool class method)":[[0,"google.adk.tools.agent_tool.AgentTool.from_config",false]],"from_config() (google.adk.tools.agenttool class method)":[[0,"google.adk.tools.AgentTool.from_config",false]],"from_config() (google.adk.tools.base_tool.basetool class method)":[[0,"google.adk.tools.base_tool.BaseTool.from_config",false]],"from_config() (google.adk.tools.base_toolset.basetoolset class method)":[[0,"google.adk.tools.base_toolset.BaseToolset.from_config",false]],"from_config() (google.adk.tools.basetool class method)":[[0,"google.adk.tools.BaseTool.from_config",false]],"from_config() (google.adk.tools.crewai_tool.crewaitool class method)":[[0,"google.adk.tools.crewai_tool.CrewaiTool.from_config",false]],"from_config() (google.adk.tools.example_tool.exampletool class method)":[[0,"google.adk.tools.example_tool.ExampleTool.from_config",false]],"from_config() (google.adk.tools.exampletool class method)":[[0,"google.adk.tools.ExampleTool.from_config",false]],"from_config() (google.adk.tools.langchain_tool.langchaintool class method)":[[0,"google.adk.tools.langchain_tool.LangchainTool.from_config",false]],"from_config() (google.adk.tools.mcp_tool.mcptoolset class method)":[[0,"google.adk.tools.mcp_tool.McpToolset.from_config",false]],"from_config() (google.adk.tools.mcptoolset class method)":[[0,"google.adk.tools.McpToolset.from_config",false]],"from_node (google.adk.workflow.edge attribute)":[[0,"google.adk.workflow.Edge.from_node",false]],"from_parsed_operation() (google.adk.tools.openapi_tool.restapitool class method)":[[0,"google.adk.tools.openapi_tool.RestApiTool.from_parsed_operation",false]],"from_parsed_operation_str() (google.adk.tools.openapi_tool.restapitool class method)":[[0,"google.adk.tools.openapi_tool.RestApiTool.from_parsed_operation_str",false]],"from_response_dict() (google.adk.tools.tool_confirmation.toolconfirmation class method)":[[0,"google.adk.tools.tool_confirmation.ToolConfirmation.from_response_dict",false]],"frontmatter (google.adk.skills.skill attribute)":[[0,"google.adk.skills.Skill.frontmatter",false],[0,"id327",false]],"func (google.adk.tools.function_tool.functiontool attribute)":[[0,"google.adk.tools.function_tool.FunctionTool.func",false]],"func (google.adk.tools.functiontool attribute)":[[0,"google.adk.tools.FunctionTool.func",false]],"function_call_id (google.adk.agents.context property)":[[0,"google.adk.agents.Context.function_call_id",false]],"function_call_id (google.adk.tools.authtoolarguments attribute)":[[0,"google.adk.tools.AuthToolArguments.function_call_id",false]],"functiontool (class in google.adk.tools)":[[0,"google.adk.tools.FunctionTool",false]],"functiontool (class in google.adk.tools.function_tool)":[[0,"google.adk.tools.function_tool.FunctionTool",false]],"gcpauthprovider (class in google.adk.integrations.agent_identity)":[[0,"google.adk.integrations.agent_identity.GcpAuthProvider",false],[0,"id80",false]],"gcpskillregistry (class in google.adk.integrations.skill_registry)":[[0,"google.adk.integrations.skill_registry.GCPSkillRegistry",false],[0,"id230",false]],"gcsadmintoolset (class in google.adk.integrations.gcs)":[[0,"google.adk.integrations.gcs.GCSAdminToolset",false],[0,"id201",false]],"gcstoolset (class in google.adk.integrations.gcs)":[[0,"google.adk.integrations.gcs.GCSToolset",false],[0,"id205",false]],"gemini_to_json_schema() (in module google.adk.tools.mcp_tool)":[[0,"google.adk.tools.mcp_tool.gemini_to_json_schema",false]],"genai_semconv_stability_opt_in (google.adk.telemetry.telemetryconfig attribute)":[[0,"google.adk.telemetry.TelemetryConfig.genai_semconv_stability_opt_in",false],[0,"id331",false]],"generate_content_async() (google.adk.labs.openai.openaillm method)":[[0,"google.adk.labs.openai.OpenAILlm.generate_content_async",false]],"generate_content_async() (google.adk.labs.openai.openairesponsesllm method)":[[0,"google.adk.labs.openai.OpenAIResponsesLlm.generate_content_async",false]],"generate_content_async() (google.adk.models.basellm method)":[[0,"google.adk.models.BaseLlm.generate_content_async",false]],"generate_content_config (google.adk.agents.llmagent attribute)":[[0,"google.adk.agents.LlmAgent.generate_content_config",false]],"generate_content_config (google.adk.agents.llmagentconfig attribute)":[[0,"google.adk.agents.LlmAgentConfig.generate_content_config",false]],"get() (google.adk.agents.liverequestqueue method)":[[0,"google.adk.agents.LiveRequestQueue.get",false]],"get() (google.adk.sessions.state method)":[[0,"google.adk.sessions.State.get",false]],"get_agent_info() (google.adk.integrations.agent_registry.agentregistry method)":[[0,"google.adk.integrations.agent_registry.AgentRegistry.get_agent_info",false],[0,"id94",false]],"get_artifact_version() (google.adk.agents.context method)":[[0,"google.adk.agents.Context.get_artifact_version",false]],"get_artifact_version() (google.adk.artifacts.baseartifactservice method)":[[0,"google.adk.artifacts.BaseArtifactService.get_artifact_version",false]],"get_asset() (google.adk.skills.resources method)":[[0,"google.adk.skills.Resources.get_asset",false]],"get_auth_config() (google.adk.tools.base_toolset.basetoolset method)":[[0,"google.adk.tools.base_toolset.BaseToolset.get_auth_config",false]],"get_auth_config() (google.adk.tools.mcp_tool.mcptoolset method)":[[0,"google.adk.tools.mcp_tool.McpToolset.get_auth_config",false]],"get_auth_config() (google.adk.tools.mcptoolset method)":[[0,"google.adk.tools.McpToolset.get_auth_config",false]],"get_auth_credential() (google.adk.integrations.agent_identity.gcpauthprovider method)":[[0,"google.adk.integrations.agent_identity.GcpAuthProvider.get_auth_credential",false],[0,"id81",false]],"get_auth_response() (google.adk.agents.context method)":[[0,"google.adk.agents.Context.get_auth_response",false]],"get_current_url() (google.adk.integrations.vmaas.sandboxclient method)":[[0,"google.adk.integrations.vmaas.SandboxClient.get_current_url",false],[0,"id292",false]],"get_endpoint() (google.adk.integrations.agent_registry.agentregistry method)":[[0,"google.adk.integrations.agent_registry.AgentRegistry.get_endpoint",false],[0,"id95",false]],"get_error_count() (google.adk.code_executors.codeexecutorcontext method)":[[0,"google.adk.code_executors.CodeExecutorContext.get_error_count",false]],"get_examples() (google.adk.examples.baseexampleprovider method)":[[0,"google.adk.examples.BaseExampleProvider.get_examples",false]],"get_examples() (google.adk.examples.vertexaiexamplestore method)":[[0,"google.adk.examples.VertexAiExampleStore.get_examples",false]],"get_execution_id() (google.adk.code_executors.codeexecutorcontext method)":[[0,"google.adk.code_executors.CodeExecutorContext.get_execution_id",false]],"get_input_files() (google.adk.code_executors.codeexecutorcontext method)":[[0,"google.adk.code_executors.CodeExecutorContext.get_input_files",false]],"get_invocation_context() (google.adk.agents.context method)":[[0,"google.adk.agents.Context.get_invocation_context",false]],"get_mcp_server() (google.adk.integrations.agent_registry.agentregistry method)":[[0,"google.adk.integrations.agent_registry.AgentRegistry.get_mcp_server",false],[0,"id96",false]],"get_mcp_toolset() (google.adk.integrations.agent_registry.agentregistry method)":[[0,"google.adk.integrations.agent_registry.AgentRegistry.get_mcp_toolset",false],[0,"id97",false]],"get_model_name() (google.adk.integrations.agent_registry.agentregistry method)":[[0,"google.adk.integrations.agent_registry.AgentRegistry.get_model_name",false],[0,"id98",false]],"get_parameter() (google.adk.integrations.parameter_manager.parametermanagerclient method)":[[0,"google.adk.integrations.parameter_manager.ParameterManagerClient.get_parameter",false],[0,"id219",false]],"get_plugin() (google.adk.plugins.pluginmanager method)":[[0,"google.adk.plugins.PluginManager.get_plugin",false]],"get_processed_file_names() (google.adk.code_executors.codeexecutorcontext method)":[[0,"google.adk.code_executors.CodeExecutorContext.get_processed_file_names",false]],"get_reference() (google.adk.skills.resources method)":[[0,"google.adk.skills.Resources.get_reference",false]],"get_remote_a2a_agent() (google.adk.integrations.agent_registry.agentregistry method)":[[0,"google.adk.integrations.agent_registry.AgentRegistry.get_remote_a2a_agent",false],[0,"id99",false]],"get_resource_info() (google.adk.tools.mcp_tool.mcptoolset method)":[[0,"google.adk.tools.mcp_tool.McpToolset.get_resource_info",false]],"get_resource_info() (google.adk.tools.mcptoolset method)":[[0,"google.adk.tools.McpToolset.get_resource_info",false]],"get_screenshot() (google.adk.integrations.vmaas.sandboxclient method)":[[0,"google.adk.integrations.vmaas.SandboxClient.get_screenshot",false],[0,"id293",false]],"get_script() (google.adk.skills.resources method)":[[0,"google.adk.skills.Resources.get_script",false]],"get_secret() (google.adk.integrations.secret_manager.secretmanagerclient method)":[[0,"google.adk.integrations.secret_manager.SecretManagerClient.get_secret",false],[0,"id226",false]],"get_session() (google.adk.sessions.basesessionservice method)":[[0,"google.adk.sessions.BaseSessionService.get_session",false]],"get_session() (google.adk.sessions.databasesessionservice method)":[[0,"google.adk.sessions.DatabaseSessionService.get_session",false]],"get_session() (google.adk.sessions.inmemorysessionservice method)":[[0,"google.adk.sessions.InMemorySessionService.get_session",false]],"get_session() (google.adk.sessions.vertexaisessionservice method)":[[0,"google.adk.sessions.VertexAiSessionService.get_session",false]],"get_session_config (google.adk.agents.runconfig attribute)":[[0,"google.adk.agents.RunConfig.get_session_config",false]],"get_session_sync() (google.adk.sessions.inmemorysessionservice method)":[[0,"google.adk.sessions.InMemorySessionService.get_session_sync",false]],"get_skill() (google.adk.integrations.skill_registry.gcpskillregistry method)":[[0,"google.adk.integrations.skill_registry.GCPSkillRegistry.get_skill",false],[0,"id231",false]],"get_skill() (google.adk.skills.skillregistry method)":[[0,"google.adk.skills.SkillRegistry.get_skill",false]],"get_state_delta() (google.adk.code_executors.codeexecutorcontext method)":[[0,"google.adk.code_executors.CodeExecutorContext.get_state_delta",false]],"get_tool() (google.adk.tools.openapi_tool.openapitoolset method)":[[0,"google.adk.tools.openapi_tool.OpenAPIToolset.get_tool",false]],"get_tools() (google.adk.integrations.eventarc.eventarctoolset method)":[[0,"google.adk.integrations.eventarc.EventarcToolset.get_tools",false],[0,"id198",false]],"get_tools() (google.adk.integrations.gcs.gcsadmintoolset method)":[[0,"google.adk.integrations.gcs.GCSAdminToolset.get_tools",false],[0,"id202",false]],"get_tools() (google.adk.integrations.gcs.gcstoolset method)":[[0,"google.adk.integrations.gcs.GCSToolset.get_tools",false],[0,"id206",false]],"get_tools() (google.adk.tools.apihub_tool.apihubtoolset method)":[[0,"google.adk.tools.apihub_tool.APIHubToolset.get_tools",false]],"get_tools() (google.adk.tools.apihubtoolset method)":[[0,"google.adk.tools.APIHubToolset.get_tools",false]],"get_tools() (google.adk.tools.application_integration_tool.applicationintegrationtoolset method)":[[0,"google.adk.tools.application_integration_tool.ApplicationIntegrationToolset.get_tools",false]],"get_tools() (google.adk.tools.base_toolset.basetoolset method)":[[0,"google.adk.tools.base_toolset.BaseToolset.get_tools",false]],"get_tools() (google.adk.tools.bigtable.bigtabletoolset method)":[[0,"google.adk.tools.bigtable.BigtableToolset.get_tools",false]],"get_tools() (google.adk.tools.data_agent.dataagenttoolset method)":[[0,"google.adk.tools.data_agent.DataAgentToolset.get_tools",false]],"get_tools() (google.adk.tools.environment.environmenttoolset method)":[[0,"google.adk.tools.environment.EnvironmentToolset.get_tools",false]],"get_tools() (google.adk.tools.google_api_tool.googleapitoolset method)":[[0,"google.adk.tools.google_api_tool.GoogleApiToolset.get_tools",false]],"get_tools() (google.adk.tools.mcp_tool.mcptoolset method)":[[0,"google.adk.tools.mcp_tool.McpToolset.get_tools",false]],"get_tools() (google.adk.tools.mcptoolset method)":[[0,"google.adk.tools.McpToolset.get_tools",false]],"get_tools() (google.adk.tools.openapi_tool.openapitoolset method)":[[0,"google.adk.tools.openapi_tool.OpenAPIToolset.get_tools",false]],"get_tools() (google.adk.tools.pubsub.pubsubtoolset method)":[[0,"google.adk.tools.pubsub.PubSubToolset.get_tools",false]],"get_tools() (google.adk.tools.skill_toolset.skilltoolset method)":[[0,"google.adk.tools.skill_toolset.SkillToolset.get_tools",false]],"get_tools() (google.adk.tools.spanner.spanneradmintoolset method)":[[0,"google.adk.tools.spanner.SpannerAdminToolset.get_tools",false]],"get_tools() (google.adk.tools.spanner.spannertoolset method)":[[0,"google.adk.tools.spanner.SpannerToolset.get_tools",false]],"get_tools() (google.adk.tools.toolbox_toolset.toolboxtoolset method)":[[0,"google.adk.tools.toolbox_toolset.ToolboxToolset.get_tools",false]],"get_tools_with_prefix() (google.adk.tools.base_toolset.basetoolset method)":[[0,"google.adk.tools.base_toolset.BaseToolset.get_tools_with_prefix",false]],"get_toolset() (google.adk.integrations.api_registry.apiregistry method)":[[0,"google.adk.integrations.api_registry.ApiRegistry.get_toolset",false],[0,"id107",false]],"get_toolset() (google.adk.tools.apiregistry method)":[[0,"google.adk.tools.ApiRegistry.get_toolset",false]],"get_user_choice() (in module google.adk.tools.get_user_choice_tool)":[[0,"google.adk.tools.get_user_choice_tool.get_user_choice",false]],"get_user_state() (google.adk.sessions.basesessionservice method)":[[0,"google.adk.sessions.BaseSessionService.get_user_state",false]],"get_user_state() (google.adk.sessions.databasesessionservice method)":[[0,"google.adk.sessions.DatabaseSessionService.get_user_state",false]],"get_user_state() (google.adk.sessions.inmemorysessionservice method)":[[0,"google.adk.sessions.InMemorySessionService.get_user_state",false]],"get_user_state() (google.adk.sessions.vertexaisessionservice method)":[[0,"google.adk.sessions.VertexAiSessionService.get_user_state",false]],"global_instruction (google.adk.agents.llmagent attribute)":[[0,"google.adk.agents.LlmAgent.global_instruction",false]],"gmailtoolset (class in google.adk.tools.google_api_tool)":[[0,"google.adk.tools.google_api_tool.GmailToolset",false]],"go_back() (google.adk.integrations.vmaas.agentenginesandboxcomputer method)":[[0,"google.adk.integrations.vmaas.AgentEngineSandboxComputer.go_back",false],[0,"id275",false]],"go_back() (google.adk.integrations.vmaas.sandboxclient method)":[[0,"google.adk.integrations.vmaas.SandboxClient.go_back",false],[0,"id294",false]],"go_forward() (google.adk.integrations.vmaas.agentenginesandboxcomputer method)":[[0,"google.adk.integrations.vmaas.AgentEngineSandboxComputer.go_forward",false],[0,"id276",false]],"go_forward() (google.adk.integrations.vmaas.sandboxclient method)":[[0,"google.adk.integrations.vmaas.SandboxClient.go_forward",false],[0,"id295",false]],"google.adk.a2a":[[0,"module-google.adk.a2a",false]],"google.adk.agents":[[0,"module-google.adk.agents",false]],"google.adk.apps":[[0,"module-google.adk.apps",false]],"google.adk.artifacts":[[0,"module-google.adk.artifacts",false]],"google.adk.auth":[[0,"module-google.adk.auth",false]],"google.adk.code_executors":[[0,"module-google.adk.code_executors",false]],"google.adk.environment":[[0,"module-google.adk.environment",false]],"google.adk.errors":[[0,"module-google.adk.errors",false]],"google.adk.evaluation":[[0,"module-google.adk.evaluation",false]],"google.adk.events":[[0,"module-google.adk.events",false]],"google.adk.examples":[[0,"module-google.adk.examples",false]],"google.adk.flows":[[0,"module-google.adk.flows",false]],"google.adk.integrations":[[0,"module-google.adk.integrations",false]],"google.adk.integrations.agent_identity":[[0,"module-0",false],[0,"module-google.adk.integrations.agent_identity",false]],"google.adk.integrations.agent_registry":[[0,"module-1",false],[0,"module-google.adk.integrations.agent_registry",false]],"google.adk.integrations.api_registry":[[0,"module-2",false],[0,"module-google.adk.integrations.api_registry",false]],"google.adk.integrations.bigquery":[[0,"module-3",false],[0,"module-google.adk.integrations.bigquery",false]],"google.adk.integrations.cloud_run":[[0,"module-4",false],[0,"module-google.adk.integrations.cloud_run",false]],"google.adk.integrations.crewai":[[0,"module-5",false],[0,"module-google.adk.integrations.crewai",false]],"google.adk.integrations.daytona":[[0,"module-6",false],[0,"module-google.adk.integrations.daytona",false]],"google.adk.integrations.e2b":[[0,"module-7",false],[0,"module-google.adk.integrations.e2b",false]],"google.adk.integrations.eventarc":[[0,"module-8",false],[0,"module-google.adk.integrations.eventarc",false]],"google.adk.integrations.firestore":[[0,"module-9",false],[0,"module-google.adk.integrations.firestore",false]],"google.adk.integrations.gcs":[[0,"module-10",false],[0,"module-google.adk.integrations.gcs",false]],"google.adk.integrations.langchain":[[0,"module-11",false],[0,"module-google.adk.integrations.langchain",false]],"google.adk.integrations.oci":[[0,"module-12",false],[0,"module-google.adk.integrations.oci",false]],"google.adk.integrations.parameter_manager":[[0,"module-13",false],[0,"module-google.adk.integrations.parameter_manager",false]],"google.adk.integrations.secret_manager":[[0,"module-14",false],[0,"module-google.adk.integrations.secret_manager",false]],"google.adk.integrations.skill_registry":[[0,"module-15",false],[0,"module-google.adk.integrations.skill_registry",false]],"google.adk.integrations.slack":[[0,"module-16",false],[0,"module-google.adk.integrations.slack",false]],"google.adk.integrations.vmaas":[[0,"module-17",false],[0,"module-google.adk.integrations.vmaas",false]],"google.adk.labs.openai":[[0,"module-google.adk.labs.openai",false]],"google.adk.memory":[[0,"module-google.adk.memory",false]],"google.adk.models":[[0,"module-google.adk.models",false]],"google.adk.optimization":[[0,"module-google.adk.optimization",false]],"google.adk.planners":[[0,"module-google.adk.planners",false]],"google.adk.platform":[[0,"module-google.adk.platform",false]],"google.adk.plugins":[[0,"module-google.adk.plugins",false]],"google.adk.runners":[[0,"module-google.adk.runners",false]],"google.adk.sessions":[[0,"module-google.adk.sessions",false]],"google.adk.skills":[[0,"module-google.adk.skills",false]],"google.adk.telemetry":[[0,"module-google.adk.telemetry",false]],"google.adk.tools":[[0,"module-google.adk.tools",false]],"google.adk.tools.agent_simulator":[[0,"module-google.adk.tools.agent_simulator",false]],"google.adk.tools.agent_tool":[[0,"module-google.adk.tools.agent_tool",false]],"google.adk.tools.api_registry":[[0,"module-google.adk.tools.api_registry",false]],"google.adk.tools.apihub_tool":[[0,"module-google.adk.tools.apihub_tool",false]],"google.adk.tools.application_integration_tool":[[0,"module-google.adk.tools.application_integration_tool",false]],"google.adk.tools.authenticated_function_tool":[[0,"module-google.adk.tools.authenticated_function_tool",false]],"google.adk.tools.base_authenticated_tool":[[0,"module-google.adk.tools.base_authenticated_tool",false]],"google.adk.tools.base_tool":[[0,"module-google.adk.tools.base_tool",false]],"google.adk.tools.base_toolset":[[0,"module-google.adk.tools.base_toolset",false]],"google.adk.tools.bash_tool":[[0,"module-google.adk.tools.bash_tool",false]],"google.adk.tools.bigquery":[[0,"module-google.adk.tools.bigquery",false]],"google.adk.tools.bigtable":[[0,"module-google.adk.tools.bigtable",false]],"google.adk.tools.computer_use":[[0,"module-google.adk.tools.computer_use",false]],"google.adk.tools.crewai_tool":[[0,"module-google.adk.tools.crewai_tool",false]],"google.adk.tools.data_agent":[[0,"module-google.adk.tools.data_agent",false]],"google.adk.tools.discovery_engine_search_tool":[[0,"module-google.adk.tools.discovery_engine_search_tool",false]],"google.adk.tools.enterprise_search_tool":[[0,"module-google.adk.tools.enterprise_search_tool",false]],"google.adk.tools.environment":[[0,"module-google.adk.tools.environment",false]],"google.adk.tools.environment_simulation":[[0,"module-google.adk.tools.environment_simulation",false]],"google.adk.tools.example_tool":[[0,"module-google.adk.tools.example_tool",false]],"google.adk.tools.exit_loop_tool":[[0,"module-google.adk.tools.exit_loop_tool",false]],"google.adk.tools.function_tool":[[0,"module-google.adk.tools.function_tool",false]],"google.adk.tools.get_user_choice_tool":[[0,"module-google.adk.tools.get_user_choice_tool",false]],"google.adk.tools.google_api_tool":[[0,"module-google.adk.tools.google_api_tool",false]],"google.adk.tools.google_maps_grounding_tool":[[0,"module-google.adk.tools.google_maps_grounding_tool",false]],"google.adk.tools.google_search_agent_tool":[[0,"module-google.adk.tools.google_search_agent_tool",false]],"google.adk.tools.google_search_tool":[[0,"module-google.adk.tools.google_search_tool",false]],"google.adk.tools.google_tool":[[0,"module-google.adk.tools.google_tool",false]],"google.adk.tools.langchain_tool":[[0,"module-google.adk.tools.langchain_tool",false]],"google.adk.tools.load_artifacts_tool":[[0,"module-google.adk.tools.load_artifacts_tool",false]],"google.adk.tools.load_mcp_resource_tool":[[0,"module-google.adk.tools.load_mcp_resource_tool",false]],"google.adk.tools.load_memory_tool":[[0,"module-google.adk.tools.load_memory_tool",false]],"google.adk.tools.load_web_page":[[0,"module-google.adk.tools.load_web_page",false]],"google.adk.tools.long_running_tool":[[0,"module-google.adk.tools.long_running_tool",false]],"google.adk.tools.mcp_tool":[[0,"module-google.adk.tools.mcp_tool",false]],"google.adk.tools.openapi_tool":[[0,"module-google.adk.tools.openapi_tool",false]],"google.adk.tools.preload_memory_tool":[[0,"module-google.adk.tools.preload_memory_tool",false]],"google.adk.tools.pubsub":[[0,"module-google.adk.tools.pubsub",false]],"google.adk.tools.retrieval":[[0,"module-google.adk.tools.retrieval",false]],"google.adk.tools.set_model_response_tool":[[0,"module-google.adk.tools.set_model_response_tool",false]],"google.adk.tools.skill_toolset":[[0,"module-google.adk.tools.skill_toolset",false]],"google.adk.tools.spanner":[[0,"module-google.adk.tools.spanner",false]],"google.adk.tools.tool_configs":[[0,"module-google.adk.tools.tool_configs",false]],"google.adk.tools.tool_confirmation":[[0,"module-google.adk.tools.tool_confirmation",false]],"google.adk.tools.tool_context":[[0,"module-google.adk.tools.tool_context",false]],"google.adk.tools.toolbox_toolset":[[0,"module-google.adk.tools.toolbox_toolset",false]],"google.adk.tools.transfer_to_agent_tool":[[0,"module-google.adk.tools.transfer_to_agent_tool",false]],"google.adk.tools.url_context_tool":[[0,"module-google.adk.tools.url_context_tool",false]],"google.adk.tools.vertex_ai_load_profiles_tool":[[0,"module-google.adk.tools.vertex_ai_load_profiles_tool",false]],"google.adk.tools.vertex_ai_search_tool":[[0,"module-google.adk.tools.vertex_ai_search_tool",false]],"google.adk.utils":[[0,"module-google.adk.utils",false]],"google.adk.version":[[0,"module-google.adk.version",false]],"google.adk.workflow":[[0,"module-google.adk.workflow",false]],"googleapitool (class in google.adk.tools.google_api_tool)":[[0,"google.adk.tools.google_api_tool.GoogleApiTool",false]],"googleapitoolset (class in google.adk.tools.google_api_tool)":[[0,"google.adk.tools.google_api_tool.GoogleApiToolset",false]],"googlemapsgroundingtool (class in google.adk.tools.google_maps_grounding_tool)":[[0,"google.adk.tools.google_maps_grounding_tool.GoogleMapsGroundingTool",false]],"googlesearchagenttool (class in google.adk.tools.google_search_agent_tool)":[[0,"google.adk.tools.google_search_agent_tool.GoogleSearchAgentTool",false]],"googlesearchtool (class in google.adk.tools.google_search_tool)":[[0,"google.adk.tools.google_search_tool.GoogleSearchTool",false]],"googletool (class in google.adk.tools.google_tool)":[[0,"google.adk.tools.google_tool.GoogleTool",false]],"graph (google.adk.workflow.workflow attribute)":[[0,"google.adk.workflow.Workflow.graph",false]],"has_delta() (google.adk.sessions.state method)":[[0,"google.adk.sessions.State.has_delta",false]],"has_trailing_code_execution_result() (google.adk.events.event method)":[[0,"google.adk.events.Event.has_trailing_code_execution_result",false]],"header_provider (google.adk.tools.mcp_tool.mcptoolset property)":[[0,"google.adk.tools.mcp_tool.McpToolset.header_provider",false]],"header_provider (google.adk.tools.mcptoolset property)":[[0,"google.adk.tools.McpToolset.header_provider",false]],"header_provider (google.adk.tools.remotemcpserver attribute)":[[0,"google.adk.tools.RemoteMcpServer.header_provider",false]],"headers (google.adk.tools.mcp_tool.sseconnectionparams attribute)":[[0,"google.adk.tools.mcp_tool.SseConnectionParams.headers",false],[0,"id366",false]],"headers (google.adk.tools.mcp_tool.streamablehttpconnectionparams attribute)":[[0,"google.adk.tools.mcp_tool.StreamableHTTPConnectionParams.headers",false],[0,"id373",false]],"headers (google.adk.tools.remotemcpserver attribute)":[[0,"google.adk.tools.RemoteMcpServer.headers",false]],"health_check() (google.adk.integrations.vmaas.sandboxclient method)":[[0,"google.adk.integrations.vmaas.SandboxClient.health_check",false],[0,"id296",false]],"hint (google.adk.tools.tool_confirmation.toolconfirmation attribute)":[[0,"google.adk.tools.tool_confirmation.ToolConfirmation.hint",false]],"history_config (google.adk.agents.runconfig attribute)":[[0,"google.adk.agents.RunConfig.history_config",false]],"hover_at() (google.adk.integrations.vmaas.agentenginesandboxcomputer method)":[[0,"google.adk.integrations.vmaas.AgentEngineSandboxComputer.hover_at",false],[0,"id277",false]],"hover_at() (google.adk.integrations.vmaas.sandboxclient method)":[[0,"google.adk.integrations.vmaas.SandboxClient.hover_at",false],[0,"id297",false]],"http_options (google.adk.agents.runconfig attribute)":[[0,"google.adk.agents.RunConfig.http_options",false]],"httpx_client_factory (google.adk.tools.mcp_tool.sseconnectionparams attribute)":[[0,"google.adk.tools.mcp_tool.SseConnectionParams.httpx_client_factory",false],[0,"id367",false]],"httpx_client_factory (google.adk.tools.mcp_tool.streamablehttpconnectionparams attribute)":[[0,"google.adk.tools.mcp_tool.StreamableHTTPConnectionParams.httpx_client_factory",false],[0,"id374",false]],"id (google.adk.events.event attribute)":[[0,"google.adk.events.Event.id",false]],"id (google.adk.integrations.eventarc.cloudeventattributesbinding attribute)":[[0,"google.adk.integrations.eventarc.CloudEventAttributesBinding.id",false],[0,"id184",false]],"id (google.adk.sessions.session attribute)":[[0,"google.adk.sessions.Session.id",false]],"include (google.adk.labs.openai.openairesponsesllm attribute)":[[0,"google.adk.labs.openai.OpenAIResponsesLlm.include",false]],"include_contents (google.adk.agents.llmagent attribute)":[[0,"google.adk.agents.LlmAgent.include_contents",false]],"include_contents (google.adk.agents.llmagentconfig attribute)":[[0,"google.adk.agents.LlmAgentConfig.include_contents",false]],"include_plugins (google.adk.tools.agent_tool.agenttool attribute)":[[0,"google.adk.tools.agent_tool.AgentTool.include_plugins",false]],"include_plugins (google.adk.tools.agent_tool.agenttoolconfig attribute)":[[0,"google.adk.tools.agent_tool.AgentToolConfig.include_plugins",false]],"include_plugins (google.adk.tools.agenttool attribute)":[[0,"google.adk.tools.AgentTool.include_plugins",false]],"include_response_metadata (google.adk.labs.openai.openairesponsesllm attribute)":[[0,"google.adk.labs.openai.OpenAIResponsesLlm.include_response_metadata",false]],"include_thoughts_from_other_agents (google.adk.agents.runconfig attribute)":[[0,"google.adk.agents.RunConfig.include_thoughts_from_other_agents",false]],"increment_error_count() (google.adk.code_executors.codeexecutorcontext method)":[[0,"google.adk.code_executors.CodeExecutorContext.increment_error_count",false]],"increment_llm_call_count() (google.adk.agents.invocationcontext method)":[[0,"google.adk.agents.InvocationContext.increment_llm_call_count",false]],"initial_delay (google.adk.workflow.retryconfig attribute)":[[0,"google.adk.workflow.RetryConfig.initial_delay",false]],"initialize() (google.adk.environment.baseenvironment method)":[[0,"google.adk.environment.BaseEnvironment.initialize",false]],"initialize() (google.adk.environment.localenvironment method)":[[0,"google.adk.environment.LocalEnvironment.initialize",false]],"initialize() (google.adk.integrations.daytona.daytonaenvironment method)":[[0,"google.adk.integrations.daytona.DaytonaEnvironment.initialize",false],[0,"id149",false]],"initialize() (google.adk.integrations.e2b.e2benvironment method)":[[0,"google.adk.integrations.e2b.E2BEnvironment.initialize",false],[0,"id173",false]],"initialize() (google.adk.integrations.vmaas.agentenginesandboxcomputer method)":[[0,"google.adk.integrations.vmaas.AgentEngineSandboxComputer.initialize",false],[0,"id278",false]],"inmemoryrunner (class in google.adk.runners)":[[0,"google.adk.runners.InMemoryRunner",false]],"inmemorysessionservice (class in google.adk.sessions)":[[0,"google.adk.sessions.InMemorySessionService",false]],"input (google.adk.examples.example attribute)":[[0,"google.adk.examples.Example.input",false],[0,"id73",false]],"input_audio_transcription (google.adk.agents.runconfig attribute)":[[0,"google.adk.agents.RunConfig.input_audio_transcription",false]],"input_realtime_cache (google.adk.agents.invocationcontext attribute)":[[0,"google.adk.agents.InvocationContext.input_realtime_cache",false]],"input_schema (google.adk.agents.llmagent attribute)":[[0,"google.adk.agents.LlmAgent.input_schema",false]],"input_schema (google.adk.agents.llmagentconfig attribute)":[[0,"google.adk.agents.LlmAgentConfig.input_schema",false]],"input_schema (google.adk.workflow.basenode attribute)":[[0,"google.adk.workflow.BaseNode.input_schema",false]],"instruction (google.adk.agents.llmagent attribute)":[[0,"google.adk.agents.LlmAgent.instruction",false]],"instruction (google.adk.agents.llmagentconfig attribute)":[[0,"google.adk.agents.LlmAgentConfig.instruction",false]],"instruction (google.adk.agents.managedagent attribute)":[[0,"google.adk.agents.ManagedAgent.instruction",false]],"instructions (google.adk.skills.skill attribute)":[[0,"google.adk.skills.Skill.instructions",false],[0,"id328",false]],"integrationconnectortool (class in google.adk.tools.application_integration_tool)":[[0,"google.adk.tools.application_integration_tool.IntegrationConnectorTool",false]],"interrupt_id (google.adk.events.requestinput attribute)":[[0,"google.adk.events.RequestInput.interrupt_id",false]],"interrupt_ids (google.adk.agents.context property)":[[0,"google.adk.agents.Context.interrupt_ids",false]],"invocation_id (google.adk.agents.invocationcontext attribute)":[[0,"google.adk.agents.InvocationContext.invocation_id",false]],"invocation_id (google.adk.events.event attribute)":[[0,"google.adk.events.Event.invocation_id",false]],"is_final_response() (google.adk.events.event method)":[[0,"google.adk.events.Event.is_final_response",false]],"is_initialized (google.adk.environment.baseenvironment property)":[[0,"google.adk.environment.BaseEnvironment.is_initialized",false]],"is_long_running (google.adk.tools.base_tool.basetool attribute)":[[0,"google.adk.tools.base_tool.BaseTool.is_long_running",false]],"is_long_running (google.adk.tools.basetool attribute)":[[0,"google.adk.tools.BaseTool.is_long_running",false]],"is_long_running (google.adk.tools.long_running_tool.longrunningfunctiontool attribute)":[[0,"google.adk.tools.long_running_tool.LongRunningFunctionTool.is_long_running",false]],"is_long_running (google.adk.tools.longrunningfunctiontool attribute)":[[0,"google.adk.tools.LongRunningFunctionTool.is_long_running",false]],"is_resumable (google.adk.agents.invocationcontext property)":[[0,"google.adk.agents.InvocationContext.is_resumable",false]],"isolation_scope (google.adk.agents.context property)":[[0,"google.adk.agents.Context.isolation_scope",false]],"isolation_scope (google.adk.agents.invocationcontext attribute)":[[0,"google.adk.agents.InvocationContext.isolation_scope",false]],"isolation_scope (google.adk.events.event attribute)":[[0,"google.adk.events.Event.isolation_scope",false]],"jitter (google.adk.workflow.retryconfig attribute)":[[0,"google.adk.workflow.RetryConfig.jitter",false]],"key_combination() (google.adk.integrations.vmaas.agentenginesandboxcomputer method)":[[0,"google.adk.integrations.vmaas.AgentEngineSandboxComputer.key_combination",false],[0,"id279",false]],"key_combination() (google.adk.integrations.vmaas.sandboxclient method)":[[0,"google.adk.integrations.vmaas.SandboxClient.key_combination",false],[0,"id298",false]],"labels (google.adk.agents.runconfig attribute)":[[0,"google.adk.agents.RunConfig.labels",false]],"langchaintool (class in google.adk.integrations.langchain)":[[0,"google.adk.integrations.langchain.LangchainTool",false],[0,"id208",false]],"langchaintool (class in google.adk.tools.langchain_tool)":[[0,"google.adk.tools.langchain_tool.LangchainTool",false]],"last_update_time (google.adk.sessions.session attribute)":[[0,"google.adk.sessions.Session.last_update_time",false]],"license (google.adk.skills.frontmatter attribute)":[[0,"google.adk.skills.Frontmatter.license",false],[0,"id321",false]],"list_agents() (google.adk.integrations.agent_registry.agentregistry method)":[[0,"google.adk.integrations.agent_registry.AgentRegistry.list_agents",false],[0,"id100",false]],"list_artifact_keys() (google.adk.artifacts.baseartifactservice method)":[[0,"google.adk.artifacts.BaseArtifactService.list_artifact_keys",false]],"list_artifact_versions() (google.adk.artifacts.baseartifactservice method)":[[0,"google.adk.artifacts.BaseArtifactService.list_artifact_versions",false]],"list_artifacts() (google.adk.agents.context method)":[[0,"google.adk.agents.Context.list_artifacts",false]],"list_assets() (google.adk.skills.resources method)":[[0,"google.adk.skills.Resources.list_assets",false]],"list_endpoints() (google.adk.integrations.agent_registry.agentregistry method)":[[0,"google.adk.integrations.agent_registry.AgentRegistry.list_endpoints",false],[0,"id101",false]],"list_mcp_servers() (google.adk.integrations.agent_registry.agentregistry method)":[[0,"google.adk.integrations.agent_registry.AgentRegistry.list_mcp_servers",false],[0,"id102",false]],"list_references() (google.adk.skills.resources method)":[[0,"google.adk.skills.Resources.list_references",false]],"list_resources() (google.adk.tools.mcp_tool.mcptoolset method)":[[0,"google.adk.tools.mcp_tool.McpToolset.list_resources",false]],"list_resources() (google.adk.tools.mcptoolset method)":[[0,"google.adk.tools.McpToolset.list_resources",false]],"list_scripts() (google.adk.skills.resources method)":[[0,"google.adk.skills.Resources.list_scripts",false]],"list_sessions() (google.adk.sessions.basesessionservice method)":[[0,"google.adk.sessions.BaseSessionService.list_sessions",false]],"list_sessions() (google.adk.sessions.databasesessionservice method)":[[0,"google.adk.sessions.DatabaseSessionService.list_sessions",false]],"list_sessions() (google.adk.sessions.inmemorysessionservice method)":[[0,"google.adk.sessions.InMemorySessionService.list_sessions",false]],"list_sessions() (google.adk.sessions.vertexaisessionservice method)":[[0,"google.adk.sessions.VertexAiSessionService.list_sessions",false]],"list_sessions_sync() (google.adk.sessions.inmemorysessionservice method)":[[0,"google.adk.sessions.InMemorySessionService.list_sessions_sync",false]],"list_skills_in_dir() (in module google.adk.skills)":[[0,"google.adk.skills.list_skills_in_dir",false]],"list_skills_in_gcs_dir() (in module google.adk.skills)":[[0,"google.adk.skills.list_skills_in_gcs_dir",false]],"list_versions() (google.adk.artifacts.baseartifactservice method)":[[0,"google.adk.artifacts.BaseArtifactService.list_versions",false]],"listskillstool (class in google.adk.tools.skill_toolset)":[[0,"google.adk.tools.skill_toolset.ListSkillsTool",false]],"live_request_queue (google.adk.agents.invocationcontext attribute)":[[0,"google.adk.agents.InvocationContext.live_request_queue",false]],"live_session_resumption_handle (google.adk.agents.invocationcontext attribute)":[[0,"google.adk.agents.InvocationContext.live_session_resumption_handle",false]],"liverequestqueue (class in google.adk.agents)":[[0,"google.adk.agents.LiveRequestQueue",false]],"llmregistry (class in google.adk.models)":[[0,"google.adk.models.LLMRegistry",false]],"load_artifact() (google.adk.agents.context method)":[[0,"google.adk.agents.Context.load_artifact",false]],"load_artifact() (google.adk.artifacts.baseartifactservice method)":[[0,"google.adk.artifacts.BaseArtifactService.load_artifact",false]],"load_credential() (google.adk.agents.context method)":[[0,"google.adk.agents.Context.load_credential",false]],"load_memory() (in module google.adk.tools.load_memory_tool)":[[0,"google.adk.tools.load_memory_tool.load_memory",false]],"load_profiles() (google.adk.tools.vertex_ai_load_profiles_tool.vertexailoadprofilestool method)":[[0,"google.adk.tools.vertex_ai_load_profiles_tool.VertexAiLoadProfilesTool.load_profiles",false]],"load_profiles() (google.adk.tools.vertexailoadprofilestool method)":[[0,"google.adk.tools.VertexAiLoadProfilesTool.load_profiles",false]],"load_skill_from_dir() (in module google.adk.skills)":[[0,"google.adk.skills.load_skill_from_dir",false]],"load_skill_from_gcs_dir() (in module google.adk.skills)":[[0,"google.adk.skills.load_skill_from_gcs_dir",false]],"load_web_page() (in module google.adk.tools.load_web_page)":[[0,"google.adk.tools.load_web_page.load_web_page",false]],"loadartifactstool (class in google.adk.tools.load_artifacts_tool)":[[0,"google.adk.tools.load_artifacts_tool.LoadArtifactsTool",false]],"loadmcpresourcetool (class in google.adk.tools.load_mcp_resource_tool)":[[0,"google.adk.tools.load_mcp_resource_tool.LoadMcpResourceTool",false]],"loadmemorytool (class in google.adk.tools.load_memory_tool)":[[0,"google.adk.tools.load_memory_tool.LoadMemoryTool",false]],"loadskillresourcetool (class in google.adk.tools.skill_toolset)":[[0,"google.adk.tools.skill_toolset.LoadSkillResourceTool",false]],"loadskilltool (class in google.adk.tools.skill_toolset)":[[0,"google.adk.tools.skill_toolset.LoadSkillTool",false]],"localenvironment (class in google.adk.environment)":[[0,"google.adk.environment.LocalEnvironment",false]],"long_running_tool_ids (google.adk.events.event attribute)":[[0,"google.adk.events.Event.long_running_tool_ids",false]],"longrunningfunctiontool (class in google.adk.tools)":[[0,"google.adk.tools.LongRunningFunctionTool",false]],"longrunningfunctiontool (class in google.adk.tools.long_running_tool)":[[0,"google.adk.tools.long_running_tool.LongRunningFunctionTool",false]],"make_cdp_batch_request() (google.adk.integrations.vmaas.sandboxclient method)":[[0,"google.adk.integrations.vmaas.SandboxClient.make_cdp_batch_request",false],[0,"id299",false]],"make_cdp_request() (google.adk.integrations.vmaas.sandboxclient method)":[[0,"google.adk.integrations.vmaas.SandboxClient.make_cdp_request",false],[0,"id300",false]],"max_attempts (google.adk.workflow.retryconfig attribute)":[[0,"google.adk.workflow.RetryConfig.max_attempts",false]],"max_child_processes (google.adk.tools.bash_tool.bashtoolpolicy attribute)":[[0,"google.adk.tools.bash_tool.BashToolPolicy.max_child_processes",false]],"max_concurrency (google.adk.workflow.workflow attribute)":[[0,"google.adk.workflow.Workflow.max_concurrency",false]],"max_delay (google.adk.workflow.retryconfig attribute)":[[0,"google.adk.workflow.RetryConfig.max_delay",false]],"max_file_size_bytes (google.adk.tools.bash_tool.bashtoolpolicy attribute)":[[0,"google.adk.tools.bash_tool.BashToolPolicy.max_file_size_bytes",false]],"max_iterations (google.adk.agents.loopagent attribute)":[[0,"google.adk.agents.LoopAgent.max_iterations",false]],"max_iterations (google.adk.agents.loopagentconfig attribute)":[[0,"google.adk.agents.LoopAgentConfig.max_iterations",false]],"max_llm_calls (google.adk.agents.runconfig attribute)":[[0,"google.adk.agents.RunConfig.max_llm_calls",false]],"max_memory_bytes (google.adk.tools.bash_tool.bashtoolpolicy attribute)":[[0,"google.adk.tools.bash_tool.BashToolPolicy.max_memory_bytes",false]],"max_parallel_workers (google.adk.workflow.node attribute)":[[0,"google.adk.workflow.Node.max_parallel_workers",false]],"max_tokens (google.adk.labs.openai.openaillm attribute)":[[0,"google.adk.labs.openai.OpenAILlm.max_tokens",false],[0,"id306",false]],"mcp_app_resource_uri (google.adk.tools.mcp_tool.mcptool property)":[[0,"google.adk.tools.mcp_tool.McpTool.mcp_app_resource_uri",false]],"mcpinstructionprovider (class in google.adk.agents)":[[0,"google.adk.agents.McpInstructionProvider",false]],"mcptool (class in google.adk.tools.mcp_tool)":[[0,"google.adk.tools.mcp_tool.MCPTool",false],[0,"google.adk.tools.mcp_tool.McpTool",false]],"mcptoolset (class in google.adk.tools)":[[0,"google.adk.tools.MCPToolset",false],[0,"google.adk.tools.McpToolset",false]],"mcptoolset (class in google.adk.tools.mcp_tool)":[[0,"google.adk.tools.mcp_tool.MCPToolset",false],[0,"google.adk.tools.mcp_tool.McpToolset",false]],"memories (google.adk.tools.load_memory_tool.loadmemoryresponse attribute)":[[0,"google.adk.tools.load_memory_tool.LoadMemoryResponse.memories",false]],"memory_service (google.adk.agents.invocationcontext attribute)":[[0,"google.adk.agents.InvocationContext.memory_service",false]],"memory_service (google.adk.runners.runner attribute)":[[0,"google.adk.runners.Runner.memory_service",false],[0,"id314",false]],"message (google.adk.events.event property)":[[0,"google.adk.events.Event.message",false]],"message (google.adk.events.requestinput attribute)":[[0,"google.adk.events.RequestInput.message",false]],"metadata (google.adk.skills.frontmatter attribute)":[[0,"google.adk.skills.Frontmatter.metadata",false],[0,"id322",false]],"migrate_eval_data_to_new_schema() (google.adk.evaluation.agentevaluator static method)":[[0,"google.adk.evaluation.AgentEvaluator.migrate_eval_data_to_new_schema",false]],"mode (google.adk.agents.llmagent attribute)":[[0,"google.adk.agents.LlmAgent.mode",false]],"mode (google.adk.agents.managedagent attribute)":[[0,"google.adk.agents.ManagedAgent.mode",false]],"model (google.adk.agents.llmagent attribute)":[[0,"google.adk.agents.LlmAgent.model",false]],"model (google.adk.agents.llmagentconfig attribute)":[[0,"google.adk.agents.LlmAgentConfig.model",false]],"model (google.adk.labs.openai.openaillm attribute)":[[0,"google.adk.labs.openai.OpenAILlm.model",false],[0,"id307",false]],"model (google.adk.labs.openai.openairesponsesllm attribute)":[[0,"google.adk.labs.openai.OpenAIResponsesLlm.model",false]],"model (google.adk.models.basellm attribute)":[[0,"google.adk.models.BaseLlm.model",false]],"model (google.adk.tools.google_search_agent_tool.googlesearchagenttool attribute)":[[0,"google.adk.tools.google_search_agent_tool.GoogleSearchAgentTool.model",false]],"model_code (google.adk.agents.llmagentconfig attribute)":[[0,"google.adk.agents.LlmAgentConfig.model_code",false]],"model_copy() (google.adk.workflow.functionnode method)":[[0,"google.adk.workflow.FunctionNode.model_copy",false]],"model_copy() (google.adk.workflow.node method)":[[0,"google.adk.workflow.Node.model_copy",false]],"model_input_context (google.adk.agents.runconfig attribute)":[[0,"google.adk.agents.RunConfig.model_input_context",false]],"model_post_init() (google.adk.agents.baseagent method)":[[0,"google.adk.agents.BaseAgent.model_post_init",false]],"model_post_init() (google.adk.agents.invocationcontext method)":[[0,"google.adk.agents.InvocationContext.model_post_init",false]],"model_post_init() (google.adk.agents.llmagent method)":[[0,"google.adk.agents.LlmAgent.model_post_init",false]],"model_post_init() (google.adk.agents.managedagent method)":[[0,"google.adk.agents.ManagedAgent.model_post_init",false]],"model_post_init() (google.adk.events.event method)":[[0,"google.adk.events.Event.model_post_init",false]],"model_post_init() (google.adk.integrations.eventarc.eventarccredentialsconfig method)":[[0,"google.adk.integrations.eventarc.EventarcCredentialsConfig.model_post_init",false],[0,"id191",false]],"model_post_init() (google.adk.integrations.gcs.gcscredentialsconfig method)":[[0,"google.adk.integrations.gcs.GCSCredentialsConfig.model_post_init",false],[0,"id204",false]],"model_post_init() (google.adk.sessions.session method)":[[0,"google.adk.sessions.Session.model_post_init",false]],"model_post_init() (google.adk.tools.bigtable.bigtablecredentialsconfig method)":[[0,"google.adk.tools.bigtable.BigtableCredentialsConfig.model_post_init",false]],"model_post_init() (google.adk.tools.data_agent.dataagentcredentialsconfig method)":[[0,"google.adk.tools.data_agent.DataAgentCredentialsConfig.model_post_init",false]],"model_post_init() (google.adk.tools.pubsub.pubsubcredentialsconfig method)":[[0,"google.adk.tools.pubsub.PubSubCredentialsConfig.model_post_init",false]],"model_post_init() (google.adk.tools.spanner.spannercredentialsconfig method)":[[0,"google.adk.tools.spanner.SpannerCredentialsConfig.model_post_init",false]],"model_post_init() (google.adk.workflow.functionnode method)":[[0,"google.adk.workflow.FunctionNode.model_post_init",false]],"model_post_init() (google.adk.workflow.node method)":[[0,"google.adk.workflow.Node.model_post_init",false]],"model_post_init() (google.adk.workflow.workflow method)":[[0,"google.adk.workflow.Workflow.model_post_init",false]],"module":[[0,"module-0",false],[0,"module-1",false],[0,"module-10",false],[0,"module-11",false],[0,"module-12",false],[0,"module-13",false],[0,"module-14",false],[0,"module-15",false],[0,"module-16",false],[0,"module-17",false],[0,"module-2",false],[0,"module-3",false],[0,"module-4",false],[0,"module-5",false],[0,"module-6",false],[0,"module-7",false],[0,"module-8",false],[0,"module-9",false],[0,"module-google.adk.a2a",false],[0,"module-google.adk.agents",false],[0,"module-google.adk.apps",false],[0,"module-google.adk.artifacts",false],[0,"module-google.adk.auth",false],[0,"module-google.adk.code_executors",false],[0,"module-google.adk.environment",false],[0,"module-google.adk.errors",false],[0,"module-google.adk.evaluation",false],[0,"module-google.adk.events",false],[0,"module-google.adk.examples",false],[0,"module-google.adk.flows",false],[0,"module-google.adk.integrations",false],[0,"module-google.adk.integrations.agent_identity",false],[0,"module-google.adk.integrations.agent_registry",false],[0,"module-google.adk.integrations.api_registry",false],[0,"module-google.adk.integrations.bigquery",false],[0,"module-google.adk.integrations.cloud_run",false],[0,"module-google.adk.integrations.crewai",false],[0,"module-google.adk.integrations.daytona",false],[0,"module-google.adk.integrations.e2b",false],[0,"module-google.adk.integrations.eventarc",false],[0,"module-google.adk.integrations.firestore",false],[0,"module-google.adk.integrations.gcs",false],[0,"module-google.adk.integrations.langchain",false],[0,"module-google.adk.integrations.oci",false],[0,"module-google.adk.integrations.parameter_manager",false],[0,"module-google.adk.integrations.secret_manager",false],[0,"module-google.adk.integrations.skill_registry",false],[0,"module-google.adk.integrations.slack",false],[0,"module-google.adk.integrations.vmaas",false],[0,"module-google.adk.labs.openai",false],[0,"module-google.adk.memory",false],[0,"module-google.adk.models",false],[0,"module-google.adk.optimization",false],[0,"module-google.adk.planners",false],[0,"module-google.adk.platform",false],[0,"module-google.adk.plugins",false],[0,"module-google.adk.runners",false],[0,"module-google.adk.sessions",false],[0,"module-google.adk.skills",false],[0,"module-google.adk.telemetry",false],[0,"module-google.adk.tools",false],[0,"module-google.adk.tools.agent_simulator",false],[0,"module-google.adk.tools.agent_tool",false],[0,"module-google.adk.tools.api_registry",false],[0,"module-google.adk.tools.apihub_tool",false],[0,"module-google.adk.tools.application_integration_tool",false],[0,"module-google.adk.tools.authenticated_function_tool",false],[0,"module-google.adk.tools.base_authenticated_tool",false],[0,"module-google.adk.tools.base_tool",false],[0,"module-google.adk.tools.base_toolset",false],[0,"module-google.adk.tools.bash_tool",false],[0,"module-google.adk.tools.bigquery",false],[0,"module-google.adk.tools.bigtable",false],[0,"module-google.adk.tools.computer_use",false],[0,"module-google.adk.tools.crewai_tool",false],[0,"module-google.adk.tools.data_agent",false],[0,"module-google.adk.tools.discovery_engine_search_tool",false],[0,"module-google.adk.tools.enterprise_search_tool",false],[0,"module-google.adk.tools.environment",false],[0,"module-google.adk.tools.environment_simulation",false],[0,"module-google.adk.tools.example_tool",false],[0,"module-google.adk.tools.exit_loop_tool",false],[0,"module-google.adk.tools.function_tool",false],[0,"module-google.adk.tools.get_user_choice_tool",false],[0,"module-google.adk.tools.google_api_tool",false],[0,"module-google.adk.tools.google_maps_grounding_tool",false],[0,"module-google.adk.tools.google_search_agent_tool",false],[0,"module-google.adk.tools.google_search_tool",false],[0,"module-google.adk.tools.google_tool",false],[0,"module-google.adk.tools.langchain_tool",false],[0,"module-google.adk.tools.load_artifacts_tool",false],[0,"module-google.adk.tools.load_mcp_resource_tool",false],[0,"module-google.adk.tools.load_memory_tool",false],[0,"module-google.adk.tools.load_web_page",false],[0,"module-google.adk.tools.long_running_tool",false],[0,"module-google.adk.tools.mcp_tool",false],[0,"module-google.adk.tools.openapi_tool",false],[0,"module-google.adk.tools.preload_memory_tool",false],[0,"module-google.adk.tools.pubsub",false],[0,"module-google.adk.tools.retrieval",false],[0,"module-google.adk.tools.set_model_response_tool",false],[0,"module-google.adk.tools.skill_toolset",false],[0,"module-google.adk.tools.spanner",false],[0,"module-google.adk.tools.tool_configs",false],[0,"module-google.adk.tools.tool_confirmation",false],[0,"module-google.adk.tools.tool_context",false],[0,"module-google.adk.tools.toolbox_toolset",false],[0,"module-google.adk.tools.transfer_to_agent_tool",false],[0,"module-google.adk.tools.url_context_tool",false],[0,"module-google.adk.tools.vertex_ai_load_profiles_tool",false],[0,"module-google.adk.tools.vertex_ai_search_tool",false],[0,"module-google.adk.utils",false],[0,"module-google.adk.version",false],[0,"module-google.adk.workflow",false]],"msg (google.adk.agents.runconfig attribute)":[[0,"google.adk.agents.RunConfig.msg",false],[0,"id0",false]],"name (google.adk.agents.baseagent attribute)":[[0,"google.adk.agents.BaseAgent.name",false]],"name (google.adk.agents.baseagentconfig attribute)":[[0,"google.adk.agents.BaseAgentConfig.name",false]],"name (google.adk.integrations.agent_identity.gcpauthproviderscheme attribute)":[[0,"google.adk.integrations.agent_identity.GcpAuthProviderScheme.name",false],[0,"id76",false],[0,"id84",false],[0,"id89",false]],"name (google.adk.integrations.crewai.crewaitool attribute)":[[0,"google.adk.integrations.crewai.CrewaiTool.name",false]],"name (google.adk.integrations.crewai.crewaitoolconfig attribute)":[[0,"google.adk.integrations.crewai.CrewaiToolConfig.name",false],[0,"id127",false]],"name (google.adk.integrations.langchain.langchaintoolconfig attribute)":[[0,"google.adk.integrations.langchain.LangchainToolConfig.name",false],[0,"id212",false]],"name (google.adk.skills.frontmatter attribute)":[[0,"google.adk.skills.Frontmatter.name",false],[0,"id323",false]],"name (google.adk.skills.skill property)":[[0,"google.adk.skills.Skill.name",false]],"name (google.adk.tools.base_tool.basetool attribute)":[[0,"google.adk.tools.base_tool.BaseTool.name",false]],"name (google.adk.tools.basetool attribute)":[[0,"google.adk.tools.BaseTool.name",false]],"name (google.adk.tools.crewai_tool.crewaitool attribute)":[[0,"google.adk.tools.crewai_tool.CrewaiTool.name",false]],"name (google.adk.tools.crewai_tool.crewaitoolconfig attribute)":[[0,"google.adk.tools.crewai_tool.CrewaiToolConfig.name",false]],"name (google.adk.tools.langchain_tool.langchaintoolconfig attribute)":[[0,"google.adk.tools.langchain_tool.LangchainToolConfig.name",false]],"name (google.adk.tools.remotemcpserver attribute)":[[0,"google.adk.tools.RemoteMcpServer.name",false]],"name (google.adk.tools.tool_configs.toolconfig attribute)":[[0,"google.adk.tools.tool_configs.ToolConfig.name",false]],"name (google.adk.workflow.basenode attribute)":[[0,"google.adk.workflow.BaseNode.name",false]],"navigate() (google.adk.integrations.vmaas.agentenginesandboxcomputer method)":[[0,"google.adk.integrations.vmaas.AgentEngineSandboxComputer.navigate",false],[0,"id280",false]],"navigate() (google.adk.integrations.vmaas.sandboxclient method)":[[0,"google.adk.integrations.vmaas.SandboxClient.navigate",false],[0,"id301",false]],"new_id() (google.adk.events.event static method)":[[0,"google.adk.events.Event.new_id",false]],"new_llm() (google.adk.models.llmregistry static method)":[[0,"google.adk.models.LLMRegistry.new_llm",false]],"no_content (google.adk.telemetry.contentcapturingmode attribute)":[[0,"google.adk.telemetry.ContentCapturingMode.NO_CONTENT",false]],"node (google.adk.agents.context property)":[[0,"google.adk.agents.Context.node",false]],"node() (in module google.adk.workflow)":[[0,"google.adk.workflow.node",false]],"node_info (google.adk.events.event attribute)":[[0,"google.adk.events.Event.node_info",false]],"node_name (google.adk.events.event property)":[[0,"google.adk.events.Event.node_name",false]],"node_path (google.adk.agents.context property)":[[0,"google.adk.agents.Context.node_path",false]],"node_path (google.adk.agents.invocationcontext attribute)":[[0,"google.adk.agents.InvocationContext.node_path",false]],"nodetimeouterror":[[0,"google.adk.workflow.NodeTimeoutError",false]],"on_agent_error_callback() (google.adk.plugins.baseplugin method)":[[0,"google.adk.plugins.BasePlugin.on_agent_error_callback",false]],"on_event_callback() (google.adk.plugins.baseplugin method)":[[0,"google.adk.plugins.BasePlugin.on_event_callback",false]],"on_model_error_callback (google.adk.agents.llmagent attribute)":[[0,"google.adk.agents.LlmAgent.on_model_error_callback",false]],"on_model_error_callback() (google.adk.plugins.baseplugin method)":[[0,"google.adk.plugins.BasePlugin.on_model_error_callback",false]],"on_run_error_callback() (google.adk.plugins.baseplugin method)":[[0,"google.adk.plugins.BasePlugin.on_run_error_callback",false]],"on_tool_error_callback (google.adk.agents.llmagent attribute)":[[0,"google.adk.agents.LlmAgent.on_tool_error_callback",false]],"on_tool_error_callback() (google.adk.plugins.baseplugin method)":[[0,"google.adk.plugins.BasePlugin.on_tool_error_callback",false]],"on_user_message_callback() (google.adk.plugins.baseplugin method)":[[0,"google.adk.plugins.BasePlugin.on_user_message_callback",false]],"open_web_browser() (google.adk.integrations.vmaas.agentenginesandboxcomputer method)":[[0,"google.adk.integrations.vmaas.AgentEngineSandboxComputer.open_web_browser",false],[0,"id281",false]],"openapitoolset (class in google.adk.tools.openapi_tool)":[[0,"google.adk.tools.openapi_tool.OpenAPIToolset",false]],"optimize_data_file (google.adk.code_executors.basecodeexecutor attribute)":[[0,"google.adk.code_executors.BaseCodeExecutor.optimize_data_file",false],[0,"id70",false]],"optimize_data_file (google.adk.code_executors.unsafelocalcodeexecutor attribute)":[[0,"google.adk.code_executors.UnsafeLocalCodeExecutor.optimize_data_file",false]],"optimize_data_file (google.adk.integrations.cloud_run.cloudrunsandboxcodeexecutor attribute)":[[0,"google.adk.integrations.cloud_run.CloudRunSandboxCodeExecutor.optimize_data_file",false],[0,"id112",false]],"optional_fields (google.adk.tools.application_integration_tool.integrationconnectortool attribute)":[[0,"google.adk.tools.application_integration_tool.IntegrationConnectorTool.OPTIONAL_FIELDS",false]],"output (google.adk.agents.context property)":[[0,"google.adk.agents.Context.output",false]],"output (google.adk.events.event attribute)":[[0,"google.adk.events.Event.output",false]],"output (google.adk.examples.example attribute)":[[0,"google.adk.examples.Example.output",false],[0,"id74",false]],"output_audio_transcription (google.adk.agents.runconfig attribute)":[[0,"google.adk.agents.RunConfig.output_audio_transcription",false]],"output_key (google.adk.agents.llmagent attribute)":[[0,"google.adk.agents.LlmAgent.output_key",false]],"output_key (google.adk.agents.llmagentconfig attribute)":[[0,"google.adk.agents.LlmAgentConfig.output_key",false]],"output_realtime_cache (google.adk.agents.invocationcontext attribute)":[[0,"google.adk.agents.InvocationContext.output_realtime_cache",false]],"output_schema (google.adk.agents.llmagent attribute)":[[0,"google.adk.agents.LlmAgent.output_schema",false]],"output_schema (google.adk.agents.llmagentconfig attribute)":[[0,"google.adk.agents.LlmAgentConfig.output_schema",false]],"output_schema (google.adk.workflow.basenode attribute)":[[0,"google.adk.workflow.BaseNode.output_schema",false]],"parallel_tool_calls (google.adk.labs.openai.openairesponsesllm attribute)":[[0,"google.adk.labs.openai.OpenAIResponsesLlm.parallel_tool_calls",false]],"parallel_worker (google.adk.agents.llmagent attribute)":[[0,"google.adk.agents.LlmAgent.parallel_worker",false]],"parallel_worker (google.adk.workflow.node attribute)":[[0,"google.adk.workflow.Node.parallel_worker",false]],"parameter_binding (google.adk.workflow.functionnode attribute)":[[0,"google.adk.workflow.FunctionNode.parameter_binding",false]],"parametermanagerclient (class in google.adk.integrations.parameter_manager)":[[0,"google.adk.integrations.parameter_manager.ParameterManagerClient",false],[0,"id216",false]],"parent_agent (google.adk.agents.baseagent attribute)":[[0,"google.adk.agents.BaseAgent.parent_agent",false]],"parent_ctx (google.adk.agents.context property)":[[0,"google.adk.agents.Context.parent_ctx",false]],"partial (google.adk.agents.liverequest attribute)":[[0,"google.adk.agents.LiveRequest.partial",false]],"payload (google.adk.events.requestinput attribute)":[[0,"google.adk.events.RequestInput.payload",false]],"payload (google.adk.tools.tool_confirmation.toolconfirmation attribute)":[[0,"google.adk.tools.tool_confirmation.ToolConfirmation.payload",false]],"planner (google.adk.agents.llmagent attribute)":[[0,"google.adk.agents.LlmAgent.planner",false]],"planreactplanner (class in google.adk.planners)":[[0,"google.adk.planners.PlanReActPlanner",false]],"plugin_manager (google.adk.agents.invocationcontext attribute)":[[0,"google.adk.agents.InvocationContext.plugin_manager",false]],"plugin_manager (google.adk.runners.runner attribute)":[[0,"google.adk.runners.Runner.plugin_manager",false],[0,"id315",false]],"pluginmanager (class in google.adk.plugins)":[[0,"google.adk.plugins.PluginManager",false]],"populate_invocation_agent_states() (google.adk.agents.invocationcontext method)":[[0,"google.adk.agents.InvocationContext.populate_invocation_agent_states",false]],"populate_name() (google.adk.tools.agent_tool.agenttool method)":[[0,"google.adk.tools.agent_tool.AgentTool.populate_name",false]],"populate_name() (google.adk.tools.agenttool method)":[[0,"google.adk.tools.AgentTool.populate_name",false]],"preloadmemorytool (class in google.adk.tools.preload_memory_tool)":[[0,"google.adk.tools.preload_memory_tool.PreloadMemoryTool",false]],"prepare() (google.adk.integrations.vmaas.agentenginesandboxcomputer method)":[[0,"google.adk.integrations.vmaas.AgentEngineSandboxComputer.prepare",false],[0,"id282",false]],"prepare_tables() (google.adk.sessions.databasesessionservice method)":[[0,"google.adk.sessions.DatabaseSessionService.prepare_tables",false]],"proactivity (google.adk.agents.runconfig attribute)":[[0,"google.adk.agents.RunConfig.proactivity",false]],"process_llm_request() (google.adk.code_executors.builtincodeexecutor method)":[[0,"google.adk.code_executors.BuiltInCodeExecutor.process_llm_request",false]],"process_llm_request() (google.adk.tools.base_tool.basetool method)":[[0,"google.adk.tools.base_tool.BaseTool.process_llm_request",false]],"process_llm_request() (google.adk.tools.base_toolset.basetoolset method)":[[0,"google.adk.tools.base_toolset.BaseToolset.process_llm_request",false]],"process_llm_request() (google.adk.tools.basetool method)":[[0,"google.adk.tools.BaseTool.process_llm_request",false]],"process_llm_request() (google.adk.tools.enterprise_search_tool.enterprisewebsearchtool method)":[[0,"google.adk.tools.enterprise_search_tool.EnterpriseWebSearchTool.process_llm_request",false]],"process_llm_request() (google.adk.tools.environment.environmenttoolset method)":[[0,"google.adk.tools.environment.EnvironmentToolset.process_llm_request",false]],"process_llm_request() (google.adk.tools.example_tool.exampletool method)":[[0,"google.adk.tools.example_tool.ExampleTool.process_llm_request",false]],"process_llm_request() (google.adk.tools.exampletool method)":[[0,"google.adk.tools.ExampleTool.process_llm_request",false]],"process_llm_request() (google.adk.tools.google_maps_grounding_tool.googlemapsgroundingtool method)":[[0,"google.adk.tools.google_maps_grounding_tool.GoogleMapsGroundingTool.process_llm_request",false]],"process_llm_request() (google.adk.tools.google_search_tool.googlesearchtool method)":[[0,"google.adk.tools.google_search_tool.GoogleSearchTool.process_llm_request",false]],"process_llm_request() (google.adk.tools.load_artifacts_tool.loadartifactstool method)":[[0,"google.adk.tools.load_artifacts_tool.LoadArtifactsTool.process_llm_request",false]],"process_llm_request() (google.adk.tools.load_mcp_resource_tool.loadmcpresourcetool method)":[[0,"google.adk.tools.load_mcp_resource_tool.LoadMcpResourceTool.process_llm_request",false]],"process_llm_request() (google.adk.tools.load_memory_tool.loadmemorytool method)":[[0,"google.adk.tools.load_memory_tool.LoadMemoryTool.process_llm_request",false]],"process_llm_request() (google.adk.tools.preload_memory_tool.preloadmemorytool method)":[[0,"google.adk.tools.preload_memory_tool.PreloadMemoryTool.process_llm_request",false]],"process_llm_request() (google.adk.tools.skill_toolset.loadskillresourcetool method)":[[0,"google.adk.tools.skill_toolset.LoadSkillResourceTool.process_llm_request",false]],"process_llm_request() (google.adk.tools.skill_toolset.skilltoolset method)":[[0,"google.adk.tools.skill_toolset.SkillToolset.process_llm_request",false]],"process_llm_request() (google.adk.tools.url_context_tool.urlcontexttool method)":[[0,"google.adk.tools.url_context_tool.UrlContextTool.process_llm_request",false]],"process_llm_request() (google.adk.tools.vertex_ai_search_tool.vertexaisearchtool method)":[[0,"google.adk.tools.vertex_ai_search_tool.VertexAiSearchTool.process_llm_request",false]],"process_llm_request() (google.adk.tools.vertexaisearchtool method)":[[0,"google.adk.tools.VertexAiSearchTool.process_llm_request",false]],"process_planning_response() (google.adk.planners.baseplanner method)":[[0,"google.adk.planners.BasePlanner.process_planning_response",false]],"process_planning_response() (google.adk.planners.builtinplanner method)":[[0,"google.adk.planners.BuiltInPlanner.process_planning_response",false]],"process_planning_response() (google.adk.planners.planreactplanner method)":[[0,"google.adk.planners.PlanReActPlanner.process_planning_response",false]],"project_id (google.adk.integrations.eventarc.eventarctoolconfig attribute)":[[0,"google.adk.integrations.eventarc.EventarcToolConfig.project_id",false],[0,"id193",false]],"project_id (google.adk.tools.pubsub.pubsubtoolconfig attribute)":[[0,"google.adk.tools.pubsub.PubSubToolConfig.project_id",false]],"publish_timeout (google.adk.integrations.eventarc.eventarctoolconfig attribute)":[[0,"google.adk.integrations.eventarc.EventarcToolConfig.publish_timeout",false],[0,"id194",false]],"pubsubtoolset (class in google.adk.tools.pubsub)":[[0,"google.adk.tools.pubsub.PubSubToolset",false]],"raw_mcp_tool (google.adk.tools.mcp_tool.mcptool property)":[[0,"google.adk.tools.mcp_tool.McpTool.raw_mcp_tool",false]],"read_file() (google.adk.environment.baseenvironment method)":[[0,"google.adk.environment.BaseEnvironment.read_file",false]],"read_file() (google.adk.environment.localenvironment method)":[[0,"google.adk.environment.LocalEnvironment.read_file",false]],"read_file() (google.adk.integrations.daytona.daytonaenvironment method)":[[0,"google.adk.integrations.daytona.DaytonaEnvironment.read_file",false],[0,"id150",false]],"read_file() (google.adk.integrations.e2b.e2benvironment method)":[[0,"google.adk.integrations.e2b.E2BEnvironment.read_file",false],[0,"id174",false]],"read_resource() (google.adk.tools.mcp_tool.mcptoolset method)":[[0,"google.adk.tools.mcp_tool.McpToolset.read_resource",false]],"read_resource() (google.adk.tools.mcptoolset method)":[[0,"google.adk.tools.McpToolset.read_resource",false]],"realtime_input_config (google.adk.agents.runconfig attribute)":[[0,"google.adk.agents.RunConfig.realtime_input_config",false]],"reasoning (google.adk.labs.openai.openairesponsesllm attribute)":[[0,"google.adk.labs.openai.OpenAIResponsesLlm.reasoning",false]],"references (google.adk.skills.resources attribute)":[[0,"google.adk.skills.Resources.references",false],[0,"id325",false]],"register() (google.adk.models.llmregistry static method)":[[0,"google.adk.models.LLMRegistry.register",false]],"register_plugin() (google.adk.plugins.pluginmanager method)":[[0,"google.adk.plugins.PluginManager.register_plugin",false]],"render_ui_widget() (google.adk.agents.context method)":[[0,"google.adk.agents.Context.render_ui_widget",false]],"render_ui_widgets (google.adk.events.eventactions attribute)":[[0,"google.adk.events.EventActions.render_ui_widgets",false]],"request_confirmation() (google.adk.agents.context method)":[[0,"google.adk.agents.Context.request_confirmation",false]],"request_credential() (google.adk.agents.context method)":[[0,"google.adk.agents.Context.request_credential",false]],"requested_auth_configs (google.adk.events.eventactions attribute)":[[0,"google.adk.events.EventActions.requested_auth_configs",false]],"requested_tool_confirmations (google.adk.events.eventactions attribute)":[[0,"google.adk.events.EventActions.requested_tool_confirmations",false]],"require_confirmation (google.adk.tools.mcp_tool.mcptoolset property)":[[0,"google.adk.tools.mcp_tool.McpToolset.require_confirmation",false]],"require_confirmation (google.adk.tools.mcptoolset property)":[[0,"google.adk.tools.McpToolset.require_confirmation",false]],"rerun_on_resume (google.adk.workflow.basenode attribute)":[[0,"google.adk.workflow.BaseNode.rerun_on_resume",false]],"rerun_on_resume (google.adk.workflow.workflow attribute)":[[0,"google.adk.workflow.Workflow.rerun_on_resume",false]],"reset_error_count() (google.adk.code_executors.codeexecutorcontext method)":[[0,"google.adk.code_executors.CodeExecutorContext.reset_error_count",false]],"reset_sub_agent_states() (google.adk.agents.invocationcontext method)":[[0,"google.adk.agents.InvocationContext.reset_sub_agent_states",false]],"resolve() (google.adk.models.llmregistry static method)":[[0,"google.adk.models.LLMRegistry.resolve",false]],"resolved_content_capturing_mode (google.adk.telemetry.telemetryconfig property)":[[0,"google.adk.telemetry.TelemetryConfig.resolved_content_capturing_mode",false]],"resources (google.adk.skills.skill attribute)":[[0,"google.adk.skills.Skill.resources",false],[0,"id329",false]],"response_modalities (google.adk.agents.runconfig attribute)":[[0,"google.adk.agents.RunConfig.response_modalities",false]],"response_scheduling (google.adk.tools.base_tool.basetool attribute)":[[0,"google.adk.tools.base_tool.BaseTool.response_scheduling",false]],"response_scheduling (google.adk.tools.basetool attribute)":[[0,"google.adk.tools.BaseTool.response_scheduling",false]],"response_schema (google.adk.events.requestinput attribute)":[[0,"google.adk.events.RequestInput.response_schema",false]],"restapitool (class in google.adk.tools.openapi_tool)":[[0,"google.adk.tools.openapi_tool.RestApiTool",false]],"resumability_config (google.adk.agents.invocationcontext attribute)":[[0,"google.adk.agents.InvocationContext.resumability_config",false]],"resumability_config (google.adk.runners.runner attribute)":[[0,"google.adk.runners.Runner.resumability_config",false],[0,"id316",false]],"resume_inputs (google.adk.agents.context property)":[[0,"google.adk.agents.Context.resume_inputs",false]],"retry_config (google.adk.workflow.basenode attribute)":[[0,"google.adk.workflow.BaseNode.retry_config",false]],"rewind_async() (google.adk.runners.runner method)":[[0,"google.adk.runners.Runner.rewind_async",false]],"rewind_before_invocation_id (google.adk.events.eventactions attribute)":[[0,"google.adk.events.EventActions.rewind_before_invocation_id",false]],"root_agent (google.adk.agents.baseagent property)":[[0,"google.adk.agents.BaseAgent.root_agent",false]],"route (google.adk.agents.context property)":[[0,"google.adk.agents.Context.route",false]],"route (google.adk.events.eventactions attribute)":[[0,"google.adk.events.EventActions.route",false]],"route (google.adk.workflow.edge attribute)":[[0,"google.adk.workflow.Edge.route",false]],"run() (google.adk.runners.runner method)":[[0,"google.adk.runners.Runner.run",false]],"run() (google.adk.workflow.basenode method)":[[0,"google.adk.workflow.BaseNode.run",false]],"run_after_agent_callback() (google.adk.plugins.pluginmanager method)":[[0,"google.adk.plugins.PluginManager.run_after_agent_callback",false]],"run_after_model_callback() (google.adk.plugins.pluginmanager method)":[[0,"google.adk.plugins.PluginManager.run_after_model_callback",false]],"run_after_run_callback() (google.adk.plugins.pluginmanager method)":[[0,"google.adk.plugins.PluginManager.run_after_run_callback",false]],"run_after_tool_callback() (google.adk.plugins.pluginmanager method)":[[0,"google.adk.plugins.PluginManager.run_after_tool_callback",false]],"run_async() (google.adk.agents.baseagent method)":[[0,"google.adk.agents.BaseAgent.run_async",false]],"run_async() (google.adk.integrations.crewai.crewaitool method)":[[0,"google.adk.integrations.crewai.CrewaiTool.run_async",false],[0,"id121",false]],"run_async() (google.adk.runners.runner method)":[[0,"google.adk.runners.Runner.run_async",false]],"run_async() (google.adk.tools.agent_tool.agenttool method)":[[0,"google.adk.tools.agent_tool.AgentTool.run_async",false]],"run_async() (google.adk.tools.agenttool method)":[[0,"google.adk.tools.AgentTool.run_async",false]],"run_async() (google.adk.tools.application_integration_tool.integrationconnectortool method)":[[0,"google.adk.tools.application_integration_tool.IntegrationConnectorTool.run_async",false]],"run_async() (google.adk.tools.authenticated_function_tool.authenticatedfunctiontool method)":[[0,"google.adk.tools.authenticated_function_tool.AuthenticatedFunctionTool.run_async",false]],"run_async() (google.adk.tools.base_authenticated_tool.baseauthenticatedtool method)":[[0,"google.adk.tools.base_authenticated_tool.BaseAuthenticatedTool.run_async",false]],"run_async() (google.adk.tools.base_tool.basetool method)":[[0,"google.adk.tools.base_tool.BaseTool.run_async",false]],"run_async() (google.adk.tools.basetool method)":[[0,"google.adk.tools.BaseTool.run_async",false]],"run_async() (google.adk.tools.bash_tool.executebashtool method)":[[0,"google.adk.tools.bash_tool.ExecuteBashTool.run_async",false]],"run_async() (google.adk.tools.crewai_tool.crewaitool method)":[[0,"google.adk.tools.crewai_tool.CrewaiTool.run_async",false]],"run_async() (google.adk.tools.function_tool.functiontool method)":[[0,"google.adk.tools.function_tool.FunctionTool.run_async",false]],"run_async() (google.adk.tools.functiontool method)":[[0,"google.adk.tools.FunctionTool.run_async",false]],"run_async() (google.adk.tools.google_api_tool.googleapitool method)":[[0,"google.adk.tools.google_api_tool.GoogleApiTool.run_async",false]],"run_async() (google.adk.tools.google_tool.googletool method)":[[0,"google.adk.tools.google_tool.GoogleTool.run_async",false]],"run_async() (google.adk.tools.load_artifacts_tool.loadartifactstool method)":[[0,"google.adk.tools.load_artifacts_tool.LoadArtifactsTool.run_async",false]],"run_async() (google.adk.tools.load_mcp_resource_tool.loadmcpresourcetool method)":[[0,"google.adk.tools.load_mcp_resource_tool.LoadMcpResourceTool.run_async",false]],"run_async() (google.adk.tools.mcp_tool.mcptool method)":[[0,"google.adk.tools.mcp_tool.McpTool.run_async",false]],"run_async() (google.adk.tools.openapi_tool.restapitool method)":[[0,"google.adk.tools.openapi_tool.RestApiTool.run_async",false]],"run_async() (google.adk.tools.set_model_response_tool.setmodelresponsetool method)":[[0,"google.adk.tools.set_model_response_tool.SetModelResponseTool.run_async",false]],"run_async() (google.adk.tools.skill_toolset.listskillstool method)":[[0,"google.adk.tools.skill_toolset.ListSkillsTool.run_async",false]],"run_async() (google.adk.tools.skill_toolset.loadskillresourcetool method)":[[0,"google.adk.tools.skill_toolset.LoadSkillResourceTool.run_async",false]],"run_async() (google.adk.tools.skill_toolset.loadskilltool method)":[[0,"google.adk.tools.skill_toolset.LoadSkillTool.run_async",false]],"run_async() (google.adk.tools.skill_toolset.runskillscripttool method)":[[0,"google.adk.tools.skill_toolset.RunSkillScriptTool.run_async",false]],"run_async() (google.adk.tools.skill_toolset.searchskillstool method)":[[0,"google.adk.tools.skill_toolset.SearchSkillsTool.run_async",false]],"run_before_agent_callback() (google.adk.plugins.pluginmanager method)":[[0,"google.adk.plugins.PluginManager.run_before_agent_callback",false]],"run_before_model_callback() (google.adk.plugins.pluginmanager method)":[[0,"google.adk.plugins.PluginManager.run_before_model_callback",false]],"run_before_run_callback() (google.adk.plugins.pluginmanager method)":[[0,"google.adk.plugins.PluginManager.run_before_run_callback",false]],"run_before_tool_callback() (google.adk.plugins.pluginmanager method)":[[0,"google.adk.plugins.PluginManager.run_before_tool_callback",false]],"run_config (google.adk.agents.invocationcontext attribute)":[[0,"google.adk.agents.InvocationContext.run_config",false]],"run_debug() (google.adk.runners.runner method)":[[0,"google.adk.runners.Runner.run_debug",false]],"run_id (google.adk.agents.context property)":[[0,"google.adk.agents.Context.run_id",false]],"run_live() (google.adk.agents.baseagent method)":[[0,"google.adk.agents.BaseAgent.run_live",false]],"run_live() (google.adk.runners.runner method)":[[0,"google.adk.runners.Runner.run_live",false]],"run_node() (google.adk.agents.context method)":[[0,"google.adk.agents.Context.run_node",false]],"run_node_impl() (google.adk.workflow.node method)":[[0,"google.adk.workflow.Node.run_node_impl",false]],"run_on_agent_error_callback() (google.adk.plugins.pluginmanager method)":[[0,"google.adk.plugins.PluginManager.run_on_agent_error_callback",false]],"run_on_event_callback() (google.adk.plugins.pluginmanager method)":[[0,"google.adk.plugins.PluginManager.run_on_event_callback",false]],"run_on_model_error_callback() (google.adk.plugins.pluginmanager method)":[[0,"google.adk.plugins.PluginManager.run_on_model_error_callback",false]],"run_on_run_error_callback() (google.adk.plugins.pluginmanager method)":[[0,"google.adk.plugins.PluginManager.run_on_run_error_callback",false]],"run_on_tool_error_callback() (google.adk.plugins.pluginmanager method)":[[0,"google.adk.plugins.PluginManager.run_on_tool_error_callback",false]],"run_on_user_message_callback() (google.adk.plugins.pluginmanager method)":[[0,"google.adk.plugins.PluginManager.run_on_user_message_callback",false]],"runner (class in google.adk.runners)":[[0,"google.adk.runners.Runner",false]],"runskillscripttool (class in google.adk.tools.skill_toolset)":[[0,"google.adk.tools.skill_toolset.RunSkillScriptTool",false]],"sandbox_bin (google.adk.integrations.cloud_run.cloudrunsandboxcodeexecutor attribute)":[[0,"google.adk.integrations.cloud_run.CloudRunSandboxCodeExecutor.sandbox_bin",false],[0,"id113",false]],"sandboxclient (class in google.adk.integrations.vmaas)":[[0,"google.adk.integrations.vmaas.SandboxClient",false],[0,"id289",false]],"save_artifact() (google.adk.agents.context method)":[[0,"google.adk.agents.Context.save_artifact",false]],"save_artifact() (google.adk.artifacts.baseartifactservice method)":[[0,"google.adk.artifacts.BaseArtifactService.save_artifact",false]],"save_credential() (google.adk.agents.context method)":[[0,"google.adk.agents.Context.save_credential",false]],"save_input_blobs_as_artifacts (google.adk.agents.runconfig attribute)":[[0,"google.adk.agents.RunConfig.save_input_blobs_as_artifacts",false]],"save_live_audio (google.adk.agents.runconfig attribute)":[[0,"google.adk.agents.RunConfig.save_live_audio",false]],"save_live_blob (google.adk.agents.runconfig attribute)":[[0,"google.adk.agents.RunConfig.save_live_blob",false]],"scopes (google.adk.integrations.agent_identity.gcpauthproviderscheme attribute)":[[0,"google.adk.integrations.agent_identity.GcpAuthProviderScheme.scopes",false],[0,"id77",false],[0,"id85",false],[0,"id90",false]],"screen_size() (google.adk.integrations.vmaas.agentenginesandboxcomputer method)":[[0,"google.adk.integrations.vmaas.AgentEngineSandboxComputer.screen_size",false],[0,"id283",false]],"scripts (google.adk.skills.resources attribute)":[[0,"google.adk.skills.Resources.scripts",false],[0,"id326",false]],"scroll_at() (google.adk.integrations.vmaas.agentenginesandboxcomputer method)":[[0,"google.adk.integrations.vmaas.AgentEngineSandboxComputer.scroll_at",false],[0,"id284",false]],"scroll_at() (google.adk.integrations.vmaas.sandboxclient method)":[[0,"google.adk.integrations.vmaas.SandboxClient.scroll_at",false],[0,"id302",false]],"scroll_document() (google.adk.integrations.vmaas.agentenginesandboxcomputer method)":[[0,"google.adk.integrations.vmaas.AgentEngineSandboxComputer.scroll_document",false],[0,"id285",false]],"search() (google.adk.integrations.vmaas.agentenginesandboxcomputer method)":[[0,"google.adk.integrations.vmaas.AgentEngineSandboxComputer.search",false],[0,"id286",false]],"search_agents() (google.adk.integrations.agent_registry.agentregistry method)":[[0,"google.adk.integrations.agent_registry.AgentRegistry.search_agents",false],[0,"id103",false]],"search_engine_id (google.adk.tools.vertex_ai_search_tool.vertexaisearchtool attribute)":[[0,"google.adk.tools.vertex_ai_search_tool.VertexAiSearchTool.search_engine_id",false]],"search_engine_id (google.adk.tools.vertexaisearchtool attribute)":[[0,"google.adk.tools.VertexAiSearchTool.search_engine_id",false]],"search_mcp_servers() (google.adk.integrations.agent_registry.agentregistry method)":[[0,"google.adk.integrations.agent_registry.AgentRegistry.search_mcp_servers",false],[0,"id104",false]],"search_memory() (google.adk.agents.context method)":[[0,"google.adk.agents.Context.search_memory",false]],"search_memory() (google.adk.memory.basememoryservice method)":[[0,"google.adk.memory.BaseMemoryService.search_memory",false]],"search_skills() (google.adk.integrations.skill_registry.gcpskillregistry method)":[[0,"google.adk.integrations.skill_registry.GCPSkillRegistry.search_skills",false],[0,"id232",false]],"search_skills() (google.adk.skills.skillregistry method)":[[0,"google.adk.skills.SkillRegistry.search_skills",false]],"search_tool_description() (google.adk.skills.skillregistry method)":[[0,"google.adk.skills.SkillRegistry.search_tool_description",false]],"searchresultmode (class in google.adk.tools)":[[0,"google.adk.tools.SearchResultMode",false]],"searchresultmode (class in google.adk.tools.discovery_engine_search_tool)":[[0,"google.adk.tools.discovery_engine_search_tool.SearchResultMode",false]],"searchskillstool (class in google.adk.tools.skill_toolset)":[[0,"google.adk.tools.skill_toolset.SearchSkillsTool",false]],"secretmanagerclient (class in google.adk.integrations.secret_manager)":[[0,"google.adk.integrations.secret_manager.SecretManagerClient",false],[0,"id223",false]],"self (google.adk.runners.runner attribute)":[[0,"google.adk.runners.Runner.Self",false]],"send() (google.adk.agents.liverequestqueue method)":[[0,"google.adk.agents.LiveRequestQueue.send",false]],"send_activity_end() (google.adk.agents.liverequestqueue method)":[[0,"google.adk.agents.LiveRequestQueue.send_activity_end",false]],"send_activity_start() (google.adk.agents.liverequestqueue method)":[[0,"google.adk.agents.LiveRequestQueue.send_activity_start",false]],"send_content() (google.adk.agents.liverequestqueue method)":[[0,"google.adk.agents.LiveRequestQueue.send_content",false]],"send_realtime() (google.adk.agents.liverequestqueue method)":[[0,"google.adk.agents.LiveRequestQueue.send_realtime",false]],"server_params (google.adk.tools.mcp_tool.stdioconnectionparams attribute)":[[0,"google.adk.tools.mcp_tool.StdioConnectionParams.server_params",false],[0,"id371",false]],"service_tier (google.adk.labs.openai.openairesponsesllm attribute)":[[0,"google.adk.labs.openai.OpenAIResponsesLlm.service_tier",false]],"session (google.adk.agents.context property)":[[0,"google.adk.agents.Context.session",false]],"session (google.adk.agents.invocationcontext attribute)":[[0,"google.adk.agents.InvocationContext.session",false]],"session_resumption (google.adk.agents.runconfig attribute)":[[0,"google.adk.agents.RunConfig.session_resumption",false]],"session_service (google.adk.agents.invocationcontext attribute)":[[0,"google.adk.agents.InvocationContext.session_service",false]],"session_service (google.adk.runners.runner attribute)":[[0,"google.adk.runners.Runner.session_service",false],[0,"id317",false]],"set_agent_state() (google.adk.agents.invocationcontext method)":[[0,"google.adk.agents.InvocationContext.set_agent_state",false]],"set_default_headers() (google.adk.tools.openapi_tool.restapitool method)":[[0,"google.adk.tools.openapi_tool.RestApiTool.set_default_headers",false]],"set_default_live_model() (google.adk.agents.llmagent class method)":[[0,"google.adk.agents.LlmAgent.set_default_live_model",false]],"set_default_model() (google.adk.agents.llmagent class method)":[[0,"google.adk.agents.LlmAgent.set_default_model",false]],"set_execution_id() (google.adk.code_executors.codeexecutorcontext method)":[[0,"google.adk.code_executors.CodeExecutorContext.set_execution_id",false]],"set_model_response (google.adk.events.eventactions attribute)":[[0,"google.adk.events.EventActions.set_model_response",false]],"set_skip_closing_plugins() (google.adk.plugins.pluginmanager method)":[[0,"google.adk.plugins.PluginManager.set_skip_closing_plugins",false]],"set_tool_filter() (google.adk.tools.google_api_tool.googleapitoolset method)":[[0,"google.adk.tools.google_api_tool.GoogleApiToolset.set_tool_filter",false]],"setdefault() (google.adk.sessions.state method)":[[0,"google.adk.sessions.State.setdefault",false]],"setmodelresponsetool (class in google.adk.tools.set_model_response_tool)":[[0,"google.adk.tools.set_model_response_tool.SetModelResponseTool",false]],"sheetstoolset (class in google.adk.tools.google_api_tool)":[[0,"google.adk.tools.google_api_tool.SheetsToolset",false]],"should_add_content_to_experimental_spans (google.adk.telemetry.telemetryconfig property)":[[0,"google.adk.telemetry.TelemetryConfig.should_add_content_to_experimental_spans",false]],"should_add_content_to_legacy_spans (google.adk.telemetry.telemetryconfig property)":[[0,"google.adk.telemetry.TelemetryConfig.should_add_content_to_legacy_spans",false]],"should_add_content_to_logs (google.adk.telemetry.telemetryconfig property)":[[0,"google.adk.telemetry.TelemetryConfig.should_add_content_to_logs",false]],"should_pause_invocation() (google.adk.agents.invocationcontext method)":[[0,"google.adk.agents.InvocationContext.should_pause_invocation",false]],"should_use_experimental_genai_semconv (google.adk.telemetry.telemetryconfig property)":[[0,"google.adk.telemetry.TelemetryConfig.should_use_experimental_genai_semconv",false]],"skillregistry (class in google.adk.skills)":[[0,"google.adk.skills.SkillRegistry",false]],"skills (google.adk.tools.skill_toolset.skilltoolset property)":[[0,"google.adk.tools.skill_toolset.SkillToolset.skills",false]],"skilltoolset (class in google.adk.tools.skill_toolset)":[[0,"google.adk.tools.skill_toolset.SkillToolset",false]],"skip_summarization (google.adk.events.eventactions attribute)":[[0,"google.adk.events.EventActions.skip_summarization",false]],"skip_summarization (google.adk.tools.agent_tool.agenttool attribute)":[[0,"google.adk.tools.agent_tool.AgentTool.skip_summarization",false]],"skip_summarization (google.adk.tools.agent_tool.agenttoolconfig attribute)":[[0,"google.adk.tools.agent_tool.AgentToolConfig.skip_summarization",false]],"skip_summarization (google.adk.tools.agenttool attribute)":[[0,"google.adk.tools.AgentTool.skip_summarization",false]],"slackrunner (class in google.adk.integrations.slack)":[[0,"google.adk.integrations.slack.SlackRunner",false],[0,"id234",false]],"slidestoolset (class in google.adk.tools.google_api_tool)":[[0,"google.adk.tools.google_api_tool.SlidesToolset",false]],"source (google.adk.integrations.eventarc.cloudeventattributesbinding attribute)":[[0,"google.adk.integrations.eventarc.CloudEventAttributesBinding.source",false],[0,"id185",false]],"span_and_event (google.adk.telemetry.contentcapturingmode attribute)":[[0,"google.adk.telemetry.ContentCapturingMode.SPAN_AND_EVENT",false]],"span_only (google.adk.telemetry.contentcapturingmode attribute)":[[0,"google.adk.telemetry.ContentCapturingMode.SPAN_ONLY",false]],"spanneradmintoolset (class in google.adk.tools.spanner)":[[0,"google.adk.tools.spanner.SpannerAdminToolset",false]],"spannertoolset (class in google.adk.tools.spanner)":[[0,"google.adk.tools.spanner.SpannerToolset",false]],"specversion (google.adk.integrations.eventarc.cloudeventattributesbinding attribute)":[[0,"google.adk.integrations.eventarc.CloudEventAttributesBinding.specversion",false],[0,"id186",false]],"speech_config (google.adk.agents.runconfig attribute)":[[0,"google.adk.agents.RunConfig.speech_config",false]],"src (google.adk.skills.script attribute)":[[0,"google.adk.skills.Script.src",false]],"sse_read_timeout (google.adk.tools.mcp_tool.sseconnectionparams attribute)":[[0,"google.adk.tools.mcp_tool.SseConnectionParams.sse_read_timeout",false],[0,"id368",false]],"sse_read_timeout (google.adk.tools.mcp_tool.streamablehttpconnectionparams attribute)":[[0,"google.adk.tools.mcp_tool.StreamableHTTPConnectionParams.sse_read_timeout",false],[0,"id375",false]],"stamp_event_branch_context() (google.adk.agents.invocationcontext method)":[[0,"google.adk.agents.InvocationContext.stamp_event_branch_context",false]],"start() (google.adk.integrations.slack.slackrunner method)":[[0,"google.adk.integrations.slack.SlackRunner.start",false],[0,"id235",false]],"state (class in google.adk.sessions)":[[0,"google.adk.sessions.State",false]],"state (google.adk.agents.context property)":[[0,"google.adk.agents.Context.state",false]],"state (google.adk.sessions.session attribute)":[[0,"google.adk.sessions.Session.state",false]],"state_delta (google.adk.agents.liverequest attribute)":[[0,"google.adk.agents.LiveRequest.state_delta",false]],"state_delta (google.adk.events.eventactions attribute)":[[0,"google.adk.events.EventActions.state_delta",false]],"state_schema (google.adk.workflow.basenode attribute)":[[0,"google.adk.workflow.BaseNode.state_schema",false]],"stateful (google.adk.code_executors.basecodeexecutor attribute)":[[0,"google.adk.code_executors.BaseCodeExecutor.stateful",false],[0,"id71",false]],"stateful (google.adk.code_executors.unsafelocalcodeexecutor attribute)":[[0,"google.adk.code_executors.UnsafeLocalCodeExecutor.stateful",false]],"stateful (google.adk.integrations.cloud_run.cloudrunsandboxcodeexecutor attribute)":[[0,"google.adk.integrations.cloud_run.CloudRunSandboxCodeExecutor.stateful",false],[0,"id114",false]],"stateschemaerror":[[0,"google.adk.sessions.StateSchemaError",false]],"static_instruction (google.adk.agents.llmagent attribute)":[[0,"google.adk.agents.LlmAgent.static_instruction",false]],"static_instruction (google.adk.agents.llmagentconfig attribute)":[[0,"google.adk.agents.LlmAgentConfig.static_instruction",false]],"stderr (google.adk.environment.executionresult attribute)":[[0,"google.adk.environment.ExecutionResult.stderr",false]],"stdout (google.adk.environment.executionresult attribute)":[[0,"google.adk.environment.ExecutionResult.stdout",false]],"store (google.adk.labs.openai.openairesponsesllm attribute)":[[0,"google.adk.labs.openai.OpenAIResponsesLlm.store",false]],"streaming_mode (google.adk.agents.runconfig attribute)":[[0,"google.adk.agents.RunConfig.streaming_mode",false]],"sub_agents (google.adk.agents.baseagent attribute)":[[0,"google.adk.agents.BaseAgent.sub_agents",false]],"sub_agents (google.adk.agents.baseagentconfig attribute)":[[0,"google.adk.agents.BaseAgentConfig.sub_agents",false]],"subject (google.adk.integrations.eventarc.cloudeventattributesbinding attribute)":[[0,"google.adk.integrations.eventarc.CloudEventAttributesBinding.subject",false],[0,"id187",false]],"support_cfc (google.adk.agents.runconfig attribute)":[[0,"google.adk.agents.RunConfig.support_cfc",false]],"supported_auth_schemes (google.adk.integrations.agent_identity.gcpauthprovider property)":[[0,"google.adk.integrations.agent_identity.GcpAuthProvider.supported_auth_schemes",false],[0,"id82",false]],"supported_models() (google.adk.labs.openai.openaillm class method)":[[0,"google.adk.labs.openai.OpenAILlm.supported_models",false]],"supported_models() (google.adk.labs.openai.openairesponsesllm class method)":[[0,"google.adk.labs.openai.OpenAIResponsesLlm.supported_models",false]],"supported_models() (google.adk.models.basellm class method)":[[0,"google.adk.models.BaseLlm.supported_models",false]],"telemetry (google.adk.agents.runconfig attribute)":[[0,"google.adk.agents.RunConfig.telemetry",false]],"telemetry_context (google.adk.agents.context property)":[[0,"google.adk.agents.Context.telemetry_context",false]],"temp_prefix (google.adk.sessions.state attribute)":[[0,"google.adk.sessions.State.TEMP_PREFIX",false]],"terminate_on_close (google.adk.tools.mcp_tool.streamablehttpconnectionparams attribute)":[[0,"google.adk.tools.mcp_tool.StreamableHTTPConnectionParams.terminate_on_close",false],[0,"id376",false]],"thinking_config (google.adk.planners.builtinplanner attribute)":[[0,"google.adk.planners.BuiltInPlanner.thinking_config",false],[0,"id308",false]],"time (google.adk.integrations.eventarc.cloudeventattributesbinding attribute)":[[0,"google.adk.integrations.eventarc.CloudEventAttributesBinding.time",false],[0,"id188",false]],"timed_out (google.adk.environment.executionresult attribute)":[[0,"google.adk.environment.ExecutionResult.timed_out",false]],"timeout (google.adk.tools.mcp_tool.sseconnectionparams attribute)":[[0,"google.adk.tools.mcp_tool.SseConnectionParams.timeout",false],[0,"id369",false]],"timeout (google.adk.tools.mcp_tool.stdioconnectionparams attribute)":[[0,"google.adk.tools.mcp_tool.StdioConnectionParams.timeout",false],[0,"id372",false]],"timeout (google.adk.tools.mcp_tool.streamablehttpconnectionparams attribute)":[[0,"google.adk.tools.mcp_tool.StreamableHTTPConnectionParams.timeout",false],[0,"id377",false]],"timeout (google.adk.workflow.basenode attribute)":[[0,"google.adk.workflow.BaseNode.timeout",false]],"timeout_seconds (google.adk.code_executors.basecodeexecutor attribute)":[[0,"google.adk.code_executors.BaseCodeExecutor.timeout_seconds",false],[0,"id72",false]],"timeout_seconds (google.adk.integrations.cloud_run.cloudrunsandboxcodeexecutor attribute)":[[0,"google.adk.integrations.cloud_run.CloudRunSandboxCodeExecutor.timeout_seconds",false]],"timeout_seconds (google.adk.tools.bash_tool.bashtoolpolicy attribute)":[[0,"google.adk.tools.bash_tool.BashToolPolicy.timeout_seconds",false]],"timestamp (google.adk.events.event attribute)":[[0,"google.adk.events.Event.timestamp",false]],"to_dict() (google.adk.sessions.state method)":[[0,"google.adk.sessions.State.to_dict",false]],"to_mcp_server() (in module google.adk.tools.mcp_tool)":[[0,"google.adk.tools.mcp_tool.to_mcp_server",false]],"to_node (google.adk.workflow.edge attribute)":[[0,"google.adk.workflow.Edge.to_node",false]],"token_compaction_checked (google.adk.agents.invocationcontext attribute)":[[0,"google.adk.agents.InvocationContext.token_compaction_checked",false]],"tool (google.adk.integrations.crewai.crewaitool attribute)":[[0,"google.adk.integrations.crewai.CrewaiTool.tool",false],[0,"id124",false]],"tool (google.adk.integrations.crewai.crewaitoolconfig attribute)":[[0,"google.adk.integrations.crewai.CrewaiToolConfig.tool",false],[0,"id128",false]],"tool (google.adk.integrations.langchain.langchaintoolconfig attribute)":[[0,"google.adk.integrations.langchain.LangchainToolConfig.tool",false],[0,"id213",false]],"tool (google.adk.tools.crewai_tool.crewaitool attribute)":[[0,"google.adk.tools.crewai_tool.CrewaiTool.tool",false]],"tool (google.adk.tools.crewai_tool.crewaitoolconfig attribute)":[[0,"google.adk.tools.crewai_tool.CrewaiToolConfig.tool",false]],"tool (google.adk.tools.langchain_tool.langchaintoolconfig attribute)":[[0,"google.adk.tools.langchain_tool.LangchainToolConfig.tool",false]],"tool_confirmation (google.adk.agents.context property)":[[0,"google.adk.agents.Context.tool_confirmation",false]],"tool_thread_pool_config (google.adk.agents.runconfig attribute)":[[0,"google.adk.agents.RunConfig.tool_thread_pool_config",false]],"toolboxtoolset (class in google.adk.tools.toolbox_toolset)":[[0,"google.adk.tools.toolbox_toolset.ToolboxToolset",false]],"toolcontext (in module google.adk.tools)":[[0,"google.adk.tools.ToolContext",false]],"toolpredicate (class in google.adk.tools.base_toolset)":[[0,"google.adk.tools.base_toolset.ToolPredicate",false]],"tools (google.adk.agents.llmagent attribute)":[[0,"google.adk.agents.LlmAgent.tools",false]],"tools (google.adk.agents.llmagentconfig attribute)":[[0,"google.adk.agents.LlmAgentConfig.tools",false]],"tools (google.adk.agents.managedagent attribute)":[[0,"google.adk.agents.ManagedAgent.tools",false]],"trace_call_llm() (in module google.adk.telemetry)":[[0,"google.adk.telemetry.trace_call_llm",false]],"trace_merged_tool_calls() (in module google.adk.telemetry)":[[0,"google.adk.telemetry.trace_merged_tool_calls",false]],"trace_send_data() (in module google.adk.telemetry)":[[0,"google.adk.telemetry.trace_send_data",false]],"trace_tool_call() (in module google.adk.telemetry)":[[0,"google.adk.telemetry.trace_tool_call",false]],"transcription_cache (google.adk.agents.invocationcontext attribute)":[[0,"google.adk.agents.InvocationContext.transcription_cache",false]],"transfer_to_agent (google.adk.events.eventactions attribute)":[[0,"google.adk.events.EventActions.transfer_to_agent",false]],"transfer_to_agent() (in module google.adk.tools)":[[0,"google.adk.tools.transfer_to_agent",false]],"transfer_to_agent() (in module google.adk.tools.transfer_to_agent_tool)":[[0,"google.adk.tools.transfer_to_agent_tool.transfer_to_agent",false]],"transfertoagenttool (class in google.adk.tools)":[[0,"google.adk.tools.TransferToAgentTool",false]],"transfertoagenttool (class in google.adk.tools.transfer_to_agent_tool)":[[0,"google.adk.tools.transfer_to_agent_tool.TransferToAgentTool",false]],"translation_config (google.adk.agents.runconfig attribute)":[[0,"google.adk.agents.RunConfig.translation_config",false]],"truncation (google.adk.labs.openai.openairesponsesllm attribute)":[[0,"google.adk.labs.openai.OpenAIResponsesLlm.truncation",false]],"type (google.adk.integrations.eventarc.cloudeventattributesbinding attribute)":[[0,"google.adk.integrations.eventarc.CloudEventAttributesBinding.type",false],[0,"id189",false]],"type_ (google.adk.integrations.agent_identity.gcpauthproviderscheme attribute)":[[0,"google.adk.integrations.agent_identity.GcpAuthProviderScheme.type_",false],[0,"id78",false],[0,"id87",false],[0,"id91",false]],"type_text() (google.adk.integrations.vmaas.sandboxclient method)":[[0,"google.adk.integrations.vmaas.SandboxClient.type_text",false],[0,"id303",false]],"type_text_at() (google.adk.integrations.vmaas.agentenginesandboxcomputer method)":[[0,"google.adk.integrations.vmaas.AgentEngineSandboxComputer.type_text_at",false],[0,"id287",false]],"type_text_at() (google.adk.integrations.vmaas.sandboxclient method)":[[0,"google.adk.integrations.vmaas.SandboxClient.type_text_at",false],[0,"id304",false]],"update() (google.adk.sessions.state method)":[[0,"google.adk.sessions.State.update",false]],"update_access_token() (google.adk.integrations.vmaas.sandboxclient method)":[[0,"google.adk.integrations.vmaas.SandboxClient.update_access_token",false],[0,"id305",false]],"update_code_execution_result() (google.adk.code_executors.codeexecutorcontext method)":[[0,"google.adk.code_executors.CodeExecutorContext.update_code_execution_result",false]],"url (google.adk.tools.mcp_tool.sseconnectionparams attribute)":[[0,"google.adk.tools.mcp_tool.SseConnectionParams.url",false],[0,"id370",false]],"url (google.adk.tools.mcp_tool.streamablehttpconnectionparams attribute)":[[0,"google.adk.tools.mcp_tool.StreamableHTTPConnectionParams.url",false],[0,"id378",false]],"url (google.adk.tools.remotemcpserver attribute)":[[0,"google.adk.tools.RemoteMcpServer.url",false]],"urlcontexttool (class in google.adk.tools.url_context_tool)":[[0,"google.adk.tools.url_context_tool.UrlContextTool",false]],"user_content (google.adk.agents.invocationcontext attribute)":[[0,"google.adk.agents.InvocationContext.user_content",false]],"user_id (google.adk.agents.invocationcontext property)":[[0,"google.adk.agents.InvocationContext.user_id",false]],"user_id (google.adk.sessions.session attribute)":[[0,"google.adk.sessions.Session.user_id",false]],"user_prefix (google.adk.sessions.state attribute)":[[0,"google.adk.sessions.State.USER_PREFIX",false]],"validate_generate_content_config() (google.adk.agents.llmagent class method)":[[0,"google.adk.agents.LlmAgent.validate_generate_content_config",false]],"validate_max_llm_calls() (google.adk.agents.runconfig class method)":[[0,"google.adk.agents.RunConfig.validate_max_llm_calls",false]],"validate_name() (google.adk.agents.baseagent class method)":[[0,"google.adk.agents.BaseAgent.validate_name",false]],"validate_sub_agents_unique_names() (google.adk.agents.baseagent class method)":[[0,"google.adk.agents.BaseAgent.validate_sub_agents_unique_names",false]],"vertexaiexamplestore (class in google.adk.examples)":[[0,"google.adk.examples.VertexAiExampleStore",false]],"vertexailoadprofilestool (class in google.adk.tools)":[[0,"google.adk.tools.VertexAiLoadProfilesTool",false]],"vertexailoadprofilestool (class in google.adk.tools.vertex_ai_load_profiles_tool)":[[0,"google.adk.tools.vertex_ai_load_profiles_tool.VertexAiLoadProfilesTool",false]],"vertexaisearchtool (class in google.adk.tools)":[[0,"google.adk.tools.VertexAiSearchTool",false]],"vertexaisearchtool (class in google.adk.tools.vertex_ai_search_tool)":[[0,"google.adk.tools.vertex_ai_search_tool.VertexAiSearchTool",false]],"vertexaisessionservice (class in google.adk.sessions)":[[0,"google.adk.sessions.VertexAiSessionService",false]],"visibility (google.adk.tools.mcp_tool.mcptool property)":[[0,"google.adk.tools.mcp_tool.McpTool.visibility",false]],"wait() (google.adk.integrations.vmaas.agentenginesandboxcomputer method)":[[0,"google.adk.integrations.vmaas.AgentEngineSandboxComputer.wait",false],[0,"id288",false]],"wait_for_output (google.adk.workflow.basenode attribute)":[[0,"google.adk.workflow.BaseNode.wait_for_output",false]],"working_dir (google.adk.environment.baseenvironment property)":[[0,"google.adk.environment.BaseEnvironment.working_dir",false]],"working_dir (google.adk.environment.localenvironment property)":[[0,"google.adk.environment.LocalEnvironment.working_dir",false]],"working_dir (google.adk.integrations.daytona.daytonaenvironment property)":[[0,"google.adk.integrations.daytona.DaytonaEnvironment.working_dir",false],[0,"id151",false]],"working_dir (google.adk.integrations.e2b.e2benvironment property)":[[0,"google.adk.integrations.e2b.E2BEnvironment.working_dir",false],[0,"id175",false]],"wrapped_property (google.adk.agents.runconfig attribute)":[[0,"google.adk.agents.RunConfig.wrapped_property",false],[0,"id65",false]],"write_file() (google.adk.environment.baseenvironment method)":[[0,"google.adk.environment.BaseEnvironment.write_file",false]],"write_file() (google.adk.environment.localenvironment method)":[[0,"google.adk.environment.LocalEnvironment.write_file",false]],"write_file() (google.adk.integrations.daytona.daytonaenvironment method)":[[0,"google.adk.integrations.daytona.DaytonaEnvironment.write_file",false],[0,"id152",false]],"write_file() (google.adk.integrations.e2b.e2benvironment method)":[[0,"google.adk.integrations.e2b.E2BEnvironment.write_file",false],[0,"id176",false]],"youtubetoolset (class in google.adk.tools.google_api_tool)":[[0,"google.adk.tools.google_api_tool.YoutubeToolset",false]]},"objects":{"google.adk":[[0,0,0,"-","a2a"],[0,0,0,"-","agents"],[0,0,0,"-","apps"],[0,0,0,"-","artifacts"],[0,0,0,"-","auth"],[0,0,0,"-","code_executors"],[0,0,0,"-","environment"],[0,0,0,"-","errors"],[0,0,0,"-","evaluation"],[0,0,0,"-","events"],[0,0,0,"-","examples"],[0,0,0,"-","flows"],[0,0,0,"-","integrations"],[0,0,0,"-","memory"],[0,0,0,"-","models"],[0,0,0,"-","optimization"],[0,0,0,"-","planners"],[0,0,0,"-","platform"],[0,0,0,"-","plugins"],[0,0,0,"-","runners"],[0,0,0,"-","sessions"],[0,0,0,"-","skills"],[0,0,0,"-","telemetry"],[0,0,0,"-","tools"],[0,0,0,"-","utils"],[0,0,0,"-","version"],[0,0,0,"-","workflow"]],"google.adk.agents":[[0,1,1,"","Agent"],[0,2,1,"","BaseAgent"],[0,2,1,"","BaseAgentConfig"],[0,7,1,"","Context"],[0,2,1,"","InvocationContext"],[0,2,1,"","LiveRequest"],[0,7,1,"","LiveRequestQueue"],[0,2,1,"","LlmAgent"],[0,2,1,"","LlmAgentConfig"],[0,2,1,"","LoopAgent"],[0,2,1,"","LoopAgentConfig"],[0,2,1,"","ManagedAgent"],[0,7,1,"","McpInstructionProvider"],[0,2,1,"","ParallelAgent"],[0,2,1,"","ParallelAgentConfig"],[0,2,1,"","RunConfig"],[0,2,1,"","SequentialAgent"],[0,2,1,"","SequentialAgentConfig"]],"google.adk.agents.BaseAgent":[[0,3,1,"","after_agent_callback"],[0,3,1,"","before_agent_callback"],[0,4,1,"","canonical_after_agent_callbacks"],[0,4,1,"","canonical_before_agent_callbacks"],[0,5,1,"","clone"],[0,1,1,"","config_type"],[0,3,1,"","description"],[0,5,1,"","find_agent"],[0,5,1,"","find_sub_agent"],[0,5,1,"","from_config"],[0,5,1,"","model_post_init"],[0,3,1,"","name"],[0,3,1,"","parent_agent"],[0,4,1,"","root_agent"],[0,5,1,"","run_async"],[0,5,1,"","run_live"],[0,3,1,"","sub_agents"],[0,6,1,"","validate_name"],[0,6,1,"","validate_sub_agents_unique_names"]],"google.adk.agents.BaseAgentConfig":[[0,3,1,"","after_agent_callbacks"],[0,3,1,"","agent_class"],[0,3,1,"","before_agent_callbacks"],[0,3,1,"","description"],[0,3,1,"","name"],[0,3,1,"","sub_agents"]],"google.adk.agents.Context":[[0,4,1,"","actions"],[0,5,1,"","add_events_to_memory"],[0,5,1,"","add_memory"],[0,5,1,"","add_session_to_memory"],[0,4,1,"","attempt_count"],[0,4,1,"","branch"],[0,4,1,"","custom_metadata"],[0,4,1,"","error"],[0,4,1,"","error_node_path"],[0,4,1,"","event_author"],[0,4,1,"","function_call_id"],[0,5,1,"","get_artifact_version"],[0,5,1,"","get_auth_response"],[0,5,1,"","get_invocation_context"],[0,4,1,"","interrupt_ids"],[0,4,1,"","isolation_scope"],[0,5,1,"","list_artifacts"],[0,5,1,"","load_artifact"],[0,5,1,"","load_credential"],[0,4,1,"","node"],[0,4,1,"","node_path"],[0,4,1,"","output"],[0,4,1,"","parent_ctx"],[0,5,1,"","render_ui_widget"],[0,5,1,"","request_confirmation"],[0,5,1,"","request_credential"],[0,4,1,"","resume_inputs"],[0,4,1,"","route"],[0,4,1,"","run_id"],[0,5,1,"","run_node"],[0,5,1,"","save_artifact"],[0,5,1,"","save_credential"],[0,5,1,"","search_memory"],[0,4,1,"","session"],[0,4,1,"","state"],[0,4,1,"","telemetry_context"],[0,4,1,"","tool_confirmation"]],"google.adk.agents.InvocationContext":[[0,3,1,"","active_non_blocking_tool_tasks"],[0,3,1,"","active_streaming_tools"],[0,3,1,"","agent"],[0,3,1,"","agent_states"],[0,4,1,"","app_name"],[0,3,1,"","artifact_service"],[0,3,1,"","branch"],[0,3,1,"","canonical_tools_cache"],[0,3,1,"","context_cache_config"],[0,3,1,"","credential_by_key"],[0,3,1,"","credential_service"],[0,3,1,"","end_invocation"],[0,3,1,"","end_of_agents"],[0,3,1,"","events_compaction_config"],[0,5,1,"","increment_llm_call_count"],[0,3,1,"","input_realtime_cache"],[0,3,1,"","invocation_id"],[0,4,1,"","is_resumable"],[0,3,1,"","isolation_scope"],[0,3,1,"","live_request_queue"],[0,3,1,"","live_session_resumption_handle"],[0,3,1,"","memory_service"],[0,5,1,"","model_post_init"],[0,3,1,"","node_path"],[0,3,1,"","output_realtime_cache"],[0,3,1,"","plugin_manager"],[0,5,1,"","populate_invocation_agent_states"],[0,5,1,"","reset_sub_agent_states"],[0,3,1,"","resumability_config"],[0,3,1,"","run_config"],[0,3,1,"","session"],[0,3,1,"","session_service"],[0,5,1,"","set_agent_state"],[0,5,1,"","should_pause_invocation"],[0,5,1,"","stamp_event_branch_context"],[0,3,1,"","token_compaction_checked"],[0,3,1,"","transcription_cache"],[0,3,1,"","user_content"],[0,4,1,"","user_id"]],"google.adk.agents.LiveRequest":[[0,3,1,"","activity_end"],[0,3,1,"","activity_start"],[0,3,1,"","blob"],[0,3,1,"","close"],[0,3,1,"","content"],[0,3,1,"","partial"],[0,3,1,"","state_delta"]],"google.adk.agents.LiveRequestQueue":[[0,5,1,"","close"],[0,5,1,"","get"],[0,5,1,"","send"],[0,5,1,"","send_activity_end"],[0,5,1,"","send_activity_start"],[0,5,1,"","send_content"],[0,5,1,"","send_realtime"]],"google.adk.agents.LlmAgent":[[0,1,1,"","DEFAULT_LIVE_MODEL"],[0,1,1,"","DEFAULT_MODEL"],[0,3,1,"","after_model_callback"],[0,3,1,"","after_tool_callback"],[0,3,1,"","before_model_callback"],[0,3,1,"","before_tool_callback"],[0,4,1,"","canonical_after_model_callbacks"],[0,4,1,"","canonical_after_tool_callbacks"],[0,4,1,"","canonical_before_model_callbacks"],[0,4,1,"","canonical_before_tool_callbacks"],[0,5,1,"","canonical_global_instruction"],[0,5,1,"","canonical_instruction"],[0,4,1,"","canonical_live_model"],[0,4,1,"","canonical_model"],[0,4,1,"","canonical_on_model_error_callbacks"],[0,4,1,"","canonical_on_tool_error_callbacks"],[0,5,1,"","canonical_tools"],[0,3,1,"","code_executor"],[0,1,1,"","config_type"],[0,3,1,"","disallow_transfer_to_parent"],[0,3,1,"","disallow_transfer_to_peers"],[0,3,1,"","generate_content_config"],[0,3,1,"","global_instruction"],[0,3,1,"","include_contents"],[0,3,1,"","input_schema"],[0,3,1,"","instruction"],[0,3,1,"","mode"],[0,3,1,"","model"],[0,5,1,"","model_post_init"],[0,3,1,"","on_model_error_callback"],[0,3,1,"","on_tool_error_callback"],[0,3,1,"","output_key"],[0,3,1,"","output_schema"],[0,3,1,"","parallel_worker"],[0,3,1,"","planner"],[0,5,1,"","set_default_live_model"],[0,5,1,"","set_default_model"],[0,3,1,"","static_instruction"],[0,3,1,"","tools"],[0,6,1,"","validate_generate_content_config"]],"google.adk.agents.LlmAgentConfig":[[0,3,1,"","after_model_callbacks"],[0,3,1,"","after_tool_callbacks"],[0,3,1,"","agent_class"],[0,3,1,"","before_model_callbacks"],[0,3,1,"","before_tool_callbacks"],[0,3,1,"","disallow_transfer_to_parent"],[0,3,1,"","disallow_transfer_to_peers"],[0,3,1,"","generate_content_config"],[0,3,1,"","include_contents"],[0,3,1,"","input_schema"],[0,3,1,"","instruction"],[0,3,1,"","model"],[0,3,1,"","model_code"],[0,3,1,"","output_key"],[0,3,1,"","output_schema"],[0,3,1,"","static_instruction"],[0,3,1,"","tools"]],"google.adk.agents.LoopAgent":[[0,1,1,"","config_type"],[0,3,1,"","max_iterations"]],"google.adk.agents.LoopAgentConfig":[[0,3,1,"","agent_class"],[0,3,1,"","max_iterations"]],"google.adk.agents.ManagedAgent":[[0,3,1,"","agent_config"],[0,3,1,"","agent_id"],[0,4,1,"","api_client"],[0,5,1,"","canonical_instruction"],[0,3,1,"","environment"],[0,3,1,"","instruction"],[0,3,1,"","mode"],[0,5,1,"","model_post_init"],[0,3,1,"","tools"]],"google.adk.agents.ParallelAgent":[[0,1,1,"","config_type"]],"google.adk.agents.ParallelAgentConfig":[[0,3,1,"","agent_class"]],"google.adk.agents.RunConfig":[[0,3,1,"","avatar_config"],[0,6,1,"","check_for_deprecated_save_live_audio"],[0,3,1,"","context_window_compression"],[0,3,1,"","custom_metadata"],[0,3,1,"","enable_affective_dialog"],[0,3,1,"","explicit_vad_signal"],[0,1,1,"id66","field_name"],[0,3,1,"","get_session_config"],[0,3,1,"","history_config"],[0,3,1,"","http_options"],[0,3,1,"","include_thoughts_from_other_agents"],[0,3,1,"","input_audio_transcription"],[0,3,1,"","labels"],[0,3,1,"","max_llm_calls"],[0,3,1,"","model_input_context"],[0,1,1,"id0","msg"],[0,3,1,"","output_audio_transcription"],[0,3,1,"","proactivity"],[0,3,1,"","realtime_input_config"],[0,3,1,"","response_modalities"],[0,1,1,"","save_input_blobs_as_artifacts"],[0,1,1,"","save_live_audio"],[0,3,1,"","save_live_blob"],[0,3,1,"","session_resumption"],[0,3,1,"","speech_config"],[0,3,1,"","streaming_mode"],[0,3,1,"","support_cfc"],[0,3,1,"","telemetry"],[0,3,1,"","tool_thread_pool_config"],[0,3,1,"","translation_config"],[0,6,1,"","validate_max_llm_calls"],[0,1,1,"id65","wrapped_property"]],"google.adk.agents.SequentialAgent":[[0,1,1,"","config_type"]],"google.adk.agents.SequentialAgentConfig":[[0,3,1,"","agent_class"]],"google.adk.artifacts":[[0,7,1,"","BaseArtifactService"]],"google.adk.artifacts.BaseArtifactService":[[0,5,1,"","delete_artifact"],[0,5,1,"","get_artifact_version"],[0,5,1,"","list_artifact_keys"],[0,5,1,"","list_artifact_versions"],[0,5,1,"","list_versions"],[0,5,1,"","load_artifact"],[0,5,1,"","save_artifact"]],"google.adk.code_executors":[[0,2,1,"","BaseCodeExecutor"],[0,2,1,"","BuiltInCodeExecutor"],[0,7,1,"","CodeExecutorContext"],[0,2,1,"","UnsafeLocalCodeExecutor"]],"google.adk.code_executors.BaseCodeExecutor":[[0,3,1,"id67","code_block_delimiters"],[0,3,1,"id68","error_retry_attempts"],[0,5,1,"","execute_code"],[0,3,1,"id69","execution_result_delimiters"],[0,3,1,"id70","optimize_data_file"],[0,3,1,"id71","stateful"],[0,3,1,"id72","timeout_seconds"]],"google.adk.code_executors.BuiltInCodeExecutor":[[0,5,1,"","execute_code"],[0,5,1,"","process_llm_request"]],"google.adk.code_executors.CodeExecutorContext":[[0,5,1,"","add_input_files"],[0,5,1,"","add_processed_file_names"],[0,5,1,"","clear_input_files"],[0,5,1,"","get_error_count"],[0,5,1,"","get_execution_id"],[0,5,1,"","get_input_files"],[0,5,1,"","get_processed_file_names"],[0,5,1,"","get_state_delta"],[0,5,1,"","increment_error_count"],[0,5,1,"","reset_error_count"],[0,5,1,"","set_execution_id"],[0,5,1,"","update_code_execution_result"]],"google.adk.code_executors.UnsafeLocalCodeExecutor":[[0,5,1,"","execute_code"],[0,3,1,"","optimize_data_file"],[0,3,1,"","stateful"]],"google.adk.environment":[[0,7,1,"","BaseEnvironment"],[0,7,1,"","ExecutionResult"],[0,7,1,"","LocalEnvironment"]],"google.adk.environment.BaseEnvironment":[[0,5,1,"","close"],[0,5,1,"","execute"],[0,5,1,"","initialize"],[0,4,1,"","is_initialized"],[0,5,1,"","read_file"],[0,4,1,"","working_dir"],[0,5,1,"","write_file"]],"google.adk.environment.ExecutionResult":[[0,1,1,"","exit_code"],[0,1,1,"","stderr"],[0,1,1,"","stdout"],[0,1,1,"","timed_out"]],"google.adk.environment.LocalEnvironment":[[0,5,1,"","close"],[0,5,1,"","execute"],[0,5,1,"","initialize"],[0,5,1,"","read_file"],[0,4,1,"","working_dir"],[0,5,1,"","write_file"]],"google.adk.evaluation":[[0,7,1,"","AgentEvaluator"]],"google.adk.evaluation.AgentEvaluator":[[0,5,1,"","evaluate"],[0,5,1,"","evaluate_eval_set"],[0,5,1,"","find_config_for_test_file"],[0,5,1,"","migrate_eval_data_to_new_schema"]],"google.adk.events":[[0,2,1,"","Event"],[0,2,1,"","EventActions"],[0,2,1,"","RequestInput"]],"google.adk.events.Event":[[0,3,1,"","actions"],[0,3,1,"","author"],[0,3,1,"","branch"],[0,5,1,"","has_trailing_code_execution_result"],[0,3,1,"","id"],[0,3,1,"","invocation_id"],[0,5,1,"","is_final_response"],[0,3,1,"","isolation_scope"],[0,3,1,"","long_running_tool_ids"],[0,4,1,"","message"],[0,5,1,"","model_post_init"],[0,5,1,"","new_id"],[0,3,1,"","node_info"],[0,4,1,"","node_name"],[0,3,1,"","output"],[0,3,1,"","timestamp"]],"google.adk.events.EventActions":[[0,3,1,"","agent_state"],[0,3,1,"","artifact_delta"],[0,3,1,"","compaction"],[0,3,1,"","end_of_agent"],[0,3,1,"","escalate"],[0,3,1,"","render_ui_widgets"],[0,3,1,"","requested_auth_configs"],[0,3,1,"","requested_tool_confirmations"],[0,3,1,"","rewind_before_invocation_id"],[0,3,1,"","route"],[0,3,1,"","set_model_response"],[0,3,1,"","skip_summarization"],[0,3,1,"","state_delta"],[0,3,1,"","transfer_to_agent"]],"google.adk.events.RequestInput":[[0,3,1,"","interrupt_id"],[0,3,1,"","message"],[0,3,1,"","payload"],[0,3,1,"","response_schema"]],"google.adk.examples":[[0,7,1,"","BaseExampleProvider"],[0,2,1,"","Example"],[0,7,1,"","VertexAiExampleStore"]],"google.adk.examples.BaseExampleProvider":[[0,5,1,"","get_examples"]],"google.adk.examples.Example":[[0,3,1,"id73","input"],[0,3,1,"id74","output"]],"google.adk.examples.VertexAiExampleStore":[[0,5,1,"","get_examples"]],"google.adk.integrations":[[0,0,0,"module-0","agent_identity"],[0,0,0,"module-1","agent_registry"],[0,0,0,"module-2","api_registry"],[0,0,0,"module-3","bigquery"],[0,0,0,"module-4","cloud_run"],[0,0,0,"module-5","crewai"],[0,0,0,"module-6","daytona"],[0,0,0,"module-7","e2b"],[0,0,0,"module-8","eventarc"],[0,0,0,"module-9","firestore"],[0,0,0,"module-10","gcs"],[0,0,0,"module-11","langchain"],[0,0,0,"module-12","oci"],[0,0,0,"module-13","parameter_manager"],[0,0,0,"module-14","secret_manager"],[0,0,0,"module-15","skill_registry"],[0,0,0,"module-16","slack"],[0,0,0,"module-17","vmaas"]],"google.adk.integrations.agent_identity":[[0,7,1,"id80","GcpAuthProvider"],[0,2,1,"id83","GcpAuthProviderScheme"]],"google.adk.integrations.agent_identity.GcpAuthProvider":[[0,5,1,"id81","get_auth_credential"],[0,4,1,"id82","supported_auth_schemes"]],"google.adk.integrations.agent_identity.GcpAuthProviderScheme":[[0,3,1,"id88","continue_uri"],[0,3,1,"id89","name"],[0,3,1,"id90","scopes"],[0,3,1,"id91","type_"]],"google.adk.integrations.agent_registry":[[0,7,1,"id93","AgentRegistry"]],"google.adk.integrations.agent_registry.AgentRegistry":[[0,5,1,"id94","get_agent_info"],[0,5,1,"id95","get_endpoint"],[0,5,1,"id96","get_mcp_server"],[0,5,1,"id97","get_mcp_toolset"],[0,5,1,"id98","get_model_name"],[0,5,1,"id99","get_remote_a2a_agent"],[0,5,1,"id100","list_agents"],[0,5,1,"id101","list_endpoints"],[0,5,1,"id102","list_mcp_servers"],[0,5,1,"id103","search_agents"],[0,5,1,"id104","search_mcp_servers"]],"google.adk.integrations.api_registry":[[0,7,1,"id106","ApiRegistry"]],"google.adk.integrations.api_registry.ApiRegistry":[[0,5,1,"id107","get_toolset"]],"google.adk.integrations.cloud_run":[[0,2,1,"id110","CloudRunSandboxCodeExecutor"]],"google.adk.integrations.cloud_run.CloudRunSandboxCodeExecutor":[[0,3,1,"id111","allow_egress"],[0,3,1,"","code_block_delimiters"],[0,3,1,"","error_retry_attempts"],[0,5,1,"id115","execute_code"],[0,3,1,"","execution_result_delimiters"],[0,3,1,"id112","optimize_data_file"],[0,3,1,"id113","sandbox_bin"],[0,3,1,"id114","stateful"],[0,3,1,"","timeout_seconds"]],"google.adk.integrations.crewai":[[0,7,1,"id119","CrewaiTool"],[0,2,1,"id125","CrewaiToolConfig"]],"google.adk.integrations.crewai.CrewaiTool":[[0,1,1,"","description"],[0,5,1,"id120","from_config"],[0,1,1,"","name"],[0,5,1,"id121","run_async"],[0,1,1,"id124","tool"]],"google.adk.integrations.crewai.CrewaiToolConfig":[[0,3,1,"id126","description"],[0,3,1,"id127","name"],[0,3,1,"id128","tool"]],"google.adk.integrations.daytona":[[0,7,1,"id146","DaytonaEnvironment"]],"google.adk.integrations.daytona.DaytonaEnvironment":[[0,5,1,"id147","close"],[0,5,1,"id148","execute"],[0,5,1,"id149","initialize"],[0,5,1,"id150","read_file"],[0,4,1,"id151","working_dir"],[0,5,1,"id152","write_file"]],"google.adk.integrations.e2b":[[0,7,1,"id170","E2BEnvironment"]],"google.adk.integrations.e2b.E2BEnvironment":[[0,5,1,"id171","close"],[0,5,1,"id172","execute"],[0,5,1,"id173","initialize"],[0,5,1,"id174","read_file"],[0,4,1,"id175","working_dir"],[0,5,1,"id176","write_file"]],"google.adk.integrations.eventarc":[[0,7,1,"id178","AgentProvided"],[0,7,1,"id181","CloudEventAttributesBinding"],[0,2,1,"id190","EventarcCredentialsConfig"],[0,2,1,"id192","EventarcToolConfig"],[0,7,1,"id195","EventarcToolset"]],"google.adk.integrations.eventarc.AgentProvided":[[0,1,1,"id179","default"],[0,1,1,"id180","description"]],"google.adk.integrations.eventarc.CloudEventAttributesBinding":[[0,1,1,"id182","custom_attributes"],[0,1,1,"id183","datacontenttype"],[0,1,1,"id184","id"],[0,1,1,"id185","source"],[0,1,1,"id186","specversion"],[0,1,1,"id187","subject"],[0,1,1,"id188","time"],[0,1,1,"id189","type"]],"google.adk.integrations.eventarc.EventarcCredentialsConfig":[[0,5,1,"id191","model_post_init"]],"google.adk.integrations.eventarc.EventarcToolConfig":[[0,3,1,"id193","project_id"],[0,3,1,"id194","publish_timeout"]],"google.adk.integrations.eventarc.EventarcToolset":[[0,5,1,"id196","close"],[0,5,1,"id197","create_publish_tool"],[0,5,1,"id198","get_tools"]],"google.adk.integrations.gcs":[[0,7,1,"id201","GCSAdminToolset"],[0,2,1,"id203","GCSCredentialsConfig"],[0,7,1,"id205","GCSToolset"]],"google.adk.integrations.gcs.GCSAdminToolset":[[0,5,1,"id202","get_tools"]],"google.adk.integrations.gcs.GCSCredentialsConfig":[[0,5,1,"id204","model_post_init"]],"google.adk.integrations.gcs.GCSToolset":[[0,5,1,"id206","get_tools"]],"google.adk.integrations.langchain":[[0,7,1,"id208","LangchainTool"],[0,2,1,"id210","LangchainToolConfig"]],"google.adk.integrations.langchain.LangchainTool":[[0,5,1,"id209","from_config"]],"google.adk.integrations.langchain.LangchainToolConfig":[[0,3,1,"id211","description"],[0,3,1,"id212","name"],[0,3,1,"id213","tool"]],"google.adk.integrations.parameter_manager":[[0,7,1,"id216","ParameterManagerClient"]],"google.adk.integrations.parameter_manager.ParameterManagerClient":[[0,1,1,"id218","_client"],[0,1,1,"id217","_credentials"],[0,5,1,"id219","get_parameter"]],"google.adk.integrations.secret_manager":[[0,7,1,"id223","SecretManagerClient"]],"google.adk.integrations.secret_manager.SecretManagerClient":[[0,1,1,"id225","_client"],[0,1,1,"id224","_credentials"],[0,5,1,"id226","get_secret"]],"google.adk.integrations.skill_registry":[[0,7,1,"id230","GCPSkillRegistry"]],"google.adk.integrations.skill_registry.GCPSkillRegistry":[[0,5,1,"id231","get_skill"],[0,5,1,"id232","search_skills"]],"google.adk.integrations.slack":[[0,7,1,"id234","SlackRunner"]],"google.adk.integrations.slack.SlackRunner":[[0,5,1,"id235","start"]],"google.adk.integrations.vmaas":[[0,7,1,"id261","AgentEngineSandboxComputer"],[0,7,1,"id289","SandboxClient"]],"google.adk.integrations.vmaas.AgentEngineSandboxComputer":[[0,5,1,"id270","click_at"],[0,5,1,"id271","close"],[0,5,1,"id272","current_state"],[0,5,1,"id273","drag_and_drop"],[0,5,1,"id274","environment"],[0,5,1,"id275","go_back"],[0,5,1,"id276","go_forward"],[0,5,1,"id277","hover_at"],[0,5,1,"id278","initialize"],[0,5,1,"id279","key_combination"],[0,5,1,"id280","navigate"],[0,5,1,"id281","open_web_browser"],[0,5,1,"id282","prepare"],[0,5,1,"id283","screen_size"],[0,5,1,"id284","scroll_at"],[0,5,1,"id285","scroll_document"],[0,5,1,"id286","search"],[0,5,1,"id287","type_text_at"],[0,5,1,"id288","wait"]],"google.adk.integrations.vmaas.SandboxClient":[[0,5,1,"id290","click_at"],[0,5,1,"id291","drag_and_drop"],[0,5,1,"id292","get_current_url"],[0,5,1,"id293","get_screenshot"],[0,5,1,"id294","go_back"],[0,5,1,"id295","go_forward"],[0,5,1,"id296","health_check"],[0,5,1,"id297","hover_at"],[0,5,1,"id298","key_combination"],[0,5,1,"id299","make_cdp_batch_request"],[0,5,1,"id300","make_cdp_request"],[0,5,1,"id301","navigate"],[0,5,1,"id302","scroll_at"],[0,5,1,"id303","type_text"],[0,5,1,"id304","type_text_at"],[0,5,1,"id305","update_access_token"]],"google.adk.labs":[[0,0,0,"-","openai"]],"google.adk.labs.openai":[[0,2,1,"","AzureOpenAIResponsesLlm"],[0,2,1,"","OpenAILlm"],[0,2,1,"","OpenAIResponsesLlm"]],"google.adk.labs.openai.AzureOpenAIResponsesLlm":[[0,3,1,"","azure_endpoint"]],"google.adk.labs.openai.OpenAILlm":[[0,5,1,"","generate_content_async"],[0,3,1,"id306","max_tokens"],[0,3,1,"id307","model"],[0,5,1,"","supported_models"]],"google.adk.labs.openai.OpenAIResponsesLlm":[[0,3,1,"","api_key"],[0,3,1,"","client"],[0,3,1,"","extra_request_args"],[0,5,1,"","generate_content_async"],[0,3,1,"","include"],[0,3,1,"","include_response_metadata"],[0,3,1,"","model"],[0,3,1,"","parallel_tool_calls"],[0,3,1,"","reasoning"],[0,3,1,"","service_tier"],[0,3,1,"","store"],[0,5,1,"","supported_models"],[0,3,1,"","truncation"]],"google.adk.memory":[[0,7,1,"","BaseMemoryService"]],"google.adk.memory.BaseMemoryService":[[0,5,1,"","add_events_to_memory"],[0,5,1,"","add_memory"],[0,5,1,"","add_session_to_memory"],[0,5,1,"","search_memory"]],"google.adk.models":[[0,2,1,"","BaseLlm"],[0,7,1,"","LLMRegistry"]],"google.adk.models.BaseLlm":[[0,5,1,"","connect"],[0,5,1,"","generate_content_async"],[0,3,1,"","model"],[0,5,1,"","supported_models"]],"google.adk.models.LLMRegistry":[[0,5,1,"","new_llm"],[0,5,1,"","register"],[0,5,1,"","resolve"]],"google.adk.planners":[[0,7,1,"","BasePlanner"],[0,7,1,"","BuiltInPlanner"],[0,7,1,"","PlanReActPlanner"]],"google.adk.planners.BasePlanner":[[0,5,1,"","build_planning_instruction"],[0,5,1,"","process_planning_response"]],"google.adk.planners.BuiltInPlanner":[[0,5,1,"","apply_thinking_config"],[0,5,1,"","build_planning_instruction"],[0,5,1,"","process_planning_response"],[0,1,1,"id308","thinking_config"]],"google.adk.planners.PlanReActPlanner":[[0,5,1,"","build_planning_instruction"],[0,5,1,"","process_planning_response"]],"google.adk.plugins":[[0,7,1,"","BasePlugin"],[0,7,1,"","PluginManager"]],"google.adk.plugins.BasePlugin":[[0,5,1,"","after_agent_callback"],[0,5,1,"","after_model_callback"],[0,5,1,"","after_run_callback"],[0,5,1,"","after_tool_callback"],[0,5,1,"","before_agent_callback"],[0,5,1,"","before_model_callback"],[0,5,1,"","before_run_callback"],[0,5,1,"","before_tool_callback"],[0,5,1,"","close"],[0,5,1,"","on_agent_error_callback"],[0,5,1,"","on_event_callback"],[0,5,1,"","on_model_error_callback"],[0,5,1,"","on_run_error_callback"],[0,5,1,"","on_tool_error_callback"],[0,5,1,"","on_user_message_callback"]],"google.adk.plugins.PluginManager":[[0,5,1,"","close"],[0,5,1,"","get_plugin"],[0,5,1,"","register_plugin"],[0,5,1,"","run_after_agent_callback"],[0,5,1,"","run_after_model_callback"],[0,5,1,"","run_after_run_callback"],[0,5,1,"","run_after_tool_callback"],[0,5,1,"","run_before_agent_callback"],[0,5,1,"","run_before_model_callback"],[0,5,1,"","run_before_run_callback"],[0,5,1,"","run_before_tool_callback"],[0,5,1,"","run_on_agent_error_callback"],[0,5,1,"","run_on_event_callback"],[0,5,1,"","run_on_model_error_callback"],[0,5,1,"","run_on_run_error_callback"],[0,5,1,"","run_on_tool_error_callback"],[0,5,1,"","run_on_user_message_callback"],[0,5,1,"","set_skip_closing_plugins"]],"google.adk.runners":[[0,7,1,"","InMemoryRunner"],[0,7,1,"","Runner"]],"google.adk.runners.InMemoryRunner":[[0,1,1,"","agent"],[0,1,1,"","app_name"]],"google.adk.runners.Runner":[[0,1,1,"","Self"],[0,1,1,"id309","agent"],[0,1,1,"id310","app_name"],[0,1,1,"id311","artifact_service"],[0,5,1,"","close"],[0,1,1,"id312","context_cache_config"],[0,1,1,"id313","credential_service"],[0,1,1,"id314","memory_service"],[0,1,1,"id315","plugin_manager"],[0,1,1,"id316","resumability_config"],[0,5,1,"","rewind_async"],[0,5,1,"","run"],[0,5,1,"","run_async"],[0,5,1,"","run_debug"],[0,5,1,"","run_live"],[0,1,1,"id317","session_service"]],"google.adk.sessions":[[0,7,1,"","BaseSessionService"],[0,7,1,"","DatabaseSessionService"],[0,7,1,"","InMemorySessionService"],[0,2,1,"","Session"],[0,7,1,"","State"],[0,8,1,"","StateSchemaError"],[0,7,1,"","VertexAiSessionService"]],"google.adk.sessions.BaseSessionService":[[0,5,1,"","append_event"],[0,5,1,"","create_session"],[0,5,1,"","delete_session"],[0,5,1,"","flush"],[0,5,1,"","get_session"],[0,5,1,"","get_user_state"],[0,5,1,"","list_sessions"]],"google.adk.sessions.DatabaseSessionService":[[0,5,1,"","append_event"],[0,5,1,"","close"],[0,5,1,"","create_session"],[0,5,1,"","delete_session"],[0,5,1,"","get_session"],[0,5,1,"","get_user_state"],[0,5,1,"","list_sessions"],[0,5,1,"","prepare_tables"]],"google.adk.sessions.InMemorySessionService":[[0,5,1,"","append_event"],[0,5,1,"","create_session"],[0,5,1,"","create_session_sync"],[0,5,1,"","delete_session"],[0,5,1,"","delete_session_sync"],[0,5,1,"","get_session"],[0,5,1,"","get_session_sync"],[0,5,1,"","get_user_state"],[0,5,1,"","list_sessions"],[0,5,1,"","list_sessions_sync"]],"google.adk.sessions.Session":[[0,3,1,"","app_name"],[0,3,1,"","events"],[0,3,1,"","id"],[0,3,1,"","last_update_time"],[0,5,1,"","model_post_init"],[0,3,1,"","state"],[0,3,1,"","user_id"]],"google.adk.sessions.State":[[0,1,1,"","APP_PREFIX"],[0,1,1,"","TEMP_PREFIX"],[0,1,1,"","USER_PREFIX"],[0,5,1,"","get"],[0,5,1,"","has_delta"],[0,5,1,"","setdefault"],[0,5,1,"","to_dict"],[0,5,1,"","update"]],"google.adk.sessions.VertexAiSessionService":[[0,5,1,"","append_event"],[0,5,1,"","create_session"],[0,5,1,"","delete_session"],[0,5,1,"","get_session"],[0,5,1,"","get_user_state"],[0,5,1,"","list_sessions"]],"google.adk.skills":[[0,2,1,"","Frontmatter"],[0,2,1,"","Resources"],[0,2,1,"","Script"],[0,2,1,"","Skill"],[0,7,1,"","SkillRegistry"],[0,9,1,"","list_skills_in_dir"],[0,9,1,"","list_skills_in_gcs_dir"],[0,9,1,"","load_skill_from_dir"],[0,9,1,"","load_skill_from_gcs_dir"]],"google.adk.skills.Frontmatter":[[0,3,1,"id318","allowed_tools"],[0,3,1,"id319","compatibility"],[0,3,1,"id320","description"],[0,3,1,"id321","license"],[0,3,1,"id322","metadata"],[0,3,1,"id323","name"]],"google.adk.skills.Resources":[[0,3,1,"id324","assets"],[0,5,1,"","get_asset"],[0,5,1,"","get_reference"],[0,5,1,"","get_script"],[0,5,1,"","list_assets"],[0,5,1,"","list_references"],[0,5,1,"","list_scripts"],[0,3,1,"id325","references"],[0,3,1,"id326","scripts"]],"google.adk.skills.Script":[[0,3,1,"","src"]],"google.adk.skills.Skill":[[0,4,1,"","description"],[0,3,1,"id327","frontmatter"],[0,3,1,"id328","instructions"],[0,4,1,"","name"],[0,3,1,"id329","resources"]],"google.adk.skills.SkillRegistry":[[0,5,1,"","get_skill"],[0,5,1,"","search_skills"],[0,5,1,"","search_tool_description"]],"google.adk.telemetry":[[0,7,1,"","ContentCapturingMode"],[0,2,1,"","TelemetryConfig"],[0,9,1,"","trace_call_llm"],[0,9,1,"","trace_merged_tool_calls"],[0,9,1,"","trace_send_data"],[0,9,1,"","trace_tool_call"]],"google.adk.telemetry.ContentCapturingMode":[[0,1,1,"","EVENT_ONLY"],[0,1,1,"","NO_CONTENT"],[0,1,1,"","SPAN_AND_EVENT"],[0,1,1,"","SPAN_ONLY"]],"google.adk.telemetry.TelemetryConfig":[[0,3,1,"id330","capture_message_content"],[0,4,1,"","content_capturing_mode_value"],[0,3,1,"id331","genai_semconv_stability_opt_in"],[0,4,1,"","resolved_content_capturing_mode"],[0,4,1,"","should_add_content_to_experimental_spans"],[0,4,1,"","should_add_content_to_legacy_spans"],[0,4,1,"","should_add_content_to_logs"],[0,4,1,"","should_use_experimental_genai_semconv"]],"google.adk.tools":[[0,7,1,"","APIHubToolset"],[0,7,1,"","AgentTool"],[0,7,1,"","ApiRegistry"],[0,2,1,"","AuthToolArguments"],[0,7,1,"","BaseTool"],[0,7,1,"","DiscoveryEngineSearchTool"],[0,7,1,"","ExampleTool"],[0,7,1,"","FunctionTool"],[0,7,1,"","LongRunningFunctionTool"],[0,7,1,"","MCPToolset"],[0,7,1,"","McpToolset"],[0,2,1,"","RemoteMcpServer"],[0,7,1,"","SearchResultMode"],[0,1,1,"","ToolContext"],[0,7,1,"","TransferToAgentTool"],[0,7,1,"","VertexAiLoadProfilesTool"],[0,7,1,"","VertexAiSearchTool"],[0,0,0,"-","agent_simulator"],[0,0,0,"-","agent_tool"],[0,0,0,"-","api_registry"],[0,0,0,"-","apihub_tool"],[0,0,0,"-","application_integration_tool"],[0,0,0,"-","authenticated_function_tool"],[0,0,0,"-","base_authenticated_tool"],[0,0,0,"-","base_tool"],[0,0,0,"-","base_toolset"],[0,0,0,"-","bash_tool"],[0,0,0,"-","bigquery"],[0,0,0,"-","bigtable"],[0,0,0,"-","computer_use"],[0,0,0,"-","crewai_tool"],[0,0,0,"-","data_agent"],[0,0,0,"-","discovery_engine_search_tool"],[0,0,0,"-","enterprise_search_tool"],[0,0,0,"-","environment"],[0,0,0,"-","environment_simulation"],[0,0,0,"-","example_tool"],[0,9,1,"","exit_loop"],[0,0,0,"-","exit_loop_tool"],[0,0,0,"-","function_tool"],[0,0,0,"-","get_user_choice_tool"],[0,0,0,"-","google_api_tool"],[0,0,0,"-","google_maps_grounding_tool"],[0,0,0,"-","google_search_agent_tool"],[0,0,0,"-","google_search_tool"],[0,0,0,"-","google_tool"],[0,0,0,"-","langchain_tool"],[0,0,0,"-","load_artifacts_tool"],[0,0,0,"-","load_mcp_resource_tool"],[0,0,0,"-","load_memory_tool"],[0,0,0,"-","load_web_page"],[0,0,0,"-","long_running_tool"],[0,0,0,"-","mcp_tool"],[0,0,0,"-","openapi_tool"],[0,0,0,"-","preload_memory_tool"],[0,0,0,"-","pubsub"],[0,0,0,"-","retrieval"],[0,0,0,"-","set_model_response_tool"],[0,0,0,"-","skill_toolset"],[0,0,0,"-","spanner"],[0,0,0,"-","tool_configs"],[0,0,0,"-","tool_confirmation"],[0,0,0,"-","tool_context"],[0,0,0,"-","toolbox_toolset"],[0,9,1,"","transfer_to_agent"],[0,0,0,"-","transfer_to_agent_tool"],[0,0,0,"-","url_context_tool"],[0,0,0,"-","vertex_ai_load_profiles_tool"],[0,0,0,"-","vertex_ai_search_tool"]],"google.adk.tools.APIHubToolset":[[0,5,1,"","close"],[0,5,1,"","get_tools"]],"google.adk.tools.AgentTool":[[0,1,1,"","agent"],[0,5,1,"","from_config"],[0,1,1,"","include_plugins"],[0,5,1,"","populate_name"],[0,5,1,"","run_async"],[0,1,1,"","skip_summarization"]],"google.adk.tools.ApiRegistry":[[0,5,1,"","get_toolset"]],"google.adk.tools.AuthToolArguments":[[0,3,1,"","auth_config"],[0,3,1,"","function_call_id"]],"google.adk.tools.BaseTool":[[0,5,1,"","check_require_confirmation"],[0,1,1,"","custom_metadata"],[0,1,1,"","description"],[0,5,1,"","from_config"],[0,1,1,"","is_long_running"],[0,1,1,"","name"],[0,5,1,"","process_llm_request"],[0,1,1,"","response_scheduling"],[0,5,1,"","run_async"]],"google.adk.tools.DiscoveryEngineSearchTool":[[0,5,1,"","discovery_engine_search"]],"google.adk.tools.ExampleTool":[[0,1,1,"","examples"],[0,5,1,"","from_config"],[0,5,1,"","process_llm_request"]],"google.adk.tools.FunctionTool":[[0,5,1,"","check_require_confirmation"],[0,1,1,"","func"],[0,5,1,"","run_async"]],"google.adk.tools.LongRunningFunctionTool":[[0,1,1,"","is_long_running"]],"google.adk.tools.McpToolset":[[0,4,1,"","auth_credential"],[0,4,1,"","auth_scheme"],[0,5,1,"","close"],[0,4,1,"","connection_params"],[0,4,1,"","errlog"],[0,5,1,"","from_config"],[0,5,1,"","get_auth_config"],[0,5,1,"","get_resource_info"],[0,5,1,"","get_tools"],[0,4,1,"","header_provider"],[0,5,1,"","list_resources"],[0,5,1,"","read_resource"],[0,4,1,"","require_confirmation"]],"google.adk.tools.RemoteMcpServer":[[0,3,1,"","allowed_tools"],[0,3,1,"","header_provider"],[0,3,1,"","headers"],[0,3,1,"","name"],[0,3,1,"","url"]],"google.adk.tools.SearchResultMode":[[0,1,1,"","CHUNKS"],[0,1,1,"","DOCUMENTS"]],"google.adk.tools.TransferToAgentTool":[[0,1,1,"","agent_names"]],"google.adk.tools.VertexAiLoadProfilesTool":[[0,5,1,"","load_profiles"]],"google.adk.tools.VertexAiSearchTool":[[0,1,1,"","data_store_id"],[0,5,1,"","process_llm_request"],[0,1,1,"","search_engine_id"]],"google.adk.tools.agent_simulator":[[0,1,1,"","AgentSimulatorFactory"]],"google.adk.tools.agent_tool":[[0,7,1,"","AgentTool"],[0,2,1,"","AgentToolConfig"]],"google.adk.tools.agent_tool.AgentTool":[[0,1,1,"","agent"],[0,5,1,"","from_config"],[0,1,1,"","include_plugins"],[0,5,1,"","populate_name"],[0,5,1,"","run_async"],[0,1,1,"","skip_summarization"]],"google.adk.tools.agent_tool.AgentToolConfig":[[0,3,1,"","agent"],[0,3,1,"","include_plugins"],[0,3,1,"","skip_summarization"]],"google.adk.tools.apihub_tool":[[0,7,1,"","APIHubToolset"]],"google.adk.tools.apihub_tool.APIHubToolset":[[0,5,1,"","close"],[0,5,1,"","get_tools"]],"google.adk.tools.application_integration_tool":[[0,7,1,"","ApplicationIntegrationToolset"],[0,7,1,"","IntegrationConnectorTool"]],"google.adk.tools.application_integration_tool.ApplicationIntegrationToolset":[[0,5,1,"","close"],[0,5,1,"","get_tools"]],"google.adk.tools.application_integration_tool.IntegrationConnectorTool":[[0,1,1,"","EXCLUDE_FIELDS"],[0,1,1,"","OPTIONAL_FIELDS"],[0,5,1,"","run_async"]],"google.adk.tools.authenticated_function_tool":[[0,7,1,"","AuthenticatedFunctionTool"]],"google.adk.tools.authenticated_function_tool.AuthenticatedFunctionTool":[[0,5,1,"","run_async"]],"google.adk.tools.base_authenticated_tool":[[0,7,1,"","BaseAuthenticatedTool"]],"google.adk.tools.base_authenticated_tool.BaseAuthenticatedTool":[[0,5,1,"","run_async"]],"google.adk.tools.base_tool":[[0,7,1,"","BaseTool"]],"google.adk.tools.base_tool.BaseTool":[[0,5,1,"","check_require_confirmation"],[0,1,1,"","custom_metadata"],[0,1,1,"","description"],[0,5,1,"","from_config"],[0,1,1,"","is_long_running"],[0,1,1,"","name"],[0,5,1,"","process_llm_request"],[0,1,1,"","response_scheduling"],[0,5,1,"","run_async"]],"google.adk.tools.base_toolset":[[0,7,1,"","BaseToolset"],[0,7,1,"","ToolPredicate"]],"google.adk.tools.base_toolset.BaseToolset":[[0,5,1,"","close"],[0,5,1,"","from_config"],[0,5,1,"","get_auth_config"],[0,5,1,"","get_tools"],[0,5,1,"","get_tools_with_prefix"],[0,5,1,"","process_llm_request"]],"google.adk.tools.bash_tool":[[0,7,1,"","BashToolPolicy"],[0,7,1,"","ExecuteBashTool"]],"google.adk.tools.bash_tool.BashToolPolicy":[[0,1,1,"","allowed_command_prefixes"],[0,1,1,"","blocked_operators"],[0,1,1,"","max_child_processes"],[0,1,1,"","max_file_size_bytes"],[0,1,1,"","max_memory_bytes"],[0,1,1,"","timeout_seconds"]],"google.adk.tools.bash_tool.ExecuteBashTool":[[0,5,1,"","run_async"]],"google.adk.tools.bigtable":[[0,2,1,"","BigtableCredentialsConfig"],[0,7,1,"","BigtableToolset"]],"google.adk.tools.bigtable.BigtableCredentialsConfig":[[0,5,1,"","model_post_init"]],"google.adk.tools.bigtable.BigtableToolset":[[0,5,1,"","get_tools"]],"google.adk.tools.crewai_tool":[[0,7,1,"","CrewaiTool"],[0,2,1,"","CrewaiToolConfig"]],"google.adk.tools.crewai_tool.CrewaiTool":[[0,1,1,"","description"],[0,5,1,"","from_config"],[0,1,1,"","name"],[0,5,1,"","run_async"],[0,1,1,"","tool"]],"google.adk.tools.crewai_tool.CrewaiToolConfig":[[0,3,1,"","description"],[0,3,1,"","name"],[0,3,1,"","tool"]],"google.adk.tools.data_agent":[[0,2,1,"","DataAgentCredentialsConfig"],[0,7,1,"","DataAgentToolset"]],"google.adk.tools.data_agent.DataAgentCredentialsConfig":[[0,5,1,"","model_post_init"]],"google.adk.tools.data_agent.DataAgentToolset":[[0,5,1,"","close"],[0,5,1,"","get_tools"]],"google.adk.tools.discovery_engine_search_tool":[[0,7,1,"","DiscoveryEngineSearchTool"],[0,7,1,"","SearchResultMode"]],"google.adk.tools.discovery_engine_search_tool.DiscoveryEngineSearchTool":[[0,5,1,"","discovery_engine_search"]],"google.adk.tools.discovery_engine_search_tool.SearchResultMode":[[0,1,1,"","CHUNKS"],[0,1,1,"","DOCUMENTS"]],"google.adk.tools.enterprise_search_tool":[[0,7,1,"","EnterpriseWebSearchTool"]],"google.adk.tools.enterprise_search_tool.EnterpriseWebSearchTool":[[0,5,1,"","process_llm_request"]],"google.adk.tools.environment":[[0,7,1,"","EnvironmentToolset"]],"google.adk.tools.environment.EnvironmentToolset":[[0,5,1,"","close"],[0,5,1,"","get_tools"],[0,5,1,"","process_llm_request"]],"google.adk.tools.environment_simulation":[[0,7,1,"","EnvironmentSimulationFactory"]],"google.adk.tools.environment_simulation.EnvironmentSimulationFactory":[[0,5,1,"","create_callback"],[0,5,1,"","create_plugin"]],"google.adk.tools.example_tool":[[0,7,1,"","ExampleTool"],[0,2,1,"","ExampleToolConfig"]],"google.adk.tools.example_tool.ExampleTool":[[0,1,1,"","examples"],[0,5,1,"","from_config"],[0,5,1,"","process_llm_request"]],"google.adk.tools.example_tool.ExampleToolConfig":[[0,3,1,"","examples"]],"google.adk.tools.exit_loop_tool":[[0,9,1,"","exit_loop"]],"google.adk.tools.function_tool":[[0,7,1,"","FunctionTool"]],"google.adk.tools.function_tool.FunctionTool":[[0,5,1,"","check_require_confirmation"],[0,1,1,"","func"],[0,5,1,"","run_async"]],"google.adk.tools.get_user_choice_tool":[[0,9,1,"","get_user_choice"]],"google.adk.tools.google_api_tool":[[0,7,1,"","BigQueryToolset"],[0,7,1,"","CalendarToolset"],[0,7,1,"","DocsToolset"],[0,7,1,"","GmailToolset"],[0,7,1,"","GoogleApiTool"],[0,7,1,"","GoogleApiToolset"],[0,7,1,"","SheetsToolset"],[0,7,1,"","SlidesToolset"],[0,7,1,"","YoutubeToolset"]],"google.adk.tools.google_api_tool.GoogleApiTool":[[0,5,1,"","configure_auth"],[0,5,1,"","configure_sa_auth"],[0,5,1,"","run_async"]],"google.adk.tools.google_api_tool.GoogleApiToolset":[[0,5,1,"","close"],[0,5,1,"","configure_auth"],[0,5,1,"","configure_sa_auth"],[0,5,1,"","get_tools"],[0,5,1,"","set_tool_filter"]],"google.adk.tools.google_maps_grounding_tool":[[0,7,1,"","GoogleMapsGroundingTool"]],"google.adk.tools.google_maps_grounding_tool.GoogleMapsGroundingTool":[[0,5,1,"","process_llm_request"]],"google.adk.tools.google_search_agent_tool":[[0,7,1,"","GoogleSearchAgentTool"],[0,9,1,"","create_google_search_agent"]],"google.adk.tools.google_search_agent_tool.GoogleSearchAgentTool":[[0,1,1,"","model"]],"google.adk.tools.google_search_tool":[[0,7,1,"","GoogleSearchTool"]],"google.adk.tools.google_search_tool.GoogleSearchTool":[[0,5,1,"","process_llm_request"]],"google.adk.tools.google_tool":[[0,7,1,"","GoogleTool"]],"google.adk.tools.google_tool.GoogleTool":[[0,5,1,"","run_async"]],"google.adk.tools.langchain_tool":[[0,7,1,"","LangchainTool"],[0,2,1,"","LangchainToolConfig"]],"google.adk.tools.langchain_tool.LangchainTool":[[0,5,1,"","from_config"]],"google.adk.tools.langchain_tool.LangchainToolConfig":[[0,3,1,"","description"],[0,3,1,"","name"],[0,3,1,"","tool"]],"google.adk.tools.load_artifacts_tool":[[0,7,1,"","LoadArtifactsTool"]],"google.adk.tools.load_artifacts_tool.LoadArtifactsTool":[[0,5,1,"","process_llm_request"],[0,5,1,"","run_async"]],"google.adk.tools.load_mcp_resource_tool":[[0,7,1,"","LoadMcpResourceTool"]],"google.adk.tools.load_mcp_resource_tool.LoadMcpResourceTool":[[0,5,1,"","process_llm_request"],[0,5,1,"","run_async"]],"google.adk.tools.load_memory_tool":[[0,2,1,"","LoadMemoryResponse"],[0,7,1,"","LoadMemoryTool"],[0,9,1,"","load_memory"]],"google.adk.tools.load_memory_tool.LoadMemoryResponse":[[0,3,1,"","memories"]],"google.adk.tools.load_memory_tool.LoadMemoryTool":[[0,5,1,"","process_llm_request"]],"google.adk.tools.load_web_page":[[0,9,1,"","load_web_page"]],"google.adk.tools.long_running_tool":[[0,7,1,"","LongRunningFunctionTool"]],"google.adk.tools.long_running_tool.LongRunningFunctionTool":[[0,1,1,"","is_long_running"]],"google.adk.tools.mcp_tool":[[0,7,1,"","MCPTool"],[0,7,1,"","MCPToolset"],[0,7,1,"","McpTool"],[0,7,1,"","McpToolset"],[0,2,1,"","SseConnectionParams"],[0,2,1,"","StdioConnectionParams"],[0,2,1,"","StreamableHTTPConnectionParams"],[0,9,1,"","adk_to_mcp_tool_type"],[0,9,1,"","gemini_to_json_schema"],[0,9,1,"","to_mcp_server"]],"google.adk.tools.mcp_tool.McpTool":[[0,5,1,"","check_require_confirmation"],[0,4,1,"","mcp_app_resource_uri"],[0,4,1,"","raw_mcp_tool"],[0,5,1,"","run_async"],[0,4,1,"","visibility"]],"google.adk.tools.mcp_tool.McpToolset":[[0,4,1,"","auth_credential"],[0,4,1,"","auth_scheme"],[0,5,1,"","close"],[0,4,1,"","connection_params"],[0,4,1,"","errlog"],[0,5,1,"","from_config"],[0,5,1,"","get_auth_config"],[0,5,1,"","get_resource_info"],[0,5,1,"","get_tools"],[0,4,1,"","header_provider"],[0,5,1,"","list_resources"],[0,5,1,"","read_resource"],[0,4,1,"","require_confirmation"]],"google.adk.tools.mcp_tool.SseConnectionParams":[[0,3,1,"id366","headers"],[0,3,1,"id367","httpx_client_factory"],[0,3,1,"id368","sse_read_timeout"],[0,3,1,"id369","timeout"],[0,3,1,"id370","url"]],"google.adk.tools.mcp_tool.StdioConnectionParams":[[0,3,1,"id371","server_params"],[0,3,1,"id372","timeout"]],"google.adk.tools.mcp_tool.StreamableHTTPConnectionParams":[[0,3,1,"id373","headers"],[0,3,1,"id374","httpx_client_factory"],[0,3,1,"id375","sse_read_timeout"],[0,3,1,"id376","terminate_on_close"],[0,3,1,"id377","timeout"],[0,3,1,"id378","url"]],"google.adk.tools.openapi_tool":[[0,7,1,"","OpenAPIToolset"],[0,7,1,"","RestApiTool"]],"google.adk.tools.openapi_tool.OpenAPIToolset":[[0,5,1,"","close"],[0,5,1,"","configure_ssl_verify_all"],[0,5,1,"","get_tool"],[0,5,1,"","get_tools"]],"google.adk.tools.openapi_tool.RestApiTool":[[0,5,1,"","call"],[0,5,1,"","configure_auth_credential"],[0,5,1,"","configure_auth_scheme"],[0,5,1,"","configure_credential_key"],[0,5,1,"","configure_ssl_verify"],[0,5,1,"","from_parsed_operation"],[0,5,1,"","from_parsed_operation_str"],[0,5,1,"","run_async"],[0,5,1,"","set_default_headers"]],"google.adk.tools.preload_memory_tool":[[0,7,1,"","PreloadMemoryTool"]],"google.adk.tools.preload_memory_tool.PreloadMemoryTool":[[0,5,1,"","process_llm_request"]],"google.adk.tools.pubsub":[[0,2,1,"","PubSubCredentialsConfig"],[0,2,1,"","PubSubToolConfig"],[0,7,1,"","PubSubToolset"]],"google.adk.tools.pubsub.PubSubCredentialsConfig":[[0,5,1,"","model_post_init"]],"google.adk.tools.pubsub.PubSubToolConfig":[[0,3,1,"","project_id"]],"google.adk.tools.pubsub.PubSubToolset":[[0,5,1,"","close"],[0,5,1,"","get_tools"]],"google.adk.tools.retrieval":[[0,7,1,"","BaseRetrievalTool"]],"google.adk.tools.set_model_response_tool":[[0,7,1,"","SetModelResponseTool"]],"google.adk.tools.set_model_response_tool.SetModelResponseTool":[[0,5,1,"","run_async"]],"google.adk.tools.skill_toolset":[[0,7,1,"","ListSkillsTool"],[0,7,1,"","LoadSkillResourceTool"],[0,7,1,"","LoadSkillTool"],[0,7,1,"","RunSkillScriptTool"],[0,7,1,"","SearchSkillsTool"],[0,7,1,"","SkillToolset"]],"google.adk.tools.skill_toolset.ListSkillsTool":[[0,5,1,"","run_async"]],"google.adk.tools.skill_toolset.LoadSkillResourceTool":[[0,5,1,"","process_llm_request"],[0,5,1,"","run_async"]],"google.adk.tools.skill_toolset.LoadSkillTool":[[0,5,1,"","run_async"]],"google.adk.tools.skill_toolset.RunSkillScriptTool":[[0,5,1,"","run_async"]],"google.adk.tools.skill_toolset.SearchSkillsTool":[[0,5,1,"","run_async"]],"google.adk.tools.skill_toolset.SkillToolset":[[0,5,1,"","clone_with_updated_skills"],[0,5,1,"","close"],[0,5,1,"","get_tools"],[0,5,1,"","process_llm_request"],[0,4,1,"","skills"]],"google.adk.tools.spanner":[[0,7,1,"","SpannerAdminToolset"],[0,2,1,"","SpannerCredentialsConfig"],[0,7,1,"","SpannerToolset"]],"google.adk.tools.spanner.SpannerAdminToolset":[[0,5,1,"","close"],[0,5,1,"","get_tools"]],"google.adk.tools.spanner.SpannerCredentialsConfig":[[0,5,1,"","model_post_init"]],"google.adk.tools.spanner.SpannerToolset":[[0,5,1,"","close"],[0,5,1,"","get_tools"]],"google.adk.tools.tool_configs":[[0,2,1,"","BaseToolConfig"],[0,2,1,"","ToolArgsConfig"],[0,2,1,"","ToolConfig"]],"google.adk.tools.tool_configs.ToolConfig":[[0,3,1,"","args"],[0,3,1,"","name"]],"google.adk.tools.tool_confirmation":[[0,2,1,"","ToolConfirmation"]],"google.adk.tools.tool_confirmation.ToolConfirmation":[[0,3,1,"","confirmed"],[0,5,1,"","from_response_dict"],[0,3,1,"","hint"],[0,3,1,"","payload"]],"google.adk.tools.toolbox_toolset":[[0,7,1,"","ToolboxToolset"]],"google.adk.tools.toolbox_toolset.ToolboxToolset":[[0,5,1,"","close"],[0,5,1,"","get_tools"]],"google.adk.tools.transfer_to_agent_tool":[[0,7,1,"","TransferToAgentTool"],[0,9,1,"","transfer_to_agent"]],"google.adk.tools.transfer_to_agent_tool.TransferToAgentTool":[[0,1,1,"","agent_names"]],"google.adk.tools.url_context_tool":[[0,7,1,"","UrlContextTool"]],"google.adk.tools.url_context_tool.UrlContextTool":[[0,5,1,"","process_llm_request"]],"google.adk.tools.vertex_ai_load_profiles_tool":[[0,7,1,"","VertexAiLoadProfilesTool"]],"google.adk.tools.vertex_ai_load_profiles_tool.VertexAiLoadProfilesTool":[[0,5,1,"","load_profiles"]],"google.adk.tools.vertex_ai_search_tool":[[0,7,1,"","VertexAiSearchTool"]],"google.adk.tools.vertex_ai_search_tool.VertexAiSearchTool":[[0,1,1,"","data_store_id"],[0,5,1,"","process_llm_request"],[0,1,1,"","search_engine_id"]],"google.adk.workflow":[[0,2,1,"","BaseNode"],[0,2,1,"","Edge"],[0,2,1,"","FunctionNode"],[0,2,1,"","JoinNode"],[0,2,1,"","Node"],[0,8,1,"","NodeTimeoutError"],[0,2,1,"","RetryConfig"],[0,2,1,"","Workflow"],[0,9,1,"","node"]],"google.adk.workflow.BaseNode":[[0,3,1,"","description"],[0,3,1,"","input_schema"],[0,3,1,"","name"],[0,3,1,"","output_schema"],[0,3,1,"","rerun_on_resume"],[0,3,1,"","retry_config"],[0,5,1,"","run"],[0,3,1,"","state_schema"],[0,3,1,"","timeout"],[0,3,1,"","wait_for_output"]],"google.adk.workflow.Edge":[[0,3,1,"","from_node"],[0,3,1,"","route"],[0,3,1,"","to_node"]],"google.adk.workflow.FunctionNode":[[0,3,1,"","auth_config"],[0,5,1,"","model_copy"],[0,5,1,"","model_post_init"],[0,3,1,"","parameter_binding"]],"google.adk.workflow.Node":[[0,3,1,"","max_parallel_workers"],[0,5,1,"","model_copy"],[0,5,1,"","model_post_init"],[0,3,1,"","parallel_worker"],[0,5,1,"","run_node_impl"]],"google.adk.workflow.RetryConfig":[[0,3,1,"","backoff_factor"],[0,3,1,"","exceptions"],[0,3,1,"","initial_delay"],[0,3,1,"","jitter"],[0,3,1,"","max_attempts"],[0,3,1,"","max_delay"]],"google.adk.workflow.Workflow":[[0,3,1,"","edges"],[0,3,1,"","graph"],[0,3,1,"","max_concurrency"],[0,5,1,"","model_post_init"],[0,3,1,"","rerun_on_resume"]]},"objnames":{"0":["py","module","Python module"],"1":["py","attribute","Python attribute"],"2":["py","pydantic_model","Python model"],"3":["py","pydantic_field","Python field"],"4":["py","property","Python property"],"5":["py","method","Python method"],"6":["py","pydantic_validator","Python validator"],"7":["py","class","Python class"],"8":["py","exception","Python exception"],"9":["py","function","Python function"]},"objtypes":{"0":"py:module","1":"py:attribute","2":"py:pydantic_model","3":"py:pydantic_field","4":"py:property","5":"py:method","6":"py:pydantic_validator","7":"py:class","8":"py:exception","9":"py:function"},"terms":{"":0,"0":0,"00":0,"00z":0,"01t00":0,"03":0,"05":0,"1":0,"10":0,"101":0,"12":0,"123":0,"1234":0,"127":0,"128":0,"13":0,"15":0,"16":0,"1742000000":0,"2":0,"2000":0,"201":0,"2025":0,"2026":0,"24":0,"24khz":0,"256":0,"3":0,"30":0,"300":0,"301":0,"31":0,"3600":0,"4":0,"40":0,"4096":0,"42":0,"443":0,"456":0,"47":0,"4o":0,"5":0,"50":0,"500":0,"5000":0,"509":0,"512":0,"6":0,"60":0,"639":0,"64":0,"6mb":0,"704x1280":0,"7200":0,"8":0,"9":0,"9535":0,"9999":0,"A":0,"As":0,"At":0,"But":0,"By":0,"For":0,"If":0,"In":0,"It":0,"Its":0,"NOT":0,"No":0,"Not":0,"Of":0,"On":0,"One":0,"Or":0,"The":0,"Then":0,"There":0,"These":0,"To":0,"Will":0,"__dict__":0,"__init__":0,"__model_validator_aft":0,"__name__":0,"__post_init__":0,"_accept_convenience_kwarg":0,"_asyncio":0,"_auth_config":0,"_base_nod":0,"_baseagent__context":0,"_build_vertex_ai_search_config":0,"_client":[0,1],"_config":0,"_credenti":[0,1],"_domain_specific_publish":0,"_event__context":0,"_invocationcontext__context":0,"_io":0,"_llmagent__context":0,"_node__context":0,"_normalize_except":0,"_parallelwork":0,"_parse_auth_config":0,"_parse_config":0,"_pre_validate_tool":0,"_retry_config":0,"_run_impl":0,"_singleaftermodelcallback":0,"_singleagentcallback":0,"_singlebeforemodelcallback":0,"_singleonmodelerrorcallback":0,"_uniongenericalia":0,"_validate_compat":0,"_validate_descript":0,"_validate_metadata":0,"_validate_model_sourc":0,"_validate_nam":0,"_validate_parallel_worker_config":0,"a2a":1,"a_long_running_funct":0,"abc":0,"abc123":0,"abil":0,"abl":0,"abort":0,"about":0,"abov":0,"absenc":0,"absent":0,"absolut":0,"abstract":0,"abstractmethod":0,"accept":0,"access":0,"access_token":0,"accesstoken":0,"accomplish":0,"accord":0,"accordingli":0,"account":0,"account_cr":0,"accumul":0,"ack":0,"acm":0,"across":0,"act":0,"action":[0,1],"action1":0,"activ":0,"active_non_blocking_tool_task":[0,1],"active_streaming_tool":[0,1],"activestreamingtool":0,"activity_end":[0,1],"activity_handling_unspecifi":0,"activity_start":[0,1],"activityend":0,"activityhandl":0,"activitystart":0,"actual":0,"ad":0,"adapt":0,"adaptationphras":0,"adc":0,"add":0,"add_events_to_memori":[0,1],"add_input_fil":[0,1],"add_memori":[0,1],"add_processed_file_nam":[0,1],"add_session_to_memori":[0,1],"addit":0,"addition":0,"additional_head":0,"additional_scop":0,"additional_tool":0,"additionalhead":0,"additionalproperti":0,"address":0,"adher":0,"adjust":0,"adk":1,"adk_additional_tool":0,"adk_capture_message_content_in_span":0,"adk_inject_st":0,"adk_request_credenti":0,"adk_to_mcp_tool_typ":[0,1],"admin":0,"advanc":0,"affect":0,"after":0,"after_agent_callback":[0,1],"after_model_callback":[0,1],"after_run_callback":[0,1],"after_timestamp":0,"after_tool_callback":[0,1],"afteragentcallback":0,"aftermodelcallback":0,"aftertoolcallback":0,"ag":0,"again":0,"against":0,"agent":1,"agent_1":0,"agent_2":0,"agent_3":0,"agent_call_2":0,"agent_class":[0,1],"agent_config":[0,1],"agent_engine_id":0,"agent_id":[0,1],"agent_ident":1,"agent_modul":0,"agent_nam":[0,1],"agent_registri":1,"agent_simul":1,"agent_st":[0,1],"agent_tool":1,"agentenginesandboxcomput":[0,1],"agentevalu":[0,1],"agentpolicyplugin":0,"agentprovid":[0,1],"agentrefconfig":0,"agentregistri":[0,1],"agentsimulatorfactori":[0,1],"agentskil":0,"agentst":0,"agenttool":[0,1],"agenttoolconfig":[0,1],"aggreg":0,"ai":0,"aiplatform":0,"algorithm":0,"alia":0,"alias":0,"alic":0,"all":0,"all_turn":0,"allow":0,"allow_egress":[0,1],"allowed_command_prefix":[0,1],"allowed_tool":[0,1],"allowlist":0,"allowlistentryparam":0,"allowlistparam":0,"alon":0,"along":0,"alongsid":0,"alpha":0,"alphanumer":0,"alreadi":0,"also":0,"alter":0,"altern":0,"alwai":0,"amazon":0,"among":0,"amount":0,"an":0,"analysi":0,"analyt":0,"analyz":0,"ancestor":0,"ani":0,"anniversari":0,"annot":0,"anoth":0,"another_ag":0,"answer":0,"antigrav":1,"antigravityagentconfigparam":0,"any_of":0,"anyof":0,"anyth":0,"apart":0,"api":0,"api_cli":[0,1],"api_cor":0,"api_kei":[0,1],"api_key_auth":0,"api_key_secret":0,"api_key_secret_vers":0,"api_key_str":0,"api_nam":0,"api_registri":1,"api_registry_project_id":0,"api_spec_unspecifi":0,"api_trigg":0,"api_url":0,"api_vers":0,"apiauth":0,"apiauthapikeyconfig":0,"apige":0,"apihub_cli":0,"apihub_resource_nam":0,"apihub_tool":1,"apihub_toolset":0,"apihubtool":0,"apihubtoolset":[0,1],"apikei":0,"apikeyconfig":0,"apikeyin":0,"apikeysecret":0,"apikeysecretvers":0,"apikeystr":0,"apinam":0,"apiregistri":[0,1],"apispec":0,"app":1,"app_nam":[0,1],"app_prefix":[0,1],"app_token":0,"appear":0,"append":0,"append_ev":[0,1],"appli":0,"applic":0,"application_integration_tool":1,"application_integration_toolset":0,"applicationintegrationtool":0,"applicationintegrationtoolset":[0,1],"apply_thinking_config":[0,1],"appnam":0,"approach":0,"appropri":0,"approv":0,"apt":0,"ar":0,"arbitrarili":0,"arg":[0,1],"arg1":0,"arg2":0,"argument":0,"around":0,"arrai":0,"arriv":0,"artifact":1,"artifact_delta":[0,1],"artifact_servic":[0,1],"artifactdelta":0,"artifactvers":0,"ask":0,"asr":0,"assembl":0,"assess":0,"asset":[0,1],"asset_id":0,"assist":0,"associ":0,"assum":0,"async":0,"asynccli":0,"asyncengin":0,"asyncgener":0,"asynchron":0,"asyncio":0,"asyncopenai":0,"attach":0,"attack":0,"attempt":0,"attempt_count":[0,1],"attribut":0,"audienc":0,"audio":0,"audiobitratebp":0,"audiooffset":0,"audiotranscript":0,"audiotranscriptionconfig":0,"augment":0,"auth":1,"auth_config":[0,1],"auth_credenti":[0,1],"auth_help":0,"auth_provider_x509_cert_url":0,"auth_schem":[0,1],"auth_token":0,"auth_token_gett":0,"auth_tool":0,"auth_typ":0,"auth_type_unspecifi":0,"auth_uri":0,"authcod":0,"authconfig":0,"authconfiggoogleserviceaccountconfig":0,"authconfighttpbasicauthconfig":0,"authconfigoauthconfig":0,"authconfigoidcconfig":0,"authcredenti":0,"authcredentialtyp":0,"authent":0,"authenticated_function_tool":1,"authenticatedfunctiontool":[0,1],"authhandl":0,"author":[0,1],"authorattribut":0,"authorization_endpoint":0,"authorizationcod":0,"authorizationurl":0,"authproviderx509certurl":0,"authresponseuri":0,"authschem":0,"authtoolargu":[0,1],"authtyp":0,"authuri":0,"auto":0,"auto_create_sess":0,"automat":0,"automaticactivitydetect":0,"avail":0,"avatar":0,"avatar_config":[0,1],"avatarconfig":0,"avatarnam":0,"avglogprob":0,"avoid":0,"await":0,"awar":0,"azur":0,"azure_endpoint":[0,1],"azureopenairesponsesllm":[0,1],"back":0,"backend":0,"background":0,"backoff":0,"backoff_factor":[0,1],"backward":0,"balanc":0,"bank":0,"bar":0,"base":0,"base64":0,"base64url":0,"base_ag":0,"base_artifact_servic":0,"base_authenticated_tool":1,"base_credential_servic":0,"base_memory_servic":0,"base_session_servic":0,"base_tool":1,"base_toolset":1,"base_url":0,"baseag":[0,1],"baseagentconfig":[0,1],"baseartifactservic":[0,1],"baseauthenticatedtool":[0,1],"baseauthprovid":0,"basecodeexecutor":[0,1],"basecomput":0,"basecredentialservic":0,"baseenviron":[0,1],"baseexampleprovid":[0,1],"baseexcept":0,"basegooglecredentialsconfig":0,"basellm":[0,1],"basellmconnect":0,"basellmflow":0,"basememoryservic":[0,1],"basemodel":0,"basemodelwithconfig":0,"basenod":[0,1],"baseplann":[0,1],"baseplugin":[0,1],"baseretrievaltool":[0,1],"basesessionservic":[0,1],"basetool":[0,1],"basetoolconfig":[0,1],"basetoolset":[0,1],"bash":0,"bash_tool":1,"bashtoolpolici":[0,1],"basic":0,"batch":0,"bcp":0,"bear":0,"bearer":0,"bearerformat":0,"becaus":0,"becom":0,"been":0,"befor":0,"before_agent_callback":[0,1],"before_model_callback":[0,1],"before_run_callback":[0,1],"before_tool_callback":[0,1],"beforeagentcallback":0,"beforemodelcallback":0,"beforetoolcallback":0,"begin":0,"behav":0,"behavior":0,"being":0,"belong":0,"below":0,"benefici":0,"benefit":0,"best":0,"beta":0,"better":0,"between":0,"beyond":0,"bias":0,"bidi":0,"bidigeneratecont":0,"bidigeneratecontentsetup":0,"bidirect":0,"bigqueri":1,"bigquerytoolset":[0,1],"bigtabl":1,"bigtable_execute_sql":0,"bigtable_get_cluster_info":0,"bigtable_get_instance_info":0,"bigtable_get_table_info":0,"bigtable_list_clust":0,"bigtable_list_inst":0,"bigtable_list_t":0,"bigtable_tool_set":0,"bigtablecredentialsconfig":[0,1],"bigtabletoolset":[0,1],"bill":0,"bin":0,"binari":0,"bind":0,"birthdai":0,"bit":0,"bitrat":0,"blob":[0,1],"blob_id":0,"block":0,"block_high_and_abov":0,"block_higher_and_abov":0,"block_low_and_abov":0,"block_medium_and_abov":0,"block_only_extremely_high":0,"block_very_high_and_abov":0,"blocked_oper":[0,1],"blockingconfid":0,"blocklist":0,"bob":0,"bodi":0,"boilerpl":0,"boldfac":0,"bone":0,"bool":0,"boolean":0,"boolvalu":0,"bootstrap":0,"both":0,"bound":0,"bound_param":0,"branch":[0,1],"break":0,"breakdown":0,"bring":0,"broader":0,"brows":0,"browser":0,"bu":0,"bucket":0,"bucket_nam":0,"buffer":0,"build":0,"build_planning_instruct":[0,1],"builder":0,"built":0,"built_in_plann":0,"builtincodeexecutor":[0,1],"builtinplann":[0,1],"bundl":0,"byo":0,"bypass":0,"bypass_multi_tools_limit":0,"bypass_state_inject":0,"byte":0,"bytecod":0,"c":0,"ca":0,"cach":0,"cache_nam":0,"cacheabl":0,"cached_cont":0,"cached_properti":0,"cachedcont":0,"cachedcontenttokencount":0,"cachemetadata":0,"cachetokensdetail":0,"calcul":0,"calendar":0,"calendartoolset":[0,1],"call":[0,1],"call_llm":0,"call_tool":0,"callabl":0,"callback":0,"callback_context":0,"callbackcontext":0,"caller":0,"came":0,"camelcas":0,"can":0,"cancel":0,"candid":0,"candidates_token_count":0,"candidatestokencount":0,"candidatestokensdetail":0,"cannot":0,"canon":0,"canonical_after_agent_callback":[0,1],"canonical_after_model_callback":[0,1],"canonical_after_tool_callback":[0,1],"canonical_before_agent_callback":[0,1],"canonical_before_model_callback":[0,1],"canonical_before_tool_callback":[0,1],"canonical_global_instruct":[0,1],"canonical_instruct":[0,1],"canonical_live_model":[0,1],"canonical_model":[0,1],"canonical_on_model_error_callback":[0,1],"canonical_on_tool_error_callback":[0,1],"canonical_tool":[0,1],"canonical_tools_cach":[0,1],"cap":0,"capabl":0,"captur":0,"capture_message_cont":[0,1],"card":0,"carri":0,"case":0,"catch":0,"caus":0,"cdp":0,"ce_attributes_bind":0,"central":0,"central1":0,"cert":0,"certain":0,"certif":0,"cfc":0,"chain":0,"chang":0,"char":0,"charact":0,"chat":0,"check":0,"check_for_deprecated_save_live_audio":[0,1],"check_require_confirm":[0,1],"checkablemcphttpclientfactori":0,"checkpoint":0,"child":0,"choic":0,"choos":0,"chosen":0,"chosencandid":0,"chunk":[0,1],"chunkid":0,"circuit":0,"citat":0,"citationmetadata":0,"citi":0,"cl":0,"claim":0,"clariti":0,"class":0,"classmethod":0,"classvar":0,"claud":0,"clean":0,"cleaner":0,"cleanup":0,"clear":0,"clear_before_typ":0,"clear_input_fil":[0,1],"cli":0,"click":0,"click_at":[0,1],"client":[0,1],"client_cont":0,"client_email":0,"client_id":0,"client_secret":0,"client_secret_bas":0,"client_secret_jwt":0,"client_secret_post":0,"client_x509_cert_url":0,"clientcredenti":0,"clientemail":0,"clientid":0,"clientsecret":0,"clientx509certurl":0,"clip":0,"clone":[0,1],"clone_with_updated_skil":[0,1],"cloned_ag":0,"close":[0,1],"close_timeout":0,"cloud":0,"cloud_run":1,"cloudev":0,"cloudeventattributesbind":[0,1],"cloudrunsandboxcodeexecutor":[0,1],"code":0,"code_block_delimit":[0,1],"code_execut":0,"code_execution_input":0,"code_executor":1,"codebas":0,"codechallengemethod":0,"codeconfig":0,"codeexecut":0,"codeexecutionresult":0,"codeexecutor":0,"codeexecutorcontext":[0,1],"codemend":0,"codemenderagentconfigparam":0,"codeverifi":0,"codex":0,"coerc":0,"coercion":0,"collabor":0,"collaborative_plan":0,"collect":0,"colon":0,"com":0,"combin":0,"come":0,"command":0,"commit":0,"common":0,"common_config":0,"commun":0,"communication_tool":0,"compact":[0,1],"compactedcont":0,"compar":0,"compat":[0,1],"compil":0,"complet":0,"complex":0,"complianc":0,"compon":0,"composit":0,"compress":0,"comput":0,"computer_us":1,"computerenviron":0,"computerout":0,"computerst":0,"computerus":0,"computerusetoolset":0,"concept":0,"concis":0,"concret":0,"concurr":0,"condit":0,"confid":0,"confidencescor":0,"config":0,"config_abs_path":0,"config_path":0,"config_typ":[0,1],"configur":0,"configure_auth":[0,1],"configure_auth_credenti":[0,1],"configure_auth_schem":[0,1],"configure_credential_kei":[0,1],"configure_sa_auth":[0,1],"configure_ssl_verifi":[0,1],"configure_ssl_verify_al":[0,1],"confirm":[0,1],"conflict":0,"connect":[0,1],"connection_host":0,"connection_nam":0,"connection_param":[0,1],"connection_service_nam":0,"connection_template_overrid":0,"connectionschemametadata":0,"connector":0,"consecut":0,"consent":0,"consent_audio":0,"consentaudio":0,"consid":0,"consider":0,"consist":0,"consol":0,"consolid":0,"const":0,"constitut":0,"constrain":0,"constraint":0,"construct":0,"constructor":0,"consum":0,"consumpt":0,"contain":0,"content":[0,1],"content_capturing_mode_valu":[0,1],"contentcapturingmod":[0,1],"contents_count":0,"contentunion":0,"context":[0,1],"context_cache_config":[0,1],"context_window_compress":[0,1],"contextcacheconfig":0,"contextu":0,"contextwindowcompressionconfig":0,"continu":0,"continue_uri":[0,1],"continueuri":0,"contract":0,"control":0,"convei":0,"conveni":0,"convent":0,"convers":0,"convert":0,"cooki":0,"coordin":0,"copi":0,"core":0,"corpora":0,"corpu":0,"correct":0,"correl":0,"correspond":0,"cost":0,"could":0,"count":0,"counterpart":0,"countri":0,"counttokensrespons":0,"cpu":0,"craft":0,"creat":0,"create_async_engin":0,"create_bucket":0,"create_callback":[0,1],"create_google_search_ag":[0,1],"create_mcp_http_cli":0,"create_object":0,"create_plugin":[0,1],"create_publish_tool":[0,1],"create_sess":[0,1],"create_session_sync":[0,1],"create_task":0,"create_tool":0,"createagentinteractionagentconfigparam":0,"createagentinteractionenvironmentparam":0,"created_at":0,"createtim":0,"creation":0,"credenti":0,"credential_by_kei":[0,1],"credential_kei":0,"credential_servic":[0,1],"credentialconfig":0,"credentialkei":0,"credentials_config":0,"credentialsecret":0,"credit":0,"crewai":1,"crewai_tool":1,"crewaibasetool":0,"crewaitool":[0,1],"crewaitoolconfig":[0,1],"criteria":0,"critic":0,"crud":0,"csv":0,"ctx":0,"current":0,"current_st":[0,1],"current_turn":0,"custom":0,"custom_attribut":[0,1],"custom_metadata":[0,1],"customauthschem":0,"customconfig":0,"customizedavatar":0,"custommetadata":0,"customvocabulari":0,"cut":0,"cwd":0,"cycl":0,"dai":0,"dash":0,"data":0,"data_ag":1,"data_agent_tool_config":0,"data_modif":0,"data_stor":0,"data_store_id":[0,1],"data_store_spec":0,"dataagentcredentialsconfig":[0,1],"dataagenttoolset":[0,1],"databas":0,"databasesessionservic":[0,1],"datacontenttyp":[0,1],"dataset":0,"datastor":0,"datastorespec":0,"datatrack":0,"datatyp":0,"date":0,"datetim":0,"daytona":1,"daytonaenviron":[0,1],"db":0,"db_engin":0,"db_url":0,"deadlock":0,"deal":0,"debug":0,"debug1":0,"debug2":0,"debug_session_id":0,"debug_user_id":0,"decid":0,"declar":0,"decod":0,"decor":0,"dedic":0,"deep":0,"deepresearchagentconfigparam":0,"def":0,"default":[0,1],"default_live_model":[0,1],"default_model":[0,1],"defer":0,"defin":0,"definit":0,"delai":0,"deleg":0,"delet":0,"delete_artifact":[0,1],"delete_bucket":0,"delete_object":0,"delete_sess":[0,1],"delete_session_sync":[0,1],"delimit":0,"delta":0,"demand":0,"deni":0,"dens":0,"depend":0,"deploy":0,"deprec":0,"deriv":0,"descend":0,"describ":0,"descript":[0,1],"descriptor":0,"design":0,"desir":0,"destination_i":0,"destination_x":0,"destroi":0,"detail":0,"detect":0,"determin":0,"dev":0,"develop":0,"dialog":0,"diariz":0,"dict":0,"dictionari":0,"did":0,"differ":0,"differenti":0,"dimens":0,"dir":0,"direct":0,"directli":0,"directori":0,"disabl":0,"disableattribut":0,"disabledsafetypolici":0,"disallow":0,"disallow_transfer_to_p":[0,1],"disallow_transfer_to_par":[0,1],"disconnect":0,"discourag":0,"discov":0,"discoveri":0,"discovery_engine_search":[0,1],"discovery_engine_search_tool":1,"discovery_url":0,"discoveryengin":0,"discoveryenginesearchtool":[0,1],"discuss":0,"displai":0,"displaynam":0,"dispos":0,"distanc":0,"distancemet":0,"distinct":0,"distinguish":0,"do":0,"doc":0,"docstoolset":[0,1],"document":[0,1],"documentnam":0,"doe":0,"doesn":0,"dog":0,"domain":0,"don":0,"done":0,"dot":0,"doubl":0,"down":0,"download":0,"downloaduri":0,"downstream":0,"drag":0,"drag_and_drop":[0,1],"drive":0,"driven":0,"drop":0,"duckduckgosearchtool":0,"duplic":0,"durat":0,"dure":0,"dynam":0,"dynamic_auth_config":0,"dynamicagentconfigparam":0,"dynamicfiltersearchtool":0,"dynamicretrievalconfig":0,"dynamicretrievalconfigmod":0,"dynamicthreshold":0,"e":0,"e2b":1,"e2b_api_kei":0,"e2benviron":[0,1],"each":0,"eagerli":0,"earli":0,"earliest":0,"easi":0,"easier":0,"east":0,"echo":0,"echotargetlanguag":0,"edg":[0,1],"edgeitem":0,"editfil":0,"effect":0,"effort":0,"egress":0,"either":0,"elast":0,"elastic_search":0,"elasticsearch":0,"elasticsearchparam":0,"element":0,"elsewher":0,"email":0,"emb":0,"embed":0,"emit":0,"emot":0,"empti":0,"en":0,"enabl":0,"enable_affective_dialog":[0,1],"enable_bigquery_tool":0,"enablepromptinjectiondetect":0,"enablewidget":0,"encapsul":0,"enclos":0,"encod":0,"encodedpolylin":0,"encoding_error_handl":0,"encount":0,"end":0,"end_invoc":[0,1],"end_of_ag":[0,1],"end_sensitivity_high":0,"end_sensitivity_low":0,"end_sensitivity_unspecifi":0,"endian":0,"endindex":0,"endofag":0,"endoffset":0,"endofspeechsensit":0,"endpoint":0,"endpoint_nam":0,"endsensit":0,"endtim":0,"endtimestamp":0,"enforc":0,"engin":0,"enhanc":0,"enough":0,"enqueu":0,"ensur":0,"ensure_part":0,"enter":0,"enterpris":0,"enterprise_assist":0,"enterprise_search_tool":1,"enterprisewebsearch":0,"enterprisewebsearchtool":[0,1],"entir":0,"entiti":0,"entity_oper":0,"entityid1":0,"entityid2":0,"entri":0,"enum":0,"enumer":0,"env":0,"env_var":0,"environ":1,"environment_brows":0,"environment_desktop":0,"environment_id":0,"environment_mobil":0,"environment_simul":1,"environment_unspecifi":0,"environmentid":0,"environmentnetworkegressallowlistparam":0,"environmentparam":0,"environmentsimul":0,"environmentsimulationfactori":[0,1],"environmentsimulationplugin":0,"environmenttoolset":[0,1],"equal":0,"equival":0,"errlog":[0,1],"error":1,"error_node_path":[0,1],"error_retry_attempt":[0,1],"error_typ":0,"errorcod":0,"errormessag":0,"escal":[0,1],"escap":0,"especi":0,"essenti":0,"establish":0,"etc":0,"eu":0,"eval":0,"eval_config":0,"eval_dataset_file_path_or_dir":0,"eval_set":0,"evalconfig":0,"evalset":0,"evalu":1,"evaluate_eval_set":[0,1],"even":0,"event":1,"event_act":0,"event_author":[0,1],"event_id":0,"event_onli":[0,1],"eventact":[0,1],"eventarc":1,"eventarccredentialsconfig":[0,1],"eventarctoolconfig":[0,1],"eventarctoolset":[0,1],"eventcompact":0,"events_compaction_config":[0,1],"eventscompactionconfig":0,"ever":0,"everi":0,"evid":0,"exa":0,"exaaisearch":0,"exactli":0,"exampl":1,"example_stor":0,"example_tool":1,"examples_store_nam":0,"examplestor":0,"exampletool":[0,1],"exampletoolconfig":[0,1],"exce":0,"exceed":0,"except":[0,1],"excerpt":0,"exchang":0,"exchange_credenti":0,"exchanged_auth_credenti":0,"exchangedauthcredenti":0,"exclud":0,"exclude_domain":0,"exclude_field":[0,1],"excludedomain":0,"excludedpredefinedfunct":0,"exclus":0,"exec":0,"execut":[0,1],"executablecod":0,"execute_cod":[0,1],"execute_sql":0,"executebashtool":[0,1],"executeconnect":0,"executeextensionrequest":0,"execution_result_delimit":[0,1],"executionresult":[0,1],"executor":0,"exist":0,"exit":0,"exit_cod":[0,1],"exit_loop":[0,1],"exit_loop_tool":1,"expand":0,"expect":0,"expens":0,"experiment":0,"expir":0,"expirationtim":0,"expire_tim":0,"expiresat":0,"expiresin":0,"expiri":0,"explan":0,"explicit":0,"explicit_vad_sign":[0,1],"explicitli":0,"explor":0,"expos":0,"express":0,"express_mode_api_kei":0,"extend":0,"extens":0,"extern":0,"external_access_token_kei":0,"externalapi":0,"externalapielasticsearchparam":0,"externalapisimplesearchparam":0,"extra":0,"extra_request_arg":[0,1],"extract":0,"eyakaknabna":0,"f":0,"face":0,"facebook":0,"factor":0,"factori":0,"factual":0,"fail":0,"failur":0,"fall":0,"fallback":0,"fals":0,"faster":0,"fastmcp":0,"favor":0,"fc_id":0,"featur":0,"feed":0,"fetch":0,"fetch_polici":0,"few":0,"field":0,"field_nam":[0,1],"file":0,"file_data":0,"file_nam":0,"file_search":0,"file_search_stor":0,"file_search_store_id":0,"filecontentparam":0,"filedata":0,"fileid":0,"filenam":0,"filenotfounderror":0,"filesearch":0,"filesearchstor":0,"filesearchstorenam":0,"filesourc":0,"filest":0,"filestatu":0,"filesystem":0,"fileuri":0,"fill":0,"filter":0,"filter_str":0,"final":0,"financial_transact":0,"find":0,"find_ag":[0,1],"find_config_for_test_fil":[0,1],"find_request":0,"find_sub_ag":[0,1],"finding_id":0,"findrequestparam":0,"fine":0,"fingerprint":0,"finish":0,"finish_reason_unspecifi":0,"finishreason":0,"firestor":1,"first":0,"firstpag":0,"fix":0,"fix_request":0,"fixrequestparam":0,"flag":0,"flagcontenturi":0,"flash":0,"flat":0,"flexibl":0,"float":0,"flow":1,"flush":[0,1],"focu":0,"focus":0,"folder":0,"follow":0,"foo":0,"forc":0,"forecast":0,"form":0,"format":0,"forward":0,"found":0,"four":0,"fp":0,"fqn":0,"fr":0,"fraction":0,"frame":0,"framework":0,"free":0,"fresh":0,"friendli":0,"from":0,"from_config":[0,1],"from_nod":[0,1],"from_parsed_oper":[0,1],"from_parsed_operation_str":[0,1],"from_response_dict":[0,1],"frontmatt":[0,1],"frozen":0,"full":0,"fulli":0,"func":[0,1],"function":0,"function_cal":0,"function_call_id":[0,1],"function_respons":0,"function_response_ev":0,"function_tool":1,"functioncal":0,"functioncallid":0,"functiondeclar":0,"functionnod":[0,1],"functionrespons":0,"functionresponseblob":0,"functionresponsefiledata":0,"functionresponsepart":0,"functionresponseschedul":0,"functiontool":[0,1],"functool":0,"further":0,"futur":0,"g":0,"gap":0,"gc":1,"gcloud":0,"gcp":0,"gcpauthprovid":[0,1],"gcpauthproviderschem":[0,1],"gcpskillregistri":[0,1],"gcs_tool_set":0,"gcsadmintoolset":[0,1],"gcscredentialsconfig":[0,1],"gcstoolset":[0,1],"gemini":0,"gemini_schema":0,"gemini_to_json_schema":[0,1],"gen_ai_latest_experiment":0,"genai":0,"genai_semconv_stability_opt_in":[0,1],"gener":0,"generate_cont":0,"generate_content_async":[0,1],"generate_content_config":[0,1],"generate_summari":0,"generatecont":0,"generatecontentconfig":0,"generatecontentresponseusagemetadata":0,"generated_audio_safeti":0,"generated_content_blocklist":0,"generated_content_prohibit":0,"generated_content_safeti":0,"generated_image_celebr":0,"generated_image_identifiable_peopl":0,"generated_image_minor":0,"generated_image_prohibit":0,"generated_image_prominent_people_detected_by_rewrit":0,"generated_image_safeti":0,"generated_oth":0,"generated_video_safeti":0,"generatedcont":0,"genericalia":0,"genuin":0,"geospati":0,"get":[0,1],"get_agent_async":0,"get_agent_info":[0,1],"get_artifact_vers":[0,1],"get_asset":[0,1],"get_auth_config":[0,1],"get_auth_credenti":[0,1],"get_auth_respons":[0,1],"get_bucket":0,"get_current_url":[0,1],"get_endpoint":[0,1],"get_error_count":[0,1],"get_exampl":[0,1],"get_execution_id":[0,1],"get_input_fil":[0,1],"get_invocation_context":[0,1],"get_mcp_serv":[0,1],"get_mcp_toolset":[0,1],"get_model_nam":[0,1],"get_object_data":0,"get_object_metadata":0,"get_paramet":[0,1],"get_plugin":[0,1],"get_processed_file_nam":[0,1],"get_refer":[0,1],"get_remote_a2a_ag":[0,1],"get_resource_info":[0,1],"get_screenshot":[0,1],"get_script":[0,1],"get_secret":[0,1],"get_sess":[0,1],"get_session_config":[0,1],"get_session_sync":[0,1],"get_skil":[0,1],"get_state_delta":[0,1],"get_tool":[0,1],"get_tools_with_prefix":[0,1],"get_toolset":[0,1],"get_user_choic":[0,1],"get_user_choice_tool":1,"get_user_st":[0,1],"get_weath":0,"getaccesstoken":0,"getopenidtoken":0,"getsessionconfig":0,"gil":0,"github":0,"given":0,"global":0,"global_instruct":[0,1],"globalinstructionplugin":0,"gmail":0,"gmailtoolset":[0,1],"go":0,"go_back":[0,1],"go_forward":[0,1],"goawai":0,"goe":0,"gone":0,"google_api_kei":0,"google_api_tool":1,"google_genai_use_enterpris":0,"google_genai_use_vertexai":0,"google_map":0,"google_maps_grounding_tool":1,"google_search":0,"google_search_agent_tool":1,"google_search_imag":0,"google_search_tool":1,"google_search_web":0,"google_service_account_auth":0,"google_tool":1,"googleapi":0,"googleapierror":0,"googleapitool":[0,1],"googleapitoolset":[0,1],"googleautherror":0,"googlemap":0,"googlemapsgroundingtool":[0,1],"googlemapsgroundingtyp":0,"googlemapsplac":0,"googlemapsrout":0,"googlemapsuri":0,"googlemapswidgetcontexttoken":0,"googlesearch":0,"googlesearchagenttool":[0,1],"googlesearchdynamicretrievalscor":0,"googlesearchretriev":0,"googlesearchtool":[0,1],"googleserviceaccountconfig":0,"googletool":[0,1],"googletyped":0,"gpt":0,"gracefulli":0,"grain":0,"grant":0,"grant_types_support":0,"graph":[0,1],"greater":0,"gregorian":0,"ground":0,"grounding_chunk":0,"grounding_chunk_indic":0,"groundingchunk":0,"groundingchunkcustommetadata":0,"groundingchunkimag":0,"groundingchunkindic":0,"groundingchunkmap":0,"groundingchunkmapsplaceanswersourc":0,"groundingchunkmapsplaceanswersourcesauthorattribut":0,"groundingchunkmapsplaceanswersourcesreviewsnippet":0,"groundingchunkmapsrout":0,"groundingchunkretrievedcontext":0,"groundingchunkstringlist":0,"groundingchunkweb":0,"groundingfact":0,"groundingmetadata":0,"groundingmetadatasourceflagginguri":0,"groundingsupport":0,"groundingtyp":0,"gserviceaccount":0,"guarante":0,"guardrail":0,"guest":0,"guid":0,"guidanc":0,"ha":0,"hallucin":0,"halt":0,"hand":0,"handcraft":0,"handl":0,"handler":0,"happen":0,"har":0,"has_delta":[0,1],"has_trailing_code_execution_result":[0,1],"hash":0,"hashlib":0,"hasn":0,"have":0,"header":[0,1],"header_provid":[0,1],"headerprovid":0,"health_check":[0,1],"healthi":0,"held":0,"hello":0,"hello_world":0,"help":0,"helper":0,"here":0,"hi":0,"hide":0,"hierarchi":0,"high":0,"higher":0,"highest":0,"hint":[0,1],"histor":0,"histori":0,"history_config":[0,1],"historyconfig":0,"hit":0,"hitl":0,"hoc":0,"hold":0,"home":0,"host":0,"hostnam":0,"hour":0,"hover":0,"hover_at":[0,1],"how":0,"howev":0,"html":0,"http":0,"http_basic_auth":0,"http_error":0,"http_in_bodi":0,"http_in_cooki":0,"http_in_head":0,"http_in_path":0,"http_in_queri":0,"http_in_unspecifi":0,"http_option":[0,1],"httpauth":0,"httpbase":0,"httpbasicauthconfig":0,"httpbearer":0,"httpcredenti":0,"httpelementloc":0,"httpoption":0,"httpx":0,"httpx_client":0,"httpx_client_factori":[0,1],"hub":0,"human":0,"hybrid":0,"hybridsearch":0,"i":0,"iam":0,"iana":0,"id":[0,1],"ideal":0,"idempot":0,"ident":0,"identif":0,"identifi":0,"idl":0,"idtoken":0,"ietf":0,"ifram":0,"ignor":0,"imag":0,"image_oth":0,"image_prohibited_cont":0,"image_prohibited_input_cont":0,"image_recit":0,"image_safeti":0,"imagedata":0,"imagemimetyp":0,"imagesearch":0,"imagesearchqueri":0,"imageuri":0,"immedi":0,"impact":0,"implement":0,"implicit":0,"import":0,"importfil":0,"improv":0,"inappropri":0,"includ":[0,1],"include_cont":[0,1],"include_domain":0,"include_plugin":[0,1],"include_response_metadata":[0,1],"include_thoughts_from_other_ag":[0,1],"inclus":0,"incom":0,"incorpor":0,"incorrect":0,"increas":0,"increment":0,"increment_error_count":[0,1],"increment_llm_call_count":[0,1],"indefinit":0,"independ":0,"index":0,"indic":0,"indirect":0,"infer":0,"info":0,"inform":0,"infrastructur":0,"ingest":0,"inherit":0,"initi":[0,1],"initial_delai":[0,1],"initial_session_fil":0,"initialhistoryinclientcont":0,"initialis":0,"inject":0,"inject_session_st":0,"inlin":0,"inline_data":0,"inlinedata":0,"inmemoryrunn":[0,1],"inmemorysessionservic":[0,1],"inop":0,"input":[0,1],"input_audio_transcript":[0,1],"input_fil":0,"input_image_celebr":0,"input_image_photo_realistic_child_prohibit":0,"input_ip_prohibit":0,"input_oth":0,"input_realtime_cach":[0,1],"input_schema":[0,1],"input_text_contain_prominent_person_prohibit":0,"input_text_ncii_prohibit":0,"inputtranscript":0,"insecur":0,"insid":0,"inspect":0,"inspect_ev":0,"instal":0,"instanc":0,"instanti":0,"instead":0,"instruct":[0,1],"instructionprovid":0,"instrument":0,"int":0,"int32":0,"int64":0,"integ":0,"integr":1,"integrationconnectortool":[0,1],"intend":0,"intens":0,"interact":0,"interactionid":0,"intercept":0,"interfac":0,"interleav":0,"intermedi":0,"intern":0,"interpol":0,"interpret":0,"interrupt":0,"interrupt_id":[0,1],"interruptid":0,"interv":0,"invalid":0,"invoc":0,"invocation_context":0,"invocation_id":[0,1],"invocationcontext":[0,1],"invocationid":0,"invocations_us":0,"invok":0,"involv":0,"io":0,"ip":0,"irrelev":0,"is_final_respons":[0,1],"is_initi":[0,1],"is_long_run":[0,1],"is_resum":[0,1],"isn":0,"iso":0,"isol":0,"isolation_scop":[0,1],"isolationscop":0,"issu":0,"item":0,"iter":0,"its":0,"itself":0,"jitter":[0,1],"joinnod":[0,1],"jpeg":0,"json":0,"json_path":0,"json_str":0,"jsonpath":0,"just":0,"jwt":0,"k":0,"kebab":0,"keep":0,"kei":0,"kept":0,"key_combin":[0,1],"keyfil":0,"keyword":0,"kill":0,"kind":0,"kit":0,"knob":0,"know":0,"knowledg":0,"kwarg":0,"l1":0,"l2":0,"l3":0,"lab":1,"label":[0,1],"lambda":0,"lang":0,"langchain":1,"langchain_tool":1,"langchaintool":[0,1],"langchaintoolconfig":[0,1],"languag":0,"language_cod":0,"language_unspecifi":0,"languageauto":0,"languagecod":0,"languagehint":0,"larger":0,"last":0,"last_consumed_client_message_index":0,"last_update_tim":[0,1],"lastconsumedclientmessageindex":0,"lastpag":0,"lastupdatetim":0,"latenc":0,"later":0,"latest":0,"layer":0,"lazili":0,"lazy_load_spec":0,"leak":0,"least":0,"leav":0,"left":0,"leg":0,"legaci":0,"legal_terms_and_agr":0,"length":0,"less":0,"let":0,"letter":0,"level":0,"leverag":0,"librari":0,"licens":[0,1],"lifecycl":0,"lifetim":0,"lightweight":0,"like":0,"likelihood":0,"limit":0,"line":0,"link":0,"list":0,"list_ag":[0,1],"list_artifact":[0,1],"list_artifact_kei":[0,1],"list_artifact_vers":[0,1],"list_asset":[0,1],"list_bucket":0,"list_directori":0,"list_endpoint":[0,1],"list_mcp_serv":[0,1],"list_object":0,"list_refer":[0,1],"list_resourc":[0,1],"list_script":[0,1],"list_sess":[0,1],"list_sessions_sync":[0,1],"list_skills_in_dir":[0,1],"list_skills_in_gcs_dir":[0,1],"list_vers":[0,1],"listsessionsrespons":0,"listskillstool":[0,1],"litellm":0,"liter":0,"littl":0,"live":0,"live_request_queu":[0,1],"live_session_resumption_handl":[0,1],"liveconnectconfig":0,"liverequest":[0,1],"liverequestqueu":[0,1],"liveservergoawai":0,"liveserversessionresumptionupd":0,"livesessionid":0,"livesessionresumptionupd":0,"llm":0,"llm_agent_call_1":0,"llm_cl":0,"llm_request":0,"llm_respons":0,"llmagent":[0,1],"llmagentconfig":[0,1],"llmcallslimitexceedederror":0,"llmranker":0,"llmregistri":[0,1],"llmrequest":0,"llmrespons":0,"load":0,"load_artifact":[0,1],"load_artifacts_tool":1,"load_credenti":[0,1],"load_mcp_resourc":0,"load_mcp_resource_tool":1,"load_memori":[0,1],"load_memory_tool":1,"load_profil":[0,1],"load_skil":0,"load_skill_from_dir":[0,1],"load_skill_from_gcs_dir":[0,1],"load_web_pag":1,"loadartifactstool":[0,1],"loadmcpresourcetool":[0,1],"loadmemoryrespons":[0,1],"loadmemorytool":[0,1],"loadskillresourcetool":[0,1],"loadskilltool":[0,1],"local":0,"localenviron":[0,1],"locat":0,"lock":0,"log":0,"logic":0,"logprob":0,"logprobabilitysum":0,"logprobsresult":0,"logprobsresultcandid":0,"logprobsresulttopcandid":0,"logrecord":0,"long":0,"long_running_tool":1,"long_running_tool_id":[0,1],"longer":0,"longrunningfunctiontool":[0,1],"longrunningtoolid":0,"look":0,"loop":0,"loopag":[0,1],"loopagentconfig":[0,1],"lose":0,"loss":0,"lost":0,"lot":0,"low":0,"lower":0,"lowercas":0,"machin":0,"made":0,"magnitud":0,"mai":0,"main":0,"mainli":0,"maintain":0,"make":0,"make_cdp_batch_request":[0,1],"make_cdp_request":[0,1],"malformed_function_cal":0,"manag":0,"managedag":[0,1],"mani":0,"manifest":0,"manner":0,"manual":0,"map":0,"mark":0,"markdown":0,"marketplac":0,"master":0,"match":0,"materi":0,"matter":0,"max":0,"max_age_second":0,"max_attempt":[0,1],"max_child_process":[0,1],"max_concurr":[0,1],"max_delai":[0,1],"max_file_size_byt":[0,1],"max_item":0,"max_iter":[0,1],"max_length":0,"max_llm_cal":[0,1],"max_memory_byt":[0,1],"max_output_char":0,"max_parallel_work":[0,1],"max_properti":0,"max_regeneration_reach":0,"max_result":0,"max_retri":0,"max_round":0,"max_token":[0,1],"max_total_token":0,"max_work":0,"maximum":0,"maximumm":0,"maxitem":0,"maxlength":0,"maxproperti":0,"maxresult":0,"maxsiz":0,"mcp":0,"mcp_app_resource_uri":[0,1],"mcp_server":0,"mcp_server_nam":0,"mcp_session_manag":0,"mcp_tool":1,"mcp_tool_error":0,"mcp_toolset":0,"mcpinstructionprovid":[0,1],"mcpserver":0,"mcpserverparam":0,"mcptool":[0,1],"mcptoolset":[0,1],"md":0,"me":0,"mean":0,"meaningless":0,"meant":0,"measur":0,"mechan":0,"media":0,"media_resolution_high":0,"media_resolution_low":0,"media_resolution_medium":0,"media_resolution_ultra_high":0,"media_resolution_unspecifi":0,"mediaid":0,"mediamod":0,"mediaresolut":0,"medium":0,"meet":0,"member":0,"memor":0,"memori":1,"memory_entri":0,"memory_servic":[0,1],"memoryentri":0,"mender":0,"mention":0,"merg":0,"messag":[0,1],"messageasoutput":0,"met":0,"meta":0,"metadata":[0,1],"metadatafilt":0,"meter":0,"method":0,"metric":0,"mid":0,"midwai":0,"might":0,"migrat":0,"migrate_eval_data_to_new_schema":[0,1],"mime":0,"mimetyp":0,"min_item":0,"min_length":0,"min_properti":0,"minim":0,"minimum":0,"minitem":0,"minlength":0,"minproperti":0,"mint":0,"mirror":0,"miss":0,"missingsentinel":0,"mistak":0,"mistakenli":0,"ml":0,"modal":0,"modality_unspecifi":0,"modalitytokencount":0,"mode":[0,1],"mode_dynam":0,"mode_unspecifi":0,"model":1,"model_cod":[0,1],"model_construct":0,"model_copi":[0,1],"model_dump":0,"model_input_context":[0,1],"model_post_init":[0,1],"model_valid":0,"modelcontextprotocol":0,"modelnam":0,"modelvers":0,"modif":0,"modifi":0,"modul":1,"monitor":0,"month":0,"more":0,"most":0,"mount":0,"msg":[0,1],"multi":0,"multimod":0,"multipl":0,"multiplex":0,"multipli":0,"multiprocess":0,"multispeakervoiceconfig":0,"must":0,"mutabl":0,"mutat":0,"mutual":0,"my":0,"my_after_agent_callback":0,"my_ag":0,"my_func":0,"my_func2":0,"my_func3":0,"my_funct":0,"my_function_arg1":0,"my_function_arg2":0,"my_function_tool":0,"my_kei":0,"my_librari":0,"my_mcp_toolset":0,"my_modul":0,"my_nod":0,"my_other_tool":0,"my_packag":0,"my_tool":0,"my_tool_arg1":0,"my_tool_arg2":0,"my_tool_class":0,"my_tool_funct":0,"myschema":0,"n":0,"n1":0,"n2":0,"n3":0,"n4":0,"n5":0,"n_run_impl":0,"na":0,"nadk":0,"name":[0,1],"nan":0,"nand":0,"nanswer":0,"napi":0,"nativ":0,"nattach":0,"nattempt":0,"nattribut":0,"naudio":0,"nauthcredenti":0,"nautomat":0,"navig":[0,1],"nbe":0,"nbegin":0,"nby":0,"nclient":0,"ncode":0,"nconfigur":0,"nconsum":0,"ncontext":0,"ncorpu":0,"ncorrespond":0,"ncreat":0,"ncredentialexchang":0,"ncurrent":0,"ndai":0,"ndata":0,"ndatastor":0,"ndefault":0,"ndefin":0,"ndeprec":0,"ndisabl":0,"ndo":0,"necessari":0,"need":0,"need_more_input":0,"neither":0,"nend":0,"nest":0,"network":0,"networkparam":0,"nevent":0,"never":0,"new":0,"new_eval_data_fil":0,"new_handl":0,"new_id":[0,1],"new_llm":[0,1],"new_messag":0,"newhandl":0,"newli":0,"nexactli":0,"nexampl":0,"nexecut":0,"next":0,"nfield":0,"nfile":0,"nfor":0,"ngener":0,"ngeneratecontentrespons":0,"ngoogl":0,"nhttp":0,"ni":0,"nif":0,"ninclud":0,"ninform":0,"ninsignific":0,"ninstanc":0,"ninstead":0,"ninstruct":0,"ninvoc":0,"nit":0,"nlimit":0,"nload":0,"nlocal":0,"nmanagedag":0,"nmember":0,"nmetric":0,"nmime":0,"nmodel":0,"nnext":0,"nnot":0,"nnote":0,"no_auth":0,"no_cont":[0,1],"no_imag":0,"no_interrupt":0,"nobject":0,"node":[0,1],"node_info":[0,1],"node_input":0,"node_lik":0,"node_nam":[0,1],"node_path":[0,1],"nodeinfo":0,"nodeinterruptederror":0,"nodelik":0,"noderunn":0,"nodetimeouterror":[0,1],"nof":0,"non":0,"non_block":0,"nonc":0,"none":0,"nonli":0,"nor":0,"normal":0,"north":0,"note":0,"nother":0,"notic":0,"notif":0,"notifi":0,"notimplementederror":0,"notion":0,"notion_head":0,"notionhq":0,"noutput":0,"now":0,"npredict":0,"npresenc":0,"nprovid":0,"npx":0,"nqueryplac":0,"nreach":0,"nrepres":0,"nrequest":0,"nrespons":0,"nrun":0,"nsandbox":0,"nsee":0,"nspecifi":0,"nstorag":0,"nsubclass":0,"nsubject":0,"nsupport":0,"ntaken":0,"ntext":0,"nthat":0,"nthe":0,"nthi":0,"nthrough":0,"nto":0,"ntoken":0,"ntool":0,"ntype":0,"null":0,"null_valu":0,"nullabl":0,"nullvalu":0,"num":0,"num_hit":0,"num_recent_ev":0,"num_run":0,"number":0,"numbervalu":0,"numer":0,"numericvalu":0,"numhit":0,"numpi":0,"numtoken":0,"nunderstand":0,"nunspecifi":0,"nuse":0,"nuser":0,"nvalid":0,"nvulner":0,"nwhen":0,"nwill":0,"nwith":0,"nwithin":0,"nyc":0,"o":0,"oa":0,"oai":0,"oauth":0,"oauth2":0,"oauth2auth":0,"oauthconfig":0,"oauthflow":0,"oauthflowauthorizationcod":0,"oauthflowclientcredenti":0,"oauthflowimplicit":0,"oauthflowpassword":0,"object":0,"observ":0,"occur":0,"oci":1,"off":0,"offer":0,"offset":0,"oidc":0,"oidc_auth":0,"oidcconfig":0,"ok":0,"old_eval_data_fil":0,"omit":0,"omitsentinel":0,"on_agent_error_callback":[0,1],"on_demand":0,"on_demand_flex":0,"on_demand_prior":0,"on_event_callback":[0,1],"on_model_error_callback":[0,1],"on_run_error_callback":[0,1],"on_tool_error_callback":[0,1],"on_user_message_callback":[0,1],"onc":0,"one":0,"ongo":0,"onli":0,"onmodelerrorcallback":0,"ontoolerrorcallback":0,"op":0,"opaqu":0,"open":0,"open_id_connect":0,"open_web_brows":[0,1],"openai":1,"openaillm":[0,1],"openaireason":0,"openairesponsesllm":[0,1],"openapi":0,"openapi_mcp_head":0,"openapi_spec_dict":0,"openapi_spec_str":0,"openapi_tool":1,"openapi_toolset":0,"openapitoolset":[0,1],"openid":0,"openidconnect":0,"openidconnecturl":0,"openidconnectwithconfig":0,"opentelemetri":0,"oper":0,"operationgener":0,"operationid":0,"opportun":0,"opt":0,"optim":1,"optimize_data_fil":[0,1],"option":0,"optional_field":[0,1],"oracl":0,"orchestr":0,"order":0,"order_bi":0,"org":0,"organ":0,"origin":0,"otel":0,"otel_":0,"otel_instrumentation_genai_capture_message_cont":0,"otel_semconv_stability_opt_in":0,"other":0,"other_nam":0,"otherwis":0,"out":0,"outbound":0,"outcom":0,"outcome_deadline_exceed":0,"outcome_fail":0,"outcome_ok":0,"outcome_unspecifi":0,"outermost":0,"outgo":0,"outliv":0,"output":[0,1],"output_audio_transcript":[0,1],"output_image_ip_prohibit":0,"output_kei":[0,1],"output_realtime_cach":[0,1],"output_schema":[0,1],"outputfor":0,"outputtranscript":0,"outsid":0,"over":0,"overlap":0,"overrid":0,"overridden":0,"override_branch":0,"override_isolation_scop":0,"overview":0,"overwrit":0,"own":0,"ownership":0,"packag":0,"page":0,"page_s":0,"page_token":0,"pagenumb":0,"pagespan":0,"pai":0,"pair":0,"parallel":0,"parallel_tool_cal":[0,1],"parallel_work":[0,1],"parallelag":[0,1],"parallelagentconfig":[0,1],"parallelaisearch":0,"param":0,"param1":0,"param2":0,"paramet":0,"parameter_bind":[0,1],"parameter_manag":1,"parametermanagercli":[0,1],"parametersjsonschema":0,"parent":0,"parent_ag":[0,1],"parent_context":0,"parent_ctx":[0,1],"parrot":0,"pars":0,"parsed_operation_str":0,"parsedoper":0,"part":0,"parti":0,"partial":[0,1],"partialarg":0,"particip":0,"particular":0,"particularli":0,"partindex":0,"partit":0,"partmediaresolut":0,"partmediaresolutionlevel":0,"partmetadata":0,"partunion":0,"pass":0,"password":0,"past":0,"patch":0,"path":0,"pattern":0,"paus":0,"payload":[0,1],"payload_schema":0,"peer":0,"pend":0,"per":0,"perform":0,"period":0,"permiss":0,"persist":0,"person":0,"perspect":0,"pet":0,"phish":0,"phish_block_threshold_unspecifi":0,"phishblockthreshold":0,"photo":0,"photouri":0,"phrase":0,"pick":0,"piec":0,"pil":0,"pin":0,"pip":0,"pixel":0,"place":0,"place_id":0,"placeanswersourc":0,"placehold":0,"placeid":0,"plain":0,"plan":0,"planner":1,"planreactplann":[0,1],"platform":1,"pleas":0,"plu":0,"plugin":1,"plugin_close_timeout":0,"plugin_manag":[0,1],"plugin_nam":0,"pluginmanag":[0,1],"png":0,"point":0,"polici":0,"poll":0,"polylin":0,"polylinealgorithm":0,"pool":0,"popul":0,"populate_invocation_agent_st":[0,1],"populate_nam":[0,1],"portabl":0,"portion":0,"portrait":0,"posit":0,"possibl":0,"post":0,"potenti":0,"power":0,"practic":0,"pre":0,"prebuilt":0,"prebuiltvoiceconfig":0,"preced":0,"predecessor":0,"predefin":0,"predic":0,"predict":0,"predictor":0,"preexist":0,"prefer":0,"prefix":0,"prefix_turn":0,"prefixitem":0,"prefixpaddingm":0,"preload":0,"preload_memory_tool":1,"preloadmemorytool":[0,1],"prem":0,"prepar":[0,1],"prepare_t":[0,1],"prepend":0,"preprocess":0,"presenc":0,"present":0,"preserv":0,"preserve_property_nam":0,"press":0,"press_ent":0,"prevent":0,"preview":0,"previou":0,"previous":0,"primari":0,"primarili":0,"primit":0,"print":0,"print_detailed_result":0,"prior":0,"prioriti":0,"privat":0,"private_kei":0,"private_key_id":0,"private_key_jwt":0,"privatekei":0,"privatekeyid":0,"pro":0,"proactiv":[0,1],"proactiveaudio":0,"proactivityconfig":0,"probabl":0,"problem":0,"proce":0,"process":0,"process_llm_request":[0,1],"process_planning_respons":[0,1],"processpoolexecutor":0,"produc":0,"product":0,"profil":0,"program":0,"progress":0,"progress_callback":0,"progresscallbackfactori":0,"progressfnt":0,"prohibited_cont":0,"prohibited_input_cont":0,"project":0,"project_id":[0,1],"projectid":0,"prompt":0,"prompt_nam":0,"prompt_token_count":0,"promptmessag":0,"prompttokencount":0,"prompttokensdetail":0,"propag":0,"propagate_grounding_metadata":0,"proper":0,"properli":0,"properti":0,"propertyord":0,"proto":0,"protobuf":0,"protocol":0,"provid":0,"provis":0,"provisioned_throughput":0,"proxi":0,"pub":0,"public":0,"publicationd":0,"publish":0,"publish_messag":0,"publish_timeout":[0,1],"pubsub":1,"pubsub_tool_config":0,"pubsubcredentialsconfig":[0,1],"pubsubtoolconfig":[0,1],"pubsubtoolset":[0,1],"pull":0,"pure":0,"purpos":0,"py":0,"pydant":0,"python":0,"python3":0,"python_path":0,"q":0,"qualifi":0,"qualiti":0,"queri":0,"queue":0,"quick":0,"quickli":0,"quickstart":0,"quiet":0,"quot":0,"quota":0,"rag":0,"rag_corpu":0,"rag_file_id":0,"rag_resourc":0,"ragchunk":0,"ragchunkpagespan":0,"ragcorpora":0,"ragcorpu":0,"ragfil":0,"ragfileid":0,"ragresourc":0,"ragretrievalconfig":0,"ragretrievalconfigfilt":0,"ragretrievalconfighybridsearch":0,"ragretrievalconfigrank":0,"ragretrievalconfigrankingllmrank":0,"ragretrievalconfigrankingrankservic":0,"rais":0,"raise_on_wait":0,"ram":0,"ran":0,"random":0,"rang":0,"rank":0,"ranker":0,"rankservic":0,"rare":0,"rate":0,"rather":0,"rational":0,"raw":0,"raw_auth_credenti":0,"raw_mcp_tool":[0,1],"rawauthcredenti":0,"re":0,"reach":0,"reachabl":0,"react":0,"reaction":0,"read":0,"read_fil":[0,1],"read_resourc":[0,1],"readabl":0,"readfil":0,"readi":0,"readonli":0,"readonly_context":0,"readonlycontext":0,"real":0,"realtim":0,"realtime_input":0,"realtime_input_config":[0,1],"realtimecacheentri":0,"realtimeinputconfig":0,"reason":[0,1],"reasoningengin":0,"reauthent":0,"recal":0,"receiv":0,"recent":0,"recit":0,"recogn":0,"recognit":0,"recommend":0,"reconnect":0,"record":0,"recoveri":0,"recreat":0,"recurs":0,"redirect":0,"redirect_uri":0,"redirecturi":0,"reduc":0,"reduct":0,"ref":0,"refer":[0,1],"referenc":0,"reference_id":0,"refin":0,"reflect":0,"reformat":0,"refresh":0,"refreshtoken":0,"refreshurl":0,"regardless":0,"regex":0,"region":0,"regist":[0,1],"register_plugin":[0,1],"registr":0,"registri":0,"regular":0,"rehydr":0,"reject":0,"rel":0,"relat":0,"relativepublishtimedescript":0,"releas":0,"relev":0,"reli":0,"remain":0,"remot":0,"remotea2aag":0,"remotemcpserv":[0,1],"remov":0,"render":0,"render_ui_widget":[0,1],"rendered_part":0,"renderedcont":0,"renderedpart":0,"renderuiwidget":0,"replac":0,"repli":0,"replic":0,"replicatedvoiceconfig":0,"repo":0,"report":0,"repositori":0,"repres":0,"represent":0,"req":0,"request":0,"request_confirm":[0,1],"request_credenti":[0,1],"requested_auth_config":[0,1],"requested_tool_confirm":[0,1],"requestedauthconfig":0,"requestedtoolconfirm":0,"requestinput":[0,1],"requir":0,"require_confirm":[0,1],"rerank":0,"rerun":0,"rerun_on_resum":[0,1],"research":0,"reserv":0,"reset":0,"reset_error_count":[0,1],"reset_sub_agent_st":[0,1],"resolut":0,"resolv":[0,1],"resolved_content_capturing_mod":[0,1],"resourc":[0,1],"resource1":0,"resource_nam":0,"resource_ref":0,"resourceref":0,"resourceuri":0,"respect":0,"respond":0,"respons":0,"response_event_id":0,"response_for_auth_requir":0,"response_mod":[0,1],"response_part":0,"response_reject":0,"response_schedul":[0,1],"response_schema":[0,1],"responsejsonschema":0,"responseschema":0,"rest":0,"rest_api_tool":0,"restapitool":[0,1],"restart":0,"restor":0,"restrict":0,"result":0,"result_stderr":0,"result_stdout":0,"resum":0,"resumability_config":[0,1],"resumabilityconfig":0,"resume_input":[0,1],"resumpt":0,"retri":0,"retriev":1,"retrievalmetadata":0,"retrievalqueri":0,"retrievedcontext":0,"retry_config":[0,1],"retryconfig":[0,1],"return":0,"reus":0,"reusabl":0,"review":0,"reviewid":0,"reviewsnippet":0,"revis":0,"revoc":0,"revocation_endpoint":0,"rewind":0,"rewind_async":[0,1],"rewind_before_invocation_id":[0,1],"rewindbeforeinvocationid":0,"rfc":0,"rfc9535":0,"rich":0,"richer":0,"right":0,"robot":0,"role":0,"root":0,"root_ag":[0,1],"round":0,"rout":[0,1],"routevalu":0,"rpc":0,"rule":0,"run":[0,1],"run_after_agent_callback":[0,1],"run_after_model_callback":[0,1],"run_after_run_callback":[0,1],"run_after_tool_callback":[0,1],"run_async":[0,1],"run_async_with_credenti":0,"run_before_agent_callback":[0,1],"run_before_model_callback":[0,1],"run_before_run_callback":[0,1],"run_before_tool_callback":[0,1],"run_config":[0,1],"run_debug":[0,1],"run_id":[0,1],"run_liv":[0,1],"run_nod":[0,1],"run_node_impl":[0,1],"run_on_agent_error_callback":[0,1],"run_on_event_callback":[0,1],"run_on_model_error_callback":[0,1],"run_on_run_error_callback":[0,1],"run_on_tool_error_callback":[0,1],"run_on_user_message_callback":[0,1],"runconfig":[0,1],"runner":1,"runskillscripttool":[0,1],"runtim":0,"runtime_auth_config":0,"runtimeerror":0,"sa":0,"safe":0,"safeti":0,"safety_policy_unspecifi":0,"safetypolici":0,"same":0,"sampl":0,"sampling_callback":0,"sampling_cap":0,"sandbox":0,"sandbox_bin":[0,1],"sandbox_nam":0,"sandbox_snapshot_nam":0,"sandbox_template_nam":0,"sandbox_ttl_second":0,"sandboxcli":[0,1],"sandboxenviron":0,"sandboxenvironmentsnapshot":0,"sandboxenvironmenttempl":0,"save":0,"save_artifact":[0,1],"save_credenti":[0,1],"save_input_blobs_as_artifact":[0,1],"save_live_audio":[0,1],"save_live_blob":[0,1],"save_live_model_audio_to_sess":0,"savefilesasartifactsplugin":0,"scan":0,"scenario":0,"schedul":0,"scheduling_unspecifi":0,"schema":0,"schematyp":0,"schemaunion":0,"scheme":0,"scope":[0,1],"scope1":0,"scope2":0,"score":0,"scratch":0,"screen":0,"screen_siz":[0,1],"screenshot":0,"script":[0,1],"script_id":0,"script_timeout":0,"scroll":0,"scroll_at":[0,1],"scroll_docu":[0,1],"sdk":0,"sdkblob":0,"search":[0,1],"search_ag":[0,1],"search_engine_id":[0,1],"search_engine_url":0,"search_mcp_serv":[0,1],"search_memori":[0,1],"search_result_mod":0,"search_skil":[0,1],"search_str":0,"search_tool":0,"search_tool_descript":[0,1],"search_typ":0,"searchalongrout":0,"searchentrypoint":0,"searchmemoryrespons":0,"searchresultmod":[0,1],"searchskillstool":[0,1],"searchtempl":0,"searchtyp":0,"sec4":0,"second":0,"secret":0,"secret_manag":1,"secretmanag":0,"secretmanagercli":[0,1],"section":0,"secur":0,"security_callback":0,"securityschem":0,"securityschemetyp":0,"see":0,"seed":0,"segment":0,"select":0,"self":[0,1],"selfag":0,"selftool":0,"selftoolset":0,"semant":0,"semconv":0,"send":[0,1],"send_activity_end":[0,1],"send_activity_start":[0,1],"send_cont":[0,1],"send_realtim":[0,1],"sensit":0,"sensitive_data_modif":0,"sent":0,"separ":0,"sequenc":0,"sequenti":0,"sequentialag":[0,1],"sequentialagentconfig":[0,1],"seri":0,"serial":0,"serializ":0,"serializeasani":0,"serv":0,"server":0,"server_param":[0,1],"server_url":0,"servic":0,"service_account":0,"service_account_credenti":0,"service_account_email":0,"service_account_json":0,"service_nam":0,"service_ti":[0,1],"serviceaccount":0,"serviceaccountconfig":0,"serviceaccountcredenti":0,"serviceaccounttokencr":0,"session":1,"session_config":0,"session_id":0,"session_resumpt":[0,1],"session_resumption_upd":0,"session_servic":[0,1],"session_st":0,"sessionconfigparam":0,"sessioninput":0,"sessionresumptionconfig":0,"sessionresumptiontoken":0,"sessionresumptiontokenupd":0,"set":0,"set_agent_st":[0,1],"set_default_head":[0,1],"set_default_live_model":[0,1],"set_default_model":[0,1],"set_execution_id":[0,1],"set_model_respons":[0,1],"set_model_response_tool":1,"set_skip_closing_plugin":[0,1],"set_tool_filt":[0,1],"setdefault":[0,1],"setmodelrespons":0,"setmodelresponsetool":[0,1],"setup":0,"setup_complet":0,"sha":0,"sha256hash":0,"shape":0,"share":0,"shared_param":0,"sheet":0,"sheetstoolset":[0,1],"shell":0,"short":0,"shorten":0,"shorter":0,"shot":0,"should":0,"should_add_content_to_experimental_span":[0,1],"should_add_content_to_legacy_span":[0,1],"should_add_content_to_log":[0,1],"should_parse_oper":0,"should_pause_invoc":[0,1],"should_use_experimental_genai_semconv":[0,1],"shouldn":0,"show":0,"shown":0,"shut":0,"shutdown":0,"sibl":0,"side":0,"sign":0,"signal":0,"signatur":0,"signific":0,"silenc":0,"silencedurationm":0,"silent":0,"similar":0,"similaritytopk":0,"simpl":0,"simple_search":0,"simplesearchparam":0,"simplifi":0,"simultan":0,"sinc":0,"singl":0,"single_turn":0,"site":0,"size":0,"sizebyt":0,"skill":1,"skill_dir":0,"skill_id":0,"skill_registri":1,"skill_toolset":1,"skillregistri":[0,1],"skills_base_path":0,"skilltoolset":[0,1],"skip":0,"skip_closing_plugin":0,"skip_summar":[0,1],"skipsummar":0,"slack":1,"slack_app":0,"slackrunn":[0,1],"sleep":0,"slide":0,"slidestoolset":[0,1],"slidingwindow":0,"smaller":0,"snake":0,"snake_cas":0,"snapshot":0,"snippet":0,"so":0,"socket":0,"softwar":0,"sole":0,"some":0,"someth":0,"soon":0,"sort":0,"sortbycolumn":0,"sourc":[0,1],"source_fil":0,"source_polici":0,"source_unspecifi":0,"sourceflagginguri":0,"sourceid":0,"sourceparam":0,"sourceuri":0,"south":0,"space":0,"span":0,"span_and_ev":[0,1],"span_onli":[0,1],"spanner":1,"spanner_create_databas":0,"spanner_create_inst":0,"spanner_execute_sql":0,"spanner_get_inst":0,"spanner_get_instance_config":0,"spanner_get_table_schema":0,"spanner_list_databas":0,"spanner_list_inst":0,"spanner_list_instance_config":0,"spanner_list_named_schema":0,"spanner_list_table_index":0,"spanner_list_table_index_column":0,"spanner_list_table_nam":0,"spanner_similarity_search":0,"spanner_tool_set":0,"spanner_vector_store_similarity_search":0,"spanneradmintoolset":[0,1],"spannercredentialsconfig":[0,1],"spannertoolset":[0,1],"spars":0,"spawn":0,"speak":0,"speaker":0,"speakerlabel":0,"speakervoiceconfig":0,"spec":0,"spec_dict":0,"spec_str":0,"spec_str_typ":0,"special":0,"specif":0,"specifi":0,"specvers":[0,1],"speech":0,"speech_config":[0,1],"speechconfig":0,"spii":0,"spk_1":0,"spk_2":0,"spoken":0,"sql":0,"sqlalchemi":0,"src":[0,1],"sse":0,"sse_read_timeout":[0,1],"sseconnectionparam":[0,1],"ssereadtimeout":0,"ssl":0,"ssl_verifi":0,"sslcontext":0,"stabil":0,"stabl":0,"stack":0,"stage":0,"stai":0,"stamp":0,"stamp_event_branch_context":[0,1],"standard":0,"start":[0,1],"start_of_activity_interrupt":0,"start_sensitivity_high":0,"start_sensitivity_low":0,"start_sensitivity_unspecifi":0,"startindex":0,"startoffset":0,"startofspeechsensit":0,"startsensit":0,"starttim":0,"starttimestamp":0,"startup":0,"state":[0,1],"state_delta":[0,1],"state_schema":[0,1],"state_unspecifi":0,"statedelta":0,"stateschemaerror":[0,1],"static":0,"static_instruct":[0,1],"statu":0,"stderr":[0,1],"stdin":0,"stdio":0,"stdioconnectionparam":[0,1],"stdioserverparamet":0,"stdout":[0,1],"step":0,"step_1":0,"step_2":0,"still":0,"stop":0,"stop_on_error":0,"storag":0,"store":[0,1],"store_context":0,"storecontext":0,"str":0,"strategi":0,"stream":0,"streamabl":0,"streamable_http":0,"streamablehttpconnectionparam":[0,1],"streamablehttptransport":0,"streaming_mod":[0,1],"streamingmod":0,"strict":0,"string":0,"stringlistvalu":0,"stringvalu":0,"structur":0,"stuck":0,"studio":0,"sub":0,"sub_ag":[0,1],"subclass":0,"subject":[0,1],"submodul":1,"subprocess":0,"subschema":0,"subscrib":0,"subscript":0,"subsequ":0,"subset":0,"substitut":0,"subtyp":0,"success":0,"suffic":0,"suffix":0,"suitabl":0,"sum":0,"summar":0,"summari":0,"sunni":0,"super":0,"support":0,"support_cfc":[0,1],"supported_auth_schem":[0,1],"supported_model":[0,1],"suppress":0,"sure":0,"surfac":0,"surgic":0,"swallow":0,"sy":0,"sync":0,"syntax":0,"synthesi":0,"system":0,"system_instruct":0,"t":0,"tab":0,"tabl":0,"tag":0,"take":0,"taken":0,"target":0,"targetlanguagecod":0,"targettoken":0,"task":0,"tear":0,"telemetri":1,"telemetry_context":[0,1],"telemetryconfig":[0,1],"telemetrycontext":0,"tell":0,"temp":0,"temp_prefix":[0,1],"temperatur":0,"templat":0,"temporari":0,"temporarili":0,"tenant":0,"term":0,"termin":0,"terminate_on_clos":[0,1],"terminateonclos":0,"test":0,"test_config":0,"test_fil":0,"test_trigg":0,"text":0,"textio":0,"textiowrapp":0,"than":0,"thei":0,"them":0,"thi":0,"think":0,"thinking_config":[0,1],"thinking_summari":0,"thinkingconfig":0,"third":0,"those":0,"thought":0,"thoughts_token_count":0,"thoughtsignatur":0,"thoughtstokencount":0,"thread":0,"threshold":0,"throttl":0,"through":0,"thu":0,"tier":0,"time":[0,1],"timed_out":[0,1],"timeleft":0,"timeofdai":0,"timeout":[0,1],"timeout_second":[0,1],"timerangefilt":0,"timestamp":[0,1],"titl":0,"tl":0,"to_a2a":0,"to_dict":[0,1],"to_mcp_serv":[0,1],"to_nod":[0,1],"todai":0,"todo":0,"togeth":0,"toggl":0,"token":0,"token_compaction_check":[0,1],"token_endpoint":0,"token_endpoint_auth_methods_support":0,"token_id":0,"token_uri":0,"tokencount":0,"tokenendpointauthmethod":0,"tokenid":0,"tokenuri":0,"tokenurl":0,"tokyo":0,"tool":1,"tool_arg":0,"tool_cod":0,"tool_config":1,"tool_confirm":1,"tool_context":1,"tool_filt":0,"tool_instruct":0,"tool_logg":0,"tool_nam":0,"tool_name_prefix":0,"tool_output":0,"tool_respons":0,"tool_set":0,"tool_thread_pool_config":[0,1],"tool_typ":0,"tool_type_unspecifi":0,"tool_use_prompt_token_count":0,"toolargsconfig":[0,1],"toolbox":0,"toolbox_adk":0,"toolbox_toolset":1,"toolboxtoolset":[0,1],"toolcal":0,"toolcodeexecut":0,"toolconfig":[0,1],"toolconfirm":[0,1],"toolcontext":[0,1],"toolexaaisearch":0,"toolloggerplugin":0,"toolparallelaisearch":0,"toolpred":[0,1],"toolrespons":0,"toolset":0,"toolset_nam":0,"toolthreadpoolconfig":0,"tooltyp":0,"toolunion":0,"tooluseprompttokencount":0,"tooluseprompttokensdetail":0,"top":0,"top_candid":0,"topcandid":0,"topic":0,"topk":0,"torn":0,"total":0,"totaltokencount":0,"trace":0,"trace_call_llm":[0,1],"trace_merged_tool_cal":[0,1],"trace_send_data":[0,1],"trace_tool_cal":[0,1],"track":0,"tradit":0,"traffic":0,"traffic_type_unspecifi":0,"traffictyp":0,"trail":0,"transcript":0,"transcription_cach":[0,1],"transcription_entri":0,"transcriptionentri":0,"transfer":0,"transfer_to_ag":[0,1],"transfer_to_agent_tool":1,"transfertoag":0,"transfertoagenttool":[0,1],"transform":0,"transformparam":0,"transient":0,"transit":0,"translat":0,"translation_config":[0,1],"translationconfig":0,"transpar":0,"transport":0,"treat":0,"tree":0,"tri":0,"trigger":0,"trigger_token":0,"triggertoken":0,"true":0,"truncat":[0,1],"trust":0,"truth":0,"try":0,"ttl":0,"tupl":0,"turn":0,"turn_complet":0,"turn_complete_reason_unspecifi":0,"turn_coverage_unspecifi":0,"turn_includes_all_input":0,"turn_includes_audio_activity_and_all_video":0,"turn_includes_only_act":0,"turncomplet":0,"turncompletereason":0,"turncoverag":0,"twice":0,"two":0,"type":[0,1],"type_":[0,1],"type_text":[0,1],"type_text_at":[0,1],"type_unspecifi":0,"typeadapt":0,"typeerror":0,"typevar":0,"typic":0,"u":0,"u2192":0,"ui":0,"ui_widget":0,"uiwidget":0,"un":0,"unavail":0,"unbound":0,"uncertain":0,"unchang":0,"unconsolid":0,"under":0,"underli":0,"underscor":0,"understand":0,"unexpect":0,"unexpected_tool_cal":0,"unhandl":0,"unidirect":0,"union":0,"uniontyp":0,"uniqu":0,"uniqueitem":0,"univers":0,"universe_domain":0,"universedomain":0,"unix":0,"unless":0,"unlik":0,"unlimit":0,"unlock":0,"unmodifi":0,"unsaf":0,"unsafe_prompt_for_image_gener":0,"unsafelocalcodeexecutor":[0,1],"unscop":0,"unset":0,"unspecifi":0,"unstructur":0,"unsupervis":0,"until":0,"unusu":0,"up":0,"updat":[0,1],"update_access_token":[0,1],"update_bucket":0,"update_code_execution_result":[0,1],"updatetim":0,"upfront":0,"upload":0,"upon":0,"uppercas":0,"upstream":0,"uri":0,"url":[0,1],"url_context":0,"url_context_tool":1,"urlcontext":0,"urlcontexttool":[0,1],"us":0,"usabl":0,"usag":0,"usage_metadata":0,"usagemetadata":0,"use_as_output":0,"use_default_credenti":0,"use_id_token":0,"use_mcp_resourc":0,"use_sub_branch":0,"usedefaultcredenti":0,"useidtoken":0,"user":0,"user_consent_manag":0,"user_cont":[0,1],"user_id":[0,1],"user_messag":0,"user_prefix":[0,1],"userid":0,"userinfo":0,"userinfo_endpoint":0,"usernam":0,"usr":0,"usual":0,"utf":0,"util":1,"v1":0,"v1beta1":0,"v2":0,"v3":0,"v4":0,"vad":0,"valid":0,"validate_generate_content_config":[0,1],"validate_max_llm_cal":[0,1],"validate_nam":[0,1],"validate_sub_agents_unique_nam":[0,1],"valu":0,"value1":0,"value2":0,"valueerror":0,"var":0,"variabl":0,"variable_nam":0,"variant":0,"variou":0,"vector":0,"vectordistancethreshold":0,"vectorsimilaritythreshold":0,"verbos":0,"verif":0,"verifi":0,"versa":0,"version":1,"vertex":0,"vertex_ai_load_profiles_tool":1,"vertex_ai_search_tool":1,"vertexai":0,"vertexai_cli":0,"vertexaiexamplestor":[0,1],"vertexailoadprofilestool":[0,1],"vertexaisearch":0,"vertexaisearchdatastorespec":0,"vertexaisearchtool":[0,1],"vertexaisessionservic":[0,1],"vertexragdataservic":0,"vertexragstor":0,"vertexragstoreragresourc":0,"via":0,"vice":0,"video":0,"videobitratebp":0,"videometadata":0,"view":0,"view_parameter_nam":0,"violat":0,"visibl":[0,1],"visit":0,"visual":0,"vmaa":1,"vocabulari":0,"voic":0,"voice_config":0,"voiceact":0,"voiceactivitytyp":0,"voiceconfig":0,"voiceconsentsignatur":0,"voicenam":0,"voicesampleaudio":0,"vscode":0,"w":0,"wa":0,"wai":0,"wait":[0,1],"wait_for_output":[0,1],"want":0,"warn":0,"wav":0,"we":0,"weather":0,"web":0,"webpag":0,"websearch":0,"websearchqueri":0,"websit":0,"webview":0,"weight":0,"welcom":0,"well":0,"were":0,"west":0,"what":0,"when":0,"when_idl":0,"where":0,"whether":0,"which":0,"while":0,"who":0,"whole":0,"whose":0,"why":0,"widget":0,"wikipedia":0,"will_continu":0,"willcontinu":0,"win":0,"window":0,"wish":0,"within":0,"without":0,"won":0,"word":0,"wordinfo":0,"wordtimestamp":0,"work":0,"workaround":0,"worker":0,"workflow":1,"working_dir":[0,1],"workspac":0,"would":0,"wrap":0,"wrapped_properti":[0,1],"wrapped_tool":0,"wrapper":0,"write":0,"write_fil":[0,1],"writefil":0,"www":0,"x":0,"x1":0,"x2":0,"x509":0,"xhigh":0,"xxx":0,"xyz":0,"y":0,"y1":0,"y2":0,"yaml":0,"year":0,"yet":0,"yield":0,"yield_user_messag":0,"you":0,"your":0,"your_client_id":0,"your_private_key_id":0,"your_project_id":0,"youtub":0,"youtubetoolset":[0,1],"z":0,"zero":0,"zone":0},"titles":["Submodules","google"],"titleterms":{"a2a":0,"adk":0,"agent":0,"agent_ident":0,"agent_registri":0,"agent_simul":0,"agent_tool":0,"antigrav":0,"api_registri":0,"apihub_tool":0,"app":0,"application_integration_tool":0,"artifact":0,"auth":0,"authenticated_function_tool":0,"base_authenticated_tool":0,"base_tool":0,"base_toolset":0,"bash_tool":0,"bigqueri":0,"bigtabl":0,"cloud_run":0,"code_executor":0,"computer_us":0,"crewai":0,"crewai_tool":0,"data_ag":0,"daytona":0,"discovery_engine_search_tool":0,"e2b":0,"enterprise_search_tool":0,"environ":0,"environment_simul":0,"error":0,"evalu":0,"event":0,"eventarc":0,"exampl":0,"example_tool":0,"exit_loop_tool":0,"firestor":0,"flow":0,"function_tool":0,"gc":0,"get_user_choice_tool":0,"googl":[0,1],"google_api_tool":0,"google_maps_grounding_tool":0,"google_search_agent_tool":0,"google_search_tool":0,"google_tool":0,"integr":0,"lab":0,"langchain":0,"langchain_tool":0,"load_artifacts_tool":0,"load_mcp_resource_tool":0,"load_memory_tool":0,"load_web_pag":0,"long_running_tool":0,"mcp_tool":0,"memori":0,"model":0,"modul":0,"oci":0,"openai":0,"openapi_tool":0,"optim":0,"parameter_manag":0,"planner":0,"platform":0,"plugin":0,"preload_memory_tool":0,"pubsub":0,"retriev":0,"runner":0,"secret_manag":0,"session":0,"set_model_response_tool":0,"skill":0,"skill_registri":0,"skill_toolset":0,"slack":0,"spanner":0,"submodul":0,"telemetri":0,"tool":0,"tool_config":0,"tool_confirm":0,"tool_context":0,"toolbox_toolset":0,"transfer_to_agent_tool":0,"url_context_tool":0,"util":0,"version":0,"vertex_ai_load_profiles_tool":0,"vertex_ai_search_tool":0,"vmaa":0,"workflow":0}})
\ No newline at end of file
@@ -0,0 +1 @@
+window.hierarchyData = "eJyVWktz2zYQ/i86sy0B8Jmb4zgeT5OJRnLbQ8cHmoIl1hSogmTGbib/vQtSlgG+sLhQlvwtvt3FYncB4sdKVlVTrz78ncTESynzSJgmHkkJ9ajvE48kYQgPwjzK0tQjAfxGKfxGI/iLkZh6jKZEgVOPBQF8DWLmMRYDJEhhlJDAKEHgA46CRBqyB28l+VPJ86aoBHD/WAGp+hDZka8+rK72XDQbvi/qRr5uC7Ev+dfr9X1VlTVvVt7quRC71QdCE2/VyhIE8jKra17/tij466E5liDdgUGoqXe/qJF+6X/46a2YH2hafKmy3df8tOF11cqcq1GWuCfgCMaYaYxnXZdYzhDEyGkyHtniPhdfBYxq42/4sWr4Fb3qZmCJw0QieFI2y3Ndiadif2GjYfTGVoiGy6csHxH2IrO0FzlFHRE9HD4XJb+STQH/bbZcfi8AtGDnBNxubBT4GuNtXjsQjtEIvtgfLrsbsS8E32Zi91i9XFc7fvPC87appHXdzUra9YiJrscfos6e+Jcqz0qsAjMiCGYjjD9lTfaY1XzL6xpSE8Lr0xII3kgP6z+5bPjLVYHnnZaw8yZGTG9asX0uyvJOlGrqclmcGlsGmpNBcAdsgtuN1YkvJhrfR5gla3a6gCyjwz8ORbmTXEDlhFToER/KJ6FQ9AhTX4Mwhkoa0AfQA6rqlB6o7DVAIxKXqVoKBZ2SCLSiAShEok4hFmoKwcgQSotuOUPsLlduGGYUa+JADAsm6JW5POI9aIJxmV9NpNEJVCerKRcQwhyYjKnhcfaYaKRBzMhz60xmZclLq1EGEGNYMioo9zIT9ROXMA8b/m/L62YtKzCkRpSUBVmEMtCqDtadow4zIi65gQRq8QWqrw4YPMBBHonjLi+o/w3XoWpf8QrOiGB8Y+Sk8/q+ro4naB8q6azDgixGGaYrc6cCN+v3Bi6KLMlhlDB6rw3PdpUoXxHJcQB1iQ5IxH0ghLHOXbUN39k76XcYwrzQiDVNFtdED/HItAMVUGPdqlkRTZHZE88AijHQ2PB0dXOmeV6otMgGeqbawobBgxbeI1EQdPMaUT2mPvGSNxeOc4hatJqUQTo/okbRhE0xdI21tjxslWYsgWVmxKhv2c7N6gkJNLO+krbZd0d/T0hgmYPASGJfYd8pXx02cDMiiNCHeqJX3bY5rCU/oarsAIsgS8iwm72WfNevVfxKG8m4rjWSUGizExZ3Cw2+TDh/XrEF9+M103xiRt15T9ZkzYJvJpPegiBGjTCcnZqbl/yQiT2XTpNzkXKfnqgvbfCp6fRNBRxd0mrCLbNCCJekhA5dgjxSGGJd6noU+15MoBCktI9P+NTVaIuyuRNoTcZwjOXRaCemOhRZQT+/GzZt1k58XhSjSmKoIvJDJR11mJGxk6tD7FEEzBAvrAgs79xygNnwlB886tMQHoF6hMlDr2E60HDbHo+ZLP5DrdZ3sKtW1Ces18DI6bDlmVBgasurAzFTQfVccF89c6EMcIqEeSmMAoGhgMz+4Ury9f5QtfsDbBdaUYg9Tg+bMEadMDHUaUWeNd0YDv6YlcIoYCzMsyTf3XzXu/PpyDPBuB6JEqNHwtBgRx/EdUK6uKajgtjXeHyfYuCd9aBR4lGapL0yUTLRo0wrtNCf4DR6n2Ognzhp7kf5mIlnh8PmkRCCnoVG7j8Ve67OVBaT/RsIM3zqTw2vzq2OtWV+B2hkDLN0mK0t5pwhLv0DVe9RQemueVBf9LdC/FiIYvFNUIdw4oNZ6qnSMRXKlzrUeZnAJHbsISFmGdrw+gSbT9tC1ZDO3KTfqitnj85HLBN7ASHiNBp1Ieuy3RfCFjg9ymkuYz/waOInHvODflZj4732bVk9ZuWdqBvZdqdldk1mRBB2gx7GScAexPZ2QgOIeXFvHDi8pcp1VRb5a/9eEpNadTzqtgAxdn15K4vm1W6ciUQQkXi4iZm0bL6KoQybWSHKtw+dFsnUHnvTCrHcJZpIhLmU6n61E6AGNm0CWzqbaDpclvhXsGO0iwoxo14cqYsyQbdRZszYIt7y5jw27txqhMdVM8U+Mal4J0xLICaZxeGg9azqonlz6O/8FdF/DiScN2URVWe1NPLUgaV6xJ6ahm46AhIOt8+2d9QXEMJ8s6arULKN/oZxinMoBSxmXkICLwkg2MAqj4U+hQfYzkIWwSNUD3VnKyLggIiBTBQSeKjfYnVnKw4BHEeAS9QAaQQDqM1s4Ps+PEjqBdRnvd+MG01vSlsuHmkwp5drYar0AA0YPEjfLinzzFdbNWS/nTpS6zdINkdPSyDmNDRO+29U0J1kUfO/+OOWZzI/2JhnRDDUTD/qv3nJjqfSGlEaDEMRmhRFo95E2znecRgSI3o+w9ZWdRs2Eh3ntDyitNuaqcDXc29VqYuD2am+lVUrdtCI2DSYEUFYDMttRI2LliEWQxbOvZepMdcbDTCGzpjN7oJkVyxQVykvSAyRsSf7Uom96glgErARNCOCucBpNCtryUu0mSMwhi40bsrJEpnUTCSGKNKX+/t1M0xkjtEIwsQouP0Qm2y/4Y0s+PesxJEOJTAXZY0347fX6+6i2dst4sUVOMBiyEJ9SUwzzbyZRDHNNfFpf/NLle7BO+FuXPvyN5Co68fDVHM2AH+beiSAuC0MDckULZoOS0NSY+un4hznyCEWQ8aSYcwgeiodhyAhxvnHtxMXV+s7BI2JRBBBo2jcs6mbq1Nhvf75DrNR/Pz5P++yGI0="
\ No newline at end of file
@@ -0,0 +1 @@
+window.navigationData = "eJyVnWtz47YVhv/L9mumSTabtMk3rS17NZEsRZKzSTsdD03BMmuKZHlxrXTy3wvwJgI45z3YLzs7Ou95QIC44xD+5//e1eqtfvfTu1lTP1+V6qCyOonS/blQ1buv3hVR/ayNKmtO1deE5K/P9SnVupckO7z76e9/fjXyrvKDmr+puKmTPFtG2bGJjsolkiLEzMz/rvJTEcXGZV8mx6MqfSyt48nzV50pkyMXNRp43xsV1U2p7qKT5z0xif67miigqQ0QklS1ec7qeRbnhyQ7eiBfwvNu8/yYquVy9WtUJlFWuzDXzpOW+XGpXlXqEobfec+1qW23ZUS/FtvKUzZ5msTndVPHuf92LCNglHmdx3lKPcfUxhO2TbZ7SdJ0kaVJpnZxmRT1vCzz0tR/FwnFfBq7ulTRSb/WFcG0jDxj9n42O5oa0jbJfNKu4jSqKqW7AEdhs759b9F003tVY9L7PE8JoC+CTJM4QTE/i36m/pd5mqqD3UGQGcUOYlrz7GjeXpQdHvO3SzfHJsXqxZS26phUdXlmwIM5mLPTryFVq6uNeReV4kqbk4vpMPVgMMn+utVXT6pcpqet+k+jqlo3wlhVFVu2wAOmlsXPeRlUWRglpBfJUSn9SARuMGH/gvIsoI/uND/pKpYqKhMXo8TYlKoAZe4oZFr+mhxUCSoyoULUj1GlmJ5iNEn+uM26Cok2f4tORaqGTNBARyQxybrTGwJ85cbDCIPYVZFnlQqBO0qJvkkb3VPSvM4mEXY6HT0n3KnyNYkVTbI1EpHu0gZLiDfZz06MkNEkab3IhArrixBT92SVnh0dolr1nRqdR1onkOt2+JBqHyMU2W9ESfaGAN+x7w58QOABUxuXUfO3+FkvfFQ7xSMSoYVh7K16KlX1jLpWIEZpXEd19BjQlmgdIs91oZZFmVTqs3rcqaiMn+mqxwghu+tgGd7FiBlJvczzgoNcrIhilmOzsk6edM1hC48QQWaTdYtd8smmVkS5vdq0yw++yrgKSIsrMZu+BhKVXickBKX9HXqm+WOkl1X6mZu2KLihhBFCdrsiXkVFdVvmTXZg1zuMUGajpuAqEG2RrdQpL8/ia2GEIexLpyLSPWkIv/tXZFuyEG63IdAtxXjsVBVC1Qv6jJry2fYQktTb0jpM1p1ot0dWySMeUuNUXvM4Mm7sCO1JEG+p+522C6ro9mDbMelV9Tn5pVENUaauAtKWK77bnBghIz3tmtMpKpM/qEpjmSEnjw5D0+WKyZVIvFVc6Pl63pQxM4YSIpHZ1liAG+0SqR+UpOfzZEFcgSdzjrq7OHIjjmXGnOxo+gstxsM9I8TsvGBWzaMJ+a/0vKDreFZRFh2p2utJBB6dt94Q4Esuq8L2qtod5vf+9JvIFSuV+ddJFeevSo9VXJHROkguVDYrkl2h4k1UViTUlYi8zYItT9sukMq2jwfPNRUgllZEaapSpsZaZshp2xxb/JYZckqVCt2ZJ0G8rYoOeZae2RHTEWDWKa/VsHdPoaZ2TKpqXXHo/E2MkJE3tTpwj3IxygxyB2w0QX9mTibPxajjGaY4GGUIPYQbRuxWBWi25CowLW7KpD5zA5ltxyQ9p2q7S6YmOALM6ua7tdmGktceUA7TGYZ6sh+cWiHFpEu4m5+R3z6qXnw38yv0yl9UZnYSA84xeC1OIU/hyYIjkFg67aekPLXjAA2bKiCtjP6tzOOf9895c3zWq5XGzIhQEUguOD091dJPZeRiWbNalMJ9VkVPaqmXSine72WEkF2mcK/XtiPSr6rU/5sl3Uj3Mcpe2LbISkP4aE/E14QR8Qqb1snkbXTcqrpM1GvELCVo3Reer5tZz2kSt5OYBbte3tEH7Z3aTuL99z+4SejuvI2C4bGDAqLgKfe6aDcV6CRCPOWke33bdxxBQpZOxC6yp5yHGauIaMeNlaqjQ1RHPMuSidCxmwRZvWggjjnchq8M+8DkhsNvVJdtjYBrRaqejkw2axRgkF7mHNpq3m8HMThXJkBhMY5mCOm3cHQPUllD5pRkayDORPmBmjOaRcg4teJBo0SCmYCCqFsb6mVGkzKlTykRegwHADl2NCKO21h3kWhfncBOYiB45kQkAfkpigPF8xMCjPZMXLa0aYLw44llAH7UhuOlFygsHXy07rB0WWYqrrlm6qkkJHMS4iDBQYiPpA9BHCJ/BuIDqe1sB8dtafswYZZjSyAsyew42SmlsyH3qyjtJtbszMhSQNQ0CHqRFQ3D82TBUNBjEjoJ26lAxm0NxrV9ijog2lQiwfIqqYdgg5/VmSU6OowdGuN9mdwkKTeRIHTBWPiCPJ2AbWO8QXleBBCkFwpjEaEZDyVEYBMSstPDiALN2NFAnEr11G0YTNGDkkqEnmeHIk+YchyMEGBCdfhXcTFDCO8f5DqL+QnmVABBXWwMzehs2L0b20E1tyUYZnqrNvoS1CBPJSPbNZ+91+4BRw3C9R9tgCmlpYCohCl1Y8COWaKnO6BjtRQQVeosn6Ka6/gmdoS5jYvp9HQXP6sTnTdSCdFORBJaUzFaiG9Di0BlmwowqO77SVA3XFEYEHV8ngohP9V1W/okaTBKgMvUmC4wR4Nwi8GLBI1WjHBiS8CrZLQIb6JN2vVhNQQzk2RfJkH7aaiMdYUSeBi7ZLKnlNCruDDrDFXKbF8qwftaXKHKTujCscITu0IJ3O+2iM/r6DB2DEdicKMdYtKTtO1hSwQYfKTRLEJQ+V/sAuaymETjACWE4EmwFMytr5Own9XjJjoq+LSeDEOP3KZLZ8LOfawPqhu2BuHGVk6CRitEtNsX88wKq5tCLnaE6SJp2LHtYoaQQmWLQ78o+5zArVJGK+C7rUu49vBUEFmrdP5W5KV2r9DT+jqI3av0U56/0PV1tCJEG+RzGDNDghwNxLV7UlfPKn4BCw1PhZB2YAwoPEqIwV38IV16o1VANKfoMUmT+gyfzJVB6CX8BjFdFUQ22aw6Z7HZlkMdJ6ETsOgJm4DZcxfsgymjAIF20WvQDgShg9g2wIcmtSbo3J57dzu0YL7ry2RoH7aOMurrwrFgEkAJMbjd8p7Fcd4wfaktCYcJp1ucGCdQsQd4vS3APeT8iZYGwENnQbw8IJHg5sTKYSJm9U/zjEV09SP8XQQd5u+g6kOSX/Z2UQullBhtYjyix1R92u83gWkgF5RYHyXFbzNNBRCUz95HaAo8FWAQF8SG6YIXTjJPzXEPKIWpIgTVT1PAhiSpFNGTyDnhaV2lhO6/BBIWg6RSQksnTo4G4qT4PlhJAp2FB8iqdvRu5+9cR+LLMJQLJsTZEbxQkkyAIUoPu6DE2ChBlJzkFJDgoptwgCkiJQwHj+dc5kuMAL6lDykwO04xpLRIDxid837WDR9t27u2Ythqc0fY177C4X3z49++/f69xYzuK1WaSwuscJeBN7WKrCedR/0IfV9juszHKH7xoLQsjN6uhCB4qghitmUFmZYijNkfikGqrQnimlulUki1FEHMYXhjkVOBSGxvLDKrVr8yXUwipamf3WOrHjJaJEYf4WPfJdZBJiaRop50JyBXak4XyEfVmpCEUYVKSIrCyLAaEpIwKqqIvkJidkEI3KFdR6U0End6W4EXJdhhCYlEbc+s+qXVz+rsH2R0ZEYm0vsThrbleKOGbQ1g0e17NEiE1RVYK3UsQiJRuy2kdUnvNXVYSiNxu2vX5N6X030BHzUARhZIR/0LIQmjBvQFrPBLUpCL5ct7h13bQJvSi9vosbZZoplPw7qO1KzsXZhtFVk6F32nPCuPzYl4OkLyBdThK3VAHSQh1DZAcgzs91oyIQmhehPoC42eKZOUjX6BSWx9BHjhjMYQ0n3GlFhrkAj+J1J0t8fpxPnS7fxu/7Cd3y52++3vDx9nu/nD/XZ5wb+a62N15dMTKFpqp/CdBb/ff3rYbOeb7fpqvtuttyTWFQHg1fpu3z3EL/fz3f4BglkxSEDr59vNdqGz9nn+8WE3n22vPlFwUojAvy32D8v1ekPCBiMAPPUNq+rP/w43ebnXA7juxdZZeqawggtI7PZq86AHUp2t7a/z7cO1Lr7F3Wy/WN89LK6ppKADSmi9vl3OH1azze7hdru+v7te3N2SCVBCGcy/QEsAQAvzomdXJiu7sHqHPUBSy/Xs+mG23S9utPeOQtsKCbWar9bb31lOZ5YgpnZvdNNnMYMAgHTrFh7IVgDUUJ66cd8stquuit3c37XF/XA1Wy4f7mYr8mkDXUHiurd7aHuV3/ZUAhMzgLy6n4BdAK/Ul1+Wc5yqKLNvMR9b+dej0Qb88GEKaCPBnZnLBHExh0G8yGWSRYYvE0jy6gqXyF5hQQPZA3iCC0/hCbx3GugyySNBC3QwE5tTknXT6BtzRaV+jKJmsEAOEnlK+u8dP56HCZqZ7i4OVBKsOCyBZVTVg99w/ismRDsJCa6iOn6eXJ5knpJLh9IC/LGNFl5kiReHesG6GojLTHCMukoT89bEV4D0MJl6DG+JSoZsSQSYffZ8U+an+zLhsKRYSKB6MbvE03OsaWaZYhfdcKJdoS6jR8UmMJVgGPMdgUUDXxJ4uIDcf0FW3SYlIUcdxt7GxRiFxhCnEhE2xFLxrEGBUW5MpUWhoipdgH2wgus7qQX456jqTyTJMpuYBUgZ6SHKnAeCrwdtLu8Bkkoq4k8BXLgTM4ZM78C33N178B1H4oL4qTtzSTwBYe91d3HwbncCbF1t5cK8y60IAF+29L3kDMK66YiieJcdOSDuE88pC33j6eD6/m6emVktOQq5GoxLMvNtuBtyZtGmEgwjb2S0WOxVjA6q+6Lo/bqcPeavzIPZmgDcd283aVQ9m08EEHEiw9D21mE9W2ZggxlChl1+mjFYMcK/t9Ji0HdXOhDmOsEpCFwp6MDMgYOpezhzrkpEepfmuTTy4jwX5Nx8ZzGI2+8c911cmtluEaH27IgwkLsHzgKiu+AsoLlgcZam3W12i+w6IbPqqwRkqzTjMABONaG4fyTFx+bpiX4htFJA91+JcLzeDCCn6Pyo15a1+R5gGK7IWQUpRGBVHlV7yx2Nu5gBxFyCWuqU5HGAVgJ0kRdN+gULKaRHyZRNptBszRIAUNmGmaqyzyCFciQI1mTtFyqXxQnJ81QAWaFJcxUwae40zt+PcxHEn5GzIXWpp6fJ07m/+IAkORqAq00UKsVoDdDROb0j372vQsgyOe3VqbhWqQkLsw6UJkhPFYAUaRLoNer+KoyeiXNbio4kANZ2hkwP7GoA7r+6Cps85GVUnvumse57CwqN9CCZP/LD+tHEi+5zN8LhwvZEAOhPJ7RGvbUef0nTU9QbO9cP3/744btvPvz5r/8Dirgtkg=="
\ No newline at end of file
@@ -0,0 +1 @@
+window.searchData = "eJy8vWtz4ziSLvxX3mh/7dNrXuTLfHO73NXedZW9tqt75kxsOGiJtrkliTqk5K6ajfPfXwIgJQLITCRA1NmI3e2yEpkPwWTi8iQS//NTU//V/vS3f/7PT1+r9eKnv539/NO6WJU//e2ni9327bIpF+V6WxXLx++bsv3p5592zbL7rVzvVu2/ARK/vG1Xy05svizatmvwt59++r8/D7qTk4Pyu+un/7j6B1PhUbGpnr6W33XFP/+0KZpOFMEK2v398fGOa/Rtu91Mt3h78eXx95Rrsy66X9IIVu+uPj9df3i6vP38+erykW1+U66fqsXTvF6vy/l2Oo6Hq/s/ri+vni4uL2+/fGbjaMvmvZqXT8V8Xu/WoTgOvnxZL8qrb+V8t63q9U2xft0Vr6UBBpTh+vO/X/xx8XB5f31nPiKu9ei/i/einTfVBn8+GDeI4O72z6v7h9+vbm74CDb1X2XTvpXLZRQE/3j8/fazh/Xv27d6HcOy52NHe+LHf9xd+b71rXDSaG/9y+eHu6vL69+urz7wIezW7aacVy9VuYiB4c/rzx9u/3x4uvzkgeGvTks38jzNV+EYxt/3elt+217Wq00xF9KPTfX6WjYWHliMPWq9dsCEkqZeLmXnsbUfFaLtfNwWe2jkUWBEu23tB0M1iGH7U7HeFUsv66uhSbD9wzu/eu8aiZBvINj/nf1WLx+v/7h+NCcjup4jAei92uJzkAMe0Mrlxc1NNxx/uKLNzIvlsht+F2Wwnc7E0/3Vw5cbMyiZljojT03Z7pZ4JHLa+vx4ZY3qlp3upRJjuMPG1f397T1toWyaugnV/9v15+tu/DBDl2HipVpX3bCBf7YOK93I+OXj746e6obD3etbcE893t52HnZhjYSmlbruPKwgRkCWndvPv13ff7p4vLaGfNBevX6pmlUhPupJdjmeLS0GePYhtvxWFttdU34W/9JNjX7hxpe7+9uPHeyH6z+unh4euv99vL+6+HT9+aND9dGmqV+7x2ir9/Kps/DUbpuyWFXrV/SpxriJ53rY2tPf8U/cJ7v6+93V/fWnLgRcmE5nqTsqv23Kplp1QIkRQAMIz/UeL369MYOoba3dFs9LPIi67fx5bS4UbSN/VfgCEbEwehfVsrxUsfFq3QVj9V41g7YE9838evFwdZIz9R09F20ppZFHAZDCs9HH3864Nnfbl7NAi4c+/FjXr8vy5ubTH0VTFXKQGRs3f+b23ser7vO8frq4u+YoPHotu4+yeio2FfpAFlDQ7h9X949Xf3+64Jl9L5tutvRUBFk99OFN/XpTvpfmRG74M7fPPlz9+sWMaJqOo0X5vMND1x4Gexaga6cnAbT268+/3ZLKq/ULPmumdf95cW8OkLruv4oGHxIB3Yc3dyu2Pz42BTgN1n9kz4W/dDOV++v/Lcd1aLoKqBVrire6qf4lR3d68mpAhmeVN9fdiPJ0eX/1ofv/1xc3DwwM82XVWXia7zeD2kkYrj/d3VxfXpsTDchytdosq3mFTzU49u4uHh7+vL03Z6GQvU1n46+6waeiqL2D59zVHeTvt7tuQWrNcLTf2H5zc3P7p1PRUTfrrP9CgeuosBWHmHa6LfUTzim2Ou8z14SAoc7d8DUhZmX0Jpp6W8/rJfAFj39iv4f04unio70ms3QdFWnxJPckcPBjaPDb+PLweGu9DMvUfNdua+JVOO2IfbYnfKvLtig22Z4421yI7cP7ud+tH75Wy+X1elmtywe5cXclhppLFebGOEhZ7hscL6y61c6/X10+Wg/sNnQ0XnB1a6H/Ludbohvop0Tm/leXXyRIaGxmICyHnb0neugOwPbpulttff74dHPx+eOX7nPwB7equmXX+vVpeeAKoqNTO8dP8CaKB0a1m/zk2mcJQPr5Vk4BntS7DnnJ61rOB57Uy47wlg9f5sOwGv5kf4nab+w10/UHc+Jt6zl6rhb4hFvHhPTpZ9MfASvreo37HMPKwwPDSKfa30Z6Nh5s5I741eHlKou9yn8zBcg3MUvSvebOl9tts5uzlR7pLRC20MR7MJ4e54fnmhfrebl8LNqvXOOywVY1mGZbfSgl0/BB2tuq9iLF3na5f+WPdb20AdgycV4nopf3RgHgo0c8TvM9BrV5xje/l59seQs6EmaX9iLa6viV9lM7w6r4a5zXttfEe1ESDtJB/xS7VWra+vRw/fHzxeOX+6unh398+vX25r8oy2LfSk1in9rqdS033J7a76vnWn++bbv4X1X7v6r1W9lUah7ERHZz8ykE2HK54uBi4yhetmWj2MduCfVczAGHOliX0opvPEhH6A2pV4wHSzaKlZAGUfhZFZ7ONir2/6fZfC5f6qZkd7gS/wE9rhSzu1yJR+hzpYjb6Up6eq/P93y/K+AsSueE0mGpWx29OoKakrDe4qZbMsrV1P8X/FoXfQaIIsNQDLpYBHdaVK3cgXlsinX7Ir6qO9WOAtG32fZttvVmaBPQ8QCCsmxaTwB9kwD73W9daNwO5MKl0w+GBv3qCnALvu1l/Vx0Cxw1WDrevRKuNOEAm9V6vtwthscl+7kXnR9Eg+xtdtuH+Vu5KmhbnVg7iAXZYfXi5P6TsZSyMAgE6F6P2WVAdf97hO++3m27/v4PmUCLmlNCZJat24b71Su5Ke9eSbkmuEdKzN7iDO7Fpvw/u7Ld3jX1vGzbmo5avfBmLBzwrE3Zbrrpdck1qqSnWm13z/J30lgnVAxCEXpXTB9Ie4MA73nSkzTJRwN+sa7XVTc9ubDmsKTRfTt7NhsJy3iS5QFlPNuajuRXe57JwwLMOGOh8e8Yex46Hcsn1wCwl/QbCQx7TV27I5oQmhbPjG2u5fJmubpov6/n9BMuu/9ZFb0cPiH2sNz32UefKdG+VfjcCEbhaz+e5UdX0NtLekY/zdpSbSbjRpbmbnO4T3XL4G15vX6v55J66jN6SeuySbVvMt83ibT00gC+dH9yfmhCKOKHJtQ99EOqy+wwqsax/FasF8vywmv3SLXh7SFFeCHK3K9+Gy6qEXPbJQLIZre+WC9+l1averYSD9O7dSeoINrUZnDQFBhcoVqYxsJ02FMLbderDTkEDlYrJRfnWW+qdzJodSJLJRLnSYU9xoMKm5Oe09qkP5wn0Y8/YE6Gy8fb2HfY4G/5Ew+HrQOMkzteuA6Np2LSRzUlENpXQ+OomNq3erdcXE5BplTEw2e59tX6VZD5XSR8rr9dOnd3UfF4jk2b4Ps1/mQkx6VlU3ApJQdmSYJpSRYTyTDvZysOre7Ltt41c/3khM/TSF2llGl6XdY+2HTEort+Xdbzrx/KZbXqegHbV3H6y6J8FnoWYz0/sq/lhOK+3DbfL7bbcrXB9mgcwKWaRqgpDmp+KO4h2+tensuZ2O97beqUz/+z3q83287Qv8oPxbYQZxSCwA9KFp2Sl2rpOYXxxtwq0clfZq/nB36V7bZbCL7skCmYC96hceTehPJztOxPf88tySR5fu+ZA+59+Vp1Axiyzz/8Gm841TTyR889TMQRlv1WAMfoSHaCxW7qLlJkrxcck71whefTYjY1V3ot1ZbftTpc4jTbycvRkTyMwra82779XhYLNALbtrsWb/sW06xfqvoi3Wv70lRM+/N9m12DZ2ByEVytF5u6wvZjLOPlQXya3U/zzUPZvGMLHMvwar5pB/nJluV2Y8l95s70dt9gom2xN46PPLZpIe8eYRiW78tVtygf8iCZ5hvZqEgLeyvOG8Oy+5Ui04xo1v03wKoFWR1cnG24HDWYaHvv5mzje0efaH1VfO1WIZJ85ZgW4s1e3HMEwYbfh2r9uiw/Xd6xPjhTOv7wDFrwH66txyLXuuK4/sMVO3GSxioXuX00mri89X2aQqsxFQJeaJiPNUTsa6FbJl04QiuOrB1aR0R1GKvviqZYOYIA6p69js2gIyLCRffBV+uiX5HKFY1r8gfDHCkalkbciSEXq5p13TX1e7VwTRxgkErD5qAhIrpNU75U30JQ7Vv+wK9XxIxupb4N6zfR+mVoHRelSdG2QR/w0HDa+zQnTQQtTcPp2jKIal9EVSsEHsrlQK544+p+kv9c2scg/UlCX/h9NtbNcsWal2DfilSyXK6g2UqUz8aczcDHgIZf4s1SPI/87KFhsw91XkNWC2LOPQ4I5NxbTjQ8T26QiPbzIX9A+4nPxFkPhc+Zjn6AE5ySTtmv2pt6/Xq/W6/HNXAQBFW77ISbvXAkDHgy7sG0f0KuYdFI+io2lVm3BnPLTfW+l5xgfxyWnrpg/aHslDXEXtsBghBfaOL8ryEkHB4sTwx9FBY6p+IAAcyrcPqXFVD7EwyHR9+n9SIA8AYRw6/DiEdUJp4v7AW4oDHfCwuX9rrW87e64WRkIIJxXg+lnPdasOfwTXRwIHFkEHiicKQ2kFiYOQ1uRJo7bKrXsuzcxwYz/BLnhWvaeG94D42cfHy6/XB1g885dLtyziG3YL2nGk40fWk1Lzx9fbUfgwg54aMjsHO7J9ncteX1WuRXyu2N9mIDcCA6gK5FNWphlpqbhEbVkSucGEZyocsnF5R2t9nUnZWFJAyAJaiOaC++GsT5H4k9F/u1mH8t18D6UjfaST7vJcNfgW3/UpYwY5ifD4LRrIusxgsuAiH8I1H8UTYtOCEFYbzvpYPf/bb7rLofXlE+VDc8iENk6OTPwRiOh2sYXOMEfVuDy86rfioWmZGZQVk7GOuYhrkRbH/fbje3cmXpfAOdtLico95L4y/AF4VIA/ZDIvzwh6BZFd+fu+9h00WaL23ZXO7rO9FDlWhVyFbdoNFAVaG8Q7Q2FdoACDaRpj8bn4nPBt8Burvj7LQM5rre8tjtwe3CewiDFZrOxrVulrvXCvTEXvFBwFu3SJ9bFc/Vstp+x87CD2bGsq5j8IRF/KDb3hB4zI3QP3ZPkdYiT14A7nX4LY67Gvp4bjsC6IjGQhTdIjFtD40Eo+fks/0wgCk6lH0yP4dje6seXR1m5tjeqsfeNwi23cm25cV68bAVx5G8UMim3R9a0XQCHtOd75rDeW4QxVggmmNbStnereH13vYBTbu3eXC7dncqEhRPlQSEInYroNijaw3s+BeEs8Uoiq6VmyH2QNHI370gjJoE2R+/7F+LtoRHmv0vUV6rro31Lg/QyE0bbuExAwG3KpoXIkYFMgOG4wSpl3VOPS6zFxyHQ73sI/Wi7FfvqhnlZZXi5QzTGC/nZQ+cvxqGyFms08KGKN1iGNog5Vu87OGFTAxrcDETly12EQfDmnuGC1pzH+o3HdI62O9ng3mY37QacKDfCxd+ht9AAp/j97aFnt0HzIHn970sss/sG9aDzu0HIOMc1Qeh+R7X98KGzijNT881lWRbAg+LI9a8ToxzEICn423j1gn5EDvMB/U+GQ9Gb2MCRx4aNgWiTefCDgZbeKMeBYZx+R7+DcHLOSyL9Rp9PDYEDeMALAzGceQ1CAv7UCsCiXWMNQSZ86AqDIg8mhqCAz3SCdsHD3Ey7bKPaVLvgj6YST21EbiuvhVdLCzRZTggEy18QXrZEcwETgaxq79ffLq7uXq6u7/94/rDFTeOgQBlKCvVL0/DRoRfNMOxW8f/lCT8oYLwxCHAQ6Og/jNcBMon6f8ezRW8ckkGUBMySTSbdB6Jh2U4R0OzRVffc+h3pR1olrhJB7ZNT9pZs+pDOjtQcBhm03dIftlhg8Uuawa9uGWHdSaLqjuTm0N1eJf9qTszPhG5mKEgPL8Te4iQ1Vh4NqcbBdjxRgldHJQhGLfrIeV+fW8+R3Dng1D4vY/jMLv/TlLTIBD1U7QuHqljd2qPznc3dGzKuR1q2dBeFXNXfWzRc1udYV9PgsU2my0M/bbefNxsEg76mgsQA++qC6b9+93az3r3xcSyTV61ARpnXbfhts5lVsb2fakVDgJ/J1TtYnoh57YVGEUsP1TafBxRtYjjiYxbX2DzUX3xcNaT7wWH053TPKBeX737fAn1unyP8xXUa+l36spDvnnpeHJnKwoG0fe+EETfx0Mg5uifumlFF108MIhZ+kq1CkNhTlweOmWdK4kaJtUcngboItEmMoBa9oTGQI0NOHJhIx2djUC1Kd9dyyAeAsUQ9rL8XpCt2n2rqSjEl+OPQrWKh+K13N42l0Ed0jXtvrrIvdIpDcARz76oBdRLwlsiEALRqD00CsBgBgDw8PvwQ7SP3e/o+x4XuUHHPGeum5dbdX7H3l1oXNkr7kPlPtboM+S6PfwIuY9FdH1IHBh36OefD9ftIMfDXdZ8ToPrBrmHwV1W3WfBdbv0UXAfy+QmicfBb8hLgFACFQEb/RY1oHgV+BoDdIYVXjkvC8c+uDiLd3kiQ0oPWQCAQkOelogyQpY1pGiQ2yKjJJD9jskCQAw7aLkfy5SzuA/DmqOUj2XTo3CPJxJ+6GHW4GF41Dgw7DoPuV7T+S22TJxAgejlBQwAeNxEFwydDCORCt17PcWX65vHp+vPEZ9E/PBUrYMzd/joWck7uD+El7f3wMhJ6cEgTihk74OQn+iDAp1cst4Drzv9B4MZXJzeAx2eFISh8i7uTqPhpwrRb9ORLcTHwBiMMCQegxL9hkaD02U3DtTLajGQ9t/gWnCwWJQhilDNGqWQJ4ixcKagMZfRlOf6IacW2RTQkDpufsjoBTmFLazCmx86cPFOgbKW8pOw8Bf6FKaAqnBuZD6bAhQ47haBHyJ3oKQwhVeS80OJbi5Q4JxbDW4P10O4yFlyZh0hcrGCOKqbG8XBhwjodhwIp98dKKyOBw5J9X+P17HfPHZ5BlDY4c7nutk+iBELHOQPtqRgOwgG2ZIc0sUcrq6iGZOSxdyuquJh7WW3lgoElwjU99bsDbKCQSRKeDssVs7jcppR1jE5LCRROMQsRJb0aFZo8D7AkAy+Ls19enMs47xa/7dqWhHJJ5+RQXxkR4j5Dt205cMLc/nTQbICd67C7Pc0l8t4LxbVsliEOaz2IoFvdUck6Gp2Qiobsay7ulXITOtTn0onmmlulROHTXkfTbOtXrpv0PGVystoRqJh9upiMdhzmOski4NkkLV+XscPfH2D0NgH2cbvCgEtuy8Gcdhti/eS18NCcmoPt52G+dunclUDtVOMECQkV4MkezS1J1P7+qy86SzRIOb0izbiMy/Dny9opuuExpvy8nBpr2vvy1ff5m/F+hW5LB2RI18ObOe+fOkC4htRzoeQjeMMDv08PyAeCB879rL+oOQlZ4fW0VChNX+ciJylf3hoxm4idr+f3cl8sFgU5yBUs/wCeYKAxD4KCSe5zw8JneBH9gornc0PDZ3oR6HhJfv5oWEk/FGQHEl/1GzUG2cgvrj9Va0rP3fuG8SwTSYjUhhYCYlOLONgdiXKf2+aqi3/LJ8f5NQKJGUQuSjhjNLNimfYQ8TgZUhwEYgZT+wUM0NCDaFmPLHR3AyJLoyc8cQHsjMkLK89HjcaPj9DogogaBjYfBgaEh5F0UTE6OZsSJR8gtsTF7qIIuE4104MXx+HdVUuAg7lh9/ihG9DHy9kjwBGCdMmiBih2Y2RDMcmpKAQ7MZQYkVHLADOSiMMa44gb5oMDOxuHHAwN837BXDQqkfQNq2HBGoYg1dwNmEEB2Q3FkYQNtF4BF63fTzYmmbdARb2OS2oVtubut4gUfXwY6SwaihkxtURxjiB1YQRJbK6UdKh1QQVFlvdKFzhzsQRGu/cSJCAZwLwjHigXZ+QZ9oPinkwCr+gZwLhZgpxrHPCnGk/PCuIg4gIfCYQRuSDvW8U+kS270AGYRuegEyUQIjpZcVDCDi5n4dSXigM1c5JgHkgEQRuL4ndWoWiEXxu/3fXHVYeiMb07n+U3+25JopnzPZ+VS2jouk7KBDR+6F1FFRhaKKioIhxHAWHJPdAQZLHKAoWkUyj0IJWn3kFztfGP8YJU6ZCXnwaY4wxX7NhRJivsVD+9uXz5eP17edwpEOqnOeRcQ46ajZpAwmZTXJQ0LNJG0fYbJKDBJxN2gC8ZpOIXf5s0rYfMJvEUPjMJm0g3Nkkx7p7NmnbD59NchChs0kbiHM2iXnfKDB/vLx7+Fotl2h2hSkQJUCDSllB2sJLcJtCjmlacJq9+DS7KiVKitozD9i2atIOTbzta69z3rrWBrZInFcKq+W9VBt12MIAA8FcF/BxMJYFGBaPVQEfj3NRgKFhrwnCsKCTcA4e51zcD1MQlpgYqOUAioGzGuBjIBcDGAbWWoDEoIUoede7bVz+OU4oOqjihR+FiJzy00XRxxblHD/oJnsHjo9Xn64/X3sgeZX/zavPTtuGy7OPbdnV2cOfdNeW14Ji7c+QXGxIbxEZ+9VIvNjgd5PSdrtvXdwAQFsbCVnPClYqoW26CtOPTXPr0lsW7Wn/r/v77XFzndjzXizYEnLjvGEIuGrexw59u/3YFn61fYA9dOi3DTqHeodF11UCY5PRrq+3QXFuFjDCL3mxAG2Bda+AHvE8rhVw2Sbvq9etBl1W77TvuqnewBB6TT2Ng3m7gjYWTLug3g6Y49nDsn4ultf9oN49J1KAHpGLM78gdPMmHMhD+GwQkSC89orcaHwr2pPYePcXRkOqH3QBo7UT7ZwsQR4bMV2e3I0WL1UeGylVxtyNEytpHhul2P2aAFMenP7BODk1+kmkzJs342Gd+FlxSvtHxzzhw/K5BCAIW/CnRF8PEL0Pwz8mx0UCPwQpfssAEyp85UBErK77CEic1OUEUTEybi5wAHVcYxAVrXjzk8CKN///CCvnNgQHWtfVCNPwapPvun5dlp+KTfuxqXfrRbfGBAl9RC7O5JvQzZt8Iw8Rg/EnwUUg/z2xU0w7CTWEdPfERvPvJLowKt4TH7zoomD5LbqcaPhcPYkqgLZnYPNh8El4oQnxnhjdPD+Jkp8o74kLZftJOE7in+HrVlgnTpyaAhEDecgZUwtvvND9A06VctG6g3WMc6RcNJzwHOfkKBcREZAnnRUl7PuG4AinQyk0/kE31nlQLipumA0/AcpF4gis3mc+KS8dhdLrtaqb5ErCQeSiBFZKNyu+Yg8RlpNDwmEm5ngiYmTnkKg8UnQ8kTnzdEhc7GSdCajQLBk2MmfKTAC6cFTR0VBZPDQaTiqPJxoyn4dEw0rqcaOBgt+hjpMr/FmSUQMgrN0rBNqPQrgFURfQAUm0ZpQJ9EYlXnI4KtE6EirITdT/dbmIJhXVPWzNXq6hw8cIqMXiQdX+eayRiooEnK51q1pva0eVRS9UZIVHAg+r3qMLCeQKd/Wymn+/Wr9Wa9wTxkJRHcFS7OUHGnakw8v3YrmDauviEEZNguxD3SyWc0DlPv3nqF07UunVqT1SbGF//+Xz5yvOBU0Qjkb+d/iCnodRcrEsPINkVOubzWdovQza32y8FsxMBMwVkIZkKEW8bxMT0Zw9LdG8dt/qx6BasUbBMSLV4seg2Uj651Ox7pyS91WrFqt9i5hoxEVaq+K5Wlbb77Lgs70TBX7go2bzoVlMXC1dbhTC1DeJ9tZ4mx1I+LO3OqJguNq8lauyISaaBo5y1GDq+wGGuwfea3qwqzvGGv4A1V7D4AOrhiVVFZZCwqkK64eErgpL9gqrKqwfGroqLIWGVxXWDw2jKiwFaUJVWG+cgfji9hdZmZVCwqrM6sSiB5TD8RJngXpKOFJwcRhghhjimfzHGRck5wY7E4/+WlwX8VgSkV4ApJXZ6yZkbPpMXNiE2Odc3cS3372J9/Jh2wWcVc8eQ18hDES2bYe225q6UpqPCFlQwRCsNVWYTeciBrZOrGOCcDw3xXr+xjW/l55olbNggr8Ecs0UhKWbqBxkuThKkfkwajQRA3kxFAIBvSIqCIFrsQhCwNeLQRhcS0QQA75KDMLQjSboehC0L/Kj7ZVgkO0WnRyBlt2TIj+7ni+fWHcGodh2sWWfdXJZzN/YSLSW877lRDTUdWIIDOxEGte+lROCbbTBIwOw1xZoGbnMjHjswAhk3NXQBfdV1+hmuRIJy5f1jt/3+8bL5UqkKs/7xgFeMJoG3oiFgqyeAiav6T9HmQACKlmzPwNpjLQ1CEqEpDUeUiplDQIWkrDGQ0Knq0FYwpLVeGjAVDUIhNe+O2qbn6YGYQhIUsOR+KSoQWC4tb14CNzpaBCG8PpePFToKhoC41w34x6phcj3su+C/9yVO8g5dYFIYRJQygyUBl6kK/8p++Za7Bx06qDoCCGQjaq+0WQM82UNXOyJPHsvO81i940w7SnJadZaqE4IbK6laoX42BO3R79X2+9XXqaLvlVsFA8itS0AR9u3m44Em+PiGFxTXB/r92Wx3FbgkIaZbw5NvO1rgevmE1qZcPRbnHBl6ONFqhFApAvX5V/dCOQ218ktpVywJfRuRsuW8y5GlrW2Xr4DXmEbGwR9bGlusFw97FarbpryL+jpxr/GcQVLI88ZNJjYFzVIcKyOhf1sat03yllFFkmmRJxuBLXyutKCHGW1BAOKsWDi4iXXTDC8oGUTF49j5QQjClw8cTHB6ycYit8SikDgsYqCkYQspCg8XmspGBJ7OcXFwVhRwUj4J3zYWPB1FAzBvZSi/NMIp5/mm/tuWNs1c/hmN0AmWkiF9LKDqgk8VlgFQUUKrEzMrtAKQgwNrkxM7vAKogoPsExcaIgF4XgHWRyFX5gF0QQGWgKTb6gFYfkEWyYWXrgF0fgFXCYeMuSCMFhBl/BZM+xKLhOPuPuf4wVbXSU/zh6QRguxBpRY0dWJ1BlYDWDBMdWJhBFODSwTIqkTDR5EDRD+8ROy7Rk6DQyhURNE4h0wDTBesdKJgBkmDQyeEdKJgg6OhnFeXAQ90AiJ/bUQjrmoJRUtQMKa2XHShh8rXCLAIkVNNm5X8ERghsZQNi53KEWQhUdUNjY0sCKQvOMrhcQvzCKIAqMtics36CLQfGIvGw8vBCOI/CIxGxMZkBEorLhM+jEUnumwHD8cB4bh+OH3x4TdyeE2UpiNEF6jhdXwcDo1jE4Pn3HCZpRwOSFMRgqPURJROJjc4TEkLJLh8PW1822kYr/2a6RwaGpkhsMxTL9PyjLo+UnBln3r7wM4HFX3w1C4i4BjSMIrf/PR0eW+MWS8Gt98FFRhbwwDVs07DIH4Ir0hiJE6DgZObXsAhauifSCOIJedWq3eA5+30/pUpvfA4em2dBX6QAy+juuoMD8BBV5HnoThXz2ehctVMx7ARFWKD7DPqAcPgnBUgQ9AIt5OABDxdqLi4NRxB5G4qrezZibaJGu/6iAvXUfkIk28cN3MKRj8EHHWpgS4KKtUP+y+d7WT+D2ubY/4DPSam4Abtvr2wuZahxPoQlfkXviQhQQBy3NJ4ULjs14nUAWt3J3Y/NbwBDz+at4LE2ddT6CassL3wkms9Ql43qWCGL6vDVX15gI81b//JdJwNNbGHIAGaOSQc/Hx6vMjK2ZrCOQoI5c2U0K0C+HN7e1dKMJl908OQi9ErJ0LDcaEuwKdaHjrUv29TbhlzYlnDh9ot50XqWfGu9LVCYMeyzUsYaO3w/6q+KbOc4F1fwwEnXA1Fg50TGQM1kx5jroOi0qSE/yOlKhfkUin/Xb3LH939nAnWAyC4baNOUZT17xnF4LTn9w8rgfUmDW/sl4olk1ZtstdrshEIZsdKojM980ifvwa0JfuT6wXIwQjvxih8qF3S475wTPjIXgr1otleeE9Sql2vLEq0otSJn/1H8JUQ+ZAFgksMfnUv3b/6SbT8vVqA+2AgNYrJYt3hi8CcdSRYXxZvUcMOb1d5oML25Ofezy1/3R596Aqz2CFgiyJKFN9WCtrym9Dpg58PyBVgDAAok3rKAXER0BWkcQgsCpssjGIO1ZUjTisRiOCQ1yuogrEuWo0UlgMZwO3OPu/x3Isvy3MAVSMLUvNeIQtSgc2agmgQQlZADhs09t1mvWw7TmHfXApoJn1WgjY1vjbbZrVgO01wLbPdppmnrt95rDp3i7TrIZvjzlwoDMSzbwz6QXwJTsstUC1jsNPMYPToM4nPgl0zhD1cMXZQjJR7ANV95fJsYrAuWnKl+qbE85eLJZd8Wi/VUuo3oJpW4i+DKIT7DMKz1i+QJaccVvpPvwh0/V6/VI77XXyTS9fKfkJlqUEx+S2pmrMum1V7YHmL+2aM6bFqj3Q++UCeqe8pZMbmChmPfS/uyeEdDOSDu0OdpwefV0TQzWBppu4LoY+cAIRws1B2Cf4jWL37cVu+5YebrS6+jbvVs7QOgaVjBLZae2sQI8/CtLdZS/gC2bULhyJ/RI+VO28fi+b79hKEhaL2P2gao++t54A6fhFLycaiTKvIqNkWyyKbeEFbFBTdCKtVLM6qImJc/gmJ6EcvtXpGDXX2ZTri031sCnnd0XTQl5jSsRxGFArz1csyFhwFr9yLQ/C/jat7ry7xqaz+s/xOlJXye/FA9JIU1sITZzpLQ8vMsWFYHlOc3n2iakuhCFguoviYEx5QV8hp708a+gEFDLonITybDomopDlWJNRHkD31BD2ytDpIe6genxSGxN4sB//HitCWTq5IUoDi3vfB2IjDjQvd2ngPbkwBEMWz2doWwyDMCQhWjtlYRj+va3XD/O3cgVMMBAE/901aYcmU+13At1/d8EMDASg/c24ia/9sWML28tluYRZUe3XKE5ta2S5tA4zSsoUgCRG2hQP6d3F/cXNzdXNFLSb/k++aVQshIxUKgDShHQqFipOShX0XiekVbFwIalVsLNPSq9iwaH4FQBTCMvCwgFyHQAAL8aDZZlKf4I/pdI3BYqFA0+DAlD4p0JhGNjpUAAK/5QoFIU7LQr6QrxSo3i2melREJrYKVIswHiaFADRP1WKjQFNl0JgeKdMsZCw06YAVPFTpzwgc9KnUMxRU6hYoFHSEooSvqlUXgjArCIChVdqERcJmFYFg/BKrfKx79ER3ilW6AA2Xh6Qd7Fpv8ZZHlgaecsDDSax0oIrQwBWxRprEJ5gcyiDzzc8tIhivfucGFETANF9V/x6Dl5Y3OfjCTz0CflgTPSZeAIP71S8FxbqXDyBhHMy3gsHeTaeAMI6Hc9FwhpAQSw+1R380IQ6MKfGQziqEBf2qezgh8bfifn1HfyQBLixR5UHfyx4oQcXGLjWQwiaW0d5BxgJt8IDHwWjyAMGxaPOAx+Pu9QDBodf7YGPhlPwAcPjU/MBQ6RNA5tySRfHtiTiTAdBrbwpoQU5RqI0AihCyjQbL7m5B8ML2uDj4qETqhFEYanVbEzwxiMMxW/zkUDAT7xGkASkYJN4fJKxEUhUWnYUXG62F0HGL+nKxoLvf8AQnOnbpL+Owut9WSzq9fI7ti9p/B4ltEI6WYHVBIuFBeduK4iA3mnl4TA/RLEIAPllEIEUJ5lltuXDwwD3aDsen7hLm22/VYebuMZ78SiWt8WW2d+D6ESL1E3toF3OPe1e1rnd7Lgpnfi+tJCxqrflRXoB78/rP0cKGJZKZrzQkEbh7iEsMch7HlYGNw4BnECO83Bx2HGw5ybQ4zxkCD+OuNQkgpwHiJpEQ6hCZtA8JOBUFYLgNU/l2aZYcghCCE3OQ4Lz5BAOf6IcRcFmyiEc/lQ5jsPNlYNfixdZzrTOZMtBPLHpch5knC+HQPoT5nwUKGOOAfGmzHlY2Jw5hCs+ae4DmrPpj6OOSpvzYKPrRjBm+BLnfhhAwpjC4UUZs7GA3DkCw4s890Lg0xne9Dk+sGnT9HZ7sanALdPRb5Em6Lo+5uz8ADDGBqkFIsLWKAMjPZ8zIIVN5pwY6I1QC0XYFigDBzKjNMx7Tichq/wNT8t6wFYngsFnk9OCwa06wbCt1i2dd4tThIcjqKyvVDUUxynn44ZxsMiTDQyH0HC0Q6PpGA598R/ldw8Yh674KtsFI3FvMVsgwk8TMfAQ0wUDhnODGYkG4wGo3nUIkSnp4bc4A5ChjzcAjQDG2RsyUUTZGGKgvL/98nj1IRxnI//ge5qDgYyzX2WCmbJZ5UbE2qmy3uOUbSo3JmyPCnDqaRtUbijkbMbEEzSbcWOAZxGmcb9ZhNsquSNlGg/ajnJjIPaiTAQBG1Ggff4ulB00vLegYASM/SfrS7A2n3ztcHeaLMvRt5ncYIk9JhNewAYTzz6+uwRB8N9acqPg7yuZiH7AphIXLmtHCcYbdzvJDRifHFpfvvdGEt86vHGCIfDbNmGhgPePAAB+m0ds2+wO8N82ggcga8reLVcQAN0vEafrgzaPybqARk7VP91+uLpxTHz3duX0XOZzhk3KCTRSq8v+IBTJZrvbbOqmk5HZrdgcYm99L74axMNxGLOIbdMFq2r9+ntZLKDaAgaSQfxtLz4pyhnQjK2BdaeG4ZC9GN8ZjQM/a1ECoezTQqi4ujc6tOkzQxzLbxeCVfH9ubzYbMr14guVn2J4pGhVyFZYkoq3i47jy67rVyAcyD/HiSwHVbywohChC+svnz9f3XOW1CO7jfxvj3U0iaGAZ10je/ZMy0P7ZgPnp431bzZ0UhptodlWL8V8K6q+VUCRQ81SL9vuZUMsHrbvODYP0tOsrmSqJceikpxmbUOejhxbU5KrvWSItaZsd6viuVpWW5EcBm5WjD+AkTiwZ8G326q0QE6n9qLevcqcAuuftyM2u2xcbcQWdwNt0et2ypEgt//0cCvvLb/u5orr8kHu1cB8ICIYKyTjyrlBGn6OKLQhCS8Gh+iJntyCI8EG7cd5onNQjSS+QN7REyG8fUgC89tLdOPxoCdJXCFcJQOdF3FJAmSzmJ6oGMQZiWsCi+aJlBoyCICcQcTp9UCoZwT5HxTepwT2HxTSf2AwjxPGYwbwWKE7btCeGK6jBOpIITpicI4XlqcG5JihOH4QjhB+gwOvM+Q+lEUzf5OyLRhwTYEo4RZUygq2Ft4YoRaGEyHQctFSYRYGFxJkuWjoEAvjCQuwXERgeIWBeAVXwj4/tMI4AgIrhcYnrMKAuEGVi8IdUmEc4QGViwwNpzAgZzClvFQLpfNdh/k7UqtK/zlSGLVUMoOohtTvo7NNen5yiG3tFTJSriAkE7KuPHC5Kxih2OjyRZHw0bWMUGx4IaNIuKiqRigqrKRRJExkfSMUFFrcaDoqTmofhGtKdp8PsjDn5xTvioXQ3/1dhbxiIfP9AOiiXrFQeX8CHgW+fHHg5b1oIHBxr+k9VDtKfUGoqEJfMRAxyn7BsBxFv2Jgc5cAg6HRBcBiIOOUA4OxuYqBBaHTJ47dPFiSt3ByovF7pKmjrZM5d9TBRjlzAKKJce6Ai/bh6j+/dFCvL/g3SoCY2/0ffc8hMJGyJsYAsEkzYxYy3sQFes+TZi4sbMjZBOwjmHQ+gQmJ3vIBcIXt+LCwICs9AITnUo9lnTqzAIIIObfAxIKfXYA/d+/zCzgO9hkGEIn/OQYCifssA/zleBXT4NpnnnGAEcU+58AEjZ91AGH6n3fwwIGeeUCheJ97YKJhn30AkcU//+AFm3MGgsAd9RwEEzixDwpFEN/zEJ4owCMBJBKvcwF8NODZCAyI1/kIPwxeHeJ9ToIY8LSlh8pNFDUEL50Zp6R0pGWJywJzkUI9FvJaRKlRovAAA5rQwKhAEISuLd7LaeiEhojoNDcS3MhwA6gFbfRjHCcxFfJ8YozRyRrzrh22kcS5dJiDtVgsKjGnKZQgA9uhxbamLsLlWJ/Xi/LqWznfcV/QoiwP4uF2kYuWbYue1yxzbKurZRq7CIdtfSQa/qytZBwZ1vaC4baERyAXSNv2hLDn9dEIBsbl0YAzkVdHcyy9ltvb5rdy27O6DJtdi7p5ES3avsUk6x5mo9jjhgjnJdkce44rsm2rsS7I5oBjpC0AsYRbKx371MZjJVjaWf41zui418QbFiUcJCpc3N093d1f/Xb9d8pMsdk8AeGWbeXx6hPHzLZcTbPz5eHqnmFH7Pf72jG/N0q/+jlA71sBfMIHvernML0fyuXWvr1bV77oZQIsgNPCg/I2tEe29X05rxsgxozcRhLPDV4wnLSw2yzoz/VoL8H0yFEoeCxaexNB/DFKINgrYsUBiQX5cNTMrXhe2h1xMKIJ+dvoYuyqAob/g4GDBEu7PrUo1nPgKPuoiwYBf90LaIP0oHlBFXkxe2TsHPXXcv1rt5xY6CkX0JtGReM4Eq2e517406Cn3KVAAJqhXSwk7Vu9Wy4uA/Go1lFQ6e5RL0V5wt/l9iL00rTfIzmCrZP59nWw6NysFE30CpD2mAfC6NvqRSDxAZGJ6KWLOTI/BmEdQCiikcyOcdzAgmMwX7Q8rtys4HRfUyDaq7aUst+1hpfiZJsVsEBAbe/lp1l+qwA2BDbai06ztym+i51BpsmDtL/Vsds0xX+X4kV9f+wC0Ovb9q7Zidx8YhRxtYjjWCwrPE9zPqLv0MLF5ojlobgcAw0PHXO88cCou5XIRtxKSdesBBWN5EikeqYHoU/j7TouNK734YvE5Sw0Hq6XMFCN3ePLui1eypt6XnQxitghRuSiOAalm+UV2EOQpMHl7Yerp6u/X11+ebzl1NohUUoWQeyZPw2b5uFcgufTCKu/Luv51w/lslp1yoDKV44eXpTPQsFirOCHYJUZo/fltvl+sRW7Q0DaDglVtm9E++LQ/scglb93o/V92e6W29C+3atppJof38P1ZttZ+Ff5odgWv1XA+p+EO7RedK1fqiWfSPdEKa/Ae9nZ63sS3ahVLFRagFYvqxSiIW+5nKuGwTFqHJabYQUDnvHVf44ThG2VvNirI41xuheCEuFsLw8pleYJAQvJ8uQhoU/1QljCzvTy0IAppxAIr4xT1Db/NC+EIeAsL47E5yQvBCb0SmEeIjc9BmHiE2Q8FGjmGmTceX4X98hRiPyjbDqJi0pdNvxrsf6KZUGhklECJ62dFUPxR8FOQi4W8phT+1irNr6oOgXyzFO7rVeDgnjYgjH9ACwPKjtqQke1SkP8nmrlMfUwXKptBETQJ6XOz4MzD1sk6kdkqPX6ekaoY8xCMEgRZiJ8xM/fN53CT93SQd55096I5QMfqmy9Eq1lvsaybz21H8Xy4EHQtMAN0BgW0aYVbYiboAMQPGzKub0mc4Jo+2aTcRCzRRREwIyRj+gFzgnDwABZYWF26dkqZj5sxspHtSq+qQU830e6Js2+ydReAWfNmGWvmTMfgxoqrtav1drng1XNStks9Jvlz+IxFAEzeRqRz2weAxU6o+cje95Vy4UujlRARmO/0PAufywq9S4ZByXD0LrXIBhK/jqEjwZdi2AgnOsR+lsDJ1BkBWlYLPJEylLtOZnSngCbX8ua/XIp4oVEtSv7djGQqIODvaxfr8iW7b5lDDSibEMYGtUyLhqZPH0Z3EEykxrvJV7AY+IMxBe3v5ZVOwChpg02EtGwPTQMxGIHlPviVZAmVfmuzo4goEyxiAEFVO0RUKwniLdCg6FFW6VxkbtXAjDQ8NUAFxlnZg5jmzI756IjZsgwqIBZMoHFd4YKYwqepVLI/GeqMLhps1UuQu4cEMboOw/konLMBWEwzPkghWF2cjiSMd9W7+XDthtAV91nJCTvulexOgwt1bpbgr8UXQf8GypMxnKDWxWN/ZUf7RvCD40/B3ZCbZwsz4fRNwsHYXV+tf2uT1FNMIMAv5MX5baoljyFR3th4pn2GBGD8k88c73oBGPb75uSaawX9TOmvSFx2F1tTjwU68Vz/W1Mj9/KgRH+VDgN+W+0OKi7L9t618zLz+OhKciyuiRL7aE0vVZr/NJ6jNUbWCbQssK8nI94r+QHAFz2VV0mQhyp+QEgu6FIJFpew58bH2Wvh9g6mwSzVS0i+mqv8Yf4qf3F96LGrpaFXBPz+JpF1Rm4EiTDhCq+hheFtHtCfxoSVJ9kFA6rTzaKCEzVupmCTGn4AdC6uZi/i4gZnOMGOD8I4+sjmfbXBKtCG7e+lev1S42aFz/yv4t50eBxba/qqBcj0EtMHkth3Ba2APYzWbWbZfGdjIIjk0raHeEokwf1DIuacKBBsUlfz8dlAXB7Y9lAc0YxC9yWo5iF09B72bQ8VzlI8k1ZX5M88f+pm5ILMhg1qkn5rAvcrm+r5n8DOng0d7lYbZaEXwIIRm2mmq/wCAMYds2PWCbX1HcPGHV/+Syz2+LVq5N7+QCzlhfvD5XhA+NBxHMVxNXouALYxInHmc3DbrUqmupf9OrANC9atkZLXyhax67nb90sxjrQSy1C6Sb8jpeTzftS3HstSIHqX7A/M8wdSVXNoKpVqpB+cTwx9sr6TkdmRRyQmoqo4LbiYPbjW7eMeauXcCjiAJRqtiM1U0FqnrapXsvyZrkidgJ1EY9PeFP9R/mdq1JsXX8t8RRCEyl2QrcsFuPDMS6rB3neXjQTBrnBAOEAtxIiAJGV+9koBulJr6Dfb2AbPchHffJO7bfvXxr+w8sGu2by8+/a8lqYUheVtF0rNoSuaTVqWsimUXtlSMRhQxo1mArECDzy93KLxO7R7/FmvaZS3nx3DNV33mdZpGd8DFN1U71W62KJLjEtk0OLyaY3QuCGDm2GbdnEvU/KNf4wfytX8GIJNt0ODcINCyKwakp4BLesjqS9TOofxz6byeQwNdumlOcsz0PpEZ0iBQBGc0BbdI2NmHbl1JDGjW6lZtD7X/ndiH/2mi7XR79xMQHyDhgO6qODaKgxkXO8Kp6rZbX9TizsDLvjVq4dTzcE6wYDyjJ4f4HToOYYzbbqlG//IDaAdBGfjc51va7mxfJLAw+6gOKjfaNdU+GPZaDGAOzE2SpynwmEIJutDs0mgVhVq/IRI3Mh86IBTenyDFN7epBd584ealZzKFGHCv929r96LKa6NnLwg7tQ13gkpNtBGnmQA0TMcfbFsLBlnGH10IBcyDkNl9/mb8X6tVzo5bw4EPZN9WpeE8A0xV/+MLpGUwBYruQ2vpeIsj63NTqX5zpMwovRMAAZ7f5GRwGW2bftdsM12ctOMVcL2CnX4F56ismBK78vX7h2hyaNbDLFeKsyhy/m83qHjNmA/b5VsW/lCcH8SO5kGb/iUCoFA2IJ+kVh98cIGzjyiAj2s6A5duMaszwcQ5sw8+NuF1Un1b026FhniHgmTsCX5jjUu26sGz+t+QRkXkIYGtf9PQFwHNscIAzOTgfTPLbqAe2SSx+mQSWPrghAu6oNvTBgmrevdnMZh29345m2PrB+xmme4TIx6GLkhwYcERqa+6jvzwgVh6bEsxpPgZ+8YSzGUEBd8wGNayLvAUqcphlEuxkT7gYQJNF4wPRVNY4KqO+mcFDvBwVRgAUDigqkLhZBLi0axnRocXVSEBDRcCoQM5LIob1+rxbwnrspw48h4rN1To1A9fKT5U2MrEfAnxStMGrA8SovqpO7TfX6incjXDrz0Ah/wtByoiwArqqdPgDgKqIsGLwSoi4w5jvfe9BVvwmAvx1blO/rwxaDr/KjUUPigYGn4Dxzt/ATGQKcZ96L8p+5avtGn8tOC8iEUDaOqrZRf1gP7Tk9cHgm7FCVEvCGc2gXDAN9EY5pmt/lh5xbBlkGuBcMws9CjG3BgJh3CjoBGS/iZrnqYsa6nFOLI02I/wL0W8acOh23jdloUS+fl+OLR92GDy0mmm7L9WJ/dgo+94VAEC2LvmVJHAMLgvIgJq+BYNq+bQQ4cnDCl6QIkPm+VQQIv4sL0BpwE5eA8LZvFQHCfVkstxW+I4BgaA7NAkAYX72qK+cIvZoQ/6snSvc5DfhU7bOfA+10oFqfGwqrUB8Jwuj0u3pZzb+rs1cYjrGMxxTrvVjukI1NUOvRqAX+YBpg/LkeyKRSXYL/TPs8U6bSo3ED/JlGYPEnoo966xLRkq0AtexNSPeZbriWhMM8XkbCHwC1CWrade6BOo+P/9r9BXtQ9ZMfiTGsoZl6JXex6ds879sgD9T/jp5VaMbXHGIW92JcI+PuEpv08hwoluakCXgkc4wrspPqjsga7Do+rKMQohQwRnKkmDGtw/aHZrtP83q92cG9Zkl5eF0DH1FBdB718sgj2XB93xhiln5tbLP76xbg09uY9X0z4jASH0QlfhR3L3h1vGz1UlFHsPgQlsX6dVfAmyUYgFGbAPOoV+OkMCDG9+t6t2X38piFVe08+tlFBHeRGZywoAj2TWIYrxkRwzCumoQYN9+xEsCDvS7Cf7cN6TKmyqO9OP5MY6S+YR8ySQd+1KDegXJvtVwQ/TeW8Aj5czTZFlB5dBDnHTQwgBOzHZgAADEM0jEhPDfFeg7uUkIQ9tIxIcyrrUznoNJAITBDOzAPNAKsQYrYSgFhDX9zbaZwYXhat41G6Atnni6IBU/TnQ6pXC8ekZ0dCEsnTu7oMI2Kq7Uu0WkbYFY0sOZtEZ5e6P1Uti06f0GwrPZtYsJ5qdZV+3ZfFi283obgqDbN0CYmnNf64q8C3H+CgLzWhZKOCqGpd3IV6PvR7Bv+oO8GLjwAITHm+RFMi+nwYzeEkHszIBTRcmu0jAttO5xsxFZFEKp9ox/QV53uZrfZwowmCmffJC6Y9/6UnE/nDG3i9027l2OjaeejJlOGgKp9mDfFdv62KTyst+M2U8wvRWVHtWvPfxeiUb/VH/1ljACJ+fxKfp1fNgtki9wBr9mr2A0qooI97MuKbc3rBXsBMNqcFQWTq0XstYA83k7kFUKgZBsomXA6HLUFEBSsVdMfGa03IvkMZvUhQAfxmCAkWeszBZUNIkxChYpO1wo8NgIZHjeI2QPbXbMWkiLRlo2lazM/tIkJZycmtr7TLdko3lTL3Lyo22p/nwByoAkQ8zkntfmMkD2YXnGvBEn6QLjpE9P4SAQCgIeiQAi7tmw87Ysmwcb1Nzzw/1+a6jf9TikNiCXGf8NDkTqCDcP07wvcuVgx6DkccLCTck4sjl1BCgja9dT2uSX247p+vIcc1PX0TvagkpwkOOC4Th54wBHGfSAo+RCzxnsX+1vEfvDhdx/ulNhkMxSCW2zGwxwgem+km9Zc3wtkSuuw8ZU2RMUOSC7OOIQpdg9EEPSgkQiFwBiKfEBgJx4JAOSBRx/jxECIWneNhLT5sZt9GO6axHN5DBG+c9H3ezosMO73pGZ65nNh+UbAZZ8uYJzLPn3N6zd9shHQN30yQbygEyDQOHCpZoQXAdxl6QKC3GUZAQxyqaQLEPNSSRyE9mFqRyiJAQAUjDIC4JrBIYDsePBpcIccCvT7YBo1QzreBwQ5MBEo/PfrvGDhowWBCRgupgAau+nVerGpK3gKNvzm4YzbbVM977Zw3oum70iThV/4Hhw2fZTjJLYXpJtTsuQ2kMucI7lVt8dJa3UapAvHGwYZdeNdBsv+d9hDdXuDLBEpXeYOut3mNNkwc1hM0g1N6kC1e87zSCXr65HaxyuYZXRJdviV/wFLrpqh7GgQRHAfgHkuxEw75DIMNKN1ENo30bKWHMlKGtywnCQ6FYltAM84ohON2AY4+UQx0ohC03YmZOtMTNKZnpsTnh0zKSlmUi7M1BSYSZkvUxNeAvNcwtNbpme1RElmCchhwVNX+IpZGSpxElOm5aNMTkOZkn0yMelkUq4JJ8WEbcyZTTE5iSJm7kTklIkImRL8BAm2YVcexNT0hxhZD5GSHUJzHCakNoQnFjjzCfhmHGkDU7MFpiUJTM4NcK4DLhyT+P53n+NraoflQ7kknmms9mhosuibEK9xgIvNvtp5saQClmZ3JB1usr/9uq/BK2vU8XrzaN9SlnXat4wAZX9vUrMq+K/3AEjEzLnRPhwW67ooGw3/rigWCEFtefiklJ/ukDIWv5TNY40WZbRtD422NV2VEQGgfePqkjjQrvqJ/2VX2GnXsaajQQqB3OMhhzynjb0Y14jeJapcFJ6noUt4EPdkiR9A6xGjro8BFzH9V9EOgvDUETDetSlHbTzN612q7qHtpkA442oJ+WREcA5dwwbkQeXDcWGHd5rP4VwX9HXXPPAc2s73bf3h2N0v76WlsexFojBpkE5nGoWJFRvIRWgj3MiwuhefZLQpi0W9XoqqScgUArI9tKKTJ9gQ5BDs+SaHkZvnUE4QJEsI2ndnrjBNC1KPOOIIGhdtXGlQHuY9HtuRsYIbHX+9v5VFt7Io8crgmgD/y12UL0UXsm/B6Zat86iXJ+ZZOlJ8ogXvfAImB1k/c1rnVfDkRvw9SsbdXpEz005CoQ1cdSEfS960DJUHYX+D1DUyB0vOu2MoExhxeFBPDgSGav2lir1p4py9JsB/zfjs0lbommPqGD35PMCc4zXAxrROazq36ZZrSNbT6GePwX+5rP9Sy0lwLDaVHvUNtjV1j/kYKfq9rDbdFEndksWybLYINu3IZ7AMc1IaGGaX1bxcw0UzLZMH2WBzK2LTybLnvNuKYRCNFqYxOmiAhsafwcf5Zlz6Gr8JChT0GzKq9a5ELivDtR8NLakby+Cn8OxaAgPZyV7G23m9gTNVCPP7RhEAYDGWME/GWpdxzdku7+T17/fla9Vum+/EpYmIqIfDLStkNKRUH+2bIU+LPAFKxOBXmpIwnBebegLpr0KG5+okkr4lMW13Q9F8oFx1ozO+7TH+3WfZjV05ZulzXTimAUTMEZeB2/agm8B9DZKOZFl0ew/DJHrBt22Pvt2bY4y42ts2B93r7WuQd5e2bdtxkbYvDOrWbNs4eGU2w6T+/W171hpfQZsyHt+huCHrkaIiQd3qZi03NWmBx4b43eq+nJf94SrkO4VwdA0b2dCxQ0YAgTubyN23hKLsNsJavXP27SfAJ3hOb9KQOC7zZRsmd98Q2/6pIGw4+JYYgsUzL58CMna937dbOTGDkAy/eTjaYlGJgFcsf8eHPk3t0aGJawDcQ3XyRAyzunCYwRZdBem2HDfhAmbMN3TpfrSRCP99iVNzf9UN6IeQ0qNRA/xhxmix5UX9tQRnKaDVQXqSSfEBYWs60Oqoga/h8fu7HsxAhvc/erwz94l1XSv7nPoBKdaFDTjTM8wpKb4JvbMMBhBfASCiHsHquW62D9XrGiaWKf1Hsm07tMWeFX4WIu//vXzYNmWx6jPyvJ/7SClpByX0jqEvQCzVgkZE5lr4QnDfRUmD6du3+/ZRYOHHHUg0jgMQniDmnCugSDyjMTFu/5TrxaGFN6xSRK1311rVE5IrBZlExEpK9gS0cl0hQyJSrSO/ts1y91qtPxXrArnLjoSkWq/2raNAanbEepSE07V0LCU8ofSLA28gh3YxYYQ6Tt88sudoudKXRTf/9QamqZj3KqKAcyRDkKg4SRFuOOMZz424S1fe1XxftpsaIatsKY95Dnp3NKL1yHF3NAAZ22CRT/9aPmLTfQyBaLjpGtIzfxKI2cn9fNnZzaYcv6P7+TXa1aDmo1Er/Ckt8PhzDud4nQ9qCfKfdDiPjT4qrPto3A5/WPsJprgXAoXvYRQcs/M/zTciEpeNs/dtSX73r/ZtPbUfdS3bfUv8kYHHmPIKMDT8d0ACMl9Cv/HVEpupgFiU7VRMrzOBE8KN5jQgpZFQ43Y5pEDT9ctLC9+dhdreN5luvEHuDcdt9y0mm94gyXeo5Q2VgedhGN8mRk07sidp4/inREczU47/MTG9eRw2fNyZjl689zq27fFiadPDxNvP/KjVdAjbelssr7clvL+Gg5Dtqr5dJBhiDAmBsenbBcEwvb0/kuoaOAyxaAMHpNebiYOeA4FD1c5C8TgrZ3kAIDk5FIE/K+cBiQ64IB5PZo4Go7vke0m64v5nDxekb9M2dR5x7tAe43SYRW/ORg3T92UzTD8v62eWxV4w2BB6Pbtlib6YnWMK376wjTm2K2Bzmh8uV3KVje+86RKeeSCqZbFcPhfzr0ztKhNE7lPMDy2ZH6D+OBS0TyJjKQiazHUCoQVCkYePQ5DIU8dxgDyXL3VTBr0v1fRHvjBlIeiNqaYxX5nSGPLOVMuIL+1wyhMu+QWBOBzuJCqAcc3LPdD+NoUa2bIAMciG83HDKUAcJxAgCNghhOnOuqhaeajjcX+Q/U4p4CLr2x/OtG+G9pP6yIZVYrtMPFQludXEAtVJdKFeHNiVA5nXKHQ0NO5HQQcFxATUTRS6hdO63Ta7uY8/qYaV1nAKkGo9X+4WQ8ewX1PfbH5oNg3EZreV+fzgsRcYQNekHZpMM+79EuJ1P5r6DJmlk595BtHFGmDPb9HIMq/O7iEJ9BAG1YDKovcx7Odjqk0UJ1PiaKURyLpqYue+TH8J/Zn0u6bubLce42nfcDNuOKVXmn4/JQSJahkNSrt7vsBJTgBB1wDgOKe/nC2WtAWBoJOzUIPGyozaINj/Gu9sqqGTdzR1BNM7Ldw06B7BeWtn1tNxhkgnW/MuBmhx9Q05czEIm3cxPItGk5+XGqU0o84RykWSNOV7Ve/a0YEZZCfNMDw0HJ2YoQgMJxDpjB8q+JyQaVwKLyrinBBo0PoKCX7k8LPHuURGgWNTMV3m2Hokelee2mKy7Lq2mBjmnIWNbat4eWNP42RRY8suXNo4xCRR0Bi2CpU19jTsKmZsGUZLGnsaxgsZWyaBcsa+xjhFjG27ZCljTwi8OsMWBke1YW8QnFis22cHYYZpvL4wbBioMuxp1lnu1zKMF/0NN80p9UsBIQv+esJyVdu1cKA1dz0NMyvtWvZd9XY9YWzwKruW6Q1Qa9fTnKv0rWUTLYDradhZ9tayjBe/dZs2JkBDJdKyIao1QHIemSLLlZfSI9UAfSgbMn7iqvsW/Wzv2wSZ1zq3LhaMq70AsTiJCYhe/8QE4DlCEhMwPO7EBD4AOjEBQxCQmMCHRCQmYHh8ExP4YN6J0QRD4xxQSPPmF/Fn+SxShqhgY0nxvwdRYqAbhT75KD7qG1FZUTZw7AlfkSM36hfySdLj/GzEej3v4C2Hg6KjQQhDLcEgBtBbnMYG6BucaAPV+qV26e9lQtQva2f3KJEQ5W257QRuyndkB2ZkpBPt7Cx70RBjfxUN8kUerPQyXPWaS9YbVxaILhI9DQRQPykPxHiiiUkPELpJWQ88eC5aG4IVxGvz4KyKb9fijRBhGQDUtarGrTD/ZEHAZw6AZc8pDAuAiy+CcAQRRjw4NDsCgQmgR1Ao4xiyP8UBIdn/yI8bjjsrdY2sSysPCKldDameYVETDjS4P+sDT/4Mi/vzPcROhtMk9gEZtqZ15FCUgtOPY1m+Oc3z5Pnoq/W2AXcgRz97jFroLYqmOtddimN0/tvxljXXdjzDHHlNkGXQXZELNjl+Q7eiBE6KlSI6/OqT6izYZfRgmqHySInTR9FGIFGnWFTlGj6IbVk8yIabE7fjwMSFbU7ch0PQFjxzw14QUqIVsjoQ/lRtVp5xD6PTjKkCn3DMNa0pWSLics09lPMGPl4Hm2wH+WCznTv80Q0WLxU8JltmO/n3g3yo2fLbpup84oL1qL1wMeU5ex3XrEDQC1dTwkC1YMedajE15qxrZsAZBEMNNeWi65n5lvkVDuLTvsSmfOnexhu7P3v5qZ3aYreVmPboC0rchiTQ4Yy5EPxUdpMFVuCRTYcz9SLmrYamHmC0QXhTrq8XfbrKn9Vw8xqIBRb1nT71l5DtLx/3tHSkaSkPWpAOQJ4PZZGL9Vbc99A+7DabukGoTBKg1CFKY7ftSEcUeE05FBoJ7r6Dith9h1cwJwE5aph7gtC+LW8s2uf1QyAdPvcJHoZEgfj+JvmE9Usd3KGDggh9akSthvMZ6EL8SPVciNkuuIMLaz0SLXYNvpFrI8ZW//hYAFt2jQBcw5sCWYjBZntxf6Pae9yWy6tv0meblhh5bDH+uyzXxfOyFDvdSO1MTPuRarnct0SeFXgGEkr3+TfVHA6UNJTVvmUkKI9NMQ/rle2+ZQgUzQcey+Xvdf0V7pDhR4+kgfr1vpzXzYJOU9c1C8anka0YKeoHxPg33L2ne7wgsmFcyTeOashOs+2mWHs9tGgQ+LzjN3hXNG252H/zkGFDxG/OiN89A6mVE0RHAWYTcRjTAlrnXGPENF8Sgxto2znKMg1j28GgUXJTmGmw9vWdo3GLSaY3olRfuUU+VNC21mSS8aYUqWB/FMsdv79Vm/e+ja957butl9X8++VbOf+K3+FrCfG/3XonzvLCTwZqPTq0QJ7LQox2LJbtjFh2ZDtThsddel+u6m15kV44iHNILjZ7jtqYQqGDD0jB7BN7BqDgV+ZAOlzKOlIBvyUvcKr74Er4BCDVa0Q9fB8QzEwDHM6UdAN/oNPepdLxQ14mfqcXDsdxoZe/+d9k0QKQbXSheNk3nQ7GMWnBoYTkiPgA64+yPHSzlIDAeNQ3b7vmjhNyPqCwqQ6Owyt/xAeKI4kERxSSSeIDjEwnwWH555Q4QOkDbVvvGiQpY/+jx5Da/Y494FjZ0V4Q870BF05udDFwzUJ+pAkHGlQfNcfaQZJvyngnu1Whbo6lvnBTiv+WqrZvDV9Wjag+qtpm1Ax9OBM88pTdJLVcuOZ3plD0yR1oYNLMznouauYE+xMCyo4CQYa5syUYxaSpEheia/CFoQWNvFxI6AgHY/Eb3rggXGMbjCVoYONCaoQgmAOBoNk3mOjG9HAK2w4YSwk4WjjbrS/a7+u5qP9AHDYCxDxCWgOXyMeUHvUNkI4GEKPUW728VFXFvOzLYmz7diEwjC4mRorhR19G4+LlpZR3P32oCuRIg66737kvhnaLoR36fLQfy3PLF7tFVTsPfBpAZEuRC1fzjnw6oayKbzfLlRgUMD8zcs+Xy9W8lw40qY6sBj2+ahrz+TfFri1v10P1QU4nyCadi/dlByf0xKaph9KtHLuadKDJbhxfihTUa+FI3G/raGgl3c+1hnRDUBmOn+qFKI1dIfN5E4FqtBo3CgTQFu/q+X9d1s/tRTucpOPgEG1lL4gKuG3RFqO2oXA2ZTknsodMBFJ86kvYX3v3CcmINa0O8isqK9ZtVuVZXL7MOTaV8FwK8w0aA8ha3mCE9+3+d49RGZ2NmeocV/pp8PDzxkxTGzynnGkIOx0CGiPpK5ZB9w2FgGHmtYQcAKxrAG0I/Lv/OCCcl9nZAHg32HGMq4vnsMBnmD0IhxtseDsdlu1xO3fsc8JonTfB2RBa3vVviPlxVHroBhFGmQJAzCNG4V8zpte7TAH0HI5v3Q/PoRHc1x4A3EWzUBjM4lkeYKiiDSgMZ9EGDwAtVbQBRdB6F23wgIQXbUDxeBZtoMFoH6hcWIBY5C/8z7BtwJnOSM2REkFeqQKCoCyLZv52te6CcnmH3v1sS3lkc34Xl5h/2nWTf1nl8ga7gAgxcqQUrIQCWTzQvo6IfGH2A2K7h92H+bCtmxLxIASeaNaKZsSBpAAQD5sSzlJ04mj7llOhdLEC2aLDIOxbxH41q+KbSvzw6pGuVbNvFRtSO5L0cxjVspR/D/UZ+xNWJz6pmYAtFmcmgOh1Tu8h3Ij57keY2keNDy0mmyaGFMy240Y42jj+ZvGKp5Ac/93KlQCyg4JqPhq14jwmWc+sn0JfzOf1Dl4U6xI+Caz48WBAp/uIsAHV+zAOZNRxBodpUpO63C8v2SDU3wr1t/m4/RRY3bfwoXwpuiDsD6lru1BtY8K5xo+KIiBcJ0ZR07iP+3TGQdYvcfuuqd+rRdn8fXZ8flk2W+RIDWlMpnNvekXfOkXzThF10gZ9TP9D5m5g1EFXXyAqFexqVVQBvaQal33jmICwoceNhhyBQqBM8iOl4kd40Kap3ottiVyTQaPq21I3ZoTDCXl1B0ARX1/3/f53OQ9ypb5pRDAylAZ98bJlzE9enBIOgKFaxYGwW1eiTmP5oe5iB2NMMsEM7RdD+2BY+ljVYuUm+58irRwOuhirBYUJY+XfsZwOzcpeLMhIhXxBIwPkl0Iq79psVfHqx4rRX0Jc1areVuHdhlZd0GzRJRccJqgF1MiGc9FkGgEc9sJNBsGSpDsb9T1F2egLaicat3CkWru3pOHHQSC9lttBkqg6TsHqNAyYXFVj/aAtq3aPrRsRqe8TBCbaD8i+qvaxYQ1XA0+B9n7QEQveFFix4YwKBXvD6dpGdvd2tAPvC0e0jQDHjjzMouG4NH9AJXkfWj+D/sEfB4FDlKZ2oWHGGn6h6r4BlxpFpX1yK52OOIGZxB8nnKB0gOLylN7QGG47gbXkwNE85Wu1hFex4gePj7Gp19tVscWIkr22I10SeQyJCk343N+jCY8KB1uGaICxhjrgM7I0luOZsd7CffnajVnI9v5YgD9J6+Yz9AvWVIrpT9uLE8+wx4mNS3K/W4rivaYbVk3aoclk44Jf/UCfgUBRCGqVUz0BhTN+r9tFVffVhDpdBK8MCXoQ47IEbYj6I9V0MzRFnhV8Dmw3QV1H4Inj0CoGBGxDg7BP7mY4jOvvXCR3ihT33x8f73gvn2rB94I3Wbkl0MLRvjXWBeRjYY7ZlqL+zCPlEm5onRZRlcbtIiEQOySrat2t62/Xl8sa4RUZIPd66vW81xMV5rQu/EF9J84NiLRi4joUFrpBT71xjNVhMNFwwIBGx4UQODuEN2CgIfkCLphxtHp8q3evb9urdyQJe/w7PxLN8aLhlkJn1XANoucbtq2R7xMxpXVYfZEWhLuPf/dMgsfKgFgqGeU/NJiYUXGF8pe1IBDFLvi8QIpAAvZFy53VcgIUOC8fsEzk5bMMuXdGAaPMNHkWgEOfITNTwL7ZJty8KBB5h5RYtA0LabLCIsfkWw1vO9jmeslwU870f9smL/2fY1yMXzybveQEU/29FExzB+lwk43MxOcZ3MuGm2udZwpssy3vTAFiXg/yX8v1r53zL/pju+JeTVkch4z8jkYeR2vFAHRfimFRdEL1L6QHOAYV1dcMylqlDOsa13OjR9GGOyUnANWURAYoOfNHcSHEW7e8nwBSKtqOFE0HqnueOjuLT8jGAh4zsgLeBbLVHfWi2HON8fnOxmxj9HQMMQZ1WF8aDz9lDwryO1BsC/mpPeqb0M+m4yaMXyDVCxwAyBoGLhBWR4uDWM1K1VQmPdQU9Fo77JviDwzqPzLbEk9tPUmIL8Mo3D5NGDe7vK+kK+9CRhkcUJDf5ctA5eKi42bfEH9e+xkIP3d8wggSTqkMFxSz69VJC9LPRyL87m7QKqeQyqO9OP5UY6QBfmyZdHowbFDrwKYQCXPd3LpfVN91s8Jq/cqaSTHbRp9Q+dj1mldxOwPty0N5jivsLjlbit8/GEuK6DwiOVEALvYl1HAFNcxsLx9gVu/O3VospUX/82f3rkb8zt50X7RgXW7KYtHpu0Iz9ng2jwZ9S6XPkdrnfnosgpCzZx5UxsTZA974pX5Zt8VLeVN3s1dxL93Vt3K+o98o3cJnwtItW9YLbFeFYeaoV0FutTgeEPO179u3en05HaJS9OOAtm/lchkBp9Tz42D2PMpD2U02FqFuNbAx7V7LRIjjD+GPsuk+m4tKHTj7tVh/7TdRiE/B1cZzI5s6DMoypTa4nSdDnY9KHuMIR+eo2RwKq/wmInkrighdbCrkHAcPYa9K1BcqNhV1rCMU7LLGd7B5GEca4kIjj3nwsLmPe3iAA77Oa3UoFC/aAsn5TefkEXgv1UfjZuRT6/CDT/AzkNBn+H3gqGjiB2PfZrp5vIgAbh4oIxBqni4cgENASgd4wMC9/8PYQdywNHG/b+GB9y3YFrw/Cf2Z6BH6QeM4GMMz2OAHjM24Hc+BGX7CGMMfAdF/7POCyRn4CHTsUc8LFGvII1DxxzsvWAMjF4hq1HwaqPT4/DSZpXtcF+mFypaRa+8P480PeWPqv9kCjqRbU3/xpVuS/7qrluOMvEH3+Ec/vbIoe3ph3IBiGoClAiyBNc7HRsYC/vpl51L6NYEA/XLBVJIWdBF/GyJcLSkLmoC//oGiwdSPf/fTLt7dvV59vNd7+MVPo31JXq9w/4OXPkGf3ixXj+Oda6Vw9IufRlW63/UBYWIhtohPCJAIsEA7OSgTYIVyc0AiwALh6LaAl/4P8rBpP0aYRJeyAIl42bg+nDQZyo0YJgAJLws3xhFS+EEQKT9Ly5V0SvnJmiOj/qOvXjDe7P/upe3TJZ5cr/QCEl4WVPHR2wase6xMQCJeNh6q9asoou8YSTCxUFvEx4ZIhVgiYh8gEWDBHZtQuWBrzq6bGK0eZJTYNeVCZ557E/qvXpofi/arGgm0m4uUYv1HP73do/YjzEXzulvZqAGJUAu/7dZzbfllWRgkvC3IMvZ39kWsBwuGhLcFc41/0Oy9mIeu+IHVse4CHqND1+eye13WDmLBlqr2pl6/ipg6vhUcsVe1y0642QsHW9UO5SLGyMO3DBsbyrv0Fbn7dl/YHuR3d128kFn6gNX9b97e/GUNO5/8u5e2wzp+OL0JDuiYGGkrGy1QPl59fny6v/p4/fB4/4+nXy8erp6+3N/srbwXTSWiX7digSXZhr48/v50d391d397efXwcHsPmTBluMovbz8/KnT/+eXq4fGJMoLKco11ja/u7+6vu+f/8+rXp4eri/vL3wFDoBzbyN+vH59ubm/vIMXDb1xlL334b6++iTz7cvFb3Tx2U+AuOtyul98BE44W/JjczWbEVdelWO/qg7efsaNBkTz48U5xjS51T08yl8sBeFjnoumdgfiHW3ZHen/k47wV68VyP/6L2ZdYDoU+hNI2iIqs6GVFJDp6Qx/57MfLu6dutdJ9Nvd/XN0/feg+1evPF4/Xt5+frj8A+El57ofy8fb2483V06eLu4enj/e3Xz5/uP78ETIGyXkaQeOG9jtX6bUINheX4nkfWGGQbsA1e3N78eHp4v7x+rdO1QNgRhfwUvvp6tPt/T8wnepXL4UiCt91wximcvidq7QbqWigugBX7fAyuoHqt+v7T8qHf/vyWb6rp8uLm5unzxefoKdgtuQC6Ub3Jzla/v0RMDb6lavQrAd0UNb/Qio6GWerlMX683hyug81/7b/ja2sKbu4rAf3kbrDrwEKL4yaLKDeXshP/X0XRy828toEVPtIxls5dosOYMPn0mDL1INRT9LU/8AoKnkyXgOqogNqH6UbbyQ+fU14MEFIcw2+dH+Qb/HX7+NRdkQ7HsyhsgHGbop2OygZSqi7jMJtfIx/Krbzt274HsNHbEKiXFOvZfdSqut1tTUWPQcTpghftZqHXcqENecro8T5Jrf7m9PH59nHVjQJH8X64e3fmno1LqCrmwBlfYy1XwVNO54Tj3sEfk3OVh4A1Fu4KZ5LzNhYwkPxb12o2TUlGutMER/V7h4K7Q7zW3ao34t5mPg43/ST9wbRPpbwUzzcWo/qHQQ81N7Ur68jNkXTqH7zUKbnUJDfFijKNfVWtP0hGKiPR7/6KGyKbkwWRwaGLGnlAeNjVroNvAHXbNXKEIbMSUa/eigcVcHQVG02fCWCG9dvOB+r2v/qp/DqW7HaLEuL2jRVG3J+Rm6WK1Rx95ufMvS9DD/6q2tLvE/73/lK+2MtJssz1quL8FX3wftK3rMNjcCmiIfqal0srRt4NM1jCQ/FvQr0tY0F+Go/yolTettcPNfvMGBdxFd19u23TvLtpiK1j6Q8DNS1oEg3UBAe/cpXOFD3oL7hRw91db0h9A2/8hWKue1yWS5xpZoEX7HILhCOTnaAKeSnvlzQmvvfPZTq9VY0ffInvqqHeSOWJ5uCiDWGjIdyscUr71DAO8CQ4SqX9baXS1VJ9Hr9oYK6wxbyUS+biQkMrnwsEqT6f1ebX3cvL+DLhAV9zPxZPt8Vr1DwGf3KVbgqvj+XD+X2dlsuhzEcmqWBcmwjZfNaPoibFEDVh1+5Cruw3TQdBOe4BwtyzWzqzW7JX0xT4myTzW5dErNl7Xeu0kbWrC2bvhcAtYYEW/Fu/We1fRutSiHdlhBXfUsseFrfBY9qcFO+gyBHv7IVbptuPVG9qCoqYCA0Rbiqt6JgFaBP/p2vxEgdgvzJFmKrb6rVY7nafCiX4gDMONVgpN4S8lXv0uyl9L1YVuLemAvjZp6DWkPCV7GM7PDIYopwVf/VfTviQeumaL733+dtH9YAM5Q41+S/6sXtszgd8lgbGaEHO5YMqTxPzvPs+GDBmpd1UuU3xcIul6vi1aKM/+9//ayEfvrb/+yZlr/9lP6S/XLeSb5U5XLRCf5zSOoRB8KVkkU9Vxlq/9WL/SELcwhhJf1vxz/9/M/jn0+TX06Os//6r5//OTSWP8g/DDoOf5ENk+5fCdQwsRomWsO0+1f688nJL/n5TGuYWg1TrWHW/SuDGmZWw0xrmHf/yiGoudUw1xrOun/NoIYzq+FMa3jS/esEanhiNTzRGp52/zqFGp5aDU+1hmfdv86ghmdWwzOtYedB/zyHGp5bDc91BxD+kIC+k9jOkxjeI90H9h/AgXQPSoRfJCnY2HaiRPeiRPhGkoGNbUdKdE9KhH8koC8ltjMlujclwkcS0J8S26ES3aMS4ScJ6FOJ7VSJ7lWJ8JUE9KvEdqxE96xE+EsC+lZiO1eie1cifCYB/SuxHSzRPSwVPpOCHpbaHpbqHpYKn0lBD0ttD0uNGCWDVPrzLPslyY0oBYQp3cNS4TNpF6mOfzlJTvXGtoeluoelwmdS0MNS28NS3cNS4TMp6GGp7WGp7mGp8JkU9LDU9rBU97BU+EwKelhqe1iqe1gqfCYFPSy1PSzVPSwVPpOCHpbaHpbqHpYJn8lAD8tsD8t0D8uEz2Sgh2W2h2W6h2XCZzIwhmW2h2XGSCiHQjCGZcBgqHtYJnwmAz0ssz0s0z0sEz6TgR6W2R6W6R6WCZ/JQA/LbA/LdA/LhM9koIdltodluodlwmcy0MMy28My3cMy4TMZ6GGZ7WGZ7mG58Jkc9LDc9rBc97Bc+EwOelhue1iue1gufCYHZ1q57WG57mE5HsNy28NyY74lJ1zgVC0Hply6h+XCZ/IcbGx7WK57WC58JgfdM7c9LNc9LBc+k4PumdseluselgufyUH3zG0Py3UPy4XP5KB75raH5bqHzaSHnUMdNrM9bKZ72Ez4zAx0z5ntYTPdw2bCZ2age85sD5vpHjYTPjMDA+DM9rCZ7mEz4TMzMADObA+bGbN6Oa0HPWwGTOx1D5sJn5nBiwLbw2a6h82Ez8xAD5vZHjbTPWwmfGYGetjM9rCZ7mEz4TMz0MNmtofNdA87ET4zAwPgie1hJ7qHnQifOQE97MT2sBPdw06Ez5yAHnZie9iJ7mEnwmdOQA87sT3sRPewE+EzJ6CHndgedqJ72InwmRPQw05sDzsx1o5y8Qh62AmwfNQ97ET4zAm89LQ97ET3sBPhMyegh53YHnaie9iJ8JkT0MNObA870T3sVPjMyfnP6fkvs9mJ1vjU9rBT3cNOhc+cgh52anvYqe5hp8JnThPoVZ3aHnaqe9ip8JlT0MNObQ871T3sNMef2fawU93DToXPnIJD7KntYae6h50Knznt3LNb3RiobQc7NTYo5A7F7OfZ7JfZ8bneGNij0B3s9Ax/ZNvBTnUHOxUuc3oCWrYd7FR3sDPhMqega5/ZDnamO9iZdLCzn/PTX44zHfaZ7WBnuoOdSQc7h2Cf2Q52pjvYmXCZs2Owse1gZ7qDnQmXOUtA2LaDnekOdiZc5iwFLdsOdqY72JnwmbMMbGx72JnuYWfCZ84g7zyzHezM2AWT22AzaN1+BmyE6Q52Jlzm7OTn7PSX/CzRG9sOdqY72LlwmbNT6IM8tx3sXHewc+EyZ2dgY9vBznUHOxcucwbO/85tBzvXHexcuMz5MdjYdrBz3cHOhcucg7Hz3Hawc93BzoXLnIPLk3Pbwc51BzsXLnMOhr9z28HOdQc7Fz5znkNOcm572LnuYefCZ85nP2ezX85OdCc5tz3s3NhrlZutJyBsYLvV3G8VTnMOupj6TW8++lvfXvjN+dnPs+Nf8uPEaA9suh4bu67HwnXOQUdTv5ntjY3XY7nzegw6m/rRVGBsvh7L3dfjBH4CYP/12NiAPZY7sMeg06kfTQXGJuyx3IU9hnePj4F92GNjI/ZY7sQewzvIx8Be7LGxGXssd2OP4V3kY2A/9tjYkD2WO7LH8E7yMbAne2y4Yb/vD+8mQzv/1ta/3Ps/PoM+wATc/TccUe3/H8O7yhADYFIAigNAuAuIBTBpAMUDYPwF4IkmFaC4AITDgNgAkw5QfEACjrEJxAiYlIDiBJIcVgB4okkLKF4gAaeCCcQMmNSA4gYScEaXQOyAQQ8kcse/wwUqABiCxKAIklSxUGewAsATDZogkTv/CcJvAExBYlAFidz973D9nJ3ZIQ1gCxKDLkgkA9Dhgh8B8ESDMkgkC5Ck4EwvAViDxKANEskEdLhgBYAnGtRBItmABOY8EoA9SAz6IEnxZUUCEAiJwSAkkhTongscFgASITFYhEQSA91z/Tw7+eU819sDPEJiEAmJ5Aa6xwLbA25ocAlJpghRmKMD6ITE4BMSSREgPQgwColBKSSZ8sJzaL84AViFxKAVEskUdP0CvgKAWUgMaiGRbEHXMTACwAsNeiGRjEHXMbACwAsNiiGRrEHXM7ACwA0NmiGRzEHXM7ACwA0NqiGR7EHXM2AnAmxDYtANiWQQup4BEQCMQ2JQDolkEbqegRUAjmjQDkmu2HnYkwHmITGohyTHd1USgHxIDPYhyZUjguv1BCAgEoOBSCSp0PUs9C0DHERikBCJ5BUSmPRJAB4iMYiIRHILXcfCCgA/NMiIRPILXcfCCgA/NAiJRHIMXc/CmQ6AHxqkRCJ5hgTmcRKAl0gMYiKRXEMCczkJwE0kBjmRSL4hgfmcBOAnEoOgSGYqUwR2ZICjSAySIpG8Q9e1sAIoX8RwRMk9JDC3kwBcRWKQFYnkHxKY30kAviIxCItEchAJzPEkAGeRGKRFInmIBOZ5EoC3SAziIjnB95UTgLpIDO4ikXRE92p+np39Yqz2E4C9SAz6IpGMRPdmgM2sBCAwEoPBSCQp0b0YMJ4CJEZisBiJJCYSmDVKACIjMZiM5EQlLcF+DJAZicFmJCfKDWE/BgiNxGA0EklSdG8GfAeAFxqkRiJ5iu7NgO0BJzR4jURSFd2b+XmW/5LOzHcAOKHBbSSSrujeDAQAYDcSg95IJGPRvRiwPeCEBsORSNKiey8/58kv3Zs0FABeaLAciSQuEphVSgCiIzGYjoSgOhKA60gMsiOR/EUCM1MJwHckBuGRnKrsubOf8+yX9NTsQ8AJDdYjkUQGvDecALxHYhAfyalywvOf8/SXWWJ2AeCFBvmRSD4D3ndMAPojMfiPRFIanWuBPQBQIInBgSSS1uh8C1YAuKHBgyRnlBsCVEhicCHJGbVWBuiQxOBDEklxJDBflwCUSGJwIomkORA/BliRxKBFkrMT6gkANzSokeRMJXLCAyJAjyQGP5KcEUtlgCFJDIokOVNLZXClC5AkicGSJOdqpQyudAGeJDGIkuRceSE8tQS4ksQgSxLJfyAdANAlicGXJJIC6eILOCIDlElicCbJuXJCkARIANokMXiTRBEnIH2RAMxJYlAniWRDugAFPwHghAZ9kpwrJzyDFQBOaFAoiWRFuggFKwC80KBREsmMdBEK7kMor9hMLJZueAZSVynApaQGl5JKbqSLULACIL/YIFNSSY50EQpWAOQYG2xKqtiUM3C3IAXYlNRgU1LFppyBnpwCbEpqsCmpYlPOwMlpCrApqcGmpIpNgUnTFGBTUoNNSRWbAhOnKcCmpAabkio25Qz0xBRgU1KDTUkVmyIIVGuCnwJkSmqQKWmCL1BSgEtJDS4lVVzKOZLmDuW5G34oqRF4XpECVEpqUCmpolIEj2t3AMCkpAaTkiom5TwDBoQUIFJSg0hJFZECk0kpQKSkBpGSKiLlHM64B4iU1CBSUsmLYK8Q8EGDR0kVj3IOZ+0DPEpq8Chpf8YCztwHeJTUPGaheBSYWU6hkxbmUQvFo5zDGfzQaQvruIWMhudwFj944sJwwxTfwE6hQxfmqYueRgFnZil08MI8eaGOXhzDh1Wgwxfm6QvJimBPALiheQBDncA4hiMBdAbDPIShTmEcg18ydAzDPIehDmLA3HgKHcUwWJQ0I2IhwKKkBouSSlYEThBLARYlNViUVJIicJpXCpAoqUGipJIUgfOtUoBESQ0SJZWcCJy8lAIcSmpwKKmkROA1agpQKKlBoaSSEUGGAoBBSQ0GJZWECJxfkgIESmoQKKkiUOD0jhQgUFKDQEkVgYKMBQCBkhoESqoIFJhUTwECJTUIlFQRKDCpngIESmoQKKkiUGBSPQUIlNQgUFJFoMCkegoQKKlBoKS5Sm0ASfUUYFBSg0FJFYMCk+opwKCkBoOS5sQqOQUolNSgUFJFocCceApQKKlBoaSKQoE58RSgUFKDQkkVhQJz4ilAoaQGhZLO1NFHeFYCUCipQaGkkhFBginAoKQGg5IqBgVmdFOAQUkNBiVVDApMyKYAg5IaDEqqGBSYkE0BBiU1GJRUMSgwIZsCDEpqMCipYlBgQjYFGJTUYFBSxaDAfGoKMCipwaCkikGB+dQUYFBSg0FJZ2pQRo6EAo5oMCgpwaCkAIOSGgxKKhmRFE43SwEKJTUolFRSIimcbpYCHEpqcCippES6hRusAHBEg0NJT/Dd6xSgUFKDQkkVhQJvGaUAhZIaFEoqGRF4xycFGJTUYFBSxaDA+y0pQKGkBoWSKgoF2WsAOJTU4FBSxaEgew0Ah5IaHEqqOBRkrwEgUVKDREkViYKs9AEWJTVYlPRU+SG8RAFYlNRgUdJTYokCkCipQaKkp9QSBWBRUoNFSSUpksJZjynAoqQGi5KeEksUgERJDRIlPT2lngA6Jm74oSRFUjjtMgVYlNRgUVLJimBPALihwaKkkhRBpsgAiZIaJEpKnCRJAQ4lNTiUVFIiaQKPiQCHkhocSiopEfg0SgpQKKlBoaSSEUkTeEwFKJTUoFBSda4EPNGSAhRKalAoqTpaAi+yAAYlNRiUVBIiaQKHMoBBSQ0GJVVHTOCpIcCgpAaDkkpGJE3gUAhQKKlBoaTqpAk8tQQolNSgUNJzVRgDDqUAhZIaFEp6rpwQnpQAHEpqcCippETSBCQQUoBDSQ0OJT1XXggHc4BDSQ0OJZWcSNpFIlAB4IYGiZJKTiRFyosAJEpqkCjpObFrCHAoqcGhpJISSVM4EgAcSmpwKKmkRNIU3HgFKJTUoFAyyYikKfghZQCFkhkUSiYZkTQFP4QMoFAyg0LJjlWRFtCRM4BCyQwKJZOMSJqCjpwBFEpmUCiZZERSOO82AyiUzKBQsmOcUM4ABiUzGJTsmMhryAAGJTMYlOwYz2vIAAIlMwiU7JjIa8gAAiUzCJTsGM9ryAACJTMIlCwh8hoygEHJDAYlS4i8hgxgUDKDQckSIq8hAyiUzKBQsoTIa8gADiUzOJQsUW4IVygBSJTMIFGyhHBDgEPJDA4lUxwKmCaXARRKZlAoWYKneGUAhZIZFEqW4CleGcCgZAaDkiVEilcGMCiZwaBkKZ7ilQEESmYQKFmKp3hlAH+SGfxJllI+CPAnmcGfZH3NKrgSEkCgZAaBkqX4IjkD+JPM4E+y/hgKOKRnAH+SGfxJpspXIeWYAAIlMwiUTB1DgTesMoBAyQwCJUvVZg04JGcAg5IZDEqmzqHAG1YZwKBkZjUrdQ4F3rDKoIJWZkWrjDgAkEFFrcyqVhlxACCDCltZla0ywpPB4laGI0pWJEUqa0EFrswKVxkRDKEaV2aRq4wak6E6V2ahq4wYk6FSV2atq4wak6FyV2a9q4wYk6GKVwaNkuXUmAzQKJlBo2Q5NSYDNEpm0ChZTsVDgEbJDBoly6kxGaBRMoNGyXLlhnCNNoBGyQwaJcsJNwRYlMxgUTKKRckAFiUzWJRMkiIpVigO8EODRclyPNcwA0iUzCBRMsmJpBmUPJ8BHEpmcCiZ4lAyMNMuAziUzOBQMsmJpEjNOYBEyQwSJZOcSJqBC90MIFEyg0TJZmpYBs/cZwCJkhkkSjZT5SSh/KQM4FAyg0PJJCWS5mCiXAZwKJnBoWSSEknzFFhmZgCFkhkUSiYZkTTvZlbpL0luKgC80KBQMsmIpDlIyWYAhZIZFEqmKJR8Bs3NAAYlMxiUTDIiaX7yc372y7kZjgEKJTMolEwdQoHTczKAQskMCiVTFAp8mCkDKJTMoFAyRaHkZ9BLBBiUzGBQshPlhfACBaBQMoNCyU5UYVN4egpQKJlBoWSSEklnCfgEUO1Jww0lI5LO4LkdQKFkBoWSSUYkhY8yZQCFkhkUSnaCb11nAIOSGQxKphgUZDwAGJTMYFAySYikM3g8ABiUzGBQMsWgwLXzMoBByQwGJSMYlAxgUDKDQckkIZLC9fcygEHJDAYlUwwKmCKVAQRKZhAo2anyQqSIKeCGBoOSneK7hhlAoGQGgZKdEruGGUCgZAaBkp3iu4YZQKBkBoGSnVG7hgCDkhkMSnZG7RoCFEpmUCjZGbVrCFAomUGhZJISSeETcRnAoWQGh5IpDgXZdgQ4lMzgULIzFQ3hcAqQKJlBomRnOJGXASRKZpAomTqGgixxABIlM0iUTJEo8BIHIFEyg0TJ1DEUZIkDkCiZQaJk5ziRlwEkSmaQKFl/DgVe4gAkSmaQKJnkRLAlDkCiZAaJkp1TC2WARMkMEiU7J/jkDCBRMoNEyRSJApf2zAASJTNIlOyccEOAQ8kMDiU7p9wQIFEyg0TJzgk3BDiUzOBQMsWhnMCzY4BEyQwSJVfnUGA/zgESJTdIlFzV9AL9OAc4lNzgUHJ1DAX24xzgUHKDQ8nVMRTYj3OAQ8kNDiVXx1BgP84BDiU3OJRcHUOB/TgHSJTcIFHyY1X4HtwxygESJTdIlPwYH5VzgETJDRIl70kU0I9zgETJDRIlP8YrF+YAiZIbJEqeUG4IkCi5QaLkCeGGAIeSGxxKnlBuCHAoucGh5AnlhgCHkhscSp5QbghwKLnBoeQJ5YYAiZIbJEqeKDcEVwg5wKLkBouSEwdRcoBFyQ0WJZesSAqSEDnAouQGi5InKhpCC+UcIFFyg0TJ1XUfJydQe4BEyQ0SJVc3fpycgu0BJzRIlFxd+tF9hlB7qGK+4YMpvkrOAQolNyiUXF39Aa5Rc4BCyQ0KJVdHUE7AaWEOUCi5QaHkxBGUHGBQcoNByVNiPM4BBiU3GJRcHUE5Bc915gCDkhsMSp4SgRAgUHKDQMkzKhACBEpuECh5RgRCgD/JDf4kz6hACPAnucGf5BkVCAH+JDf4kzyjAiHAn+QGf5JnVCAECJTcIFByyYd02EE/BgiU3CBQ8owIhACBkhsESp4pN4SW+TnAn+QGf5JLPiSFq3PnAIGSm3eGSD4khU+559C1Iea9ITme/Z9DN4eYV4fkKT4UQJeHmLeHqOtD4KEAuj/EukAkx4cC8AoRwwfzGT4UQLeImNeI5Cf4UABdJGLeJKK4E3gogO4SMS8Tyc/woQC6TsS8T0RRJ6fwRSjQlSIGd5LP8LT/HKBOcoM6yVUFLzjnPQeok9ygTnJ1/gQuk5AD1EluUCe5ZELgpPkcYE5ygznJ1fETuExCDlAnuUGd5Or4CVwmIQeok9ygTnJ1/ARO288B7iQ3uJNcHT+ByyTkAHeSG9xJro6fwGUScoA7yQ3uJFcFvOAyCTlAnuQGeZKfqLx/OJQC5ElukCe5Ik/gows5QJ7kBnmSqxJe8NGFHCBPcoM8yVUNL/joQg6wJ7nBnuSqhhdcJiEH2JPcYE9ydQAFLpOQA+xJbrAnuarhBR+eyAH6JDfok1zRJ6fw3UoAfZIb9El+gnPJOcCe5AZ7kp/gKQ05wJ7kBnuSSzIETtzPAfIkN8iTXJEncOJ+DpAnuUGe5Kf4NRI5wJ3kBneSn6qca/hGL4A8yQ3yJJdcCJy4nwPcSW5wJ7nkQuDE/RzgTnKDO8kVdwIn7ucAd5Ib3EmuSniBifs5wJ3kBneS94dP4EAAcCe5wZ3kkguBE/dzgDvJDe4kV9wJnLifA9xJbnAnueJO4MT9HOBOcoM7yfvjJ/CQBnAnucGd5Io7gRP3c4A7yQ3uJO+5EzBxPwe4k9zgTnLFncA3weQAd5Ib3ElOcCc5wJ3kBneSU9xJDnAnucGd5AR3kgPcSW5wJznFneQAd5Ib3ElOcCc5wJ3kBneSU9xJDnAnucGd5BR3kgPcSW5wJznFneQAd5Ib3ElOcSc5wJ3kBneSK+7kFLnyD3BDgzvJCe4kB7iT3OBOcoo7yQHuJDe4k5zgTnKAO8kN7iQ/p9wQ4E5ygzuZHeNuOAOok5lBncyOCTecAdzJzOBOZseEG84A7mRmcCezY8INZwB3MjO4k9kx4YYzgDuZGdzJ7Fi5IbhlOAO4k5nBncyOcTecAdTJzKBOZv8/Z/e6G0mOpAn7Xvr3YBE8mNE4d7DXsPiQUGVGZsWUUtLqUF3Vg+/e14N0upyvv/RmDrAHIaPaFIqgu5N8zIyFQvhGgxA6EaATudQ9a7bRIEROBORELnXPmm00CJETATkRV/es2UaDEDgRgBNxdc+abTQIgRMBOBFXU7vYRoMQNxFwE3E1mYFtNAhhEwE2kVp6YoMDRMkIBDaRk9ITIWoioCZS1eS+RD3s1QlBEwE0kYIg3thenxA0EUATqWhi/ChSoiYCaiJunNclRE0E1ESqmtDz0oSoiYCaSFUTntkmhE0E2EQqmxg/EpW4iYCbyEnvLiFuIuAmUt3E6FaREDgRgBOpcGL8aFUCJwJwIidwIgROBOBEau8uvkAXAicCcCLFQfipjELcRMBNpPbuWhb40f6Xx99PBiG4iRQG8ZkdeiCETQTYRAqD+MwKuISwiQCbSFEQn1mWsRA1EVATKQjiM6vfEoImAmgiYdzFUIiZCJiJFALx991K8r8nAxDIRMJJsr8QMhEgEykE4jM9OkSImQiYiVQz4U0IhaCJAJpIOLkPEjMRMBOpZsJTG4WYiYCZSKyZhfQ7JGYiYCZSzYSnNgpBEwE0kYomPLVRiJoIqIlUNeGpjULYRIBNpLIJz0wU4iYCbiLVTTK/kxI4EYATiWO6EwInAnAia+cufiEQORGQE1mLTugWhxA5ETyN/UROhJ3Hjgeyr0UnrOpF2JHseCZ7rTnJ/FnCjmXHc9kLhAyeJexkdjyavZac8GcBO5z9cDp7vRfSPSKhB7TDIKwlJ/xhws5ox0Pai4IEfk6lsHPa8aD2teSEPo3YUe14VnutOOFPM3ZaO6CJ1IoT/jQjZiJgJlIIJFxoJawQMxEwEykEEi78XkzMRMBMpBac8OchIRMBMpEiIOFC2UgImQiQidSCE1r0I0RMBMREar0Jn1ARMBEAE6lgwouGhICJAJhIAZDAGwgKERMBMZEiIIF3jhNCJgJkIidnugshEwEykfXYE7pDJYRMBMhECoHwHSohZCJAJrIee0J3qISQiQCZSCGQwQ4VIRMBMpF67Mlgh4qYiYCZSD32ZLBDRcxEwEykduwa7FARNBFAE0lnz2OCJgJoIqkOQz6vJGoioCZiJ8OQoIkAmojVmyGf0hA0EUATWc89oc0lhKCJAJpIMZBw4U90giYCaCJW74Z8l4+giQCaSDGQ4PgTkaCJAJpIQZDgaCKBEDURUBMpCBIcTSQQoiYCaiJFQYLjTwTCJgJsIkVBguM3VMImAmwi+WQgEjYRYBMpChIcvyETNhFgE6l9u2j1mhA1EVATKQgSHL8UiZoIqIkUBAmOX0pETQTURPLJZiFBEwE0kVyHIb+SiJoIqInkOgz5lUTUREBNJI/zGISoiYCayKom/KFI1ERATbQoCH8oKlETBTXRqib8oahETRTURC/jAyeUoIkCmuhacEIfikrQRAFNtKIJfygqQRMFNNFacMIfikrQRAFN9HKyW6NETRTURIuCBE933ZWwiQKb6GU8DJWwiQKb6OVkGCpxEwU3UXcyDImbKLiJurNhSOBEAU705NwTJXCiACfqzoYhkRMFOVF3NgyJnCjIibqzYUjoRIFO1J0NQ2InCnairg5DmqitBE8U8ETdyTAkdqJgJ+rOhiHBEwU8UX8yDAmeKOCJ+rNhSPBEAU/UnwxDYicKdqL+bBgSPFHAE/Vnw5DgiQKeqD8bhgRPFPBE/dkwJHqioCfq6zCk9XtK9ERBT/Tk/HgleqKgJ+rPhiHhEwU+0XAyDAmfKPCJhrNhSPxEwU80nAxD4icKfqLhbBgSQFEAFA1nw5AIioKgaDgbhoRQFAhFzwhFCaEoEIqGOgypBCshFAVC0XAyDImgKAiKhrNhSAhFgVA0ngxDIigKgqLxbBgSQlEgFI0nw5AIioKgaDwbhkRQFARF49kwJIKiICgaz4YhERQFQdGztl1KBEVBUDTWYUjXqUoIRYFQ9KRtlxJBURAUjeNUayWAogAoKuNUayWAogAoKiep1koERUFQVMap1koARQFQVE5SrZUIioKgqIxTrZUIioKgqIxTrZUAigKgqJykWisRFAVBURmnWisBFAVAUTlJtVYiKAqCojJOtVYiKAqConqSaq2EUBQIRfUk1VoJoSgQiupJqrUSQlEgFNWTVGslhqJgKKonqdZKDEXBULSYSPB0w0oJoiggiuo4rUYJoiggiupJjqsSRFFAFNWTemQliKKAKKrjemQlhqJgKJpO6pGVIIoComga1yMrMRQFQ9F0Uo+sBFEUEEXTST2yEkRRQBRNJ/XIShRFQVE0ndQjK1EUBUXRgiLB031PJYqioCh60rVLCaIoIIoWE+EHGyoxFAVD0Woonu67KjEUBUNRO3kkE0NRMBQtJDJ4IBFCUSAULSLCT0ZUIigKgqIFRAaXIQEUBUDRCiie7hsrARQFQNHiIYPLkPiJgp9o4RB+tKISPlHgE61FJ/xoRSV8osAnWjRkcLSiEj5R4BOtVSf8aEUlfKLAJ1pPjudHKyrxEwU/0Vp2wo9WVOInCn6iteyEH62oBFAUAEVr2Qk/WlEJoCgAitayE360ohJAUQAUzWf3QiIoCoKi9fB4frSiEkFREBStdSf8aEUlgqIgKFoPj+dHKyohFAVC0VzvhtRwlBCKAqGkyxjyEiGUBISSiogE3ms/EUJJQChpPfiEZSomQigJCCUVEQm8VX4ihJKAUFIRkcB7rCdCKAkIJZ2ce5KIoCQQlHR27kkigpJAUNLJuSeJAEoCQEln554kIigJBCWdnHuSCKAkAJR0du5JIoKSQFDS2bkniQhKAkFJZ+eeJEIoCQglnZ17kgihJCCU5OowpDtuiRBKAkJJJ8UniQhKAkFJJ+eeJAIoCQAlnZx7koifJPCTdHLuSSJ+ksBP0tm5J4n4SQI/ScVDAu8RnwigJACUtAIKS1VMxE8S+ElaDz6h3wDxkwR+kny9FdI1aiJ+ksBPkj9ZniTiJwn8JBUOCYGuLhLxkwR+kgqHBN6lPhE/SeAnyY+XJ4nwSQI+SYVDQqCz40T8JIGfpMIhIdAnciJ+ksBP0snJ8Yn4SQI/SYVDQuRPZOInCfwkFQ8JkT9RCaAkAJRUPCRE/kQlgJIAUFIYn7+TiJ8k8JNUOCREfi8lfpLAT1LhkBD5rYD4SQI/SSdduxLhkwR8kuqxJ/xmTPgkAZ+klU/ozZjoSQI9SfXUE34zJnqSQE/Sqif8Zkz0JIGepPXQE3ovJXqSQE9S1RN+LyV4kgBPUjy7FRI8SYAnKdYxyG/GBE8S4EmK4w3DROwkgZ2kaieR34uJnSSwk1QsJPCTFhLBkwR4kgqGhEj7AiSiJwn0JBUNCfyohUT4JAGfpKIhgR+1kAifJOCTVDhk8CUQPknAJ6nWn9BVdiJ6kkBPUtGQIPxeTPgkAZ+kwiF8tysRPknAJ6loCN/tSkRPEuhJqnpCd7sS0ZMEepJk3JkhETxJgCdJTpYmBE8S4EkqFsI3qxKxkwR2kmrLLr5ZlYidJLCTVFt28c2qROwkgZ2k2rKLb1YlYicJ7CTVll18syoRO0lgJ6m27OKbVYnYSQI7SbVlF9+sSgRPEuBJqnjCN6sSwZMEeJLqofF8syoRPEmAJ6keGj9YHxI9SaAnaT3yhG5WJaInCfQk1RIUvlmVCJ8k4JNU+YRvViXCJwn4JKVxYXIiepJAT1I6mRYSPEmAJ6lYSBA+LyV4kgBPUsUTfu5NIniSAE9SwZDAj51JRE8S6EkqGhL4sTOJ8EkCPkmVT/ixMYnwSQI+SYVDAj/2JRE/SeAnqdag8CNHEgGUBICSCogEfmJIIoKSQFBSrUHhZz0kQigJCCVVQlH+VCaEkoBQUq1B4V36EzGUBIaSag0K76+eCKIkQJRUa1CUj0SCKAkQJdUaFOUjkSBKAkRJtQZF+UgkiJIAUVIxkaB8JBJESYAoqRahKB+JBFESIEoqJhJ4k/JEECUBoqQ87haSiKEkMJRUDWWwdUwMJYGhpEIig+kVIZQEhJIqoQy2jgmhJCCUVERkMD8jgpJAUFIVlMHWMRGUBIKSahHKYOuYCEoCQbH12BO6UjRCKAaEYrUKhU8NjBCKAaFYIZGQ6P3MiKEYGIpdxsPQCKEYEIrVo+N5nwEjhGJAKFZbd/GTGY0YioGhWD32hFapGyEUA0Kx2rqLn8xoxFAMDMVq7y5+MqMRQzEwFKvNu2iRthFDMTAUq827eJG1EUMxMBQrJBJ4p3ojhmJgKObGa2UjhGJAKObGa2UjgmIgKFZAhC91jQCKAaCYG2caGgEUA0CxAiJ8qWsEUAwAxdyY8YwAigGgWAERfis1AigGgGLFQ/hS14ifGPiJ1XPj+VLXiJ8Y+IlVP+FLXSOAYgAoVgGFL3WNCIqBoFitQOFLXSOCYiAoVgWFL3WNCIqBoFitQOFLXSOCYiAoVitQ+FLXiKAYCIrVg0/4UtcIoRgQivmTMnkjhGJAKFZLUPhS1wihGBCK1ZNP+FLXiKEYGIrVGhS+1DViKAaGYtVQEp3gGzEUA0OxcPJIJoRiQCgWTmaGRgzFwFAsjGeGRgjFgFAsnMwMjRCKAaFYGM8MjRCKAaFYOJkZGjEUA0OxcDIzNIIoBohiBUVCoos0I4pioCgW6yOZLtKMKIqBolisw5Au0owwigGjWDzp6mrEUQwcxeJJV1cjjmLgKFYdhXfbN+IoBo5iJ45ixFEMHMUKiwymJYRRDBjFKqPwJt1GGMWAUayoyGBeQxTFQFGsoMhgXkMQxQBRrJjIYF5DDMXAUEzGrWuMGIqBoVg9/ITfCIihGBiKFRIZzGsIoRgQitWzTwbzGmIoBoZi9eyTwbyGIIoBolg9+2QwryGKYqAoVs8+GcxrCKMYMIrVs08G8xriKAaOYvXsk8G8hkCKAaRYhZTBvIZAigGkWIWUwbyGQIoBpJiepHgZgRQDSLEKKYN5DYEUA0ixCimDeQ2BFANIsQopg3kNgRQDSLHiIoG3ejcCKQaQYidnnxhxFANHseoo/CwmI45i4ChWWIQfpWSEUQwYxSqj8IOMjDCKAaNYZRR+iI8RRjFgFKtVKPwQHyOOYuAoVqtQ+CE+RiDFAFKsVqHwI3SMQIoBpFiFlPuHeOjeY8RRDBzFTopQjDCKAaNYPf6E9yg2wigGjGJFRXhfSSOKYqAoVo8/oS31jCCKAaJYPf2E9qU0YigGhmL18BPaVtIIoRgQitWzT2hXRyOCYiAoVo8+oRRoBFAMAMWKh/AexUb8xMBPzGpbTdaT0QifGPCJ1RqUwbOA8IkBn5jVFsO0R7ERPjHgE6t8wpvVG+ETAz6xkxZeRvTEQE8sn7Q0NKInBnpi+WReSPDEAE8sn7Q0NKInBnpiedzS0AieGOCJ5ZOWhkb0xEBPLJ+0NDSiJwZ6YvmkpaERPjHgE8tnezWETwz4xGoBivFdY8InBnySTwpQMtGTDHqSLyfDMBM9yaAn+TIehpngSQY8yZeTYZiJnmTQk3wZD8NM8CQDnuTLyTDMBE8y4Em+nAzDTPQkg57ky8kwzERPMuhJvpwMw0z0JIOe5EsdhnS/LRM+ycAn2Z0MQ6InGfQku7NhSPQkg55kdzIMiZ5k0JPszoYh4ZMMfJLdyTAkfJKBT7I7G4bETzL4SXZnw5AASgZAye5sGBJBySAo2Z0NQ0IoGQgluzoM6Y5fJoaSwVCyPxmGhFAyEEr24xL5TAQlg6DkAiJ8rykTQMkAKLkeG8/7lWQCKBkAJRcP4f1KMvGTDH6S6/EnvF9JJn6SwU9y4RDeryQTPsnAJ7loCN9ty0RPMuhJrsfG834lmehJBj3J9dh4ukeQCZ5kwJNcjz/h/UoywZMMeJKLhfB+JZnYSQY7yfX8E96vJBM7yWAnuR6AwvuVZIInGfAkFwsZ9CvJBE8y4EmuR6DwfiWZ6EkGPcn12HjeryQTPcmgJ7k28DJKB5nwSQY+yScNvDLRkwx6kguG8G3zTPAkA57kiif8JKZM8CQDnuRiIYNbGbGTDHaSC4UMLmRCJxnoJBcJ4dvmmchJBjnJBUIGEwICJxngJMdxm4ZM3CSDm+Q4btOQiZtkcJMcT9o0ZAInGeAkx5M2DZnASQY4yfGkTUMmcpJBTrKctGnIhE4y0EmWkzYNmdhJBjvJctKmIRM8yYAnWU7aNGSiJxn0JMtJm4ZM+CQDn2Q5adOQCZ9k4JMsJ20aMuGTDHyS5aRNQyZ8koFPspy0aciETzLwSZY6L6SImQmfZOCTrCfzQqInGfQk1xZe9GTBTPAkA57k2sGLniyYiZ1ksJNcKCTwU+kysZMMdpJ1nPufCZ1koJNc6YQWVGYiJxnkJBcICUbhIxM5ySAnuUAIPdkwEzfJ4Ca5FqDQgs5M3CSDm+R6AorRVOVM3CSDm+TiICHT9mGZwEkGOMnrEShsyzkTN8ngJjmdHD2RiZtkcJNcGCRkulWViZtkcJNcGMQnehEQNsnAJrmyCa1pzURNMqhJrieg0JrWTNQkg5rkswNQMmGTDGyS00mSayZskoFNcmGQwVVM2CQDm+RafJL5Ng9xkwxukmvxSeYLdAInGeAk1+KTzOfVRE4yyEk+OwAlEzrJQCe5Fp9kPjEmdpLBTnItPuGnG2aCJxnwJNfiE34wXiZ6kkFPci0+yfxmSvQkg57kWnyS+d2M6EkGPckFQxK9GxM7yWAn+cROMrGTDHaSC4XEC8WbTOwkg53kYiHLbIoHIMMQ8CQXC4kXfiURPMmAJ7lgSLzwK4noSQY9yQVDIj/UKxM9yaAn+eTU+EzwJAOe5LV7lxIDzMROMthJXu0k0f89GYNAJ7lISOSHkmVCJxnoxF1O7GR9sY+w/8cWoo5EejNYXz3EcBijDkZ6P1hfPcTwGKPs2YTMbovrq4cYAWOM54jri4cQEUPUQUnvTOurhxiCMbTEoDen9dVDDMUY97EWHb1BrK8eYiSMYSUGvUesrx5iGMYYP7DXFw8hcJDW5l70MltfxBAOB2nFFXqlrS8eQuAYLVwSHb3fra8eYuAYdeOc7PXFQwgcovWglNGHwYaowyFanWX0YbAR6nCEFjiJjt6711cPMXCEunEKzvriIQQO0JVb6C7p+uohBg7Q2vUr0OM911cPMXCE1sKVQNFifRVjeByitXYlUHdYXz3EwDFay1cC3fpfXz3EwDFaK1gC3TxfXz3EwEFai1gC3T9fXz3EwFFaWCXyE+bWVw8xcJienES/vngIgaPUn3TNXl89xMBh6sctSNYXDyFwlK6HqlCcXV89xMBRWpiF7+euL2KIgIO0lrVwol1fPcTAQRpqE22qtOurhxg4SMNJVcH66iEGDtJwUliwvnqIgYM01EFKZ2Drq4cYOEjD2SAlUrP/xxaiPuwHczCCNft/bDHqw34wByNgs//HFqOUoNI9qvXFQwgcpPXgehncSgnb7P+xxShTUjeYgxG62f9jizGuRV1fPITAQbqWvgxuHURw9v/YYpRFkmN5ruuLhxA4RgvLxLsEshBsiEYcokVmoh88I4nl7P+xxRgXp64vHkLgEC08E/1obLAhGnGIxtMbKTGd/T+uMQrSRD94VBPW2f9jizHOs1hfPITAIVqkJnp+tRHa2f9jC3FyRND66iEGDlE5OSVoffUQA8eo1DE6uI8S49n/Y4uhZ88Ewjz7f2wxTrJy11cPMXCUSh2lg5sxwZ79P7YYZ6smwj37f1xD1ENbRhcLIZ/9P7YYBX1oa+31xUMIHKTVffxgSkrkZ/+PLUZZ2nuaULK+eoiBo3Q9v2UwrSUAtP/HFqMkZfjBtJYg0P4fW4x6Kx08ZokD7f+xxThbOREL2v9jC2FnzybiQft/bDHGx7msLx5C4CA9O9FlfRVjJBykJ4e6rC8eQuAgPTvXZX31EAMH6dnRLuurhxg4SM9Od1lfPcTAQXp2wMv66iEGDtJUB+lgAkWkaP+PLUapeqUnjK8vHkLgIK0nvfDnG8Gi/T+2CGWHlJ9usL56iIFjtAhQ5AcUrK9iDMMxWhAo8jMG1lcPMXCQFgeKwbP+LOurhxg4SAsFRd4jfn31EAMHqdXFPXXc9dVDDBykBYTiaKOCENL+H1uM8rwPNNNzffUQAwdprcKJrApqffEQAgdpPQsm0Dqc9dVDDBymRYci77u+vnqIgcM012Gq/H0QU9r/Y4tRh2kaxGDDNOMwrbDE+5+vrx5i4DDNlTgH6w2CS/t/bDGKctIKwfXFQwgcpRWYeCf29dVDDBylxYwib6a+vnqIgaM0ny2dCDTt/7GFKJPSyNJ31hcPIXCQVm2KLHlhffEQAsaoK3gUI38oOOZNDr3J1fNieBrJ+uohhsMYZYxGlgexvngI4TFEuZPy7tzrq4cYAWOMEzTXFw8hIoYoU1Klfc/WVw8xBGPUIcqnxo5xk0Nucpdxr5X1xUOIhCHqEOUzY8e0yaE2uUsdo3zi4hg3OeQmV/CIV+auL2II5CZX8ChGbpGOeZNDb3LVm3jn8fXVQwwcpEWPotCr3jFvcuhNruhRvO/H0T+FDVIEJ1f4KMrgsmfi5FCcXBUn3vh2ffUQAwdp8aMowj8ONkhRnFzhoyj8KeuYODkUJ7eKE5+4OCZODsXJ+XETgvVFDIHg5IoeReEPe8fAySE4OV8H6eB6Y+DkEJxcBafEV9WOgZNDcHIVnBKtt1hfPcTAUVrBiXcFXl89xMBRWmt/Bnd0Bk4Owcn5szsp8yaH3uSKHkXennh99RADB2nRo8g7FK+vHmLgIC18FHmT4vVVjIHi5AofRd6neH31EANHaeGjyFsVr68eYuAoLXwUlU/zHRMnh+LkCh+FC9+Sc0ycHIqTq+LEmx6vrx5i4CgtfjQaYkycHIqTK3zkMp0MOgZODsHJ1fZqtAPD+uIhBA7S2mCNF3isrx5i4CCNdZAOph0MnByCk6vgxPtAr68eYuAgjXWQZvpxMHByCE6u6FHkBzSvrx5i4Bit4DSYGjNwcghOroIT7wO7vnqIgUO08JGTwZyUiZNDcXLFjyJvobi+eoiBg7SSE+/At756iIGjtPhR5E341lcPMXCU1kKiwdSFiZNDcXLiTmY/TJwcipOr4sS7Aa6vHmLgIC1+NJhOMnByCE6uHmkziMBGKHKTq9zEWwKurx5i4AgtdhTTYPrEuMkhNzmpI3Rw32Dc5JCbXC0tGn2tbICiNjmpnaNpVv766iEGDtBiRzENZk+Mmxxyk9NxweX64iEEjlAd11yuLx5C4AAtdDSawzFscohNTsedENYXDyFwiBY44sWT64uHEDhCa682Xj+5vnqIgSO0wFHkTYLWVw8xcIQWOPK06mR98RACR2iBI6+st/n64iEEDtDiRn6ZOLEQTJocSpMrbuSXqQINwcYnSpMrbOSXmQINwcYnQpOrh+BEoxMF5kwOncnVOiRxPAQbn8hMrphR5G171lcPMXCAVmbiPVfWVw8xcICmOkAHD2jmTA6dyaWaRjqY2zNpcihNLtWW0zQv1zFocghNzmqeM83LdcyZHDqTq87Ei/bXVw8xcIjWAqXBBr5jzuTQmVx1Jl57v756iIGDtKBR5CWv66uHGDhKqzPxqtH11UMMHKVWR+ngIc2cyaEzuaJGvHp2ffEQAgdp7fdGC2jXFw8hcIxWZuIlnOurhxg4SHMVe1pEub6KMZCZXGWmPHioMGZyyEyunpzjBmsdxkwOmclVZnKDzXPGTA6ZyVVmcoMJLXMmh87kqjPxutL11UMMHKUFjYIbTIuZMzl0JlfUKPLiyPXVQwwcprkOU4r2jkGTQ2hyhY1GKaCOSZNDafJVmniZ5voqxPAoTf5SS975Xq9n0uRRmnyVJl7tub56iOExRh2m/IbsGTV5pCZf4Cjyms/11UOMiDHGDf3XFw8hBEOc9PRfXz3EUIxxskHqGTV5pCZfqYkXsK6vHmIYxig3U17Dur56iIGj1NVRyh8tnlmTR2vy1Zp4Jev66iEGjtICR3LhN1PPrMmjNflqTYP0FM+wySM2+SJHcuE3ZM+wySM2+SJHcuE3ZM+wySM2+SJH48+DDVPEJl/oSHh56/rqIQaO00JHwitc11cPMXCcFjoSXiS6vnqIgeO02JEMajw94yaP3OSLHcmgxtMzbvLITd7XcTq4Xhg3eeQmX+xIBsWVnnGTR27yxY5kUFzpGTd55CZf7EgGkw/PuMkjN/mCR8NrjnmTR2/yRY9kUNfoGTh5BCdfW85FWmLgmTd59CZf8Eju8xcWgo1S5CZf+85lXg3oGTd55CZf7Egcnb54pk0etckXOpJBTZBn2uRRm3xtQOepa3iGTR6xyRc5GniCZ9bk0Zp8qEN0cNkza/JoTb7Ikdxb6bEPlI1QtCYf6gg1HoINULQmX+RIeBmNZ9bk0Zp8gSPhZTSeUZNHavLFjcTTVaBn0uRRmnyVpkGujmfS5FGafHEj8XQl6Zk0eZQmX9hIPL9aGTR5hCZf2Eh49Ypn0OQRmnxRI35m4/riIQQOz4JGMig88cyZPDqTL2gkg4IPz5zJozP5gkbi+WXCmMkjM/lYByi/TJgyeVQmL3WA8rwlz5jJIzP5gkYS+HXCmMkjM/liRhL4dcKUyaMy+YJGEvgYZ8zkkZl8USMZ5Ep7Bk0eockXNZLABzlzJo/O5AsaSaC+4xkzeWQmX8xI7qnBLAQbn6hMvpiRhMHsjTGTR2bylZnokRXri4cQOEBrURM/ZXV9FWOgMvla1MTPOV1fPcTAEap1hA4mosyZPDqT1zpE+TOJOZNHZ/JFjSTyy5U5k0dn8kWNZJCf7Bk0eYQmr3r2l7Ahis7kCxpJ5FtgnjmTR2fyRY2EJyh75kwenckXNZI4uOYZNHmEJl+haTB3Y9DkEZp8qnn4g3k9kyaP0uSLG0kcrB0ZNXmkJl+paXDFMmrySE2+UtPoimXW5NGafKrPee7TnlmTR2vyBY6GVz2zJo/W5FMdpIPJArMmj9bkUy2z59cKoyaP1OTXoib+hGXU5JGafK1pGhR0e2ZNHq3JV2saFJh6Zk0ercnXmqZBJbVn1uTRmny1psFEklGTR2ryVu+jgxkcoyaP1OSLG42uFSZNHqXJFzaSSAHQM2jyCE2+QtPocmPS5FGafJWm0aXCqMkjNXmrN9LBnjWjJo/U5IsbSRzs1DBq8khNvriRDLLoPaMmj9TkT44ZWl88hMAxWpvl8fIbz6DJIzT5okYigyckgyaP0OQrNA2ekMyZPDqTzye5o54xk0dm8sWMRAY7ToyZPDKTL2gkMnhQM2fy6Ey+OtPg3sOYySMzhcpMgwd1YMwUkJlCbaA3yCwOjJkCMlMoZjTYgAtMmQIqUyhkNNiACwyZAiJTuNQz2fgGXGDIFBCZwqXuOdG7eWDIFBCZwkXHE7DAjCmgMYXaPY9vngVmTAGNKVzqlhNd0QdGTAGJKVzqnihd0QcmTAGFKRQuGmx8BQZMAYEpFC0abHwF5ksBfSlUX+IbX4HxUkBeCpWXBhtfgfFSQF4KlZf4xldguhRQl0LVJb7xFRguBcSlUHGJz1cCs6WAthRcfcrTja/AaCkgLQV3suEUmCwFlKXgTjacAoOlgLAU/NmGU2CwFBCWgj/ZcArMlQK6UvAnG06BsVJAVgr+ZMMpMFUKqEqhqhLfLAoMlQKiUqioxDeLAjOlgKYUfF3M082iwEgpICmF4kN+UIoeGCkFJKXg6wOeL18DM6WAphSqKQlfrwWGSgFRKRQhEuFLg8BQKSAqhYpKwjfPAlOlgKoUag3ToKQ0MFUKqEqhGJEMqvUCY6WArBRCnYbySXlgrhTQlUJ1pUF9WmCuFNCVQnWlQX1aYLAUEJZChSXlqQKByVJAWQpVlgb1aYHRUkBaCpWWBvVpgdlSQFsK1ZZ0MNYZLgXEpVCkSAa1ZYHhUkBcChWXBikcgelSQF0KsbZy5tWcgfFSQF4KlZcGZV2B+VJAXwrxZEkfmC8F9KVQfUn5OjgwXwroS6H6kg4uOeZLAX0pVF9Kg0uOAVNAYAqxlonwvYXAhCmgMAWpG/g0kT8wYAoITEHO9u8DE6aAwhSqMA1K1AIjpoDEFCoxDcrLAjOmgMYUqjENyssCM6aAxhSqMQ3KywJDpoDIFORsycSQKSAyhYpMg9qwwJQpoDKF2jpvUMAYmDIFVKZQzGiwQRGYMgVUplDISAblYYEpU0BlCurOni1MmQIqU9Czjk+BKVNAZQpVmQZlaoExU0BmCpWZ0uAmxpwpoDOF6kyD+rDAnCmgMwU9qa4PzJkCOlOozjSoZwrMmQI6U6jONCh9CQyaAkJT0LNRypwpoDOFokYyqJ4JDJoCQlMoaiSD6pnAoCkgNIWiRqM/hTlTQGcKRY2EJ40H5kwBnSkUNBpeK8yZAjpTKGgkg6qVwJwpoDOFWtM06GwWmDMFdKZQj1kaNAgJzJkCOlOoNU28s1lgzhTQmUJRIxkU4AQGTQGhKVRo4tWpgTlTQGcK1ZkGLVcCc6aAzhTMn32izJkCOlMoajRouRKYMwV0plBLmgYtVwJzpoDOFIoajdqlBAZNAaEp1NZ5g3YpgUlTQGkKVu+kgwk2k6aA0hSs3kkHC1ImTQGlKVRpGhQ1BSZNAaUpVGkaFCQFJk0BpSnkWi3CFwsMmgJCU6jQRA98XV88hMBBmmtx6GCOzqQpoDSFXMl+MMFm0hRQmkJxIxmUNAVGTQGpKRQ4kkE5UmDWFNCaQrWmQR1QYNYU0JpCtaZBDU9g1hTQmkKRIxnU3wSGTQGxKa41TfTmEZk1RbSmWOBIBoUvkVlTRGuKRY5kUPgSGTZFxKZYsWlQ+BKZNkXUpnip26WUNiLDpojYFCs2cQ+NDJsiYlO81EHKbz+RaVNEbYqXul9KH5KRaVNEbYrFjnzmU/TIuCkiN8WCR4PGd5FxU0Ruiq6m4NNZR2TcFJGbYsGjESJG5k0RvSkWPfKZnRS6vngIgSPU1RakfCkamTdF9Kbo6o2UMk1k3hTRm2LRI58HIdgIRW+KRY98ZoeGri8eQuAALXo06scaGThFBKdY+GjU/CoycYooTrH4kb/PwdinwUYoilMsfBQuvE42MnGKKE7R1x0ouokVmThFFKdY/Ej5+Y3rq4cYOEQLIOlgqzUyc4poTrEIkl74HZCZU0RzikWQdFDoFhk6RUSnWA9qGhS6RaZOEdUpFkLSQaFbZOoUUZ1iISQdFLpFpk4R1SkWQhp+pGyQIjrFIkg6qJWLDJ0iolMsgqSDWrnI0CkiOsXgT/4UZk4RzSmGOkgHz0dmThHNKRZAGkytIyOniOQUix/poF1AZOQUkZxiPahpcBxiZOQUkZxi8SMdVNtFRk4RySkWP9JBqX9k5BSRnGI9qWkwx4+MnCKSUyx+pIMT2iIjp4jkFIsfDb8XRk4RySnWo5pGnwcjp4jkFIsfqeNJWJGRU0RyisWPdFAuFxk5RSSnGOs4HVz5zJwimlOMdZwOrnxmThHNKcZ0cskxcopITrGSE89mjUycIopTPBWnyMQpojjFVZwGI52RU0RyilJH6eAmxsgpIjnF4kfqB098Rk4RySkWP1I/uAMxcopITrH4kfrBHYiRU0RyisWPRk1gIiOniOQUz8gpMnKKSE6x+JH6wcyDkVNEcorFjwY95yITp4jiFIsfJb63GJk4RRSnWPjILjwEA6eI4BSLHg0630XmTRG9KdbmeX7wLtgIRW6KtXleGIRgAxS1KRY64hYQmTVFtKZY4Ej94MHErCmiNcUza4rMmiJaUyxwZHyzNzJqikhNsbiRDVb1TJoiSlOspzQNdo2YNEWUpljYaHDiQmTQFBGaYj2kabBUYc4U0ZlidSYOqpE5U0RnikWN8mCiwJwpojPFgkYDBYiMmSIyUyxmNACzyJQpojLFQkaZk0hkyBQRmWIRozwYncyYIhpTLGI06FEZmTFFNKZYwCgPRicjpojEFGvbvNFODTOmiMYUCxiNWmVGZkwRjSlWYxo0nonMmCIaU7T6gB9MQxkyRUSmaGdaHxkyRUSmWMRoIBGRGVNEY4oFjHRQFR+ZMUU0pmj1AT+YDTNjimhMsYDR6IJlxBSRmGLxIh0chxYZMUUkpli8SAcnkUVGTBGJKRYw0sFJZJEZU0Rjirl2J+GPV2ZMEY0p5pPmJJERU0RiivmkOUlkwhRRmGIVJl5fERkwRQSmWIGJ11dE5ksRfSlWX+L1FZHxUkReipWXeH1FZLoUUZdi1SVeXxEZLkXEJbnUTHy61SMMlwRxSSou8doIYbYkaEtSbYnXRgijJUFakkpLvLBBmCwJypJUWeKFDcJkSVCWpMoSL0oQJkuCsiRVlnhRgjBYEoQludTGD4MvlYxOQViSWsbEbUqYKwm6ktQyJl5RIMyVBF1JihLp4PxEYbAkCEvi6t2TL3yFwZIgLElhIh30BBEmS4KyJIWJNPDViTBZEpQlcSc7osJkSVCWpFYy8e0ZYbIkKEtSZWmwPSOMlgRpSdZSJr49I4yWBGlJ6qFM/MwKYbIkKEtSnEgHJzAKoyVBWhJfBymf8QijJUFaEl8HKZ/xCLMlQVuSeigTn4cKoyVBWhJfM/Cp1QmTJUFZEl8T8gbvgg1RlCWpsjTosiJMlgRlSaosBb7CECZLgrIkhYkib7MiDJYEYUkqLA3arAiDJUFYksJEg60qYbAkCEtSlGiwSSTMlQRdSQoSDTZGhLGSICtJQaLg+QpFmCsJupIUJBosooWxkiArSUGiwfJVGCsJspIUIxqtG4WxkiArSWWlQesbYawkyEoS6gjlcwWmSoKqJKHeRPlcgaGSICpJESKNgycsQyVBVJIiRKPvlZmSoCnJ2iNvcOthpiRoSlJNadAISJgpCZqSxJOKemGkJEhKUnxosNQSJkqCoiTxpAWZMFASBCWpoDRoJSQMlARBSQoP6aB3jjBREhQlifUmyre9hJGSIClJrGN08IBlpCRISlJ8SAenjAojJUFSkkpKg2w+YaQkSEpSSUn4zpcwUhIkJamkNGgrIoyUBElJKikNGnoIIyVBUpLiQzpo6CGMlARJSQoQ6aBmWJgpCZqSVFMa1AwLMyVBU5IiRDqoGRaGSoKoJIWIdFAzLEyVBFVJihHpoN5XGCsJspKs3fJ47y1hriToSqJ1nPK9L2GwJAhLUphIBzXDwmRJUJakQJEOaoaF2ZKgLUm1pcGZlsJsSdCWpEiRDmqGheGSIC7JWsjEb+sMlwRxSQoV6aDsWJguCeqSFCvSQdmxMF4S5CUpWKSDsmNhviToS1K0SAflvsKASRCYpHCRDk5xFCZMgsIkqQ7TwVBnxCRITFLASAe1usKMSdCYpIiRDgpchSGTIDJJISMdFLgKUyZBZZJiRjoocBXGTILMJAWNdFDgKsyZBJ1JihrpoDpVGDQJQpMUNdJBWagwaBKEJilqpGkwThk0CUKTFDXSwamBwqBJEJqkQtOgHFMYNAlCkxQ1Gp3RKQyaBKFJ7ORMEWHQJAhNsnbNG6wmGTQJQpPYyZkiwpxJ0JmkqJEOKkuFQZMgNEmFJuNMLgyaBKFJKjQNykKFQZMgNEmFpkFZqDBoEoQmKWykg6PIhEmToDRJcSMdFGQKoyZBapICRzqoYhRmTYLWJEWORjsvzJoErUmKHOmgXE4YNglikxQ60kE6iDBtEtQmKXY02gFi2iSoTZLrKB3cOxg3CXKTro3zeJmsMm9S9CYteqSDqj1l4KQITno56e2oDJwUwUkLH+mg1E2ZOCmKkxY/Gtx/lImTojhp8aPBbpYycVIUJ62nMw12s5SRkyI5aQEkHaTpKDMnRXPSIkg6KNpThk6K6KSFkHRQtKdMnRTVSas6DYr2lKmTojppIaTBKefK0EkRnbSi06BoTxk6KaKTVnQaFO0pQydFdNJCSIO7oDJ0UkQndbVWhD/glKmTojppIaTBHUwZOimikxZBGl31zJwUzUmLII2uWGZOiuakBZBGVywjJ0Vy0kpOgzpKZeSkSE7qz3KflJGTIjlpLWcaVEEqMydFc9L1YKbBnYOhkyI6aSGkNMgFU6ZOiuqkhZBGxW7K1ElRnbQQUroMnglMnRTVSYshpQufyCljJ0V20mJIaVCbpYydFNlJKzsNarOUuZOiO2lRpDSozVIGT4rwpIWR0qA2S5k8KcqTFkZKg8IqZfKkKE9aHCkNCquU0ZMiPWmo43RwvTB7UrQnLZCUBoeQKbMnRXvS1Z745cLoSZGetEBSGlRFKbMnRXvSIklpUBWlDJ8U8UnDSfWyMntStCctkuQyTdpRZk+K9qTxpAuEMnpSpCeNtXiZ1lArkydFedLaQI/XPyuTJ0V50ipPvPBYmTwpypMWR3KZiqIyeVKUJy2MNJo9MXhShCetlUy8ZliZOym6k8Y6PAd3UeZOiu6k8eTwG2XspMhOWgwpucHVythJkZ1UarNxmnipTJ0U1Ulr7zyeOKQMnRTRSeWsS4kydFJEJ5WzLiXK0EkRnVTqLXTwWGLopIhOWgQpDar+lKGTIjqp1Hvo4LHE0EkRnVRODhZRZk6K5qRycrCIMnJSJCfVs4NFlJGTIjmpnh0sooycFMlJ9exgEWXkpEhOqicHiygTJ0Vx0sJHaVCKqUycFMVJ9aQLqTJwUgQn1TpGB9MNBk6K4KR6lqinTJwUxUkLH6VBDaQycVIUJy18lAY1kMrESVGctPBRHDRFVCZOiuKkVZwGyQjKxElRnLSe0cQRTxk4KYKTFj1KfrBqYuCkCE5a9CgN6iiVgZMiOGnRozSouVMGTorgpEWPxn8LG6YITlr0KA0OdFQGTorgpBWcBrkZysBJEZw01WE6eCwwcFIEJ63gNMjvUAZOiuCkRY/SoIRGGTgpgpMWPUqD+hdl4KQITmp1nA5uQQycFMFJKzjxnobKvEnRm7ToURqU0CgDJ0VwUqstHnmrSWXgpAhOWvgoDRLalYmTojipnXXUUSZOiuKkdjYtZeCkCE5am+cNWlwrAydFcNJcU/Y4JSoDJ0Vw0qJHaZDfrwycFMFJ1/Z5PNtFGTgpgpOets9TBk6K4KQVnAZ1BsrESVGctPCRV5oVrwycFMFJix55pY2OlHmTojdp0SOvykOwMYrepPWcJk08BBujyE2p2JFfxigJkZg2JdSmdKmJUMZuPolhU0JsSvWUJnE8BBmgCbEpFTlKg+KRxLApITalWt7EF3CJYVNCbEqXepAYHVuJYVNCbEpFjtKg4iIxbEqITelS1018RZwYNiXEplTkaLAiTsyaElpTqgVOow+UDNCE1JSKG6VB7Uhi1JSQmlI9qGkwq03MmhJaU3L1JsqnC4lZU0JrSqs18WlcYtaU0JpStaZB6Udi2JQQm1LtnZfo/lNi1pTQmlKtcEo8lTwxbEqITcnVRz2f+SSmTQm1KRU7SoPykcS4KSE3pYJHaVBnkJg3JfSmVPAoDWqLEvOmhN6UCh6Npk+JeVNCb0oFj9IgPT8xb0roTangURpktSfmTQm9KVVvGmS1J+ZNCb0pFTxKg8NHE/OmhN6UqjcNvxc2TtGbUvWmQWZ8Yt6U0JtSwaPxd8vGKXpTqqc28UKUxLgpITelyk2DBP3EuCkhN6ViR4PSi8S0KaE2pXB2fkNi2pRQm1LVpsEhqIlpU0JtSqGmQPEZemLalFCbUtWmwUGqiWlTQm1Koe7m0/3FxLQpoTalUHfz6RIwMWxKiE2pYtOg4iExbEqITWnFJr7WSEybEmpTKnaUBhUPiXFTQm5KlZu40iTGTQm5KRU8SoOiicS8KaE3paJHaVA0kRg4JQSnVPgoJLp/nRg4JQSnVM9r4tSTGDglBKdU+CgNSjcSE6eE4pSKH0WhxXiJiVNCcUqFj6IM7udMnBKKUyp+FGUwd2HklJCcUiWnQRVKYuSUkJxSAaQ0qEJJzJwSmlOS0zspQ6eE6JSkDtLBnZShU0J0SkWQ0qAKJTF0SohOqaLToAolMXRKiE6potOgCiUxdEqITqmi06AKJTF0SohOSU6f90ydEqpTqu3zBmUoibFTQnZKtdJp0DcpMXZKyE5Ja34J321NjJ0SslMqhpQG5TCJsVNCdkr1xCbHc+QSc6eE7pT07DScxNwpoTslreN0cCtk8JQQnlJRpNGtkLlTQndKWofp4BbE3CmhO6XqToPKnsTcKaE7pepOg8qexNwpoTulgkhpUNmTmDsldKdUECkNKnsSc6eE7pSKIqVBZU9i8JQQnlKFp0FlT2LwlBCeUoWnQWVPYvCUEJ5ShadBZU9i8JQQnlKFp0FlT2LwlBCeUoWnQWVPYvCUEJ5SUaQ0qOxJDJ4SwlOq8JQ4XiUGTwnhKdlZdn5i8JQQnlKFJxvcThk8JYSndHpsU2LwlBCeUlGkARol5k4J3SlZTXweXHIMnhLCU6rwZIMZHYOnhPCUKjwNkisSg6eE8JQqPA1KexKDp4TwlIoijRI0EoOnhPCUrOaa8ASNxOQpoTylwkhpUGKUmDwllKeU3dn3wuQpoTylKk+DMqXE5CmhPKUczi5bJk8J5SnleHbJMXlKKE+pMNLwkmPylFCeUnGk0SXH5CmhPKVa6jTox54YPSWkp5Rra+fBXZ3ZU0J7Srn23Bnc1Rk+JcQnu9Rhyu/qxvTJUJ/sUocpLXowpk+G+mSXuobiCSvG+MmQn6xYUgycGIzxkyE/WcGkQbtsY/xkyE9WMGnQLtsYPxnyk1V+GhSxGeMnQ36yYkmjAlhj/GTIT1YwKQ2K2Iz5k6E/WT24aVCBZgygDAHK3ElnKGP+ZOhP5urGPt9mNOZPhv5k7qQFuTF+MuQncyctyI3pk6E+WdWnwclzxvTJUJ+sWFIaFLEZ4ydDfrJiSWlQxGaMnwz5ySo/DYrYjPGTIT9Z5adBBZoxfjLkJ6v8NKhAM8ZPhvxklZ8G5U7G+MmQn6xYUhqUKhnjJ0N+smJJNji9yRg/GfKTFUuyQYmQMX4y5CcrlmSDEiFj/GTIT+brvXQwThk/GfKTFUuyQYmQMX4y5CcrlmSDEiFj/GTIT1YsyQYlQsb4yZCfrGCSDUqEjPmToT9ZbbM3KBEy5k+G/mS1z96gRMgYQBkClIWT6mZj/mToT1b9iW9GGeMnQ36yYklO839E/78EN6OM8ZMhP1k46ZlvTJ8M9clqrdOguYIxfjLkJyuYZIOaK2P+ZOhPFmoF/uDCZ/5k6E9WMMkGBVPG/MnQnyzWJ/7gwmf+ZOhPFuuhI4MLnwGUIUBZ0SQbFGEYAyhDgLKiSTYowjAGUIYAZYWTbFCEYUygDAXKiifZIN/fGEEZEpTFWt88uPAZQRkSlBVQskGivTGDMjQoK6Bkg0R7YwZlaFBWQMkGhw0ZMyhDg7ICSjbITjdmUIYGZQWUbJCdbsygDA3KpE5NB+OUGZShQVkBJRtkhRszKEODsgJKNsjoNmZQhgZlBZRskNFtzKAMDcoKKNkgo9uYQRkalBVQskE6tjGDMjQoK6Bkg1RqYwZlaFBWK594PqMxgjIkKKtHOA3Sj40RlCFBWT3DaZD2a4ygDAnK6iFOgwxRYwRlSFC2nuI0GOqMoAwJyuoxToOMRmMEZUhQVkufPC3/NCZQhgJl9RynQUKjMYIyJCirBzkNkhGNEZQhQVk9yWmQBWiMoAwJyupRToMsQGMEZUhQVjzJBlmAxgjKkKCseJIN+vwaIyhDgrLiSTbI4DNGUIYEZcWTbJDBZ4ygDAnKUj1tbDDUGUEZEpQVT7JBBp8xgjIkKCueZIPsO2MEZUhQVjzJBmlvxgjKkKCseJIN8s2MEZQhQVnxJBvkihkjKEOCsuJJNsjSMkZQhgRlxZNskKVljKAMCcqKJ9kgS8sYQRkSlBVQskGKlTGDMjQoK6BkgxQrYwZlaFC2nuo0GKfMoAwNygoo2SAjyJhBGRqUFVCyQUaQMYMyNCgroGSDbB5jBmVoUFZAyQbZPMYMytCgrICSDbJ5jBmUoUFZri31B+OUGZShQVmuS/3BOGUGZWhQVkDJBpk4xgzK0KCsgJINMmCMGZShQVmuTSEH45QZlKFBWRElG6SNGEMoQ4SyXNtEDcYpQyhDhLLab2+QNmIMoQwRyooo2SBtxBhCGSJULqJkg7SRzBAqI0LlQko2SBvJTKEyKlSuDfcGaSOZKVRGhcqFlGyQNpKZQmVUqFxMyQZpI5kxVEaGypWhBmkjmTlURofKBZVskDaSmUNldKhcUMkGaSOZOVRGh8oFlWzQEDYzh8roULmgkg1aoGbmUBkdKleHGuRaZAZRGSEqF1WyQQvUzCAqI0TlClGDPInMJCqjROUqUYP8hMwoKiNF5eJKNsgtyIyiMlJULq5kAwjPjKIyUlSuXfcGEJ4ZRWWkqFzb7g0gPDOKykhRubiSDdw2M4rKSFF5PeyJ51pkRlEZKSoXV7KB22ZGURkpKhdXsoHbZkZRGSkqV4oaUGVmFJWRonKlqAFVZkZRGSkqV4oaUGVmFJWRonKlqAFVZkZRGSkqV4oaUGVmFJWRonKlqAFVZkZRGSkqV4oaUGVmFJWRonKlqAFVZkZR7R//v//4x+3pz+vr+/Xb/376dv3rH//5f/7PP778uL5/u359fHh9eL89P/3jP/77H19u9VW3TAzKb/3Hf/73P9yyCPrP//7//+MfwbUfYvthmTOWH+LyQK0/uPZDaD+0/+Z+NmP9YVmplh/uXWvrD6794NsPof0Q2w9pDZja27in1pQf7phRf8hr5PtDsf7g1h/cJfj2k8T2U425/Lh+jvXf2wdYXrt/og/+4cvDj/u/7D6kZfG1fUais3FKmOtf168f78+v+3DLvHILp3k23Nv763X5H/25/PO3h/eHfcB7qtPnl3jPZZqM+fF2ff3t4/b47frax0tdvMn3+Nvz6/vb7cfTw+M+mA+7Ty/E9fu7n2lTv5m4zEimwn/9en17e3/+49oN4PvJQp/v9X500Fyw+4Xw1r3PeNm9z23geG/rT6GO6qnYf17r13V7+vH+/Nx9Hsssevs1s4PyGPFluZZ/du8/+t2wWsb75Dg9hu4/lbyLej9EqH1pk2PsHv72/nd3y8m79zk5tNYw16dv3Xfvd1+Zi/IL38892J9wmUefu0/w197b2/vD63v/7lz37ia/62/fyhtbRvrP68/n1+6ji25/oV/C5GD/9u12H+4Pj79fH5ZLvfuCJe/Gowt5cthsIQ8jJthuxGSdjsf+2tT9tZND7tu3t+VGsbw59gn6ZVL+OZ6XiVl7ZKz3Jedm757f36+vyy309fp/P5br5+vD4+NvD1//6G+j+yvynto5H/j+7OAxP0O2p7Vvzzvf/iWm9Q+794GsP9j6w72krD5B25PY2j35Pj+sP7SnvnO63aal3Qfvh0uuP+U1ltse6yX9dPrP/Pp8f0K+L//lS70jd1+V241Mb23+kVz701x725NX1v03lmuLfbD3/NjdYMuX7e+ZvKuU6OVpf+Xxu8Gc3Rb/F979z+dv10c6LHZ3LttGQ5uXJd8+svYFt8nX8rXm7Y3E+TcCo/6tn97s/1KZvaOUsB9P7K/zLuxHQmx/Vmh/Vmh/lsz/rvfbz+UvePj50t0Nu0t2uZX9QrzlRsjevO2eUe0b8Sbtb2hz3jbhuC9K1q9GP8fg5N+FE9e0mxulVP9X0iY00j42S9vNz7VfGS/t3zRMPgfvv/zL6/XHbZlN/P3lt4e365eP127qY/vvsSQVzQe+f7xfyuzy/eP1+uXt75+/9fMqp92k9Rc+sa8Pr/20ohsE95NU6ieRwuQVUoIut7bX58fHaxfadZPV/0m0/pbZLyyc3z3cnJ+cHZRlytOP29P11r3XtL+plFqx9WPIk3esz8Cv17fnj9ev1xJt/4bDfgIX2tPkYr/wQdff8Pbw9O2357++LjdItuRy3eQ4TN7ST8M/vxyWEMtKeH+Pt1/5nNaoy9f7/fajDypd0F+4Gm9P35/7UN0EN//CAMRvzsfd5DZsc4pfuVG1W0U/IPbfU/yFD7BFe1tWMY/Xn19fysT0+t5ffaG7sH8h+vPyWIc1cu4md5NPuXuw/ml56VYJPrTb7q/cHt7+uD0+/ry+P+DOQOxWx252rnGPietWp90mwy9GIuM6WvfWfuHbeH99eHr7fn1d/uZ1IvLy+nzfHYCLfr/UdrP3lMfH5392UwK3XzDMx7h+OyyNJHV3Id0mYb/y3j6eHj7ef79f3V8f3vuny71Lz/4rmhxBT19/f379N0+W1D25J58sg8Dsztm9c+cmP+eX25c/rv0NZBdmNsZ9xgY7C24/a3Nt9zHK5B/+cvv6eIO5mLPde/OXSws5OcV8uf24XpcB338r++d9nv6DaySyhSSx+xYm72kvN/gSonR3HdcmUG7b9As2Ofd7uZW3eYW777Js2f+G2Xn/y+3Ph9fbA3wx6dLdyev/OLSpcIjth7Zmi217O7r2Q1uBx/bfyKX9kNZno7aNc20b59pu9tp20DW2H9qSLbW3se7q3rfA2w9t9Z0v7Qe3zaBC+6QvbZbvLmn2quqWRPe2Xbtxuy0L2sdSenVNxv3y8nr9fvur2y7a7z/l6WHxcr4WyPtrzc1eGC/LXeCwK+j9fhuifQshtVXU9jlcdPrNt9+zPr26ka3dNTg7VX15OczQ9hOUbc9GdF1eWhvoy8XTvlPfVtRuW6C6ELeftj2L2MjGxdiubdl2gHTbPdK4jRbddopmJ7AvL+w50U1C3OwT7vVH/xy+7CcGfrtqdHYn6fX99n15lHXPXrf/3rZ9t9J39ldifrs+9lM46W7KwU8+L9Zwb9fXP29f+4Gxv6AlrG9U2gaE2fY1b7sB94OG2sX+a3/On9fXN9jXi91C3c3uArwtk/l+5pz3cxKdFYm3v5++3u5brDDFCZfd2xKbvGcsc9Hbb8vaoB9fcf908nnyL/z4tswZ+u/qfszEXrfaHqymyfe3TBXvN106P7ZuyFqcD3lfB/dvs9vyi5OXeIl0WBd0Iu3i5CV+j7XMNe/z4t4fXTcZ0TaQ3XaFutkpWPcr3v9+6b/03UU1+31v03i4QtJ+zVGaUM7G+/3h6dtjP1VyOe6fhZPP6iVWP1ik27vzmwGENq1ZvvbJu2eJfftX+bO/4FDaD/hZzN0HXB6tL8+3/hGuuv88RSdXW0vY+6WzZk28Xt8+HvtHdbecc7OLgzUsXbHm3Y3D+8lnfwn4/Oft2/X1tyXQ7am/nvL+2vSz6+xdULZRsyxg9u90/iJtQf+SS/56fX2HLeL7AS67qzXNf6bL9/OyzBauH6+3/tbUbebK/LX59vX3K2xXyv5urG3gu9i27KXZROn3MfuL7reSflx1y6fZTYcl0uFvz93fvs3L0vQdpds/7PR57kZyZ4B7ddfuObsLMrlyKJZQGeBs1p92kdtutW8LIW0T9rSxR1uHWZvE5knqKO/nfuP60rZtz1cjXV5Bmzv7hnHBb6s2N/e9lN9//evh58vj9Uu7oE7fgr/sPhuvc0/68msKObI/qhukucFWm+fHNthsMsOp/LIJ5NlfzS27LLQcsBDaD7Z+paHpzZqxsvzg27+0/ya2/0aaLUvb8dG23lXXfmhPPm0pA/fTzurIam/j3lyr/vHty7a2dsptXyC7bYXe3pC7xG2trr8wEtad7vMPrltFNNUPLWcubT+03YWsc/f0+zs4uKO/7MHWz4+Ahl2HOWG33TO50C4Bx+ug2O3xOZ27YZegu+dYH7Gbuk4a5D3iyK38ZT95m3x41YDjzdxooXub83/45/T3+tfXZa75A//+bu9icg3VB369fl+e5L9j4O6JOAlrfWA6AroJnM0/jdabLxsE/iL7r2x+7MPmrr/Y/pY9/ycvcZZv/+l6SKiJHVm5yY2YNeQZtCyTyt1bndxm3OLWaRsP7PazzF+4npbAOKtKud/mnb/B1iwyNn663DmX5y+kl4f33/sV3z5S+oV5yMvjx48b5E3tNz8np3ol1PPj7evfFbz7P7Nb+k3msd0jrol4bBNqnxzpJ3OESsiPnz8flsUe3CByl/kwmbN1j4fM6feZAmEyJ6oFIqSSpXtjvxYP/NrvJ5LBzceCRZZ2syiZvWCv359fr/8m5TF35QSTi8018ijncf9UbQssH7ZUqnXmEjdoadkI2nYyk7RN77bVa233J7fJV962OD/3iOKW/bhtkzppArBMotqyz9zkJVH+zn+T9Lh/4G8z1K2Oov0leXIfuP7K07zELm28lXCUDo3zv2CYmGi7+1ozBW9tKt5y0lTat7DtK0X9fCe/Mj7PMxO79fBkXcMad5SauH/aW4PittjUljWbw68MkWEu4e5G3Ma9b6mqsa15tYFO3hQwbpsV66r3F97I8jQ9ziX8fi/AbzLaUElb7mKeBKzfbt/6rYvdxzqZQ073vrS7+05eMzUQpOnsHzDRT76lx+ffuih7S3RRJu/gr/dMip5w9rbX7nfOb3ep0OqtXJy9ju9lQKVw7K+H233d9JXtzXe7cxeZnJAtod+XEL+wZeLDPr1s9tO+/57b03AttU82DJPU99vfLw9vbz8/lsDlWni8/bz1m8BdOcul1bA5n7bnxKQv3C/4fk7Y7XXI3Pd4j3LYVPcd4U/HKZ/koUomd7g1Obzu4ZZJedG3bl/i0idyTAZ7+nrtPqu4F908maBaw7w/vPVTmN1nNalsS6Dnp9vyJx6T9N/6P7bLD50b1X3w/ZMBYu9vUJO7z1ts8hSH6H0S6v8k+slb70svfi34j+Ue+/B4e3p7f/04PKac6/Z4psdFDT0M2gvlrwUtH3L/53cePnt5ruEOSYbOdYvSuVv0Fg4EIXYrBTdJxJhQH/ellcsXPDnwb+8F3lheq3R0vW3yL8+99ixci5H//W95vD48Ye7MvZvfbhkzud94zPm7n6Syv2y2VJo2n3d62RJFJnOf6m/5stvY6ndKd3w6eZmWgNefDzeQuE57Jqsha7DvZc+xA0Pttl90skqshuvrErTLFf2sSdVf+gDL1mCvxJ26y2S9Zo021Mz9pa2TG6JfH5/7DRjX2XtbdvqWeaZt2ZHaLN9aJZ9tC6vJnIzld7/1v1v3l4Kuvyk0DhHbEhXbm2jpXzltK+qtmi5OThnL21h3jzo83M/h0uwggtmQ7O16mcG0tzmbHFGmscd0gG5Ha/6dLWuEr38sj4T7xBJqc91+FuyabfkGmOETjibrqD+nxsvnent6+ejbHHSlCH5L6Atx8la6j/748PTj4+FHnya0W9P9esTjJy7dxMHPzmwH64M9XrSNl9xsb1lBTz7nl+j1nR5mztJNRryfD7isy27fb/2Wp3ZbxjK5lry/+vD07bD/3GWSpzQd7AXSIF331NjWo+0OlfPnkN3yZreB5mYfMvX3rpUF+CF3G66T2w9bRPKldbmik0V1Jd777bfbIzQ/kE4ywySy3sM9vy33h/WWCPn20tUW+9n15mF5v1e2tkfnt/Ys252+PVOsPYlsK8XeAHvrF+Oizf6N97fz8Xodp/KFfRXKbPloF/eY0xP2I382B3KL+fk+4SsJ+/QIm76BLmFfOwXcX+SzM5IapabXvV7/6/oVyoT2tROzU9tdzO4RdT9Gdr9JMXt5lHD924qXbid6spRwpc7uHrQfx77thPk2d9l2lm2yiO1TU4++46Sb4c3eN1vAj/t9/RGKW6Tbkvc6PXg+g5JnZbcG89M3nqe358fbsvxqbHHwsv1SKUxWSN/DlpU1NEbK+8nderdZv75tO+2zH0+712x7blvBfPsfuW3F1W5nrt2XfHv++Fae5Fs5jm8l+Nt+qm83ON9+hW/Fe1vNhG9rOr/lnrWH3bYqDc2fQmvAEFrR81ZnEVqSd9gm2+1XhOYloW3+h9YGa+2idK9Jaj+0vyKG9i9tZh6bfkVtErMpWgsoLZlJ2nuWbc7fPihpv0JaLpS0VDppv0LaFynNBiRvP7TIzdS0JWmpaz+0r1tbYpK2z0dbKYumLQGrDZr2gaf25lObK6f2nab2YEvt80ktjzO1NWXaRl9LcLPLlj3Y7iJhSyNsj8P2qVp7Y9b+5NzeYW7DL/tNSrbMq/YvbYzltE2f2kvta1ruk9s8atvzv2xVWhe3ZZRtVXiXrcPEJWw/bfp52aqBLpMZUWQS1pVMbcur7YL1bUy4LXPPhSabyxpx+yl/5pa3vy2F6Uf0/V19WT3wy6ACYj9Z/IXH9D309S4NAE7SZUWG+cdhCXiYe8Yu8WIyk3KNdpqws29UEOL0Tfset2exbrofJzOo1kdJ/47i/h39wue2l/T319sPyEnrNgp/4Q/d5c6dfpL7lgJhMmsTfwF8pN07nn9Qv9+ePjD7XbpUvzDrGctk+f0oP9a1t7DJLOJdMNJ1z7odUpud65SYt6c/n2vxDBlQrvvit2d8ewRqu5OmdpO19lSzzewn8y3ru3m9dxN6ueH8yLr2HTaZx7eF/Pj5UBeRZLXWdayy2blniUy21u6nrexEf5t7bE/2lkxz2R4VW3qMzY7S/S8nxa/LbX5/w5tMTKpR7/2culjdNrGfrI7nC0/pinLDZHreMVv2+vqKt4/9bW/+8uSLztg1vHCzd9Fj7i2t+NnX0YX5r4YphXQZhWEycfI0l9fvM8+kgZBsmV+27Uds+706WbD29ePejLEfD7vfNfnmSxDao0U7Ao+f86VtA/ay7UK2ygK3tb9zaZJjD11joZZiPsq/Se3cL4nDZB/Se9jlA3rtU3aty4rdFnNp8mLegvaAFLu2oZetwH1buDmdTNvefsFxY0C6zjt+Msl+C/j2cv0K7V1d96bbHNlvdfz6ufydnId9u/72Afk9Oz1s41Am6xC/Xb8/fDy+908V6W5JYXIL69v18fp+ZWX2fn8njm2VGNuble1KcW0R5nTSm/tfSp9OHTdMNu2pYekDd3/vb8u4sC2TP5dkk7Oi7jeR95+6dHWbnA0vt1zYbN7d+2ZDvH19vb1gHsW+a3UDAteWzH7bGGlfaQjb7kfbIWn7Blu3wtjyR+OWY9r+G9m6YLaPWtsaXNsaXNvmwNbdRNsmjLbejam9n9TmiantY1ibZlrY8ozbLkHbd8pt+pTbcyhva9vLtrd12fpqXHRbj2924raVvtvW8p/lqH7LgfDbJnzQbU29/bQ9JJ1sd1bdJne67RfYpKEs3/KyBGm10qXf3w2aH+4fOJNTxm/LE7NPTIhd08DLpPp/u7cQ+nl7qmnm3++rumVyfRyTHaXYZOrpt9tb6c3VGpO9Py8PBFw97QJ/evjkHgv5BVfA4q7t8mfe7+RT/fb29fnP62sxkuWRvnxUZKYS9nvIsxsxLXQbEzyw2weeHG+3t5fHh78xdyfG7kG5pev7z82kyR4m3yANI+7T93Keu/ddnx5+e7w+fP9+LZ3Wvy2z1+fumZs6ddfJXNcadgn1A3agtHvgyuT0q4ZbvprXWz/t0K7xm0xOY2q4ZbB+Pby72IWbG53Xez52W+t342afySGyzZInE/1Yrwjp+gVsGf3LvWv2k6wx+1ufdLlFfnrs1FiQid5tuU3WgSyhDgvkrpzfT/ZSOpaHpW6PKU02B7zvd76+vN7erl/+ef3tS8047/dmu+2NybXaZ9glag16EKu9f4ZJnT6u3Pe7JdtJKNu9Zhs2k3nmJf4hUalrgO+33frQmGRZD/7C2z/uL3f9UP1k5/sS6+cyy4TsHnHdldNma8u73Wp6Jmfi5Te8LvePvx/e36/LQxqyorolRZsvtv5V4XMSNZkQtMxOHx4f3mH3qNvInyxhv/758PgBkfx+mitb43U/mbx2zL/XrhZ6Q5XwKwHZ+SddY46tO1KYzHhZ+9ndheAe+fav/tHZ3f/cplJpm+emyalWPRyj34zpuqpuK2Od7LtVImK1cDeWJ6+LWhPev7Wuv/XsLbYG6r+dfQujsN1e3GSWxBrycCvcv78wey9ZNzP7vMzd55W2K9DZ3FSuhfw2zv2J3UTETeY2b20KjvkQXeJKmOyxVfMG75ObfmJ42U8MJ6/DWpPZPUn3s+Ct/DFMPkHWGk94hrhuQdP2FHxbu4bPs7Im8xF3v4fsenX9GcNkOtWW4vnl8JjdD9BJcPpMcO2nYF3xzZr1MR+sjqBRnm43lqx9xluyx7aEn8wL3nWDR9eSrnvirN1e/7q9f3l8fn7pZ1jdWvcXQt0jHe8l+83DyeKm618v19fb/Z8g02+fVDR7D3m5pz09QE5/t3yZzD5fQ/VtFbTroCOT58AtoZZIb/ein2Of5NR1oElb4800uT74fi31k0calK6HYpjsILaGwwX1vunA5DxojfT2DlPErqpz7lL4foNHareCDJPf6D3KWUvU/cMgTpYB3GOepIJ0x97Nv0v89KVrrbl1O3Bx6wUqn/1rt1qYtO0Qpsl6umMaYuyKlS/b79tOmXK6AXCaPCnn+xL70C3Kub67z3r7bM8qbbtZqTUXszaLtq3SfbI69v77y3zvt7+/fzyVSfC9JLF/UliXf2mTW3S70I8Pb+8tfOtvg7+iOz1icpfu/it+Prx//X0Zavu331cxdG1uJnOG7pHfPn4jX03Xb7klNm5tytsGc9raSrdmdrZlsc3efW5Pt7ff+5TgvZBMTk9amONiN3VTk8nE5xru9frwBq7VlX379sx34fMEpUnV/v76/HM9IQOf9bGrDL1MdrVZAj69/7yvnPus4tRNHDYuSJMV3G3A/fsmfX5fQh23BM7ZQT68Lv1+Khtmr/g13NvyJH6+H4v7/f7/3qXix/PT49/9fKi77ic7D7dfcJwP5f2nMBfsx9eXLz+X/1v34L/sSOUL3EB8f7bJ3GW+hN/3rjtWQ4j1eytzF8kStpxAQ9NG9lORONnwEwOSTvDStYQLk73Bfnx9O5sG7OcWcbK+5Mf153KP6MPIPszkV1PCfFkmid0kYr9V+UuBxn0797fBlk4ye3ZqDb78n/fj2s86eLHZsVMikpVkd6ZxmKwMW55f987updbnmL/Y3bPXdO1fCklQ3e0bfPnJraJ9TMjYdPuWNX6yrrPFW6uvxzOb2N01JvPNtuh1snvs4bH/qjZ93pK8t95DNllWCL+PZD7uvsfPOrPJqU6L3hpF7SqbjiOmyxSyyYS6H31dedjXNUlLI8iTTSyXYO0scWyrYLE/lGn2En5fD31eM7j6fbz9FtTkcWH3iOy4OdfdEOY/PLhD3ydIcJFYlyc6W8e1C02OpfD7ffXYprqxTXVlM5etCH75Yf5vevvjftj6frTtL1O4kXYpw9NXzfvJ7mn3XHeTKryGJKdGu+5GMrkZu4ZrK6L+rreb2vmWjhMmd/yWwPXO9/jw2xU/y04RZ6cJ1/eunK7/0/dX3fTT/X2QBBX2bzDNXyTMrl13WUxmr99jMXDYrz1maxCXWMM9Kes2Mmx+CJ5cJ918fTI3YRcR91rC/i2m+VGNa314l92sYzLlYYm6TILXNQsk+nSJ7TY9M7oHbEk4fbxu3jaZT7XE+/39nZ3R5PaZTr4VeM32T1ji/tey1i5LE8gR2hPT/HX3uDzqhu9032J5q6CczEy7x37GciPrujLYZMeXJdSy6quLvv6C7s4L/pVg7PjT/jCh6Uu6LCXwWnH9kT/TT+Dn15MKlP2WaWuUH9p2o+y64//Cr/u+3Mt/L6vJfmG1G/R5fgKxnUbYT5v213iav/EemzeH/fhJ848r3ol835Fm0vGXWLQFu9/XPIT5Ocm9q9z7tU1h+xHUdSH+hYhrcilMN8O+lCxN5n4s8ehI3P+xLSc2tBqSz2rUy/xdbf01BGus25ibzJ/6jMgy1btmW2EyEeIz5MnMuwM1m/T9e2S8Av0+UTFuxc9b6X6abF23xD72wOu7UrTpZJtXJt9EoRlDnr3SzpoN7j/0Ldk0zu6DYGTS2H2/dTObOfzj+eGfD30Cf7eo9a1034XtRJI4mQn24/n5x+P1y8+Hl7cvP16fPw79d813o2X2xljDkpTArjTWZp+HJdzj409y9uteeiZTQGq4+9+8/cmHrd/UdeGbHFol7iBlcX/S2GzO34/Xh5rX9Pb28VL3vjvP7hq7yeykp/3NtCtjV6O09adbRta2STPZc7ueY1c6ng7bwrs+O7I15mj3Zm2XYGo9vKwVS1hzyzw5b6lv59+0qXd9/mPrGNLKy7TttaatPUTrSWGtI02efArW97NfGD3e3mDnqpvUT65lfn/opzX7vc08We+0xDicYRr2m5p58oJYAr3//vzx4/d3WP50N4HJbbR7sNeH23KD/fFvmspZl/lps3912SPpkju6xXiazAOucdhsznVHXk9mS5Ktm9gdYrdxuwuTa5XfYdMhdh2cL5OJP78/Q21aN69Ik/ZyX9d198ndfHf9s2aXJvdQ992pfhrVpdFM3nfvkYZ1zx1aTd4MoXq1W8W5rYHK1tpgud22yYdO5iLevr0//3GFdKdu6TlZ5Xz7+fJ4+wod0rtn11yYp6+PH9+urONIt25rc8U4KRlL3GU9ct8ofPxZG5x/wHxg30VbJsUaFyL7DcJtpSCT+Qt3W+vXXd0UZW4w357qmUWn1rk/QmAyjbjFPa/E32e1yWSVaYs8PGvJ76tMZNLZWtTRyUZ+j8izdc4t6OvH0xOskfcrOZkk/xbupKB+//SUyWnqsbtrdwhumJT4EuZ+MvVzKT1kO9ipO01dJ/cZSuB7whuczN41AJn+mpdYxx3DfblzK9FdbhWz3/ISc/g3S5d+saWqubD1MpXJY7JGa8l9qeGW8ze5T7VfRZKZROq6b9jkOnsXtO8A2SWYp8kjHG73Oq1ahQJp2t2S0X82FN2yHGWy0GX3K97+TRuw7lgTm9wZ3cc/bRG1ty2ZzDoowZdbd5+dk/crjDjJs1uofhrYCd5lqyjx25Uyf6dZ4r9+vGCX0W6xvi3L3Hbm6PJFzn7QJ32efLeEl22Hbv17bEuEDZMVhIffRnJTuiNQZnPdPwNDWtv+m9ja4Emr0LDdDG87P8B9lrpOPl/fyrr10J2qWwzY5MpsCfbSVxJ0XVBtslT29kYPj7WuTYBN7ofWYCfnclq3frLJhOUaFo7mtK6syyYP0qyhDt9A91i2ya3az1hgPNbt6tjs/P/ta2uA3V/CXQ+b2VvXZ7BjQk23MWuTZ3Tc3lZVrnXlfRJM15rLJo/+WSLenu4Nr46pCNbVV9pkKcYScJAHal1JlE0uIm9vNTHOP78+/Pb8J7zD7mqbLKptEcNf3x8f3n6/s2gftLvqJjNblqBl2xLSFq1raWWT28m3t/sJUYfbQeouttk189vj89OP+xQdtqRd99ZaV+Gtojo0iAjbWX6tXUxsqd2xdYmJ23/THp/SWvVq40ttu+radgR1O5J+a0a4NTtubyO1OZ+1om9r25m5daDNn71dPwvM4vbT1mN1I3hnk+2Z7x/e8wv5Jva3qjw7wX27P0AfH6+PJKDvAs7erFagfLoud5h+b6RLGnWTe3f3gKXRYl9ppN3hgTo7sX17fa4Vonwwh+4v/pWY12PljHXFUHl2Qvh2XLpa17g2T55Te3tbVkf3gpSXB3hwdK0lJrOa9tGOT44+b3l2w+Lt7T4zL1sV5NNLXcjZ++jnoZj96HPdoyi1/IUNG1sn5NQWNXkyCeq/Hv58qMvQbuG10+6pMH8s/8N+n6rrlDO5/8sOdpHueLjZrOV7mdTHyzfSuzN1LR50cprwePt6hYe5dBWWYdJMD4c8andySwzbZsJkgfNdZ8rwgyTK7jjauRH9GYpNXrQ72ihO7miVmOtW4R/Xv6HxwB6dm7LFtpyTrbnHxuzL9zX3vMdfS1vWdbO7ycrMfeD+j9knLYXJpMZ9tDVvGD6hvfa2qz22xZpsFWHbLWH5hCavkOVXt9No+dfd5aJO7jjeo9LWQq4/WW3+w96i8Tcp3ZucvQbfPnPi4F1257T9T8Lxt9k1Spg8r/ketyUkQSb97q+e1b97NJaW7/fnyIU2AQztMHTZNgYuk4y//0XkstPO9OJkB4o+KPmE+17sk8ZXot6Th95wZRX2A0smyz/u4fhVvGeq9qiOrZuMbMkxLn0WWc//Be1Xsg+7yxuIk6vs+/ptWXUdz5x0+1R/35YhcbKj7RqW1Ee4PcD4lhMXJ+to73HXlPpjBpx2xyTGyR2fe0j6cXZjdzJJaBds+X8++rTwS9fuef6DXC8G3ODu0la2svqwSbxMzuN3v+KzmWWdUPW/sMtLiZ/5XluTssnpPmyDaTdLk8k64iXIlzKBOa0h3k/NJzPS6Xqr26nNk+0rWiQ2UrsH7uzDZ413JKrUJQTYZFOaJR4rtQ37+6tM7kqWWMeLqNv5i61ozaXZy/0elTwButatcXJ38h7svv4FxOq21SalcAm1XCg/H15v/+rDhX0ymUxu+nXRSH2BdgssmTza+fH54dsXOn21blltk5ktJV415j5Yt4s4mXlWgt0bNr7AEtC6u4zNrmaWcPeynvJ8v090YVNiHzNPHmpeYrLW4ftElK3/QdyaN25HV23Zii5t435yb2r/u9ll1Z12IpNtSvdBj5Og/eNOJrdt7xF5oaC3/TEKjery1ujFzT6cl9/w87Pe6PCu9znI+gtfbB3Hx3C7d62zd9ElXBl49zT3w8jrnhuTJyx0Ef91e/nt4/t32Gbr9iPyZG+eLe7449w9iWczMLaox2i7h5xONku+R1vuC4fbgnV7xr9wC1yD0dtqXxU1+yEe+we70M8V10F+2bosbS1v3Hb2ntvKQFz6/GmSdaD3s3adhmYzho5VZ9rlYMhkl7m1ezQpQtrTvU7u3j7eHejPa192vO/9Mf2m7tWjr9+2XAroR93VsM1ODT8taMR0YT/j0dll9Gfce7zbtz5NwHc9gnYtVWff9fPLxFQ57B/kOrs8YcAT9vMLndyc3iKR2XLXi0omW1X/fPiDretcf971bKynjwfof7Lfo58M8te95ePx8Nuwn/No241xMtmxcIm75qH2CVXdpp5Of2p/1Vx2ODVmH+uyDUG/3blUP+9mc0Pn58Pfv10fXl6uT9/WlgZ4/KPbN+jwzTR92/7cjqCYLccvv/Ge7vB+fdx6F/VPmQ4SJ1eiy/zk7GjflLsJ8uRjhtbxatcJQyZzL7dQ/QaCdplbMtkWiO+lanfmcpzsyVhilX2H5fp6gGdR2N/1Zje614LlfgN1Xwk7uUPBC5/Dvj9rmsyYKjPNW7+pm7qqGp3ccqxz1uVf+gWYdo0kZPLw0XGC9D7dVVpbX2kdEm1bw8fPfpGfp6pOPp1/Xl9/3Nt6vkOPg+4IgDxJ5WsP+bflRkKeHV3thU5uidGqtG4KOntG5xLp92comOu4bjIXt56p8Xqsw9FOn2VSX3/eloDQqzx2GTLuM2V29iF5W67lpx9fmOzus9MmvayFq2L9hTwf9jlqk6X8pQfBPsYeBreDkVruqm9PmChb76lN4fw2D/u8JLaq4ziZF1jeD9kll26Hazs33G1ZAG621qIE2f/BXS1eu25bR862Z7EdErGdC7cdvxBapW9oxw/FTQeabsSwPaO31KZ2HlnLg5L2YW2HRWn77drcRNv9R7curm3fWds0QNupU6m9w9RuVql9o9Y2xa2d82DbN9qqf3JL8c0t+T63Dzt/LulaztYyCWrfxGXzWPd5bJzfftqO23DtiFi39QhxfkvKD9uB2duB7S5sRhTTZzr152HW7b2ItXi65SlvR587m2wb/HT9J+zMh31HXZncZn0quc73nhlYCtYVeMTtCIvtsLXlljN3a3h6/nKvvvzS+pv3a9j9mnMy3FP/DNQunVkm739PcM6TdquguRAfP5dV63U9wxsaGe4fG2Fykv18r0X03Xe627xsA3Ny07YGw+pG7btFTbpjjXU82rafA+73I9LkkVY1cjsu7G82tdxv16RJzClht1r47rm5b/g2+R6/f4e5pbquyd3k1H7tNcjKyP1+hbqd4BdbF5yt53aeVPllkn5/VtUDhujv2zdBalmmsS0Qt/VhnkwerVsrJ7+uaycf269rebNtXz5P3vyen+6L0HUqSX/hfqt5q26JbbWu7eaeZ7+6ZeH75fbty7p07AbUbjxNx3p4ud0Pe13Wn28w2vfrvDT7bdeIbBG0v9zTL/yxt2/rn/rP2/vvZKKufdLQ9Pt8PWzHarc7LpNTsS0Ua4mnXa68TNYJbyHZt7LP65nsEX3fxP55+9f1vjTBAw1cZ0JtjuZbHVD4nLhMZvM9v0LlyzI9625Rc4+0ZfH7414jgfPQ2H3fbnJ76r51s3WzI4Mo9Tldkx/rEvT35+c/YF3V6cDkfujzx/vyH/TTAOuej5NJqEugQ+Ft11P781y0ye6WNeK/q8Hdv1edfTSWyKQIt8tQmdSEGgxOOOn6fmyzxcmd5RqR1PX2XfG3qJPjukQdV/Z2Zu+3EzVCW9osC7jJt38/9PT27XpSu9SNsDzJwUhs6rqclO0ogji5o9TKM2aoYZ96mSZnn8Pyj7BPN02TiVq8AZ92ezyyndppk8+5EpUJYezK89zkhVU3kw8DN3Z3AjeZYlqPEj58el0tcFvIb6cuaiPM1M7hsEaZ1k5KzPFzhftZHr9loYVtRbodKK2Tm+Dlsdk/Nfc7sJNTuxLl4enb2/u97dKwc/B++jp5ryqRv/E5SCf/Mtlw4+Wen9FDk3TZcV62XTm/7QNM5j28PLy9/fO57/0du+4d7cubTEh9eYCVYLeBKJPNHV8elpl3ne0Tw9o/hHV6pP99l/9ekLvDvmc/sULaZAXp960Pth0ZaddIagk/tmHe7GlQ9Vf2ier7HXm/VettR5Y6nZw+1vYly+3k6x/HflXa7b3PbvbUkGTWI13zlslYLx+PM6cPdEd25EmHuc8Zu6HV9f9Ksw+5538uj4zfr3BY0i7JdC7M6/X77a/uS+6mw63V3Fagn7Yf2sw+TwLE8quGmXtdde1kncYab5BAtbeNNDnVXSLen0191/men7uzqi+TSXT3rLE7VT5eH+6VL8cttdStFtLkom4J++ft+eNt2HpEuxTGOLlT9/J6+3MZ/Hi0XxdLJ/ukfsbq31nqvnGdfSi9PpeTHm7v/VvrvhSdNN81HYenC7uuZv7z6NLWOLf5wDaJDu3WG5oPhG3nqe2Ex7adH9tMJLb/RloJjLSsrG2Ook03tZ1Epq1cT7dWjE0wUntjqW1qp0ai1hYWFjdwWH9XbgqQ28Wdt+Swy7bLf2kreHeZfaC+3nOf3t5ufy5z77fl/74vF9dPPFZwf2Lv5GP19fm/cKeqa9ixNat0YbJkeg3Zj1LXpftsk8vLhhxhm1x+Jsukz9zyyUYGy+/+eesngXHf6TpP376ef75Aem73KJ1k7CXO+/NXKF/ouuelydYzLdJa8tfPJrtcsu30tk06XZxMkWi/BLoBdacrb4tqmcwLaEFxi33/rG7H4S7v+dfeKWPWLqHGTyrNEvCvvz9e+xTFrtuMm9xje3n9eLrS7qRdB4I82Vvr5e8lVt//azeefyHE/b9ZVkw4wU/dnthsW/nlNt9PPJLrW5DOXa+vD/88O9Z7P5ubPU7lnk5xP72P9IMK+7WMTTZYaPFKZku/d9fh3WQq7D0cO2kjhP1ZL5PZvkuwx3t9fGlId9w5Td1mnU5C7PFAS+0m5zLZR+eOntBIJna9593kemQZHLcl2Du0m9fuOSWTRYzLJP36en2Cilztasl1Mvd+7TXS/YVdw3432TRrDUQarXY54JMFVrX+C8972K8327mboWUgzO5gt9DrvmV/d+s6ZkwujVtAdtrFfltocluYlr51R8JN5uWNj6YI+wWGTaaT9uGIcXSPhtkas9a4cH9y2JftLNb7IvsLCo11OUg2WaRIzsPrBtd+xylMPsE/Yx6Ose+2nMJkf/IWj5cu7bcuwmQG/xrx+q08osp31ltIl1ESJmfcW9T1YN/tE4XY3cEfkwsxbDXZd0fuenF/JiHNXhD/92O5C/cbcF3HNjf9Jt/u87Y+J2lfRT39fKlP0eXm2c8auj5Pk8WGtE+D5q7VzJbglSY1pu1J/3z+9vB4e8eE4S6/WicRv8Xk37HrerxcthzGyVqY13v+bs0Q6G95u8/BpqcRuBspXTqMb2twlybzAtZOXLflo/z7eAt1++1b3/YHNqmwllG4jNNtpbk1btDJHJ/X6/LYe/rz4fEDOLhLu59s1Ph6bU0/eXZCt+CcnVA/9xkEqW9pN/v0e34+opLrxmv76HzbU9kOi1FbP9/U0oOs7SFY2/fIW2sDN1mjULuczThk1x5g9uHBe6iF/b1k9tDvXSyWut5NyWdvJCUkJnLuK6Btcpl7LJbXDgt1sv5sWeOen8AS9sv7NOnvLeo6Kfhae4XiqZj7/ZM0eWZii1zy3fj73a+/Zh+Ka9Tl/+cx96mOs/fgNWazs2PQ/VmHk6UB96BP3+rRMCX9rruwu6X75C7HPeLhsGc4PWq9xLddvObOvu2o+rYR6Nuuq0+bkmy7wNsPLe1pO7RrSxFsO7xb/crWhy22/0ba3rG05G1pNyFpe4/a2mFqq27Xdi6Qtv+VtrehbfGkLXEwtfecWra3NXy3tuSybRN5O/q67YFaS93PrSwut3zvvG2QXTZ6v8i2sTy5adO+s/tJHP331p/N1L6ctn/e8tn/X2XXsuM4jgT/Zc57sJ6k9lcWg4LKlruMqbIMW57eXmD+fUlKTGVQlCv61uhGh1wuKpmPiEgTv3gb2d1WGJLkpCl+BH+6cyYIkKS2/Fn8Zv9SpQ2eDTlxEdjX4UgP+Qw5fhHo/XikySWGbL0L7F5A0iQTwzYnIuhuRNKZiiENvgF1dszcfLH6BiG9JfwPvrl0Kz0CaMSv4rAu4hPP9JbtvD2vw+1j+HI3IBaaWorTiDCFpKs61NR7ucBtEjHZiqGrjYMnEwUrNpJCbSTudGyVPz99Gx1g60KM2KLZiVHLxNmejUIhGwcQHam22HrPVppysyyGDr+6GAWXoRwJ/TJzLPXK30YWsPEZxnVZ4o5NWGDYtuTihBltvO+iQtZm+azthbqg0pNawx/Z71QElRbNsErygPtSLVBp+rZhay4P+40qoNJ2f4ZtUj+vwTDl4t6h67LOff7o7ruBKlgfMvq72GBvanTNj2fXDkTgPUjd6STV2g4yaAEC3+ezf0dlprXg2kSaLDxc3vo+/jf2aNKeZgGeLyKgO5An+NH/PWQ9oTShtRLVaEyPaskeV/bWuqCWHC7pZ+csboG+25LFrAfdc3DSOnBhKIjNQ/EbX1mYOb1/ju+P/pF1JDNgFNqSEqHAjE0226AIgvyIx/GWUNeBUV2Jf1fTyuVP7n/K+G0XwGkkm44zTtJyBCDSE2neDDvvMEs2AsKmnYNQ1kspylqy+6afkTHEAO+Ulsw4Zswti63Ufi5V/P00QkU5yEtekGFJPyn7okEThBxhIOiWf2ygHm5Jct+MOsdl+FL0foBaVjMbctKmYbeRXq9DI6ef6zri05AXngAvxbDBfjg+75fpV2YiqNmsHUk39w4SWAtodjRZV3mQSJdL8TQJuVmbzORAVSMHK3HE1nXLajxGDkgW84zUYaHSCemqMi/IoaNH/fCLDvCVrcGToyA9zzxYJDHgZ9Rc7NhQdrDsWY+LHZiGsWY3dKTz9IvVEZW+ZzpSUTf772TiKpCZDH3ogwXMW3/cbDHV5envYGWganApKYTT2JJr7RE5n7EYKH9bubRZB7LFiwgjgD7/a+4jjbVaXBZaNh+an/JipaoB+mBLvx4Zk+hS8/Gq2AS0q/1EVCwU0lV1173wLFeP57X9IX8nrp7uCmeDTPiI35ibGhCyGtKxJ2d330KmVdcrQ5R90WbMbxJvKCkMqep7taZVkx1jb7pZW8DC1BRTybaWcTM5eIqP90S1l1t4K8026cgiNJWM60FWRzb9HMbWoNKCCUZHujXPUBtXyRZyjiZ2qwo6XUhlIKgx4jF22ZaancDSmh4f4/PztPSfsTcHNJGYH0dfnk7MgA4y6j6IxVdBTqS8Y9Pn8Hp8ZqBxb0mtnULeay5bYDRYciKwAO+NA6xuCDtQMhwF0G/69hYMcSy52VtD738TsB+RbFSHhB9DG5xA9kzPFsNbdp0Bm1rWQG9b3VSaGtqtjlykLkjMitMwpVmJHVvq/nW5RfP2reoXNjMJD6KoSF7M49Zf9/xrge1JTqket2E4Zrw3DESultTVPu5HBAE9EDnkeyTO/tqDlozu7tYa+pMvC0Z0TDA1yonI8zalG/x0PkZSr8JyLSQq6jeyIjXvocxLC54G8sOSh0JOeqmNXKp1TXAcI4vIphBnsnJ1IZPJWMtWmP75LhAmporAWq74b3cazk+8fCFWxZWYZcx5K7nwDmwIn07DHbKPBlhNJXu/TKfL+NIgFvROhk1qplNy3JsDcjPYH9OrwzBMq5GGcAlIWs4M59+gj2l67YsLWiFDf5uLmO0rmZXoCbDYELSkb4NDdZCX869MD8SCEKEjx2fzkvvnPbe8GExWLGlr9ni+Z1b/QXISWStlZC22sZQzrXBL4sQ3skQ6qR2KVQMWXcIKqT8K4bsULZuxxZ0m2K2BmZbsJGfLvOzWlRo8vYtI6HTVEPkuPW9eHn48JxcaWMey3ZkZaziFtA9/W7gNYvkllbFnXceuiCWVyO6OSdR30GQht024K+YHJkI1DIxLMu2b+gem+ZqSEYf74qhyIEflHnW2eUxvZQveEJbcVjENX7e3rfy+0ozgjmTK+SLncnVX0Xg9fo5JP7+G1JnMwBcpIM43FFX5t1A2gcfUkH+TIoTgl/IxfqKSHFYuG3IYls3RAEhMdVm3xwUSr5YWcoGGDNkL1MNzuE6JUQC4/ZNXocdzmcrXDZO3GpK3GF4rsUNtyBbONPZljxcV7Egho3SAyWxHMVC7sL6BG1laA/u1arJECzDv/WM4IZ8Oyai1vkg7sk+6D537EkC2Y0jmf3hEnqcPVnBkgQNwXl+U8RRvoJVFOmzvAD/kCsPPDsJOUh0QHpGNIHUDgiDpNBlSuxuQE5mnAcVaS5IW0wmnASsW1p7MowQdHQRvdXzYgBZw9tRz2tOVjEIebyuw0b4ipPeiR3K5Ar4g4GtmSDJDQHLnbSaZJ++0nrCRE/vYBtveeCCNMw15ESxwi1/SVnVo4HUz5PgjFfHBr0P3oisx+TqQaXEKvf0iwDLOkM2ZBXbz40OftZWby5BOlIGqF3K6wZ2n+d8gsYP1hL9xOhfQKGtFUNjCQhrwedDz5TORwRRw6Nslj5fFq0b+EKknHZvQ++VPniuVdye00H+wbP7mQDNXm4VugSUFmR7s5kX2x6SbZKGFaMliaYZ74Qhk4MY05PxpVgz4kJd5EaAnSN+UidFJAa17MTasyUZswHNfYrLOArbIkSxVD/W8pqcdSldLEomncV6ZhoWROnMdyayfxqT9gScPpLId2fiZxskLY4ck04emc00SvAOW9z9NsGB9NJuG3/vjX5frj4/tapZCszvKqLAtY8CopSnDlk/33rsled+1ucLz9jHu0fnkGI7AgW0GfPeIXJLcQpJMKubBOffYHz+SXdma1COLM2q2lNPgQ7oxyYCZtyHlkAHz7KePGxpPA/lARdJXA6BPtLPVF3xENte7X9KJeQEbmGXTRsG2X+6XL98yCY37zQjBdrCview4R8wMHPgYk/OaKQiYpnBIX9SKIK04kJ5c+9i53xl4URiS2eRF4h71c0gsg4BWIj7uRSVa+IZ9p9N9FeAoe5AVfqu1aClcCFm2V1Ri5lUJD6oS0pD4BLuzWsif4gTJxDU+7gZf/yT/SlJo/c/x9rz6LQeX8wWrU53nkwIiD7dlZ0PU5HIiFyC9tdhwGr/6S8JqxUSRe4vdj9ifB+8i/ekFIbklNzWQ/Q8krXcHOHuUYTZD7ijb+d3Am8e9d8/bKYkNlSaNdCTXbobZzE9hWlCSZLDE762BvqXc6YXIiwt2sYwDfssUWRbOjiUPtQNbsNKuRl0Au59sJT+98Cm7DQ9arDJmdeEpBoKG5IY/3ZsznHuXrO/ROoEOSZpgOtTLadONNCBxaEkttMdazV4f/Q2aTgU0h+NEq47u6MUqbq/IhpTXnGVnFLrdSVYaO6tVS02NkNVjTRyc2oMwP1dXcLKh7J+YslDVWaki5VS0NLYQEqqwCkqRb5bC6K7WLXgi6Vy1DbV80GZV6MovoV2FOyR3PfwY1/OY7+PCfIG86T1i+E/QHoeag5SCPaezhZOhQMjK+29XTPng2N9u6WeyoCvqyEgRAQO76nRB2iYMATqyE5rx66xh19jqTFXIBtJGCNlGIrEl2wbugS5yvvXwemtyBkn4n3H6JEqAmlFGvkKwlC5aRRJk41NmTdF7f/0rQ9+tgQJ9IJldu9DZVAGGimRdEZ8wC4MyjDRYxMF6GiCqv7LCzgeflSA4NJXIRguCb69X2KNB+t1uMbc8GQv5kyU9kFbkPZ55XYKpOplg5HFz5wKMQFkv+Bn+3v+4+323gwsqmy8aaMwH0uvqZ39PAol6q6WgIsvsn/0jrivEIgR6ixUZLX66/z3+fLwdvzBrBr4giQSjZj1pJlsSXo7tS/Px3t9/Lcadcf8QBnTIecjv7X/jaXz37aVp3C61sUA66Ziu/5//+uN2uQ1e6P7Hv//z5z///B+79yfD";
\ No newline at end of file